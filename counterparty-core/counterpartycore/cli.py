@@ -213,6 +213,14 @@ CONFIG_ARGS = [
             "help": f"required password (for api-user) to use the {config.APP_NAME} API (via HTTP basic auth)",
         },
     ],
+    [
+        ("--api-workers",),
+        {
+            "type": int,
+            "default": config.DEFAULT_API_WORKERS,
+            "help": f"number of threads serving the API v2, each with its own read-only database connection (default: {config.DEFAULT_API_WORKERS})",
+        },
+    ],
     [
         ("--api-no-allow-cors",),
         {"action": "store_true", "default": False, "help": "allow ajax cross domain request"},
@@ -374,6 +382,14 @@ def main():
     parser_reparse.add_argument(
         "block_index", type=int, help="the index of the last known good block"
     )
+    parser_reparse.add_argument(
+        "--verify",
+        action="store_true",
+        help="only verify the consensus hashes, reparsing ranges of blocks between checkpoints in parallel",
+    )
+    parser_reparse.add_argument(
+        "--processes", type=int, help="number of processes used with `--verify`"
+    )
     setup.add_config_arguments(parser_reparse, CONFIG_ARGS, configfile)
 
     parser_vacuum = subparsers.add_parser(
@@ -392,7 +408,17 @@ def main():
     )
     parser_kickstart.add_argument("--bitcoind-dir", help="Bitcoin Core data directory")
     parser_kickstart.add_argument(
-        "--max-queue-size", type=int, help="Size of the multiprocessing.Queue for parsing blocks"
+        "--max-queue-size",
+        type=int,
+        help="Size of the multiprocessing.Queue of each blocks reader process",
+    )
+    parser_kickstart.add_argument(
+        "--blocks-readers", type=int, help="Number of processes reading the blocks files"
+    )
+    parser_kickstart.add_argument(
+        "--blocks-buffer-size",
+        type=int,
+        help="Size in MB of the shared memory buffer of each blocks reader process",
     )
     parser_kickstart.add_argument(
         "--debug-block", type=int, help="Rollback and run kickstart for a single block;"
@@ -432,7 +458,7 @@ def main():
 
     # PARSING
     elif args.action == "reparse":
-        server.reparse(block_index=args.block_index)
+        server.reparse(block_index=args.block_index, verify=args.verify, processes=args.processes)
 
     elif args.action == "rollback":
         server.rollback(block_index=args.block_index)
@@ -443,6 +469,8 @@ def main():
             force=args.force,
             max_queue_size=args.max_queue_size,
             debug_block=args.debug_block,
+            blocks_readers=args.blocks_readers,
+            blocks_buffer_size=args.blocks_buffer_size,
         )
 
     elif args.action == "start":
@@ -1,9 +1,11 @@
 import argparse
 import logging
 import multiprocessing
+import socket
+import threading
 import time
 import traceback
-from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from multiprocessing import Process
 from threading import Timer
 
@@ -19,23 +21,29 @@ from counterpartycore.lib import (
     transaction,
     util,
 )
+from counterpartycore.lib.api import cache, event_stream, state
 from counterpartycore.lib.api.routes import ROUTES
 from counterpartycore.lib.api.util import (
+    NDJSON_MIMETYPE,
     function_needs_db,
     get_backend_height,
+    get_next_cursor,
     init_api_access_log,
     inject_dispensers,
     inject_issuance,
     inject_normalized_quantities,
+    is_streamable,
     remove_rowids,
     to_json,
+    to_json_stream,
+    to_ndjson_stream,
 )
 from flask import Flask, request
 from flask import g as flask_globals
 from flask_cors import CORS
 from flask_httpauth import HTTPBasicAuth
 from sentry_sdk import configure_scope as configure_sentry_scope
-from werkzeug.serving import make_server
+from werkzeug.serving import BaseWSGIServer
 
 multiprocessing.set_start_method("spawn", force=True)
 
@@ -43,20 +51,156 @@ logger = logging.getLogger(config.LOGGER_NAME)
 auth = HTTPBasicAuth()
 
 BACKEND_HEIGHT = None
-CURRENT_BLOCK_TIME = None
 REFRESH_BACKEND_HEIGHT_INTERVAL = 10
 BACKEND_HEIGHT_TIMER = None
-BLOCK_CACHE = OrderedDict()
-MAX_BLOCK_CACHE_SIZE = 1000
+DB_POOL = None
+EVENT_BROADCASTER = None
+CACHE_INVALIDATOR = None
+# seconds to wait for a database connection when all are in use
+DB_POOL_TIMEOUT = 30
+# requests waiting for a worker, by worker, beyond which new connections get a 503
+MAX_PENDING_REQUESTS_BY_WORKER = 8
+# seconds a client can stay idle while sending its request or receiving the response
+REQUEST_SOCKET_TIMEOUT = 30
+
+
+def service_unavailable_response(error):
+    body = to_json({"error": error}).encode()
+    return (
+        b"HTTP/1.1 503 Service Unavailable\r\n"
+        b"Content-Type: application/json\r\n"
+        b"Content-Length: " + str(len(body)).encode() + b"\r\n"
+        b"Retry-After: 1\r\n"
+        b"Connection: close\r\n\r\n" + body
+    )
+
+
+TOO_MANY_REQUESTS_RESPONSE = service_unavailable_response("Too many requests. Please retry later.")
+TOO_MANY_SUBSCRIBERS_RESPONSE = service_unavailable_response(
+    "Too many subscribers. Please retry later."
+)
 
 
 def get_db():
-    """Get the database connection."""
+    """Get a database connection from the pool, released at the end of the request."""
     if not hasattr(flask_globals, "db"):
-        flask_globals.db = database.get_connection(read_only=True)
+        flask_globals.db = DB_POOL.get(timeout=DB_POOL_TIMEOUT)
     return flask_globals.db
 
 
+def release_db(exception=None):
+    db = flask_globals.pop("db", None)
+    if db is not None:
+        DB_POOL.release(db)
+
+
+def get_last_block():
+    """Return the last block seen by the request, read once per request.
+
+    Pushed by the parser if it runs, read from the database otherwise.
+    """
+    if not hasattr(flask_globals, "last_block"):
+        last_block = state.get_last_block()
+        if last_block is None:
+            last_block = ledger.get_last_block(get_db())
+        if not last_block:
+            last_block = {"block_index": 0, "block_hash": None, "block_time": 0}
+        flask_globals.last_block = last_block
+    return flask_globals.last_block
+
+
+class APIWSGIServer(BaseWSGIServer):
+    """WSGI server handling the requests with a fixed number of threads.
+
+    Event streams are long-lived: they are handed over to a separate pool
+    bounded by `event_stream.MAX_SUBSCRIBERS` to not hold the workers.
+    """
+
+    multithread = True
+
+    def __init__(self, host, port, app, workers):
+        super().__init__(host, port, app)
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="api")
+        # requests being handled or waiting for a worker
+        self.pending_requests = threading.BoundedSemaphore(
+            workers * (1 + MAX_PENDING_REQUESTS_BY_WORKER)
+        )
+        self.stream_executor = ThreadPoolExecutor(
+            max_workers=event_stream.MAX_SUBSCRIBERS, thread_name_prefix="api-stream"
+        )
+        self.streams = threading.BoundedSemaphore(event_stream.MAX_SUBSCRIBERS)
+
+    def process_request(self, request, client_address):
+        if not self.pending_requests.acquire(blocking=False):
+            self.reject_request(request, TOO_MANY_REQUESTS_RESPONSE)
+            return
+        try:
+            self.executor.submit(self.process_request_thread, request, client_address)
+        except RuntimeError:
+            # the executor is shut down
+            self.pending_requests.release()
+            self.shutdown_request(request)
+
+    def reject_request(self, request, response):
+        try:
+            request.sendall(response)
+        except OSError:
+            pass
+        self.shutdown_request(request)
+
+    def is_event_stream_request(self, request):
+        prefix = f"GET {event_stream.STREAM_ROUTE}".encode()
+        deadline = time.time() + REQUEST_SOCKET_TIMEOUT
+        try:
+            while True:
+                # times out with the socket if nothing is sent
+                data = request.recv(len(prefix), socket.MSG_PEEK)
+                if len(data) == len(prefix) or not prefix.startswith(data):
+                    return data == prefix
+                # closed, or the beginning of the request only
+                if not data or time.time() > deadline:
+                    return False
+                time.sleep(0.01)
+        except OSError:
+            return False
+
+    def process_request_thread(self, request, client_address):
+        try:
+            # also bounds the time a client can hold a worker without sending anything
+            request.settimeout(REQUEST_SOCKET_TIMEOUT)
+            if not self.is_event_stream_request(request):
+                self.finish_and_shutdown_request(request, client_address)
+            elif not self.streams.acquire(blocking=False):
+                self.reject_request(request, TOO_MANY_SUBSCRIBERS_RESPONSE)
+            else:
+                try:
+                    self.stream_executor.submit(self.process_stream_thread, request, client_address)
+                except RuntimeError:
+                    self.streams.release()
+                    self.shutdown_request(request)
+        finally:
+            self.pending_requests.release()
+
+    def process_stream_thread(self, request, client_address):
+        try:
+            self.finish_and_shutdown_request(request, client_address)
+        finally:
+            self.streams.release()
+
+    def finish_and_shutdown_request(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.stream_executor.shutdown(wait=False, cancel_futures=True)
+
+
 @auth.verify_password
 def verify_password(username, password):
     if config.API_PASSWORD is None:
@@ -95,9 +239,10 @@ def api_root():
 def is_server_ready():
     if BACKEND_HEIGHT is None:
         return False
-    if util.CURRENT_BLOCK_INDEX >= BACKEND_HEIGHT - 1:
+    last_block = get_last_block()
+    if last_block["block_index"] >= BACKEND_HEIGHT - 1:
         return True
-    if time.time() - CURRENT_BLOCK_TIME < 60:
+    if time.time() - last_block["block_time"] < 60:
         return True
     return False
 
@@ -116,18 +261,33 @@ def return_result_if_not_ready(rule):
     return is_cachable(rule) or rule == "/"
 
 
-def return_result(http_code, result=None, error=None):
+def return_result(http_code, result=None, error=None, next_cursor=None):
     assert result is None or error is None
     api_result = {}
     if result is not None:
-        api_result["result"] = result
+        # the rowids are only used as pagination keys
+        api_result["result"] = result = remove_rowids(result)
+    if next_cursor is not None:
+        api_result["next_cursor"] = next_cursor
     if error is not None:
         api_result["error"] = error
-    response = flask.make_response(to_json(api_result), http_code)
-    response.headers["X-COUNTERPARTY-HEIGHT"] = util.CURRENT_BLOCK_INDEX
+    mimetype = "application/json"
+    if is_streamable(result):
+        # lists are serialized by chunks instead of in one string,
+        # one item per line for bulk consumers
+        if request.accept_mimetypes.best_match([mimetype, NDJSON_MIMETYPE]) == NDJSON_MIMETYPE:
+            mimetype = NDJSON_MIMETYPE
+            response = flask.Response(to_ndjson_stream(result), http_code)
+        else:
+            response = flask.Response(to_json_stream(api_result), http_code)
+    else:
+        response = flask.make_response(to_json(api_result), http_code)
+    response.headers["X-COUNTERPARTY-HEIGHT"] = get_last_block()["block_index"]
     response.headers["X-COUNTERPARTY-READY"] = is_server_ready()
     response.headers["X-BITCOIN-HEIGHT"] = BACKEND_HEIGHT
-    response.headers["Content-Type"] = "application/json"
+    if next_cursor is not None:
+        response.headers["X-COUNTERPARTY-NEXT-CURSOR"] = next_cursor
+    response.headers["Content-Type"] = mimetype
     return response
 
 
@@ -163,39 +323,69 @@ def prepare_args(route, **kwargs):
                 raise ValueError(f"Invalid float: {arg_name}") from e
         else:
             function_args[arg_name] = str_arg
+    # a cursor is the position of the next page, it can't be combined with an offset
+    if function_args.get("cursor") is not None and function_args.get("offset"):
+        raise ValueError("The cursor and offset parameters can't be used together")
     return function_args
 
 
-def execute_api_function(db, route, function_args):
-    # cache everything for one block
-    cache_key = f"{util.CURRENT_BLOCK_INDEX}:{request.url}"
-    # except for blocks and transactions cached forever
-    if request.path.startswith("/blocks/") or request.path.startswith("/transactions/"):
-        cache_key = request.url
+def call_api_function(db, route, function_args):
+    if function_needs_db(route["function"]):
+        return route["function"](db, **function_args)
+    return route["function"](**function_args)
 
-    if cache_key in BLOCK_CACHE:
-        result = BLOCK_CACHE[cache_key]
-    else:
-        if function_needs_db(route["function"]):
-            result = route["function"](db, **function_args)
-        else:
-            result = route["function"](**function_args)
-        # don't cache API v1
-        if route["function"].__name__ != "redirect_to_api_v1":
-            BLOCK_CACHE[cache_key] = result
-            if len(BLOCK_CACHE) > MAX_BLOCK_CACHE_SIZE:
-                BLOCK_CACHE.popitem(last=False)
+
+def execute_api_function(db, rule, route, function_args, last_block):
+    # don't cache API v1
+    if route["function"].__name__ == "redirect_to_api_v1":
+        return call_api_function(db, route, function_args)
+
+    # cached until a new block touches one of the entities of the request,
+    # see `cache.invalidate()`
+    block_hash = last_block["block_hash"]
+    result = cache.get_result(request.url, block_hash)
+    if result is None:
+        result = call_api_function(db, route, function_args)
+        if result is not None:
+            tags = cache.get_entry_tags(db, rule, route, function_args, last_block["block_index"])
+            cache.set_result(request.url, result, tags, block_hash)
 
     return result
 
 
-def inject_details(db, result):
+def inject_details(db, result, block_hash=None):
     result = inject_dispensers(db, result)
-    result = inject_issuance(db, result)
+    result = inject_issuance(db, result, block_hash)
     result = inject_normalized_quantities(result)
     return result
 
 
+@auth.login_required
+def handle_events_stream():
+    if EVENT_BROADCASTER.subscribers >= event_stream.MAX_SUBSCRIBERS:
+        return return_result(503, error="Too many subscribers. Please retry later.")
+    # `Last-Event-ID` is sent by the browsers when they reconnect
+    last_event_index = request.args.get("last", request.headers.get("Last-Event-ID"))
+    if last_event_index is not None:
+        try:
+            last_event_index = int(last_event_index)
+        except ValueError:
+            return return_result(400, error="Invalid integer: last")
+    event_names = set(filter(None, request.args.get("event_name", "").split(",")))
+    entities = set(filter(None, request.args.get("addresses", "").split(",")))
+    for asset in filter(None, request.args.get("assets", "").split(",")):
+        entities.add(ledger.resolve_subasset_longname(get_db(), asset.upper()))
+    release_db()
+    response = flask.Response(
+        event_stream.stream_events(EVENT_BROADCASTER, last_event_index, event_names, entities),
+        200,
+        mimetype="text/event-stream",
+    )
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
+
+
 def get_transaction_name(rule):
     if rule == "/v2/":
         return "APIRoot"
@@ -209,16 +399,8 @@ def handle_route(**kwargs):
     if BACKEND_HEIGHT is None:
         return return_result(503, error="Backend still not ready. Please retry later.")
     db = get_db()
-
-    # update the current block index
-    global CURRENT_BLOCK_TIME  # noqa F811
-    last_block = ledger.get_last_block(db)
-    if last_block:
-        util.CURRENT_BLOCK_INDEX = last_block["block_index"]
-        CURRENT_BLOCK_TIME = last_block["block_time"]
-    else:
-        util.CURRENT_BLOCK_INDEX = 0
-        CURRENT_BLOCK_TIME = 0
+    # also updates `util.CURRENT_BLOCK_INDEX`, see `state.get_last_block()`
+    last_block = get_last_block()
 
     rule = str(request.url_rule.rule)
 
@@ -241,10 +423,13 @@ def handle_route(**kwargs):
         return return_result(400, error=str(e))
 
     # call the function
+    block_hash = last_block["block_hash"]
     try:
-        result = execute_api_function(db, route, function_args)
+        result = execute_api_function(db, rule, route, function_args, last_block)
     except (exceptions.ComposeError, exceptions.UnpackError) as e:
         return return_result(503, error=str(e))
+    except exceptions.InvalidArgument as e:
+        return return_result(400, error=str(e))
     except Exception as e:
         logger.exception("Error in API: %s", e)
         traceback.print_exc()
@@ -254,23 +439,34 @@ def handle_route(**kwargs):
     if result is None:
         return return_result(404, error="Not found")
 
-    result = remove_rowids(result)
+    next_cursor = get_next_cursor(function_args, result)
 
     # inject details
     verbose = request.args.get("verbose", "False")
     if verbose.lower() in ["true", "1"]:
-        result = inject_details(db, result)
+        result = inject_details(db, result, block_hash)
 
-    return return_result(200, result=result)
+    return return_result(200, result=result, next_cursor=next_cursor)
 
 
-def run_api_server(args):
+def run_api_server(args, last_block=None):
+    global DB_POOL, EVENT_BROADCASTER, CACHE_INVALIDATOR  # noqa: PLW0603
     logger.info("Starting API Server.")
     sentry.init()
     app = Flask(config.APP_NAME)
     # Initialise log and config
     server.initialise_log_and_config(argparse.Namespace(**args))
     transaction.initialise()
+    cache.initialise()
+    state.attach(last_block)
+    # one connection per worker
+    DB_POOL = database.ConnectionPool(config.API_WORKERS)
+    app.teardown_appcontext(release_db)
+    # one broadcaster for all the event streams
+    EVENT_BROADCASTER = event_stream.EventBroadcaster(DB_POOL)
+    EVENT_BROADCASTER.start()
+    CACHE_INVALIDATOR = cache.CacheInvalidator(DB_POOL)
+    CACHE_INVALIDATOR.start()
     with app.app_context():
         if not config.API_NO_ALLOW_CORS:
             CORS(app)
@@ -280,6 +476,7 @@ def run_api_server(args):
         util.CURRENT_BLOCK_INDEX = blocks.last_db_index(get_db())
         # Add routes
         app.add_url_rule("/v2/", view_func=handle_route)
+        app.add_url_rule(event_stream.STREAM_ROUTE, view_func=handle_events_stream)
         for path in ROUTES:
             methods = ["GET"]
             if not path.startswith("/v2/"):
@@ -294,12 +491,16 @@ def run_api_server(args):
             BACKEND_HEIGHT = 0
     try:
         # Init the HTTP Server.
-        werkzeug_server = make_server(config.API_HOST, config.API_PORT, app, threaded=True)
+        werkzeug_server = APIWSGIServer(config.API_HOST, config.API_PORT, app, config.API_WORKERS)
         app.app_context().push()
         # Run app server (blocking)
         werkzeug_server.serve_forever()
     finally:
         werkzeug_server.shutdown()
+        werkzeug_server.server_close()
+        EVENT_BROADCASTER.stop()
+        CACHE_INVALIDATOR.stop()
+        DB_POOL.close()
         # ensure timer is cancelled
         if BACKEND_HEIGHT_TIMER:
             BACKEND_HEIGHT_TIMER.cancel()
@@ -327,7 +528,7 @@ class APIServer(object):
     def start(self, args):
         if self.process is not None:
             raise Exception("API server is already running")
-        self.process = Process(target=run_api_server, args=(vars(args),))
+        self.process = Process(target=run_api_server, args=(vars(args), state.LAST_BLOCK))
         self.process.start()
         return self.process
 
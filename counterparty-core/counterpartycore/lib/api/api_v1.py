@@ -26,6 +26,7 @@ from counterpartycore.lib import (
     exceptions,
     gettxinfo,
     ledger,
+    mempool,
     message_type,
     script,
     transaction,
@@ -151,6 +152,9 @@ JSON_RPC_ERROR_API_COMPOSE = -32001  # code to use for error composing transacti
 CURRENT_API_STATUS_CODE = None  # is updated by the APIStatusPoller
 CURRENT_API_STATUS_RESPONSE_JSON = None  # is updated by the APIStatusPoller
 
+# number of rows read by query when a `get_rows()` result is streamed
+ROWS_PAGE_SIZE = 1000
+
 
 class APIError(Exception):
     pass
@@ -217,8 +221,12 @@ def get_rows(
     limit=1000,
     offset=0,
     show_expired=True,
+    stream=False,
 ):
-    """SELECT * FROM wrapper. Filters results based on a filter data structure (as used by the API)."""
+    """SELECT * FROM wrapper. Filters results based on a filter data structure (as used by the API).
+
+    With `stream`, return a generator of the rows fetched and adjusted by chunks.
+    """
 
     if filters == None:  # noqa: E711
         filters = []
@@ -367,6 +375,11 @@ def get_rows(
         statement += f""" ORDER BY {order_by}"""
         if order_dir != None:  # noqa: E711
             statement += f""" {order_dir.upper()}"""
+
+    if stream:
+        query_result = query_pages(db, statement, tuple(bindings), limit, offset)
+        return stream_rows_results(db, table, query_result)
+
     # LIMIT
     if limit and limit > 0:
         statement += f""" LIMIT {limit}"""
@@ -374,7 +387,31 @@ def get_rows(
             statement += f""" OFFSET {offset}"""
 
     query_result = db_query(db, statement, tuple(bindings))
-
+    return adjust_get_rows_results(db, table, query_result)
+
+
+def query_pages(db, statement, bindings, limit, offset):
+    """Yield the rows of `statement` read by pages of `ROWS_PAGE_SIZE` rows.
+
+    Each page is read by its own query, so no cursor (and no read transaction)
+    stays open while the rows are sent to the client.
+    """
+    # as without `stream`, the offset is ignored without limit
+    remaining = limit if limit and limit > 0 else None
+    if remaining is None or not offset:
+        offset = 0
+    while remaining is None or remaining > 0:
+        page_size = ROWS_PAGE_SIZE if remaining is None else min(remaining, ROWS_PAGE_SIZE)
+        page = db_query(db, f"{statement} LIMIT {page_size} OFFSET {offset}", bindings)
+        yield from page
+        if len(page) < page_size:
+            return
+        offset += page_size
+        if remaining is not None:
+            remaining -= page_size
+
+
+def adjust_get_rows_results(db, table, query_result):
     if table == "balances":
         return adjust_get_balances_results(query_result, db)
 
@@ -392,6 +429,11 @@ def get_rows(
     return remove_rowids(query_result)
 
 
+def stream_rows_results(db, table, query_result):
+    for rows in api_util.iterate_chunks(query_result):
+        yield from adjust_get_rows_results(db, table, rows)
+
+
 def remove_rowids(query_result):
     """Remove the rowid field from the query result."""
     filtered_results = []
@@ -599,87 +641,6 @@ def get_running_info_shared(db):
         "force_enabled": is_force_enabled(),
     }
 
-# is updated by MemMempool ('maxmempool' bitcoin conf directly affects this, keeping 300MB default works well)
-memmempool_cached_response = []
-
-class MemMempool(threading.Thread):
-    """In-memory mempool, maintains a ready-to-serve parsed transaction response."""
-    def __init__(self):
-        self.last_mempool_check = 0
-        threading.Thread.__init__(self)
-        self.stop_event = threading.Event()
-
-    def stop(self):
-        self.stop_event.set()
-
-    def run(self):
-        logger.info('Starting MemMempool.')
-        global memmempool_cached_response
-        db = database.get_connection(read_only=True)
-
-        while self.stop_event.is_set() != True:
-
-            if time.time() - self.last_mempool_check > 1 * 60: # 1 minute since last check.
-
-                status = get_running_info_shared(db)
-                if status["server_ready"]:
-
-                    # TODO logs only showing in the first iteration
-                    # logger.info('Mempool processing start...')
-
-                    logger.info("MemMempool caching...")
-
-                    # different, now the mempool provides the transactions but they have no data (maybe because is still a wip)
-                    mempool_txs = db_query(db, "SELECT * FROM mempool")
-                    mempool_txids = []
-                    for tx_row in list(mempool_txs):
-                        mempool_txids.append(tx_row["tx_hash"])
-
-                    to_add = {}
-                    for tx_hash in mempool_txids:
-                        tx_hex = None
-                        try:
-                            tx_hex = backend.getrawtransaction(tx_hash)
-                        except Exception as e:
-                            # TODO logs only showing in the first iteration
-                            logger.warning('Failed to fetch raw TX, continue; %s', (e, ))
-                            continue
-
-                        if tx_hex is None:
-                            continue
-
-                        source, destination, btc_amount, fee, data, extra = gettxinfo.get_tx_info(
-                            db,
-                            BlockchainParser().deserialize_tx(tx_hex),
-                            block_index=None,
-                        )
-
-                        data_hex = None
-                        if data is not None:
-                            data_hex = util.hexlify(data)
-
-                        if data_hex is not None:
-                            to_add[tx_hash] = {
-                                "tx_hash": tx_hash,
-                                "source": source,
-                                "destination": destination,
-                                "btc_amount": btc_amount,
-                                "fee": fee,
-                                "data": data_hex,
-                                "extra": extra,
-                            }
-
-                    new_cached_response = []
-                    for key in to_add:
-                        new_cached_response.append(to_add[key])
-
-                    memmempool_cached_response = new_cached_response
-
-                    self.last_mempool_check = time.time()
-
-            time.sleep(config.BACKEND_POLL_INTERVAL)
-
-
 class APIServer(threading.Thread):
     """Handle JSON-RPC API calls."""
 
@@ -714,7 +675,7 @@ class APIServer(threading.Thread):
         @dispatcher.add_method
         def get_memmempool():
             return {
-                'cached_response': memmempool_cached_response,
+                'cached_response': mempool.get_transactions(),
             }
 
         # Generate dynamically get_{table} methods
@@ -1059,11 +1020,7 @@ class APIServer(threading.Thread):
         @dispatcher.add_method
         def get_holder_count(asset):
             asset = ledger.resolve_subasset_longname(self.db, asset)
-            holders = ledger.holders(self.db, asset, True)
-            addresses = []
-            for holder in holders:
-                addresses.append(holder["address"])
-            return {asset: len(set(addresses))}
+            return {asset: ledger.get_asset_holder_count(self.db, asset)}
 
         @dispatcher.add_method
         def get_holders(asset):
@@ -1381,16 +1338,21 @@ class APIServer(threading.Thread):
                         table=query_type,
                         filters=data_filter,
                         filterop=operator,
+                        stream=True,
                     )
                 except APIError as error:  # noqa: F841
                     return flask.Response("API Error", 400, mimetype="application/json")
 
             # See which encoding to choose from.
             file_format = flask_request.headers["Accept"]
-            # JSON as default.
+            # JSON as default, the rows are serialized while they are fetched.
             if file_format == "application/json" or file_format == "*/*":
-                response_data = json.dumps(query_data)
+                response_data = api_util.to_json_stream(query_data)
+            elif file_format == api_util.NDJSON_MIMETYPE and api_util.is_streamable(query_data):
+                response_data = api_util.to_ndjson_stream(query_data)
             elif file_format == "application/xml":
+                if api_util.is_streamable(query_data):
+                    query_data = list(query_data)
                 # Add document root for XML. Note when xmltodict encounters a list, it produces separate tags for every item.
                 # Hence we end up with multiple query_type roots. To combat this we put it in a separate item dict.
                 response_data = serialize_to_xml({query_type: {"item": query_data}})
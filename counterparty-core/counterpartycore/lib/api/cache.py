@@ -0,0 +1,337 @@
+import json
+import logging
+import os
+
+# Used to store the results of the API functions
+import pickle  # nosec B403
+import threading
+
+import apsw
+from counterpartycore.lib import config, database, ledger, util
+from counterpartycore.lib.api import state
+from counterpartycore.lib.api import util as api_util
+
+logger = logging.getLogger(config.LOGGER_NAME)
+
+# API v2 responses cache, shared by the API processes through an SQLite database.
+# Each entry is tagged with the addresses, assets and hashes it depends on and is
+# invalidated when a new block has a message with one of them. Entries that
+# don't depend on any of them are tagged with `ANY_ENTITY` and are invalidated
+# on every block, except the results of the `FINAL_ROUTES`. The invalidation runs once per block in the `CacheInvalidator`
+# thread of each API process; entries are only read and written by requests
+# made at the block the cache was last invalidated for. The cache is an
+# optimisation: its errors are logged and the requests read the database.
+
+MAX_CACHE_SIZE = 10000
+# Longer results are not cached: they are serialized by chunks while they are
+# sent, pickling them would hold a second copy of the whole list.
+MAX_CACHED_LIST_SIZE = 1000
+# Beyond that many new blocks, the whole cache is cleared instead.
+MAX_BLOCKS_TO_INVALIDATE = 10
+ANY_ENTITY = "*"
+# seconds between two checks of the last block
+POLL_INTERVAL = 0.5
+
+# Routes whose result can't change once the block they read is parsed. They are not
+# tagged and are only removed with the whole cache, after a reorg.
+FINAL_ROUTES = ["/v2/blocks/<int:block_index>", "/v2/transactions/<tx_hash>"]
+# Route arguments identifying an entity.
+ENTITY_ARGS = ["address", "asset", "asset1", "asset2", "order_hash", "bet_hash", "dispenser_hash"]
+ASSET_ARGS = ["asset", "asset1", "asset2"]
+# Message bindings identifying an entity.
+ENTITY_FIELDS = [
+    "address",
+    "source",
+    "destination",
+    "issuer",
+    "origin",
+    "feed_address",
+    "oracle_address",
+    "tx0_address",
+    "tx1_address",
+    "asset",
+    "give_asset",
+    "get_asset",
+    "forward_asset",
+    "backward_asset",
+    "dividend_asset",
+    "asset_longname",
+    "tx_hash",
+    "tx0_hash",
+    "tx1_hash",
+    "offer_hash",
+    "order_hash",
+    "bet_hash",
+    "rps_hash",
+    "dispenser_tx_hash",
+]
+MATCH_ID_FIELDS = ["id", "order_match_id", "bet_match_id", "rps_match_id"]
+
+CONNECTIONS = threading.local()
+LAST_BLOCK = {}
+
+
+def get_cache_db_path():
+    return f"{config.DATABASE}.api_cache"
+
+
+def get_connection():
+    """Return the connection to the cache database of the current thread."""
+    if not hasattr(CONNECTIONS, "db"):
+        db = apsw.Connection(get_cache_db_path())
+        db.setbusytimeout(5000)
+        cursor = db.cursor()
+        cursor.execute("PRAGMA journal_mode = WAL")
+        cursor.execute("PRAGMA synchronous = OFF")
+        cursor.execute("PRAGMA recursive_triggers = ON")
+        cursor.close()
+        db.setrowtrace(database.rowtracer)
+        CONNECTIONS.db = db
+    return CONNECTIONS.db
+
+
+def initialise():
+    """Create an empty cache database, called once before starting the API processes."""
+    if hasattr(CONNECTIONS, "db"):
+        CONNECTIONS.db.close()
+        del CONNECTIONS.db
+    LAST_BLOCK.clear()
+    for suffix in ["", "-wal", "-shm"]:
+        if os.path.exists(get_cache_db_path() + suffix):
+            os.remove(get_cache_db_path() + suffix)
+    db = get_connection()
+    cursor = db.cursor()
+    cursor.execute("""CREATE TABLE IF NOT EXISTS cache(
+                      key TEXT PRIMARY KEY,
+                      result BLOB,
+                      block_hash TEXT)
+                   """)
+    cursor.execute("""CREATE TABLE IF NOT EXISTS cache_tags(
+                      tag TEXT,
+                      key TEXT)
+                   """)
+    cursor.execute("""CREATE INDEX IF NOT EXISTS cache_tags_tag_idx ON cache_tags (tag)""")
+    cursor.execute("""CREATE INDEX IF NOT EXISTS cache_tags_key_idx ON cache_tags (key)""")
+    cursor.execute("""CREATE TRIGGER IF NOT EXISTS cache_delete_tags
+                      AFTER DELETE ON cache BEGIN
+                          DELETE FROM cache_tags WHERE key = old.key;
+                      END;
+                   """)
+    cursor.execute("""CREATE TABLE IF NOT EXISTS cache_state(
+                      block_index INTEGER,
+                      block_hash TEXT)
+                   """)
+    cursor.close()
+
+
+def get_entry_tags(db, rule, route, function_args, last_block_index):
+    """Return the entities the result of a route depends on.
+
+    `[]` if the result is final, `[ANY_ENTITY]` if the entities are unknown.
+    """
+    if any(rule == final or rule.startswith(f"{final}/") for final in FINAL_ROUTES):
+        # the blocks not parsed yet can still get data
+        if function_args.get("block_index", last_block_index) <= last_block_index:
+            return []
+    # compose and backend functions depend on the UTXOs of the addresses
+    if route["function"].__module__ != ledger.__name__:
+        return [ANY_ENTITY]
+    tags = set()
+    for arg_name in ENTITY_ARGS:
+        value = function_args.get(arg_name)
+        if not isinstance(value, str):
+            continue
+        tags.add(value)
+        if arg_name in ASSET_ARGS:
+            tags.add(value.upper())
+            tags.add(ledger.resolve_subasset_longname(db, value))
+    return list(tags) or [ANY_ENTITY]
+
+
+def get_result(key, block_hash):
+    """Return the cached result for `key`, or `None`.
+
+    `block_hash` is the last block seen by the request: the cache is not used
+    until it has been invalidated for this block.
+    """
+    if block_hash is None:
+        return None
+    try:
+        cursor = get_connection().cursor()
+        cursor.execute(
+            """
+            SELECT result FROM cache, cache_state
+            WHERE key = ? AND cache_state.block_hash = ?
+            """,
+            (key, block_hash),
+        )
+        rows = cursor.fetchall()
+        cursor.close()
+        if rows:
+            # written by `set_result()`
+            return pickle.loads(rows[0]["result"])  # nosec B301  # noqa: S301
+    except Exception as e:  # noqa: BLE001
+        logger.warning("Error reading the API cache: %s", e)
+    return None
+
+
+def set_result(key, result, tags, block_hash):
+    """Cache `result`, computed by a request made at `block_hash`.
+
+    The result is dropped if the cache has been invalidated for a new block
+    since, it may be outdated.
+    """
+    if block_hash is None:
+        return
+    if isinstance(result, list) and len(result) > MAX_CACHED_LIST_SIZE:
+        return
+    try:
+        db = get_connection()
+        cursor = db.cursor()
+        with db:
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO cache (key, result, block_hash)
+                SELECT ?, ?, block_hash FROM cache_state WHERE block_hash = ?
+                """,
+                (key, pickle.dumps(result), block_hash),
+            )
+            if db.changes() > 0:
+                cursor.executemany(
+                    """INSERT INTO cache_tags (tag, key) VALUES (?, ?)""",
+                    [(tag, key) for tag in tags],
+                )
+                cursor.execute(
+                    """DELETE FROM cache WHERE rowid <= (SELECT MAX(rowid) FROM cache) - ?""",
+                    (MAX_CACHE_SIZE,),
+                )
+        cursor.close()
+    except Exception as e:  # noqa: BLE001
+        logger.warning("Error writing the API cache: %s", e)
+
+
+def get_match_hashes(match_id):
+    if isinstance(match_id, str) and "_" in match_id:
+        return match_id.split("_")
+    return []
+
+
+def get_messages_entities(db, first_block_index, last_block_index):
+    """Return the entities updated by the messages of the blocks `first_block_index` to `last_block_index`."""
+    cursor = db.cursor()
+    cursor.execute(
+        """
+        SELECT command, category, bindings FROM messages
+        WHERE block_index >= ? AND block_index <= ?
+        """,
+        (first_block_index, last_block_index),
+    )
+    entities = set()
+    for message in cursor.fetchall():
+        bindings = json.loads(message["bindings"])
+        if not isinstance(bindings, dict):
+            continue
+        records = [bindings]
+        # updates only contain the updated fields and the id of the record
+        id_fields = ledger.ID_FIELDS.get(message["category"])
+        if message["command"] == "update" and id_fields and all(f in bindings for f in id_fields):
+            where = " AND ".join([f"{field} = ?" for field in id_fields])
+            # no sql injection here
+            records += cursor.execute(
+                f"""SELECT * FROM current_{message["category"]} WHERE {where}""",  # nosec B608  # noqa: S608
+                tuple(bindings[field] for field in id_fields),
+            ).fetchall()
+        for record in records:
+            for field in ENTITY_FIELDS:
+                if isinstance(record.get(field), str):
+                    entities.add(record[field])
+            for field in MATCH_ID_FIELDS:
+                entities.update(get_match_hashes(record.get(field)))
+    cursor.close()
+    return entities
+
+
+def invalidate(db, last_block):
+    """Remove the entries invalidated by the blocks parsed since the last call."""
+    if last_block is None:
+        return
+    block_index, block_hash = last_block["block_index"], last_block["block_hash"]
+    if LAST_BLOCK.get("block_hash") == block_hash:
+        return
+
+    cursor = get_connection().cursor()
+    # one process at a time
+    cursor.execute("""BEGIN IMMEDIATE""")
+    try:
+        state = cursor.execute("""SELECT * FROM cache_state""").fetchall()
+        state = state[0] if state else None
+        if state is not None and state["block_hash"] == block_hash:
+            pass
+        elif (
+            state is None
+            or block_index <= state["block_index"]
+            or block_index - state["block_index"] > MAX_BLOCKS_TO_INVALIDATE
+            or (ledger.get_block(db, state["block_index"]) or {}).get("block_hash")
+            != state["block_hash"]
+        ):
+            # first call, reorg or too many blocks
+            logger.debug("Clearing API cache...")
+            cursor.execute("""DELETE FROM cache""")
+        else:
+            tags = list(get_messages_entities(db, state["block_index"] + 1, block_index))
+            tags.append(ANY_ENTITY)
+            logger.debug(f"Invalidating API cache for {len(tags)} entities...")
+            for i in range(0, len(tags), 500):
+                chunk = tags[i : i + 500]
+                # no sql injection here
+                cursor.execute(
+                    f"""
+                    DELETE FROM cache WHERE key IN (
+                        SELECT key FROM cache_tags WHERE tag IN ({",".join("?" * len(chunk))})
+                    )
+                    """,  # nosec B608  # noqa: S608
+                    chunk,
+                )
+        cursor.execute("""DELETE FROM cache_state""")
+        cursor.execute("""INSERT INTO cache_state VALUES (?, ?)""", (block_index, block_hash))
+        cursor.execute("""COMMIT""")
+    except Exception:
+        cursor.execute("""ROLLBACK""")
+        raise
+    finally:
+        cursor.close()
+    LAST_BLOCK["block_hash"] = block_hash
+
+
+class CacheInvalidator(threading.Thread):
+    """Invalidate the cache and the assets info once per new block, outside of the requests."""
+
+    def __init__(self, db_pool):
+        threading.Thread.__init__(self, name="CacheInvalidator", daemon=True)
+        self.db_pool = db_pool
+        self.stop_event = threading.Event()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def run(self):
+        logger.info("Starting API cache invalidator.")
+        while not self.stop_event.is_set():
+            try:
+                db = self.db_pool.get()
+                try:
+                    # the block pushed by the parser sets the current block index
+                    last_block = state.get_last_block()
+                    if last_block is None:
+                        # without parser, new blocks are only seen here
+                        last_block = ledger.get_last_block(db)
+                        if last_block:
+                            util.CURRENT_BLOCK_INDEX = last_block["block_index"]
+                    api_util.invalidate_assets_info(db, last_block)
+                    invalidate(db, last_block)
+                finally:
+                    self.db_pool.release(db)
+            except Exception as e:  # noqa: BLE001
+                # requests don't use the cache until it is invalidated for their block
+                logger.warning("Error invalidating the API cache: %s", e)
+            self.stop_event.wait(POLL_INTERVAL)
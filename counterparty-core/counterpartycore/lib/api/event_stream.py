@@ -0,0 +1,243 @@
+import collections
+import logging
+import threading
+
+from counterpartycore.lib import config, ledger
+from counterpartycore.lib.api import state
+from counterpartycore.lib.api.util import to_json
+
+logger = logging.getLogger(config.LOGGER_NAME)
+
+# Server-Sent Events stream of the `messages` table. A single broadcaster
+# reads the new events once per block and keeps the last ones in memory;
+# every subscriber tails this buffer, with its own filters, instead of
+# polling `/v2/events`.
+
+STREAM_ROUTE = "/v2/events/stream"
+MAX_BUFFERED_EVENTS = 10000
+MAX_SUBSCRIBERS = 1000
+# seconds between two checks of the last block
+POLL_INTERVAL = 0.5
+# seconds without event before sending a comment to keep the connection open
+KEEPALIVE_INTERVAL = 15
+# events read at once from the database
+PAGE_SIZE = 1000
+# blocks read by the broadcaster whose hashes are kept to find where a reorganisation starts
+MAX_TRACKED_BLOCKS = 1000
+# rollbacks kept for the subscribers slower than the broadcaster
+MAX_TRACKED_ROLLBACKS = 100
+
+
+class EventBroadcaster(threading.Thread):
+    """Read the events of each new block and wake up the subscribers."""
+
+    def __init__(self, db_pool):
+        threading.Thread.__init__(self, name="EventBroadcaster", daemon=True)
+        self.db_pool = db_pool
+        self.events = collections.deque(maxlen=MAX_BUFFERED_EVENTS)
+        self.condition = threading.Condition()
+        # index of the last event read, `None` until started
+        self.last_event_index = None
+        self.last_event = None
+        # `(block_index, block_hash)` of the last blocks read
+        self.blocks = collections.deque(maxlen=MAX_TRACKED_BLOCKS)
+        # number of rollbacks, and index of the last event kept by each of the last ones
+        self.rollbacks = 0
+        self.rollback_event_indexes = collections.deque(maxlen=MAX_TRACKED_ROLLBACKS)
+        self.subscribers = 0
+        self.stop_event = threading.Event()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def run(self):
+        logger.info("Starting event broadcaster.")
+        last_block_hash = None
+        while not self.stop_event.is_set():
+            try:
+                db = self.db_pool.get()
+                try:
+                    last_block = state.get_last_block() or ledger.get_last_block(db)
+                    if last_block and last_block["block_hash"] != last_block_hash:
+                        self.read_new_events(db)
+                        last_block_hash = last_block["block_hash"]
+                finally:
+                    self.db_pool.release(db)
+            except Exception as e:  # noqa: BLE001
+                logger.warning("Event broadcaster error: %s", e)
+            self.stop_event.wait(POLL_INTERVAL)
+
+    def is_event_read(self, db, event):
+        """Return whether `event` is still in the database."""
+        events = ledger.get_events(db, event_index=event["event_index"], limit=1)
+        return bool(events) and events[0] == event
+
+    def is_block_read(self, db, block_index, block_hash):
+        """Return whether the block read at `block_index` is still in the database."""
+        block = ledger.get_block(db, block_index)
+        return block is not None and (block["block_index"], block["block_hash"]) == (
+            block_index,
+            block_hash,
+        )
+
+    def find_rollback(self, db):
+        """Return the last block read still in the database if blocks were rolled back, `None` otherwise.
+
+        Blocks are rolled back if the hash of a block read changed, or if the
+        last event read is no longer in the database.
+        """
+        rolled_back = self.last_event is not None and not self.is_event_read(db, self.last_event)
+        for block_index, block_hash in reversed(self.blocks):
+            if self.is_block_read(db, block_index, block_hash):
+                return block_index if rolled_back else None
+            rolled_back = True
+        if not rolled_back:
+            return None
+        # rolled back before the first block read
+        return self.blocks[0][0] - 1 if self.blocks else 0
+
+    def rollback(self, db, block_index):
+        """Remove the events after `block_index`, the subscribers after them restart from there."""
+        cursor = db.cursor()
+        cursor.execute(
+            "SELECT MAX(message_index) AS event_index FROM messages WHERE block_index <= ?",
+            (block_index,),
+        )
+        event_index = cursor.fetchone()["event_index"]
+        cursor.close()
+        event_index = min(-1 if event_index is None else event_index, self.last_event_index)
+        last_events = ledger.get_events(db, event_index=event_index, limit=1)
+        logger.debug("Events rolled back after event %s.", event_index)
+        while self.blocks and self.blocks[-1][0] > block_index:
+            self.blocks.pop()
+        with self.condition:
+            while self.events and self.events[-1]["event_index"] > event_index:
+                self.events.pop()
+            self.last_event = last_events[0] if last_events else None
+            self.last_event_index = event_index
+            self.rollbacks += 1
+            self.rollback_event_indexes.append(event_index)
+            self.condition.notify_all()
+
+    def read_new_events(self, db):
+        # taken before reading the events: the block of the last event read or an older one
+        last_block = ledger.get_last_block(db)
+        if self.last_event_index is None:
+            last_events = ledger.get_events(db, limit=1)
+            with self.condition:
+                # subscribers start from the last event
+                self.last_event = last_events[0] if last_events else None
+                self.last_event_index = last_events[0]["event_index"] if last_events else -1
+                self.condition.notify_all()
+        else:
+            rollback_block_index = self.find_rollback(db)
+            if rollback_block_index is not None:
+                self.rollback(db, rollback_block_index)
+            while True:
+                events = ledger.get_events(db, after=self.last_event_index, limit=PAGE_SIZE)
+                if not events:
+                    break
+                with self.condition:
+                    self.events.extend(events)
+                    self.last_event = events[-1]
+                    self.last_event_index = events[-1]["event_index"]
+                    self.condition.notify_all()
+        if last_block and (not self.blocks or self.blocks[-1][0] < last_block["block_index"]):
+            self.blocks.append((last_block["block_index"], last_block["block_hash"]))
+
+    def get_rollback(self, rollbacks):
+        """Return the number of rollbacks and the last event kept by the ones after the `rollbacks` first.
+
+        The event is `None` if there was no rollback since.
+        """
+        with self.condition:
+            count = self.rollbacks - rollbacks
+            if count <= 0:
+                return self.rollbacks, None
+            # the rollbacks no longer tracked are older than the tracked ones
+            return self.rollbacks, min(list(self.rollback_event_indexes)[-count:])
+
+    def get_buffered_events(self, event_index):
+        """Return the buffered events after `event_index`, `None` if some are no longer buffered."""
+        with self.condition:
+            if self.last_event_index is None or event_index >= self.last_event_index:
+                return []
+            if not self.events or self.events[0]["event_index"] > event_index + 1:
+                return None
+            # event indexes are consecutive
+            first = max(event_index + 1 - self.events[0]["event_index"], 0)
+            if first < len(self.events) and self.events[first]["event_index"] != event_index + 1:
+                return [event for event in self.events if event["event_index"] > event_index]
+            return [self.events[i] for i in range(first, len(self.events))]
+
+    def wait_for_events(self, event_index, rollbacks, timeout):
+        """Wait for an event after `event_index` or a rollback, return `False` on timeout."""
+        with self.condition:
+            return self.condition.wait_for(
+                lambda: (
+                    self.last_event_index is not None
+                    and (self.last_event_index != event_index or self.rollbacks != rollbacks)
+                ),
+                timeout,
+            )
+
+
+def match_event(event, event_names, entities):
+    if event_names and event["event"] not in event_names:
+        return False
+    if entities:
+        params = event["params"] if isinstance(event["params"], dict) else {}
+        if not entities.intersection([v for v in params.values() if isinstance(v, str)]):
+            return False
+    return True
+
+
+def format_event(event):
+    return f"id: {event['event_index']}\nevent: {event['event']}\ndata: {to_json(event)}\n\n"
+
+
+def stream_events(broadcaster, last_event_index=None, event_names=None, entities=None):
+    """Yield the events after `last_event_index`, or from now, as Server-Sent Events.
+
+    Only the events named in `event_names` and with a parameter in `entities`
+    (addresses and assets) are sent.
+    """
+    with broadcaster.condition:
+        broadcaster.subscribers += 1
+    try:
+        # wait for the broadcaster to start
+        while broadcaster.last_event_index is None:
+            if not broadcaster.wait_for_events(None, 0, KEEPALIVE_INTERVAL):
+                yield ": keepalive\n\n"
+        rollbacks, _ = broadcaster.get_rollback(0)
+        event_index = last_event_index
+        if event_index is None:
+            event_index = broadcaster.last_event_index
+        while True:
+            rollbacks, rollback_event_index = broadcaster.get_rollback(rollbacks)
+            if rollback_event_index is not None and event_index > rollback_event_index:
+                # events sent rolled back
+                event_index = rollback_event_index
+                yield f"event: reorg\ndata: {to_json({'event_index': event_index})}\n\n"
+            elif event_index > broadcaster.last_event_index:
+                # resume after the last event
+                event_index = broadcaster.last_event_index
+                yield f"event: reorg\ndata: {to_json({'event_index': event_index})}\n\n"
+            events = broadcaster.get_buffered_events(event_index)
+            if events is None:
+                # resume from an event no longer buffered
+                db = broadcaster.db_pool.get()
+                try:
+                    events = ledger.get_events(db, after=event_index, limit=PAGE_SIZE)
+                finally:
+                    broadcaster.db_pool.release(db)
+            if events:
+                matched = [event for event in events if match_event(event, event_names, entities)]
+                if matched:
+                    yield "".join([format_event(event) for event in matched])
+                event_index = events[-1]["event_index"]
+            elif not broadcaster.wait_for_events(event_index, rollbacks, KEEPALIVE_INTERVAL):
+                yield ": keepalive\n\n"
+    finally:
+        with broadcaster.condition:
+            broadcaster.subscribers -= 1
@@ -0,0 +1,57 @@
+import json
+import multiprocessing
+
+from counterpartycore.lib import util
+
+# Last parsed block, pushed by the parser to the API server process through
+# shared memory so the API doesn't have to query it for every request.
+
+LAST_BLOCK_FIELDS = ["block_index", "block_hash", "block_time"]
+# JSON of the fields above
+LAST_BLOCK_SIZE = 256
+
+LAST_BLOCK = None
+# in the API server process, `util.CURRENT_BLOCK_INDEX` follows the pushed block
+FOLLOW_LAST_BLOCK = False
+
+
+def initialise():
+    """Create the shared last block, called by the parser before starting the API server."""
+    global LAST_BLOCK  # noqa: PLW0603
+    LAST_BLOCK = multiprocessing.Array("c", LAST_BLOCK_SIZE)
+    return LAST_BLOCK
+
+
+def attach(last_block):
+    """Use the shared last block created by the parser, called by the API server process."""
+    global LAST_BLOCK, FOLLOW_LAST_BLOCK  # noqa: PLW0603
+    LAST_BLOCK = last_block
+    FOLLOW_LAST_BLOCK = True
+
+
+def set_last_block(block):
+    if LAST_BLOCK is None or block is None:
+        return
+    value = json.dumps({field: block[field] for field in LAST_BLOCK_FIELDS}).encode()
+    with LAST_BLOCK.get_lock():
+        LAST_BLOCK.value = value
+
+
+def get_last_block():
+    """Return the last block pushed by the parser, `None` if nothing was pushed yet.
+
+    In the API server process, `util.CURRENT_BLOCK_INDEX` is set to the block read: the
+    parser pushes the block as soon as it is committed. It is set under the lock of the
+    shared block, so that a thread never replaces the block read by another thread with
+    an older one.
+    """
+    if LAST_BLOCK is None:
+        return None
+    with LAST_BLOCK.get_lock():
+        value = LAST_BLOCK.value
+        if not value:
+            return None
+        last_block = json.loads(value)
+        if FOLLOW_LAST_BLOCK:
+            util.CURRENT_BLOCK_INDEX = last_block["block_index"]
+    return last_block
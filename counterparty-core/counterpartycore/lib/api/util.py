@@ -1,8 +1,11 @@
+import collections
 import decimal
 import inspect
 import json
 import logging
+import threading
 import time
+import types
 from logging import handlers as logging_handlers
 
 import flask
@@ -104,6 +107,21 @@ def remove_rowids(query_result):
     return query_result
 
 
+def get_next_cursor(function_args, query_result):
+    """Return the cursor of the next page of a paginated query result, `None` if it's the last one."""
+    if "cursor" not in function_args or not isinstance(query_result, list):
+        return None
+    limit = function_args.get("limit")
+    if not query_result or limit is None or len(query_result) < limit:
+        return None
+    last_row = query_result[-1]
+    # the key the query is sorted on
+    for key in ["event_index", "rowid", "tx_index"]:
+        if key in last_row:
+            return util.encode_cursor(last_row[key])
+    return None
+
+
 def getrawtransactions(tx_hashes, verbose=False, skip_missing=False, _retry=0):
     txhash_list = tx_hashes.split(",")
     return backend.getrawtransaction_batch(txhash_list, verbose, skip_missing, _retry)
@@ -252,12 +270,170 @@ def to_json(obj, indent=None):
     return json.dumps(obj, cls=ApiJsonEncoder, indent=indent)
 
 
+# Number of items serialized at once by the streaming serializers
+STREAM_CHUNK_SIZE = 100
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+
+def iterate_chunks(items, chunk_size=STREAM_CHUNK_SIZE):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def is_streamable(obj):
+    return isinstance(obj, (list, types.GeneratorType))
+
+
+def to_json_array_stream(items):
+    """Yield the JSON of the list or generator `items`, by chunks of items."""
+    yield "["
+    separator = ""
+    for chunk in iterate_chunks(items):
+        yield separator + ", ".join([to_json(item) for item in chunk])
+        separator = ", "
+    yield "]"
+
+
+def to_json_stream(obj):
+    """Serialize `obj` like `to_json()`, but yield its lists (and the lists of a dict) by chunks."""
+    if is_streamable(obj):
+        yield from to_json_array_stream(obj)
+    elif isinstance(obj, dict):
+        yield "{"
+        separator = ""
+        for key, value in obj.items():
+            yield f"{separator}{to_json(key)}: "
+            if is_streamable(value):
+                yield from to_json_array_stream(value)
+            else:
+                yield to_json(value)
+            separator = ", "
+        yield "}"
+    else:
+        yield to_json(obj)
+
+
+def to_ndjson_stream(items):
+    """Yield one JSON document per line for each item of the list or generator `items`."""
+    for chunk in iterate_chunks(items):
+        yield "".join([to_json(item) + "\n" for item in chunk])
+
+
+# `divide()` doesn't change the context of the thread
+DECIMAL_CONTEXT = decimal.Context(prec=8)
+UNIT = D(10**8)
+
+# Quantity fields normalized with the divisibility of the asset of the `*_info` field.
+QUANTITY_FIELDS = {
+    "quantity": "asset_info",
+    "give_quantity": "give_asset_info",
+    "get_quantity": "get_asset_info",
+    "get_remaining": "get_asset_info",
+    "give_remaining": "give_asset_info",
+    "escrow_quantity": "escrow_asset_info",
+    "dispense_quantity": "dispense_asset_info",
+}
+ASSET_FIELDS = ["asset", "give_asset", "get_asset"]
+# Events that change the last issuance of an asset
+ASSET_INFO_EVENTS = ["ASSET_ISSUANCE", "ASSET_TRANSFER", "RESET_ISSUANCE"]
+# Beyond that many new blocks, the whole assets info cache is cleared instead.
+MAX_BLOCKS_TO_INVALIDATE = 10
+
+# In-process LRU cache of `ledger.get_assets_last_issuance()`, shared by the
+# request threads and invalidated once per block by the `CacheInvalidator`
+# thread, see `invalidate_assets_info()`. As the responses cache, it is only
+# used by the requests made at the block it was last invalidated for.
+ASSETS_INFO = collections.OrderedDict()
+ASSETS_INFO_MAX_SIZE = 10000
+# last block the cache was invalidated for
+ASSETS_INFO_STATE = {}
+ASSETS_INFO_LOCK = threading.Lock()
+
+
 def divide(value1, value2):
-    decimal.getcontext().prec = 8
-    return D(value1) / D(value2)
+    return DECIMAL_CONTEXT.divide(D(value1), D(value2))
+
 
+def get_assets_info(db, asset_list, block_hash=None):
+    """Return the last issuance of the assets in `asset_list`, from the cache when possible.
 
-def inject_issuance(db, result):
+    `block_hash` is the last block seen by the request.
+    """
+    cached = {}
+    with ASSETS_INFO_LOCK:
+        use_cache = block_hash is not None and ASSETS_INFO_STATE.get("block_hash") == block_hash
+        if use_cache:
+            for asset in asset_list:
+                if asset in ASSETS_INFO:
+                    ASSETS_INFO.move_to_end(asset)
+                    cached[asset] = ASSETS_INFO[asset]
+    missing_assets = [asset for asset in asset_list if asset not in cached]
+    issuance_by_asset = {}
+    if missing_assets:
+        issuance_by_asset = ledger.get_assets_last_issuance(db, missing_assets)
+    if missing_assets and use_cache:
+        with ASSETS_INFO_LOCK:
+            # the issuances may be outdated if the cache was invalidated meanwhile
+            if ASSETS_INFO_STATE.get("block_hash") == block_hash:
+                for asset in missing_assets:
+                    # also caches the assets without issuance
+                    ASSETS_INFO[asset] = issuance_by_asset.get(asset)
+                while len(ASSETS_INFO) > ASSETS_INFO_MAX_SIZE:
+                    ASSETS_INFO.popitem(last=False)
+    issuance_by_asset.update(cached)
+    return {
+        asset: issuance_by_asset[asset]
+        for asset in asset_list
+        if issuance_by_asset.get(asset) is not None
+    }
+
+
+def invalidate_assets_info(db, last_block):
+    """Remove the assets issued, reset or transferred since the last call from the assets info cache."""
+    if last_block is None:
+        return
+    block_index, block_hash = last_block["block_index"], last_block["block_hash"]
+    with ASSETS_INFO_LOCK:
+        state = ASSETS_INFO_STATE.copy()
+    if state.get("block_hash") == block_hash:
+        return
+    assets = None
+    if not (
+        not state
+        or block_index <= state["block_index"]
+        or block_index - state["block_index"] > MAX_BLOCKS_TO_INVALIDATE
+        or (ledger.get_block(db, state["block_index"]) or {}).get("block_hash")
+        != state["block_hash"]
+    ):
+        cursor = db.cursor()
+        # no sql injection here
+        cursor.execute(
+            f"""
+            SELECT bindings FROM messages
+            WHERE block_index > ? AND block_index <= ?
+            AND event IN ({",".join(["?" for _ in ASSET_INFO_EVENTS])})
+            """,  # nosec B608  # noqa: S608
+            [state["block_index"], block_index] + ASSET_INFO_EVENTS,
+        )
+        assets = [json.loads(message["bindings"]).get("asset") for message in cursor]
+        cursor.close()
+    with ASSETS_INFO_LOCK:
+        if assets is None:
+            # first call, reorg or too many blocks
+            ASSETS_INFO.clear()
+        else:
+            for asset in assets:
+                ASSETS_INFO.pop(asset, None)
+        ASSETS_INFO_STATE.update({"block_index": block_index, "block_hash": block_hash})
+
+
+def inject_issuance(db, result, block_hash=None):
     # let's work with a list
     result_list = result
     result_is_dict = False
@@ -273,20 +449,20 @@ def inject_issuance(db, result):
         item = result_item
         if "params" in item:
             item = item["params"]
-        for field_name in ["asset", "give_asset", "get_asset"]:
+        for field_name in ASSET_FIELDS:
             if field_name in item:
                 if item[field_name] not in asset_list:
                     asset_list.append(item[field_name])
 
     # get asset issuances
-    issuance_by_asset = ledger.get_assets_last_issuance(db, asset_list)
+    issuance_by_asset = get_assets_info(db, asset_list, block_hash)
 
     # inject issuance
     for result_item in result_list:
         item = result_item
         if "params" in item:
             item = item["params"]
-        for field_name in ["asset", "give_asset", "get_asset"]:
+        for field_name in ASSET_FIELDS:
             if field_name in item and item[field_name] in issuance_by_asset:
                 item[field_name + "_info"] = issuance_by_asset[item[field_name]]
 
@@ -295,6 +471,12 @@ def inject_issuance(db, result):
     return result
 
 
+def normalize_quantity(quantity, divisible):
+    if divisible:
+        return DECIMAL_CONTEXT.divide(D(quantity), UNIT)
+    return str(quantity)
+
+
 def inject_normalized_quantities(result):
     # let's work with a list
     result_list = result
@@ -303,37 +485,27 @@ def inject_normalized_quantities(result):
         result_list = [result]
         result_is_dict = True
 
-    # inject normalized quantities
+    # inject normalized quantities, no database access
     for result_item in result_list:
         item = result_item
-        for field_name in [
-            "quantity",
-            "give_quantity",
-            "get_quantity",
-            "get_remaining",
-            "give_remaining",
-            "escrow_quantity",
-            "dispense_quantity",
-        ]:
-            if "params" in item:
-                item = item["params"]
-            if "dispenser" in item:
-                item = result_item["dispenser"]
+        if "params" in item:
+            item = item["params"]
+        if "dispenser" in item:
+            item = result_item["dispenser"]
+        for field_name, asset_info_field_name in QUANTITY_FIELDS.items():
             if field_name not in item:
                 continue
-            issuance_field_name = (
-                field_name.replace("quantity", "asset").replace("remaining", "asset") + "_info"
-            )
+            issuance_field_name = asset_info_field_name
             if issuance_field_name not in item:
                 issuance_field_name = "asset_info"
-            if issuance_field_name not in item and issuance_field_name not in result_item:
-                continue
-            if issuance_field_name not in item:
-                is_divisible = result_item[issuance_field_name]["divisible"]
+            if issuance_field_name in item:
+                asset_info = item[issuance_field_name]
+            elif issuance_field_name in result_item:
+                asset_info = result_item[issuance_field_name]
             else:
-                is_divisible = item[issuance_field_name]["divisible"]
-            item[field_name + "_normalized"] = (
-                divide(item[field_name], 10**8) if is_divisible else str(item[field_name])
+                continue
+            item[field_name + "_normalized"] = normalize_quantity(
+                item[field_name], asset_info["divisible"]
             )
         if "get_quantity" in item and "give_quantity" in item and "market_dir" in item:
             if item["market_dir"] == "SELL":
@@ -10,11 +10,14 @@ import csv  # noqa: E402
 import decimal
 import http  # noqa: E402
 import logging  # noqa: E402
+import multiprocessing
 import os
+import shutil
 import struct
 import time
 from datetime import timedelta
 
+import apsw
 import bitcoin as bitcoinlib  # noqa: E402
 from halo import Halo  # noqa: E402
 from termcolor import colored  # noqa: E402
@@ -26,11 +29,13 @@ from counterpartycore.lib import (  # noqa: E402
     database,
     exceptions,
     ledger,
+    mempool,
     message_type,
     prefetcher,
     util,
 )
-from counterpartycore.lib.gettxinfo import get_tx_info  # noqa: E402
+from counterpartycore.lib.api import state as api_state  # noqa: E402
+from counterpartycore.lib.gettxinfo import get_tx_info, prefetch_prevouts  # noqa: E402
 from counterpartycore.lib.kickstart.blocks_parser import BlockchainParser  # noqa: E402
 from counterpartycore.lib.transaction_helper import p2sh_encoding  # noqa: E402, F401
 
@@ -56,6 +61,9 @@ D = decimal.Decimal
 logger = logging.getLogger(config.LOGGER_NAME)
 
 NUM_PREFETCHER_THREADS = 3
+NUM_DECODER_PROCESSES = 3
+# Mempool transactions parsed between two checks of the block count
+MEMPOOL_CHUNK_SIZE = 100
 
 # Order matters for FOREIGN KEY constraints.
 TABLES = ["balances", "credits", "debits", "messages"] + [
@@ -215,6 +223,8 @@ def parse_tx(db, tx):
 
             return True
     except Exception as e:
+        # the savepoint has been rolled back with the journaled messages and orders
+        ledger.reset_caches()
         raise exceptions.ParseTransactionError(f"{e}")  # noqa: B904
     finally:
         cursor.close()
@@ -230,101 +240,117 @@ def parse_block(
     txlist_hash=None,
     previous_messages_hash=None,
     reparsing=False,
-    start_time=None
+    start_time=None,
 ):
     """Parse the block, return hash of new ledger, txlist and messages.
 
     The unused arguments `ledger_hash` and `txlist_hash` are for the test suite.
     """
 
-    ledger.BLOCK_LEDGER = []
-    ledger.BLOCK_JOURNAL = []
+    # Balances read or written during the block are cached until the block is parsed.
+    ledger.BALANCES_CACHE = {}
+    # Messages, credits and debits are written by batches.
+    ledger.start_write_buffer(db)
 
-    assert block_index == util.CURRENT_BLOCK_INDEX
+    try:
+        assert block_index == util.CURRENT_BLOCK_INDEX
 
-    # Expire orders, bets and rps.
-    order.expire(db, block_index)
-    bet.expire(db, block_index, block_time)
-    rps.expire(db, block_index)
+        # Consensus hashes are fed while the block is parsed.
+        consensus_hashes = check.init_consensus_hashes(
+            db,
+            {
+                "ledger_hash": previous_ledger_hash,
+                "txlist_hash": previous_txlist_hash,
+                "messages_hash": previous_messages_hash,
+            },
+        )
+        ledger.BLOCK_LEDGER = consensus_hashes["ledger_hash"]
+        ledger.BLOCK_JOURNAL = consensus_hashes["messages_hash"]
+        txlist = consensus_hashes["txlist_hash"]
 
-    # Close dispensers
-    dispenser.close_pending(db, block_index)
+        # Expire orders, bets and rps.
+        order.expire(db, block_index)
+        bet.expire(db, block_index, block_time)
+        rps.expire(db, block_index)
 
-    # Parse transactions, sorting them by type.
-    cursor = db.cursor()
-    cursor.execute(
-        """SELECT * FROM transactions \
-                      WHERE block_index=$block_index ORDER BY tx_index""",
-        {"block_index": block_index},
-    )
-    txlist = []
-    for tx in list(cursor):
-        try:
-            # Add manual event to journal because transaction already exists
-            if reparsing:
-                transaction_bindings = {
-                    "tx_index": tx["tx_index"],
-                    "tx_hash": tx["tx_hash"],
-                    "block_index": tx["block_index"],
-                    "block_hash": tx["block_hash"],
-                    "block_time": tx["block_time"],
-                    "source": tx["source"],
-                    "destination": tx["destination"],
-                    "btc_amount": tx["btc_amount"],
-                    "fee": tx["fee"],
-                    "data": tx["data"],
-                }
-                ledger.add_to_journal(
-                    db,
-                    block_index,
-                    "insert",
-                    "transactions",
-                    "NEW_TRANSACTION",
-                    transaction_bindings,
+        # Close dispensers
+        dispenser.close_pending(db, block_index)
+
+        # Parse transactions, sorting them by type.
+        cursor = db.cursor()
+        cursor.execute(
+            """SELECT * FROM transactions \
+                          WHERE block_index=$block_index ORDER BY tx_index""",
+            {"block_index": block_index},
+        )
+        for tx in list(cursor):
+            try:
+                # Add manual event to journal because transaction already exists
+                if reparsing:
+                    transaction_bindings = {
+                        "tx_index": tx["tx_index"],
+                        "tx_hash": tx["tx_hash"],
+                        "block_index": tx["block_index"],
+                        "block_hash": tx["block_hash"],
+                        "block_time": tx["block_time"],
+                        "source": tx["source"],
+                        "destination": tx["destination"],
+                        "btc_amount": tx["btc_amount"],
+                        "fee": tx["fee"],
+                        "data": tx["data"],
+                    }
+                    ledger.add_to_journal(
+                        db,
+                        block_index,
+                        "insert",
+                        "transactions",
+                        "NEW_TRANSACTION",
+                        transaction_bindings,
+                    )
+                parse_tx(db, tx)
+                data = binascii.hexlify(tx["data"]).decode("UTF-8") if tx["data"] else ""
+                txlist.append(
+                    f"{tx['tx_hash']}{tx['source']}{tx['destination']}{tx['btc_amount']}{tx['fee']}{data}"
                 )
-            parse_tx(db, tx)
-            data = binascii.hexlify(tx["data"]).decode("UTF-8") if tx["data"] else ""
-            txlist.append(
-                f"{tx['tx_hash']}{tx['source']}{tx['destination']}{tx['btc_amount']}{tx['fee']}{data}"
-            )
-        except exceptions.ParseTransactionError as e:
-            logger.warning(f"ParseTransactionError for tx {tx['tx_hash']}: {e}")
-            raise e
-            # pass
+            except exceptions.ParseTransactionError as e:
+                logger.warning(f"ParseTransactionError for tx {tx['tx_hash']}: {e}")
+                raise e
+                # pass
 
-    cursor.close()
+        cursor.close()
 
-    # Calculate consensus hashes.
-    new_txlist_hash, found_txlist_hash = check.consensus_hash(
-        db, "txlist_hash", previous_txlist_hash, txlist
-    )
-    new_ledger_hash, found_ledger_hash = check.consensus_hash(
-        db, "ledger_hash", previous_ledger_hash, ledger.BLOCK_LEDGER
-    )
-    new_messages_hash, found_messages_hash = check.consensus_hash(
-        db, "messages_hash", previous_messages_hash, ledger.BLOCK_JOURNAL
-    )
+        # Calculate consensus hashes.
+        new_txlist_hash, found_txlist_hash = check.consensus_hash(db, txlist)
+        new_ledger_hash, found_ledger_hash = check.consensus_hash(db, ledger.BLOCK_LEDGER)
+        new_messages_hash, found_messages_hash = check.consensus_hash(db, ledger.BLOCK_JOURNAL)
 
-    duration = None
-    if start_time:
-        duration = time.time() - start_time
+        duration = None
+        if start_time:
+            duration = time.time() - start_time
 
-    ledger.add_to_journal(
-        db,
-        block_index,
-        "parse",
-        "blocks",
-        "BLOCK_PARSED",
-        {
-            "block_index": block_index,
-            "ledger_hash": new_ledger_hash,
-            "txlist_hash": new_txlist_hash,
-            "messages_hash": new_messages_hash,
-            # "duration": duration
-        },
-    )
+        ledger.add_to_journal(
+            db,
+            block_index,
+            "parse",
+            "blocks",
+            "BLOCK_PARSED",
+            {
+                "block_index": block_index,
+                "ledger_hash": new_ledger_hash,
+                "txlist_hash": new_txlist_hash,
+                "messages_hash": new_messages_hash,
+                # "duration": duration
+            },
+        )
+        ledger.flush_write_buffer(db)
+        ledger.prune_asset_counters_changes(db, block_index)
+        ledger.prune_asset_holders_changes(db, block_index)
 
-    return new_ledger_hash, new_txlist_hash, new_messages_hash, found_messages_hash
+        return new_ledger_hash, new_txlist_hash, new_messages_hash, found_messages_hash
+    finally:
+        ledger.BALANCES_CACHE = None
+        # nothing is left to write if the block is parsed, rolled back otherwise
+        ledger.discard_write_buffer()
 
 
 def initialise(db):
@@ -631,6 +657,8 @@ def initialise(db):
     if "event" not in columns:
         cursor.execute("""ALTER TABLE mempool ADD COLUMN event TEXT""")
 
+    initialise_state_tables(db)
+
     # Lock UPDATE on all tables
     for table in TABLES:
         cursor.execute(f"""CREATE TRIGGER IF NOT EXISTS block_update_{table}
@@ -639,6 +667,152 @@ def initialise(db):
                            END;
                         """)
     cursor.close()
+    # the schema may have changed
+    database.reset_statements(db)
+
+
+def initialise_state_tables(db):
+    """Create and populate the tables derived from the history tables."""
+    cursor = db.cursor()
+
+    # Last revision of mutable records
+    initialise_current_state_tables(cursor)
+
+    # Supply and held quantities of each asset
+    initialise_asset_counters_tables(db)
+
+    # Current holders of each asset
+    initialise_asset_holders_table(db)
+
+    cursor.close()
+
+
+# Secondary indexes of the current state tables, used by the hot queries
+# of `ledger` (order book, expirations, bets matching...).
+CURRENT_STATE_INDEXES = {
+    "balances": [["address"], ["asset"]],
+    "orders": [
+        ["give_asset", "get_asset", "status"],
+        ["source", "give_asset", "status"],
+        ["expire_index", "status"],
+    ],
+    "order_matches": [["tx0_hash"], ["tx1_hash"], ["status", "match_expire_index"]],
+    "bets": [["feed_address", "bet_type", "status"], ["expire_index", "status"]],
+    "bet_matches": [["feed_address", "status"]],
+    "rps": [["expire_index", "status"]],
+    "rps_matches": [["status", "match_expire_index"]],
+    "dispensers": [["source", "asset"], ["asset"], ["status"]],
+}
+
+
+def build_current_state_table(cursor, table):
+    logger.info(f"Building current state of table `{table}`...")
+    id_fields = ", ".join(ledger.ID_FIELDS[table])
+    cursor.execute(f"""DROP TABLE IF EXISTS current_{table}""")  # nosec B608
+    # internal function, no sql injection here
+    cursor.execute(f"""
+        CREATE TABLE current_{table} AS
+        SELECT * FROM {table} WHERE rowid IN (
+            SELECT MAX(rowid) FROM {table} GROUP BY {id_fields}
+        )
+    """)  # nosec B608  # noqa: S608
+    database.create_indexes(cursor, f"current_{table}", [ledger.ID_FIELDS[table]], unique=True)
+    database.create_indexes(cursor, f"current_{table}", CURRENT_STATE_INDEXES[table])
+
+
+def initialise_current_state_tables(cursor):
+    for table in ledger.ID_FIELDS:
+        columns = [column["name"] for column in cursor.execute(f"""PRAGMA table_info({table})""")]
+        current_columns = [
+            column["name"] for column in cursor.execute(f"""PRAGMA table_info(current_{table})""")
+        ]
+        # (re)build the table if it doesn't exist or if the history table has changed
+        if current_columns != columns:
+            build_current_state_table(cursor, table)
+
+
+def initialise_asset_counters_tables(db):
+    cursor = db.cursor()
+    cursor.execute(
+        """SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'asset_counters'"""
+    )
+    exists = len(cursor.fetchall()) > 0
+    cursor.execute("""CREATE TABLE IF NOT EXISTS asset_counters(
+                      asset TEXT PRIMARY KEY,
+                      issued INTEGER NOT NULL DEFAULT 0,
+                      destroyed INTEGER NOT NULL DEFAULT 0,
+                      held INTEGER NOT NULL DEFAULT 0,
+                      escrowed INTEGER NOT NULL DEFAULT 0)
+                   """)
+    cursor.execute("""CREATE TABLE IF NOT EXISTS asset_counters_changes(
+                      block_index INTEGER,
+                      asset TEXT,
+                      issued INTEGER NOT NULL DEFAULT 0,
+                      destroyed INTEGER NOT NULL DEFAULT 0,
+                      held INTEGER NOT NULL DEFAULT 0,
+                      escrowed INTEGER NOT NULL DEFAULT 0,
+                      PRIMARY KEY (block_index, asset))
+                   """)
+    if not exists:
+        # last parsed block
+        cursor.execute("""SELECT MAX(block_index) AS block_index FROM messages""")
+        last_block_index = cursor.fetchall()[0]["block_index"] or 0
+        ledger.build_asset_counters(db, last_block_index)
+    cursor.close()
+
+
+def initialise_asset_holders_table(db):
+    cursor = db.cursor()
+    cursor.execute(
+        """SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'asset_holders'"""
+    )
+    exists = len(cursor.fetchall()) > 0
+    cursor.execute("""CREATE TABLE IF NOT EXISTS asset_holders(
+                      asset TEXT,
+                      kind INTEGER,
+                      address TEXT,
+                      escrow TEXT,
+                      quantity INTEGER)
+                   """)
+    database.create_indexes(
+        cursor, "asset_holders", [["asset", "kind", "address", "escrow"]], unique=True
+    )
+    database.create_indexes(cursor, "asset_holders", [["asset", "address"]])
+    cursor.execute("""CREATE TABLE IF NOT EXISTS asset_holders_changes(
+                      block_index INTEGER,
+                      asset TEXT,
+                      PRIMARY KEY (block_index, asset))
+                   """)
+    if not exists:
+        cursor.execute("""DELETE FROM asset_holders_changes""")
+        ledger.build_asset_holders(db)
+    cursor.close()
+
+
+def clean_current_state_table_from(cursor, table, block_index):
+    """Restore the revisions of `table` prior to `block_index` once the history table is cleaned."""
+    id_fields = ledger.ID_FIELDS[table]
+    join_on = " AND ".join([f"history.{field} = current.{field}" for field in id_fields])
+    group_by = ", ".join([f"history.{field}" for field in id_fields])
+    # internal function, no sql injection here
+    cursor.execute(
+        f"""
+        INSERT OR REPLACE INTO current_{table}
+        SELECT * FROM {table} WHERE rowid IN (
+            SELECT MAX(history.rowid)
+            FROM {table} AS history
+            JOIN current_{table} AS current ON {join_on}
+            WHERE current.block_index >= ?
+            GROUP BY {group_by}
+        )
+        """,  # nosec B608  # noqa: S608
+        (block_index,),
+    )
+    # records without any revision left
+    cursor.execute(
+        f"""DELETE FROM current_{table} WHERE block_index >= ?""",  # nosec B608  # noqa: S608
+        (block_index,),
+    )
 
 
 def list_tx(
@@ -734,7 +908,12 @@ def clean_messages_tables(db, block_index=0):
         cursor.execute("""PRAGMA foreign_keys=OFF""")
         for table in TABLES:
             clean_table_from(cursor, table, block_index)
+        for table in ledger.ID_FIELDS:
+            clean_current_state_table_from(cursor, table, block_index)
+        ledger.rollback_asset_holders(db, block_index)
+        ledger.rollback_asset_counters(db, block_index)
         cursor.execute("""PRAGMA foreign_keys=ON""")
+    ledger.reset_caches()
 
 
 def clean_transactions_tables(cursor, block_index=0):
@@ -753,8 +932,15 @@ def rebuild_database(db, include_transactions=True):
         tables_to_clean += ["transaction_outputs", "transactions", "blocks"]
     for table in tables_to_clean:
         cursor.execute(f"DROP TABLE {table}")  # nosec B608
+    for table in ledger.ID_FIELDS:
+        cursor.execute(f"DROP TABLE IF EXISTS current_{table}")  # nosec B608
+    cursor.execute("""DROP TABLE IF EXISTS asset_counters""")
+    cursor.execute("""DROP TABLE IF EXISTS asset_counters_changes""")
+    cursor.execute("""DROP TABLE IF EXISTS asset_holders""")
+    cursor.execute("""DROP TABLE IF EXISTS asset_holders_changes""")
     cursor.execute("""PRAGMA foreign_keys=ON""")
     initialise(db)
+    ledger.reset_caches()
 
 
 def rollback(db, block_index=0):
@@ -800,6 +986,35 @@ def generate_progression_message(
     return f"{current_block} [{blocks_parsed}{txs_indexed}{duration}]"
 
 
+def reparse_block(db, block):
+    util.CURRENT_BLOCK_INDEX = block["block_index"]
+    # Add event manually to journal because block already exists
+    ledger.add_to_journal(
+        db,
+        block["block_index"],
+        "insert",
+        "blocks",
+        "NEW_BLOCK",
+        {
+            "block_index": block["block_index"],
+            "block_hash": block["block_hash"],
+            "block_time": block["block_time"],
+            "previous_block_hash": block["previous_block_hash"],
+            "difficulty": block["difficulty"],
+        },
+    )
+    previous_block = ledger.get_block(db, block["block_index"] - 1)
+    return parse_block(
+        db,
+        block["block_index"],
+        block["block_time"],
+        previous_ledger_hash=previous_block["ledger_hash"],
+        previous_txlist_hash=previous_block["txlist_hash"],
+        previous_messages_hash=previous_block["messages_hash"],
+        reparsing=True,
+    )
+
+
 def reparse(db, block_index=0):
     cursor = db.cursor()
     # clean all tables except assets' blocks', 'transaction_outputs' and 'transactions'
@@ -830,32 +1045,7 @@ def reparse(db, block_index=0):
         )
         for block in cursor.fetchall():
             start_time_block_parse = time.time()
-            util.CURRENT_BLOCK_INDEX = block["block_index"]
-            # Add event manually to journal because block already exists
-            ledger.add_to_journal(
-                db,
-                block["block_index"],
-                "insert",
-                "blocks",
-                "NEW_BLOCK",
-                {
-                    "block_index": block["block_index"],
-                    "block_hash": block["block_hash"],
-                    "block_time": block["block_time"],
-                    "previous_block_hash": block["previous_block_hash"],
-                    "difficulty": block["difficulty"],
-                },
-            )
-            previous_block = ledger.get_block(db, block["block_index"] - 1)
-            parse_block(
-                db,
-                block["block_index"],
-                block["block_time"],
-                previous_ledger_hash=previous_block["ledger_hash"],
-                previous_txlist_hash=previous_block["txlist_hash"],
-                previous_messages_hash=previous_block["messages_hash"],
-                reparsing=True,
-            )
+            reparse_block(db, block)
             block_parsed_count += 1
             message = generate_progression_message(
                 block,
@@ -869,6 +1059,201 @@ def reparse(db, block_index=0):
     print(f"All blocks reparsed in {time.time() - start_time_all_blocks_parse:.2f}s")
 
 
+def get_verification_ranges(db, block_index, processes):
+    """Split the blocks from `block_index` in `processes` ranges ending at checkpoints.
+
+    Ranges are balanced by number of transactions.
+    """
+    if config.TESTNET:
+        checkpoints = check.CHECKPOINTS_TESTNET
+    elif config.REGTEST:
+        checkpoints = check.CHECKPOINTS_REGTEST
+    else:
+        checkpoints = check.CHECKPOINTS_MAINNET
+
+    last_block_index = last_db_index(db)
+    boundaries = [
+        checkpoint
+        for checkpoint in sorted(checkpoints.keys())
+        if block_index <= checkpoint < last_block_index
+    ] + [last_block_index]
+
+    cursor = db.cursor()
+    segments = []
+    first_block_index = block_index
+    for boundary in boundaries:
+        tx_count = cursor.execute(
+            """SELECT COUNT(*) AS cnt FROM transactions WHERE block_index >= ? AND block_index <= ?""",
+            (first_block_index, boundary),
+        ).fetchone()["cnt"]
+        segments.append((first_block_index, boundary, tx_count))
+        first_block_index = boundary + 1
+    cursor.close()
+
+    total_tx_count = sum(segment[2] for segment in segments)
+    range_tx_count = total_tx_count / processes
+    ranges = []
+    current_range = None
+    current_tx_count = 0
+    for first_block_index, last_block_index, tx_count in segments:
+        if current_range is None:
+            current_range = [first_block_index, last_block_index]
+        else:
+            current_range[1] = last_block_index
+        current_tx_count += tx_count
+        if current_tx_count >= range_tx_count and len(ranges) < processes - 1:
+            ranges.append(tuple(current_range))
+            current_range = None
+            current_tx_count = 0
+    if current_range is not None:
+        ranges.append(tuple(current_range))
+    return ranges
+
+
+# Free disk space needed by a verification snapshot, relative to the size of
+# the database: the reparsed blocks are written again in the snapshot.
+VERIFY_SNAPSHOT_SIZE_RATIO = 1.1
+
+
+def get_snapshot_files(ranges):
+    return [f"{config.DATABASE}.verify.{first_block_index}" for first_block_index, _ in ranges]
+
+
+def remove_snapshot_files(snapshot_files):
+    for snapshot_file in snapshot_files:
+        for suffix in ["", "-wal", "-shm"]:
+            if os.path.exists(snapshot_file + suffix):
+                os.remove(snapshot_file + suffix)
+
+
+def get_max_verify_processes(database_file, processes):
+    """Return how many verification snapshots of `database_file` fit on the disk, up to `processes`."""
+    database_size = sum(
+        os.path.getsize(database_file + suffix)
+        for suffix in ["", "-wal"]
+        if os.path.exists(database_file + suffix)
+    )
+    free_space = shutil.disk_usage(os.path.dirname(os.path.abspath(database_file))).free
+    if database_size == 0:
+        return processes
+    return min(processes, int(free_space // (database_size * VERIFY_SNAPSHOT_SIZE_RATIO)))
+
+
+def create_snapshots(db, snapshot_files, ranges):
+    """Create the snapshot of each range, rolled back to the first block of the range.
+
+    The database is backed up once in the first snapshot, which is then rolled
+    back range by range from the last one and copied at each range start: the
+    rollbacks remove each block only once and the processes only reparse.
+    All the ranges are verified against the same state of the database,
+    even if it's written while the snapshots are taken.
+    """
+    snapshot_db = apsw.Connection(snapshot_files[0])
+    with snapshot_db.backup("main", db, "main") as backup:
+        backup.step()
+    snapshot_db.setrowtrace(database.rowtracer)
+    try:
+        for index in reversed(range(len(ranges))):
+            with snapshot_db:
+                clean_messages_tables(snapshot_db, block_index=ranges[index][0])
+            if index > 0:
+                snapshot_db.wal_checkpoint(mode=apsw.SQLITE_CHECKPOINT_TRUNCATE)
+                shutil.copyfile(snapshot_files[0], snapshot_files[index])
+    finally:
+        snapshot_db.close()
+
+
+def verify_blocks(parser_config, snapshot_file, first_block_index, last_block_index):
+    """Reparse `snapshot_file` from `first_block_index` to `last_block_index`.
+
+    The snapshot is already rolled back to `first_block_index`. Consensus hashes
+    are not cleaned, so each block is checked against the hashes in the database
+    and the checkpoints.
+    Return `None` if all blocks are valid, `(is_consensus_error, message)` otherwise.
+    """
+    for attribute in parser_config:
+        setattr(config, attribute, parser_config[attribute])
+
+    config.DATABASE = snapshot_file
+    try:
+        db = database.get_connection(read_only=False)
+        try:
+            cursor = db.cursor()
+            cursor.execute(
+                """SELECT * FROM blocks WHERE block_index >= ? AND block_index <= ? ORDER BY block_index""",
+                (first_block_index, last_block_index),
+            )
+            for block in cursor.fetchall():
+                with db:
+                    reparse_block(db, block)
+        finally:
+            db.close()
+        return None
+    except check.ConsensusError as e:
+        return True, str(e)
+    except Exception as e:  # noqa: BLE001
+        # returned like the consensus errors, so the failures of all the processes are reported
+        return False, f"Blocks {first_block_index}-{last_block_index}: {type(e).__name__}: {e}"
+
+
+def verify(db, block_index=0, processes=None):
+    """Verify the consensus hashes from `block_index` by reparsing ranges of blocks in parallel.
+
+    The database is not modified: each range is reparsed in its own snapshot,
+    so the number of processes is limited by the free disk space.
+    """
+    block_index = max(block_index, config.BLOCK_FIRST)
+    processes = processes or os.cpu_count()
+    max_processes = get_max_verify_processes(config.DATABASE, processes)
+    if max_processes == 0:
+        raise exceptions.DatabaseError("Not enough free disk space to verify the blocks.")
+    if max_processes < processes:
+        logger.warning(
+            f"Not enough free disk space for {processes} processes, verifying with {max_processes}."
+        )
+    ranges = get_verification_ranges(db, block_index, max_processes)
+    if not ranges:
+        logger.info("No blocks to verify.")
+        return
+
+    parser_config = {}
+    for attribute in dir(config):
+        if attribute.isupper():
+            parser_config[attribute] = getattr(config, attribute)
+
+    start_time = time.time()
+    snapshot_files = get_snapshot_files(ranges)
+    try:
+        step = f"Taking {len(snapshot_files)} snapshots of the database..."
+        with Halo(text=step, spinner=SPINNER_STYLE):
+            create_snapshots(db, snapshot_files, ranges)
+        print(f"{OK_GREEN} {step}")
+
+        step = f"Verifying blocks from block {block_index} with {len(ranges)} processes..."
+        with Halo(text=step, spinner=SPINNER_STYLE):
+            with multiprocessing.Pool(len(ranges)) as pool:
+                errors = pool.starmap(
+                    verify_blocks,
+                    [
+                        (parser_config, snapshot_file, first, last)
+                        for snapshot_file, (first, last) in zip(snapshot_files, ranges, strict=True)
+                    ],
+                )
+    finally:
+        # also when a process failed or the verification was interrupted
+        remove_snapshot_files(snapshot_files)
+    errors = [error for error in errors if error is not None]
+    for _, message in errors:
+        logger.error(message)
+    consensus_errors = [message for is_consensus_error, message in errors if is_consensus_error]
+    if consensus_errors:
+        raise check.ConsensusError(consensus_errors[0])
+    if errors:
+        raise exceptions.DatabaseError(f"Blocks verification failed in {len(errors)} processes.")
+    print(f"{OK_GREEN} {step}")
+    print(f"All blocks verified in {time.time() - start_time:.2f}s")
+
+
 def last_db_index(db):
     cursor = db.cursor()
     query = "SELECT name FROM sqlite_master WHERE type='table' AND name='blocks'"
@@ -904,6 +1289,99 @@ class MempoolError(Exception):
     pass
 
 
+def parse_mempool_tx(
+    db,
+    cursor,
+    tx_hash,
+    tx_hex,
+    block_index,
+    curr_time,
+    mempool_tx_index,
+    not_supported,
+    not_supported_sorted,
+    xcp_mempool,
+    parsed_transactions,
+):
+    """Parse a mempool transaction in a database transaction, rolled back after its messages
+    are saved.
+
+    Each transaction is parsed against the confirmed state only, and the write lock is
+    held only while it is parsed. The entry of the transaction for `mempool.update()`
+    is saved in `parsed_transactions`. Return the `tx_index` of the next transaction.
+    """
+    # The transaction is always rolled back, and its messages with it.
+    journal_indexes = ledger.JOURNAL_INDEXES
+    # mempool orders go in a temporary order book
+    order_book = ledger.ORDER_BOOK
+    ledger.reset_order_book()
+    # the dispenser addresses are replaced by the mempool dispensers
+    dispenser_addresses = ledger.get_dispenser_addresses(db)
+    try:
+        with db:
+            if tx_hex is None:
+                # logger.debug(
+                #     "tx_hash %s not found in backend.  Not adding to mempool.",
+                #     (tx_hash,),
+                # )
+                raise MempoolError
+            # List the fake block.
+            cursor.execute(
+                """INSERT INTO blocks(
+                                block_index,
+                                block_hash,
+                                block_time) VALUES(?,?,?)""",
+                (config.MEMPOOL_BLOCK_INDEX, config.MEMPOOL_BLOCK_HASH, curr_time),
+            )
+            mempool_tx_index = list_tx(
+                db,
+                None,
+                block_index,
+                curr_time,
+                tx_hash,
+                tx_index=mempool_tx_index,
+                tx_hex=tx_hex,
+            )
+
+            # Parse transaction.
+            cursor.execute("""SELECT * FROM transactions WHERE tx_hash = ?""", (tx_hash,))
+            transactions = list(cursor)
+            if transactions:
+                assert len(transactions) == 1
+                transaction = transactions[0]
+                parsed_transactions[tx_hash] = mempool.get_transaction_entry(db, transaction)
+                supported = parse_tx(db, transaction)
+                if not supported:
+                    not_supported[tx_hash] = ""
+                    not_supported_sorted.append((block_index, tx_hash))
+            else:
+                # If a transaction hasn’t been added to the
+                # table `transactions`, then it’s not a
+                # Counterparty transaction.
+                not_supported[tx_hash] = ""
+                not_supported_sorted.append((block_index, tx_hash))
+                raise MempoolError
+
+            # Save transaction and side‐effects in memory.
+            cursor.execute(
+                """SELECT * FROM messages WHERE block_index = ?""",
+                (config.MEMPOOL_BLOCK_INDEX,),
+            )
+            for message in list(cursor):
+                xcp_mempool.append((tx_hash, message))
+
+            # Rollback.
+            raise MempoolError
+    except exceptions.ParseTransactionError as e:
+        logger.warning(f"ParseTransactionError for tx {tx_hash}: {e}")
+    except MempoolError:
+        pass
+    finally:
+        ledger.JOURNAL_INDEXES = journal_indexes
+        ledger.ORDER_BOOK = order_book
+        ledger.DISPENSER_ADDRESSES = dispenser_addresses
+    return mempool_tx_index
+
+
 def follow(db):
     # Check software version.
     check.software_version()
@@ -938,7 +1416,7 @@ def follow(db):
     # If we're far behind, start Prefetcher.
     block_count = backend.getblockcount()  # TODO: Need retry logic
     if block_index <= block_count - 2000:
-        prefetcher.start_all(NUM_PREFETCHER_THREADS)
+        prefetcher.start_all(NUM_PREFETCHER_THREADS, NUM_DECODER_PROCESSES)
 
     # Get index of last transaction.
     tx_index = get_next_tx_index(db)
@@ -1031,6 +1509,7 @@ def follow(db):
                 rollback(db, block_index=current_index - 1)
                 block_index = current_index - 1
                 tx_index = get_next_tx_index(db)
+                api_state.set_last_block(ledger.get_last_block(db))
                 continue
 
             # Check version every 24H.
@@ -1042,15 +1521,20 @@ def follow(db):
 
             # Get and parse transactions in this block (atomically).
             # logger.debug(f'Blockchain cache size: {len(backend.BLOCKCHAIN_CACHE)}')
-            if current_index in backend.BLOCKCHAIN_CACHE:
+            decoded_transactions = None
+            cached_block = prefetcher.get_block(current_index)
+            if cached_block is not None:
                 # logger.debug(f'Blockchain cache hit! Block index: {current_index}')
-                block_hash = backend.BLOCKCHAIN_CACHE[current_index]["block_hash"]
-                txhash_list = backend.BLOCKCHAIN_CACHE[current_index]["txhash_list"]
-                raw_transactions = backend.BLOCKCHAIN_CACHE[current_index]["raw_transactions"]
-                previous_block_hash = backend.BLOCKCHAIN_CACHE[current_index]["previous_block_hash"]
-                block_time = backend.BLOCKCHAIN_CACHE[current_index]["block_time"]
-                block_difficulty = backend.BLOCKCHAIN_CACHE[current_index]["block_difficulty"]
-                del backend.BLOCKCHAIN_CACHE[current_index]
+                block_hash = cached_block["block_hash"]
+                decoded_transactions = prefetcher.get_decoded_transactions(
+                    current_index, block_hash
+                )
+                txhash_list = cached_block["txhash_list"]
+                raw_transactions = cached_block["raw_transactions"]
+                previous_block_hash = cached_block["previous_block_hash"]
+                block_time = cached_block["block_time"]
+                block_difficulty = cached_block["block_difficulty"]
+                prefetcher.release_block(current_index)
             else:
                 if block_index < block_count - 100:
                     logger.warning(f"Blockchain cache miss :/ Block index: {current_index}")
@@ -1077,11 +1561,25 @@ def follow(db):
                 }
                 ledger.insert_record(db, "blocks", block_bindings, "NEW_BLOCK")
 
+                if decoded_transactions is None:
+                    decoded_transactions = {
+                        tx_hash: BlockchainParser().deserialize_tx(raw_transactions[tx_hash])
+                        for tx_hash in txhash_list
+                    }
+                # Fetch the outputs spent by the Counterparty transactions in one batch.
+                prefetch_prevouts(db, decoded_transactions.values())
+
                 # List the transactions in the block.
                 for tx_hash in txhash_list:
-                    tx_hex = raw_transactions[tx_hash]
                     tx_index = list_tx(
-                        db, block_hash, block_index, block_time, tx_hash, tx_index, tx_hex
+                        db,
+                        block_hash,
+                        block_index,
+                        block_time,
+                        tx_hash,
+                        tx_index,
+                        raw_transactions[tx_hash],
+                        decoded_tx=decoded_transactions[tx_hash],
                     )
 
                 # Parse the transactions in the block.
@@ -1089,13 +1587,16 @@ def follow(db):
                     parse_block(db, block_index, block_time, start_time=start_time)
                     # parse_block(db, block_index, block_time)
                 )
+            api_state.set_last_block(block_bindings)
 
-            # When newly caught up, check for conservation of assets.
-            if block_index == block_count:
-                if config.CHECK_ASSET_CONSERVATION:
-                    check.asset_conservation(db)
-                else:
-                    logger.debug("Skip asset conservation check.")
+            # Check for conservation of assets with the asset counters, and
+            # with a full scan of the tables when newly caught up.
+            if config.CHECK_ASSET_CONSERVATION:
+                check.asset_conservation(
+                    db, deep=block_index == block_count, block_index=block_index
+                )
+            elif block_index == block_count:
+                logger.debug("Skip asset conservation check.")
 
             # Remove any non‐supported transactions older than ten blocks.
             while len(not_supported_sorted) and not_supported_sorted[0][0] <= block_index - 10:
@@ -1112,6 +1613,8 @@ def follow(db):
             logger.info(
                 f"Block: {block_index} ({duration:.2f}, hashes: L:{new_ledger_hash[-5:]} / TX:{new_txlist_hash[-5:]} / M:{new_messages_hash[-5:]}{overwrote})"
             )
+            if prefetcher.PREFETCHER_THREADS:
+                logger.debug(f"Prefetcher: {prefetcher.get_stats()}")
 
             # Increment block index.
             block_count = backend.getblockcount()
@@ -1132,6 +1635,8 @@ def follow(db):
             mempool_tx_index = tx_index
 
             xcp_mempool = []
+            # entries of the parsed transactions for `mempool.update()`
+            parsed_transactions = {}
             raw_mempool = backend.getrawmempool()
 
             # For each transaction in Bitcoin Core mempool, if it’s new, create
@@ -1167,95 +1672,47 @@ def follow(db):
                 continue  # restart the follow loop
 
             parsed_txs_count = 0
-            for tx_hash in parse_txs:
+            interrupted = False
+            for chunk_start in range(0, len(parse_txs), MEMPOOL_CHUNK_SIZE):
                 # Get block count everytime we parse some mempool_txs. If there is a new block, we just interrupt this process
-                if parsed_txs_count % 100 == 0:
-                    if len(parse_txs) > 1000:
-                        logger.trace(
-                            f"Mempool parsed txs count:{parsed_txs_count} from {len(parse_txs)}"
-                        )
-
-                    try:
-                        block_count = backend.getblockcount()
-
-                        if block_index <= block_count:
-                            logger.info("Mempool parsing interrupted, there are blocks to parse")
-                            break  # Interrupt the process if there is a new block to parse
-                    except (
-                        ConnectionRefusedError,
-                        http.client.CannotSendRequest,
-                        backend.addrindexrs.BackendRPCError,
-                    ) as e:  # noqa: F841
-                        # Keep parsing what we have, anyway if there is a temporary problem with the server,
-                        # normal parse won't work
-                        pass
+                if len(parse_txs) > 1000:
+                    logger.trace(
+                        f"Mempool parsed txs count:{parsed_txs_count} from {len(parse_txs)}"
+                    )
 
                 try:
-                    with db:
-                        # List the fake block.
-                        cursor.execute(
-                            """INSERT INTO blocks(
-                                            block_index,
-                                            block_hash,
-                                            block_time) VALUES(?,?,?)""",
-                            (config.MEMPOOL_BLOCK_INDEX, config.MEMPOOL_BLOCK_HASH, curr_time),
-                        )
-
-                        tx_hex = raw_transactions[tx_hash]
-                        if tx_hex is None:
-                            # logger.debug(
-                            #     "tx_hash %s not found in backend.  Not adding to mempool.",
-                            #     (tx_hash,),
-                            # )
-                            raise MempoolError
-                        mempool_tx_index = list_tx(
-                            db,
-                            None,
-                            block_index,
-                            curr_time,
-                            tx_hash,
-                            tx_index=mempool_tx_index,
-                            tx_hex=tx_hex,
-                        )
-
-                        # Parse transaction.
-                        cursor.execute(
-                            """SELECT * FROM transactions WHERE tx_hash = ?""", (tx_hash,)
-                        )
-                        transactions = list(cursor)
-                        if transactions:
-                            assert len(transactions) == 1
-                            transaction = transactions[0]
-                            supported = parse_tx(db, transaction)
-                            if not supported:
-                                not_supported[tx_hash] = ""
-                                not_supported_sorted.append((block_index, tx_hash))
-                        else:
-                            # If a transaction hasn’t been added to the
-                            # table `transactions`, then it’s not a
-                            # Counterparty transaction.
-                            not_supported[tx_hash] = ""
-                            not_supported_sorted.append((block_index, tx_hash))
-                            raise MempoolError
-
-                        # Save transaction and side‐effects in memory.
-                        cursor.execute(
-                            """SELECT * FROM messages WHERE block_index = ?""",
-                            (config.MEMPOOL_BLOCK_INDEX,),
-                        )
-                        for message in list(cursor):
-                            xcp_mempool.append((tx_hash, message))
-
-                        # Rollback.
-                        raise MempoolError
-                except exceptions.ParseTransactionError as e:
-                    logger.warning(f"ParseTransactionError for tx {tx_hash}: {e}")
-                except MempoolError:
+                    block_count = backend.getblockcount()
+
+                    if block_index <= block_count:
+                        logger.info("Mempool parsing interrupted, there are blocks to parse")
+                        interrupted = True
+                        break  # Interrupt the process if there is a new block to parse
+                except (
+                    ConnectionRefusedError,
+                    http.client.CannotSendRequest,
+                    backend.addrindexrs.BackendRPCError,
+                ) as e:  # noqa: F841
+                    # Keep parsing what we have, anyway if there is a temporary problem with the server,
+                    # normal parse won't work
                     pass
 
-                parsed_txs_count = parsed_txs_count + 1
+                for tx_hash in parse_txs[chunk_start : chunk_start + MEMPOOL_CHUNK_SIZE]:
+                    mempool_tx_index = parse_mempool_tx(
+                        db,
+                        cursor,
+                        tx_hash,
+                        raw_transactions[tx_hash],
+                        block_index,
+                        curr_time,
+                        mempool_tx_index,
+                        not_supported,
+                        not_supported_sorted,
+                        xcp_mempool,
+                        parsed_transactions,
+                    )
+                    parsed_txs_count += 1
 
-            if parsed_txs_count < len(parse_txs):
+            if interrupted:
                 continue  # if parse didn't finish is an interruption
             else:
                 if len(parse_txs) > 1000:
@@ -1272,6 +1729,11 @@ def follow(db):
                         new_message,
                     )
 
+            # Update the Counterparty transactions served by the API.
+            mempool.update(
+                db, [tx_hash for tx_hash, _ in xcp_mempool], parsed_transactions, raw_transactions
+            )
+
             elapsed_time = time.time() - start_time
             sleep_time = (
                 config.BACKEND_POLL_INTERVAL - elapsed_time
@@ -1,3 +1,4 @@
+import hashlib
 import json
 import logging
 import sys
@@ -810,50 +811,88 @@ class ConsensusError(Exception):
     pass
 
 
-def consensus_hash(db, field, previous_consensus_hash, content):
-    assert field in ("ledger_hash", "txlist_hash", "messages_hash")
+CONSENSUS_HASH_FIELDS = ("ledger_hash", "txlist_hash", "messages_hash")
 
-    cursor = db.cursor()
+
+class ConsensusHash:
+    """Double SHA-256 of `previous_consensus_hash + version + "".join(content)`.
+
+    The content is fed piece by piece with `append()`, like a list,
+    so the block content is never concatenated in memory.
+    """
+
+    def __init__(self, field, previous_consensus_hash, found_hash):
+        assert field in CONSENSUS_HASH_FIELDS
+        self.field = field
+        self.found_hash = found_hash
+        if config.TESTNET:
+            consensus_hash_version = CONSENSUS_HASH_VERSION_TESTNET
+        elif config.REGTEST:
+            consensus_hash_version = CONSENSUS_HASH_VERSION_REGTEST
+        else:
+            consensus_hash_version = CONSENSUS_HASH_VERSION_MAINNET
+        self.hasher = hashlib.sha256(
+            f"{previous_consensus_hash}{consensus_hash_version}".encode("utf-8")
+        )
+
+    def append(self, content):
+        self.hasher.update(content.encode("utf-8"))
+
+    def hexdigest(self):
+        return hashlib.sha256(self.hasher.digest()).hexdigest()
+
+
+def init_consensus_hashes(db, previous_consensus_hashes):
+    """Return a `ConsensusHash` for each field of the current block.
+
+    `previous_consensus_hashes` are read from the database when not provided.
+    """
     block_index = util.CURRENT_BLOCK_INDEX
+    cursor = db.cursor()
+    blocks = {
+        block["block_index"]: block
+        for block in cursor.execute(
+            """SELECT * FROM blocks WHERE block_index IN (?, ?)""",
+            (block_index - 1, block_index),
+        )
+    }
+    cursor.close()
 
-    # Initialise previous hash on first block.
-    if block_index <= config.BLOCK_FIRST:
-        assert not previous_consensus_hash
-        previous_consensus_hash = util.dhash_string(CONSENSUS_HASH_SEED)
+    consensus_hashes = {}
+    for field in CONSENSUS_HASH_FIELDS:
+        previous_consensus_hash = previous_consensus_hashes.get(field)
+        # Initialise previous hash on first block.
+        if block_index <= config.BLOCK_FIRST:
+            assert not previous_consensus_hash
+            previous_consensus_hash = util.dhash_string(CONSENSUS_HASH_SEED)
 
-    # Get previous hash.
-    if not previous_consensus_hash:
-        try:
-            previous_consensus_hash = list(
-                cursor.execute("""SELECT * FROM blocks WHERE block_index = ?""", (block_index - 1,))
-            )[0][field]
-        except IndexError:
-            previous_consensus_hash = None
+        # Get previous hash.
         if not previous_consensus_hash:
-            raise ConsensusError(
-                f"Empty previous {field} for block {block_index}. Please launch a `rollback`."
-            )
+            if block_index - 1 in blocks:
+                previous_consensus_hash = blocks[block_index - 1][field]
+            if not previous_consensus_hash:
+                raise ConsensusError(
+                    f"Empty previous {field} for block {block_index}. Please launch a `rollback`."
+                )
 
-    # Calculate current hash.
-    if config.TESTNET:
-        consensus_hash_version = CONSENSUS_HASH_VERSION_TESTNET
-    elif config.REGTEST:
-        consensus_hash_version = CONSENSUS_HASH_VERSION_REGTEST
-    else:
-        consensus_hash_version = CONSENSUS_HASH_VERSION_MAINNET
+        found_hash = None
+        if block_index in blocks:
+            found_hash = blocks[block_index][field] or None
+        consensus_hashes[field] = ConsensusHash(field, previous_consensus_hash, found_hash)
+    return consensus_hashes
+
+
+def consensus_hash(db, consensus_hash_content):
+    field = consensus_hash_content.field
+    block_index = util.CURRENT_BLOCK_INDEX
+    cursor = db.cursor()
 
-    calculated_hash = util.dhash_string(
-        previous_consensus_hash + f"{consensus_hash_version}{''.join(content)}"
-    )
+    # Calculate current hash.
+    calculated_hash = consensus_hash_content.hexdigest()
+    found_hash = consensus_hash_content.found_hash
 
     # Verify hash (if already in database) or save hash (if not).
     # NOTE: do not enforce this for messages_hashes, those are more informational (for now at least)
-    found_hash = (
-        list(cursor.execute("""SELECT * FROM blocks WHERE block_index = ?""", (block_index,)))[0][
-            field
-        ]
-        or None
-    )
     if found_hash and field != "messages_hash":
         # Check against existing value.
         if calculated_hash != found_hash:
@@ -890,10 +929,20 @@ class SanityError(Exception):
     pass
 
 
-def asset_conservation(db):
+def asset_conservation(db, deep=False, block_index=None):
+    """Check that the supply of each asset is held, using the asset counters.
+
+    With `block_index`, only the assets changed by this block are checked.
+    With `deep`, the supplies and held quantities are computed by scanning
+    all the tables, and the asset counters are checked against them.
+    """
     logger.debug("Checking for conservation of assets.")
-    supplies = ledger.supplies(db)
-    held = ledger.held(db)
+    if deep:
+        supplies = ledger.supplies(db)
+        held = ledger.held(db)
+        asset_counters_conservation(db, supplies, held)
+    else:
+        supplies, held = ledger.get_asset_counters(db, block_index)
     for asset in supplies.keys():
         asset_issued = supplies[asset]
         asset_held = held[asset] if asset in held and held[asset] != None else 0  # noqa: E711
@@ -906,14 +955,25 @@ def asset_conservation(db):
                     asset,
                 )
             )
-        logger.debug(
-            "{} has been conserved ({} {} both issued and held)".format(
-                asset, ledger.value_out(db, asset_issued, asset), asset
+        # checked after each block, the quantities are not formatted
+        if block_index is None:
+            logger.debug(
+                "{} has been conserved ({} {} both issued and held)".format(
+                    asset, ledger.value_out(db, asset_issued, asset), asset
+                )
             )
-        )
     logger.debug("All assets have been conserved.")
 
 
+def asset_counters_conservation(db, supplies, held):
+    counted_supplies, counted_held = ledger.get_asset_counters(db)
+    for asset in supplies.keys():
+        if (supplies[asset] or 0) != counted_supplies.get(asset, 0):
+            raise SanityError(f"{asset} supply doesn't match the asset counters")
+        if (held.get(asset) or 0) != counted_held.get(asset, 0):
+            raise SanityError(f"{asset} held quantity doesn't match the asset counters")
+
+
 class VersionError(Exception):
     pass
 
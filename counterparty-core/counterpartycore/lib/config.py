@@ -148,6 +148,7 @@ ADDRESS_OPTION_MAX_VALUE = ADDRESS_OPTION_REQUIRE_MEMO  # Or list of all the add
 OLD_STYLE_API = True
 
 API_LIMIT_ROWS = 1000
+DEFAULT_API_WORKERS = 16
 
 MPMA_LIMIT = 1000
 
@@ -1,5 +1,9 @@
+import collections
 import logging
 import os
+import queue
+import threading
+import weakref
 
 import apsw
 import apsw.bestpractice
@@ -85,6 +89,116 @@ def get_connection(read_only=True):
     return db
 
 
+class ConnectionPool:
+    """Bounded pool of read-only connections shared by the threads of the API server.
+
+    Connections are opened lazily, up to `size`; `get()` then waits for a
+    connection to be released.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.connections = queue.LifoQueue()
+        self.opened = 0
+        self.lock = threading.Lock()
+
+    def get(self, timeout=None):
+        try:
+            return self.connections.get_nowait()
+        except queue.Empty:
+            pass
+        with self.lock:
+            if self.opened < self.size:
+                self.opened += 1
+                open_connection = True
+            else:
+                open_connection = False
+        if open_connection:
+            try:
+                return get_connection(read_only=True)
+            except Exception:
+                with self.lock:
+                    self.opened -= 1
+                raise
+        try:
+            return self.connections.get(timeout=timeout)
+        except queue.Empty as e:
+            raise exceptions.DatabaseError("No database connection available.") from e
+
+    def release(self, db):
+        self.connections.put(db)
+
+    def close(self):
+        while True:
+            try:
+                db = self.connections.get_nowait()
+            except queue.Empty:
+                break
+            reset_statements(db)
+            db.close()
+            with self.lock:
+                self.opened -= 1
+
+
+# Statement layer used by the ledger getters called for every transaction.
+# apsw already caches the prepared statements of each connection by SQL text;
+# on top of that we keep, per connection, one cursor per statement and the
+# column names of the tables.
+STATEMENT_CURSORS_MAX = 128
+STATEMENTS = weakref.WeakKeyDictionary()
+TABLE_COLUMNS = weakref.WeakKeyDictionary()
+
+
+def get_statement_cursor(db, query):
+    """Return the cursor reserved for `query` on this connection."""
+    cursors = STATEMENTS.get(db)
+    if cursors is None:
+        cursors = STATEMENTS[db] = collections.OrderedDict()
+    cursor = cursors.get(query)
+    if cursor is None:
+        cursor = cursors[query] = db.cursor()
+        if len(cursors) > STATEMENT_CURSORS_MAX:
+            cursors.popitem(last=False)[1].close()
+    else:
+        cursors.move_to_end(query)
+    return cursor
+
+
+def fetchall(db, query, bindings=()):
+    """Execute `query` with its reserved cursor and return all the rows.
+
+    The rows are always fully fetched so that the statement is reset and
+    doesn't keep a read transaction open.
+    """
+    return get_statement_cursor(db, query).execute(query, bindings).fetchall()
+
+
+def fetchone(db, query, bindings=()):
+    """Like `fetchall()` but return only the first row, or `None`."""
+    rows = fetchall(db, query, bindings)
+    return rows[0] if rows else None
+
+
+def get_table_columns(db, table_name):
+    """Return the column names of `table_name`, cached per connection."""
+    columns = TABLE_COLUMNS.get(db)
+    if columns is None:
+        columns = TABLE_COLUMNS[db] = {}
+    if table_name not in columns:
+        cursor = db.cursor()
+        cursor.execute(f"PRAGMA table_info({table_name})")
+        columns[table_name] = [column["name"] for column in cursor]
+        cursor.close()
+    return columns[table_name]
+
+
+def reset_statements(db):
+    """Forget the cursors and columns cached for `db`, after a schema change."""
+    for cursor in STATEMENTS.pop(db, {}).values():
+        cursor.close()
+    TABLE_COLUMNS.pop(db, None)
+
+
 class DatabaseIntegrityError(exceptions.DatabaseError):
     pass
 
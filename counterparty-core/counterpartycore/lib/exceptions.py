@@ -91,4 +91,8 @@ class InvalidArgument(Exception):
     pass
 
 
+class BlocksReaderError(Exception):
+    pass
+
+
 # vim: tabstop=8 expandtab shiftwidth=4 softtabstop=4
@@ -1,6 +1,8 @@
 import binascii
+import collections
 import logging
 import struct
+import threading
 
 from counterpartycore.lib import arc4, backend, config, script, util
 from counterpartycore.lib.exceptions import BTCOnlyError, DecodeError
@@ -12,6 +14,14 @@ from counterpartycore.lib.transaction_helper import p2sh_encoding
 
 logger = logging.getLogger(config.LOGGER_NAME)
 
+# Outputs spent by the transactions to parse: (txid, n) -> (value, scriptPubKey, segwit),
+# `segwit` telling if the transaction of the output has a witness. Filled in one batch
+# for each block by `prefetch_prevouts()`, and by the transactions of the mempool,
+# that are parsed again when confirmed.
+PREVOUTS_CACHE = collections.OrderedDict()
+PREVOUTS_CACHE_MAX_SIZE = 100000
+PREVOUTS_CACHE_LOCK = threading.Lock()
+
 
 def arc4_decrypt(cyphertext, decoded_tx):
     """Un‐obfuscate. Initialise key once per attempt."""
@@ -137,22 +147,44 @@ def get_address(scriptpubkey, block_index):
         return address
 
 
+def cache_prevouts(txid, tx, output_indexes):
+    """Cache the outputs `output_indexes` of the deserialized transaction `tx`."""
+    segwit = len(tx["vtxinwit"]) > 0
+    with PREVOUTS_CACHE_LOCK:
+        for n in output_indexes:
+            vout = tx["vout"][n]
+            PREVOUTS_CACHE[(txid, n)] = (vout["nValue"], vout["scriptPubKey"], segwit)
+            PREVOUTS_CACHE.move_to_end((txid, n))
+        while len(PREVOUTS_CACHE) > PREVOUTS_CACHE_MAX_SIZE:
+            PREVOUTS_CACHE.popitem(last=False)
+
+
+def get_prevout(vin, block_parser=None):
+    """Return the value, the script and the segwit flag of the output spent by `vin`."""
+    if block_parser:
+        return block_parser.get_prevout(ib2h(vin["hash"]), vin["n"])
+
+    txid = ib2h(vin["hash"])
+    with PREVOUTS_CACHE_LOCK:
+        prevout = PREVOUTS_CACHE.get((txid, vin["n"]))
+    if prevout is not None:
+        return prevout
+
+    # Note: We don't know what block the `vin` is in, and the block might have been from a while ago, so this call may not hit the cache.
+    vin_tx = backend.getrawtransaction(txid, block_index=None)
+    vin_ctx = BlockchainParser().deserialize_tx(vin_tx)
+    cache_prevouts(txid, vin_ctx, [vin["n"]])
+    vout = vin_ctx["vout"][vin["n"]]
+    return vout["nValue"], vout["scriptPubKey"], len(vin_ctx["vtxinwit"]) > 0
+
+
 def get_transaction_sources(decoded_tx, block_parser=None):
     sources = []
     outputs_value = 0
 
     for vin in decoded_tx["vin"][:]:  # Loop through inputs.
-        script_pubkey = None
-        if block_parser:
-            vin_ctx = block_parser.read_raw_transaction(ib2h(vin["hash"]))
-        else:
-            # Note: We don't know what block the `vin` is in, and the block might have been from a while ago, so this call may not hit the cache.
-            vin_tx = backend.getrawtransaction(ib2h(vin["hash"]), block_index=None)
-            vin_ctx = BlockchainParser().deserialize_tx(vin_tx)
-
-        vout = vin_ctx["vout"][vin["n"]]
-        outputs_value += vout["nValue"]
-        script_pubkey = vout["scriptPubKey"]
+        value, script_pubkey, _ = get_prevout(vin, block_parser=block_parser)
+        outputs_value += value
 
         asm = script.script_to_asm(script_pubkey)
 
@@ -191,20 +223,14 @@ def get_transaction_source_from_p2sh(decoded_tx, p2sh_is_segwit, block_parser=No
     outputs_value = 0
 
     for vin in decoded_tx["vin"]:
-        if block_parser:
-            vin_ctx = block_parser.read_raw_transaction(ib2h(vin["hash"]))
-        else:
-            # Note: We don't know what block the `vin` is in, and the block might have been from a while ago, so this call may not hit the cache.
-            vin_tx = backend.getrawtransaction(ib2h(vin["hash"]), block_index=None)
-            vin_ctx = BlockchainParser().deserialize_tx(vin_tx)
+        value, _, segwit = get_prevout(vin, block_parser=block_parser)
 
         if util.enabled("prevout_segwit_fix"):
-            prevout_is_segwit = len(vin_ctx["vtxinwit"]) > 0
+            prevout_is_segwit = segwit
         else:
             prevout_is_segwit = p2sh_is_segwit
 
-        vout = vin_ctx["vout"][vin["n"]]
-        outputs_value += vout["nValue"]
+        outputs_value += value
 
         # Ignore transactions with invalid script.
         asm = script.script_to_asm(vin["scriptSig"])
@@ -240,6 +266,65 @@ def get_dispensers_outputs(db, potential_dispensers):
     return outputs
 
 
+def needs_sources(db, decoded_tx):
+    """Tell if `get_tx_info_new()` will look for the sources of `decoded_tx`.
+
+    The parsed vouts and the dispensers outputs are kept in `decoded_tx` for
+    `get_tx_info_new()`: the transactions of a block are all listed before the
+    block is parsed, so the dispensers can't change in between.
+    """
+    if decoded_tx["coinbase"]:
+        return False
+    if "parsed_vouts" not in decoded_tx:
+        try:
+            decoded_tx["parsed_vouts"] = parse_transaction_vouts(decoded_tx)
+        except DecodeError:
+            decoded_tx["parsed_vouts"] = "DecodeError"
+        except Exception:  # noqa: BLE001
+            # raised again when the transaction is parsed
+            return False
+    if decoded_tx["parsed_vouts"] == "DecodeError":
+        return False
+    destinations, _, _, data, potential_dispensers = decoded_tx["parsed_vouts"]
+    if data or destinations == [config.UNSPENDABLE]:
+        return True
+    if not util.enabled("dispensers"):
+        return False
+    decoded_tx["dispensers_outputs"] = get_dispensers_outputs(db, potential_dispensers)
+    return len(decoded_tx["dispensers_outputs"]) > 0
+
+
+def prefetch_prevouts(db, decoded_transactions):
+    """Fetch in one batch the outputs spent by the transactions of a block that need their sources."""
+    if not util.enabled("multisig_addresses"):
+        return
+    output_indexes = {}
+    for decoded_tx in decoded_transactions:
+        if not needs_sources(db, decoded_tx):
+            continue
+        for vin in decoded_tx["vin"]:
+            txid = ib2h(vin["hash"])
+            if (txid, vin["n"]) not in PREVOUTS_CACHE:
+                output_indexes.setdefault(txid, set()).add(vin["n"])
+    if not output_indexes:
+        return
+
+    try:
+        raw_transactions = backend.getrawtransaction_batch(
+            list(output_indexes.keys()), skip_missing=True
+        )
+    except Exception as e:  # noqa: BLE001
+        # the missing outputs are fetched one by one
+        logger.warning("Failed to fetch the prevouts of the block, continue; %s", (e,))
+        return
+    for txid, tx_hex in raw_transactions.items():
+        if tx_hex is None or txid not in output_indexes:
+            continue
+        tx = BlockchainParser().deserialize_tx(tx_hex)
+        # an invalid output index is an error when the transaction is parsed
+        cache_prevouts(txid, tx, [n for n in output_indexes[txid] if n < len(tx["vout"])])
+
+
 def get_dispensers_tx_info(sources, dispensers_outputs):
     source, destination, btc_amount, fee, data, outs = b"", None, None, None, None, []
 
@@ -376,7 +461,10 @@ def get_tx_info_new(
         config.UNSPENDABLE,
     ]:
         if util.enabled("dispensers", block_index) and not composing:
-            dispensers_outputs = get_dispensers_outputs(db, potential_dispensers)
+            if "dispensers_outputs" in decoded_tx:
+                dispensers_outputs = decoded_tx["dispensers_outputs"]
+            else:
+                dispensers_outputs = get_dispensers_outputs(db, potential_dispensers)
             if len(dispensers_outputs) == 0:
                 raise BTCOnlyError("no data and not unspendable")
         else:
@@ -482,18 +570,9 @@ def get_tx_info_legacy(decoded_tx, block_index, block_parser=None):
         if vin["coinbase"]:
             raise DecodeError("coinbase transaction")
 
-        # Get the full transaction data for this input transaction.
-        script_pubkey = None
-        if block_parser:
-            vin_ctx = block_parser.read_raw_transaction(ib2h(vin["hash"]))
-        else:
-            # Note: We don't know what block the `vin` is in, and the block might have been from a while ago, so this call may not hit the cache.
-            vin_tx = backend.getrawtransaction(ib2h(vin["hash"]), block_index=None)
-            vin_ctx = BlockchainParser().deserialize_tx(vin_tx)
-
-        vout = vin_ctx["vout"][vin["n"]]
-        fee += vout["nValue"]
-        script_pubkey = vout["scriptPubKey"]
+        # Get the output spent by this input.
+        value, script_pubkey, _ = get_prevout(vin, block_parser=block_parser)
+        fee += value
 
         address = get_address(script_pubkey, block_index)
         if not address:
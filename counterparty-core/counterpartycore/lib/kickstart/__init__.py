@@ -13,6 +13,7 @@ from termcolor import colored
 from counterpartycore import server
 from counterpartycore.lib import backend, blocks, config, database, ledger, util  # noqa: F401
 from counterpartycore.lib.backend.addrindexrs import AddrindexrsSocket  # noqa: F401
+from counterpartycore.lib.kickstart import block_buffer
 from counterpartycore.lib.kickstart.blocks_parser import BlockchainParser, ChainstateParser
 from counterpartycore.lib.kickstart.utils import remove_shm_from_resource_tracker
 
@@ -20,6 +21,10 @@ logger = logging.getLogger(config.LOGGER_NAME)
 
 OK_GREEN = colored("[OK]", "green")
 SPINNER_STYLE = "bouncingBar"
+# the parser process is usually the bottleneck beyond that
+MAX_DEFAULT_BLOCKS_READERS = 4
+# in MB, a block record must fit in the blocks buffer
+MIN_BLOCKS_BUFFER_SIZE = 8
 
 
 def confirm_kickstart():
@@ -131,6 +136,11 @@ def prepare_db_for_resume(cursor):
     # clean tables from last parsed block
     for table in blocks.TABLES + ["transaction_outputs", "transactions", "blocks"]:
         blocks.clean_table_from(cursor, table, last_parsed_block + 1)
+    for table in ledger.ID_FIELDS:
+        blocks.clean_current_state_table_from(cursor, table, last_parsed_block + 1)
+    ledger.rollback_asset_holders(cursor.connection, last_parsed_block + 1)
+    ledger.rollback_asset_counters(cursor.connection, last_parsed_block + 1)
+    ledger.reset_caches()
 
     block_count = last_block_index - last_parsed_block
 
@@ -209,17 +219,36 @@ def intialize_kickstart_db(bitcoind_dir, last_known_hash, resuming, new_database
     return kickstart_db, block_count, tx_index, last_parsed_block
 
 
-def start_blocks_parser_process(bitcoind_dir, last_parsed_block, max_queue_size):
+def start_blocks_parser_process(
+    bitcoind_dir, last_parsed_block, max_queue_size, blocks_readers=None, blocks_buffer_size=None
+):
     step = f"Starting blocks parser from block {last_parsed_block}..."
-    with Halo(text=step, spinner=SPINNER_STYLE):
-        # determine queue size
+    with Halo(text=step, spinner=SPINNER_STYLE) as spinner:
+
+        def positions_progress(count, total):
+            spinner.text = f"{step} Reading blocks positions: {count}/{total}"
+
+        # determine queue size, by reader
         default_queue_size = 100
         if config.TESTNET:
             default_queue_size = 1000
         queue_size = max_queue_size if max_queue_size is not None else default_queue_size
+        # determine readers count, the parser has its own core
+        if blocks_readers is None:
+            blocks_readers = min(MAX_DEFAULT_BLOCKS_READERS, max((os.cpu_count() or 2) - 1, 1))
+        # determine blocks buffer size, by reader
+        buffer_size = block_buffer.BLOCK_BUFFER_SIZE
+        if blocks_buffer_size is not None:
+            buffer_size = blocks_buffer_size * 1024 * 1024
         # Start block parser.
         block_parser = BlockchainParser(
-            bitcoind_dir, config.DATABASE, last_parsed_block, queue_size
+            bitcoind_dir,
+            config.DATABASE,
+            last_parsed_block,
+            queue_size,
+            readers=blocks_readers,
+            buffer_size=buffer_size,
+            positions_progress=positions_progress,
         )
     print(f"{OK_GREEN} {step}")
     return block_parser
@@ -345,7 +374,14 @@ def cleanup(kickstart_db, block_parser):
     print(f"{OK_GREEN} {step}")
 
 
-def run(bitcoind_dir, force=False, max_queue_size=None, debug_block=None):
+def run(
+    bitcoind_dir,
+    force=False,
+    max_queue_size=None,
+    debug_block=None,
+    blocks_readers=None,
+    blocks_buffer_size=None,
+):
     # default signal handlers
     signal.signal(signal.SIGTERM, signal.SIG_DFL)
     signal.signal(signal.SIGINT, signal.default_int_handler)
@@ -383,7 +419,9 @@ def run(bitcoind_dir, force=False, max_queue_size=None, debug_block=None):
     )
 
     # Start block parser.
-    block_parser = start_blocks_parser_process(bitcoind_dir, last_parsed_block, max_queue_size)
+    block_parser = start_blocks_parser_process(
+        bitcoind_dir, last_parsed_block, max_queue_size, blocks_readers, blocks_buffer_size
+    )
 
     # intitialize message
     message = ""
@@ -6,6 +6,14 @@ import struct
 
 from .exceptions import SerializationError
 
+INT16 = struct.Struct("<h")
+UINT16 = struct.Struct("<H")
+INT32 = struct.Struct("<i")
+UINT32 = struct.Struct("<I")
+INT64 = struct.Struct("<q")
+UINT64 = struct.Struct("<Q")
+STRUCTS = {s.format: s for s in [INT16, UINT16, INT32, UINT32, INT64, UINT64]}
+
 
 class BCDataStream(object):
     def __init__(self):
@@ -26,6 +34,10 @@ class BCDataStream(object):
         self.input = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
         self.read_cursor = start
 
+    def map_buffer(self, buffer, start):  # Initialize with an already mapped file
+        self.input = buffer
+        self.read_cursor = start
+
     def map_hex(self, data):  # Initialize with hex string
         data_bytes = bytes.fromhex(data)
         self.input = data_bytes
@@ -68,26 +80,30 @@ class BCDataStream(object):
         except IndexError:
             raise SerializationError("attempt to read past end of buffer")  # noqa: B904
 
+    def read_view(self, start, end):
+        """Return the bytes from `start` to `end` without copying them."""
+        return memoryview(self.input)[start:end]
+
     def read_boolean(self):
         return self.read_bytes(1)[0] != chr(0)
 
     def read_int16(self):
-        return self._read_num("<h")
+        return self._read_struct(INT16)
 
     def read_uint16(self):
-        return self._read_num("<H")
+        return self._read_struct(UINT16)
 
     def read_int32(self):
-        return self._read_num("<i")
+        return self._read_struct(INT32)
 
     def read_uint32(self):
-        return self._read_num("<I")
+        return self._read_struct(UINT32)
 
     def read_int64(self):
-        return self._read_num("<q")
+        return self._read_struct(INT64)
 
     def read_uint64(self):
-        return self._read_num("<Q")
+        return self._read_struct(UINT64)
 
     def write_boolean(self, val):
         return self.write(chr(1) if val else chr(0))
@@ -114,11 +130,11 @@ class BCDataStream(object):
         size = self.input[self.read_cursor]
         self.read_cursor += 1
         if size == 253:
-            return self._read_num("<H")
+            return self._read_struct(UINT16)
         elif size == 254:
-            return self._read_num("<I")
+            return self._read_struct(UINT32)
         elif size == 255:
-            return self._read_num("<Q")
+            return self._read_struct(UINT64)
         return size
 
     def write_compact_size(self, size):
@@ -137,8 +153,11 @@ class BCDataStream(object):
             self._write_num("<Q", size)
 
     def _read_num(self, format):
-        (i,) = struct.unpack_from(format, self.input, self.read_cursor)
-        self.read_cursor += struct.calcsize(format)
+        return self._read_struct(STRUCTS.get(format) or struct.Struct(format))
+
+    def _read_struct(self, num_struct):
+        (i,) = num_struct.unpack_from(self.input, self.read_cursor)
+        self.read_cursor += num_struct.size
         return i
 
     def _write_num(self, format, num):
@@ -148,7 +167,8 @@ class BCDataStream(object):
     def read_var_int(self):
         n = 0
         while True:
-            cur_byte = self.read_bytes(1)[0]
+            cur_byte = self.input[self.read_cursor]
+            self.read_cursor += 1
             n = (n << 7) | (cur_byte & 0x7F)
             if cur_byte & 0x80:
                 n += 1
@@ -0,0 +1,378 @@
+import hashlib
+
+# Used to serialize the parsed vouts of the transactions
+import marshal  # nosec B302
+import multiprocessing
+import struct
+from multiprocessing import shared_memory
+
+from .bc_data_stream import INT32, INT64, UINT16, UINT32, UINT64
+from .utils import double_hash, ib2h
+
+# Blocks are handed from the blocks reader process to the parser as binary
+# records written in a ring buffer in shared memory, instead of being pickled
+# in a new shared memory segment each. A block record contains the raw
+# transactions with the offsets of their fields, which the parser reads from
+# the buffer only when they are needed (see `BlockTransaction`).
+#
+# Block record: BLOCK_HEADER followed by the transaction records.
+# Transaction record: TX_HEADER, the raw transaction, a VIN_ENTRY by input, a
+# VOUT_ENTRY by output, a WITNESS_ENTRY by witness and the marshalled parsed
+# vouts. The offsets of the entries are relative to the raw transaction.
+# The reader copies the raw transactions from the mapped block file to the
+# buffer only, and the parser keeps only the outputs it caches as prevouts.
+
+BLOCK_BUFFER_SIZE = 64 * 1024 * 1024
+
+# block_index, tx_count, block_hash, hash_prev, block_time, bits, transaction_count
+BLOCK_HEADER = struct.Struct("<II64s64sIII")
+# tx_hash, flags, raw transaction length, vin count, vout count, witness count, parsed vouts length
+TX_HEADER = struct.Struct("<64sBIIIII")
+# hash offset, n, scriptSig offset, scriptSig length, nSequence
+VIN_ENTRY = struct.Struct("<IIIII")
+# nValue, scriptPubKey offset, scriptPubKey length
+VOUT_ENTRY = struct.Struct("<qII")
+# witness offset, witness length
+WITNESS_ENTRY = struct.Struct("<II")
+
+SEGWIT_FLAG = 1
+COINBASE_FLAG = 2
+NULL_HASH = b"\x00" * 32
+
+
+def read_compact_size(buffer, offset):
+    """Return the compact size at `offset` of `buffer` and the offset after it."""
+    size = buffer[offset]
+    if size == 253:
+        return UINT16.unpack_from(buffer, offset + 1)[0], offset + 3
+    if size == 254:
+        return UINT32.unpack_from(buffer, offset + 1)[0], offset + 5
+    if size == 255:
+        return UINT64.unpack_from(buffer, offset + 1)[0], offset + 9
+    return size, offset + 1
+
+
+def read_transaction_layout(buffer, start):
+    """Walk the transaction at `start` of `buffer` without copying its fields.
+
+    Return the end of the transaction, if it is segwit, the offset of its
+    witnesses and the entries of its inputs, outputs and witnesses.
+    """
+    offset = start + 4
+    segwit = buffer[offset] == 0 and buffer[offset + 1] == 1
+    if segwit:
+        offset += 2
+
+    vin_count, offset = read_compact_size(buffer, offset)
+    vins = []
+    for _ in range(vin_count):
+        n = UINT32.unpack_from(buffer, offset + 32)[0]
+        script_length, script_offset = read_compact_size(buffer, offset + 36)
+        sequence = UINT32.unpack_from(buffer, script_offset + script_length)[0]
+        vins.append((offset - start, n, script_offset - start, script_length, sequence))
+        offset = script_offset + script_length + 4
+
+    vout_count, offset = read_compact_size(buffer, offset)
+    vouts = []
+    for _ in range(vout_count):
+        value = INT64.unpack_from(buffer, offset)[0]
+        script_length, script_offset = read_compact_size(buffer, offset + 8)
+        vouts.append((value, script_offset - start, script_length))
+        offset = script_offset + script_length
+
+    witnesses_offset = offset - start
+    witnesses = []
+    if segwit:
+        for _ in range(vin_count):
+            witness_count, offset = read_compact_size(buffer, offset)
+            for _ in range(witness_count):
+                witness_length, offset = read_compact_size(buffer, offset)
+                witnesses.append((offset - start, witness_length))
+                offset += witness_length
+
+    # lock_time
+    offset += 4
+    return offset, segwit, witnesses_offset, vins, vouts, witnesses
+
+
+class BlockTransaction(dict):
+    """Transaction of a block record.
+
+    `tx_hash`, `segwit`, `coinbase` and `parsed_vouts` are read with the block,
+    the other fields of `BlockchainParser.read_transaction()` are decoded from
+    the raw transaction when first read.
+    """
+
+    def __init__(self, data, entries, vin_count, vout_count, witness_count, **fields):
+        dict.__init__(self, fields)
+        self.data = data
+        self.entries = entries
+        self.vin_count = vin_count
+        self.vout_count = vout_count
+        self.witness_count = witness_count
+
+    def __missing__(self, key):
+        if key == "vin":
+            value = self.decode_vin()
+        elif key == "vout":
+            value = self.decode_vout()
+        elif key == "vtxinwit":
+            value = self.decode_vtxinwit()
+        elif key == "version":
+            value = INT32.unpack_from(self.data, 0)[0]
+        elif key == "lock_time":
+            value = UINT32.unpack_from(self.data, len(self.data) - 4)[0]
+        elif key == "__data__":
+            value = bytes(self.data).hex()
+        else:
+            raise KeyError(key)
+        self[key] = value
+        return value
+
+    def decode_vin(self):
+        vin = []
+        for i in range(self.vin_count):
+            hash_offset, n, script_offset, script_length, sequence = VIN_ENTRY.unpack_from(
+                self.entries, i * VIN_ENTRY.size
+            )
+            tx_hash = bytes(self.data[hash_offset : hash_offset + 32])
+            vin.append(
+                {
+                    "hash": tx_hash,
+                    "n": n,
+                    "scriptSig": bytes(self.data[script_offset : script_offset + script_length]),
+                    "nSequence": sequence,
+                    "coinbase": tx_hash == NULL_HASH,
+                }
+            )
+        return vin
+
+    def decode_vout(self):
+        start = self.vin_count * VIN_ENTRY.size
+        vout = []
+        for i in range(self.vout_count):
+            value, script_offset, script_length = VOUT_ENTRY.unpack_from(
+                self.entries, start + i * VOUT_ENTRY.size
+            )
+            vout.append(
+                {
+                    "nValue": value,
+                    "scriptPubKey": bytes(self.data[script_offset : script_offset + script_length]),
+                }
+            )
+        return vout
+
+    def decode_vtxinwit(self):
+        start = self.vin_count * VIN_ENTRY.size + self.vout_count * VOUT_ENTRY.size
+        vtxinwit = []
+        for i in range(self.witness_count):
+            witness_offset, witness_length = WITNESS_ENTRY.unpack_from(
+                self.entries, start + i * WITNESS_ENTRY.size
+            )
+            vtxinwit.append(bytes(self.data[witness_offset : witness_offset + witness_length]))
+        return vtxinwit
+
+    def get_prevouts(self):
+        """Return the value, the script and the segwit flag of the outputs, out of the block buffer.
+
+        Only the scripts are copied, to keep them after the block is released.
+        """
+        start = self.vin_count * VIN_ENTRY.size
+        segwit = self.witness_count > 0
+        prevouts = []
+        for i in range(self.vout_count):
+            value, script_offset, script_length = VOUT_ENTRY.unpack_from(
+                self.entries, start + i * VOUT_ENTRY.size
+            )
+            prevouts.append(
+                (value, bytes(self.data[script_offset : script_offset + script_length]), segwit)
+            )
+        return prevouts
+
+
+def encode_transaction(record, buffer, start, use_txid, parse_vouts):
+    """Append to `record` the parts of the transaction at `start` of `buffer`, return its end.
+
+    The raw transaction is appended as a view of `buffer`, not copied.
+    """
+    end, segwit, witnesses_offset, vins, vouts, witnesses = read_transaction_layout(buffer, start)
+    data = buffer[start:end]
+
+    tx_hash = ib2h(double_hash(data))
+    if segwit and use_txid:
+        hasher = hashlib.sha256()
+        hasher.update(data[:4])
+        hasher.update(data[6:witnesses_offset])
+        hasher.update(data[-4:])
+        tx_hash = ib2h(hashlib.sha256(hasher.digest()).digest())
+    coinbase = any(data[vin[0] : vin[0] + 32] == NULL_HASH for vin in vins)
+
+    entries = b"".join(
+        [VIN_ENTRY.pack(*vin) for vin in vins]
+        + [VOUT_ENTRY.pack(*vout) for vout in vouts]
+        + [WITNESS_ENTRY.pack(*witness) for witness in witnesses]
+    )
+    transaction = BlockTransaction(
+        data,
+        entries,
+        len(vins),
+        len(vouts),
+        len(witnesses),
+        tx_hash=tx_hash,
+        segwit=segwit,
+        coinbase=coinbase,
+    )
+    parsed_vouts = marshal.dumps(parse_vouts(transaction))
+
+    flags = (SEGWIT_FLAG if segwit else 0) | (COINBASE_FLAG if coinbase else 0)
+    record.append(
+        TX_HEADER.pack(
+            tx_hash.encode(),
+            flags,
+            len(data),
+            len(vins),
+            len(vouts),
+            len(witnesses),
+            len(parsed_vouts),
+        )
+    )
+    record.extend([data, entries, parsed_vouts])
+    return end
+
+
+def encode_block(block, buffer, start, transaction_count, use_txid, parse_vouts):
+    """Return the record of `block`, whose transactions are at `start` of `buffer`, as a list of parts.
+
+    The parts are copied once, by `BlockRingBuffer.write()`.
+    `parse_vouts(transaction)` returns the parsed vouts of a transaction.
+    """
+    record = [
+        BLOCK_HEADER.pack(
+            block["block_index"],
+            block["tx_count"],
+            block["block_hash"].encode(),
+            block["hash_prev"].encode(),
+            block["block_time"],
+            block["bits"],
+            transaction_count,
+        )
+    ]
+    offset = start
+    for _ in range(transaction_count):
+        offset = encode_transaction(record, buffer, offset, use_txid, parse_vouts)
+    return record
+
+
+def decode_block(record):
+    """Return the block of `record`, a memoryview, with `BlockTransaction`s reading from it."""
+    block_index, tx_count, block_hash, hash_prev, block_time, bits, transaction_count = (
+        BLOCK_HEADER.unpack_from(record, 0)
+    )
+    block = {
+        "block_index": block_index,
+        "tx_count": tx_count,
+        "block_hash": block_hash.decode(),
+        "hash_prev": hash_prev.decode(),
+        "block_time": block_time,
+        "bits": bits,
+        "transaction_count": transaction_count,
+        "transactions": [],
+    }
+    offset = BLOCK_HEADER.size
+    for _ in range(transaction_count):
+        (
+            tx_hash,
+            flags,
+            data_length,
+            vin_count,
+            vout_count,
+            witness_count,
+            parsed_vouts_length,
+        ) = TX_HEADER.unpack_from(record, offset)
+        offset += TX_HEADER.size
+        data = record[offset : offset + data_length]
+        offset += data_length
+        entries_length = (
+            vin_count * VIN_ENTRY.size
+            + vout_count * VOUT_ENTRY.size
+            + witness_count * WITNESS_ENTRY.size
+        )
+        entries = record[offset : offset + entries_length]
+        offset += entries_length
+        # written by the blocks reader process
+        parsed_vouts = marshal.loads(record[offset : offset + parsed_vouts_length])  # nosec B302  # noqa: S302
+        offset += parsed_vouts_length
+        block["transactions"].append(
+            BlockTransaction(
+                data,
+                entries,
+                vin_count,
+                vout_count,
+                witness_count,
+                tx_hash=tx_hash.decode(),
+                segwit=bool(flags & SEGWIT_FLAG),
+                coinbase=bool(flags & COINBASE_FLAG),
+                parsed_vouts=parsed_vouts,
+            )
+        )
+    return block
+
+
+class BlockRingBuffer:
+    """Ring buffer of block records in shared memory, with one writer and one reader process.
+
+    Positions are counted in bytes written since the creation of the buffer;
+    a record never wraps around the end of the buffer.
+    """
+
+    def __init__(self, size=BLOCK_BUFFER_SIZE):
+        self.size = size
+        self.shm = shared_memory.SharedMemory(create=True, size=size)
+        # position before which the records have been read
+        self.released = multiprocessing.Value("Q", 0, lock=False)
+        self.condition = multiprocessing.Condition()
+        # position of the next record, used by the writer only
+        self.write_position = 0
+
+    def write(self, record):
+        """Copy the parts of `record` in the buffer, waiting for free space.
+
+        Return the position and the length of the record.
+        """
+        length = sum(len(part) for part in record)
+        if length > self.size:
+            raise Exception(f"Block record of {length} bytes larger than the block buffer.")
+        position = self.write_position
+        if position % self.size + length > self.size:
+            position += self.size - position % self.size
+        with self.condition:
+            while position + length - self.released.value > self.size:
+                self.condition.wait()
+        offset = position % self.size
+        for part in record:
+            self.shm.buf[offset : offset + len(part)] = part
+            offset += len(part)
+        self.write_position = position + length
+        return position, length
+
+    def read(self, position, length):
+        offset = position % self.size
+        return self.shm.buf[offset : offset + length]
+
+    def release(self, position):
+        """Free the space of the records before `position`."""
+        with self.condition:
+            self.released.value = position
+            self.condition.notify_all()
+
+    def close(self, unlink=False):
+        try:
+            self.shm.close()
+        except BufferError:
+            # the transactions of the last block are still referenced
+            pass
+        if unlink:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
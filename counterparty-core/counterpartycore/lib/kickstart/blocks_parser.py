@@ -1,19 +1,21 @@
 import binascii
 import logging
+import mmap
 import multiprocessing
 import os
-
-# Used to pickle and unpickle blocks from shared_memory
-import pickle  # nosec B403
 import signal
+import time
+import traceback
 from collections import OrderedDict
-from multiprocessing import JoinableQueue, Process, shared_memory
+from multiprocessing import Process, Queue
+from queue import Empty
 
 import apsw
 
 from counterpartycore.lib import config, gettxinfo, util
-from counterpartycore.lib.exceptions import DecodeError
+from counterpartycore.lib.exceptions import BlocksReaderError, DecodeError
 
+from . import block_buffer
 from .bc_data_stream import BCDataStream
 from .utils import (
     b2h,
@@ -30,7 +32,14 @@ import multiprocessing  # noqa: E402, F811
 
 multiprocessing.set_start_method("spawn", force=True)
 
-TX_CACHE_MAX_SIZE = 15000
+# outputs of the parsed transactions kept for the transactions spending them
+PREVOUTS_CACHE_MAX_SIZE = 50000
+# block files kept mapped, by process
+MAX_MAPPED_BLOCK_FILES = 64
+# seconds between the checks that a blocks reader is still alive
+READER_POLL_INTERVAL = 1
+# blocks between the progress reports of `get_blocks_positions()`
+BLOCKS_POSITIONS_PROGRESS_INTERVAL = 10000
 
 
 def open_leveldb(db_dir):
@@ -46,7 +55,46 @@ def open_leveldb(db_dir):
         raise Exception("Ensure that bitcoind is stopped.")  # noqa: B904
 
 
-def fetch_blocks(bitcoind_dir, db_path, queue, first_block_index, parser_config):
+def parse_vouts(transaction):
+    try:
+        return gettxinfo.parse_transaction_vouts(transaction)
+    except DecodeError:
+        return "DecodeError"
+
+
+def get_blocks_positions(bitcoind_dir, db_path, first_block_index, progress=None):
+    """Return the height, transaction count, file number and position in file of the blocks to parse.
+
+    The blocks index can be opened by one process only, so the positions are
+    read before starting the readers. `progress(count, total)` is called
+    every `BLOCKS_POSITIONS_PROGRESS_INTERVAL` blocks.
+    """
+    db = apsw.Connection(db_path, flags=apsw.SQLITE_OPEN_READONLY)
+    cursor = db.cursor()
+    cursor.execute(
+        """SELECT block_hash, block_index FROM kickstart_blocks
+                    WHERE block_index > ?
+                    ORDER BY block_index
+                    """,
+        (first_block_index,),
+    )
+    all_blocks = cursor.fetchall()
+    cursor.close()
+    db.close()
+
+    parser = BlockchainParser(bitcoind_dir)
+    try:
+        blocks_positions = []
+        for db_block in all_blocks:
+            blocks_positions.append(parser.get_block_position(db_block[0]))
+            if progress and len(blocks_positions) % BLOCKS_POSITIONS_PROGRESS_INTERVAL == 0:
+                progress(len(blocks_positions), len(all_blocks))
+        return blocks_positions
+    finally:
+        parser.close()
+
+
+def fetch_blocks(bitcoind_dir, blocks_positions, queue, blocks_buffer, parser_config):
     signal.signal(signal.SIGTERM, signal.SIG_DFL)
     signal.signal(signal.SIGINT, signal.default_int_handler)
     remove_shm_from_resource_tracker()
@@ -54,108 +102,142 @@ def fetch_blocks(bitcoind_dir, db_path, queue, first_block_index, parser_config)
     for attribute in parser_config:
         setattr(config, attribute, parser_config[attribute])
 
-    db = apsw.Connection(db_path, flags=apsw.SQLITE_OPEN_READONLY)
-    cursor = db.cursor()
+    parser = BlockchainParser(bitcoind_dir, blocks_index=False)
     try:
-        cursor.execute(
-            """SELECT block_hash, block_index FROM kickstart_blocks
-                        WHERE block_index > ?
-                        ORDER BY block_index
-                        """,
-            (first_block_index,),
-        )
-        all_blocks = cursor.fetchall()
-        cursor.close()
-        db.close()
-
-        parser = BlockchainParser(bitcoind_dir)
-        shm = None
-        for db_block in all_blocks:
-            if queue.full():
-                logger.debug("Queue is full, waiting for blocks to be parsed.")
-                queue.join()
-            block = parser.read_raw_block(
-                db_block[0],
-                use_txid=util.enabled("correct_segwit_txids", block_index=db_block[1]),
+        for block_position in blocks_positions:
+            util.CURRENT_BLOCK_INDEX = block_position[0]
+            record = parser.read_block_record(
+                block_position,
+                use_txid=util.enabled("correct_segwit_txids", block_index=block_position[0]),
             )
-
-            util.CURRENT_BLOCK_INDEX = db_block[1]
-            for i, transaction in enumerate(block["transactions"]):  # noqa: B007
-                try:
-                    block["transactions"][i]["parsed_vouts"] = gettxinfo.parse_transaction_vouts(
-                        block["transactions"][i]
-                    )
-                except DecodeError:
-                    block["transactions"][i]["parsed_vouts"] = "DecodeError"
-
-            serialized_block = pickle.dumps(block, protocol=pickle.HIGHEST_PROTOCOL)
-            block_length = len(serialized_block)
-            name = db_block[0][-8:]
-            try:
-                shm = shared_memory.SharedMemory(name, create=True, size=block_length)
-            except FileExistsError:
-                shm = shared_memory.SharedMemory(name)
-                shm.close()
-                shm.unlink()
-                shm = shared_memory.SharedMemory(name, create=True, size=block_length)
-            shm.buf[:block_length] = serialized_block
-            queue.put(shm.name)
-            shm.close()
+            # wait for free space in the buffer, then in the queue
+            queue.put(blocks_buffer.write(record))
         queue.put(None)
     except KeyboardInterrupt:
-        if shm:
-            shm.close()
-            shm.unlink()
+        pass
+    except Exception:  # noqa: BLE001
+        # raised by the parser, which would otherwise wait for the next block forever
+        queue.put(BlocksReaderError(f"Blocks reader failed:\n{traceback.format_exc()}"))
     finally:
         parser.close()
+        blocks_buffer.close()
 
 
 class BlockchainParser:
-    def __init__(self, bitcoind_dir=None, db_path=None, first_block_index=0, queue_size=100):
+    def __init__(
+        self,
+        bitcoind_dir=None,
+        db_path=None,
+        first_block_index=0,
+        queue_size=100,
+        readers=1,
+        buffer_size=block_buffer.BLOCK_BUFFER_SIZE,
+        blocks_index=True,
+        positions_progress=None,
+    ):
         if bitcoind_dir is None:  # for deserialize_tx()
             return
 
         self.blocks_dir = os.path.join(bitcoind_dir, "blocks")
         self.file_num = -1
         self.current_file_size = 0
-        self.current_block_file = None
+        # file number -> mapped block file
+        self.block_files = OrderedDict()
         self.data_stream = None
-        self.shm = None
-        self.queue = None
-
-        self.tx_cache = OrderedDict()
+        # one queue and one blocks buffer by reader process
+        self.queues = []
+        self.blocks_buffers = []
+        self.fetch_processes = []
+        # reader of the next block, reader i reads the blocks i, i + readers, ...
+        self.next_reader = 0
+        # reader and end of the block being parsed
+        self.current_block = None
+
+        # (tx_hash, n) -> (value, script, segwit)
+        self.prevouts_cache = OrderedDict()
         if db_path is not None:
+            blocks_positions = get_blocks_positions(
+                bitcoind_dir, db_path, first_block_index, positions_progress
+            )
             self.blocks_leveldb = None
             self.txindex_leveldb_path = os.path.join(bitcoind_dir, "indexes", "txindex")
             self.txindex_leveldb = open_leveldb(self.txindex_leveldb_path)
-            self.queue = JoinableQueue(queue_size)
             parser_config = {}
             for attribute in dir(config):
                 if attribute.isupper():
                     parser_config[attribute] = getattr(config, attribute)
-            self.fetch_process = Process(
-                target=fetch_blocks,
-                args=(bitcoind_dir, db_path, self.queue, first_block_index, parser_config),
-            )
-            self.fetch_process.start()
-        else:
+            for reader in range(readers):
+                self.queues.append(Queue(queue_size))
+                self.blocks_buffers.append(block_buffer.BlockRingBuffer(buffer_size))
+                self.fetch_processes.append(
+                    Process(
+                        target=fetch_blocks,
+                        args=(
+                            bitcoind_dir,
+                            blocks_positions[reader::readers],
+                            self.queues[reader],
+                            self.blocks_buffers[reader],
+                            parser_config,
+                        ),
+                    )
+                )
+            for fetch_process in self.fetch_processes:
+                fetch_process.start()
+        elif blocks_index:
             self.blocks_leveldb_path = os.path.join(self.blocks_dir, "index")
             self.blocks_leveldb = open_leveldb(self.blocks_leveldb_path)
             self.txindex_leveldb = None
-            self.fetch_process = None
+        else:  # for fetch_blocks()
+            self.blocks_leveldb = None
+            self.txindex_leveldb = None
 
     def next_block(self, timeout=None):
-        block_hash = self.queue.get(timeout=timeout)
-        if block_hash is None:
+        """Return the next block, read from the blocks buffer until `block_parsed()` is called.
+
+        The readers are read in turn so the blocks come in height order.
+        """
+        reader = self.next_reader
+        item = self.get_reader_item(reader, timeout)
+        if item is None:
+            # the reader of the block after the last one
             return None
-        self.shm = shared_memory.SharedMemory(name=block_hash)
-        block = pickle.loads(self.shm.buf[: self.shm.size])  # nosec B301  # noqa: S301
-        self.shm.close()
-        self.shm.unlink()
-        return block
+        if isinstance(item, BlocksReaderError):
+            raise item
+        position, length = item
+        self.current_block = (reader, position + length)
+        self.next_reader = (reader + 1) % len(self.queues)
+        return block_buffer.decode_block(self.blocks_buffers[reader].read(position, length))
+
+    def get_reader_item(self, reader, timeout=None):
+        """Return the next item of the queue of `reader`.
+
+        Raise `BlocksReaderError` if the reader process exited without putting it.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            poll_interval = READER_POLL_INTERVAL
+            if deadline is not None:
+                poll_interval = max(min(poll_interval, deadline - time.monotonic()), 0)
+            try:
+                return self.queues[reader].get(timeout=poll_interval)
+            except Empty:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise
+            fetch_process = self.fetch_processes[reader]
+            if not fetch_process.is_alive():
+                # the items put before the reader exited are in the queue
+                try:
+                    return self.queues[reader].get(timeout=READER_POLL_INTERVAL)
+                except Empty:
+                    raise BlocksReaderError(  # noqa: B904
+                        f"Blocks reader exited with code {fetch_process.exitcode}"
+                    )
 
     def block_parsed(self):
-        self.queue.task_done()
+        if self.current_block is not None:
+            reader, block_end = self.current_block
+            self.blocks_buffers[reader].release(block_end)
+            self.current_block = None
 
     def read_tx_in(self, vds):
         tx_in = {}
@@ -213,11 +295,11 @@ class BlockchainParser:
                     transaction["vtxinwit"].append(witness)
 
         transaction["lock_time"] = vds.read_uint32()
-        data = vds.input[start_pos : vds.read_cursor]
+        data = vds.read_view(start_pos, vds.read_cursor)
 
         transaction["tx_hash"] = ib2h(double_hash(data))
         if transaction["segwit"]:
-            hash_data = data[:4] + data[6:offset_before_tx_witnesses] + data[-4:]
+            hash_data = b"".join([data[:4], data[6:offset_before_tx_witnesses], data[-4:]])
             transaction["tx_id"] = ib2h(double_hash(hash_data))
             if use_txid:
                 transaction["tx_hash"] = transaction["tx_id"]
@@ -227,10 +309,23 @@ class BlockchainParser:
         return transaction
 
     def put_in_cache(self, transaction):
-        # save transaction to cache
-        self.tx_cache[transaction["tx_hash"]] = transaction
-        if len(self.tx_cache) > TX_CACHE_MAX_SIZE:
-            self.tx_cache.popitem(last=False)
+        # save the outputs of the transaction to cache, out of the blocks buffer
+        tx_hash = transaction["tx_hash"]
+        for n, prevout in enumerate(transaction.get_prevouts()):
+            self.prevouts_cache[(tx_hash, n)] = prevout
+        while len(self.prevouts_cache) > PREVOUTS_CACHE_MAX_SIZE:
+            self.prevouts_cache.popitem(last=False)
+
+    def get_prevout(self, tx_hash, n):
+        """Return the value, the script and the segwit flag of the output `n` of a transaction."""
+        # an output is spent once
+        prevout = self.prevouts_cache.pop((tx_hash, n), None)
+        if prevout is not None:
+            return prevout
+        # logger.warning('Prevout not found in cache, reading from disk.')
+        transaction = self.read_raw_transaction(tx_hash)
+        vout = transaction["vout"][n]
+        return vout["nValue"], vout["scriptPubKey"], len(transaction["vtxinwit"]) > 0
 
     def read_block_header(self, vds):
         block_header = {}
@@ -246,7 +341,7 @@ class BlockchainParser:
         block_header["bits"] = vds.read_uint32()
         block_header["nonce"] = vds.read_uint32()
         header_end = vds.read_cursor
-        header = vds.input[header_start:header_end]
+        header = vds.read_view(header_start, header_end)
         block_header["block_hash"] = ib2h(double_hash(header))
         # block_header['__header__'] = b2h(header)
         return block_header
@@ -261,20 +356,30 @@ class BlockchainParser:
             block["transactions"].append(self.read_transaction(vds, use_txid=use_txid))
         return block
 
+    def get_block_file(self, file_num):
+        """Return the mapped `blkNNNNN.dat` file, kept mapped for the next reads."""
+        if file_num in self.block_files:
+            self.block_files.move_to_end(file_num)
+            return self.block_files[file_num]
+        data_file_path = os.path.join(self.blocks_dir, f"blk{file_num:05d}.dat")
+        with open(data_file_path, "rb") as block_file:
+            block_file_map = mmap.mmap(block_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.block_files[file_num] = block_file_map
+        if len(self.block_files) > MAX_MAPPED_BLOCK_FILES:
+            # unmapped once no longer referenced
+            self.block_files.popitem(last=False)
+        return block_file_map
+
     def prepare_data_stream(self, file_num, pos_in_file):
         if self.data_stream is None or file_num != self.file_num:
             self.file_num = file_num
-            if self.current_block_file:
-                self.current_block_file.close()
-            data_file_path = os.path.join(self.blocks_dir, f"blk{self.file_num:05d}.dat")
-            self.current_block_file = open(data_file_path, "rb")
             self.data_stream = BCDataStream()
-            self.data_stream.map_file(self.current_block_file, pos_in_file)
+            self.data_stream.map_buffer(self.get_block_file(file_num), pos_in_file)
         else:
             self.data_stream.seek_file(pos_in_file)
 
-    def read_raw_block(self, block_hash, only_header=False, use_txid=True):
-        # print('Reading raw block:', block_hash, only_header)
+    def get_block_position(self, block_hash):
+        """Return the height, the transaction count, the file number and the position in file of a block."""
         block_key = bytes("b", "utf-8") + binascii.unhexlify(inverse_hash(block_hash))
         block_data = self.blocks_leveldb.get(block_key)
         ds = BCDataStream()
@@ -288,18 +393,38 @@ class BlockchainParser:
         block_pos_in_file = ds.read_var_int() - 8
         block_undo_pos_in_file = ds.read_var_int()  # noqa: F841
         block_header = ds.read_bytes(80)  # noqa: F841
+        return height, tx_count, file_num, block_pos_in_file
+
+    def read_raw_block(self, block_hash, only_header=False, use_txid=True):
+        # print('Reading raw block:', block_hash, only_header)
+        height, tx_count, file_num, block_pos_in_file = self.get_block_position(block_hash)
         self.prepare_data_stream(file_num, block_pos_in_file)
         block = self.read_block(self.data_stream, only_header=only_header, use_txid=use_txid)
         block["block_index"] = height
         block["tx_count"] = tx_count
         return block
 
-    def read_raw_transaction(self, tx_hash, use_txid=True):
-        # return transaction from cache if exists
-        if tx_hash in self.tx_cache:
-            return self.tx_cache[tx_hash]
-        # logger.warning('Transaction not found in cache, reading from disk.')
+    def read_block_record(self, block_position, use_txid=True):
+        """Return the record of a block for the blocks buffer, see `block_buffer`.
+
+        `block_position` is returned by `get_block_position()`.
+        """
+        height, tx_count, file_num, block_pos_in_file = block_position
+        self.prepare_data_stream(file_num, block_pos_in_file)
+        block = self.read_block_header(self.data_stream)
+        block["block_index"] = height
+        block["tx_count"] = tx_count
+        transaction_count = self.data_stream.read_compact_size()
+        return block_buffer.encode_block(
+            block,
+            memoryview(self.data_stream.input),
+            self.data_stream.read_cursor,
+            transaction_count,
+            use_txid,
+            parse_vouts,
+        )
 
+    def read_raw_transaction(self, tx_hash, use_txid=True):
         tx_key = bytes("t", "utf-8") + binascii.unhexlify(inverse_hash(tx_hash))
         tx_data = self.txindex_leveldb.get(tx_key)
 
@@ -325,23 +450,25 @@ class BlockchainParser:
         return self.read_transaction(ds, use_txid=use_txid)
 
     def close(self):
-        if self.current_block_file:
-            self.current_block_file.close()
+        self.data_stream = None
+        for block_file_map in self.block_files.values():
+            try:
+                block_file_map.close()
+            except BufferError:
+                # still read by a transaction
+                pass
+        self.block_files.clear()
         if self.blocks_leveldb:
             self.blocks_leveldb.close()
         if self.txindex_leveldb:
             self.txindex_leveldb.close()
-        if self.fetch_process:
-            self.fetch_process.terminate()
-            self.fetch_process.join()
-        if self.shm:
-            try:
-                self.shm.close()
-                self.shm.unlink()
-            except FileNotFoundError:
-                pass
-        if self.queue:
-            self.queue.close()
+        for fetch_process in self.fetch_processes:
+            fetch_process.terminate()
+            fetch_process.join()
+        for blocks_buffer in self.blocks_buffers:
+            blocks_buffer.close(unlink=True)
+        for queue in self.queues:
+            queue.close()
 
 
 class ChainstateParser:
@@ -1,16 +1,35 @@
 import binascii
+import bisect
 import fractions
+import functools
 import json
 import logging
 import time
 from decimal import Decimal as D
 
-from counterpartycore.lib import backend, config, exceptions, log, util
+from counterpartycore.lib import backend, config, database, exceptions, log, util
 
 logger = logging.getLogger(config.LOGGER_NAME)
 
+# Content of the ledger and messages hashes. `blocks.parse_block()` replaces
+# them with `check.ConsensusHash` objects, which hash the content as it is appended.
 BLOCK_LEDGER = []
 BLOCK_JOURNAL = []
+# Write-through cache of the last balance of each (address, asset) pair.
+# It is owned by `blocks.parse_block()` and is `None` outside of block parsing.
+BALANCES_CACHE = None
+# `(db, next message_index, next mensaje_index)` used by `add_to_journal()`.
+# `None` means that the indexes must be read again from the database.
+JOURNAL_INDEXES = None
+# Rows of the append-only `BUFFERED_TABLES` waiting to be written with `executemany()`:
+# `(db, {table: [(fields, records), ...]})` while `blocks.parse_block()` runs, `None` otherwise.
+WRITE_BUFFER = None
+BUFFERED_TABLES = ["messages", "credits", "debits"]
+# `(db, {(give_asset, get_asset): OrderBook})`, see `get_order_book()`.
+ORDER_BOOK = None
+# `(db, {address: frozenset(assets)})` of the dispensers that can dispense,
+# see `get_dispenser_addresses()`. Replaced, not updated, when it changes.
+DISPENSER_ADDRESSES = None
 
 ###########################
 #         MESSAGES        #
@@ -19,6 +38,7 @@ BLOCK_JOURNAL = []
 
 def last_message(db):
     """Return latest message from the db."""
+    flush_write_buffer(db)
     cursor = db.cursor()
     query = """
         SELECT * FROM messages
@@ -38,6 +58,7 @@ def last_message(db):
 
 def last_mensaje(db):
     """Return latest mensaje from the db."""
+    flush_write_buffer(db)
     cursor = db.cursor()
     query = """
         SELECT * FROM messages
@@ -56,6 +77,7 @@ def last_mensaje(db):
 
 
 def get_messages(db, block_index=None, block_index_in=None, message_index_in=None):
+    flush_write_buffer(db)
     cursor = db.cursor()
     where = []
     bindings = []
@@ -76,7 +98,17 @@ def get_messages(db, block_index=None, block_index_in=None, message_index_in=Non
     return cursor.fetchall()
 
 
-def get_events(db, block_index=None, event=None, event_index=None, last=None, limit=None):
+def get_events(
+    db,
+    block_index=None,
+    event=None,
+    event_index=None,
+    last=None,
+    limit=None,
+    before=None,
+    after=None,
+):
+    flush_write_buffer(db)
     cursor = db.cursor()
     where = []
     bindings = []
@@ -92,6 +124,15 @@ def get_events(db, block_index=None, event=None, event_index=None, last=None, li
     if last is not None:
         where.append("message_index <= ?")
         bindings.append(last)
+    if before is not None:
+        where.append("message_index < ?")
+        bindings.append(before)
+    # events after an index are returned in ascending order, to tail the messages
+    order = "DESC"
+    if after is not None:
+        where.append("message_index > ?")
+        bindings.append(after)
+        order = "ASC"
     if block_index is None and limit is None:
         limit = 100
     if limit is not None:
@@ -111,7 +152,7 @@ def get_events(db, block_index=None, event=None, event_index=None, last=None, li
             WHERE ({" AND ".join(where)})
         """  # nosec B608  # noqa: S608
     query += f"""
-        ORDER BY message_index DESC {limit}
+        ORDER BY message_index {order} {limit}
     """
     cursor.execute(query, tuple(bindings))
     events = cursor.fetchall()
@@ -120,13 +161,14 @@ def get_events(db, block_index=None, event=None, event_index=None, last=None, li
     return events
 
 
-def get_all_events(db, last: int = None, limit: int = 100):
+def get_all_events(db, last: int = None, limit: int = 100, cursor: str = None):
     """
     Returns all events
     :param int last: The last event index to return (e.g. 10665092)
     :param int limit: The maximum number of events to return (e.g. 5)
+    :param str cursor: The `next_cursor` returned with the previous page (e.g. MTA2NjUwOTI=)
     """
-    return get_events(db, last=last, limit=limit)
+    return get_events(db, last=last, limit=limit, before=util.decode_cursor(cursor))
 
 
 def get_events_by_block(db, block_index: int):
@@ -156,14 +198,15 @@ def get_event_by_index(db, event_index: int):
     return get_events(db, event_index=event_index)
 
 
-def get_events_by_name(db, event: str, last: int = None, limit: int = 100):
+def get_events_by_name(db, event: str, last: int = None, limit: int = 100, cursor: str = None):
     """
     Returns the events filtered by event name
     :param str event: The event to return (e.g. CREDIT)
     :param int last: The last event index to return (e.g. 10665092)
     :param int limit: The maximum number of events to return (e.g. 5)
+    :param str cursor: The `next_cursor` returned with the previous page (e.g. MTA2NjUwOTI=)
     """
-    return get_events(db, event=event, last=last, limit=limit)
+    return get_events(db, event=event, last=last, limit=limit, before=util.decode_cursor(cursor))
 
 
 def get_mempool_events(db, event_name=None):
@@ -204,6 +247,7 @@ def get_mempool_events_by_name(db, event: str):
 
 
 def get_events_counts(db, block_index=None):
+    flush_write_buffer(db)
     cursor = db.cursor()
     bindings = []
     query = """
@@ -238,26 +282,55 @@ def curr_time():
     return int(time.time())
 
 
-def add_to_journal(db, block_index, command, category, event, bindings):
-    cursor = db.cursor()
+def reset_journal_indexes():
+    """Force `add_to_journal()` to read the next indexes from the database."""
+    global JOURNAL_INDEXES  # noqa: PLW0603
+    JOURNAL_INDEXES = None
 
-    # Get last message index.
-    try:
-        message = last_message(db)
-        message_index = message["message_index"] + 1
-    except exceptions.DatabaseError:
-        message_index = 0
 
-    # Get last mensaje index.
+def reset_caches():
+    """Forget the in-memory state read from the database.
+
+    Must be called each time rows are deleted or rolled back.
+    """
+    reset_journal_indexes()
+    reset_order_book()
+    reset_dispenser_addresses()
+
+
+def get_journal_indexes(db):
+    """Return the next `message_index` and `mensaje_index`."""
+    global JOURNAL_INDEXES  # noqa: PLW0603
+    if JOURNAL_INDEXES is None or JOURNAL_INDEXES[0] is not db:
+        flush_write_buffer(db)
+        cursor = db.cursor()
+        query = """
+            SELECT MAX(message_index) AS message_index, MAX(mensaje_index) AS mensaje_index
+            FROM messages
+        """
+        last_indexes = cursor.execute(query).fetchone()
+        cursor.close()
+        JOURNAL_INDEXES = (
+            db,
+            0 if last_indexes["message_index"] is None else last_indexes["message_index"] + 1,
+            0 if last_indexes["mensaje_index"] is None else last_indexes["mensaje_index"] + 1,
+        )
+        # an explicit ROLLBACK invalidates the indexes
+        db.setrollbackhook(reset_caches)
+    return JOURNAL_INDEXES[1], JOURNAL_INDEXES[2]
+
+
+def add_to_journal(db, block_index, command, category, event, bindings):
+    global JOURNAL_INDEXES  # noqa: PLW0603
+
+    # Get next message and mensaje indexes.
+    message_index, next_mensaje_index = get_journal_indexes(db)
     non_message_events = ["transaction_outputs", "transactions", "blocks"]
     if category in non_message_events:
         mensaje_index = None
     else:
-        try:
-            last_mensaje_message = last_mensaje(db)
-            mensaje_index = last_mensaje_message["mensaje_index"] + 1
-        except exceptions.DatabaseError:
-            mensaje_index = 0
+        mensaje_index = next_mensaje_index
+        next_mensaje_index += 1
 
     # Not to be misleading…
     if block_index == config.MEMPOOL_BLOCK_INDEX:
@@ -288,9 +361,8 @@ def add_to_journal(db, block_index, command, category, event, bindings):
         "timestamp": current_time,
         "event": event,
     }
-    query = """INSERT INTO messages VALUES (:message_index, :mensaje_index, :block_index, :command, :category, :bindings, :timestamp, :event)"""
-    cursor.execute(query, message_bindings)
-    cursor.close()
+    write_record(db, "messages", message_bindings)
+    JOURNAL_INDEXES = (db, message_index + 1, next_mensaje_index)
 
     # practically, this is now an "events hash"
     # BLOCK_JOURNAL.append(f"{command}{category}{bindings_string}")
@@ -307,8 +379,6 @@ def add_to_journal(db, block_index, command, category, event, bindings):
 
 
 def remove_from_balance(db, address, asset, quantity, tx_index):
-    balance_cursor = db.cursor()
-
     no_balance = False
     try:
         old_balance = get_balance(db, address, asset, raise_error_if_no_balance=True)
@@ -335,7 +405,12 @@ def remove_from_balance(db, address, asset, quantity, tx_index):
             INSERT INTO balances
             VALUES (:address, :asset, :quantity, :block_index, :tx_index)
         """
-        balance_cursor.execute(query, bindings)
+        database.get_statement_cursor(db, query).execute(query, bindings)
+        update_current_state(db, "balances", db.last_insert_rowid())
+        update_asset_counters(db, {(asset, "held"): balance - old_balance})
+        set_asset_holding(db, "balances", asset, address, "", balance)
+        record_asset_holders_change(db, asset)
+        cache_balance(address, asset, balance)
 
 
 class DebitError(Exception):
@@ -383,8 +458,6 @@ def debit(db, address, asset, quantity, tx_index, action=None, event=None):
 
 
 def add_to_balance(db, address, asset, quantity, tx_index):
-    balance_cursor = db.cursor()
-
     old_balance = get_balance(db, address, asset)
     balance = round(old_balance + quantity)
     balance = min(balance, config.MAX_INT)
@@ -400,7 +473,12 @@ def add_to_balance(db, address, asset, quantity, tx_index):
         INSERT INTO balances
         VALUES (:address, :asset, :quantity, :block_index, :tx_index)
     """
-    balance_cursor.execute(query, bindings)
+    database.get_statement_cursor(db, query).execute(query, bindings)
+    update_current_state(db, "balances", db.last_insert_rowid())
+    update_asset_counters(db, {(asset, "held"): balance - old_balance})
+    set_asset_holding(db, "balances", asset, address, "", balance)
+    record_asset_holders_change(db, asset)
+    cache_balance(address, asset, balance)
 
 
 class CreditError(Exception):
@@ -450,24 +528,32 @@ def transfer(db, source, destination, asset, quantity, action, event):
     credit(db, destination, asset, quantity, action=action, event=event)
 
 
+def cache_balance(address, asset, quantity):
+    """Update the block balances cache, if any. `None` means no balance."""
+    if BALANCES_CACHE is not None:
+        BALANCES_CACHE[(address, asset)] = quantity
+
+
 def get_balance(db, address, asset, raise_error_if_no_balance=False, return_list=False):
     """Get balance of contract or address."""
-    cursor = db.cursor()
-    query = """
-        SELECT * FROM balances
-        WHERE (address = ? AND asset = ?)
-        ORDER BY rowid DESC LIMIT 1
-    """
-    bindings = (address, asset)
-    balances = list(cursor.execute(query, bindings))
-    cursor.close()
-    if return_list:
-        return balances
-    if not balances and raise_error_if_no_balance:
+    if not return_list and BALANCES_CACHE is not None and (address, asset) in BALANCES_CACHE:
+        quantity = BALANCES_CACHE[(address, asset)]
+    else:
+        query = """
+            SELECT * FROM current_balances
+            WHERE (address = ? AND asset = ?)
+        """
+        bindings = (address, asset)
+        balances = database.fetchall(db, query, bindings)
+        if return_list:
+            return balances
+        quantity = balances[0]["quantity"] if balances else None
+        cache_balance(address, asset, quantity)
+    if quantity is None and raise_error_if_no_balance:
         raise exceptions.BalanceError(f"No balance for this address and asset: {address}, {asset}.")
-    if not balances:
+    if quantity is None:
         return 0
-    return balances[0]["quantity"]
+    return quantity
 
 
 def get_balance_by_address_and_asset(db, address: str, asset: str):
@@ -529,8 +615,17 @@ def get_balances_count(db, address):
 
 
 def get_credits_or_debits(
-    db, table, address=None, asset=None, block_index=None, tx_index=None, offset=0, limit=None
+    db,
+    table,
+    address=None,
+    asset=None,
+    block_index=None,
+    tx_index=None,
+    offset=0,
+    limit=None,
+    after=None,
 ):
+    flush_write_buffer(db)
     cursor = db.cursor()
     where = []
     bindings = []
@@ -546,6 +641,9 @@ def get_credits_or_debits(
     if tx_index is not None:
         where.append("tx_index = ?")
         bindings.append(tx_index)
+    if after is not None:
+        where.append("rowid > ?")
+        bindings.append(after)
     query_limit = ""
     if limit is not None:
         query_limit = "LIMIT ?"
@@ -555,14 +653,24 @@ def get_credits_or_debits(
         query_offset = "OFFSET ?"
         bindings.append(offset)
     # no sql injection here
-    query = f"""SELECT * FROM {table} WHERE ({" AND ".join(where)}) {query_limit} {query_offset}"""  # nosec B608  # noqa: S608
+    query = f"""SELECT *, rowid FROM {table} WHERE ({" AND ".join(where)}) ORDER BY rowid {query_limit} {query_offset}"""  # nosec B608  # noqa: S608
     cursor.execute(query, tuple(bindings))
     return cursor.fetchall()
 
 
-def get_credits(db, address=None, asset=None, block_index=None, tx_index=None, limit=100, offset=0):
+def get_credits(
+    db, address=None, asset=None, block_index=None, tx_index=None, limit=100, offset=0, after=None
+):
     return get_credits_or_debits(
-        db, "credits", address, asset, block_index, tx_index, limit=limit, offset=offset
+        db,
+        "credits",
+        address,
+        asset,
+        block_index,
+        tx_index,
+        limit=limit,
+        offset=offset,
+        after=after,
     )
 
 
@@ -574,29 +682,37 @@ def get_credits_by_block(db, block_index: int):
     return get_credits(db, block_index=block_index)
 
 
-def get_credits_by_address(db, address: str, limit: int = 100, offset: int = 0):
+def get_credits_by_address(db, address: str, limit: int = 100, offset: int = 0, cursor: str = None):
     """
     Returns the credits of an address
     :param str address: The address to return (e.g. 1C3uGcoSGzKVgFqyZ3kM2DBq9CYttTMAVs)
     :param int limit: The maximum number of credits to return (e.g. 5)
     :param int offset: The offset of the credits to return (e.g. 0)
+    :param str cursor: The `next_cursor` returned with the previous page (e.g. MTA=)
     """
-    return get_credits(db, address=address, limit=limit, offset=offset)
+    return get_credits(
+        db, address=address, limit=limit, offset=offset, after=util.decode_cursor(cursor)
+    )
 
 
-def get_credits_by_asset(db, asset: str, limit: int = 100, offset: int = 0):
+def get_credits_by_asset(db, asset: str, limit: int = 100, offset: int = 0, cursor: str = None):
     """
     Returns the credits of an asset
     :param str asset: The asset to return (e.g. UNNEGOTIABLE)
     :param int limit: The maximum number of credits to return (e.g. 5)
     :param int offset: The offset of the credits to return (e.g. 0)
+    :param str cursor: The `next_cursor` returned with the previous page (e.g. MTA=)
     """
-    return get_credits(db, asset=asset, limit=limit, offset=offset)
+    return get_credits(
+        db, asset=asset, limit=limit, offset=offset, after=util.decode_cursor(cursor)
+    )
 
 
-def get_debits(db, address=None, asset=None, block_index=None, tx_index=None, limit=100, offset=0):
+def get_debits(
+    db, address=None, asset=None, block_index=None, tx_index=None, limit=100, offset=0, after=None
+):
     return get_credits_or_debits(
-        db, "debits", address, asset, block_index, tx_index, limit=limit, offset=offset
+        db, "debits", address, asset, block_index, tx_index, limit=limit, offset=offset, after=after
     )
 
 
@@ -608,24 +724,28 @@ def get_debits_by_block(db, block_index: int):
     return get_debits(db, block_index=block_index)
 
 
-def get_debits_by_address(db, address: str, limit: int = 100, offset: int = 0):
+def get_debits_by_address(db, address: str, limit: int = 100, offset: int = 0, cursor: str = None):
     """
     Returns the debits of an address
     :param str address: The address to return (e.g. bc1q7787j6msqczs58asdtetchl3zwe8ruj57p9r9y)
     :param int limit: The maximum number of debits to return (e.g. 5)
     :param int offset: The offset of the debits to return (e.g. 0)
+    :param str cursor: The `next_cursor` returned with the previous page (e.g. MTA=)
     """
-    return get_debits(db, address=address, limit=limit, offset=offset)
+    return get_debits(
+        db, address=address, limit=limit, offset=offset, after=util.decode_cursor(cursor)
+    )
 
 
-def get_debits_by_asset(db, asset: str, limit: int = 100, offset: int = 0):
+def get_debits_by_asset(db, asset: str, limit: int = 100, offset: int = 0, cursor: str = None):
     """
     Returns the debits of an asset
     :param str asset: The asset to return (e.g. XCP)
     :param int limit: The maximum number of debits to return (e.g. 5)
     :param int offset: The offset of the debits to return (e.g. 0)
+    :param str cursor: The `next_cursor` returned with the previous page (e.g. MTA=)
     """
-    return get_debits(db, asset=asset, limit=limit, offset=offset)
+    return get_debits(db, asset=asset, limit=limit, offset=offset, after=util.decode_cursor(cursor))
 
 
 def get_sends_or_receives(
@@ -637,6 +757,7 @@ def get_sends_or_receives(
     status="valid",
     limit=None,
     offset=0,
+    after=None,
 ):
     cursor = db.cursor()
     where = []
@@ -656,6 +777,9 @@ def get_sends_or_receives(
     if status is not None:
         where.append("status = ?")
         bindings.append(status)
+    if after is not None:
+        where.append("rowid > ?")
+        bindings.append(after)
     query_limit = ""
     if limit is not None:
         query_limit = "LIMIT ?"
@@ -665,29 +789,35 @@ def get_sends_or_receives(
         query_offset = "OFFSET ?"
         bindings.append(offset)
     # no sql injection here
-    query = f"""SELECT * FROM sends WHERE ({" AND ".join(where)}) {query_limit} {query_offset}"""  # nosec B608  # noqa: S608
+    query = f"""SELECT *, rowid FROM sends WHERE ({" AND ".join(where)}) ORDER BY rowid {query_limit} {query_offset}"""  # nosec B608  # noqa: S608
     cursor.execute(query, tuple(bindings))
     return cursor.fetchall()
 
 
-def get_sends_by_block(db, block_index: int, limit: int = 100, offset: int = 0):
+def get_sends_by_block(db, block_index: int, limit: int = 100, offset: int = 0, cursor: str = None):
     """
     Returns the sends of a block
     :param int block_index: The index of the block to return (e.g. 840459)
     :param int limit: The maximum number of sends to return (e.g. 5)
     :param int offset: The offset of the sends to return (e.g. 0)
+    :param str cursor: The `next_cursor` returned with the previous page (e.g. MTA=)
     """
-    return get_sends_or_receives(db, block_index=block_index, limit=limit, offset=offset)
+    return get_sends_or_receives(
+        db, block_index=block_index, limit=limit, offset=offset, after=util.decode_cursor(cursor)
+    )
 
 
-def get_sends_by_asset(db, asset: str, limit: int = 100, offset: int = 0):
+def get_sends_by_asset(db, asset: str, limit: int = 100, offset: int = 0, cursor: str = None):
     """
     Returns the sends of an asset
     :param str asset: The asset to return (e.g. XCP)
     :param int limit: The maximum number of sends to return (e.g. 5)
     :param int offset: The offset of the sends to return (e.g. 0)
+    :param str cursor: The `next_cursor` returned with the previous page (e.g. MTA=)
     """
-    return get_sends_or_receives(db, asset=asset, limit=limit, offset=offset)
+    return get_sends_or_receives(
+        db, asset=asset, limit=limit, offset=offset, after=util.decode_cursor(cursor)
+    )
 
 
 def get_sends(
@@ -698,6 +828,7 @@ def get_sends(
     status="valid",
     limit: int = 100,
     offset: int = 0,
+    after=None,
 ):
     return get_sends_or_receives(
         db,
@@ -707,17 +838,21 @@ def get_sends(
         status=status,
         limit=limit,
         offset=offset,
+        after=after,
     )
 
 
-def get_send_by_address(db, address: str, limit: int = 100, offset: int = 0):
+def get_send_by_address(db, address: str, limit: int = 100, offset: int = 0, cursor: str = None):
     """
     Returns the sends of an address
     :param str address: The address to return (e.g. 1HVgrYx3U258KwvBEvuG7R8ss1RN2Z9J1W)
     :param int limit: The maximum number of sends to return (e.g. 5)
     :param int offset: The offset of the sends to return (e.g. 0)
+    :param str cursor: The `next_cursor` returned with the previous page (e.g. MTA=)
     """
-    return get_sends(db, address=address, limit=limit, offset=offset)
+    return get_sends(
+        db, address=address, limit=limit, offset=offset, after=util.decode_cursor(cursor)
+    )
 
 
 def get_send_by_address_and_asset(db, address: str, asset: str):
@@ -737,6 +872,7 @@ def get_receives(
     status="valid",
     limit: int = 100,
     offset: int = 0,
+    after=None,
 ):
     return get_sends_or_receives(
         db,
@@ -746,21 +882,25 @@ def get_receives(
         status=status,
         limit=limit,
         offset=offset,
+        after=after,
     )
 
 
-def get_receive_by_address(db, address: str, limit: int = 100, offset: int = 0):
+def get_receive_by_address(db, address: str, limit: int = 100, offset: int = 0, cursor: str = None):
     """
     Returns the receives of an address
     :param str address: The address to return (e.g. 1C3uGcoSGzKVgFqyZ3kM2DBq9CYttTMAVs)
     :param int limit: The maximum number of receives to return (e.g. 5)
     :param int offset: The offset of the receives to return (e.g. 0)
+    :param str cursor: The `next_cursor` returned with the previous page (e.g. MTA=)
     """
-    return get_receives(db, address=address, limit=limit, offset=offset)
+    return get_receives(
+        db, address=address, limit=limit, offset=offset, after=util.decode_cursor(cursor)
+    )
 
 
 def get_receive_by_address_and_asset(
-    db, address: str, asset: str, limit: int = 100, offset: int = 0
+    db, address: str, asset: str, limit: int = 100, offset: int = 0, cursor: str = None
 ):
     """
     Returns the receives of an address and asset
@@ -768,8 +908,16 @@ def get_receive_by_address_and_asset(
     :param str asset: The asset to return (e.g. XCP)
     :param int limit: The maximum number of receives to return (e.g. 5)
     :param int offset: The offset of the receives to return (e.g. 0)
+    :param str cursor: The `next_cursor` returned with the previous page (e.g. MTA=)
     """
-    return get_receives(db, address=address, asset=asset, limit=limit, offset=offset)
+    return get_receives(
+        db,
+        address=address,
+        asset=asset,
+        limit=limit,
+        offset=offset,
+        after=util.decode_cursor(cursor),
+    )
 
 
 def get_sweeps(db, address=None, block_index=None, status="valid"):
@@ -894,14 +1042,12 @@ def get_asset_id(db, asset_name, block_index):
     """Return asset_id from asset_name."""
     if not util.enabled("hotfix_numeric_assets"):
         return generate_asset_id(asset_name, block_index)
-    cursor = db.cursor()
     query = """
         SELECT * FROM assets
         WHERE asset_name = ?
     """
     bindings = (asset_name,)
-    cursor.execute(query, bindings)
-    assets = list(cursor)
+    assets = database.fetchall(db, query, bindings)
     if len(assets) == 1:
         return int(assets[0]["asset_id"])
     else:
@@ -912,14 +1058,12 @@ def get_asset_name(db, asset_id, block_index):
     """Return asset_name from asset_id."""
     if not util.enabled("hotfix_numeric_assets"):
         return generate_asset_name(asset_id, block_index)
-    cursor = db.cursor()
     query = """
         SELECT * FROM assets
         WHERE asset_id = ?
     """
     bindings = (str(asset_id),)
-    cursor.execute(query, bindings)
-    assets = list(cursor)
+    assets = database.fetchall(db, query, bindings)
     if len(assets) == 1:
         return assets[0]["asset_name"]
     elif not assets:
@@ -1367,28 +1511,36 @@ def get_burns_by_address(db, address: str):
     return get_burns(db, address=address)
 
 
-def get_all_burns(db, status: str = "valid", offset: int = 0, limit: int = 100):
+def get_all_burns(db, status: str = "valid", offset: int = 0, limit: int = 100, cursor: str = None):
     """
     Returns the burns
     :param str status: The status of the burns to return (e.g. valid)
     :param int offset: The offset of the burns to return (e.g. 10)
     :param int limit: The limit of the burns to return (e.g. 5)
+    :param str cursor: The `next_cursor` returned with the previous page (e.g. MTA=)
     """
     try:
         int(offset)
         int(limit)
     except ValueError as e:
         raise exceptions.InvalidArgument("Invalid offset or limit parameter") from e
-    cursor = db.cursor()
-    query = """
+    where = ["status = ?"]
+    bindings = [status]
+    after = util.decode_cursor(cursor)
+    if after is not None:
+        where.append("tx_index > ?")
+        bindings.append(after)
+    # no sql injection here
+    query = f"""
         SELECT * FROM burns
-        WHERE status = ?
+        WHERE ({" AND ".join(where)})
         ORDER BY tx_index ASC
         LIMIT ? OFFSET ?
-    """
-    bindings = (status, limit, offset)
-    cursor.execute(query, bindings)
-    return cursor.fetchall()
+    """  # nosec B608  # noqa: S608
+    bindings += [limit, offset]
+    db_cursor = db.cursor()
+    db_cursor.execute(query, tuple(bindings))
+    return db_cursor.fetchall()
 
 
 ######################################
@@ -1583,14 +1735,68 @@ def get_destructions(db, block_index: int):
 ###############################
 
 
-def insert_record(db, table_name, record, event):
-    cursor = db.cursor()
-    fields_name = ", ".join(record.keys())
-    fields_values = ", ".join([f":{key}" for key in record.keys()])
+@functools.lru_cache(maxsize=None)
+def insert_query(table_name, fields):
+    """Return the INSERT statement of `table_name` for the tuple `fields`.
+
+    The same string is returned for the same (table, columns) pair,
+    so that APSW reuses its prepared statement.
+    """
+    fields_name = ", ".join(fields)
+    fields_values = ", ".join([f":{key}" for key in fields])
     # no sql injection here
-    query = f"""INSERT INTO {table_name} ({fields_name}) VALUES ({fields_values})"""  # nosec B608  # noqa: S608
-    cursor.execute(query, record)
+    return f"""INSERT INTO {table_name} ({fields_name}) VALUES ({fields_values})"""  # nosec B608  # noqa: S608
+
+
+def start_write_buffer(db):
+    global WRITE_BUFFER  # noqa: PLW0603
+    WRITE_BUFFER = (db, {})
+
+
+def discard_write_buffer():
+    global WRITE_BUFFER  # noqa: PLW0603
+    WRITE_BUFFER = None
+
+
+def write_record(db, table_name, record):
+    """Insert `record`, or buffer it if `table_name` is buffered for `db`."""
+    fields = tuple(record.keys())
+    if WRITE_BUFFER is not None and WRITE_BUFFER[0] is db and table_name in BUFFERED_TABLES:
+        # consecutive records with the same columns share the same `executemany()`,
+        # the insertion order (and so the rowids) of each table is preserved
+        batches = WRITE_BUFFER[1].setdefault(table_name, [])
+        if batches and batches[-1][0] == fields:
+            batches[-1][1].append(record)
+        else:
+            batches.append((fields, [record]))
+        return
+    cursor = db.cursor()
+    cursor.execute(insert_query(table_name, fields), record)
     cursor.close()
+
+
+def flush_write_buffer(db):
+    """Write the buffered records. Must be called before reading the `BUFFERED_TABLES`."""
+    if WRITE_BUFFER is None or WRITE_BUFFER[0] is not db or not WRITE_BUFFER[1]:
+        return
+    cursor = db.cursor()
+    for table_name, batches in WRITE_BUFFER[1].items():
+        for fields, records in batches:
+            cursor.executemany(insert_query(table_name, fields), records)
+    cursor.close()
+    WRITE_BUFFER[1].clear()
+
+
+def insert_record(db, table_name, record, event):
+    write_record(db, table_name, record)
+    update_current_state(db, table_name, db.last_insert_rowid())
+    update_escrowed_counters(db, table_name, None, record)
+    update_supply_counters(db, table_name, record)
+    update_asset_holders(db, table_name, None, record)
+    if table_name == "orders":
+        update_order_book(db, record, from_database=True)
+    elif table_name == "dispensers":
+        update_dispenser_addresses(db, record)
     # Add event to journal
     add_to_journal(db, util.CURRENT_BLOCK_INDEX, "insert", table_name, event, record)
 
@@ -1599,17 +1805,22 @@ def insert_record(db, table_name, record, event):
 # The `block_index` and `rowid` fields allow you to
 # order updates and retrieve the row with the current data.
 def insert_update(db, table_name, id_name, id_value, update_data, event, event_info={}):  # noqa: B006
-    cursor = db.cursor()
     # select records to update
-    select_query = f"""
-        SELECT *, rowid
-        FROM {table_name}
-        WHERE {id_name} = ?
-        ORDER BY rowid DESC
-        LIMIT 1
-    """  # nosec B608  # noqa: S608
+    if ID_FIELDS.get(table_name) == [id_name]:
+        select_query = f"""
+            SELECT * FROM current_{table_name}
+            WHERE {id_name} = ?
+        """  # nosec B608  # noqa: S608
+    else:
+        select_query = f"""
+            SELECT *, rowid
+            FROM {table_name}
+            WHERE {id_name} = ?
+            ORDER BY rowid DESC
+            LIMIT 1
+        """  # nosec B608  # noqa: S608
     bindings = (id_value,)
-    need_update_record = cursor.execute(select_query, bindings).fetchone()
+    need_update_record = database.fetchone(db, select_query, bindings)
 
     # update record
     new_record = need_update_record.copy()
@@ -1626,12 +1837,15 @@ def insert_update(db, table_name, id_name, id_value, update_data, event, event_i
     # insert new record
     if "rowid" in new_record:
         del new_record["rowid"]
-    fields_name = ", ".join(new_record.keys())
-    fields_values = ", ".join([f":{key}" for key in new_record.keys()])
-    # no sql injection here
-    insert_query = f"""INSERT INTO {table_name} ({fields_name}) VALUES ({fields_values})"""  # nosec B608  # noqa: S608
-    cursor.execute(insert_query, new_record)
-    cursor.close()
+    query = insert_query(table_name, tuple(new_record.keys()))
+    database.get_statement_cursor(db, query).execute(query, new_record)
+    update_current_state(db, table_name, db.last_insert_rowid())
+    update_escrowed_counters(db, table_name, need_update_record, new_record)
+    update_asset_holders(db, table_name, need_update_record, new_record)
+    if table_name == "orders":
+        update_order_book(db, new_record)
+    elif table_name == "dispensers":
+        update_dispenser_addresses(db, new_record)
     # Add event to journal
     event_paylod = update_data | {id_name: id_value} | event_info
     if "rowid" in event_paylod:
@@ -1669,6 +1883,21 @@ ID_FIELDS = {
 }
 
 
+# Each table of `ID_FIELDS` has a `current_{table}` twin with the same columns and
+# only the last revision of each record. It is maintained in the same transaction
+# as the history table, so it can replace the `MAX(rowid) ... GROUP BY` queries.
+def update_current_state(db, table_name, rowid):
+    """Copy the revision `rowid` of `table_name` into its current state table."""
+    if table_name not in ID_FIELDS:
+        return
+    # no sql injection here
+    query = f"""
+        INSERT OR REPLACE INTO current_{table_name}
+        SELECT * FROM {table_name} WHERE rowid = ?
+    """  # nosec B608  # noqa: S608
+    database.get_statement_cursor(db, query).execute(query, (rowid,))
+
+
 def _gen_where_and_binding(key, value):
     where = ""
     bindings = []
@@ -1684,14 +1913,9 @@ def _gen_where_and_binding(key, value):
 
 
 def select_last_revision(db, table_name, where_data):
-    cursor = db.cursor()
     if table_name not in MUTABLE_FIELDS.keys():
         raise exceptions.UnknownTable(f"Unknown table: {table_name}")
-    query = """
-        PRAGMA table_info(?)
-    """
-    bindings = (table_name,)
-    columns = [column["name"] for column in cursor.execute(query, bindings)]
+    columns = database.get_table_columns(db, table_name)
     for key in where_data.keys():
         _key = key.replace("_in", "")
         if _key not in columns:
@@ -1711,15 +1935,11 @@ def select_last_revision(db, table_name, where_data):
             where_mutable.append(_where)
             bindings += _bindings
     # no sql injection here
-    query = f"""SELECT * FROM (
-        SELECT *, MAX(rowid)
-        FROM {table_name}
-        WHERE ({" AND ".join(where_immutable)})
-        GROUP BY {", ".join(ID_FIELDS[table_name])}
-    ) WHERE ({" AND ".join(where_mutable)})
+    query = f"""
+        SELECT * FROM current_{table_name}
+        WHERE ({" AND ".join(where_immutable + where_mutable)})
     """  # nosec B608  # noqa: S608
-    cursor.execute(query, tuple(bindings))
-    return cursor.fetchall()
+    return database.fetchall(db, query, tuple(bindings))
 
 
 #####################
@@ -1876,15 +2096,12 @@ def get_last_refills_block_index(db, dispenser_tx_hash):
 
 
 def get_dispenser(db, tx_hash):
-    cursor = db.cursor()
     query = """
-        SELECT * FROM dispensers
+        SELECT * FROM current_dispensers
         WHERE tx_hash = ?
-        ORDER BY rowid DESC LIMIT 1
     """
     bindings = (tx_hash,)
-    cursor.execute(query, bindings)
-    return cursor.fetchall()
+    return database.fetchall(db, query, bindings)
 
 
 def get_dispensers(
@@ -1946,6 +2163,70 @@ def get_dispensers(
     return cursor.fetchall()
 
 
+# statuses of the dispensers that `dispenser.is_dispensable()` considers
+DISPENSABLE_STATUSES = [0, 11]
+
+
+def reset_dispenser_addresses():
+    global DISPENSER_ADDRESSES  # noqa: PLW0603
+    DISPENSER_ADDRESSES = None
+
+
+def get_dispenser_addresses(db):
+    """Return the addresses with a dispenser that can dispense, loading them from the database if needed.
+
+    As in `get_dispensers()`, the status of a dispenser is the one of the last
+    dispenser of the same asset and address.
+    """
+    global DISPENSER_ADDRESSES  # noqa: PLW0603
+    if DISPENSER_ADDRESSES is None or DISPENSER_ADDRESSES[0] is not db:
+        cursor = db.cursor()
+        query = f"""
+            SELECT source, asset FROM (
+                SELECT source, asset, status, MAX(rowid) AS rowid
+                FROM dispensers
+                GROUP BY asset, source
+            ) WHERE status IN ({",".join(["?" for _ in DISPENSABLE_STATUSES])})
+        """  # nosec B608  # noqa: S608
+        addresses = {}
+        for dispenser in cursor.execute(query, DISPENSABLE_STATUSES):
+            addresses.setdefault(dispenser["source"], set()).add(dispenser["asset"])
+        cursor.close()
+        DISPENSER_ADDRESSES = (
+            db,
+            {address: frozenset(assets) for address, assets in addresses.items()},
+        )
+        # an explicit ROLLBACK invalidates the addresses
+        db.setrollbackhook(reset_caches)
+    return DISPENSER_ADDRESSES
+
+
+def update_dispenser_addresses(db, dispenser):
+    """Apply the last revision of a dispenser to the dispenser addresses, if loaded."""
+    global DISPENSER_ADDRESSES  # noqa: PLW0603
+    if DISPENSER_ADDRESSES is None or DISPENSER_ADDRESSES[0] is not db:
+        return
+    address, asset = dispenser["source"], dispenser["asset"]
+    assets = DISPENSER_ADDRESSES[1].get(address, frozenset())
+    if dispenser["status"] in DISPENSABLE_STATUSES:
+        new_assets = assets | {asset}
+    else:
+        new_assets = assets - {asset}
+    if new_assets == assets:
+        return
+    addresses = dict(DISPENSER_ADDRESSES[1])
+    if new_assets:
+        addresses[address] = new_assets
+    else:
+        del addresses[address]
+    DISPENSER_ADDRESSES = (db, addresses)
+
+
+def is_dispenser_address(db, address):
+    """Tell if `address` may have a dispenser that can dispense, without querying the dispensers."""
+    return address in get_dispenser_addresses(db)[1]
+
+
 def get_dispensers_by_address(db, address: str, status: int = 0):
     """
     Returns the dispensers of an address
@@ -1971,7 +2252,7 @@ def get_dispensers_by_address_and_asset(db, address: str, asset: str, status: in
     return get_dispensers(db, address=address, asset=asset, status=status)
 
 
-def get_dispenses(db, dispenser_tx_hash=None, block_index=None):
+def get_dispenses(db, dispenser_tx_hash=None, block_index=None, limit=None, offset=0, after=None):
     cursor = db.cursor()
     where = []
     bindings = []
@@ -1981,8 +2262,19 @@ def get_dispenses(db, dispenser_tx_hash=None, block_index=None):
     if block_index is not None:
         where.append("block_index = ?")
         bindings.append(block_index)
+    if after is not None:
+        where.append("rowid > ?")
+        bindings.append(after)
+    query_limit = ""
+    if limit is not None:
+        query_limit = "LIMIT ?"
+        bindings.append(limit)
+    query_offset = ""
+    if offset > 0:
+        query_offset = "OFFSET ?"
+        bindings.append(offset)
     # no sql injection here
-    query = f"""SELECT * FROM dispenses WHERE ({" AND ".join(where)})"""  # nosec B608  # noqa: S608
+    query = f"""SELECT *, rowid FROM dispenses WHERE ({" AND ".join(where)}) ORDER BY rowid {query_limit} {query_offset}"""  # nosec B608  # noqa: S608
     cursor.execute(query, tuple(bindings))
     return cursor.fetchall()
 
@@ -1995,12 +2287,23 @@ def get_dispenses_by_block(db, block_index: int):
     return get_dispenses(db, block_index=block_index)
 
 
-def get_dispenses_by_dispenser(db, dispenser_hash: str):
+def get_dispenses_by_dispenser(
+    db, dispenser_hash: str, limit: int = 100, offset: int = 0, cursor: str = None
+):
     """
     Returns the dispenses of a dispenser
     :param str dispenser_hash: The hash of the dispenser to return (e.g. 753787004d6e93e71f6e0aa1e0932cc74457d12276d53856424b2e4088cc542a)
+    :param int limit: The maximum number of dispenses to return (e.g. 5)
+    :param int offset: The offset of the dispenses to return (e.g. 0)
+    :param str cursor: The `next_cursor` returned with the previous page (e.g. MTA=)
     """
-    return get_dispenses(db, dispenser_tx_hash=dispenser_hash)
+    return get_dispenses(
+        db,
+        dispenser_tx_hash=dispenser_hash,
+        limit=limit,
+        offset=offset,
+        after=util.decode_cursor(cursor),
+    )
 
 
 ### UPDATES ###
@@ -2076,12 +2379,8 @@ def get_bet(db, bet_hash: str):
 def get_bets_to_expire(db, block_index):
     cursor = db.cursor()
     query = """
-        SELECT * FROM (
-            SELECT *, MAX(rowid)
-            FROM bets
-            WHERE expire_index = ? - 1
-            GROUP BY tx_hash
-        ) WHERE status = ?
+        SELECT * FROM current_bets
+        WHERE (expire_index = ? - 1 AND status = ?)
         ORDER BY tx_index, tx_hash
     """
     bindings = (block_index, "open")
@@ -2092,12 +2391,8 @@ def get_bets_to_expire(db, block_index):
 def get_matching_bets(db, feed_address, bet_type):
     cursor = db.cursor()
     query = """
-        SELECT * FROM (
-            SELECT *, MAX(rowid)
-            FROM bets
-            WHERE (feed_address = ? AND bet_type = ?)
-            GROUP BY tx_hash
-        ) WHERE status = ?
+        SELECT * FROM current_bets
+        WHERE (feed_address = ? AND bet_type = ? AND status = ?)
         ORDER BY tx_index, tx_hash
     """
     bindings = (feed_address, bet_type, "open")
@@ -2246,15 +2541,12 @@ def get_order(db, order_hash: str):
     Returns the information of an order
     :param str order_hash: The hash of the transaction that created the order (e.g. 23f68fdf934e81144cca31ce8ef69062d553c521321a039166e7ba99aede0776)
     """
-    cursor = db.cursor()
     query = """
-        SELECT * FROM orders
+        SELECT * FROM current_orders
         WHERE tx_hash = ?
-        ORDER BY rowid DESC LIMIT 1
     """
     bindings = (order_hash,)
-    cursor.execute(query, bindings)
-    return cursor.fetchall()
+    return database.fetchall(db, query, bindings)
 
 
 def get_order_first_block_index(cursor, tx_hash):
@@ -2271,12 +2563,8 @@ def get_order_first_block_index(cursor, tx_hash):
 def get_orders_to_expire(db, block_index):
     cursor = db.cursor()
     query = """
-        SELECT * FROM (
-            SELECT *, MAX(rowid)
-            FROM orders
-            WHERE expire_index = ? - 1
-            GROUP BY tx_hash
-        ) WHERE status = ?
+        SELECT * FROM current_orders
+        WHERE (expire_index = ? - 1 AND status = ?)
         ORDER BY tx_index, tx_hash
     """
     bindings = (block_index, "open")
@@ -2287,12 +2575,8 @@ def get_orders_to_expire(db, block_index):
 def get_open_btc_orders(db, address):
     cursor = db.cursor()
     query = """
-        SELECT * FROM (
-            SELECT *, MAX(rowid)
-            FROM orders
-            WHERE (source = ? AND give_asset = ?)
-            GROUP BY tx_hash
-        ) WHERE status = ?
+        SELECT * FROM current_orders
+        WHERE (source = ? AND give_asset = ? AND status = ?)
         ORDER BY tx_index, tx_hash
     """
     bindings = (address, config.BTC, "open")
@@ -2303,12 +2587,8 @@ def get_open_btc_orders(db, address):
 def get_matching_orders(db, tx_hash, give_asset, get_asset):
     cursor = db.cursor()
     query = """
-        SELECT * FROM (
-            SELECT *, MAX(rowid)
-            FROM orders
-            WHERE (tx_hash != ? AND give_asset = ? AND get_asset = ?)
-            GROUP BY tx_hash
-        ) WHERE status = ?
+        SELECT * FROM current_orders
+        WHERE (tx_hash != ? AND give_asset = ? AND get_asset = ? AND status = ?)
         ORDER BY tx_index, tx_hash
     """
     bindings = (tx_hash, get_asset, give_asset, "open")
@@ -2316,6 +2596,88 @@ def get_matching_orders(db, tx_hash, give_asset, get_asset):
     return cursor.fetchall()
 
 
+class OrderBook:
+    """Open orders of one (give_asset, get_asset) pair, sorted by price then by `tx_index`.
+
+    This is the order in which `order.match()` considers the orders since the
+    prices are `Fraction`s.
+    """
+
+    def __init__(self, orders):
+        self.orders = {}
+        self.keys = []
+        for order in orders:
+            self.orders[order["tx_hash"]] = order
+            self.keys.append(self.sort_key(order))
+        self.keys.sort()
+
+    @staticmethod
+    def sort_key(order):
+        return (
+            fractions.Fraction(order["get_quantity"], order["give_quantity"]),
+            order["tx_index"],
+            order["tx_hash"],
+        )
+
+    def update(self, order):
+        old_order = self.orders.pop(order["tx_hash"], None)
+        if old_order is not None:
+            self.keys.pop(bisect.bisect_left(self.keys, self.sort_key(old_order)))
+        if order["status"] == "open":
+            self.orders[order["tx_hash"]] = order
+            bisect.insort(self.keys, self.sort_key(order))
+
+    def sorted_orders(self, exclude_tx_hash):
+        return [self.orders[key[2]] for key in self.keys if key[2] != exclude_tx_hash]
+
+
+def reset_order_book():
+    global ORDER_BOOK  # noqa: PLW0603
+    ORDER_BOOK = None
+
+
+def get_order_book(db, give_asset, get_asset):
+    """Return the `OrderBook` of the pair, loading it from the database if needed."""
+    global ORDER_BOOK  # noqa: PLW0603
+    if ORDER_BOOK is None or ORDER_BOOK[0] is not db:
+        ORDER_BOOK = (db, {})
+        # an explicit ROLLBACK invalidates the order books
+        db.setrollbackhook(reset_caches)
+    if (give_asset, get_asset) not in ORDER_BOOK[1]:
+        cursor = db.cursor()
+        query = """
+            SELECT * FROM current_orders
+            WHERE (give_asset = ? AND get_asset = ? AND status = ?)
+        """
+        bindings = (give_asset, get_asset, "open")
+        ORDER_BOOK[1][(give_asset, get_asset)] = OrderBook(cursor.execute(query, bindings))
+        cursor.close()
+    return ORDER_BOOK[1][(give_asset, get_asset)]
+
+
+def update_order_book(db, order, from_database=False):
+    """Apply the last revision of an order to its order book, if loaded."""
+    if ORDER_BOOK is None or ORDER_BOOK[0] is not db:
+        return
+    order_book = ORDER_BOOK[1].get((order["give_asset"], order["get_asset"]))
+    if order_book is None:
+        return
+    if from_database:
+        cursor = db.cursor()
+        query = """SELECT * FROM current_orders WHERE tx_hash = ?"""
+        order = cursor.execute(query, (order["tx_hash"],)).fetchone()
+        cursor.close()
+    order_book.update(dict(order))
+
+
+def get_sorted_matching_orders(db, tx_hash, give_asset, get_asset):
+    """Same orders as `get_matching_orders()` sorted by price then by `tx_index`.
+
+    Prices must be `Fraction`s (see `price()`).
+    """
+    return get_order_book(db, get_asset, give_asset).sorted_orders(tx_hash)
+
+
 def get_orders_by_asset(db, asset: str, status: str = "open"):
     """
     Returns the orders of an asset
@@ -2512,12 +2874,8 @@ def get_matching_rps(db, possible_moves, wager, source, already_matched_tx_hashe
 def get_rps_to_expire(db, block_index):
     cursor = db.cursor()
     query = """
-        SELECT * FROM (
-            SELECT *, MAX(rowid)
-            FROM rps
-            WHERE expire_index = ? - 1
-            GROUP BY tx_hash
-        ) WHERE status = ?
+        SELECT * FROM current_rps
+        WHERE (expire_index = ? - 1 AND status = ?)
         ORDER BY tx_index, tx_hash
     """
     bindings = (block_index, "open")
@@ -2828,19 +3186,352 @@ def holders(db, asset, exclude_empty_holders=False):
     return holders
 
 
+#####################
+#   ASSET HOLDERS   #
+#####################
+
+# `asset_holders` keeps the current holdings of each asset: the balances and
+# the quantities escrowed by open orders, bets, rps and dispensers and by
+# pending matches, like `holders()`. It is updated along with the ledger and
+# serves the holders of an asset and their count without scanning the
+# history tables. `asset_holders_changes` records the assets whose holdings
+# changed in each block, to rebuild only them on a rollback.
+
+# In the order of `holders()`.
+HOLDER_KINDS = [
+    "balances",
+    "orders",
+    "order_matches_forward",
+    "order_matches_backward",
+    "bets",
+    "bet_matches",
+    "rps",
+    "rps_matches",
+    "dispensers",
+]
+# table: (statuses, field to order by when (re)building)
+HOLDER_ESCROWS = {
+    "orders": (["open"], "tx_index"),
+    "order_matches": (["pending"], "tx1_index"),
+    "bets": (["open"], "tx_index"),
+    "bet_matches": (["pending"], "tx1_index"),
+    "rps": (["open"], "tx_index"),
+    "rps_matches": (["pending", "pending and resolved", "resolved and pending"], "tx1_index"),
+    "dispensers": ([0], "tx_index"),
+}
+# Holdings of the last revision of a group of records, see `remove_last_revision_holdings()`.
+LAST_REVISION_HOLDER_QUERIES = {
+    "order_matches_backward": """
+        SELECT * FROM (
+            SELECT *, MAX(rowid) AS rowid
+            FROM order_matches
+            GROUP BY backward_asset
+        ) WHERE status = 'pending'
+        ORDER BY rowid
+    """,
+    "dispensers": """
+        SELECT * FROM (
+            SELECT *, MAX(rowid)
+            FROM dispensers
+            GROUP BY source, asset
+        ) WHERE status = 0
+        ORDER BY tx_index
+    """,
+}
+LAST_REVISION_HOLDER_KINDS = list(LAST_REVISION_HOLDER_QUERIES)
+
+
+def escrow_holdings(table_name, record):
+    """Return the holdings `(kind, asset, address, escrow, quantity)` of a revision of a record."""
+    if record is None or table_name not in HOLDER_ESCROWS:
+        return []
+    if record["status"] not in HOLDER_ESCROWS[table_name][0]:
+        return []
+    if table_name == "orders":
+        return [
+            (
+                "orders",
+                record["give_asset"],
+                record["source"],
+                record["tx_hash"],
+                record["give_remaining"],
+            )
+        ]
+    if table_name == "order_matches":
+        return [
+            (
+                "order_matches_forward",
+                record["forward_asset"],
+                record["tx0_address"],
+                record["id"],
+                record["forward_quantity"],
+            ),
+            (
+                "order_matches_backward",
+                record["backward_asset"],
+                record["tx1_address"],
+                record["id"],
+                record["backward_quantity"],
+            ),
+        ]
+    if table_name == "bets":
+        return [
+            ("bets", config.XCP, record["source"], record["tx_hash"], record["wager_remaining"])
+        ]
+    if table_name == "bet_matches":
+        return [
+            (
+                "bet_matches",
+                config.XCP,
+                record["tx0_address"],
+                record["id"],
+                record["forward_quantity"],
+            ),
+            (
+                "bet_matches",
+                config.XCP,
+                record["tx1_address"],
+                record["id"],
+                record["backward_quantity"],
+            ),
+        ]
+    if table_name == "rps":
+        return [("rps", config.XCP, record["source"], record["tx_hash"], record["wager"])]
+    if table_name == "rps_matches":
+        return [
+            ("rps_matches", config.XCP, record["tx0_address"], record["id"], record["wager"]),
+            ("rps_matches", config.XCP, record["tx1_address"], record["id"], record["wager"]),
+        ]
+    # like `holders()`, a dispenser is identified by its source and its asset
+    return [("dispensers", record["asset"], record["source"], "", record["give_remaining"])]
+
+
+def set_asset_holding(db, kind, asset, address, escrow, quantity):
+    query = """
+        INSERT INTO asset_holders (asset, kind, address, escrow, quantity)
+        VALUES (:asset, :kind, :address, :escrow, :quantity)
+        ON CONFLICT (asset, kind, address, escrow) DO UPDATE SET quantity = excluded.quantity
+    """
+    bindings = {
+        "asset": asset,
+        "kind": HOLDER_KINDS.index(kind),
+        "address": address,
+        "escrow": escrow,
+        "quantity": quantity,
+    }
+    database.get_statement_cursor(db, query).execute(query, bindings)
+
+
+def remove_asset_holding(db, kind, asset, address, escrow):
+    query = """
+        DELETE FROM asset_holders
+        WHERE asset = :asset AND kind = :kind AND address = :address AND escrow = :escrow
+    """
+    bindings = {
+        "asset": asset,
+        "kind": HOLDER_KINDS.index(kind),
+        "address": address,
+        "escrow": escrow,
+    }
+    database.get_statement_cursor(db, query).execute(query, bindings)
+
+
+def remove_last_revision_holdings(db, table_name, record):
+    """Remove the holdings replaced by a new revision in the groups of `holders()`.
+
+    `holders()` only counts the last revision of the dispensers of a source and
+    an asset, and the last order match with a backward asset.
+    """
+    if table_name == "dispensers":
+        remove_asset_holding(db, "dispensers", record["asset"], record["source"], "")
+    elif table_name == "order_matches":
+        query = """DELETE FROM asset_holders WHERE asset = :asset AND kind = :kind"""
+        bindings = {
+            "asset": record["backward_asset"],
+            "kind": HOLDER_KINDS.index("order_matches_backward"),
+        }
+        database.get_statement_cursor(db, query).execute(query, bindings)
+
+
+def record_asset_holders_change(db, asset):
+    """Record that the holdings of `asset` changed in the current block, see `rollback_asset_holders()`."""
+    query = """
+        INSERT OR IGNORE INTO asset_holders_changes (block_index, asset)
+        VALUES (:block_index, :asset)
+    """
+    bindings = {"block_index": util.CURRENT_BLOCK_INDEX, "asset": asset}
+    database.get_statement_cursor(db, query).execute(query, bindings)
+
+
+def update_asset_holders(db, table_name, old_record, new_record):
+    """Update the holdings escrowed by a record after a new revision."""
+    if table_name not in HOLDER_ESCROWS:
+        return
+    old_holdings = escrow_holdings(table_name, old_record)
+    new_holdings = escrow_holdings(table_name, new_record)
+    new_keys = [holding[:4] for holding in new_holdings]
+    for holding in old_holdings:
+        if holding[:4] not in new_keys:
+            remove_asset_holding(db, *holding[:4])
+    if new_record is not None:
+        remove_last_revision_holdings(db, table_name, new_record)
+    for holding in new_holdings:
+        set_asset_holding(db, *holding)
+    # record the changed assets even if the escrowed quantities are unchanged
+    assets = set(holding[1] for holding in old_holdings + new_holdings)
+    if table_name == "dispensers" and new_record is not None:
+        assets.add(new_record["asset"])
+    elif table_name == "order_matches" and new_record is not None:
+        assets.add(new_record["backward_asset"])
+    for asset in assets:
+        record_asset_holders_change(db, asset)
+
+
+def build_asset_holders(db, assets=None):
+    """(Re)build the holdings of `assets`, or of all the assets."""
+    logger.info("Building asset holders...")
+    cursor = db.cursor()
+    where, bindings = "", []
+    if assets is not None:
+        where = f"WHERE asset IN ({','.join(['?' for _ in assets])})"
+        bindings = list(assets)
+    # no sql injection here
+    cursor.execute(f"""DELETE FROM asset_holders {where}""", bindings)  # nosec B608  # noqa: S608
+    # balances in the order of their first revision
+    cursor.execute(
+        f"""
+        SELECT current.address, current.asset, current.quantity
+        FROM current_balances AS current
+        JOIN (
+            SELECT address, asset, MIN(rowid) AS first_rowid
+            FROM balances {where}
+            GROUP BY address, asset
+        ) AS first ON current.address = first.address AND current.asset = first.asset
+        ORDER BY first.first_rowid
+        """,  # nosec B608  # noqa: S608
+        bindings,
+    )
+    for balance in cursor.fetchall():
+        set_asset_holding(
+            db, "balances", balance["asset"], balance["address"], "", balance["quantity"]
+        )
+    for table_name, (statuses, order_by) in HOLDER_ESCROWS.items():
+        # no sql injection here
+        cursor.execute(
+            f"""
+            SELECT * FROM current_{table_name}
+            WHERE status IN ({",".join(["?" for _ in statuses])})
+            ORDER BY {order_by}
+            """,  # nosec B608  # noqa: S608
+            statuses,
+        )
+        for record in cursor.fetchall():
+            for holding in escrow_holdings(table_name, record):
+                if holding[0] in LAST_REVISION_HOLDER_KINDS:
+                    continue
+                if assets is None or holding[1] in assets:
+                    set_asset_holding(db, *holding)
+    # the last revisions, as `holders()` reads them
+    for kind, query in LAST_REVISION_HOLDER_QUERIES.items():
+        table_name = "dispensers" if kind == "dispensers" else "order_matches"
+        cursor.execute(query)
+        for record in cursor.fetchall():
+            for holding in escrow_holdings(table_name, record):
+                if holding[0] == kind and (assets is None or holding[1] in assets):
+                    set_asset_holding(db, *holding)
+    cursor.close()
+
+
+def rollback_asset_holders(db, block_index):
+    """Rebuild the holdings of the assets changed since `block_index`.
+
+    Must be called after the other tables are cleaned: if the changes
+    of the blocks to remove are not all recorded, all the holdings are rebuilt.
+    """
+    cursor = db.cursor()
+    cursor.execute("""SELECT MIN(block_index) AS block_index FROM asset_holders_changes""")
+    first_block_index = cursor.fetchall()[0]["block_index"]
+    if first_block_index is None or block_index <= first_block_index:
+        cursor.execute("""DELETE FROM asset_holders_changes""")
+        cursor.close()
+        build_asset_holders(db)
+        return
+    cursor.execute(
+        """SELECT DISTINCT asset FROM asset_holders_changes WHERE block_index >= ?""",
+        (block_index,),
+    )
+    assets = [row["asset"] for row in cursor.fetchall()]
+    cursor.execute("""DELETE FROM asset_holders_changes WHERE block_index >= ?""", (block_index,))
+    cursor.close()
+    if assets:
+        build_asset_holders(db, assets)
+
+
+def prune_asset_holders_changes(db, block_index):
+    """Remove the changes of the blocks too old to be rolled back by a reorganisation."""
+    query = """DELETE FROM asset_holders_changes WHERE block_index < :block_index"""
+    # same depth as the asset counters
+    bindings = {"block_index": block_index - ASSET_COUNTERS_CHANGES_BLOCKS}
+    database.get_statement_cursor(db, query).execute(query, bindings)
+
+
+def get_asset_holders_where(asset):
+    # without the empty holdings, also the escrows: an order with BTC stays open once filled
+    where = ["asset = ?", "quantity > 0"]
+    bindings = [asset]
+    if not util.enabled("dispensers_in_holders"):
+        where.append("kind != ?")
+        bindings.append(HOLDER_KINDS.index("dispensers"))
+    return " AND ".join(where), bindings
+
+
 def get_asset_holders(db, asset: str):
     """
     Returns the holders of an asset
     :param str asset: The asset to return (e.g. ERYKAHPEPU)
     """
     asset_name = resolve_subasset_longname(db, asset)
-    return holders(db, asset_name, True)
+    where, bindings = get_asset_holders_where(asset_name)
+    cursor = db.cursor()
+    # no sql injection here
+    query = f"""
+        SELECT address, quantity AS address_quantity, kind, escrow
+        FROM asset_holders
+        WHERE {where}
+        ORDER BY kind, rowid
+    """  # nosec B608  # noqa: S608
+    cursor.execute(query, bindings)
+    holders = []
+    for holding in cursor:
+        # as in `holders()`
+        escrow = holding["escrow"]
+        if HOLDER_KINDS[holding["kind"]] in ["balances", "dispensers"]:
+            escrow = None
+        holders.append(
+            {
+                "address": holding["address"],
+                "address_quantity": holding["address_quantity"],
+                "escrow": escrow,
+            }
+        )
+    cursor.close()
+    return holders
 
 
 def get_asset_holder_count(db, asset):
-    holders = get_asset_holders(db, asset)
-    addresses = [holder["address"] for holder in holders]
-    return len(set(addresses))
+    asset_name = resolve_subasset_longname(db, asset)
+    where, bindings = get_asset_holders_where(asset_name)
+    cursor = db.cursor()
+    # no sql injection here
+    query = f"""
+        SELECT COUNT(DISTINCT address) AS holder_count
+        FROM asset_holders
+        WHERE {where}
+    """  # nosec B608  # noqa: S608
+    cursor.execute(query, bindings)
+    holder_count = cursor.fetchall()[0]["holder_count"]
+    cursor.close()
+    return holder_count
 
 
 def xcp_created(db):
@@ -2995,95 +3686,100 @@ def supplies(db):
     return {key: d1[key] - d2.get(key, 0) for key in d1.keys()}
 
 
-def held(db):  # TODO: Rename ?
-    queries = [
-        """
-        SELECT asset, SUM(quantity) AS total FROM (
-            SELECT address, asset, quantity, (address || asset) AS aa, MAX(rowid)
-            FROM balances
-            WHERE address IS NOT NULL
-            GROUP BY aa
-        ) GROUP BY asset
-        """,
-        """
-        SELECT asset, SUM(quantity) AS total FROM (
-            SELECT NULL, asset, quantity
-            FROM balances
-            WHERE address IS NULL
-        ) GROUP BY asset
-        """,
-        """
-        SELECT give_asset AS asset, SUM(give_remaining) AS total FROM (
-            SELECT give_asset, give_remaining, status, MAX(rowid)
-            FROM orders
-            GROUP BY tx_hash
-        ) WHERE status = 'open' GROUP BY asset
-        """,
-        """
-        SELECT give_asset AS asset, SUM(give_remaining) AS total FROM (
-            SELECT give_asset, give_remaining, status, MAX(rowid)
-            FROM orders
-            WHERE give_asset = 'XCP' AND get_asset = 'BTC'
-            GROUP BY tx_hash
-        ) WHERE status = 'filled' GROUP BY asset
-        """,
-        """
-        SELECT forward_asset AS asset, SUM(forward_quantity) AS total FROM (
-            SELECT forward_asset, forward_quantity, status, MAX(rowid)
-            FROM order_matches
-            GROUP BY id
-        ) WHERE status = 'pending' GROUP BY asset
-        """,
-        """
-        SELECT backward_asset AS asset, SUM(backward_quantity) AS total FROM (
-            SELECT backward_asset, backward_quantity, status, MAX(rowid)
-            FROM order_matches
-            GROUP BY id
-        ) WHERE status = 'pending' GROUP BY asset
-        """,
-        """
-        SELECT 'XCP' AS asset, SUM(wager_remaining) AS total FROM (
-            SELECT wager_remaining, status, MAX(rowid)
-            FROM bets
-            GROUP BY tx_hash
-        ) WHERE status = 'open'
-        """,
-        """
-        SELECT 'XCP' AS asset, SUM(forward_quantity) AS total FROM (
-            SELECT forward_quantity, status, MAX(rowid)
-            FROM bet_matches
-            GROUP BY id
-        ) WHERE status = 'pending'
-        """,
-        """
-        SELECT 'XCP' AS asset, SUM(backward_quantity) AS total FROM (
-            SELECT backward_quantity, status, MAX(rowid)
-            FROM bet_matches
-            GROUP BY id
-        ) WHERE status = 'pending'
-        """,
-        """
-        SELECT 'XCP' AS asset, SUM(wager) AS total FROM (
-            SELECT wager, status, MAX(rowid)
-            FROM rps
-            GROUP BY tx_hash
-        ) WHERE status = 'open'
-        """,
-        """
-        SELECT 'XCP' AS asset, SUM(wager * 2) AS total FROM (
-            SELECT wager, status, MAX(rowid)
-            FROM rps_matches
-            GROUP BY id
-        ) WHERE status IN ('pending', 'pending and resolved', 'resolved and pending')
-        """,
-        """
-        SELECT asset, SUM(give_remaining) AS total FROM (
-            SELECT asset, give_remaining, status, MAX(rowid)
-            FROM dispensers
-            GROUP BY tx_hash
-        ) WHERE status IN (0, 1, 11) GROUP BY asset
-        """,
-    ]
+# Quantities held in balances and escrowed, by asset.
+BALANCES_HELD_QUERIES = [
+    """
+    SELECT asset, SUM(quantity) AS total FROM (
+        SELECT address, asset, quantity, (address || asset) AS aa, MAX(rowid)
+        FROM balances
+        WHERE address IS NOT NULL
+        GROUP BY aa
+    ) GROUP BY asset
+    """,
+    """
+    SELECT asset, SUM(quantity) AS total FROM (
+        SELECT NULL, asset, quantity
+        FROM balances
+        WHERE address IS NULL
+    ) GROUP BY asset
+    """,
+]
+ESCROWED_QUERIES = [
+    """
+    SELECT give_asset AS asset, SUM(give_remaining) AS total FROM (
+        SELECT give_asset, give_remaining, status, MAX(rowid)
+        FROM orders
+        GROUP BY tx_hash
+    ) WHERE status = 'open' GROUP BY asset
+    """,
+    """
+    SELECT give_asset AS asset, SUM(give_remaining) AS total FROM (
+        SELECT give_asset, give_remaining, status, MAX(rowid)
+        FROM orders
+        WHERE give_asset = 'XCP' AND get_asset = 'BTC'
+        GROUP BY tx_hash
+    ) WHERE status = 'filled' GROUP BY asset
+    """,
+    """
+    SELECT forward_asset AS asset, SUM(forward_quantity) AS total FROM (
+        SELECT forward_asset, forward_quantity, status, MAX(rowid)
+        FROM order_matches
+        GROUP BY id
+    ) WHERE status = 'pending' GROUP BY asset
+    """,
+    """
+    SELECT backward_asset AS asset, SUM(backward_quantity) AS total FROM (
+        SELECT backward_asset, backward_quantity, status, MAX(rowid)
+        FROM order_matches
+        GROUP BY id
+    ) WHERE status = 'pending' GROUP BY asset
+    """,
+    """
+    SELECT 'XCP' AS asset, SUM(wager_remaining) AS total FROM (
+        SELECT wager_remaining, status, MAX(rowid)
+        FROM bets
+        GROUP BY tx_hash
+    ) WHERE status = 'open'
+    """,
+    """
+    SELECT 'XCP' AS asset, SUM(forward_quantity) AS total FROM (
+        SELECT forward_quantity, status, MAX(rowid)
+        FROM bet_matches
+        GROUP BY id
+    ) WHERE status = 'pending'
+    """,
+    """
+    SELECT 'XCP' AS asset, SUM(backward_quantity) AS total FROM (
+        SELECT backward_quantity, status, MAX(rowid)
+        FROM bet_matches
+        GROUP BY id
+    ) WHERE status = 'pending'
+    """,
+    """
+    SELECT 'XCP' AS asset, SUM(wager) AS total FROM (
+        SELECT wager, status, MAX(rowid)
+        FROM rps
+        GROUP BY tx_hash
+    ) WHERE status = 'open'
+    """,
+    """
+    SELECT 'XCP' AS asset, SUM(wager * 2) AS total FROM (
+        SELECT wager, status, MAX(rowid)
+        FROM rps_matches
+        GROUP BY id
+    ) WHERE status IN ('pending', 'pending and resolved', 'resolved and pending')
+    """,
+    """
+    SELECT asset, SUM(give_remaining) AS total FROM (
+        SELECT asset, give_remaining, status, MAX(rowid)
+        FROM dispensers
+        GROUP BY tx_hash
+    ) WHERE status IN (0, 1, 11) GROUP BY asset
+    """,
+]
+
+
+def sum_by_asset(db, queries):
     # no sql injection here
     sql = (
         "SELECT asset, SUM(total) AS total FROM ("  # noqa: S608
@@ -3093,10 +3789,218 @@ def held(db):  # TODO: Rename ?
 
     cursor = db.cursor()
     cursor.execute(sql)
-    held = {}
+    totals = {}
     for row in cursor:
         asset = row["asset"]
         total = row["total"]
-        held[asset] = total
+        totals[asset] = total
 
-    return held
+    return totals
+
+
+def held(db):  # TODO: Rename ?
+    return sum_by_asset(db, BALANCES_HELD_QUERIES + ESCROWED_QUERIES)
+
+
+def escrowed(db):
+    return sum_by_asset(db, ESCROWED_QUERIES)
+
+
+#####################
+#  ASSET COUNTERS   #
+#####################
+
+# `asset_counters` keeps the total issued, destroyed, held in balances and
+# escrowed of each asset, updated along with the ledger, so that the
+# conservation of assets can be checked without scanning all the tables.
+# `asset_counters_changes` records the changes of each block to be able to
+# roll them back.
+
+ASSET_COUNTERS = ["issued", "destroyed", "held", "escrowed"]
+# Number of blocks whose changes are kept, rolling back further rebuilds the counters.
+ASSET_COUNTERS_CHANGES_BLOCKS = 100
+# Statuses of the records counted as escrowed by `ESCROWED_QUERIES`.
+ESCROW_STATUSES = {
+    "orders": ["open"],
+    "order_matches": ["pending"],
+    "bets": ["open"],
+    "bet_matches": ["pending"],
+    "rps": ["open"],
+    "rps_matches": ["pending", "pending and resolved", "resolved and pending"],
+    "dispensers": [0, 1, 11],
+}
+
+
+def update_asset_counters(db, counters):
+    """Add `counters`, `{(asset, counter): quantity}`, to the asset counters."""
+    for (asset, counter), quantity in counters.items():
+        if not quantity or asset == config.BTC:
+            continue
+        # no sql injection here, `counter` is one of `ASSET_COUNTERS`
+        query = f"""
+            INSERT INTO asset_counters (asset, {counter}) VALUES (:asset, :quantity)
+            ON CONFLICT (asset) DO UPDATE SET {counter} = {counter} + excluded.{counter}
+        """  # nosec B608  # noqa: S608
+        bindings = {"asset": asset, "quantity": quantity}
+        database.get_statement_cursor(db, query).execute(query, bindings)
+        query = f"""
+            INSERT INTO asset_counters_changes (block_index, asset, {counter})
+            VALUES (:block_index, :asset, :quantity)
+            ON CONFLICT (block_index, asset) DO UPDATE SET {counter} = {counter} + excluded.{counter}
+        """  # nosec B608  # noqa: S608
+        bindings["block_index"] = util.CURRENT_BLOCK_INDEX
+        database.get_statement_cursor(db, query).execute(query, bindings)
+
+
+def escrowed_quantities(table_name, record):
+    """Return the quantities escrowed by a revision of a record, as counted by `escrowed()`."""
+    if record is None or table_name not in ESCROW_STATUSES:
+        return []
+    status = record["status"]
+    if table_name == "orders":
+        if status == "open" or (
+            status == "filled"
+            and record["give_asset"] == config.XCP
+            and record["get_asset"] == config.BTC
+        ):
+            return [(record["give_asset"], record["give_remaining"])]
+        return []
+    if status not in ESCROW_STATUSES[table_name]:
+        return []
+    if table_name == "order_matches":
+        return [
+            (record["forward_asset"], record["forward_quantity"]),
+            (record["backward_asset"], record["backward_quantity"]),
+        ]
+    if table_name == "bets":
+        return [(config.XCP, record["wager_remaining"])]
+    if table_name == "bet_matches":
+        return [(config.XCP, record["forward_quantity"] + record["backward_quantity"])]
+    if table_name == "rps":
+        return [(config.XCP, record["wager"])]
+    if table_name == "rps_matches":
+        return [(config.XCP, record["wager"] * 2)]
+    return [(record["asset"], record["give_remaining"])]
+
+
+def update_escrowed_counters(db, table_name, old_record, new_record):
+    counters = {}
+    for asset, quantity in escrowed_quantities(table_name, old_record):
+        counters[(asset, "escrowed")] = counters.get((asset, "escrowed"), 0) - (quantity or 0)
+    for asset, quantity in escrowed_quantities(table_name, new_record):
+        counters[(asset, "escrowed")] = counters.get((asset, "escrowed"), 0) + (quantity or 0)
+    update_asset_counters(db, counters)
+
+
+def update_supply_counters(db, table_name, record):
+    """Count the quantities created or destroyed by a new record, as `supplies()` does."""
+    if record.get("status") != "valid":
+        return
+    if table_name == "burns":
+        counters = {(config.XCP, "issued"): record["earned"]}
+    elif table_name == "issuances":
+        counters = {
+            (record["asset"], "issued"): record["quantity"],
+            (config.XCP, "destroyed"): record["fee_paid"],
+        }
+    elif table_name == "destructions":
+        counters = {(record["asset"], "destroyed"): record["quantity"]}
+    elif table_name in ["dividends", "sweeps"]:
+        counters = {(config.XCP, "destroyed"): record["fee_paid"]}
+    else:
+        return
+    update_asset_counters(db, counters)
+
+
+def build_asset_counters(db, block_index):
+    """(Re)build the asset counters from the tables, attributing them to `block_index`."""
+    logger.info("Building asset counters...")
+    totals = {}
+    for counter, values in [
+        ("issued", creations(db)),
+        ("destroyed", destructions(db)),
+        ("held", sum_by_asset(db, BALANCES_HELD_QUERIES)),
+        ("escrowed", escrowed(db)),
+    ]:
+        for asset, quantity in values.items():
+            totals[(asset, counter)] = quantity or 0
+    cursor = db.cursor()
+    cursor.execute("""DELETE FROM asset_counters""")
+    cursor.execute("""DELETE FROM asset_counters_changes""")
+    cursor.close()
+    current_block_index = util.CURRENT_BLOCK_INDEX
+    util.CURRENT_BLOCK_INDEX = block_index
+    try:
+        update_asset_counters(db, totals)
+    finally:
+        util.CURRENT_BLOCK_INDEX = current_block_index
+
+
+def rollback_asset_counters(db, block_index):
+    """Roll the asset counters back to the block before `block_index`.
+
+    Must be called after the other tables are cleaned: if the changes
+    of the blocks to remove are not all recorded, the counters are rebuilt.
+    """
+    cursor = db.cursor()
+    cursor.execute("""SELECT MIN(block_index) AS block_index FROM asset_counters_changes""")
+    first_block_index = cursor.fetchall()[0]["block_index"]
+    if first_block_index is None or block_index <= first_block_index:
+        cursor.close()
+        build_asset_counters(db, block_index - 1)
+        return
+    cursor.execute(
+        """
+        UPDATE asset_counters SET
+            issued = asset_counters.issued - changes.issued,
+            destroyed = asset_counters.destroyed - changes.destroyed,
+            held = asset_counters.held - changes.held,
+            escrowed = asset_counters.escrowed - changes.escrowed
+        FROM (
+            SELECT asset,
+                SUM(issued) AS issued,
+                SUM(destroyed) AS destroyed,
+                SUM(held) AS held,
+                SUM(escrowed) AS escrowed
+            FROM asset_counters_changes
+            WHERE block_index >= ?
+            GROUP BY asset
+        ) AS changes
+        WHERE asset_counters.asset = changes.asset
+        """,
+        (block_index,),
+    )
+    cursor.execute("""DELETE FROM asset_counters_changes WHERE block_index >= ?""", (block_index,))
+    cursor.close()
+
+
+def prune_asset_counters_changes(db, block_index):
+    """Remove the changes of the blocks too old to be rolled back by a reorganisation."""
+    query = """DELETE FROM asset_counters_changes WHERE block_index < :block_index"""
+    bindings = {"block_index": block_index - ASSET_COUNTERS_CHANGES_BLOCKS}
+    database.get_statement_cursor(db, query).execute(query, bindings)
+
+
+def get_asset_counters(db, block_index=None):
+    """Return the supplies and the held quantities from the asset counters.
+
+    With `block_index`, return only the assets changed by this block.
+    """
+    cursor = db.cursor()
+    if block_index is None:
+        cursor.execute("""SELECT * FROM asset_counters""")
+    else:
+        cursor.execute(
+            """
+            SELECT asset_counters.* FROM asset_counters
+            JOIN asset_counters_changes ON asset_counters.asset = asset_counters_changes.asset
+            WHERE asset_counters_changes.block_index = ?
+            """,
+            (block_index,),
+        )
+    supplies, held = {}, {}
+    for counters in cursor:
+        supplies[counters["asset"]] = counters["issued"] - counters["destroyed"]
+        held[counters["asset"]] = counters["held"] + counters["escrowed"]
+    cursor.close()
+    return supplies, held
@@ -0,0 +1,113 @@
+import logging
+import threading
+
+from counterpartycore.lib import backend, config, util
+from counterpartycore.lib.gettxinfo import get_tx_info
+from counterpartycore.lib.kickstart.blocks_parser import BlockchainParser
+
+logger = logging.getLogger(config.LOGGER_NAME)
+
+# Decoded Counterparty transactions of the mempool, keyed by tx hash. Updated
+# incrementally by the mempool loop of `blocks.follow()`: the new transactions
+# are taken from the mempool parsing, and the ones that left the mempool are
+# evicted. Served by the API v1 `get_memmempool` method.
+
+TRANSACTIONS = {}
+LOCK = threading.Lock()
+
+
+def get_transaction_entry(db, transaction):
+    """Return the mempool entry of a transaction listed by `blocks.list_tx()`, `None` if it has no data."""
+    if transaction["data"] is None:
+        return None
+    cursor = db.cursor()
+    cursor.execute(
+        """
+        SELECT destination, btc_amount, out_index FROM transaction_outputs
+        WHERE tx_hash = ? ORDER BY rowid
+        """,
+        (transaction["tx_hash"],),
+    )
+    outputs = cursor.fetchall()
+    cursor.close()
+    return {
+        "tx_hash": transaction["tx_hash"],
+        "source": transaction["source"],
+        "destination": transaction["destination"],
+        "btc_amount": transaction["btc_amount"],
+        "fee": transaction["fee"],
+        "data": util.hexlify(transaction["data"]),
+        "extra": outputs,
+    }
+
+
+def decode_transaction(db, tx_hash, tx_hex):
+    """Return the mempool entry of a transaction, `None` if it has no Counterparty data."""
+    source, destination, btc_amount, fee, data, extra = get_tx_info(
+        db,
+        BlockchainParser().deserialize_tx(tx_hex),
+        block_index=None,
+    )
+    if data is None:
+        return None
+    return {
+        "tx_hash": tx_hash,
+        "source": source,
+        "destination": destination,
+        "btc_amount": btc_amount,
+        "fee": fee,
+        "data": util.hexlify(data),
+        "extra": extra,
+    }
+
+
+def update(db, tx_hashes, parsed_transactions=None, raw_transactions=None):
+    """Keep the transactions of `tx_hashes` and add the new ones.
+
+    `parsed_transactions` are the entries of the transactions parsed by the
+    caller, see `get_transaction_entry()`. The other new transactions, parsed
+    before the last restart, are decoded from `raw_transactions` or fetched in
+    one batch.
+    """
+    tx_hashes = list(dict.fromkeys(tx_hashes))
+    parsed_transactions = parsed_transactions or {}
+    new_tx_hashes = [tx_hash for tx_hash in tx_hashes if tx_hash not in TRANSACTIONS]
+    new_transactions = {
+        tx_hash: parsed_transactions[tx_hash]
+        for tx_hash in new_tx_hashes
+        if tx_hash in parsed_transactions
+    }
+    raw_transactions = raw_transactions or {}
+    missing_tx_hashes = [
+        tx_hash
+        for tx_hash in new_tx_hashes
+        if tx_hash not in new_transactions and raw_transactions.get(tx_hash) is None
+    ]
+    if missing_tx_hashes:
+        try:
+            raw_transactions = raw_transactions | backend.getrawtransaction_batch(
+                missing_tx_hashes, skip_missing=True
+            )
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Failed to fetch raw mempool TXs, continue; %s", (e,))
+
+    for tx_hash in new_tx_hashes:
+        if tx_hash in new_transactions:
+            continue
+        tx_hex = raw_transactions.get(tx_hash)
+        if tx_hex is None:
+            # retried on the next update
+            continue
+        new_transactions[tx_hash] = decode_transaction(db, tx_hash, tx_hex)
+
+    kept_tx_hashes = set(tx_hashes)
+    with LOCK:
+        for tx_hash in list(TRANSACTIONS):
+            if tx_hash not in kept_tx_hashes:
+                del TRANSACTIONS[tx_hash]
+        TRANSACTIONS.update(new_transactions)
+
+
+def get_transactions():
+    with LOCK:
+        return [transaction for transaction in TRANSACTIONS.values() if transaction is not None]
@@ -743,6 +743,9 @@ def parse(db, tx, message):
 def is_dispensable(db, address, amount):
     if address is None:
         return False
+    # almost no output pays a dispenser
+    if not ledger.is_dispenser_address(db, address):
+        return False
 
     dispensers = ledger.get_dispensers(db, address=address, status_in=[0, 11])
 
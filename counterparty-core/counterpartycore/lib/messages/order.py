@@ -644,11 +644,23 @@ def match(db, tx, block_index=None):
     tx1_give_remaining = tx1["give_remaining"]
     tx1_get_remaining = tx1["get_remaining"]
 
-    order_matches = ledger.get_matching_orders(
-        db, tx1["tx_hash"], give_asset=tx1["give_asset"], get_asset=tx1["get_asset"]
+    # With `Fraction` prices, the order book is already sorted by price then by tx index,
+    # so the orders after the first price mismatch can be skipped.
+    sorted_by_price = (tx["block_index"] > 284500 or config.TESTNET or config.REGTEST) and (
+        util.CURRENT_BLOCK_INDEX >= 294500 or config.TESTNET or config.REGTEST
     )
+    if sorted_by_price:
+        order_matches = ledger.get_sorted_matching_orders(
+            db, tx1["tx_hash"], give_asset=tx1["give_asset"], get_asset=tx1["get_asset"]
+        )
+    else:
+        order_matches = ledger.get_matching_orders(
+            db, tx1["tx_hash"], give_asset=tx1["give_asset"], get_asset=tx1["get_asset"]
+        )
 
-    if tx["block_index"] > 284500 or config.TESTNET or config.REGTEST:  # Protocol change.
+    if (
+        tx["block_index"] > 284500 or config.TESTNET or config.REGTEST
+    ) and not sorted_by_price:  # Protocol change.
         order_matches = sorted(
             order_matches, key=lambda x: x["tx_index"]
         )  # Sort by tx index second.
@@ -731,6 +743,8 @@ def match(db, tx, block_index=None):
         )
         if tx0_price > tx1_inverse_price:
             logger.debug("Skipping: price mismatch.")
+            if sorted_by_price:
+                break
         else:
             logger.debug(
                 f"Potential forward quantities: {tx0_give_remaining}, {int(ledger.price(tx1_give_remaining, tx0_price))}"
@@ -1,24 +1,98 @@
 import logging
-import queue
+import multiprocessing
 import threading
-import time
 
 import bitcoin as bitcoinlib
 
-from counterpartycore.lib import backend, config, util
+from counterpartycore.lib import backend, config, gettxinfo, util
+from counterpartycore.lib.exceptions import DecodeError
+from counterpartycore.lib.kickstart.blocks_parser import BlockchainParser
 
 logger = logging.getLogger(config.LOGGER_NAME)
 
 
-BLOCKCHAIN_CACHE_MAX_SIZE = 100
+# Size of the raw transactions kept in `backend.BLOCKCHAIN_CACHE`.
+BLOCKCHAIN_CACHE_MAX_BYTES = 256 * 1024 * 1024
 PREFETCHER_THREADS = []
-NEXT_BLOCK_TO_PREFETCH = queue.Queue()
-
-
-def next_block_index():
-    block_index = NEXT_BLOCK_TO_PREFETCH.get()
-    NEXT_BLOCK_TO_PREFETCH.put(block_index + 1)
-    return block_index
+# Protects `backend.BLOCKCHAIN_CACHE` and the pipeline state below.
+PIPELINE_CONDITION = threading.Condition()
+NEXT_BLOCK_TO_PREFETCH = None
+# Blocks claimed by a prefetcher thread and not cached yet.
+BLOCKS_IN_FLIGHT = set()
+CACHED_BLOCKS_SIZE = {}
+STATS = {
+    "cache_bytes": 0,
+    "cache_blocks": 0,
+    "producer_stalls": 0,
+    "consumer_stalls": 0,
+    "cache_misses": 0,
+}
+
+# Number of cached blocks ahead of the parser sent to the decoder processes.
+DECODER_LOOKAHEAD = 20
+DECODER_POOL = None
+# block_index -> (block_hash, AsyncResult of `decode_transactions()`)
+DECODED_BLOCKS = {}
+
+
+def claim_block_index(stop_event):
+    """Return the next block to fetch, waiting while the cache is full.
+
+    Blocks are claimed in order, so the block needed by the parser is always
+    cached or in flight before the ones after it.
+    """
+    global NEXT_BLOCK_TO_PREFETCH  # noqa: PLW0603
+    with PIPELINE_CONDITION:
+        while STATS["cache_bytes"] >= BLOCKCHAIN_CACHE_MAX_BYTES and not stop_event.is_set():
+            STATS["producer_stalls"] += 1
+            PIPELINE_CONDITION.wait()
+        if stop_event.is_set():
+            return None
+        block_index = NEXT_BLOCK_TO_PREFETCH
+        NEXT_BLOCK_TO_PREFETCH += 1
+        BLOCKS_IN_FLIGHT.add(block_index)
+        return block_index
+
+
+def cache_block(block_index, cached_block):
+    """Add a fetched block to the cache, or just release the claim if `cached_block` is `None`."""
+    with PIPELINE_CONDITION:
+        BLOCKS_IN_FLIGHT.discard(block_index)
+        if cached_block is not None:
+            block_size = sum(len(tx_hex) for tx_hex in cached_block["raw_transactions"].values())
+            backend.BLOCKCHAIN_CACHE[block_index] = cached_block
+            CACHED_BLOCKS_SIZE[block_index] = block_size
+            STATS["cache_bytes"] += block_size
+            STATS["cache_blocks"] = len(backend.BLOCKCHAIN_CACHE)
+        PIPELINE_CONDITION.notify_all()
+
+
+def get_block(block_index):
+    """Return the cached block `block_index`, waiting for it if it's being fetched."""
+    with PIPELINE_CONDITION:
+        if block_index in BLOCKS_IN_FLIGHT:
+            STATS["consumer_stalls"] += 1
+            while block_index in BLOCKS_IN_FLIGHT:
+                PIPELINE_CONDITION.wait()
+        cached_block = backend.BLOCKCHAIN_CACHE.get(block_index)
+        if cached_block is None and PREFETCHER_THREADS:
+            STATS["cache_misses"] += 1
+        return cached_block
+
+
+def release_block(block_index):
+    """Remove `block_index` and all previous blocks from the cache."""
+    with PIPELINE_CONDITION:
+        for cached_index in [index for index in backend.BLOCKCHAIN_CACHE if index <= block_index]:
+            del backend.BLOCKCHAIN_CACHE[cached_index]
+            STATS["cache_bytes"] -= CACHED_BLOCKS_SIZE.pop(cached_index)
+        STATS["cache_blocks"] = len(backend.BLOCKCHAIN_CACHE)
+        PIPELINE_CONDITION.notify_all()
+
+
+def get_stats():
+    with PIPELINE_CONDITION:
+        return STATS | {"blocks_in_flight": len(BLOCKS_IN_FLIGHT)}
 
 
 class Prefetcher(threading.Thread):
@@ -29,57 +103,144 @@ class Prefetcher(threading.Thread):
 
     def stop(self):
         self.stop_event.set()
+        with PIPELINE_CONDITION:
+            PIPELINE_CONDITION.notify_all()
 
     def run(self):
         logger.info(f"Starting Prefetcher process {self.thread_index}.")
 
         while True:
-            if self.stop_event.is_set():
+            block_index = claim_block_index(self.stop_event)
+            if block_index is None:
                 break
 
-            if len(backend.BLOCKCHAIN_CACHE) >= BLOCKCHAIN_CACHE_MAX_SIZE:
-                logger.debug(
-                    f"Blockchain cache is full. Sleeping Prefetcher thread {self.thread_index}."
-                )
-                time.sleep(10)
-                continue
-
-            block_index = next_block_index()
-            if not block_index:
-                continue
-
             logger.debug(
                 f"Fetching block {block_index} with Prefetcher thread {self.thread_index}."
             )
-            block_hash = backend.getblockhash(block_index)
-            block = backend.getblock(block_hash)
-            txhash_list, raw_transactions = backend.get_tx_list(
-                block,
-                correct_segwit=util.enabled("correct_segwit_txids", block_index=block_index),
-            )
-            backend.BLOCKCHAIN_CACHE[block_index] = {
-                "block_hash": block_hash,
-                "txhash_list": txhash_list,
-                "raw_transactions": raw_transactions,
-                "previous_block_hash": bitcoinlib.core.b2lx(block.hashPrevBlock),
-                "block_time": block.nTime,
-                "block_difficulty": block.difficulty,
-            }
-
-
-def start_all(num_prefetcher_threads):
+            cached_block = None
+            try:
+                block_hash = backend.getblockhash(block_index)
+                block = backend.getblock(block_hash)
+                txhash_list, raw_transactions = backend.get_tx_list(
+                    block,
+                    correct_segwit=util.enabled("correct_segwit_txids", block_index=block_index),
+                )
+                cached_block = {
+                    "block_hash": block_hash,
+                    "txhash_list": txhash_list,
+                    "raw_transactions": raw_transactions,
+                    "previous_block_hash": bitcoinlib.core.b2lx(block.hashPrevBlock),
+                    "block_time": block.nTime,
+                    "block_difficulty": block.difficulty,
+                }
+            except Exception as e:
+                # `follow()` will fetch the block itself
+                logger.warning(
+                    f"Prefetcher thread {self.thread_index} failed to fetch block {block_index}: {e}"
+                )
+            finally:
+                cache_block(block_index, cached_block)
+
+
+def init_decoder(parser_config):
+    for attribute in parser_config:
+        setattr(config, attribute, parser_config[attribute])
+
+
+def decode_transactions(block_index, txhash_list, raw_transactions):
+    """Deserialize the transactions of a block and parse their outputs.
+
+    Nothing here depends on the ledger: sources and dispensers are resolved
+    by `gettxinfo.get_tx_info()` in the main process, which uses `parsed_vouts`
+    as it does with the blocks decoded by kickstart.
+    """
+    util.CURRENT_BLOCK_INDEX = block_index
+    decoded_transactions = {}
+    for tx_hash in txhash_list:
+        decoded_tx = BlockchainParser().deserialize_tx(raw_transactions[tx_hash])
+        try:
+            decoded_tx["parsed_vouts"] = gettxinfo.parse_transaction_vouts(decoded_tx)
+        except DecodeError:
+            decoded_tx["parsed_vouts"] = "DecodeError"
+        except Exception:  # noqa: S110
+            # let the main process raise it
+            pass
+        decoded_transactions[tx_hash] = decoded_tx
+    return decoded_transactions
+
+
+def schedule_decoding(block_index):
+    for next_block_index in range(block_index, block_index + DECODER_LOOKAHEAD):
+        if next_block_index in DECODED_BLOCKS:
+            continue
+        cached_block = backend.BLOCKCHAIN_CACHE.get(next_block_index)
+        if cached_block is None:
+            continue
+        DECODED_BLOCKS[next_block_index] = (
+            cached_block["block_hash"],
+            DECODER_POOL.apply_async(
+                decode_transactions,
+                (
+                    next_block_index,
+                    cached_block["txhash_list"],
+                    cached_block["raw_transactions"],
+                ),
+            ),
+        )
+
+
+def get_decoded_transactions(block_index, block_hash):
+    """Return the decoded transactions of a cached block by hash, or `None`.
+
+    Must be called before the block is removed from `backend.BLOCKCHAIN_CACHE`.
+    """
+    if DECODER_POOL is None:
+        return None
+    schedule_decoding(block_index)
+    decoded_block = DECODED_BLOCKS.pop(block_index, None)
+    if decoded_block is None or decoded_block[0] != block_hash:
+        return None
+    return decoded_block[1].get()
+
+
+def start_decoder(num_decoder_processes):
+    global DECODER_POOL  # noqa: PLW0603
+    parser_config = {}
+    for attribute in dir(config):
+        if attribute.isupper():
+            parser_config[attribute] = getattr(config, attribute)
+    DECODER_POOL = multiprocessing.Pool(
+        num_decoder_processes, initializer=init_decoder, initargs=(parser_config,)
+    )
+
+
+def stop_decoder():
+    global DECODER_POOL  # noqa: PLW0603
+    if DECODER_POOL is not None:
+        DECODER_POOL.terminate()
+        DECODER_POOL = None
+    DECODED_BLOCKS.clear()
+
+
+def start_all(num_prefetcher_threads, num_decoder_processes=0):
+    global NEXT_BLOCK_TO_PREFETCH  # noqa: PLW0603
     # Block Prefetcher and Indexer
     block_first = config.BLOCK_FIRST_TESTNET if config.TESTNET else config.BLOCK_FIRST
     block_first = util.CURRENT_BLOCK_INDEX or block_first
-    NEXT_BLOCK_TO_PREFETCH.put(block_first)
+    with PIPELINE_CONDITION:
+        NEXT_BLOCK_TO_PREFETCH = block_first
     for thread_index in range(1, num_prefetcher_threads + 1):
         prefetcher_thread = Prefetcher(thread_index)
         prefetcher_thread.daemon = True
-        time.sleep(0.05)  # avoid DOS
         prefetcher_thread.start()
         PREFETCHER_THREADS.append(prefetcher_thread)
+    # Transactions decoder
+    if num_decoder_processes > 0:
+        start_decoder(num_decoder_processes)
 
 
 def stop_all():
     for prefetcher_thread in PREFETCHER_THREADS:
-        prefetcher_thread.stop_event.set()
+        prefetcher_thread.stop()
+    PREFETCHER_THREADS.clear()
+    stop_decoder()
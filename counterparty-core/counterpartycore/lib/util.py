@@ -1,3 +1,4 @@
+import base64
 import binascii
 import collections
 import decimal
@@ -399,6 +400,21 @@ def parse_id(match_id):
     return match_id[:64], match_id[65:]  # UTF-8 encoding means that the indices are doubled.
 
 
+# Pagination cursors of the API: the rowid or event index of the last row of a page.
+def encode_cursor(row_key):
+    return base64.urlsafe_b64encode(str(row_key).encode()).decode()
+
+
+def decode_cursor(cursor):
+    """Return the rowid or event index of a cursor returned by `encode_cursor()`."""
+    if cursor is None:
+        return None
+    try:
+        return int(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except (ValueError, UnicodeDecodeError, binascii.Error) as e:
+        raise exceptions.InvalidArgument("Invalid cursor parameter") from e
+
+
 def sizeof(v):
     if isinstance(v, dict) or isinstance(v, DictCache):
         s = 0
@@ -24,6 +24,7 @@ from counterpartycore.lib import (
     check,
     config,
     database,
+    ledger,
     log,
     transaction,
     util,
@@ -31,6 +32,7 @@ from counterpartycore.lib import (
 from counterpartycore.lib import kickstart as kickstarter
 from counterpartycore.lib.api import api_server as api_v2
 from counterpartycore.lib.api import api_v1, routes  # noqa: F401
+from counterpartycore.lib.api import state as api_state
 from counterpartycore.lib.public_keys import PUBLIC_KEYS
 from counterpartycore.lib.telemetry.clients.influxdb import TelemetryClientInfluxDB
 from counterpartycore.lib.telemetry.collectors.influxdb import (
@@ -141,6 +143,7 @@ def initialise_config(
     api_user=None,
     api_password=None,
     api_no_allow_cors=False,
+    api_workers=config.DEFAULT_API_WORKERS,
     force=False,
     requests_timeout=config.DEFAULT_REQUESTS_TIMEOUT,
     rpc_batch_size=config.DEFAULT_RPC_BATCH_SIZE,
@@ -454,6 +457,10 @@ def initialise_config(
     else:
         config.API_NO_ALLOW_CORS = False
 
+    if api_workers < 1:
+        raise ConfigurationError("Please specify a positive number of API workers")
+    config.API_WORKERS = api_workers
+
     ##############
     # OTHER SETTINGS
 
@@ -583,6 +590,7 @@ def initialise_log_and_config(args):
         "api_user": args.api_user,
         "api_password": args.api_password,
         "api_no_allow_cors": args.api_no_allow_cors,
+        "api_workers": args.api_workers,
         "requests_timeout": args.requests_timeout,
         "rpc_batch_size": args.rpc_batch_size,
         "check_asset_conservation": args.check_asset_conservation,
@@ -691,7 +699,9 @@ def start_all(args):
         db = initialise_db()
         blocks.initialise(db)
 
-        # API Server v2.
+        # API Server v2, the parser pushes it the last block.
+        api_state.initialise()
+        api_state.set_last_block(ledger.get_last_block(db))
         api_server_v2 = api_v2.APIServer()
         api_server_v2.start(args)
 
@@ -719,11 +729,6 @@ def start_all(args):
         api_status_poller.daemon = True
         api_status_poller.start()
 
-        # In-memory mempool.
-        in_memory_mempool = api_v1.MemMempool()
-        in_memory_mempool.daemon = True
-        in_memory_mempool.start()
-
         # API Server v1.
         api_server_v1 = api_v1.APIServer()
         api_server_v1.daemon = True
@@ -752,12 +757,15 @@ def start_all(args):
         logging.shutdown()
 
 
-def reparse(block_index):
+def reparse(block_index, verify=False, processes=None):
     connect_to_electrs()
     # connect_to_addrindexrs()
     db = initialise_db()
     try:
-        blocks.reparse(db, block_index=block_index)
+        if verify:
+            blocks.verify(db, block_index=block_index, processes=processes)
+        else:
+            blocks.reparse(db, block_index=block_index)
     finally:
         backend.stop()
         database.optimize(db)
@@ -773,12 +781,27 @@ def rollback(block_index=None):
         db.close()
 
 
-def kickstart(bitcoind_dir, force=False, max_queue_size=None, debug_block=None):
+def kickstart(
+    bitcoind_dir,
+    force=False,
+    max_queue_size=None,
+    debug_block=None,
+    blocks_readers=None,
+    blocks_buffer_size=None,
+):
+    if blocks_readers is not None and blocks_readers < 1:
+        raise ConfigurationError("Please specify a positive number of blocks readers")
+    if blocks_buffer_size is not None and blocks_buffer_size < kickstarter.MIN_BLOCKS_BUFFER_SIZE:
+        raise ConfigurationError(
+            f"Please specify a blocks buffer size of at least {kickstarter.MIN_BLOCKS_BUFFER_SIZE} MB"
+        )
     kickstarter.run(
         bitcoind_dir=bitcoind_dir,
         force=force,
         max_queue_size=max_queue_size,
         debug_block=debug_block,
+        blocks_readers=blocks_readers,
+        blocks_buffer_size=blocks_buffer_size,
     )
 
 
@@ -798,7 +821,7 @@ def check_database():
     start_time = time.time()
     step = "Checking asset conservation..."
     with Halo(text=step, spinner=SPINNER_STYLE):
-        check.asset_conservation(db)
+        check.asset_conservation(db, deep=True)
     print(f"{OK_GREEN} {step} (in {time.time() - start_time:.2f}s)")
 
     start_time = time.time()
@@ -20,6 +20,17 @@ API_V2_FIXTURES = CURR_DIR + "/fixtures/api_v2_fixtures.json"
 API_ROOT = "http://localhost:10009"
 
 
+def has_rowid(result):
+    """Whether a row of the result has a rowid field."""
+    if isinstance(result, dict):
+        return any(
+            key in ["rowid", "MAX(rowid)"] or has_rowid(value) for key, value in result.items()
+        )
+    if isinstance(result, list):
+        return any(has_rowid(item) for item in result)
+    return False
+
+
 @pytest.mark.usefixtures("api_server_v2")
 def test_api_v2(request):
     block_index = 310491
@@ -72,6 +83,8 @@ def test_api_v2(request):
         results[url] = result.json()
         print(result.json())
         assert result.status_code == 200
+        # the rowids are only used as pagination keys
+        assert not has_rowid(results[url])
         if not request.config.getoption("saveapifixtures"):
             assert results[url] == fixtures[url]
 
@@ -322,3 +335,79 @@ def test_new_get_order_matches():
         "fee_paid": 7200,
         "status": "pending",
     }
+
+
+@pytest.mark.usefixtures("api_server_v2")
+def test_new_get_balances_ndjson():
+    alice = ADDR[0]
+    url = f"{API_ROOT}/v2/addresses/{alice}/balances"
+    result = requests.get(url).json()["result"]  # noqa: S113
+    response = requests.get(url, headers={"Accept": "application/x-ndjson"})  # noqa: S113
+    assert response.headers["Content-Type"] == "application/x-ndjson"
+    assert [json.loads(line) for line in response.text.splitlines()] == result
+
+
+@pytest.mark.usefixtures("api_server_v2")
+def test_new_get_pages_with_cursor():
+    for path in [
+        f"/v2/addresses/{ADDR[0]}/credits",
+        "/v2/events/CREDIT",
+        "/v2/assets/XCP/sends",
+        "/v2/burns",
+    ]:
+        all_rows = requests.get(f"{API_ROOT}{path}?limit=1000").json()["result"]  # noqa: S113
+        assert len(all_rows) > 3
+
+        rows = []
+        url = f"{API_ROOT}{path}?limit=3"
+        while True:
+            page = requests.get(url).json()  # noqa: S113
+            rows += page["result"]
+            if "next_cursor" not in page:
+                break
+            assert len(page["result"]) == 3
+            url = f"{API_ROOT}{path}?limit=3&cursor={page['next_cursor']}"
+        assert rows == all_rows
+
+    url = f"{API_ROOT}/v2/addresses/{ADDR[0]}/credits"
+    result = requests.get(f"{url}?cursor=MTA=&offset=3")  # noqa: S113
+    assert result.status_code == 400
+    assert result.json()["error"] == "The cursor and offset parameters can't be used together"
+    result = requests.get(f"{url}?cursor=foobar")  # noqa: S113
+    assert result.status_code == 400
+    assert result.json()["error"] == "Invalid cursor parameter"
+
+
+def read_stream_events(response, count):
+    events = []
+    for line in response.iter_lines(decode_unicode=True):
+        if line.startswith("data: "):
+            events.append(json.loads(line[len("data: ") :]))
+            if len(events) == count:
+                break
+    return events
+
+
+@pytest.mark.usefixtures("api_server_v2")
+def test_new_events_stream():
+    credits = requests.get(f"{API_ROOT}/v2/events/CREDIT?limit=4").json()["result"]  # noqa: S113
+    # from the oldest to the newest
+    credits = credits[::-1]
+    url = f"{API_ROOT}/v2/events/stream?event_name=CREDIT&last={credits[0]['event_index']}"
+    with requests.get(url, stream=True, timeout=10) as response:
+        assert response.status_code == 200
+        assert response.headers["Content-Type"].startswith("text/event-stream")
+        events = read_stream_events(response, 3)
+    assert [event["event_index"] for event in events] == [
+        credit["event_index"] for credit in credits[1:]
+    ]
+    assert [event["params"] for event in events] == [credit["params"] for credit in credits[1:]]
+
+    # the streams don't hold the API workers
+    with requests.get(url, stream=True, timeout=10) as response:
+        assert read_stream_events(response, 1) == events[:1]
+        assert requests.get(f"{API_ROOT}/v2/events/CREDIT?limit=1").status_code == 200  # noqa: S113
+
+    result = requests.get(f"{API_ROOT}/v2/events/stream?last=foo")  # noqa: S113
+    assert result.status_code == 400
+    assert result.json()["error"] == "Invalid integer: last"
@@ -0,0 +1,105 @@
+import socket
+import threading
+
+from counterpartycore.lib.api import api_server, event_stream
+
+
+def blocking_app(release):
+    def app(environ, start_response):
+        release.wait(5)
+        start_response("200 OK", [("Content-Type", "text/plain")])
+        return [b"ok"]
+
+    return app
+
+
+def send_request(port, path="/v2/"):
+    connection = socket.create_connection(("127.0.0.1", port), timeout=5)
+    connection.sendall(
+        f"GET {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n".encode()
+    )
+    return connection
+
+
+def start_server(app, workers):
+    server = api_server.APIWSGIServer("127.0.0.1", 0, app, workers)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def stop_server(server):
+    server.shutdown()
+    server.server_close()
+
+
+def read_response(connection):
+    response = b""
+    while True:
+        data = connection.recv(4096)
+        if not data:
+            break
+        response += data
+    connection.close()
+    return response
+
+
+def test_pending_requests(monkeypatch):
+    monkeypatch.setattr(api_server, "MAX_PENDING_REQUESTS_BY_WORKER", 1)
+    release = threading.Event()
+    server = start_server(blocking_app(release), 1)
+    try:
+        # one request handled by the worker, one waiting for it
+        connections = [send_request(server.server_port) for _ in range(2)]
+        rejected = read_response(send_request(server.server_port))
+        assert rejected.startswith(b"HTTP/1.1 503 Service Unavailable")
+        assert rejected.endswith(b'{"error": "Too many requests. Please retry later."}')
+
+        release.set()
+        for connection in connections:
+            assert read_response(connection).startswith(b"HTTP/1.1 200 OK")
+        # the slots are released
+        assert read_response(send_request(server.server_port)).startswith(b"HTTP/1.1 200 OK")
+    finally:
+        release.set()
+        stop_server(server)
+
+
+def test_event_streams(monkeypatch):
+    monkeypatch.setattr(event_stream, "MAX_SUBSCRIBERS", 1)
+    release = threading.Event()
+
+    def app(environ, start_response):
+        if environ["PATH_INFO"] == event_stream.STREAM_ROUTE:
+            return blocking_app(release)(environ, start_response)
+        start_response("200 OK", [("Content-Type", "text/plain")])
+        return [b"ok"]
+
+    server = start_server(app, 1)
+    try:
+        # the stream doesn't hold the only worker
+        stream = send_request(server.server_port, event_stream.STREAM_ROUTE)
+        assert read_response(send_request(server.server_port)).startswith(b"HTTP/1.1 200 OK")
+        rejected = read_response(send_request(server.server_port, event_stream.STREAM_ROUTE))
+        assert rejected.startswith(b"HTTP/1.1 503 Service Unavailable")
+        assert b"Too many subscribers" in rejected
+
+        release.set()
+        assert read_response(stream).startswith(b"HTTP/1.1 200 OK")
+    finally:
+        release.set()
+        stop_server(server)
+
+
+def test_idle_connection(monkeypatch):
+    monkeypatch.setattr(api_server, "REQUEST_SOCKET_TIMEOUT", 0.5)
+    release = threading.Event()
+    release.set()
+    server = start_server(blocking_app(release), 1)
+    try:
+        # a client sending the beginning of its request only holds the worker until the timeout
+        idle = socket.create_connection(("127.0.0.1", server.server_port), timeout=5)
+        idle.sendall(b"GET /v2/ev")
+        assert read_response(send_request(server.server_port)).startswith(b"HTTP/1.1 200 OK")
+        idle.close()
+    finally:
+        stop_server(server)
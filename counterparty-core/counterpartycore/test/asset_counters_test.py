@@ -0,0 +1,205 @@
+import tempfile
+
+import pytest
+
+from counterpartycore.lib import blocks, check, ledger, util
+
+# this is require near the top to do setup of the test suite
+from counterpartycore.test import (
+    conftest,  # noqa: F401
+)
+from counterpartycore.test.fixtures.params import ADDR
+from counterpartycore.test.util_test import CURR_DIR
+
+# read by the `cp_server` fixture
+FIXTURE_SQL_FILE = CURR_DIR + "/fixtures/scenarios/unittest_fixture.sql"
+FIXTURE_DB = tempfile.gettempdir() + "/fixtures.unittest_fixture.db"
+
+
+def test_asset_counters(server_db):
+    check.asset_conservation(server_db, deep=True)
+    supplies, held = ledger.get_asset_counters(server_db)
+
+    block_index = util.CURRENT_BLOCK_INDEX + 1
+    util.CURRENT_BLOCK_INDEX = block_index
+    ledger.debit(server_db, ADDR[0], "XCP", 100, 0, action="test", event="test")
+    _, new_held = ledger.get_asset_counters(server_db)
+    assert new_held["XCP"] == held["XCP"] - 100
+
+    ledger.rollback_asset_counters(server_db, block_index)
+    assert ledger.get_asset_counters(server_db) == (supplies, held)
+
+
+def test_asset_holders(server_db):
+    holders = ledger.get_asset_holders(server_db, "XCP")
+    holder_count = ledger.get_asset_holder_count(server_db, "XCP")
+    assert holder_count == len(set(holder["address"] for holder in holders))
+    assert assert_same_holders(server_db, "XCP") == holders
+
+    block_index = util.CURRENT_BLOCK_INDEX + 1
+    util.CURRENT_BLOCK_INDEX = block_index
+    balance = ledger.get_balance(server_db, ADDR[5], "XCP")
+    ledger.credit(server_db, ADDR[5], "XCP", 100, 0, action="test", event="test")
+    assert {
+        "address": ADDR[5],
+        "address_quantity": balance + 100,
+        "escrow": None,
+    } in ledger.get_asset_holders(server_db, "XCP")
+
+    blocks.clean_messages_tables(server_db, block_index)
+    assert ledger.get_asset_holders(server_db, "XCP") == holders
+
+
+def assert_same_holders(db, asset):
+    holders = ledger.get_asset_holders(db, asset)
+    # same holders as the history tables, without the empty escrows; only the order may differ
+    history_holders = [
+        holder for holder in ledger.holders(db, asset, True) if holder["address_quantity"] > 0
+    ]
+    assert sorted(holders, key=str) == sorted(history_holders, key=str)
+    return holders
+
+
+def copy_record(db, table_name, id_name, id_value, **fields):
+    record = dict(
+        db.execute(
+            f"SELECT * FROM {table_name} WHERE {id_name} = ? ORDER BY rowid DESC LIMIT 1",  # noqa: S608
+            (id_value,),
+        ).fetchone()
+    )
+    record.update(fields, block_index=util.CURRENT_BLOCK_INDEX)
+    ledger.insert_record(db, table_name, record, "TEST")
+    return record
+
+
+def test_asset_holders_escrows(server_db, monkeypatch):
+    enabled = util.enabled
+    monkeypatch.setattr(
+        util,
+        "enabled",
+        lambda change_name, **kwargs: (
+            change_name == "dispensers_in_holders" or enabled(change_name, **kwargs)
+        ),
+    )
+    monkeypatch.setattr(util, "CURRENT_BLOCK_INDEX", util.CURRENT_BLOCK_INDEX + 1)
+    block_index = util.CURRENT_BLOCK_INDEX
+    # XCP has an open dispenser and a pending order match
+    holders = assert_same_holders(server_db, "XCP")
+    dispenser = server_db.execute("SELECT * FROM dispensers WHERE asset = 'XCP'").fetchone()
+    order_match = server_db.execute("SELECT * FROM order_matches").fetchone()
+
+    # another dispenser of the same source replaces the first one
+    copy_record(
+        server_db,
+        "dispensers",
+        "tx_hash",
+        dispenser["tx_hash"],
+        tx_hash="11" * 32,
+        give_remaining=50,
+    )
+    assert_same_holders(server_db, "XCP")
+    assert {
+        "address": dispenser["source"],
+        "address_quantity": 50,
+        "escrow": None,
+    } in ledger.get_asset_holders(server_db, "XCP")
+
+    # closing the new dispenser doesn't bring the first one back
+    ledger.insert_update(server_db, "dispensers", "tx_hash", "11" * 32, {"status": 10}, "TEST")
+    dispenser_holding = {"address": dispenser["source"], "address_quantity": 100, "escrow": None}
+    assert dispenser_holding in holders
+    assert dispenser_holding not in assert_same_holders(server_db, "XCP")
+
+    # only the last order match of a backward asset is a holder
+    for index in range(2):
+        copy_record(
+            server_db,
+            "order_matches",
+            "id",
+            order_match["id"],
+            id=f"{index}" * 64,
+            forward_asset="DIVISIBLE",
+            backward_asset="XCP",
+            backward_quantity=1000 + index,
+        )
+        assert_same_holders(server_db, "XCP")
+        assert_same_holders(server_db, "DIVISIBLE")
+    ledger.insert_update(server_db, "order_matches", "id", "1" * 64, {"status": "expired"}, "TEST")
+    assert_same_holders(server_db, "XCP")
+    assert_same_holders(server_db, "DIVISIBLE")
+
+    # the changed assets are rebuilt on a rollback
+    changes = server_db.execute(
+        "SELECT DISTINCT asset FROM asset_holders_changes WHERE block_index = ?", (block_index,)
+    ).fetchall()
+    assert sorted(change["asset"] for change in changes) == ["DIVISIBLE", "XCP"]
+    blocks.clean_messages_tables(server_db, block_index)
+    assert assert_same_holders(server_db, "XCP") == holders
+
+
+def test_asset_holders_filled_order(server_db, monkeypatch):
+    monkeypatch.setattr(util, "CURRENT_BLOCK_INDEX", util.CURRENT_BLOCK_INDEX + 1)
+    order = server_db.execute(
+        "SELECT * FROM orders WHERE give_asset = 'XCP' AND get_asset = 'BTC' AND status = 'open'"
+    ).fetchone()
+    order_holding = {
+        "address": order["source"],
+        "address_quantity": order["give_remaining"],
+        "escrow": order["tx_hash"],
+    }
+    assert order_holding in assert_same_holders(server_db, "XCP")
+
+    # an order with BTC stays open when it's filled
+    ledger.insert_update(
+        server_db, "orders", "tx_hash", order["tx_hash"], {"give_remaining": 0}, "TEST"
+    )
+    holders = assert_same_holders(server_db, "XCP")
+    assert all(holder["escrow"] != order["tx_hash"] for holder in holders)
+    assert all(holder["address_quantity"] > 0 for holder in holders)
+    assert ledger.get_asset_holder_count(server_db, "XCP") == len(
+        set(holder["address"] for holder in holders)
+    )
+
+
+def test_asset_conservation_by_block(server_db, monkeypatch):
+    block_index = util.CURRENT_BLOCK_INDEX + 1
+    monkeypatch.setattr(util, "CURRENT_BLOCK_INDEX", block_index)
+    ledger.debit(server_db, ADDR[0], "DIVISIBLE", 100, 0, action="test", event="test")
+
+    supplies, held = ledger.get_asset_counters(server_db, block_index)
+    assert list(supplies) == ["DIVISIBLE"]
+    assert list(held) == ["DIVISIBLE"]
+    # the debit is not balanced by a destruction
+    with pytest.raises(check.SanityError, match="DIVISIBLE"):
+        check.asset_conservation(server_db, block_index=block_index)
+
+    # the assets not changed by the next block are not checked
+    monkeypatch.setattr(util, "CURRENT_BLOCK_INDEX", block_index + 1)
+    ledger.debit(server_db, ADDR[0], "XCP", 100, 0, action="test", event="test")
+    ledger.credit(server_db, ADDR[1], "XCP", 100, 0, action="test", event="test")
+    assert list(ledger.get_asset_counters(server_db, block_index + 1)[0]) == ["XCP"]
+    check.asset_conservation(server_db, block_index=block_index + 1)
+
+
+def test_prune_asset_counters_changes(server_db, monkeypatch):
+    block_index = util.CURRENT_BLOCK_INDEX + 1
+    monkeypatch.setattr(util, "CURRENT_BLOCK_INDEX", block_index)
+    ledger.debit(server_db, ADDR[0], "XCP", 100, 0, action="test", event="test")
+    supplies, held = ledger.get_asset_counters(server_db)
+
+    # the changes of the block are kept as long as it can be rolled back
+    ledger.prune_asset_counters_changes(
+        server_db, block_index + ledger.ASSET_COUNTERS_CHANGES_BLOCKS
+    )
+    assert list(ledger.get_asset_counters(server_db, block_index)[1]) == ["XCP"]
+
+    ledger.prune_asset_counters_changes(
+        server_db, block_index + ledger.ASSET_COUNTERS_CHANGES_BLOCKS + 1
+    )
+    assert ledger.get_asset_counters(server_db, block_index) == ({}, {})
+    # the counters are unchanged
+    assert ledger.get_asset_counters(server_db) == (supplies, held)
+
+    # the changes of the block are lost, the counters are rebuilt
+    ledger.rollback_asset_counters(server_db, block_index)
+    assert ledger.get_asset_counters(server_db) == (supplies, held)
@@ -0,0 +1,55 @@
+import os
+import tempfile
+from multiprocessing import Process, Queue
+
+import pytest
+
+from counterpartycore.lib import exceptions
+from counterpartycore.lib.kickstart import block_buffer, blocks_parser
+
+
+def start_reader(target, args):
+    """Return a parser reading the blocks of one reader process."""
+    parser = blocks_parser.BlockchainParser()
+    parser.queues = [Queue(10)]
+    parser.blocks_buffers = [block_buffer.BlockRingBuffer(1024 * 1024)]
+    parser.fetch_processes = [Process(target=target, args=args(parser))]
+    parser.next_reader = 0
+    parser.current_block = None
+    parser.fetch_processes[0].start()
+    return parser
+
+
+def stop_reader(parser):
+    parser.fetch_processes[0].join()
+    parser.blocks_buffers[0].close(unlink=True)
+    parser.queues[0].close()
+
+
+def test_reader_error():
+    # the block file doesn't exist
+    parser = start_reader(
+        blocks_parser.fetch_blocks,
+        lambda parser: (
+            tempfile.gettempdir(),
+            [(840000, 1, 99999, 0)],
+            parser.queues[0],
+            parser.blocks_buffers[0],
+            {},
+        ),
+    )
+    try:
+        with pytest.raises(exceptions.BlocksReaderError, match="Blocks reader failed"):
+            parser.next_block()
+    finally:
+        stop_reader(parser)
+
+
+def test_reader_exited():
+    # the reader is killed before putting the next block
+    parser = start_reader(os._exit, lambda parser: (1,))
+    try:
+        with pytest.raises(exceptions.BlocksReaderError, match="exited with code 1"):
+            parser.next_block()
+    finally:
+        stop_reader(parser)
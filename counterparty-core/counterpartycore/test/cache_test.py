@@ -0,0 +1,232 @@
+import collections
+import decimal
+import os
+import tempfile
+
+import pytest
+
+from counterpartycore.lib import blocks, ledger, util
+from counterpartycore.lib.api import api_server, cache
+from counterpartycore.lib.api import util as api_util
+
+# this is require near the top to do setup of the test suite
+from counterpartycore.test import (
+    conftest,  # noqa: F401
+    util_test,
+)
+from counterpartycore.test.fixtures.params import ADDR
+from counterpartycore.test.util_test import CURR_DIR
+
+# read by the `cp_server` fixture
+FIXTURE_SQL_FILE = CURR_DIR + "/fixtures/scenarios/unittest_fixture.sql"
+FIXTURE_DB = tempfile.gettempdir() + "/fixtures.unittest_fixture.db"
+
+
+@pytest.fixture
+def api_cache(server_db):
+    cache.initialise()
+    last_block = ledger.get_last_block(server_db)
+    cache.invalidate(server_db, last_block)
+    yield last_block
+    cache.CONNECTIONS.db.close()
+    del cache.CONNECTIONS.db
+    for suffix in ["", "-wal", "-shm"]:
+        if os.path.exists(cache.get_cache_db_path() + suffix):
+            os.remove(cache.get_cache_db_path() + suffix)
+
+
+def next_block(db):
+    block_index, block_hash, _ = util_test.create_next_block(db, parse_block=False)
+    return {"block_index": block_index, "block_hash": block_hash}
+
+
+def test_cache_hit(api_cache):
+    block_hash = api_cache["block_hash"]
+    result = {"quantity": decimal.Decimal("1.5"), "utxo": ("txid", 0)}
+    assert cache.get_result("/v2/key", block_hash) is None
+
+    cache.set_result("/v2/key", result, [ADDR[0]], block_hash)
+    # the result is returned as it was computed
+    assert cache.get_result("/v2/key", block_hash) == result
+    assert isinstance(cache.get_result("/v2/key", block_hash)["utxo"], tuple)
+
+    # requests made at another block don't read or write the cache
+    assert cache.get_result("/v2/key", "other_hash") is None
+    cache.set_result("/v2/other_key", result, [ADDR[0]], "other_hash")
+    assert cache.get_result("/v2/other_key", block_hash) is None
+
+
+def test_cache_long_list(api_cache, monkeypatch):
+    block_hash = api_cache["block_hash"]
+    monkeypatch.setattr(cache, "MAX_CACHED_LIST_SIZE", 2)
+    cache.set_result("/v2/short", [1, 2], [ADDR[0]], block_hash)
+    cache.set_result("/v2/long", [1, 2, 3], [ADDR[0]], block_hash)
+    assert cache.get_result("/v2/short", block_hash) == [1, 2]
+    assert cache.get_result("/v2/long", block_hash) is None
+
+
+def test_cache_entity_invalidation(server_db, api_cache, monkeypatch):
+    block_hash = api_cache["block_hash"]
+    cache.set_result("/v2/address0", 0, [ADDR[0]], block_hash)
+    cache.set_result("/v2/address2", 2, [ADDR[2]], block_hash)
+    cache.set_result("/v2/mempool", [], [cache.ANY_ENTITY], block_hash)
+
+    block = next_block(server_db)
+    monkeypatch.setattr(util, "CURRENT_BLOCK_INDEX", block["block_index"])
+    ledger.credit(server_db, ADDR[0], "XCP", 100, 0, action="test", event="test")
+    # computed before the invalidation, the result may be outdated
+    cache.invalidate(server_db, block)
+    cache.set_result("/v2/address1", 1, [ADDR[1]], block_hash)
+
+    new_block_hash = block["block_hash"]
+    assert cache.get_result("/v2/address0", new_block_hash) is None
+    assert cache.get_result("/v2/address2", new_block_hash) == 2
+    assert cache.get_result("/v2/mempool", new_block_hash) is None
+    assert cache.get_result("/v2/address1", new_block_hash) is None
+
+
+def test_cache_final_routes(server_db, api_cache):
+    block_index = api_cache["block_index"]
+    routes = api_server.ROUTES
+    block_route = "/v2/blocks/<int:block_index>/credits"
+    address_route = "/v2/addresses/<address>/credits"
+    tx_route = "/v2/transactions/<tx_hash>"
+
+    def get_tags(rule, **function_args):
+        return cache.get_entry_tags(server_db, rule, routes[rule], function_args, block_index)
+
+    assert get_tags(block_route, block_index=block_index) == []
+    assert get_tags(tx_route, tx_hash="hash") == []
+    # the next block is not parsed yet
+    assert get_tags(block_route, block_index=block_index + 1) == [cache.ANY_ENTITY]
+    assert get_tags("/v2/blocks", last=None, limit=10) == [cache.ANY_ENTITY]
+    assert get_tags(address_route, address=ADDR[0]) == [ADDR[0]]
+
+    # the final results are kept by the new blocks
+    cache.set_result("/v2/blocks/1/credits", 1, [], api_cache["block_hash"])
+    block = next_block(server_db)
+    cache.invalidate(server_db, block)
+    assert cache.get_result("/v2/blocks/1/credits", block["block_hash"]) == 1
+    # and removed with the whole cache
+    cache.invalidate(server_db, {"block_index": block["block_index"], "block_hash": "reorg_hash"})
+    assert cache.get_result("/v2/blocks/1/credits", "reorg_hash") is None
+
+
+def test_cache_reorg(server_db, api_cache):
+    cache.set_result("/v2/address2", 2, [ADDR[2]], api_cache["block_hash"])
+
+    # the last block is replaced
+    block = {"block_index": api_cache["block_index"], "block_hash": "reorg_hash"}
+    cache.invalidate(server_db, block)
+    assert cache.get_result("/v2/address2", "reorg_hash") is None
+
+    cache.set_result("/v2/address2", 2, [ADDR[2]], "reorg_hash")
+    assert cache.get_result("/v2/address2", "reorg_hash") == 2
+    # the cached block is no longer in the database
+    cache.invalidate(server_db, next_block(server_db))
+    assert cache.get_result("/v2/address2", "reorg_hash") is None
+
+
+def test_cache_errors(api_cache, monkeypatch):
+    block_hash = api_cache["block_hash"]
+    cache.set_result("/v2/key", 1, [ADDR[0]], block_hash)
+
+    def get_connection():
+        raise cache.apsw.IOError("disk I/O error")
+
+    warnings = []
+    monkeypatch.setattr(cache, "get_connection", get_connection)
+    monkeypatch.setattr(cache.logger, "warning", lambda message, *args: warnings.append(message))
+    # the requests read the database
+    assert cache.get_result("/v2/key", block_hash) is None
+    cache.set_result("/v2/key", 2, [ADDR[0]], block_hash)
+    assert warnings == ["Error reading the API cache: %s", "Error writing the API cache: %s"]
+
+
+def test_assets_info(server_db, monkeypatch):
+    monkeypatch.setattr(api_util, "ASSETS_INFO", collections.OrderedDict())
+    monkeypatch.setattr(api_util, "ASSETS_INFO_STATE", {})
+    monkeypatch.setattr(api_util, "ASSETS_INFO_MAX_SIZE", 2)
+    get_assets_last_issuance = ledger.get_assets_last_issuance
+    queried_assets = []
+
+    def get_assets_last_issuance_spy(db, asset_list):
+        queried_assets.append(asset_list)
+        return get_assets_last_issuance(db, asset_list)
+
+    monkeypatch.setattr(ledger, "get_assets_last_issuance", get_assets_last_issuance_spy)
+    last_block = ledger.get_last_block(server_db)
+    block_hash = last_block["block_hash"]
+    assets = ["DIVISIBLE", "NODIVISIBLE", "CALLABLE"]
+    expected = get_assets_last_issuance(server_db, assets)
+    expected = {asset: expected[asset] for asset in assets}
+
+    # not invalidated yet for the block of the request
+    assert api_util.get_assets_info(server_db, assets, block_hash) == expected
+    assert list(api_util.ASSETS_INFO) == []
+
+    api_util.invalidate_assets_info(server_db, last_block)
+    assert api_util.get_assets_info(server_db, assets, block_hash) == expected
+    # the least recently used asset is dropped
+    assert list(api_util.ASSETS_INFO) == ["NODIVISIBLE", "CALLABLE"]
+    queried_assets.clear()
+    assert api_util.get_assets_info(server_db, ["CALLABLE", "NOTANASSET"], block_hash) == {
+        "CALLABLE": expected["CALLABLE"]
+    }
+    # the assets without issuance are cached too
+    assert queried_assets == [["NOTANASSET"]]
+    assert list(api_util.ASSETS_INFO) == ["CALLABLE", "NOTANASSET"]
+
+    # a new block transfers an asset
+    block = next_block(server_db)
+    ledger.add_to_journal(
+        server_db,
+        block["block_index"],
+        "insert",
+        "issuances",
+        "ASSET_TRANSFER",
+        {"asset": "CALLABLE"},
+    )
+    api_util.invalidate_assets_info(server_db, block)
+    assert list(api_util.ASSETS_INFO) == ["NOTANASSET"]
+    queried_assets.clear()
+    assert api_util.get_assets_info(server_db, ["CALLABLE"], block["block_hash"]) == {
+        "CALLABLE": expected["CALLABLE"]
+    }
+    assert queried_assets == [["CALLABLE"]]
+
+    # a reorg clears the cache
+    api_util.invalidate_assets_info(
+        server_db, {"block_index": block["block_index"], "block_hash": "reorg_hash"}
+    )
+    assert list(api_util.ASSETS_INFO) == []
+
+
+def test_assets_info_reset(server_db, monkeypatch):
+    monkeypatch.setattr(api_util, "ASSETS_INFO", collections.OrderedDict())
+    monkeypatch.setattr(api_util, "ASSETS_INFO_STATE", {})
+    last_block = ledger.get_last_block(server_db)
+    api_util.invalidate_assets_info(server_db, last_block)
+    assets_info = api_util.get_assets_info(server_db, ["DIVISIBLE"], last_block["block_hash"])
+    assert assets_info["DIVISIBLE"]["divisible"]
+
+    # a new block resets the asset as not divisible
+    block = next_block(server_db)
+    monkeypatch.setattr(util, "CURRENT_BLOCK_INDEX", block["block_index"])
+    issuance = ledger.get_issuances(server_db, asset="DIVISIBLE", status="valid", last=True)[0]
+    issuance.update(
+        {
+            "tx_index": blocks.get_next_tx_index(server_db),
+            "tx_hash": util.dhash_string("cache_test_reset"),
+            "block_index": block["block_index"],
+            "divisible": False,
+            "description": "Reset asset",
+            "reset": True,
+        }
+    )
+    ledger.insert_record(server_db, "issuances", issuance, "RESET_ISSUANCE")
+    api_util.invalidate_assets_info(server_db, block)
+
+    assets_info = api_util.get_assets_info(server_db, ["DIVISIBLE"], block["block_hash"])
+    assert not assets_info["DIVISIBLE"]["divisible"]
+    assert assets_info["DIVISIBLE"]["description"] == "Reset asset"
@@ -273,6 +273,7 @@ def api_server_v2(request, cp_server):
         "api_user": "rpc",
         "api_password": None,
         "api_no_allow_cors": False,
+        "api_workers": config.DEFAULT_API_WORKERS,
         "force": False,
         "requests_timeout": config.DEFAULT_REQUESTS_TIMEOUT,
         "rpc_batch_size": config.DEFAULT_RPC_BATCH_SIZE,
@@ -0,0 +1,28 @@
+from counterpartycore.lib import check, config, util
+
+# this is require near the top to do setup of the test suite
+from counterpartycore.test import (
+    conftest,  # noqa: F401
+)
+
+
+def test_consensus_hash_stream(monkeypatch):
+    monkeypatch.setattr(config, "TESTNET", False, raising=False)
+    monkeypatch.setattr(config, "REGTEST", False, raising=False)
+
+    previous_consensus_hash = util.dhash_string(check.CONSENSUS_HASH_SEED)
+    content = [
+        "310000mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zcXCP93000000000",
+        'insertcredits{"action":"burn","asset":"XCP","quantity":93000000000}',
+        "",
+        "unicode: é€",
+    ]
+
+    consensus_hash = check.ConsensusHash("ledger_hash", previous_consensus_hash, None)
+    for item in content:
+        consensus_hash.append(item)
+
+    expected_hash = util.dhash_string(
+        previous_consensus_hash + f"{check.CONSENSUS_HASH_VERSION_MAINNET}{''.join(content)}"
+    )
+    assert consensus_hash.hexdigest() == expected_hash
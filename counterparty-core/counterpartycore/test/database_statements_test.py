@@ -0,0 +1,47 @@
+import apsw
+import pytest
+
+from counterpartycore.lib import config, database, exceptions
+
+# this is require near the top to do setup of the test suite
+from counterpartycore.test import (
+    conftest,  # noqa: F401
+)
+
+
+def test_statement_cursors():
+    db = apsw.Connection(":memory:")
+    db.setrowtrace(database.rowtracer)
+    db.execute("CREATE TABLE assets (asset_id TEXT, asset_name TEXT)")
+    db.execute("INSERT INTO assets VALUES ('1', 'XCP'), ('2', 'PEPE')")
+
+    query = "SELECT * FROM assets WHERE asset_name = ?"
+    assert database.fetchall(db, query, ("XCP",)) == [{"asset_id": "1", "asset_name": "XCP"}]
+    assert database.fetchone(db, query, ("PEPE",)) == {"asset_id": "2", "asset_name": "PEPE"}
+    assert database.fetchone(db, query, ("FOO",)) is None
+    assert len(database.STATEMENTS[db]) == 1
+
+    assert database.get_table_columns(db, "assets") == ["asset_id", "asset_name"]
+    db.execute("ALTER TABLE assets ADD COLUMN divisible BOOL")
+    database.reset_statements(db)
+    assert db not in database.STATEMENTS
+    assert database.get_table_columns(db, "assets") == ["asset_id", "asset_name", "divisible"]
+    db.close()
+
+
+def test_connection_pool(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "DATABASE", str(tmp_path / "pool.db"))
+    apsw.Connection(config.DATABASE).execute("CREATE TABLE assets (asset_id TEXT)")
+
+    pool = database.ConnectionPool(2)
+    db1, db2 = pool.get(), pool.get()
+    with pytest.raises(exceptions.DatabaseError, match="No database connection available."):
+        pool.get(timeout=0.01)
+    pool.release(db1)
+    assert pool.get() is db1
+    assert pool.opened == 2
+
+    pool.release(db1)
+    pool.release(db2)
+    pool.close()
+    assert pool.opened == 0
@@ -0,0 +1,93 @@
+import json
+import tempfile
+
+from counterpartycore.lib import ledger
+from counterpartycore.lib.api import event_stream
+
+# this is require near the top to do setup of the test suite
+from counterpartycore.test import (
+    conftest,  # noqa: F401
+)
+from counterpartycore.test.util_test import CURR_DIR
+
+FIXTURE_SQL_FILE = CURR_DIR + "/fixtures/scenarios/unittest_fixture.sql"
+FIXTURE_DB = tempfile.gettempdir() + "/fixtures.unittest_fixture.db"
+
+
+class Pool:
+    def __init__(self, db):
+        self.db = db
+
+    def get(self):
+        return self.db
+
+    def release(self, db):
+        pass
+
+
+def add_block(db, block_hash, event):
+    """Add a block with one event after the last block."""
+    block_index = ledger.get_last_block(db)["block_index"] + 1
+    event_index = ledger.get_events(db, limit=1)[0]["event_index"] + 1
+    cursor = db.cursor()
+    cursor.execute(
+        "INSERT INTO blocks (block_index, block_hash, block_time) VALUES (?, ?, ?)",
+        (block_index, block_hash, block_index),
+    )
+    cursor.execute(
+        """INSERT INTO messages (message_index, block_index, command, category, bindings, timestamp, event)
+        VALUES (?, ?, ?, ?, ?, ?, ?)""",
+        (event_index, block_index, "insert", "test", json.dumps({}), 0, event),
+    )
+    return event_index
+
+
+def remove_last_block(db):
+    block_index = ledger.get_last_block(db)["block_index"]
+    cursor = db.cursor()
+    cursor.execute("DELETE FROM messages WHERE block_index >= ?", (block_index,))
+    cursor.execute("DELETE FROM blocks WHERE block_index >= ?", (block_index,))
+
+
+def test_stream_reorg(server_db, monkeypatch):
+    monkeypatch.setattr(event_stream, "KEEPALIVE_INTERVAL", 0.01)
+    broadcaster = event_stream.EventBroadcaster(Pool(server_db))
+
+    stream = event_stream.stream_events(broadcaster)
+    # subscribers wait for the broadcaster to start
+    assert next(stream) == ": keepalive\n\n"
+    broadcaster.read_new_events(server_db)
+    first_event_index = broadcaster.last_event_index
+    assert next(stream) == ": keepalive\n\n"
+
+    event_index = add_block(server_db, "block_a", "EVENT_A")
+    broadcaster.read_new_events(server_db)
+    assert next(stream).startswith(f"id: {event_index}\nevent: EVENT_A\n")
+
+    # the new block has an event with the same index
+    remove_last_block(server_db)
+    assert add_block(server_db, "block_b", "EVENT_B") == event_index
+    broadcaster.read_new_events(server_db)
+    assert broadcaster.rollbacks == 1
+    assert next(stream) == f'event: reorg\ndata: {{"event_index": {first_event_index}}}\n\n'
+    assert next(stream).startswith(f"id: {event_index}\nevent: EVENT_B\n")
+
+    # nothing changed
+    broadcaster.read_new_events(server_db)
+    assert broadcaster.rollbacks == 1
+    assert next(stream) == ": keepalive\n\n"
+
+
+def test_stream_reorg_same_block_hash(server_db):
+    broadcaster = event_stream.EventBroadcaster(Pool(server_db))
+    broadcaster.read_new_events(server_db)
+    first_event_index = broadcaster.last_event_index
+    add_block(server_db, "block_a", "EVENT_A")
+    broadcaster.read_new_events(server_db)
+
+    # the last event sent is no longer in the database
+    server_db.cursor().execute("DELETE FROM messages WHERE message_index > ?", (first_event_index,))
+    broadcaster.read_new_events(server_db)
+    assert broadcaster.rollbacks == 1
+    assert broadcaster.get_rollback(0) == (1, first_event_index)
+    assert broadcaster.last_event_index == first_event_index
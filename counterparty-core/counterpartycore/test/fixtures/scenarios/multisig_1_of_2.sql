@@ -463,361 +463,362 @@ BEGIN TRANSACTION;
 DROP TABLE IF EXISTS messages;
 CREATE TABLE messages(
                       message_index INTEGER PRIMARY KEY,
+                      mensaje_index INTEGER,
                       block_index INTEGER,
                       command TEXT,
                       category TEXT,
                       bindings TEXT,
                       timestamp INTEGER,
                       event TEXT);
-INSERT INTO messages VALUES(0,0,'insert','blocks','{"block_hash":"8b3bef249cb3b0fa23a4936c1249b6bd41daeadc848c8d2e409ea1cbc10adfe7","block_index":309999,"block_time":309999000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1,309999,'parse','blocks','{"block_index":309999,"ledger_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","messages_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","txlist_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(2,309999,'insert','blocks','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(3,310000,'insert','transactions','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"btc_amount":62000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"9b6b1abb696d8d1b70c5beed046d7cddd23cd95b69ef18946cb18c5b56cfde30","tx_index":1}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(4,310000,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310000,"calling_function":"burn","event":"9b6b1abb696d8d1b70c5beed046d7cddd23cd95b69ef18946cb18c5b56cfde30","quantity":93000000000,"tx_index":1}',0,'CREDIT');
-INSERT INTO messages VALUES(5,310000,'insert','burns','{"block_index":310000,"burned":62000000,"earned":93000000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"9b6b1abb696d8d1b70c5beed046d7cddd23cd95b69ef18946cb18c5b56cfde30","tx_index":1}',0,'BURN');
-INSERT INTO messages VALUES(6,310000,'parse','blocks','{"block_index":310000,"ledger_hash":"98ccdf7cd2fb29a8a01cbed5f133b70b6966c6c56354dad00baacedd0673c87e","messages_hash":"b364e4b262b19375281c08af25e2ce24e68e5ec3fb881f680c318fc258e9b02b","txlist_hash":"faf6476a908c85f6e26ca5d182688d6da3f326296602d5ad3aa5979cb8bc110b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(7,310000,'insert','blocks','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(8,310001,'insert','transactions','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"btc_amount":1000,"data":"0000000000000000000000010000000002faf080","destination":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"58e839ec2b1584d3474014093393ce57e5c22d6e686213ee4a7a0abe7bbac33c","tx_index":2}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(9,310001,'insert','debits','{"action":"send","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310001,"event":"58e839ec2b1584d3474014093393ce57e5c22d6e686213ee4a7a0abe7bbac33c","quantity":50000000,"tx_index":2}',0,'DEBIT');
-INSERT INTO messages VALUES(10,310001,'insert','credits','{"address":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310001,"calling_function":"send","event":"58e839ec2b1584d3474014093393ce57e5c22d6e686213ee4a7a0abe7bbac33c","quantity":50000000,"tx_index":2}',0,'CREDIT');
-INSERT INTO messages VALUES(11,310001,'insert','sends','{"asset":"XCP","block_index":310001,"destination":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","quantity":50000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"58e839ec2b1584d3474014093393ce57e5c22d6e686213ee4a7a0abe7bbac33c","tx_index":2}',0,'SEND');
-INSERT INTO messages VALUES(12,310001,'parse','transactions','{"supported":true,"tx_hash":"58e839ec2b1584d3474014093393ce57e5c22d6e686213ee4a7a0abe7bbac33c","tx_index":2}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(13,310001,'parse','blocks','{"block_index":310001,"ledger_hash":"fd43dc5efe2ee796ef7d24f8d478a67aa58bf85f538ef4b9a49b983a315deb26","messages_hash":"508f3f345fea51bf28a58de66ce187d1de1f66b1aaf1f2752e6bdbb459d253ac","txlist_hash":"544f7958bf7661b78699c708ba1097da0dbb044acee3d1d8aa9a32d6b659a14d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(14,310001,'insert','blocks','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(15,310002,'insert','transactions','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"btc_amount":0,"data":"0000000a00000000000000000000000002faf08000000000000000010000000005f5e100000a0000000000000000","destination":"","fee":1000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"332b030da57b9565324df01414778b1eafbee6c52343fea80774ee1725484367","tx_index":3}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(16,310002,'insert','orders','{"block_index":310002,"expiration":10,"expire_index":310012,"fee_provided":1000000,"fee_provided_remaining":1000000,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":100000000,"get_remaining":100000000,"give_asset":"BTC","give_quantity":50000000,"give_remaining":50000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","tx_hash":"332b030da57b9565324df01414778b1eafbee6c52343fea80774ee1725484367","tx_index":3}',0,'OPEN_ORDER');
-INSERT INTO messages VALUES(17,310002,'parse','transactions','{"supported":true,"tx_hash":"332b030da57b9565324df01414778b1eafbee6c52343fea80774ee1725484367","tx_index":3}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(18,310002,'parse','blocks','{"block_index":310002,"ledger_hash":"dbae4fff32545b4f3c104fb5a051dcaeacecd27401c84c09f93923b8bc30eab5","messages_hash":"433747661a40185a36239da6ba39d8d3fe35bfb8080a674d6d46e74f7c71fe9a","txlist_hash":"ee37e75a4eba165ed448b7cf96d188d7f738aca4d90a781c7f473974e12564d5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(19,310002,'insert','blocks','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(20,310003,'insert','transactions','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"btc_amount":0,"data":"0000000a00000000000000010000000006422c4000000000000000000000000002faf080000a00000000000dbba0","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f","tx_index":4}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(21,310003,'insert','debits','{"action":"open order","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310003,"event":"f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f","quantity":105000000,"tx_index":4}',0,'DEBIT');
-INSERT INTO messages VALUES(22,310003,'insert','orders','{"block_index":310003,"expiration":10,"expire_index":310013,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":900000,"fee_required_remaining":900000,"get_asset":"BTC","get_quantity":50000000,"get_remaining":50000000,"give_asset":"XCP","give_quantity":105000000,"give_remaining":105000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","tx_hash":"f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f","tx_index":4}',0,'OPEN_ORDER');
-INSERT INTO messages VALUES(23,310003,'update','orders','{"fee_provided_remaining":142858,"fee_required_remaining":0,"get_remaining":0,"give_remaining":0,"status":"open","tx_hash":"332b030da57b9565324df01414778b1eafbee6c52343fea80774ee1725484367"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(24,310003,'update','orders','{"fee_provided_remaining":6800,"fee_required_remaining":42858,"get_remaining":0,"give_remaining":5000000,"status":"open","tx_hash":"f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(25,310003,'insert','order_matches','{"backward_asset":"XCP","backward_quantity":100000000,"block_index":310003,"fee_paid":857142,"forward_asset":"BTC","forward_quantity":50000000,"id":"332b030da57b9565324df01414778b1eafbee6c52343fea80774ee1725484367_f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f","match_expire_index":310023,"status":"pending","tx0_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx0_block_index":310002,"tx0_expiration":10,"tx0_hash":"332b030da57b9565324df01414778b1eafbee6c52343fea80774ee1725484367","tx0_index":3,"tx1_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx1_block_index":310003,"tx1_expiration":10,"tx1_hash":"f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f","tx1_index":4}',0,'ORDER_MATCH');
-INSERT INTO messages VALUES(26,310003,'parse','transactions','{"supported":true,"tx_hash":"f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f","tx_index":4}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(27,310003,'parse','blocks','{"block_index":310003,"ledger_hash":"fd0ae9793d9513540246b94ad116fc0531e8e07b2c014752e175a12e2a7a82d4","messages_hash":"01a5158be117031c2249b66ea64def6a7fa907cc99484335d67fadf9b747f3e2","txlist_hash":"107902b17490957ebc0d2cb5dba1f5e667e3a393acfd8b3adde9f6b17aaad5c4"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(28,310003,'insert','blocks','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(29,310004,'insert','transactions','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"btc_amount":50000000,"data":"0000000b332b030da57b9565324df01414778b1eafbee6c52343fea80774ee1725484367f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":9675,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"ed17dc38233838e15d319a1786825b9e7cdba815554c9d6f4dd527615bce10b8","tx_index":5}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(30,310004,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310004,"calling_function":"btcpay","event":"ed17dc38233838e15d319a1786825b9e7cdba815554c9d6f4dd527615bce10b8","quantity":100000000,"tx_index":5}',0,'CREDIT');
-INSERT INTO messages VALUES(31,310004,'update','order_matches','{"id":"332b030da57b9565324df01414778b1eafbee6c52343fea80774ee1725484367_f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f","order_match_id":"332b030da57b9565324df01414778b1eafbee6c52343fea80774ee1725484367_f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f","status":"completed"}',0,'ORDER_MATCH_UPDATE');
-INSERT INTO messages VALUES(32,310004,'insert','btcpays','{"block_index":310004,"btc_amount":50000000,"destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","order_match_id":"332b030da57b9565324df01414778b1eafbee6c52343fea80774ee1725484367_f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f","source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"ed17dc38233838e15d319a1786825b9e7cdba815554c9d6f4dd527615bce10b8","tx_index":5}',0,'BTC_PAY');
-INSERT INTO messages VALUES(33,310004,'parse','transactions','{"supported":true,"tx_hash":"ed17dc38233838e15d319a1786825b9e7cdba815554c9d6f4dd527615bce10b8","tx_index":5}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(34,310004,'parse','blocks','{"block_index":310004,"ledger_hash":"bd894777a85b731155a0d6362766b4220c03db4f3e5fbf030d6c2529cb5f3537","messages_hash":"ffab6b5c0592a131d2ee25f07a31b86d9a35a48ca313bcf129ddeddb84b6b04c","txlist_hash":"65e6a7c64c8439a60fb066d96d5165e6e40974bd1b98812ac6a4172fb1db1511"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(35,310004,'insert','blocks','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(36,310005,'insert','transactions','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"btc_amount":0,"data":"000000140000000000004767000000003b9aca000100000000000000000000","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"cd2b44cb56dd5aaae1181c42ab8953ebb9d0fb8e177e960ffe55e3500b3aae25","tx_index":6}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(37,310005,'insert','debits','{"action":"issuance fee","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310005,"event":"cd2b44cb56dd5aaae1181c42ab8953ebb9d0fb8e177e960ffe55e3500b3aae25","quantity":50000000,"tx_index":6}',0,'DEBIT');
-INSERT INTO messages VALUES(38,310005,'insert','assets','{"asset_id":"18279","asset_longname":null,"asset_name":"BBBB","block_index":310005}',0,'ASSET_CREATION');
-INSERT INTO messages VALUES(39,310005,'insert','issuances','{"asset":"BBBB","asset_longname":null,"block_index":310005,"call_date":0,"call_price":0.0,"callable":false,"description":"","divisible":true,"fee_paid":50000000,"issuer":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","locked":false,"quantity":1000000000,"reset":false,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","transfer":false,"tx_hash":"cd2b44cb56dd5aaae1181c42ab8953ebb9d0fb8e177e960ffe55e3500b3aae25","tx_index":6}',0,'ASSET_ISSUANCE');
-INSERT INTO messages VALUES(40,310005,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBB","block_index":310005,"calling_function":"issuance","event":"cd2b44cb56dd5aaae1181c42ab8953ebb9d0fb8e177e960ffe55e3500b3aae25","quantity":1000000000,"tx_index":6}',0,'CREDIT');
-INSERT INTO messages VALUES(41,310005,'parse','transactions','{"supported":true,"tx_hash":"cd2b44cb56dd5aaae1181c42ab8953ebb9d0fb8e177e960ffe55e3500b3aae25","tx_index":6}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(42,310005,'parse','blocks','{"block_index":310005,"ledger_hash":"264c98f1d460f78e52def545d25482fd76549a5309d04841bc27b335f06470a2","messages_hash":"92d9412fe93d5ea10d281e838ab44f67f61078ca1df6e621b48d9e50a01e18e7","txlist_hash":"9ede5548f7cb273af825360a6285fe9a51e9625c9084b2dde7bec013dec24f0e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(43,310005,'insert','blocks','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(44,310006,'insert','transactions','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"btc_amount":0,"data":"00000014000000000000476800000000000186a00000000000000000000006666f6f626172","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"ddefdf227fd8cd8df1e77f0b531e98a033d2e5b237fa4331b83c003de54877d9","tx_index":7}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(45,310006,'insert','debits','{"action":"issuance fee","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310006,"event":"ddefdf227fd8cd8df1e77f0b531e98a033d2e5b237fa4331b83c003de54877d9","quantity":50000000,"tx_index":7}',0,'DEBIT');
-INSERT INTO messages VALUES(46,310006,'insert','assets','{"asset_id":"18280","asset_longname":null,"asset_name":"BBBC","block_index":310006}',0,'ASSET_CREATION');
-INSERT INTO messages VALUES(47,310006,'insert','issuances','{"asset":"BBBC","asset_longname":null,"block_index":310006,"call_date":0,"call_price":0.0,"callable":false,"description":"foobar","divisible":false,"fee_paid":50000000,"issuer":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","locked":false,"quantity":100000,"reset":false,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","transfer":false,"tx_hash":"ddefdf227fd8cd8df1e77f0b531e98a033d2e5b237fa4331b83c003de54877d9","tx_index":7}',0,'ASSET_ISSUANCE');
-INSERT INTO messages VALUES(48,310006,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBC","block_index":310006,"calling_function":"issuance","event":"ddefdf227fd8cd8df1e77f0b531e98a033d2e5b237fa4331b83c003de54877d9","quantity":100000,"tx_index":7}',0,'CREDIT');
-INSERT INTO messages VALUES(49,310006,'parse','transactions','{"supported":true,"tx_hash":"ddefdf227fd8cd8df1e77f0b531e98a033d2e5b237fa4331b83c003de54877d9","tx_index":7}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(50,310006,'parse','blocks','{"block_index":310006,"ledger_hash":"a1f2aa5a0b8d030c2fc4e1243c3173319ecf68d232262ea3dc8bfdd03a3f923a","messages_hash":"5259477ce9e5a469ba99387b432342722700d86f80912613aa648460421d5261","txlist_hash":"afa257be6b0f57581b8f1b932b3c8473ff5c89e4bd6c3d3e3dd6a8c3cd9b09d3"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(51,310006,'insert','blocks','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(52,310007,'insert','transactions','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"btc_amount":1000,"data":"00000000000000000000476700000000003d0900","destination":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"f337451a19eac3c2fe66daf7d44d39c41a012d2dfd85de90cc3877bbc2e7d30c","tx_index":8}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(53,310007,'insert','debits','{"action":"send","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBB","block_index":310007,"event":"f337451a19eac3c2fe66daf7d44d39c41a012d2dfd85de90cc3877bbc2e7d30c","quantity":4000000,"tx_index":8}',0,'DEBIT');
-INSERT INTO messages VALUES(54,310007,'insert','credits','{"address":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBB","block_index":310007,"calling_function":"send","event":"f337451a19eac3c2fe66daf7d44d39c41a012d2dfd85de90cc3877bbc2e7d30c","quantity":4000000,"tx_index":8}',0,'CREDIT');
-INSERT INTO messages VALUES(55,310007,'insert','sends','{"asset":"BBBB","block_index":310007,"destination":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","quantity":4000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"f337451a19eac3c2fe66daf7d44d39c41a012d2dfd85de90cc3877bbc2e7d30c","tx_index":8}',0,'SEND');
-INSERT INTO messages VALUES(56,310007,'parse','transactions','{"supported":true,"tx_hash":"f337451a19eac3c2fe66daf7d44d39c41a012d2dfd85de90cc3877bbc2e7d30c","tx_index":8}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(57,310007,'parse','blocks','{"block_index":310007,"ledger_hash":"8709aa2d5064ea2b7ab51a887d21f5fddcb7046753cd883317b533ed121f8504","messages_hash":"0b9ffff66cfe4698c16889013800547e79cdad7d3f84eff57e14828a3dbe8a52","txlist_hash":"40941bb90c086bd2716de8afc1fba5eb75721143a86a606ef99ee3312de95614"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(58,310007,'insert','blocks','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(59,310008,'insert','transactions','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"btc_amount":1000,"data":"000000000000000000004768000000000000020e","destination":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"c639e9482b31b487115b4437dd87cff98338003fabf18066bf051e1164aa4394","tx_index":9}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(60,310008,'insert','debits','{"action":"send","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBC","block_index":310008,"event":"c639e9482b31b487115b4437dd87cff98338003fabf18066bf051e1164aa4394","quantity":526,"tx_index":9}',0,'DEBIT');
-INSERT INTO messages VALUES(61,310008,'insert','credits','{"address":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBC","block_index":310008,"calling_function":"send","event":"c639e9482b31b487115b4437dd87cff98338003fabf18066bf051e1164aa4394","quantity":526,"tx_index":9}',0,'CREDIT');
-INSERT INTO messages VALUES(62,310008,'insert','sends','{"asset":"BBBC","block_index":310008,"destination":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","quantity":526,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"c639e9482b31b487115b4437dd87cff98338003fabf18066bf051e1164aa4394","tx_index":9}',0,'SEND');
-INSERT INTO messages VALUES(63,310008,'parse','transactions','{"supported":true,"tx_hash":"c639e9482b31b487115b4437dd87cff98338003fabf18066bf051e1164aa4394","tx_index":9}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(64,310008,'parse','blocks','{"block_index":310008,"ledger_hash":"c1c516176fe38b69b31e3668b5ef20805bd90d3112c77f5652f838af8e7f604a","messages_hash":"7fdd558da169a125a365a206d1606ef1594ce7dc3c8102d9de55a0a08f8036a8","txlist_hash":"9b186632fe722ba57daaa01573568c3d3405f7fcb0a729005a6338266a4debfa"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(65,310008,'insert','blocks','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(66,310009,'insert','transactions','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"btc_amount":0,"data":"00000032000000000000025800000000000047670000000000000001","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"7881c1fe7881a590d09302dde67cfd888a74154888e0c310bd01575f560b8ac8","tx_index":10}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(67,310009,'insert','debits','{"action":"dividend","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310009,"event":"7881c1fe7881a590d09302dde67cfd888a74154888e0c310bd01575f560b8ac8","quantity":24,"tx_index":10}',0,'DEBIT');
-INSERT INTO messages VALUES(68,310009,'insert','debits','{"action":"dividend fee","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310009,"event":"7881c1fe7881a590d09302dde67cfd888a74154888e0c310bd01575f560b8ac8","quantity":20000,"tx_index":10}',0,'DEBIT');
-INSERT INTO messages VALUES(69,310009,'insert','credits','{"address":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310009,"calling_function":"dividend","event":"7881c1fe7881a590d09302dde67cfd888a74154888e0c310bd01575f560b8ac8","quantity":24,"tx_index":10}',0,'CREDIT');
-INSERT INTO messages VALUES(70,310009,'insert','dividends','{"asset":"BBBB","block_index":310009,"dividend_asset":"XCP","fee_paid":20000,"quantity_per_unit":600,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"7881c1fe7881a590d09302dde67cfd888a74154888e0c310bd01575f560b8ac8","tx_index":10}',0,'ASSET_DIVIDEND');
-INSERT INTO messages VALUES(71,310009,'parse','transactions','{"supported":true,"tx_hash":"7881c1fe7881a590d09302dde67cfd888a74154888e0c310bd01575f560b8ac8","tx_index":10}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(72,310009,'parse','blocks','{"block_index":310009,"ledger_hash":"ae8ee9e681f0ac96de96babc1c80e5188b3e0cb91074a0dfd8511ee7d0ae64c8","messages_hash":"262ab7169bddff900a7be3663dc902396e4e58f34c0112f1293a2b2040856f03","txlist_hash":"39f4f154cbeae9a65b43ac831b2d5ad0e6f6575b909b979bd4bd97dadbab4cdd"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(73,310009,'insert','blocks','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(74,310010,'insert','transactions','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"btc_amount":0,"data":"00000032000000000000032000000000000047680000000000000001","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"c41898ad625e2236110101070c09e9f28b6fea1ed436ecb78f231f3f99f123f7","tx_index":11}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(75,310010,'insert','debits','{"action":"dividend","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310010,"event":"c41898ad625e2236110101070c09e9f28b6fea1ed436ecb78f231f3f99f123f7","quantity":420800,"tx_index":11}',0,'DEBIT');
-INSERT INTO messages VALUES(76,310010,'insert','debits','{"action":"dividend fee","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310010,"event":"c41898ad625e2236110101070c09e9f28b6fea1ed436ecb78f231f3f99f123f7","quantity":20000,"tx_index":11}',0,'DEBIT');
-INSERT INTO messages VALUES(77,310010,'insert','credits','{"address":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310010,"calling_function":"dividend","event":"c41898ad625e2236110101070c09e9f28b6fea1ed436ecb78f231f3f99f123f7","quantity":420800,"tx_index":11}',0,'CREDIT');
-INSERT INTO messages VALUES(78,310010,'insert','dividends','{"asset":"BBBC","block_index":310010,"dividend_asset":"XCP","fee_paid":20000,"quantity_per_unit":800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"c41898ad625e2236110101070c09e9f28b6fea1ed436ecb78f231f3f99f123f7","tx_index":11}',0,'ASSET_DIVIDEND');
-INSERT INTO messages VALUES(79,310010,'parse','transactions','{"supported":true,"tx_hash":"c41898ad625e2236110101070c09e9f28b6fea1ed436ecb78f231f3f99f123f7","tx_index":11}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(80,310010,'parse','blocks','{"block_index":310010,"ledger_hash":"0451ffa5d7ffb0e588e58ac7eacf77f6b3e17f1d27c1039f03d7716b16fb234f","messages_hash":"a363f1f103b4d39b9056e391559737a36c56439c6b3a12854f306dca0e1ed067","txlist_hash":"0cea2e2e06c6423d1c5ba19f6128fbe8fe6d6c3688316c9c35dd31cf03d38c97"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(81,310010,'insert','blocks','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(82,310011,'insert','transactions','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"btc_amount":0,"data":"0000001e52bb3300405900000000000005f5e0ff09556e69742054657374","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"a21533ad03334823cca2aa8e57c383113a7f93a5810c5df8dd2fa70f6eec416d","tx_index":12}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(83,310011,'insert','broadcasts','{"block_index":310011,"fee_fraction_int":99999999,"locked":false,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","text":"Unit Test","timestamp":1388000000,"tx_hash":"a21533ad03334823cca2aa8e57c383113a7f93a5810c5df8dd2fa70f6eec416d","tx_index":12,"value":100.0}',0,'BROADCAST');
-INSERT INTO messages VALUES(84,310011,'parse','transactions','{"supported":true,"tx_hash":"a21533ad03334823cca2aa8e57c383113a7f93a5810c5df8dd2fa70f6eec416d","tx_index":12}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(85,310011,'parse','blocks','{"block_index":310011,"ledger_hash":"dfaae3f28c2f75e4bcc49034ff2a191b5a41b88035c5d266181617c8c65ad5d3","messages_hash":"c6c72bb6b85bbf0d1fa5e18500990cdf69c7b7b1d315d8639f6c6afabcd31a26","txlist_hash":"0134329cfdaf63e5946b9b5a94b73f59b9a870d4569ca07c0cce078bf13714a5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(86,310011,'insert','blocks','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(87,310012,'insert','transactions','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"btc_amount":1000,"data":"00000028000052bb33640000000002faf08000000000017d7840000000000000000000003b100000000a","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"74062934f0a97c41851735fef2a7df4d9ad9945424f09a54281e145a5e32492f","tx_index":13}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(88,310012,'insert','debits','{"action":"bet","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310012,"event":"74062934f0a97c41851735fef2a7df4d9ad9945424f09a54281e145a5e32492f","quantity":50000000,"tx_index":13}',0,'DEBIT');
-INSERT INTO messages VALUES(89,310012,'insert','bets','{"bet_type":0,"block_index":310012,"counterwager_quantity":25000000,"counterwager_remaining":25000000,"deadline":1388000100,"expiration":10,"expire_index":310022,"fee_fraction_int":99999999.0,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","leverage":15120,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","target_value":0.0,"tx_hash":"74062934f0a97c41851735fef2a7df4d9ad9945424f09a54281e145a5e32492f","tx_index":13,"wager_quantity":50000000,"wager_remaining":50000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(90,310012,'parse','transactions','{"supported":true,"tx_hash":"74062934f0a97c41851735fef2a7df4d9ad9945424f09a54281e145a5e32492f","tx_index":13}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(91,310012,'parse','blocks','{"block_index":310012,"ledger_hash":"c711e8cf2d9bbed01724a7b22cbd4900a4fd0a126bb7ecbd7c97ca15a6276553","messages_hash":"7e2be8d32d548626652064d9d37f0942b4a78667630e49c3e8e739d10478fb75","txlist_hash":"9a3fb4fb846c9ffff3a50a0a31f3ac3900ba7048a60dd69c6e14752734358f1c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(92,310012,'insert','blocks','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(93,310013,'insert','transactions','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"btc_amount":1000,"data":"00000028000152bb336400000000017d78400000000002793d60000000000000000000003b100000000a","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"6a5f30666a5f24b6e0e6f31cf06b22ee74d3e692a550297450bdf1d36b1cc167","tx_index":14}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(94,310013,'update','orders','{"status":"expired","tx_hash":"332b030da57b9565324df01414778b1eafbee6c52343fea80774ee1725484367"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(95,310013,'insert','order_expirations','{"block_index":310013,"order_hash":"332b030da57b9565324df01414778b1eafbee6c52343fea80774ee1725484367","source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2"}',0,'ORDER_EXPIRATION');
-INSERT INTO messages VALUES(96,310013,'insert','debits','{"action":"bet","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310013,"event":"6a5f30666a5f24b6e0e6f31cf06b22ee74d3e692a550297450bdf1d36b1cc167","quantity":25000000,"tx_index":14}',0,'DEBIT');
-INSERT INTO messages VALUES(97,310013,'insert','bets','{"bet_type":1,"block_index":310013,"counterwager_quantity":41500000,"counterwager_remaining":41500000,"deadline":1388000100,"expiration":10,"expire_index":310023,"fee_fraction_int":99999999.0,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","leverage":15120,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","target_value":0.0,"tx_hash":"6a5f30666a5f24b6e0e6f31cf06b22ee74d3e692a550297450bdf1d36b1cc167","tx_index":14,"wager_quantity":25000000,"wager_remaining":25000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(98,310013,'update','bets','{"counterwager_remaining":4250000,"status":"open","tx_hash":"74062934f0a97c41851735fef2a7df4d9ad9945424f09a54281e145a5e32492f","wager_remaining":8500000}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(99,310013,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310013,"calling_function":"filled","event":"6a5f30666a5f24b6e0e6f31cf06b22ee74d3e692a550297450bdf1d36b1cc167","quantity":4250000,"tx_index":14}',0,'CREDIT');
-INSERT INTO messages VALUES(100,310013,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"6a5f30666a5f24b6e0e6f31cf06b22ee74d3e692a550297450bdf1d36b1cc167","wager_remaining":4250000}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(101,310013,'insert','bet_matches','{"backward_quantity":20750000,"block_index":310012,"deadline":1388000100,"fee_fraction_int":99999999,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","forward_quantity":41500000,"id":"74062934f0a97c41851735fef2a7df4d9ad9945424f09a54281e145a5e32492f_6a5f30666a5f24b6e0e6f31cf06b22ee74d3e692a550297450bdf1d36b1cc167","initial_value":100.0,"leverage":15120,"match_expire_index":310022,"status":"pending","target_value":0.0,"tx0_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx0_bet_type":0,"tx0_block_index":310012,"tx0_expiration":10,"tx0_hash":"74062934f0a97c41851735fef2a7df4d9ad9945424f09a54281e145a5e32492f","tx0_index":13,"tx1_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx1_bet_type":1,"tx1_block_index":310013,"tx1_expiration":10,"tx1_hash":"6a5f30666a5f24b6e0e6f31cf06b22ee74d3e692a550297450bdf1d36b1cc167","tx1_index":14}',0,'BET_MATCH');
-INSERT INTO messages VALUES(102,310013,'parse','transactions','{"supported":true,"tx_hash":"6a5f30666a5f24b6e0e6f31cf06b22ee74d3e692a550297450bdf1d36b1cc167","tx_index":14}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(103,310013,'parse','blocks','{"block_index":310013,"ledger_hash":"3dfa5822de8a4c674f1517b17e50d2ef63ccbb1fc4ae96fe5e1dc05cd353aa4b","messages_hash":"065ed4ebeb7d71c4d6c81c65e46f8682fc8eabaa8c08b0a8298fa93140a6585f","txlist_hash":"6228a449b24d607b8fe1aea60a0292874cfe515a9440bee2829f6e61efa0b2a6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(104,310013,'insert','blocks','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(105,310014,'insert','transactions','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"btc_amount":1000,"data":"00000028000052bb33640000000008f0d1800000000014dc93800000000000000000000013b00000000a","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"2066b9a6b8913412384a0401ef57bfc604e7c5a2c141e23111a8ccc6881b0fb3","tx_index":15}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(106,310014,'update','orders','{"status":"expired","tx_hash":"f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(107,310014,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310014,"calling_function":"cancel order","event":"f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f","quantity":5000000,"tx_index":0}',0,'CREDIT');
-INSERT INTO messages VALUES(108,310014,'insert','order_expirations','{"block_index":310014,"order_hash":"f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f","source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2"}',0,'ORDER_EXPIRATION');
-INSERT INTO messages VALUES(109,310014,'insert','debits','{"action":"bet","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310014,"event":"2066b9a6b8913412384a0401ef57bfc604e7c5a2c141e23111a8ccc6881b0fb3","quantity":150000000,"tx_index":15}',0,'DEBIT');
-INSERT INTO messages VALUES(110,310014,'insert','bets','{"bet_type":0,"block_index":310014,"counterwager_quantity":350000000,"counterwager_remaining":350000000,"deadline":1388000100,"expiration":10,"expire_index":310024,"fee_fraction_int":99999999.0,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","leverage":5040,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","target_value":0.0,"tx_hash":"2066b9a6b8913412384a0401ef57bfc604e7c5a2c141e23111a8ccc6881b0fb3","tx_index":15,"wager_quantity":150000000,"wager_remaining":150000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(111,310014,'parse','transactions','{"supported":true,"tx_hash":"2066b9a6b8913412384a0401ef57bfc604e7c5a2c141e23111a8ccc6881b0fb3","tx_index":15}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(112,310014,'parse','blocks','{"block_index":310014,"ledger_hash":"49fcaed957776bc62c9f1feac30dad8c0574596d312f9efee7a453e00bf64866","messages_hash":"912195d824c04576868edda92286e9720896de5c90b6477ee927e78553c23283","txlist_hash":"700cf4c54e23c0cfb4d8b02bc6cb1ca509637dd95312629625aa92d32d5548d2"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(113,310014,'insert','blocks','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(114,310015,'insert','transactions','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"btc_amount":1000,"data":"00000028000152bb33640000000014dc93800000000008f0d1800000000000000000000013b00000000a","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"65db3ab58b65891a947ab9bdba4723e907678bf3b48397add62802dcc65d1d8e","tx_index":16}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(115,310015,'insert','debits','{"action":"bet","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310015,"event":"65db3ab58b65891a947ab9bdba4723e907678bf3b48397add62802dcc65d1d8e","quantity":350000000,"tx_index":16}',0,'DEBIT');
-INSERT INTO messages VALUES(116,310015,'insert','bets','{"bet_type":1,"block_index":310015,"counterwager_quantity":150000000,"counterwager_remaining":150000000,"deadline":1388000100,"expiration":10,"expire_index":310025,"fee_fraction_int":99999999.0,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","leverage":5040,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","target_value":0.0,"tx_hash":"65db3ab58b65891a947ab9bdba4723e907678bf3b48397add62802dcc65d1d8e","tx_index":16,"wager_quantity":350000000,"wager_remaining":350000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(117,310015,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310015,"calling_function":"filled","event":"65db3ab58b65891a947ab9bdba4723e907678bf3b48397add62802dcc65d1d8e","quantity":0,"tx_index":16}',0,'CREDIT');
-INSERT INTO messages VALUES(118,310015,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"2066b9a6b8913412384a0401ef57bfc604e7c5a2c141e23111a8ccc6881b0fb3","wager_remaining":0}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(119,310015,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310015,"calling_function":"filled","event":"65db3ab58b65891a947ab9bdba4723e907678bf3b48397add62802dcc65d1d8e","quantity":0,"tx_index":16}',0,'CREDIT');
-INSERT INTO messages VALUES(120,310015,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"65db3ab58b65891a947ab9bdba4723e907678bf3b48397add62802dcc65d1d8e","wager_remaining":0}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(121,310015,'insert','bet_matches','{"backward_quantity":350000000,"block_index":310014,"deadline":1388000100,"fee_fraction_int":99999999,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","forward_quantity":150000000,"id":"2066b9a6b8913412384a0401ef57bfc604e7c5a2c141e23111a8ccc6881b0fb3_65db3ab58b65891a947ab9bdba4723e907678bf3b48397add62802dcc65d1d8e","initial_value":100.0,"leverage":5040,"match_expire_index":310024,"status":"pending","target_value":0.0,"tx0_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx0_bet_type":0,"tx0_block_index":310014,"tx0_expiration":10,"tx0_hash":"2066b9a6b8913412384a0401ef57bfc604e7c5a2c141e23111a8ccc6881b0fb3","tx0_index":15,"tx1_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx1_bet_type":1,"tx1_block_index":310015,"tx1_expiration":10,"tx1_hash":"65db3ab58b65891a947ab9bdba4723e907678bf3b48397add62802dcc65d1d8e","tx1_index":16}',0,'BET_MATCH');
-INSERT INTO messages VALUES(122,310015,'parse','transactions','{"supported":true,"tx_hash":"65db3ab58b65891a947ab9bdba4723e907678bf3b48397add62802dcc65d1d8e","tx_index":16}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(123,310015,'parse','blocks','{"block_index":310015,"ledger_hash":"4e4abd3e8ab2658a7ac673e3a178ceac76fee41cf48bb6ed007d241c079979bf","messages_hash":"b0cc104a22aa13139de9b6ddd2f363738160a44272d0c5f60e9568b4cd718f23","txlist_hash":"288c9c0f37cb0c2e9db66d4b88b165391a67f06016ac84c485e9b9158ee51f2d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(124,310015,'insert','blocks','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(125,310016,'insert','transactions','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"btc_amount":1000,"data":"00000028000252bb33c8000000002cb417800000000026be36803ff0000000000000000013b00000000a","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"94b11df6b519372bfbcf0ec5f3e6465a63e323c7cd7cff83a8abd78596d4bce4","tx_index":17}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(126,310016,'insert','debits','{"action":"bet","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310016,"event":"94b11df6b519372bfbcf0ec5f3e6465a63e323c7cd7cff83a8abd78596d4bce4","quantity":750000000,"tx_index":17}',0,'DEBIT');
-INSERT INTO messages VALUES(127,310016,'insert','bets','{"bet_type":2,"block_index":310016,"counterwager_quantity":650000000,"counterwager_remaining":650000000,"deadline":1388000200,"expiration":10,"expire_index":310026,"fee_fraction_int":99999999.0,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","leverage":5040,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","target_value":1.0,"tx_hash":"94b11df6b519372bfbcf0ec5f3e6465a63e323c7cd7cff83a8abd78596d4bce4","tx_index":17,"wager_quantity":750000000,"wager_remaining":750000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(128,310016,'parse','transactions','{"supported":true,"tx_hash":"94b11df6b519372bfbcf0ec5f3e6465a63e323c7cd7cff83a8abd78596d4bce4","tx_index":17}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(129,310016,'parse','blocks','{"block_index":310016,"ledger_hash":"17a28cca0777254af26544edfefcad8810e847e5d173fded9a7813719cf1162f","messages_hash":"de03065dfd7c73a58301d2ad9411a1f7a4eb42123adaba0ac82f4b26412ab29d","txlist_hash":"1bf7e0a4aa8356584087591a8c8e8b28185a6ebfe1a15a85f01165a04ff57913"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(130,310016,'insert','blocks','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(131,310017,'insert','transactions','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"btc_amount":1000,"data":"00000028000352bb33c80000000026be3680000000002cb417803ff0000000000000000013b00000000a","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"a7daff1ca2874f6b18a8f1a1e70db27f58c6b39a9f106c353223fbccde57098e","tx_index":18}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(132,310017,'insert','debits','{"action":"bet","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310017,"event":"a7daff1ca2874f6b18a8f1a1e70db27f58c6b39a9f106c353223fbccde57098e","quantity":650000000,"tx_index":18}',0,'DEBIT');
-INSERT INTO messages VALUES(133,310017,'insert','bets','{"bet_type":3,"block_index":310017,"counterwager_quantity":750000000,"counterwager_remaining":750000000,"deadline":1388000200,"expiration":10,"expire_index":310027,"fee_fraction_int":99999999.0,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","leverage":5040,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","target_value":1.0,"tx_hash":"a7daff1ca2874f6b18a8f1a1e70db27f58c6b39a9f106c353223fbccde57098e","tx_index":18,"wager_quantity":650000000,"wager_remaining":650000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(134,310017,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310017,"calling_function":"filled","event":"a7daff1ca2874f6b18a8f1a1e70db27f58c6b39a9f106c353223fbccde57098e","quantity":0,"tx_index":18}',0,'CREDIT');
-INSERT INTO messages VALUES(135,310017,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"94b11df6b519372bfbcf0ec5f3e6465a63e323c7cd7cff83a8abd78596d4bce4","wager_remaining":0}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(136,310017,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310017,"calling_function":"filled","event":"a7daff1ca2874f6b18a8f1a1e70db27f58c6b39a9f106c353223fbccde57098e","quantity":0,"tx_index":18}',0,'CREDIT');
-INSERT INTO messages VALUES(137,310017,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"a7daff1ca2874f6b18a8f1a1e70db27f58c6b39a9f106c353223fbccde57098e","wager_remaining":0}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(138,310017,'insert','bet_matches','{"backward_quantity":650000000,"block_index":310016,"deadline":1388000200,"fee_fraction_int":99999999,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","forward_quantity":750000000,"id":"94b11df6b519372bfbcf0ec5f3e6465a63e323c7cd7cff83a8abd78596d4bce4_a7daff1ca2874f6b18a8f1a1e70db27f58c6b39a9f106c353223fbccde57098e","initial_value":100.0,"leverage":5040,"match_expire_index":310026,"status":"pending","target_value":1.0,"tx0_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx0_bet_type":2,"tx0_block_index":310016,"tx0_expiration":10,"tx0_hash":"94b11df6b519372bfbcf0ec5f3e6465a63e323c7cd7cff83a8abd78596d4bce4","tx0_index":17,"tx1_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx1_bet_type":3,"tx1_block_index":310017,"tx1_expiration":10,"tx1_hash":"a7daff1ca2874f6b18a8f1a1e70db27f58c6b39a9f106c353223fbccde57098e","tx1_index":18}',0,'BET_MATCH');
-INSERT INTO messages VALUES(139,310017,'parse','transactions','{"supported":true,"tx_hash":"a7daff1ca2874f6b18a8f1a1e70db27f58c6b39a9f106c353223fbccde57098e","tx_index":18}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(140,310017,'parse','blocks','{"block_index":310017,"ledger_hash":"1fb58120e9eb78908fda6265cad12b4a5770701e9a271bd5c4bc94059bd3bab5","messages_hash":"22b69c233a30db17deaf78087019583ae1097211b856b9235b11e341b0420b03","txlist_hash":"62678a570c40b5a12469e442b3a54f1416d9113de2db501f37ed533f345e71c1"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(141,310017,'insert','blocks','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(142,310018,'insert','transactions','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"btc_amount":0,"data":"0000001e52bb33324058f7256ffc115e004c4b4009556e69742054657374","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"f020ae6c0b1aadbba4893581678ef87f9d2a925be5e6b08d02440e213f6183b4","tx_index":19}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(143,310018,'insert','broadcasts','{"block_index":310018,"fee_fraction_int":5000000,"locked":false,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","text":"Unit Test","timestamp":1388000050,"tx_hash":"f020ae6c0b1aadbba4893581678ef87f9d2a925be5e6b08d02440e213f6183b4","tx_index":19,"value":99.86166}',0,'BROADCAST');
-INSERT INTO messages VALUES(144,310018,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310018,"calling_function":"bet settled: liquidated for bear","event":"f020ae6c0b1aadbba4893581678ef87f9d2a925be5e6b08d02440e213f6183b4","quantity":59137500,"tx_index":19}',0,'CREDIT');
-INSERT INTO messages VALUES(145,310018,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310018,"calling_function":"feed fee","event":"f020ae6c0b1aadbba4893581678ef87f9d2a925be5e6b08d02440e213f6183b4","quantity":3112500,"tx_index":19}',0,'CREDIT');
-INSERT INTO messages VALUES(146,310018,'insert','bet_match_resolutions','{"bear_credit":59137500,"bet_match_id":"74062934f0a97c41851735fef2a7df4d9ad9945424f09a54281e145a5e32492f_6a5f30666a5f24b6e0e6f31cf06b22ee74d3e692a550297450bdf1d36b1cc167","bet_match_type_id":1,"block_index":310018,"bull_credit":0,"escrow_less_fee":null,"fee":3112500,"settled":false,"winner":null}',0,'BET_MATCH_RESOLUTON');
-INSERT INTO messages VALUES(147,310018,'update','bet_matches','{"id":"74062934f0a97c41851735fef2a7df4d9ad9945424f09a54281e145a5e32492f_6a5f30666a5f24b6e0e6f31cf06b22ee74d3e692a550297450bdf1d36b1cc167","status":"settled: liquidated for bear"}',0,'BET_MATCH_UPDATE');
-INSERT INTO messages VALUES(148,310018,'parse','transactions','{"supported":true,"tx_hash":"f020ae6c0b1aadbba4893581678ef87f9d2a925be5e6b08d02440e213f6183b4","tx_index":19}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(149,310018,'parse','blocks','{"block_index":310018,"ledger_hash":"304243c1b11644e04d325d7100e4c757c07b874f0349e60163a5a544e84e951f","messages_hash":"277c84ad2141397b5cd35cac07e45452ecdd845668f7684bb1c1679f4ef6a50b","txlist_hash":"a174e4813aa967f5466148f27f4f8511ed9404295bf613e112c08b72eb3229ad"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(150,310018,'insert','blocks','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(151,310019,'insert','transactions','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"btc_amount":0,"data":"0000001e52bb3365405915f3b645a1cb004c4b4009556e69742054657374","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"dccbd8852c8d489d32f87be0c86a631b63ec50202b0109a2be6aa96f27f89600","tx_index":20}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(152,310019,'insert','broadcasts','{"block_index":310019,"fee_fraction_int":5000000,"locked":false,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","text":"Unit Test","timestamp":1388000101,"tx_hash":"dccbd8852c8d489d32f87be0c86a631b63ec50202b0109a2be6aa96f27f89600","tx_index":20,"value":100.343}',0,'BROADCAST');
-INSERT INTO messages VALUES(153,310019,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310019,"calling_function":"bet settled","event":"dccbd8852c8d489d32f87be0c86a631b63ec50202b0109a2be6aa96f27f89600","quantity":159300000,"tx_index":20}',0,'CREDIT');
-INSERT INTO messages VALUES(154,310019,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310019,"calling_function":"bet settled","event":"dccbd8852c8d489d32f87be0c86a631b63ec50202b0109a2be6aa96f27f89600","quantity":315700000,"tx_index":20}',0,'CREDIT');
-INSERT INTO messages VALUES(155,310019,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310019,"calling_function":"feed fee","event":"dccbd8852c8d489d32f87be0c86a631b63ec50202b0109a2be6aa96f27f89600","quantity":25000000,"tx_index":20}',0,'CREDIT');
-INSERT INTO messages VALUES(156,310019,'insert','bet_match_resolutions','{"bear_credit":315700000,"bet_match_id":"2066b9a6b8913412384a0401ef57bfc604e7c5a2c141e23111a8ccc6881b0fb3_65db3ab58b65891a947ab9bdba4723e907678bf3b48397add62802dcc65d1d8e","bet_match_type_id":1,"block_index":310019,"bull_credit":159300000,"escrow_less_fee":null,"fee":25000000,"settled":true,"winner":null}',0,'BET_MATCH_RESOLUTON');
-INSERT INTO messages VALUES(157,310019,'update','bet_matches','{"id":"2066b9a6b8913412384a0401ef57bfc604e7c5a2c141e23111a8ccc6881b0fb3_65db3ab58b65891a947ab9bdba4723e907678bf3b48397add62802dcc65d1d8e","status":"settled"}',0,'BET_MATCH_UPDATE');
-INSERT INTO messages VALUES(158,310019,'parse','transactions','{"supported":true,"tx_hash":"dccbd8852c8d489d32f87be0c86a631b63ec50202b0109a2be6aa96f27f89600","tx_index":20}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(159,310019,'parse','blocks','{"block_index":310019,"ledger_hash":"fc9905ee4863b3cf29a3e558ee690a24ed978a4fd79c464bdde30a34cfff19fe","messages_hash":"0928aaa2af960f1750455c96196f5f331bce38c09b7cc315f40aacfc8b363c3b","txlist_hash":"c551c2094651cd0e06e0cd9d513fec771b69f4bb89c3034f201c89f703cf8a23"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(160,310019,'insert','blocks','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(161,310020,'insert','transactions','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"btc_amount":0,"data":"0000001e52bb33c94000000000000000004c4b4009556e69742054657374","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"457f36dccce6664a8e28b00ebf47aa60ba4a41b46642aceef0e2a297429eb64e","tx_index":21}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(162,310020,'insert','broadcasts','{"block_index":310020,"fee_fraction_int":5000000,"locked":false,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","text":"Unit Test","timestamp":1388000201,"tx_hash":"457f36dccce6664a8e28b00ebf47aa60ba4a41b46642aceef0e2a297429eb64e","tx_index":21,"value":2.0}',0,'BROADCAST');
-INSERT INTO messages VALUES(163,310020,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310020,"calling_function":"bet settled: for notequal","event":"457f36dccce6664a8e28b00ebf47aa60ba4a41b46642aceef0e2a297429eb64e","quantity":1330000000,"tx_index":21}',0,'CREDIT');
-INSERT INTO messages VALUES(164,310020,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310020,"calling_function":"feed fee","event":"457f36dccce6664a8e28b00ebf47aa60ba4a41b46642aceef0e2a297429eb64e","quantity":70000000,"tx_index":21}',0,'CREDIT');
-INSERT INTO messages VALUES(165,310020,'insert','bet_match_resolutions','{"bear_credit":null,"bet_match_id":"94b11df6b519372bfbcf0ec5f3e6465a63e323c7cd7cff83a8abd78596d4bce4_a7daff1ca2874f6b18a8f1a1e70db27f58c6b39a9f106c353223fbccde57098e","bet_match_type_id":5,"block_index":310020,"bull_credit":null,"escrow_less_fee":1330000000,"fee":70000000,"settled":null,"winner":"NotEqual"}',0,'BET_MATCH_RESOLUTON');
-INSERT INTO messages VALUES(166,310020,'update','bet_matches','{"id":"94b11df6b519372bfbcf0ec5f3e6465a63e323c7cd7cff83a8abd78596d4bce4_a7daff1ca2874f6b18a8f1a1e70db27f58c6b39a9f106c353223fbccde57098e","status":"settled: for notequal"}',0,'BET_MATCH_UPDATE');
-INSERT INTO messages VALUES(167,310020,'parse','transactions','{"supported":true,"tx_hash":"457f36dccce6664a8e28b00ebf47aa60ba4a41b46642aceef0e2a297429eb64e","tx_index":21}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(168,310020,'parse','blocks','{"block_index":310020,"ledger_hash":"e433feac4a09ad727bd3764b10a568acf5c659745a695e9d7e8790514f6bc98e","messages_hash":"859eb68b2ff99d0621c4d634d717d985688b8e0ca83b84e330446a25ccbd5fe1","txlist_hash":"087d41720991e4b6bb72c6141334a65c9a289454dd8fd57edc33a09db467d086"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(169,310020,'insert','blocks','{"block_hash":"7c2460bb32c5749c856486393239bf7a0ac789587ac71f32e7237910da8097f2","block_index":310021,"block_time":310021000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(170,310021,'insert','transactions','{"block_hash":"7c2460bb32c5749c856486393239bf7a0ac789587ac71f32e7237910da8097f2","block_index":310021,"block_time":310021000,"btc_amount":0,"data":"0000000a00000000000047670000000002faf08000000000000000010000000002faf080000a0000000000000000","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"6cb08a1c0547ab0d0d37b74633c1c8a2fd2372d9fd72eb3abdea298f2b245fee","tx_index":22}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(171,310021,'insert','debits','{"action":"open order","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBB","block_index":310021,"event":"6cb08a1c0547ab0d0d37b74633c1c8a2fd2372d9fd72eb3abdea298f2b245fee","quantity":50000000,"tx_index":22}',0,'DEBIT');
-INSERT INTO messages VALUES(172,310021,'insert','orders','{"block_index":310021,"expiration":10,"expire_index":310031,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":50000000,"get_remaining":50000000,"give_asset":"BBBB","give_quantity":50000000,"give_remaining":50000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","tx_hash":"6cb08a1c0547ab0d0d37b74633c1c8a2fd2372d9fd72eb3abdea298f2b245fee","tx_index":22}',0,'OPEN_ORDER');
-INSERT INTO messages VALUES(173,310021,'parse','transactions','{"supported":true,"tx_hash":"6cb08a1c0547ab0d0d37b74633c1c8a2fd2372d9fd72eb3abdea298f2b245fee","tx_index":22}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(174,310021,'parse','blocks','{"block_index":310021,"ledger_hash":"622f92da40eae0b1b57218b32ad18daf7d79c9e0202fed4a288d75b8fdcd19d2","messages_hash":"9e323ccc0a72f968a5886d5bd8cd26c990602bd87d0e65e8cbd64343c4b02bfe","txlist_hash":"caa77e83354d56437795411f9625dff332c0dd39d059a0ad7381fe1f37e38999"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(175,310021,'insert','blocks','{"block_hash":"44435f9a99a0aa12a9bfabdc4cb8119f6ea6a6e1350d2d65445fb66a456db5fc","block_index":310022,"block_time":310022000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(176,310022,'insert','transactions','{"block_hash":"44435f9a99a0aa12a9bfabdc4cb8119f6ea6a6e1350d2d65445fb66a456db5fc","block_index":310022,"block_time":310022000,"btc_amount":100000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":14675,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"c81cd36f1efabd22f1a00923714fd5a5f1ba07852ef1f0763223563e3f55dfda","tx_index":23}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(177,310022,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310022,"calling_function":"burn","event":"c81cd36f1efabd22f1a00923714fd5a5f1ba07852ef1f0763223563e3f55dfda","quantity":56999887262,"tx_index":23}',0,'CREDIT');
-INSERT INTO messages VALUES(178,310022,'insert','burns','{"block_index":310022,"burned":38000000,"earned":56999887262,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"c81cd36f1efabd22f1a00923714fd5a5f1ba07852ef1f0763223563e3f55dfda","tx_index":23}',0,'BURN');
-INSERT INTO messages VALUES(179,310022,'parse','blocks','{"block_index":310022,"ledger_hash":"b7aa8d9ebc37d52d8dcce2cc17431d6edf5a183b73ac85bb3d91276592215cfd","messages_hash":"a9bfc8463d636a888c8ae61b3fc13d2d32768fa1920b980cb5ea967b4863e6ec","txlist_hash":"df23960a57099b0b64572553e56794b1eff3004e684ee2b31187b585aeb03587"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(180,310022,'insert','blocks','{"block_hash":"d8cf5bec1bbcab8ca4f495352afde3b6572b7e1d61b3976872ebb8e9d30ccb08","block_index":310023,"block_time":310023000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(181,310023,'insert','transactions','{"block_hash":"d8cf5bec1bbcab8ca4f495352afde3b6572b7e1d61b3976872ebb8e9d30ccb08","block_index":310023,"block_time":310023000,"btc_amount":1000,"data":"0000000000000000000047680000000000002710","destination":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"c576ecde0f86c86725b540c9f5e6ae57a378fe9694260f7859eca55613d9d341","tx_index":24}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(182,310023,'update','bets','{"status":"expired","tx_hash":"74062934f0a97c41851735fef2a7df4d9ad9945424f09a54281e145a5e32492f"}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(183,310023,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310023,"calling_function":"recredit wager remaining","event":"74062934f0a97c41851735fef2a7df4d9ad9945424f09a54281e145a5e32492f","quantity":8500000,"tx_index":0}',0,'CREDIT');
-INSERT INTO messages VALUES(184,310023,'insert','bet_expirations','{"bet_hash":"74062934f0a97c41851735fef2a7df4d9ad9945424f09a54281e145a5e32492f","bet_index":13,"block_index":310023,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2"}',0,'BET_EXPIRATION');
-INSERT INTO messages VALUES(185,310023,'insert','debits','{"action":"send","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBC","block_index":310023,"event":"c576ecde0f86c86725b540c9f5e6ae57a378fe9694260f7859eca55613d9d341","quantity":10000,"tx_index":24}',0,'DEBIT');
-INSERT INTO messages VALUES(186,310023,'insert','credits','{"address":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBC","block_index":310023,"calling_function":"send","event":"c576ecde0f86c86725b540c9f5e6ae57a378fe9694260f7859eca55613d9d341","quantity":10000,"tx_index":24}',0,'CREDIT');
-INSERT INTO messages VALUES(187,310023,'insert','sends','{"asset":"BBBC","block_index":310023,"destination":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","quantity":10000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"c576ecde0f86c86725b540c9f5e6ae57a378fe9694260f7859eca55613d9d341","tx_index":24}',0,'SEND');
-INSERT INTO messages VALUES(188,310023,'parse','transactions','{"supported":true,"tx_hash":"c576ecde0f86c86725b540c9f5e6ae57a378fe9694260f7859eca55613d9d341","tx_index":24}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(189,310023,'parse','blocks','{"block_index":310023,"ledger_hash":"501c058860063ca599f3b946d465b3bbd84fd483a2a80527e456e3de32b48a19","messages_hash":"82ecd86662e345e85c8e68ef7a8dbad744af2415bd71756cdd5824ac35b9655e","txlist_hash":"c680a6d4f839ba4f9420a99f0512e51fc1db0b661ed027332f440c6089eb615a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(190,310023,'insert','blocks','{"block_hash":"b03042b4e18a222b4c8d1e9e1970d93e6e2a2d41686d227ff8ecf0a839223dc5","block_index":310024,"block_time":310024000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(191,310024,'parse','blocks','{"block_index":310024,"ledger_hash":"222986ec44fae1a6196d64dec24b79872970823f17bf0459d3b247bdef316675","messages_hash":"2d94009516ad0a6a7696d3c90c4a18b18970ed29702a91684120939b7f7e424f","txlist_hash":"f40aab7ef7167a17e35279423d9c14d49a9ebc05691fa658b09add1373216959"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(192,310024,'insert','blocks','{"block_hash":"a872e560766832cc3b4f7f222228cb6db882ce3c54f6459f62c71d5cd6e90666","block_index":310025,"block_time":310025000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(193,310025,'parse','blocks','{"block_index":310025,"ledger_hash":"bcd88006b9cb98445a74c656d424435e82eeaef95dd9c54e394b42808dc9cb8b","messages_hash":"07d351ee43763fbb80ea1d600cb501b6f8b0105cf3d3d277b9a9714527a81235","txlist_hash":"0e3736813d3c0e789cd9474449abcf83118b5559cbc2f4dfd4d3ee51b5847a57"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(194,310025,'insert','blocks','{"block_hash":"6c96350f6f2f05810f19a689de235eff975338587194a36a70dfd0fcd490941a","block_index":310026,"block_time":310026000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(195,310026,'parse','blocks','{"block_index":310026,"ledger_hash":"3de7bf2043ac2e68bc9eaf8d1c12195a4f2400bc78c8deed0d487af11edf401e","messages_hash":"3b432d9f048634678497de80535eced0de2db802c86b3ecd6f7e3052285f2819","txlist_hash":"c3572580398fcd71e5a1fef6e10217a99dec1aa605d61830ebb64ea65b7907ae"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(196,310026,'insert','blocks','{"block_hash":"d7acfac66df393c4482a14c189742c0571b89442eb7f817b34415a560445699e","block_index":310027,"block_time":310027000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(197,310027,'parse','blocks','{"block_index":310027,"ledger_hash":"6c2a67783cf36e8987dc1805f87532ee1b94f79fb00952d8ee4cf3daaf655f85","messages_hash":"139682b87ae2b72b9fbd62ca0d3788ab4bf20239f6e27e0142e7b4d810b3138d","txlist_hash":"b8b9d102d56df94d4fcea6f8aeb92d3cb859d3281c9fac7407842b7f05313737"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(198,310027,'insert','blocks','{"block_hash":"02409fcf8fa06dafcb7f11e38593181d9c42cc9d5e2ddc304d098f990bd9530b","block_index":310028,"block_time":310028000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(199,310028,'parse','blocks','{"block_index":310028,"ledger_hash":"659c73390e2e7eccc07d690fb438181c604787208bc45f466e57721fa1e21a64","messages_hash":"281c45bea9359ef175c8e8b50167fe72be91b589dd7e589d51280d15ffefb8dc","txlist_hash":"55eafa176bc145ec7b98497c8a156226c68bd3b921cbdd06a890b2bd660ca050"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(200,310028,'insert','blocks','{"block_hash":"3c739fa8b40c118d5547ea356ee8d10ee2898871907643ec02e5db9d00f03cc6","block_index":310029,"block_time":310029000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(201,310029,'parse','blocks','{"block_index":310029,"ledger_hash":"87449e7ff7316e49012934d83c1f5b733cedf39680299a9582eb216e260e0c02","messages_hash":"39af1ee82e4334b2b0596abf86dc82603d9b2c8a5d046c5db281ecf34b303a30","txlist_hash":"c2fc809ff3ef6b74b10b1439fe15c275c6fd925e92dea73cf9d603948aba0d8f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(202,310029,'insert','blocks','{"block_hash":"d5071cddedf89765ee0fd58f209c1c7d669ba8ea66200a57587da8b189b9e4f5","block_index":310030,"block_time":310030000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(203,310030,'parse','blocks','{"block_index":310030,"ledger_hash":"6c4a7f749d0308edf5c88b3ea4de3b1d497ba3bc06435594d77686318b744b0f","messages_hash":"eaf3156993560de86b2de78af58593d00da00db7fd7bab33a7f7cc56d49944f6","txlist_hash":"45db1d0cde22349299df8245e7ed24d308e1b1cb227098178606650f20832aaa"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(204,310030,'insert','blocks','{"block_hash":"0b02b10f41380fff27c543ea8891ecb845bf7a003ac5c87e15932aff3bfcf689","block_index":310031,"block_time":310031000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(205,310031,'parse','blocks','{"block_index":310031,"ledger_hash":"ecc04b1b2c7803ca17dc2a32adebd0960de2c04c8dbfec9cd88771dd883c885a","messages_hash":"0806bca89167cf716795644fc4577dc88f73a1ab2420109a4a7fb504dade4e65","txlist_hash":"981653075dd609f44e0a5673dac2b63824b84e26080ec226547892c67dd7cc33"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(206,310031,'insert','blocks','{"block_hash":"66346be81e6ba04544f2ae643b76c2b7b1383f038fc2636e02e49dc7ec144074","block_index":310032,"block_time":310032000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(207,310032,'update','orders','{"status":"expired","tx_hash":"6cb08a1c0547ab0d0d37b74633c1c8a2fd2372d9fd72eb3abdea298f2b245fee"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(208,310032,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBB","block_index":310032,"calling_function":"cancel order","event":"6cb08a1c0547ab0d0d37b74633c1c8a2fd2372d9fd72eb3abdea298f2b245fee","quantity":50000000,"tx_index":0}',0,'CREDIT');
-INSERT INTO messages VALUES(209,310032,'insert','order_expirations','{"block_index":310032,"order_hash":"6cb08a1c0547ab0d0d37b74633c1c8a2fd2372d9fd72eb3abdea298f2b245fee","source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2"}',0,'ORDER_EXPIRATION');
-INSERT INTO messages VALUES(210,310032,'parse','blocks','{"block_index":310032,"ledger_hash":"01e769c5b990db44a9e534bc6c759567eb4283e0ea252578dd525923c7fde02c","messages_hash":"49cd53ea397947d31318ad902433661e23e78cac31fd544f67ee87f7cf5a5e47","txlist_hash":"81778134948c3577216eeeb6db7fe9687545d855dc3b5f6bdf6053a7edf3eaf3"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(211,310032,'insert','blocks','{"block_hash":"999c65df9661f73e8c01f1da1afda09ac16788b72834f0ff5ea3d1464afb4707","block_index":310033,"block_time":310033000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(212,310033,'parse','blocks','{"block_index":310033,"ledger_hash":"2df6b8dca0ffa8d6d55997605188637c2b86300e4dd7ebe3f1f275690169fd46","messages_hash":"03e1ca09ca2ad95c3d8625cdbdcefd20d69f2442d56a49c570d85c74935e232a","txlist_hash":"650b0875a0fb44a0ad1b04edf1a0eb1b50b5ecc423c6ecdd37b5aa60b5e85663"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(213,310033,'insert','blocks','{"block_hash":"f552edd2e0a648230f3668e72ddf0ddfb1e8ac0f4c190f91b89c1a8c2e357208","block_index":310034,"block_time":310034000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(214,310034,'parse','blocks','{"block_index":310034,"ledger_hash":"7f0dc7c1527a7d11831d272f0295eacabcb96fa3599f5a716bd29ba1bb6b7577","messages_hash":"40b21162c2bdec9408ffa79df90b098be7f3adfcbcd8f6bc6e6064d0b3a571ac","txlist_hash":"e9d6c050b077d8e6902999bf64a0f1bf420c881b8a32c511ae81b0359e83a542"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(215,310034,'insert','blocks','{"block_hash":"a13cbb016f3044207a46967a4ba1c87dab411f78c55c1179f2336653c2726ae2","block_index":310035,"block_time":310035000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(216,310035,'parse','blocks','{"block_index":310035,"ledger_hash":"5e0cdf1764ed94672c29144f9c1bd9c3e70784f17c9dd1c9e4ce703a99bb3599","messages_hash":"aaaa2778599705d04a371a7488537f432426d15e6f3b3230f0d86f8fa7f266a0","txlist_hash":"e755b5d80c9995dfa5763b080b9bdd349fd7b5bd940a661836ad418202b77384"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(217,310035,'insert','blocks','{"block_hash":"158648a98f1e1bd1875584ce8449eb15a4e91a99a923bbb24c4210135cef0c76","block_index":310036,"block_time":310036000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(218,310036,'parse','blocks','{"block_index":310036,"ledger_hash":"96da34a5a66b89aa3e8857b4a4edca51a56a0cbbfe600d8153077875624a153e","messages_hash":"a68c4c24471575ea622ce59af306b947b521f01abeaa347a8e33eb651cf91a25","txlist_hash":"cbc0139fb09af6a6c63e07847a37f15767a1f7b01d6305cf40179de841c4f093"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(219,310036,'insert','blocks','{"block_hash":"563acfd6d991ce256d5655de2e9429975c8dceeb221e76d5ec6e9e24a2c27c07","block_index":310037,"block_time":310037000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(220,310037,'parse','blocks','{"block_index":310037,"ledger_hash":"d481358c19b4220aa9a3d135fd0651fada6df8d0f27b9ec954ac07950e876c0c","messages_hash":"7aa07b58643d61192acc195054c76aa198bc0615a8d1015efd485e6078c84797","txlist_hash":"0493eb6bbab5ced7f25c6f5a3b32e4e2da321a5c761855ef64b5e050ddcfe431"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(221,310037,'insert','blocks','{"block_hash":"b44b4cad12431c32df27940e18d51f63897c7472b70950d18454edfd640490b2","block_index":310038,"block_time":310038000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(222,310038,'parse','blocks','{"block_index":310038,"ledger_hash":"4e9fcc454ee53b3617c792eb6577c2eefa6eee6aa4a2925538cb1976d48817c9","messages_hash":"d06d2f843297dda75791f6d438a0c22a679fa705606c8a82f71c3a316e24bfdd","txlist_hash":"64b95af50bbee190166820a564e858e5c86769c04b22a68c2bed5adee0f7292f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(223,310038,'insert','blocks','{"block_hash":"5fa1ae9c5e8a599247458987b006ad3a57f686df1f7cc240bf119e911b56c347","block_index":310039,"block_time":310039000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(224,310039,'parse','blocks','{"block_index":310039,"ledger_hash":"795c5652d9679942a02060edfb497b072009695d9a72fb144fa3591dba65a2ce","messages_hash":"975d014fa7da9eb851641c145a0f55fde983a0d8670ed0008dbed98bde05f8b7","txlist_hash":"9927f1558918a59509f668789e75198eb432fd63e0a7ffb46160d002c0932188"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(225,310039,'insert','blocks','{"block_hash":"7200ded406675453eadddfbb2d14c2a4526c7dc2b5de14bd48b29243df5e1aa3","block_index":310040,"block_time":310040000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(226,310040,'parse','blocks','{"block_index":310040,"ledger_hash":"e569e6e8083818e594e92b3356833e8dd54fcfcf5ed25af0d09e36e24b9dd441","messages_hash":"8f1a984f0da070ff524c9fc9517efd3567d25bacc25f29ba32d03d06a7c43c36","txlist_hash":"969f7176f1a56d43e0d1b4da9cbac17cb1a934be64c12b3784ef33b584513271"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(227,310040,'insert','blocks','{"block_hash":"5db592ff9ba5fac1e030cf22d6c13b70d330ba397f415340086ee7357143b359","block_index":310041,"block_time":310041000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(228,310041,'parse','blocks','{"block_index":310041,"ledger_hash":"2247fcc633175a91921d226f412e56822379c79ca799117c39ecaaca0a702192","messages_hash":"373d191cad758b4644384ebfbef2cf1e49c038716f6672447b5d36e69bad7d88","txlist_hash":"29cb8f1b29affa41416aca0265599863f6b739538f13bc6672f6b3c17e411045"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(229,310041,'insert','blocks','{"block_hash":"826fd4701ef2824e9559b069517cd3cb990aff6a4690830f78fc845ab77fa3e4","block_index":310042,"block_time":310042000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(230,310042,'parse','blocks','{"block_index":310042,"ledger_hash":"0246c3a2a70b33a038ccdb816f6b0922a50d08310f360cbd5db4df58e97fc4dd","messages_hash":"3758f623adbf54b2e0471b990dd67c65bebbf41d86e3277bda367bcc0a98a8cc","txlist_hash":"d1ca4c9abe26de83d9a0170461c87f2c219926f8dcb0c48793d74a0cbf01a43a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(231,310042,'insert','blocks','{"block_hash":"2254a12ada208f1dd57bc17547ecaf3c44720323c47bc7d4b1262477cb7f3c51","block_index":310043,"block_time":310043000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(232,310043,'parse','blocks','{"block_index":310043,"ledger_hash":"cbe39e9d1a132cdc568f893bbc3d4f55d27bacf7af31f027ebea1b4bed9f0009","messages_hash":"a209a4e543642de2708ff915d0c0e3e966b378dd48feef2430a7d55ac8ff238c","txlist_hash":"452b2e3ff4075f702cddcb4b8fd9006c756dda7a3527d635f637a200fd621c91"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(233,310043,'insert','blocks','{"block_hash":"3346d24118d8af0b3c6bcc42f8b85792e7a2e7036ebf6e4c25f4f6723c78e46b","block_index":310044,"block_time":310044000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(234,310044,'parse','blocks','{"block_index":310044,"ledger_hash":"1202b05e118f0940ce270d9002d010076115a0197d889fee2d971a77709899bc","messages_hash":"863dbb043614eab0029f0ebafb1eb4b12902fde830dd1c05722c01ba3923403c","txlist_hash":"527114d86a06f44f12e1f789f095227f9710b47e95251cdbd6f4c03309eae61d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(235,310044,'insert','blocks','{"block_hash":"7bba0ab243839e91ad1a45a762bf074011f8a9883074d68203c6d1b46fffde98","block_index":310045,"block_time":310045000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(236,310045,'parse','blocks','{"block_index":310045,"ledger_hash":"0bc49f765419c0b5b4911cccf03b0d9959aabacda266480b98245de0c0d35fc5","messages_hash":"023de4e9ae06942b0e09ae12622949346a414f2a4f3d882786f5bb261639d701","txlist_hash":"ed6954fc7aadd8f80684cc67580b9cc16f9a402296ac91c021de0148a1ccb4a8"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(237,310045,'insert','blocks','{"block_hash":"47db6788c38f2d6d712764979e41346b55e78cbb4969e0ef5c4336faf18993a6","block_index":310046,"block_time":310046000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(238,310046,'parse','blocks','{"block_index":310046,"ledger_hash":"e42bf9806d0ff3a0663756f7955b30735747d14fcb0915c89884baa12795163d","messages_hash":"b9e8dd64f4addd93fcdc8ea8424e96947da4cbadd60abe13f0f53a6d65a39426","txlist_hash":"2e62ee5d03044d0b6086419a6d2fed78b7db3bee75a2bc158bbc04a8f5c34908"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(239,310046,'insert','blocks','{"block_hash":"a9ccabcc2a098a7d25e4ab8bda7c4e66807eefa42e29890dcd88149a10de7075","block_index":310047,"block_time":310047000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(240,310047,'parse','blocks','{"block_index":310047,"ledger_hash":"b19b5e14741284b4ca06b736120e903363651460a6efb3ede1aca3a4f3c00df1","messages_hash":"36c01e15c47bcc42b22cf98ddcecdad49522ac234a205d5abff4939ee8478dbf","txlist_hash":"bd40f4de40c172e5b5997091f4a069ea54d25504421e6225ef3d9ee360fbca6c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(241,310047,'insert','blocks','{"block_hash":"610bf3935a85b05a98556c55493c6de45bed4d7b3b6c8553a984718765796309","block_index":310048,"block_time":310048000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(242,310048,'parse','blocks','{"block_index":310048,"ledger_hash":"e870de901ba86d65d0e2053251ffb32cc7dffb55fcc2efbc006a2b9137314a39","messages_hash":"4de4097a707a21573097f67e72cc9f52b502e0a488b2c17934c60ff9aec3ca64","txlist_hash":"d89730ea689c2912f38a2d2dc86caf6dc35a3e183c4d394129f21368f5c1d371"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(243,310048,'insert','blocks','{"block_hash":"4ad2761923ad49ad2b283b640f1832522a2a5d6964486b21591b71df6b33be3c","block_index":310049,"block_time":310049000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(244,310049,'parse','blocks','{"block_index":310049,"ledger_hash":"44cf354cdc8552ed37e5911340397d3531d0ba45100feae27377130d4ddef359","messages_hash":"fefb42b3c87927779046cd4ee3e6956ae79798cf47d9fdcbda09d59f99139479","txlist_hash":"1100866c04ae89913abf573ee61b3a7b56ec8fb7526c7d9c9938d61a187586ab"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(245,310049,'insert','blocks','{"block_hash":"8cfeb60a14a4cec6e9be13d699694d49007d82a31065a17890383e262071e348","block_index":310050,"block_time":310050000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(246,310050,'parse','blocks','{"block_index":310050,"ledger_hash":"7d72f11f48ac99553e1b2c52a7ff5645fbe05728a10a002727b9270dbb32daed","messages_hash":"ed89674f1bdb8bff262936bdd369f9b33ada1cce1466ea08a7f3bd9fbfc06cd5","txlist_hash":"1d95ff7cb416f1915ba7db0099ba9591b97c6bc673cb43296cc82655627eb1ad"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(247,310050,'insert','blocks','{"block_hash":"b53c90385dd808306601350920c6af4beb717518493fd23b5c730eea078f33e6","block_index":310051,"block_time":310051000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(248,310051,'parse','blocks','{"block_index":310051,"ledger_hash":"35a965dc90686fc4eb20450da81ca8db9125e25c2cdd7146fd61d98841d80c24","messages_hash":"a1c291e9a5685784681f9f1a9021d1cd88249d7039460ba4a1ef3a61bc6f1e2f","txlist_hash":"9d15589506565edb31f7627a37c1f6a6bca01d584b0dc815e8603689f07a80db"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(249,310051,'insert','blocks','{"block_hash":"0acdacf4e4b6fca756479cb055191b367b1fa433aa558956f5f08fa5b7b394e2","block_index":310052,"block_time":310052000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(250,310052,'parse','blocks','{"block_index":310052,"ledger_hash":"8604d503e7194ee1c8ebe1143019207b2aad163655107a3d23d018ef26cef550","messages_hash":"5554df4e98fed870e873dd4b78c7e5fcf9a2066e573c6a05f48200e435ab1cb7","txlist_hash":"40053c62babd7f69b9822b6d4223732008d45250146216762da4e13b1b9d3a3b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(251,310052,'insert','blocks','{"block_hash":"68348f01b6dc49b2cb30fe92ac43e527aa90d859093d3bf7cd695c64d2ef744f","block_index":310053,"block_time":310053000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(252,310053,'parse','blocks','{"block_index":310053,"ledger_hash":"ecdb64ffc44490eeb12199d2da5c1189c07f4102f5b91494cbe4ec68fe6bb6d4","messages_hash":"408d7c4d46c15335764ec5518c65dbbcbf1a389b3a106332fc8ede93eec63ea9","txlist_hash":"7d74527f370a78a8dca189b60657f9fd15c27ba5f875344546bb8d6e5b54c8c5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(253,310053,'insert','blocks','{"block_hash":"a8b5f253df293037e49b998675620d5477445c51d5ec66596e023282bb9cd305","block_index":310054,"block_time":310054000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(254,310054,'parse','blocks','{"block_index":310054,"ledger_hash":"b96b0d51d6327284f5922b65e5d023afd2b2e44c9e11f435afbe2a71df4e6eb2","messages_hash":"cfe641f06ebaae19e0167a07956bfc6af2b8022e00f50d59d079ae6a94344aa4","txlist_hash":"70b8a2eccd5c79e1c270abfdf683dc4423ff315a62486db9e5972a12daaf60ea"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(255,310054,'insert','blocks','{"block_hash":"4b069152e2dc82e96ed8a3c3547c162e8c3aceeb2a4ac07972f8321a535b9356","block_index":310055,"block_time":310055000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(256,310055,'parse','blocks','{"block_index":310055,"ledger_hash":"c5be3fc23a9c41b7b78cc7df4ed13d1d35fdd7edab77c998cef5a5a5fe2a7d33","messages_hash":"f398b87ef1257c5cd5f6a09fb7f51a4cbe1687066f25433446f94847cbb8a899","txlist_hash":"0072c2fbc0915dcc39103950d4a48feba19eac28bde001d3dfe0f9ddc25e5152"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(257,310055,'insert','blocks','{"block_hash":"7603eaed418971b745256742f9d2ba70b2c2b2f69f61de6cc70e61ce0336f9d3","block_index":310056,"block_time":310056000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(258,310056,'parse','blocks','{"block_index":310056,"ledger_hash":"faa7cf6128f229fe3d408797c77ef2972eb28d16542b32ec87c5fd42d2495018","messages_hash":"ef875ddfb4443cd94d86deac01673964c5f3d1ed4b3afaa0d131445562ce64f8","txlist_hash":"46c53b0ab86b04c06e8302726aeed5922fb5b3d940102422c53bdf4bafe285e4"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(259,310056,'insert','blocks','{"block_hash":"4a5fdc84f2d66ecb6ee3e3646aad20751ce8694e64e348d3c8aab09d33a3e411","block_index":310057,"block_time":310057000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(260,310057,'parse','blocks','{"block_index":310057,"ledger_hash":"135af680c59a3d707ff3e6b67fbbb0aaaf0a97724d36ba584087658ae8c0db19","messages_hash":"98310bdd2da785732bfa6de62ba2f2fbd5d103f4204ff7d1b43fed584907693d","txlist_hash":"8b3fe70c1d1b8fa1a247810dfbc2667ca0307860c112002e47107fe4836b8138"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(261,310057,'insert','blocks','{"block_hash":"a6eef3089896f0cae0bfe9423392e45c48f4efe4310b14d8cfbdb1fea613635f","block_index":310058,"block_time":310058000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(262,310058,'parse','blocks','{"block_index":310058,"ledger_hash":"496b559ef740feabe42d55356bc770bab7b927d79260c22848b7f47d51918f11","messages_hash":"5fe661842a118ac1eeb5382d6bb92d8039390ee68fcf9cce1441839dcc558c9a","txlist_hash":"ddbb4db386fab0fbbb7edee7c7c45676f994d6feb088f50b0f3edaddcc809e47"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(263,310058,'insert','blocks','{"block_hash":"ab505de874c43f97c90be1c26a769e6c5cb140405c993b4a6cc7afc795f156a9","block_index":310059,"block_time":310059000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(264,310059,'parse','blocks','{"block_index":310059,"ledger_hash":"608eb77e572aa596c9e14c6e4cb1dc1993bcbcfe735cf0453124c2801192ecc9","messages_hash":"00ed7b98e21c3dc58d1ee6c41389fbf40e86522758fed197cf39ef3a7274dbc9","txlist_hash":"b8d3a5abf9edc13434594de8ec0cdf3b760f6917798eab89ff2a6a4f0bda06d9"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(265,310059,'insert','blocks','{"block_hash":"974ad5fbef621e0a38eab811608dc9afaf10c8ecc85fed913075ba1a145e889b","block_index":310060,"block_time":310060000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(266,310060,'parse','blocks','{"block_index":310060,"ledger_hash":"bc5c375d1237425486c9f46bd749fba20b5635bcaf3e2d9178b35ddfbb700f14","messages_hash":"4d91b8cb3b7b5363ac2e84f7f3d2f5e52207ef68bae865e09bf9fc89aa42d60a","txlist_hash":"1766568459fde2e95dbe4a1c1b73a37b6f8443dc1ec36cb44a38fadd95d8f807"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(267,310060,'insert','blocks','{"block_hash":"35d267d21ad386e7b7632292af1c422b0310dde7ca49a82f9577525a29c138cf","block_index":310061,"block_time":310061000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(268,310061,'parse','blocks','{"block_index":310061,"ledger_hash":"c6d48d72746c0e18fa0f1b0b16f663869be2c4684a9d98b634e691ea495f4d81","messages_hash":"d47acf46ad59983e01b9e681527ed2068076ab781880c571426aa808fe36c424","txlist_hash":"9f6619aae8ab667b4291ec14e89386177dec7f3465def984144d2991d10476ab"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(269,310061,'insert','blocks','{"block_hash":"b31a0054145319ef9de8c1cb19df5bcf4dc8a1ece20053aa494e5d3a00a2852f","block_index":310062,"block_time":310062000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(270,310062,'parse','blocks','{"block_index":310062,"ledger_hash":"8deffdb1602f1aa2d0d1956d2297ba30ac78901ea27eb223ad8bf7ca83b18110","messages_hash":"8b051844cfce3c15973994e593d4cd84023384ef7d6e4b0c0fe4d2242f68ec6b","txlist_hash":"278612a215aec2522b38d2ddd268f051906a858996b526fa53c48743b1f33c2e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(271,310062,'insert','blocks','{"block_hash":"0cbcbcd5b7f2dc288e3a34eab3d4212463a5a56e886804fb4f9f1cf929eadebe","block_index":310063,"block_time":310063000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(272,310063,'parse','blocks','{"block_index":310063,"ledger_hash":"34859861f240c6553ffbf63fff9bc884f231276ec6173964d5fc6641a6d79b16","messages_hash":"dcba300d4efc36a2324491e29a6b0001868b33ab1be391102cef110552178e78","txlist_hash":"a884effb413598885693dd0eed419a3a2a35db95fe4d6582e580bc141f28377c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(273,310063,'insert','blocks','{"block_hash":"e2db8065a195e85cde9ddb868a17d39893a60fb2b1255aa5f0c88729de7cbf30","block_index":310064,"block_time":310064000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(274,310064,'parse','blocks','{"block_index":310064,"ledger_hash":"fa185f9b97a1666ce3b966dc09b8a7870ba55896a54a54f54d3420708d5a8ae0","messages_hash":"d18f5fc35609a49d75347c92c7c9a483e35d9c4192503782bafe4478043ba4c2","txlist_hash":"070c320cd53cca3d81560367d437e1f4cb2afb10ab6339e2f1cfb0a2dd6d6063"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(275,310064,'insert','blocks','{"block_hash":"8a7bc7a77c831ac4fd11b8a9d22d1b6a0661b07cef05c2e600c7fb683b861d2a","block_index":310065,"block_time":310065000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(276,310065,'parse','blocks','{"block_index":310065,"ledger_hash":"9f75da9f944d59b1841d690b2994ead7fb0ee3d679ddbdb0b692e49238f66603","messages_hash":"18be484e57b9cf23147d188a114137c5948a5b53cd19d657dd973dd265ecd564","txlist_hash":"fb310206b118e11d48becbd11a695199fd7cc3553dd8b2a7c29c6a927f5bafb7"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(277,310065,'insert','blocks','{"block_hash":"b6959be51eb084747d301f7ccaf9e75f2292c9404633b1532e3692659939430d","block_index":310066,"block_time":310066000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(278,310066,'parse','blocks','{"block_index":310066,"ledger_hash":"4740587d203632d1b4061343436e25e12941f0f80be03c3ab390a1c08b842b59","messages_hash":"3443a7b0bee87c7ced9d66afce89399e945d14d182019f4dbc2c014c59abe58f","txlist_hash":"041e6429d7ad46da6e1a2547daf274a0df952ac4f9b43eaadfeafa6e005141d6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(279,310066,'insert','blocks','{"block_hash":"8b08eae98d7193c9c01863fac6effb9162bda010daeacf9e0347112f233b8577","block_index":310067,"block_time":310067000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(280,310067,'parse','blocks','{"block_index":310067,"ledger_hash":"d6eecb0ca22f29b50e52cd5dec8f408250a7b1ddc61bfa9bf6cc6ef0a85a6ffc","messages_hash":"169a650e89d34830da0f077b7efebb0a64f43b59d725abf94e3c84ac8b6da6a8","txlist_hash":"f8e9baf27b01e99db390d6ee2e06b8ac7d92951c331d8240fdf0dd711ad75979"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(281,310067,'insert','blocks','{"block_hash":"9280e7297ef6313341bc81787a36acfc9af58f83a415afff5e3154f126cf52b5","block_index":310068,"block_time":310068000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(282,310068,'parse','blocks','{"block_index":310068,"ledger_hash":"1508605d4796eb2d8b0553b307827f570b5020f4cacf773926b6c8f2c1b003c8","messages_hash":"e0b7f166b6b82211e67aec109d3181bee7c6b48dd68f610b57e9a6c0089ce0c8","txlist_hash":"fe7a135af64a7668cee07a66fa146b6a7a54fc78b96eb7c62d0bbd8b8ec4a820"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(283,310068,'insert','blocks','{"block_hash":"486351f0655bf594ffaab1980cff17353b640b63e9c27239109addece189a6f7","block_index":310069,"block_time":310069000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(284,310069,'parse','blocks','{"block_index":310069,"ledger_hash":"ea7afbe0817cfef5a5a940bf88b057d01d092182dd5d0c7fd156b6750fdf4cb2","messages_hash":"50be0edf30243d3f05b2d04582b092f02a3bf48cc36592364f244f1406a7d42e","txlist_hash":"561526733017c46e8f7476f6f7f0a1c317a372adf6ccbe2a34e4d8b0fee1a694"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(285,310069,'insert','blocks','{"block_hash":"8739e99f4dee8bebf1332f37f49a125348b40b93b74fe35579dd52bfba4fa7e5","block_index":310070,"block_time":310070000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(286,310070,'parse','blocks','{"block_index":310070,"ledger_hash":"f805d8bd0b724ffeb9e466367e8524bcbcf2c0fe0525b8ff2707af2013824a2c","messages_hash":"99c95d813c0af76a0ba787330b43f1b3eef9c9c12956c734057f5d6af3f173af","txlist_hash":"4c10a876e31ee15289cd2d82d8771bd9aaffd0e335c6de15f8d5316e6e7ee81a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(287,310070,'insert','blocks','{"block_hash":"7a099aa1bba0ead577f1e44f35263a1f115ed6a868c98d4dd71609072ae7f80b","block_index":310071,"block_time":310071000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(288,310071,'parse','blocks','{"block_index":310071,"ledger_hash":"305123423486d17e97e8370399b9079a35977465e4cf8c5b33d50bd7004b463b","messages_hash":"600a392fef1ffc97b4862a0eabf83f8bca0be5eacbe68f1a72daa1c9ee52960e","txlist_hash":"660d6afeecb2375668200669bac5cf258dbd18b0f61213eb01d29e133a45917c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(289,310071,'insert','blocks','{"block_hash":"7b17ecedc07552551b8129e068ae67cb176ca766ea3f6df74b597a94e3a7fc8a","block_index":310072,"block_time":310072000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(290,310072,'parse','blocks','{"block_index":310072,"ledger_hash":"b04fcd2cf46165fa31626b476aa06f9ad8c8cd1d5aa1cfdc014e0d55fa7e0761","messages_hash":"cd91c870d87762425a917c044f5f2f1e3f03abcd3f574f6b738fcf83786a0c09","txlist_hash":"0791350dc66254e276bfea1651fdda43705668f461f5451fd91fb7e084b26aa2"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(291,310072,'insert','blocks','{"block_hash":"ee0fe3cc9b3a48a2746b6090b63b442b97ea6055d48edcf4b2288396764c6943","block_index":310073,"block_time":310073000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(292,310073,'parse','blocks','{"block_index":310073,"ledger_hash":"209f05567343042c8a9172138cc14e28a2e53f9addf16c7affa469fbea9728ae","messages_hash":"42f0c487366bef15ee290608623baa2021b3106933ea6c19c13c889175f25052","txlist_hash":"4885e82f77b273e102f9019b8451e08910a7d98daf19366a0a2b9db779352c0f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(293,310073,'insert','blocks','{"block_hash":"ceab38dfde01f711a187601731ad575d67cfe0b7dbc61dcd4f15baaef72089fb","block_index":310074,"block_time":310074000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(294,310074,'parse','blocks','{"block_index":310074,"ledger_hash":"fc18c0dcd6011c4147575f09bdc6e1eb0e6ae7d3144339859054df458651618a","messages_hash":"7cda3663089c12d62dcf16687d67e6c815f59ee61d49b6c7fbf1acef8ff8ad5a","txlist_hash":"49cbefb674e3da718d86151b10bb37755e158a2bdca642a542897361f15fde66"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(295,310074,'insert','blocks','{"block_hash":"ef547198c6e36d829f117cfd7077ccde45158e3c545152225fa24dba7a26847b","block_index":310075,"block_time":310075000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(296,310075,'parse','blocks','{"block_index":310075,"ledger_hash":"f304dbebd02e4536b1754502e6f51e058ed309fdf95a2db8329dd7e5635824ad","messages_hash":"19e396d72aff42647cd89d62de2fc077cd5bef0a338dc80d2b23ebd2d3156de5","txlist_hash":"b5e7c72a91d779334162c8fcb6282c7e5baeb43ef83d8f8c0eeb4dd0579f0916"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(297,310075,'insert','blocks','{"block_hash":"3b0499c2e8e8f0252c7288d4ecf66efc426ca37aad3524424d14c8bc6f8b0d92","block_index":310076,"block_time":310076000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(298,310076,'parse','blocks','{"block_index":310076,"ledger_hash":"f39c071315c869425bdbcf05ff84130a0860f5f47b4f851cea970f58a6edc9f8","messages_hash":"4045738813eb927f7543bde1971329d6f09a7fde63e8d1392a1600c226474aad","txlist_hash":"e399bd32bd2988f29b4fb003686b343bd72ae59297412480a359bd56ded23ca5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(299,310076,'insert','blocks','{"block_hash":"d2adeefa9024ab3ff2822bc36acf19b6c647cea118cf15b86c6bc00c3322e7dd","block_index":310077,"block_time":310077000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(300,310077,'parse','blocks','{"block_index":310077,"ledger_hash":"20624d783cd8e82044df58c05e6171a744505df43623d9c2a828c1331f505ca8","messages_hash":"94b7908b589b1c80ea4dd88f05ffe997d078ad2c78b8cad6265626b6d5317132","txlist_hash":"c587d5426925227ed7d0ef11834b5bb1291fcf0ea3f0bcac864e4356187b6a10"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(301,310077,'insert','blocks','{"block_hash":"f6c17115ef0efe489c562bcda4615892b4d4b39db0c9791fe193d4922bd82cd6","block_index":310078,"block_time":310078000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(302,310078,'parse','blocks','{"block_index":310078,"ledger_hash":"41ae6610121587bd8171a02da3c50645e8e6d3642aef2c560d46f12707506b66","messages_hash":"365f46087a06fe2306b2c30b88bc3f6779f93b82a0d9496e2674f48e4665cf85","txlist_hash":"c8331e225af242d83e283889e6234d601ecb507373f4b7de891b8508d1b7b1b6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(303,310078,'insert','blocks','{"block_hash":"f2fbd2074d804e631db44cb0fb2e1db3fdc367e439c21ffc40d73104c4d7069c","block_index":310079,"block_time":310079000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(304,310079,'parse','blocks','{"block_index":310079,"ledger_hash":"bbc2068f2a4b47c86198a5cb7242e26f385077126c7a3294eca6607485b1170b","messages_hash":"10181469a6450a20a15d45b37942f7dc0ed689640e6555c0ea58b587ec3cbcb2","txlist_hash":"42ee671f6b45a8e36b4e57dc7edaa2501b075eb75bcfce535435ee4c0cdf2e66"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(305,310079,'insert','blocks','{"block_hash":"42943b914d9c367000a78b78a544cc4b84b1df838aadde33fe730964a89a3a6c","block_index":310080,"block_time":310080000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(306,310080,'parse','blocks','{"block_index":310080,"ledger_hash":"fc4350d187ec74fa6dfbbca7f6c51849b78356f853c6c713d10ae4a39ee4f7e2","messages_hash":"e753c18bbf377d74cfe933f4e53a00faf32d066f750c6170e31fae4597c446c0","txlist_hash":"f35b5543ac99e33a4ea6fb61b688d06a2b5b9cc79776df32c24e848b5dad80c0"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(307,310080,'insert','blocks','{"block_hash":"6554f9d307976249e7b7e260e08046b3b55d318f8b6af627fed5be3063f123c4","block_index":310081,"block_time":310081000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(308,310081,'parse','blocks','{"block_index":310081,"ledger_hash":"3cadb90f0285d3e3bb107caa2165e88d855cfa057fcff1fccfb278a8f64c9b1c","messages_hash":"bdb06802e00a851facaccffd4e7e0469e99171891e68338fa5c108a59c09e184","txlist_hash":"3ff813ab5112e5adf9f50936955db90036ed0e2ba309022002c69e81473d7c04"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(309,310081,'insert','blocks','{"block_hash":"4f1ef91b1dcd575f8ac2e66a67715500cbca154bd6f3b8148bb7015a6aa6c644","block_index":310082,"block_time":310082000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(310,310082,'parse','blocks','{"block_index":310082,"ledger_hash":"f3390bff59484b5ce0d84f5034fc88f4d862334ef3c0d7addaa9be7f0e67006f","messages_hash":"91548b15232ca3271660eaed9e543d6027ad088d34286d8abdfe4184b3fb91db","txlist_hash":"3d843f898e46d0ec4c4cf79709ec7326a0e45d44361a2c9fe45e546bd5f1e630"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(311,310082,'insert','blocks','{"block_hash":"9b1f6fd6ff9b0dc4e37603cfb0625f49067c775b99e12492afd85392d3c8d850","block_index":310083,"block_time":310083000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(312,310083,'parse','blocks','{"block_index":310083,"ledger_hash":"0354bf318eaec5c79b4a7835c76c89f373ab0e413f9fe4ebdea442f57763a971","messages_hash":"290b3b825f0ac859bbd2db052280d1f45898734f0f89b8fccf96672f6730217f","txlist_hash":"6405368df02c1207da46178c106ac287c7c90e5b87a98154aa938f6ef5a570d1"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(313,310083,'insert','blocks','{"block_hash":"1e0972523e80306441b9f4157f171716199f1428db2e818a7f7817ccdc8859e3","block_index":310084,"block_time":310084000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(314,310084,'parse','blocks','{"block_index":310084,"ledger_hash":"e22b7a64e15ded24f6c54a5f627354dd2c3ed8175c2f4cd31aa5a6789d7b67e4","messages_hash":"b4f9a9c17f2c4a6bb4fd1a99d9d3ade15eee4ca747d8c5f1132c777d2cf8e04a","txlist_hash":"6f58e857b2891d43f22bb4b44d296ff18f3078de01cf90aeed104283d66342a2"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(315,310084,'insert','blocks','{"block_hash":"c5b6e9581831e3bc5848cd7630c499bca26d9ece5156d36579bdb72d54817e34","block_index":310085,"block_time":310085000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(316,310085,'parse','blocks','{"block_index":310085,"ledger_hash":"7b8a6f62709cf4d20820031f43d968ea46d73d8cee4ad40f414da60b9be4e676","messages_hash":"89b34eb4cd1d69d9c578c7d6181985d828e55b6b926bf562c3117dd8b39971bd","txlist_hash":"51c8a62f3e4c43e6eea75410efb977c8ddd2ad8e64c0d6ce6f63a4e5eb153400"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(317,310085,'insert','blocks','{"block_hash":"080c1dc55a4ecf4824cf9840602498cfc35b5f84099f50b71b45cb63834c7a78","block_index":310086,"block_time":310086000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(318,310086,'parse','blocks','{"block_index":310086,"ledger_hash":"ae82ee2f7f1e075937b5b8eef065f8643a7bef0428e00689ee773558905eef19","messages_hash":"845f79869780ce25161caef376dca496190611dbaf591d4b1617202eb1ec6035","txlist_hash":"7358e41e9a61f87d68cc6851768346daea2e100ab896e86c0047e47228e6cc29"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(319,310086,'insert','blocks','{"block_hash":"4ec8cb1c38b22904e8087a034a6406b896eff4dd28e7620601c6bddf82e2738c","block_index":310087,"block_time":310087000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(320,310087,'parse','blocks','{"block_index":310087,"ledger_hash":"ced371f1349e81cc2f179f064e4b9b202650a0f79e9b4513666ace29f0e8b3cb","messages_hash":"89835847f0386b5a4a4e4f748f643a22b6bef41b1bbd51c9ee6fa3f3526f0899","txlist_hash":"0e8cd750f8ad91d5b14d2b05b7c03621367036703bed1654555b94592ff41e11"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(321,310087,'insert','blocks','{"block_hash":"e945c815c433cbddd0bf8e66c5c23b51072483492acda98f5c2c201020a8c5b3","block_index":310088,"block_time":310088000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(322,310088,'parse','blocks','{"block_index":310088,"ledger_hash":"6c343897092c5dfcd32ee96dc8b96f38fedd31fa58cf5757a3e15a254942cd59","messages_hash":"18faa2da192eaf7d4e7e3ee72a09c146966ce3bae7e2dfe4148d09ec26f6a4fb","txlist_hash":"c38a183db86650f155005a8828155aaf2fc6d92aa89066d7f0843a123800d771"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(323,310088,'insert','blocks','{"block_hash":"0382437f895ef3e7e38bf025fd4f606fd44d4bbd6aea71dbdc4ed11a7cd46f33","block_index":310089,"block_time":310089000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(324,310089,'parse','blocks','{"block_index":310089,"ledger_hash":"abc7afdaefa89bf58bc4c28401740657eca24c902ba551f55becb6a1c8992675","messages_hash":"0ed9475500a23bd1df5d9cc2675c3dbe28b137f251b9ce51aeb0e268cc5e1186","txlist_hash":"609b4f777892b43541593da80d09aa2c3928f2f73600009615196a7f89ca8123"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(325,310089,'insert','blocks','{"block_hash":"b756db71dc037b5a4582de354a3347371267d31ebda453e152f0a13bb2fae969","block_index":310090,"block_time":310090000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(326,310090,'parse','blocks','{"block_index":310090,"ledger_hash":"4c8ca9b4eeae7adfec822b20665e7bd6fecb51d4f30cc2c826f18402d8401a9b","messages_hash":"1192140c5046ed35037f88bc7dd4fe2a013a2c02a98b861e47b48eb19d80c7c0","txlist_hash":"fba4f7514306c49b3045912791cc21a26527a23e58dcb1c8adc5563e5c6e901d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(327,310090,'insert','blocks','{"block_hash":"734a9aa485f36399d5efb74f3b9c47f8b5f6fd68c9967f134b14cfe7e2d7583c","block_index":310091,"block_time":310091000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(328,310091,'parse','blocks','{"block_index":310091,"ledger_hash":"fe7fd2b60c3216d79dfe4e6d38880f6d3b9fde747b619f2c477108825235663d","messages_hash":"51f6f931459ba6a532c7c74d462deb1b0a54da7e011486c6af3056b2e65f195b","txlist_hash":"3a62ce0eeff09c242b3a7c3a8da6dd20bf06c1c2fbf224f73646791557ce3d4c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(329,310091,'insert','blocks','{"block_hash":"56386beb65f9228740d4ad43a1c575645f6daf59e0dd9f22551c59215b5e8c3d","block_index":310092,"block_time":310092000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(330,310092,'parse','blocks','{"block_index":310092,"ledger_hash":"420b8ff3c159f7e89df2274682e7ef798a0c0233149365114bfd934c38806098","messages_hash":"49487109a4081406fc52526bbedfe3a2f93e749a4685b1633ead6342bf3dd7a0","txlist_hash":"9c866b1985d2ff084264e192e5defce4af96b7aca461a46f58c659008113909a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(331,310092,'insert','blocks','{"block_hash":"a74a2425f2f4be24bb5f715173e6756649e1cbf1b064aeb1ef60e0b94b418ddc","block_index":310093,"block_time":310093000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(332,310093,'parse','blocks','{"block_index":310093,"ledger_hash":"f4fac6a570b4f6332a628a3f8e27f5f081689fb4255363cff1cd8bd0244eecea","messages_hash":"6e9c8dcec7ecbd5d027c038f873ae53e2cc970f49fdd98b3a786fe3c113c38ee","txlist_hash":"271c5484d7a74166a1b83e9dc6f56cc391d5b01829c9b594deb087e58a22b762"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(333,310093,'insert','blocks','{"block_hash":"2a8f976f20c4e89ff01071915ac96ee35192d54df3a246bf61fd4a0cccfb5b23","block_index":310094,"block_time":310094000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(334,310094,'parse','blocks','{"block_index":310094,"ledger_hash":"adea7b4cacc06ba1f7dc260f30039943936f5baeecf5a8a452d4cbcaa994a70d","messages_hash":"c8e0c6e52ed6e0dc0d9b2a7cecaa8b53aa2e36e847c0fb20c0c8ef6029700aa6","txlist_hash":"7d8deca0e4f444c015cdf98c74255215af14198d17619640186c6486bb3a6be6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(335,310094,'insert','blocks','{"block_hash":"bed0fa40c9981223fb40b3be8124ca619edc9dd34d0c907369477ea92e5d2cd2","block_index":310095,"block_time":310095000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(336,310095,'parse','blocks','{"block_index":310095,"ledger_hash":"a2290c6a24befab16b4d9ed768c3129d582edbafdf8a2326c7ed50397e5db674","messages_hash":"142676e0c4985556d710f23cd93b06f98864f2322b458ff58c0ae3e3dff4e5c5","txlist_hash":"8bab183d2c7670f060de1a64663fe4ec602cc9df957a4d1ccd4b2c5e4876e5ab"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(337,310095,'insert','blocks','{"block_hash":"306aeec3db435fabffdf88c2f26ee83caa4c2426375a33daa2be041dbd27ea2f","block_index":310096,"block_time":310096000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(338,310096,'parse','blocks','{"block_index":310096,"ledger_hash":"b3c321ea2fb119cbaacfb39f219be47cb346cdd40d895980afd34b4157a3b7ec","messages_hash":"b2ff4518567b1d1defaebb078146815cc39ab11dc19d392a5d20d299867aa6da","txlist_hash":"6997f2cf50cb2331a8d5cea3f97b32b41a9c40b6006041939b21008016e013c8"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(339,310096,'insert','blocks','{"block_hash":"13e8e16e67c7cdcc80d477491e554b43744f90e8e1a9728439a11fab42cefadf","block_index":310097,"block_time":310097000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(340,310097,'parse','blocks','{"block_index":310097,"ledger_hash":"456a1bd4d6b30f24e798a9c1f975af109db030b0bca19db6b29788f938ce6c4d","messages_hash":"11771c3c0ce2f3d5e74539f731ce50c4f34cc01f80b3c32c6136080272e8b448","txlist_hash":"bd930dddbfc97b06fba95a33417533bd58fd5e95326d8677d2939790850a67de"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(341,310097,'insert','blocks','{"block_hash":"ca5bca4b5ec4fa6183e05176abe921cff884c4e20910fab55b603cef48dc3bca","block_index":310098,"block_time":310098000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(342,310098,'parse','blocks','{"block_index":310098,"ledger_hash":"f48d6574488a24155420ae76aa7dcecfe73f6a262a2434a96eb2e93f6bbf02b6","messages_hash":"4ba3a4a60a0c079e27df1ae65619cee9ef2aedc4ab595b55871fd36c6dca22c6","txlist_hash":"bf2e65b5a1da6ac499a4ebcde81b607f6516de77ed2a10ff363ddb05dd8e288d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(343,310098,'insert','blocks','{"block_hash":"3c4c2279cd7de0add5ec469648a845875495a7d54ebfb5b012dcc5a197b7992a","block_index":310099,"block_time":310099000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(344,310099,'parse','blocks','{"block_index":310099,"ledger_hash":"e936debeb5d219215ba24e56ed34edb435131877c2947c0801824155fdc70c05","messages_hash":"ce9c5786ef39b2358c92af86f3ab6a58251b47487128de33ea86a2d817d74d8d","txlist_hash":"d18b9514ed9fda087d3c98eca75ea68388964396143b925cc58ce2e2d5c1c5da"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(345,310099,'insert','blocks','{"block_hash":"96925c05b3c7c80c716f5bef68d161c71d044252c766ca0e3f17f255764242cb","block_index":310100,"block_time":310100000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(346,310100,'parse','blocks','{"block_index":310100,"ledger_hash":"2b033a615b9eb693ed59daca9bc047f61a3519bec5c2b64f968cf717c75afe79","messages_hash":"00c15802e74c7874cd843b0412cc13a263fce9d4cf4f05dbf222ae1558676140","txlist_hash":"1c39371c274124af6085dcf02fcdfda68d36d261bb47d7763ea3f09b70d0f62b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(347,310100,'insert','blocks','{"block_hash":"369472409995ca1a2ebecbad6bf9dab38c378ab1e67e1bdf13d4ce1346731cd6","block_index":310101,"block_time":310101000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(348,310101,'parse','blocks','{"block_index":310101,"ledger_hash":"6a41dd11d8b611f6fde79e06a4f65d20fc15419f8336646130c02e9f7d87eff4","messages_hash":"9c5d561b9fd34987179149f2720b511024f0a434b35cb960b4185e80596c7697","txlist_hash":"e2c84c519b3d759f8efb016894a981411328df6f0a778835c95ed4116fef01f5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(0,NULL,0,'insert','blocks','{"block_hash":"8b3bef249cb3b0fa23a4936c1249b6bd41daeadc848c8d2e409ea1cbc10adfe7","block_index":309999,"block_time":309999000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1,NULL,309999,'parse','blocks','{"block_index":309999,"ledger_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","messages_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","txlist_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(2,NULL,309999,'insert','blocks','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(3,NULL,310000,'insert','transactions','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"btc_amount":62000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"9b6b1abb696d8d1b70c5beed046d7cddd23cd95b69ef18946cb18c5b56cfde30","tx_index":1}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(4,NULL,310000,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310000,"calling_function":"burn","event":"9b6b1abb696d8d1b70c5beed046d7cddd23cd95b69ef18946cb18c5b56cfde30","quantity":93000000000,"tx_index":1}',0,'CREDIT');
+INSERT INTO messages VALUES(5,NULL,310000,'insert','burns','{"block_index":310000,"burned":62000000,"earned":93000000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"9b6b1abb696d8d1b70c5beed046d7cddd23cd95b69ef18946cb18c5b56cfde30","tx_index":1}',0,'BURN');
+INSERT INTO messages VALUES(6,NULL,310000,'parse','blocks','{"block_index":310000,"ledger_hash":"98ccdf7cd2fb29a8a01cbed5f133b70b6966c6c56354dad00baacedd0673c87e","messages_hash":"b364e4b262b19375281c08af25e2ce24e68e5ec3fb881f680c318fc258e9b02b","txlist_hash":"faf6476a908c85f6e26ca5d182688d6da3f326296602d5ad3aa5979cb8bc110b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(7,NULL,310000,'insert','blocks','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(8,NULL,310001,'insert','transactions','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"btc_amount":1000,"data":"0000000000000000000000010000000002faf080","destination":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"58e839ec2b1584d3474014093393ce57e5c22d6e686213ee4a7a0abe7bbac33c","tx_index":2}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(9,NULL,310001,'insert','debits','{"action":"send","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310001,"event":"58e839ec2b1584d3474014093393ce57e5c22d6e686213ee4a7a0abe7bbac33c","quantity":50000000,"tx_index":2}',0,'DEBIT');
+INSERT INTO messages VALUES(10,NULL,310001,'insert','credits','{"address":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310001,"calling_function":"send","event":"58e839ec2b1584d3474014093393ce57e5c22d6e686213ee4a7a0abe7bbac33c","quantity":50000000,"tx_index":2}',0,'CREDIT');
+INSERT INTO messages VALUES(11,NULL,310001,'insert','sends','{"asset":"XCP","block_index":310001,"destination":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","quantity":50000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"58e839ec2b1584d3474014093393ce57e5c22d6e686213ee4a7a0abe7bbac33c","tx_index":2}',0,'SEND');
+INSERT INTO messages VALUES(12,NULL,310001,'parse','transactions','{"supported":true,"tx_hash":"58e839ec2b1584d3474014093393ce57e5c22d6e686213ee4a7a0abe7bbac33c","tx_index":2}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(13,NULL,310001,'parse','blocks','{"block_index":310001,"ledger_hash":"fd43dc5efe2ee796ef7d24f8d478a67aa58bf85f538ef4b9a49b983a315deb26","messages_hash":"508f3f345fea51bf28a58de66ce187d1de1f66b1aaf1f2752e6bdbb459d253ac","txlist_hash":"544f7958bf7661b78699c708ba1097da0dbb044acee3d1d8aa9a32d6b659a14d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(14,NULL,310001,'insert','blocks','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(15,NULL,310002,'insert','transactions','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"btc_amount":0,"data":"0000000a00000000000000000000000002faf08000000000000000010000000005f5e100000a0000000000000000","destination":"","fee":1000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"332b030da57b9565324df01414778b1eafbee6c52343fea80774ee1725484367","tx_index":3}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(16,NULL,310002,'insert','orders','{"block_index":310002,"expiration":10,"expire_index":310012,"fee_provided":1000000,"fee_provided_remaining":1000000,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":100000000,"get_remaining":100000000,"give_asset":"BTC","give_quantity":50000000,"give_remaining":50000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","tx_hash":"332b030da57b9565324df01414778b1eafbee6c52343fea80774ee1725484367","tx_index":3}',0,'OPEN_ORDER');
+INSERT INTO messages VALUES(17,NULL,310002,'parse','transactions','{"supported":true,"tx_hash":"332b030da57b9565324df01414778b1eafbee6c52343fea80774ee1725484367","tx_index":3}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(18,NULL,310002,'parse','blocks','{"block_index":310002,"ledger_hash":"dbae4fff32545b4f3c104fb5a051dcaeacecd27401c84c09f93923b8bc30eab5","messages_hash":"433747661a40185a36239da6ba39d8d3fe35bfb8080a674d6d46e74f7c71fe9a","txlist_hash":"ee37e75a4eba165ed448b7cf96d188d7f738aca4d90a781c7f473974e12564d5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(19,NULL,310002,'insert','blocks','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(20,NULL,310003,'insert','transactions','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"btc_amount":0,"data":"0000000a00000000000000010000000006422c4000000000000000000000000002faf080000a00000000000dbba0","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f","tx_index":4}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(21,NULL,310003,'insert','debits','{"action":"open order","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310003,"event":"f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f","quantity":105000000,"tx_index":4}',0,'DEBIT');
+INSERT INTO messages VALUES(22,NULL,310003,'insert','orders','{"block_index":310003,"expiration":10,"expire_index":310013,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":900000,"fee_required_remaining":900000,"get_asset":"BTC","get_quantity":50000000,"get_remaining":50000000,"give_asset":"XCP","give_quantity":105000000,"give_remaining":105000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","tx_hash":"f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f","tx_index":4}',0,'OPEN_ORDER');
+INSERT INTO messages VALUES(23,NULL,310003,'update','orders','{"fee_provided_remaining":142858,"fee_required_remaining":0,"get_remaining":0,"give_remaining":0,"status":"open","tx_hash":"332b030da57b9565324df01414778b1eafbee6c52343fea80774ee1725484367"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(24,NULL,310003,'update','orders','{"fee_provided_remaining":6800,"fee_required_remaining":42858,"get_remaining":0,"give_remaining":5000000,"status":"open","tx_hash":"f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(25,NULL,310003,'insert','order_matches','{"backward_asset":"XCP","backward_quantity":100000000,"block_index":310003,"fee_paid":857142,"forward_asset":"BTC","forward_quantity":50000000,"id":"332b030da57b9565324df01414778b1eafbee6c52343fea80774ee1725484367_f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f","match_expire_index":310023,"status":"pending","tx0_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx0_block_index":310002,"tx0_expiration":10,"tx0_hash":"332b030da57b9565324df01414778b1eafbee6c52343fea80774ee1725484367","tx0_index":3,"tx1_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx1_block_index":310003,"tx1_expiration":10,"tx1_hash":"f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f","tx1_index":4}',0,'ORDER_MATCH');
+INSERT INTO messages VALUES(26,NULL,310003,'parse','transactions','{"supported":true,"tx_hash":"f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f","tx_index":4}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(27,NULL,310003,'parse','blocks','{"block_index":310003,"ledger_hash":"fd0ae9793d9513540246b94ad116fc0531e8e07b2c014752e175a12e2a7a82d4","messages_hash":"01a5158be117031c2249b66ea64def6a7fa907cc99484335d67fadf9b747f3e2","txlist_hash":"107902b17490957ebc0d2cb5dba1f5e667e3a393acfd8b3adde9f6b17aaad5c4"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(28,NULL,310003,'insert','blocks','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(29,NULL,310004,'insert','transactions','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"btc_amount":50000000,"data":"0000000b332b030da57b9565324df01414778b1eafbee6c52343fea80774ee1725484367f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":9675,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"ed17dc38233838e15d319a1786825b9e7cdba815554c9d6f4dd527615bce10b8","tx_index":5}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(30,NULL,310004,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310004,"calling_function":"btcpay","event":"ed17dc38233838e15d319a1786825b9e7cdba815554c9d6f4dd527615bce10b8","quantity":100000000,"tx_index":5}',0,'CREDIT');
+INSERT INTO messages VALUES(31,NULL,310004,'update','order_matches','{"id":"332b030da57b9565324df01414778b1eafbee6c52343fea80774ee1725484367_f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f","order_match_id":"332b030da57b9565324df01414778b1eafbee6c52343fea80774ee1725484367_f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f","status":"completed"}',0,'ORDER_MATCH_UPDATE');
+INSERT INTO messages VALUES(32,NULL,310004,'insert','btcpays','{"block_index":310004,"btc_amount":50000000,"destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","order_match_id":"332b030da57b9565324df01414778b1eafbee6c52343fea80774ee1725484367_f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f","source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"ed17dc38233838e15d319a1786825b9e7cdba815554c9d6f4dd527615bce10b8","tx_index":5}',0,'BTC_PAY');
+INSERT INTO messages VALUES(33,NULL,310004,'parse','transactions','{"supported":true,"tx_hash":"ed17dc38233838e15d319a1786825b9e7cdba815554c9d6f4dd527615bce10b8","tx_index":5}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(34,NULL,310004,'parse','blocks','{"block_index":310004,"ledger_hash":"bd894777a85b731155a0d6362766b4220c03db4f3e5fbf030d6c2529cb5f3537","messages_hash":"ffab6b5c0592a131d2ee25f07a31b86d9a35a48ca313bcf129ddeddb84b6b04c","txlist_hash":"65e6a7c64c8439a60fb066d96d5165e6e40974bd1b98812ac6a4172fb1db1511"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(35,NULL,310004,'insert','blocks','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(36,NULL,310005,'insert','transactions','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"btc_amount":0,"data":"000000140000000000004767000000003b9aca000100000000000000000000","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"cd2b44cb56dd5aaae1181c42ab8953ebb9d0fb8e177e960ffe55e3500b3aae25","tx_index":6}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(37,NULL,310005,'insert','debits','{"action":"issuance fee","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310005,"event":"cd2b44cb56dd5aaae1181c42ab8953ebb9d0fb8e177e960ffe55e3500b3aae25","quantity":50000000,"tx_index":6}',0,'DEBIT');
+INSERT INTO messages VALUES(38,NULL,310005,'insert','assets','{"asset_id":"18279","asset_longname":null,"asset_name":"BBBB","block_index":310005}',0,'ASSET_CREATION');
+INSERT INTO messages VALUES(39,NULL,310005,'insert','issuances','{"asset":"BBBB","asset_longname":null,"block_index":310005,"call_date":0,"call_price":0.0,"callable":false,"description":"","divisible":true,"fee_paid":50000000,"issuer":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","locked":false,"quantity":1000000000,"reset":false,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","transfer":false,"tx_hash":"cd2b44cb56dd5aaae1181c42ab8953ebb9d0fb8e177e960ffe55e3500b3aae25","tx_index":6}',0,'ASSET_ISSUANCE');
+INSERT INTO messages VALUES(40,NULL,310005,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBB","block_index":310005,"calling_function":"issuance","event":"cd2b44cb56dd5aaae1181c42ab8953ebb9d0fb8e177e960ffe55e3500b3aae25","quantity":1000000000,"tx_index":6}',0,'CREDIT');
+INSERT INTO messages VALUES(41,NULL,310005,'parse','transactions','{"supported":true,"tx_hash":"cd2b44cb56dd5aaae1181c42ab8953ebb9d0fb8e177e960ffe55e3500b3aae25","tx_index":6}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(42,NULL,310005,'parse','blocks','{"block_index":310005,"ledger_hash":"264c98f1d460f78e52def545d25482fd76549a5309d04841bc27b335f06470a2","messages_hash":"92d9412fe93d5ea10d281e838ab44f67f61078ca1df6e621b48d9e50a01e18e7","txlist_hash":"9ede5548f7cb273af825360a6285fe9a51e9625c9084b2dde7bec013dec24f0e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(43,NULL,310005,'insert','blocks','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(44,NULL,310006,'insert','transactions','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"btc_amount":0,"data":"00000014000000000000476800000000000186a00000000000000000000006666f6f626172","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"ddefdf227fd8cd8df1e77f0b531e98a033d2e5b237fa4331b83c003de54877d9","tx_index":7}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(45,NULL,310006,'insert','debits','{"action":"issuance fee","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310006,"event":"ddefdf227fd8cd8df1e77f0b531e98a033d2e5b237fa4331b83c003de54877d9","quantity":50000000,"tx_index":7}',0,'DEBIT');
+INSERT INTO messages VALUES(46,NULL,310006,'insert','assets','{"asset_id":"18280","asset_longname":null,"asset_name":"BBBC","block_index":310006}',0,'ASSET_CREATION');
+INSERT INTO messages VALUES(47,NULL,310006,'insert','issuances','{"asset":"BBBC","asset_longname":null,"block_index":310006,"call_date":0,"call_price":0.0,"callable":false,"description":"foobar","divisible":false,"fee_paid":50000000,"issuer":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","locked":false,"quantity":100000,"reset":false,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","transfer":false,"tx_hash":"ddefdf227fd8cd8df1e77f0b531e98a033d2e5b237fa4331b83c003de54877d9","tx_index":7}',0,'ASSET_ISSUANCE');
+INSERT INTO messages VALUES(48,NULL,310006,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBC","block_index":310006,"calling_function":"issuance","event":"ddefdf227fd8cd8df1e77f0b531e98a033d2e5b237fa4331b83c003de54877d9","quantity":100000,"tx_index":7}',0,'CREDIT');
+INSERT INTO messages VALUES(49,NULL,310006,'parse','transactions','{"supported":true,"tx_hash":"ddefdf227fd8cd8df1e77f0b531e98a033d2e5b237fa4331b83c003de54877d9","tx_index":7}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(50,NULL,310006,'parse','blocks','{"block_index":310006,"ledger_hash":"a1f2aa5a0b8d030c2fc4e1243c3173319ecf68d232262ea3dc8bfdd03a3f923a","messages_hash":"5259477ce9e5a469ba99387b432342722700d86f80912613aa648460421d5261","txlist_hash":"afa257be6b0f57581b8f1b932b3c8473ff5c89e4bd6c3d3e3dd6a8c3cd9b09d3"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(51,NULL,310006,'insert','blocks','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(52,NULL,310007,'insert','transactions','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"btc_amount":1000,"data":"00000000000000000000476700000000003d0900","destination":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"f337451a19eac3c2fe66daf7d44d39c41a012d2dfd85de90cc3877bbc2e7d30c","tx_index":8}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(53,NULL,310007,'insert','debits','{"action":"send","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBB","block_index":310007,"event":"f337451a19eac3c2fe66daf7d44d39c41a012d2dfd85de90cc3877bbc2e7d30c","quantity":4000000,"tx_index":8}',0,'DEBIT');
+INSERT INTO messages VALUES(54,NULL,310007,'insert','credits','{"address":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBB","block_index":310007,"calling_function":"send","event":"f337451a19eac3c2fe66daf7d44d39c41a012d2dfd85de90cc3877bbc2e7d30c","quantity":4000000,"tx_index":8}',0,'CREDIT');
+INSERT INTO messages VALUES(55,NULL,310007,'insert','sends','{"asset":"BBBB","block_index":310007,"destination":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","quantity":4000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"f337451a19eac3c2fe66daf7d44d39c41a012d2dfd85de90cc3877bbc2e7d30c","tx_index":8}',0,'SEND');
+INSERT INTO messages VALUES(56,NULL,310007,'parse','transactions','{"supported":true,"tx_hash":"f337451a19eac3c2fe66daf7d44d39c41a012d2dfd85de90cc3877bbc2e7d30c","tx_index":8}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(57,NULL,310007,'parse','blocks','{"block_index":310007,"ledger_hash":"8709aa2d5064ea2b7ab51a887d21f5fddcb7046753cd883317b533ed121f8504","messages_hash":"0b9ffff66cfe4698c16889013800547e79cdad7d3f84eff57e14828a3dbe8a52","txlist_hash":"40941bb90c086bd2716de8afc1fba5eb75721143a86a606ef99ee3312de95614"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(58,NULL,310007,'insert','blocks','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(59,NULL,310008,'insert','transactions','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"btc_amount":1000,"data":"000000000000000000004768000000000000020e","destination":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"c639e9482b31b487115b4437dd87cff98338003fabf18066bf051e1164aa4394","tx_index":9}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(60,NULL,310008,'insert','debits','{"action":"send","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBC","block_index":310008,"event":"c639e9482b31b487115b4437dd87cff98338003fabf18066bf051e1164aa4394","quantity":526,"tx_index":9}',0,'DEBIT');
+INSERT INTO messages VALUES(61,NULL,310008,'insert','credits','{"address":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBC","block_index":310008,"calling_function":"send","event":"c639e9482b31b487115b4437dd87cff98338003fabf18066bf051e1164aa4394","quantity":526,"tx_index":9}',0,'CREDIT');
+INSERT INTO messages VALUES(62,NULL,310008,'insert','sends','{"asset":"BBBC","block_index":310008,"destination":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","quantity":526,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"c639e9482b31b487115b4437dd87cff98338003fabf18066bf051e1164aa4394","tx_index":9}',0,'SEND');
+INSERT INTO messages VALUES(63,NULL,310008,'parse','transactions','{"supported":true,"tx_hash":"c639e9482b31b487115b4437dd87cff98338003fabf18066bf051e1164aa4394","tx_index":9}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(64,NULL,310008,'parse','blocks','{"block_index":310008,"ledger_hash":"c1c516176fe38b69b31e3668b5ef20805bd90d3112c77f5652f838af8e7f604a","messages_hash":"7fdd558da169a125a365a206d1606ef1594ce7dc3c8102d9de55a0a08f8036a8","txlist_hash":"9b186632fe722ba57daaa01573568c3d3405f7fcb0a729005a6338266a4debfa"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(65,NULL,310008,'insert','blocks','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(66,NULL,310009,'insert','transactions','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"btc_amount":0,"data":"00000032000000000000025800000000000047670000000000000001","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"7881c1fe7881a590d09302dde67cfd888a74154888e0c310bd01575f560b8ac8","tx_index":10}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(67,NULL,310009,'insert','debits','{"action":"dividend","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310009,"event":"7881c1fe7881a590d09302dde67cfd888a74154888e0c310bd01575f560b8ac8","quantity":24,"tx_index":10}',0,'DEBIT');
+INSERT INTO messages VALUES(68,NULL,310009,'insert','debits','{"action":"dividend fee","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310009,"event":"7881c1fe7881a590d09302dde67cfd888a74154888e0c310bd01575f560b8ac8","quantity":20000,"tx_index":10}',0,'DEBIT');
+INSERT INTO messages VALUES(69,NULL,310009,'insert','credits','{"address":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310009,"calling_function":"dividend","event":"7881c1fe7881a590d09302dde67cfd888a74154888e0c310bd01575f560b8ac8","quantity":24,"tx_index":10}',0,'CREDIT');
+INSERT INTO messages VALUES(70,NULL,310009,'insert','dividends','{"asset":"BBBB","block_index":310009,"dividend_asset":"XCP","fee_paid":20000,"quantity_per_unit":600,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"7881c1fe7881a590d09302dde67cfd888a74154888e0c310bd01575f560b8ac8","tx_index":10}',0,'ASSET_DIVIDEND');
+INSERT INTO messages VALUES(71,NULL,310009,'parse','transactions','{"supported":true,"tx_hash":"7881c1fe7881a590d09302dde67cfd888a74154888e0c310bd01575f560b8ac8","tx_index":10}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(72,NULL,310009,'parse','blocks','{"block_index":310009,"ledger_hash":"ae8ee9e681f0ac96de96babc1c80e5188b3e0cb91074a0dfd8511ee7d0ae64c8","messages_hash":"262ab7169bddff900a7be3663dc902396e4e58f34c0112f1293a2b2040856f03","txlist_hash":"39f4f154cbeae9a65b43ac831b2d5ad0e6f6575b909b979bd4bd97dadbab4cdd"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(73,NULL,310009,'insert','blocks','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(74,NULL,310010,'insert','transactions','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"btc_amount":0,"data":"00000032000000000000032000000000000047680000000000000001","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"c41898ad625e2236110101070c09e9f28b6fea1ed436ecb78f231f3f99f123f7","tx_index":11}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(75,NULL,310010,'insert','debits','{"action":"dividend","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310010,"event":"c41898ad625e2236110101070c09e9f28b6fea1ed436ecb78f231f3f99f123f7","quantity":420800,"tx_index":11}',0,'DEBIT');
+INSERT INTO messages VALUES(76,NULL,310010,'insert','debits','{"action":"dividend fee","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310010,"event":"c41898ad625e2236110101070c09e9f28b6fea1ed436ecb78f231f3f99f123f7","quantity":20000,"tx_index":11}',0,'DEBIT');
+INSERT INTO messages VALUES(77,NULL,310010,'insert','credits','{"address":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310010,"calling_function":"dividend","event":"c41898ad625e2236110101070c09e9f28b6fea1ed436ecb78f231f3f99f123f7","quantity":420800,"tx_index":11}',0,'CREDIT');
+INSERT INTO messages VALUES(78,NULL,310010,'insert','dividends','{"asset":"BBBC","block_index":310010,"dividend_asset":"XCP","fee_paid":20000,"quantity_per_unit":800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"c41898ad625e2236110101070c09e9f28b6fea1ed436ecb78f231f3f99f123f7","tx_index":11}',0,'ASSET_DIVIDEND');
+INSERT INTO messages VALUES(79,NULL,310010,'parse','transactions','{"supported":true,"tx_hash":"c41898ad625e2236110101070c09e9f28b6fea1ed436ecb78f231f3f99f123f7","tx_index":11}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(80,NULL,310010,'parse','blocks','{"block_index":310010,"ledger_hash":"0451ffa5d7ffb0e588e58ac7eacf77f6b3e17f1d27c1039f03d7716b16fb234f","messages_hash":"a363f1f103b4d39b9056e391559737a36c56439c6b3a12854f306dca0e1ed067","txlist_hash":"0cea2e2e06c6423d1c5ba19f6128fbe8fe6d6c3688316c9c35dd31cf03d38c97"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(81,NULL,310010,'insert','blocks','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(82,NULL,310011,'insert','transactions','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"btc_amount":0,"data":"0000001e52bb3300405900000000000005f5e0ff09556e69742054657374","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"a21533ad03334823cca2aa8e57c383113a7f93a5810c5df8dd2fa70f6eec416d","tx_index":12}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(83,NULL,310011,'insert','broadcasts','{"block_index":310011,"fee_fraction_int":99999999,"locked":false,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","text":"Unit Test","timestamp":1388000000,"tx_hash":"a21533ad03334823cca2aa8e57c383113a7f93a5810c5df8dd2fa70f6eec416d","tx_index":12,"value":100.0}',0,'BROADCAST');
+INSERT INTO messages VALUES(84,NULL,310011,'parse','transactions','{"supported":true,"tx_hash":"a21533ad03334823cca2aa8e57c383113a7f93a5810c5df8dd2fa70f6eec416d","tx_index":12}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(85,NULL,310011,'parse','blocks','{"block_index":310011,"ledger_hash":"dfaae3f28c2f75e4bcc49034ff2a191b5a41b88035c5d266181617c8c65ad5d3","messages_hash":"c6c72bb6b85bbf0d1fa5e18500990cdf69c7b7b1d315d8639f6c6afabcd31a26","txlist_hash":"0134329cfdaf63e5946b9b5a94b73f59b9a870d4569ca07c0cce078bf13714a5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(86,NULL,310011,'insert','blocks','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(87,NULL,310012,'insert','transactions','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"btc_amount":1000,"data":"00000028000052bb33640000000002faf08000000000017d7840000000000000000000003b100000000a","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"74062934f0a97c41851735fef2a7df4d9ad9945424f09a54281e145a5e32492f","tx_index":13}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(88,NULL,310012,'insert','debits','{"action":"bet","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310012,"event":"74062934f0a97c41851735fef2a7df4d9ad9945424f09a54281e145a5e32492f","quantity":50000000,"tx_index":13}',0,'DEBIT');
+INSERT INTO messages VALUES(89,NULL,310012,'insert','bets','{"bet_type":0,"block_index":310012,"counterwager_quantity":25000000,"counterwager_remaining":25000000,"deadline":1388000100,"expiration":10,"expire_index":310022,"fee_fraction_int":99999999.0,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","leverage":15120,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","target_value":0.0,"tx_hash":"74062934f0a97c41851735fef2a7df4d9ad9945424f09a54281e145a5e32492f","tx_index":13,"wager_quantity":50000000,"wager_remaining":50000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(90,NULL,310012,'parse','transactions','{"supported":true,"tx_hash":"74062934f0a97c41851735fef2a7df4d9ad9945424f09a54281e145a5e32492f","tx_index":13}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(91,NULL,310012,'parse','blocks','{"block_index":310012,"ledger_hash":"c711e8cf2d9bbed01724a7b22cbd4900a4fd0a126bb7ecbd7c97ca15a6276553","messages_hash":"7e2be8d32d548626652064d9d37f0942b4a78667630e49c3e8e739d10478fb75","txlist_hash":"9a3fb4fb846c9ffff3a50a0a31f3ac3900ba7048a60dd69c6e14752734358f1c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(92,NULL,310012,'insert','blocks','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(93,NULL,310013,'insert','transactions','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"btc_amount":1000,"data":"00000028000152bb336400000000017d78400000000002793d60000000000000000000003b100000000a","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"6a5f30666a5f24b6e0e6f31cf06b22ee74d3e692a550297450bdf1d36b1cc167","tx_index":14}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(94,NULL,310013,'update','orders','{"status":"expired","tx_hash":"332b030da57b9565324df01414778b1eafbee6c52343fea80774ee1725484367"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(95,NULL,310013,'insert','order_expirations','{"block_index":310013,"order_hash":"332b030da57b9565324df01414778b1eafbee6c52343fea80774ee1725484367","source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2"}',0,'ORDER_EXPIRATION');
+INSERT INTO messages VALUES(96,NULL,310013,'insert','debits','{"action":"bet","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310013,"event":"6a5f30666a5f24b6e0e6f31cf06b22ee74d3e692a550297450bdf1d36b1cc167","quantity":25000000,"tx_index":14}',0,'DEBIT');
+INSERT INTO messages VALUES(97,NULL,310013,'insert','bets','{"bet_type":1,"block_index":310013,"counterwager_quantity":41500000,"counterwager_remaining":41500000,"deadline":1388000100,"expiration":10,"expire_index":310023,"fee_fraction_int":99999999.0,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","leverage":15120,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","target_value":0.0,"tx_hash":"6a5f30666a5f24b6e0e6f31cf06b22ee74d3e692a550297450bdf1d36b1cc167","tx_index":14,"wager_quantity":25000000,"wager_remaining":25000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(98,NULL,310013,'update','bets','{"counterwager_remaining":4250000,"status":"open","tx_hash":"74062934f0a97c41851735fef2a7df4d9ad9945424f09a54281e145a5e32492f","wager_remaining":8500000}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(99,NULL,310013,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310013,"calling_function":"filled","event":"6a5f30666a5f24b6e0e6f31cf06b22ee74d3e692a550297450bdf1d36b1cc167","quantity":4250000,"tx_index":14}',0,'CREDIT');
+INSERT INTO messages VALUES(100,NULL,310013,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"6a5f30666a5f24b6e0e6f31cf06b22ee74d3e692a550297450bdf1d36b1cc167","wager_remaining":4250000}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(101,NULL,310013,'insert','bet_matches','{"backward_quantity":20750000,"block_index":310012,"deadline":1388000100,"fee_fraction_int":99999999,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","forward_quantity":41500000,"id":"74062934f0a97c41851735fef2a7df4d9ad9945424f09a54281e145a5e32492f_6a5f30666a5f24b6e0e6f31cf06b22ee74d3e692a550297450bdf1d36b1cc167","initial_value":100.0,"leverage":15120,"match_expire_index":310022,"status":"pending","target_value":0.0,"tx0_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx0_bet_type":0,"tx0_block_index":310012,"tx0_expiration":10,"tx0_hash":"74062934f0a97c41851735fef2a7df4d9ad9945424f09a54281e145a5e32492f","tx0_index":13,"tx1_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx1_bet_type":1,"tx1_block_index":310013,"tx1_expiration":10,"tx1_hash":"6a5f30666a5f24b6e0e6f31cf06b22ee74d3e692a550297450bdf1d36b1cc167","tx1_index":14}',0,'BET_MATCH');
+INSERT INTO messages VALUES(102,NULL,310013,'parse','transactions','{"supported":true,"tx_hash":"6a5f30666a5f24b6e0e6f31cf06b22ee74d3e692a550297450bdf1d36b1cc167","tx_index":14}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(103,NULL,310013,'parse','blocks','{"block_index":310013,"ledger_hash":"3dfa5822de8a4c674f1517b17e50d2ef63ccbb1fc4ae96fe5e1dc05cd353aa4b","messages_hash":"065ed4ebeb7d71c4d6c81c65e46f8682fc8eabaa8c08b0a8298fa93140a6585f","txlist_hash":"6228a449b24d607b8fe1aea60a0292874cfe515a9440bee2829f6e61efa0b2a6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(104,NULL,310013,'insert','blocks','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(105,NULL,310014,'insert','transactions','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"btc_amount":1000,"data":"00000028000052bb33640000000008f0d1800000000014dc93800000000000000000000013b00000000a","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"2066b9a6b8913412384a0401ef57bfc604e7c5a2c141e23111a8ccc6881b0fb3","tx_index":15}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(106,NULL,310014,'update','orders','{"status":"expired","tx_hash":"f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(107,NULL,310014,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310014,"calling_function":"cancel order","event":"f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f","quantity":5000000,"tx_index":0}',0,'CREDIT');
+INSERT INTO messages VALUES(108,NULL,310014,'insert','order_expirations','{"block_index":310014,"order_hash":"f093b6c00e1bbe85106db6874b1ab4e3f4378d0bf0bcffbd8b51835285dfbf3f","source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2"}',0,'ORDER_EXPIRATION');
+INSERT INTO messages VALUES(109,NULL,310014,'insert','debits','{"action":"bet","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310014,"event":"2066b9a6b8913412384a0401ef57bfc604e7c5a2c141e23111a8ccc6881b0fb3","quantity":150000000,"tx_index":15}',0,'DEBIT');
+INSERT INTO messages VALUES(110,NULL,310014,'insert','bets','{"bet_type":0,"block_index":310014,"counterwager_quantity":350000000,"counterwager_remaining":350000000,"deadline":1388000100,"expiration":10,"expire_index":310024,"fee_fraction_int":99999999.0,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","leverage":5040,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","target_value":0.0,"tx_hash":"2066b9a6b8913412384a0401ef57bfc604e7c5a2c141e23111a8ccc6881b0fb3","tx_index":15,"wager_quantity":150000000,"wager_remaining":150000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(111,NULL,310014,'parse','transactions','{"supported":true,"tx_hash":"2066b9a6b8913412384a0401ef57bfc604e7c5a2c141e23111a8ccc6881b0fb3","tx_index":15}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(112,NULL,310014,'parse','blocks','{"block_index":310014,"ledger_hash":"49fcaed957776bc62c9f1feac30dad8c0574596d312f9efee7a453e00bf64866","messages_hash":"912195d824c04576868edda92286e9720896de5c90b6477ee927e78553c23283","txlist_hash":"700cf4c54e23c0cfb4d8b02bc6cb1ca509637dd95312629625aa92d32d5548d2"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(113,NULL,310014,'insert','blocks','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(114,NULL,310015,'insert','transactions','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"btc_amount":1000,"data":"00000028000152bb33640000000014dc93800000000008f0d1800000000000000000000013b00000000a","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"65db3ab58b65891a947ab9bdba4723e907678bf3b48397add62802dcc65d1d8e","tx_index":16}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(115,NULL,310015,'insert','debits','{"action":"bet","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310015,"event":"65db3ab58b65891a947ab9bdba4723e907678bf3b48397add62802dcc65d1d8e","quantity":350000000,"tx_index":16}',0,'DEBIT');
+INSERT INTO messages VALUES(116,NULL,310015,'insert','bets','{"bet_type":1,"block_index":310015,"counterwager_quantity":150000000,"counterwager_remaining":150000000,"deadline":1388000100,"expiration":10,"expire_index":310025,"fee_fraction_int":99999999.0,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","leverage":5040,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","target_value":0.0,"tx_hash":"65db3ab58b65891a947ab9bdba4723e907678bf3b48397add62802dcc65d1d8e","tx_index":16,"wager_quantity":350000000,"wager_remaining":350000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(117,NULL,310015,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310015,"calling_function":"filled","event":"65db3ab58b65891a947ab9bdba4723e907678bf3b48397add62802dcc65d1d8e","quantity":0,"tx_index":16}',0,'CREDIT');
+INSERT INTO messages VALUES(118,NULL,310015,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"2066b9a6b8913412384a0401ef57bfc604e7c5a2c141e23111a8ccc6881b0fb3","wager_remaining":0}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(119,NULL,310015,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310015,"calling_function":"filled","event":"65db3ab58b65891a947ab9bdba4723e907678bf3b48397add62802dcc65d1d8e","quantity":0,"tx_index":16}',0,'CREDIT');
+INSERT INTO messages VALUES(120,NULL,310015,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"65db3ab58b65891a947ab9bdba4723e907678bf3b48397add62802dcc65d1d8e","wager_remaining":0}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(121,NULL,310015,'insert','bet_matches','{"backward_quantity":350000000,"block_index":310014,"deadline":1388000100,"fee_fraction_int":99999999,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","forward_quantity":150000000,"id":"2066b9a6b8913412384a0401ef57bfc604e7c5a2c141e23111a8ccc6881b0fb3_65db3ab58b65891a947ab9bdba4723e907678bf3b48397add62802dcc65d1d8e","initial_value":100.0,"leverage":5040,"match_expire_index":310024,"status":"pending","target_value":0.0,"tx0_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx0_bet_type":0,"tx0_block_index":310014,"tx0_expiration":10,"tx0_hash":"2066b9a6b8913412384a0401ef57bfc604e7c5a2c141e23111a8ccc6881b0fb3","tx0_index":15,"tx1_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx1_bet_type":1,"tx1_block_index":310015,"tx1_expiration":10,"tx1_hash":"65db3ab58b65891a947ab9bdba4723e907678bf3b48397add62802dcc65d1d8e","tx1_index":16}',0,'BET_MATCH');
+INSERT INTO messages VALUES(122,NULL,310015,'parse','transactions','{"supported":true,"tx_hash":"65db3ab58b65891a947ab9bdba4723e907678bf3b48397add62802dcc65d1d8e","tx_index":16}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(123,NULL,310015,'parse','blocks','{"block_index":310015,"ledger_hash":"4e4abd3e8ab2658a7ac673e3a178ceac76fee41cf48bb6ed007d241c079979bf","messages_hash":"b0cc104a22aa13139de9b6ddd2f363738160a44272d0c5f60e9568b4cd718f23","txlist_hash":"288c9c0f37cb0c2e9db66d4b88b165391a67f06016ac84c485e9b9158ee51f2d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(124,NULL,310015,'insert','blocks','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(125,NULL,310016,'insert','transactions','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"btc_amount":1000,"data":"00000028000252bb33c8000000002cb417800000000026be36803ff0000000000000000013b00000000a","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"94b11df6b519372bfbcf0ec5f3e6465a63e323c7cd7cff83a8abd78596d4bce4","tx_index":17}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(126,NULL,310016,'insert','debits','{"action":"bet","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310016,"event":"94b11df6b519372bfbcf0ec5f3e6465a63e323c7cd7cff83a8abd78596d4bce4","quantity":750000000,"tx_index":17}',0,'DEBIT');
+INSERT INTO messages VALUES(127,NULL,310016,'insert','bets','{"bet_type":2,"block_index":310016,"counterwager_quantity":650000000,"counterwager_remaining":650000000,"deadline":1388000200,"expiration":10,"expire_index":310026,"fee_fraction_int":99999999.0,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","leverage":5040,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","target_value":1.0,"tx_hash":"94b11df6b519372bfbcf0ec5f3e6465a63e323c7cd7cff83a8abd78596d4bce4","tx_index":17,"wager_quantity":750000000,"wager_remaining":750000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(128,NULL,310016,'parse','transactions','{"supported":true,"tx_hash":"94b11df6b519372bfbcf0ec5f3e6465a63e323c7cd7cff83a8abd78596d4bce4","tx_index":17}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(129,NULL,310016,'parse','blocks','{"block_index":310016,"ledger_hash":"17a28cca0777254af26544edfefcad8810e847e5d173fded9a7813719cf1162f","messages_hash":"de03065dfd7c73a58301d2ad9411a1f7a4eb42123adaba0ac82f4b26412ab29d","txlist_hash":"1bf7e0a4aa8356584087591a8c8e8b28185a6ebfe1a15a85f01165a04ff57913"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(130,NULL,310016,'insert','blocks','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(131,NULL,310017,'insert','transactions','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"btc_amount":1000,"data":"00000028000352bb33c80000000026be3680000000002cb417803ff0000000000000000013b00000000a","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"a7daff1ca2874f6b18a8f1a1e70db27f58c6b39a9f106c353223fbccde57098e","tx_index":18}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(132,NULL,310017,'insert','debits','{"action":"bet","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310017,"event":"a7daff1ca2874f6b18a8f1a1e70db27f58c6b39a9f106c353223fbccde57098e","quantity":650000000,"tx_index":18}',0,'DEBIT');
+INSERT INTO messages VALUES(133,NULL,310017,'insert','bets','{"bet_type":3,"block_index":310017,"counterwager_quantity":750000000,"counterwager_remaining":750000000,"deadline":1388000200,"expiration":10,"expire_index":310027,"fee_fraction_int":99999999.0,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","leverage":5040,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","target_value":1.0,"tx_hash":"a7daff1ca2874f6b18a8f1a1e70db27f58c6b39a9f106c353223fbccde57098e","tx_index":18,"wager_quantity":650000000,"wager_remaining":650000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(134,NULL,310017,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310017,"calling_function":"filled","event":"a7daff1ca2874f6b18a8f1a1e70db27f58c6b39a9f106c353223fbccde57098e","quantity":0,"tx_index":18}',0,'CREDIT');
+INSERT INTO messages VALUES(135,NULL,310017,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"94b11df6b519372bfbcf0ec5f3e6465a63e323c7cd7cff83a8abd78596d4bce4","wager_remaining":0}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(136,NULL,310017,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310017,"calling_function":"filled","event":"a7daff1ca2874f6b18a8f1a1e70db27f58c6b39a9f106c353223fbccde57098e","quantity":0,"tx_index":18}',0,'CREDIT');
+INSERT INTO messages VALUES(137,NULL,310017,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"a7daff1ca2874f6b18a8f1a1e70db27f58c6b39a9f106c353223fbccde57098e","wager_remaining":0}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(138,NULL,310017,'insert','bet_matches','{"backward_quantity":650000000,"block_index":310016,"deadline":1388000200,"fee_fraction_int":99999999,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","forward_quantity":750000000,"id":"94b11df6b519372bfbcf0ec5f3e6465a63e323c7cd7cff83a8abd78596d4bce4_a7daff1ca2874f6b18a8f1a1e70db27f58c6b39a9f106c353223fbccde57098e","initial_value":100.0,"leverage":5040,"match_expire_index":310026,"status":"pending","target_value":1.0,"tx0_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx0_bet_type":2,"tx0_block_index":310016,"tx0_expiration":10,"tx0_hash":"94b11df6b519372bfbcf0ec5f3e6465a63e323c7cd7cff83a8abd78596d4bce4","tx0_index":17,"tx1_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx1_bet_type":3,"tx1_block_index":310017,"tx1_expiration":10,"tx1_hash":"a7daff1ca2874f6b18a8f1a1e70db27f58c6b39a9f106c353223fbccde57098e","tx1_index":18}',0,'BET_MATCH');
+INSERT INTO messages VALUES(139,NULL,310017,'parse','transactions','{"supported":true,"tx_hash":"a7daff1ca2874f6b18a8f1a1e70db27f58c6b39a9f106c353223fbccde57098e","tx_index":18}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(140,NULL,310017,'parse','blocks','{"block_index":310017,"ledger_hash":"1fb58120e9eb78908fda6265cad12b4a5770701e9a271bd5c4bc94059bd3bab5","messages_hash":"22b69c233a30db17deaf78087019583ae1097211b856b9235b11e341b0420b03","txlist_hash":"62678a570c40b5a12469e442b3a54f1416d9113de2db501f37ed533f345e71c1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(141,NULL,310017,'insert','blocks','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(142,NULL,310018,'insert','transactions','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"btc_amount":0,"data":"0000001e52bb33324058f7256ffc115e004c4b4009556e69742054657374","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"f020ae6c0b1aadbba4893581678ef87f9d2a925be5e6b08d02440e213f6183b4","tx_index":19}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(143,NULL,310018,'insert','broadcasts','{"block_index":310018,"fee_fraction_int":5000000,"locked":false,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","text":"Unit Test","timestamp":1388000050,"tx_hash":"f020ae6c0b1aadbba4893581678ef87f9d2a925be5e6b08d02440e213f6183b4","tx_index":19,"value":99.86166}',0,'BROADCAST');
+INSERT INTO messages VALUES(144,NULL,310018,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310018,"calling_function":"bet settled: liquidated for bear","event":"f020ae6c0b1aadbba4893581678ef87f9d2a925be5e6b08d02440e213f6183b4","quantity":59137500,"tx_index":19}',0,'CREDIT');
+INSERT INTO messages VALUES(145,NULL,310018,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310018,"calling_function":"feed fee","event":"f020ae6c0b1aadbba4893581678ef87f9d2a925be5e6b08d02440e213f6183b4","quantity":3112500,"tx_index":19}',0,'CREDIT');
+INSERT INTO messages VALUES(146,NULL,310018,'insert','bet_match_resolutions','{"bear_credit":59137500,"bet_match_id":"74062934f0a97c41851735fef2a7df4d9ad9945424f09a54281e145a5e32492f_6a5f30666a5f24b6e0e6f31cf06b22ee74d3e692a550297450bdf1d36b1cc167","bet_match_type_id":1,"block_index":310018,"bull_credit":0,"escrow_less_fee":null,"fee":3112500,"settled":false,"winner":null}',0,'BET_MATCH_RESOLUTON');
+INSERT INTO messages VALUES(147,NULL,310018,'update','bet_matches','{"id":"74062934f0a97c41851735fef2a7df4d9ad9945424f09a54281e145a5e32492f_6a5f30666a5f24b6e0e6f31cf06b22ee74d3e692a550297450bdf1d36b1cc167","status":"settled: liquidated for bear"}',0,'BET_MATCH_UPDATE');
+INSERT INTO messages VALUES(148,NULL,310018,'parse','transactions','{"supported":true,"tx_hash":"f020ae6c0b1aadbba4893581678ef87f9d2a925be5e6b08d02440e213f6183b4","tx_index":19}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(149,NULL,310018,'parse','blocks','{"block_index":310018,"ledger_hash":"304243c1b11644e04d325d7100e4c757c07b874f0349e60163a5a544e84e951f","messages_hash":"277c84ad2141397b5cd35cac07e45452ecdd845668f7684bb1c1679f4ef6a50b","txlist_hash":"a174e4813aa967f5466148f27f4f8511ed9404295bf613e112c08b72eb3229ad"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(150,NULL,310018,'insert','blocks','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(151,NULL,310019,'insert','transactions','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"btc_amount":0,"data":"0000001e52bb3365405915f3b645a1cb004c4b4009556e69742054657374","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"dccbd8852c8d489d32f87be0c86a631b63ec50202b0109a2be6aa96f27f89600","tx_index":20}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(152,NULL,310019,'insert','broadcasts','{"block_index":310019,"fee_fraction_int":5000000,"locked":false,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","text":"Unit Test","timestamp":1388000101,"tx_hash":"dccbd8852c8d489d32f87be0c86a631b63ec50202b0109a2be6aa96f27f89600","tx_index":20,"value":100.343}',0,'BROADCAST');
+INSERT INTO messages VALUES(153,NULL,310019,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310019,"calling_function":"bet settled","event":"dccbd8852c8d489d32f87be0c86a631b63ec50202b0109a2be6aa96f27f89600","quantity":159300000,"tx_index":20}',0,'CREDIT');
+INSERT INTO messages VALUES(154,NULL,310019,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310019,"calling_function":"bet settled","event":"dccbd8852c8d489d32f87be0c86a631b63ec50202b0109a2be6aa96f27f89600","quantity":315700000,"tx_index":20}',0,'CREDIT');
+INSERT INTO messages VALUES(155,NULL,310019,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310019,"calling_function":"feed fee","event":"dccbd8852c8d489d32f87be0c86a631b63ec50202b0109a2be6aa96f27f89600","quantity":25000000,"tx_index":20}',0,'CREDIT');
+INSERT INTO messages VALUES(156,NULL,310019,'insert','bet_match_resolutions','{"bear_credit":315700000,"bet_match_id":"2066b9a6b8913412384a0401ef57bfc604e7c5a2c141e23111a8ccc6881b0fb3_65db3ab58b65891a947ab9bdba4723e907678bf3b48397add62802dcc65d1d8e","bet_match_type_id":1,"block_index":310019,"bull_credit":159300000,"escrow_less_fee":null,"fee":25000000,"settled":true,"winner":null}',0,'BET_MATCH_RESOLUTON');
+INSERT INTO messages VALUES(157,NULL,310019,'update','bet_matches','{"id":"2066b9a6b8913412384a0401ef57bfc604e7c5a2c141e23111a8ccc6881b0fb3_65db3ab58b65891a947ab9bdba4723e907678bf3b48397add62802dcc65d1d8e","status":"settled"}',0,'BET_MATCH_UPDATE');
+INSERT INTO messages VALUES(158,NULL,310019,'parse','transactions','{"supported":true,"tx_hash":"dccbd8852c8d489d32f87be0c86a631b63ec50202b0109a2be6aa96f27f89600","tx_index":20}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(159,NULL,310019,'parse','blocks','{"block_index":310019,"ledger_hash":"fc9905ee4863b3cf29a3e558ee690a24ed978a4fd79c464bdde30a34cfff19fe","messages_hash":"0928aaa2af960f1750455c96196f5f331bce38c09b7cc315f40aacfc8b363c3b","txlist_hash":"c551c2094651cd0e06e0cd9d513fec771b69f4bb89c3034f201c89f703cf8a23"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(160,NULL,310019,'insert','blocks','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(161,NULL,310020,'insert','transactions','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"btc_amount":0,"data":"0000001e52bb33c94000000000000000004c4b4009556e69742054657374","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"457f36dccce6664a8e28b00ebf47aa60ba4a41b46642aceef0e2a297429eb64e","tx_index":21}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(162,NULL,310020,'insert','broadcasts','{"block_index":310020,"fee_fraction_int":5000000,"locked":false,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","text":"Unit Test","timestamp":1388000201,"tx_hash":"457f36dccce6664a8e28b00ebf47aa60ba4a41b46642aceef0e2a297429eb64e","tx_index":21,"value":2.0}',0,'BROADCAST');
+INSERT INTO messages VALUES(163,NULL,310020,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310020,"calling_function":"bet settled: for notequal","event":"457f36dccce6664a8e28b00ebf47aa60ba4a41b46642aceef0e2a297429eb64e","quantity":1330000000,"tx_index":21}',0,'CREDIT');
+INSERT INTO messages VALUES(164,NULL,310020,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310020,"calling_function":"feed fee","event":"457f36dccce6664a8e28b00ebf47aa60ba4a41b46642aceef0e2a297429eb64e","quantity":70000000,"tx_index":21}',0,'CREDIT');
+INSERT INTO messages VALUES(165,NULL,310020,'insert','bet_match_resolutions','{"bear_credit":null,"bet_match_id":"94b11df6b519372bfbcf0ec5f3e6465a63e323c7cd7cff83a8abd78596d4bce4_a7daff1ca2874f6b18a8f1a1e70db27f58c6b39a9f106c353223fbccde57098e","bet_match_type_id":5,"block_index":310020,"bull_credit":null,"escrow_less_fee":1330000000,"fee":70000000,"settled":null,"winner":"NotEqual"}',0,'BET_MATCH_RESOLUTON');
+INSERT INTO messages VALUES(166,NULL,310020,'update','bet_matches','{"id":"94b11df6b519372bfbcf0ec5f3e6465a63e323c7cd7cff83a8abd78596d4bce4_a7daff1ca2874f6b18a8f1a1e70db27f58c6b39a9f106c353223fbccde57098e","status":"settled: for notequal"}',0,'BET_MATCH_UPDATE');
+INSERT INTO messages VALUES(167,NULL,310020,'parse','transactions','{"supported":true,"tx_hash":"457f36dccce6664a8e28b00ebf47aa60ba4a41b46642aceef0e2a297429eb64e","tx_index":21}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(168,NULL,310020,'parse','blocks','{"block_index":310020,"ledger_hash":"e433feac4a09ad727bd3764b10a568acf5c659745a695e9d7e8790514f6bc98e","messages_hash":"859eb68b2ff99d0621c4d634d717d985688b8e0ca83b84e330446a25ccbd5fe1","txlist_hash":"087d41720991e4b6bb72c6141334a65c9a289454dd8fd57edc33a09db467d086"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(169,NULL,310020,'insert','blocks','{"block_hash":"7c2460bb32c5749c856486393239bf7a0ac789587ac71f32e7237910da8097f2","block_index":310021,"block_time":310021000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(170,NULL,310021,'insert','transactions','{"block_hash":"7c2460bb32c5749c856486393239bf7a0ac789587ac71f32e7237910da8097f2","block_index":310021,"block_time":310021000,"btc_amount":0,"data":"0000000a00000000000047670000000002faf08000000000000000010000000002faf080000a0000000000000000","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"6cb08a1c0547ab0d0d37b74633c1c8a2fd2372d9fd72eb3abdea298f2b245fee","tx_index":22}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(171,NULL,310021,'insert','debits','{"action":"open order","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBB","block_index":310021,"event":"6cb08a1c0547ab0d0d37b74633c1c8a2fd2372d9fd72eb3abdea298f2b245fee","quantity":50000000,"tx_index":22}',0,'DEBIT');
+INSERT INTO messages VALUES(172,NULL,310021,'insert','orders','{"block_index":310021,"expiration":10,"expire_index":310031,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":50000000,"get_remaining":50000000,"give_asset":"BBBB","give_quantity":50000000,"give_remaining":50000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","tx_hash":"6cb08a1c0547ab0d0d37b74633c1c8a2fd2372d9fd72eb3abdea298f2b245fee","tx_index":22}',0,'OPEN_ORDER');
+INSERT INTO messages VALUES(173,NULL,310021,'parse','transactions','{"supported":true,"tx_hash":"6cb08a1c0547ab0d0d37b74633c1c8a2fd2372d9fd72eb3abdea298f2b245fee","tx_index":22}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(174,NULL,310021,'parse','blocks','{"block_index":310021,"ledger_hash":"622f92da40eae0b1b57218b32ad18daf7d79c9e0202fed4a288d75b8fdcd19d2","messages_hash":"9e323ccc0a72f968a5886d5bd8cd26c990602bd87d0e65e8cbd64343c4b02bfe","txlist_hash":"caa77e83354d56437795411f9625dff332c0dd39d059a0ad7381fe1f37e38999"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(175,NULL,310021,'insert','blocks','{"block_hash":"44435f9a99a0aa12a9bfabdc4cb8119f6ea6a6e1350d2d65445fb66a456db5fc","block_index":310022,"block_time":310022000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(176,NULL,310022,'insert','transactions','{"block_hash":"44435f9a99a0aa12a9bfabdc4cb8119f6ea6a6e1350d2d65445fb66a456db5fc","block_index":310022,"block_time":310022000,"btc_amount":100000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":14675,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"c81cd36f1efabd22f1a00923714fd5a5f1ba07852ef1f0763223563e3f55dfda","tx_index":23}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(177,NULL,310022,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310022,"calling_function":"burn","event":"c81cd36f1efabd22f1a00923714fd5a5f1ba07852ef1f0763223563e3f55dfda","quantity":56999887262,"tx_index":23}',0,'CREDIT');
+INSERT INTO messages VALUES(178,NULL,310022,'insert','burns','{"block_index":310022,"burned":38000000,"earned":56999887262,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"c81cd36f1efabd22f1a00923714fd5a5f1ba07852ef1f0763223563e3f55dfda","tx_index":23}',0,'BURN');
+INSERT INTO messages VALUES(179,NULL,310022,'parse','blocks','{"block_index":310022,"ledger_hash":"b7aa8d9ebc37d52d8dcce2cc17431d6edf5a183b73ac85bb3d91276592215cfd","messages_hash":"a9bfc8463d636a888c8ae61b3fc13d2d32768fa1920b980cb5ea967b4863e6ec","txlist_hash":"df23960a57099b0b64572553e56794b1eff3004e684ee2b31187b585aeb03587"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(180,NULL,310022,'insert','blocks','{"block_hash":"d8cf5bec1bbcab8ca4f495352afde3b6572b7e1d61b3976872ebb8e9d30ccb08","block_index":310023,"block_time":310023000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(181,NULL,310023,'insert','transactions','{"block_hash":"d8cf5bec1bbcab8ca4f495352afde3b6572b7e1d61b3976872ebb8e9d30ccb08","block_index":310023,"block_time":310023000,"btc_amount":1000,"data":"0000000000000000000047680000000000002710","destination":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"c576ecde0f86c86725b540c9f5e6ae57a378fe9694260f7859eca55613d9d341","tx_index":24}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(182,NULL,310023,'update','bets','{"status":"expired","tx_hash":"74062934f0a97c41851735fef2a7df4d9ad9945424f09a54281e145a5e32492f"}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(183,NULL,310023,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310023,"calling_function":"recredit wager remaining","event":"74062934f0a97c41851735fef2a7df4d9ad9945424f09a54281e145a5e32492f","quantity":8500000,"tx_index":0}',0,'CREDIT');
+INSERT INTO messages VALUES(184,NULL,310023,'insert','bet_expirations','{"bet_hash":"74062934f0a97c41851735fef2a7df4d9ad9945424f09a54281e145a5e32492f","bet_index":13,"block_index":310023,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2"}',0,'BET_EXPIRATION');
+INSERT INTO messages VALUES(185,NULL,310023,'insert','debits','{"action":"send","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBC","block_index":310023,"event":"c576ecde0f86c86725b540c9f5e6ae57a378fe9694260f7859eca55613d9d341","quantity":10000,"tx_index":24}',0,'DEBIT');
+INSERT INTO messages VALUES(186,NULL,310023,'insert','credits','{"address":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBC","block_index":310023,"calling_function":"send","event":"c576ecde0f86c86725b540c9f5e6ae57a378fe9694260f7859eca55613d9d341","quantity":10000,"tx_index":24}',0,'CREDIT');
+INSERT INTO messages VALUES(187,NULL,310023,'insert','sends','{"asset":"BBBC","block_index":310023,"destination":"1_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","quantity":10000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"c576ecde0f86c86725b540c9f5e6ae57a378fe9694260f7859eca55613d9d341","tx_index":24}',0,'SEND');
+INSERT INTO messages VALUES(188,NULL,310023,'parse','transactions','{"supported":true,"tx_hash":"c576ecde0f86c86725b540c9f5e6ae57a378fe9694260f7859eca55613d9d341","tx_index":24}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(189,NULL,310023,'parse','blocks','{"block_index":310023,"ledger_hash":"501c058860063ca599f3b946d465b3bbd84fd483a2a80527e456e3de32b48a19","messages_hash":"82ecd86662e345e85c8e68ef7a8dbad744af2415bd71756cdd5824ac35b9655e","txlist_hash":"c680a6d4f839ba4f9420a99f0512e51fc1db0b661ed027332f440c6089eb615a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(190,NULL,310023,'insert','blocks','{"block_hash":"b03042b4e18a222b4c8d1e9e1970d93e6e2a2d41686d227ff8ecf0a839223dc5","block_index":310024,"block_time":310024000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(191,NULL,310024,'parse','blocks','{"block_index":310024,"ledger_hash":"222986ec44fae1a6196d64dec24b79872970823f17bf0459d3b247bdef316675","messages_hash":"2d94009516ad0a6a7696d3c90c4a18b18970ed29702a91684120939b7f7e424f","txlist_hash":"f40aab7ef7167a17e35279423d9c14d49a9ebc05691fa658b09add1373216959"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(192,NULL,310024,'insert','blocks','{"block_hash":"a872e560766832cc3b4f7f222228cb6db882ce3c54f6459f62c71d5cd6e90666","block_index":310025,"block_time":310025000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(193,NULL,310025,'parse','blocks','{"block_index":310025,"ledger_hash":"bcd88006b9cb98445a74c656d424435e82eeaef95dd9c54e394b42808dc9cb8b","messages_hash":"07d351ee43763fbb80ea1d600cb501b6f8b0105cf3d3d277b9a9714527a81235","txlist_hash":"0e3736813d3c0e789cd9474449abcf83118b5559cbc2f4dfd4d3ee51b5847a57"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(194,NULL,310025,'insert','blocks','{"block_hash":"6c96350f6f2f05810f19a689de235eff975338587194a36a70dfd0fcd490941a","block_index":310026,"block_time":310026000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(195,NULL,310026,'parse','blocks','{"block_index":310026,"ledger_hash":"3de7bf2043ac2e68bc9eaf8d1c12195a4f2400bc78c8deed0d487af11edf401e","messages_hash":"3b432d9f048634678497de80535eced0de2db802c86b3ecd6f7e3052285f2819","txlist_hash":"c3572580398fcd71e5a1fef6e10217a99dec1aa605d61830ebb64ea65b7907ae"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(196,NULL,310026,'insert','blocks','{"block_hash":"d7acfac66df393c4482a14c189742c0571b89442eb7f817b34415a560445699e","block_index":310027,"block_time":310027000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(197,NULL,310027,'parse','blocks','{"block_index":310027,"ledger_hash":"6c2a67783cf36e8987dc1805f87532ee1b94f79fb00952d8ee4cf3daaf655f85","messages_hash":"139682b87ae2b72b9fbd62ca0d3788ab4bf20239f6e27e0142e7b4d810b3138d","txlist_hash":"b8b9d102d56df94d4fcea6f8aeb92d3cb859d3281c9fac7407842b7f05313737"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(198,NULL,310027,'insert','blocks','{"block_hash":"02409fcf8fa06dafcb7f11e38593181d9c42cc9d5e2ddc304d098f990bd9530b","block_index":310028,"block_time":310028000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(199,NULL,310028,'parse','blocks','{"block_index":310028,"ledger_hash":"659c73390e2e7eccc07d690fb438181c604787208bc45f466e57721fa1e21a64","messages_hash":"281c45bea9359ef175c8e8b50167fe72be91b589dd7e589d51280d15ffefb8dc","txlist_hash":"55eafa176bc145ec7b98497c8a156226c68bd3b921cbdd06a890b2bd660ca050"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(200,NULL,310028,'insert','blocks','{"block_hash":"3c739fa8b40c118d5547ea356ee8d10ee2898871907643ec02e5db9d00f03cc6","block_index":310029,"block_time":310029000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(201,NULL,310029,'parse','blocks','{"block_index":310029,"ledger_hash":"87449e7ff7316e49012934d83c1f5b733cedf39680299a9582eb216e260e0c02","messages_hash":"39af1ee82e4334b2b0596abf86dc82603d9b2c8a5d046c5db281ecf34b303a30","txlist_hash":"c2fc809ff3ef6b74b10b1439fe15c275c6fd925e92dea73cf9d603948aba0d8f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(202,NULL,310029,'insert','blocks','{"block_hash":"d5071cddedf89765ee0fd58f209c1c7d669ba8ea66200a57587da8b189b9e4f5","block_index":310030,"block_time":310030000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(203,NULL,310030,'parse','blocks','{"block_index":310030,"ledger_hash":"6c4a7f749d0308edf5c88b3ea4de3b1d497ba3bc06435594d77686318b744b0f","messages_hash":"eaf3156993560de86b2de78af58593d00da00db7fd7bab33a7f7cc56d49944f6","txlist_hash":"45db1d0cde22349299df8245e7ed24d308e1b1cb227098178606650f20832aaa"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(204,NULL,310030,'insert','blocks','{"block_hash":"0b02b10f41380fff27c543ea8891ecb845bf7a003ac5c87e15932aff3bfcf689","block_index":310031,"block_time":310031000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(205,NULL,310031,'parse','blocks','{"block_index":310031,"ledger_hash":"ecc04b1b2c7803ca17dc2a32adebd0960de2c04c8dbfec9cd88771dd883c885a","messages_hash":"0806bca89167cf716795644fc4577dc88f73a1ab2420109a4a7fb504dade4e65","txlist_hash":"981653075dd609f44e0a5673dac2b63824b84e26080ec226547892c67dd7cc33"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(206,NULL,310031,'insert','blocks','{"block_hash":"66346be81e6ba04544f2ae643b76c2b7b1383f038fc2636e02e49dc7ec144074","block_index":310032,"block_time":310032000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(207,NULL,310032,'update','orders','{"status":"expired","tx_hash":"6cb08a1c0547ab0d0d37b74633c1c8a2fd2372d9fd72eb3abdea298f2b245fee"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(208,NULL,310032,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBB","block_index":310032,"calling_function":"cancel order","event":"6cb08a1c0547ab0d0d37b74633c1c8a2fd2372d9fd72eb3abdea298f2b245fee","quantity":50000000,"tx_index":0}',0,'CREDIT');
+INSERT INTO messages VALUES(209,NULL,310032,'insert','order_expirations','{"block_index":310032,"order_hash":"6cb08a1c0547ab0d0d37b74633c1c8a2fd2372d9fd72eb3abdea298f2b245fee","source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2"}',0,'ORDER_EXPIRATION');
+INSERT INTO messages VALUES(210,NULL,310032,'parse','blocks','{"block_index":310032,"ledger_hash":"01e769c5b990db44a9e534bc6c759567eb4283e0ea252578dd525923c7fde02c","messages_hash":"49cd53ea397947d31318ad902433661e23e78cac31fd544f67ee87f7cf5a5e47","txlist_hash":"81778134948c3577216eeeb6db7fe9687545d855dc3b5f6bdf6053a7edf3eaf3"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(211,NULL,310032,'insert','blocks','{"block_hash":"999c65df9661f73e8c01f1da1afda09ac16788b72834f0ff5ea3d1464afb4707","block_index":310033,"block_time":310033000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(212,NULL,310033,'parse','blocks','{"block_index":310033,"ledger_hash":"2df6b8dca0ffa8d6d55997605188637c2b86300e4dd7ebe3f1f275690169fd46","messages_hash":"03e1ca09ca2ad95c3d8625cdbdcefd20d69f2442d56a49c570d85c74935e232a","txlist_hash":"650b0875a0fb44a0ad1b04edf1a0eb1b50b5ecc423c6ecdd37b5aa60b5e85663"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(213,NULL,310033,'insert','blocks','{"block_hash":"f552edd2e0a648230f3668e72ddf0ddfb1e8ac0f4c190f91b89c1a8c2e357208","block_index":310034,"block_time":310034000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(214,NULL,310034,'parse','blocks','{"block_index":310034,"ledger_hash":"7f0dc7c1527a7d11831d272f0295eacabcb96fa3599f5a716bd29ba1bb6b7577","messages_hash":"40b21162c2bdec9408ffa79df90b098be7f3adfcbcd8f6bc6e6064d0b3a571ac","txlist_hash":"e9d6c050b077d8e6902999bf64a0f1bf420c881b8a32c511ae81b0359e83a542"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(215,NULL,310034,'insert','blocks','{"block_hash":"a13cbb016f3044207a46967a4ba1c87dab411f78c55c1179f2336653c2726ae2","block_index":310035,"block_time":310035000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(216,NULL,310035,'parse','blocks','{"block_index":310035,"ledger_hash":"5e0cdf1764ed94672c29144f9c1bd9c3e70784f17c9dd1c9e4ce703a99bb3599","messages_hash":"aaaa2778599705d04a371a7488537f432426d15e6f3b3230f0d86f8fa7f266a0","txlist_hash":"e755b5d80c9995dfa5763b080b9bdd349fd7b5bd940a661836ad418202b77384"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(217,NULL,310035,'insert','blocks','{"block_hash":"158648a98f1e1bd1875584ce8449eb15a4e91a99a923bbb24c4210135cef0c76","block_index":310036,"block_time":310036000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(218,NULL,310036,'parse','blocks','{"block_index":310036,"ledger_hash":"96da34a5a66b89aa3e8857b4a4edca51a56a0cbbfe600d8153077875624a153e","messages_hash":"a68c4c24471575ea622ce59af306b947b521f01abeaa347a8e33eb651cf91a25","txlist_hash":"cbc0139fb09af6a6c63e07847a37f15767a1f7b01d6305cf40179de841c4f093"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(219,NULL,310036,'insert','blocks','{"block_hash":"563acfd6d991ce256d5655de2e9429975c8dceeb221e76d5ec6e9e24a2c27c07","block_index":310037,"block_time":310037000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(220,NULL,310037,'parse','blocks','{"block_index":310037,"ledger_hash":"d481358c19b4220aa9a3d135fd0651fada6df8d0f27b9ec954ac07950e876c0c","messages_hash":"7aa07b58643d61192acc195054c76aa198bc0615a8d1015efd485e6078c84797","txlist_hash":"0493eb6bbab5ced7f25c6f5a3b32e4e2da321a5c761855ef64b5e050ddcfe431"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(221,NULL,310037,'insert','blocks','{"block_hash":"b44b4cad12431c32df27940e18d51f63897c7472b70950d18454edfd640490b2","block_index":310038,"block_time":310038000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(222,NULL,310038,'parse','blocks','{"block_index":310038,"ledger_hash":"4e9fcc454ee53b3617c792eb6577c2eefa6eee6aa4a2925538cb1976d48817c9","messages_hash":"d06d2f843297dda75791f6d438a0c22a679fa705606c8a82f71c3a316e24bfdd","txlist_hash":"64b95af50bbee190166820a564e858e5c86769c04b22a68c2bed5adee0f7292f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(223,NULL,310038,'insert','blocks','{"block_hash":"5fa1ae9c5e8a599247458987b006ad3a57f686df1f7cc240bf119e911b56c347","block_index":310039,"block_time":310039000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(224,NULL,310039,'parse','blocks','{"block_index":310039,"ledger_hash":"795c5652d9679942a02060edfb497b072009695d9a72fb144fa3591dba65a2ce","messages_hash":"975d014fa7da9eb851641c145a0f55fde983a0d8670ed0008dbed98bde05f8b7","txlist_hash":"9927f1558918a59509f668789e75198eb432fd63e0a7ffb46160d002c0932188"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(225,NULL,310039,'insert','blocks','{"block_hash":"7200ded406675453eadddfbb2d14c2a4526c7dc2b5de14bd48b29243df5e1aa3","block_index":310040,"block_time":310040000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(226,NULL,310040,'parse','blocks','{"block_index":310040,"ledger_hash":"e569e6e8083818e594e92b3356833e8dd54fcfcf5ed25af0d09e36e24b9dd441","messages_hash":"8f1a984f0da070ff524c9fc9517efd3567d25bacc25f29ba32d03d06a7c43c36","txlist_hash":"969f7176f1a56d43e0d1b4da9cbac17cb1a934be64c12b3784ef33b584513271"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(227,NULL,310040,'insert','blocks','{"block_hash":"5db592ff9ba5fac1e030cf22d6c13b70d330ba397f415340086ee7357143b359","block_index":310041,"block_time":310041000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(228,NULL,310041,'parse','blocks','{"block_index":310041,"ledger_hash":"2247fcc633175a91921d226f412e56822379c79ca799117c39ecaaca0a702192","messages_hash":"373d191cad758b4644384ebfbef2cf1e49c038716f6672447b5d36e69bad7d88","txlist_hash":"29cb8f1b29affa41416aca0265599863f6b739538f13bc6672f6b3c17e411045"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(229,NULL,310041,'insert','blocks','{"block_hash":"826fd4701ef2824e9559b069517cd3cb990aff6a4690830f78fc845ab77fa3e4","block_index":310042,"block_time":310042000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(230,NULL,310042,'parse','blocks','{"block_index":310042,"ledger_hash":"0246c3a2a70b33a038ccdb816f6b0922a50d08310f360cbd5db4df58e97fc4dd","messages_hash":"3758f623adbf54b2e0471b990dd67c65bebbf41d86e3277bda367bcc0a98a8cc","txlist_hash":"d1ca4c9abe26de83d9a0170461c87f2c219926f8dcb0c48793d74a0cbf01a43a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(231,NULL,310042,'insert','blocks','{"block_hash":"2254a12ada208f1dd57bc17547ecaf3c44720323c47bc7d4b1262477cb7f3c51","block_index":310043,"block_time":310043000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(232,NULL,310043,'parse','blocks','{"block_index":310043,"ledger_hash":"cbe39e9d1a132cdc568f893bbc3d4f55d27bacf7af31f027ebea1b4bed9f0009","messages_hash":"a209a4e543642de2708ff915d0c0e3e966b378dd48feef2430a7d55ac8ff238c","txlist_hash":"452b2e3ff4075f702cddcb4b8fd9006c756dda7a3527d635f637a200fd621c91"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(233,NULL,310043,'insert','blocks','{"block_hash":"3346d24118d8af0b3c6bcc42f8b85792e7a2e7036ebf6e4c25f4f6723c78e46b","block_index":310044,"block_time":310044000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(234,NULL,310044,'parse','blocks','{"block_index":310044,"ledger_hash":"1202b05e118f0940ce270d9002d010076115a0197d889fee2d971a77709899bc","messages_hash":"863dbb043614eab0029f0ebafb1eb4b12902fde830dd1c05722c01ba3923403c","txlist_hash":"527114d86a06f44f12e1f789f095227f9710b47e95251cdbd6f4c03309eae61d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(235,NULL,310044,'insert','blocks','{"block_hash":"7bba0ab243839e91ad1a45a762bf074011f8a9883074d68203c6d1b46fffde98","block_index":310045,"block_time":310045000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(236,NULL,310045,'parse','blocks','{"block_index":310045,"ledger_hash":"0bc49f765419c0b5b4911cccf03b0d9959aabacda266480b98245de0c0d35fc5","messages_hash":"023de4e9ae06942b0e09ae12622949346a414f2a4f3d882786f5bb261639d701","txlist_hash":"ed6954fc7aadd8f80684cc67580b9cc16f9a402296ac91c021de0148a1ccb4a8"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(237,NULL,310045,'insert','blocks','{"block_hash":"47db6788c38f2d6d712764979e41346b55e78cbb4969e0ef5c4336faf18993a6","block_index":310046,"block_time":310046000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(238,NULL,310046,'parse','blocks','{"block_index":310046,"ledger_hash":"e42bf9806d0ff3a0663756f7955b30735747d14fcb0915c89884baa12795163d","messages_hash":"b9e8dd64f4addd93fcdc8ea8424e96947da4cbadd60abe13f0f53a6d65a39426","txlist_hash":"2e62ee5d03044d0b6086419a6d2fed78b7db3bee75a2bc158bbc04a8f5c34908"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(239,NULL,310046,'insert','blocks','{"block_hash":"a9ccabcc2a098a7d25e4ab8bda7c4e66807eefa42e29890dcd88149a10de7075","block_index":310047,"block_time":310047000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(240,NULL,310047,'parse','blocks','{"block_index":310047,"ledger_hash":"b19b5e14741284b4ca06b736120e903363651460a6efb3ede1aca3a4f3c00df1","messages_hash":"36c01e15c47bcc42b22cf98ddcecdad49522ac234a205d5abff4939ee8478dbf","txlist_hash":"bd40f4de40c172e5b5997091f4a069ea54d25504421e6225ef3d9ee360fbca6c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(241,NULL,310047,'insert','blocks','{"block_hash":"610bf3935a85b05a98556c55493c6de45bed4d7b3b6c8553a984718765796309","block_index":310048,"block_time":310048000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(242,NULL,310048,'parse','blocks','{"block_index":310048,"ledger_hash":"e870de901ba86d65d0e2053251ffb32cc7dffb55fcc2efbc006a2b9137314a39","messages_hash":"4de4097a707a21573097f67e72cc9f52b502e0a488b2c17934c60ff9aec3ca64","txlist_hash":"d89730ea689c2912f38a2d2dc86caf6dc35a3e183c4d394129f21368f5c1d371"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(243,NULL,310048,'insert','blocks','{"block_hash":"4ad2761923ad49ad2b283b640f1832522a2a5d6964486b21591b71df6b33be3c","block_index":310049,"block_time":310049000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(244,NULL,310049,'parse','blocks','{"block_index":310049,"ledger_hash":"44cf354cdc8552ed37e5911340397d3531d0ba45100feae27377130d4ddef359","messages_hash":"fefb42b3c87927779046cd4ee3e6956ae79798cf47d9fdcbda09d59f99139479","txlist_hash":"1100866c04ae89913abf573ee61b3a7b56ec8fb7526c7d9c9938d61a187586ab"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(245,NULL,310049,'insert','blocks','{"block_hash":"8cfeb60a14a4cec6e9be13d699694d49007d82a31065a17890383e262071e348","block_index":310050,"block_time":310050000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(246,NULL,310050,'parse','blocks','{"block_index":310050,"ledger_hash":"7d72f11f48ac99553e1b2c52a7ff5645fbe05728a10a002727b9270dbb32daed","messages_hash":"ed89674f1bdb8bff262936bdd369f9b33ada1cce1466ea08a7f3bd9fbfc06cd5","txlist_hash":"1d95ff7cb416f1915ba7db0099ba9591b97c6bc673cb43296cc82655627eb1ad"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(247,NULL,310050,'insert','blocks','{"block_hash":"b53c90385dd808306601350920c6af4beb717518493fd23b5c730eea078f33e6","block_index":310051,"block_time":310051000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(248,NULL,310051,'parse','blocks','{"block_index":310051,"ledger_hash":"35a965dc90686fc4eb20450da81ca8db9125e25c2cdd7146fd61d98841d80c24","messages_hash":"a1c291e9a5685784681f9f1a9021d1cd88249d7039460ba4a1ef3a61bc6f1e2f","txlist_hash":"9d15589506565edb31f7627a37c1f6a6bca01d584b0dc815e8603689f07a80db"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(249,NULL,310051,'insert','blocks','{"block_hash":"0acdacf4e4b6fca756479cb055191b367b1fa433aa558956f5f08fa5b7b394e2","block_index":310052,"block_time":310052000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(250,NULL,310052,'parse','blocks','{"block_index":310052,"ledger_hash":"8604d503e7194ee1c8ebe1143019207b2aad163655107a3d23d018ef26cef550","messages_hash":"5554df4e98fed870e873dd4b78c7e5fcf9a2066e573c6a05f48200e435ab1cb7","txlist_hash":"40053c62babd7f69b9822b6d4223732008d45250146216762da4e13b1b9d3a3b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(251,NULL,310052,'insert','blocks','{"block_hash":"68348f01b6dc49b2cb30fe92ac43e527aa90d859093d3bf7cd695c64d2ef744f","block_index":310053,"block_time":310053000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(252,NULL,310053,'parse','blocks','{"block_index":310053,"ledger_hash":"ecdb64ffc44490eeb12199d2da5c1189c07f4102f5b91494cbe4ec68fe6bb6d4","messages_hash":"408d7c4d46c15335764ec5518c65dbbcbf1a389b3a106332fc8ede93eec63ea9","txlist_hash":"7d74527f370a78a8dca189b60657f9fd15c27ba5f875344546bb8d6e5b54c8c5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(253,NULL,310053,'insert','blocks','{"block_hash":"a8b5f253df293037e49b998675620d5477445c51d5ec66596e023282bb9cd305","block_index":310054,"block_time":310054000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(254,NULL,310054,'parse','blocks','{"block_index":310054,"ledger_hash":"b96b0d51d6327284f5922b65e5d023afd2b2e44c9e11f435afbe2a71df4e6eb2","messages_hash":"cfe641f06ebaae19e0167a07956bfc6af2b8022e00f50d59d079ae6a94344aa4","txlist_hash":"70b8a2eccd5c79e1c270abfdf683dc4423ff315a62486db9e5972a12daaf60ea"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(255,NULL,310054,'insert','blocks','{"block_hash":"4b069152e2dc82e96ed8a3c3547c162e8c3aceeb2a4ac07972f8321a535b9356","block_index":310055,"block_time":310055000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(256,NULL,310055,'parse','blocks','{"block_index":310055,"ledger_hash":"c5be3fc23a9c41b7b78cc7df4ed13d1d35fdd7edab77c998cef5a5a5fe2a7d33","messages_hash":"f398b87ef1257c5cd5f6a09fb7f51a4cbe1687066f25433446f94847cbb8a899","txlist_hash":"0072c2fbc0915dcc39103950d4a48feba19eac28bde001d3dfe0f9ddc25e5152"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(257,NULL,310055,'insert','blocks','{"block_hash":"7603eaed418971b745256742f9d2ba70b2c2b2f69f61de6cc70e61ce0336f9d3","block_index":310056,"block_time":310056000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(258,NULL,310056,'parse','blocks','{"block_index":310056,"ledger_hash":"faa7cf6128f229fe3d408797c77ef2972eb28d16542b32ec87c5fd42d2495018","messages_hash":"ef875ddfb4443cd94d86deac01673964c5f3d1ed4b3afaa0d131445562ce64f8","txlist_hash":"46c53b0ab86b04c06e8302726aeed5922fb5b3d940102422c53bdf4bafe285e4"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(259,NULL,310056,'insert','blocks','{"block_hash":"4a5fdc84f2d66ecb6ee3e3646aad20751ce8694e64e348d3c8aab09d33a3e411","block_index":310057,"block_time":310057000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(260,NULL,310057,'parse','blocks','{"block_index":310057,"ledger_hash":"135af680c59a3d707ff3e6b67fbbb0aaaf0a97724d36ba584087658ae8c0db19","messages_hash":"98310bdd2da785732bfa6de62ba2f2fbd5d103f4204ff7d1b43fed584907693d","txlist_hash":"8b3fe70c1d1b8fa1a247810dfbc2667ca0307860c112002e47107fe4836b8138"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(261,NULL,310057,'insert','blocks','{"block_hash":"a6eef3089896f0cae0bfe9423392e45c48f4efe4310b14d8cfbdb1fea613635f","block_index":310058,"block_time":310058000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(262,NULL,310058,'parse','blocks','{"block_index":310058,"ledger_hash":"496b559ef740feabe42d55356bc770bab7b927d79260c22848b7f47d51918f11","messages_hash":"5fe661842a118ac1eeb5382d6bb92d8039390ee68fcf9cce1441839dcc558c9a","txlist_hash":"ddbb4db386fab0fbbb7edee7c7c45676f994d6feb088f50b0f3edaddcc809e47"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(263,NULL,310058,'insert','blocks','{"block_hash":"ab505de874c43f97c90be1c26a769e6c5cb140405c993b4a6cc7afc795f156a9","block_index":310059,"block_time":310059000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(264,NULL,310059,'parse','blocks','{"block_index":310059,"ledger_hash":"608eb77e572aa596c9e14c6e4cb1dc1993bcbcfe735cf0453124c2801192ecc9","messages_hash":"00ed7b98e21c3dc58d1ee6c41389fbf40e86522758fed197cf39ef3a7274dbc9","txlist_hash":"b8d3a5abf9edc13434594de8ec0cdf3b760f6917798eab89ff2a6a4f0bda06d9"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(265,NULL,310059,'insert','blocks','{"block_hash":"974ad5fbef621e0a38eab811608dc9afaf10c8ecc85fed913075ba1a145e889b","block_index":310060,"block_time":310060000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(266,NULL,310060,'parse','blocks','{"block_index":310060,"ledger_hash":"bc5c375d1237425486c9f46bd749fba20b5635bcaf3e2d9178b35ddfbb700f14","messages_hash":"4d91b8cb3b7b5363ac2e84f7f3d2f5e52207ef68bae865e09bf9fc89aa42d60a","txlist_hash":"1766568459fde2e95dbe4a1c1b73a37b6f8443dc1ec36cb44a38fadd95d8f807"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(267,NULL,310060,'insert','blocks','{"block_hash":"35d267d21ad386e7b7632292af1c422b0310dde7ca49a82f9577525a29c138cf","block_index":310061,"block_time":310061000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(268,NULL,310061,'parse','blocks','{"block_index":310061,"ledger_hash":"c6d48d72746c0e18fa0f1b0b16f663869be2c4684a9d98b634e691ea495f4d81","messages_hash":"d47acf46ad59983e01b9e681527ed2068076ab781880c571426aa808fe36c424","txlist_hash":"9f6619aae8ab667b4291ec14e89386177dec7f3465def984144d2991d10476ab"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(269,NULL,310061,'insert','blocks','{"block_hash":"b31a0054145319ef9de8c1cb19df5bcf4dc8a1ece20053aa494e5d3a00a2852f","block_index":310062,"block_time":310062000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(270,NULL,310062,'parse','blocks','{"block_index":310062,"ledger_hash":"8deffdb1602f1aa2d0d1956d2297ba30ac78901ea27eb223ad8bf7ca83b18110","messages_hash":"8b051844cfce3c15973994e593d4cd84023384ef7d6e4b0c0fe4d2242f68ec6b","txlist_hash":"278612a215aec2522b38d2ddd268f051906a858996b526fa53c48743b1f33c2e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(271,NULL,310062,'insert','blocks','{"block_hash":"0cbcbcd5b7f2dc288e3a34eab3d4212463a5a56e886804fb4f9f1cf929eadebe","block_index":310063,"block_time":310063000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(272,NULL,310063,'parse','blocks','{"block_index":310063,"ledger_hash":"34859861f240c6553ffbf63fff9bc884f231276ec6173964d5fc6641a6d79b16","messages_hash":"dcba300d4efc36a2324491e29a6b0001868b33ab1be391102cef110552178e78","txlist_hash":"a884effb413598885693dd0eed419a3a2a35db95fe4d6582e580bc141f28377c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(273,NULL,310063,'insert','blocks','{"block_hash":"e2db8065a195e85cde9ddb868a17d39893a60fb2b1255aa5f0c88729de7cbf30","block_index":310064,"block_time":310064000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(274,NULL,310064,'parse','blocks','{"block_index":310064,"ledger_hash":"fa185f9b97a1666ce3b966dc09b8a7870ba55896a54a54f54d3420708d5a8ae0","messages_hash":"d18f5fc35609a49d75347c92c7c9a483e35d9c4192503782bafe4478043ba4c2","txlist_hash":"070c320cd53cca3d81560367d437e1f4cb2afb10ab6339e2f1cfb0a2dd6d6063"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(275,NULL,310064,'insert','blocks','{"block_hash":"8a7bc7a77c831ac4fd11b8a9d22d1b6a0661b07cef05c2e600c7fb683b861d2a","block_index":310065,"block_time":310065000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(276,NULL,310065,'parse','blocks','{"block_index":310065,"ledger_hash":"9f75da9f944d59b1841d690b2994ead7fb0ee3d679ddbdb0b692e49238f66603","messages_hash":"18be484e57b9cf23147d188a114137c5948a5b53cd19d657dd973dd265ecd564","txlist_hash":"fb310206b118e11d48becbd11a695199fd7cc3553dd8b2a7c29c6a927f5bafb7"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(277,NULL,310065,'insert','blocks','{"block_hash":"b6959be51eb084747d301f7ccaf9e75f2292c9404633b1532e3692659939430d","block_index":310066,"block_time":310066000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(278,NULL,310066,'parse','blocks','{"block_index":310066,"ledger_hash":"4740587d203632d1b4061343436e25e12941f0f80be03c3ab390a1c08b842b59","messages_hash":"3443a7b0bee87c7ced9d66afce89399e945d14d182019f4dbc2c014c59abe58f","txlist_hash":"041e6429d7ad46da6e1a2547daf274a0df952ac4f9b43eaadfeafa6e005141d6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(279,NULL,310066,'insert','blocks','{"block_hash":"8b08eae98d7193c9c01863fac6effb9162bda010daeacf9e0347112f233b8577","block_index":310067,"block_time":310067000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(280,NULL,310067,'parse','blocks','{"block_index":310067,"ledger_hash":"d6eecb0ca22f29b50e52cd5dec8f408250a7b1ddc61bfa9bf6cc6ef0a85a6ffc","messages_hash":"169a650e89d34830da0f077b7efebb0a64f43b59d725abf94e3c84ac8b6da6a8","txlist_hash":"f8e9baf27b01e99db390d6ee2e06b8ac7d92951c331d8240fdf0dd711ad75979"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(281,NULL,310067,'insert','blocks','{"block_hash":"9280e7297ef6313341bc81787a36acfc9af58f83a415afff5e3154f126cf52b5","block_index":310068,"block_time":310068000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(282,NULL,310068,'parse','blocks','{"block_index":310068,"ledger_hash":"1508605d4796eb2d8b0553b307827f570b5020f4cacf773926b6c8f2c1b003c8","messages_hash":"e0b7f166b6b82211e67aec109d3181bee7c6b48dd68f610b57e9a6c0089ce0c8","txlist_hash":"fe7a135af64a7668cee07a66fa146b6a7a54fc78b96eb7c62d0bbd8b8ec4a820"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(283,NULL,310068,'insert','blocks','{"block_hash":"486351f0655bf594ffaab1980cff17353b640b63e9c27239109addece189a6f7","block_index":310069,"block_time":310069000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(284,NULL,310069,'parse','blocks','{"block_index":310069,"ledger_hash":"ea7afbe0817cfef5a5a940bf88b057d01d092182dd5d0c7fd156b6750fdf4cb2","messages_hash":"50be0edf30243d3f05b2d04582b092f02a3bf48cc36592364f244f1406a7d42e","txlist_hash":"561526733017c46e8f7476f6f7f0a1c317a372adf6ccbe2a34e4d8b0fee1a694"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(285,NULL,310069,'insert','blocks','{"block_hash":"8739e99f4dee8bebf1332f37f49a125348b40b93b74fe35579dd52bfba4fa7e5","block_index":310070,"block_time":310070000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(286,NULL,310070,'parse','blocks','{"block_index":310070,"ledger_hash":"f805d8bd0b724ffeb9e466367e8524bcbcf2c0fe0525b8ff2707af2013824a2c","messages_hash":"99c95d813c0af76a0ba787330b43f1b3eef9c9c12956c734057f5d6af3f173af","txlist_hash":"4c10a876e31ee15289cd2d82d8771bd9aaffd0e335c6de15f8d5316e6e7ee81a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(287,NULL,310070,'insert','blocks','{"block_hash":"7a099aa1bba0ead577f1e44f35263a1f115ed6a868c98d4dd71609072ae7f80b","block_index":310071,"block_time":310071000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(288,NULL,310071,'parse','blocks','{"block_index":310071,"ledger_hash":"305123423486d17e97e8370399b9079a35977465e4cf8c5b33d50bd7004b463b","messages_hash":"600a392fef1ffc97b4862a0eabf83f8bca0be5eacbe68f1a72daa1c9ee52960e","txlist_hash":"660d6afeecb2375668200669bac5cf258dbd18b0f61213eb01d29e133a45917c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(289,NULL,310071,'insert','blocks','{"block_hash":"7b17ecedc07552551b8129e068ae67cb176ca766ea3f6df74b597a94e3a7fc8a","block_index":310072,"block_time":310072000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(290,NULL,310072,'parse','blocks','{"block_index":310072,"ledger_hash":"b04fcd2cf46165fa31626b476aa06f9ad8c8cd1d5aa1cfdc014e0d55fa7e0761","messages_hash":"cd91c870d87762425a917c044f5f2f1e3f03abcd3f574f6b738fcf83786a0c09","txlist_hash":"0791350dc66254e276bfea1651fdda43705668f461f5451fd91fb7e084b26aa2"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(291,NULL,310072,'insert','blocks','{"block_hash":"ee0fe3cc9b3a48a2746b6090b63b442b97ea6055d48edcf4b2288396764c6943","block_index":310073,"block_time":310073000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(292,NULL,310073,'parse','blocks','{"block_index":310073,"ledger_hash":"209f05567343042c8a9172138cc14e28a2e53f9addf16c7affa469fbea9728ae","messages_hash":"42f0c487366bef15ee290608623baa2021b3106933ea6c19c13c889175f25052","txlist_hash":"4885e82f77b273e102f9019b8451e08910a7d98daf19366a0a2b9db779352c0f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(293,NULL,310073,'insert','blocks','{"block_hash":"ceab38dfde01f711a187601731ad575d67cfe0b7dbc61dcd4f15baaef72089fb","block_index":310074,"block_time":310074000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(294,NULL,310074,'parse','blocks','{"block_index":310074,"ledger_hash":"fc18c0dcd6011c4147575f09bdc6e1eb0e6ae7d3144339859054df458651618a","messages_hash":"7cda3663089c12d62dcf16687d67e6c815f59ee61d49b6c7fbf1acef8ff8ad5a","txlist_hash":"49cbefb674e3da718d86151b10bb37755e158a2bdca642a542897361f15fde66"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(295,NULL,310074,'insert','blocks','{"block_hash":"ef547198c6e36d829f117cfd7077ccde45158e3c545152225fa24dba7a26847b","block_index":310075,"block_time":310075000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(296,NULL,310075,'parse','blocks','{"block_index":310075,"ledger_hash":"f304dbebd02e4536b1754502e6f51e058ed309fdf95a2db8329dd7e5635824ad","messages_hash":"19e396d72aff42647cd89d62de2fc077cd5bef0a338dc80d2b23ebd2d3156de5","txlist_hash":"b5e7c72a91d779334162c8fcb6282c7e5baeb43ef83d8f8c0eeb4dd0579f0916"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(297,NULL,310075,'insert','blocks','{"block_hash":"3b0499c2e8e8f0252c7288d4ecf66efc426ca37aad3524424d14c8bc6f8b0d92","block_index":310076,"block_time":310076000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(298,NULL,310076,'parse','blocks','{"block_index":310076,"ledger_hash":"f39c071315c869425bdbcf05ff84130a0860f5f47b4f851cea970f58a6edc9f8","messages_hash":"4045738813eb927f7543bde1971329d6f09a7fde63e8d1392a1600c226474aad","txlist_hash":"e399bd32bd2988f29b4fb003686b343bd72ae59297412480a359bd56ded23ca5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(299,NULL,310076,'insert','blocks','{"block_hash":"d2adeefa9024ab3ff2822bc36acf19b6c647cea118cf15b86c6bc00c3322e7dd","block_index":310077,"block_time":310077000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(300,NULL,310077,'parse','blocks','{"block_index":310077,"ledger_hash":"20624d783cd8e82044df58c05e6171a744505df43623d9c2a828c1331f505ca8","messages_hash":"94b7908b589b1c80ea4dd88f05ffe997d078ad2c78b8cad6265626b6d5317132","txlist_hash":"c587d5426925227ed7d0ef11834b5bb1291fcf0ea3f0bcac864e4356187b6a10"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(301,NULL,310077,'insert','blocks','{"block_hash":"f6c17115ef0efe489c562bcda4615892b4d4b39db0c9791fe193d4922bd82cd6","block_index":310078,"block_time":310078000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(302,NULL,310078,'parse','blocks','{"block_index":310078,"ledger_hash":"41ae6610121587bd8171a02da3c50645e8e6d3642aef2c560d46f12707506b66","messages_hash":"365f46087a06fe2306b2c30b88bc3f6779f93b82a0d9496e2674f48e4665cf85","txlist_hash":"c8331e225af242d83e283889e6234d601ecb507373f4b7de891b8508d1b7b1b6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(303,NULL,310078,'insert','blocks','{"block_hash":"f2fbd2074d804e631db44cb0fb2e1db3fdc367e439c21ffc40d73104c4d7069c","block_index":310079,"block_time":310079000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(304,NULL,310079,'parse','blocks','{"block_index":310079,"ledger_hash":"bbc2068f2a4b47c86198a5cb7242e26f385077126c7a3294eca6607485b1170b","messages_hash":"10181469a6450a20a15d45b37942f7dc0ed689640e6555c0ea58b587ec3cbcb2","txlist_hash":"42ee671f6b45a8e36b4e57dc7edaa2501b075eb75bcfce535435ee4c0cdf2e66"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(305,NULL,310079,'insert','blocks','{"block_hash":"42943b914d9c367000a78b78a544cc4b84b1df838aadde33fe730964a89a3a6c","block_index":310080,"block_time":310080000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(306,NULL,310080,'parse','blocks','{"block_index":310080,"ledger_hash":"fc4350d187ec74fa6dfbbca7f6c51849b78356f853c6c713d10ae4a39ee4f7e2","messages_hash":"e753c18bbf377d74cfe933f4e53a00faf32d066f750c6170e31fae4597c446c0","txlist_hash":"f35b5543ac99e33a4ea6fb61b688d06a2b5b9cc79776df32c24e848b5dad80c0"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(307,NULL,310080,'insert','blocks','{"block_hash":"6554f9d307976249e7b7e260e08046b3b55d318f8b6af627fed5be3063f123c4","block_index":310081,"block_time":310081000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(308,NULL,310081,'parse','blocks','{"block_index":310081,"ledger_hash":"3cadb90f0285d3e3bb107caa2165e88d855cfa057fcff1fccfb278a8f64c9b1c","messages_hash":"bdb06802e00a851facaccffd4e7e0469e99171891e68338fa5c108a59c09e184","txlist_hash":"3ff813ab5112e5adf9f50936955db90036ed0e2ba309022002c69e81473d7c04"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(309,NULL,310081,'insert','blocks','{"block_hash":"4f1ef91b1dcd575f8ac2e66a67715500cbca154bd6f3b8148bb7015a6aa6c644","block_index":310082,"block_time":310082000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(310,NULL,310082,'parse','blocks','{"block_index":310082,"ledger_hash":"f3390bff59484b5ce0d84f5034fc88f4d862334ef3c0d7addaa9be7f0e67006f","messages_hash":"91548b15232ca3271660eaed9e543d6027ad088d34286d8abdfe4184b3fb91db","txlist_hash":"3d843f898e46d0ec4c4cf79709ec7326a0e45d44361a2c9fe45e546bd5f1e630"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(311,NULL,310082,'insert','blocks','{"block_hash":"9b1f6fd6ff9b0dc4e37603cfb0625f49067c775b99e12492afd85392d3c8d850","block_index":310083,"block_time":310083000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(312,NULL,310083,'parse','blocks','{"block_index":310083,"ledger_hash":"0354bf318eaec5c79b4a7835c76c89f373ab0e413f9fe4ebdea442f57763a971","messages_hash":"290b3b825f0ac859bbd2db052280d1f45898734f0f89b8fccf96672f6730217f","txlist_hash":"6405368df02c1207da46178c106ac287c7c90e5b87a98154aa938f6ef5a570d1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(313,NULL,310083,'insert','blocks','{"block_hash":"1e0972523e80306441b9f4157f171716199f1428db2e818a7f7817ccdc8859e3","block_index":310084,"block_time":310084000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(314,NULL,310084,'parse','blocks','{"block_index":310084,"ledger_hash":"e22b7a64e15ded24f6c54a5f627354dd2c3ed8175c2f4cd31aa5a6789d7b67e4","messages_hash":"b4f9a9c17f2c4a6bb4fd1a99d9d3ade15eee4ca747d8c5f1132c777d2cf8e04a","txlist_hash":"6f58e857b2891d43f22bb4b44d296ff18f3078de01cf90aeed104283d66342a2"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(315,NULL,310084,'insert','blocks','{"block_hash":"c5b6e9581831e3bc5848cd7630c499bca26d9ece5156d36579bdb72d54817e34","block_index":310085,"block_time":310085000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(316,NULL,310085,'parse','blocks','{"block_index":310085,"ledger_hash":"7b8a6f62709cf4d20820031f43d968ea46d73d8cee4ad40f414da60b9be4e676","messages_hash":"89b34eb4cd1d69d9c578c7d6181985d828e55b6b926bf562c3117dd8b39971bd","txlist_hash":"51c8a62f3e4c43e6eea75410efb977c8ddd2ad8e64c0d6ce6f63a4e5eb153400"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(317,NULL,310085,'insert','blocks','{"block_hash":"080c1dc55a4ecf4824cf9840602498cfc35b5f84099f50b71b45cb63834c7a78","block_index":310086,"block_time":310086000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(318,NULL,310086,'parse','blocks','{"block_index":310086,"ledger_hash":"ae82ee2f7f1e075937b5b8eef065f8643a7bef0428e00689ee773558905eef19","messages_hash":"845f79869780ce25161caef376dca496190611dbaf591d4b1617202eb1ec6035","txlist_hash":"7358e41e9a61f87d68cc6851768346daea2e100ab896e86c0047e47228e6cc29"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(319,NULL,310086,'insert','blocks','{"block_hash":"4ec8cb1c38b22904e8087a034a6406b896eff4dd28e7620601c6bddf82e2738c","block_index":310087,"block_time":310087000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(320,NULL,310087,'parse','blocks','{"block_index":310087,"ledger_hash":"ced371f1349e81cc2f179f064e4b9b202650a0f79e9b4513666ace29f0e8b3cb","messages_hash":"89835847f0386b5a4a4e4f748f643a22b6bef41b1bbd51c9ee6fa3f3526f0899","txlist_hash":"0e8cd750f8ad91d5b14d2b05b7c03621367036703bed1654555b94592ff41e11"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(321,NULL,310087,'insert','blocks','{"block_hash":"e945c815c433cbddd0bf8e66c5c23b51072483492acda98f5c2c201020a8c5b3","block_index":310088,"block_time":310088000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(322,NULL,310088,'parse','blocks','{"block_index":310088,"ledger_hash":"6c343897092c5dfcd32ee96dc8b96f38fedd31fa58cf5757a3e15a254942cd59","messages_hash":"18faa2da192eaf7d4e7e3ee72a09c146966ce3bae7e2dfe4148d09ec26f6a4fb","txlist_hash":"c38a183db86650f155005a8828155aaf2fc6d92aa89066d7f0843a123800d771"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(323,NULL,310088,'insert','blocks','{"block_hash":"0382437f895ef3e7e38bf025fd4f606fd44d4bbd6aea71dbdc4ed11a7cd46f33","block_index":310089,"block_time":310089000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(324,NULL,310089,'parse','blocks','{"block_index":310089,"ledger_hash":"abc7afdaefa89bf58bc4c28401740657eca24c902ba551f55becb6a1c8992675","messages_hash":"0ed9475500a23bd1df5d9cc2675c3dbe28b137f251b9ce51aeb0e268cc5e1186","txlist_hash":"609b4f777892b43541593da80d09aa2c3928f2f73600009615196a7f89ca8123"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(325,NULL,310089,'insert','blocks','{"block_hash":"b756db71dc037b5a4582de354a3347371267d31ebda453e152f0a13bb2fae969","block_index":310090,"block_time":310090000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(326,NULL,310090,'parse','blocks','{"block_index":310090,"ledger_hash":"4c8ca9b4eeae7adfec822b20665e7bd6fecb51d4f30cc2c826f18402d8401a9b","messages_hash":"1192140c5046ed35037f88bc7dd4fe2a013a2c02a98b861e47b48eb19d80c7c0","txlist_hash":"fba4f7514306c49b3045912791cc21a26527a23e58dcb1c8adc5563e5c6e901d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(327,NULL,310090,'insert','blocks','{"block_hash":"734a9aa485f36399d5efb74f3b9c47f8b5f6fd68c9967f134b14cfe7e2d7583c","block_index":310091,"block_time":310091000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(328,NULL,310091,'parse','blocks','{"block_index":310091,"ledger_hash":"fe7fd2b60c3216d79dfe4e6d38880f6d3b9fde747b619f2c477108825235663d","messages_hash":"51f6f931459ba6a532c7c74d462deb1b0a54da7e011486c6af3056b2e65f195b","txlist_hash":"3a62ce0eeff09c242b3a7c3a8da6dd20bf06c1c2fbf224f73646791557ce3d4c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(329,NULL,310091,'insert','blocks','{"block_hash":"56386beb65f9228740d4ad43a1c575645f6daf59e0dd9f22551c59215b5e8c3d","block_index":310092,"block_time":310092000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(330,NULL,310092,'parse','blocks','{"block_index":310092,"ledger_hash":"420b8ff3c159f7e89df2274682e7ef798a0c0233149365114bfd934c38806098","messages_hash":"49487109a4081406fc52526bbedfe3a2f93e749a4685b1633ead6342bf3dd7a0","txlist_hash":"9c866b1985d2ff084264e192e5defce4af96b7aca461a46f58c659008113909a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(331,NULL,310092,'insert','blocks','{"block_hash":"a74a2425f2f4be24bb5f715173e6756649e1cbf1b064aeb1ef60e0b94b418ddc","block_index":310093,"block_time":310093000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(332,NULL,310093,'parse','blocks','{"block_index":310093,"ledger_hash":"f4fac6a570b4f6332a628a3f8e27f5f081689fb4255363cff1cd8bd0244eecea","messages_hash":"6e9c8dcec7ecbd5d027c038f873ae53e2cc970f49fdd98b3a786fe3c113c38ee","txlist_hash":"271c5484d7a74166a1b83e9dc6f56cc391d5b01829c9b594deb087e58a22b762"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(333,NULL,310093,'insert','blocks','{"block_hash":"2a8f976f20c4e89ff01071915ac96ee35192d54df3a246bf61fd4a0cccfb5b23","block_index":310094,"block_time":310094000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(334,NULL,310094,'parse','blocks','{"block_index":310094,"ledger_hash":"adea7b4cacc06ba1f7dc260f30039943936f5baeecf5a8a452d4cbcaa994a70d","messages_hash":"c8e0c6e52ed6e0dc0d9b2a7cecaa8b53aa2e36e847c0fb20c0c8ef6029700aa6","txlist_hash":"7d8deca0e4f444c015cdf98c74255215af14198d17619640186c6486bb3a6be6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(335,NULL,310094,'insert','blocks','{"block_hash":"bed0fa40c9981223fb40b3be8124ca619edc9dd34d0c907369477ea92e5d2cd2","block_index":310095,"block_time":310095000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(336,NULL,310095,'parse','blocks','{"block_index":310095,"ledger_hash":"a2290c6a24befab16b4d9ed768c3129d582edbafdf8a2326c7ed50397e5db674","messages_hash":"142676e0c4985556d710f23cd93b06f98864f2322b458ff58c0ae3e3dff4e5c5","txlist_hash":"8bab183d2c7670f060de1a64663fe4ec602cc9df957a4d1ccd4b2c5e4876e5ab"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(337,NULL,310095,'insert','blocks','{"block_hash":"306aeec3db435fabffdf88c2f26ee83caa4c2426375a33daa2be041dbd27ea2f","block_index":310096,"block_time":310096000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(338,NULL,310096,'parse','blocks','{"block_index":310096,"ledger_hash":"b3c321ea2fb119cbaacfb39f219be47cb346cdd40d895980afd34b4157a3b7ec","messages_hash":"b2ff4518567b1d1defaebb078146815cc39ab11dc19d392a5d20d299867aa6da","txlist_hash":"6997f2cf50cb2331a8d5cea3f97b32b41a9c40b6006041939b21008016e013c8"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(339,NULL,310096,'insert','blocks','{"block_hash":"13e8e16e67c7cdcc80d477491e554b43744f90e8e1a9728439a11fab42cefadf","block_index":310097,"block_time":310097000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(340,NULL,310097,'parse','blocks','{"block_index":310097,"ledger_hash":"456a1bd4d6b30f24e798a9c1f975af109db030b0bca19db6b29788f938ce6c4d","messages_hash":"11771c3c0ce2f3d5e74539f731ce50c4f34cc01f80b3c32c6136080272e8b448","txlist_hash":"bd930dddbfc97b06fba95a33417533bd58fd5e95326d8677d2939790850a67de"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(341,NULL,310097,'insert','blocks','{"block_hash":"ca5bca4b5ec4fa6183e05176abe921cff884c4e20910fab55b603cef48dc3bca","block_index":310098,"block_time":310098000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(342,NULL,310098,'parse','blocks','{"block_index":310098,"ledger_hash":"f48d6574488a24155420ae76aa7dcecfe73f6a262a2434a96eb2e93f6bbf02b6","messages_hash":"4ba3a4a60a0c079e27df1ae65619cee9ef2aedc4ab595b55871fd36c6dca22c6","txlist_hash":"bf2e65b5a1da6ac499a4ebcde81b607f6516de77ed2a10ff363ddb05dd8e288d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(343,NULL,310098,'insert','blocks','{"block_hash":"3c4c2279cd7de0add5ec469648a845875495a7d54ebfb5b012dcc5a197b7992a","block_index":310099,"block_time":310099000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(344,NULL,310099,'parse','blocks','{"block_index":310099,"ledger_hash":"e936debeb5d219215ba24e56ed34edb435131877c2947c0801824155fdc70c05","messages_hash":"ce9c5786ef39b2358c92af86f3ab6a58251b47487128de33ea86a2d817d74d8d","txlist_hash":"d18b9514ed9fda087d3c98eca75ea68388964396143b925cc58ce2e2d5c1c5da"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(345,NULL,310099,'insert','blocks','{"block_hash":"96925c05b3c7c80c716f5bef68d161c71d044252c766ca0e3f17f255764242cb","block_index":310100,"block_time":310100000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(346,NULL,310100,'parse','blocks','{"block_index":310100,"ledger_hash":"2b033a615b9eb693ed59daca9bc047f61a3519bec5c2b64f968cf717c75afe79","messages_hash":"00c15802e74c7874cd843b0412cc13a263fce9d4cf4f05dbf222ae1558676140","txlist_hash":"1c39371c274124af6085dcf02fcdfda68d36d261bb47d7763ea3f09b70d0f62b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(347,NULL,310100,'insert','blocks','{"block_hash":"369472409995ca1a2ebecbad6bf9dab38c378ab1e67e1bdf13d4ce1346731cd6","block_index":310101,"block_time":310101000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(348,NULL,310101,'parse','blocks','{"block_index":310101,"ledger_hash":"6a41dd11d8b611f6fde79e06a4f65d20fc15419f8336646130c02e9f7d87eff4","messages_hash":"9c5d561b9fd34987179149f2720b511024f0a434b35cb960b4185e80596c7697","txlist_hash":"e2c84c519b3d759f8efb016894a981411328df6f0a778835c95ed4116fef01f5"}',0,'BLOCK_PARSED');
 -- Triggers and indices on  messages
 CREATE TRIGGER block_update_messages
                            BEFORE UPDATE ON messages BEGIN
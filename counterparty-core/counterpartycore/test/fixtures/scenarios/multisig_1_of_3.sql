@@ -463,361 +463,362 @@ BEGIN TRANSACTION;
 DROP TABLE IF EXISTS messages;
 CREATE TABLE messages(
                       message_index INTEGER PRIMARY KEY,
+                      mensaje_index INTEGER,
                       block_index INTEGER,
                       command TEXT,
                       category TEXT,
                       bindings TEXT,
                       timestamp INTEGER,
                       event TEXT);
-INSERT INTO messages VALUES(0,0,'insert','blocks','{"block_hash":"8b3bef249cb3b0fa23a4936c1249b6bd41daeadc848c8d2e409ea1cbc10adfe7","block_index":309999,"block_time":309999000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1,309999,'parse','blocks','{"block_index":309999,"ledger_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","messages_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","txlist_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(2,309999,'insert','blocks','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(3,310000,'insert','transactions','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"btc_amount":62000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"63f8a75a06328d984c928bdcf6bebb20d9c2b154712f1d03041d07c6f319efd2","tx_index":1}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(4,310000,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310000,"calling_function":"burn","event":"63f8a75a06328d984c928bdcf6bebb20d9c2b154712f1d03041d07c6f319efd2","quantity":93000000000,"tx_index":1}',0,'CREDIT');
-INSERT INTO messages VALUES(5,310000,'insert','burns','{"block_index":310000,"burned":62000000,"earned":93000000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"63f8a75a06328d984c928bdcf6bebb20d9c2b154712f1d03041d07c6f319efd2","tx_index":1}',0,'BURN');
-INSERT INTO messages VALUES(6,310000,'parse','blocks','{"block_index":310000,"ledger_hash":"7e1322d444b3395f9d8ce6b1ca6d48e8f0d78e5d72da997fad9520899bdbebe3","messages_hash":"d95ba402c3fcafbebe7fd8f621727efe65b9a20355645e4f62ca4f77f9b4f061","txlist_hash":"702e537dd6e79386a246cbc44fbccf8ea2a4e575c9f1e072189fbbd831308672"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(7,310000,'insert','blocks','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(8,310001,'insert','transactions','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"btc_amount":1000,"data":"0000000000000000000000010000000002faf080","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"5849bd15f5a73840e4babd220ed450d0f46128479d6bb7eaf9f4e98a409c97d4","tx_index":2}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(9,310001,'insert','debits','{"action":"send","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310001,"event":"5849bd15f5a73840e4babd220ed450d0f46128479d6bb7eaf9f4e98a409c97d4","quantity":50000000,"tx_index":2}',0,'DEBIT');
-INSERT INTO messages VALUES(10,310001,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"XCP","block_index":310001,"calling_function":"send","event":"5849bd15f5a73840e4babd220ed450d0f46128479d6bb7eaf9f4e98a409c97d4","quantity":50000000,"tx_index":2}',0,'CREDIT');
-INSERT INTO messages VALUES(11,310001,'insert','sends','{"asset":"XCP","block_index":310001,"destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","quantity":50000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"5849bd15f5a73840e4babd220ed450d0f46128479d6bb7eaf9f4e98a409c97d4","tx_index":2}',0,'SEND');
-INSERT INTO messages VALUES(12,310001,'parse','transactions','{"supported":true,"tx_hash":"5849bd15f5a73840e4babd220ed450d0f46128479d6bb7eaf9f4e98a409c97d4","tx_index":2}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(13,310001,'parse','blocks','{"block_index":310001,"ledger_hash":"3e18d8a969bce2d869cb86b28c23823d88e6d8a840a3cda905a003b37222ebb8","messages_hash":"992c82eb0567345b819a2b96f773b54399af095bd95ded9bdb81f1c9440c6dfd","txlist_hash":"bcd62109b750a9b5c3a07fb6e3ba7a5feb2cb56fb554da3b2b4b560a632e3e2e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(14,310001,'insert','blocks','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(15,310002,'insert','transactions','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"btc_amount":0,"data":"0000000a00000000000000000000000002faf08000000000000000010000000005f5e100000a0000000000000000","destination":"","fee":1000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"04d5809f0085bf2655c500a8c65d6d8b42dd373160fb431af05792b0f30b63a6","tx_index":3}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(16,310002,'insert','orders','{"block_index":310002,"expiration":10,"expire_index":310012,"fee_provided":1000000,"fee_provided_remaining":1000000,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":100000000,"get_remaining":100000000,"give_asset":"BTC","give_quantity":50000000,"give_remaining":50000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","tx_hash":"04d5809f0085bf2655c500a8c65d6d8b42dd373160fb431af05792b0f30b63a6","tx_index":3}',0,'OPEN_ORDER');
-INSERT INTO messages VALUES(17,310002,'parse','transactions','{"supported":true,"tx_hash":"04d5809f0085bf2655c500a8c65d6d8b42dd373160fb431af05792b0f30b63a6","tx_index":3}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(18,310002,'parse','blocks','{"block_index":310002,"ledger_hash":"71dfa527236bbaf632db18cf1773c63f7ee3a0076fc6562e46db0c955b346a9f","messages_hash":"ee6ae96acab5328d1beb240759bfd4593ea203c4a5ab8bbbb893586824ae4816","txlist_hash":"f7e5b51624875d95cb14e212ee733c94f12f69084eeefa4b77491479ea3ae990"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(19,310002,'insert','blocks','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(20,310003,'insert','transactions','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"btc_amount":0,"data":"0000000a00000000000000010000000006422c4000000000000000000000000002faf080000a00000000000dbba0","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"98ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52","tx_index":4}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(21,310003,'insert','debits','{"action":"open order","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310003,"event":"98ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52","quantity":105000000,"tx_index":4}',0,'DEBIT');
-INSERT INTO messages VALUES(22,310003,'insert','orders','{"block_index":310003,"expiration":10,"expire_index":310013,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":900000,"fee_required_remaining":900000,"get_asset":"BTC","get_quantity":50000000,"get_remaining":50000000,"give_asset":"XCP","give_quantity":105000000,"give_remaining":105000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","tx_hash":"98ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52","tx_index":4}',0,'OPEN_ORDER');
-INSERT INTO messages VALUES(23,310003,'update','orders','{"fee_provided_remaining":142858,"fee_required_remaining":0,"get_remaining":0,"give_remaining":0,"status":"open","tx_hash":"04d5809f0085bf2655c500a8c65d6d8b42dd373160fb431af05792b0f30b63a6"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(24,310003,'update','orders','{"fee_provided_remaining":6800,"fee_required_remaining":42858,"get_remaining":0,"give_remaining":5000000,"status":"open","tx_hash":"98ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(25,310003,'insert','order_matches','{"backward_asset":"XCP","backward_quantity":100000000,"block_index":310003,"fee_paid":857142,"forward_asset":"BTC","forward_quantity":50000000,"id":"04d5809f0085bf2655c500a8c65d6d8b42dd373160fb431af05792b0f30b63a6_98ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52","match_expire_index":310023,"status":"pending","tx0_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx0_block_index":310002,"tx0_expiration":10,"tx0_hash":"04d5809f0085bf2655c500a8c65d6d8b42dd373160fb431af05792b0f30b63a6","tx0_index":3,"tx1_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx1_block_index":310003,"tx1_expiration":10,"tx1_hash":"98ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52","tx1_index":4}',0,'ORDER_MATCH');
-INSERT INTO messages VALUES(26,310003,'parse','transactions','{"supported":true,"tx_hash":"98ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52","tx_index":4}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(27,310003,'parse','blocks','{"block_index":310003,"ledger_hash":"39feff81ad306adcfb9610e6bd8442e35dd6e1924e75a53708c1d2932bda67f6","messages_hash":"c3ba35fc4fb0a7a1e9fff19e260c2a36ffc6869477fd4a382b7bc9294aab42a6","txlist_hash":"a857bb0cb63c343a04d6efdf7d69f1de6f89a67dc25ca5b3e9cd9405ef48c416"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(28,310003,'insert','blocks','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(29,310004,'insert','transactions','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"btc_amount":50000000,"data":"0000000b04d5809f0085bf2655c500a8c65d6d8b42dd373160fb431af05792b0f30b63a698ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":9675,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"90eb885df58d93c1d5fdc86a88257db69e6ac7904409929733250b3f7bbe5613","tx_index":5}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(30,310004,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310004,"calling_function":"btcpay","event":"90eb885df58d93c1d5fdc86a88257db69e6ac7904409929733250b3f7bbe5613","quantity":100000000,"tx_index":5}',0,'CREDIT');
-INSERT INTO messages VALUES(31,310004,'update','order_matches','{"id":"04d5809f0085bf2655c500a8c65d6d8b42dd373160fb431af05792b0f30b63a6_98ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52","order_match_id":"04d5809f0085bf2655c500a8c65d6d8b42dd373160fb431af05792b0f30b63a6_98ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52","status":"completed"}',0,'ORDER_MATCH_UPDATE');
-INSERT INTO messages VALUES(32,310004,'insert','btcpays','{"block_index":310004,"btc_amount":50000000,"destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","order_match_id":"04d5809f0085bf2655c500a8c65d6d8b42dd373160fb431af05792b0f30b63a6_98ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52","source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"90eb885df58d93c1d5fdc86a88257db69e6ac7904409929733250b3f7bbe5613","tx_index":5}',0,'BTC_PAY');
-INSERT INTO messages VALUES(33,310004,'parse','transactions','{"supported":true,"tx_hash":"90eb885df58d93c1d5fdc86a88257db69e6ac7904409929733250b3f7bbe5613","tx_index":5}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(34,310004,'parse','blocks','{"block_index":310004,"ledger_hash":"1cee0851ee48eeaa3f71e7a18f9f52fffa28cd3b2e1cbf1f79c0f562618b88c6","messages_hash":"db1deda535fb5c25233d6efc2cc930499cde719c4546f817abad5b30d48af9ac","txlist_hash":"32e68b308a1281ef170d188fe7d19a93486667d45d8a6b50a0c39f00d6924cde"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(35,310004,'insert','blocks','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(36,310005,'insert','transactions','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"btc_amount":0,"data":"000000140000000000004767000000003b9aca000100000000000000000000","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"1ba2a0b4ee8543976aab629c78103c0ba86c60250c11d51f9bc40676487283b7","tx_index":6}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(37,310005,'insert','debits','{"action":"issuance fee","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310005,"event":"1ba2a0b4ee8543976aab629c78103c0ba86c60250c11d51f9bc40676487283b7","quantity":50000000,"tx_index":6}',0,'DEBIT');
-INSERT INTO messages VALUES(38,310005,'insert','assets','{"asset_id":"18279","asset_longname":null,"asset_name":"BBBB","block_index":310005}',0,'ASSET_CREATION');
-INSERT INTO messages VALUES(39,310005,'insert','issuances','{"asset":"BBBB","asset_longname":null,"block_index":310005,"call_date":0,"call_price":0.0,"callable":false,"description":"","divisible":true,"fee_paid":50000000,"issuer":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","locked":false,"quantity":1000000000,"reset":false,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","transfer":false,"tx_hash":"1ba2a0b4ee8543976aab629c78103c0ba86c60250c11d51f9bc40676487283b7","tx_index":6}',0,'ASSET_ISSUANCE');
-INSERT INTO messages VALUES(40,310005,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBB","block_index":310005,"calling_function":"issuance","event":"1ba2a0b4ee8543976aab629c78103c0ba86c60250c11d51f9bc40676487283b7","quantity":1000000000,"tx_index":6}',0,'CREDIT');
-INSERT INTO messages VALUES(41,310005,'parse','transactions','{"supported":true,"tx_hash":"1ba2a0b4ee8543976aab629c78103c0ba86c60250c11d51f9bc40676487283b7","tx_index":6}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(42,310005,'parse','blocks','{"block_index":310005,"ledger_hash":"89f516c3fbdcd1540125561301db451fb55b1baead9ae8f408156075aed104ad","messages_hash":"a587bd615ee0752052c4b1ce2df72fa76cf8ba03ae53e561fa1b55674ae3fbd7","txlist_hash":"3a41f3c4d912ee4628975e61c4a04b836de31df5a9aa5fbd7031628d9c4f0eb6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(43,310005,'insert','blocks','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(44,310006,'insert','transactions','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"btc_amount":0,"data":"00000014000000000000476800000000000186a00000000000000000000006666f6f626172","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"3f9e2dc4f7a72dee0e2d3badd871324506fe6c8239f62b6aa35f316800d55846","tx_index":7}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(45,310006,'insert','debits','{"action":"issuance fee","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310006,"event":"3f9e2dc4f7a72dee0e2d3badd871324506fe6c8239f62b6aa35f316800d55846","quantity":50000000,"tx_index":7}',0,'DEBIT');
-INSERT INTO messages VALUES(46,310006,'insert','assets','{"asset_id":"18280","asset_longname":null,"asset_name":"BBBC","block_index":310006}',0,'ASSET_CREATION');
-INSERT INTO messages VALUES(47,310006,'insert','issuances','{"asset":"BBBC","asset_longname":null,"block_index":310006,"call_date":0,"call_price":0.0,"callable":false,"description":"foobar","divisible":false,"fee_paid":50000000,"issuer":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","locked":false,"quantity":100000,"reset":false,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","transfer":false,"tx_hash":"3f9e2dc4f7a72dee0e2d3badd871324506fe6c8239f62b6aa35f316800d55846","tx_index":7}',0,'ASSET_ISSUANCE');
-INSERT INTO messages VALUES(48,310006,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBC","block_index":310006,"calling_function":"issuance","event":"3f9e2dc4f7a72dee0e2d3badd871324506fe6c8239f62b6aa35f316800d55846","quantity":100000,"tx_index":7}',0,'CREDIT');
-INSERT INTO messages VALUES(49,310006,'parse','transactions','{"supported":true,"tx_hash":"3f9e2dc4f7a72dee0e2d3badd871324506fe6c8239f62b6aa35f316800d55846","tx_index":7}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(50,310006,'parse','blocks','{"block_index":310006,"ledger_hash":"e9a37cfc1055e8c18d369896a14422cad3c5ac8d9b4d5aff6053d8e31dd56336","messages_hash":"200f90a0b58f1350230916be6521a38bc99cc9fdc9165b36a26141b28ae83954","txlist_hash":"4d2d6945b23826371a1cdb4cf2f841cf2b78c891a6b93da8167ed219388edd65"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(51,310006,'insert','blocks','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(52,310007,'insert','transactions','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"btc_amount":1000,"data":"00000000000000000000476700000000003d0900","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"30bfb2793bd1a65e5993edb9c3268db31bc96b8bf1f6e3bef037da4f4e93bc65","tx_index":8}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(53,310007,'insert','debits','{"action":"send","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBB","block_index":310007,"event":"30bfb2793bd1a65e5993edb9c3268db31bc96b8bf1f6e3bef037da4f4e93bc65","quantity":4000000,"tx_index":8}',0,'DEBIT');
-INSERT INTO messages VALUES(54,310007,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"BBBB","block_index":310007,"calling_function":"send","event":"30bfb2793bd1a65e5993edb9c3268db31bc96b8bf1f6e3bef037da4f4e93bc65","quantity":4000000,"tx_index":8}',0,'CREDIT');
-INSERT INTO messages VALUES(55,310007,'insert','sends','{"asset":"BBBB","block_index":310007,"destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","quantity":4000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"30bfb2793bd1a65e5993edb9c3268db31bc96b8bf1f6e3bef037da4f4e93bc65","tx_index":8}',0,'SEND');
-INSERT INTO messages VALUES(56,310007,'parse','transactions','{"supported":true,"tx_hash":"30bfb2793bd1a65e5993edb9c3268db31bc96b8bf1f6e3bef037da4f4e93bc65","tx_index":8}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(57,310007,'parse','blocks','{"block_index":310007,"ledger_hash":"174c7c107c37e0ca2c907b1bc35e086eebbad8eb02493a2f166ff2279ecc013c","messages_hash":"0727ddaec67766acc71f6b2534a1fe0eb25e8866c10d8bd0c5c742eb6a5f8d8c","txlist_hash":"dd1e7522ff359cc0ed124a82d3b367ea105127d45ccf563848b531aaf75b8c2d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(58,310007,'insert','blocks','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(59,310008,'insert','transactions','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"btc_amount":1000,"data":"000000000000000000004768000000000000020e","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"7da21bef68887cb50f8582fc0dda69ee5414993450dfab7437891b5a1117e849","tx_index":9}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(60,310008,'insert','debits','{"action":"send","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBC","block_index":310008,"event":"7da21bef68887cb50f8582fc0dda69ee5414993450dfab7437891b5a1117e849","quantity":526,"tx_index":9}',0,'DEBIT');
-INSERT INTO messages VALUES(61,310008,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"BBBC","block_index":310008,"calling_function":"send","event":"7da21bef68887cb50f8582fc0dda69ee5414993450dfab7437891b5a1117e849","quantity":526,"tx_index":9}',0,'CREDIT');
-INSERT INTO messages VALUES(62,310008,'insert','sends','{"asset":"BBBC","block_index":310008,"destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","quantity":526,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"7da21bef68887cb50f8582fc0dda69ee5414993450dfab7437891b5a1117e849","tx_index":9}',0,'SEND');
-INSERT INTO messages VALUES(63,310008,'parse','transactions','{"supported":true,"tx_hash":"7da21bef68887cb50f8582fc0dda69ee5414993450dfab7437891b5a1117e849","tx_index":9}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(64,310008,'parse','blocks','{"block_index":310008,"ledger_hash":"1463da3ebe264e703ecc0c708baa98f737b31f51726f85d3ac646f5e301b7c10","messages_hash":"46eeaba57e4e2bef42a40c71a8bfd0bd81d10357dfe68f3cc0899ceb0da7bd74","txlist_hash":"3e547d66bace022adbb42aba8172ed287077f306537c9ce69bb11f47ed1b34d1"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(65,310008,'insert','blocks','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(66,310009,'insert','transactions','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"btc_amount":0,"data":"00000032000000000000025800000000000047670000000000000001","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"f3cb8e3c39c261fef8d71c5222b8864bee3c7c1c4ec342430cff08945273779f","tx_index":10}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(67,310009,'insert','debits','{"action":"dividend","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310009,"event":"f3cb8e3c39c261fef8d71c5222b8864bee3c7c1c4ec342430cff08945273779f","quantity":24,"tx_index":10}',0,'DEBIT');
-INSERT INTO messages VALUES(68,310009,'insert','debits','{"action":"dividend fee","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310009,"event":"f3cb8e3c39c261fef8d71c5222b8864bee3c7c1c4ec342430cff08945273779f","quantity":20000,"tx_index":10}',0,'DEBIT');
-INSERT INTO messages VALUES(69,310009,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"XCP","block_index":310009,"calling_function":"dividend","event":"f3cb8e3c39c261fef8d71c5222b8864bee3c7c1c4ec342430cff08945273779f","quantity":24,"tx_index":10}',0,'CREDIT');
-INSERT INTO messages VALUES(70,310009,'insert','dividends','{"asset":"BBBB","block_index":310009,"dividend_asset":"XCP","fee_paid":20000,"quantity_per_unit":600,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"f3cb8e3c39c261fef8d71c5222b8864bee3c7c1c4ec342430cff08945273779f","tx_index":10}',0,'ASSET_DIVIDEND');
-INSERT INTO messages VALUES(71,310009,'parse','transactions','{"supported":true,"tx_hash":"f3cb8e3c39c261fef8d71c5222b8864bee3c7c1c4ec342430cff08945273779f","tx_index":10}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(72,310009,'parse','blocks','{"block_index":310009,"ledger_hash":"dfe8c57b4ce4ea12f002d11cfc127f95b7cea7727bcbaf64418b2d584602a250","messages_hash":"fe46bead46c77b206699519527766a6528f0b9c5de6b51cbab3ff306a30b20bd","txlist_hash":"20b7caf43b34f595139545c800247b16da6e00b0b1162928670c80ffc2cc773f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(73,310009,'insert','blocks','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(74,310010,'insert','transactions','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"btc_amount":0,"data":"00000032000000000000032000000000000047680000000000000001","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"15741649c83a752d61662fe00bd28b1c33dfd7816cb92225a0a61008f9059a59","tx_index":11}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(75,310010,'insert','debits','{"action":"dividend","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310010,"event":"15741649c83a752d61662fe00bd28b1c33dfd7816cb92225a0a61008f9059a59","quantity":420800,"tx_index":11}',0,'DEBIT');
-INSERT INTO messages VALUES(76,310010,'insert','debits','{"action":"dividend fee","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310010,"event":"15741649c83a752d61662fe00bd28b1c33dfd7816cb92225a0a61008f9059a59","quantity":20000,"tx_index":11}',0,'DEBIT');
-INSERT INTO messages VALUES(77,310010,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"XCP","block_index":310010,"calling_function":"dividend","event":"15741649c83a752d61662fe00bd28b1c33dfd7816cb92225a0a61008f9059a59","quantity":420800,"tx_index":11}',0,'CREDIT');
-INSERT INTO messages VALUES(78,310010,'insert','dividends','{"asset":"BBBC","block_index":310010,"dividend_asset":"XCP","fee_paid":20000,"quantity_per_unit":800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"15741649c83a752d61662fe00bd28b1c33dfd7816cb92225a0a61008f9059a59","tx_index":11}',0,'ASSET_DIVIDEND');
-INSERT INTO messages VALUES(79,310010,'parse','transactions','{"supported":true,"tx_hash":"15741649c83a752d61662fe00bd28b1c33dfd7816cb92225a0a61008f9059a59","tx_index":11}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(80,310010,'parse','blocks','{"block_index":310010,"ledger_hash":"f9c936d3bb4c8bbc20e544d9262ffa3906fbaeca5e4b2e3b241f6059868f506e","messages_hash":"aa6e782f2298ea91fe4708af37be85c140fbe2b6772a66a9f9acb11d0e2186fe","txlist_hash":"47442be955776c7e31fba3f14df298b088192577691c17dced8b14b6037e3c50"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(81,310010,'insert','blocks','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(82,310011,'insert','transactions','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"btc_amount":0,"data":"0000001e52bb3300405900000000000005f5e0ff09556e69742054657374","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"1a5b6320346fcb5f7b59ce88553ef92738d2f5ba0a7477e898df85b2730a0f1a","tx_index":12}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(83,310011,'insert','broadcasts','{"block_index":310011,"fee_fraction_int":99999999,"locked":false,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","text":"Unit Test","timestamp":1388000000,"tx_hash":"1a5b6320346fcb5f7b59ce88553ef92738d2f5ba0a7477e898df85b2730a0f1a","tx_index":12,"value":100.0}',0,'BROADCAST');
-INSERT INTO messages VALUES(84,310011,'parse','transactions','{"supported":true,"tx_hash":"1a5b6320346fcb5f7b59ce88553ef92738d2f5ba0a7477e898df85b2730a0f1a","tx_index":12}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(85,310011,'parse','blocks','{"block_index":310011,"ledger_hash":"490bfec10bfd72eca7fcbae5887b94ce4739454a82e601dc754e4e9d1030f3c2","messages_hash":"c9c5eded352f3952628122af57f3f3d716beac03fc6058fb7601f90617221fd2","txlist_hash":"8a060a9cc82b497e020ad7af45a62c07110b724282ce0c7ca34ad24584638a3b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(86,310011,'insert','blocks','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(87,310012,'insert','transactions','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"btc_amount":1000,"data":"00000028000052bb33640000000002faf08000000000017d7840000000000000000000003b100000000a","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"1075391072b01264a783bf31205a83abdf7356c8c405753d3ef8599f852df887","tx_index":13}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(88,310012,'insert','debits','{"action":"bet","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310012,"event":"1075391072b01264a783bf31205a83abdf7356c8c405753d3ef8599f852df887","quantity":50000000,"tx_index":13}',0,'DEBIT');
-INSERT INTO messages VALUES(89,310012,'insert','bets','{"bet_type":0,"block_index":310012,"counterwager_quantity":25000000,"counterwager_remaining":25000000,"deadline":1388000100,"expiration":10,"expire_index":310022,"fee_fraction_int":99999999.0,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":15120,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":0.0,"tx_hash":"1075391072b01264a783bf31205a83abdf7356c8c405753d3ef8599f852df887","tx_index":13,"wager_quantity":50000000,"wager_remaining":50000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(90,310012,'parse','transactions','{"supported":true,"tx_hash":"1075391072b01264a783bf31205a83abdf7356c8c405753d3ef8599f852df887","tx_index":13}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(91,310012,'parse','blocks','{"block_index":310012,"ledger_hash":"621d39c103bff9a76ada332f41e3ad54c89676bb6057f624942ddf28b31b5927","messages_hash":"26c52cc30b3386eeac9bdd91338ea6460559a0ec72b81314f6de852446b881f3","txlist_hash":"4eb1fdd02e0f8ba27b9134ddb7b03b51caf3417e92687c7c1a7b50ce2d52e6ca"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(92,310012,'insert','blocks','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(93,310013,'insert','transactions','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"btc_amount":1000,"data":"00000028000152bb336400000000017d78400000000002793d60000000000000000000003b100000000a","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"a067f79057992245507ea08e901e623918be2b0eb2d178e35b01f36da2d30a33","tx_index":14}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(94,310013,'update','orders','{"status":"expired","tx_hash":"04d5809f0085bf2655c500a8c65d6d8b42dd373160fb431af05792b0f30b63a6"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(95,310013,'insert','order_expirations','{"block_index":310013,"order_hash":"04d5809f0085bf2655c500a8c65d6d8b42dd373160fb431af05792b0f30b63a6","source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3"}',0,'ORDER_EXPIRATION');
-INSERT INTO messages VALUES(96,310013,'insert','debits','{"action":"bet","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310013,"event":"a067f79057992245507ea08e901e623918be2b0eb2d178e35b01f36da2d30a33","quantity":25000000,"tx_index":14}',0,'DEBIT');
-INSERT INTO messages VALUES(97,310013,'insert','bets','{"bet_type":1,"block_index":310013,"counterwager_quantity":41500000,"counterwager_remaining":41500000,"deadline":1388000100,"expiration":10,"expire_index":310023,"fee_fraction_int":99999999.0,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":15120,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":0.0,"tx_hash":"a067f79057992245507ea08e901e623918be2b0eb2d178e35b01f36da2d30a33","tx_index":14,"wager_quantity":25000000,"wager_remaining":25000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(98,310013,'update','bets','{"counterwager_remaining":4250000,"status":"open","tx_hash":"1075391072b01264a783bf31205a83abdf7356c8c405753d3ef8599f852df887","wager_remaining":8500000}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(99,310013,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310013,"calling_function":"filled","event":"a067f79057992245507ea08e901e623918be2b0eb2d178e35b01f36da2d30a33","quantity":4250000,"tx_index":14}',0,'CREDIT');
-INSERT INTO messages VALUES(100,310013,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"a067f79057992245507ea08e901e623918be2b0eb2d178e35b01f36da2d30a33","wager_remaining":4250000}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(101,310013,'insert','bet_matches','{"backward_quantity":20750000,"block_index":310012,"deadline":1388000100,"fee_fraction_int":99999999,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","forward_quantity":41500000,"id":"1075391072b01264a783bf31205a83abdf7356c8c405753d3ef8599f852df887_a067f79057992245507ea08e901e623918be2b0eb2d178e35b01f36da2d30a33","initial_value":100.0,"leverage":15120,"match_expire_index":310022,"status":"pending","target_value":0.0,"tx0_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx0_bet_type":0,"tx0_block_index":310012,"tx0_expiration":10,"tx0_hash":"1075391072b01264a783bf31205a83abdf7356c8c405753d3ef8599f852df887","tx0_index":13,"tx1_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx1_bet_type":1,"tx1_block_index":310013,"tx1_expiration":10,"tx1_hash":"a067f79057992245507ea08e901e623918be2b0eb2d178e35b01f36da2d30a33","tx1_index":14}',0,'BET_MATCH');
-INSERT INTO messages VALUES(102,310013,'parse','transactions','{"supported":true,"tx_hash":"a067f79057992245507ea08e901e623918be2b0eb2d178e35b01f36da2d30a33","tx_index":14}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(103,310013,'parse','blocks','{"block_index":310013,"ledger_hash":"7d31be770d6bb6669bcb0a8a5964e57a758788cbbb942d1d3da1abd25b5dd158","messages_hash":"04ac5c161df427ab528946abd575d82c8579c27637511d1784049e1281c97dfe","txlist_hash":"c71d132b3da755134d5305e814129761fdeab1ac933dc320f83570bd5d007002"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(104,310013,'insert','blocks','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(105,310014,'insert','transactions','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"btc_amount":1000,"data":"00000028000052bb33640000000008f0d1800000000014dc93800000000000000000000013b00000000a","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"040e03dfdef2df24411a077cfe5f90f3311bbb82bb3783ea2d7e6f484afd3e2b","tx_index":15}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(106,310014,'update','orders','{"status":"expired","tx_hash":"98ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(107,310014,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310014,"calling_function":"cancel order","event":"98ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52","quantity":5000000,"tx_index":0}',0,'CREDIT');
-INSERT INTO messages VALUES(108,310014,'insert','order_expirations','{"block_index":310014,"order_hash":"98ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52","source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3"}',0,'ORDER_EXPIRATION');
-INSERT INTO messages VALUES(109,310014,'insert','debits','{"action":"bet","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310014,"event":"040e03dfdef2df24411a077cfe5f90f3311bbb82bb3783ea2d7e6f484afd3e2b","quantity":150000000,"tx_index":15}',0,'DEBIT');
-INSERT INTO messages VALUES(110,310014,'insert','bets','{"bet_type":0,"block_index":310014,"counterwager_quantity":350000000,"counterwager_remaining":350000000,"deadline":1388000100,"expiration":10,"expire_index":310024,"fee_fraction_int":99999999.0,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":5040,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":0.0,"tx_hash":"040e03dfdef2df24411a077cfe5f90f3311bbb82bb3783ea2d7e6f484afd3e2b","tx_index":15,"wager_quantity":150000000,"wager_remaining":150000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(111,310014,'parse','transactions','{"supported":true,"tx_hash":"040e03dfdef2df24411a077cfe5f90f3311bbb82bb3783ea2d7e6f484afd3e2b","tx_index":15}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(112,310014,'parse','blocks','{"block_index":310014,"ledger_hash":"3aba9622f8de243bcd5e6a5c88fdf04a79a52d95bdc1778d57586b13f30e501c","messages_hash":"6955a89976cbc97716f4f2a189d22ce159a4110af396e660f85ab6e688c24fea","txlist_hash":"d7949a992d062d2eb763b2bd406ffab07d7d676e3327f5e38a4a8a4815e97f35"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(113,310014,'insert','blocks','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(114,310015,'insert','transactions','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"btc_amount":1000,"data":"00000028000152bb33640000000014dc93800000000008f0d1800000000000000000000013b00000000a","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"62ece578c6760773bd4252922a7a0af87da1a1c308f32423e20cf49a369ea0a2","tx_index":16}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(115,310015,'insert','debits','{"action":"bet","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310015,"event":"62ece578c6760773bd4252922a7a0af87da1a1c308f32423e20cf49a369ea0a2","quantity":350000000,"tx_index":16}',0,'DEBIT');
-INSERT INTO messages VALUES(116,310015,'insert','bets','{"bet_type":1,"block_index":310015,"counterwager_quantity":150000000,"counterwager_remaining":150000000,"deadline":1388000100,"expiration":10,"expire_index":310025,"fee_fraction_int":99999999.0,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":5040,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":0.0,"tx_hash":"62ece578c6760773bd4252922a7a0af87da1a1c308f32423e20cf49a369ea0a2","tx_index":16,"wager_quantity":350000000,"wager_remaining":350000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(117,310015,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310015,"calling_function":"filled","event":"62ece578c6760773bd4252922a7a0af87da1a1c308f32423e20cf49a369ea0a2","quantity":0,"tx_index":16}',0,'CREDIT');
-INSERT INTO messages VALUES(118,310015,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"040e03dfdef2df24411a077cfe5f90f3311bbb82bb3783ea2d7e6f484afd3e2b","wager_remaining":0}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(119,310015,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310015,"calling_function":"filled","event":"62ece578c6760773bd4252922a7a0af87da1a1c308f32423e20cf49a369ea0a2","quantity":0,"tx_index":16}',0,'CREDIT');
-INSERT INTO messages VALUES(120,310015,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"62ece578c6760773bd4252922a7a0af87da1a1c308f32423e20cf49a369ea0a2","wager_remaining":0}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(121,310015,'insert','bet_matches','{"backward_quantity":350000000,"block_index":310014,"deadline":1388000100,"fee_fraction_int":99999999,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","forward_quantity":150000000,"id":"040e03dfdef2df24411a077cfe5f90f3311bbb82bb3783ea2d7e6f484afd3e2b_62ece578c6760773bd4252922a7a0af87da1a1c308f32423e20cf49a369ea0a2","initial_value":100.0,"leverage":5040,"match_expire_index":310024,"status":"pending","target_value":0.0,"tx0_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx0_bet_type":0,"tx0_block_index":310014,"tx0_expiration":10,"tx0_hash":"040e03dfdef2df24411a077cfe5f90f3311bbb82bb3783ea2d7e6f484afd3e2b","tx0_index":15,"tx1_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx1_bet_type":1,"tx1_block_index":310015,"tx1_expiration":10,"tx1_hash":"62ece578c6760773bd4252922a7a0af87da1a1c308f32423e20cf49a369ea0a2","tx1_index":16}',0,'BET_MATCH');
-INSERT INTO messages VALUES(122,310015,'parse','transactions','{"supported":true,"tx_hash":"62ece578c6760773bd4252922a7a0af87da1a1c308f32423e20cf49a369ea0a2","tx_index":16}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(123,310015,'parse','blocks','{"block_index":310015,"ledger_hash":"342e5dddd2289d3d6e381fade13e5a5e3ed27615b89bd8e06ea2bab8f8b48be8","messages_hash":"710b39597c7c1009e186eb15450bec99878edf95af9935ae8ccb2246b6b6728b","txlist_hash":"5afdd424176b977bd7b0660867d92952a9cec422a6861c62a876a10014807084"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(124,310015,'insert','blocks','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(125,310016,'insert','transactions','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"btc_amount":1000,"data":"00000028000252bb33c8000000002cb417800000000026be36803ff0000000000000000013b00000000a","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"578d8026c9a3a9173fdb7d5f10c6d5e7d49f375edf5fd8b3f29ccb37a8b42d1f","tx_index":17}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(126,310016,'insert','debits','{"action":"bet","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310016,"event":"578d8026c9a3a9173fdb7d5f10c6d5e7d49f375edf5fd8b3f29ccb37a8b42d1f","quantity":750000000,"tx_index":17}',0,'DEBIT');
-INSERT INTO messages VALUES(127,310016,'insert','bets','{"bet_type":2,"block_index":310016,"counterwager_quantity":650000000,"counterwager_remaining":650000000,"deadline":1388000200,"expiration":10,"expire_index":310026,"fee_fraction_int":99999999.0,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":5040,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":1.0,"tx_hash":"578d8026c9a3a9173fdb7d5f10c6d5e7d49f375edf5fd8b3f29ccb37a8b42d1f","tx_index":17,"wager_quantity":750000000,"wager_remaining":750000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(128,310016,'parse','transactions','{"supported":true,"tx_hash":"578d8026c9a3a9173fdb7d5f10c6d5e7d49f375edf5fd8b3f29ccb37a8b42d1f","tx_index":17}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(129,310016,'parse','blocks','{"block_index":310016,"ledger_hash":"51b904e6b18ce4d17bdc491457036ff3a4ba70789ae929862844e9456c3b9b01","messages_hash":"068b8aa01882c57eee33d9c970b47032d3977b9a5c3c5f96cbb96f10a7209706","txlist_hash":"d74711d3af6b2313835591b58b1ff53bc20bc194922d10a60cb1274ca632e153"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(130,310016,'insert','blocks','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(131,310017,'insert','transactions','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"btc_amount":1000,"data":"00000028000352bb33c80000000026be3680000000002cb417803ff0000000000000000013b00000000a","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"479b0fbec468381f1e27332755b12a69800680379d0037e02f641265a8beb183","tx_index":18}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(132,310017,'insert','debits','{"action":"bet","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310017,"event":"479b0fbec468381f1e27332755b12a69800680379d0037e02f641265a8beb183","quantity":650000000,"tx_index":18}',0,'DEBIT');
-INSERT INTO messages VALUES(133,310017,'insert','bets','{"bet_type":3,"block_index":310017,"counterwager_quantity":750000000,"counterwager_remaining":750000000,"deadline":1388000200,"expiration":10,"expire_index":310027,"fee_fraction_int":99999999.0,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":5040,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":1.0,"tx_hash":"479b0fbec468381f1e27332755b12a69800680379d0037e02f641265a8beb183","tx_index":18,"wager_quantity":650000000,"wager_remaining":650000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(134,310017,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310017,"calling_function":"filled","event":"479b0fbec468381f1e27332755b12a69800680379d0037e02f641265a8beb183","quantity":0,"tx_index":18}',0,'CREDIT');
-INSERT INTO messages VALUES(135,310017,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"578d8026c9a3a9173fdb7d5f10c6d5e7d49f375edf5fd8b3f29ccb37a8b42d1f","wager_remaining":0}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(136,310017,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310017,"calling_function":"filled","event":"479b0fbec468381f1e27332755b12a69800680379d0037e02f641265a8beb183","quantity":0,"tx_index":18}',0,'CREDIT');
-INSERT INTO messages VALUES(137,310017,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"479b0fbec468381f1e27332755b12a69800680379d0037e02f641265a8beb183","wager_remaining":0}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(138,310017,'insert','bet_matches','{"backward_quantity":650000000,"block_index":310016,"deadline":1388000200,"fee_fraction_int":99999999,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","forward_quantity":750000000,"id":"578d8026c9a3a9173fdb7d5f10c6d5e7d49f375edf5fd8b3f29ccb37a8b42d1f_479b0fbec468381f1e27332755b12a69800680379d0037e02f641265a8beb183","initial_value":100.0,"leverage":5040,"match_expire_index":310026,"status":"pending","target_value":1.0,"tx0_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx0_bet_type":2,"tx0_block_index":310016,"tx0_expiration":10,"tx0_hash":"578d8026c9a3a9173fdb7d5f10c6d5e7d49f375edf5fd8b3f29ccb37a8b42d1f","tx0_index":17,"tx1_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx1_bet_type":3,"tx1_block_index":310017,"tx1_expiration":10,"tx1_hash":"479b0fbec468381f1e27332755b12a69800680379d0037e02f641265a8beb183","tx1_index":18}',0,'BET_MATCH');
-INSERT INTO messages VALUES(139,310017,'parse','transactions','{"supported":true,"tx_hash":"479b0fbec468381f1e27332755b12a69800680379d0037e02f641265a8beb183","tx_index":18}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(140,310017,'parse','blocks','{"block_index":310017,"ledger_hash":"03a60654bc84711524cb38171f6573acbe8cc2120787bd09e5ec621b2f53929c","messages_hash":"795d00da46b3c5f0d16ed694ca58d6aff3cb42c8e2f0d08bfc77964b5b451cde","txlist_hash":"bafeaf2f42cf716cdd586e1aea74504257d170275022dfb2c11863cdc33d3127"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(141,310017,'insert','blocks','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(142,310018,'insert','transactions','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"btc_amount":0,"data":"0000001e52bb33324058f7256ffc115e004c4b4009556e69742054657374","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"16a5d04f339e5765125c4b2fdda91e45e135e44df489b97805b5d3bae50a6485","tx_index":19}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(143,310018,'insert','broadcasts','{"block_index":310018,"fee_fraction_int":5000000,"locked":false,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","text":"Unit Test","timestamp":1388000050,"tx_hash":"16a5d04f339e5765125c4b2fdda91e45e135e44df489b97805b5d3bae50a6485","tx_index":19,"value":99.86166}',0,'BROADCAST');
-INSERT INTO messages VALUES(144,310018,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310018,"calling_function":"bet settled: liquidated for bear","event":"16a5d04f339e5765125c4b2fdda91e45e135e44df489b97805b5d3bae50a6485","quantity":59137500,"tx_index":19}',0,'CREDIT');
-INSERT INTO messages VALUES(145,310018,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310018,"calling_function":"feed fee","event":"16a5d04f339e5765125c4b2fdda91e45e135e44df489b97805b5d3bae50a6485","quantity":3112500,"tx_index":19}',0,'CREDIT');
-INSERT INTO messages VALUES(146,310018,'insert','bet_match_resolutions','{"bear_credit":59137500,"bet_match_id":"1075391072b01264a783bf31205a83abdf7356c8c405753d3ef8599f852df887_a067f79057992245507ea08e901e623918be2b0eb2d178e35b01f36da2d30a33","bet_match_type_id":1,"block_index":310018,"bull_credit":0,"escrow_less_fee":null,"fee":3112500,"settled":false,"winner":null}',0,'BET_MATCH_RESOLUTON');
-INSERT INTO messages VALUES(147,310018,'update','bet_matches','{"id":"1075391072b01264a783bf31205a83abdf7356c8c405753d3ef8599f852df887_a067f79057992245507ea08e901e623918be2b0eb2d178e35b01f36da2d30a33","status":"settled: liquidated for bear"}',0,'BET_MATCH_UPDATE');
-INSERT INTO messages VALUES(148,310018,'parse','transactions','{"supported":true,"tx_hash":"16a5d04f339e5765125c4b2fdda91e45e135e44df489b97805b5d3bae50a6485","tx_index":19}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(149,310018,'parse','blocks','{"block_index":310018,"ledger_hash":"a590602f34163cf8f880c3620f07a8cd27b9aeba8fc80ccb201d88364eaed210","messages_hash":"dfd585d1c8707912ca3f03923bc4e50cbbbe5a8e4218caecb73df3cb6cb4fd5a","txlist_hash":"930eaaee66936628f4ac02f6417167100cc7e2335aaae56dac78cf2ea81bb172"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(150,310018,'insert','blocks','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(151,310019,'insert','transactions','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"btc_amount":0,"data":"0000001e52bb3365405915f3b645a1cb004c4b4009556e69742054657374","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"65c96e80d7bfe2c7b00086196a7fc38889d91f5907658a6bbe795c89ef90ce37","tx_index":20}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(152,310019,'insert','broadcasts','{"block_index":310019,"fee_fraction_int":5000000,"locked":false,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","text":"Unit Test","timestamp":1388000101,"tx_hash":"65c96e80d7bfe2c7b00086196a7fc38889d91f5907658a6bbe795c89ef90ce37","tx_index":20,"value":100.343}',0,'BROADCAST');
-INSERT INTO messages VALUES(153,310019,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310019,"calling_function":"bet settled","event":"65c96e80d7bfe2c7b00086196a7fc38889d91f5907658a6bbe795c89ef90ce37","quantity":159300000,"tx_index":20}',0,'CREDIT');
-INSERT INTO messages VALUES(154,310019,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310019,"calling_function":"bet settled","event":"65c96e80d7bfe2c7b00086196a7fc38889d91f5907658a6bbe795c89ef90ce37","quantity":315700000,"tx_index":20}',0,'CREDIT');
-INSERT INTO messages VALUES(155,310019,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310019,"calling_function":"feed fee","event":"65c96e80d7bfe2c7b00086196a7fc38889d91f5907658a6bbe795c89ef90ce37","quantity":25000000,"tx_index":20}',0,'CREDIT');
-INSERT INTO messages VALUES(156,310019,'insert','bet_match_resolutions','{"bear_credit":315700000,"bet_match_id":"040e03dfdef2df24411a077cfe5f90f3311bbb82bb3783ea2d7e6f484afd3e2b_62ece578c6760773bd4252922a7a0af87da1a1c308f32423e20cf49a369ea0a2","bet_match_type_id":1,"block_index":310019,"bull_credit":159300000,"escrow_less_fee":null,"fee":25000000,"settled":true,"winner":null}',0,'BET_MATCH_RESOLUTON');
-INSERT INTO messages VALUES(157,310019,'update','bet_matches','{"id":"040e03dfdef2df24411a077cfe5f90f3311bbb82bb3783ea2d7e6f484afd3e2b_62ece578c6760773bd4252922a7a0af87da1a1c308f32423e20cf49a369ea0a2","status":"settled"}',0,'BET_MATCH_UPDATE');
-INSERT INTO messages VALUES(158,310019,'parse','transactions','{"supported":true,"tx_hash":"65c96e80d7bfe2c7b00086196a7fc38889d91f5907658a6bbe795c89ef90ce37","tx_index":20}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(159,310019,'parse','blocks','{"block_index":310019,"ledger_hash":"1b340e7abac4c458e6a0c6ff2abd6dadaa2913414f450cf926725b5253210950","messages_hash":"16e098173f2f2fb61b8df304c27cc1069eb397263de2262743a57426e05a8152","txlist_hash":"ba496b27fd545d9d811d7421c6f9663e68aa9dbe3a7b5aa9d1ee5644cd142b4a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(160,310019,'insert','blocks','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(161,310020,'insert','transactions','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"btc_amount":0,"data":"0000001e52bb33c94000000000000000004c4b4009556e69742054657374","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"43232e4a2e0863cde59fb404a8da059c01cc8afb6c88b509f77d6cbfa02d187e","tx_index":21}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(162,310020,'insert','broadcasts','{"block_index":310020,"fee_fraction_int":5000000,"locked":false,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","text":"Unit Test","timestamp":1388000201,"tx_hash":"43232e4a2e0863cde59fb404a8da059c01cc8afb6c88b509f77d6cbfa02d187e","tx_index":21,"value":2.0}',0,'BROADCAST');
-INSERT INTO messages VALUES(163,310020,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310020,"calling_function":"bet settled: for notequal","event":"43232e4a2e0863cde59fb404a8da059c01cc8afb6c88b509f77d6cbfa02d187e","quantity":1330000000,"tx_index":21}',0,'CREDIT');
-INSERT INTO messages VALUES(164,310020,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310020,"calling_function":"feed fee","event":"43232e4a2e0863cde59fb404a8da059c01cc8afb6c88b509f77d6cbfa02d187e","quantity":70000000,"tx_index":21}',0,'CREDIT');
-INSERT INTO messages VALUES(165,310020,'insert','bet_match_resolutions','{"bear_credit":null,"bet_match_id":"578d8026c9a3a9173fdb7d5f10c6d5e7d49f375edf5fd8b3f29ccb37a8b42d1f_479b0fbec468381f1e27332755b12a69800680379d0037e02f641265a8beb183","bet_match_type_id":5,"block_index":310020,"bull_credit":null,"escrow_less_fee":1330000000,"fee":70000000,"settled":null,"winner":"NotEqual"}',0,'BET_MATCH_RESOLUTON');
-INSERT INTO messages VALUES(166,310020,'update','bet_matches','{"id":"578d8026c9a3a9173fdb7d5f10c6d5e7d49f375edf5fd8b3f29ccb37a8b42d1f_479b0fbec468381f1e27332755b12a69800680379d0037e02f641265a8beb183","status":"settled: for notequal"}',0,'BET_MATCH_UPDATE');
-INSERT INTO messages VALUES(167,310020,'parse','transactions','{"supported":true,"tx_hash":"43232e4a2e0863cde59fb404a8da059c01cc8afb6c88b509f77d6cbfa02d187e","tx_index":21}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(168,310020,'parse','blocks','{"block_index":310020,"ledger_hash":"5a5a31ae9b03a362b44c9e38effadfeac273bd370374ea4816b8402d6b8a8a1a","messages_hash":"27297409f25155cbbf6c84b665c6d0375c5e964c279c111df35370720b9299ee","txlist_hash":"be94a40c259a5f9e2ad5cb714089c4be18de7bd6d3b403f3a4620f4d889ba4ed"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(169,310020,'insert','blocks','{"block_hash":"7c2460bb32c5749c856486393239bf7a0ac789587ac71f32e7237910da8097f2","block_index":310021,"block_time":310021000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(170,310021,'insert','transactions','{"block_hash":"7c2460bb32c5749c856486393239bf7a0ac789587ac71f32e7237910da8097f2","block_index":310021,"block_time":310021000,"btc_amount":0,"data":"0000000a00000000000047670000000002faf08000000000000000010000000002faf080000a0000000000000000","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"cd79f155a7a8b7737cf959cdc347db22f2f38288261842997e13844a09f6f2ee","tx_index":22}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(171,310021,'insert','debits','{"action":"open order","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBB","block_index":310021,"event":"cd79f155a7a8b7737cf959cdc347db22f2f38288261842997e13844a09f6f2ee","quantity":50000000,"tx_index":22}',0,'DEBIT');
-INSERT INTO messages VALUES(172,310021,'insert','orders','{"block_index":310021,"expiration":10,"expire_index":310031,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":50000000,"get_remaining":50000000,"give_asset":"BBBB","give_quantity":50000000,"give_remaining":50000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","tx_hash":"cd79f155a7a8b7737cf959cdc347db22f2f38288261842997e13844a09f6f2ee","tx_index":22}',0,'OPEN_ORDER');
-INSERT INTO messages VALUES(173,310021,'parse','transactions','{"supported":true,"tx_hash":"cd79f155a7a8b7737cf959cdc347db22f2f38288261842997e13844a09f6f2ee","tx_index":22}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(174,310021,'parse','blocks','{"block_index":310021,"ledger_hash":"2005a300856ccc74efe80c56927fc13619d5c40ab03ae4ee4fba2050bc2a6b75","messages_hash":"dad5bc884bf7ba7bc454bc0864ce114a1faf785f6cf500fc4df296130ac5d56f","txlist_hash":"afa68f3f9cb6cf8f767075bc9119411e146b6838278d884868a80d9c8e80e26f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(175,310021,'insert','blocks','{"block_hash":"44435f9a99a0aa12a9bfabdc4cb8119f6ea6a6e1350d2d65445fb66a456db5fc","block_index":310022,"block_time":310022000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(176,310022,'insert','transactions','{"block_hash":"44435f9a99a0aa12a9bfabdc4cb8119f6ea6a6e1350d2d65445fb66a456db5fc","block_index":310022,"block_time":310022000,"btc_amount":100000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"ec9788fbae83a6cdf980d5373d85911a27447410efa4b11997fefcc41bc89caa","tx_index":23}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(177,310022,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310022,"calling_function":"burn","event":"ec9788fbae83a6cdf980d5373d85911a27447410efa4b11997fefcc41bc89caa","quantity":56999887262,"tx_index":23}',0,'CREDIT');
-INSERT INTO messages VALUES(178,310022,'insert','burns','{"block_index":310022,"burned":38000000,"earned":56999887262,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"ec9788fbae83a6cdf980d5373d85911a27447410efa4b11997fefcc41bc89caa","tx_index":23}',0,'BURN');
-INSERT INTO messages VALUES(179,310022,'parse','blocks','{"block_index":310022,"ledger_hash":"95307de52e23a8433143d79710e7df22ba7205e2651c88a2eda220ebc8e0f289","messages_hash":"36fe7b2ad4951a9900b5bbf451e10101d5cdd8ff33d4c40eb6e253dee2e8e991","txlist_hash":"66f27b0e46d782b3e7eb8207ba442131069820295ea19ba9b1f8be5ae5b1367b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(180,310022,'insert','blocks','{"block_hash":"d8cf5bec1bbcab8ca4f495352afde3b6572b7e1d61b3976872ebb8e9d30ccb08","block_index":310023,"block_time":310023000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(181,310023,'insert','transactions','{"block_hash":"d8cf5bec1bbcab8ca4f495352afde3b6572b7e1d61b3976872ebb8e9d30ccb08","block_index":310023,"block_time":310023000,"btc_amount":1000,"data":"0000000000000000000047680000000000002710","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"53290702a54a5c19d9a5e2fc1942c2381a4d2283f30d645579b982ae0dbb7fcc","tx_index":24}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(182,310023,'update','bets','{"status":"expired","tx_hash":"1075391072b01264a783bf31205a83abdf7356c8c405753d3ef8599f852df887"}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(183,310023,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310023,"calling_function":"recredit wager remaining","event":"1075391072b01264a783bf31205a83abdf7356c8c405753d3ef8599f852df887","quantity":8500000,"tx_index":0}',0,'CREDIT');
-INSERT INTO messages VALUES(184,310023,'insert','bet_expirations','{"bet_hash":"1075391072b01264a783bf31205a83abdf7356c8c405753d3ef8599f852df887","bet_index":13,"block_index":310023,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3"}',0,'BET_EXPIRATION');
-INSERT INTO messages VALUES(185,310023,'insert','debits','{"action":"send","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBC","block_index":310023,"event":"53290702a54a5c19d9a5e2fc1942c2381a4d2283f30d645579b982ae0dbb7fcc","quantity":10000,"tx_index":24}',0,'DEBIT');
-INSERT INTO messages VALUES(186,310023,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"BBBC","block_index":310023,"calling_function":"send","event":"53290702a54a5c19d9a5e2fc1942c2381a4d2283f30d645579b982ae0dbb7fcc","quantity":10000,"tx_index":24}',0,'CREDIT');
-INSERT INTO messages VALUES(187,310023,'insert','sends','{"asset":"BBBC","block_index":310023,"destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","quantity":10000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"53290702a54a5c19d9a5e2fc1942c2381a4d2283f30d645579b982ae0dbb7fcc","tx_index":24}',0,'SEND');
-INSERT INTO messages VALUES(188,310023,'parse','transactions','{"supported":true,"tx_hash":"53290702a54a5c19d9a5e2fc1942c2381a4d2283f30d645579b982ae0dbb7fcc","tx_index":24}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(189,310023,'parse','blocks','{"block_index":310023,"ledger_hash":"de5a22c228bfc58ceaf428d55f180e951ff877537ef463821ce1206f07ab02f3","messages_hash":"f8aeac00fb3c7b32c574f4025dd01789ea804d7dd61ab5e84fc8f0536d6fc923","txlist_hash":"eda7d728863433b4e738e2b317d661a68d7f8921ed3fcf56120e0e0df464f161"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(190,310023,'insert','blocks','{"block_hash":"b03042b4e18a222b4c8d1e9e1970d93e6e2a2d41686d227ff8ecf0a839223dc5","block_index":310024,"block_time":310024000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(191,310024,'parse','blocks','{"block_index":310024,"ledger_hash":"e54da9db6c4911087dcfb2824acfd7429431e3297f6b5836dfa8f95165ac9b08","messages_hash":"0cdb6d20ad2c93a414e4a882e78a01188ab03c3b4d20ab23980282d0be6d4ab0","txlist_hash":"6d7b69dafc9e895a4a4b75c2e7ee2dcda352e21b82249074bfd0865e04dfe6f6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(192,310024,'insert','blocks','{"block_hash":"a872e560766832cc3b4f7f222228cb6db882ce3c54f6459f62c71d5cd6e90666","block_index":310025,"block_time":310025000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(193,310025,'parse','blocks','{"block_index":310025,"ledger_hash":"dac63e0e407785c7a461d839ddd749f020f8a33026cd6ea2acd659567a36c40c","messages_hash":"3338a508c7799481dd961696b5634afa3f7caafd82114c09f35903a0761be969","txlist_hash":"fb8e2f9f37cc8ceb72b92925cdb86f62af821bbae196e5de5083d784436e26ef"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(194,310025,'insert','blocks','{"block_hash":"6c96350f6f2f05810f19a689de235eff975338587194a36a70dfd0fcd490941a","block_index":310026,"block_time":310026000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(195,310026,'parse','blocks','{"block_index":310026,"ledger_hash":"0397b7da62fb672aadb96fbdfc37f3265ea04c4d401632d5d9018b9b0ad7cd45","messages_hash":"49b57bea36ede566bc2f0b73007114f2979075d952326fa548ea7589598a8648","txlist_hash":"35f40cec8ce2dab43b642668fb3baed3654b63a328ef005e41c8772cbf02029a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(196,310026,'insert','blocks','{"block_hash":"d7acfac66df393c4482a14c189742c0571b89442eb7f817b34415a560445699e","block_index":310027,"block_time":310027000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(197,310027,'parse','blocks','{"block_index":310027,"ledger_hash":"dbe43e77c383acc66cb46105991ed066ed5309434016081c26ca1a7dd948b6ce","messages_hash":"c9e442648e4c4070ad2b42eb492b272dedb0fbb261625d7a1400a36c1ab469d0","txlist_hash":"df94b526dfa87413c5d4c11024019c28dd94051780c00b433b28093788b15ce0"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(198,310027,'insert','blocks','{"block_hash":"02409fcf8fa06dafcb7f11e38593181d9c42cc9d5e2ddc304d098f990bd9530b","block_index":310028,"block_time":310028000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(199,310028,'parse','blocks','{"block_index":310028,"ledger_hash":"ce1021a584895988014f16dd9f7b7b29bbe59ca8a761914f60c9290b5ec6a16f","messages_hash":"d7e783156e45f96a55b90a5d0b0986bf47ef91b509c294a3c8369df38b32828e","txlist_hash":"7d8c18a5d7ec2d6d87ef468e4ed6784e9d41b248bd3d6754bef8f6bd1df9b9f2"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(200,310028,'insert','blocks','{"block_hash":"3c739fa8b40c118d5547ea356ee8d10ee2898871907643ec02e5db9d00f03cc6","block_index":310029,"block_time":310029000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(201,310029,'parse','blocks','{"block_index":310029,"ledger_hash":"4a066ff12cf6f8dad894e23cfbb4fe6a087893b717b3f0c1ec53764b1e922bf4","messages_hash":"ac70e12d6f22150346bb4773fc6439f402a2d5ceb618856bd234d28b475d0917","txlist_hash":"0dab776748029f3a094e8c2ad8871c1771263f81cfc6de79ded15ff475239371"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(202,310029,'insert','blocks','{"block_hash":"d5071cddedf89765ee0fd58f209c1c7d669ba8ea66200a57587da8b189b9e4f5","block_index":310030,"block_time":310030000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(203,310030,'parse','blocks','{"block_index":310030,"ledger_hash":"be1cc89117e7cb3fc18eb610103d72f144c31848da4d8001c334aac577f19427","messages_hash":"047e32ff2ff5dfd5356f783809f796f8816c8d5e620d72194126a3277b814783","txlist_hash":"934400af42a6099d1279e8fc2700bfc118bc313da8383d06892521a17663ef73"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(204,310030,'insert','blocks','{"block_hash":"0b02b10f41380fff27c543ea8891ecb845bf7a003ac5c87e15932aff3bfcf689","block_index":310031,"block_time":310031000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(205,310031,'parse','blocks','{"block_index":310031,"ledger_hash":"a616b3d81a1ad1db1a9b1491b06ff6bcead9037f75552d14a4c7234b6ff56670","messages_hash":"f84fea3613d29a2ae4189da93688bf73179b5ca9ca98eed91009e003f919a931","txlist_hash":"b45534f04aeeee6c2ed877085eac7ebea9f7eacceb2026e5ab8a34ff715bc3be"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(206,310031,'insert','blocks','{"block_hash":"66346be81e6ba04544f2ae643b76c2b7b1383f038fc2636e02e49dc7ec144074","block_index":310032,"block_time":310032000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(207,310032,'update','orders','{"status":"expired","tx_hash":"cd79f155a7a8b7737cf959cdc347db22f2f38288261842997e13844a09f6f2ee"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(208,310032,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBB","block_index":310032,"calling_function":"cancel order","event":"cd79f155a7a8b7737cf959cdc347db22f2f38288261842997e13844a09f6f2ee","quantity":50000000,"tx_index":0}',0,'CREDIT');
-INSERT INTO messages VALUES(209,310032,'insert','order_expirations','{"block_index":310032,"order_hash":"cd79f155a7a8b7737cf959cdc347db22f2f38288261842997e13844a09f6f2ee","source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3"}',0,'ORDER_EXPIRATION');
-INSERT INTO messages VALUES(210,310032,'parse','blocks','{"block_index":310032,"ledger_hash":"e7e76fe32ac5c06696c0bda815f29f1e0785a9d48641615f2ef78fa9982d258f","messages_hash":"2087d0657082953a749135ecbf8ebfc3659f774ce32c3549d0064fd0474bd7a2","txlist_hash":"b8261f9bd73b90fef96702a2e83111c3b9305e55efefae86a4078d99ce8c3d0d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(211,310032,'insert','blocks','{"block_hash":"999c65df9661f73e8c01f1da1afda09ac16788b72834f0ff5ea3d1464afb4707","block_index":310033,"block_time":310033000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(212,310033,'parse','blocks','{"block_index":310033,"ledger_hash":"f0d33d2f73f83449c18b9a7bea43857b36effa24eb248283d9356c5280e4992f","messages_hash":"fdbb2f907b3d0a7f263f6fa913d39624181ac3bb69d4abfa9f9907eacbff4109","txlist_hash":"bd3133719a6698bda726f9304fa48db5847cc475db79b879d2566da3cc7299d0"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(213,310033,'insert','blocks','{"block_hash":"f552edd2e0a648230f3668e72ddf0ddfb1e8ac0f4c190f91b89c1a8c2e357208","block_index":310034,"block_time":310034000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(214,310034,'parse','blocks','{"block_index":310034,"ledger_hash":"434d631a1c3ef7d31d136b4eab8b3044dc2b65886bf43642537cc592db0415a3","messages_hash":"c9d7c4ebbd0bf9570081d316d219a200759d9e0c820dbd96ffd08ee0ae2550cc","txlist_hash":"eea570d87d2e343bcb9b93764aa9bed952588f4b053d13e87da410b8dee27d7c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(215,310034,'insert','blocks','{"block_hash":"a13cbb016f3044207a46967a4ba1c87dab411f78c55c1179f2336653c2726ae2","block_index":310035,"block_time":310035000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(216,310035,'parse','blocks','{"block_index":310035,"ledger_hash":"5ca42816d9c6aaed19f6d25cd02e842b5d834254f90a169630544c83a129c7e5","messages_hash":"e69e7e5d53ad6f4e017b29ae535c181f961c676bf9f868c2712b00a1b23d3485","txlist_hash":"c827847c2f94718cd8c3efdf2b30cf9c8753893a76590efae0e30c61ef9a2d4a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(217,310035,'insert','blocks','{"block_hash":"158648a98f1e1bd1875584ce8449eb15a4e91a99a923bbb24c4210135cef0c76","block_index":310036,"block_time":310036000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(218,310036,'parse','blocks','{"block_index":310036,"ledger_hash":"31aecb842ea816f98aead90fed7ad005c010919a2ef2c5d7a8965b71832d3201","messages_hash":"7714fff105a6606c2e60c25256d11266c90d628e9aa6947d2fb2ed9f873835ab","txlist_hash":"5a69c5cc5e4aa7e7d071da7ecf8cff88740a707f70ddec29c57ee52b3da09127"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(219,310036,'insert','blocks','{"block_hash":"563acfd6d991ce256d5655de2e9429975c8dceeb221e76d5ec6e9e24a2c27c07","block_index":310037,"block_time":310037000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(220,310037,'parse','blocks','{"block_index":310037,"ledger_hash":"7a3167eb2c8a80c7c363ac47200ebc8cb6bd53f57da64465bec14bd86cf2c6c7","messages_hash":"6baaa9f3a19f84c31e3ae3be04bfae441a1073cee975d3e6a2dea97b94904808","txlist_hash":"8bc588a7a9286c3f5c13bc31c0faf29f155391f14ad89defebe3d0a0b21d049e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(221,310037,'insert','blocks','{"block_hash":"b44b4cad12431c32df27940e18d51f63897c7472b70950d18454edfd640490b2","block_index":310038,"block_time":310038000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(222,310038,'parse','blocks','{"block_index":310038,"ledger_hash":"212bc51956081e57aa618360926e186824dce8987948ee7706403451ab417a0a","messages_hash":"2fed45c6e0eb8befd33dfaae01c3121fbaa17a33fc8db9e7ab32f2a2c8ae970a","txlist_hash":"77861a778f50d5f8314cf4caeb6a78539702ee5b36b882713079b88143d4c6ca"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(223,310038,'insert','blocks','{"block_hash":"5fa1ae9c5e8a599247458987b006ad3a57f686df1f7cc240bf119e911b56c347","block_index":310039,"block_time":310039000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(224,310039,'parse','blocks','{"block_index":310039,"ledger_hash":"03e72d7551164403b41956638a0fdec8703c29373ea2b15c770717b0ec39fa95","messages_hash":"f85797a2335bfe5bb7fe18328e1e199a2c576284b6cbc402b1089c18e7c19319","txlist_hash":"b445575b555d0621a37fc3f9f22c113126ea35507703f8885294cb2a4613a6c7"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(225,310039,'insert','blocks','{"block_hash":"7200ded406675453eadddfbb2d14c2a4526c7dc2b5de14bd48b29243df5e1aa3","block_index":310040,"block_time":310040000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(226,310040,'parse','blocks','{"block_index":310040,"ledger_hash":"922aa744aa0c08274d1f47a0f80638c7937ecaaf95555e68ceec09449e60d080","messages_hash":"976d3bb7ff94f02bde2563b09209c79d775221e6c6b2031b1c202771b499b773","txlist_hash":"d46179d869f330c786bb81e0c122952d33b264f3af2b4a70627764332cce3fb7"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(227,310040,'insert','blocks','{"block_hash":"5db592ff9ba5fac1e030cf22d6c13b70d330ba397f415340086ee7357143b359","block_index":310041,"block_time":310041000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(228,310041,'parse','blocks','{"block_index":310041,"ledger_hash":"de422fc7f3f11d20b697e0ee57afe101ddeb5e84105153a3bb10f97f9c3f1783","messages_hash":"46b89e475c74e426ff35955880806d687cca7f89f6237980a9b2fb481790947f","txlist_hash":"d0cef146e488d50917e659d8c039e7304a41d239d2330947d81e49d3bc7aa723"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(229,310041,'insert','blocks','{"block_hash":"826fd4701ef2824e9559b069517cd3cb990aff6a4690830f78fc845ab77fa3e4","block_index":310042,"block_time":310042000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(230,310042,'parse','blocks','{"block_index":310042,"ledger_hash":"82d7c9a0c9d63c3f93b125a9eabc2a7b5f560eccc5fb578d71ec071f150c8fac","messages_hash":"6beccf09f1d28e3b1e210b39e233b2550bc5084e26240329d1a51907745a9ddc","txlist_hash":"68777d56b0179c05517b00df97200e16079b34c54a270d598c28caa4f39ea43b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(231,310042,'insert','blocks','{"block_hash":"2254a12ada208f1dd57bc17547ecaf3c44720323c47bc7d4b1262477cb7f3c51","block_index":310043,"block_time":310043000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(232,310043,'parse','blocks','{"block_index":310043,"ledger_hash":"c9232d9cfb183cc9bc09bef78f7c83bac3d9af803e6916c9b14063c4f619d9e6","messages_hash":"bdaa43efd672607af77b4b40f439f6aeaed1085617186e1acd6801bb61f3c0f9","txlist_hash":"728975e1d9ed1caeeef47b1b8f1040c3d1ede182cc47282f32f2f464071057b2"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(233,310043,'insert','blocks','{"block_hash":"3346d24118d8af0b3c6bcc42f8b85792e7a2e7036ebf6e4c25f4f6723c78e46b","block_index":310044,"block_time":310044000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(234,310044,'parse','blocks','{"block_index":310044,"ledger_hash":"71c3e7aa2ad71e35b752dd4e48381b4ca845c370e5c340f2a221dde808966a45","messages_hash":"66199cebdbc88c927c1f33af517c8f679cd75a9c1d3179e75230b43ca181e447","txlist_hash":"56e52a1e4cd4954442f83c421e7b8c653e38cd7725d6b140a47e74f57df2c169"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(235,310044,'insert','blocks','{"block_hash":"7bba0ab243839e91ad1a45a762bf074011f8a9883074d68203c6d1b46fffde98","block_index":310045,"block_time":310045000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(236,310045,'parse','blocks','{"block_index":310045,"ledger_hash":"47230be2ba96e7adb6088b18788b52a65aa48183c2c00095b79999f5ea1af514","messages_hash":"e2e6623c734a0f965d3897a10844b64d4edf09be17ea873645a6f11f736e9123","txlist_hash":"e8b8a81eeb5c9a9fa6f19f6d9617c7c8e1d19368725d223ef270b74b09b1a541"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(237,310045,'insert','blocks','{"block_hash":"47db6788c38f2d6d712764979e41346b55e78cbb4969e0ef5c4336faf18993a6","block_index":310046,"block_time":310046000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(238,310046,'parse','blocks','{"block_index":310046,"ledger_hash":"2c306c41049fba2e58a07b5d14f930bcaa465b2afa4df24d8a887958555f0c57","messages_hash":"a4f142388df842e3f7638bba46fa8451424281206af0a37977a5489d032cb40b","txlist_hash":"3ed01193d67e5b016184cd322ca01829a616ad7f7c98bdc034c642ab5c37938d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(239,310046,'insert','blocks','{"block_hash":"a9ccabcc2a098a7d25e4ab8bda7c4e66807eefa42e29890dcd88149a10de7075","block_index":310047,"block_time":310047000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(240,310047,'parse','blocks','{"block_index":310047,"ledger_hash":"95a6325dcb8b9f7aef9da35bd20a46addef23aa5c36795beccacf992bee88d28","messages_hash":"0f056aff130424174dc02d66a0359b0ac135228727e1235bcfdc8c8de90ec17c","txlist_hash":"730fe6316784de4a36e2530b3935fbbd2e1bb9c876c61d0cc436f86a103d6655"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(241,310047,'insert','blocks','{"block_hash":"610bf3935a85b05a98556c55493c6de45bed4d7b3b6c8553a984718765796309","block_index":310048,"block_time":310048000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(242,310048,'parse','blocks','{"block_index":310048,"ledger_hash":"8811d6a6b22ff3e0ecf399dd20a28a17ad000e99b17f90e63e02230ed42cf260","messages_hash":"ebe06e76bbe19b578653b19bc7dbeb78c4b133028ed77cd51e7f5f366a53bf94","txlist_hash":"a1772d6d909c4fd092a9e511c2f0425480f61c1f2a3d513d973a15e587c47a51"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(243,310048,'insert','blocks','{"block_hash":"4ad2761923ad49ad2b283b640f1832522a2a5d6964486b21591b71df6b33be3c","block_index":310049,"block_time":310049000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(244,310049,'parse','blocks','{"block_index":310049,"ledger_hash":"4bffe3d3071cee255f64108bd8b97652f06190cb73caac5bdc4ef61d3ff9ecd6","messages_hash":"cdddfdb873c4834f4250cda22831636cab7c724f678da6216fd559b80a0e7ff7","txlist_hash":"af66fd2b113c2349077f00be46a1cd5629b2ec39576ae16ec004249438781905"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(245,310049,'insert','blocks','{"block_hash":"8cfeb60a14a4cec6e9be13d699694d49007d82a31065a17890383e262071e348","block_index":310050,"block_time":310050000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(246,310050,'parse','blocks','{"block_index":310050,"ledger_hash":"b00d5001e914fde448457f3b373637385114eeb07d79751241f4c1f50cadc050","messages_hash":"82992ff8a610ee881b81bd88a5d4a86e5010062bb0faf06cae1eefe2c6769249","txlist_hash":"64149e5936bce967da53b587f07492b64472145ac66f58c1773a4df324ced96d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(247,310050,'insert','blocks','{"block_hash":"b53c90385dd808306601350920c6af4beb717518493fd23b5c730eea078f33e6","block_index":310051,"block_time":310051000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(248,310051,'parse','blocks','{"block_index":310051,"ledger_hash":"90dd8fabe43314ac6ab6f5485275a4b1131c232a1e9d92395fc030659873edb8","messages_hash":"8dd7a3b1ee68d435cf5931e578e166e91e9961350db22909b6af5fefd5c4442f","txlist_hash":"71f3161707a90feeb8b8e3340f47a9102c344b652ff70760aaa1f7b3bb30a14f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(249,310051,'insert','blocks','{"block_hash":"0acdacf4e4b6fca756479cb055191b367b1fa433aa558956f5f08fa5b7b394e2","block_index":310052,"block_time":310052000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(250,310052,'parse','blocks','{"block_index":310052,"ledger_hash":"923848bdc7906ab89898021e05e201f69305087b12803c459f066f2d681fe9b5","messages_hash":"3698853c8fd4827d29eea3f3c530f1529fa5f17dd33dffaa19be81d9f30511a6","txlist_hash":"de443d5cc1b054f4cff96f616b234d91b0b5e3712e6d72e64d564c201b7cd757"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(251,310052,'insert','blocks','{"block_hash":"68348f01b6dc49b2cb30fe92ac43e527aa90d859093d3bf7cd695c64d2ef744f","block_index":310053,"block_time":310053000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(252,310053,'parse','blocks','{"block_index":310053,"ledger_hash":"e5ecdf8c0a2166fa8fe25adea0d374d34131d29a3c901868fec579eb20a5a930","messages_hash":"dd245b141ff920a732dda71cbc156cbcd1047a88e56724aa897e88f63a1f0af1","txlist_hash":"05b8fe3b76416a506aed1b000e3649af38e59adf26cf0d168c5e84112641ea6c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(253,310053,'insert','blocks','{"block_hash":"a8b5f253df293037e49b998675620d5477445c51d5ec66596e023282bb9cd305","block_index":310054,"block_time":310054000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(254,310054,'parse','blocks','{"block_index":310054,"ledger_hash":"03cd75c14bbe11800f4d436dce93235787e2521a19b1d5a90796a5de369680d1","messages_hash":"17cdd1a908040ea3a4f92093afe9b9bdab12daea6436a6c00994b04481ed082d","txlist_hash":"d8edec966eae31778588f68b7343dbdb4bf878b30cb430246b04ebebdd9e43b9"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(255,310054,'insert','blocks','{"block_hash":"4b069152e2dc82e96ed8a3c3547c162e8c3aceeb2a4ac07972f8321a535b9356","block_index":310055,"block_time":310055000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(256,310055,'parse','blocks','{"block_index":310055,"ledger_hash":"7239560704ca831dfe90791f1cd21ae1f1506275cf6b45933676be9b096d340b","messages_hash":"7741ea70459b2a66f6dd9e80dece0be8e2c70d9bf2f4a35a7e25209afc693168","txlist_hash":"1294057c4f21c98f97d10d96510ce83d0e8d348d138b3caa2c76ef1be47a3c2a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(257,310055,'insert','blocks','{"block_hash":"7603eaed418971b745256742f9d2ba70b2c2b2f69f61de6cc70e61ce0336f9d3","block_index":310056,"block_time":310056000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(258,310056,'parse','blocks','{"block_index":310056,"ledger_hash":"3aa4ef8714cbb71c4f0b052dc7ec7795322103ba7b8361db3f33303f564f3815","messages_hash":"67c95d8fcaf9ce3998af05392f9a5068937a7f7e2db782fd8398f91d9a8401b9","txlist_hash":"211d0e47a87100167138974db02ac1299bf1b2a1d7b60606b19cecf2f06df0fd"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(259,310056,'insert','blocks','{"block_hash":"4a5fdc84f2d66ecb6ee3e3646aad20751ce8694e64e348d3c8aab09d33a3e411","block_index":310057,"block_time":310057000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(260,310057,'parse','blocks','{"block_index":310057,"ledger_hash":"fee33c0a466c580887106b4bb7a8c6aeb7a049c94987bae64f695ae400c4a4a1","messages_hash":"b669486dbace095d0a4d0c2c526e18b2f10e79c415589a782f79734e9b11fef0","txlist_hash":"f851a0d0a25322d5939a5cd2cafc831b6282af5ab81932553cb80ff3825b4a2d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(261,310057,'insert','blocks','{"block_hash":"a6eef3089896f0cae0bfe9423392e45c48f4efe4310b14d8cfbdb1fea613635f","block_index":310058,"block_time":310058000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(262,310058,'parse','blocks','{"block_index":310058,"ledger_hash":"94d58bd9a65a2e13c7ea2373e521952e916b0e1d31d803eced96e5c8903aa625","messages_hash":"e7600207187bfd393eb1cbab52e554db20953b3c0e7677735776cd0c8e6fa1b5","txlist_hash":"e959bddf887904cd324ff7bf5fb60380f2c4a7c2b1b4215c63715a59ad297200"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(263,310058,'insert','blocks','{"block_hash":"ab505de874c43f97c90be1c26a769e6c5cb140405c993b4a6cc7afc795f156a9","block_index":310059,"block_time":310059000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(264,310059,'parse','blocks','{"block_index":310059,"ledger_hash":"e9c87b2a652d4ef3d48ac74424f57d06dd85893fd542e0784df067c37396b0df","messages_hash":"1d1f6ff471aa4e5771d0d8f5527a283f946485ffab1ca06addec37f8c3df6039","txlist_hash":"ec205004b519cbbc750bcae821effee41789b3f643f90148e8db2d9d9f83ed49"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(265,310059,'insert','blocks','{"block_hash":"974ad5fbef621e0a38eab811608dc9afaf10c8ecc85fed913075ba1a145e889b","block_index":310060,"block_time":310060000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(266,310060,'parse','blocks','{"block_index":310060,"ledger_hash":"b664a0985edab20768aec36096a7b2faa159cef4af7e779ad421942137ee317a","messages_hash":"1da3366346658554be885ca7896d80736ed13f520e7848030de9ebc9acfdc199","txlist_hash":"dec86d178abd72944cda84a3154303e16eaf39e5bd5bd59a80cca27a5ed5887e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(267,310060,'insert','blocks','{"block_hash":"35d267d21ad386e7b7632292af1c422b0310dde7ca49a82f9577525a29c138cf","block_index":310061,"block_time":310061000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(268,310061,'parse','blocks','{"block_index":310061,"ledger_hash":"5ffa5e1f36c5539b2f5a89a6a60d45ec6372ced770d9b0e0e8dfd61edad84c22","messages_hash":"b31533d94983095966b5f0ac4d0ba3996f7bf8263ccddd8e42aef7356bec55ae","txlist_hash":"be052ccd372d556b9b28d0d2b6f9dbfc9b32ff173b71d7842fb6008047a67384"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(269,310061,'insert','blocks','{"block_hash":"b31a0054145319ef9de8c1cb19df5bcf4dc8a1ece20053aa494e5d3a00a2852f","block_index":310062,"block_time":310062000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(270,310062,'parse','blocks','{"block_index":310062,"ledger_hash":"fc6f9f23c3b8954c7989b0e4ce40087b66dceabc7c0e407ac7f4b397fe2a1281","messages_hash":"657e25d6ed0c9c9eb39155ba6f1e9d205a57ab7015d18a13905df2b3657ce3c3","txlist_hash":"1495ca8eeb434877ce36335268a349709e99811e93f416ccf1f0c98114731824"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(271,310062,'insert','blocks','{"block_hash":"0cbcbcd5b7f2dc288e3a34eab3d4212463a5a56e886804fb4f9f1cf929eadebe","block_index":310063,"block_time":310063000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(272,310063,'parse','blocks','{"block_index":310063,"ledger_hash":"cc6c3b8cf2c457b2f6afb5b208f968544767be8b86ca53bdab4224619a03121d","messages_hash":"3f132fc4d63edafb5eb644dd47aaa2af32fedf3a15c206deedcc1d3dc47549b2","txlist_hash":"93d193df39b7340b932b5abd85a027df086e033ff2b18fd8c9d0d03cd6db392f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(273,310063,'insert','blocks','{"block_hash":"e2db8065a195e85cde9ddb868a17d39893a60fb2b1255aa5f0c88729de7cbf30","block_index":310064,"block_time":310064000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(274,310064,'parse','blocks','{"block_index":310064,"ledger_hash":"cc57ac6aec118ebfb03f5113ad1af749522e60ef4ca201d48bd43478cc0a29e4","messages_hash":"22e4ad71319ebf70101939828e606ddd7381dadd77c8fe5ab718ddba78feded7","txlist_hash":"064c03f24da9de841de9f492487de4077b842d6de92366d3fe7ff37d558998c1"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(275,310064,'insert','blocks','{"block_hash":"8a7bc7a77c831ac4fd11b8a9d22d1b6a0661b07cef05c2e600c7fb683b861d2a","block_index":310065,"block_time":310065000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(276,310065,'parse','blocks','{"block_index":310065,"ledger_hash":"9999be70079c0943f0a00c54236680bafe0c87dd3bb75c982211f751e7ecdcae","messages_hash":"cbd70e755299ba20e886f6aad7674e4a0784b8507c9a15a64fb1403164d6cc51","txlist_hash":"f1196c84f3767cea82b4dfb6a5e4be30f3ed3f53e9b9cefdadf81af9f2b2bd49"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(277,310065,'insert','blocks','{"block_hash":"b6959be51eb084747d301f7ccaf9e75f2292c9404633b1532e3692659939430d","block_index":310066,"block_time":310066000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(278,310066,'parse','blocks','{"block_index":310066,"ledger_hash":"efb2fcb7b5628bb99994bc1ada157bf80b4516d961497aa011c06da1523801d7","messages_hash":"7ed9c6fe414c01dddd55faa66d5934f375f8eef87637bfc2c626ba44eb67968f","txlist_hash":"ba6d273c442538389e43b3ad47795d7e61d9b17427d1a1044333f96cafe575c4"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(279,310066,'insert','blocks','{"block_hash":"8b08eae98d7193c9c01863fac6effb9162bda010daeacf9e0347112f233b8577","block_index":310067,"block_time":310067000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(280,310067,'parse','blocks','{"block_index":310067,"ledger_hash":"fb396fca9af7816f97b22b8bf1b01951e271a75f1a640dfc64955696dc1c0b7d","messages_hash":"5537534fb9d0145545b419b9d01d124fb4021e9a7144eee21c74e633fc995daa","txlist_hash":"20ebf686e5c5a50c0df23ee15488559024622039aa4fa47f1b07dc3967bbc760"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(281,310067,'insert','blocks','{"block_hash":"9280e7297ef6313341bc81787a36acfc9af58f83a415afff5e3154f126cf52b5","block_index":310068,"block_time":310068000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(282,310068,'parse','blocks','{"block_index":310068,"ledger_hash":"6cbc681ed90e676cc507d07120888bd4c8759873a0b9215f721a0ce707070086","messages_hash":"f758fe286e0973f30be7c0d6afaa7c7cc2ffa3f5dbb73dc91ee326cc2d3b0070","txlist_hash":"d8c09411f0c7fd43774558fd6cc9884b032cfdcca63a08845b61293ff52ef380"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(283,310068,'insert','blocks','{"block_hash":"486351f0655bf594ffaab1980cff17353b640b63e9c27239109addece189a6f7","block_index":310069,"block_time":310069000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(284,310069,'parse','blocks','{"block_index":310069,"ledger_hash":"7cb734eb3e24e92de8915a6bea42b6ef721251c481ac9ec751cdbdc08e110011","messages_hash":"65a2965d49d850b583ec0574c58c5d1a7bbc3e5c789f143b4505aed318ba88af","txlist_hash":"4f02ef18a644ac564db930818e845496ab0ea3caa34ff70878f0f9f0ef6641e9"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(285,310069,'insert','blocks','{"block_hash":"8739e99f4dee8bebf1332f37f49a125348b40b93b74fe35579dd52bfba4fa7e5","block_index":310070,"block_time":310070000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(286,310070,'parse','blocks','{"block_index":310070,"ledger_hash":"7b57a4d1ce0995a938e174e52a096cc9829a0ddd59f698ed04d8b43371a78126","messages_hash":"d65f12404b216e72ad6ae61b04e69c9f4ca01e2f3fdb4f504e0225ac54736ea5","txlist_hash":"7716368643d8c6d26932d9efabb6fd6e574c1b13b8f149363ec4b99d9f405435"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(287,310070,'insert','blocks','{"block_hash":"7a099aa1bba0ead577f1e44f35263a1f115ed6a868c98d4dd71609072ae7f80b","block_index":310071,"block_time":310071000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(288,310071,'parse','blocks','{"block_index":310071,"ledger_hash":"f46f820a64ced97ccf68a56c048459de0b2855ecd4299e447c4b630913ce1749","messages_hash":"5ab53570219fc9bb359c607e25599669bb1595309f563491e3f66bfa31d1f984","txlist_hash":"71375966f9a524c1df04c5033ebb17e4293053f3ecb8e724a2f093b3373641b6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(289,310071,'insert','blocks','{"block_hash":"7b17ecedc07552551b8129e068ae67cb176ca766ea3f6df74b597a94e3a7fc8a","block_index":310072,"block_time":310072000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(290,310072,'parse','blocks','{"block_index":310072,"ledger_hash":"878239189ae0afa759af5e59db8a17fd17c0c9a2c017384fd2d0ca789e738050","messages_hash":"0552a8f121d1ab0e74a11098bee498faa3e6ca29ed768c5477060ab17ef7909c","txlist_hash":"4ead629f99d32f3d0ef6c5f7ad1bbffa91608d71b815293128461a9b5850ad15"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(291,310072,'insert','blocks','{"block_hash":"ee0fe3cc9b3a48a2746b6090b63b442b97ea6055d48edcf4b2288396764c6943","block_index":310073,"block_time":310073000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(292,310073,'parse','blocks','{"block_index":310073,"ledger_hash":"d2d86823f727bc075138653a682373a9c76d21d48b5881968adb66042b501e53","messages_hash":"1bfdd70a8a1e5b2bd0e98a38a1d8583b65de45bcfb19b22e88c1c240d45d5116","txlist_hash":"3958da4cebd7670ab3e197b6ff8b5a770dc756dccc1806bdd050513e75e9e33c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(293,310073,'insert','blocks','{"block_hash":"ceab38dfde01f711a187601731ad575d67cfe0b7dbc61dcd4f15baaef72089fb","block_index":310074,"block_time":310074000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(294,310074,'parse','blocks','{"block_index":310074,"ledger_hash":"9fd098fcc7d71c0c46fc741ea278de92589c44a6efc4980ced53843193553ea8","messages_hash":"a453a4c531be98d82b30875224f99b77ed74bb8b5433a46773ed9086c78ad820","txlist_hash":"f5b2e274c8dda92ac634490b28d13b18d7aeb22fd1a5101c805d3f4265422a7c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(295,310074,'insert','blocks','{"block_hash":"ef547198c6e36d829f117cfd7077ccde45158e3c545152225fa24dba7a26847b","block_index":310075,"block_time":310075000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(296,310075,'parse','blocks','{"block_index":310075,"ledger_hash":"f1ad21f9b4134bc0225c26fb8969af3565c07997197a7ed9636c01f187f07042","messages_hash":"ee8a0a5a6e43392e0e1a898383cc016e65ea48728faecfd48ac2216769d3ab4d","txlist_hash":"3711ef31e2cc58fe1a9cbcf0a5bfdac9a805f346137b923fd86c65f850b35eae"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(297,310075,'insert','blocks','{"block_hash":"3b0499c2e8e8f0252c7288d4ecf66efc426ca37aad3524424d14c8bc6f8b0d92","block_index":310076,"block_time":310076000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(298,310076,'parse','blocks','{"block_index":310076,"ledger_hash":"9a1f3de6b5a255720973fb0c93ae2bc8fe8936565140b8ae991b9d83f86a0002","messages_hash":"813aee3a02a6e3051aee0bcc3f1559a1ef525876773365702d8cfb623b76104a","txlist_hash":"8e73f7f52266820ca7f25665628e31afc6a5e3dcbbf51bc1bc8635440ecdf669"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(299,310076,'insert','blocks','{"block_hash":"d2adeefa9024ab3ff2822bc36acf19b6c647cea118cf15b86c6bc00c3322e7dd","block_index":310077,"block_time":310077000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(300,310077,'parse','blocks','{"block_index":310077,"ledger_hash":"ab56d9f59575b2d8ecc4933bbfa1fb0cb81c7a6fe84c1ba81bdee40c3da13164","messages_hash":"857718a08a7c24695301eea96ac485c69d7d8528ebd7144526877144727a1930","txlist_hash":"2720a0a338a84ae1b56086f0d4f1b341eb5e3b46e9290887d7675800c6872081"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(301,310077,'insert','blocks','{"block_hash":"f6c17115ef0efe489c562bcda4615892b4d4b39db0c9791fe193d4922bd82cd6","block_index":310078,"block_time":310078000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(302,310078,'parse','blocks','{"block_index":310078,"ledger_hash":"8399d461b5079a145c716f8f6004d2f7870fe93786bd944fa36ef27134c9517c","messages_hash":"cde0bd558daabf0cbede387365e4a018d490754a10047d177cae43a0f4b45d12","txlist_hash":"18ee24262532a6a1e49086f1a8ea0161a5c1ae80ce2230f1b76ce782f6aff39a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(303,310078,'insert','blocks','{"block_hash":"f2fbd2074d804e631db44cb0fb2e1db3fdc367e439c21ffc40d73104c4d7069c","block_index":310079,"block_time":310079000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(304,310079,'parse','blocks','{"block_index":310079,"ledger_hash":"b6696a1511704128bbd5ec2c80a1d7d8d3bda6b959f1a674537ace152cb7f8bc","messages_hash":"e1727b554699bff7dbb8b8e04c1703b9dd8baec7d0adbbe19ed29c13063feacf","txlist_hash":"e839a4222aad212860b0698214f3d426d065226d1e7983e6620325a583b28abb"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(305,310079,'insert','blocks','{"block_hash":"42943b914d9c367000a78b78a544cc4b84b1df838aadde33fe730964a89a3a6c","block_index":310080,"block_time":310080000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(306,310080,'parse','blocks','{"block_index":310080,"ledger_hash":"9aea0f996c36a815e4103b86ee7fc9be784d7c72549e54d04d84cf7fb8adfb78","messages_hash":"417fc14121a6d8f20288b10640991263f4237e0dad8bcd9bfaa3e13bbca4851c","txlist_hash":"fca6c96a2d6bbe118c5418a3e2b85dced8cfc0da2a8b46fef65f49e81a459efc"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(307,310080,'insert','blocks','{"block_hash":"6554f9d307976249e7b7e260e08046b3b55d318f8b6af627fed5be3063f123c4","block_index":310081,"block_time":310081000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(308,310081,'parse','blocks','{"block_index":310081,"ledger_hash":"7571b554c5600796b60982bb6df3517eed517a2a3627f8383b92a073cc4a5872","messages_hash":"8b39440aeec8b1f4a945ab49608e3f9c8d439ccdb5a42d9e60d5ac4e719f8297","txlist_hash":"a168e4a6c3de65e68532d534107bc3033588b2b0d67ae2f5d23b1ffac1a21ca8"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(309,310081,'insert','blocks','{"block_hash":"4f1ef91b1dcd575f8ac2e66a67715500cbca154bd6f3b8148bb7015a6aa6c644","block_index":310082,"block_time":310082000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(310,310082,'parse','blocks','{"block_index":310082,"ledger_hash":"b2507a73ff4f6998582daac667c457308ba78744e3d1d7533c0232092e3eab1f","messages_hash":"c40fd8a8ad93626d3df0814b83e6e53fc1ac7e1b56d56c64597931b14dd3ad75","txlist_hash":"379aebcf4d32a0480f5d334f5c04629b6ace33bdc5f138907c338eab7b1d9093"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(311,310082,'insert','blocks','{"block_hash":"9b1f6fd6ff9b0dc4e37603cfb0625f49067c775b99e12492afd85392d3c8d850","block_index":310083,"block_time":310083000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(312,310083,'parse','blocks','{"block_index":310083,"ledger_hash":"18566f22ffb9bc5f98712ef3234f8da84f8f3e382007b23c3bb8e6c910043746","messages_hash":"3cb151083aad730810ba5c58d41d621145473366f7b8c502a742583e5fdecdb8","txlist_hash":"b238ccb2ac0b6329a0fc30267fd29e4813bfc786ad871de90c1797c6c72e65bb"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(313,310083,'insert','blocks','{"block_hash":"1e0972523e80306441b9f4157f171716199f1428db2e818a7f7817ccdc8859e3","block_index":310084,"block_time":310084000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(314,310084,'parse','blocks','{"block_index":310084,"ledger_hash":"72c44bddd5b54657623692e444bf893ca7b6d8da992c274bcbaa37c6db903825","messages_hash":"943656932a28a98619d4de3abdd3e84004dc58ede68152286af3ce6209e12afa","txlist_hash":"2736ff0669b8c3cfb5b4ad8f082e23d985cbf0c4ba9990175febf1c02882bdf9"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(315,310084,'insert','blocks','{"block_hash":"c5b6e9581831e3bc5848cd7630c499bca26d9ece5156d36579bdb72d54817e34","block_index":310085,"block_time":310085000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(316,310085,'parse','blocks','{"block_index":310085,"ledger_hash":"1ddc441adb4b262862caf5b811b2375bd376d9b5d7b8ee251c4337478833cde9","messages_hash":"d970401c49e0b45d95031cbd740826688efbe7440f776fe4ae5fbd8f5a2d0eae","txlist_hash":"3407db619adaf80236c8319a7e9283c10a43a7b1717d4d89115ac90e8f52b706"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(317,310085,'insert','blocks','{"block_hash":"080c1dc55a4ecf4824cf9840602498cfc35b5f84099f50b71b45cb63834c7a78","block_index":310086,"block_time":310086000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(318,310086,'parse','blocks','{"block_index":310086,"ledger_hash":"b59447846d380cb8d32639ca13e6e396b68b18483f70b6380296bff65dced3d2","messages_hash":"e22966531dedb141d7f6e4a5aabfd82382ed9fcfe6caf8991a17fafb7afc5997","txlist_hash":"e02f456fb1e9b6de38bb9923f6f68973d592ffa04f65731c66dae734e4fd1d44"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(319,310086,'insert','blocks','{"block_hash":"4ec8cb1c38b22904e8087a034a6406b896eff4dd28e7620601c6bddf82e2738c","block_index":310087,"block_time":310087000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(320,310087,'parse','blocks','{"block_index":310087,"ledger_hash":"54a1c32d20665e7ff92ea43451ff2e59a98136ad7da576fa6b2614dda700b707","messages_hash":"8cb58a3a69cd2881516a1073e0e6f8c8a6ca7624c1ba03327f39865006054482","txlist_hash":"5177e82a6aa417664930ecdb0495e108b3fb660ff08a608fa540a29b0c4c2650"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(321,310087,'insert','blocks','{"block_hash":"e945c815c433cbddd0bf8e66c5c23b51072483492acda98f5c2c201020a8c5b3","block_index":310088,"block_time":310088000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(322,310088,'parse','blocks','{"block_index":310088,"ledger_hash":"f0bef715c366843e002c75992b8d50d82a3ea54f144350f158e862eb03cb45dd","messages_hash":"a61bd68a25b8460c5a8b915a33898526dcd728017a7f651b70b597cfb11bb1d8","txlist_hash":"84abe1e98b75d07291ef4b9847c336f787fdcc74f9a2570d23cb8ce396c9104a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(323,310088,'insert','blocks','{"block_hash":"0382437f895ef3e7e38bf025fd4f606fd44d4bbd6aea71dbdc4ed11a7cd46f33","block_index":310089,"block_time":310089000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(324,310089,'parse','blocks','{"block_index":310089,"ledger_hash":"0a4ce98b783b97f81fff9ab73d7a7091087e8511ebb425c81ccf60c3f9edbfd6","messages_hash":"e8454aef34c815ad01cd9016c6c3fb983bf301e63273a36fc802d26b929b7969","txlist_hash":"ca0f3a6b9b2eafb864eb324359d4ad9dd85361a7c7d2833ba6bfd230d0e60773"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(325,310089,'insert','blocks','{"block_hash":"b756db71dc037b5a4582de354a3347371267d31ebda453e152f0a13bb2fae969","block_index":310090,"block_time":310090000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(326,310090,'parse','blocks','{"block_index":310090,"ledger_hash":"f3b6781eebab3a6928791cf281d4ae7cb4f7fb59c6ae7575eba253e6ec6e447b","messages_hash":"5b1b966a74a430ee625b0e0d381a963a41ea1d427840a109b95929a4c7061f0d","txlist_hash":"283080af19ccbde44c6e268326ddde17fc850d7ca1add3698adb3e606cd984e4"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(327,310090,'insert','blocks','{"block_hash":"734a9aa485f36399d5efb74f3b9c47f8b5f6fd68c9967f134b14cfe7e2d7583c","block_index":310091,"block_time":310091000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(328,310091,'parse','blocks','{"block_index":310091,"ledger_hash":"14261b6b340632c469847700cee16c0163a7f8cad4dac7ad4555efeb5f3235fb","messages_hash":"d429ca517a7f8c46db00cbb4da11040e4735d0c0aced4f21f1493b44cd679e1f","txlist_hash":"744bcdbcd8d44066eb9528c6fa39109148ea557d3cc3bdb88a818b9f9a9dcb25"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(329,310091,'insert','blocks','{"block_hash":"56386beb65f9228740d4ad43a1c575645f6daf59e0dd9f22551c59215b5e8c3d","block_index":310092,"block_time":310092000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(330,310092,'parse','blocks','{"block_index":310092,"ledger_hash":"3c033a502e1890e8a3c697e354cd1769e4300ce7f62ee7ac47a7201e1ad5de2c","messages_hash":"099e7a26e5dca406cf008eae37302e3e0c7c1797c55362c98b4a3743edad2b40","txlist_hash":"c424d1724a85f76a855b4dc834c8b599f764b5095b0649448a0fa2aef1e41d31"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(331,310092,'insert','blocks','{"block_hash":"a74a2425f2f4be24bb5f715173e6756649e1cbf1b064aeb1ef60e0b94b418ddc","block_index":310093,"block_time":310093000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(332,310093,'parse','blocks','{"block_index":310093,"ledger_hash":"acc1dc4b7ec10c0989af833b57640be486035d76f74b57a50b023fb60f418be2","messages_hash":"e7704dd7f3358c09a87dff920ee932c695e7f0b530239518d50b20b10470141f","txlist_hash":"dde73fa3b80a8e2d1cb8aa692dd62ad712549fdceebf4083965cb36f692d45d9"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(333,310093,'insert','blocks','{"block_hash":"2a8f976f20c4e89ff01071915ac96ee35192d54df3a246bf61fd4a0cccfb5b23","block_index":310094,"block_time":310094000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(334,310094,'parse','blocks','{"block_index":310094,"ledger_hash":"1443d97efeeb04291e117b152f1e18537035a59c80fabb574577cb3e66e5db59","messages_hash":"acc5a7b3c965552eec18f13d55d796897254c9ae4f6b76b304c53560a5f4cc85","txlist_hash":"a52c247beb178317cdd18532927c8281abe3af9914c676cf250084d4b1e96762"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(335,310094,'insert','blocks','{"block_hash":"bed0fa40c9981223fb40b3be8124ca619edc9dd34d0c907369477ea92e5d2cd2","block_index":310095,"block_time":310095000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(336,310095,'parse','blocks','{"block_index":310095,"ledger_hash":"1c74208da191b965f52006e577c3f4df30f29b36b1d137ab457bbfe30737285d","messages_hash":"96f02682a3030b2befc1d70760002100282215a301eb5aee1cb07c9162843e0d","txlist_hash":"693d04e9be7d9de1aee3cfe832c6d913213bbf44b0f04a5b394e1aceb77b7b49"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(337,310095,'insert','blocks','{"block_hash":"306aeec3db435fabffdf88c2f26ee83caa4c2426375a33daa2be041dbd27ea2f","block_index":310096,"block_time":310096000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(338,310096,'parse','blocks','{"block_index":310096,"ledger_hash":"662e1b232c5afeba4df756a31d7b63f7f33dbb4aa752abbea9f0b57f1c7c4295","messages_hash":"457f56e032453d64457be80fad88d46e8d4325df25b621c6aea936b6b3636669","txlist_hash":"bce25b4036b54089a064c1fd781923787126977938ff3c206f0a8d76ddf52489"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(339,310096,'insert','blocks','{"block_hash":"13e8e16e67c7cdcc80d477491e554b43744f90e8e1a9728439a11fab42cefadf","block_index":310097,"block_time":310097000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(340,310097,'parse','blocks','{"block_index":310097,"ledger_hash":"8a1b60657764a35ce95c9e215600f63f0fc8c4933c682ea017553010743c97a2","messages_hash":"64e00821dde4646cad059921826a3014f892cafa2f978b8baee1ed96e4a00409","txlist_hash":"0d0259b0c4755aba3d725283f1773bdd766a0ae009f2b94be00a5589b61ef8f5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(341,310097,'insert','blocks','{"block_hash":"ca5bca4b5ec4fa6183e05176abe921cff884c4e20910fab55b603cef48dc3bca","block_index":310098,"block_time":310098000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(342,310098,'parse','blocks','{"block_index":310098,"ledger_hash":"c2e25d20f3c50a67a4268d9aa3e386c92e5217cf8f106d2affaae19e49b48828","messages_hash":"da90a92d7a7cc0e24781d15093a3fbb9df9720571e36eb5032240ecb805f01ba","txlist_hash":"32c25e6b70ffe5ea4582a7fd8bf8c892d4fe0afb247e3aca79686e5b5ce9e430"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(343,310098,'insert','blocks','{"block_hash":"3c4c2279cd7de0add5ec469648a845875495a7d54ebfb5b012dcc5a197b7992a","block_index":310099,"block_time":310099000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(344,310099,'parse','blocks','{"block_index":310099,"ledger_hash":"bd7479caeb388072138c99d19624e495200df1bf02f47caf0ae8a5007fd9dfce","messages_hash":"41e980e29574743be776872e4c380ce99c1c84f48f8eeb4ddcfb2cb24207d7e5","txlist_hash":"0fdf6d97b6a63f690d30aca13e27aa4cd6bc3ebbf525cfe6f6eee3ce529dfff4"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(345,310099,'insert','blocks','{"block_hash":"96925c05b3c7c80c716f5bef68d161c71d044252c766ca0e3f17f255764242cb","block_index":310100,"block_time":310100000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(346,310100,'parse','blocks','{"block_index":310100,"ledger_hash":"ddb8394df96a37e0127c8894e669072cb195ac953e2a3e922b95bf40804820b6","messages_hash":"0cbcc6eba05629dc63fb500419ab4e6f81b94820d68d7974328e09ff92a2f40b","txlist_hash":"8cd686429ec5799fb9a78d07d662c5f51431c6d79691a45c109d512d261aa5df"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(347,310100,'insert','blocks','{"block_hash":"369472409995ca1a2ebecbad6bf9dab38c378ab1e67e1bdf13d4ce1346731cd6","block_index":310101,"block_time":310101000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(348,310101,'parse','blocks','{"block_index":310101,"ledger_hash":"3ed7694459a57281ba8e4159ce156333aae4b596aa3ab5193ea6c1901f2c9667","messages_hash":"a2034f57c8adc0bddcddab4aa24ca8732ed7c72a551dd4c8369db54be08e025a","txlist_hash":"b6c153092c9e72a0fc5f32febc767803bf50df6886edea271315e382903b8cc1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(0,NULL,0,'insert','blocks','{"block_hash":"8b3bef249cb3b0fa23a4936c1249b6bd41daeadc848c8d2e409ea1cbc10adfe7","block_index":309999,"block_time":309999000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1,NULL,309999,'parse','blocks','{"block_index":309999,"ledger_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","messages_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","txlist_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(2,NULL,309999,'insert','blocks','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(3,NULL,310000,'insert','transactions','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"btc_amount":62000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"63f8a75a06328d984c928bdcf6bebb20d9c2b154712f1d03041d07c6f319efd2","tx_index":1}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(4,NULL,310000,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310000,"calling_function":"burn","event":"63f8a75a06328d984c928bdcf6bebb20d9c2b154712f1d03041d07c6f319efd2","quantity":93000000000,"tx_index":1}',0,'CREDIT');
+INSERT INTO messages VALUES(5,NULL,310000,'insert','burns','{"block_index":310000,"burned":62000000,"earned":93000000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"63f8a75a06328d984c928bdcf6bebb20d9c2b154712f1d03041d07c6f319efd2","tx_index":1}',0,'BURN');
+INSERT INTO messages VALUES(6,NULL,310000,'parse','blocks','{"block_index":310000,"ledger_hash":"7e1322d444b3395f9d8ce6b1ca6d48e8f0d78e5d72da997fad9520899bdbebe3","messages_hash":"d95ba402c3fcafbebe7fd8f621727efe65b9a20355645e4f62ca4f77f9b4f061","txlist_hash":"702e537dd6e79386a246cbc44fbccf8ea2a4e575c9f1e072189fbbd831308672"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(7,NULL,310000,'insert','blocks','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(8,NULL,310001,'insert','transactions','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"btc_amount":1000,"data":"0000000000000000000000010000000002faf080","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"5849bd15f5a73840e4babd220ed450d0f46128479d6bb7eaf9f4e98a409c97d4","tx_index":2}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(9,NULL,310001,'insert','debits','{"action":"send","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310001,"event":"5849bd15f5a73840e4babd220ed450d0f46128479d6bb7eaf9f4e98a409c97d4","quantity":50000000,"tx_index":2}',0,'DEBIT');
+INSERT INTO messages VALUES(10,NULL,310001,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"XCP","block_index":310001,"calling_function":"send","event":"5849bd15f5a73840e4babd220ed450d0f46128479d6bb7eaf9f4e98a409c97d4","quantity":50000000,"tx_index":2}',0,'CREDIT');
+INSERT INTO messages VALUES(11,NULL,310001,'insert','sends','{"asset":"XCP","block_index":310001,"destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","quantity":50000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"5849bd15f5a73840e4babd220ed450d0f46128479d6bb7eaf9f4e98a409c97d4","tx_index":2}',0,'SEND');
+INSERT INTO messages VALUES(12,NULL,310001,'parse','transactions','{"supported":true,"tx_hash":"5849bd15f5a73840e4babd220ed450d0f46128479d6bb7eaf9f4e98a409c97d4","tx_index":2}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(13,NULL,310001,'parse','blocks','{"block_index":310001,"ledger_hash":"3e18d8a969bce2d869cb86b28c23823d88e6d8a840a3cda905a003b37222ebb8","messages_hash":"992c82eb0567345b819a2b96f773b54399af095bd95ded9bdb81f1c9440c6dfd","txlist_hash":"bcd62109b750a9b5c3a07fb6e3ba7a5feb2cb56fb554da3b2b4b560a632e3e2e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(14,NULL,310001,'insert','blocks','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(15,NULL,310002,'insert','transactions','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"btc_amount":0,"data":"0000000a00000000000000000000000002faf08000000000000000010000000005f5e100000a0000000000000000","destination":"","fee":1000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"04d5809f0085bf2655c500a8c65d6d8b42dd373160fb431af05792b0f30b63a6","tx_index":3}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(16,NULL,310002,'insert','orders','{"block_index":310002,"expiration":10,"expire_index":310012,"fee_provided":1000000,"fee_provided_remaining":1000000,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":100000000,"get_remaining":100000000,"give_asset":"BTC","give_quantity":50000000,"give_remaining":50000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","tx_hash":"04d5809f0085bf2655c500a8c65d6d8b42dd373160fb431af05792b0f30b63a6","tx_index":3}',0,'OPEN_ORDER');
+INSERT INTO messages VALUES(17,NULL,310002,'parse','transactions','{"supported":true,"tx_hash":"04d5809f0085bf2655c500a8c65d6d8b42dd373160fb431af05792b0f30b63a6","tx_index":3}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(18,NULL,310002,'parse','blocks','{"block_index":310002,"ledger_hash":"71dfa527236bbaf632db18cf1773c63f7ee3a0076fc6562e46db0c955b346a9f","messages_hash":"ee6ae96acab5328d1beb240759bfd4593ea203c4a5ab8bbbb893586824ae4816","txlist_hash":"f7e5b51624875d95cb14e212ee733c94f12f69084eeefa4b77491479ea3ae990"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(19,NULL,310002,'insert','blocks','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(20,NULL,310003,'insert','transactions','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"btc_amount":0,"data":"0000000a00000000000000010000000006422c4000000000000000000000000002faf080000a00000000000dbba0","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"98ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52","tx_index":4}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(21,NULL,310003,'insert','debits','{"action":"open order","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310003,"event":"98ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52","quantity":105000000,"tx_index":4}',0,'DEBIT');
+INSERT INTO messages VALUES(22,NULL,310003,'insert','orders','{"block_index":310003,"expiration":10,"expire_index":310013,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":900000,"fee_required_remaining":900000,"get_asset":"BTC","get_quantity":50000000,"get_remaining":50000000,"give_asset":"XCP","give_quantity":105000000,"give_remaining":105000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","tx_hash":"98ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52","tx_index":4}',0,'OPEN_ORDER');
+INSERT INTO messages VALUES(23,NULL,310003,'update','orders','{"fee_provided_remaining":142858,"fee_required_remaining":0,"get_remaining":0,"give_remaining":0,"status":"open","tx_hash":"04d5809f0085bf2655c500a8c65d6d8b42dd373160fb431af05792b0f30b63a6"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(24,NULL,310003,'update','orders','{"fee_provided_remaining":6800,"fee_required_remaining":42858,"get_remaining":0,"give_remaining":5000000,"status":"open","tx_hash":"98ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(25,NULL,310003,'insert','order_matches','{"backward_asset":"XCP","backward_quantity":100000000,"block_index":310003,"fee_paid":857142,"forward_asset":"BTC","forward_quantity":50000000,"id":"04d5809f0085bf2655c500a8c65d6d8b42dd373160fb431af05792b0f30b63a6_98ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52","match_expire_index":310023,"status":"pending","tx0_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx0_block_index":310002,"tx0_expiration":10,"tx0_hash":"04d5809f0085bf2655c500a8c65d6d8b42dd373160fb431af05792b0f30b63a6","tx0_index":3,"tx1_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx1_block_index":310003,"tx1_expiration":10,"tx1_hash":"98ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52","tx1_index":4}',0,'ORDER_MATCH');
+INSERT INTO messages VALUES(26,NULL,310003,'parse','transactions','{"supported":true,"tx_hash":"98ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52","tx_index":4}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(27,NULL,310003,'parse','blocks','{"block_index":310003,"ledger_hash":"39feff81ad306adcfb9610e6bd8442e35dd6e1924e75a53708c1d2932bda67f6","messages_hash":"c3ba35fc4fb0a7a1e9fff19e260c2a36ffc6869477fd4a382b7bc9294aab42a6","txlist_hash":"a857bb0cb63c343a04d6efdf7d69f1de6f89a67dc25ca5b3e9cd9405ef48c416"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(28,NULL,310003,'insert','blocks','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(29,NULL,310004,'insert','transactions','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"btc_amount":50000000,"data":"0000000b04d5809f0085bf2655c500a8c65d6d8b42dd373160fb431af05792b0f30b63a698ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":9675,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"90eb885df58d93c1d5fdc86a88257db69e6ac7904409929733250b3f7bbe5613","tx_index":5}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(30,NULL,310004,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310004,"calling_function":"btcpay","event":"90eb885df58d93c1d5fdc86a88257db69e6ac7904409929733250b3f7bbe5613","quantity":100000000,"tx_index":5}',0,'CREDIT');
+INSERT INTO messages VALUES(31,NULL,310004,'update','order_matches','{"id":"04d5809f0085bf2655c500a8c65d6d8b42dd373160fb431af05792b0f30b63a6_98ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52","order_match_id":"04d5809f0085bf2655c500a8c65d6d8b42dd373160fb431af05792b0f30b63a6_98ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52","status":"completed"}',0,'ORDER_MATCH_UPDATE');
+INSERT INTO messages VALUES(32,NULL,310004,'insert','btcpays','{"block_index":310004,"btc_amount":50000000,"destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","order_match_id":"04d5809f0085bf2655c500a8c65d6d8b42dd373160fb431af05792b0f30b63a6_98ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52","source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"90eb885df58d93c1d5fdc86a88257db69e6ac7904409929733250b3f7bbe5613","tx_index":5}',0,'BTC_PAY');
+INSERT INTO messages VALUES(33,NULL,310004,'parse','transactions','{"supported":true,"tx_hash":"90eb885df58d93c1d5fdc86a88257db69e6ac7904409929733250b3f7bbe5613","tx_index":5}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(34,NULL,310004,'parse','blocks','{"block_index":310004,"ledger_hash":"1cee0851ee48eeaa3f71e7a18f9f52fffa28cd3b2e1cbf1f79c0f562618b88c6","messages_hash":"db1deda535fb5c25233d6efc2cc930499cde719c4546f817abad5b30d48af9ac","txlist_hash":"32e68b308a1281ef170d188fe7d19a93486667d45d8a6b50a0c39f00d6924cde"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(35,NULL,310004,'insert','blocks','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(36,NULL,310005,'insert','transactions','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"btc_amount":0,"data":"000000140000000000004767000000003b9aca000100000000000000000000","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"1ba2a0b4ee8543976aab629c78103c0ba86c60250c11d51f9bc40676487283b7","tx_index":6}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(37,NULL,310005,'insert','debits','{"action":"issuance fee","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310005,"event":"1ba2a0b4ee8543976aab629c78103c0ba86c60250c11d51f9bc40676487283b7","quantity":50000000,"tx_index":6}',0,'DEBIT');
+INSERT INTO messages VALUES(38,NULL,310005,'insert','assets','{"asset_id":"18279","asset_longname":null,"asset_name":"BBBB","block_index":310005}',0,'ASSET_CREATION');
+INSERT INTO messages VALUES(39,NULL,310005,'insert','issuances','{"asset":"BBBB","asset_longname":null,"block_index":310005,"call_date":0,"call_price":0.0,"callable":false,"description":"","divisible":true,"fee_paid":50000000,"issuer":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","locked":false,"quantity":1000000000,"reset":false,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","transfer":false,"tx_hash":"1ba2a0b4ee8543976aab629c78103c0ba86c60250c11d51f9bc40676487283b7","tx_index":6}',0,'ASSET_ISSUANCE');
+INSERT INTO messages VALUES(40,NULL,310005,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBB","block_index":310005,"calling_function":"issuance","event":"1ba2a0b4ee8543976aab629c78103c0ba86c60250c11d51f9bc40676487283b7","quantity":1000000000,"tx_index":6}',0,'CREDIT');
+INSERT INTO messages VALUES(41,NULL,310005,'parse','transactions','{"supported":true,"tx_hash":"1ba2a0b4ee8543976aab629c78103c0ba86c60250c11d51f9bc40676487283b7","tx_index":6}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(42,NULL,310005,'parse','blocks','{"block_index":310005,"ledger_hash":"89f516c3fbdcd1540125561301db451fb55b1baead9ae8f408156075aed104ad","messages_hash":"a587bd615ee0752052c4b1ce2df72fa76cf8ba03ae53e561fa1b55674ae3fbd7","txlist_hash":"3a41f3c4d912ee4628975e61c4a04b836de31df5a9aa5fbd7031628d9c4f0eb6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(43,NULL,310005,'insert','blocks','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(44,NULL,310006,'insert','transactions','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"btc_amount":0,"data":"00000014000000000000476800000000000186a00000000000000000000006666f6f626172","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"3f9e2dc4f7a72dee0e2d3badd871324506fe6c8239f62b6aa35f316800d55846","tx_index":7}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(45,NULL,310006,'insert','debits','{"action":"issuance fee","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310006,"event":"3f9e2dc4f7a72dee0e2d3badd871324506fe6c8239f62b6aa35f316800d55846","quantity":50000000,"tx_index":7}',0,'DEBIT');
+INSERT INTO messages VALUES(46,NULL,310006,'insert','assets','{"asset_id":"18280","asset_longname":null,"asset_name":"BBBC","block_index":310006}',0,'ASSET_CREATION');
+INSERT INTO messages VALUES(47,NULL,310006,'insert','issuances','{"asset":"BBBC","asset_longname":null,"block_index":310006,"call_date":0,"call_price":0.0,"callable":false,"description":"foobar","divisible":false,"fee_paid":50000000,"issuer":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","locked":false,"quantity":100000,"reset":false,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","transfer":false,"tx_hash":"3f9e2dc4f7a72dee0e2d3badd871324506fe6c8239f62b6aa35f316800d55846","tx_index":7}',0,'ASSET_ISSUANCE');
+INSERT INTO messages VALUES(48,NULL,310006,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBC","block_index":310006,"calling_function":"issuance","event":"3f9e2dc4f7a72dee0e2d3badd871324506fe6c8239f62b6aa35f316800d55846","quantity":100000,"tx_index":7}',0,'CREDIT');
+INSERT INTO messages VALUES(49,NULL,310006,'parse','transactions','{"supported":true,"tx_hash":"3f9e2dc4f7a72dee0e2d3badd871324506fe6c8239f62b6aa35f316800d55846","tx_index":7}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(50,NULL,310006,'parse','blocks','{"block_index":310006,"ledger_hash":"e9a37cfc1055e8c18d369896a14422cad3c5ac8d9b4d5aff6053d8e31dd56336","messages_hash":"200f90a0b58f1350230916be6521a38bc99cc9fdc9165b36a26141b28ae83954","txlist_hash":"4d2d6945b23826371a1cdb4cf2f841cf2b78c891a6b93da8167ed219388edd65"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(51,NULL,310006,'insert','blocks','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(52,NULL,310007,'insert','transactions','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"btc_amount":1000,"data":"00000000000000000000476700000000003d0900","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"30bfb2793bd1a65e5993edb9c3268db31bc96b8bf1f6e3bef037da4f4e93bc65","tx_index":8}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(53,NULL,310007,'insert','debits','{"action":"send","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBB","block_index":310007,"event":"30bfb2793bd1a65e5993edb9c3268db31bc96b8bf1f6e3bef037da4f4e93bc65","quantity":4000000,"tx_index":8}',0,'DEBIT');
+INSERT INTO messages VALUES(54,NULL,310007,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"BBBB","block_index":310007,"calling_function":"send","event":"30bfb2793bd1a65e5993edb9c3268db31bc96b8bf1f6e3bef037da4f4e93bc65","quantity":4000000,"tx_index":8}',0,'CREDIT');
+INSERT INTO messages VALUES(55,NULL,310007,'insert','sends','{"asset":"BBBB","block_index":310007,"destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","quantity":4000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"30bfb2793bd1a65e5993edb9c3268db31bc96b8bf1f6e3bef037da4f4e93bc65","tx_index":8}',0,'SEND');
+INSERT INTO messages VALUES(56,NULL,310007,'parse','transactions','{"supported":true,"tx_hash":"30bfb2793bd1a65e5993edb9c3268db31bc96b8bf1f6e3bef037da4f4e93bc65","tx_index":8}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(57,NULL,310007,'parse','blocks','{"block_index":310007,"ledger_hash":"174c7c107c37e0ca2c907b1bc35e086eebbad8eb02493a2f166ff2279ecc013c","messages_hash":"0727ddaec67766acc71f6b2534a1fe0eb25e8866c10d8bd0c5c742eb6a5f8d8c","txlist_hash":"dd1e7522ff359cc0ed124a82d3b367ea105127d45ccf563848b531aaf75b8c2d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(58,NULL,310007,'insert','blocks','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(59,NULL,310008,'insert','transactions','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"btc_amount":1000,"data":"000000000000000000004768000000000000020e","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"7da21bef68887cb50f8582fc0dda69ee5414993450dfab7437891b5a1117e849","tx_index":9}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(60,NULL,310008,'insert','debits','{"action":"send","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBC","block_index":310008,"event":"7da21bef68887cb50f8582fc0dda69ee5414993450dfab7437891b5a1117e849","quantity":526,"tx_index":9}',0,'DEBIT');
+INSERT INTO messages VALUES(61,NULL,310008,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"BBBC","block_index":310008,"calling_function":"send","event":"7da21bef68887cb50f8582fc0dda69ee5414993450dfab7437891b5a1117e849","quantity":526,"tx_index":9}',0,'CREDIT');
+INSERT INTO messages VALUES(62,NULL,310008,'insert','sends','{"asset":"BBBC","block_index":310008,"destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","quantity":526,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"7da21bef68887cb50f8582fc0dda69ee5414993450dfab7437891b5a1117e849","tx_index":9}',0,'SEND');
+INSERT INTO messages VALUES(63,NULL,310008,'parse','transactions','{"supported":true,"tx_hash":"7da21bef68887cb50f8582fc0dda69ee5414993450dfab7437891b5a1117e849","tx_index":9}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(64,NULL,310008,'parse','blocks','{"block_index":310008,"ledger_hash":"1463da3ebe264e703ecc0c708baa98f737b31f51726f85d3ac646f5e301b7c10","messages_hash":"46eeaba57e4e2bef42a40c71a8bfd0bd81d10357dfe68f3cc0899ceb0da7bd74","txlist_hash":"3e547d66bace022adbb42aba8172ed287077f306537c9ce69bb11f47ed1b34d1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(65,NULL,310008,'insert','blocks','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(66,NULL,310009,'insert','transactions','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"btc_amount":0,"data":"00000032000000000000025800000000000047670000000000000001","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"f3cb8e3c39c261fef8d71c5222b8864bee3c7c1c4ec342430cff08945273779f","tx_index":10}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(67,NULL,310009,'insert','debits','{"action":"dividend","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310009,"event":"f3cb8e3c39c261fef8d71c5222b8864bee3c7c1c4ec342430cff08945273779f","quantity":24,"tx_index":10}',0,'DEBIT');
+INSERT INTO messages VALUES(68,NULL,310009,'insert','debits','{"action":"dividend fee","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310009,"event":"f3cb8e3c39c261fef8d71c5222b8864bee3c7c1c4ec342430cff08945273779f","quantity":20000,"tx_index":10}',0,'DEBIT');
+INSERT INTO messages VALUES(69,NULL,310009,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"XCP","block_index":310009,"calling_function":"dividend","event":"f3cb8e3c39c261fef8d71c5222b8864bee3c7c1c4ec342430cff08945273779f","quantity":24,"tx_index":10}',0,'CREDIT');
+INSERT INTO messages VALUES(70,NULL,310009,'insert','dividends','{"asset":"BBBB","block_index":310009,"dividend_asset":"XCP","fee_paid":20000,"quantity_per_unit":600,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"f3cb8e3c39c261fef8d71c5222b8864bee3c7c1c4ec342430cff08945273779f","tx_index":10}',0,'ASSET_DIVIDEND');
+INSERT INTO messages VALUES(71,NULL,310009,'parse','transactions','{"supported":true,"tx_hash":"f3cb8e3c39c261fef8d71c5222b8864bee3c7c1c4ec342430cff08945273779f","tx_index":10}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(72,NULL,310009,'parse','blocks','{"block_index":310009,"ledger_hash":"dfe8c57b4ce4ea12f002d11cfc127f95b7cea7727bcbaf64418b2d584602a250","messages_hash":"fe46bead46c77b206699519527766a6528f0b9c5de6b51cbab3ff306a30b20bd","txlist_hash":"20b7caf43b34f595139545c800247b16da6e00b0b1162928670c80ffc2cc773f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(73,NULL,310009,'insert','blocks','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(74,NULL,310010,'insert','transactions','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"btc_amount":0,"data":"00000032000000000000032000000000000047680000000000000001","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"15741649c83a752d61662fe00bd28b1c33dfd7816cb92225a0a61008f9059a59","tx_index":11}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(75,NULL,310010,'insert','debits','{"action":"dividend","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310010,"event":"15741649c83a752d61662fe00bd28b1c33dfd7816cb92225a0a61008f9059a59","quantity":420800,"tx_index":11}',0,'DEBIT');
+INSERT INTO messages VALUES(76,NULL,310010,'insert','debits','{"action":"dividend fee","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310010,"event":"15741649c83a752d61662fe00bd28b1c33dfd7816cb92225a0a61008f9059a59","quantity":20000,"tx_index":11}',0,'DEBIT');
+INSERT INTO messages VALUES(77,NULL,310010,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"XCP","block_index":310010,"calling_function":"dividend","event":"15741649c83a752d61662fe00bd28b1c33dfd7816cb92225a0a61008f9059a59","quantity":420800,"tx_index":11}',0,'CREDIT');
+INSERT INTO messages VALUES(78,NULL,310010,'insert','dividends','{"asset":"BBBC","block_index":310010,"dividend_asset":"XCP","fee_paid":20000,"quantity_per_unit":800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"15741649c83a752d61662fe00bd28b1c33dfd7816cb92225a0a61008f9059a59","tx_index":11}',0,'ASSET_DIVIDEND');
+INSERT INTO messages VALUES(79,NULL,310010,'parse','transactions','{"supported":true,"tx_hash":"15741649c83a752d61662fe00bd28b1c33dfd7816cb92225a0a61008f9059a59","tx_index":11}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(80,NULL,310010,'parse','blocks','{"block_index":310010,"ledger_hash":"f9c936d3bb4c8bbc20e544d9262ffa3906fbaeca5e4b2e3b241f6059868f506e","messages_hash":"aa6e782f2298ea91fe4708af37be85c140fbe2b6772a66a9f9acb11d0e2186fe","txlist_hash":"47442be955776c7e31fba3f14df298b088192577691c17dced8b14b6037e3c50"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(81,NULL,310010,'insert','blocks','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(82,NULL,310011,'insert','transactions','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"btc_amount":0,"data":"0000001e52bb3300405900000000000005f5e0ff09556e69742054657374","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"1a5b6320346fcb5f7b59ce88553ef92738d2f5ba0a7477e898df85b2730a0f1a","tx_index":12}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(83,NULL,310011,'insert','broadcasts','{"block_index":310011,"fee_fraction_int":99999999,"locked":false,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","text":"Unit Test","timestamp":1388000000,"tx_hash":"1a5b6320346fcb5f7b59ce88553ef92738d2f5ba0a7477e898df85b2730a0f1a","tx_index":12,"value":100.0}',0,'BROADCAST');
+INSERT INTO messages VALUES(84,NULL,310011,'parse','transactions','{"supported":true,"tx_hash":"1a5b6320346fcb5f7b59ce88553ef92738d2f5ba0a7477e898df85b2730a0f1a","tx_index":12}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(85,NULL,310011,'parse','blocks','{"block_index":310011,"ledger_hash":"490bfec10bfd72eca7fcbae5887b94ce4739454a82e601dc754e4e9d1030f3c2","messages_hash":"c9c5eded352f3952628122af57f3f3d716beac03fc6058fb7601f90617221fd2","txlist_hash":"8a060a9cc82b497e020ad7af45a62c07110b724282ce0c7ca34ad24584638a3b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(86,NULL,310011,'insert','blocks','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(87,NULL,310012,'insert','transactions','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"btc_amount":1000,"data":"00000028000052bb33640000000002faf08000000000017d7840000000000000000000003b100000000a","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"1075391072b01264a783bf31205a83abdf7356c8c405753d3ef8599f852df887","tx_index":13}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(88,NULL,310012,'insert','debits','{"action":"bet","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310012,"event":"1075391072b01264a783bf31205a83abdf7356c8c405753d3ef8599f852df887","quantity":50000000,"tx_index":13}',0,'DEBIT');
+INSERT INTO messages VALUES(89,NULL,310012,'insert','bets','{"bet_type":0,"block_index":310012,"counterwager_quantity":25000000,"counterwager_remaining":25000000,"deadline":1388000100,"expiration":10,"expire_index":310022,"fee_fraction_int":99999999.0,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":15120,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":0.0,"tx_hash":"1075391072b01264a783bf31205a83abdf7356c8c405753d3ef8599f852df887","tx_index":13,"wager_quantity":50000000,"wager_remaining":50000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(90,NULL,310012,'parse','transactions','{"supported":true,"tx_hash":"1075391072b01264a783bf31205a83abdf7356c8c405753d3ef8599f852df887","tx_index":13}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(91,NULL,310012,'parse','blocks','{"block_index":310012,"ledger_hash":"621d39c103bff9a76ada332f41e3ad54c89676bb6057f624942ddf28b31b5927","messages_hash":"26c52cc30b3386eeac9bdd91338ea6460559a0ec72b81314f6de852446b881f3","txlist_hash":"4eb1fdd02e0f8ba27b9134ddb7b03b51caf3417e92687c7c1a7b50ce2d52e6ca"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(92,NULL,310012,'insert','blocks','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(93,NULL,310013,'insert','transactions','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"btc_amount":1000,"data":"00000028000152bb336400000000017d78400000000002793d60000000000000000000003b100000000a","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"a067f79057992245507ea08e901e623918be2b0eb2d178e35b01f36da2d30a33","tx_index":14}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(94,NULL,310013,'update','orders','{"status":"expired","tx_hash":"04d5809f0085bf2655c500a8c65d6d8b42dd373160fb431af05792b0f30b63a6"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(95,NULL,310013,'insert','order_expirations','{"block_index":310013,"order_hash":"04d5809f0085bf2655c500a8c65d6d8b42dd373160fb431af05792b0f30b63a6","source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3"}',0,'ORDER_EXPIRATION');
+INSERT INTO messages VALUES(96,NULL,310013,'insert','debits','{"action":"bet","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310013,"event":"a067f79057992245507ea08e901e623918be2b0eb2d178e35b01f36da2d30a33","quantity":25000000,"tx_index":14}',0,'DEBIT');
+INSERT INTO messages VALUES(97,NULL,310013,'insert','bets','{"bet_type":1,"block_index":310013,"counterwager_quantity":41500000,"counterwager_remaining":41500000,"deadline":1388000100,"expiration":10,"expire_index":310023,"fee_fraction_int":99999999.0,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":15120,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":0.0,"tx_hash":"a067f79057992245507ea08e901e623918be2b0eb2d178e35b01f36da2d30a33","tx_index":14,"wager_quantity":25000000,"wager_remaining":25000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(98,NULL,310013,'update','bets','{"counterwager_remaining":4250000,"status":"open","tx_hash":"1075391072b01264a783bf31205a83abdf7356c8c405753d3ef8599f852df887","wager_remaining":8500000}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(99,NULL,310013,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310013,"calling_function":"filled","event":"a067f79057992245507ea08e901e623918be2b0eb2d178e35b01f36da2d30a33","quantity":4250000,"tx_index":14}',0,'CREDIT');
+INSERT INTO messages VALUES(100,NULL,310013,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"a067f79057992245507ea08e901e623918be2b0eb2d178e35b01f36da2d30a33","wager_remaining":4250000}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(101,NULL,310013,'insert','bet_matches','{"backward_quantity":20750000,"block_index":310012,"deadline":1388000100,"fee_fraction_int":99999999,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","forward_quantity":41500000,"id":"1075391072b01264a783bf31205a83abdf7356c8c405753d3ef8599f852df887_a067f79057992245507ea08e901e623918be2b0eb2d178e35b01f36da2d30a33","initial_value":100.0,"leverage":15120,"match_expire_index":310022,"status":"pending","target_value":0.0,"tx0_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx0_bet_type":0,"tx0_block_index":310012,"tx0_expiration":10,"tx0_hash":"1075391072b01264a783bf31205a83abdf7356c8c405753d3ef8599f852df887","tx0_index":13,"tx1_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx1_bet_type":1,"tx1_block_index":310013,"tx1_expiration":10,"tx1_hash":"a067f79057992245507ea08e901e623918be2b0eb2d178e35b01f36da2d30a33","tx1_index":14}',0,'BET_MATCH');
+INSERT INTO messages VALUES(102,NULL,310013,'parse','transactions','{"supported":true,"tx_hash":"a067f79057992245507ea08e901e623918be2b0eb2d178e35b01f36da2d30a33","tx_index":14}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(103,NULL,310013,'parse','blocks','{"block_index":310013,"ledger_hash":"7d31be770d6bb6669bcb0a8a5964e57a758788cbbb942d1d3da1abd25b5dd158","messages_hash":"04ac5c161df427ab528946abd575d82c8579c27637511d1784049e1281c97dfe","txlist_hash":"c71d132b3da755134d5305e814129761fdeab1ac933dc320f83570bd5d007002"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(104,NULL,310013,'insert','blocks','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(105,NULL,310014,'insert','transactions','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"btc_amount":1000,"data":"00000028000052bb33640000000008f0d1800000000014dc93800000000000000000000013b00000000a","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"040e03dfdef2df24411a077cfe5f90f3311bbb82bb3783ea2d7e6f484afd3e2b","tx_index":15}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(106,NULL,310014,'update','orders','{"status":"expired","tx_hash":"98ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(107,NULL,310014,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310014,"calling_function":"cancel order","event":"98ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52","quantity":5000000,"tx_index":0}',0,'CREDIT');
+INSERT INTO messages VALUES(108,NULL,310014,'insert','order_expirations','{"block_index":310014,"order_hash":"98ef3d31d1777ad18801e94eef03d4314911ac03d7a82483b40614ea5cf80e52","source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3"}',0,'ORDER_EXPIRATION');
+INSERT INTO messages VALUES(109,NULL,310014,'insert','debits','{"action":"bet","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310014,"event":"040e03dfdef2df24411a077cfe5f90f3311bbb82bb3783ea2d7e6f484afd3e2b","quantity":150000000,"tx_index":15}',0,'DEBIT');
+INSERT INTO messages VALUES(110,NULL,310014,'insert','bets','{"bet_type":0,"block_index":310014,"counterwager_quantity":350000000,"counterwager_remaining":350000000,"deadline":1388000100,"expiration":10,"expire_index":310024,"fee_fraction_int":99999999.0,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":5040,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":0.0,"tx_hash":"040e03dfdef2df24411a077cfe5f90f3311bbb82bb3783ea2d7e6f484afd3e2b","tx_index":15,"wager_quantity":150000000,"wager_remaining":150000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(111,NULL,310014,'parse','transactions','{"supported":true,"tx_hash":"040e03dfdef2df24411a077cfe5f90f3311bbb82bb3783ea2d7e6f484afd3e2b","tx_index":15}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(112,NULL,310014,'parse','blocks','{"block_index":310014,"ledger_hash":"3aba9622f8de243bcd5e6a5c88fdf04a79a52d95bdc1778d57586b13f30e501c","messages_hash":"6955a89976cbc97716f4f2a189d22ce159a4110af396e660f85ab6e688c24fea","txlist_hash":"d7949a992d062d2eb763b2bd406ffab07d7d676e3327f5e38a4a8a4815e97f35"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(113,NULL,310014,'insert','blocks','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(114,NULL,310015,'insert','transactions','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"btc_amount":1000,"data":"00000028000152bb33640000000014dc93800000000008f0d1800000000000000000000013b00000000a","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"62ece578c6760773bd4252922a7a0af87da1a1c308f32423e20cf49a369ea0a2","tx_index":16}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(115,NULL,310015,'insert','debits','{"action":"bet","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310015,"event":"62ece578c6760773bd4252922a7a0af87da1a1c308f32423e20cf49a369ea0a2","quantity":350000000,"tx_index":16}',0,'DEBIT');
+INSERT INTO messages VALUES(116,NULL,310015,'insert','bets','{"bet_type":1,"block_index":310015,"counterwager_quantity":150000000,"counterwager_remaining":150000000,"deadline":1388000100,"expiration":10,"expire_index":310025,"fee_fraction_int":99999999.0,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":5040,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":0.0,"tx_hash":"62ece578c6760773bd4252922a7a0af87da1a1c308f32423e20cf49a369ea0a2","tx_index":16,"wager_quantity":350000000,"wager_remaining":350000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(117,NULL,310015,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310015,"calling_function":"filled","event":"62ece578c6760773bd4252922a7a0af87da1a1c308f32423e20cf49a369ea0a2","quantity":0,"tx_index":16}',0,'CREDIT');
+INSERT INTO messages VALUES(118,NULL,310015,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"040e03dfdef2df24411a077cfe5f90f3311bbb82bb3783ea2d7e6f484afd3e2b","wager_remaining":0}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(119,NULL,310015,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310015,"calling_function":"filled","event":"62ece578c6760773bd4252922a7a0af87da1a1c308f32423e20cf49a369ea0a2","quantity":0,"tx_index":16}',0,'CREDIT');
+INSERT INTO messages VALUES(120,NULL,310015,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"62ece578c6760773bd4252922a7a0af87da1a1c308f32423e20cf49a369ea0a2","wager_remaining":0}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(121,NULL,310015,'insert','bet_matches','{"backward_quantity":350000000,"block_index":310014,"deadline":1388000100,"fee_fraction_int":99999999,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","forward_quantity":150000000,"id":"040e03dfdef2df24411a077cfe5f90f3311bbb82bb3783ea2d7e6f484afd3e2b_62ece578c6760773bd4252922a7a0af87da1a1c308f32423e20cf49a369ea0a2","initial_value":100.0,"leverage":5040,"match_expire_index":310024,"status":"pending","target_value":0.0,"tx0_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx0_bet_type":0,"tx0_block_index":310014,"tx0_expiration":10,"tx0_hash":"040e03dfdef2df24411a077cfe5f90f3311bbb82bb3783ea2d7e6f484afd3e2b","tx0_index":15,"tx1_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx1_bet_type":1,"tx1_block_index":310015,"tx1_expiration":10,"tx1_hash":"62ece578c6760773bd4252922a7a0af87da1a1c308f32423e20cf49a369ea0a2","tx1_index":16}',0,'BET_MATCH');
+INSERT INTO messages VALUES(122,NULL,310015,'parse','transactions','{"supported":true,"tx_hash":"62ece578c6760773bd4252922a7a0af87da1a1c308f32423e20cf49a369ea0a2","tx_index":16}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(123,NULL,310015,'parse','blocks','{"block_index":310015,"ledger_hash":"342e5dddd2289d3d6e381fade13e5a5e3ed27615b89bd8e06ea2bab8f8b48be8","messages_hash":"710b39597c7c1009e186eb15450bec99878edf95af9935ae8ccb2246b6b6728b","txlist_hash":"5afdd424176b977bd7b0660867d92952a9cec422a6861c62a876a10014807084"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(124,NULL,310015,'insert','blocks','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(125,NULL,310016,'insert','transactions','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"btc_amount":1000,"data":"00000028000252bb33c8000000002cb417800000000026be36803ff0000000000000000013b00000000a","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"578d8026c9a3a9173fdb7d5f10c6d5e7d49f375edf5fd8b3f29ccb37a8b42d1f","tx_index":17}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(126,NULL,310016,'insert','debits','{"action":"bet","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310016,"event":"578d8026c9a3a9173fdb7d5f10c6d5e7d49f375edf5fd8b3f29ccb37a8b42d1f","quantity":750000000,"tx_index":17}',0,'DEBIT');
+INSERT INTO messages VALUES(127,NULL,310016,'insert','bets','{"bet_type":2,"block_index":310016,"counterwager_quantity":650000000,"counterwager_remaining":650000000,"deadline":1388000200,"expiration":10,"expire_index":310026,"fee_fraction_int":99999999.0,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":5040,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":1.0,"tx_hash":"578d8026c9a3a9173fdb7d5f10c6d5e7d49f375edf5fd8b3f29ccb37a8b42d1f","tx_index":17,"wager_quantity":750000000,"wager_remaining":750000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(128,NULL,310016,'parse','transactions','{"supported":true,"tx_hash":"578d8026c9a3a9173fdb7d5f10c6d5e7d49f375edf5fd8b3f29ccb37a8b42d1f","tx_index":17}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(129,NULL,310016,'parse','blocks','{"block_index":310016,"ledger_hash":"51b904e6b18ce4d17bdc491457036ff3a4ba70789ae929862844e9456c3b9b01","messages_hash":"068b8aa01882c57eee33d9c970b47032d3977b9a5c3c5f96cbb96f10a7209706","txlist_hash":"d74711d3af6b2313835591b58b1ff53bc20bc194922d10a60cb1274ca632e153"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(130,NULL,310016,'insert','blocks','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(131,NULL,310017,'insert','transactions','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"btc_amount":1000,"data":"00000028000352bb33c80000000026be3680000000002cb417803ff0000000000000000013b00000000a","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"479b0fbec468381f1e27332755b12a69800680379d0037e02f641265a8beb183","tx_index":18}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(132,NULL,310017,'insert','debits','{"action":"bet","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310017,"event":"479b0fbec468381f1e27332755b12a69800680379d0037e02f641265a8beb183","quantity":650000000,"tx_index":18}',0,'DEBIT');
+INSERT INTO messages VALUES(133,NULL,310017,'insert','bets','{"bet_type":3,"block_index":310017,"counterwager_quantity":750000000,"counterwager_remaining":750000000,"deadline":1388000200,"expiration":10,"expire_index":310027,"fee_fraction_int":99999999.0,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":5040,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":1.0,"tx_hash":"479b0fbec468381f1e27332755b12a69800680379d0037e02f641265a8beb183","tx_index":18,"wager_quantity":650000000,"wager_remaining":650000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(134,NULL,310017,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310017,"calling_function":"filled","event":"479b0fbec468381f1e27332755b12a69800680379d0037e02f641265a8beb183","quantity":0,"tx_index":18}',0,'CREDIT');
+INSERT INTO messages VALUES(135,NULL,310017,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"578d8026c9a3a9173fdb7d5f10c6d5e7d49f375edf5fd8b3f29ccb37a8b42d1f","wager_remaining":0}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(136,NULL,310017,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310017,"calling_function":"filled","event":"479b0fbec468381f1e27332755b12a69800680379d0037e02f641265a8beb183","quantity":0,"tx_index":18}',0,'CREDIT');
+INSERT INTO messages VALUES(137,NULL,310017,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"479b0fbec468381f1e27332755b12a69800680379d0037e02f641265a8beb183","wager_remaining":0}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(138,NULL,310017,'insert','bet_matches','{"backward_quantity":650000000,"block_index":310016,"deadline":1388000200,"fee_fraction_int":99999999,"feed_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","forward_quantity":750000000,"id":"578d8026c9a3a9173fdb7d5f10c6d5e7d49f375edf5fd8b3f29ccb37a8b42d1f_479b0fbec468381f1e27332755b12a69800680379d0037e02f641265a8beb183","initial_value":100.0,"leverage":5040,"match_expire_index":310026,"status":"pending","target_value":1.0,"tx0_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx0_bet_type":2,"tx0_block_index":310016,"tx0_expiration":10,"tx0_hash":"578d8026c9a3a9173fdb7d5f10c6d5e7d49f375edf5fd8b3f29ccb37a8b42d1f","tx0_index":17,"tx1_address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx1_bet_type":3,"tx1_block_index":310017,"tx1_expiration":10,"tx1_hash":"479b0fbec468381f1e27332755b12a69800680379d0037e02f641265a8beb183","tx1_index":18}',0,'BET_MATCH');
+INSERT INTO messages VALUES(139,NULL,310017,'parse','transactions','{"supported":true,"tx_hash":"479b0fbec468381f1e27332755b12a69800680379d0037e02f641265a8beb183","tx_index":18}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(140,NULL,310017,'parse','blocks','{"block_index":310017,"ledger_hash":"03a60654bc84711524cb38171f6573acbe8cc2120787bd09e5ec621b2f53929c","messages_hash":"795d00da46b3c5f0d16ed694ca58d6aff3cb42c8e2f0d08bfc77964b5b451cde","txlist_hash":"bafeaf2f42cf716cdd586e1aea74504257d170275022dfb2c11863cdc33d3127"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(141,NULL,310017,'insert','blocks','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(142,NULL,310018,'insert','transactions','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"btc_amount":0,"data":"0000001e52bb33324058f7256ffc115e004c4b4009556e69742054657374","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"16a5d04f339e5765125c4b2fdda91e45e135e44df489b97805b5d3bae50a6485","tx_index":19}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(143,NULL,310018,'insert','broadcasts','{"block_index":310018,"fee_fraction_int":5000000,"locked":false,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","text":"Unit Test","timestamp":1388000050,"tx_hash":"16a5d04f339e5765125c4b2fdda91e45e135e44df489b97805b5d3bae50a6485","tx_index":19,"value":99.86166}',0,'BROADCAST');
+INSERT INTO messages VALUES(144,NULL,310018,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310018,"calling_function":"bet settled: liquidated for bear","event":"16a5d04f339e5765125c4b2fdda91e45e135e44df489b97805b5d3bae50a6485","quantity":59137500,"tx_index":19}',0,'CREDIT');
+INSERT INTO messages VALUES(145,NULL,310018,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310018,"calling_function":"feed fee","event":"16a5d04f339e5765125c4b2fdda91e45e135e44df489b97805b5d3bae50a6485","quantity":3112500,"tx_index":19}',0,'CREDIT');
+INSERT INTO messages VALUES(146,NULL,310018,'insert','bet_match_resolutions','{"bear_credit":59137500,"bet_match_id":"1075391072b01264a783bf31205a83abdf7356c8c405753d3ef8599f852df887_a067f79057992245507ea08e901e623918be2b0eb2d178e35b01f36da2d30a33","bet_match_type_id":1,"block_index":310018,"bull_credit":0,"escrow_less_fee":null,"fee":3112500,"settled":false,"winner":null}',0,'BET_MATCH_RESOLUTON');
+INSERT INTO messages VALUES(147,NULL,310018,'update','bet_matches','{"id":"1075391072b01264a783bf31205a83abdf7356c8c405753d3ef8599f852df887_a067f79057992245507ea08e901e623918be2b0eb2d178e35b01f36da2d30a33","status":"settled: liquidated for bear"}',0,'BET_MATCH_UPDATE');
+INSERT INTO messages VALUES(148,NULL,310018,'parse','transactions','{"supported":true,"tx_hash":"16a5d04f339e5765125c4b2fdda91e45e135e44df489b97805b5d3bae50a6485","tx_index":19}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(149,NULL,310018,'parse','blocks','{"block_index":310018,"ledger_hash":"a590602f34163cf8f880c3620f07a8cd27b9aeba8fc80ccb201d88364eaed210","messages_hash":"dfd585d1c8707912ca3f03923bc4e50cbbbe5a8e4218caecb73df3cb6cb4fd5a","txlist_hash":"930eaaee66936628f4ac02f6417167100cc7e2335aaae56dac78cf2ea81bb172"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(150,NULL,310018,'insert','blocks','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(151,NULL,310019,'insert','transactions','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"btc_amount":0,"data":"0000001e52bb3365405915f3b645a1cb004c4b4009556e69742054657374","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"65c96e80d7bfe2c7b00086196a7fc38889d91f5907658a6bbe795c89ef90ce37","tx_index":20}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(152,NULL,310019,'insert','broadcasts','{"block_index":310019,"fee_fraction_int":5000000,"locked":false,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","text":"Unit Test","timestamp":1388000101,"tx_hash":"65c96e80d7bfe2c7b00086196a7fc38889d91f5907658a6bbe795c89ef90ce37","tx_index":20,"value":100.343}',0,'BROADCAST');
+INSERT INTO messages VALUES(153,NULL,310019,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310019,"calling_function":"bet settled","event":"65c96e80d7bfe2c7b00086196a7fc38889d91f5907658a6bbe795c89ef90ce37","quantity":159300000,"tx_index":20}',0,'CREDIT');
+INSERT INTO messages VALUES(154,NULL,310019,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310019,"calling_function":"bet settled","event":"65c96e80d7bfe2c7b00086196a7fc38889d91f5907658a6bbe795c89ef90ce37","quantity":315700000,"tx_index":20}',0,'CREDIT');
+INSERT INTO messages VALUES(155,NULL,310019,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310019,"calling_function":"feed fee","event":"65c96e80d7bfe2c7b00086196a7fc38889d91f5907658a6bbe795c89ef90ce37","quantity":25000000,"tx_index":20}',0,'CREDIT');
+INSERT INTO messages VALUES(156,NULL,310019,'insert','bet_match_resolutions','{"bear_credit":315700000,"bet_match_id":"040e03dfdef2df24411a077cfe5f90f3311bbb82bb3783ea2d7e6f484afd3e2b_62ece578c6760773bd4252922a7a0af87da1a1c308f32423e20cf49a369ea0a2","bet_match_type_id":1,"block_index":310019,"bull_credit":159300000,"escrow_less_fee":null,"fee":25000000,"settled":true,"winner":null}',0,'BET_MATCH_RESOLUTON');
+INSERT INTO messages VALUES(157,NULL,310019,'update','bet_matches','{"id":"040e03dfdef2df24411a077cfe5f90f3311bbb82bb3783ea2d7e6f484afd3e2b_62ece578c6760773bd4252922a7a0af87da1a1c308f32423e20cf49a369ea0a2","status":"settled"}',0,'BET_MATCH_UPDATE');
+INSERT INTO messages VALUES(158,NULL,310019,'parse','transactions','{"supported":true,"tx_hash":"65c96e80d7bfe2c7b00086196a7fc38889d91f5907658a6bbe795c89ef90ce37","tx_index":20}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(159,NULL,310019,'parse','blocks','{"block_index":310019,"ledger_hash":"1b340e7abac4c458e6a0c6ff2abd6dadaa2913414f450cf926725b5253210950","messages_hash":"16e098173f2f2fb61b8df304c27cc1069eb397263de2262743a57426e05a8152","txlist_hash":"ba496b27fd545d9d811d7421c6f9663e68aa9dbe3a7b5aa9d1ee5644cd142b4a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(160,NULL,310019,'insert','blocks','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(161,NULL,310020,'insert','transactions','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"btc_amount":0,"data":"0000001e52bb33c94000000000000000004c4b4009556e69742054657374","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"43232e4a2e0863cde59fb404a8da059c01cc8afb6c88b509f77d6cbfa02d187e","tx_index":21}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(162,NULL,310020,'insert','broadcasts','{"block_index":310020,"fee_fraction_int":5000000,"locked":false,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","text":"Unit Test","timestamp":1388000201,"tx_hash":"43232e4a2e0863cde59fb404a8da059c01cc8afb6c88b509f77d6cbfa02d187e","tx_index":21,"value":2.0}',0,'BROADCAST');
+INSERT INTO messages VALUES(163,NULL,310020,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310020,"calling_function":"bet settled: for notequal","event":"43232e4a2e0863cde59fb404a8da059c01cc8afb6c88b509f77d6cbfa02d187e","quantity":1330000000,"tx_index":21}',0,'CREDIT');
+INSERT INTO messages VALUES(164,NULL,310020,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310020,"calling_function":"feed fee","event":"43232e4a2e0863cde59fb404a8da059c01cc8afb6c88b509f77d6cbfa02d187e","quantity":70000000,"tx_index":21}',0,'CREDIT');
+INSERT INTO messages VALUES(165,NULL,310020,'insert','bet_match_resolutions','{"bear_credit":null,"bet_match_id":"578d8026c9a3a9173fdb7d5f10c6d5e7d49f375edf5fd8b3f29ccb37a8b42d1f_479b0fbec468381f1e27332755b12a69800680379d0037e02f641265a8beb183","bet_match_type_id":5,"block_index":310020,"bull_credit":null,"escrow_less_fee":1330000000,"fee":70000000,"settled":null,"winner":"NotEqual"}',0,'BET_MATCH_RESOLUTON');
+INSERT INTO messages VALUES(166,NULL,310020,'update','bet_matches','{"id":"578d8026c9a3a9173fdb7d5f10c6d5e7d49f375edf5fd8b3f29ccb37a8b42d1f_479b0fbec468381f1e27332755b12a69800680379d0037e02f641265a8beb183","status":"settled: for notequal"}',0,'BET_MATCH_UPDATE');
+INSERT INTO messages VALUES(167,NULL,310020,'parse','transactions','{"supported":true,"tx_hash":"43232e4a2e0863cde59fb404a8da059c01cc8afb6c88b509f77d6cbfa02d187e","tx_index":21}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(168,NULL,310020,'parse','blocks','{"block_index":310020,"ledger_hash":"5a5a31ae9b03a362b44c9e38effadfeac273bd370374ea4816b8402d6b8a8a1a","messages_hash":"27297409f25155cbbf6c84b665c6d0375c5e964c279c111df35370720b9299ee","txlist_hash":"be94a40c259a5f9e2ad5cb714089c4be18de7bd6d3b403f3a4620f4d889ba4ed"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(169,NULL,310020,'insert','blocks','{"block_hash":"7c2460bb32c5749c856486393239bf7a0ac789587ac71f32e7237910da8097f2","block_index":310021,"block_time":310021000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(170,NULL,310021,'insert','transactions','{"block_hash":"7c2460bb32c5749c856486393239bf7a0ac789587ac71f32e7237910da8097f2","block_index":310021,"block_time":310021000,"btc_amount":0,"data":"0000000a00000000000047670000000002faf08000000000000000010000000002faf080000a0000000000000000","destination":"","fee":6800,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"cd79f155a7a8b7737cf959cdc347db22f2f38288261842997e13844a09f6f2ee","tx_index":22}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(171,NULL,310021,'insert','debits','{"action":"open order","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBB","block_index":310021,"event":"cd79f155a7a8b7737cf959cdc347db22f2f38288261842997e13844a09f6f2ee","quantity":50000000,"tx_index":22}',0,'DEBIT');
+INSERT INTO messages VALUES(172,NULL,310021,'insert','orders','{"block_index":310021,"expiration":10,"expire_index":310031,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":50000000,"get_remaining":50000000,"give_asset":"BBBB","give_quantity":50000000,"give_remaining":50000000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","tx_hash":"cd79f155a7a8b7737cf959cdc347db22f2f38288261842997e13844a09f6f2ee","tx_index":22}',0,'OPEN_ORDER');
+INSERT INTO messages VALUES(173,NULL,310021,'parse','transactions','{"supported":true,"tx_hash":"cd79f155a7a8b7737cf959cdc347db22f2f38288261842997e13844a09f6f2ee","tx_index":22}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(174,NULL,310021,'parse','blocks','{"block_index":310021,"ledger_hash":"2005a300856ccc74efe80c56927fc13619d5c40ab03ae4ee4fba2050bc2a6b75","messages_hash":"dad5bc884bf7ba7bc454bc0864ce114a1faf785f6cf500fc4df296130ac5d56f","txlist_hash":"afa68f3f9cb6cf8f767075bc9119411e146b6838278d884868a80d9c8e80e26f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(175,NULL,310021,'insert','blocks','{"block_hash":"44435f9a99a0aa12a9bfabdc4cb8119f6ea6a6e1350d2d65445fb66a456db5fc","block_index":310022,"block_time":310022000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(176,NULL,310022,'insert','transactions','{"block_hash":"44435f9a99a0aa12a9bfabdc4cb8119f6ea6a6e1350d2d65445fb66a456db5fc","block_index":310022,"block_time":310022000,"btc_amount":100000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"ec9788fbae83a6cdf980d5373d85911a27447410efa4b11997fefcc41bc89caa","tx_index":23}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(177,NULL,310022,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310022,"calling_function":"burn","event":"ec9788fbae83a6cdf980d5373d85911a27447410efa4b11997fefcc41bc89caa","quantity":56999887262,"tx_index":23}',0,'CREDIT');
+INSERT INTO messages VALUES(178,NULL,310022,'insert','burns','{"block_index":310022,"burned":38000000,"earned":56999887262,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"ec9788fbae83a6cdf980d5373d85911a27447410efa4b11997fefcc41bc89caa","tx_index":23}',0,'BURN');
+INSERT INTO messages VALUES(179,NULL,310022,'parse','blocks','{"block_index":310022,"ledger_hash":"95307de52e23a8433143d79710e7df22ba7205e2651c88a2eda220ebc8e0f289","messages_hash":"36fe7b2ad4951a9900b5bbf451e10101d5cdd8ff33d4c40eb6e253dee2e8e991","txlist_hash":"66f27b0e46d782b3e7eb8207ba442131069820295ea19ba9b1f8be5ae5b1367b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(180,NULL,310022,'insert','blocks','{"block_hash":"d8cf5bec1bbcab8ca4f495352afde3b6572b7e1d61b3976872ebb8e9d30ccb08","block_index":310023,"block_time":310023000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(181,NULL,310023,'insert','transactions','{"block_hash":"d8cf5bec1bbcab8ca4f495352afde3b6572b7e1d61b3976872ebb8e9d30ccb08","block_index":310023,"block_time":310023000,"btc_amount":1000,"data":"0000000000000000000047680000000000002710","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","fee":7650,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"53290702a54a5c19d9a5e2fc1942c2381a4d2283f30d645579b982ae0dbb7fcc","tx_index":24}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(182,NULL,310023,'update','bets','{"status":"expired","tx_hash":"1075391072b01264a783bf31205a83abdf7356c8c405753d3ef8599f852df887"}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(183,NULL,310023,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310023,"calling_function":"recredit wager remaining","event":"1075391072b01264a783bf31205a83abdf7356c8c405753d3ef8599f852df887","quantity":8500000,"tx_index":0}',0,'CREDIT');
+INSERT INTO messages VALUES(184,NULL,310023,'insert','bet_expirations','{"bet_hash":"1075391072b01264a783bf31205a83abdf7356c8c405753d3ef8599f852df887","bet_index":13,"block_index":310023,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3"}',0,'BET_EXPIRATION');
+INSERT INTO messages VALUES(185,NULL,310023,'insert','debits','{"action":"send","address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBC","block_index":310023,"event":"53290702a54a5c19d9a5e2fc1942c2381a4d2283f30d645579b982ae0dbb7fcc","quantity":10000,"tx_index":24}',0,'DEBIT');
+INSERT INTO messages VALUES(186,NULL,310023,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"BBBC","block_index":310023,"calling_function":"send","event":"53290702a54a5c19d9a5e2fc1942c2381a4d2283f30d645579b982ae0dbb7fcc","quantity":10000,"tx_index":24}',0,'CREDIT');
+INSERT INTO messages VALUES(187,NULL,310023,'insert','sends','{"asset":"BBBC","block_index":310023,"destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","quantity":10000,"source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"53290702a54a5c19d9a5e2fc1942c2381a4d2283f30d645579b982ae0dbb7fcc","tx_index":24}',0,'SEND');
+INSERT INTO messages VALUES(188,NULL,310023,'parse','transactions','{"supported":true,"tx_hash":"53290702a54a5c19d9a5e2fc1942c2381a4d2283f30d645579b982ae0dbb7fcc","tx_index":24}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(189,NULL,310023,'parse','blocks','{"block_index":310023,"ledger_hash":"de5a22c228bfc58ceaf428d55f180e951ff877537ef463821ce1206f07ab02f3","messages_hash":"f8aeac00fb3c7b32c574f4025dd01789ea804d7dd61ab5e84fc8f0536d6fc923","txlist_hash":"eda7d728863433b4e738e2b317d661a68d7f8921ed3fcf56120e0e0df464f161"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(190,NULL,310023,'insert','blocks','{"block_hash":"b03042b4e18a222b4c8d1e9e1970d93e6e2a2d41686d227ff8ecf0a839223dc5","block_index":310024,"block_time":310024000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(191,NULL,310024,'parse','blocks','{"block_index":310024,"ledger_hash":"e54da9db6c4911087dcfb2824acfd7429431e3297f6b5836dfa8f95165ac9b08","messages_hash":"0cdb6d20ad2c93a414e4a882e78a01188ab03c3b4d20ab23980282d0be6d4ab0","txlist_hash":"6d7b69dafc9e895a4a4b75c2e7ee2dcda352e21b82249074bfd0865e04dfe6f6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(192,NULL,310024,'insert','blocks','{"block_hash":"a872e560766832cc3b4f7f222228cb6db882ce3c54f6459f62c71d5cd6e90666","block_index":310025,"block_time":310025000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(193,NULL,310025,'parse','blocks','{"block_index":310025,"ledger_hash":"dac63e0e407785c7a461d839ddd749f020f8a33026cd6ea2acd659567a36c40c","messages_hash":"3338a508c7799481dd961696b5634afa3f7caafd82114c09f35903a0761be969","txlist_hash":"fb8e2f9f37cc8ceb72b92925cdb86f62af821bbae196e5de5083d784436e26ef"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(194,NULL,310025,'insert','blocks','{"block_hash":"6c96350f6f2f05810f19a689de235eff975338587194a36a70dfd0fcd490941a","block_index":310026,"block_time":310026000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(195,NULL,310026,'parse','blocks','{"block_index":310026,"ledger_hash":"0397b7da62fb672aadb96fbdfc37f3265ea04c4d401632d5d9018b9b0ad7cd45","messages_hash":"49b57bea36ede566bc2f0b73007114f2979075d952326fa548ea7589598a8648","txlist_hash":"35f40cec8ce2dab43b642668fb3baed3654b63a328ef005e41c8772cbf02029a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(196,NULL,310026,'insert','blocks','{"block_hash":"d7acfac66df393c4482a14c189742c0571b89442eb7f817b34415a560445699e","block_index":310027,"block_time":310027000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(197,NULL,310027,'parse','blocks','{"block_index":310027,"ledger_hash":"dbe43e77c383acc66cb46105991ed066ed5309434016081c26ca1a7dd948b6ce","messages_hash":"c9e442648e4c4070ad2b42eb492b272dedb0fbb261625d7a1400a36c1ab469d0","txlist_hash":"df94b526dfa87413c5d4c11024019c28dd94051780c00b433b28093788b15ce0"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(198,NULL,310027,'insert','blocks','{"block_hash":"02409fcf8fa06dafcb7f11e38593181d9c42cc9d5e2ddc304d098f990bd9530b","block_index":310028,"block_time":310028000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(199,NULL,310028,'parse','blocks','{"block_index":310028,"ledger_hash":"ce1021a584895988014f16dd9f7b7b29bbe59ca8a761914f60c9290b5ec6a16f","messages_hash":"d7e783156e45f96a55b90a5d0b0986bf47ef91b509c294a3c8369df38b32828e","txlist_hash":"7d8c18a5d7ec2d6d87ef468e4ed6784e9d41b248bd3d6754bef8f6bd1df9b9f2"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(200,NULL,310028,'insert','blocks','{"block_hash":"3c739fa8b40c118d5547ea356ee8d10ee2898871907643ec02e5db9d00f03cc6","block_index":310029,"block_time":310029000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(201,NULL,310029,'parse','blocks','{"block_index":310029,"ledger_hash":"4a066ff12cf6f8dad894e23cfbb4fe6a087893b717b3f0c1ec53764b1e922bf4","messages_hash":"ac70e12d6f22150346bb4773fc6439f402a2d5ceb618856bd234d28b475d0917","txlist_hash":"0dab776748029f3a094e8c2ad8871c1771263f81cfc6de79ded15ff475239371"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(202,NULL,310029,'insert','blocks','{"block_hash":"d5071cddedf89765ee0fd58f209c1c7d669ba8ea66200a57587da8b189b9e4f5","block_index":310030,"block_time":310030000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(203,NULL,310030,'parse','blocks','{"block_index":310030,"ledger_hash":"be1cc89117e7cb3fc18eb610103d72f144c31848da4d8001c334aac577f19427","messages_hash":"047e32ff2ff5dfd5356f783809f796f8816c8d5e620d72194126a3277b814783","txlist_hash":"934400af42a6099d1279e8fc2700bfc118bc313da8383d06892521a17663ef73"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(204,NULL,310030,'insert','blocks','{"block_hash":"0b02b10f41380fff27c543ea8891ecb845bf7a003ac5c87e15932aff3bfcf689","block_index":310031,"block_time":310031000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(205,NULL,310031,'parse','blocks','{"block_index":310031,"ledger_hash":"a616b3d81a1ad1db1a9b1491b06ff6bcead9037f75552d14a4c7234b6ff56670","messages_hash":"f84fea3613d29a2ae4189da93688bf73179b5ca9ca98eed91009e003f919a931","txlist_hash":"b45534f04aeeee6c2ed877085eac7ebea9f7eacceb2026e5ab8a34ff715bc3be"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(206,NULL,310031,'insert','blocks','{"block_hash":"66346be81e6ba04544f2ae643b76c2b7b1383f038fc2636e02e49dc7ec144074","block_index":310032,"block_time":310032000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(207,NULL,310032,'update','orders','{"status":"expired","tx_hash":"cd79f155a7a8b7737cf959cdc347db22f2f38288261842997e13844a09f6f2ee"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(208,NULL,310032,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBB","block_index":310032,"calling_function":"cancel order","event":"cd79f155a7a8b7737cf959cdc347db22f2f38288261842997e13844a09f6f2ee","quantity":50000000,"tx_index":0}',0,'CREDIT');
+INSERT INTO messages VALUES(209,NULL,310032,'insert','order_expirations','{"block_index":310032,"order_hash":"cd79f155a7a8b7737cf959cdc347db22f2f38288261842997e13844a09f6f2ee","source":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3"}',0,'ORDER_EXPIRATION');
+INSERT INTO messages VALUES(210,NULL,310032,'parse','blocks','{"block_index":310032,"ledger_hash":"e7e76fe32ac5c06696c0bda815f29f1e0785a9d48641615f2ef78fa9982d258f","messages_hash":"2087d0657082953a749135ecbf8ebfc3659f774ce32c3549d0064fd0474bd7a2","txlist_hash":"b8261f9bd73b90fef96702a2e83111c3b9305e55efefae86a4078d99ce8c3d0d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(211,NULL,310032,'insert','blocks','{"block_hash":"999c65df9661f73e8c01f1da1afda09ac16788b72834f0ff5ea3d1464afb4707","block_index":310033,"block_time":310033000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(212,NULL,310033,'parse','blocks','{"block_index":310033,"ledger_hash":"f0d33d2f73f83449c18b9a7bea43857b36effa24eb248283d9356c5280e4992f","messages_hash":"fdbb2f907b3d0a7f263f6fa913d39624181ac3bb69d4abfa9f9907eacbff4109","txlist_hash":"bd3133719a6698bda726f9304fa48db5847cc475db79b879d2566da3cc7299d0"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(213,NULL,310033,'insert','blocks','{"block_hash":"f552edd2e0a648230f3668e72ddf0ddfb1e8ac0f4c190f91b89c1a8c2e357208","block_index":310034,"block_time":310034000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(214,NULL,310034,'parse','blocks','{"block_index":310034,"ledger_hash":"434d631a1c3ef7d31d136b4eab8b3044dc2b65886bf43642537cc592db0415a3","messages_hash":"c9d7c4ebbd0bf9570081d316d219a200759d9e0c820dbd96ffd08ee0ae2550cc","txlist_hash":"eea570d87d2e343bcb9b93764aa9bed952588f4b053d13e87da410b8dee27d7c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(215,NULL,310034,'insert','blocks','{"block_hash":"a13cbb016f3044207a46967a4ba1c87dab411f78c55c1179f2336653c2726ae2","block_index":310035,"block_time":310035000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(216,NULL,310035,'parse','blocks','{"block_index":310035,"ledger_hash":"5ca42816d9c6aaed19f6d25cd02e842b5d834254f90a169630544c83a129c7e5","messages_hash":"e69e7e5d53ad6f4e017b29ae535c181f961c676bf9f868c2712b00a1b23d3485","txlist_hash":"c827847c2f94718cd8c3efdf2b30cf9c8753893a76590efae0e30c61ef9a2d4a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(217,NULL,310035,'insert','blocks','{"block_hash":"158648a98f1e1bd1875584ce8449eb15a4e91a99a923bbb24c4210135cef0c76","block_index":310036,"block_time":310036000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(218,NULL,310036,'parse','blocks','{"block_index":310036,"ledger_hash":"31aecb842ea816f98aead90fed7ad005c010919a2ef2c5d7a8965b71832d3201","messages_hash":"7714fff105a6606c2e60c25256d11266c90d628e9aa6947d2fb2ed9f873835ab","txlist_hash":"5a69c5cc5e4aa7e7d071da7ecf8cff88740a707f70ddec29c57ee52b3da09127"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(219,NULL,310036,'insert','blocks','{"block_hash":"563acfd6d991ce256d5655de2e9429975c8dceeb221e76d5ec6e9e24a2c27c07","block_index":310037,"block_time":310037000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(220,NULL,310037,'parse','blocks','{"block_index":310037,"ledger_hash":"7a3167eb2c8a80c7c363ac47200ebc8cb6bd53f57da64465bec14bd86cf2c6c7","messages_hash":"6baaa9f3a19f84c31e3ae3be04bfae441a1073cee975d3e6a2dea97b94904808","txlist_hash":"8bc588a7a9286c3f5c13bc31c0faf29f155391f14ad89defebe3d0a0b21d049e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(221,NULL,310037,'insert','blocks','{"block_hash":"b44b4cad12431c32df27940e18d51f63897c7472b70950d18454edfd640490b2","block_index":310038,"block_time":310038000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(222,NULL,310038,'parse','blocks','{"block_index":310038,"ledger_hash":"212bc51956081e57aa618360926e186824dce8987948ee7706403451ab417a0a","messages_hash":"2fed45c6e0eb8befd33dfaae01c3121fbaa17a33fc8db9e7ab32f2a2c8ae970a","txlist_hash":"77861a778f50d5f8314cf4caeb6a78539702ee5b36b882713079b88143d4c6ca"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(223,NULL,310038,'insert','blocks','{"block_hash":"5fa1ae9c5e8a599247458987b006ad3a57f686df1f7cc240bf119e911b56c347","block_index":310039,"block_time":310039000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(224,NULL,310039,'parse','blocks','{"block_index":310039,"ledger_hash":"03e72d7551164403b41956638a0fdec8703c29373ea2b15c770717b0ec39fa95","messages_hash":"f85797a2335bfe5bb7fe18328e1e199a2c576284b6cbc402b1089c18e7c19319","txlist_hash":"b445575b555d0621a37fc3f9f22c113126ea35507703f8885294cb2a4613a6c7"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(225,NULL,310039,'insert','blocks','{"block_hash":"7200ded406675453eadddfbb2d14c2a4526c7dc2b5de14bd48b29243df5e1aa3","block_index":310040,"block_time":310040000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(226,NULL,310040,'parse','blocks','{"block_index":310040,"ledger_hash":"922aa744aa0c08274d1f47a0f80638c7937ecaaf95555e68ceec09449e60d080","messages_hash":"976d3bb7ff94f02bde2563b09209c79d775221e6c6b2031b1c202771b499b773","txlist_hash":"d46179d869f330c786bb81e0c122952d33b264f3af2b4a70627764332cce3fb7"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(227,NULL,310040,'insert','blocks','{"block_hash":"5db592ff9ba5fac1e030cf22d6c13b70d330ba397f415340086ee7357143b359","block_index":310041,"block_time":310041000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(228,NULL,310041,'parse','blocks','{"block_index":310041,"ledger_hash":"de422fc7f3f11d20b697e0ee57afe101ddeb5e84105153a3bb10f97f9c3f1783","messages_hash":"46b89e475c74e426ff35955880806d687cca7f89f6237980a9b2fb481790947f","txlist_hash":"d0cef146e488d50917e659d8c039e7304a41d239d2330947d81e49d3bc7aa723"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(229,NULL,310041,'insert','blocks','{"block_hash":"826fd4701ef2824e9559b069517cd3cb990aff6a4690830f78fc845ab77fa3e4","block_index":310042,"block_time":310042000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(230,NULL,310042,'parse','blocks','{"block_index":310042,"ledger_hash":"82d7c9a0c9d63c3f93b125a9eabc2a7b5f560eccc5fb578d71ec071f150c8fac","messages_hash":"6beccf09f1d28e3b1e210b39e233b2550bc5084e26240329d1a51907745a9ddc","txlist_hash":"68777d56b0179c05517b00df97200e16079b34c54a270d598c28caa4f39ea43b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(231,NULL,310042,'insert','blocks','{"block_hash":"2254a12ada208f1dd57bc17547ecaf3c44720323c47bc7d4b1262477cb7f3c51","block_index":310043,"block_time":310043000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(232,NULL,310043,'parse','blocks','{"block_index":310043,"ledger_hash":"c9232d9cfb183cc9bc09bef78f7c83bac3d9af803e6916c9b14063c4f619d9e6","messages_hash":"bdaa43efd672607af77b4b40f439f6aeaed1085617186e1acd6801bb61f3c0f9","txlist_hash":"728975e1d9ed1caeeef47b1b8f1040c3d1ede182cc47282f32f2f464071057b2"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(233,NULL,310043,'insert','blocks','{"block_hash":"3346d24118d8af0b3c6bcc42f8b85792e7a2e7036ebf6e4c25f4f6723c78e46b","block_index":310044,"block_time":310044000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(234,NULL,310044,'parse','blocks','{"block_index":310044,"ledger_hash":"71c3e7aa2ad71e35b752dd4e48381b4ca845c370e5c340f2a221dde808966a45","messages_hash":"66199cebdbc88c927c1f33af517c8f679cd75a9c1d3179e75230b43ca181e447","txlist_hash":"56e52a1e4cd4954442f83c421e7b8c653e38cd7725d6b140a47e74f57df2c169"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(235,NULL,310044,'insert','blocks','{"block_hash":"7bba0ab243839e91ad1a45a762bf074011f8a9883074d68203c6d1b46fffde98","block_index":310045,"block_time":310045000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(236,NULL,310045,'parse','blocks','{"block_index":310045,"ledger_hash":"47230be2ba96e7adb6088b18788b52a65aa48183c2c00095b79999f5ea1af514","messages_hash":"e2e6623c734a0f965d3897a10844b64d4edf09be17ea873645a6f11f736e9123","txlist_hash":"e8b8a81eeb5c9a9fa6f19f6d9617c7c8e1d19368725d223ef270b74b09b1a541"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(237,NULL,310045,'insert','blocks','{"block_hash":"47db6788c38f2d6d712764979e41346b55e78cbb4969e0ef5c4336faf18993a6","block_index":310046,"block_time":310046000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(238,NULL,310046,'parse','blocks','{"block_index":310046,"ledger_hash":"2c306c41049fba2e58a07b5d14f930bcaa465b2afa4df24d8a887958555f0c57","messages_hash":"a4f142388df842e3f7638bba46fa8451424281206af0a37977a5489d032cb40b","txlist_hash":"3ed01193d67e5b016184cd322ca01829a616ad7f7c98bdc034c642ab5c37938d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(239,NULL,310046,'insert','blocks','{"block_hash":"a9ccabcc2a098a7d25e4ab8bda7c4e66807eefa42e29890dcd88149a10de7075","block_index":310047,"block_time":310047000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(240,NULL,310047,'parse','blocks','{"block_index":310047,"ledger_hash":"95a6325dcb8b9f7aef9da35bd20a46addef23aa5c36795beccacf992bee88d28","messages_hash":"0f056aff130424174dc02d66a0359b0ac135228727e1235bcfdc8c8de90ec17c","txlist_hash":"730fe6316784de4a36e2530b3935fbbd2e1bb9c876c61d0cc436f86a103d6655"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(241,NULL,310047,'insert','blocks','{"block_hash":"610bf3935a85b05a98556c55493c6de45bed4d7b3b6c8553a984718765796309","block_index":310048,"block_time":310048000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(242,NULL,310048,'parse','blocks','{"block_index":310048,"ledger_hash":"8811d6a6b22ff3e0ecf399dd20a28a17ad000e99b17f90e63e02230ed42cf260","messages_hash":"ebe06e76bbe19b578653b19bc7dbeb78c4b133028ed77cd51e7f5f366a53bf94","txlist_hash":"a1772d6d909c4fd092a9e511c2f0425480f61c1f2a3d513d973a15e587c47a51"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(243,NULL,310048,'insert','blocks','{"block_hash":"4ad2761923ad49ad2b283b640f1832522a2a5d6964486b21591b71df6b33be3c","block_index":310049,"block_time":310049000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(244,NULL,310049,'parse','blocks','{"block_index":310049,"ledger_hash":"4bffe3d3071cee255f64108bd8b97652f06190cb73caac5bdc4ef61d3ff9ecd6","messages_hash":"cdddfdb873c4834f4250cda22831636cab7c724f678da6216fd559b80a0e7ff7","txlist_hash":"af66fd2b113c2349077f00be46a1cd5629b2ec39576ae16ec004249438781905"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(245,NULL,310049,'insert','blocks','{"block_hash":"8cfeb60a14a4cec6e9be13d699694d49007d82a31065a17890383e262071e348","block_index":310050,"block_time":310050000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(246,NULL,310050,'parse','blocks','{"block_index":310050,"ledger_hash":"b00d5001e914fde448457f3b373637385114eeb07d79751241f4c1f50cadc050","messages_hash":"82992ff8a610ee881b81bd88a5d4a86e5010062bb0faf06cae1eefe2c6769249","txlist_hash":"64149e5936bce967da53b587f07492b64472145ac66f58c1773a4df324ced96d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(247,NULL,310050,'insert','blocks','{"block_hash":"b53c90385dd808306601350920c6af4beb717518493fd23b5c730eea078f33e6","block_index":310051,"block_time":310051000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(248,NULL,310051,'parse','blocks','{"block_index":310051,"ledger_hash":"90dd8fabe43314ac6ab6f5485275a4b1131c232a1e9d92395fc030659873edb8","messages_hash":"8dd7a3b1ee68d435cf5931e578e166e91e9961350db22909b6af5fefd5c4442f","txlist_hash":"71f3161707a90feeb8b8e3340f47a9102c344b652ff70760aaa1f7b3bb30a14f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(249,NULL,310051,'insert','blocks','{"block_hash":"0acdacf4e4b6fca756479cb055191b367b1fa433aa558956f5f08fa5b7b394e2","block_index":310052,"block_time":310052000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(250,NULL,310052,'parse','blocks','{"block_index":310052,"ledger_hash":"923848bdc7906ab89898021e05e201f69305087b12803c459f066f2d681fe9b5","messages_hash":"3698853c8fd4827d29eea3f3c530f1529fa5f17dd33dffaa19be81d9f30511a6","txlist_hash":"de443d5cc1b054f4cff96f616b234d91b0b5e3712e6d72e64d564c201b7cd757"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(251,NULL,310052,'insert','blocks','{"block_hash":"68348f01b6dc49b2cb30fe92ac43e527aa90d859093d3bf7cd695c64d2ef744f","block_index":310053,"block_time":310053000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(252,NULL,310053,'parse','blocks','{"block_index":310053,"ledger_hash":"e5ecdf8c0a2166fa8fe25adea0d374d34131d29a3c901868fec579eb20a5a930","messages_hash":"dd245b141ff920a732dda71cbc156cbcd1047a88e56724aa897e88f63a1f0af1","txlist_hash":"05b8fe3b76416a506aed1b000e3649af38e59adf26cf0d168c5e84112641ea6c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(253,NULL,310053,'insert','blocks','{"block_hash":"a8b5f253df293037e49b998675620d5477445c51d5ec66596e023282bb9cd305","block_index":310054,"block_time":310054000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(254,NULL,310054,'parse','blocks','{"block_index":310054,"ledger_hash":"03cd75c14bbe11800f4d436dce93235787e2521a19b1d5a90796a5de369680d1","messages_hash":"17cdd1a908040ea3a4f92093afe9b9bdab12daea6436a6c00994b04481ed082d","txlist_hash":"d8edec966eae31778588f68b7343dbdb4bf878b30cb430246b04ebebdd9e43b9"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(255,NULL,310054,'insert','blocks','{"block_hash":"4b069152e2dc82e96ed8a3c3547c162e8c3aceeb2a4ac07972f8321a535b9356","block_index":310055,"block_time":310055000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(256,NULL,310055,'parse','blocks','{"block_index":310055,"ledger_hash":"7239560704ca831dfe90791f1cd21ae1f1506275cf6b45933676be9b096d340b","messages_hash":"7741ea70459b2a66f6dd9e80dece0be8e2c70d9bf2f4a35a7e25209afc693168","txlist_hash":"1294057c4f21c98f97d10d96510ce83d0e8d348d138b3caa2c76ef1be47a3c2a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(257,NULL,310055,'insert','blocks','{"block_hash":"7603eaed418971b745256742f9d2ba70b2c2b2f69f61de6cc70e61ce0336f9d3","block_index":310056,"block_time":310056000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(258,NULL,310056,'parse','blocks','{"block_index":310056,"ledger_hash":"3aa4ef8714cbb71c4f0b052dc7ec7795322103ba7b8361db3f33303f564f3815","messages_hash":"67c95d8fcaf9ce3998af05392f9a5068937a7f7e2db782fd8398f91d9a8401b9","txlist_hash":"211d0e47a87100167138974db02ac1299bf1b2a1d7b60606b19cecf2f06df0fd"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(259,NULL,310056,'insert','blocks','{"block_hash":"4a5fdc84f2d66ecb6ee3e3646aad20751ce8694e64e348d3c8aab09d33a3e411","block_index":310057,"block_time":310057000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(260,NULL,310057,'parse','blocks','{"block_index":310057,"ledger_hash":"fee33c0a466c580887106b4bb7a8c6aeb7a049c94987bae64f695ae400c4a4a1","messages_hash":"b669486dbace095d0a4d0c2c526e18b2f10e79c415589a782f79734e9b11fef0","txlist_hash":"f851a0d0a25322d5939a5cd2cafc831b6282af5ab81932553cb80ff3825b4a2d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(261,NULL,310057,'insert','blocks','{"block_hash":"a6eef3089896f0cae0bfe9423392e45c48f4efe4310b14d8cfbdb1fea613635f","block_index":310058,"block_time":310058000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(262,NULL,310058,'parse','blocks','{"block_index":310058,"ledger_hash":"94d58bd9a65a2e13c7ea2373e521952e916b0e1d31d803eced96e5c8903aa625","messages_hash":"e7600207187bfd393eb1cbab52e554db20953b3c0e7677735776cd0c8e6fa1b5","txlist_hash":"e959bddf887904cd324ff7bf5fb60380f2c4a7c2b1b4215c63715a59ad297200"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(263,NULL,310058,'insert','blocks','{"block_hash":"ab505de874c43f97c90be1c26a769e6c5cb140405c993b4a6cc7afc795f156a9","block_index":310059,"block_time":310059000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(264,NULL,310059,'parse','blocks','{"block_index":310059,"ledger_hash":"e9c87b2a652d4ef3d48ac74424f57d06dd85893fd542e0784df067c37396b0df","messages_hash":"1d1f6ff471aa4e5771d0d8f5527a283f946485ffab1ca06addec37f8c3df6039","txlist_hash":"ec205004b519cbbc750bcae821effee41789b3f643f90148e8db2d9d9f83ed49"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(265,NULL,310059,'insert','blocks','{"block_hash":"974ad5fbef621e0a38eab811608dc9afaf10c8ecc85fed913075ba1a145e889b","block_index":310060,"block_time":310060000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(266,NULL,310060,'parse','blocks','{"block_index":310060,"ledger_hash":"b664a0985edab20768aec36096a7b2faa159cef4af7e779ad421942137ee317a","messages_hash":"1da3366346658554be885ca7896d80736ed13f520e7848030de9ebc9acfdc199","txlist_hash":"dec86d178abd72944cda84a3154303e16eaf39e5bd5bd59a80cca27a5ed5887e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(267,NULL,310060,'insert','blocks','{"block_hash":"35d267d21ad386e7b7632292af1c422b0310dde7ca49a82f9577525a29c138cf","block_index":310061,"block_time":310061000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(268,NULL,310061,'parse','blocks','{"block_index":310061,"ledger_hash":"5ffa5e1f36c5539b2f5a89a6a60d45ec6372ced770d9b0e0e8dfd61edad84c22","messages_hash":"b31533d94983095966b5f0ac4d0ba3996f7bf8263ccddd8e42aef7356bec55ae","txlist_hash":"be052ccd372d556b9b28d0d2b6f9dbfc9b32ff173b71d7842fb6008047a67384"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(269,NULL,310061,'insert','blocks','{"block_hash":"b31a0054145319ef9de8c1cb19df5bcf4dc8a1ece20053aa494e5d3a00a2852f","block_index":310062,"block_time":310062000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(270,NULL,310062,'parse','blocks','{"block_index":310062,"ledger_hash":"fc6f9f23c3b8954c7989b0e4ce40087b66dceabc7c0e407ac7f4b397fe2a1281","messages_hash":"657e25d6ed0c9c9eb39155ba6f1e9d205a57ab7015d18a13905df2b3657ce3c3","txlist_hash":"1495ca8eeb434877ce36335268a349709e99811e93f416ccf1f0c98114731824"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(271,NULL,310062,'insert','blocks','{"block_hash":"0cbcbcd5b7f2dc288e3a34eab3d4212463a5a56e886804fb4f9f1cf929eadebe","block_index":310063,"block_time":310063000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(272,NULL,310063,'parse','blocks','{"block_index":310063,"ledger_hash":"cc6c3b8cf2c457b2f6afb5b208f968544767be8b86ca53bdab4224619a03121d","messages_hash":"3f132fc4d63edafb5eb644dd47aaa2af32fedf3a15c206deedcc1d3dc47549b2","txlist_hash":"93d193df39b7340b932b5abd85a027df086e033ff2b18fd8c9d0d03cd6db392f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(273,NULL,310063,'insert','blocks','{"block_hash":"e2db8065a195e85cde9ddb868a17d39893a60fb2b1255aa5f0c88729de7cbf30","block_index":310064,"block_time":310064000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(274,NULL,310064,'parse','blocks','{"block_index":310064,"ledger_hash":"cc57ac6aec118ebfb03f5113ad1af749522e60ef4ca201d48bd43478cc0a29e4","messages_hash":"22e4ad71319ebf70101939828e606ddd7381dadd77c8fe5ab718ddba78feded7","txlist_hash":"064c03f24da9de841de9f492487de4077b842d6de92366d3fe7ff37d558998c1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(275,NULL,310064,'insert','blocks','{"block_hash":"8a7bc7a77c831ac4fd11b8a9d22d1b6a0661b07cef05c2e600c7fb683b861d2a","block_index":310065,"block_time":310065000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(276,NULL,310065,'parse','blocks','{"block_index":310065,"ledger_hash":"9999be70079c0943f0a00c54236680bafe0c87dd3bb75c982211f751e7ecdcae","messages_hash":"cbd70e755299ba20e886f6aad7674e4a0784b8507c9a15a64fb1403164d6cc51","txlist_hash":"f1196c84f3767cea82b4dfb6a5e4be30f3ed3f53e9b9cefdadf81af9f2b2bd49"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(277,NULL,310065,'insert','blocks','{"block_hash":"b6959be51eb084747d301f7ccaf9e75f2292c9404633b1532e3692659939430d","block_index":310066,"block_time":310066000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(278,NULL,310066,'parse','blocks','{"block_index":310066,"ledger_hash":"efb2fcb7b5628bb99994bc1ada157bf80b4516d961497aa011c06da1523801d7","messages_hash":"7ed9c6fe414c01dddd55faa66d5934f375f8eef87637bfc2c626ba44eb67968f","txlist_hash":"ba6d273c442538389e43b3ad47795d7e61d9b17427d1a1044333f96cafe575c4"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(279,NULL,310066,'insert','blocks','{"block_hash":"8b08eae98d7193c9c01863fac6effb9162bda010daeacf9e0347112f233b8577","block_index":310067,"block_time":310067000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(280,NULL,310067,'parse','blocks','{"block_index":310067,"ledger_hash":"fb396fca9af7816f97b22b8bf1b01951e271a75f1a640dfc64955696dc1c0b7d","messages_hash":"5537534fb9d0145545b419b9d01d124fb4021e9a7144eee21c74e633fc995daa","txlist_hash":"20ebf686e5c5a50c0df23ee15488559024622039aa4fa47f1b07dc3967bbc760"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(281,NULL,310067,'insert','blocks','{"block_hash":"9280e7297ef6313341bc81787a36acfc9af58f83a415afff5e3154f126cf52b5","block_index":310068,"block_time":310068000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(282,NULL,310068,'parse','blocks','{"block_index":310068,"ledger_hash":"6cbc681ed90e676cc507d07120888bd4c8759873a0b9215f721a0ce707070086","messages_hash":"f758fe286e0973f30be7c0d6afaa7c7cc2ffa3f5dbb73dc91ee326cc2d3b0070","txlist_hash":"d8c09411f0c7fd43774558fd6cc9884b032cfdcca63a08845b61293ff52ef380"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(283,NULL,310068,'insert','blocks','{"block_hash":"486351f0655bf594ffaab1980cff17353b640b63e9c27239109addece189a6f7","block_index":310069,"block_time":310069000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(284,NULL,310069,'parse','blocks','{"block_index":310069,"ledger_hash":"7cb734eb3e24e92de8915a6bea42b6ef721251c481ac9ec751cdbdc08e110011","messages_hash":"65a2965d49d850b583ec0574c58c5d1a7bbc3e5c789f143b4505aed318ba88af","txlist_hash":"4f02ef18a644ac564db930818e845496ab0ea3caa34ff70878f0f9f0ef6641e9"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(285,NULL,310069,'insert','blocks','{"block_hash":"8739e99f4dee8bebf1332f37f49a125348b40b93b74fe35579dd52bfba4fa7e5","block_index":310070,"block_time":310070000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(286,NULL,310070,'parse','blocks','{"block_index":310070,"ledger_hash":"7b57a4d1ce0995a938e174e52a096cc9829a0ddd59f698ed04d8b43371a78126","messages_hash":"d65f12404b216e72ad6ae61b04e69c9f4ca01e2f3fdb4f504e0225ac54736ea5","txlist_hash":"7716368643d8c6d26932d9efabb6fd6e574c1b13b8f149363ec4b99d9f405435"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(287,NULL,310070,'insert','blocks','{"block_hash":"7a099aa1bba0ead577f1e44f35263a1f115ed6a868c98d4dd71609072ae7f80b","block_index":310071,"block_time":310071000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(288,NULL,310071,'parse','blocks','{"block_index":310071,"ledger_hash":"f46f820a64ced97ccf68a56c048459de0b2855ecd4299e447c4b630913ce1749","messages_hash":"5ab53570219fc9bb359c607e25599669bb1595309f563491e3f66bfa31d1f984","txlist_hash":"71375966f9a524c1df04c5033ebb17e4293053f3ecb8e724a2f093b3373641b6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(289,NULL,310071,'insert','blocks','{"block_hash":"7b17ecedc07552551b8129e068ae67cb176ca766ea3f6df74b597a94e3a7fc8a","block_index":310072,"block_time":310072000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(290,NULL,310072,'parse','blocks','{"block_index":310072,"ledger_hash":"878239189ae0afa759af5e59db8a17fd17c0c9a2c017384fd2d0ca789e738050","messages_hash":"0552a8f121d1ab0e74a11098bee498faa3e6ca29ed768c5477060ab17ef7909c","txlist_hash":"4ead629f99d32f3d0ef6c5f7ad1bbffa91608d71b815293128461a9b5850ad15"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(291,NULL,310072,'insert','blocks','{"block_hash":"ee0fe3cc9b3a48a2746b6090b63b442b97ea6055d48edcf4b2288396764c6943","block_index":310073,"block_time":310073000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(292,NULL,310073,'parse','blocks','{"block_index":310073,"ledger_hash":"d2d86823f727bc075138653a682373a9c76d21d48b5881968adb66042b501e53","messages_hash":"1bfdd70a8a1e5b2bd0e98a38a1d8583b65de45bcfb19b22e88c1c240d45d5116","txlist_hash":"3958da4cebd7670ab3e197b6ff8b5a770dc756dccc1806bdd050513e75e9e33c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(293,NULL,310073,'insert','blocks','{"block_hash":"ceab38dfde01f711a187601731ad575d67cfe0b7dbc61dcd4f15baaef72089fb","block_index":310074,"block_time":310074000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(294,NULL,310074,'parse','blocks','{"block_index":310074,"ledger_hash":"9fd098fcc7d71c0c46fc741ea278de92589c44a6efc4980ced53843193553ea8","messages_hash":"a453a4c531be98d82b30875224f99b77ed74bb8b5433a46773ed9086c78ad820","txlist_hash":"f5b2e274c8dda92ac634490b28d13b18d7aeb22fd1a5101c805d3f4265422a7c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(295,NULL,310074,'insert','blocks','{"block_hash":"ef547198c6e36d829f117cfd7077ccde45158e3c545152225fa24dba7a26847b","block_index":310075,"block_time":310075000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(296,NULL,310075,'parse','blocks','{"block_index":310075,"ledger_hash":"f1ad21f9b4134bc0225c26fb8969af3565c07997197a7ed9636c01f187f07042","messages_hash":"ee8a0a5a6e43392e0e1a898383cc016e65ea48728faecfd48ac2216769d3ab4d","txlist_hash":"3711ef31e2cc58fe1a9cbcf0a5bfdac9a805f346137b923fd86c65f850b35eae"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(297,NULL,310075,'insert','blocks','{"block_hash":"3b0499c2e8e8f0252c7288d4ecf66efc426ca37aad3524424d14c8bc6f8b0d92","block_index":310076,"block_time":310076000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(298,NULL,310076,'parse','blocks','{"block_index":310076,"ledger_hash":"9a1f3de6b5a255720973fb0c93ae2bc8fe8936565140b8ae991b9d83f86a0002","messages_hash":"813aee3a02a6e3051aee0bcc3f1559a1ef525876773365702d8cfb623b76104a","txlist_hash":"8e73f7f52266820ca7f25665628e31afc6a5e3dcbbf51bc1bc8635440ecdf669"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(299,NULL,310076,'insert','blocks','{"block_hash":"d2adeefa9024ab3ff2822bc36acf19b6c647cea118cf15b86c6bc00c3322e7dd","block_index":310077,"block_time":310077000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(300,NULL,310077,'parse','blocks','{"block_index":310077,"ledger_hash":"ab56d9f59575b2d8ecc4933bbfa1fb0cb81c7a6fe84c1ba81bdee40c3da13164","messages_hash":"857718a08a7c24695301eea96ac485c69d7d8528ebd7144526877144727a1930","txlist_hash":"2720a0a338a84ae1b56086f0d4f1b341eb5e3b46e9290887d7675800c6872081"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(301,NULL,310077,'insert','blocks','{"block_hash":"f6c17115ef0efe489c562bcda4615892b4d4b39db0c9791fe193d4922bd82cd6","block_index":310078,"block_time":310078000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(302,NULL,310078,'parse','blocks','{"block_index":310078,"ledger_hash":"8399d461b5079a145c716f8f6004d2f7870fe93786bd944fa36ef27134c9517c","messages_hash":"cde0bd558daabf0cbede387365e4a018d490754a10047d177cae43a0f4b45d12","txlist_hash":"18ee24262532a6a1e49086f1a8ea0161a5c1ae80ce2230f1b76ce782f6aff39a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(303,NULL,310078,'insert','blocks','{"block_hash":"f2fbd2074d804e631db44cb0fb2e1db3fdc367e439c21ffc40d73104c4d7069c","block_index":310079,"block_time":310079000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(304,NULL,310079,'parse','blocks','{"block_index":310079,"ledger_hash":"b6696a1511704128bbd5ec2c80a1d7d8d3bda6b959f1a674537ace152cb7f8bc","messages_hash":"e1727b554699bff7dbb8b8e04c1703b9dd8baec7d0adbbe19ed29c13063feacf","txlist_hash":"e839a4222aad212860b0698214f3d426d065226d1e7983e6620325a583b28abb"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(305,NULL,310079,'insert','blocks','{"block_hash":"42943b914d9c367000a78b78a544cc4b84b1df838aadde33fe730964a89a3a6c","block_index":310080,"block_time":310080000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(306,NULL,310080,'parse','blocks','{"block_index":310080,"ledger_hash":"9aea0f996c36a815e4103b86ee7fc9be784d7c72549e54d04d84cf7fb8adfb78","messages_hash":"417fc14121a6d8f20288b10640991263f4237e0dad8bcd9bfaa3e13bbca4851c","txlist_hash":"fca6c96a2d6bbe118c5418a3e2b85dced8cfc0da2a8b46fef65f49e81a459efc"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(307,NULL,310080,'insert','blocks','{"block_hash":"6554f9d307976249e7b7e260e08046b3b55d318f8b6af627fed5be3063f123c4","block_index":310081,"block_time":310081000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(308,NULL,310081,'parse','blocks','{"block_index":310081,"ledger_hash":"7571b554c5600796b60982bb6df3517eed517a2a3627f8383b92a073cc4a5872","messages_hash":"8b39440aeec8b1f4a945ab49608e3f9c8d439ccdb5a42d9e60d5ac4e719f8297","txlist_hash":"a168e4a6c3de65e68532d534107bc3033588b2b0d67ae2f5d23b1ffac1a21ca8"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(309,NULL,310081,'insert','blocks','{"block_hash":"4f1ef91b1dcd575f8ac2e66a67715500cbca154bd6f3b8148bb7015a6aa6c644","block_index":310082,"block_time":310082000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(310,NULL,310082,'parse','blocks','{"block_index":310082,"ledger_hash":"b2507a73ff4f6998582daac667c457308ba78744e3d1d7533c0232092e3eab1f","messages_hash":"c40fd8a8ad93626d3df0814b83e6e53fc1ac7e1b56d56c64597931b14dd3ad75","txlist_hash":"379aebcf4d32a0480f5d334f5c04629b6ace33bdc5f138907c338eab7b1d9093"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(311,NULL,310082,'insert','blocks','{"block_hash":"9b1f6fd6ff9b0dc4e37603cfb0625f49067c775b99e12492afd85392d3c8d850","block_index":310083,"block_time":310083000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(312,NULL,310083,'parse','blocks','{"block_index":310083,"ledger_hash":"18566f22ffb9bc5f98712ef3234f8da84f8f3e382007b23c3bb8e6c910043746","messages_hash":"3cb151083aad730810ba5c58d41d621145473366f7b8c502a742583e5fdecdb8","txlist_hash":"b238ccb2ac0b6329a0fc30267fd29e4813bfc786ad871de90c1797c6c72e65bb"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(313,NULL,310083,'insert','blocks','{"block_hash":"1e0972523e80306441b9f4157f171716199f1428db2e818a7f7817ccdc8859e3","block_index":310084,"block_time":310084000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(314,NULL,310084,'parse','blocks','{"block_index":310084,"ledger_hash":"72c44bddd5b54657623692e444bf893ca7b6d8da992c274bcbaa37c6db903825","messages_hash":"943656932a28a98619d4de3abdd3e84004dc58ede68152286af3ce6209e12afa","txlist_hash":"2736ff0669b8c3cfb5b4ad8f082e23d985cbf0c4ba9990175febf1c02882bdf9"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(315,NULL,310084,'insert','blocks','{"block_hash":"c5b6e9581831e3bc5848cd7630c499bca26d9ece5156d36579bdb72d54817e34","block_index":310085,"block_time":310085000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(316,NULL,310085,'parse','blocks','{"block_index":310085,"ledger_hash":"1ddc441adb4b262862caf5b811b2375bd376d9b5d7b8ee251c4337478833cde9","messages_hash":"d970401c49e0b45d95031cbd740826688efbe7440f776fe4ae5fbd8f5a2d0eae","txlist_hash":"3407db619adaf80236c8319a7e9283c10a43a7b1717d4d89115ac90e8f52b706"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(317,NULL,310085,'insert','blocks','{"block_hash":"080c1dc55a4ecf4824cf9840602498cfc35b5f84099f50b71b45cb63834c7a78","block_index":310086,"block_time":310086000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(318,NULL,310086,'parse','blocks','{"block_index":310086,"ledger_hash":"b59447846d380cb8d32639ca13e6e396b68b18483f70b6380296bff65dced3d2","messages_hash":"e22966531dedb141d7f6e4a5aabfd82382ed9fcfe6caf8991a17fafb7afc5997","txlist_hash":"e02f456fb1e9b6de38bb9923f6f68973d592ffa04f65731c66dae734e4fd1d44"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(319,NULL,310086,'insert','blocks','{"block_hash":"4ec8cb1c38b22904e8087a034a6406b896eff4dd28e7620601c6bddf82e2738c","block_index":310087,"block_time":310087000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(320,NULL,310087,'parse','blocks','{"block_index":310087,"ledger_hash":"54a1c32d20665e7ff92ea43451ff2e59a98136ad7da576fa6b2614dda700b707","messages_hash":"8cb58a3a69cd2881516a1073e0e6f8c8a6ca7624c1ba03327f39865006054482","txlist_hash":"5177e82a6aa417664930ecdb0495e108b3fb660ff08a608fa540a29b0c4c2650"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(321,NULL,310087,'insert','blocks','{"block_hash":"e945c815c433cbddd0bf8e66c5c23b51072483492acda98f5c2c201020a8c5b3","block_index":310088,"block_time":310088000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(322,NULL,310088,'parse','blocks','{"block_index":310088,"ledger_hash":"f0bef715c366843e002c75992b8d50d82a3ea54f144350f158e862eb03cb45dd","messages_hash":"a61bd68a25b8460c5a8b915a33898526dcd728017a7f651b70b597cfb11bb1d8","txlist_hash":"84abe1e98b75d07291ef4b9847c336f787fdcc74f9a2570d23cb8ce396c9104a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(323,NULL,310088,'insert','blocks','{"block_hash":"0382437f895ef3e7e38bf025fd4f606fd44d4bbd6aea71dbdc4ed11a7cd46f33","block_index":310089,"block_time":310089000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(324,NULL,310089,'parse','blocks','{"block_index":310089,"ledger_hash":"0a4ce98b783b97f81fff9ab73d7a7091087e8511ebb425c81ccf60c3f9edbfd6","messages_hash":"e8454aef34c815ad01cd9016c6c3fb983bf301e63273a36fc802d26b929b7969","txlist_hash":"ca0f3a6b9b2eafb864eb324359d4ad9dd85361a7c7d2833ba6bfd230d0e60773"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(325,NULL,310089,'insert','blocks','{"block_hash":"b756db71dc037b5a4582de354a3347371267d31ebda453e152f0a13bb2fae969","block_index":310090,"block_time":310090000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(326,NULL,310090,'parse','blocks','{"block_index":310090,"ledger_hash":"f3b6781eebab3a6928791cf281d4ae7cb4f7fb59c6ae7575eba253e6ec6e447b","messages_hash":"5b1b966a74a430ee625b0e0d381a963a41ea1d427840a109b95929a4c7061f0d","txlist_hash":"283080af19ccbde44c6e268326ddde17fc850d7ca1add3698adb3e606cd984e4"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(327,NULL,310090,'insert','blocks','{"block_hash":"734a9aa485f36399d5efb74f3b9c47f8b5f6fd68c9967f134b14cfe7e2d7583c","block_index":310091,"block_time":310091000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(328,NULL,310091,'parse','blocks','{"block_index":310091,"ledger_hash":"14261b6b340632c469847700cee16c0163a7f8cad4dac7ad4555efeb5f3235fb","messages_hash":"d429ca517a7f8c46db00cbb4da11040e4735d0c0aced4f21f1493b44cd679e1f","txlist_hash":"744bcdbcd8d44066eb9528c6fa39109148ea557d3cc3bdb88a818b9f9a9dcb25"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(329,NULL,310091,'insert','blocks','{"block_hash":"56386beb65f9228740d4ad43a1c575645f6daf59e0dd9f22551c59215b5e8c3d","block_index":310092,"block_time":310092000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(330,NULL,310092,'parse','blocks','{"block_index":310092,"ledger_hash":"3c033a502e1890e8a3c697e354cd1769e4300ce7f62ee7ac47a7201e1ad5de2c","messages_hash":"099e7a26e5dca406cf008eae37302e3e0c7c1797c55362c98b4a3743edad2b40","txlist_hash":"c424d1724a85f76a855b4dc834c8b599f764b5095b0649448a0fa2aef1e41d31"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(331,NULL,310092,'insert','blocks','{"block_hash":"a74a2425f2f4be24bb5f715173e6756649e1cbf1b064aeb1ef60e0b94b418ddc","block_index":310093,"block_time":310093000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(332,NULL,310093,'parse','blocks','{"block_index":310093,"ledger_hash":"acc1dc4b7ec10c0989af833b57640be486035d76f74b57a50b023fb60f418be2","messages_hash":"e7704dd7f3358c09a87dff920ee932c695e7f0b530239518d50b20b10470141f","txlist_hash":"dde73fa3b80a8e2d1cb8aa692dd62ad712549fdceebf4083965cb36f692d45d9"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(333,NULL,310093,'insert','blocks','{"block_hash":"2a8f976f20c4e89ff01071915ac96ee35192d54df3a246bf61fd4a0cccfb5b23","block_index":310094,"block_time":310094000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(334,NULL,310094,'parse','blocks','{"block_index":310094,"ledger_hash":"1443d97efeeb04291e117b152f1e18537035a59c80fabb574577cb3e66e5db59","messages_hash":"acc5a7b3c965552eec18f13d55d796897254c9ae4f6b76b304c53560a5f4cc85","txlist_hash":"a52c247beb178317cdd18532927c8281abe3af9914c676cf250084d4b1e96762"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(335,NULL,310094,'insert','blocks','{"block_hash":"bed0fa40c9981223fb40b3be8124ca619edc9dd34d0c907369477ea92e5d2cd2","block_index":310095,"block_time":310095000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(336,NULL,310095,'parse','blocks','{"block_index":310095,"ledger_hash":"1c74208da191b965f52006e577c3f4df30f29b36b1d137ab457bbfe30737285d","messages_hash":"96f02682a3030b2befc1d70760002100282215a301eb5aee1cb07c9162843e0d","txlist_hash":"693d04e9be7d9de1aee3cfe832c6d913213bbf44b0f04a5b394e1aceb77b7b49"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(337,NULL,310095,'insert','blocks','{"block_hash":"306aeec3db435fabffdf88c2f26ee83caa4c2426375a33daa2be041dbd27ea2f","block_index":310096,"block_time":310096000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(338,NULL,310096,'parse','blocks','{"block_index":310096,"ledger_hash":"662e1b232c5afeba4df756a31d7b63f7f33dbb4aa752abbea9f0b57f1c7c4295","messages_hash":"457f56e032453d64457be80fad88d46e8d4325df25b621c6aea936b6b3636669","txlist_hash":"bce25b4036b54089a064c1fd781923787126977938ff3c206f0a8d76ddf52489"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(339,NULL,310096,'insert','blocks','{"block_hash":"13e8e16e67c7cdcc80d477491e554b43744f90e8e1a9728439a11fab42cefadf","block_index":310097,"block_time":310097000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(340,NULL,310097,'parse','blocks','{"block_index":310097,"ledger_hash":"8a1b60657764a35ce95c9e215600f63f0fc8c4933c682ea017553010743c97a2","messages_hash":"64e00821dde4646cad059921826a3014f892cafa2f978b8baee1ed96e4a00409","txlist_hash":"0d0259b0c4755aba3d725283f1773bdd766a0ae009f2b94be00a5589b61ef8f5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(341,NULL,310097,'insert','blocks','{"block_hash":"ca5bca4b5ec4fa6183e05176abe921cff884c4e20910fab55b603cef48dc3bca","block_index":310098,"block_time":310098000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(342,NULL,310098,'parse','blocks','{"block_index":310098,"ledger_hash":"c2e25d20f3c50a67a4268d9aa3e386c92e5217cf8f106d2affaae19e49b48828","messages_hash":"da90a92d7a7cc0e24781d15093a3fbb9df9720571e36eb5032240ecb805f01ba","txlist_hash":"32c25e6b70ffe5ea4582a7fd8bf8c892d4fe0afb247e3aca79686e5b5ce9e430"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(343,NULL,310098,'insert','blocks','{"block_hash":"3c4c2279cd7de0add5ec469648a845875495a7d54ebfb5b012dcc5a197b7992a","block_index":310099,"block_time":310099000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(344,NULL,310099,'parse','blocks','{"block_index":310099,"ledger_hash":"bd7479caeb388072138c99d19624e495200df1bf02f47caf0ae8a5007fd9dfce","messages_hash":"41e980e29574743be776872e4c380ce99c1c84f48f8eeb4ddcfb2cb24207d7e5","txlist_hash":"0fdf6d97b6a63f690d30aca13e27aa4cd6bc3ebbf525cfe6f6eee3ce529dfff4"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(345,NULL,310099,'insert','blocks','{"block_hash":"96925c05b3c7c80c716f5bef68d161c71d044252c766ca0e3f17f255764242cb","block_index":310100,"block_time":310100000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(346,NULL,310100,'parse','blocks','{"block_index":310100,"ledger_hash":"ddb8394df96a37e0127c8894e669072cb195ac953e2a3e922b95bf40804820b6","messages_hash":"0cbcc6eba05629dc63fb500419ab4e6f81b94820d68d7974328e09ff92a2f40b","txlist_hash":"8cd686429ec5799fb9a78d07d662c5f51431c6d79691a45c109d512d261aa5df"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(347,NULL,310100,'insert','blocks','{"block_hash":"369472409995ca1a2ebecbad6bf9dab38c378ab1e67e1bdf13d4ce1346731cd6","block_index":310101,"block_time":310101000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(348,NULL,310101,'parse','blocks','{"block_index":310101,"ledger_hash":"3ed7694459a57281ba8e4159ce156333aae4b596aa3ab5193ea6c1901f2c9667","messages_hash":"a2034f57c8adc0bddcddab4aa24ca8732ed7c72a551dd4c8369db54be08e025a","txlist_hash":"b6c153092c9e72a0fc5f32febc767803bf50df6886edea271315e382903b8cc1"}',0,'BLOCK_PARSED');
 -- Triggers and indices on  messages
 CREATE TRIGGER block_update_messages
                            BEFORE UPDATE ON messages BEGIN
@@ -463,361 +463,362 @@ BEGIN TRANSACTION;
 DROP TABLE IF EXISTS messages;
 CREATE TABLE messages(
                       message_index INTEGER PRIMARY KEY,
+                      mensaje_index INTEGER,
                       block_index INTEGER,
                       command TEXT,
                       category TEXT,
                       bindings TEXT,
                       timestamp INTEGER,
                       event TEXT);
-INSERT INTO messages VALUES(0,0,'insert','blocks','{"block_hash":"8b3bef249cb3b0fa23a4936c1249b6bd41daeadc848c8d2e409ea1cbc10adfe7","block_index":309999,"block_time":309999000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1,309999,'parse','blocks','{"block_index":309999,"ledger_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","messages_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","txlist_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(2,309999,'insert','blocks','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(3,310000,'insert','transactions','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"btc_amount":62000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"5fde1c728d8d00aaa1b5f8dae963ceb4fd30c415eb0b8a982ba2d8d676fec0bb","tx_index":1}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(4,310000,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310000,"calling_function":"burn","event":"5fde1c728d8d00aaa1b5f8dae963ceb4fd30c415eb0b8a982ba2d8d676fec0bb","quantity":93000000000,"tx_index":1}',0,'CREDIT');
-INSERT INTO messages VALUES(5,310000,'insert','burns','{"block_index":310000,"burned":62000000,"earned":93000000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"5fde1c728d8d00aaa1b5f8dae963ceb4fd30c415eb0b8a982ba2d8d676fec0bb","tx_index":1}',0,'BURN');
-INSERT INTO messages VALUES(6,310000,'parse','blocks','{"block_index":310000,"ledger_hash":"a16ae7423db132c887ae41cc33b7fa48a0cc6571d5a49e0963be25ec8a9769b4","messages_hash":"72fb35fd107eb57460c13d547f5963136bd2c13d3ded9fc7318f917f7b7bf3e4","txlist_hash":"b8fb4fb649dd315851564165b076d636e5a85e043d59c11877bdccced38f1b3e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(7,310000,'insert','blocks','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(8,310001,'insert','transactions','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"btc_amount":1000,"data":"0000000000000000000000010000000002faf080","destination":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"eacd03b732d28924807d4f0cb1c1aa5720a78bf44d23660fb1658a5fd1b4e9a3","tx_index":2}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(9,310001,'insert','debits','{"action":"send","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310001,"event":"eacd03b732d28924807d4f0cb1c1aa5720a78bf44d23660fb1658a5fd1b4e9a3","quantity":50000000,"tx_index":2}',0,'DEBIT');
-INSERT INTO messages VALUES(10,310001,'insert','credits','{"address":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310001,"calling_function":"send","event":"eacd03b732d28924807d4f0cb1c1aa5720a78bf44d23660fb1658a5fd1b4e9a3","quantity":50000000,"tx_index":2}',0,'CREDIT');
-INSERT INTO messages VALUES(11,310001,'insert','sends','{"asset":"XCP","block_index":310001,"destination":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","quantity":50000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"eacd03b732d28924807d4f0cb1c1aa5720a78bf44d23660fb1658a5fd1b4e9a3","tx_index":2}',0,'SEND');
-INSERT INTO messages VALUES(12,310001,'parse','transactions','{"supported":true,"tx_hash":"eacd03b732d28924807d4f0cb1c1aa5720a78bf44d23660fb1658a5fd1b4e9a3","tx_index":2}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(13,310001,'parse','blocks','{"block_index":310001,"ledger_hash":"0cda5c4a26f0b23d5b948142dcd226b2718c57c9c6a481250128a7a1c8ad30dc","messages_hash":"aff0be14b9e6ace9e4d6333cf04061ef6447598c02d9b27fac1d939df31aa09c","txlist_hash":"1c009ff73127980e51ba6a7035bec5c2a9650b5a184da1d55c3d807fa658f8e7"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(14,310001,'insert','blocks','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(15,310002,'insert','transactions','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"btc_amount":0,"data":"0000000a00000000000000000000000002faf08000000000000000010000000005f5e100000a0000000000000000","destination":"","fee":1000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"025ca2c1784ca3c9389b9f227a5a04445908337e21e2ef9411c890e20aff61c0","tx_index":3}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(16,310002,'insert','orders','{"block_index":310002,"expiration":10,"expire_index":310012,"fee_provided":1000000,"fee_provided_remaining":1000000,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":100000000,"get_remaining":100000000,"give_asset":"BTC","give_quantity":50000000,"give_remaining":50000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","tx_hash":"025ca2c1784ca3c9389b9f227a5a04445908337e21e2ef9411c890e20aff61c0","tx_index":3}',0,'OPEN_ORDER');
-INSERT INTO messages VALUES(17,310002,'parse','transactions','{"supported":true,"tx_hash":"025ca2c1784ca3c9389b9f227a5a04445908337e21e2ef9411c890e20aff61c0","tx_index":3}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(18,310002,'parse','blocks','{"block_index":310002,"ledger_hash":"657c31576766cf1f8a699a14e6c7493498673f1948bea1be4f639247f4d52d53","messages_hash":"3f32659dd96a8649fd53b83ac36a4fc05acaac73db54738573b8642b7875f787","txlist_hash":"c674bb5077acb71ab19a6a4a8f779015846135e7b93a5006555fe1f4ad10c58e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(19,310002,'insert','blocks','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(20,310003,'insert','transactions','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"btc_amount":0,"data":"0000000a00000000000000010000000006422c4000000000000000000000000002faf080000a00000000000dbba0","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee","tx_index":4}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(21,310003,'insert','debits','{"action":"open order","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310003,"event":"c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee","quantity":105000000,"tx_index":4}',0,'DEBIT');
-INSERT INTO messages VALUES(22,310003,'insert','orders','{"block_index":310003,"expiration":10,"expire_index":310013,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":900000,"fee_required_remaining":900000,"get_asset":"BTC","get_quantity":50000000,"get_remaining":50000000,"give_asset":"XCP","give_quantity":105000000,"give_remaining":105000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","tx_hash":"c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee","tx_index":4}',0,'OPEN_ORDER');
-INSERT INTO messages VALUES(23,310003,'update','orders','{"fee_provided_remaining":142858,"fee_required_remaining":0,"get_remaining":0,"give_remaining":0,"status":"open","tx_hash":"025ca2c1784ca3c9389b9f227a5a04445908337e21e2ef9411c890e20aff61c0"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(24,310003,'update','orders','{"fee_provided_remaining":6800,"fee_required_remaining":42858,"get_remaining":0,"give_remaining":5000000,"status":"open","tx_hash":"c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(25,310003,'insert','order_matches','{"backward_asset":"XCP","backward_quantity":100000000,"block_index":310003,"fee_paid":857142,"forward_asset":"BTC","forward_quantity":50000000,"id":"025ca2c1784ca3c9389b9f227a5a04445908337e21e2ef9411c890e20aff61c0_c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee","match_expire_index":310023,"status":"pending","tx0_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx0_block_index":310002,"tx0_expiration":10,"tx0_hash":"025ca2c1784ca3c9389b9f227a5a04445908337e21e2ef9411c890e20aff61c0","tx0_index":3,"tx1_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx1_block_index":310003,"tx1_expiration":10,"tx1_hash":"c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee","tx1_index":4}',0,'ORDER_MATCH');
-INSERT INTO messages VALUES(26,310003,'parse','transactions','{"supported":true,"tx_hash":"c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee","tx_index":4}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(27,310003,'parse','blocks','{"block_index":310003,"ledger_hash":"e11e7eeb21ff539c27324c94a407dc6f04c739f3ed9841f9f661bf4441e4d847","messages_hash":"85ce063a964cd9bc7d1b5803ebd4a0f460cd48e5be820968cd47859025492a45","txlist_hash":"105a5c9915547d3ebfe733d284d6e812cada8e86a904510fc196e2f0af5b50a4"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(28,310003,'insert','blocks','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(29,310004,'insert','transactions','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"btc_amount":50000000,"data":"0000000b025ca2c1784ca3c9389b9f227a5a04445908337e21e2ef9411c890e20aff61c0c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":9675,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"b0bf5693ba52a5c6bda34671ba065606bd02277f281e9aa19d25778e26c2f7e2","tx_index":5}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(30,310004,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310004,"calling_function":"btcpay","event":"b0bf5693ba52a5c6bda34671ba065606bd02277f281e9aa19d25778e26c2f7e2","quantity":100000000,"tx_index":5}',0,'CREDIT');
-INSERT INTO messages VALUES(31,310004,'update','order_matches','{"id":"025ca2c1784ca3c9389b9f227a5a04445908337e21e2ef9411c890e20aff61c0_c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee","order_match_id":"025ca2c1784ca3c9389b9f227a5a04445908337e21e2ef9411c890e20aff61c0_c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee","status":"completed"}',0,'ORDER_MATCH_UPDATE');
-INSERT INTO messages VALUES(32,310004,'insert','btcpays','{"block_index":310004,"btc_amount":50000000,"destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","order_match_id":"025ca2c1784ca3c9389b9f227a5a04445908337e21e2ef9411c890e20aff61c0_c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee","source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"b0bf5693ba52a5c6bda34671ba065606bd02277f281e9aa19d25778e26c2f7e2","tx_index":5}',0,'BTC_PAY');
-INSERT INTO messages VALUES(33,310004,'parse','transactions','{"supported":true,"tx_hash":"b0bf5693ba52a5c6bda34671ba065606bd02277f281e9aa19d25778e26c2f7e2","tx_index":5}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(34,310004,'parse','blocks','{"block_index":310004,"ledger_hash":"2742a3e99eed62c09d9ecdaf501aa69b0d0b21fc092ca061448d5016957f35e0","messages_hash":"604c56317946ca59a8278817b3802ec346527d2d286d64e2f354179effbe87b0","txlist_hash":"369b47f51b512708e680edc5ba459b91e2a514f5a5c7cb8435670a4b3ed34dbe"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(35,310004,'insert','blocks','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(36,310005,'insert','transactions','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"btc_amount":0,"data":"000000140000000000004767000000003b9aca000100000000000000000000","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"93599860b4a4a3b672a79c064812eb18d2e1b532613e08bd3ae1ee2a9979eae2","tx_index":6}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(37,310005,'insert','debits','{"action":"issuance fee","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310005,"event":"93599860b4a4a3b672a79c064812eb18d2e1b532613e08bd3ae1ee2a9979eae2","quantity":50000000,"tx_index":6}',0,'DEBIT');
-INSERT INTO messages VALUES(38,310005,'insert','assets','{"asset_id":"18279","asset_longname":null,"asset_name":"BBBB","block_index":310005}',0,'ASSET_CREATION');
-INSERT INTO messages VALUES(39,310005,'insert','issuances','{"asset":"BBBB","asset_longname":null,"block_index":310005,"call_date":0,"call_price":0.0,"callable":false,"description":"","divisible":true,"fee_paid":50000000,"issuer":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","locked":false,"quantity":1000000000,"reset":false,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","transfer":false,"tx_hash":"93599860b4a4a3b672a79c064812eb18d2e1b532613e08bd3ae1ee2a9979eae2","tx_index":6}',0,'ASSET_ISSUANCE');
-INSERT INTO messages VALUES(40,310005,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBB","block_index":310005,"calling_function":"issuance","event":"93599860b4a4a3b672a79c064812eb18d2e1b532613e08bd3ae1ee2a9979eae2","quantity":1000000000,"tx_index":6}',0,'CREDIT');
-INSERT INTO messages VALUES(41,310005,'parse','transactions','{"supported":true,"tx_hash":"93599860b4a4a3b672a79c064812eb18d2e1b532613e08bd3ae1ee2a9979eae2","tx_index":6}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(42,310005,'parse','blocks','{"block_index":310005,"ledger_hash":"49f526a56f21491c797e8e2559f722ded6f6990b1f69c55dc38791d8d30f4048","messages_hash":"7601e852ffd000c30484a083254b65a7d1d6c72df44ebf568915c7d8fcd72512","txlist_hash":"f0c2ddd7c39b14fc55d8518c65aa0811fe7807ebd1eebb4b66df8459f9e5352b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(43,310005,'insert','blocks','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(44,310006,'insert','transactions','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"btc_amount":0,"data":"00000014000000000000476800000000000186a00000000000000000000006666f6f626172","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"3318c4b8b244fbc64f6894d28f7a1866db5671f04d2e4f5911d0fd688f804404","tx_index":7}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(45,310006,'insert','debits','{"action":"issuance fee","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310006,"event":"3318c4b8b244fbc64f6894d28f7a1866db5671f04d2e4f5911d0fd688f804404","quantity":50000000,"tx_index":7}',0,'DEBIT');
-INSERT INTO messages VALUES(46,310006,'insert','assets','{"asset_id":"18280","asset_longname":null,"asset_name":"BBBC","block_index":310006}',0,'ASSET_CREATION');
-INSERT INTO messages VALUES(47,310006,'insert','issuances','{"asset":"BBBC","asset_longname":null,"block_index":310006,"call_date":0,"call_price":0.0,"callable":false,"description":"foobar","divisible":false,"fee_paid":50000000,"issuer":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","locked":false,"quantity":100000,"reset":false,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","transfer":false,"tx_hash":"3318c4b8b244fbc64f6894d28f7a1866db5671f04d2e4f5911d0fd688f804404","tx_index":7}',0,'ASSET_ISSUANCE');
-INSERT INTO messages VALUES(48,310006,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBC","block_index":310006,"calling_function":"issuance","event":"3318c4b8b244fbc64f6894d28f7a1866db5671f04d2e4f5911d0fd688f804404","quantity":100000,"tx_index":7}',0,'CREDIT');
-INSERT INTO messages VALUES(49,310006,'parse','transactions','{"supported":true,"tx_hash":"3318c4b8b244fbc64f6894d28f7a1866db5671f04d2e4f5911d0fd688f804404","tx_index":7}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(50,310006,'parse','blocks','{"block_index":310006,"ledger_hash":"78787c4c9537fc4db5d1dc7d31d4fab6b445d57021aab1a38d4bd6a9404713c5","messages_hash":"914680b3a6ab891815c044f2d4a31422852b4125f1810e9d1179515560f1582f","txlist_hash":"877117b3bd10ddbe6e46f417845085a6bdecd86a4961b99c80e991b4c51e0f5e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(51,310006,'insert','blocks','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(52,310007,'insert','transactions','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"btc_amount":1000,"data":"00000000000000000000476700000000003d0900","destination":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"e43d2ab22a3a5fe1de032bdf042381fc1d6fc34794abc51a1b3db46ccf8cbdbe","tx_index":8}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(53,310007,'insert','debits','{"action":"send","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBB","block_index":310007,"event":"e43d2ab22a3a5fe1de032bdf042381fc1d6fc34794abc51a1b3db46ccf8cbdbe","quantity":4000000,"tx_index":8}',0,'DEBIT');
-INSERT INTO messages VALUES(54,310007,'insert','credits','{"address":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBB","block_index":310007,"calling_function":"send","event":"e43d2ab22a3a5fe1de032bdf042381fc1d6fc34794abc51a1b3db46ccf8cbdbe","quantity":4000000,"tx_index":8}',0,'CREDIT');
-INSERT INTO messages VALUES(55,310007,'insert','sends','{"asset":"BBBB","block_index":310007,"destination":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","quantity":4000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"e43d2ab22a3a5fe1de032bdf042381fc1d6fc34794abc51a1b3db46ccf8cbdbe","tx_index":8}',0,'SEND');
-INSERT INTO messages VALUES(56,310007,'parse','transactions','{"supported":true,"tx_hash":"e43d2ab22a3a5fe1de032bdf042381fc1d6fc34794abc51a1b3db46ccf8cbdbe","tx_index":8}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(57,310007,'parse','blocks','{"block_index":310007,"ledger_hash":"5cc2599b63007433426c220c59a777b5c37b1165595f2ba239c3ce578c8055ab","messages_hash":"854c4c587b4276b27f3fed020babe5e6b8ab8dd184a4d7ba1432ab6bfab2c6ea","txlist_hash":"702a5772ce8529995f7a66a244e8be495e3f7cbedb7b09f47e3d5aa941c7f4c1"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(58,310007,'insert','blocks','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(59,310008,'insert','transactions','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"btc_amount":1000,"data":"000000000000000000004768000000000000020e","destination":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"7b48b32b5373757d0bfa50358184117ca01b5ad564ca4338ecb021ae726a19c9","tx_index":9}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(60,310008,'insert','debits','{"action":"send","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBC","block_index":310008,"event":"7b48b32b5373757d0bfa50358184117ca01b5ad564ca4338ecb021ae726a19c9","quantity":526,"tx_index":9}',0,'DEBIT');
-INSERT INTO messages VALUES(61,310008,'insert','credits','{"address":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBC","block_index":310008,"calling_function":"send","event":"7b48b32b5373757d0bfa50358184117ca01b5ad564ca4338ecb021ae726a19c9","quantity":526,"tx_index":9}',0,'CREDIT');
-INSERT INTO messages VALUES(62,310008,'insert','sends','{"asset":"BBBC","block_index":310008,"destination":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","quantity":526,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"7b48b32b5373757d0bfa50358184117ca01b5ad564ca4338ecb021ae726a19c9","tx_index":9}',0,'SEND');
-INSERT INTO messages VALUES(63,310008,'parse','transactions','{"supported":true,"tx_hash":"7b48b32b5373757d0bfa50358184117ca01b5ad564ca4338ecb021ae726a19c9","tx_index":9}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(64,310008,'parse','blocks','{"block_index":310008,"ledger_hash":"9550db622e679ff3d63d814f9ffa743d57eb12491b213ef6474617a6c738c3fa","messages_hash":"345a10c31ef469648159999ef16856316259345971b2eec607a5ce57ba556676","txlist_hash":"6c536f7ae10567cbd91945e3e958640e6c65408f83e4a1d93e705950ba39de1b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(65,310008,'insert','blocks','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(66,310009,'insert','transactions','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"btc_amount":0,"data":"00000032000000000000025800000000000047670000000000000001","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"cbc73bb03bae7cbaa0e88c9c16cb78fa6f315b9a6383f0f7efb63d0fdd831a81","tx_index":10}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(67,310009,'insert','debits','{"action":"dividend","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310009,"event":"cbc73bb03bae7cbaa0e88c9c16cb78fa6f315b9a6383f0f7efb63d0fdd831a81","quantity":24,"tx_index":10}',0,'DEBIT');
-INSERT INTO messages VALUES(68,310009,'insert','debits','{"action":"dividend fee","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310009,"event":"cbc73bb03bae7cbaa0e88c9c16cb78fa6f315b9a6383f0f7efb63d0fdd831a81","quantity":20000,"tx_index":10}',0,'DEBIT');
-INSERT INTO messages VALUES(69,310009,'insert','credits','{"address":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310009,"calling_function":"dividend","event":"cbc73bb03bae7cbaa0e88c9c16cb78fa6f315b9a6383f0f7efb63d0fdd831a81","quantity":24,"tx_index":10}',0,'CREDIT');
-INSERT INTO messages VALUES(70,310009,'insert','dividends','{"asset":"BBBB","block_index":310009,"dividend_asset":"XCP","fee_paid":20000,"quantity_per_unit":600,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"cbc73bb03bae7cbaa0e88c9c16cb78fa6f315b9a6383f0f7efb63d0fdd831a81","tx_index":10}',0,'ASSET_DIVIDEND');
-INSERT INTO messages VALUES(71,310009,'parse','transactions','{"supported":true,"tx_hash":"cbc73bb03bae7cbaa0e88c9c16cb78fa6f315b9a6383f0f7efb63d0fdd831a81","tx_index":10}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(72,310009,'parse','blocks','{"block_index":310009,"ledger_hash":"08c005dd5bae7f21ca27803d75318ac4b968c6d4dd2c275ef284c03fea43b189","messages_hash":"5ab18e8b7b08bdb2aabef0fb95b3a8d431438f98527f224b19863e1a18e7671b","txlist_hash":"8f8156aca3441754221fbf9cc21b0e7d877a533e00f63950be3f95d0a9305433"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(73,310009,'insert','blocks','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(74,310010,'insert','transactions','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"btc_amount":0,"data":"00000032000000000000032000000000000047680000000000000001","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"c59e9803933740537b59928d19d2b65812e6f2b8d1ac811d9262353a19327b97","tx_index":11}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(75,310010,'insert','debits','{"action":"dividend","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310010,"event":"c59e9803933740537b59928d19d2b65812e6f2b8d1ac811d9262353a19327b97","quantity":420800,"tx_index":11}',0,'DEBIT');
-INSERT INTO messages VALUES(76,310010,'insert','debits','{"action":"dividend fee","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310010,"event":"c59e9803933740537b59928d19d2b65812e6f2b8d1ac811d9262353a19327b97","quantity":20000,"tx_index":11}',0,'DEBIT');
-INSERT INTO messages VALUES(77,310010,'insert','credits','{"address":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310010,"calling_function":"dividend","event":"c59e9803933740537b59928d19d2b65812e6f2b8d1ac811d9262353a19327b97","quantity":420800,"tx_index":11}',0,'CREDIT');
-INSERT INTO messages VALUES(78,310010,'insert','dividends','{"asset":"BBBC","block_index":310010,"dividend_asset":"XCP","fee_paid":20000,"quantity_per_unit":800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"c59e9803933740537b59928d19d2b65812e6f2b8d1ac811d9262353a19327b97","tx_index":11}',0,'ASSET_DIVIDEND');
-INSERT INTO messages VALUES(79,310010,'parse','transactions','{"supported":true,"tx_hash":"c59e9803933740537b59928d19d2b65812e6f2b8d1ac811d9262353a19327b97","tx_index":11}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(80,310010,'parse','blocks','{"block_index":310010,"ledger_hash":"07f48634d06e6be1d800e068cd213a648517fe167ed89c355d9db966897ed7b0","messages_hash":"0546e010b64a8b52b22b5806d642b98afa94cd8ba58a7b79fd5468c7d3967e2e","txlist_hash":"c5956a9750e786639ceb4a252a219afef6abb753037888c90ebf17a5c5db079f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(81,310010,'insert','blocks','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(82,310011,'insert','transactions','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"btc_amount":0,"data":"0000001e52bb3300405900000000000005f5e0ff09556e69742054657374","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"0a15cc28e58f28a690051e66e6c50ecb68826077d59b75d05590a1db453d9d61","tx_index":12}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(83,310011,'insert','broadcasts','{"block_index":310011,"fee_fraction_int":99999999,"locked":false,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","text":"Unit Test","timestamp":1388000000,"tx_hash":"0a15cc28e58f28a690051e66e6c50ecb68826077d59b75d05590a1db453d9d61","tx_index":12,"value":100.0}',0,'BROADCAST');
-INSERT INTO messages VALUES(84,310011,'parse','transactions','{"supported":true,"tx_hash":"0a15cc28e58f28a690051e66e6c50ecb68826077d59b75d05590a1db453d9d61","tx_index":12}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(85,310011,'parse','blocks','{"block_index":310011,"ledger_hash":"8d0be0b3731bdd0d611e81b48efa6c706a983990f31bc563d57893f705b73aa7","messages_hash":"aa5dc6df82251757a41241459af772cbf946bceda20e4ab304e9c0dc1d54b729","txlist_hash":"219d47523246e5c4ffa99ae9c29bdcfdf9f419bff3d21da76fdc91cfe99fc28d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(86,310011,'insert','blocks','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(87,310012,'insert','transactions','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"btc_amount":1000,"data":"00000028000052bb33640000000002faf08000000000017d7840000000000000000000003b100000000a","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"c36b65e3d4c105739d5c8cef470c0878d2e8da138416e09cb499edcec343c0b8","tx_index":13}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(88,310012,'insert','debits','{"action":"bet","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310012,"event":"c36b65e3d4c105739d5c8cef470c0878d2e8da138416e09cb499edcec343c0b8","quantity":50000000,"tx_index":13}',0,'DEBIT');
-INSERT INTO messages VALUES(89,310012,'insert','bets','{"bet_type":0,"block_index":310012,"counterwager_quantity":25000000,"counterwager_remaining":25000000,"deadline":1388000100,"expiration":10,"expire_index":310022,"fee_fraction_int":99999999.0,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","leverage":15120,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","target_value":0.0,"tx_hash":"c36b65e3d4c105739d5c8cef470c0878d2e8da138416e09cb499edcec343c0b8","tx_index":13,"wager_quantity":50000000,"wager_remaining":50000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(90,310012,'parse','transactions','{"supported":true,"tx_hash":"c36b65e3d4c105739d5c8cef470c0878d2e8da138416e09cb499edcec343c0b8","tx_index":13}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(91,310012,'parse','blocks','{"block_index":310012,"ledger_hash":"e3de05180536ad40eb9007f19ccb819fee0586cb9e7c414dc560e506ae5c09b7","messages_hash":"5322bd28e42ff13238d6bad863782392d07d3c529139d25b5a7859f2065e25ff","txlist_hash":"ce6072bd562a52051fc530ec552aa343e4980a1b236f1cb8318c415d3eb2e851"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(92,310012,'insert','blocks','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(93,310013,'insert','transactions','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"btc_amount":1000,"data":"00000028000152bb336400000000017d78400000000002793d60000000000000000000003b100000000a","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"23f77ca0034c19aa841413edfde7f4a3dca8d8ef582ce939dfc2e170c7c811a1","tx_index":14}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(94,310013,'update','orders','{"status":"expired","tx_hash":"025ca2c1784ca3c9389b9f227a5a04445908337e21e2ef9411c890e20aff61c0"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(95,310013,'insert','order_expirations','{"block_index":310013,"order_hash":"025ca2c1784ca3c9389b9f227a5a04445908337e21e2ef9411c890e20aff61c0","source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2"}',0,'ORDER_EXPIRATION');
-INSERT INTO messages VALUES(96,310013,'insert','debits','{"action":"bet","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310013,"event":"23f77ca0034c19aa841413edfde7f4a3dca8d8ef582ce939dfc2e170c7c811a1","quantity":25000000,"tx_index":14}',0,'DEBIT');
-INSERT INTO messages VALUES(97,310013,'insert','bets','{"bet_type":1,"block_index":310013,"counterwager_quantity":41500000,"counterwager_remaining":41500000,"deadline":1388000100,"expiration":10,"expire_index":310023,"fee_fraction_int":99999999.0,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","leverage":15120,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","target_value":0.0,"tx_hash":"23f77ca0034c19aa841413edfde7f4a3dca8d8ef582ce939dfc2e170c7c811a1","tx_index":14,"wager_quantity":25000000,"wager_remaining":25000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(98,310013,'update','bets','{"counterwager_remaining":4250000,"status":"open","tx_hash":"c36b65e3d4c105739d5c8cef470c0878d2e8da138416e09cb499edcec343c0b8","wager_remaining":8500000}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(99,310013,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310013,"calling_function":"filled","event":"23f77ca0034c19aa841413edfde7f4a3dca8d8ef582ce939dfc2e170c7c811a1","quantity":4250000,"tx_index":14}',0,'CREDIT');
-INSERT INTO messages VALUES(100,310013,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"23f77ca0034c19aa841413edfde7f4a3dca8d8ef582ce939dfc2e170c7c811a1","wager_remaining":4250000}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(101,310013,'insert','bet_matches','{"backward_quantity":20750000,"block_index":310012,"deadline":1388000100,"fee_fraction_int":99999999,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","forward_quantity":41500000,"id":"c36b65e3d4c105739d5c8cef470c0878d2e8da138416e09cb499edcec343c0b8_23f77ca0034c19aa841413edfde7f4a3dca8d8ef582ce939dfc2e170c7c811a1","initial_value":100.0,"leverage":15120,"match_expire_index":310022,"status":"pending","target_value":0.0,"tx0_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx0_bet_type":0,"tx0_block_index":310012,"tx0_expiration":10,"tx0_hash":"c36b65e3d4c105739d5c8cef470c0878d2e8da138416e09cb499edcec343c0b8","tx0_index":13,"tx1_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx1_bet_type":1,"tx1_block_index":310013,"tx1_expiration":10,"tx1_hash":"23f77ca0034c19aa841413edfde7f4a3dca8d8ef582ce939dfc2e170c7c811a1","tx1_index":14}',0,'BET_MATCH');
-INSERT INTO messages VALUES(102,310013,'parse','transactions','{"supported":true,"tx_hash":"23f77ca0034c19aa841413edfde7f4a3dca8d8ef582ce939dfc2e170c7c811a1","tx_index":14}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(103,310013,'parse','blocks','{"block_index":310013,"ledger_hash":"e521556db091cc726fb38cbebfd10923e37dab652c51dca73a646fe5bd81bb96","messages_hash":"53dd35d7fcb3cb00c464d2e5cf8d658b0de66fbdb3c644d862477ec1cf9827ea","txlist_hash":"1a1e24f2debcd4b5b1e350a71823758d3114335ac831367bc91c9e487b94c65c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(104,310013,'insert','blocks','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(105,310014,'insert','transactions','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"btc_amount":1000,"data":"00000028000052bb33640000000008f0d1800000000014dc93800000000000000000000013b00000000a","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"a5a1927a83521144a5aa751f61065b530c9447c5b2c35e35064de32dae9573fd","tx_index":15}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(106,310014,'update','orders','{"status":"expired","tx_hash":"c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(107,310014,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310014,"calling_function":"cancel order","event":"c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee","quantity":5000000,"tx_index":0}',0,'CREDIT');
-INSERT INTO messages VALUES(108,310014,'insert','order_expirations','{"block_index":310014,"order_hash":"c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee","source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2"}',0,'ORDER_EXPIRATION');
-INSERT INTO messages VALUES(109,310014,'insert','debits','{"action":"bet","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310014,"event":"a5a1927a83521144a5aa751f61065b530c9447c5b2c35e35064de32dae9573fd","quantity":150000000,"tx_index":15}',0,'DEBIT');
-INSERT INTO messages VALUES(110,310014,'insert','bets','{"bet_type":0,"block_index":310014,"counterwager_quantity":350000000,"counterwager_remaining":350000000,"deadline":1388000100,"expiration":10,"expire_index":310024,"fee_fraction_int":99999999.0,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","leverage":5040,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","target_value":0.0,"tx_hash":"a5a1927a83521144a5aa751f61065b530c9447c5b2c35e35064de32dae9573fd","tx_index":15,"wager_quantity":150000000,"wager_remaining":150000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(111,310014,'parse','transactions','{"supported":true,"tx_hash":"a5a1927a83521144a5aa751f61065b530c9447c5b2c35e35064de32dae9573fd","tx_index":15}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(112,310014,'parse','blocks','{"block_index":310014,"ledger_hash":"1cd6d92fbbca9266135a35f20a4328d510c8d209ba6161dc8c9e9bfa69032c57","messages_hash":"2b42fe416ff6b68adcff8c01b8ad5e9e664617e5982215fa404edea66c7ef951","txlist_hash":"80ee1bd354b8e1aa1c2f57926fbd36c0d9e2dbd3f77d8f2e43d59b29bd8175a6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(113,310014,'insert','blocks','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(114,310015,'insert','transactions','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"btc_amount":1000,"data":"00000028000152bb33640000000014dc93800000000008f0d1800000000000000000000013b00000000a","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"6aa4c5853aa9971d13c0291c4e91ee5cddd506521942377aca5c3b1a48780c75","tx_index":16}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(115,310015,'insert','debits','{"action":"bet","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310015,"event":"6aa4c5853aa9971d13c0291c4e91ee5cddd506521942377aca5c3b1a48780c75","quantity":350000000,"tx_index":16}',0,'DEBIT');
-INSERT INTO messages VALUES(116,310015,'insert','bets','{"bet_type":1,"block_index":310015,"counterwager_quantity":150000000,"counterwager_remaining":150000000,"deadline":1388000100,"expiration":10,"expire_index":310025,"fee_fraction_int":99999999.0,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","leverage":5040,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","target_value":0.0,"tx_hash":"6aa4c5853aa9971d13c0291c4e91ee5cddd506521942377aca5c3b1a48780c75","tx_index":16,"wager_quantity":350000000,"wager_remaining":350000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(117,310015,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310015,"calling_function":"filled","event":"6aa4c5853aa9971d13c0291c4e91ee5cddd506521942377aca5c3b1a48780c75","quantity":0,"tx_index":16}',0,'CREDIT');
-INSERT INTO messages VALUES(118,310015,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"a5a1927a83521144a5aa751f61065b530c9447c5b2c35e35064de32dae9573fd","wager_remaining":0}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(119,310015,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310015,"calling_function":"filled","event":"6aa4c5853aa9971d13c0291c4e91ee5cddd506521942377aca5c3b1a48780c75","quantity":0,"tx_index":16}',0,'CREDIT');
-INSERT INTO messages VALUES(120,310015,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"6aa4c5853aa9971d13c0291c4e91ee5cddd506521942377aca5c3b1a48780c75","wager_remaining":0}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(121,310015,'insert','bet_matches','{"backward_quantity":350000000,"block_index":310014,"deadline":1388000100,"fee_fraction_int":99999999,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","forward_quantity":150000000,"id":"a5a1927a83521144a5aa751f61065b530c9447c5b2c35e35064de32dae9573fd_6aa4c5853aa9971d13c0291c4e91ee5cddd506521942377aca5c3b1a48780c75","initial_value":100.0,"leverage":5040,"match_expire_index":310024,"status":"pending","target_value":0.0,"tx0_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx0_bet_type":0,"tx0_block_index":310014,"tx0_expiration":10,"tx0_hash":"a5a1927a83521144a5aa751f61065b530c9447c5b2c35e35064de32dae9573fd","tx0_index":15,"tx1_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx1_bet_type":1,"tx1_block_index":310015,"tx1_expiration":10,"tx1_hash":"6aa4c5853aa9971d13c0291c4e91ee5cddd506521942377aca5c3b1a48780c75","tx1_index":16}',0,'BET_MATCH');
-INSERT INTO messages VALUES(122,310015,'parse','transactions','{"supported":true,"tx_hash":"6aa4c5853aa9971d13c0291c4e91ee5cddd506521942377aca5c3b1a48780c75","tx_index":16}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(123,310015,'parse','blocks','{"block_index":310015,"ledger_hash":"62759ea6d5070225bd30253a42b6c68fdaf2c4165b1b221b8e7bdddeb26e9737","messages_hash":"95e6788f7af884c71f7e813de2665e2beddc6faee99015402ec9e8498edf6074","txlist_hash":"30a124b4460d985c715c7bbd85cfbe972a5caf457e45844e0a54daa258ca3376"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(124,310015,'insert','blocks','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(125,310016,'insert','transactions','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"btc_amount":1000,"data":"00000028000252bb33c8000000002cb417800000000026be36803ff0000000000000000013b00000000a","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"91cea72c920a13cc450d14c92a81a318462300670308d6b1eb344ac06a72eda1","tx_index":17}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(126,310016,'insert','debits','{"action":"bet","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310016,"event":"91cea72c920a13cc450d14c92a81a318462300670308d6b1eb344ac06a72eda1","quantity":750000000,"tx_index":17}',0,'DEBIT');
-INSERT INTO messages VALUES(127,310016,'insert','bets','{"bet_type":2,"block_index":310016,"counterwager_quantity":650000000,"counterwager_remaining":650000000,"deadline":1388000200,"expiration":10,"expire_index":310026,"fee_fraction_int":99999999.0,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","leverage":5040,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","target_value":1.0,"tx_hash":"91cea72c920a13cc450d14c92a81a318462300670308d6b1eb344ac06a72eda1","tx_index":17,"wager_quantity":750000000,"wager_remaining":750000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(128,310016,'parse','transactions','{"supported":true,"tx_hash":"91cea72c920a13cc450d14c92a81a318462300670308d6b1eb344ac06a72eda1","tx_index":17}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(129,310016,'parse','blocks','{"block_index":310016,"ledger_hash":"f9fc0dd4d98ac5e06e4f9673cf5678f9fc264cda23172e24427b833331b73c33","messages_hash":"7fd6480d829327edbce5d160651ffe3490f980d0e5f2b0ff6d5328f7e29e75d4","txlist_hash":"cdbbf3665287df62a1660198e00049d06f649f37c49cb76e9fb1eab12960e66c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(130,310016,'insert','blocks','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(131,310017,'insert','transactions','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"btc_amount":1000,"data":"00000028000352bb33c80000000026be3680000000002cb417803ff0000000000000000013b00000000a","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"c345c2e6d9899c7729a0ca2ef13fab71ca5808854fb6be62e3b3dcd9225d1c4a","tx_index":18}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(132,310017,'insert','debits','{"action":"bet","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310017,"event":"c345c2e6d9899c7729a0ca2ef13fab71ca5808854fb6be62e3b3dcd9225d1c4a","quantity":650000000,"tx_index":18}',0,'DEBIT');
-INSERT INTO messages VALUES(133,310017,'insert','bets','{"bet_type":3,"block_index":310017,"counterwager_quantity":750000000,"counterwager_remaining":750000000,"deadline":1388000200,"expiration":10,"expire_index":310027,"fee_fraction_int":99999999.0,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","leverage":5040,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","target_value":1.0,"tx_hash":"c345c2e6d9899c7729a0ca2ef13fab71ca5808854fb6be62e3b3dcd9225d1c4a","tx_index":18,"wager_quantity":650000000,"wager_remaining":650000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(134,310017,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310017,"calling_function":"filled","event":"c345c2e6d9899c7729a0ca2ef13fab71ca5808854fb6be62e3b3dcd9225d1c4a","quantity":0,"tx_index":18}',0,'CREDIT');
-INSERT INTO messages VALUES(135,310017,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"91cea72c920a13cc450d14c92a81a318462300670308d6b1eb344ac06a72eda1","wager_remaining":0}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(136,310017,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310017,"calling_function":"filled","event":"c345c2e6d9899c7729a0ca2ef13fab71ca5808854fb6be62e3b3dcd9225d1c4a","quantity":0,"tx_index":18}',0,'CREDIT');
-INSERT INTO messages VALUES(137,310017,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"c345c2e6d9899c7729a0ca2ef13fab71ca5808854fb6be62e3b3dcd9225d1c4a","wager_remaining":0}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(138,310017,'insert','bet_matches','{"backward_quantity":650000000,"block_index":310016,"deadline":1388000200,"fee_fraction_int":99999999,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","forward_quantity":750000000,"id":"91cea72c920a13cc450d14c92a81a318462300670308d6b1eb344ac06a72eda1_c345c2e6d9899c7729a0ca2ef13fab71ca5808854fb6be62e3b3dcd9225d1c4a","initial_value":100.0,"leverage":5040,"match_expire_index":310026,"status":"pending","target_value":1.0,"tx0_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx0_bet_type":2,"tx0_block_index":310016,"tx0_expiration":10,"tx0_hash":"91cea72c920a13cc450d14c92a81a318462300670308d6b1eb344ac06a72eda1","tx0_index":17,"tx1_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx1_bet_type":3,"tx1_block_index":310017,"tx1_expiration":10,"tx1_hash":"c345c2e6d9899c7729a0ca2ef13fab71ca5808854fb6be62e3b3dcd9225d1c4a","tx1_index":18}',0,'BET_MATCH');
-INSERT INTO messages VALUES(139,310017,'parse','transactions','{"supported":true,"tx_hash":"c345c2e6d9899c7729a0ca2ef13fab71ca5808854fb6be62e3b3dcd9225d1c4a","tx_index":18}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(140,310017,'parse','blocks','{"block_index":310017,"ledger_hash":"4a355b8e80a902030f384f58700d05da9a6efaae3f3ce0b1a056dc1250d9ec63","messages_hash":"4326f831920bfbfc580e6dbc0b1c8c012c7b46f95f2a57e8cfba5128a8ec7d31","txlist_hash":"355616d4b8b8408ea7061e787ca35918b6d0417895a2a2ff224d207f0f76e02a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(141,310017,'insert','blocks','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(142,310018,'insert','transactions','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"btc_amount":0,"data":"0000001e52bb33324058f7256ffc115e004c4b4009556e69742054657374","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"c473921b7c5d877de55ef38b39935e149003d6fec701bea0c8b66b77255942d4","tx_index":19}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(143,310018,'insert','broadcasts','{"block_index":310018,"fee_fraction_int":5000000,"locked":false,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","text":"Unit Test","timestamp":1388000050,"tx_hash":"c473921b7c5d877de55ef38b39935e149003d6fec701bea0c8b66b77255942d4","tx_index":19,"value":99.86166}',0,'BROADCAST');
-INSERT INTO messages VALUES(144,310018,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310018,"calling_function":"bet settled: liquidated for bear","event":"c473921b7c5d877de55ef38b39935e149003d6fec701bea0c8b66b77255942d4","quantity":59137500,"tx_index":19}',0,'CREDIT');
-INSERT INTO messages VALUES(145,310018,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310018,"calling_function":"feed fee","event":"c473921b7c5d877de55ef38b39935e149003d6fec701bea0c8b66b77255942d4","quantity":3112500,"tx_index":19}',0,'CREDIT');
-INSERT INTO messages VALUES(146,310018,'insert','bet_match_resolutions','{"bear_credit":59137500,"bet_match_id":"c36b65e3d4c105739d5c8cef470c0878d2e8da138416e09cb499edcec343c0b8_23f77ca0034c19aa841413edfde7f4a3dca8d8ef582ce939dfc2e170c7c811a1","bet_match_type_id":1,"block_index":310018,"bull_credit":0,"escrow_less_fee":null,"fee":3112500,"settled":false,"winner":null}',0,'BET_MATCH_RESOLUTON');
-INSERT INTO messages VALUES(147,310018,'update','bet_matches','{"id":"c36b65e3d4c105739d5c8cef470c0878d2e8da138416e09cb499edcec343c0b8_23f77ca0034c19aa841413edfde7f4a3dca8d8ef582ce939dfc2e170c7c811a1","status":"settled: liquidated for bear"}',0,'BET_MATCH_UPDATE');
-INSERT INTO messages VALUES(148,310018,'parse','transactions','{"supported":true,"tx_hash":"c473921b7c5d877de55ef38b39935e149003d6fec701bea0c8b66b77255942d4","tx_index":19}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(149,310018,'parse','blocks','{"block_index":310018,"ledger_hash":"57aee8f9c9b63342ceeea3a3162998e9034a3d624d6d85b19782943ce170cef5","messages_hash":"1933395b09d7e4284e5565db7975d03a7b752fa50af48573e1ef8bd7aaf91964","txlist_hash":"7987b849a43c706d33e421d45e99ca6593c9aa8c69079522888f746a8d4ff748"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(150,310018,'insert','blocks','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(151,310019,'insert','transactions','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"btc_amount":0,"data":"0000001e52bb3365405915f3b645a1cb004c4b4009556e69742054657374","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"c9388ea12ab42ec1502dbb54e2da81beca5adee6056777559200aab28e5e1dc0","tx_index":20}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(152,310019,'insert','broadcasts','{"block_index":310019,"fee_fraction_int":5000000,"locked":false,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","text":"Unit Test","timestamp":1388000101,"tx_hash":"c9388ea12ab42ec1502dbb54e2da81beca5adee6056777559200aab28e5e1dc0","tx_index":20,"value":100.343}',0,'BROADCAST');
-INSERT INTO messages VALUES(153,310019,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310019,"calling_function":"bet settled","event":"c9388ea12ab42ec1502dbb54e2da81beca5adee6056777559200aab28e5e1dc0","quantity":159300000,"tx_index":20}',0,'CREDIT');
-INSERT INTO messages VALUES(154,310019,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310019,"calling_function":"bet settled","event":"c9388ea12ab42ec1502dbb54e2da81beca5adee6056777559200aab28e5e1dc0","quantity":315700000,"tx_index":20}',0,'CREDIT');
-INSERT INTO messages VALUES(155,310019,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310019,"calling_function":"feed fee","event":"c9388ea12ab42ec1502dbb54e2da81beca5adee6056777559200aab28e5e1dc0","quantity":25000000,"tx_index":20}',0,'CREDIT');
-INSERT INTO messages VALUES(156,310019,'insert','bet_match_resolutions','{"bear_credit":315700000,"bet_match_id":"a5a1927a83521144a5aa751f61065b530c9447c5b2c35e35064de32dae9573fd_6aa4c5853aa9971d13c0291c4e91ee5cddd506521942377aca5c3b1a48780c75","bet_match_type_id":1,"block_index":310019,"bull_credit":159300000,"escrow_less_fee":null,"fee":25000000,"settled":true,"winner":null}',0,'BET_MATCH_RESOLUTON');
-INSERT INTO messages VALUES(157,310019,'update','bet_matches','{"id":"a5a1927a83521144a5aa751f61065b530c9447c5b2c35e35064de32dae9573fd_6aa4c5853aa9971d13c0291c4e91ee5cddd506521942377aca5c3b1a48780c75","status":"settled"}',0,'BET_MATCH_UPDATE');
-INSERT INTO messages VALUES(158,310019,'parse','transactions','{"supported":true,"tx_hash":"c9388ea12ab42ec1502dbb54e2da81beca5adee6056777559200aab28e5e1dc0","tx_index":20}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(159,310019,'parse','blocks','{"block_index":310019,"ledger_hash":"d11f94528a9e0034365e4388ee455f02102d2024c65e1428cdee28b6e5aa7e1c","messages_hash":"f58bd63cd1c639a15c0ef21fbb816bdcfc65555f27e76c7638d632f2f65308ed","txlist_hash":"14d0604fb6986f281715ae660221c79b7bfddf15cbc7da02c722e86b8e264d85"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(160,310019,'insert','blocks','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(161,310020,'insert','transactions','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"btc_amount":0,"data":"0000001e52bb33c94000000000000000004c4b4009556e69742054657374","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"54292b0676d266705f8dd0daa1194cff3d16414564f25c422309af75d8ca344e","tx_index":21}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(162,310020,'insert','broadcasts','{"block_index":310020,"fee_fraction_int":5000000,"locked":false,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","text":"Unit Test","timestamp":1388000201,"tx_hash":"54292b0676d266705f8dd0daa1194cff3d16414564f25c422309af75d8ca344e","tx_index":21,"value":2.0}',0,'BROADCAST');
-INSERT INTO messages VALUES(163,310020,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310020,"calling_function":"bet settled: for notequal","event":"54292b0676d266705f8dd0daa1194cff3d16414564f25c422309af75d8ca344e","quantity":1330000000,"tx_index":21}',0,'CREDIT');
-INSERT INTO messages VALUES(164,310020,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310020,"calling_function":"feed fee","event":"54292b0676d266705f8dd0daa1194cff3d16414564f25c422309af75d8ca344e","quantity":70000000,"tx_index":21}',0,'CREDIT');
-INSERT INTO messages VALUES(165,310020,'insert','bet_match_resolutions','{"bear_credit":null,"bet_match_id":"91cea72c920a13cc450d14c92a81a318462300670308d6b1eb344ac06a72eda1_c345c2e6d9899c7729a0ca2ef13fab71ca5808854fb6be62e3b3dcd9225d1c4a","bet_match_type_id":5,"block_index":310020,"bull_credit":null,"escrow_less_fee":1330000000,"fee":70000000,"settled":null,"winner":"NotEqual"}',0,'BET_MATCH_RESOLUTON');
-INSERT INTO messages VALUES(166,310020,'update','bet_matches','{"id":"91cea72c920a13cc450d14c92a81a318462300670308d6b1eb344ac06a72eda1_c345c2e6d9899c7729a0ca2ef13fab71ca5808854fb6be62e3b3dcd9225d1c4a","status":"settled: for notequal"}',0,'BET_MATCH_UPDATE');
-INSERT INTO messages VALUES(167,310020,'parse','transactions','{"supported":true,"tx_hash":"54292b0676d266705f8dd0daa1194cff3d16414564f25c422309af75d8ca344e","tx_index":21}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(168,310020,'parse','blocks','{"block_index":310020,"ledger_hash":"4397f5568bfcf8cc90d1e72b7c61e7cc6905a0d9d3b3890c33e2afb464a25fb9","messages_hash":"c83c26a59d32bdb9ac99237809b1df16a5ac2ca3102b1c6dc4ebf59b57e6c231","txlist_hash":"5483ead85237ef0ceb3486e3c3e6ee1e5080a5dd602f805b811cedf996b8dbaa"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(169,310020,'insert','blocks','{"block_hash":"7c2460bb32c5749c856486393239bf7a0ac789587ac71f32e7237910da8097f2","block_index":310021,"block_time":310021000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(170,310021,'insert','transactions','{"block_hash":"7c2460bb32c5749c856486393239bf7a0ac789587ac71f32e7237910da8097f2","block_index":310021,"block_time":310021000,"btc_amount":0,"data":"0000000a00000000000047670000000002faf08000000000000000010000000002faf080000a0000000000000000","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"6d3c6a9ea36e82a0e8162f69c68fc8bb95d316ad5586a30553fbaf1717f4121e","tx_index":22}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(171,310021,'insert','debits','{"action":"open order","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBB","block_index":310021,"event":"6d3c6a9ea36e82a0e8162f69c68fc8bb95d316ad5586a30553fbaf1717f4121e","quantity":50000000,"tx_index":22}',0,'DEBIT');
-INSERT INTO messages VALUES(172,310021,'insert','orders','{"block_index":310021,"expiration":10,"expire_index":310031,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":50000000,"get_remaining":50000000,"give_asset":"BBBB","give_quantity":50000000,"give_remaining":50000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","tx_hash":"6d3c6a9ea36e82a0e8162f69c68fc8bb95d316ad5586a30553fbaf1717f4121e","tx_index":22}',0,'OPEN_ORDER');
-INSERT INTO messages VALUES(173,310021,'parse','transactions','{"supported":true,"tx_hash":"6d3c6a9ea36e82a0e8162f69c68fc8bb95d316ad5586a30553fbaf1717f4121e","tx_index":22}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(174,310021,'parse','blocks','{"block_index":310021,"ledger_hash":"16b7018344f7a97695eb17dc5921c4955b3f8cf4d9e70bd8628041c4033886b9","messages_hash":"df2718afd201901a86d99a9d0a6d51eae8c18ffd5410c2df3e03f9bc9dc19ad6","txlist_hash":"bd68fe9b7aef054c8a5925dff9ff140cb5c00eb611a8802156196ed486479ad1"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(175,310021,'insert','blocks','{"block_hash":"44435f9a99a0aa12a9bfabdc4cb8119f6ea6a6e1350d2d65445fb66a456db5fc","block_index":310022,"block_time":310022000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(176,310022,'insert','transactions','{"block_hash":"44435f9a99a0aa12a9bfabdc4cb8119f6ea6a6e1350d2d65445fb66a456db5fc","block_index":310022,"block_time":310022000,"btc_amount":100000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"df080a76ceb263201901bc23c85c3e8dce4eca0e72c873131adaf2f46820e9f1","tx_index":23}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(177,310022,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310022,"calling_function":"burn","event":"df080a76ceb263201901bc23c85c3e8dce4eca0e72c873131adaf2f46820e9f1","quantity":56999887262,"tx_index":23}',0,'CREDIT');
-INSERT INTO messages VALUES(178,310022,'insert','burns','{"block_index":310022,"burned":38000000,"earned":56999887262,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"df080a76ceb263201901bc23c85c3e8dce4eca0e72c873131adaf2f46820e9f1","tx_index":23}',0,'BURN');
-INSERT INTO messages VALUES(179,310022,'parse','blocks','{"block_index":310022,"ledger_hash":"c3c26212677f4aed4614b653f1e5da509f962c29502d22c84c1c5522bca0dcf5","messages_hash":"44ca0135d35e858c86b381ada27e536e525b152a649f50d2707dba4154f181bf","txlist_hash":"109e820ac7d290ecec049098115ba6b467ba90ba624aa24326cc7e103e51b265"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(180,310022,'insert','blocks','{"block_hash":"d8cf5bec1bbcab8ca4f495352afde3b6572b7e1d61b3976872ebb8e9d30ccb08","block_index":310023,"block_time":310023000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(181,310023,'insert','transactions','{"block_hash":"d8cf5bec1bbcab8ca4f495352afde3b6572b7e1d61b3976872ebb8e9d30ccb08","block_index":310023,"block_time":310023000,"btc_amount":1000,"data":"0000000000000000000047680000000000002710","destination":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"abc5e16e5a7a1a7dd7d38ff1351b252a3813d40a695ab798f6a26cb904f91ab1","tx_index":24}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(182,310023,'update','bets','{"status":"expired","tx_hash":"c36b65e3d4c105739d5c8cef470c0878d2e8da138416e09cb499edcec343c0b8"}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(183,310023,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310023,"calling_function":"recredit wager remaining","event":"c36b65e3d4c105739d5c8cef470c0878d2e8da138416e09cb499edcec343c0b8","quantity":8500000,"tx_index":0}',0,'CREDIT');
-INSERT INTO messages VALUES(184,310023,'insert','bet_expirations','{"bet_hash":"c36b65e3d4c105739d5c8cef470c0878d2e8da138416e09cb499edcec343c0b8","bet_index":13,"block_index":310023,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2"}',0,'BET_EXPIRATION');
-INSERT INTO messages VALUES(185,310023,'insert','debits','{"action":"send","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBC","block_index":310023,"event":"abc5e16e5a7a1a7dd7d38ff1351b252a3813d40a695ab798f6a26cb904f91ab1","quantity":10000,"tx_index":24}',0,'DEBIT');
-INSERT INTO messages VALUES(186,310023,'insert','credits','{"address":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBC","block_index":310023,"calling_function":"send","event":"abc5e16e5a7a1a7dd7d38ff1351b252a3813d40a695ab798f6a26cb904f91ab1","quantity":10000,"tx_index":24}',0,'CREDIT');
-INSERT INTO messages VALUES(187,310023,'insert','sends','{"asset":"BBBC","block_index":310023,"destination":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","quantity":10000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"abc5e16e5a7a1a7dd7d38ff1351b252a3813d40a695ab798f6a26cb904f91ab1","tx_index":24}',0,'SEND');
-INSERT INTO messages VALUES(188,310023,'parse','transactions','{"supported":true,"tx_hash":"abc5e16e5a7a1a7dd7d38ff1351b252a3813d40a695ab798f6a26cb904f91ab1","tx_index":24}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(189,310023,'parse','blocks','{"block_index":310023,"ledger_hash":"420b753d9e2a4ae5c00cf65efccb9a657d2daeb19159075d1671a076d8c1ade1","messages_hash":"91081b0be0fff5219493139012532117f008245abc4b50bd36faab48f85be5ff","txlist_hash":"8e03eae75b5f9306a0a8142296412f7271b17f8c751e9e8e1b1cbeca5418f4eb"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(190,310023,'insert','blocks','{"block_hash":"b03042b4e18a222b4c8d1e9e1970d93e6e2a2d41686d227ff8ecf0a839223dc5","block_index":310024,"block_time":310024000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(191,310024,'parse','blocks','{"block_index":310024,"ledger_hash":"786e9c043df5025bb8d123322e2dd9cba30cc433ff90a44b7b7036369565835b","messages_hash":"9ab46e4d9677c04c33eaf38a5739415b157e5030714de0a236e7be42ff238dc0","txlist_hash":"6a80f89b076199d165801b34c7d292976e069920f2ae4184e09dad8411735b94"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(192,310024,'insert','blocks','{"block_hash":"a872e560766832cc3b4f7f222228cb6db882ce3c54f6459f62c71d5cd6e90666","block_index":310025,"block_time":310025000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(193,310025,'parse','blocks','{"block_index":310025,"ledger_hash":"1a2e0585eb1a7f608b4ca4b1d252f555f87e7f16fff124ed869285ec17643059","messages_hash":"20141b1af89156b848ceb20e590be9ff0d54478bcaad039be244306aef734642","txlist_hash":"a2110149cc4e90d1474c53bdf91e24f8bbb8931548542a6afda94bc343fe3a7f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(194,310025,'insert','blocks','{"block_hash":"6c96350f6f2f05810f19a689de235eff975338587194a36a70dfd0fcd490941a","block_index":310026,"block_time":310026000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(195,310026,'parse','blocks','{"block_index":310026,"ledger_hash":"44a1f10e2df25328c38e20c36029bff557c7a93784030ece591406df9c71ebd6","messages_hash":"63504129b0e9f989d9c6f9ab21687c26b7202d9cf0f03f79958385033f163464","txlist_hash":"d087d907b7af1ac1171c61f00c756754fc94e0edf0dc265d9eced163a07357c1"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(196,310026,'insert','blocks','{"block_hash":"d7acfac66df393c4482a14c189742c0571b89442eb7f817b34415a560445699e","block_index":310027,"block_time":310027000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(197,310027,'parse','blocks','{"block_index":310027,"ledger_hash":"093f82c2b8e108242edc6dad72e5878700b9c33606c359e673bdfe65341db64a","messages_hash":"66093532b874150a5943bf3868b6f76cfcd695755d97035987429f4cfa0edeb5","txlist_hash":"5796b7de2e12cda876546b21e2a64e92b85792c201f39fe404e7fa6c395e78db"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(198,310027,'insert','blocks','{"block_hash":"02409fcf8fa06dafcb7f11e38593181d9c42cc9d5e2ddc304d098f990bd9530b","block_index":310028,"block_time":310028000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(199,310028,'parse','blocks','{"block_index":310028,"ledger_hash":"efac93e04f7cd9d3b1c0af3da102c29b50d940b4b5687fb0061b3b6e169290f6","messages_hash":"de99b16970903ae65ce92f70f7d0a8da9ad74db4c483e2d4447cb548982d0bc9","txlist_hash":"5daed82ccefd923a597451b918ece6172dbc75df5cd53ea0f7e40065e3d0d929"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(200,310028,'insert','blocks','{"block_hash":"3c739fa8b40c118d5547ea356ee8d10ee2898871907643ec02e5db9d00f03cc6","block_index":310029,"block_time":310029000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(201,310029,'parse','blocks','{"block_index":310029,"ledger_hash":"1fa464e853787685a588de6dab287456de7a0efdcd76052a41ddaf5e2f85a648","messages_hash":"f3b6cd92ef9d32c924d0ce7881b825fa846c06a58bbc075502484ed976f8f528","txlist_hash":"818415429923b4a38cb65dddb4e8b8a17264cea0188e905d4a19db340e98ef82"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(202,310029,'insert','blocks','{"block_hash":"d5071cddedf89765ee0fd58f209c1c7d669ba8ea66200a57587da8b189b9e4f5","block_index":310030,"block_time":310030000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(203,310030,'parse','blocks','{"block_index":310030,"ledger_hash":"fee866f1cf6e5f83010b97e0e9d88b54ce43fdf45e89081ba3b2fe07b62434fc","messages_hash":"c61b51630aa3cec277cb59ae2f322a8abd57699b6f090b731564d2e6d00f4810","txlist_hash":"7e3fb0dc1ce885afb71be88ad0ca3b189202535d328ff70bda7cceaede6813bb"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(204,310030,'insert','blocks','{"block_hash":"0b02b10f41380fff27c543ea8891ecb845bf7a003ac5c87e15932aff3bfcf689","block_index":310031,"block_time":310031000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(205,310031,'parse','blocks','{"block_index":310031,"ledger_hash":"11ed526c46610698e7a4f102ae91755a541d668750ec3bc10decd0c1709d1115","messages_hash":"6e82edc73115783e4515dc3c8f34c62c906da0c0c882c4ab621a4adf58ad11b5","txlist_hash":"e3044e5fc57d122eb707d271ca1f4248358a8f477a6466cedb739e7799351bb8"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(206,310031,'insert','blocks','{"block_hash":"66346be81e6ba04544f2ae643b76c2b7b1383f038fc2636e02e49dc7ec144074","block_index":310032,"block_time":310032000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(207,310032,'update','orders','{"status":"expired","tx_hash":"6d3c6a9ea36e82a0e8162f69c68fc8bb95d316ad5586a30553fbaf1717f4121e"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(208,310032,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBB","block_index":310032,"calling_function":"cancel order","event":"6d3c6a9ea36e82a0e8162f69c68fc8bb95d316ad5586a30553fbaf1717f4121e","quantity":50000000,"tx_index":0}',0,'CREDIT');
-INSERT INTO messages VALUES(209,310032,'insert','order_expirations','{"block_index":310032,"order_hash":"6d3c6a9ea36e82a0e8162f69c68fc8bb95d316ad5586a30553fbaf1717f4121e","source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2"}',0,'ORDER_EXPIRATION');
-INSERT INTO messages VALUES(210,310032,'parse','blocks','{"block_index":310032,"ledger_hash":"7930e5a2c6150df64dfd995801aec68ce11df292e206f08f7ff20eda9ca2d017","messages_hash":"9e5bd4348011a4bfd4f91b9ecfa75389c87204381308a38032ccbfd463529617","txlist_hash":"cbe01ce5a4da72538e9310180de025f141ea8baf1b6eeede8164cac3488532fe"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(211,310032,'insert','blocks','{"block_hash":"999c65df9661f73e8c01f1da1afda09ac16788b72834f0ff5ea3d1464afb4707","block_index":310033,"block_time":310033000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(212,310033,'parse','blocks','{"block_index":310033,"ledger_hash":"c5834a54b3ad7f9fdbb18a87c8cefe867eff2ba1ae5bff238a3a041431d0afdd","messages_hash":"907ed29694aefd86edfbc4a210f60db1de73085d1ef82b5eba6fed922ef2681a","txlist_hash":"81bceadbd9f9b956ed25021e2e0a9f4217c7424522105f8a0ba41c9f78234fcd"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(213,310033,'insert','blocks','{"block_hash":"f552edd2e0a648230f3668e72ddf0ddfb1e8ac0f4c190f91b89c1a8c2e357208","block_index":310034,"block_time":310034000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(214,310034,'parse','blocks','{"block_index":310034,"ledger_hash":"5a4b3f29cb1554ae8f670955df4dde45fdcc57623a50ca7d8f2c78ad79186a7a","messages_hash":"dd328930abb087b56675e8122dc92a7dcd71162ee577f4d482fa176d2a88b3fb","txlist_hash":"0ec430eb4c16f386b5abbd6586133741dfe6c19eb820d388810f3680442d363a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(215,310034,'insert','blocks','{"block_hash":"a13cbb016f3044207a46967a4ba1c87dab411f78c55c1179f2336653c2726ae2","block_index":310035,"block_time":310035000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(216,310035,'parse','blocks','{"block_index":310035,"ledger_hash":"b81834ed9e92514fe7d277378be72e1f81043a615a4b67cb67dbcf97e3c3b43e","messages_hash":"41db3179bc9788824037f2c6341e43178c2013baec35d5144cfd625349ca9b20","txlist_hash":"a883860baff0c6dec150c9d80b8a640401e191312eeebd4e9f21914e7803c46b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(217,310035,'insert','blocks','{"block_hash":"158648a98f1e1bd1875584ce8449eb15a4e91a99a923bbb24c4210135cef0c76","block_index":310036,"block_time":310036000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(218,310036,'parse','blocks','{"block_index":310036,"ledger_hash":"736adff04611f10a4e384b5d5c44651bdf037c0caeb8dda5bedbbc6d18d04ca2","messages_hash":"e47efff42238d0792a847ce03c257ebc6a98df5b2ed2aa6794deb87bb1762714","txlist_hash":"821ad697a76d9a35b14a7c388b65b4f3a86fc66c42e02af6d568f73e2586beec"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(219,310036,'insert','blocks','{"block_hash":"563acfd6d991ce256d5655de2e9429975c8dceeb221e76d5ec6e9e24a2c27c07","block_index":310037,"block_time":310037000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(220,310037,'parse','blocks','{"block_index":310037,"ledger_hash":"34d49fb14a7ec85ebd02ffe04768f5aa7382ed0ac7f9ae903e71567dc5d9ab67","messages_hash":"c85db66d7f2fc6b8db0dc4a2290e79e34f961b84004b7d0260be4e17d645b209","txlist_hash":"c5ff4e50b07b755c23a6d9ca6dd5efe71a2728c4c662418fab814993be455308"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(221,310037,'insert','blocks','{"block_hash":"b44b4cad12431c32df27940e18d51f63897c7472b70950d18454edfd640490b2","block_index":310038,"block_time":310038000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(222,310038,'parse','blocks','{"block_index":310038,"ledger_hash":"9bfc3bf0ed35dd256f0df04c813dab9dd818238163e6b01842e18815971e7010","messages_hash":"2c2e220375664b0c12fa86da7be19a292aa6fdd5ada46d285df190b50f5d3bb4","txlist_hash":"8a2ea429a26990e70f9c8937d11c58c986f991c55f196416344847435c670849"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(223,310038,'insert','blocks','{"block_hash":"5fa1ae9c5e8a599247458987b006ad3a57f686df1f7cc240bf119e911b56c347","block_index":310039,"block_time":310039000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(224,310039,'parse','blocks','{"block_index":310039,"ledger_hash":"da7a63f22053d1713c805684d14695c31670eaf848bf23eee3331e679744f291","messages_hash":"b203f7b7b307a063a1d329553fb07b2b1dcece4111f3cd0c35b32c3af097d943","txlist_hash":"9f186391b30cc438ae59dabfb18dfca8811193a8fe37cada73d513ad688a80f0"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(225,310039,'insert','blocks','{"block_hash":"7200ded406675453eadddfbb2d14c2a4526c7dc2b5de14bd48b29243df5e1aa3","block_index":310040,"block_time":310040000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(226,310040,'parse','blocks','{"block_index":310040,"ledger_hash":"ddb485115b64342bcb172cc3e77b20effb1294e635459119b59179f3b6a87d66","messages_hash":"c7ce0dc2cbfb4e01ad2d6ee56ba13aa9b1bb7ea41a814d918e62351b5f7e46d6","txlist_hash":"f73c8b5e92181566aeee4ec42a1e50b950fd18680c69c58fe20b5288a915d7e9"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(227,310040,'insert','blocks','{"block_hash":"5db592ff9ba5fac1e030cf22d6c13b70d330ba397f415340086ee7357143b359","block_index":310041,"block_time":310041000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(228,310041,'parse','blocks','{"block_index":310041,"ledger_hash":"b58d05ae5f282f7904c7a759ae5624194b5cb091f43f05d738cb4002a999c26d","messages_hash":"93117028a2487b2bfcaf92829728572bd59794f0ecc6ab6108ad7e2dc620023e","txlist_hash":"73ee837bac9153dbc94c23879192b6c2fd71a9a6148502e8c4693bd342c4feec"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(229,310041,'insert','blocks','{"block_hash":"826fd4701ef2824e9559b069517cd3cb990aff6a4690830f78fc845ab77fa3e4","block_index":310042,"block_time":310042000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(230,310042,'parse','blocks','{"block_index":310042,"ledger_hash":"c18e1989fccd8bc7168ebf2acc035c224a9010b428b81c814683b0ce1e244113","messages_hash":"2d222cb4b49a3a83535b2f026e13759f1ef6faf8ff833e79dfd218a8e2972a7e","txlist_hash":"9ef577154ca6e451585e9dcc4c3690d496b8a666856987194c4e41414743945f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(231,310042,'insert','blocks','{"block_hash":"2254a12ada208f1dd57bc17547ecaf3c44720323c47bc7d4b1262477cb7f3c51","block_index":310043,"block_time":310043000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(232,310043,'parse','blocks','{"block_index":310043,"ledger_hash":"1a935492fce6a168d9aafd24246bba6f5615f53a47311549059b21adc6a67154","messages_hash":"2e99c026842fbb3d0096b55a09d137f21c59b1d5b1d9303b8c02d3e049e471ca","txlist_hash":"29f3ff5d49a8c6ffbf0ddc41a5e45fd3b777fd7c9ea60a914191fc551ac46ea4"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(233,310043,'insert','blocks','{"block_hash":"3346d24118d8af0b3c6bcc42f8b85792e7a2e7036ebf6e4c25f4f6723c78e46b","block_index":310044,"block_time":310044000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(234,310044,'parse','blocks','{"block_index":310044,"ledger_hash":"536611cb3cb3005f8c4ffc5b8ed8271734448b5d6f49bd47eb0456bc4ee207e4","messages_hash":"f45c8d78c1854e9ff54aa0ea675ae1e5267a5b9ee5e41284fdf2bcc8fa49553f","txlist_hash":"6f22c984234616fa84a474dc80c5d5e25ccdbec1a84b0cabb279505e93aa4d6c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(235,310044,'insert','blocks','{"block_hash":"7bba0ab243839e91ad1a45a762bf074011f8a9883074d68203c6d1b46fffde98","block_index":310045,"block_time":310045000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(236,310045,'parse','blocks','{"block_index":310045,"ledger_hash":"ebbeea29c073c61dad3e091302cd945a9926741db0dc6a918792c4c01b8cc30c","messages_hash":"f7e2e1530436138aa604ff4ab4fdf5199c0c14b1307aad7f53992963325b99b8","txlist_hash":"a1d1a029c0bcbe481f8ba760714e266ff9e759844517ceef96bbaefb05652dcd"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(237,310045,'insert','blocks','{"block_hash":"47db6788c38f2d6d712764979e41346b55e78cbb4969e0ef5c4336faf18993a6","block_index":310046,"block_time":310046000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(238,310046,'parse','blocks','{"block_index":310046,"ledger_hash":"d9baff8bec82f3c29f1fa69c9ddd456f1867f33a55d1648605ea7109270d8e07","messages_hash":"79f70931f48bb72ed75656a64ab2de397aa09047ac7609b22611c21b40dd754d","txlist_hash":"26f6ea6c1e350b91f4757619dd52bb7a2b2bad7277497f0d4e1d61b363eb7a99"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(239,310046,'insert','blocks','{"block_hash":"a9ccabcc2a098a7d25e4ab8bda7c4e66807eefa42e29890dcd88149a10de7075","block_index":310047,"block_time":310047000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(240,310047,'parse','blocks','{"block_index":310047,"ledger_hash":"09ad4a6bb3f671e6ac6d595bcbfb82371cc41f35c309142678eb5b7df97a5de5","messages_hash":"24e0e1b61be60f0a0078d5d1ac7e31c287354323e9331e2bf40021cc703358f6","txlist_hash":"5e32dc4d14838fdf0460146fd87eeb59ece3416bb7104362d24fd6d2bf0fe963"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(241,310047,'insert','blocks','{"block_hash":"610bf3935a85b05a98556c55493c6de45bed4d7b3b6c8553a984718765796309","block_index":310048,"block_time":310048000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(242,310048,'parse','blocks','{"block_index":310048,"ledger_hash":"208200708851a32b0ffaecade58f78f8ba7d5820457c582d5ca127e16fec0952","messages_hash":"2597361763116e4e99d7f8d7988dc1c3a1f1316e51703c09a1d02852aa1caa26","txlist_hash":"c0a8253cff82f71d9a90c7b982e5d5093d5c2bbc2ee2859d9d7d09afbef56192"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(243,310048,'insert','blocks','{"block_hash":"4ad2761923ad49ad2b283b640f1832522a2a5d6964486b21591b71df6b33be3c","block_index":310049,"block_time":310049000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(244,310049,'parse','blocks','{"block_index":310049,"ledger_hash":"9d1a7335d989bb73b0363bc88da6dd82c0fbaf064b1d70708b0aa2f6a8a9958b","messages_hash":"17d15d7933015f793185bd1eae6e311471e2cdf3c15df12eef904447206625a2","txlist_hash":"c07861a54cc9537b7a2486e5a7e6366cd04413fb1307712ec6af55588dd22cfc"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(245,310049,'insert','blocks','{"block_hash":"8cfeb60a14a4cec6e9be13d699694d49007d82a31065a17890383e262071e348","block_index":310050,"block_time":310050000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(246,310050,'parse','blocks','{"block_index":310050,"ledger_hash":"2fd9039e49fcbb070315defae275bed858cfbb539bc4db8f2ec5f5ff6d69ea25","messages_hash":"e9d18500e588b2ee026e997cf3bf94d83180495f1ed9a943591b63d99c379e1f","txlist_hash":"0ae948495f47c1ad343052f786467c6236cd6ca23dce0c628503a44ada8f8329"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(247,310050,'insert','blocks','{"block_hash":"b53c90385dd808306601350920c6af4beb717518493fd23b5c730eea078f33e6","block_index":310051,"block_time":310051000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(248,310051,'parse','blocks','{"block_index":310051,"ledger_hash":"2e97864865a020b04ed60b22c347d9dbebce5d00abce86c2b3a5054a3184699b","messages_hash":"db5355867330ece23a480053220efc0a9c0e2adc29c43066b897db1f8be5ce5d","txlist_hash":"986536c5e9cec38d9b78bef44e21e73f93a654b9c421c7822dcba475b14f2127"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(249,310051,'insert','blocks','{"block_hash":"0acdacf4e4b6fca756479cb055191b367b1fa433aa558956f5f08fa5b7b394e2","block_index":310052,"block_time":310052000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(250,310052,'parse','blocks','{"block_index":310052,"ledger_hash":"f6a8e9f4cde78fbf6c9a5ea176312116f3813f2c0bcaee6c92f3beb13a8c3899","messages_hash":"d42146acaf047c28ad0bff965c05dcefaf06d898828e4a538d9fd1a7422e3e89","txlist_hash":"4ffb95c683e1839d31018cc7ec92e978014b8cd32f308c2819ff2e79ff60fa2d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(251,310052,'insert','blocks','{"block_hash":"68348f01b6dc49b2cb30fe92ac43e527aa90d859093d3bf7cd695c64d2ef744f","block_index":310053,"block_time":310053000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(252,310053,'parse','blocks','{"block_index":310053,"ledger_hash":"1d84e4657febaa291b4873d808d9ab433370227976196fd6436a65839c3575d1","messages_hash":"cea5b93f173a27746ed90eb780446303b38fa611548f5641f24381973435570b","txlist_hash":"0ed99730b61327cff9ed15d8585f70d7629b2b10150a717093dac4fafcc4e737"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(253,310053,'insert','blocks','{"block_hash":"a8b5f253df293037e49b998675620d5477445c51d5ec66596e023282bb9cd305","block_index":310054,"block_time":310054000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(254,310054,'parse','blocks','{"block_index":310054,"ledger_hash":"083f6b773191caaf1844f47c53077e8724e100d0b46461ddaa642b88d5265c9a","messages_hash":"73b50c51dd56dc45dfd626e0051250cdbebd9ce256952530fd0b6710a3cba150","txlist_hash":"69aa5d1c74c026da7b7cebe352bd6d907a31174cfd6f346e09382b0cf3fb8239"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(255,310054,'insert','blocks','{"block_hash":"4b069152e2dc82e96ed8a3c3547c162e8c3aceeb2a4ac07972f8321a535b9356","block_index":310055,"block_time":310055000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(256,310055,'parse','blocks','{"block_index":310055,"ledger_hash":"b1302087b804fc5753df5a4d8aaf8626e80ff99b429f52fed97767b051c24e8c","messages_hash":"7a31dd7f45427e5ed38234de010caee7ef9713c09191aedc7ce9279a4dfd9059","txlist_hash":"e35d2a19e5b60e2534a36d8c1d0c14c6211d56c29b4aa4953a14bf0b83bcc405"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(257,310055,'insert','blocks','{"block_hash":"7603eaed418971b745256742f9d2ba70b2c2b2f69f61de6cc70e61ce0336f9d3","block_index":310056,"block_time":310056000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(258,310056,'parse','blocks','{"block_index":310056,"ledger_hash":"956c9ca0b51eaba7343703a165eb96d5947fc764457ef3dde5ca90c18d3b2f3d","messages_hash":"7c37e4f5dcbb655f768081f89e89f74a8dfa368459e2c65c34e41f4904709f0b","txlist_hash":"165a88d3d459ce6f4f37cc2ddb1c365dd01542b102dc68181d41b95ebde044dd"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(259,310056,'insert','blocks','{"block_hash":"4a5fdc84f2d66ecb6ee3e3646aad20751ce8694e64e348d3c8aab09d33a3e411","block_index":310057,"block_time":310057000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(260,310057,'parse','blocks','{"block_index":310057,"ledger_hash":"e86cae3e73aa13e8498a98de335ed0cbdb7899b24e91839bbf0f50aa22355ecb","messages_hash":"cb8ea0fe610cd5906ffe9de26da5d5b2635ddfc88ececfe465e2f9711bcfda04","txlist_hash":"37394f57952a82ab5fb6ceb7323152d83f3c911a533e289c55b531fc83269268"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(261,310057,'insert','blocks','{"block_hash":"a6eef3089896f0cae0bfe9423392e45c48f4efe4310b14d8cfbdb1fea613635f","block_index":310058,"block_time":310058000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(262,310058,'parse','blocks','{"block_index":310058,"ledger_hash":"54bd5e4fc1bc17df27f9e6f22b5e1facd82229a877e09ec0136f878f2da81344","messages_hash":"34d713c9ef3e60d682f178fa7dbe1daf4f12a64fc8143a01e036666da1f4f46a","txlist_hash":"ebd7b1c7c24aa51a0622e244d1b486d4bde8b1019d86e1d8845b6e90847ad09b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(263,310058,'insert','blocks','{"block_hash":"ab505de874c43f97c90be1c26a769e6c5cb140405c993b4a6cc7afc795f156a9","block_index":310059,"block_time":310059000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(264,310059,'parse','blocks','{"block_index":310059,"ledger_hash":"1403832427d4c482b0d2d925e08a72fe37f5aaa6af73e74f601f7e22fdad7662","messages_hash":"5d1b34371d873a0b08e072ba89187bf5f51e9d1bd9471b3a9ad8c3cc0374adca","txlist_hash":"cb71b795988456a345fd21a3c729005ab802707d54311480012920f07db40bc9"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(265,310059,'insert','blocks','{"block_hash":"974ad5fbef621e0a38eab811608dc9afaf10c8ecc85fed913075ba1a145e889b","block_index":310060,"block_time":310060000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(266,310060,'parse','blocks','{"block_index":310060,"ledger_hash":"7b08f124a953d0e5511b0698d3314f5ec71ebba77b94c4d236ff9738d5a587e8","messages_hash":"e52e415923ef293e6c5a234251c4298558d2d739934fb7efdf6fc6c56c341ece","txlist_hash":"cf47be21938b5a55ffb8eba6a9f63eb61b89e679b279d75080571832bf08c0e0"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(267,310060,'insert','blocks','{"block_hash":"35d267d21ad386e7b7632292af1c422b0310dde7ca49a82f9577525a29c138cf","block_index":310061,"block_time":310061000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(268,310061,'parse','blocks','{"block_index":310061,"ledger_hash":"1de158dfd18413618b9800236a2aa265d2fab497b09a839be408da8871b0960a","messages_hash":"739ac804a6f6728dbb657d1c6e918b357b3bca5b468bd919a413f4c826737ac5","txlist_hash":"a9c1a3c24a410649e701fc0b321b2030b6fc35de7a2538a10e75b482cbe96b3f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(269,310061,'insert','blocks','{"block_hash":"b31a0054145319ef9de8c1cb19df5bcf4dc8a1ece20053aa494e5d3a00a2852f","block_index":310062,"block_time":310062000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(270,310062,'parse','blocks','{"block_index":310062,"ledger_hash":"aa4be540bad6cd762a02b77856c3d6a737d90245e71f61b63a426573bffb3a4a","messages_hash":"54d67ccdcc62ff368fd5344c672b89a1b1e70cab962fc124ff44562a8669bd40","txlist_hash":"93d0499dcc4fc819927eed8d1eec8b094eb5a4323b70d2cec33d568e31737ce4"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(271,310062,'insert','blocks','{"block_hash":"0cbcbcd5b7f2dc288e3a34eab3d4212463a5a56e886804fb4f9f1cf929eadebe","block_index":310063,"block_time":310063000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(272,310063,'parse','blocks','{"block_index":310063,"ledger_hash":"49edce8190c2480fe3c6b3df7c7c5f13d34f67c3aef3b2aa12eaea603153aa83","messages_hash":"6aaade6a270f9a62a4dcaac7b6f1c07cd511a51f0094be18b1c8aff23e7951ef","txlist_hash":"a76d957ffb41dbfd83b8c92ad487582586cdf13ca49dc1dfc30e869afc8ca76b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(273,310063,'insert','blocks','{"block_hash":"e2db8065a195e85cde9ddb868a17d39893a60fb2b1255aa5f0c88729de7cbf30","block_index":310064,"block_time":310064000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(274,310064,'parse','blocks','{"block_index":310064,"ledger_hash":"a2a8c9946cf45490858deb15c8f277ec545854dfc02dc9d248a684c0c3544d6e","messages_hash":"4c574f2119c32253047618cfd26249d088f1f78b7a3122be6132431db5812d9d","txlist_hash":"0270a3faca0bc1a674fbd3632a1edbe8363d5115db8af56f135493f09a63df30"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(275,310064,'insert','blocks','{"block_hash":"8a7bc7a77c831ac4fd11b8a9d22d1b6a0661b07cef05c2e600c7fb683b861d2a","block_index":310065,"block_time":310065000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(276,310065,'parse','blocks','{"block_index":310065,"ledger_hash":"ca1e5d385fd9cec1184d28095a6f4a2ec2914d40cc016309fe322dbb335cf2c3","messages_hash":"917bc990738cda65cd360163d7a69a3d52acfa1d93ef3d39e0684dd323519842","txlist_hash":"85484b37f06238496ca822d539fe09e0e2906d12cf5b6d77c6219af29ec7410a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(277,310065,'insert','blocks','{"block_hash":"b6959be51eb084747d301f7ccaf9e75f2292c9404633b1532e3692659939430d","block_index":310066,"block_time":310066000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(278,310066,'parse','blocks','{"block_index":310066,"ledger_hash":"73519f53874cc8cbe9052bf8dd18c590e0a4bd5bdc2a286c4930e8cfd006a993","messages_hash":"a59263137511047b1accc2820a60c67aaee255e806d3850abeafe6a7de0ebb57","txlist_hash":"9c360f75cdc0788ebf8a530fa967e8eaefc3876b19739dfef2f7307e1af414f2"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(279,310066,'insert','blocks','{"block_hash":"8b08eae98d7193c9c01863fac6effb9162bda010daeacf9e0347112f233b8577","block_index":310067,"block_time":310067000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(280,310067,'parse','blocks','{"block_index":310067,"ledger_hash":"5de09a95e36480de84f9d3c8db3e18b7bf5145f8b6ee6bde57b5c3de11274cbd","messages_hash":"9eef7e51b0077440af3cdd4cd771c9639cc28f7c45baa6a9792e5310382a2119","txlist_hash":"b4a32df829f1f913a9077d0ecd83362230bf893ffd654703538c5fc1c30a181e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(281,310067,'insert','blocks','{"block_hash":"9280e7297ef6313341bc81787a36acfc9af58f83a415afff5e3154f126cf52b5","block_index":310068,"block_time":310068000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(282,310068,'parse','blocks','{"block_index":310068,"ledger_hash":"be6a452931358d500eda0fd2aa3a91b86483fa847a7bf350f23d33d85712592e","messages_hash":"3e98d5f18828f0025e9ae510f23a142b57d1801ea8d4f33426caba2d861be081","txlist_hash":"fc4f551737950e1293a8718899c3b74c2ce76d8d1f58d6e22d10976ffd15eb24"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(283,310068,'insert','blocks','{"block_hash":"486351f0655bf594ffaab1980cff17353b640b63e9c27239109addece189a6f7","block_index":310069,"block_time":310069000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(284,310069,'parse','blocks','{"block_index":310069,"ledger_hash":"5940a47dfa1a1c8bc1e51f1e64100cd0604c74197c88b39f6f7a9d5b763a0b56","messages_hash":"6f2fcc910d98c607fb5b6373ae58afc4d60928eb6de15f43489fbd4221529157","txlist_hash":"53ce1fdeb3b9e39930ad127bc86bc71e7b497f24cc34af2a022200db36ebfa36"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(285,310069,'insert','blocks','{"block_hash":"8739e99f4dee8bebf1332f37f49a125348b40b93b74fe35579dd52bfba4fa7e5","block_index":310070,"block_time":310070000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(286,310070,'parse','blocks','{"block_index":310070,"ledger_hash":"6aebe68545207e7cc81d68c3aca801f0b39e276ac86e8e0130d5029eefb60e2e","messages_hash":"b24b67a141d2b58200f8e59427c601292b3cf1ffe3b1459bd06984b224be6286","txlist_hash":"0d482039b615aa55b721fef8ddaffcc2942838dbda8784940e9fdd8dba8b1465"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(287,310070,'insert','blocks','{"block_hash":"7a099aa1bba0ead577f1e44f35263a1f115ed6a868c98d4dd71609072ae7f80b","block_index":310071,"block_time":310071000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(288,310071,'parse','blocks','{"block_index":310071,"ledger_hash":"d005aff752907b93e2dfe442896c8976203f0139fb67cda3ea1936aea495e008","messages_hash":"616dba0e803fd874755b060b0585ffa3bfe5777161671e5438501c82a61dd167","txlist_hash":"8be094b2e99ec5c85a594d4a4059b7427ffbee3671190b84161fbf2fadb6f313"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(289,310071,'insert','blocks','{"block_hash":"7b17ecedc07552551b8129e068ae67cb176ca766ea3f6df74b597a94e3a7fc8a","block_index":310072,"block_time":310072000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(290,310072,'parse','blocks','{"block_index":310072,"ledger_hash":"781f0ebe67964c25640f0bf5624e08cda546dbbb6648bd6e8d9f280c7f075f7c","messages_hash":"d49d67e76802bf51725be6edba18b0699a224052de810192c76e1780d6fdd23f","txlist_hash":"9c5e049c1738beda53ffdffe18492b0af038a756278f2bdeaddaa1a726681ce5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(291,310072,'insert','blocks','{"block_hash":"ee0fe3cc9b3a48a2746b6090b63b442b97ea6055d48edcf4b2288396764c6943","block_index":310073,"block_time":310073000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(292,310073,'parse','blocks','{"block_index":310073,"ledger_hash":"83b5e1ca76fda895b144e8c03cda5fc3d18f6324b5413fd74923e51a94ccc53a","messages_hash":"d10c8c167ab11695802fabdfb86811f5e97dfd159eb48726599d1f6db6e8d79d","txlist_hash":"a7199dd9b360cc694f85a81ccf72fd614e6c0400d753132cb517ca9da55df86a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(293,310073,'insert','blocks','{"block_hash":"ceab38dfde01f711a187601731ad575d67cfe0b7dbc61dcd4f15baaef72089fb","block_index":310074,"block_time":310074000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(294,310074,'parse','blocks','{"block_index":310074,"ledger_hash":"4293be396327c0aa3c56c77a9152068cc32612692c76ba94e8961c59a9ad780f","messages_hash":"8ffe9a16041d01db32f197ac722248cc5a965f8b898b9993fd22a85eea5db562","txlist_hash":"833f9d3ae03e5819eec47318d948999dfbe35fcbe66766f985b6ca71eccae54a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(295,310074,'insert','blocks','{"block_hash":"ef547198c6e36d829f117cfd7077ccde45158e3c545152225fa24dba7a26847b","block_index":310075,"block_time":310075000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(296,310075,'parse','blocks','{"block_index":310075,"ledger_hash":"d08b93b609f1766534cb0c30502350b9e4ccc4a885ebff7633e9e5c5b52d8e90","messages_hash":"292b6736907d722669ccff7de41f5768bf856990f27bed1bc6bbae4d86a698b0","txlist_hash":"7db8bbcaa76b087fbcdbd8f5b428b3587c494f0cd7d458a2d519abb0ef26f424"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(297,310075,'insert','blocks','{"block_hash":"3b0499c2e8e8f0252c7288d4ecf66efc426ca37aad3524424d14c8bc6f8b0d92","block_index":310076,"block_time":310076000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(298,310076,'parse','blocks','{"block_index":310076,"ledger_hash":"06c72d219df429f2873af74b6250f3d12996cce14496d151bf8bd4cf819532e4","messages_hash":"454f362796ec85e40ff999ad703786cb1566dc265cbad79679a21863df744616","txlist_hash":"8f6a902dd8d5d573658f07e8ac598ccc46ed49bff95b2a9ed89a051c852215a5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(299,310076,'insert','blocks','{"block_hash":"d2adeefa9024ab3ff2822bc36acf19b6c647cea118cf15b86c6bc00c3322e7dd","block_index":310077,"block_time":310077000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(300,310077,'parse','blocks','{"block_index":310077,"ledger_hash":"0ff019cc4b9b8a394aad1b9f8f579fd5c4cc48a846e4fe71ab2f45226cec5a1e","messages_hash":"f1fd80fbd94b33058c5f6c79aba84481468967589830db3d32883d8543d32367","txlist_hash":"e1ab0a4cbd4e60c5b1da333c5ef542bbc1d8bbd7709fdb35374c072a1f54d38c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(301,310077,'insert','blocks','{"block_hash":"f6c17115ef0efe489c562bcda4615892b4d4b39db0c9791fe193d4922bd82cd6","block_index":310078,"block_time":310078000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(302,310078,'parse','blocks','{"block_index":310078,"ledger_hash":"6ea40a02464725d0ba45b9969bdbb7529ae5e3ca794ae00abf4783bfc9667104","messages_hash":"ced300cd87e34fe62b096d945571be63ab5bba0fc53d62541a52f6c1274f6e3e","txlist_hash":"be6f6965b6ba8aae157eb48f28bce3fa91c3bbc22b88fc3ee8d4f126c1538032"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(303,310078,'insert','blocks','{"block_hash":"f2fbd2074d804e631db44cb0fb2e1db3fdc367e439c21ffc40d73104c4d7069c","block_index":310079,"block_time":310079000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(304,310079,'parse','blocks','{"block_index":310079,"ledger_hash":"076abf036bd51c47525fe4e638dbad403a8a1667a5b7c2f81ffc2a70e79b80a8","messages_hash":"dfd50e735f06f6aae4bcd58b484f39021e38ee290d41240b18b1744d3de653f7","txlist_hash":"eb97110f496f9813e14f127af2cdcdb26d54e9745e274fe227fb0646cc132c29"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(305,310079,'insert','blocks','{"block_hash":"42943b914d9c367000a78b78a544cc4b84b1df838aadde33fe730964a89a3a6c","block_index":310080,"block_time":310080000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(306,310080,'parse','blocks','{"block_index":310080,"ledger_hash":"8cc2e62f7b3ae2c89977ee9e31acacff38f944d00a978e9b0e48678487cdbe27","messages_hash":"4b3120593291e81d0a0519478f45b1c17aad478f384964dadbb6631295912aa7","txlist_hash":"93c6c5967f4d297df962f2853f2a2ba3870f5692c8835413c08528cf243985dc"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(307,310080,'insert','blocks','{"block_hash":"6554f9d307976249e7b7e260e08046b3b55d318f8b6af627fed5be3063f123c4","block_index":310081,"block_time":310081000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(308,310081,'parse','blocks','{"block_index":310081,"ledger_hash":"ec86fa6786b598b091121fc2001650bc04668d26d88805efff7271312c76a373","messages_hash":"815500c2b55e7b9eadf7b1436407dc29d17fcbd5145aee3cc14b9559fdc38600","txlist_hash":"e6cf70178316b3c594c60d10ac1ee3783f1dafe5054ce4c6fb932bf3c771f703"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(309,310081,'insert','blocks','{"block_hash":"4f1ef91b1dcd575f8ac2e66a67715500cbca154bd6f3b8148bb7015a6aa6c644","block_index":310082,"block_time":310082000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(310,310082,'parse','blocks','{"block_index":310082,"ledger_hash":"6b720db96b2d10816e5022ab8c61fafba49cc6bf484909fb500295451e61f768","messages_hash":"33014d2d503328d843a057ed2d544af2dd00c7c7dfe923c4494d5f04a5e5ea2c","txlist_hash":"254cf1d1ac865c611a3d9fbd78001152928a52ad94fd640c526e043ce7c0fdb3"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(311,310082,'insert','blocks','{"block_hash":"9b1f6fd6ff9b0dc4e37603cfb0625f49067c775b99e12492afd85392d3c8d850","block_index":310083,"block_time":310083000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(312,310083,'parse','blocks','{"block_index":310083,"ledger_hash":"d8c6fabb9b9dff0f1f3ba35e75c08be55dc4ded8dcf54e51f0cd857625b87dc8","messages_hash":"7b5d4bd5a47db25e25b6fbfed91c263663202753248a1953369da64a782ac8cb","txlist_hash":"a34f7e98c65b95becae5908e74cfedcb846366a83605f9d8685e98ac629d1278"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(313,310083,'insert','blocks','{"block_hash":"1e0972523e80306441b9f4157f171716199f1428db2e818a7f7817ccdc8859e3","block_index":310084,"block_time":310084000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(314,310084,'parse','blocks','{"block_index":310084,"ledger_hash":"eba03194b13ca764dbfbb86f86d16841df4486f12c26a214f7f1020468b52d27","messages_hash":"b9ce189b79f426b6e6eb9d9bd6ea4272dee9713c93e9d842183ccb6ae66f9211","txlist_hash":"e5a15333b0539a58bcf306d993b0be078d8dfd3cf3f5929a690da5ac534eff5e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(315,310084,'insert','blocks','{"block_hash":"c5b6e9581831e3bc5848cd7630c499bca26d9ece5156d36579bdb72d54817e34","block_index":310085,"block_time":310085000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(316,310085,'parse','blocks','{"block_index":310085,"ledger_hash":"d7fa8085722edc91ea5cb907e439649533e32ad5429b52bc10463629719af5ab","messages_hash":"20abfbccb4ae6786f1ef5249f27b96ce3a561e38705295ae96433606a9ee2f59","txlist_hash":"bfedffe97e2bf812728130721dec204767d92ab05bfcf2c4596b5386fc6ea380"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(317,310085,'insert','blocks','{"block_hash":"080c1dc55a4ecf4824cf9840602498cfc35b5f84099f50b71b45cb63834c7a78","block_index":310086,"block_time":310086000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(318,310086,'parse','blocks','{"block_index":310086,"ledger_hash":"e84e0b26a5a67af1bca0cdadadea17b52b79f160d8acc0281289de1c70bef248","messages_hash":"5f674cafe43098f7d91995019a4796221cb521683242efb9350aebd6f0962761","txlist_hash":"2b4c3ff824d597cc1376a524f89bac6deef025a71395e848b51e9c06002d7f12"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(319,310086,'insert','blocks','{"block_hash":"4ec8cb1c38b22904e8087a034a6406b896eff4dd28e7620601c6bddf82e2738c","block_index":310087,"block_time":310087000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(320,310087,'parse','blocks','{"block_index":310087,"ledger_hash":"ac3522ba0e8278bac956b5f9d7af271424f8e4eff23d57d2a5ff88416dd02ff4","messages_hash":"aa6c5e822ec3d28fab4b599a922cb46afe34d4d8b075d59266bd814704bf3b30","txlist_hash":"2b3b181734d815e3cd024f6fd91b11de8cd457bdc5f833520af281a6c42ab391"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(321,310087,'insert','blocks','{"block_hash":"e945c815c433cbddd0bf8e66c5c23b51072483492acda98f5c2c201020a8c5b3","block_index":310088,"block_time":310088000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(322,310088,'parse','blocks','{"block_index":310088,"ledger_hash":"86255a3e32e6c7a96d0f0a6e7815d61d9a970272f1df38bb0c29ee9f2051f2e4","messages_hash":"1aecea3bd5175ddda4a31d3ffc6dbc1873210b9191b76b4e12e77b96d7e4e53c","txlist_hash":"9092b97fab9af004edd169f26446c6712e5e1ed1d5f94fc5ac0b49565fa65b4b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(323,310088,'insert','blocks','{"block_hash":"0382437f895ef3e7e38bf025fd4f606fd44d4bbd6aea71dbdc4ed11a7cd46f33","block_index":310089,"block_time":310089000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(324,310089,'parse','blocks','{"block_index":310089,"ledger_hash":"9694fd19263381693133a47584432de876ef1e0a32060d52c8db96811ff7d09e","messages_hash":"46153be228fa8f944bbdf64b72e4ab8089c93152fa4e70e99866e57496899e11","txlist_hash":"06ae398816ea8ca96fa424903182c7df9ce93c5d1bdbc2ead089ee71acb90531"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(325,310089,'insert','blocks','{"block_hash":"b756db71dc037b5a4582de354a3347371267d31ebda453e152f0a13bb2fae969","block_index":310090,"block_time":310090000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(326,310090,'parse','blocks','{"block_index":310090,"ledger_hash":"3cb1b469cc6627cbed3f0db1a00370d5c95edf9940f8a4c9406fc78076640d90","messages_hash":"1cb847cbd07a241995f1c2afa6efb8c9557104fae1b36048f241e7b1ff62b63b","txlist_hash":"2c688b2021aa321432ae1bd5a60a9f65cdb6d3720512ca2c304bd2773e7647d9"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(327,310090,'insert','blocks','{"block_hash":"734a9aa485f36399d5efb74f3b9c47f8b5f6fd68c9967f134b14cfe7e2d7583c","block_index":310091,"block_time":310091000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(328,310091,'parse','blocks','{"block_index":310091,"ledger_hash":"cac7cc49c1d632aef2e9bcb3456f60df2ff11110c4e9980989ce0f2d8a5835e1","messages_hash":"e48ef422b958d8058d5cd6aa702072825fd190a03b58f569671ee58d6ca2306f","txlist_hash":"2a7ce0455e84f973c078752f1c0ea93ffdbe993f239baeb7ed947e749c119dfb"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(329,310091,'insert','blocks','{"block_hash":"56386beb65f9228740d4ad43a1c575645f6daf59e0dd9f22551c59215b5e8c3d","block_index":310092,"block_time":310092000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(330,310092,'parse','blocks','{"block_index":310092,"ledger_hash":"1614a317b1144c7f08fb2785bf468bb299b9f19450331b7fdfebd510fa07e574","messages_hash":"ac58d3aa1c81f62a3b39215d28d911e1d7b2c2b16d5fb942dc81c215231d9703","txlist_hash":"270190f8eea6e059acfe66f7369986d3748f707f3ad0eaa2e396a190cc047a6f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(331,310092,'insert','blocks','{"block_hash":"a74a2425f2f4be24bb5f715173e6756649e1cbf1b064aeb1ef60e0b94b418ddc","block_index":310093,"block_time":310093000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(332,310093,'parse','blocks','{"block_index":310093,"ledger_hash":"631d42f4b3fb091a4c67f737bc2da60b8bf9820d27c758f5b9453b40813c5bc5","messages_hash":"af5aec74565edcf44587e0eb2782fc4fc4cf1506001b8a0e45401bc8186ed36b","txlist_hash":"35ca62f9b66717328f41e23c80e72395f4ece758ce3ca9aabe1d1edd87d06016"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(333,310093,'insert','blocks','{"block_hash":"2a8f976f20c4e89ff01071915ac96ee35192d54df3a246bf61fd4a0cccfb5b23","block_index":310094,"block_time":310094000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(334,310094,'parse','blocks','{"block_index":310094,"ledger_hash":"2b3f460da72fc0a9b3a720abca80bff0c44654287de69567c43c62a5557144bf","messages_hash":"3184f5a18eb60486361d3987a39fe534d6d0a5e6fb450dcc8835c6c37e11ed19","txlist_hash":"37d35cf95c6f102413739a672d5dc1c3b0760068de256676b336c631bdc94447"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(335,310094,'insert','blocks','{"block_hash":"bed0fa40c9981223fb40b3be8124ca619edc9dd34d0c907369477ea92e5d2cd2","block_index":310095,"block_time":310095000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(336,310095,'parse','blocks','{"block_index":310095,"ledger_hash":"db62bf94ddb276cf55ddfe73f8023e760788647910807adff6e0672ce1d5e23d","messages_hash":"a73f6efcbccef38fded18f60759919ae1bcdcbb425eaff8b4225d1e6d411c59c","txlist_hash":"2eec38760b106cf52b3bf0fa51198348cb611ae9bb75edd8e4a343e7fef1e042"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(337,310095,'insert','blocks','{"block_hash":"306aeec3db435fabffdf88c2f26ee83caa4c2426375a33daa2be041dbd27ea2f","block_index":310096,"block_time":310096000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(338,310096,'parse','blocks','{"block_index":310096,"ledger_hash":"1c427808f1eb1972df57b51eea9f3405d3d63a1d58c5a3faba616d7160e3a264","messages_hash":"c95f2aa93c30ec8c210a78b3439c66b1586e3eab75991b87296393289c1dbd07","txlist_hash":"be57a1f4088437c89e3bdd7c9456b8ac9dc6011d15ada8d5432ab662f80e9a52"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(339,310096,'insert','blocks','{"block_hash":"13e8e16e67c7cdcc80d477491e554b43744f90e8e1a9728439a11fab42cefadf","block_index":310097,"block_time":310097000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(340,310097,'parse','blocks','{"block_index":310097,"ledger_hash":"cd28b5ac0f80f8815467663c1e90b15ffe46ce067a1b2ce004b0d371cb0ceb16","messages_hash":"f36348ab193e851709e6f1e2977ff3b954bcfc208e81a1a2faff95014cbfc64c","txlist_hash":"cf5fed759ba01d430d2e97ed6d52503a67c35688f02ad6742e87f1da1b468ae0"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(341,310097,'insert','blocks','{"block_hash":"ca5bca4b5ec4fa6183e05176abe921cff884c4e20910fab55b603cef48dc3bca","block_index":310098,"block_time":310098000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(342,310098,'parse','blocks','{"block_index":310098,"ledger_hash":"69adfbe756c116e395fb3a5170b57210ac2721b07144b3d7a35c4327f28e28c9","messages_hash":"ca4a3f93e7ffdbdfce2fdc86ab481462f5d9ea6c30968c939d784a837736b3ef","txlist_hash":"528e0ea934cb95d328ad13fb3a3a47a1d89824ee44abbb2cc271d707bb6d62d1"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(343,310098,'insert','blocks','{"block_hash":"3c4c2279cd7de0add5ec469648a845875495a7d54ebfb5b012dcc5a197b7992a","block_index":310099,"block_time":310099000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(344,310099,'parse','blocks','{"block_index":310099,"ledger_hash":"d50cb66a25a410db360cdf749b5d10932410b5e37c3e5d3d834a65b5671dcca6","messages_hash":"a953aa10f4e569ce2037e817593575ae40b4423b9f857d5b38e09afbf07e1a12","txlist_hash":"f0e0e40238d13f69c9c40cad5b8be218cb09af9bc061e728b56d74a42182788b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(345,310099,'insert','blocks','{"block_hash":"96925c05b3c7c80c716f5bef68d161c71d044252c766ca0e3f17f255764242cb","block_index":310100,"block_time":310100000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(346,310100,'parse','blocks','{"block_index":310100,"ledger_hash":"384f8d2eda5f1b7b8273ef149ac37fcaa9ae51865fd57bd348339579b8a078eb","messages_hash":"23ce68e6c5fde9490e384c6204ce16bcf645cb1fc006622de99beeb1b8ea40e3","txlist_hash":"19ac618404aade5a0914a9a9c159ea229384be303a320b08b9915474beccf1df"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(347,310100,'insert','blocks','{"block_hash":"369472409995ca1a2ebecbad6bf9dab38c378ab1e67e1bdf13d4ce1346731cd6","block_index":310101,"block_time":310101000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(348,310101,'parse','blocks','{"block_index":310101,"ledger_hash":"5eff25450225c71f85f34466d6e359001eed8f05ea5042e7d65c30ccfeb6098f","messages_hash":"d85c0fed7144a53f31159f376756a35a8ce777d7dd174ed300eead63079bfdf0","txlist_hash":"7d02630f0fbe3e5c3b16766f1d04dd1a83c305f74f0546276d970b36e870ba8e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(0,NULL,0,'insert','blocks','{"block_hash":"8b3bef249cb3b0fa23a4936c1249b6bd41daeadc848c8d2e409ea1cbc10adfe7","block_index":309999,"block_time":309999000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1,NULL,309999,'parse','blocks','{"block_index":309999,"ledger_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","messages_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","txlist_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(2,NULL,309999,'insert','blocks','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(3,NULL,310000,'insert','transactions','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"btc_amount":62000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"5fde1c728d8d00aaa1b5f8dae963ceb4fd30c415eb0b8a982ba2d8d676fec0bb","tx_index":1}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(4,NULL,310000,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310000,"calling_function":"burn","event":"5fde1c728d8d00aaa1b5f8dae963ceb4fd30c415eb0b8a982ba2d8d676fec0bb","quantity":93000000000,"tx_index":1}',0,'CREDIT');
+INSERT INTO messages VALUES(5,NULL,310000,'insert','burns','{"block_index":310000,"burned":62000000,"earned":93000000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"5fde1c728d8d00aaa1b5f8dae963ceb4fd30c415eb0b8a982ba2d8d676fec0bb","tx_index":1}',0,'BURN');
+INSERT INTO messages VALUES(6,NULL,310000,'parse','blocks','{"block_index":310000,"ledger_hash":"a16ae7423db132c887ae41cc33b7fa48a0cc6571d5a49e0963be25ec8a9769b4","messages_hash":"72fb35fd107eb57460c13d547f5963136bd2c13d3ded9fc7318f917f7b7bf3e4","txlist_hash":"b8fb4fb649dd315851564165b076d636e5a85e043d59c11877bdccced38f1b3e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(7,NULL,310000,'insert','blocks','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(8,NULL,310001,'insert','transactions','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"btc_amount":1000,"data":"0000000000000000000000010000000002faf080","destination":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"eacd03b732d28924807d4f0cb1c1aa5720a78bf44d23660fb1658a5fd1b4e9a3","tx_index":2}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(9,NULL,310001,'insert','debits','{"action":"send","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310001,"event":"eacd03b732d28924807d4f0cb1c1aa5720a78bf44d23660fb1658a5fd1b4e9a3","quantity":50000000,"tx_index":2}',0,'DEBIT');
+INSERT INTO messages VALUES(10,NULL,310001,'insert','credits','{"address":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310001,"calling_function":"send","event":"eacd03b732d28924807d4f0cb1c1aa5720a78bf44d23660fb1658a5fd1b4e9a3","quantity":50000000,"tx_index":2}',0,'CREDIT');
+INSERT INTO messages VALUES(11,NULL,310001,'insert','sends','{"asset":"XCP","block_index":310001,"destination":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","quantity":50000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"eacd03b732d28924807d4f0cb1c1aa5720a78bf44d23660fb1658a5fd1b4e9a3","tx_index":2}',0,'SEND');
+INSERT INTO messages VALUES(12,NULL,310001,'parse','transactions','{"supported":true,"tx_hash":"eacd03b732d28924807d4f0cb1c1aa5720a78bf44d23660fb1658a5fd1b4e9a3","tx_index":2}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(13,NULL,310001,'parse','blocks','{"block_index":310001,"ledger_hash":"0cda5c4a26f0b23d5b948142dcd226b2718c57c9c6a481250128a7a1c8ad30dc","messages_hash":"aff0be14b9e6ace9e4d6333cf04061ef6447598c02d9b27fac1d939df31aa09c","txlist_hash":"1c009ff73127980e51ba6a7035bec5c2a9650b5a184da1d55c3d807fa658f8e7"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(14,NULL,310001,'insert','blocks','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(15,NULL,310002,'insert','transactions','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"btc_amount":0,"data":"0000000a00000000000000000000000002faf08000000000000000010000000005f5e100000a0000000000000000","destination":"","fee":1000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"025ca2c1784ca3c9389b9f227a5a04445908337e21e2ef9411c890e20aff61c0","tx_index":3}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(16,NULL,310002,'insert','orders','{"block_index":310002,"expiration":10,"expire_index":310012,"fee_provided":1000000,"fee_provided_remaining":1000000,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":100000000,"get_remaining":100000000,"give_asset":"BTC","give_quantity":50000000,"give_remaining":50000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","tx_hash":"025ca2c1784ca3c9389b9f227a5a04445908337e21e2ef9411c890e20aff61c0","tx_index":3}',0,'OPEN_ORDER');
+INSERT INTO messages VALUES(17,NULL,310002,'parse','transactions','{"supported":true,"tx_hash":"025ca2c1784ca3c9389b9f227a5a04445908337e21e2ef9411c890e20aff61c0","tx_index":3}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(18,NULL,310002,'parse','blocks','{"block_index":310002,"ledger_hash":"657c31576766cf1f8a699a14e6c7493498673f1948bea1be4f639247f4d52d53","messages_hash":"3f32659dd96a8649fd53b83ac36a4fc05acaac73db54738573b8642b7875f787","txlist_hash":"c674bb5077acb71ab19a6a4a8f779015846135e7b93a5006555fe1f4ad10c58e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(19,NULL,310002,'insert','blocks','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(20,NULL,310003,'insert','transactions','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"btc_amount":0,"data":"0000000a00000000000000010000000006422c4000000000000000000000000002faf080000a00000000000dbba0","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee","tx_index":4}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(21,NULL,310003,'insert','debits','{"action":"open order","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310003,"event":"c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee","quantity":105000000,"tx_index":4}',0,'DEBIT');
+INSERT INTO messages VALUES(22,NULL,310003,'insert','orders','{"block_index":310003,"expiration":10,"expire_index":310013,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":900000,"fee_required_remaining":900000,"get_asset":"BTC","get_quantity":50000000,"get_remaining":50000000,"give_asset":"XCP","give_quantity":105000000,"give_remaining":105000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","tx_hash":"c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee","tx_index":4}',0,'OPEN_ORDER');
+INSERT INTO messages VALUES(23,NULL,310003,'update','orders','{"fee_provided_remaining":142858,"fee_required_remaining":0,"get_remaining":0,"give_remaining":0,"status":"open","tx_hash":"025ca2c1784ca3c9389b9f227a5a04445908337e21e2ef9411c890e20aff61c0"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(24,NULL,310003,'update','orders','{"fee_provided_remaining":6800,"fee_required_remaining":42858,"get_remaining":0,"give_remaining":5000000,"status":"open","tx_hash":"c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(25,NULL,310003,'insert','order_matches','{"backward_asset":"XCP","backward_quantity":100000000,"block_index":310003,"fee_paid":857142,"forward_asset":"BTC","forward_quantity":50000000,"id":"025ca2c1784ca3c9389b9f227a5a04445908337e21e2ef9411c890e20aff61c0_c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee","match_expire_index":310023,"status":"pending","tx0_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx0_block_index":310002,"tx0_expiration":10,"tx0_hash":"025ca2c1784ca3c9389b9f227a5a04445908337e21e2ef9411c890e20aff61c0","tx0_index":3,"tx1_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx1_block_index":310003,"tx1_expiration":10,"tx1_hash":"c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee","tx1_index":4}',0,'ORDER_MATCH');
+INSERT INTO messages VALUES(26,NULL,310003,'parse','transactions','{"supported":true,"tx_hash":"c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee","tx_index":4}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(27,NULL,310003,'parse','blocks','{"block_index":310003,"ledger_hash":"e11e7eeb21ff539c27324c94a407dc6f04c739f3ed9841f9f661bf4441e4d847","messages_hash":"85ce063a964cd9bc7d1b5803ebd4a0f460cd48e5be820968cd47859025492a45","txlist_hash":"105a5c9915547d3ebfe733d284d6e812cada8e86a904510fc196e2f0af5b50a4"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(28,NULL,310003,'insert','blocks','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(29,NULL,310004,'insert','transactions','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"btc_amount":50000000,"data":"0000000b025ca2c1784ca3c9389b9f227a5a04445908337e21e2ef9411c890e20aff61c0c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":9675,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"b0bf5693ba52a5c6bda34671ba065606bd02277f281e9aa19d25778e26c2f7e2","tx_index":5}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(30,NULL,310004,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310004,"calling_function":"btcpay","event":"b0bf5693ba52a5c6bda34671ba065606bd02277f281e9aa19d25778e26c2f7e2","quantity":100000000,"tx_index":5}',0,'CREDIT');
+INSERT INTO messages VALUES(31,NULL,310004,'update','order_matches','{"id":"025ca2c1784ca3c9389b9f227a5a04445908337e21e2ef9411c890e20aff61c0_c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee","order_match_id":"025ca2c1784ca3c9389b9f227a5a04445908337e21e2ef9411c890e20aff61c0_c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee","status":"completed"}',0,'ORDER_MATCH_UPDATE');
+INSERT INTO messages VALUES(32,NULL,310004,'insert','btcpays','{"block_index":310004,"btc_amount":50000000,"destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","order_match_id":"025ca2c1784ca3c9389b9f227a5a04445908337e21e2ef9411c890e20aff61c0_c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee","source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"b0bf5693ba52a5c6bda34671ba065606bd02277f281e9aa19d25778e26c2f7e2","tx_index":5}',0,'BTC_PAY');
+INSERT INTO messages VALUES(33,NULL,310004,'parse','transactions','{"supported":true,"tx_hash":"b0bf5693ba52a5c6bda34671ba065606bd02277f281e9aa19d25778e26c2f7e2","tx_index":5}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(34,NULL,310004,'parse','blocks','{"block_index":310004,"ledger_hash":"2742a3e99eed62c09d9ecdaf501aa69b0d0b21fc092ca061448d5016957f35e0","messages_hash":"604c56317946ca59a8278817b3802ec346527d2d286d64e2f354179effbe87b0","txlist_hash":"369b47f51b512708e680edc5ba459b91e2a514f5a5c7cb8435670a4b3ed34dbe"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(35,NULL,310004,'insert','blocks','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(36,NULL,310005,'insert','transactions','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"btc_amount":0,"data":"000000140000000000004767000000003b9aca000100000000000000000000","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"93599860b4a4a3b672a79c064812eb18d2e1b532613e08bd3ae1ee2a9979eae2","tx_index":6}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(37,NULL,310005,'insert','debits','{"action":"issuance fee","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310005,"event":"93599860b4a4a3b672a79c064812eb18d2e1b532613e08bd3ae1ee2a9979eae2","quantity":50000000,"tx_index":6}',0,'DEBIT');
+INSERT INTO messages VALUES(38,NULL,310005,'insert','assets','{"asset_id":"18279","asset_longname":null,"asset_name":"BBBB","block_index":310005}',0,'ASSET_CREATION');
+INSERT INTO messages VALUES(39,NULL,310005,'insert','issuances','{"asset":"BBBB","asset_longname":null,"block_index":310005,"call_date":0,"call_price":0.0,"callable":false,"description":"","divisible":true,"fee_paid":50000000,"issuer":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","locked":false,"quantity":1000000000,"reset":false,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","transfer":false,"tx_hash":"93599860b4a4a3b672a79c064812eb18d2e1b532613e08bd3ae1ee2a9979eae2","tx_index":6}',0,'ASSET_ISSUANCE');
+INSERT INTO messages VALUES(40,NULL,310005,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBB","block_index":310005,"calling_function":"issuance","event":"93599860b4a4a3b672a79c064812eb18d2e1b532613e08bd3ae1ee2a9979eae2","quantity":1000000000,"tx_index":6}',0,'CREDIT');
+INSERT INTO messages VALUES(41,NULL,310005,'parse','transactions','{"supported":true,"tx_hash":"93599860b4a4a3b672a79c064812eb18d2e1b532613e08bd3ae1ee2a9979eae2","tx_index":6}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(42,NULL,310005,'parse','blocks','{"block_index":310005,"ledger_hash":"49f526a56f21491c797e8e2559f722ded6f6990b1f69c55dc38791d8d30f4048","messages_hash":"7601e852ffd000c30484a083254b65a7d1d6c72df44ebf568915c7d8fcd72512","txlist_hash":"f0c2ddd7c39b14fc55d8518c65aa0811fe7807ebd1eebb4b66df8459f9e5352b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(43,NULL,310005,'insert','blocks','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(44,NULL,310006,'insert','transactions','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"btc_amount":0,"data":"00000014000000000000476800000000000186a00000000000000000000006666f6f626172","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"3318c4b8b244fbc64f6894d28f7a1866db5671f04d2e4f5911d0fd688f804404","tx_index":7}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(45,NULL,310006,'insert','debits','{"action":"issuance fee","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310006,"event":"3318c4b8b244fbc64f6894d28f7a1866db5671f04d2e4f5911d0fd688f804404","quantity":50000000,"tx_index":7}',0,'DEBIT');
+INSERT INTO messages VALUES(46,NULL,310006,'insert','assets','{"asset_id":"18280","asset_longname":null,"asset_name":"BBBC","block_index":310006}',0,'ASSET_CREATION');
+INSERT INTO messages VALUES(47,NULL,310006,'insert','issuances','{"asset":"BBBC","asset_longname":null,"block_index":310006,"call_date":0,"call_price":0.0,"callable":false,"description":"foobar","divisible":false,"fee_paid":50000000,"issuer":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","locked":false,"quantity":100000,"reset":false,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","transfer":false,"tx_hash":"3318c4b8b244fbc64f6894d28f7a1866db5671f04d2e4f5911d0fd688f804404","tx_index":7}',0,'ASSET_ISSUANCE');
+INSERT INTO messages VALUES(48,NULL,310006,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBC","block_index":310006,"calling_function":"issuance","event":"3318c4b8b244fbc64f6894d28f7a1866db5671f04d2e4f5911d0fd688f804404","quantity":100000,"tx_index":7}',0,'CREDIT');
+INSERT INTO messages VALUES(49,NULL,310006,'parse','transactions','{"supported":true,"tx_hash":"3318c4b8b244fbc64f6894d28f7a1866db5671f04d2e4f5911d0fd688f804404","tx_index":7}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(50,NULL,310006,'parse','blocks','{"block_index":310006,"ledger_hash":"78787c4c9537fc4db5d1dc7d31d4fab6b445d57021aab1a38d4bd6a9404713c5","messages_hash":"914680b3a6ab891815c044f2d4a31422852b4125f1810e9d1179515560f1582f","txlist_hash":"877117b3bd10ddbe6e46f417845085a6bdecd86a4961b99c80e991b4c51e0f5e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(51,NULL,310006,'insert','blocks','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(52,NULL,310007,'insert','transactions','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"btc_amount":1000,"data":"00000000000000000000476700000000003d0900","destination":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"e43d2ab22a3a5fe1de032bdf042381fc1d6fc34794abc51a1b3db46ccf8cbdbe","tx_index":8}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(53,NULL,310007,'insert','debits','{"action":"send","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBB","block_index":310007,"event":"e43d2ab22a3a5fe1de032bdf042381fc1d6fc34794abc51a1b3db46ccf8cbdbe","quantity":4000000,"tx_index":8}',0,'DEBIT');
+INSERT INTO messages VALUES(54,NULL,310007,'insert','credits','{"address":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBB","block_index":310007,"calling_function":"send","event":"e43d2ab22a3a5fe1de032bdf042381fc1d6fc34794abc51a1b3db46ccf8cbdbe","quantity":4000000,"tx_index":8}',0,'CREDIT');
+INSERT INTO messages VALUES(55,NULL,310007,'insert','sends','{"asset":"BBBB","block_index":310007,"destination":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","quantity":4000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"e43d2ab22a3a5fe1de032bdf042381fc1d6fc34794abc51a1b3db46ccf8cbdbe","tx_index":8}',0,'SEND');
+INSERT INTO messages VALUES(56,NULL,310007,'parse','transactions','{"supported":true,"tx_hash":"e43d2ab22a3a5fe1de032bdf042381fc1d6fc34794abc51a1b3db46ccf8cbdbe","tx_index":8}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(57,NULL,310007,'parse','blocks','{"block_index":310007,"ledger_hash":"5cc2599b63007433426c220c59a777b5c37b1165595f2ba239c3ce578c8055ab","messages_hash":"854c4c587b4276b27f3fed020babe5e6b8ab8dd184a4d7ba1432ab6bfab2c6ea","txlist_hash":"702a5772ce8529995f7a66a244e8be495e3f7cbedb7b09f47e3d5aa941c7f4c1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(58,NULL,310007,'insert','blocks','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(59,NULL,310008,'insert','transactions','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"btc_amount":1000,"data":"000000000000000000004768000000000000020e","destination":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"7b48b32b5373757d0bfa50358184117ca01b5ad564ca4338ecb021ae726a19c9","tx_index":9}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(60,NULL,310008,'insert','debits','{"action":"send","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBC","block_index":310008,"event":"7b48b32b5373757d0bfa50358184117ca01b5ad564ca4338ecb021ae726a19c9","quantity":526,"tx_index":9}',0,'DEBIT');
+INSERT INTO messages VALUES(61,NULL,310008,'insert','credits','{"address":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBC","block_index":310008,"calling_function":"send","event":"7b48b32b5373757d0bfa50358184117ca01b5ad564ca4338ecb021ae726a19c9","quantity":526,"tx_index":9}',0,'CREDIT');
+INSERT INTO messages VALUES(62,NULL,310008,'insert','sends','{"asset":"BBBC","block_index":310008,"destination":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","quantity":526,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"7b48b32b5373757d0bfa50358184117ca01b5ad564ca4338ecb021ae726a19c9","tx_index":9}',0,'SEND');
+INSERT INTO messages VALUES(63,NULL,310008,'parse','transactions','{"supported":true,"tx_hash":"7b48b32b5373757d0bfa50358184117ca01b5ad564ca4338ecb021ae726a19c9","tx_index":9}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(64,NULL,310008,'parse','blocks','{"block_index":310008,"ledger_hash":"9550db622e679ff3d63d814f9ffa743d57eb12491b213ef6474617a6c738c3fa","messages_hash":"345a10c31ef469648159999ef16856316259345971b2eec607a5ce57ba556676","txlist_hash":"6c536f7ae10567cbd91945e3e958640e6c65408f83e4a1d93e705950ba39de1b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(65,NULL,310008,'insert','blocks','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(66,NULL,310009,'insert','transactions','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"btc_amount":0,"data":"00000032000000000000025800000000000047670000000000000001","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"cbc73bb03bae7cbaa0e88c9c16cb78fa6f315b9a6383f0f7efb63d0fdd831a81","tx_index":10}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(67,NULL,310009,'insert','debits','{"action":"dividend","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310009,"event":"cbc73bb03bae7cbaa0e88c9c16cb78fa6f315b9a6383f0f7efb63d0fdd831a81","quantity":24,"tx_index":10}',0,'DEBIT');
+INSERT INTO messages VALUES(68,NULL,310009,'insert','debits','{"action":"dividend fee","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310009,"event":"cbc73bb03bae7cbaa0e88c9c16cb78fa6f315b9a6383f0f7efb63d0fdd831a81","quantity":20000,"tx_index":10}',0,'DEBIT');
+INSERT INTO messages VALUES(69,NULL,310009,'insert','credits','{"address":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310009,"calling_function":"dividend","event":"cbc73bb03bae7cbaa0e88c9c16cb78fa6f315b9a6383f0f7efb63d0fdd831a81","quantity":24,"tx_index":10}',0,'CREDIT');
+INSERT INTO messages VALUES(70,NULL,310009,'insert','dividends','{"asset":"BBBB","block_index":310009,"dividend_asset":"XCP","fee_paid":20000,"quantity_per_unit":600,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"cbc73bb03bae7cbaa0e88c9c16cb78fa6f315b9a6383f0f7efb63d0fdd831a81","tx_index":10}',0,'ASSET_DIVIDEND');
+INSERT INTO messages VALUES(71,NULL,310009,'parse','transactions','{"supported":true,"tx_hash":"cbc73bb03bae7cbaa0e88c9c16cb78fa6f315b9a6383f0f7efb63d0fdd831a81","tx_index":10}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(72,NULL,310009,'parse','blocks','{"block_index":310009,"ledger_hash":"08c005dd5bae7f21ca27803d75318ac4b968c6d4dd2c275ef284c03fea43b189","messages_hash":"5ab18e8b7b08bdb2aabef0fb95b3a8d431438f98527f224b19863e1a18e7671b","txlist_hash":"8f8156aca3441754221fbf9cc21b0e7d877a533e00f63950be3f95d0a9305433"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(73,NULL,310009,'insert','blocks','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(74,NULL,310010,'insert','transactions','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"btc_amount":0,"data":"00000032000000000000032000000000000047680000000000000001","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"c59e9803933740537b59928d19d2b65812e6f2b8d1ac811d9262353a19327b97","tx_index":11}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(75,NULL,310010,'insert','debits','{"action":"dividend","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310010,"event":"c59e9803933740537b59928d19d2b65812e6f2b8d1ac811d9262353a19327b97","quantity":420800,"tx_index":11}',0,'DEBIT');
+INSERT INTO messages VALUES(76,NULL,310010,'insert','debits','{"action":"dividend fee","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310010,"event":"c59e9803933740537b59928d19d2b65812e6f2b8d1ac811d9262353a19327b97","quantity":20000,"tx_index":11}',0,'DEBIT');
+INSERT INTO messages VALUES(77,NULL,310010,'insert','credits','{"address":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310010,"calling_function":"dividend","event":"c59e9803933740537b59928d19d2b65812e6f2b8d1ac811d9262353a19327b97","quantity":420800,"tx_index":11}',0,'CREDIT');
+INSERT INTO messages VALUES(78,NULL,310010,'insert','dividends','{"asset":"BBBC","block_index":310010,"dividend_asset":"XCP","fee_paid":20000,"quantity_per_unit":800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"c59e9803933740537b59928d19d2b65812e6f2b8d1ac811d9262353a19327b97","tx_index":11}',0,'ASSET_DIVIDEND');
+INSERT INTO messages VALUES(79,NULL,310010,'parse','transactions','{"supported":true,"tx_hash":"c59e9803933740537b59928d19d2b65812e6f2b8d1ac811d9262353a19327b97","tx_index":11}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(80,NULL,310010,'parse','blocks','{"block_index":310010,"ledger_hash":"07f48634d06e6be1d800e068cd213a648517fe167ed89c355d9db966897ed7b0","messages_hash":"0546e010b64a8b52b22b5806d642b98afa94cd8ba58a7b79fd5468c7d3967e2e","txlist_hash":"c5956a9750e786639ceb4a252a219afef6abb753037888c90ebf17a5c5db079f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(81,NULL,310010,'insert','blocks','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(82,NULL,310011,'insert','transactions','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"btc_amount":0,"data":"0000001e52bb3300405900000000000005f5e0ff09556e69742054657374","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"0a15cc28e58f28a690051e66e6c50ecb68826077d59b75d05590a1db453d9d61","tx_index":12}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(83,NULL,310011,'insert','broadcasts','{"block_index":310011,"fee_fraction_int":99999999,"locked":false,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","text":"Unit Test","timestamp":1388000000,"tx_hash":"0a15cc28e58f28a690051e66e6c50ecb68826077d59b75d05590a1db453d9d61","tx_index":12,"value":100.0}',0,'BROADCAST');
+INSERT INTO messages VALUES(84,NULL,310011,'parse','transactions','{"supported":true,"tx_hash":"0a15cc28e58f28a690051e66e6c50ecb68826077d59b75d05590a1db453d9d61","tx_index":12}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(85,NULL,310011,'parse','blocks','{"block_index":310011,"ledger_hash":"8d0be0b3731bdd0d611e81b48efa6c706a983990f31bc563d57893f705b73aa7","messages_hash":"aa5dc6df82251757a41241459af772cbf946bceda20e4ab304e9c0dc1d54b729","txlist_hash":"219d47523246e5c4ffa99ae9c29bdcfdf9f419bff3d21da76fdc91cfe99fc28d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(86,NULL,310011,'insert','blocks','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(87,NULL,310012,'insert','transactions','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"btc_amount":1000,"data":"00000028000052bb33640000000002faf08000000000017d7840000000000000000000003b100000000a","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"c36b65e3d4c105739d5c8cef470c0878d2e8da138416e09cb499edcec343c0b8","tx_index":13}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(88,NULL,310012,'insert','debits','{"action":"bet","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310012,"event":"c36b65e3d4c105739d5c8cef470c0878d2e8da138416e09cb499edcec343c0b8","quantity":50000000,"tx_index":13}',0,'DEBIT');
+INSERT INTO messages VALUES(89,NULL,310012,'insert','bets','{"bet_type":0,"block_index":310012,"counterwager_quantity":25000000,"counterwager_remaining":25000000,"deadline":1388000100,"expiration":10,"expire_index":310022,"fee_fraction_int":99999999.0,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","leverage":15120,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","target_value":0.0,"tx_hash":"c36b65e3d4c105739d5c8cef470c0878d2e8da138416e09cb499edcec343c0b8","tx_index":13,"wager_quantity":50000000,"wager_remaining":50000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(90,NULL,310012,'parse','transactions','{"supported":true,"tx_hash":"c36b65e3d4c105739d5c8cef470c0878d2e8da138416e09cb499edcec343c0b8","tx_index":13}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(91,NULL,310012,'parse','blocks','{"block_index":310012,"ledger_hash":"e3de05180536ad40eb9007f19ccb819fee0586cb9e7c414dc560e506ae5c09b7","messages_hash":"5322bd28e42ff13238d6bad863782392d07d3c529139d25b5a7859f2065e25ff","txlist_hash":"ce6072bd562a52051fc530ec552aa343e4980a1b236f1cb8318c415d3eb2e851"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(92,NULL,310012,'insert','blocks','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(93,NULL,310013,'insert','transactions','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"btc_amount":1000,"data":"00000028000152bb336400000000017d78400000000002793d60000000000000000000003b100000000a","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"23f77ca0034c19aa841413edfde7f4a3dca8d8ef582ce939dfc2e170c7c811a1","tx_index":14}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(94,NULL,310013,'update','orders','{"status":"expired","tx_hash":"025ca2c1784ca3c9389b9f227a5a04445908337e21e2ef9411c890e20aff61c0"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(95,NULL,310013,'insert','order_expirations','{"block_index":310013,"order_hash":"025ca2c1784ca3c9389b9f227a5a04445908337e21e2ef9411c890e20aff61c0","source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2"}',0,'ORDER_EXPIRATION');
+INSERT INTO messages VALUES(96,NULL,310013,'insert','debits','{"action":"bet","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310013,"event":"23f77ca0034c19aa841413edfde7f4a3dca8d8ef582ce939dfc2e170c7c811a1","quantity":25000000,"tx_index":14}',0,'DEBIT');
+INSERT INTO messages VALUES(97,NULL,310013,'insert','bets','{"bet_type":1,"block_index":310013,"counterwager_quantity":41500000,"counterwager_remaining":41500000,"deadline":1388000100,"expiration":10,"expire_index":310023,"fee_fraction_int":99999999.0,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","leverage":15120,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","target_value":0.0,"tx_hash":"23f77ca0034c19aa841413edfde7f4a3dca8d8ef582ce939dfc2e170c7c811a1","tx_index":14,"wager_quantity":25000000,"wager_remaining":25000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(98,NULL,310013,'update','bets','{"counterwager_remaining":4250000,"status":"open","tx_hash":"c36b65e3d4c105739d5c8cef470c0878d2e8da138416e09cb499edcec343c0b8","wager_remaining":8500000}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(99,NULL,310013,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310013,"calling_function":"filled","event":"23f77ca0034c19aa841413edfde7f4a3dca8d8ef582ce939dfc2e170c7c811a1","quantity":4250000,"tx_index":14}',0,'CREDIT');
+INSERT INTO messages VALUES(100,NULL,310013,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"23f77ca0034c19aa841413edfde7f4a3dca8d8ef582ce939dfc2e170c7c811a1","wager_remaining":4250000}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(101,NULL,310013,'insert','bet_matches','{"backward_quantity":20750000,"block_index":310012,"deadline":1388000100,"fee_fraction_int":99999999,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","forward_quantity":41500000,"id":"c36b65e3d4c105739d5c8cef470c0878d2e8da138416e09cb499edcec343c0b8_23f77ca0034c19aa841413edfde7f4a3dca8d8ef582ce939dfc2e170c7c811a1","initial_value":100.0,"leverage":15120,"match_expire_index":310022,"status":"pending","target_value":0.0,"tx0_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx0_bet_type":0,"tx0_block_index":310012,"tx0_expiration":10,"tx0_hash":"c36b65e3d4c105739d5c8cef470c0878d2e8da138416e09cb499edcec343c0b8","tx0_index":13,"tx1_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx1_bet_type":1,"tx1_block_index":310013,"tx1_expiration":10,"tx1_hash":"23f77ca0034c19aa841413edfde7f4a3dca8d8ef582ce939dfc2e170c7c811a1","tx1_index":14}',0,'BET_MATCH');
+INSERT INTO messages VALUES(102,NULL,310013,'parse','transactions','{"supported":true,"tx_hash":"23f77ca0034c19aa841413edfde7f4a3dca8d8ef582ce939dfc2e170c7c811a1","tx_index":14}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(103,NULL,310013,'parse','blocks','{"block_index":310013,"ledger_hash":"e521556db091cc726fb38cbebfd10923e37dab652c51dca73a646fe5bd81bb96","messages_hash":"53dd35d7fcb3cb00c464d2e5cf8d658b0de66fbdb3c644d862477ec1cf9827ea","txlist_hash":"1a1e24f2debcd4b5b1e350a71823758d3114335ac831367bc91c9e487b94c65c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(104,NULL,310013,'insert','blocks','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(105,NULL,310014,'insert','transactions','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"btc_amount":1000,"data":"00000028000052bb33640000000008f0d1800000000014dc93800000000000000000000013b00000000a","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"a5a1927a83521144a5aa751f61065b530c9447c5b2c35e35064de32dae9573fd","tx_index":15}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(106,NULL,310014,'update','orders','{"status":"expired","tx_hash":"c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(107,NULL,310014,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310014,"calling_function":"cancel order","event":"c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee","quantity":5000000,"tx_index":0}',0,'CREDIT');
+INSERT INTO messages VALUES(108,NULL,310014,'insert','order_expirations','{"block_index":310014,"order_hash":"c6881f7505bd7fe0742c2ce50490e21431705bf2df4368be43f423fa0c515aee","source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2"}',0,'ORDER_EXPIRATION');
+INSERT INTO messages VALUES(109,NULL,310014,'insert','debits','{"action":"bet","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310014,"event":"a5a1927a83521144a5aa751f61065b530c9447c5b2c35e35064de32dae9573fd","quantity":150000000,"tx_index":15}',0,'DEBIT');
+INSERT INTO messages VALUES(110,NULL,310014,'insert','bets','{"bet_type":0,"block_index":310014,"counterwager_quantity":350000000,"counterwager_remaining":350000000,"deadline":1388000100,"expiration":10,"expire_index":310024,"fee_fraction_int":99999999.0,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","leverage":5040,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","target_value":0.0,"tx_hash":"a5a1927a83521144a5aa751f61065b530c9447c5b2c35e35064de32dae9573fd","tx_index":15,"wager_quantity":150000000,"wager_remaining":150000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(111,NULL,310014,'parse','transactions','{"supported":true,"tx_hash":"a5a1927a83521144a5aa751f61065b530c9447c5b2c35e35064de32dae9573fd","tx_index":15}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(112,NULL,310014,'parse','blocks','{"block_index":310014,"ledger_hash":"1cd6d92fbbca9266135a35f20a4328d510c8d209ba6161dc8c9e9bfa69032c57","messages_hash":"2b42fe416ff6b68adcff8c01b8ad5e9e664617e5982215fa404edea66c7ef951","txlist_hash":"80ee1bd354b8e1aa1c2f57926fbd36c0d9e2dbd3f77d8f2e43d59b29bd8175a6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(113,NULL,310014,'insert','blocks','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(114,NULL,310015,'insert','transactions','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"btc_amount":1000,"data":"00000028000152bb33640000000014dc93800000000008f0d1800000000000000000000013b00000000a","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"6aa4c5853aa9971d13c0291c4e91ee5cddd506521942377aca5c3b1a48780c75","tx_index":16}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(115,NULL,310015,'insert','debits','{"action":"bet","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310015,"event":"6aa4c5853aa9971d13c0291c4e91ee5cddd506521942377aca5c3b1a48780c75","quantity":350000000,"tx_index":16}',0,'DEBIT');
+INSERT INTO messages VALUES(116,NULL,310015,'insert','bets','{"bet_type":1,"block_index":310015,"counterwager_quantity":150000000,"counterwager_remaining":150000000,"deadline":1388000100,"expiration":10,"expire_index":310025,"fee_fraction_int":99999999.0,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","leverage":5040,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","target_value":0.0,"tx_hash":"6aa4c5853aa9971d13c0291c4e91ee5cddd506521942377aca5c3b1a48780c75","tx_index":16,"wager_quantity":350000000,"wager_remaining":350000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(117,NULL,310015,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310015,"calling_function":"filled","event":"6aa4c5853aa9971d13c0291c4e91ee5cddd506521942377aca5c3b1a48780c75","quantity":0,"tx_index":16}',0,'CREDIT');
+INSERT INTO messages VALUES(118,NULL,310015,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"a5a1927a83521144a5aa751f61065b530c9447c5b2c35e35064de32dae9573fd","wager_remaining":0}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(119,NULL,310015,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310015,"calling_function":"filled","event":"6aa4c5853aa9971d13c0291c4e91ee5cddd506521942377aca5c3b1a48780c75","quantity":0,"tx_index":16}',0,'CREDIT');
+INSERT INTO messages VALUES(120,NULL,310015,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"6aa4c5853aa9971d13c0291c4e91ee5cddd506521942377aca5c3b1a48780c75","wager_remaining":0}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(121,NULL,310015,'insert','bet_matches','{"backward_quantity":350000000,"block_index":310014,"deadline":1388000100,"fee_fraction_int":99999999,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","forward_quantity":150000000,"id":"a5a1927a83521144a5aa751f61065b530c9447c5b2c35e35064de32dae9573fd_6aa4c5853aa9971d13c0291c4e91ee5cddd506521942377aca5c3b1a48780c75","initial_value":100.0,"leverage":5040,"match_expire_index":310024,"status":"pending","target_value":0.0,"tx0_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx0_bet_type":0,"tx0_block_index":310014,"tx0_expiration":10,"tx0_hash":"a5a1927a83521144a5aa751f61065b530c9447c5b2c35e35064de32dae9573fd","tx0_index":15,"tx1_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx1_bet_type":1,"tx1_block_index":310015,"tx1_expiration":10,"tx1_hash":"6aa4c5853aa9971d13c0291c4e91ee5cddd506521942377aca5c3b1a48780c75","tx1_index":16}',0,'BET_MATCH');
+INSERT INTO messages VALUES(122,NULL,310015,'parse','transactions','{"supported":true,"tx_hash":"6aa4c5853aa9971d13c0291c4e91ee5cddd506521942377aca5c3b1a48780c75","tx_index":16}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(123,NULL,310015,'parse','blocks','{"block_index":310015,"ledger_hash":"62759ea6d5070225bd30253a42b6c68fdaf2c4165b1b221b8e7bdddeb26e9737","messages_hash":"95e6788f7af884c71f7e813de2665e2beddc6faee99015402ec9e8498edf6074","txlist_hash":"30a124b4460d985c715c7bbd85cfbe972a5caf457e45844e0a54daa258ca3376"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(124,NULL,310015,'insert','blocks','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(125,NULL,310016,'insert','transactions','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"btc_amount":1000,"data":"00000028000252bb33c8000000002cb417800000000026be36803ff0000000000000000013b00000000a","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"91cea72c920a13cc450d14c92a81a318462300670308d6b1eb344ac06a72eda1","tx_index":17}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(126,NULL,310016,'insert','debits','{"action":"bet","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310016,"event":"91cea72c920a13cc450d14c92a81a318462300670308d6b1eb344ac06a72eda1","quantity":750000000,"tx_index":17}',0,'DEBIT');
+INSERT INTO messages VALUES(127,NULL,310016,'insert','bets','{"bet_type":2,"block_index":310016,"counterwager_quantity":650000000,"counterwager_remaining":650000000,"deadline":1388000200,"expiration":10,"expire_index":310026,"fee_fraction_int":99999999.0,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","leverage":5040,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","target_value":1.0,"tx_hash":"91cea72c920a13cc450d14c92a81a318462300670308d6b1eb344ac06a72eda1","tx_index":17,"wager_quantity":750000000,"wager_remaining":750000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(128,NULL,310016,'parse','transactions','{"supported":true,"tx_hash":"91cea72c920a13cc450d14c92a81a318462300670308d6b1eb344ac06a72eda1","tx_index":17}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(129,NULL,310016,'parse','blocks','{"block_index":310016,"ledger_hash":"f9fc0dd4d98ac5e06e4f9673cf5678f9fc264cda23172e24427b833331b73c33","messages_hash":"7fd6480d829327edbce5d160651ffe3490f980d0e5f2b0ff6d5328f7e29e75d4","txlist_hash":"cdbbf3665287df62a1660198e00049d06f649f37c49cb76e9fb1eab12960e66c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(130,NULL,310016,'insert','blocks','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(131,NULL,310017,'insert','transactions','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"btc_amount":1000,"data":"00000028000352bb33c80000000026be3680000000002cb417803ff0000000000000000013b00000000a","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"c345c2e6d9899c7729a0ca2ef13fab71ca5808854fb6be62e3b3dcd9225d1c4a","tx_index":18}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(132,NULL,310017,'insert','debits','{"action":"bet","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310017,"event":"c345c2e6d9899c7729a0ca2ef13fab71ca5808854fb6be62e3b3dcd9225d1c4a","quantity":650000000,"tx_index":18}',0,'DEBIT');
+INSERT INTO messages VALUES(133,NULL,310017,'insert','bets','{"bet_type":3,"block_index":310017,"counterwager_quantity":750000000,"counterwager_remaining":750000000,"deadline":1388000200,"expiration":10,"expire_index":310027,"fee_fraction_int":99999999.0,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","leverage":5040,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","target_value":1.0,"tx_hash":"c345c2e6d9899c7729a0ca2ef13fab71ca5808854fb6be62e3b3dcd9225d1c4a","tx_index":18,"wager_quantity":650000000,"wager_remaining":650000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(134,NULL,310017,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310017,"calling_function":"filled","event":"c345c2e6d9899c7729a0ca2ef13fab71ca5808854fb6be62e3b3dcd9225d1c4a","quantity":0,"tx_index":18}',0,'CREDIT');
+INSERT INTO messages VALUES(135,NULL,310017,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"91cea72c920a13cc450d14c92a81a318462300670308d6b1eb344ac06a72eda1","wager_remaining":0}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(136,NULL,310017,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310017,"calling_function":"filled","event":"c345c2e6d9899c7729a0ca2ef13fab71ca5808854fb6be62e3b3dcd9225d1c4a","quantity":0,"tx_index":18}',0,'CREDIT');
+INSERT INTO messages VALUES(137,NULL,310017,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"c345c2e6d9899c7729a0ca2ef13fab71ca5808854fb6be62e3b3dcd9225d1c4a","wager_remaining":0}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(138,NULL,310017,'insert','bet_matches','{"backward_quantity":650000000,"block_index":310016,"deadline":1388000200,"fee_fraction_int":99999999,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","forward_quantity":750000000,"id":"91cea72c920a13cc450d14c92a81a318462300670308d6b1eb344ac06a72eda1_c345c2e6d9899c7729a0ca2ef13fab71ca5808854fb6be62e3b3dcd9225d1c4a","initial_value":100.0,"leverage":5040,"match_expire_index":310026,"status":"pending","target_value":1.0,"tx0_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx0_bet_type":2,"tx0_block_index":310016,"tx0_expiration":10,"tx0_hash":"91cea72c920a13cc450d14c92a81a318462300670308d6b1eb344ac06a72eda1","tx0_index":17,"tx1_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","tx1_bet_type":3,"tx1_block_index":310017,"tx1_expiration":10,"tx1_hash":"c345c2e6d9899c7729a0ca2ef13fab71ca5808854fb6be62e3b3dcd9225d1c4a","tx1_index":18}',0,'BET_MATCH');
+INSERT INTO messages VALUES(139,NULL,310017,'parse','transactions','{"supported":true,"tx_hash":"c345c2e6d9899c7729a0ca2ef13fab71ca5808854fb6be62e3b3dcd9225d1c4a","tx_index":18}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(140,NULL,310017,'parse','blocks','{"block_index":310017,"ledger_hash":"4a355b8e80a902030f384f58700d05da9a6efaae3f3ce0b1a056dc1250d9ec63","messages_hash":"4326f831920bfbfc580e6dbc0b1c8c012c7b46f95f2a57e8cfba5128a8ec7d31","txlist_hash":"355616d4b8b8408ea7061e787ca35918b6d0417895a2a2ff224d207f0f76e02a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(141,NULL,310017,'insert','blocks','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(142,NULL,310018,'insert','transactions','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"btc_amount":0,"data":"0000001e52bb33324058f7256ffc115e004c4b4009556e69742054657374","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"c473921b7c5d877de55ef38b39935e149003d6fec701bea0c8b66b77255942d4","tx_index":19}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(143,NULL,310018,'insert','broadcasts','{"block_index":310018,"fee_fraction_int":5000000,"locked":false,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","text":"Unit Test","timestamp":1388000050,"tx_hash":"c473921b7c5d877de55ef38b39935e149003d6fec701bea0c8b66b77255942d4","tx_index":19,"value":99.86166}',0,'BROADCAST');
+INSERT INTO messages VALUES(144,NULL,310018,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310018,"calling_function":"bet settled: liquidated for bear","event":"c473921b7c5d877de55ef38b39935e149003d6fec701bea0c8b66b77255942d4","quantity":59137500,"tx_index":19}',0,'CREDIT');
+INSERT INTO messages VALUES(145,NULL,310018,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310018,"calling_function":"feed fee","event":"c473921b7c5d877de55ef38b39935e149003d6fec701bea0c8b66b77255942d4","quantity":3112500,"tx_index":19}',0,'CREDIT');
+INSERT INTO messages VALUES(146,NULL,310018,'insert','bet_match_resolutions','{"bear_credit":59137500,"bet_match_id":"c36b65e3d4c105739d5c8cef470c0878d2e8da138416e09cb499edcec343c0b8_23f77ca0034c19aa841413edfde7f4a3dca8d8ef582ce939dfc2e170c7c811a1","bet_match_type_id":1,"block_index":310018,"bull_credit":0,"escrow_less_fee":null,"fee":3112500,"settled":false,"winner":null}',0,'BET_MATCH_RESOLUTON');
+INSERT INTO messages VALUES(147,NULL,310018,'update','bet_matches','{"id":"c36b65e3d4c105739d5c8cef470c0878d2e8da138416e09cb499edcec343c0b8_23f77ca0034c19aa841413edfde7f4a3dca8d8ef582ce939dfc2e170c7c811a1","status":"settled: liquidated for bear"}',0,'BET_MATCH_UPDATE');
+INSERT INTO messages VALUES(148,NULL,310018,'parse','transactions','{"supported":true,"tx_hash":"c473921b7c5d877de55ef38b39935e149003d6fec701bea0c8b66b77255942d4","tx_index":19}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(149,NULL,310018,'parse','blocks','{"block_index":310018,"ledger_hash":"57aee8f9c9b63342ceeea3a3162998e9034a3d624d6d85b19782943ce170cef5","messages_hash":"1933395b09d7e4284e5565db7975d03a7b752fa50af48573e1ef8bd7aaf91964","txlist_hash":"7987b849a43c706d33e421d45e99ca6593c9aa8c69079522888f746a8d4ff748"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(150,NULL,310018,'insert','blocks','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(151,NULL,310019,'insert','transactions','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"btc_amount":0,"data":"0000001e52bb3365405915f3b645a1cb004c4b4009556e69742054657374","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"c9388ea12ab42ec1502dbb54e2da81beca5adee6056777559200aab28e5e1dc0","tx_index":20}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(152,NULL,310019,'insert','broadcasts','{"block_index":310019,"fee_fraction_int":5000000,"locked":false,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","text":"Unit Test","timestamp":1388000101,"tx_hash":"c9388ea12ab42ec1502dbb54e2da81beca5adee6056777559200aab28e5e1dc0","tx_index":20,"value":100.343}',0,'BROADCAST');
+INSERT INTO messages VALUES(153,NULL,310019,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310019,"calling_function":"bet settled","event":"c9388ea12ab42ec1502dbb54e2da81beca5adee6056777559200aab28e5e1dc0","quantity":159300000,"tx_index":20}',0,'CREDIT');
+INSERT INTO messages VALUES(154,NULL,310019,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310019,"calling_function":"bet settled","event":"c9388ea12ab42ec1502dbb54e2da81beca5adee6056777559200aab28e5e1dc0","quantity":315700000,"tx_index":20}',0,'CREDIT');
+INSERT INTO messages VALUES(155,NULL,310019,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310019,"calling_function":"feed fee","event":"c9388ea12ab42ec1502dbb54e2da81beca5adee6056777559200aab28e5e1dc0","quantity":25000000,"tx_index":20}',0,'CREDIT');
+INSERT INTO messages VALUES(156,NULL,310019,'insert','bet_match_resolutions','{"bear_credit":315700000,"bet_match_id":"a5a1927a83521144a5aa751f61065b530c9447c5b2c35e35064de32dae9573fd_6aa4c5853aa9971d13c0291c4e91ee5cddd506521942377aca5c3b1a48780c75","bet_match_type_id":1,"block_index":310019,"bull_credit":159300000,"escrow_less_fee":null,"fee":25000000,"settled":true,"winner":null}',0,'BET_MATCH_RESOLUTON');
+INSERT INTO messages VALUES(157,NULL,310019,'update','bet_matches','{"id":"a5a1927a83521144a5aa751f61065b530c9447c5b2c35e35064de32dae9573fd_6aa4c5853aa9971d13c0291c4e91ee5cddd506521942377aca5c3b1a48780c75","status":"settled"}',0,'BET_MATCH_UPDATE');
+INSERT INTO messages VALUES(158,NULL,310019,'parse','transactions','{"supported":true,"tx_hash":"c9388ea12ab42ec1502dbb54e2da81beca5adee6056777559200aab28e5e1dc0","tx_index":20}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(159,NULL,310019,'parse','blocks','{"block_index":310019,"ledger_hash":"d11f94528a9e0034365e4388ee455f02102d2024c65e1428cdee28b6e5aa7e1c","messages_hash":"f58bd63cd1c639a15c0ef21fbb816bdcfc65555f27e76c7638d632f2f65308ed","txlist_hash":"14d0604fb6986f281715ae660221c79b7bfddf15cbc7da02c722e86b8e264d85"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(160,NULL,310019,'insert','blocks','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(161,NULL,310020,'insert','transactions','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"btc_amount":0,"data":"0000001e52bb33c94000000000000000004c4b4009556e69742054657374","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"54292b0676d266705f8dd0daa1194cff3d16414564f25c422309af75d8ca344e","tx_index":21}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(162,NULL,310020,'insert','broadcasts','{"block_index":310020,"fee_fraction_int":5000000,"locked":false,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","text":"Unit Test","timestamp":1388000201,"tx_hash":"54292b0676d266705f8dd0daa1194cff3d16414564f25c422309af75d8ca344e","tx_index":21,"value":2.0}',0,'BROADCAST');
+INSERT INTO messages VALUES(163,NULL,310020,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310020,"calling_function":"bet settled: for notequal","event":"54292b0676d266705f8dd0daa1194cff3d16414564f25c422309af75d8ca344e","quantity":1330000000,"tx_index":21}',0,'CREDIT');
+INSERT INTO messages VALUES(164,NULL,310020,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310020,"calling_function":"feed fee","event":"54292b0676d266705f8dd0daa1194cff3d16414564f25c422309af75d8ca344e","quantity":70000000,"tx_index":21}',0,'CREDIT');
+INSERT INTO messages VALUES(165,NULL,310020,'insert','bet_match_resolutions','{"bear_credit":null,"bet_match_id":"91cea72c920a13cc450d14c92a81a318462300670308d6b1eb344ac06a72eda1_c345c2e6d9899c7729a0ca2ef13fab71ca5808854fb6be62e3b3dcd9225d1c4a","bet_match_type_id":5,"block_index":310020,"bull_credit":null,"escrow_less_fee":1330000000,"fee":70000000,"settled":null,"winner":"NotEqual"}',0,'BET_MATCH_RESOLUTON');
+INSERT INTO messages VALUES(166,NULL,310020,'update','bet_matches','{"id":"91cea72c920a13cc450d14c92a81a318462300670308d6b1eb344ac06a72eda1_c345c2e6d9899c7729a0ca2ef13fab71ca5808854fb6be62e3b3dcd9225d1c4a","status":"settled: for notequal"}',0,'BET_MATCH_UPDATE');
+INSERT INTO messages VALUES(167,NULL,310020,'parse','transactions','{"supported":true,"tx_hash":"54292b0676d266705f8dd0daa1194cff3d16414564f25c422309af75d8ca344e","tx_index":21}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(168,NULL,310020,'parse','blocks','{"block_index":310020,"ledger_hash":"4397f5568bfcf8cc90d1e72b7c61e7cc6905a0d9d3b3890c33e2afb464a25fb9","messages_hash":"c83c26a59d32bdb9ac99237809b1df16a5ac2ca3102b1c6dc4ebf59b57e6c231","txlist_hash":"5483ead85237ef0ceb3486e3c3e6ee1e5080a5dd602f805b811cedf996b8dbaa"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(169,NULL,310020,'insert','blocks','{"block_hash":"7c2460bb32c5749c856486393239bf7a0ac789587ac71f32e7237910da8097f2","block_index":310021,"block_time":310021000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(170,NULL,310021,'insert','transactions','{"block_hash":"7c2460bb32c5749c856486393239bf7a0ac789587ac71f32e7237910da8097f2","block_index":310021,"block_time":310021000,"btc_amount":0,"data":"0000000a00000000000047670000000002faf08000000000000000010000000002faf080000a0000000000000000","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"6d3c6a9ea36e82a0e8162f69c68fc8bb95d316ad5586a30553fbaf1717f4121e","tx_index":22}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(171,NULL,310021,'insert','debits','{"action":"open order","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBB","block_index":310021,"event":"6d3c6a9ea36e82a0e8162f69c68fc8bb95d316ad5586a30553fbaf1717f4121e","quantity":50000000,"tx_index":22}',0,'DEBIT');
+INSERT INTO messages VALUES(172,NULL,310021,'insert','orders','{"block_index":310021,"expiration":10,"expire_index":310031,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":50000000,"get_remaining":50000000,"give_asset":"BBBB","give_quantity":50000000,"give_remaining":50000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"open","tx_hash":"6d3c6a9ea36e82a0e8162f69c68fc8bb95d316ad5586a30553fbaf1717f4121e","tx_index":22}',0,'OPEN_ORDER');
+INSERT INTO messages VALUES(173,NULL,310021,'parse','transactions','{"supported":true,"tx_hash":"6d3c6a9ea36e82a0e8162f69c68fc8bb95d316ad5586a30553fbaf1717f4121e","tx_index":22}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(174,NULL,310021,'parse','blocks','{"block_index":310021,"ledger_hash":"16b7018344f7a97695eb17dc5921c4955b3f8cf4d9e70bd8628041c4033886b9","messages_hash":"df2718afd201901a86d99a9d0a6d51eae8c18ffd5410c2df3e03f9bc9dc19ad6","txlist_hash":"bd68fe9b7aef054c8a5925dff9ff140cb5c00eb611a8802156196ed486479ad1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(175,NULL,310021,'insert','blocks','{"block_hash":"44435f9a99a0aa12a9bfabdc4cb8119f6ea6a6e1350d2d65445fb66a456db5fc","block_index":310022,"block_time":310022000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(176,NULL,310022,'insert','transactions','{"block_hash":"44435f9a99a0aa12a9bfabdc4cb8119f6ea6a6e1350d2d65445fb66a456db5fc","block_index":310022,"block_time":310022000,"btc_amount":100000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"df080a76ceb263201901bc23c85c3e8dce4eca0e72c873131adaf2f46820e9f1","tx_index":23}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(177,NULL,310022,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310022,"calling_function":"burn","event":"df080a76ceb263201901bc23c85c3e8dce4eca0e72c873131adaf2f46820e9f1","quantity":56999887262,"tx_index":23}',0,'CREDIT');
+INSERT INTO messages VALUES(178,NULL,310022,'insert','burns','{"block_index":310022,"burned":38000000,"earned":56999887262,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"df080a76ceb263201901bc23c85c3e8dce4eca0e72c873131adaf2f46820e9f1","tx_index":23}',0,'BURN');
+INSERT INTO messages VALUES(179,NULL,310022,'parse','blocks','{"block_index":310022,"ledger_hash":"c3c26212677f4aed4614b653f1e5da509f962c29502d22c84c1c5522bca0dcf5","messages_hash":"44ca0135d35e858c86b381ada27e536e525b152a649f50d2707dba4154f181bf","txlist_hash":"109e820ac7d290ecec049098115ba6b467ba90ba624aa24326cc7e103e51b265"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(180,NULL,310022,'insert','blocks','{"block_hash":"d8cf5bec1bbcab8ca4f495352afde3b6572b7e1d61b3976872ebb8e9d30ccb08","block_index":310023,"block_time":310023000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(181,NULL,310023,'insert','transactions','{"block_hash":"d8cf5bec1bbcab8ca4f495352afde3b6572b7e1d61b3976872ebb8e9d30ccb08","block_index":310023,"block_time":310023000,"btc_amount":1000,"data":"0000000000000000000047680000000000002710","destination":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","supported":true,"tx_hash":"abc5e16e5a7a1a7dd7d38ff1351b252a3813d40a695ab798f6a26cb904f91ab1","tx_index":24}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(182,NULL,310023,'update','bets','{"status":"expired","tx_hash":"c36b65e3d4c105739d5c8cef470c0878d2e8da138416e09cb499edcec343c0b8"}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(183,NULL,310023,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310023,"calling_function":"recredit wager remaining","event":"c36b65e3d4c105739d5c8cef470c0878d2e8da138416e09cb499edcec343c0b8","quantity":8500000,"tx_index":0}',0,'CREDIT');
+INSERT INTO messages VALUES(184,NULL,310023,'insert','bet_expirations','{"bet_hash":"c36b65e3d4c105739d5c8cef470c0878d2e8da138416e09cb499edcec343c0b8","bet_index":13,"block_index":310023,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2"}',0,'BET_EXPIRATION');
+INSERT INTO messages VALUES(185,NULL,310023,'insert','debits','{"action":"send","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBC","block_index":310023,"event":"abc5e16e5a7a1a7dd7d38ff1351b252a3813d40a695ab798f6a26cb904f91ab1","quantity":10000,"tx_index":24}',0,'DEBIT');
+INSERT INTO messages VALUES(186,NULL,310023,'insert','credits','{"address":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBC","block_index":310023,"calling_function":"send","event":"abc5e16e5a7a1a7dd7d38ff1351b252a3813d40a695ab798f6a26cb904f91ab1","quantity":10000,"tx_index":24}',0,'CREDIT');
+INSERT INTO messages VALUES(187,NULL,310023,'insert','sends','{"asset":"BBBC","block_index":310023,"destination":"2_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","quantity":10000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","status":"valid","tx_hash":"abc5e16e5a7a1a7dd7d38ff1351b252a3813d40a695ab798f6a26cb904f91ab1","tx_index":24}',0,'SEND');
+INSERT INTO messages VALUES(188,NULL,310023,'parse','transactions','{"supported":true,"tx_hash":"abc5e16e5a7a1a7dd7d38ff1351b252a3813d40a695ab798f6a26cb904f91ab1","tx_index":24}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(189,NULL,310023,'parse','blocks','{"block_index":310023,"ledger_hash":"420b753d9e2a4ae5c00cf65efccb9a657d2daeb19159075d1671a076d8c1ade1","messages_hash":"91081b0be0fff5219493139012532117f008245abc4b50bd36faab48f85be5ff","txlist_hash":"8e03eae75b5f9306a0a8142296412f7271b17f8c751e9e8e1b1cbeca5418f4eb"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(190,NULL,310023,'insert','blocks','{"block_hash":"b03042b4e18a222b4c8d1e9e1970d93e6e2a2d41686d227ff8ecf0a839223dc5","block_index":310024,"block_time":310024000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(191,NULL,310024,'parse','blocks','{"block_index":310024,"ledger_hash":"786e9c043df5025bb8d123322e2dd9cba30cc433ff90a44b7b7036369565835b","messages_hash":"9ab46e4d9677c04c33eaf38a5739415b157e5030714de0a236e7be42ff238dc0","txlist_hash":"6a80f89b076199d165801b34c7d292976e069920f2ae4184e09dad8411735b94"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(192,NULL,310024,'insert','blocks','{"block_hash":"a872e560766832cc3b4f7f222228cb6db882ce3c54f6459f62c71d5cd6e90666","block_index":310025,"block_time":310025000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(193,NULL,310025,'parse','blocks','{"block_index":310025,"ledger_hash":"1a2e0585eb1a7f608b4ca4b1d252f555f87e7f16fff124ed869285ec17643059","messages_hash":"20141b1af89156b848ceb20e590be9ff0d54478bcaad039be244306aef734642","txlist_hash":"a2110149cc4e90d1474c53bdf91e24f8bbb8931548542a6afda94bc343fe3a7f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(194,NULL,310025,'insert','blocks','{"block_hash":"6c96350f6f2f05810f19a689de235eff975338587194a36a70dfd0fcd490941a","block_index":310026,"block_time":310026000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(195,NULL,310026,'parse','blocks','{"block_index":310026,"ledger_hash":"44a1f10e2df25328c38e20c36029bff557c7a93784030ece591406df9c71ebd6","messages_hash":"63504129b0e9f989d9c6f9ab21687c26b7202d9cf0f03f79958385033f163464","txlist_hash":"d087d907b7af1ac1171c61f00c756754fc94e0edf0dc265d9eced163a07357c1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(196,NULL,310026,'insert','blocks','{"block_hash":"d7acfac66df393c4482a14c189742c0571b89442eb7f817b34415a560445699e","block_index":310027,"block_time":310027000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(197,NULL,310027,'parse','blocks','{"block_index":310027,"ledger_hash":"093f82c2b8e108242edc6dad72e5878700b9c33606c359e673bdfe65341db64a","messages_hash":"66093532b874150a5943bf3868b6f76cfcd695755d97035987429f4cfa0edeb5","txlist_hash":"5796b7de2e12cda876546b21e2a64e92b85792c201f39fe404e7fa6c395e78db"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(198,NULL,310027,'insert','blocks','{"block_hash":"02409fcf8fa06dafcb7f11e38593181d9c42cc9d5e2ddc304d098f990bd9530b","block_index":310028,"block_time":310028000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(199,NULL,310028,'parse','blocks','{"block_index":310028,"ledger_hash":"efac93e04f7cd9d3b1c0af3da102c29b50d940b4b5687fb0061b3b6e169290f6","messages_hash":"de99b16970903ae65ce92f70f7d0a8da9ad74db4c483e2d4447cb548982d0bc9","txlist_hash":"5daed82ccefd923a597451b918ece6172dbc75df5cd53ea0f7e40065e3d0d929"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(200,NULL,310028,'insert','blocks','{"block_hash":"3c739fa8b40c118d5547ea356ee8d10ee2898871907643ec02e5db9d00f03cc6","block_index":310029,"block_time":310029000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(201,NULL,310029,'parse','blocks','{"block_index":310029,"ledger_hash":"1fa464e853787685a588de6dab287456de7a0efdcd76052a41ddaf5e2f85a648","messages_hash":"f3b6cd92ef9d32c924d0ce7881b825fa846c06a58bbc075502484ed976f8f528","txlist_hash":"818415429923b4a38cb65dddb4e8b8a17264cea0188e905d4a19db340e98ef82"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(202,NULL,310029,'insert','blocks','{"block_hash":"d5071cddedf89765ee0fd58f209c1c7d669ba8ea66200a57587da8b189b9e4f5","block_index":310030,"block_time":310030000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(203,NULL,310030,'parse','blocks','{"block_index":310030,"ledger_hash":"fee866f1cf6e5f83010b97e0e9d88b54ce43fdf45e89081ba3b2fe07b62434fc","messages_hash":"c61b51630aa3cec277cb59ae2f322a8abd57699b6f090b731564d2e6d00f4810","txlist_hash":"7e3fb0dc1ce885afb71be88ad0ca3b189202535d328ff70bda7cceaede6813bb"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(204,NULL,310030,'insert','blocks','{"block_hash":"0b02b10f41380fff27c543ea8891ecb845bf7a003ac5c87e15932aff3bfcf689","block_index":310031,"block_time":310031000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(205,NULL,310031,'parse','blocks','{"block_index":310031,"ledger_hash":"11ed526c46610698e7a4f102ae91755a541d668750ec3bc10decd0c1709d1115","messages_hash":"6e82edc73115783e4515dc3c8f34c62c906da0c0c882c4ab621a4adf58ad11b5","txlist_hash":"e3044e5fc57d122eb707d271ca1f4248358a8f477a6466cedb739e7799351bb8"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(206,NULL,310031,'insert','blocks','{"block_hash":"66346be81e6ba04544f2ae643b76c2b7b1383f038fc2636e02e49dc7ec144074","block_index":310032,"block_time":310032000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(207,NULL,310032,'update','orders','{"status":"expired","tx_hash":"6d3c6a9ea36e82a0e8162f69c68fc8bb95d316ad5586a30553fbaf1717f4121e"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(208,NULL,310032,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"BBBB","block_index":310032,"calling_function":"cancel order","event":"6d3c6a9ea36e82a0e8162f69c68fc8bb95d316ad5586a30553fbaf1717f4121e","quantity":50000000,"tx_index":0}',0,'CREDIT');
+INSERT INTO messages VALUES(209,NULL,310032,'insert','order_expirations','{"block_index":310032,"order_hash":"6d3c6a9ea36e82a0e8162f69c68fc8bb95d316ad5586a30553fbaf1717f4121e","source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2"}',0,'ORDER_EXPIRATION');
+INSERT INTO messages VALUES(210,NULL,310032,'parse','blocks','{"block_index":310032,"ledger_hash":"7930e5a2c6150df64dfd995801aec68ce11df292e206f08f7ff20eda9ca2d017","messages_hash":"9e5bd4348011a4bfd4f91b9ecfa75389c87204381308a38032ccbfd463529617","txlist_hash":"cbe01ce5a4da72538e9310180de025f141ea8baf1b6eeede8164cac3488532fe"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(211,NULL,310032,'insert','blocks','{"block_hash":"999c65df9661f73e8c01f1da1afda09ac16788b72834f0ff5ea3d1464afb4707","block_index":310033,"block_time":310033000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(212,NULL,310033,'parse','blocks','{"block_index":310033,"ledger_hash":"c5834a54b3ad7f9fdbb18a87c8cefe867eff2ba1ae5bff238a3a041431d0afdd","messages_hash":"907ed29694aefd86edfbc4a210f60db1de73085d1ef82b5eba6fed922ef2681a","txlist_hash":"81bceadbd9f9b956ed25021e2e0a9f4217c7424522105f8a0ba41c9f78234fcd"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(213,NULL,310033,'insert','blocks','{"block_hash":"f552edd2e0a648230f3668e72ddf0ddfb1e8ac0f4c190f91b89c1a8c2e357208","block_index":310034,"block_time":310034000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(214,NULL,310034,'parse','blocks','{"block_index":310034,"ledger_hash":"5a4b3f29cb1554ae8f670955df4dde45fdcc57623a50ca7d8f2c78ad79186a7a","messages_hash":"dd328930abb087b56675e8122dc92a7dcd71162ee577f4d482fa176d2a88b3fb","txlist_hash":"0ec430eb4c16f386b5abbd6586133741dfe6c19eb820d388810f3680442d363a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(215,NULL,310034,'insert','blocks','{"block_hash":"a13cbb016f3044207a46967a4ba1c87dab411f78c55c1179f2336653c2726ae2","block_index":310035,"block_time":310035000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(216,NULL,310035,'parse','blocks','{"block_index":310035,"ledger_hash":"b81834ed9e92514fe7d277378be72e1f81043a615a4b67cb67dbcf97e3c3b43e","messages_hash":"41db3179bc9788824037f2c6341e43178c2013baec35d5144cfd625349ca9b20","txlist_hash":"a883860baff0c6dec150c9d80b8a640401e191312eeebd4e9f21914e7803c46b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(217,NULL,310035,'insert','blocks','{"block_hash":"158648a98f1e1bd1875584ce8449eb15a4e91a99a923bbb24c4210135cef0c76","block_index":310036,"block_time":310036000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(218,NULL,310036,'parse','blocks','{"block_index":310036,"ledger_hash":"736adff04611f10a4e384b5d5c44651bdf037c0caeb8dda5bedbbc6d18d04ca2","messages_hash":"e47efff42238d0792a847ce03c257ebc6a98df5b2ed2aa6794deb87bb1762714","txlist_hash":"821ad697a76d9a35b14a7c388b65b4f3a86fc66c42e02af6d568f73e2586beec"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(219,NULL,310036,'insert','blocks','{"block_hash":"563acfd6d991ce256d5655de2e9429975c8dceeb221e76d5ec6e9e24a2c27c07","block_index":310037,"block_time":310037000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(220,NULL,310037,'parse','blocks','{"block_index":310037,"ledger_hash":"34d49fb14a7ec85ebd02ffe04768f5aa7382ed0ac7f9ae903e71567dc5d9ab67","messages_hash":"c85db66d7f2fc6b8db0dc4a2290e79e34f961b84004b7d0260be4e17d645b209","txlist_hash":"c5ff4e50b07b755c23a6d9ca6dd5efe71a2728c4c662418fab814993be455308"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(221,NULL,310037,'insert','blocks','{"block_hash":"b44b4cad12431c32df27940e18d51f63897c7472b70950d18454edfd640490b2","block_index":310038,"block_time":310038000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(222,NULL,310038,'parse','blocks','{"block_index":310038,"ledger_hash":"9bfc3bf0ed35dd256f0df04c813dab9dd818238163e6b01842e18815971e7010","messages_hash":"2c2e220375664b0c12fa86da7be19a292aa6fdd5ada46d285df190b50f5d3bb4","txlist_hash":"8a2ea429a26990e70f9c8937d11c58c986f991c55f196416344847435c670849"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(223,NULL,310038,'insert','blocks','{"block_hash":"5fa1ae9c5e8a599247458987b006ad3a57f686df1f7cc240bf119e911b56c347","block_index":310039,"block_time":310039000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(224,NULL,310039,'parse','blocks','{"block_index":310039,"ledger_hash":"da7a63f22053d1713c805684d14695c31670eaf848bf23eee3331e679744f291","messages_hash":"b203f7b7b307a063a1d329553fb07b2b1dcece4111f3cd0c35b32c3af097d943","txlist_hash":"9f186391b30cc438ae59dabfb18dfca8811193a8fe37cada73d513ad688a80f0"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(225,NULL,310039,'insert','blocks','{"block_hash":"7200ded406675453eadddfbb2d14c2a4526c7dc2b5de14bd48b29243df5e1aa3","block_index":310040,"block_time":310040000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(226,NULL,310040,'parse','blocks','{"block_index":310040,"ledger_hash":"ddb485115b64342bcb172cc3e77b20effb1294e635459119b59179f3b6a87d66","messages_hash":"c7ce0dc2cbfb4e01ad2d6ee56ba13aa9b1bb7ea41a814d918e62351b5f7e46d6","txlist_hash":"f73c8b5e92181566aeee4ec42a1e50b950fd18680c69c58fe20b5288a915d7e9"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(227,NULL,310040,'insert','blocks','{"block_hash":"5db592ff9ba5fac1e030cf22d6c13b70d330ba397f415340086ee7357143b359","block_index":310041,"block_time":310041000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(228,NULL,310041,'parse','blocks','{"block_index":310041,"ledger_hash":"b58d05ae5f282f7904c7a759ae5624194b5cb091f43f05d738cb4002a999c26d","messages_hash":"93117028a2487b2bfcaf92829728572bd59794f0ecc6ab6108ad7e2dc620023e","txlist_hash":"73ee837bac9153dbc94c23879192b6c2fd71a9a6148502e8c4693bd342c4feec"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(229,NULL,310041,'insert','blocks','{"block_hash":"826fd4701ef2824e9559b069517cd3cb990aff6a4690830f78fc845ab77fa3e4","block_index":310042,"block_time":310042000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(230,NULL,310042,'parse','blocks','{"block_index":310042,"ledger_hash":"c18e1989fccd8bc7168ebf2acc035c224a9010b428b81c814683b0ce1e244113","messages_hash":"2d222cb4b49a3a83535b2f026e13759f1ef6faf8ff833e79dfd218a8e2972a7e","txlist_hash":"9ef577154ca6e451585e9dcc4c3690d496b8a666856987194c4e41414743945f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(231,NULL,310042,'insert','blocks','{"block_hash":"2254a12ada208f1dd57bc17547ecaf3c44720323c47bc7d4b1262477cb7f3c51","block_index":310043,"block_time":310043000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(232,NULL,310043,'parse','blocks','{"block_index":310043,"ledger_hash":"1a935492fce6a168d9aafd24246bba6f5615f53a47311549059b21adc6a67154","messages_hash":"2e99c026842fbb3d0096b55a09d137f21c59b1d5b1d9303b8c02d3e049e471ca","txlist_hash":"29f3ff5d49a8c6ffbf0ddc41a5e45fd3b777fd7c9ea60a914191fc551ac46ea4"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(233,NULL,310043,'insert','blocks','{"block_hash":"3346d24118d8af0b3c6bcc42f8b85792e7a2e7036ebf6e4c25f4f6723c78e46b","block_index":310044,"block_time":310044000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(234,NULL,310044,'parse','blocks','{"block_index":310044,"ledger_hash":"536611cb3cb3005f8c4ffc5b8ed8271734448b5d6f49bd47eb0456bc4ee207e4","messages_hash":"f45c8d78c1854e9ff54aa0ea675ae1e5267a5b9ee5e41284fdf2bcc8fa49553f","txlist_hash":"6f22c984234616fa84a474dc80c5d5e25ccdbec1a84b0cabb279505e93aa4d6c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(235,NULL,310044,'insert','blocks','{"block_hash":"7bba0ab243839e91ad1a45a762bf074011f8a9883074d68203c6d1b46fffde98","block_index":310045,"block_time":310045000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(236,NULL,310045,'parse','blocks','{"block_index":310045,"ledger_hash":"ebbeea29c073c61dad3e091302cd945a9926741db0dc6a918792c4c01b8cc30c","messages_hash":"f7e2e1530436138aa604ff4ab4fdf5199c0c14b1307aad7f53992963325b99b8","txlist_hash":"a1d1a029c0bcbe481f8ba760714e266ff9e759844517ceef96bbaefb05652dcd"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(237,NULL,310045,'insert','blocks','{"block_hash":"47db6788c38f2d6d712764979e41346b55e78cbb4969e0ef5c4336faf18993a6","block_index":310046,"block_time":310046000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(238,NULL,310046,'parse','blocks','{"block_index":310046,"ledger_hash":"d9baff8bec82f3c29f1fa69c9ddd456f1867f33a55d1648605ea7109270d8e07","messages_hash":"79f70931f48bb72ed75656a64ab2de397aa09047ac7609b22611c21b40dd754d","txlist_hash":"26f6ea6c1e350b91f4757619dd52bb7a2b2bad7277497f0d4e1d61b363eb7a99"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(239,NULL,310046,'insert','blocks','{"block_hash":"a9ccabcc2a098a7d25e4ab8bda7c4e66807eefa42e29890dcd88149a10de7075","block_index":310047,"block_time":310047000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(240,NULL,310047,'parse','blocks','{"block_index":310047,"ledger_hash":"09ad4a6bb3f671e6ac6d595bcbfb82371cc41f35c309142678eb5b7df97a5de5","messages_hash":"24e0e1b61be60f0a0078d5d1ac7e31c287354323e9331e2bf40021cc703358f6","txlist_hash":"5e32dc4d14838fdf0460146fd87eeb59ece3416bb7104362d24fd6d2bf0fe963"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(241,NULL,310047,'insert','blocks','{"block_hash":"610bf3935a85b05a98556c55493c6de45bed4d7b3b6c8553a984718765796309","block_index":310048,"block_time":310048000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(242,NULL,310048,'parse','blocks','{"block_index":310048,"ledger_hash":"208200708851a32b0ffaecade58f78f8ba7d5820457c582d5ca127e16fec0952","messages_hash":"2597361763116e4e99d7f8d7988dc1c3a1f1316e51703c09a1d02852aa1caa26","txlist_hash":"c0a8253cff82f71d9a90c7b982e5d5093d5c2bbc2ee2859d9d7d09afbef56192"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(243,NULL,310048,'insert','blocks','{"block_hash":"4ad2761923ad49ad2b283b640f1832522a2a5d6964486b21591b71df6b33be3c","block_index":310049,"block_time":310049000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(244,NULL,310049,'parse','blocks','{"block_index":310049,"ledger_hash":"9d1a7335d989bb73b0363bc88da6dd82c0fbaf064b1d70708b0aa2f6a8a9958b","messages_hash":"17d15d7933015f793185bd1eae6e311471e2cdf3c15df12eef904447206625a2","txlist_hash":"c07861a54cc9537b7a2486e5a7e6366cd04413fb1307712ec6af55588dd22cfc"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(245,NULL,310049,'insert','blocks','{"block_hash":"8cfeb60a14a4cec6e9be13d699694d49007d82a31065a17890383e262071e348","block_index":310050,"block_time":310050000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(246,NULL,310050,'parse','blocks','{"block_index":310050,"ledger_hash":"2fd9039e49fcbb070315defae275bed858cfbb539bc4db8f2ec5f5ff6d69ea25","messages_hash":"e9d18500e588b2ee026e997cf3bf94d83180495f1ed9a943591b63d99c379e1f","txlist_hash":"0ae948495f47c1ad343052f786467c6236cd6ca23dce0c628503a44ada8f8329"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(247,NULL,310050,'insert','blocks','{"block_hash":"b53c90385dd808306601350920c6af4beb717518493fd23b5c730eea078f33e6","block_index":310051,"block_time":310051000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(248,NULL,310051,'parse','blocks','{"block_index":310051,"ledger_hash":"2e97864865a020b04ed60b22c347d9dbebce5d00abce86c2b3a5054a3184699b","messages_hash":"db5355867330ece23a480053220efc0a9c0e2adc29c43066b897db1f8be5ce5d","txlist_hash":"986536c5e9cec38d9b78bef44e21e73f93a654b9c421c7822dcba475b14f2127"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(249,NULL,310051,'insert','blocks','{"block_hash":"0acdacf4e4b6fca756479cb055191b367b1fa433aa558956f5f08fa5b7b394e2","block_index":310052,"block_time":310052000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(250,NULL,310052,'parse','blocks','{"block_index":310052,"ledger_hash":"f6a8e9f4cde78fbf6c9a5ea176312116f3813f2c0bcaee6c92f3beb13a8c3899","messages_hash":"d42146acaf047c28ad0bff965c05dcefaf06d898828e4a538d9fd1a7422e3e89","txlist_hash":"4ffb95c683e1839d31018cc7ec92e978014b8cd32f308c2819ff2e79ff60fa2d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(251,NULL,310052,'insert','blocks','{"block_hash":"68348f01b6dc49b2cb30fe92ac43e527aa90d859093d3bf7cd695c64d2ef744f","block_index":310053,"block_time":310053000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(252,NULL,310053,'parse','blocks','{"block_index":310053,"ledger_hash":"1d84e4657febaa291b4873d808d9ab433370227976196fd6436a65839c3575d1","messages_hash":"cea5b93f173a27746ed90eb780446303b38fa611548f5641f24381973435570b","txlist_hash":"0ed99730b61327cff9ed15d8585f70d7629b2b10150a717093dac4fafcc4e737"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(253,NULL,310053,'insert','blocks','{"block_hash":"a8b5f253df293037e49b998675620d5477445c51d5ec66596e023282bb9cd305","block_index":310054,"block_time":310054000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(254,NULL,310054,'parse','blocks','{"block_index":310054,"ledger_hash":"083f6b773191caaf1844f47c53077e8724e100d0b46461ddaa642b88d5265c9a","messages_hash":"73b50c51dd56dc45dfd626e0051250cdbebd9ce256952530fd0b6710a3cba150","txlist_hash":"69aa5d1c74c026da7b7cebe352bd6d907a31174cfd6f346e09382b0cf3fb8239"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(255,NULL,310054,'insert','blocks','{"block_hash":"4b069152e2dc82e96ed8a3c3547c162e8c3aceeb2a4ac07972f8321a535b9356","block_index":310055,"block_time":310055000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(256,NULL,310055,'parse','blocks','{"block_index":310055,"ledger_hash":"b1302087b804fc5753df5a4d8aaf8626e80ff99b429f52fed97767b051c24e8c","messages_hash":"7a31dd7f45427e5ed38234de010caee7ef9713c09191aedc7ce9279a4dfd9059","txlist_hash":"e35d2a19e5b60e2534a36d8c1d0c14c6211d56c29b4aa4953a14bf0b83bcc405"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(257,NULL,310055,'insert','blocks','{"block_hash":"7603eaed418971b745256742f9d2ba70b2c2b2f69f61de6cc70e61ce0336f9d3","block_index":310056,"block_time":310056000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(258,NULL,310056,'parse','blocks','{"block_index":310056,"ledger_hash":"956c9ca0b51eaba7343703a165eb96d5947fc764457ef3dde5ca90c18d3b2f3d","messages_hash":"7c37e4f5dcbb655f768081f89e89f74a8dfa368459e2c65c34e41f4904709f0b","txlist_hash":"165a88d3d459ce6f4f37cc2ddb1c365dd01542b102dc68181d41b95ebde044dd"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(259,NULL,310056,'insert','blocks','{"block_hash":"4a5fdc84f2d66ecb6ee3e3646aad20751ce8694e64e348d3c8aab09d33a3e411","block_index":310057,"block_time":310057000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(260,NULL,310057,'parse','blocks','{"block_index":310057,"ledger_hash":"e86cae3e73aa13e8498a98de335ed0cbdb7899b24e91839bbf0f50aa22355ecb","messages_hash":"cb8ea0fe610cd5906ffe9de26da5d5b2635ddfc88ececfe465e2f9711bcfda04","txlist_hash":"37394f57952a82ab5fb6ceb7323152d83f3c911a533e289c55b531fc83269268"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(261,NULL,310057,'insert','blocks','{"block_hash":"a6eef3089896f0cae0bfe9423392e45c48f4efe4310b14d8cfbdb1fea613635f","block_index":310058,"block_time":310058000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(262,NULL,310058,'parse','blocks','{"block_index":310058,"ledger_hash":"54bd5e4fc1bc17df27f9e6f22b5e1facd82229a877e09ec0136f878f2da81344","messages_hash":"34d713c9ef3e60d682f178fa7dbe1daf4f12a64fc8143a01e036666da1f4f46a","txlist_hash":"ebd7b1c7c24aa51a0622e244d1b486d4bde8b1019d86e1d8845b6e90847ad09b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(263,NULL,310058,'insert','blocks','{"block_hash":"ab505de874c43f97c90be1c26a769e6c5cb140405c993b4a6cc7afc795f156a9","block_index":310059,"block_time":310059000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(264,NULL,310059,'parse','blocks','{"block_index":310059,"ledger_hash":"1403832427d4c482b0d2d925e08a72fe37f5aaa6af73e74f601f7e22fdad7662","messages_hash":"5d1b34371d873a0b08e072ba89187bf5f51e9d1bd9471b3a9ad8c3cc0374adca","txlist_hash":"cb71b795988456a345fd21a3c729005ab802707d54311480012920f07db40bc9"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(265,NULL,310059,'insert','blocks','{"block_hash":"974ad5fbef621e0a38eab811608dc9afaf10c8ecc85fed913075ba1a145e889b","block_index":310060,"block_time":310060000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(266,NULL,310060,'parse','blocks','{"block_index":310060,"ledger_hash":"7b08f124a953d0e5511b0698d3314f5ec71ebba77b94c4d236ff9738d5a587e8","messages_hash":"e52e415923ef293e6c5a234251c4298558d2d739934fb7efdf6fc6c56c341ece","txlist_hash":"cf47be21938b5a55ffb8eba6a9f63eb61b89e679b279d75080571832bf08c0e0"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(267,NULL,310060,'insert','blocks','{"block_hash":"35d267d21ad386e7b7632292af1c422b0310dde7ca49a82f9577525a29c138cf","block_index":310061,"block_time":310061000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(268,NULL,310061,'parse','blocks','{"block_index":310061,"ledger_hash":"1de158dfd18413618b9800236a2aa265d2fab497b09a839be408da8871b0960a","messages_hash":"739ac804a6f6728dbb657d1c6e918b357b3bca5b468bd919a413f4c826737ac5","txlist_hash":"a9c1a3c24a410649e701fc0b321b2030b6fc35de7a2538a10e75b482cbe96b3f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(269,NULL,310061,'insert','blocks','{"block_hash":"b31a0054145319ef9de8c1cb19df5bcf4dc8a1ece20053aa494e5d3a00a2852f","block_index":310062,"block_time":310062000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(270,NULL,310062,'parse','blocks','{"block_index":310062,"ledger_hash":"aa4be540bad6cd762a02b77856c3d6a737d90245e71f61b63a426573bffb3a4a","messages_hash":"54d67ccdcc62ff368fd5344c672b89a1b1e70cab962fc124ff44562a8669bd40","txlist_hash":"93d0499dcc4fc819927eed8d1eec8b094eb5a4323b70d2cec33d568e31737ce4"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(271,NULL,310062,'insert','blocks','{"block_hash":"0cbcbcd5b7f2dc288e3a34eab3d4212463a5a56e886804fb4f9f1cf929eadebe","block_index":310063,"block_time":310063000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(272,NULL,310063,'parse','blocks','{"block_index":310063,"ledger_hash":"49edce8190c2480fe3c6b3df7c7c5f13d34f67c3aef3b2aa12eaea603153aa83","messages_hash":"6aaade6a270f9a62a4dcaac7b6f1c07cd511a51f0094be18b1c8aff23e7951ef","txlist_hash":"a76d957ffb41dbfd83b8c92ad487582586cdf13ca49dc1dfc30e869afc8ca76b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(273,NULL,310063,'insert','blocks','{"block_hash":"e2db8065a195e85cde9ddb868a17d39893a60fb2b1255aa5f0c88729de7cbf30","block_index":310064,"block_time":310064000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(274,NULL,310064,'parse','blocks','{"block_index":310064,"ledger_hash":"a2a8c9946cf45490858deb15c8f277ec545854dfc02dc9d248a684c0c3544d6e","messages_hash":"4c574f2119c32253047618cfd26249d088f1f78b7a3122be6132431db5812d9d","txlist_hash":"0270a3faca0bc1a674fbd3632a1edbe8363d5115db8af56f135493f09a63df30"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(275,NULL,310064,'insert','blocks','{"block_hash":"8a7bc7a77c831ac4fd11b8a9d22d1b6a0661b07cef05c2e600c7fb683b861d2a","block_index":310065,"block_time":310065000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(276,NULL,310065,'parse','blocks','{"block_index":310065,"ledger_hash":"ca1e5d385fd9cec1184d28095a6f4a2ec2914d40cc016309fe322dbb335cf2c3","messages_hash":"917bc990738cda65cd360163d7a69a3d52acfa1d93ef3d39e0684dd323519842","txlist_hash":"85484b37f06238496ca822d539fe09e0e2906d12cf5b6d77c6219af29ec7410a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(277,NULL,310065,'insert','blocks','{"block_hash":"b6959be51eb084747d301f7ccaf9e75f2292c9404633b1532e3692659939430d","block_index":310066,"block_time":310066000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(278,NULL,310066,'parse','blocks','{"block_index":310066,"ledger_hash":"73519f53874cc8cbe9052bf8dd18c590e0a4bd5bdc2a286c4930e8cfd006a993","messages_hash":"a59263137511047b1accc2820a60c67aaee255e806d3850abeafe6a7de0ebb57","txlist_hash":"9c360f75cdc0788ebf8a530fa967e8eaefc3876b19739dfef2f7307e1af414f2"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(279,NULL,310066,'insert','blocks','{"block_hash":"8b08eae98d7193c9c01863fac6effb9162bda010daeacf9e0347112f233b8577","block_index":310067,"block_time":310067000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(280,NULL,310067,'parse','blocks','{"block_index":310067,"ledger_hash":"5de09a95e36480de84f9d3c8db3e18b7bf5145f8b6ee6bde57b5c3de11274cbd","messages_hash":"9eef7e51b0077440af3cdd4cd771c9639cc28f7c45baa6a9792e5310382a2119","txlist_hash":"b4a32df829f1f913a9077d0ecd83362230bf893ffd654703538c5fc1c30a181e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(281,NULL,310067,'insert','blocks','{"block_hash":"9280e7297ef6313341bc81787a36acfc9af58f83a415afff5e3154f126cf52b5","block_index":310068,"block_time":310068000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(282,NULL,310068,'parse','blocks','{"block_index":310068,"ledger_hash":"be6a452931358d500eda0fd2aa3a91b86483fa847a7bf350f23d33d85712592e","messages_hash":"3e98d5f18828f0025e9ae510f23a142b57d1801ea8d4f33426caba2d861be081","txlist_hash":"fc4f551737950e1293a8718899c3b74c2ce76d8d1f58d6e22d10976ffd15eb24"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(283,NULL,310068,'insert','blocks','{"block_hash":"486351f0655bf594ffaab1980cff17353b640b63e9c27239109addece189a6f7","block_index":310069,"block_time":310069000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(284,NULL,310069,'parse','blocks','{"block_index":310069,"ledger_hash":"5940a47dfa1a1c8bc1e51f1e64100cd0604c74197c88b39f6f7a9d5b763a0b56","messages_hash":"6f2fcc910d98c607fb5b6373ae58afc4d60928eb6de15f43489fbd4221529157","txlist_hash":"53ce1fdeb3b9e39930ad127bc86bc71e7b497f24cc34af2a022200db36ebfa36"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(285,NULL,310069,'insert','blocks','{"block_hash":"8739e99f4dee8bebf1332f37f49a125348b40b93b74fe35579dd52bfba4fa7e5","block_index":310070,"block_time":310070000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(286,NULL,310070,'parse','blocks','{"block_index":310070,"ledger_hash":"6aebe68545207e7cc81d68c3aca801f0b39e276ac86e8e0130d5029eefb60e2e","messages_hash":"b24b67a141d2b58200f8e59427c601292b3cf1ffe3b1459bd06984b224be6286","txlist_hash":"0d482039b615aa55b721fef8ddaffcc2942838dbda8784940e9fdd8dba8b1465"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(287,NULL,310070,'insert','blocks','{"block_hash":"7a099aa1bba0ead577f1e44f35263a1f115ed6a868c98d4dd71609072ae7f80b","block_index":310071,"block_time":310071000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(288,NULL,310071,'parse','blocks','{"block_index":310071,"ledger_hash":"d005aff752907b93e2dfe442896c8976203f0139fb67cda3ea1936aea495e008","messages_hash":"616dba0e803fd874755b060b0585ffa3bfe5777161671e5438501c82a61dd167","txlist_hash":"8be094b2e99ec5c85a594d4a4059b7427ffbee3671190b84161fbf2fadb6f313"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(289,NULL,310071,'insert','blocks','{"block_hash":"7b17ecedc07552551b8129e068ae67cb176ca766ea3f6df74b597a94e3a7fc8a","block_index":310072,"block_time":310072000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(290,NULL,310072,'parse','blocks','{"block_index":310072,"ledger_hash":"781f0ebe67964c25640f0bf5624e08cda546dbbb6648bd6e8d9f280c7f075f7c","messages_hash":"d49d67e76802bf51725be6edba18b0699a224052de810192c76e1780d6fdd23f","txlist_hash":"9c5e049c1738beda53ffdffe18492b0af038a756278f2bdeaddaa1a726681ce5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(291,NULL,310072,'insert','blocks','{"block_hash":"ee0fe3cc9b3a48a2746b6090b63b442b97ea6055d48edcf4b2288396764c6943","block_index":310073,"block_time":310073000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(292,NULL,310073,'parse','blocks','{"block_index":310073,"ledger_hash":"83b5e1ca76fda895b144e8c03cda5fc3d18f6324b5413fd74923e51a94ccc53a","messages_hash":"d10c8c167ab11695802fabdfb86811f5e97dfd159eb48726599d1f6db6e8d79d","txlist_hash":"a7199dd9b360cc694f85a81ccf72fd614e6c0400d753132cb517ca9da55df86a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(293,NULL,310073,'insert','blocks','{"block_hash":"ceab38dfde01f711a187601731ad575d67cfe0b7dbc61dcd4f15baaef72089fb","block_index":310074,"block_time":310074000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(294,NULL,310074,'parse','blocks','{"block_index":310074,"ledger_hash":"4293be396327c0aa3c56c77a9152068cc32612692c76ba94e8961c59a9ad780f","messages_hash":"8ffe9a16041d01db32f197ac722248cc5a965f8b898b9993fd22a85eea5db562","txlist_hash":"833f9d3ae03e5819eec47318d948999dfbe35fcbe66766f985b6ca71eccae54a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(295,NULL,310074,'insert','blocks','{"block_hash":"ef547198c6e36d829f117cfd7077ccde45158e3c545152225fa24dba7a26847b","block_index":310075,"block_time":310075000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(296,NULL,310075,'parse','blocks','{"block_index":310075,"ledger_hash":"d08b93b609f1766534cb0c30502350b9e4ccc4a885ebff7633e9e5c5b52d8e90","messages_hash":"292b6736907d722669ccff7de41f5768bf856990f27bed1bc6bbae4d86a698b0","txlist_hash":"7db8bbcaa76b087fbcdbd8f5b428b3587c494f0cd7d458a2d519abb0ef26f424"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(297,NULL,310075,'insert','blocks','{"block_hash":"3b0499c2e8e8f0252c7288d4ecf66efc426ca37aad3524424d14c8bc6f8b0d92","block_index":310076,"block_time":310076000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(298,NULL,310076,'parse','blocks','{"block_index":310076,"ledger_hash":"06c72d219df429f2873af74b6250f3d12996cce14496d151bf8bd4cf819532e4","messages_hash":"454f362796ec85e40ff999ad703786cb1566dc265cbad79679a21863df744616","txlist_hash":"8f6a902dd8d5d573658f07e8ac598ccc46ed49bff95b2a9ed89a051c852215a5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(299,NULL,310076,'insert','blocks','{"block_hash":"d2adeefa9024ab3ff2822bc36acf19b6c647cea118cf15b86c6bc00c3322e7dd","block_index":310077,"block_time":310077000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(300,NULL,310077,'parse','blocks','{"block_index":310077,"ledger_hash":"0ff019cc4b9b8a394aad1b9f8f579fd5c4cc48a846e4fe71ab2f45226cec5a1e","messages_hash":"f1fd80fbd94b33058c5f6c79aba84481468967589830db3d32883d8543d32367","txlist_hash":"e1ab0a4cbd4e60c5b1da333c5ef542bbc1d8bbd7709fdb35374c072a1f54d38c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(301,NULL,310077,'insert','blocks','{"block_hash":"f6c17115ef0efe489c562bcda4615892b4d4b39db0c9791fe193d4922bd82cd6","block_index":310078,"block_time":310078000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(302,NULL,310078,'parse','blocks','{"block_index":310078,"ledger_hash":"6ea40a02464725d0ba45b9969bdbb7529ae5e3ca794ae00abf4783bfc9667104","messages_hash":"ced300cd87e34fe62b096d945571be63ab5bba0fc53d62541a52f6c1274f6e3e","txlist_hash":"be6f6965b6ba8aae157eb48f28bce3fa91c3bbc22b88fc3ee8d4f126c1538032"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(303,NULL,310078,'insert','blocks','{"block_hash":"f2fbd2074d804e631db44cb0fb2e1db3fdc367e439c21ffc40d73104c4d7069c","block_index":310079,"block_time":310079000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(304,NULL,310079,'parse','blocks','{"block_index":310079,"ledger_hash":"076abf036bd51c47525fe4e638dbad403a8a1667a5b7c2f81ffc2a70e79b80a8","messages_hash":"dfd50e735f06f6aae4bcd58b484f39021e38ee290d41240b18b1744d3de653f7","txlist_hash":"eb97110f496f9813e14f127af2cdcdb26d54e9745e274fe227fb0646cc132c29"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(305,NULL,310079,'insert','blocks','{"block_hash":"42943b914d9c367000a78b78a544cc4b84b1df838aadde33fe730964a89a3a6c","block_index":310080,"block_time":310080000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(306,NULL,310080,'parse','blocks','{"block_index":310080,"ledger_hash":"8cc2e62f7b3ae2c89977ee9e31acacff38f944d00a978e9b0e48678487cdbe27","messages_hash":"4b3120593291e81d0a0519478f45b1c17aad478f384964dadbb6631295912aa7","txlist_hash":"93c6c5967f4d297df962f2853f2a2ba3870f5692c8835413c08528cf243985dc"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(307,NULL,310080,'insert','blocks','{"block_hash":"6554f9d307976249e7b7e260e08046b3b55d318f8b6af627fed5be3063f123c4","block_index":310081,"block_time":310081000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(308,NULL,310081,'parse','blocks','{"block_index":310081,"ledger_hash":"ec86fa6786b598b091121fc2001650bc04668d26d88805efff7271312c76a373","messages_hash":"815500c2b55e7b9eadf7b1436407dc29d17fcbd5145aee3cc14b9559fdc38600","txlist_hash":"e6cf70178316b3c594c60d10ac1ee3783f1dafe5054ce4c6fb932bf3c771f703"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(309,NULL,310081,'insert','blocks','{"block_hash":"4f1ef91b1dcd575f8ac2e66a67715500cbca154bd6f3b8148bb7015a6aa6c644","block_index":310082,"block_time":310082000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(310,NULL,310082,'parse','blocks','{"block_index":310082,"ledger_hash":"6b720db96b2d10816e5022ab8c61fafba49cc6bf484909fb500295451e61f768","messages_hash":"33014d2d503328d843a057ed2d544af2dd00c7c7dfe923c4494d5f04a5e5ea2c","txlist_hash":"254cf1d1ac865c611a3d9fbd78001152928a52ad94fd640c526e043ce7c0fdb3"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(311,NULL,310082,'insert','blocks','{"block_hash":"9b1f6fd6ff9b0dc4e37603cfb0625f49067c775b99e12492afd85392d3c8d850","block_index":310083,"block_time":310083000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(312,NULL,310083,'parse','blocks','{"block_index":310083,"ledger_hash":"d8c6fabb9b9dff0f1f3ba35e75c08be55dc4ded8dcf54e51f0cd857625b87dc8","messages_hash":"7b5d4bd5a47db25e25b6fbfed91c263663202753248a1953369da64a782ac8cb","txlist_hash":"a34f7e98c65b95becae5908e74cfedcb846366a83605f9d8685e98ac629d1278"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(313,NULL,310083,'insert','blocks','{"block_hash":"1e0972523e80306441b9f4157f171716199f1428db2e818a7f7817ccdc8859e3","block_index":310084,"block_time":310084000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(314,NULL,310084,'parse','blocks','{"block_index":310084,"ledger_hash":"eba03194b13ca764dbfbb86f86d16841df4486f12c26a214f7f1020468b52d27","messages_hash":"b9ce189b79f426b6e6eb9d9bd6ea4272dee9713c93e9d842183ccb6ae66f9211","txlist_hash":"e5a15333b0539a58bcf306d993b0be078d8dfd3cf3f5929a690da5ac534eff5e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(315,NULL,310084,'insert','blocks','{"block_hash":"c5b6e9581831e3bc5848cd7630c499bca26d9ece5156d36579bdb72d54817e34","block_index":310085,"block_time":310085000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(316,NULL,310085,'parse','blocks','{"block_index":310085,"ledger_hash":"d7fa8085722edc91ea5cb907e439649533e32ad5429b52bc10463629719af5ab","messages_hash":"20abfbccb4ae6786f1ef5249f27b96ce3a561e38705295ae96433606a9ee2f59","txlist_hash":"bfedffe97e2bf812728130721dec204767d92ab05bfcf2c4596b5386fc6ea380"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(317,NULL,310085,'insert','blocks','{"block_hash":"080c1dc55a4ecf4824cf9840602498cfc35b5f84099f50b71b45cb63834c7a78","block_index":310086,"block_time":310086000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(318,NULL,310086,'parse','blocks','{"block_index":310086,"ledger_hash":"e84e0b26a5a67af1bca0cdadadea17b52b79f160d8acc0281289de1c70bef248","messages_hash":"5f674cafe43098f7d91995019a4796221cb521683242efb9350aebd6f0962761","txlist_hash":"2b4c3ff824d597cc1376a524f89bac6deef025a71395e848b51e9c06002d7f12"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(319,NULL,310086,'insert','blocks','{"block_hash":"4ec8cb1c38b22904e8087a034a6406b896eff4dd28e7620601c6bddf82e2738c","block_index":310087,"block_time":310087000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(320,NULL,310087,'parse','blocks','{"block_index":310087,"ledger_hash":"ac3522ba0e8278bac956b5f9d7af271424f8e4eff23d57d2a5ff88416dd02ff4","messages_hash":"aa6c5e822ec3d28fab4b599a922cb46afe34d4d8b075d59266bd814704bf3b30","txlist_hash":"2b3b181734d815e3cd024f6fd91b11de8cd457bdc5f833520af281a6c42ab391"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(321,NULL,310087,'insert','blocks','{"block_hash":"e945c815c433cbddd0bf8e66c5c23b51072483492acda98f5c2c201020a8c5b3","block_index":310088,"block_time":310088000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(322,NULL,310088,'parse','blocks','{"block_index":310088,"ledger_hash":"86255a3e32e6c7a96d0f0a6e7815d61d9a970272f1df38bb0c29ee9f2051f2e4","messages_hash":"1aecea3bd5175ddda4a31d3ffc6dbc1873210b9191b76b4e12e77b96d7e4e53c","txlist_hash":"9092b97fab9af004edd169f26446c6712e5e1ed1d5f94fc5ac0b49565fa65b4b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(323,NULL,310088,'insert','blocks','{"block_hash":"0382437f895ef3e7e38bf025fd4f606fd44d4bbd6aea71dbdc4ed11a7cd46f33","block_index":310089,"block_time":310089000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(324,NULL,310089,'parse','blocks','{"block_index":310089,"ledger_hash":"9694fd19263381693133a47584432de876ef1e0a32060d52c8db96811ff7d09e","messages_hash":"46153be228fa8f944bbdf64b72e4ab8089c93152fa4e70e99866e57496899e11","txlist_hash":"06ae398816ea8ca96fa424903182c7df9ce93c5d1bdbc2ead089ee71acb90531"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(325,NULL,310089,'insert','blocks','{"block_hash":"b756db71dc037b5a4582de354a3347371267d31ebda453e152f0a13bb2fae969","block_index":310090,"block_time":310090000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(326,NULL,310090,'parse','blocks','{"block_index":310090,"ledger_hash":"3cb1b469cc6627cbed3f0db1a00370d5c95edf9940f8a4c9406fc78076640d90","messages_hash":"1cb847cbd07a241995f1c2afa6efb8c9557104fae1b36048f241e7b1ff62b63b","txlist_hash":"2c688b2021aa321432ae1bd5a60a9f65cdb6d3720512ca2c304bd2773e7647d9"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(327,NULL,310090,'insert','blocks','{"block_hash":"734a9aa485f36399d5efb74f3b9c47f8b5f6fd68c9967f134b14cfe7e2d7583c","block_index":310091,"block_time":310091000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(328,NULL,310091,'parse','blocks','{"block_index":310091,"ledger_hash":"cac7cc49c1d632aef2e9bcb3456f60df2ff11110c4e9980989ce0f2d8a5835e1","messages_hash":"e48ef422b958d8058d5cd6aa702072825fd190a03b58f569671ee58d6ca2306f","txlist_hash":"2a7ce0455e84f973c078752f1c0ea93ffdbe993f239baeb7ed947e749c119dfb"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(329,NULL,310091,'insert','blocks','{"block_hash":"56386beb65f9228740d4ad43a1c575645f6daf59e0dd9f22551c59215b5e8c3d","block_index":310092,"block_time":310092000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(330,NULL,310092,'parse','blocks','{"block_index":310092,"ledger_hash":"1614a317b1144c7f08fb2785bf468bb299b9f19450331b7fdfebd510fa07e574","messages_hash":"ac58d3aa1c81f62a3b39215d28d911e1d7b2c2b16d5fb942dc81c215231d9703","txlist_hash":"270190f8eea6e059acfe66f7369986d3748f707f3ad0eaa2e396a190cc047a6f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(331,NULL,310092,'insert','blocks','{"block_hash":"a74a2425f2f4be24bb5f715173e6756649e1cbf1b064aeb1ef60e0b94b418ddc","block_index":310093,"block_time":310093000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(332,NULL,310093,'parse','blocks','{"block_index":310093,"ledger_hash":"631d42f4b3fb091a4c67f737bc2da60b8bf9820d27c758f5b9453b40813c5bc5","messages_hash":"af5aec74565edcf44587e0eb2782fc4fc4cf1506001b8a0e45401bc8186ed36b","txlist_hash":"35ca62f9b66717328f41e23c80e72395f4ece758ce3ca9aabe1d1edd87d06016"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(333,NULL,310093,'insert','blocks','{"block_hash":"2a8f976f20c4e89ff01071915ac96ee35192d54df3a246bf61fd4a0cccfb5b23","block_index":310094,"block_time":310094000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(334,NULL,310094,'parse','blocks','{"block_index":310094,"ledger_hash":"2b3f460da72fc0a9b3a720abca80bff0c44654287de69567c43c62a5557144bf","messages_hash":"3184f5a18eb60486361d3987a39fe534d6d0a5e6fb450dcc8835c6c37e11ed19","txlist_hash":"37d35cf95c6f102413739a672d5dc1c3b0760068de256676b336c631bdc94447"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(335,NULL,310094,'insert','blocks','{"block_hash":"bed0fa40c9981223fb40b3be8124ca619edc9dd34d0c907369477ea92e5d2cd2","block_index":310095,"block_time":310095000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(336,NULL,310095,'parse','blocks','{"block_index":310095,"ledger_hash":"db62bf94ddb276cf55ddfe73f8023e760788647910807adff6e0672ce1d5e23d","messages_hash":"a73f6efcbccef38fded18f60759919ae1bcdcbb425eaff8b4225d1e6d411c59c","txlist_hash":"2eec38760b106cf52b3bf0fa51198348cb611ae9bb75edd8e4a343e7fef1e042"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(337,NULL,310095,'insert','blocks','{"block_hash":"306aeec3db435fabffdf88c2f26ee83caa4c2426375a33daa2be041dbd27ea2f","block_index":310096,"block_time":310096000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(338,NULL,310096,'parse','blocks','{"block_index":310096,"ledger_hash":"1c427808f1eb1972df57b51eea9f3405d3d63a1d58c5a3faba616d7160e3a264","messages_hash":"c95f2aa93c30ec8c210a78b3439c66b1586e3eab75991b87296393289c1dbd07","txlist_hash":"be57a1f4088437c89e3bdd7c9456b8ac9dc6011d15ada8d5432ab662f80e9a52"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(339,NULL,310096,'insert','blocks','{"block_hash":"13e8e16e67c7cdcc80d477491e554b43744f90e8e1a9728439a11fab42cefadf","block_index":310097,"block_time":310097000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(340,NULL,310097,'parse','blocks','{"block_index":310097,"ledger_hash":"cd28b5ac0f80f8815467663c1e90b15ffe46ce067a1b2ce004b0d371cb0ceb16","messages_hash":"f36348ab193e851709e6f1e2977ff3b954bcfc208e81a1a2faff95014cbfc64c","txlist_hash":"cf5fed759ba01d430d2e97ed6d52503a67c35688f02ad6742e87f1da1b468ae0"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(341,NULL,310097,'insert','blocks','{"block_hash":"ca5bca4b5ec4fa6183e05176abe921cff884c4e20910fab55b603cef48dc3bca","block_index":310098,"block_time":310098000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(342,NULL,310098,'parse','blocks','{"block_index":310098,"ledger_hash":"69adfbe756c116e395fb3a5170b57210ac2721b07144b3d7a35c4327f28e28c9","messages_hash":"ca4a3f93e7ffdbdfce2fdc86ab481462f5d9ea6c30968c939d784a837736b3ef","txlist_hash":"528e0ea934cb95d328ad13fb3a3a47a1d89824ee44abbb2cc271d707bb6d62d1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(343,NULL,310098,'insert','blocks','{"block_hash":"3c4c2279cd7de0add5ec469648a845875495a7d54ebfb5b012dcc5a197b7992a","block_index":310099,"block_time":310099000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(344,NULL,310099,'parse','blocks','{"block_index":310099,"ledger_hash":"d50cb66a25a410db360cdf749b5d10932410b5e37c3e5d3d834a65b5671dcca6","messages_hash":"a953aa10f4e569ce2037e817593575ae40b4423b9f857d5b38e09afbf07e1a12","txlist_hash":"f0e0e40238d13f69c9c40cad5b8be218cb09af9bc061e728b56d74a42182788b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(345,NULL,310099,'insert','blocks','{"block_hash":"96925c05b3c7c80c716f5bef68d161c71d044252c766ca0e3f17f255764242cb","block_index":310100,"block_time":310100000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(346,NULL,310100,'parse','blocks','{"block_index":310100,"ledger_hash":"384f8d2eda5f1b7b8273ef149ac37fcaa9ae51865fd57bd348339579b8a078eb","messages_hash":"23ce68e6c5fde9490e384c6204ce16bcf645cb1fc006622de99beeb1b8ea40e3","txlist_hash":"19ac618404aade5a0914a9a9c159ea229384be303a320b08b9915474beccf1df"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(347,NULL,310100,'insert','blocks','{"block_hash":"369472409995ca1a2ebecbad6bf9dab38c378ab1e67e1bdf13d4ce1346731cd6","block_index":310101,"block_time":310101000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(348,NULL,310101,'parse','blocks','{"block_index":310101,"ledger_hash":"5eff25450225c71f85f34466d6e359001eed8f05ea5042e7d65c30ccfeb6098f","messages_hash":"d85c0fed7144a53f31159f376756a35a8ce777d7dd174ed300eead63079bfdf0","txlist_hash":"7d02630f0fbe3e5c3b16766f1d04dd1a83c305f74f0546276d970b36e870ba8e"}',0,'BLOCK_PARSED');
 -- Triggers and indices on  messages
 CREATE TRIGGER block_update_messages
                            BEFORE UPDATE ON messages BEGIN
@@ -463,361 +463,362 @@ BEGIN TRANSACTION;
 DROP TABLE IF EXISTS messages;
 CREATE TABLE messages(
                       message_index INTEGER PRIMARY KEY,
+                      mensaje_index INTEGER,
                       block_index INTEGER,
                       command TEXT,
                       category TEXT,
                       bindings TEXT,
                       timestamp INTEGER,
                       event TEXT);
-INSERT INTO messages VALUES(0,0,'insert','blocks','{"block_hash":"8b3bef249cb3b0fa23a4936c1249b6bd41daeadc848c8d2e409ea1cbc10adfe7","block_index":309999,"block_time":309999000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1,309999,'parse','blocks','{"block_index":309999,"ledger_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","messages_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","txlist_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(2,309999,'insert','blocks','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(3,310000,'insert','transactions','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"btc_amount":62000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"15b35d5497f454c43576f21a1b61d99bde25dfc5aae1a4796dcf55e739d6a399","tx_index":1}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(4,310000,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310000,"calling_function":"burn","event":"15b35d5497f454c43576f21a1b61d99bde25dfc5aae1a4796dcf55e739d6a399","quantity":93000000000,"tx_index":1}',0,'CREDIT');
-INSERT INTO messages VALUES(5,310000,'insert','burns','{"block_index":310000,"burned":62000000,"earned":93000000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"15b35d5497f454c43576f21a1b61d99bde25dfc5aae1a4796dcf55e739d6a399","tx_index":1}',0,'BURN');
-INSERT INTO messages VALUES(6,310000,'parse','blocks','{"block_index":310000,"ledger_hash":"cff3ba7c92f6b318eb4a4a5e2b90b655fc055d4e8a82101b813aef6e1c6152e4","messages_hash":"f25f391e967671ba5a4efd1b0766b90d3d0443b51d9507f85125d9d1ef3a0308","txlist_hash":"9f6f20e36fd2b2b44df6e91fbfaeffc6d7fae9917b27d196245ee90c36d99ff1"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(7,310000,'insert','blocks','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(8,310001,'insert','transactions','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"btc_amount":1000,"data":"0000000000000000000000010000000002faf080","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"121285e4ce5c17fbd6e0b0277702af982cdc14054735154a9043beecb247b84f","tx_index":2}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(9,310001,'insert','debits','{"action":"send","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310001,"event":"121285e4ce5c17fbd6e0b0277702af982cdc14054735154a9043beecb247b84f","quantity":50000000,"tx_index":2}',0,'DEBIT');
-INSERT INTO messages VALUES(10,310001,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"XCP","block_index":310001,"calling_function":"send","event":"121285e4ce5c17fbd6e0b0277702af982cdc14054735154a9043beecb247b84f","quantity":50000000,"tx_index":2}',0,'CREDIT');
-INSERT INTO messages VALUES(11,310001,'insert','sends','{"asset":"XCP","block_index":310001,"destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","quantity":50000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"121285e4ce5c17fbd6e0b0277702af982cdc14054735154a9043beecb247b84f","tx_index":2}',0,'SEND');
-INSERT INTO messages VALUES(12,310001,'parse','transactions','{"supported":true,"tx_hash":"121285e4ce5c17fbd6e0b0277702af982cdc14054735154a9043beecb247b84f","tx_index":2}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(13,310001,'parse','blocks','{"block_index":310001,"ledger_hash":"2281de0177f4fcf8d730e2751d7b9fb5da4df741196bbcaff470c7860a2ca0b6","messages_hash":"e3aa0380b1a456cdf8335e2c4dcf2bf5cd54a82bf155a91cf04c9ecc8ff63bdb","txlist_hash":"49836952844fe3f887e718d236efa6b1f4cc0b81cfc010f79a6349562ebfc162"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(14,310001,'insert','blocks','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(15,310002,'insert','transactions','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"btc_amount":0,"data":"0000000a00000000000000000000000002faf08000000000000000010000000005f5e100000a0000000000000000","destination":"","fee":1000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"c953eb18873ce8aed42456df0ece8e4678e13282d9917916e7a4aec10e828375","tx_index":3}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(16,310002,'insert','orders','{"block_index":310002,"expiration":10,"expire_index":310012,"fee_provided":1000000,"fee_provided_remaining":1000000,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":100000000,"get_remaining":100000000,"give_asset":"BTC","give_quantity":50000000,"give_remaining":50000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","tx_hash":"c953eb18873ce8aed42456df0ece8e4678e13282d9917916e7a4aec10e828375","tx_index":3}',0,'OPEN_ORDER');
-INSERT INTO messages VALUES(17,310002,'parse','transactions','{"supported":true,"tx_hash":"c953eb18873ce8aed42456df0ece8e4678e13282d9917916e7a4aec10e828375","tx_index":3}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(18,310002,'parse','blocks','{"block_index":310002,"ledger_hash":"802742a55d8ab83de24c45efb86d1daa0ad4e565cc4db6dcaa5cedb16ec4125f","messages_hash":"d8df33aece3f5184376a2f4a13cfb52ed09ab73cdbdffd84dadde3ca8e4d4b9f","txlist_hash":"017a0ddcf461ffcc3c89042ba6a6337efcc276c8f144daad445ba0e4a36bab33"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(19,310002,'insert','blocks','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(20,310003,'insert','transactions','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"btc_amount":0,"data":"0000000a00000000000000010000000006422c4000000000000000000000000002faf080000a00000000000dbba0","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"89a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a","tx_index":4}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(21,310003,'insert','debits','{"action":"open order","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310003,"event":"89a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a","quantity":105000000,"tx_index":4}',0,'DEBIT');
-INSERT INTO messages VALUES(22,310003,'insert','orders','{"block_index":310003,"expiration":10,"expire_index":310013,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":900000,"fee_required_remaining":900000,"get_asset":"BTC","get_quantity":50000000,"get_remaining":50000000,"give_asset":"XCP","give_quantity":105000000,"give_remaining":105000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","tx_hash":"89a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a","tx_index":4}',0,'OPEN_ORDER');
-INSERT INTO messages VALUES(23,310003,'update','orders','{"fee_provided_remaining":142858,"fee_required_remaining":0,"get_remaining":0,"give_remaining":0,"status":"open","tx_hash":"c953eb18873ce8aed42456df0ece8e4678e13282d9917916e7a4aec10e828375"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(24,310003,'update','orders','{"fee_provided_remaining":6800,"fee_required_remaining":42858,"get_remaining":0,"give_remaining":5000000,"status":"open","tx_hash":"89a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(25,310003,'insert','order_matches','{"backward_asset":"XCP","backward_quantity":100000000,"block_index":310003,"fee_paid":857142,"forward_asset":"BTC","forward_quantity":50000000,"id":"c953eb18873ce8aed42456df0ece8e4678e13282d9917916e7a4aec10e828375_89a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a","match_expire_index":310023,"status":"pending","tx0_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx0_block_index":310002,"tx0_expiration":10,"tx0_hash":"c953eb18873ce8aed42456df0ece8e4678e13282d9917916e7a4aec10e828375","tx0_index":3,"tx1_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx1_block_index":310003,"tx1_expiration":10,"tx1_hash":"89a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a","tx1_index":4}',0,'ORDER_MATCH');
-INSERT INTO messages VALUES(26,310003,'parse','transactions','{"supported":true,"tx_hash":"89a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a","tx_index":4}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(27,310003,'parse','blocks','{"block_index":310003,"ledger_hash":"ed279c6a985256134cfb39f1283ec97c8dc800b7255a3e8243ca9846884d0378","messages_hash":"e8a8467421c8964ff378e119f97e7cf43ee424041b1d660cbd6493b23213f79b","txlist_hash":"8ec458bf08abe2f3634eafac5af321f02cf5d470c2a87301b8061efe3dcc644f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(28,310003,'insert','blocks','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(29,310004,'insert','transactions','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"btc_amount":50000000,"data":"0000000bc953eb18873ce8aed42456df0ece8e4678e13282d9917916e7a4aec10e82837589a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":9675,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"f0c58099c1614dcf2b8fd12be01c63427a5877b8c0367ecadea31ae9eb9714e6","tx_index":5}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(30,310004,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310004,"calling_function":"btcpay","event":"f0c58099c1614dcf2b8fd12be01c63427a5877b8c0367ecadea31ae9eb9714e6","quantity":100000000,"tx_index":5}',0,'CREDIT');
-INSERT INTO messages VALUES(31,310004,'update','order_matches','{"id":"c953eb18873ce8aed42456df0ece8e4678e13282d9917916e7a4aec10e828375_89a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a","order_match_id":"c953eb18873ce8aed42456df0ece8e4678e13282d9917916e7a4aec10e828375_89a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a","status":"completed"}',0,'ORDER_MATCH_UPDATE');
-INSERT INTO messages VALUES(32,310004,'insert','btcpays','{"block_index":310004,"btc_amount":50000000,"destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","order_match_id":"c953eb18873ce8aed42456df0ece8e4678e13282d9917916e7a4aec10e828375_89a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a","source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"f0c58099c1614dcf2b8fd12be01c63427a5877b8c0367ecadea31ae9eb9714e6","tx_index":5}',0,'BTC_PAY');
-INSERT INTO messages VALUES(33,310004,'parse','transactions','{"supported":true,"tx_hash":"f0c58099c1614dcf2b8fd12be01c63427a5877b8c0367ecadea31ae9eb9714e6","tx_index":5}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(34,310004,'parse','blocks','{"block_index":310004,"ledger_hash":"bba1ec90ee149be7d8a88ff9df1fca931e076e885be21bc822637829a8675e02","messages_hash":"7942936fb941c33d235d0f95f868587159b956e31c7ebd591e09117f54faa9bb","txlist_hash":"e2e334cb3c300e622a50d2c206fe532a3320f56c445dc1a9dec750417260fe9a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(35,310004,'insert','blocks','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(36,310005,'insert','transactions','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"btc_amount":0,"data":"000000140000000000004767000000003b9aca000100000000000000000000","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"9238105e39efd4b7d428ad14011ad0c0f366bdcd150afa954e1f25c0cf4c2cc9","tx_index":6}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(37,310005,'insert','debits','{"action":"issuance fee","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310005,"event":"9238105e39efd4b7d428ad14011ad0c0f366bdcd150afa954e1f25c0cf4c2cc9","quantity":50000000,"tx_index":6}',0,'DEBIT');
-INSERT INTO messages VALUES(38,310005,'insert','assets','{"asset_id":"18279","asset_longname":null,"asset_name":"BBBB","block_index":310005}',0,'ASSET_CREATION');
-INSERT INTO messages VALUES(39,310005,'insert','issuances','{"asset":"BBBB","asset_longname":null,"block_index":310005,"call_date":0,"call_price":0.0,"callable":false,"description":"","divisible":true,"fee_paid":50000000,"issuer":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","locked":false,"quantity":1000000000,"reset":false,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","transfer":false,"tx_hash":"9238105e39efd4b7d428ad14011ad0c0f366bdcd150afa954e1f25c0cf4c2cc9","tx_index":6}',0,'ASSET_ISSUANCE');
-INSERT INTO messages VALUES(40,310005,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBB","block_index":310005,"calling_function":"issuance","event":"9238105e39efd4b7d428ad14011ad0c0f366bdcd150afa954e1f25c0cf4c2cc9","quantity":1000000000,"tx_index":6}',0,'CREDIT');
-INSERT INTO messages VALUES(41,310005,'parse','transactions','{"supported":true,"tx_hash":"9238105e39efd4b7d428ad14011ad0c0f366bdcd150afa954e1f25c0cf4c2cc9","tx_index":6}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(42,310005,'parse','blocks','{"block_index":310005,"ledger_hash":"5f8a9d465e686b3e9471041bd15d645b7fc8afee36ee890873aa6c3c51d87bb5","messages_hash":"fa485519e19f15670e3c2e14e5edf24ceb43f3716d9b941e6d553ed966890c50","txlist_hash":"260ad7ae2e2b555f7adf9155fcb761e7ed7a2d22f128457db0f1ff363b498d64"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(43,310005,'insert','blocks','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(44,310006,'insert','transactions','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"btc_amount":0,"data":"00000014000000000000476800000000000186a00000000000000000000006666f6f626172","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"19d9d6059edf351635fa19ad867ccfa1db3959a5109fc63729430110a661b6e8","tx_index":7}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(45,310006,'insert','debits','{"action":"issuance fee","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310006,"event":"19d9d6059edf351635fa19ad867ccfa1db3959a5109fc63729430110a661b6e8","quantity":50000000,"tx_index":7}',0,'DEBIT');
-INSERT INTO messages VALUES(46,310006,'insert','assets','{"asset_id":"18280","asset_longname":null,"asset_name":"BBBC","block_index":310006}',0,'ASSET_CREATION');
-INSERT INTO messages VALUES(47,310006,'insert','issuances','{"asset":"BBBC","asset_longname":null,"block_index":310006,"call_date":0,"call_price":0.0,"callable":false,"description":"foobar","divisible":false,"fee_paid":50000000,"issuer":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","locked":false,"quantity":100000,"reset":false,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","transfer":false,"tx_hash":"19d9d6059edf351635fa19ad867ccfa1db3959a5109fc63729430110a661b6e8","tx_index":7}',0,'ASSET_ISSUANCE');
-INSERT INTO messages VALUES(48,310006,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBC","block_index":310006,"calling_function":"issuance","event":"19d9d6059edf351635fa19ad867ccfa1db3959a5109fc63729430110a661b6e8","quantity":100000,"tx_index":7}',0,'CREDIT');
-INSERT INTO messages VALUES(49,310006,'parse','transactions','{"supported":true,"tx_hash":"19d9d6059edf351635fa19ad867ccfa1db3959a5109fc63729430110a661b6e8","tx_index":7}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(50,310006,'parse','blocks','{"block_index":310006,"ledger_hash":"153795f1c7ae2dbec7fc19bb25d03dd518f0664bca82b9bb92bb7c4f1e22f040","messages_hash":"91d3dd09443d1265650e148632f4de4352559fb4a2aa2dfbe161b1a83d7f51de","txlist_hash":"c047baa686f8bf24c406cf03687c0b4fe6b95e4afe0b396e0f507a694fb10245"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(51,310006,'insert','blocks','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(52,310007,'insert','transactions','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"btc_amount":1000,"data":"00000000000000000000476700000000003d0900","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"b25659252f68f162d96cf2cf3070b30e5913b472cbace76985e314b4634641a0","tx_index":8}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(53,310007,'insert','debits','{"action":"send","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBB","block_index":310007,"event":"b25659252f68f162d96cf2cf3070b30e5913b472cbace76985e314b4634641a0","quantity":4000000,"tx_index":8}',0,'DEBIT');
-INSERT INTO messages VALUES(54,310007,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"BBBB","block_index":310007,"calling_function":"send","event":"b25659252f68f162d96cf2cf3070b30e5913b472cbace76985e314b4634641a0","quantity":4000000,"tx_index":8}',0,'CREDIT');
-INSERT INTO messages VALUES(55,310007,'insert','sends','{"asset":"BBBB","block_index":310007,"destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","quantity":4000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"b25659252f68f162d96cf2cf3070b30e5913b472cbace76985e314b4634641a0","tx_index":8}',0,'SEND');
-INSERT INTO messages VALUES(56,310007,'parse','transactions','{"supported":true,"tx_hash":"b25659252f68f162d96cf2cf3070b30e5913b472cbace76985e314b4634641a0","tx_index":8}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(57,310007,'parse','blocks','{"block_index":310007,"ledger_hash":"c5d21baa8c6949a8e9f0d73a37436d431bf4876ab3b60b82553877ec53fc4454","messages_hash":"477c8a3efdb86228e5387e26f324d6db1de8d3d0269b61e5918c50e9099e27ca","txlist_hash":"d9532f5bdd583968d88ed24feb95b50c5e319d36171dd7bc6067ddf3d13c623c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(58,310007,'insert','blocks','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(59,310008,'insert','transactions','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"btc_amount":1000,"data":"000000000000000000004768000000000000020e","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"592e248181970aa6f97f2cfe133323d3ffb2095dd7f411cfd20b1ab611238a11","tx_index":9}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(60,310008,'insert','debits','{"action":"send","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBC","block_index":310008,"event":"592e248181970aa6f97f2cfe133323d3ffb2095dd7f411cfd20b1ab611238a11","quantity":526,"tx_index":9}',0,'DEBIT');
-INSERT INTO messages VALUES(61,310008,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"BBBC","block_index":310008,"calling_function":"send","event":"592e248181970aa6f97f2cfe133323d3ffb2095dd7f411cfd20b1ab611238a11","quantity":526,"tx_index":9}',0,'CREDIT');
-INSERT INTO messages VALUES(62,310008,'insert','sends','{"asset":"BBBC","block_index":310008,"destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","quantity":526,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"592e248181970aa6f97f2cfe133323d3ffb2095dd7f411cfd20b1ab611238a11","tx_index":9}',0,'SEND');
-INSERT INTO messages VALUES(63,310008,'parse','transactions','{"supported":true,"tx_hash":"592e248181970aa6f97f2cfe133323d3ffb2095dd7f411cfd20b1ab611238a11","tx_index":9}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(64,310008,'parse','blocks','{"block_index":310008,"ledger_hash":"579de8204446e9128076fd27a644a82da77ca5ff2793ff56815c24a11218af5e","messages_hash":"e6077ca90d21f6c9bf673fddbfde5afa61ce76d3efdc19e3e98601ebe2659c69","txlist_hash":"5b37c224e5684c0b3a913793e7e97c4f88b26b6c6d7683de8e06bb9485fba409"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(65,310008,'insert','blocks','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(66,310009,'insert','transactions','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"btc_amount":0,"data":"00000032000000000000025800000000000047670000000000000001","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"f2f6db13d6bda4def4f1bd759b603c64c962f82017329057a9237ceaf171520a","tx_index":10}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(67,310009,'insert','debits','{"action":"dividend","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310009,"event":"f2f6db13d6bda4def4f1bd759b603c64c962f82017329057a9237ceaf171520a","quantity":24,"tx_index":10}',0,'DEBIT');
-INSERT INTO messages VALUES(68,310009,'insert','debits','{"action":"dividend fee","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310009,"event":"f2f6db13d6bda4def4f1bd759b603c64c962f82017329057a9237ceaf171520a","quantity":20000,"tx_index":10}',0,'DEBIT');
-INSERT INTO messages VALUES(69,310009,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"XCP","block_index":310009,"calling_function":"dividend","event":"f2f6db13d6bda4def4f1bd759b603c64c962f82017329057a9237ceaf171520a","quantity":24,"tx_index":10}',0,'CREDIT');
-INSERT INTO messages VALUES(70,310009,'insert','dividends','{"asset":"BBBB","block_index":310009,"dividend_asset":"XCP","fee_paid":20000,"quantity_per_unit":600,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"f2f6db13d6bda4def4f1bd759b603c64c962f82017329057a9237ceaf171520a","tx_index":10}',0,'ASSET_DIVIDEND');
-INSERT INTO messages VALUES(71,310009,'parse','transactions','{"supported":true,"tx_hash":"f2f6db13d6bda4def4f1bd759b603c64c962f82017329057a9237ceaf171520a","tx_index":10}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(72,310009,'parse','blocks','{"block_index":310009,"ledger_hash":"c03a6e31f50f172c86029ce6a810ec730e1179ad3e76ba5d4290595ec414bb87","messages_hash":"6b1c0ca7b4fbde952b5729befc447a09d9e996f873f25757fc9fe6332799bdc9","txlist_hash":"f81c6592f74098821e15c146c2a7e4a5be2cc743431d37a5fb6d4143b89907d5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(73,310009,'insert','blocks','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(74,310010,'insert','transactions','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"btc_amount":0,"data":"00000032000000000000032000000000000047680000000000000001","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"a4353c6bd3159d3288f76c9f40fdbde89d681b09ec64d1f2b422b2e9e30c10d8","tx_index":11}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(75,310010,'insert','debits','{"action":"dividend","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310010,"event":"a4353c6bd3159d3288f76c9f40fdbde89d681b09ec64d1f2b422b2e9e30c10d8","quantity":420800,"tx_index":11}',0,'DEBIT');
-INSERT INTO messages VALUES(76,310010,'insert','debits','{"action":"dividend fee","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310010,"event":"a4353c6bd3159d3288f76c9f40fdbde89d681b09ec64d1f2b422b2e9e30c10d8","quantity":20000,"tx_index":11}',0,'DEBIT');
-INSERT INTO messages VALUES(77,310010,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"XCP","block_index":310010,"calling_function":"dividend","event":"a4353c6bd3159d3288f76c9f40fdbde89d681b09ec64d1f2b422b2e9e30c10d8","quantity":420800,"tx_index":11}',0,'CREDIT');
-INSERT INTO messages VALUES(78,310010,'insert','dividends','{"asset":"BBBC","block_index":310010,"dividend_asset":"XCP","fee_paid":20000,"quantity_per_unit":800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"a4353c6bd3159d3288f76c9f40fdbde89d681b09ec64d1f2b422b2e9e30c10d8","tx_index":11}',0,'ASSET_DIVIDEND');
-INSERT INTO messages VALUES(79,310010,'parse','transactions','{"supported":true,"tx_hash":"a4353c6bd3159d3288f76c9f40fdbde89d681b09ec64d1f2b422b2e9e30c10d8","tx_index":11}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(80,310010,'parse','blocks','{"block_index":310010,"ledger_hash":"804651f6571bb24ef7534c97116ae35fb0b6b31aa6a4574a419aae7fc2900b1c","messages_hash":"68122cbe27346172664dc07f3c7cd823a2fd9ff5efdb47ed357fcf80ba43976c","txlist_hash":"3698516a21c2c590522e6419eae91ed8b469d922863141def1f3e295c4954dfd"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(81,310010,'insert','blocks','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(82,310011,'insert','transactions','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"btc_amount":0,"data":"0000001e52bb3300405900000000000005f5e0ff09556e69742054657374","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"9ec74a4822710f9534a3815f0e836a09219f6c766880a57767c7514071d99084","tx_index":12}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(83,310011,'insert','broadcasts','{"block_index":310011,"fee_fraction_int":99999999,"locked":false,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","text":"Unit Test","timestamp":1388000000,"tx_hash":"9ec74a4822710f9534a3815f0e836a09219f6c766880a57767c7514071d99084","tx_index":12,"value":100.0}',0,'BROADCAST');
-INSERT INTO messages VALUES(84,310011,'parse','transactions','{"supported":true,"tx_hash":"9ec74a4822710f9534a3815f0e836a09219f6c766880a57767c7514071d99084","tx_index":12}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(85,310011,'parse','blocks','{"block_index":310011,"ledger_hash":"a9a18fcba1a83d637dcfd633f32848d55c86c5b499e0c15af6a626653b7424b8","messages_hash":"3cb60f7ac2f1597df6cde54a9aea3c2dda78734aa723e408520d205af49c6c62","txlist_hash":"deaaba2ecb1772901052ae6490a1015e75146af3b2707b1c148562deff91af49"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(86,310011,'insert','blocks','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(87,310012,'insert','transactions','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"btc_amount":1000,"data":"00000028000052bb33640000000002faf08000000000017d7840000000000000000000003b100000000a","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"ef92dc4986fdfb4ccb6e101ee949d5307c554e8dd1619307548ec032a973f19c","tx_index":13}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(88,310012,'insert','debits','{"action":"bet","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310012,"event":"ef92dc4986fdfb4ccb6e101ee949d5307c554e8dd1619307548ec032a973f19c","quantity":50000000,"tx_index":13}',0,'DEBIT');
-INSERT INTO messages VALUES(89,310012,'insert','bets','{"bet_type":0,"block_index":310012,"counterwager_quantity":25000000,"counterwager_remaining":25000000,"deadline":1388000100,"expiration":10,"expire_index":310022,"fee_fraction_int":99999999.0,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":15120,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":0.0,"tx_hash":"ef92dc4986fdfb4ccb6e101ee949d5307c554e8dd1619307548ec032a973f19c","tx_index":13,"wager_quantity":50000000,"wager_remaining":50000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(90,310012,'parse','transactions','{"supported":true,"tx_hash":"ef92dc4986fdfb4ccb6e101ee949d5307c554e8dd1619307548ec032a973f19c","tx_index":13}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(91,310012,'parse','blocks','{"block_index":310012,"ledger_hash":"27298dbdb9026b5d54228b686b7a76f9d42479da79b38b9ef7cd13e4fee27159","messages_hash":"49b0d12e30aae10622d9c04e4d7ae9c574020ad4471669bd37c5e5e3354f928e","txlist_hash":"e409e7c7435482a64f10aaaaa6e62d69a4f0ae3083922c91907d6f15393dbb22"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(92,310012,'insert','blocks','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(93,310013,'insert','transactions','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"btc_amount":1000,"data":"00000028000152bb336400000000017d78400000000002793d60000000000000000000003b100000000a","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"ce9d3a5ea18ed454ddee80b75bd12abdd47de8e176d9c9dfc768c1233e729943","tx_index":14}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(94,310013,'update','orders','{"status":"expired","tx_hash":"c953eb18873ce8aed42456df0ece8e4678e13282d9917916e7a4aec10e828375"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(95,310013,'insert','order_expirations','{"block_index":310013,"order_hash":"c953eb18873ce8aed42456df0ece8e4678e13282d9917916e7a4aec10e828375","source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3"}',0,'ORDER_EXPIRATION');
-INSERT INTO messages VALUES(96,310013,'insert','debits','{"action":"bet","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310013,"event":"ce9d3a5ea18ed454ddee80b75bd12abdd47de8e176d9c9dfc768c1233e729943","quantity":25000000,"tx_index":14}',0,'DEBIT');
-INSERT INTO messages VALUES(97,310013,'insert','bets','{"bet_type":1,"block_index":310013,"counterwager_quantity":41500000,"counterwager_remaining":41500000,"deadline":1388000100,"expiration":10,"expire_index":310023,"fee_fraction_int":99999999.0,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":15120,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":0.0,"tx_hash":"ce9d3a5ea18ed454ddee80b75bd12abdd47de8e176d9c9dfc768c1233e729943","tx_index":14,"wager_quantity":25000000,"wager_remaining":25000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(98,310013,'update','bets','{"counterwager_remaining":4250000,"status":"open","tx_hash":"ef92dc4986fdfb4ccb6e101ee949d5307c554e8dd1619307548ec032a973f19c","wager_remaining":8500000}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(99,310013,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310013,"calling_function":"filled","event":"ce9d3a5ea18ed454ddee80b75bd12abdd47de8e176d9c9dfc768c1233e729943","quantity":4250000,"tx_index":14}',0,'CREDIT');
-INSERT INTO messages VALUES(100,310013,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"ce9d3a5ea18ed454ddee80b75bd12abdd47de8e176d9c9dfc768c1233e729943","wager_remaining":4250000}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(101,310013,'insert','bet_matches','{"backward_quantity":20750000,"block_index":310012,"deadline":1388000100,"fee_fraction_int":99999999,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","forward_quantity":41500000,"id":"ef92dc4986fdfb4ccb6e101ee949d5307c554e8dd1619307548ec032a973f19c_ce9d3a5ea18ed454ddee80b75bd12abdd47de8e176d9c9dfc768c1233e729943","initial_value":100.0,"leverage":15120,"match_expire_index":310022,"status":"pending","target_value":0.0,"tx0_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx0_bet_type":0,"tx0_block_index":310012,"tx0_expiration":10,"tx0_hash":"ef92dc4986fdfb4ccb6e101ee949d5307c554e8dd1619307548ec032a973f19c","tx0_index":13,"tx1_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx1_bet_type":1,"tx1_block_index":310013,"tx1_expiration":10,"tx1_hash":"ce9d3a5ea18ed454ddee80b75bd12abdd47de8e176d9c9dfc768c1233e729943","tx1_index":14}',0,'BET_MATCH');
-INSERT INTO messages VALUES(102,310013,'parse','transactions','{"supported":true,"tx_hash":"ce9d3a5ea18ed454ddee80b75bd12abdd47de8e176d9c9dfc768c1233e729943","tx_index":14}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(103,310013,'parse','blocks','{"block_index":310013,"ledger_hash":"f5fbbb8870bb8253cfba52c58765b8c2493ceee6a2db5779a4212ed456bf892e","messages_hash":"0548d7767e52fe92fb48e9860a17d4d0aae87d90395c814f71a19418cb01f253","txlist_hash":"78b492a743e24d50541f29a1a8e476434e81961bd457552c55fcbbac68d68fca"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(104,310013,'insert','blocks','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(105,310014,'insert','transactions','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"btc_amount":1000,"data":"00000028000052bb33640000000008f0d1800000000014dc93800000000000000000000013b00000000a","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"6722884208180367a60c5c96ae86865dad3c63525a9498d716e98b5015ec2e3d","tx_index":15}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(106,310014,'update','orders','{"status":"expired","tx_hash":"89a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(107,310014,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310014,"calling_function":"cancel order","event":"89a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a","quantity":5000000,"tx_index":0}',0,'CREDIT');
-INSERT INTO messages VALUES(108,310014,'insert','order_expirations','{"block_index":310014,"order_hash":"89a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a","source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3"}',0,'ORDER_EXPIRATION');
-INSERT INTO messages VALUES(109,310014,'insert','debits','{"action":"bet","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310014,"event":"6722884208180367a60c5c96ae86865dad3c63525a9498d716e98b5015ec2e3d","quantity":150000000,"tx_index":15}',0,'DEBIT');
-INSERT INTO messages VALUES(110,310014,'insert','bets','{"bet_type":0,"block_index":310014,"counterwager_quantity":350000000,"counterwager_remaining":350000000,"deadline":1388000100,"expiration":10,"expire_index":310024,"fee_fraction_int":99999999.0,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":5040,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":0.0,"tx_hash":"6722884208180367a60c5c96ae86865dad3c63525a9498d716e98b5015ec2e3d","tx_index":15,"wager_quantity":150000000,"wager_remaining":150000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(111,310014,'parse','transactions','{"supported":true,"tx_hash":"6722884208180367a60c5c96ae86865dad3c63525a9498d716e98b5015ec2e3d","tx_index":15}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(112,310014,'parse','blocks','{"block_index":310014,"ledger_hash":"f1e77a7a4d28d64a0cfd878112074b6205ef09055b93b8923b0c6466a07ea500","messages_hash":"1ec2ab1b175680972277d46d3c88eacd45939ff84545534192a4aae70b68bd1f","txlist_hash":"475ee3563b60fa5bbf8f8db5eabf9bdfea4a2f1b5fc82aedc37fa7c581c5f065"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(113,310014,'insert','blocks','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(114,310015,'insert','transactions','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"btc_amount":1000,"data":"00000028000152bb33640000000014dc93800000000008f0d1800000000000000000000013b00000000a","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"10c669ad89d61e1a983e179f66f355b1dd21e53d520fd4dc3bb5a6f9e5e24fcd","tx_index":16}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(115,310015,'insert','debits','{"action":"bet","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310015,"event":"10c669ad89d61e1a983e179f66f355b1dd21e53d520fd4dc3bb5a6f9e5e24fcd","quantity":350000000,"tx_index":16}',0,'DEBIT');
-INSERT INTO messages VALUES(116,310015,'insert','bets','{"bet_type":1,"block_index":310015,"counterwager_quantity":150000000,"counterwager_remaining":150000000,"deadline":1388000100,"expiration":10,"expire_index":310025,"fee_fraction_int":99999999.0,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":5040,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":0.0,"tx_hash":"10c669ad89d61e1a983e179f66f355b1dd21e53d520fd4dc3bb5a6f9e5e24fcd","tx_index":16,"wager_quantity":350000000,"wager_remaining":350000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(117,310015,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310015,"calling_function":"filled","event":"10c669ad89d61e1a983e179f66f355b1dd21e53d520fd4dc3bb5a6f9e5e24fcd","quantity":0,"tx_index":16}',0,'CREDIT');
-INSERT INTO messages VALUES(118,310015,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"6722884208180367a60c5c96ae86865dad3c63525a9498d716e98b5015ec2e3d","wager_remaining":0}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(119,310015,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310015,"calling_function":"filled","event":"10c669ad89d61e1a983e179f66f355b1dd21e53d520fd4dc3bb5a6f9e5e24fcd","quantity":0,"tx_index":16}',0,'CREDIT');
-INSERT INTO messages VALUES(120,310015,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"10c669ad89d61e1a983e179f66f355b1dd21e53d520fd4dc3bb5a6f9e5e24fcd","wager_remaining":0}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(121,310015,'insert','bet_matches','{"backward_quantity":350000000,"block_index":310014,"deadline":1388000100,"fee_fraction_int":99999999,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","forward_quantity":150000000,"id":"6722884208180367a60c5c96ae86865dad3c63525a9498d716e98b5015ec2e3d_10c669ad89d61e1a983e179f66f355b1dd21e53d520fd4dc3bb5a6f9e5e24fcd","initial_value":100.0,"leverage":5040,"match_expire_index":310024,"status":"pending","target_value":0.0,"tx0_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx0_bet_type":0,"tx0_block_index":310014,"tx0_expiration":10,"tx0_hash":"6722884208180367a60c5c96ae86865dad3c63525a9498d716e98b5015ec2e3d","tx0_index":15,"tx1_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx1_bet_type":1,"tx1_block_index":310015,"tx1_expiration":10,"tx1_hash":"10c669ad89d61e1a983e179f66f355b1dd21e53d520fd4dc3bb5a6f9e5e24fcd","tx1_index":16}',0,'BET_MATCH');
-INSERT INTO messages VALUES(122,310015,'parse','transactions','{"supported":true,"tx_hash":"10c669ad89d61e1a983e179f66f355b1dd21e53d520fd4dc3bb5a6f9e5e24fcd","tx_index":16}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(123,310015,'parse','blocks','{"block_index":310015,"ledger_hash":"014bcc839c0ea0d2fecd9aab3074528ffee3b2dce7f805e4d459e2dfb3d98a51","messages_hash":"1c29ad09a0e553303984b97abf9b4a3a844defb01750cda96efc763eb7e0e509","txlist_hash":"5d40b180a3f3b38eedd15c7f40e8585aaa5e2fdde3967dff443a74703fa45fd4"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(124,310015,'insert','blocks','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(125,310016,'insert','transactions','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"btc_amount":1000,"data":"00000028000252bb33c8000000002cb417800000000026be36803ff0000000000000000013b00000000a","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"caaceb9160747bd86fa4b3b4d090c9e1617285fae312eac2152bf3fabedcd2bc","tx_index":17}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(126,310016,'insert','debits','{"action":"bet","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310016,"event":"caaceb9160747bd86fa4b3b4d090c9e1617285fae312eac2152bf3fabedcd2bc","quantity":750000000,"tx_index":17}',0,'DEBIT');
-INSERT INTO messages VALUES(127,310016,'insert','bets','{"bet_type":2,"block_index":310016,"counterwager_quantity":650000000,"counterwager_remaining":650000000,"deadline":1388000200,"expiration":10,"expire_index":310026,"fee_fraction_int":99999999.0,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":5040,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":1.0,"tx_hash":"caaceb9160747bd86fa4b3b4d090c9e1617285fae312eac2152bf3fabedcd2bc","tx_index":17,"wager_quantity":750000000,"wager_remaining":750000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(128,310016,'parse','transactions','{"supported":true,"tx_hash":"caaceb9160747bd86fa4b3b4d090c9e1617285fae312eac2152bf3fabedcd2bc","tx_index":17}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(129,310016,'parse','blocks','{"block_index":310016,"ledger_hash":"9f72d6a84ee58e1e851a90a62b525dc257c3b1b0c7e9964f93a7e5df6a2e4007","messages_hash":"422aca1d53d6f1cdabb33311ac6416c777f51a0f2964e2c9f8ccd40f5894e98e","txlist_hash":"e990e43e7272c9d971fcc782768bea70c71d45fa7d712a7195bcc4151617a57f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(130,310016,'insert','blocks','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(131,310017,'insert','transactions','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"btc_amount":1000,"data":"00000028000352bb33c80000000026be3680000000002cb417803ff0000000000000000013b00000000a","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"67497105b77192af401ec8024ad34de211592877dee8532dbe216d8a8f17dd0c","tx_index":18}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(132,310017,'insert','debits','{"action":"bet","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310017,"event":"67497105b77192af401ec8024ad34de211592877dee8532dbe216d8a8f17dd0c","quantity":650000000,"tx_index":18}',0,'DEBIT');
-INSERT INTO messages VALUES(133,310017,'insert','bets','{"bet_type":3,"block_index":310017,"counterwager_quantity":750000000,"counterwager_remaining":750000000,"deadline":1388000200,"expiration":10,"expire_index":310027,"fee_fraction_int":99999999.0,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":5040,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":1.0,"tx_hash":"67497105b77192af401ec8024ad34de211592877dee8532dbe216d8a8f17dd0c","tx_index":18,"wager_quantity":650000000,"wager_remaining":650000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(134,310017,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310017,"calling_function":"filled","event":"67497105b77192af401ec8024ad34de211592877dee8532dbe216d8a8f17dd0c","quantity":0,"tx_index":18}',0,'CREDIT');
-INSERT INTO messages VALUES(135,310017,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"caaceb9160747bd86fa4b3b4d090c9e1617285fae312eac2152bf3fabedcd2bc","wager_remaining":0}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(136,310017,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310017,"calling_function":"filled","event":"67497105b77192af401ec8024ad34de211592877dee8532dbe216d8a8f17dd0c","quantity":0,"tx_index":18}',0,'CREDIT');
-INSERT INTO messages VALUES(137,310017,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"67497105b77192af401ec8024ad34de211592877dee8532dbe216d8a8f17dd0c","wager_remaining":0}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(138,310017,'insert','bet_matches','{"backward_quantity":650000000,"block_index":310016,"deadline":1388000200,"fee_fraction_int":99999999,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","forward_quantity":750000000,"id":"caaceb9160747bd86fa4b3b4d090c9e1617285fae312eac2152bf3fabedcd2bc_67497105b77192af401ec8024ad34de211592877dee8532dbe216d8a8f17dd0c","initial_value":100.0,"leverage":5040,"match_expire_index":310026,"status":"pending","target_value":1.0,"tx0_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx0_bet_type":2,"tx0_block_index":310016,"tx0_expiration":10,"tx0_hash":"caaceb9160747bd86fa4b3b4d090c9e1617285fae312eac2152bf3fabedcd2bc","tx0_index":17,"tx1_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx1_bet_type":3,"tx1_block_index":310017,"tx1_expiration":10,"tx1_hash":"67497105b77192af401ec8024ad34de211592877dee8532dbe216d8a8f17dd0c","tx1_index":18}',0,'BET_MATCH');
-INSERT INTO messages VALUES(139,310017,'parse','transactions','{"supported":true,"tx_hash":"67497105b77192af401ec8024ad34de211592877dee8532dbe216d8a8f17dd0c","tx_index":18}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(140,310017,'parse','blocks','{"block_index":310017,"ledger_hash":"5d1e195a7d313d703253640cd98be600b04a7d98aae69b5327a29e740573198d","messages_hash":"51b88cfe43063411950072a1f9a3529859a893b57b1f10f578725b072279a25b","txlist_hash":"443444009d5700747b2d345cc10a70bf5a48214bc279d811a311ef76e52abf04"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(141,310017,'insert','blocks','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(142,310018,'insert','transactions','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"btc_amount":0,"data":"0000001e52bb33324058f7256ffc115e004c4b4009556e69742054657374","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"e87bf8dfeda7df143873ff042cc7a05dd590a6bef6a55c5832e22db1bd5e3bcd","tx_index":19}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(143,310018,'insert','broadcasts','{"block_index":310018,"fee_fraction_int":5000000,"locked":false,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","text":"Unit Test","timestamp":1388000050,"tx_hash":"e87bf8dfeda7df143873ff042cc7a05dd590a6bef6a55c5832e22db1bd5e3bcd","tx_index":19,"value":99.86166}',0,'BROADCAST');
-INSERT INTO messages VALUES(144,310018,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310018,"calling_function":"bet settled: liquidated for bear","event":"e87bf8dfeda7df143873ff042cc7a05dd590a6bef6a55c5832e22db1bd5e3bcd","quantity":59137500,"tx_index":19}',0,'CREDIT');
-INSERT INTO messages VALUES(145,310018,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310018,"calling_function":"feed fee","event":"e87bf8dfeda7df143873ff042cc7a05dd590a6bef6a55c5832e22db1bd5e3bcd","quantity":3112500,"tx_index":19}',0,'CREDIT');
-INSERT INTO messages VALUES(146,310018,'insert','bet_match_resolutions','{"bear_credit":59137500,"bet_match_id":"ef92dc4986fdfb4ccb6e101ee949d5307c554e8dd1619307548ec032a973f19c_ce9d3a5ea18ed454ddee80b75bd12abdd47de8e176d9c9dfc768c1233e729943","bet_match_type_id":1,"block_index":310018,"bull_credit":0,"escrow_less_fee":null,"fee":3112500,"settled":false,"winner":null}',0,'BET_MATCH_RESOLUTON');
-INSERT INTO messages VALUES(147,310018,'update','bet_matches','{"id":"ef92dc4986fdfb4ccb6e101ee949d5307c554e8dd1619307548ec032a973f19c_ce9d3a5ea18ed454ddee80b75bd12abdd47de8e176d9c9dfc768c1233e729943","status":"settled: liquidated for bear"}',0,'BET_MATCH_UPDATE');
-INSERT INTO messages VALUES(148,310018,'parse','transactions','{"supported":true,"tx_hash":"e87bf8dfeda7df143873ff042cc7a05dd590a6bef6a55c5832e22db1bd5e3bcd","tx_index":19}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(149,310018,'parse','blocks','{"block_index":310018,"ledger_hash":"f38538a4a2cba9bcf8821b56e1dc877990e027135d3f220338cd8cb11f3eb205","messages_hash":"641798f65a211495512814860dc526be35f6887724547aa27a257203cc2b2e38","txlist_hash":"abe72d22a1fb28e1ce34bfe3f1fd012d5a41fe219a0c4ee96f3b4b0e49aea889"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(150,310018,'insert','blocks','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(151,310019,'insert','transactions','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"btc_amount":0,"data":"0000001e52bb3365405915f3b645a1cb004c4b4009556e69742054657374","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"1fcd2de64aabc6c05796e28cbea31df45a25928c2cd8dd30d774c9e70c4e97df","tx_index":20}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(152,310019,'insert','broadcasts','{"block_index":310019,"fee_fraction_int":5000000,"locked":false,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","text":"Unit Test","timestamp":1388000101,"tx_hash":"1fcd2de64aabc6c05796e28cbea31df45a25928c2cd8dd30d774c9e70c4e97df","tx_index":20,"value":100.343}',0,'BROADCAST');
-INSERT INTO messages VALUES(153,310019,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310019,"calling_function":"bet settled","event":"1fcd2de64aabc6c05796e28cbea31df45a25928c2cd8dd30d774c9e70c4e97df","quantity":159300000,"tx_index":20}',0,'CREDIT');
-INSERT INTO messages VALUES(154,310019,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310019,"calling_function":"bet settled","event":"1fcd2de64aabc6c05796e28cbea31df45a25928c2cd8dd30d774c9e70c4e97df","quantity":315700000,"tx_index":20}',0,'CREDIT');
-INSERT INTO messages VALUES(155,310019,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310019,"calling_function":"feed fee","event":"1fcd2de64aabc6c05796e28cbea31df45a25928c2cd8dd30d774c9e70c4e97df","quantity":25000000,"tx_index":20}',0,'CREDIT');
-INSERT INTO messages VALUES(156,310019,'insert','bet_match_resolutions','{"bear_credit":315700000,"bet_match_id":"6722884208180367a60c5c96ae86865dad3c63525a9498d716e98b5015ec2e3d_10c669ad89d61e1a983e179f66f355b1dd21e53d520fd4dc3bb5a6f9e5e24fcd","bet_match_type_id":1,"block_index":310019,"bull_credit":159300000,"escrow_less_fee":null,"fee":25000000,"settled":true,"winner":null}',0,'BET_MATCH_RESOLUTON');
-INSERT INTO messages VALUES(157,310019,'update','bet_matches','{"id":"6722884208180367a60c5c96ae86865dad3c63525a9498d716e98b5015ec2e3d_10c669ad89d61e1a983e179f66f355b1dd21e53d520fd4dc3bb5a6f9e5e24fcd","status":"settled"}',0,'BET_MATCH_UPDATE');
-INSERT INTO messages VALUES(158,310019,'parse','transactions','{"supported":true,"tx_hash":"1fcd2de64aabc6c05796e28cbea31df45a25928c2cd8dd30d774c9e70c4e97df","tx_index":20}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(159,310019,'parse','blocks','{"block_index":310019,"ledger_hash":"3a51f1f061d953c940ac7e53f8bb37df041f2d4f42a16f5c5d23707b8b0c0dc6","messages_hash":"b59cc514a2948e9f942fb18aff5acbc5686a7021b67fd5fbb8c1cb2ee11bde4b","txlist_hash":"8bea2f5ef9805bffa4b23881f7635ec213525f8dfe98aa45e716e43a73ffe114"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(160,310019,'insert','blocks','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(161,310020,'insert','transactions','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"btc_amount":0,"data":"0000001e52bb33c94000000000000000004c4b4009556e69742054657374","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"dc4b57ad8a0b23dbc7ffc03f51e8076cd2418edf256b2660783bb0d1be0b8b73","tx_index":21}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(162,310020,'insert','broadcasts','{"block_index":310020,"fee_fraction_int":5000000,"locked":false,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","text":"Unit Test","timestamp":1388000201,"tx_hash":"dc4b57ad8a0b23dbc7ffc03f51e8076cd2418edf256b2660783bb0d1be0b8b73","tx_index":21,"value":2.0}',0,'BROADCAST');
-INSERT INTO messages VALUES(163,310020,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310020,"calling_function":"bet settled: for notequal","event":"dc4b57ad8a0b23dbc7ffc03f51e8076cd2418edf256b2660783bb0d1be0b8b73","quantity":1330000000,"tx_index":21}',0,'CREDIT');
-INSERT INTO messages VALUES(164,310020,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310020,"calling_function":"feed fee","event":"dc4b57ad8a0b23dbc7ffc03f51e8076cd2418edf256b2660783bb0d1be0b8b73","quantity":70000000,"tx_index":21}',0,'CREDIT');
-INSERT INTO messages VALUES(165,310020,'insert','bet_match_resolutions','{"bear_credit":null,"bet_match_id":"caaceb9160747bd86fa4b3b4d090c9e1617285fae312eac2152bf3fabedcd2bc_67497105b77192af401ec8024ad34de211592877dee8532dbe216d8a8f17dd0c","bet_match_type_id":5,"block_index":310020,"bull_credit":null,"escrow_less_fee":1330000000,"fee":70000000,"settled":null,"winner":"NotEqual"}',0,'BET_MATCH_RESOLUTON');
-INSERT INTO messages VALUES(166,310020,'update','bet_matches','{"id":"caaceb9160747bd86fa4b3b4d090c9e1617285fae312eac2152bf3fabedcd2bc_67497105b77192af401ec8024ad34de211592877dee8532dbe216d8a8f17dd0c","status":"settled: for notequal"}',0,'BET_MATCH_UPDATE');
-INSERT INTO messages VALUES(167,310020,'parse','transactions','{"supported":true,"tx_hash":"dc4b57ad8a0b23dbc7ffc03f51e8076cd2418edf256b2660783bb0d1be0b8b73","tx_index":21}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(168,310020,'parse','blocks','{"block_index":310020,"ledger_hash":"cce3284c53fcf79ba268d925e32ab70e3d4df1e6f13dbcbe2920e93fc689128b","messages_hash":"657db356d2ffcb7ba632c7144241fe250361e09d32b93f551768e31502d614ae","txlist_hash":"d0e8a123b3125a8e057d8504b7a96e77188895c86907c273922b80e7e9ca42d2"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(169,310020,'insert','blocks','{"block_hash":"7c2460bb32c5749c856486393239bf7a0ac789587ac71f32e7237910da8097f2","block_index":310021,"block_time":310021000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(170,310021,'insert','transactions','{"block_hash":"7c2460bb32c5749c856486393239bf7a0ac789587ac71f32e7237910da8097f2","block_index":310021,"block_time":310021000,"btc_amount":0,"data":"0000000a00000000000047670000000002faf08000000000000000010000000002faf080000a0000000000000000","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"4408350196e71533e054ef84d1bdc4ba4b0f693d2d98d240d3c697b553078ab7","tx_index":22}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(171,310021,'insert','debits','{"action":"open order","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBB","block_index":310021,"event":"4408350196e71533e054ef84d1bdc4ba4b0f693d2d98d240d3c697b553078ab7","quantity":50000000,"tx_index":22}',0,'DEBIT');
-INSERT INTO messages VALUES(172,310021,'insert','orders','{"block_index":310021,"expiration":10,"expire_index":310031,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":50000000,"get_remaining":50000000,"give_asset":"BBBB","give_quantity":50000000,"give_remaining":50000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","tx_hash":"4408350196e71533e054ef84d1bdc4ba4b0f693d2d98d240d3c697b553078ab7","tx_index":22}',0,'OPEN_ORDER');
-INSERT INTO messages VALUES(173,310021,'parse','transactions','{"supported":true,"tx_hash":"4408350196e71533e054ef84d1bdc4ba4b0f693d2d98d240d3c697b553078ab7","tx_index":22}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(174,310021,'parse','blocks','{"block_index":310021,"ledger_hash":"6ad5172a6dcaa6706d5a4f6fd8ada183e103b9faab58e42c1365613a26477490","messages_hash":"bee135735ca1d013383b5fde88988a6f7e0155ec16c2d5ffaae49d6f4e0d6905","txlist_hash":"1c207ab28dd2c5d297f47d5ac366699523cd97ccfc8a3e348dbf6fe900c32b5d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(175,310021,'insert','blocks','{"block_hash":"44435f9a99a0aa12a9bfabdc4cb8119f6ea6a6e1350d2d65445fb66a456db5fc","block_index":310022,"block_time":310022000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(176,310022,'insert','transactions','{"block_hash":"44435f9a99a0aa12a9bfabdc4cb8119f6ea6a6e1350d2d65445fb66a456db5fc","block_index":310022,"block_time":310022000,"btc_amount":100000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"181709b341ec136f90975fdaa362c767ebd789e72f16d4e17348ab2985c1bd01","tx_index":23}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(177,310022,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310022,"calling_function":"burn","event":"181709b341ec136f90975fdaa362c767ebd789e72f16d4e17348ab2985c1bd01","quantity":56999887262,"tx_index":23}',0,'CREDIT');
-INSERT INTO messages VALUES(178,310022,'insert','burns','{"block_index":310022,"burned":38000000,"earned":56999887262,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"181709b341ec136f90975fdaa362c767ebd789e72f16d4e17348ab2985c1bd01","tx_index":23}',0,'BURN');
-INSERT INTO messages VALUES(179,310022,'parse','blocks','{"block_index":310022,"ledger_hash":"c9361fea7f3dd2415969eb6ad7fe893381c9ca65ea391f2e47a966e342db3a90","messages_hash":"bb9d4b79d020195079c817aac5ae98987b3e9db4889667e69dc62fe454c25a14","txlist_hash":"c0867554bd3d50cd8ca4bb6e2d055250fa0c3c46f47b5f03ce5022b7090e07d4"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(180,310022,'insert','blocks','{"block_hash":"d8cf5bec1bbcab8ca4f495352afde3b6572b7e1d61b3976872ebb8e9d30ccb08","block_index":310023,"block_time":310023000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(181,310023,'insert','transactions','{"block_hash":"d8cf5bec1bbcab8ca4f495352afde3b6572b7e1d61b3976872ebb8e9d30ccb08","block_index":310023,"block_time":310023000,"btc_amount":1000,"data":"0000000000000000000047680000000000002710","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"f4a0c2582fb141e9451a7c00fa61afc147b9959c2dd20a1978950936fdb53831","tx_index":24}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(182,310023,'update','bets','{"status":"expired","tx_hash":"ef92dc4986fdfb4ccb6e101ee949d5307c554e8dd1619307548ec032a973f19c"}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(183,310023,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310023,"calling_function":"recredit wager remaining","event":"ef92dc4986fdfb4ccb6e101ee949d5307c554e8dd1619307548ec032a973f19c","quantity":8500000,"tx_index":0}',0,'CREDIT');
-INSERT INTO messages VALUES(184,310023,'insert','bet_expirations','{"bet_hash":"ef92dc4986fdfb4ccb6e101ee949d5307c554e8dd1619307548ec032a973f19c","bet_index":13,"block_index":310023,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3"}',0,'BET_EXPIRATION');
-INSERT INTO messages VALUES(185,310023,'insert','debits','{"action":"send","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBC","block_index":310023,"event":"f4a0c2582fb141e9451a7c00fa61afc147b9959c2dd20a1978950936fdb53831","quantity":10000,"tx_index":24}',0,'DEBIT');
-INSERT INTO messages VALUES(186,310023,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"BBBC","block_index":310023,"calling_function":"send","event":"f4a0c2582fb141e9451a7c00fa61afc147b9959c2dd20a1978950936fdb53831","quantity":10000,"tx_index":24}',0,'CREDIT');
-INSERT INTO messages VALUES(187,310023,'insert','sends','{"asset":"BBBC","block_index":310023,"destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","quantity":10000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"f4a0c2582fb141e9451a7c00fa61afc147b9959c2dd20a1978950936fdb53831","tx_index":24}',0,'SEND');
-INSERT INTO messages VALUES(188,310023,'parse','transactions','{"supported":true,"tx_hash":"f4a0c2582fb141e9451a7c00fa61afc147b9959c2dd20a1978950936fdb53831","tx_index":24}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(189,310023,'parse','blocks','{"block_index":310023,"ledger_hash":"f63680db66cf963aaaebf64130629790e7492b5ea9396434c2179a5eb8774412","messages_hash":"9953f0483df04bf7651d41fb34e95ecf36ef2195b8508e8e1525e4d1e872beea","txlist_hash":"6a3cc06342da18a8eae7180bd93af2cc3a6f7c51916a19265365814f52a58119"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(190,310023,'insert','blocks','{"block_hash":"b03042b4e18a222b4c8d1e9e1970d93e6e2a2d41686d227ff8ecf0a839223dc5","block_index":310024,"block_time":310024000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(191,310024,'parse','blocks','{"block_index":310024,"ledger_hash":"d69ea243fcd5e525ae03af680d5610b654a9d2bad17782e196305aaa110a6ba9","messages_hash":"b68e0765ebe5e98e0972ee993eb7ae5fc1178de01b68aa2e33966fb69ea2591c","txlist_hash":"7e4a0076ce614d5b7bcb0a59c84e79d21702a3507ba88bc0d8ce9e644d7fe692"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(192,310024,'insert','blocks','{"block_hash":"a872e560766832cc3b4f7f222228cb6db882ce3c54f6459f62c71d5cd6e90666","block_index":310025,"block_time":310025000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(193,310025,'parse','blocks','{"block_index":310025,"ledger_hash":"721906ed4cbd1524fafdc8e3ffef27d8b03e0c798bbcbe3eee7bc7f14afe4e81","messages_hash":"e1edd85efb3d8302b64133ce5edac3cc3047c0b968b295f864e61dadc65cdcee","txlist_hash":"c1596eb8c172f2968ddd2ef70c1a8f125ab989c1a7bb012ab56f6c75cd96bb41"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(194,310025,'insert','blocks','{"block_hash":"6c96350f6f2f05810f19a689de235eff975338587194a36a70dfd0fcd490941a","block_index":310026,"block_time":310026000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(195,310026,'parse','blocks','{"block_index":310026,"ledger_hash":"27912da2afa797876030dd0e50c31aea462d54c7bfa4f89d2f14fdb7b80db6b0","messages_hash":"fdb48d0418b6e97e15f1beb3e755e001eccc2217100606217e003c3a86a27997","txlist_hash":"2d653751a75829265f2cfe2dd7bcc3a594be62492893d36642e3c8815d339fbd"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(196,310026,'insert','blocks','{"block_hash":"d7acfac66df393c4482a14c189742c0571b89442eb7f817b34415a560445699e","block_index":310027,"block_time":310027000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(197,310027,'parse','blocks','{"block_index":310027,"ledger_hash":"cc0734ecfd2bdbd2d04d236b853f60e324feaa9115fae33a8add961c4a5f9436","messages_hash":"88a9b5e14c5f63905f30734c91a2bfb61efe8e62ba88cf36a5242495487885b4","txlist_hash":"3d5c1eb8dafccfee04f7d91b2819d9f51a9fe8df4050c025c19c29ceb18b3575"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(198,310027,'insert','blocks','{"block_hash":"02409fcf8fa06dafcb7f11e38593181d9c42cc9d5e2ddc304d098f990bd9530b","block_index":310028,"block_time":310028000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(199,310028,'parse','blocks','{"block_index":310028,"ledger_hash":"d3f5fbbe85d5a81fef8735c73349f61a43122f4b6f3f7aa61215323a683ce3aa","messages_hash":"ba94bc00c1246e08a641038398acddf181d667a726e0a054a570a95a91407055","txlist_hash":"e6600d6d90725ce81afdd7b00220f8df650f85dc3a308d2486fab88edaaa8981"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(200,310028,'insert','blocks','{"block_hash":"3c739fa8b40c118d5547ea356ee8d10ee2898871907643ec02e5db9d00f03cc6","block_index":310029,"block_time":310029000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(201,310029,'parse','blocks','{"block_index":310029,"ledger_hash":"74d08f0d1cad9f7102d0cfe70f50614c7ae7f4844ca6d02390031e1e96c2b418","messages_hash":"f4f014290c00eb6d1df157e203d82ed4bdd52aaa758dabdf3fd32ec3880c2b5c","txlist_hash":"341aa44dcd4967cc3356ca23c97111b1cf3ee128c944493a0ebc6458c4f119be"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(202,310029,'insert','blocks','{"block_hash":"d5071cddedf89765ee0fd58f209c1c7d669ba8ea66200a57587da8b189b9e4f5","block_index":310030,"block_time":310030000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(203,310030,'parse','blocks','{"block_index":310030,"ledger_hash":"753a1a8bb877851ae24dbc33884344f34ee18c6b0d70a4d909231448b943e8cd","messages_hash":"db8ea86a15db96b17b2d85a213bb157e6044ef311d40258dcb4e2030ee91546b","txlist_hash":"b9385290e5bd72f2a1a5d2cc889108a6da0aa888fdcf76170b166888c6301407"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(204,310030,'insert','blocks','{"block_hash":"0b02b10f41380fff27c543ea8891ecb845bf7a003ac5c87e15932aff3bfcf689","block_index":310031,"block_time":310031000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(205,310031,'parse','blocks','{"block_index":310031,"ledger_hash":"f7c62d08a4efc854dea6f47249786d3d00778d97223dd84de1d0fd1eef3e2ee7","messages_hash":"108cd055eb0f1f50883615c29d1f2f7e58a3ed849b381d6a13f5249cf3339d6c","txlist_hash":"6c27a0cb80d8602b9ccd126f53bb69727d358353b4c1299434c3472b0469d85f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(206,310031,'insert','blocks','{"block_hash":"66346be81e6ba04544f2ae643b76c2b7b1383f038fc2636e02e49dc7ec144074","block_index":310032,"block_time":310032000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(207,310032,'update','orders','{"status":"expired","tx_hash":"4408350196e71533e054ef84d1bdc4ba4b0f693d2d98d240d3c697b553078ab7"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(208,310032,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBB","block_index":310032,"calling_function":"cancel order","event":"4408350196e71533e054ef84d1bdc4ba4b0f693d2d98d240d3c697b553078ab7","quantity":50000000,"tx_index":0}',0,'CREDIT');
-INSERT INTO messages VALUES(209,310032,'insert','order_expirations','{"block_index":310032,"order_hash":"4408350196e71533e054ef84d1bdc4ba4b0f693d2d98d240d3c697b553078ab7","source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3"}',0,'ORDER_EXPIRATION');
-INSERT INTO messages VALUES(210,310032,'parse','blocks','{"block_index":310032,"ledger_hash":"833690f195e85b427b61890640fe8f0cc7419e0f4301b6f4738bab12be06dbb8","messages_hash":"a6321cefb0ec463ccef9562be2387263feab779731c65626aeb393b2fdde3886","txlist_hash":"cb3ca17e5c792309fead54d49039ee0e00e7b17291868a3a2e86e09bb3dae80e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(211,310032,'insert','blocks','{"block_hash":"999c65df9661f73e8c01f1da1afda09ac16788b72834f0ff5ea3d1464afb4707","block_index":310033,"block_time":310033000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(212,310033,'parse','blocks','{"block_index":310033,"ledger_hash":"a1e118474a6f70b8f700a67b43ee0272c4609d3309603b5be6434ca587eaa704","messages_hash":"039c4c914fb56800d197a5eba14ff51734a5f39e848fb6a3d41bf811c34a1582","txlist_hash":"2f097bb1b1dff2b4266dcb3b46d29255401e23a2fcfb75f28e9f7184733e14bc"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(213,310033,'insert','blocks','{"block_hash":"f552edd2e0a648230f3668e72ddf0ddfb1e8ac0f4c190f91b89c1a8c2e357208","block_index":310034,"block_time":310034000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(214,310034,'parse','blocks','{"block_index":310034,"ledger_hash":"3b6427f61fb59ffd674ed8e0af75687fc4ccf8b462011727d4dc4bdf4c794775","messages_hash":"e33abdd943a38b791ea9eedd1fecb1b25e17fb11ca5f434d1fb9c1a52e014b25","txlist_hash":"be05766d9a1c70d8907d523979a313ccec8cf2900335fd91800b4b90da3bee12"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(215,310034,'insert','blocks','{"block_hash":"a13cbb016f3044207a46967a4ba1c87dab411f78c55c1179f2336653c2726ae2","block_index":310035,"block_time":310035000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(216,310035,'parse','blocks','{"block_index":310035,"ledger_hash":"d065384f739c52a718f656717f88eb2fecc10d8567a93ccf823434c003d28c55","messages_hash":"5be7215f264b8f7977200c67689ceff9e2f14035280d424ae973855a8e689d7f","txlist_hash":"41cb2236ce676fd45ae98593c9cac6291fa95479ec07a5af615ccb5fbbeab760"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(217,310035,'insert','blocks','{"block_hash":"158648a98f1e1bd1875584ce8449eb15a4e91a99a923bbb24c4210135cef0c76","block_index":310036,"block_time":310036000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(218,310036,'parse','blocks','{"block_index":310036,"ledger_hash":"22cddc8dbfcbaf4b851fa5379c740a96294acc3d772dcf6d684881bef18d7fbf","messages_hash":"70668b938741ae0f0dc76997b78268cebb0960bfd43fa6d043b648d3de84cf72","txlist_hash":"0beb88a3d4adbf913601c2d5144599cecfd48886ca51f995aecfeb50c56aab1c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(219,310036,'insert','blocks','{"block_hash":"563acfd6d991ce256d5655de2e9429975c8dceeb221e76d5ec6e9e24a2c27c07","block_index":310037,"block_time":310037000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(220,310037,'parse','blocks','{"block_index":310037,"ledger_hash":"93172c51a9c4cb5c33937a199a32ad3c13a40a60f4c194a1187e2c59a15c0ccc","messages_hash":"b23bd50542786f46b18658498e048f11ecd3c4bab73ace2b1d41e72b3ef921e8","txlist_hash":"ea276540d3637a9165f482c48e414467e3a78c2c25c6a70bbed0c38f7205920e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(221,310037,'insert','blocks','{"block_hash":"b44b4cad12431c32df27940e18d51f63897c7472b70950d18454edfd640490b2","block_index":310038,"block_time":310038000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(222,310038,'parse','blocks','{"block_index":310038,"ledger_hash":"7a167a13f7e576c7e066035dbe2a2513659f1386c095a9e63afa494c043b7def","messages_hash":"d236c4cc61ab09e7b0a2b20a2d8358002b4cdd8528edfad746df5f4156ebb8a5","txlist_hash":"15ef5d6175a7ce1937554ed6c2b10be6555aa14f7179245b7b140d1a620095fc"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(223,310038,'insert','blocks','{"block_hash":"5fa1ae9c5e8a599247458987b006ad3a57f686df1f7cc240bf119e911b56c347","block_index":310039,"block_time":310039000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(224,310039,'parse','blocks','{"block_index":310039,"ledger_hash":"4733d9ada3d4f60bc09f0a6eba3fdcdcd8e8b18adfd38c7bf06372259e2d38f3","messages_hash":"b001901e32d2be5ffcf6722ad12d238cba23d17cf5903818c35fc4f1e111ea45","txlist_hash":"4ac5fe346b8577626d58c9442c95fccd4955506ac712ee3f27b5df6b7ec1d0df"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(225,310039,'insert','blocks','{"block_hash":"7200ded406675453eadddfbb2d14c2a4526c7dc2b5de14bd48b29243df5e1aa3","block_index":310040,"block_time":310040000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(226,310040,'parse','blocks','{"block_index":310040,"ledger_hash":"b8021bbe3744e58cedfc3dd99220fce48f4e56a8fe8256d7894dd55c7312a76d","messages_hash":"bcfde45a33ace1870169520291256debd57cd92191055b02b067ca9b359459d9","txlist_hash":"acbb3114dc5c7599eabdaec4833952c3b6de20dde616233f3945151977d5be16"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(227,310040,'insert','blocks','{"block_hash":"5db592ff9ba5fac1e030cf22d6c13b70d330ba397f415340086ee7357143b359","block_index":310041,"block_time":310041000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(228,310041,'parse','blocks','{"block_index":310041,"ledger_hash":"017b79a5fb34785dd39964a61a5bde69d676f75ee085c27bbc9e3381983c2dab","messages_hash":"fe7e2286d95c9fedb3f426879324acf58b6b818e79fb76f672d77d9a052f33a0","txlist_hash":"6cbdfb2d6b3677c91097b1e80a32dafb0172725fabff370adcf444321ee48509"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(229,310041,'insert','blocks','{"block_hash":"826fd4701ef2824e9559b069517cd3cb990aff6a4690830f78fc845ab77fa3e4","block_index":310042,"block_time":310042000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(230,310042,'parse','blocks','{"block_index":310042,"ledger_hash":"cf5389c037b6c619025bf95d9718fb5548cd67978c3ebf26f76029873828162e","messages_hash":"cf30fc0d3b3fcad9aa91035bdab67237d66928cfaffd8c6e9d5747ba7e730295","txlist_hash":"a091876d90aaf1dd5b0d53403a3a9b5788710bf3d0c1996184a91961a1f24aa0"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(231,310042,'insert','blocks','{"block_hash":"2254a12ada208f1dd57bc17547ecaf3c44720323c47bc7d4b1262477cb7f3c51","block_index":310043,"block_time":310043000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(232,310043,'parse','blocks','{"block_index":310043,"ledger_hash":"df116ea1fcf5f968644dcc97c1149f0ef6061b188fd56c27152543256ce79009","messages_hash":"3967234a887552a7a446b28b1d71be584efe09d346e735477726fcb803d3ea06","txlist_hash":"eafb7d2cbbb2d1afe4a3eb65ca6bc7be653d7d824238264082d2c5e382757e54"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(233,310043,'insert','blocks','{"block_hash":"3346d24118d8af0b3c6bcc42f8b85792e7a2e7036ebf6e4c25f4f6723c78e46b","block_index":310044,"block_time":310044000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(234,310044,'parse','blocks','{"block_index":310044,"ledger_hash":"c12cfaa984bfb34e781ac93848a87cdc0318c45a1cd9f02d31f5c3a4abe8d918","messages_hash":"b96d11bc51e12584035a7a14072443ebb4ab62cb43903ce3f93183f4489708ab","txlist_hash":"61cb811c578f90cd6cc9f6963ff80c280f6ad0edb53fe53dd3075a8818404fe8"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(235,310044,'insert','blocks','{"block_hash":"7bba0ab243839e91ad1a45a762bf074011f8a9883074d68203c6d1b46fffde98","block_index":310045,"block_time":310045000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(236,310045,'parse','blocks','{"block_index":310045,"ledger_hash":"999a9ed2673de2db7637e22eb8a1876e0c794e90f09cdd76d1442e56ae12b1c8","messages_hash":"3ba540abdfe5bec9c2b07cacfbec12fd67312f884073e3f7a2e0138fd4c1d5d3","txlist_hash":"ce9e3f0524576a630ed0154cf69c7798065a001e6752c4f369c30b06aebbe378"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(237,310045,'insert','blocks','{"block_hash":"47db6788c38f2d6d712764979e41346b55e78cbb4969e0ef5c4336faf18993a6","block_index":310046,"block_time":310046000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(238,310046,'parse','blocks','{"block_index":310046,"ledger_hash":"240c9a2f6dc918ed868abfb5de6838d7a17f02263fdda0ccd3c7481c09e155d1","messages_hash":"657eaa5a6ca03f35197b063eff359fdd5c08e369a9675a2f2aefefae93a8adf7","txlist_hash":"4f83f9bc531841759d1071a92ccda5d898af693fc88db0de16b2d2ca09630d59"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(239,310046,'insert','blocks','{"block_hash":"a9ccabcc2a098a7d25e4ab8bda7c4e66807eefa42e29890dcd88149a10de7075","block_index":310047,"block_time":310047000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(240,310047,'parse','blocks','{"block_index":310047,"ledger_hash":"79836105e355e25afd709d15632e2c0d1ab53ab251cd3750ffee9fea4a2605b8","messages_hash":"67b525e65cdf790966a30fa8980229402ca894d989c8e04b368b39710cb486a1","txlist_hash":"b17c5d4fc0eef05c315095d265b324a0ea7dee28145d7b4e251a944b4b6a16fb"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(241,310047,'insert','blocks','{"block_hash":"610bf3935a85b05a98556c55493c6de45bed4d7b3b6c8553a984718765796309","block_index":310048,"block_time":310048000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(242,310048,'parse','blocks','{"block_index":310048,"ledger_hash":"6bf0789392e97311c4283d9f748b37effe7b0d1678076e30ce5725eff345a8c5","messages_hash":"d1189f782de3e9769c05abd81d1f7e13ff72ebae99f271958b33b84c1cecfeff","txlist_hash":"f9f7ec8bdc9301d4ea41a099d04f84631badad709fdbdf43582327f183102590"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(243,310048,'insert','blocks','{"block_hash":"4ad2761923ad49ad2b283b640f1832522a2a5d6964486b21591b71df6b33be3c","block_index":310049,"block_time":310049000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(244,310049,'parse','blocks','{"block_index":310049,"ledger_hash":"1842c46a03800f5e191cb8d641aead6bc80e6d25c2ec826f3a5df426059cc1cb","messages_hash":"3840a6172bb14e16efef4402c3a4f81667c97dc4a5ce48d90e60982f5bbaecb1","txlist_hash":"458e51569acd6ef757e0b36ab3f558e76f239ea3bfbf1b0ce7824f39ec5ac23b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(245,310049,'insert','blocks','{"block_hash":"8cfeb60a14a4cec6e9be13d699694d49007d82a31065a17890383e262071e348","block_index":310050,"block_time":310050000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(246,310050,'parse','blocks','{"block_index":310050,"ledger_hash":"d424b02109320491b2d32388869d6468ab1fca26d4bf72374cfef729efad866d","messages_hash":"4e38733346bd60ded8f95932eb85b68c170ab5e0e62dcdbd28b66901ac96c1d0","txlist_hash":"53e0972193c4f689d3a7216f22607a9b0cb7b8a9f43f144469bfbf25f59edb09"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(247,310050,'insert','blocks','{"block_hash":"b53c90385dd808306601350920c6af4beb717518493fd23b5c730eea078f33e6","block_index":310051,"block_time":310051000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(248,310051,'parse','blocks','{"block_index":310051,"ledger_hash":"d1db4181403136b41168ab7786831f2fadfc418a05b7477246ab097bab531859","messages_hash":"036a2c57db183169924f171a954a33d5ec1cd430b5916bf071a0b587afaa7147","txlist_hash":"89bbd06ca16ed2098ac6b7accd2296b4e0a2d8236dbf1cc14137e90ebad364e3"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(249,310051,'insert','blocks','{"block_hash":"0acdacf4e4b6fca756479cb055191b367b1fa433aa558956f5f08fa5b7b394e2","block_index":310052,"block_time":310052000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(250,310052,'parse','blocks','{"block_index":310052,"ledger_hash":"97fdb6b2c8e636d23109a67af55ab4bb30955a84073274de3fdc788074dc1b6b","messages_hash":"3db2edc06e57d225d363f733a6539fed037aee88e16888ed16da58b7b692707a","txlist_hash":"8b8739b799483eb556e0e32f92cc092c349bb2bcb87044e88e762d55d6f1b033"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(251,310052,'insert','blocks','{"block_hash":"68348f01b6dc49b2cb30fe92ac43e527aa90d859093d3bf7cd695c64d2ef744f","block_index":310053,"block_time":310053000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(252,310053,'parse','blocks','{"block_index":310053,"ledger_hash":"0506be4f04a22058504406210af3f1475dbf6d6834c1c1b7f6ac0fe013b47363","messages_hash":"aa9e8f3e3d6febd2672bcdb086a690d656bf47a8817fc555f139c786b2530fd3","txlist_hash":"05673a7bf2fc7e9a5daf3732cb03bcf43712df43ef7ecf1bfe89d18f54726b6b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(253,310053,'insert','blocks','{"block_hash":"a8b5f253df293037e49b998675620d5477445c51d5ec66596e023282bb9cd305","block_index":310054,"block_time":310054000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(254,310054,'parse','blocks','{"block_index":310054,"ledger_hash":"3dc7894c1368c9ef5d32a95fdc292e7de8237b73b61365a25b9d0da95eedc2e6","messages_hash":"f94db2dd80cde70db18382dffac1ed812f3d2d03c4a2b1f9feb972247e212525","txlist_hash":"4651aab35442e5ec1d79ba6422ca0c2b0df02369ee49b33efe1ef54e2ebc7080"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(255,310054,'insert','blocks','{"block_hash":"4b069152e2dc82e96ed8a3c3547c162e8c3aceeb2a4ac07972f8321a535b9356","block_index":310055,"block_time":310055000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(256,310055,'parse','blocks','{"block_index":310055,"ledger_hash":"a9ef2c8bf3a88c326d2bdd722c3d82ed4f4c10b65620b136d4b893ed93174795","messages_hash":"2e774913f25b35ed4864bc24fdd94ca25a67cd9779d0c59e652a7fd22607010e","txlist_hash":"d826fea28c0f5e82a6fbefae4d6885a0a49a3180d3c16d6eeb4faff9f57d4d89"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(257,310055,'insert','blocks','{"block_hash":"7603eaed418971b745256742f9d2ba70b2c2b2f69f61de6cc70e61ce0336f9d3","block_index":310056,"block_time":310056000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(258,310056,'parse','blocks','{"block_index":310056,"ledger_hash":"13b76edecb04a9733107d5c21420ee20424fd463dcde2ea98424ad99ed3383f0","messages_hash":"2f5072254be3d1ca2cf2c871f75d90c7ff0158014b26e0803daadb7f8ea1430e","txlist_hash":"fe620dd60bf5b6f3c610495735deca47cdbfcbb510975ebba2f68c7df6d32a15"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(259,310056,'insert','blocks','{"block_hash":"4a5fdc84f2d66ecb6ee3e3646aad20751ce8694e64e348d3c8aab09d33a3e411","block_index":310057,"block_time":310057000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(260,310057,'parse','blocks','{"block_index":310057,"ledger_hash":"41c8a47d7bc4e73aa2f09685acb9fac052c5c55764ec3a8250abbbcde40dbe90","messages_hash":"8337aa5515901276b768ee119463ff5e7cdb251b8517b47006cc734d70c5311f","txlist_hash":"553ea196d7a1045f71dc6261cbfe4b84c78b7dc37de89b8865f4d385cbb42863"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(261,310057,'insert','blocks','{"block_hash":"a6eef3089896f0cae0bfe9423392e45c48f4efe4310b14d8cfbdb1fea613635f","block_index":310058,"block_time":310058000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(262,310058,'parse','blocks','{"block_index":310058,"ledger_hash":"0b8ec211d258206ab8c318c079d9deb33d444a7086d5a05aaba97abc0be137df","messages_hash":"ac5c07af4e8057be82c39a551bf2a0eaf6d9acf57658e3d13383dd66014727c5","txlist_hash":"c3fd7824c9b8413f24feb96ca676285447a980d684f730d10b81c06a440fab7a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(263,310058,'insert','blocks','{"block_hash":"ab505de874c43f97c90be1c26a769e6c5cb140405c993b4a6cc7afc795f156a9","block_index":310059,"block_time":310059000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(264,310059,'parse','blocks','{"block_index":310059,"ledger_hash":"f5c2686408577854893d11b02f52d8ea917e90777dddf67c98aabb36a3339b6f","messages_hash":"0bc06f8d5a42655c32b9d0a2faf5a15b638e7529721c1fc07562b8445458e72d","txlist_hash":"3f73e1d36c82dfc8ee58f83502643d962ba6558cbf0fb46d83fea966b5cdfc59"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(265,310059,'insert','blocks','{"block_hash":"974ad5fbef621e0a38eab811608dc9afaf10c8ecc85fed913075ba1a145e889b","block_index":310060,"block_time":310060000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(266,310060,'parse','blocks','{"block_index":310060,"ledger_hash":"b80d446905550494f56f4f8240b501d593b0d0e63b5d98a09e180b1a0a68e3b1","messages_hash":"121aeaa7099e55f66f61bf5597e6c277106987c914283bfe3de59757c9dc5a53","txlist_hash":"f1995db5beea80756d509ddf79d3467bb14ae96b0d151175499030505d1f648e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(267,310060,'insert','blocks','{"block_hash":"35d267d21ad386e7b7632292af1c422b0310dde7ca49a82f9577525a29c138cf","block_index":310061,"block_time":310061000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(268,310061,'parse','blocks','{"block_index":310061,"ledger_hash":"41b30d23becc727151698b29a1bb733e45ae5086683c5256d073a6f817baaf49","messages_hash":"ad3dc31b4ef463b328c95e834f9fb14b8b2c0ccdc009a7570aa10ecd18c7cc47","txlist_hash":"de6a4e6bbd49de2001ce26387040970beeb7062b4e16911757204d2745f6c409"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(269,310061,'insert','blocks','{"block_hash":"b31a0054145319ef9de8c1cb19df5bcf4dc8a1ece20053aa494e5d3a00a2852f","block_index":310062,"block_time":310062000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(270,310062,'parse','blocks','{"block_index":310062,"ledger_hash":"f873f47e89715e965c98e92616339f8ff4200f6b8ef5cf747e8de2d101cbde02","messages_hash":"f49c03b535f3622c285a0c30dc16b1ab768477a919617e94558a766e8b0dd783","txlist_hash":"f2954d07588b07ffc063170f43afbb12548fe61584575a979526d28dd631edaa"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(271,310062,'insert','blocks','{"block_hash":"0cbcbcd5b7f2dc288e3a34eab3d4212463a5a56e886804fb4f9f1cf929eadebe","block_index":310063,"block_time":310063000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(272,310063,'parse','blocks','{"block_index":310063,"ledger_hash":"14ce21ebfe6a00eccd7bf1aac2d5cf122441d2ebe8c0f5fd6dd14a95b5a209b3","messages_hash":"8abb5b763837ecbe0ee9fcc3f199e14e0a5b7d3af2132dcf24ad69971ccf83ff","txlist_hash":"96b5675e5c3a3b66d7e2bd3424316119cf795c17bbbf2c8677b66872e4659574"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(273,310063,'insert','blocks','{"block_hash":"e2db8065a195e85cde9ddb868a17d39893a60fb2b1255aa5f0c88729de7cbf30","block_index":310064,"block_time":310064000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(274,310064,'parse','blocks','{"block_index":310064,"ledger_hash":"adb05bac5e7f1e6a1679d5c51f252dc877ebd99c2b73a56df69a9c848cef98a7","messages_hash":"fd8f02cc9a32ede97914e157560a3d68ee7106ca7e7d2ab80f2397e39455cb85","txlist_hash":"243e437b3c00d8106e8c9c2cb08d22376e8a16bd3b62a8b62b86128ddd6d139e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(275,310064,'insert','blocks','{"block_hash":"8a7bc7a77c831ac4fd11b8a9d22d1b6a0661b07cef05c2e600c7fb683b861d2a","block_index":310065,"block_time":310065000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(276,310065,'parse','blocks','{"block_index":310065,"ledger_hash":"9065476b6b2cfb122888e036cea71d36f3d5f7d6c72451c63d770b40a4560fac","messages_hash":"237fab9675ab9d7b81399d8fefb8678ffd4dc2424b7089ed9c107c2437a0f9b9","txlist_hash":"4af47a042289756821ffb0b14aba38fcc8c972fd254220d3991b05642df641e6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(277,310065,'insert','blocks','{"block_hash":"b6959be51eb084747d301f7ccaf9e75f2292c9404633b1532e3692659939430d","block_index":310066,"block_time":310066000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(278,310066,'parse','blocks','{"block_index":310066,"ledger_hash":"7d5d369827ec0cd44743ed9a519d45003789ff8dc2e511191d2726e1482f58d2","messages_hash":"a6ef9c531563e09b7fa26c58ef497218dd993107540fe47bce76770a8a7f92e5","txlist_hash":"4d61dab0197a7a3f452f3751a92cb1f5378106a13be0351f0f8942d011da097d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(279,310066,'insert','blocks','{"block_hash":"8b08eae98d7193c9c01863fac6effb9162bda010daeacf9e0347112f233b8577","block_index":310067,"block_time":310067000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(280,310067,'parse','blocks','{"block_index":310067,"ledger_hash":"301b22a9338d5dd39bbebf6bf518ac53bbb8e1cf7469322484cbcee2fee666ef","messages_hash":"409af4673120ac3029d09fdf1b20a59e4d86d8c1922acfc0dc94f120c79bcbfd","txlist_hash":"ae0cf0361293deb7b8903f20aca2410197db694ea3aff0aec3b635690168f5a5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(281,310067,'insert','blocks','{"block_hash":"9280e7297ef6313341bc81787a36acfc9af58f83a415afff5e3154f126cf52b5","block_index":310068,"block_time":310068000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(282,310068,'parse','blocks','{"block_index":310068,"ledger_hash":"fc281736e1dfe5a89a9a3dd098565c645904a4ad1626dd70ac8e9bc447dfb8b8","messages_hash":"f410e3c9f4d3381177946edaae6b1db4c84eb0118f0ce0bbcd2cac11b15221a1","txlist_hash":"460295c507a33a24231d1f4c760e5987b54f29d1e17bc97959db2a712f0339bf"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(283,310068,'insert','blocks','{"block_hash":"486351f0655bf594ffaab1980cff17353b640b63e9c27239109addece189a6f7","block_index":310069,"block_time":310069000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(284,310069,'parse','blocks','{"block_index":310069,"ledger_hash":"b0249a0dfd008a4554adc24085d3c5f44278403cbccb44ba27ee354b23c5627b","messages_hash":"546c9caf6f78f49dc560850474c3354eb4c8a80b3775ec147f78700a9f117e0e","txlist_hash":"d07500b12517493106b918ff5b6c96c371bc10bb3699eb279647539ea7ab1fd5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(285,310069,'insert','blocks','{"block_hash":"8739e99f4dee8bebf1332f37f49a125348b40b93b74fe35579dd52bfba4fa7e5","block_index":310070,"block_time":310070000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(286,310070,'parse','blocks','{"block_index":310070,"ledger_hash":"d34051879c8db679ac5c49e50edf2085d0ce88dfc1adb971e7b097c0177854c2","messages_hash":"3e6dba3cc0c763aa7ca983d8f815aae7c993a51ee1db7a058c764f76fc821c7f","txlist_hash":"874e494499820bcc0ba41ac5cd1bd153ac1772f730c9b842b77b289adbb2c2f5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(287,310070,'insert','blocks','{"block_hash":"7a099aa1bba0ead577f1e44f35263a1f115ed6a868c98d4dd71609072ae7f80b","block_index":310071,"block_time":310071000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(288,310071,'parse','blocks','{"block_index":310071,"ledger_hash":"0186c5312af19576cc628a85014ce7c33892dc23b5352c8ff5a0f230adfe263b","messages_hash":"179740d814b3143f9f9243c1afc800cabbcce38f4a3bff20d372f08eeb6f0768","txlist_hash":"01342c18caeaea6b35f2d815b9aeffbd92228f6ad285103faa13cb25171fdfc6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(289,310071,'insert','blocks','{"block_hash":"7b17ecedc07552551b8129e068ae67cb176ca766ea3f6df74b597a94e3a7fc8a","block_index":310072,"block_time":310072000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(290,310072,'parse','blocks','{"block_index":310072,"ledger_hash":"5376530512d61c3967f21cf01418d317ed072976119b8583fefaf3991b93d8b2","messages_hash":"290e9835fd502c57d1d3b10c512789133df5c6caa128f4e64f53b016d06dc3d2","txlist_hash":"72a7d63ad0b15a401210b197da00ca549b6e8c80d8eda1650cf9017bcbc92532"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(291,310072,'insert','blocks','{"block_hash":"ee0fe3cc9b3a48a2746b6090b63b442b97ea6055d48edcf4b2288396764c6943","block_index":310073,"block_time":310073000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(292,310073,'parse','blocks','{"block_index":310073,"ledger_hash":"d15fe704fe5de58e9203ff5ded50218a1a01609b65a1a259aec510b8b9e6d690","messages_hash":"6d25cf33e13bf22ab1e3e0aa9e92bc6c70dfd3af45e3f2c1435855289369c2d0","txlist_hash":"924753a39229b5005b684c4b2dd111b6233347b89179f2fd2732d256b960ace0"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(293,310073,'insert','blocks','{"block_hash":"ceab38dfde01f711a187601731ad575d67cfe0b7dbc61dcd4f15baaef72089fb","block_index":310074,"block_time":310074000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(294,310074,'parse','blocks','{"block_index":310074,"ledger_hash":"61015667044d0dddac3bdb16db67faa6ebcb71758101bfad898fca8ed183e7c3","messages_hash":"37a72ebc94288c1526b9dd7ffc91a59b9fcfeddc28c7848efe86bf44ed5eaa31","txlist_hash":"298ed692f21afcee61b06fd853cf07e5707dbd63a05f0caff6b6a177edc3b613"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(295,310074,'insert','blocks','{"block_hash":"ef547198c6e36d829f117cfd7077ccde45158e3c545152225fa24dba7a26847b","block_index":310075,"block_time":310075000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(296,310075,'parse','blocks','{"block_index":310075,"ledger_hash":"5dd06f32075c46b6e573d73f12c1c31cf82cac5d1588bbdf302b8fe95c4b948b","messages_hash":"1bd5f8cc1ec863a1eabcbc0e89dd96b86cf0b47a76ea553fae27a1f9b44a78f3","txlist_hash":"528e4b6aee88202f84f9f2b56611d0aba2336d925b8d8fe47039504e6eea1ebc"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(297,310075,'insert','blocks','{"block_hash":"3b0499c2e8e8f0252c7288d4ecf66efc426ca37aad3524424d14c8bc6f8b0d92","block_index":310076,"block_time":310076000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(298,310076,'parse','blocks','{"block_index":310076,"ledger_hash":"8e1782c2f35a07fcc4c57b34b2226b70cc4c7af2761386f38fc8fd74d53d5e60","messages_hash":"ae84d3a2b80f3efcb466d2371fd67160de7b6a832d122ee80403f9e966190814","txlist_hash":"76682f0ffbc6b86d16fbcec967a7562f6f12558c12aa3d9abd8779f51cc870ab"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(299,310076,'insert','blocks','{"block_hash":"d2adeefa9024ab3ff2822bc36acf19b6c647cea118cf15b86c6bc00c3322e7dd","block_index":310077,"block_time":310077000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(300,310077,'parse','blocks','{"block_index":310077,"ledger_hash":"6469ff80c3890d274817d30602f33d5d4b0a7c0a9e3b85100d21d7b38d894efb","messages_hash":"c3eaa5ca861b8b1f550baee63c8210fc3fcca2e8326b968478c7fd435959d700","txlist_hash":"187e9ae8428d46b7f8c8d652ab31dcf7c86a574cc781714a71784857dc0d1365"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(301,310077,'insert','blocks','{"block_hash":"f6c17115ef0efe489c562bcda4615892b4d4b39db0c9791fe193d4922bd82cd6","block_index":310078,"block_time":310078000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(302,310078,'parse','blocks','{"block_index":310078,"ledger_hash":"3ca73c2bf37c694281938a0599335633dccf0284a027f5f3b8e17a9e68cbcdf0","messages_hash":"4b53c5f3f79be4d81443e9c774ced97b5a945a4ea630ee39796a6f18784874cd","txlist_hash":"f7830250755fc0566ee5162a06e7308b51c9c0a7a951752be6cff224806a90fa"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(303,310078,'insert','blocks','{"block_hash":"f2fbd2074d804e631db44cb0fb2e1db3fdc367e439c21ffc40d73104c4d7069c","block_index":310079,"block_time":310079000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(304,310079,'parse','blocks','{"block_index":310079,"ledger_hash":"ae4a36e1ce7d5e11f059301684573cddce85b70ba69188a116e0611ceba5c140","messages_hash":"d3fb445eb5f1998a4f0490b187079d82a2522179d7fabd4aac10961120e8de5c","txlist_hash":"8d3b4ed30546c5f19f5522a0f57a86c29159ce27bf9e1e183a5ecffd9fbae8a2"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(305,310079,'insert','blocks','{"block_hash":"42943b914d9c367000a78b78a544cc4b84b1df838aadde33fe730964a89a3a6c","block_index":310080,"block_time":310080000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(306,310080,'parse','blocks','{"block_index":310080,"ledger_hash":"c2c0b96c64f1ed555c8553da976e0fcc3a5ef403819ceac49cf22b476281ced1","messages_hash":"53f48ccfd392fea120503dc3305b1a2425316a48760bdbd9eca17c1cde959319","txlist_hash":"d9ecf83f3f9f40246bee151938855fce34e0f9c636a5c9c2c80c896eb59287b9"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(307,310080,'insert','blocks','{"block_hash":"6554f9d307976249e7b7e260e08046b3b55d318f8b6af627fed5be3063f123c4","block_index":310081,"block_time":310081000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(308,310081,'parse','blocks','{"block_index":310081,"ledger_hash":"88d1b09f8141b90b44740e4618422298f8a64f2b3d11230c6b04084ef8d11b2c","messages_hash":"d66811b6b4438b65cf403dbcf382e0a41cfcfe9bd4f0f7b95c2e061564e81ea7","txlist_hash":"49e2f64485ac3ef523a079732bce9b2197384e2abfb3a4ad9340bca5a7179e31"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(309,310081,'insert','blocks','{"block_hash":"4f1ef91b1dcd575f8ac2e66a67715500cbca154bd6f3b8148bb7015a6aa6c644","block_index":310082,"block_time":310082000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(310,310082,'parse','blocks','{"block_index":310082,"ledger_hash":"dab22ae7a9216033777136cbbac87a3597cf6478a2fd008260caab3cad0cde3f","messages_hash":"a07058ef1ba8c2a825e497f04e76c526294e8a4bd8e999c96cd195fec2266738","txlist_hash":"5406c6e3c63633910da82fc039c525dbeeb1aa818dc450a9d34d43084eef680f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(311,310082,'insert','blocks','{"block_hash":"9b1f6fd6ff9b0dc4e37603cfb0625f49067c775b99e12492afd85392d3c8d850","block_index":310083,"block_time":310083000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(312,310083,'parse','blocks','{"block_index":310083,"ledger_hash":"a185e60dc97d19a211b0dfaa3f3da154956499b4af146751bf1d776fc68c15b8","messages_hash":"be8805302f4e3ff5944af2e51e0eeb84680ee2fe6c5a976ba576b347998d8c73","txlist_hash":"76e009b37822fc739a1e4abccf9f908a5fcdbed7fac540a719efbff8ebc694b7"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(313,310083,'insert','blocks','{"block_hash":"1e0972523e80306441b9f4157f171716199f1428db2e818a7f7817ccdc8859e3","block_index":310084,"block_time":310084000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(314,310084,'parse','blocks','{"block_index":310084,"ledger_hash":"622c574321be176c535fde918f319e10cfacaab383978be51406334303d14a8d","messages_hash":"1182b2e349f88f2df5119e7cbbd3ff6d9893ab5e00be067bc47d35b3f986d041","txlist_hash":"f3a3c37d89eb008f2194267a1eb5a7a52e9443f8b1f5fe51267d93a57eee27c7"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(315,310084,'insert','blocks','{"block_hash":"c5b6e9581831e3bc5848cd7630c499bca26d9ece5156d36579bdb72d54817e34","block_index":310085,"block_time":310085000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(316,310085,'parse','blocks','{"block_index":310085,"ledger_hash":"5556084b92f51175d4de4097fcd820a3c367c2f0630d3a20081296e892462d84","messages_hash":"3398a844add370aa0b7661ed80a3d7090f730a0b1bb0a5943ed5f1383ace9234","txlist_hash":"f284f757d004154b6ab9b9ee9d18281e6f8dd51f25f3f1fc7cc58450e0ba5f17"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(317,310085,'insert','blocks','{"block_hash":"080c1dc55a4ecf4824cf9840602498cfc35b5f84099f50b71b45cb63834c7a78","block_index":310086,"block_time":310086000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(318,310086,'parse','blocks','{"block_index":310086,"ledger_hash":"fc9dd8ef92fc7d47b187a75bd16e9698d61fa9ce6b4da7bba75982f59b0fbbc5","messages_hash":"c6f8b9023f4fb14abf10b405dfe416bb91386d12667871c8b128528162b27df4","txlist_hash":"e5f9da1d98725423a240687ba2985b42f8acb274ba0122b4e31e25c57619845f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(319,310086,'insert','blocks','{"block_hash":"4ec8cb1c38b22904e8087a034a6406b896eff4dd28e7620601c6bddf82e2738c","block_index":310087,"block_time":310087000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(320,310087,'parse','blocks','{"block_index":310087,"ledger_hash":"21f7329fa27373fba176043db9081b0d9f95f75421e5adce87177a3edffcedc0","messages_hash":"74446399df111b44c653465cc75327752e252ed8686373b7266390d50a6707a8","txlist_hash":"7935ee6c215a123367ddfae34507170148723d08f1963aad7e47b68520fa4e70"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(321,310087,'insert','blocks','{"block_hash":"e945c815c433cbddd0bf8e66c5c23b51072483492acda98f5c2c201020a8c5b3","block_index":310088,"block_time":310088000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(322,310088,'parse','blocks','{"block_index":310088,"ledger_hash":"19164a10a0602df57d1add2e3a31ad4eef9d3ef9e53e70174b44aa91de2d6296","messages_hash":"8f42f7221255861ee5bd5ba65b281a071fab20f79c483ef92460f8e7d79beb9d","txlist_hash":"d35a417416c712908cdfbeda76e261a55c605ff8091605a79d4d4fc986ae76cd"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(323,310088,'insert','blocks','{"block_hash":"0382437f895ef3e7e38bf025fd4f606fd44d4bbd6aea71dbdc4ed11a7cd46f33","block_index":310089,"block_time":310089000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(324,310089,'parse','blocks','{"block_index":310089,"ledger_hash":"87f1c713c5f2cd84fab28b996008900f86bf9eaad25ceedac1507348a949be7c","messages_hash":"051ccde9020819e5b7aa2c6f95ab716f1ac0fb7a905d31c67ee5352c8572ab3c","txlist_hash":"44c73622e27c362abf0460a5e0d7b836091523b763b6183cb9815cee30d66bef"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(325,310089,'insert','blocks','{"block_hash":"b756db71dc037b5a4582de354a3347371267d31ebda453e152f0a13bb2fae969","block_index":310090,"block_time":310090000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(326,310090,'parse','blocks','{"block_index":310090,"ledger_hash":"75264a6a628d669a60b4a8ca7e24b6b5ef1ad2c74d955b8325959f906c3bc337","messages_hash":"883f97a60b66fb64c61c49b1d08bbe3245988443c8da0f04180aaafe1aabc6bb","txlist_hash":"c1771520c57b0c705c3a5f0d576622c8dd40c399e4946b63ba153af976b23b0e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(327,310090,'insert','blocks','{"block_hash":"734a9aa485f36399d5efb74f3b9c47f8b5f6fd68c9967f134b14cfe7e2d7583c","block_index":310091,"block_time":310091000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(328,310091,'parse','blocks','{"block_index":310091,"ledger_hash":"27914e38b3ca9d8444275e5c6d24b5cfe0b4093f7c645d5c1fc3c39e0d3a3c60","messages_hash":"063389fad33e69fb1a37535b082d7605ceb64e2a98f2c157c4f072e6254b8c35","txlist_hash":"329ae5ae96b71b9a116cb82d9518110e63d32a9dfcb6fece911201ab6c3a78c5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(329,310091,'insert','blocks','{"block_hash":"56386beb65f9228740d4ad43a1c575645f6daf59e0dd9f22551c59215b5e8c3d","block_index":310092,"block_time":310092000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(330,310092,'parse','blocks','{"block_index":310092,"ledger_hash":"eca83e762899ace4d990b8acb23183263df5f92be10b63aecab3518b340b975d","messages_hash":"cd07af393f202759c9752fede344e7b96e08767be4525e4530690dd32961e3b8","txlist_hash":"6183465e58c5e5ef0f359a032e98d12cd247ff080ae44dc7a90ee35006e74e9e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(331,310092,'insert','blocks','{"block_hash":"a74a2425f2f4be24bb5f715173e6756649e1cbf1b064aeb1ef60e0b94b418ddc","block_index":310093,"block_time":310093000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(332,310093,'parse','blocks','{"block_index":310093,"ledger_hash":"3544fab97fe90a35b1f52ba955f88a8149d90329986df38d97e12992201bb187","messages_hash":"54e1bbd5d34dc103464f9254d73b99e2bb240ebf2981fd5e78c1778492442c58","txlist_hash":"407c0451107403f827f434f3f8f8e3c9adb33362ab584802d87903afe3851f4d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(333,310093,'insert','blocks','{"block_hash":"2a8f976f20c4e89ff01071915ac96ee35192d54df3a246bf61fd4a0cccfb5b23","block_index":310094,"block_time":310094000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(334,310094,'parse','blocks','{"block_index":310094,"ledger_hash":"df1e6d8f1be344f78c0b58baf7260c2abdbed3175adc45a122947815c08fcc16","messages_hash":"1b3956b84c9076fa22fdd3350a85b27e0ac949495e18dcc9c2187e07d7e4a596","txlist_hash":"d4bc7124f8beb9fe04930a1b19a66aef57669e6bf790a5d38441beefcc001dbf"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(335,310094,'insert','blocks','{"block_hash":"bed0fa40c9981223fb40b3be8124ca619edc9dd34d0c907369477ea92e5d2cd2","block_index":310095,"block_time":310095000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(336,310095,'parse','blocks','{"block_index":310095,"ledger_hash":"8b9febcfe1a9447f6a820c060f503dfe6e5c02738df4d9d63b007fe03847a6c7","messages_hash":"c35d50219e30573b4346080b362836e7aa84dfa6f4ce548e3f5c94f891b8e5cd","txlist_hash":"7038d6f46cc32e35793799e50fbce7bde13c52c379e3bea10da0e6443a221c62"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(337,310095,'insert','blocks','{"block_hash":"306aeec3db435fabffdf88c2f26ee83caa4c2426375a33daa2be041dbd27ea2f","block_index":310096,"block_time":310096000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(338,310096,'parse','blocks','{"block_index":310096,"ledger_hash":"b927091b4cf42f8537058a9adbec3814b574c1e1ccd242fe44c5f3671a191304","messages_hash":"173e9852974eacbeb6084725c5e9f300ea1e0eec8ee89eb63f822cb1cec8976f","txlist_hash":"7640d47e11233c9d27a8e868bec5595acd99b3c7326a480298f7ea38c4a66689"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(339,310096,'insert','blocks','{"block_hash":"13e8e16e67c7cdcc80d477491e554b43744f90e8e1a9728439a11fab42cefadf","block_index":310097,"block_time":310097000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(340,310097,'parse','blocks','{"block_index":310097,"ledger_hash":"649d094cfc74f90e06bb4514276aaf3b0a0ed45f56397a2f774cae9602d02e6f","messages_hash":"c063131b7b3e526fcd0d32784dd33bfbde81aaf84860d2fd128538891629ba59","txlist_hash":"ce9cdd6db6e1bbea3a9446b50b092e504bcc58900befb237580896e1c107eaab"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(341,310097,'insert','blocks','{"block_hash":"ca5bca4b5ec4fa6183e05176abe921cff884c4e20910fab55b603cef48dc3bca","block_index":310098,"block_time":310098000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(342,310098,'parse','blocks','{"block_index":310098,"ledger_hash":"c9a9dec300afba2cc3f171f76ff4c07cbeb7a41a86a3f498f712e066a8acbd17","messages_hash":"8ae79287158f94c84d5945cb8833435518c91dba4c8e95036198369ac548b610","txlist_hash":"7153d6b86e3d8ed76bed0edd2dbd4fe6200e1e6d82d51dd3f812d6b43109f503"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(343,310098,'insert','blocks','{"block_hash":"3c4c2279cd7de0add5ec469648a845875495a7d54ebfb5b012dcc5a197b7992a","block_index":310099,"block_time":310099000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(344,310099,'parse','blocks','{"block_index":310099,"ledger_hash":"3c7434887f9373b5370664180ba640fa63c2eb5b85569875105e4f4db67d8c02","messages_hash":"a3e5b0bb7df3e0ec5a9e23f7abb2cb779e266038bc8e99e5d99a54c7516e6642","txlist_hash":"adfefb6d18cdf44329bf9330e32f265145f60290f2a75db73fea8dd8ed2eb7d6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(345,310099,'insert','blocks','{"block_hash":"96925c05b3c7c80c716f5bef68d161c71d044252c766ca0e3f17f255764242cb","block_index":310100,"block_time":310100000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(346,310100,'parse','blocks','{"block_index":310100,"ledger_hash":"7e6a09386c3d8552a0dcc25b75143876a3046ebac0ff9cb09d6224ea7e2f3df9","messages_hash":"adc0156efd0d146d632eb6ce494f365b5c2d40acc8c22f2138ee64bce753567b","txlist_hash":"2776deb848ce539546aada2bc1756d9de92b23e0a8d513f5dbfb1b0bb3be3bc5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(347,310100,'insert','blocks','{"block_hash":"369472409995ca1a2ebecbad6bf9dab38c378ab1e67e1bdf13d4ce1346731cd6","block_index":310101,"block_time":310101000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(348,310101,'parse','blocks','{"block_index":310101,"ledger_hash":"6903c0c5941f334f1374aa731e389b010043fc5940d4e9ae8b94480fb4fca030","messages_hash":"6be3d97c2fd4c161f247215c9fe17df2747c2adf80b1292294705ef636ca4d40","txlist_hash":"6612c5f602f26ccc2cf4961f27e64c188ba405870cc0d7cf881c4e0fcb9a54ce"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(0,NULL,0,'insert','blocks','{"block_hash":"8b3bef249cb3b0fa23a4936c1249b6bd41daeadc848c8d2e409ea1cbc10adfe7","block_index":309999,"block_time":309999000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1,NULL,309999,'parse','blocks','{"block_index":309999,"ledger_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","messages_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","txlist_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(2,NULL,309999,'insert','blocks','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(3,NULL,310000,'insert','transactions','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"btc_amount":62000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"15b35d5497f454c43576f21a1b61d99bde25dfc5aae1a4796dcf55e739d6a399","tx_index":1}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(4,NULL,310000,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310000,"calling_function":"burn","event":"15b35d5497f454c43576f21a1b61d99bde25dfc5aae1a4796dcf55e739d6a399","quantity":93000000000,"tx_index":1}',0,'CREDIT');
+INSERT INTO messages VALUES(5,NULL,310000,'insert','burns','{"block_index":310000,"burned":62000000,"earned":93000000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"15b35d5497f454c43576f21a1b61d99bde25dfc5aae1a4796dcf55e739d6a399","tx_index":1}',0,'BURN');
+INSERT INTO messages VALUES(6,NULL,310000,'parse','blocks','{"block_index":310000,"ledger_hash":"cff3ba7c92f6b318eb4a4a5e2b90b655fc055d4e8a82101b813aef6e1c6152e4","messages_hash":"f25f391e967671ba5a4efd1b0766b90d3d0443b51d9507f85125d9d1ef3a0308","txlist_hash":"9f6f20e36fd2b2b44df6e91fbfaeffc6d7fae9917b27d196245ee90c36d99ff1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(7,NULL,310000,'insert','blocks','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(8,NULL,310001,'insert','transactions','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"btc_amount":1000,"data":"0000000000000000000000010000000002faf080","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"121285e4ce5c17fbd6e0b0277702af982cdc14054735154a9043beecb247b84f","tx_index":2}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(9,NULL,310001,'insert','debits','{"action":"send","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310001,"event":"121285e4ce5c17fbd6e0b0277702af982cdc14054735154a9043beecb247b84f","quantity":50000000,"tx_index":2}',0,'DEBIT');
+INSERT INTO messages VALUES(10,NULL,310001,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"XCP","block_index":310001,"calling_function":"send","event":"121285e4ce5c17fbd6e0b0277702af982cdc14054735154a9043beecb247b84f","quantity":50000000,"tx_index":2}',0,'CREDIT');
+INSERT INTO messages VALUES(11,NULL,310001,'insert','sends','{"asset":"XCP","block_index":310001,"destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","quantity":50000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"121285e4ce5c17fbd6e0b0277702af982cdc14054735154a9043beecb247b84f","tx_index":2}',0,'SEND');
+INSERT INTO messages VALUES(12,NULL,310001,'parse','transactions','{"supported":true,"tx_hash":"121285e4ce5c17fbd6e0b0277702af982cdc14054735154a9043beecb247b84f","tx_index":2}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(13,NULL,310001,'parse','blocks','{"block_index":310001,"ledger_hash":"2281de0177f4fcf8d730e2751d7b9fb5da4df741196bbcaff470c7860a2ca0b6","messages_hash":"e3aa0380b1a456cdf8335e2c4dcf2bf5cd54a82bf155a91cf04c9ecc8ff63bdb","txlist_hash":"49836952844fe3f887e718d236efa6b1f4cc0b81cfc010f79a6349562ebfc162"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(14,NULL,310001,'insert','blocks','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(15,NULL,310002,'insert','transactions','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"btc_amount":0,"data":"0000000a00000000000000000000000002faf08000000000000000010000000005f5e100000a0000000000000000","destination":"","fee":1000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"c953eb18873ce8aed42456df0ece8e4678e13282d9917916e7a4aec10e828375","tx_index":3}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(16,NULL,310002,'insert','orders','{"block_index":310002,"expiration":10,"expire_index":310012,"fee_provided":1000000,"fee_provided_remaining":1000000,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":100000000,"get_remaining":100000000,"give_asset":"BTC","give_quantity":50000000,"give_remaining":50000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","tx_hash":"c953eb18873ce8aed42456df0ece8e4678e13282d9917916e7a4aec10e828375","tx_index":3}',0,'OPEN_ORDER');
+INSERT INTO messages VALUES(17,NULL,310002,'parse','transactions','{"supported":true,"tx_hash":"c953eb18873ce8aed42456df0ece8e4678e13282d9917916e7a4aec10e828375","tx_index":3}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(18,NULL,310002,'parse','blocks','{"block_index":310002,"ledger_hash":"802742a55d8ab83de24c45efb86d1daa0ad4e565cc4db6dcaa5cedb16ec4125f","messages_hash":"d8df33aece3f5184376a2f4a13cfb52ed09ab73cdbdffd84dadde3ca8e4d4b9f","txlist_hash":"017a0ddcf461ffcc3c89042ba6a6337efcc276c8f144daad445ba0e4a36bab33"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(19,NULL,310002,'insert','blocks','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(20,NULL,310003,'insert','transactions','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"btc_amount":0,"data":"0000000a00000000000000010000000006422c4000000000000000000000000002faf080000a00000000000dbba0","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"89a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a","tx_index":4}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(21,NULL,310003,'insert','debits','{"action":"open order","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310003,"event":"89a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a","quantity":105000000,"tx_index":4}',0,'DEBIT');
+INSERT INTO messages VALUES(22,NULL,310003,'insert','orders','{"block_index":310003,"expiration":10,"expire_index":310013,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":900000,"fee_required_remaining":900000,"get_asset":"BTC","get_quantity":50000000,"get_remaining":50000000,"give_asset":"XCP","give_quantity":105000000,"give_remaining":105000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","tx_hash":"89a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a","tx_index":4}',0,'OPEN_ORDER');
+INSERT INTO messages VALUES(23,NULL,310003,'update','orders','{"fee_provided_remaining":142858,"fee_required_remaining":0,"get_remaining":0,"give_remaining":0,"status":"open","tx_hash":"c953eb18873ce8aed42456df0ece8e4678e13282d9917916e7a4aec10e828375"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(24,NULL,310003,'update','orders','{"fee_provided_remaining":6800,"fee_required_remaining":42858,"get_remaining":0,"give_remaining":5000000,"status":"open","tx_hash":"89a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(25,NULL,310003,'insert','order_matches','{"backward_asset":"XCP","backward_quantity":100000000,"block_index":310003,"fee_paid":857142,"forward_asset":"BTC","forward_quantity":50000000,"id":"c953eb18873ce8aed42456df0ece8e4678e13282d9917916e7a4aec10e828375_89a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a","match_expire_index":310023,"status":"pending","tx0_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx0_block_index":310002,"tx0_expiration":10,"tx0_hash":"c953eb18873ce8aed42456df0ece8e4678e13282d9917916e7a4aec10e828375","tx0_index":3,"tx1_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx1_block_index":310003,"tx1_expiration":10,"tx1_hash":"89a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a","tx1_index":4}',0,'ORDER_MATCH');
+INSERT INTO messages VALUES(26,NULL,310003,'parse','transactions','{"supported":true,"tx_hash":"89a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a","tx_index":4}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(27,NULL,310003,'parse','blocks','{"block_index":310003,"ledger_hash":"ed279c6a985256134cfb39f1283ec97c8dc800b7255a3e8243ca9846884d0378","messages_hash":"e8a8467421c8964ff378e119f97e7cf43ee424041b1d660cbd6493b23213f79b","txlist_hash":"8ec458bf08abe2f3634eafac5af321f02cf5d470c2a87301b8061efe3dcc644f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(28,NULL,310003,'insert','blocks','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(29,NULL,310004,'insert','transactions','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"btc_amount":50000000,"data":"0000000bc953eb18873ce8aed42456df0ece8e4678e13282d9917916e7a4aec10e82837589a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":9675,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"f0c58099c1614dcf2b8fd12be01c63427a5877b8c0367ecadea31ae9eb9714e6","tx_index":5}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(30,NULL,310004,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310004,"calling_function":"btcpay","event":"f0c58099c1614dcf2b8fd12be01c63427a5877b8c0367ecadea31ae9eb9714e6","quantity":100000000,"tx_index":5}',0,'CREDIT');
+INSERT INTO messages VALUES(31,NULL,310004,'update','order_matches','{"id":"c953eb18873ce8aed42456df0ece8e4678e13282d9917916e7a4aec10e828375_89a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a","order_match_id":"c953eb18873ce8aed42456df0ece8e4678e13282d9917916e7a4aec10e828375_89a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a","status":"completed"}',0,'ORDER_MATCH_UPDATE');
+INSERT INTO messages VALUES(32,NULL,310004,'insert','btcpays','{"block_index":310004,"btc_amount":50000000,"destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","order_match_id":"c953eb18873ce8aed42456df0ece8e4678e13282d9917916e7a4aec10e828375_89a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a","source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"f0c58099c1614dcf2b8fd12be01c63427a5877b8c0367ecadea31ae9eb9714e6","tx_index":5}',0,'BTC_PAY');
+INSERT INTO messages VALUES(33,NULL,310004,'parse','transactions','{"supported":true,"tx_hash":"f0c58099c1614dcf2b8fd12be01c63427a5877b8c0367ecadea31ae9eb9714e6","tx_index":5}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(34,NULL,310004,'parse','blocks','{"block_index":310004,"ledger_hash":"bba1ec90ee149be7d8a88ff9df1fca931e076e885be21bc822637829a8675e02","messages_hash":"7942936fb941c33d235d0f95f868587159b956e31c7ebd591e09117f54faa9bb","txlist_hash":"e2e334cb3c300e622a50d2c206fe532a3320f56c445dc1a9dec750417260fe9a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(35,NULL,310004,'insert','blocks','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(36,NULL,310005,'insert','transactions','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"btc_amount":0,"data":"000000140000000000004767000000003b9aca000100000000000000000000","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"9238105e39efd4b7d428ad14011ad0c0f366bdcd150afa954e1f25c0cf4c2cc9","tx_index":6}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(37,NULL,310005,'insert','debits','{"action":"issuance fee","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310005,"event":"9238105e39efd4b7d428ad14011ad0c0f366bdcd150afa954e1f25c0cf4c2cc9","quantity":50000000,"tx_index":6}',0,'DEBIT');
+INSERT INTO messages VALUES(38,NULL,310005,'insert','assets','{"asset_id":"18279","asset_longname":null,"asset_name":"BBBB","block_index":310005}',0,'ASSET_CREATION');
+INSERT INTO messages VALUES(39,NULL,310005,'insert','issuances','{"asset":"BBBB","asset_longname":null,"block_index":310005,"call_date":0,"call_price":0.0,"callable":false,"description":"","divisible":true,"fee_paid":50000000,"issuer":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","locked":false,"quantity":1000000000,"reset":false,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","transfer":false,"tx_hash":"9238105e39efd4b7d428ad14011ad0c0f366bdcd150afa954e1f25c0cf4c2cc9","tx_index":6}',0,'ASSET_ISSUANCE');
+INSERT INTO messages VALUES(40,NULL,310005,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBB","block_index":310005,"calling_function":"issuance","event":"9238105e39efd4b7d428ad14011ad0c0f366bdcd150afa954e1f25c0cf4c2cc9","quantity":1000000000,"tx_index":6}',0,'CREDIT');
+INSERT INTO messages VALUES(41,NULL,310005,'parse','transactions','{"supported":true,"tx_hash":"9238105e39efd4b7d428ad14011ad0c0f366bdcd150afa954e1f25c0cf4c2cc9","tx_index":6}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(42,NULL,310005,'parse','blocks','{"block_index":310005,"ledger_hash":"5f8a9d465e686b3e9471041bd15d645b7fc8afee36ee890873aa6c3c51d87bb5","messages_hash":"fa485519e19f15670e3c2e14e5edf24ceb43f3716d9b941e6d553ed966890c50","txlist_hash":"260ad7ae2e2b555f7adf9155fcb761e7ed7a2d22f128457db0f1ff363b498d64"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(43,NULL,310005,'insert','blocks','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(44,NULL,310006,'insert','transactions','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"btc_amount":0,"data":"00000014000000000000476800000000000186a00000000000000000000006666f6f626172","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"19d9d6059edf351635fa19ad867ccfa1db3959a5109fc63729430110a661b6e8","tx_index":7}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(45,NULL,310006,'insert','debits','{"action":"issuance fee","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310006,"event":"19d9d6059edf351635fa19ad867ccfa1db3959a5109fc63729430110a661b6e8","quantity":50000000,"tx_index":7}',0,'DEBIT');
+INSERT INTO messages VALUES(46,NULL,310006,'insert','assets','{"asset_id":"18280","asset_longname":null,"asset_name":"BBBC","block_index":310006}',0,'ASSET_CREATION');
+INSERT INTO messages VALUES(47,NULL,310006,'insert','issuances','{"asset":"BBBC","asset_longname":null,"block_index":310006,"call_date":0,"call_price":0.0,"callable":false,"description":"foobar","divisible":false,"fee_paid":50000000,"issuer":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","locked":false,"quantity":100000,"reset":false,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","transfer":false,"tx_hash":"19d9d6059edf351635fa19ad867ccfa1db3959a5109fc63729430110a661b6e8","tx_index":7}',0,'ASSET_ISSUANCE');
+INSERT INTO messages VALUES(48,NULL,310006,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBC","block_index":310006,"calling_function":"issuance","event":"19d9d6059edf351635fa19ad867ccfa1db3959a5109fc63729430110a661b6e8","quantity":100000,"tx_index":7}',0,'CREDIT');
+INSERT INTO messages VALUES(49,NULL,310006,'parse','transactions','{"supported":true,"tx_hash":"19d9d6059edf351635fa19ad867ccfa1db3959a5109fc63729430110a661b6e8","tx_index":7}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(50,NULL,310006,'parse','blocks','{"block_index":310006,"ledger_hash":"153795f1c7ae2dbec7fc19bb25d03dd518f0664bca82b9bb92bb7c4f1e22f040","messages_hash":"91d3dd09443d1265650e148632f4de4352559fb4a2aa2dfbe161b1a83d7f51de","txlist_hash":"c047baa686f8bf24c406cf03687c0b4fe6b95e4afe0b396e0f507a694fb10245"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(51,NULL,310006,'insert','blocks','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(52,NULL,310007,'insert','transactions','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"btc_amount":1000,"data":"00000000000000000000476700000000003d0900","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"b25659252f68f162d96cf2cf3070b30e5913b472cbace76985e314b4634641a0","tx_index":8}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(53,NULL,310007,'insert','debits','{"action":"send","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBB","block_index":310007,"event":"b25659252f68f162d96cf2cf3070b30e5913b472cbace76985e314b4634641a0","quantity":4000000,"tx_index":8}',0,'DEBIT');
+INSERT INTO messages VALUES(54,NULL,310007,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"BBBB","block_index":310007,"calling_function":"send","event":"b25659252f68f162d96cf2cf3070b30e5913b472cbace76985e314b4634641a0","quantity":4000000,"tx_index":8}',0,'CREDIT');
+INSERT INTO messages VALUES(55,NULL,310007,'insert','sends','{"asset":"BBBB","block_index":310007,"destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","quantity":4000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"b25659252f68f162d96cf2cf3070b30e5913b472cbace76985e314b4634641a0","tx_index":8}',0,'SEND');
+INSERT INTO messages VALUES(56,NULL,310007,'parse','transactions','{"supported":true,"tx_hash":"b25659252f68f162d96cf2cf3070b30e5913b472cbace76985e314b4634641a0","tx_index":8}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(57,NULL,310007,'parse','blocks','{"block_index":310007,"ledger_hash":"c5d21baa8c6949a8e9f0d73a37436d431bf4876ab3b60b82553877ec53fc4454","messages_hash":"477c8a3efdb86228e5387e26f324d6db1de8d3d0269b61e5918c50e9099e27ca","txlist_hash":"d9532f5bdd583968d88ed24feb95b50c5e319d36171dd7bc6067ddf3d13c623c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(58,NULL,310007,'insert','blocks','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(59,NULL,310008,'insert','transactions','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"btc_amount":1000,"data":"000000000000000000004768000000000000020e","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"592e248181970aa6f97f2cfe133323d3ffb2095dd7f411cfd20b1ab611238a11","tx_index":9}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(60,NULL,310008,'insert','debits','{"action":"send","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBC","block_index":310008,"event":"592e248181970aa6f97f2cfe133323d3ffb2095dd7f411cfd20b1ab611238a11","quantity":526,"tx_index":9}',0,'DEBIT');
+INSERT INTO messages VALUES(61,NULL,310008,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"BBBC","block_index":310008,"calling_function":"send","event":"592e248181970aa6f97f2cfe133323d3ffb2095dd7f411cfd20b1ab611238a11","quantity":526,"tx_index":9}',0,'CREDIT');
+INSERT INTO messages VALUES(62,NULL,310008,'insert','sends','{"asset":"BBBC","block_index":310008,"destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","quantity":526,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"592e248181970aa6f97f2cfe133323d3ffb2095dd7f411cfd20b1ab611238a11","tx_index":9}',0,'SEND');
+INSERT INTO messages VALUES(63,NULL,310008,'parse','transactions','{"supported":true,"tx_hash":"592e248181970aa6f97f2cfe133323d3ffb2095dd7f411cfd20b1ab611238a11","tx_index":9}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(64,NULL,310008,'parse','blocks','{"block_index":310008,"ledger_hash":"579de8204446e9128076fd27a644a82da77ca5ff2793ff56815c24a11218af5e","messages_hash":"e6077ca90d21f6c9bf673fddbfde5afa61ce76d3efdc19e3e98601ebe2659c69","txlist_hash":"5b37c224e5684c0b3a913793e7e97c4f88b26b6c6d7683de8e06bb9485fba409"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(65,NULL,310008,'insert','blocks','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(66,NULL,310009,'insert','transactions','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"btc_amount":0,"data":"00000032000000000000025800000000000047670000000000000001","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"f2f6db13d6bda4def4f1bd759b603c64c962f82017329057a9237ceaf171520a","tx_index":10}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(67,NULL,310009,'insert','debits','{"action":"dividend","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310009,"event":"f2f6db13d6bda4def4f1bd759b603c64c962f82017329057a9237ceaf171520a","quantity":24,"tx_index":10}',0,'DEBIT');
+INSERT INTO messages VALUES(68,NULL,310009,'insert','debits','{"action":"dividend fee","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310009,"event":"f2f6db13d6bda4def4f1bd759b603c64c962f82017329057a9237ceaf171520a","quantity":20000,"tx_index":10}',0,'DEBIT');
+INSERT INTO messages VALUES(69,NULL,310009,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"XCP","block_index":310009,"calling_function":"dividend","event":"f2f6db13d6bda4def4f1bd759b603c64c962f82017329057a9237ceaf171520a","quantity":24,"tx_index":10}',0,'CREDIT');
+INSERT INTO messages VALUES(70,NULL,310009,'insert','dividends','{"asset":"BBBB","block_index":310009,"dividend_asset":"XCP","fee_paid":20000,"quantity_per_unit":600,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"f2f6db13d6bda4def4f1bd759b603c64c962f82017329057a9237ceaf171520a","tx_index":10}',0,'ASSET_DIVIDEND');
+INSERT INTO messages VALUES(71,NULL,310009,'parse','transactions','{"supported":true,"tx_hash":"f2f6db13d6bda4def4f1bd759b603c64c962f82017329057a9237ceaf171520a","tx_index":10}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(72,NULL,310009,'parse','blocks','{"block_index":310009,"ledger_hash":"c03a6e31f50f172c86029ce6a810ec730e1179ad3e76ba5d4290595ec414bb87","messages_hash":"6b1c0ca7b4fbde952b5729befc447a09d9e996f873f25757fc9fe6332799bdc9","txlist_hash":"f81c6592f74098821e15c146c2a7e4a5be2cc743431d37a5fb6d4143b89907d5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(73,NULL,310009,'insert','blocks','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(74,NULL,310010,'insert','transactions','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"btc_amount":0,"data":"00000032000000000000032000000000000047680000000000000001","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"a4353c6bd3159d3288f76c9f40fdbde89d681b09ec64d1f2b422b2e9e30c10d8","tx_index":11}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(75,NULL,310010,'insert','debits','{"action":"dividend","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310010,"event":"a4353c6bd3159d3288f76c9f40fdbde89d681b09ec64d1f2b422b2e9e30c10d8","quantity":420800,"tx_index":11}',0,'DEBIT');
+INSERT INTO messages VALUES(76,NULL,310010,'insert','debits','{"action":"dividend fee","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310010,"event":"a4353c6bd3159d3288f76c9f40fdbde89d681b09ec64d1f2b422b2e9e30c10d8","quantity":20000,"tx_index":11}',0,'DEBIT');
+INSERT INTO messages VALUES(77,NULL,310010,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"XCP","block_index":310010,"calling_function":"dividend","event":"a4353c6bd3159d3288f76c9f40fdbde89d681b09ec64d1f2b422b2e9e30c10d8","quantity":420800,"tx_index":11}',0,'CREDIT');
+INSERT INTO messages VALUES(78,NULL,310010,'insert','dividends','{"asset":"BBBC","block_index":310010,"dividend_asset":"XCP","fee_paid":20000,"quantity_per_unit":800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"a4353c6bd3159d3288f76c9f40fdbde89d681b09ec64d1f2b422b2e9e30c10d8","tx_index":11}',0,'ASSET_DIVIDEND');
+INSERT INTO messages VALUES(79,NULL,310010,'parse','transactions','{"supported":true,"tx_hash":"a4353c6bd3159d3288f76c9f40fdbde89d681b09ec64d1f2b422b2e9e30c10d8","tx_index":11}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(80,NULL,310010,'parse','blocks','{"block_index":310010,"ledger_hash":"804651f6571bb24ef7534c97116ae35fb0b6b31aa6a4574a419aae7fc2900b1c","messages_hash":"68122cbe27346172664dc07f3c7cd823a2fd9ff5efdb47ed357fcf80ba43976c","txlist_hash":"3698516a21c2c590522e6419eae91ed8b469d922863141def1f3e295c4954dfd"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(81,NULL,310010,'insert','blocks','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(82,NULL,310011,'insert','transactions','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"btc_amount":0,"data":"0000001e52bb3300405900000000000005f5e0ff09556e69742054657374","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"9ec74a4822710f9534a3815f0e836a09219f6c766880a57767c7514071d99084","tx_index":12}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(83,NULL,310011,'insert','broadcasts','{"block_index":310011,"fee_fraction_int":99999999,"locked":false,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","text":"Unit Test","timestamp":1388000000,"tx_hash":"9ec74a4822710f9534a3815f0e836a09219f6c766880a57767c7514071d99084","tx_index":12,"value":100.0}',0,'BROADCAST');
+INSERT INTO messages VALUES(84,NULL,310011,'parse','transactions','{"supported":true,"tx_hash":"9ec74a4822710f9534a3815f0e836a09219f6c766880a57767c7514071d99084","tx_index":12}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(85,NULL,310011,'parse','blocks','{"block_index":310011,"ledger_hash":"a9a18fcba1a83d637dcfd633f32848d55c86c5b499e0c15af6a626653b7424b8","messages_hash":"3cb60f7ac2f1597df6cde54a9aea3c2dda78734aa723e408520d205af49c6c62","txlist_hash":"deaaba2ecb1772901052ae6490a1015e75146af3b2707b1c148562deff91af49"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(86,NULL,310011,'insert','blocks','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(87,NULL,310012,'insert','transactions','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"btc_amount":1000,"data":"00000028000052bb33640000000002faf08000000000017d7840000000000000000000003b100000000a","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"ef92dc4986fdfb4ccb6e101ee949d5307c554e8dd1619307548ec032a973f19c","tx_index":13}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(88,NULL,310012,'insert','debits','{"action":"bet","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310012,"event":"ef92dc4986fdfb4ccb6e101ee949d5307c554e8dd1619307548ec032a973f19c","quantity":50000000,"tx_index":13}',0,'DEBIT');
+INSERT INTO messages VALUES(89,NULL,310012,'insert','bets','{"bet_type":0,"block_index":310012,"counterwager_quantity":25000000,"counterwager_remaining":25000000,"deadline":1388000100,"expiration":10,"expire_index":310022,"fee_fraction_int":99999999.0,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":15120,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":0.0,"tx_hash":"ef92dc4986fdfb4ccb6e101ee949d5307c554e8dd1619307548ec032a973f19c","tx_index":13,"wager_quantity":50000000,"wager_remaining":50000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(90,NULL,310012,'parse','transactions','{"supported":true,"tx_hash":"ef92dc4986fdfb4ccb6e101ee949d5307c554e8dd1619307548ec032a973f19c","tx_index":13}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(91,NULL,310012,'parse','blocks','{"block_index":310012,"ledger_hash":"27298dbdb9026b5d54228b686b7a76f9d42479da79b38b9ef7cd13e4fee27159","messages_hash":"49b0d12e30aae10622d9c04e4d7ae9c574020ad4471669bd37c5e5e3354f928e","txlist_hash":"e409e7c7435482a64f10aaaaa6e62d69a4f0ae3083922c91907d6f15393dbb22"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(92,NULL,310012,'insert','blocks','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(93,NULL,310013,'insert','transactions','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"btc_amount":1000,"data":"00000028000152bb336400000000017d78400000000002793d60000000000000000000003b100000000a","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"ce9d3a5ea18ed454ddee80b75bd12abdd47de8e176d9c9dfc768c1233e729943","tx_index":14}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(94,NULL,310013,'update','orders','{"status":"expired","tx_hash":"c953eb18873ce8aed42456df0ece8e4678e13282d9917916e7a4aec10e828375"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(95,NULL,310013,'insert','order_expirations','{"block_index":310013,"order_hash":"c953eb18873ce8aed42456df0ece8e4678e13282d9917916e7a4aec10e828375","source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3"}',0,'ORDER_EXPIRATION');
+INSERT INTO messages VALUES(96,NULL,310013,'insert','debits','{"action":"bet","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310013,"event":"ce9d3a5ea18ed454ddee80b75bd12abdd47de8e176d9c9dfc768c1233e729943","quantity":25000000,"tx_index":14}',0,'DEBIT');
+INSERT INTO messages VALUES(97,NULL,310013,'insert','bets','{"bet_type":1,"block_index":310013,"counterwager_quantity":41500000,"counterwager_remaining":41500000,"deadline":1388000100,"expiration":10,"expire_index":310023,"fee_fraction_int":99999999.0,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":15120,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":0.0,"tx_hash":"ce9d3a5ea18ed454ddee80b75bd12abdd47de8e176d9c9dfc768c1233e729943","tx_index":14,"wager_quantity":25000000,"wager_remaining":25000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(98,NULL,310013,'update','bets','{"counterwager_remaining":4250000,"status":"open","tx_hash":"ef92dc4986fdfb4ccb6e101ee949d5307c554e8dd1619307548ec032a973f19c","wager_remaining":8500000}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(99,NULL,310013,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310013,"calling_function":"filled","event":"ce9d3a5ea18ed454ddee80b75bd12abdd47de8e176d9c9dfc768c1233e729943","quantity":4250000,"tx_index":14}',0,'CREDIT');
+INSERT INTO messages VALUES(100,NULL,310013,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"ce9d3a5ea18ed454ddee80b75bd12abdd47de8e176d9c9dfc768c1233e729943","wager_remaining":4250000}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(101,NULL,310013,'insert','bet_matches','{"backward_quantity":20750000,"block_index":310012,"deadline":1388000100,"fee_fraction_int":99999999,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","forward_quantity":41500000,"id":"ef92dc4986fdfb4ccb6e101ee949d5307c554e8dd1619307548ec032a973f19c_ce9d3a5ea18ed454ddee80b75bd12abdd47de8e176d9c9dfc768c1233e729943","initial_value":100.0,"leverage":15120,"match_expire_index":310022,"status":"pending","target_value":0.0,"tx0_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx0_bet_type":0,"tx0_block_index":310012,"tx0_expiration":10,"tx0_hash":"ef92dc4986fdfb4ccb6e101ee949d5307c554e8dd1619307548ec032a973f19c","tx0_index":13,"tx1_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx1_bet_type":1,"tx1_block_index":310013,"tx1_expiration":10,"tx1_hash":"ce9d3a5ea18ed454ddee80b75bd12abdd47de8e176d9c9dfc768c1233e729943","tx1_index":14}',0,'BET_MATCH');
+INSERT INTO messages VALUES(102,NULL,310013,'parse','transactions','{"supported":true,"tx_hash":"ce9d3a5ea18ed454ddee80b75bd12abdd47de8e176d9c9dfc768c1233e729943","tx_index":14}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(103,NULL,310013,'parse','blocks','{"block_index":310013,"ledger_hash":"f5fbbb8870bb8253cfba52c58765b8c2493ceee6a2db5779a4212ed456bf892e","messages_hash":"0548d7767e52fe92fb48e9860a17d4d0aae87d90395c814f71a19418cb01f253","txlist_hash":"78b492a743e24d50541f29a1a8e476434e81961bd457552c55fcbbac68d68fca"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(104,NULL,310013,'insert','blocks','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(105,NULL,310014,'insert','transactions','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"btc_amount":1000,"data":"00000028000052bb33640000000008f0d1800000000014dc93800000000000000000000013b00000000a","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"6722884208180367a60c5c96ae86865dad3c63525a9498d716e98b5015ec2e3d","tx_index":15}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(106,NULL,310014,'update','orders','{"status":"expired","tx_hash":"89a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(107,NULL,310014,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310014,"calling_function":"cancel order","event":"89a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a","quantity":5000000,"tx_index":0}',0,'CREDIT');
+INSERT INTO messages VALUES(108,NULL,310014,'insert','order_expirations','{"block_index":310014,"order_hash":"89a44a3314b298a83d5d14c8646900a5122b8a1e8f6e0528e73ea82044d1726a","source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3"}',0,'ORDER_EXPIRATION');
+INSERT INTO messages VALUES(109,NULL,310014,'insert','debits','{"action":"bet","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310014,"event":"6722884208180367a60c5c96ae86865dad3c63525a9498d716e98b5015ec2e3d","quantity":150000000,"tx_index":15}',0,'DEBIT');
+INSERT INTO messages VALUES(110,NULL,310014,'insert','bets','{"bet_type":0,"block_index":310014,"counterwager_quantity":350000000,"counterwager_remaining":350000000,"deadline":1388000100,"expiration":10,"expire_index":310024,"fee_fraction_int":99999999.0,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":5040,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":0.0,"tx_hash":"6722884208180367a60c5c96ae86865dad3c63525a9498d716e98b5015ec2e3d","tx_index":15,"wager_quantity":150000000,"wager_remaining":150000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(111,NULL,310014,'parse','transactions','{"supported":true,"tx_hash":"6722884208180367a60c5c96ae86865dad3c63525a9498d716e98b5015ec2e3d","tx_index":15}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(112,NULL,310014,'parse','blocks','{"block_index":310014,"ledger_hash":"f1e77a7a4d28d64a0cfd878112074b6205ef09055b93b8923b0c6466a07ea500","messages_hash":"1ec2ab1b175680972277d46d3c88eacd45939ff84545534192a4aae70b68bd1f","txlist_hash":"475ee3563b60fa5bbf8f8db5eabf9bdfea4a2f1b5fc82aedc37fa7c581c5f065"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(113,NULL,310014,'insert','blocks','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(114,NULL,310015,'insert','transactions','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"btc_amount":1000,"data":"00000028000152bb33640000000014dc93800000000008f0d1800000000000000000000013b00000000a","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"10c669ad89d61e1a983e179f66f355b1dd21e53d520fd4dc3bb5a6f9e5e24fcd","tx_index":16}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(115,NULL,310015,'insert','debits','{"action":"bet","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310015,"event":"10c669ad89d61e1a983e179f66f355b1dd21e53d520fd4dc3bb5a6f9e5e24fcd","quantity":350000000,"tx_index":16}',0,'DEBIT');
+INSERT INTO messages VALUES(116,NULL,310015,'insert','bets','{"bet_type":1,"block_index":310015,"counterwager_quantity":150000000,"counterwager_remaining":150000000,"deadline":1388000100,"expiration":10,"expire_index":310025,"fee_fraction_int":99999999.0,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":5040,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":0.0,"tx_hash":"10c669ad89d61e1a983e179f66f355b1dd21e53d520fd4dc3bb5a6f9e5e24fcd","tx_index":16,"wager_quantity":350000000,"wager_remaining":350000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(117,NULL,310015,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310015,"calling_function":"filled","event":"10c669ad89d61e1a983e179f66f355b1dd21e53d520fd4dc3bb5a6f9e5e24fcd","quantity":0,"tx_index":16}',0,'CREDIT');
+INSERT INTO messages VALUES(118,NULL,310015,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"6722884208180367a60c5c96ae86865dad3c63525a9498d716e98b5015ec2e3d","wager_remaining":0}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(119,NULL,310015,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310015,"calling_function":"filled","event":"10c669ad89d61e1a983e179f66f355b1dd21e53d520fd4dc3bb5a6f9e5e24fcd","quantity":0,"tx_index":16}',0,'CREDIT');
+INSERT INTO messages VALUES(120,NULL,310015,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"10c669ad89d61e1a983e179f66f355b1dd21e53d520fd4dc3bb5a6f9e5e24fcd","wager_remaining":0}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(121,NULL,310015,'insert','bet_matches','{"backward_quantity":350000000,"block_index":310014,"deadline":1388000100,"fee_fraction_int":99999999,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","forward_quantity":150000000,"id":"6722884208180367a60c5c96ae86865dad3c63525a9498d716e98b5015ec2e3d_10c669ad89d61e1a983e179f66f355b1dd21e53d520fd4dc3bb5a6f9e5e24fcd","initial_value":100.0,"leverage":5040,"match_expire_index":310024,"status":"pending","target_value":0.0,"tx0_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx0_bet_type":0,"tx0_block_index":310014,"tx0_expiration":10,"tx0_hash":"6722884208180367a60c5c96ae86865dad3c63525a9498d716e98b5015ec2e3d","tx0_index":15,"tx1_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx1_bet_type":1,"tx1_block_index":310015,"tx1_expiration":10,"tx1_hash":"10c669ad89d61e1a983e179f66f355b1dd21e53d520fd4dc3bb5a6f9e5e24fcd","tx1_index":16}',0,'BET_MATCH');
+INSERT INTO messages VALUES(122,NULL,310015,'parse','transactions','{"supported":true,"tx_hash":"10c669ad89d61e1a983e179f66f355b1dd21e53d520fd4dc3bb5a6f9e5e24fcd","tx_index":16}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(123,NULL,310015,'parse','blocks','{"block_index":310015,"ledger_hash":"014bcc839c0ea0d2fecd9aab3074528ffee3b2dce7f805e4d459e2dfb3d98a51","messages_hash":"1c29ad09a0e553303984b97abf9b4a3a844defb01750cda96efc763eb7e0e509","txlist_hash":"5d40b180a3f3b38eedd15c7f40e8585aaa5e2fdde3967dff443a74703fa45fd4"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(124,NULL,310015,'insert','blocks','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(125,NULL,310016,'insert','transactions','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"btc_amount":1000,"data":"00000028000252bb33c8000000002cb417800000000026be36803ff0000000000000000013b00000000a","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"caaceb9160747bd86fa4b3b4d090c9e1617285fae312eac2152bf3fabedcd2bc","tx_index":17}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(126,NULL,310016,'insert','debits','{"action":"bet","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310016,"event":"caaceb9160747bd86fa4b3b4d090c9e1617285fae312eac2152bf3fabedcd2bc","quantity":750000000,"tx_index":17}',0,'DEBIT');
+INSERT INTO messages VALUES(127,NULL,310016,'insert','bets','{"bet_type":2,"block_index":310016,"counterwager_quantity":650000000,"counterwager_remaining":650000000,"deadline":1388000200,"expiration":10,"expire_index":310026,"fee_fraction_int":99999999.0,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":5040,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":1.0,"tx_hash":"caaceb9160747bd86fa4b3b4d090c9e1617285fae312eac2152bf3fabedcd2bc","tx_index":17,"wager_quantity":750000000,"wager_remaining":750000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(128,NULL,310016,'parse','transactions','{"supported":true,"tx_hash":"caaceb9160747bd86fa4b3b4d090c9e1617285fae312eac2152bf3fabedcd2bc","tx_index":17}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(129,NULL,310016,'parse','blocks','{"block_index":310016,"ledger_hash":"9f72d6a84ee58e1e851a90a62b525dc257c3b1b0c7e9964f93a7e5df6a2e4007","messages_hash":"422aca1d53d6f1cdabb33311ac6416c777f51a0f2964e2c9f8ccd40f5894e98e","txlist_hash":"e990e43e7272c9d971fcc782768bea70c71d45fa7d712a7195bcc4151617a57f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(130,NULL,310016,'insert','blocks','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(131,NULL,310017,'insert','transactions','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"btc_amount":1000,"data":"00000028000352bb33c80000000026be3680000000002cb417803ff0000000000000000013b00000000a","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"67497105b77192af401ec8024ad34de211592877dee8532dbe216d8a8f17dd0c","tx_index":18}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(132,NULL,310017,'insert','debits','{"action":"bet","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310017,"event":"67497105b77192af401ec8024ad34de211592877dee8532dbe216d8a8f17dd0c","quantity":650000000,"tx_index":18}',0,'DEBIT');
+INSERT INTO messages VALUES(133,NULL,310017,'insert','bets','{"bet_type":3,"block_index":310017,"counterwager_quantity":750000000,"counterwager_remaining":750000000,"deadline":1388000200,"expiration":10,"expire_index":310027,"fee_fraction_int":99999999.0,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":5040,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":1.0,"tx_hash":"67497105b77192af401ec8024ad34de211592877dee8532dbe216d8a8f17dd0c","tx_index":18,"wager_quantity":650000000,"wager_remaining":650000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(134,NULL,310017,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310017,"calling_function":"filled","event":"67497105b77192af401ec8024ad34de211592877dee8532dbe216d8a8f17dd0c","quantity":0,"tx_index":18}',0,'CREDIT');
+INSERT INTO messages VALUES(135,NULL,310017,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"caaceb9160747bd86fa4b3b4d090c9e1617285fae312eac2152bf3fabedcd2bc","wager_remaining":0}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(136,NULL,310017,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310017,"calling_function":"filled","event":"67497105b77192af401ec8024ad34de211592877dee8532dbe216d8a8f17dd0c","quantity":0,"tx_index":18}',0,'CREDIT');
+INSERT INTO messages VALUES(137,NULL,310017,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"67497105b77192af401ec8024ad34de211592877dee8532dbe216d8a8f17dd0c","wager_remaining":0}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(138,NULL,310017,'insert','bet_matches','{"backward_quantity":650000000,"block_index":310016,"deadline":1388000200,"fee_fraction_int":99999999,"feed_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","forward_quantity":750000000,"id":"caaceb9160747bd86fa4b3b4d090c9e1617285fae312eac2152bf3fabedcd2bc_67497105b77192af401ec8024ad34de211592877dee8532dbe216d8a8f17dd0c","initial_value":100.0,"leverage":5040,"match_expire_index":310026,"status":"pending","target_value":1.0,"tx0_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx0_bet_type":2,"tx0_block_index":310016,"tx0_expiration":10,"tx0_hash":"caaceb9160747bd86fa4b3b4d090c9e1617285fae312eac2152bf3fabedcd2bc","tx0_index":17,"tx1_address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx1_bet_type":3,"tx1_block_index":310017,"tx1_expiration":10,"tx1_hash":"67497105b77192af401ec8024ad34de211592877dee8532dbe216d8a8f17dd0c","tx1_index":18}',0,'BET_MATCH');
+INSERT INTO messages VALUES(139,NULL,310017,'parse','transactions','{"supported":true,"tx_hash":"67497105b77192af401ec8024ad34de211592877dee8532dbe216d8a8f17dd0c","tx_index":18}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(140,NULL,310017,'parse','blocks','{"block_index":310017,"ledger_hash":"5d1e195a7d313d703253640cd98be600b04a7d98aae69b5327a29e740573198d","messages_hash":"51b88cfe43063411950072a1f9a3529859a893b57b1f10f578725b072279a25b","txlist_hash":"443444009d5700747b2d345cc10a70bf5a48214bc279d811a311ef76e52abf04"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(141,NULL,310017,'insert','blocks','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(142,NULL,310018,'insert','transactions','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"btc_amount":0,"data":"0000001e52bb33324058f7256ffc115e004c4b4009556e69742054657374","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"e87bf8dfeda7df143873ff042cc7a05dd590a6bef6a55c5832e22db1bd5e3bcd","tx_index":19}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(143,NULL,310018,'insert','broadcasts','{"block_index":310018,"fee_fraction_int":5000000,"locked":false,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","text":"Unit Test","timestamp":1388000050,"tx_hash":"e87bf8dfeda7df143873ff042cc7a05dd590a6bef6a55c5832e22db1bd5e3bcd","tx_index":19,"value":99.86166}',0,'BROADCAST');
+INSERT INTO messages VALUES(144,NULL,310018,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310018,"calling_function":"bet settled: liquidated for bear","event":"e87bf8dfeda7df143873ff042cc7a05dd590a6bef6a55c5832e22db1bd5e3bcd","quantity":59137500,"tx_index":19}',0,'CREDIT');
+INSERT INTO messages VALUES(145,NULL,310018,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310018,"calling_function":"feed fee","event":"e87bf8dfeda7df143873ff042cc7a05dd590a6bef6a55c5832e22db1bd5e3bcd","quantity":3112500,"tx_index":19}',0,'CREDIT');
+INSERT INTO messages VALUES(146,NULL,310018,'insert','bet_match_resolutions','{"bear_credit":59137500,"bet_match_id":"ef92dc4986fdfb4ccb6e101ee949d5307c554e8dd1619307548ec032a973f19c_ce9d3a5ea18ed454ddee80b75bd12abdd47de8e176d9c9dfc768c1233e729943","bet_match_type_id":1,"block_index":310018,"bull_credit":0,"escrow_less_fee":null,"fee":3112500,"settled":false,"winner":null}',0,'BET_MATCH_RESOLUTON');
+INSERT INTO messages VALUES(147,NULL,310018,'update','bet_matches','{"id":"ef92dc4986fdfb4ccb6e101ee949d5307c554e8dd1619307548ec032a973f19c_ce9d3a5ea18ed454ddee80b75bd12abdd47de8e176d9c9dfc768c1233e729943","status":"settled: liquidated for bear"}',0,'BET_MATCH_UPDATE');
+INSERT INTO messages VALUES(148,NULL,310018,'parse','transactions','{"supported":true,"tx_hash":"e87bf8dfeda7df143873ff042cc7a05dd590a6bef6a55c5832e22db1bd5e3bcd","tx_index":19}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(149,NULL,310018,'parse','blocks','{"block_index":310018,"ledger_hash":"f38538a4a2cba9bcf8821b56e1dc877990e027135d3f220338cd8cb11f3eb205","messages_hash":"641798f65a211495512814860dc526be35f6887724547aa27a257203cc2b2e38","txlist_hash":"abe72d22a1fb28e1ce34bfe3f1fd012d5a41fe219a0c4ee96f3b4b0e49aea889"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(150,NULL,310018,'insert','blocks','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(151,NULL,310019,'insert','transactions','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"btc_amount":0,"data":"0000001e52bb3365405915f3b645a1cb004c4b4009556e69742054657374","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"1fcd2de64aabc6c05796e28cbea31df45a25928c2cd8dd30d774c9e70c4e97df","tx_index":20}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(152,NULL,310019,'insert','broadcasts','{"block_index":310019,"fee_fraction_int":5000000,"locked":false,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","text":"Unit Test","timestamp":1388000101,"tx_hash":"1fcd2de64aabc6c05796e28cbea31df45a25928c2cd8dd30d774c9e70c4e97df","tx_index":20,"value":100.343}',0,'BROADCAST');
+INSERT INTO messages VALUES(153,NULL,310019,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310019,"calling_function":"bet settled","event":"1fcd2de64aabc6c05796e28cbea31df45a25928c2cd8dd30d774c9e70c4e97df","quantity":159300000,"tx_index":20}',0,'CREDIT');
+INSERT INTO messages VALUES(154,NULL,310019,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310019,"calling_function":"bet settled","event":"1fcd2de64aabc6c05796e28cbea31df45a25928c2cd8dd30d774c9e70c4e97df","quantity":315700000,"tx_index":20}',0,'CREDIT');
+INSERT INTO messages VALUES(155,NULL,310019,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310019,"calling_function":"feed fee","event":"1fcd2de64aabc6c05796e28cbea31df45a25928c2cd8dd30d774c9e70c4e97df","quantity":25000000,"tx_index":20}',0,'CREDIT');
+INSERT INTO messages VALUES(156,NULL,310019,'insert','bet_match_resolutions','{"bear_credit":315700000,"bet_match_id":"6722884208180367a60c5c96ae86865dad3c63525a9498d716e98b5015ec2e3d_10c669ad89d61e1a983e179f66f355b1dd21e53d520fd4dc3bb5a6f9e5e24fcd","bet_match_type_id":1,"block_index":310019,"bull_credit":159300000,"escrow_less_fee":null,"fee":25000000,"settled":true,"winner":null}',0,'BET_MATCH_RESOLUTON');
+INSERT INTO messages VALUES(157,NULL,310019,'update','bet_matches','{"id":"6722884208180367a60c5c96ae86865dad3c63525a9498d716e98b5015ec2e3d_10c669ad89d61e1a983e179f66f355b1dd21e53d520fd4dc3bb5a6f9e5e24fcd","status":"settled"}',0,'BET_MATCH_UPDATE');
+INSERT INTO messages VALUES(158,NULL,310019,'parse','transactions','{"supported":true,"tx_hash":"1fcd2de64aabc6c05796e28cbea31df45a25928c2cd8dd30d774c9e70c4e97df","tx_index":20}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(159,NULL,310019,'parse','blocks','{"block_index":310019,"ledger_hash":"3a51f1f061d953c940ac7e53f8bb37df041f2d4f42a16f5c5d23707b8b0c0dc6","messages_hash":"b59cc514a2948e9f942fb18aff5acbc5686a7021b67fd5fbb8c1cb2ee11bde4b","txlist_hash":"8bea2f5ef9805bffa4b23881f7635ec213525f8dfe98aa45e716e43a73ffe114"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(160,NULL,310019,'insert','blocks','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(161,NULL,310020,'insert','transactions','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"btc_amount":0,"data":"0000001e52bb33c94000000000000000004c4b4009556e69742054657374","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"dc4b57ad8a0b23dbc7ffc03f51e8076cd2418edf256b2660783bb0d1be0b8b73","tx_index":21}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(162,NULL,310020,'insert','broadcasts','{"block_index":310020,"fee_fraction_int":5000000,"locked":false,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","text":"Unit Test","timestamp":1388000201,"tx_hash":"dc4b57ad8a0b23dbc7ffc03f51e8076cd2418edf256b2660783bb0d1be0b8b73","tx_index":21,"value":2.0}',0,'BROADCAST');
+INSERT INTO messages VALUES(163,NULL,310020,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310020,"calling_function":"bet settled: for notequal","event":"dc4b57ad8a0b23dbc7ffc03f51e8076cd2418edf256b2660783bb0d1be0b8b73","quantity":1330000000,"tx_index":21}',0,'CREDIT');
+INSERT INTO messages VALUES(164,NULL,310020,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310020,"calling_function":"feed fee","event":"dc4b57ad8a0b23dbc7ffc03f51e8076cd2418edf256b2660783bb0d1be0b8b73","quantity":70000000,"tx_index":21}',0,'CREDIT');
+INSERT INTO messages VALUES(165,NULL,310020,'insert','bet_match_resolutions','{"bear_credit":null,"bet_match_id":"caaceb9160747bd86fa4b3b4d090c9e1617285fae312eac2152bf3fabedcd2bc_67497105b77192af401ec8024ad34de211592877dee8532dbe216d8a8f17dd0c","bet_match_type_id":5,"block_index":310020,"bull_credit":null,"escrow_less_fee":1330000000,"fee":70000000,"settled":null,"winner":"NotEqual"}',0,'BET_MATCH_RESOLUTON');
+INSERT INTO messages VALUES(166,NULL,310020,'update','bet_matches','{"id":"caaceb9160747bd86fa4b3b4d090c9e1617285fae312eac2152bf3fabedcd2bc_67497105b77192af401ec8024ad34de211592877dee8532dbe216d8a8f17dd0c","status":"settled: for notequal"}',0,'BET_MATCH_UPDATE');
+INSERT INTO messages VALUES(167,NULL,310020,'parse','transactions','{"supported":true,"tx_hash":"dc4b57ad8a0b23dbc7ffc03f51e8076cd2418edf256b2660783bb0d1be0b8b73","tx_index":21}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(168,NULL,310020,'parse','blocks','{"block_index":310020,"ledger_hash":"cce3284c53fcf79ba268d925e32ab70e3d4df1e6f13dbcbe2920e93fc689128b","messages_hash":"657db356d2ffcb7ba632c7144241fe250361e09d32b93f551768e31502d614ae","txlist_hash":"d0e8a123b3125a8e057d8504b7a96e77188895c86907c273922b80e7e9ca42d2"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(169,NULL,310020,'insert','blocks','{"block_hash":"7c2460bb32c5749c856486393239bf7a0ac789587ac71f32e7237910da8097f2","block_index":310021,"block_time":310021000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(170,NULL,310021,'insert','transactions','{"block_hash":"7c2460bb32c5749c856486393239bf7a0ac789587ac71f32e7237910da8097f2","block_index":310021,"block_time":310021000,"btc_amount":0,"data":"0000000a00000000000047670000000002faf08000000000000000010000000002faf080000a0000000000000000","destination":"","fee":6800,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"4408350196e71533e054ef84d1bdc4ba4b0f693d2d98d240d3c697b553078ab7","tx_index":22}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(171,NULL,310021,'insert','debits','{"action":"open order","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBB","block_index":310021,"event":"4408350196e71533e054ef84d1bdc4ba4b0f693d2d98d240d3c697b553078ab7","quantity":50000000,"tx_index":22}',0,'DEBIT');
+INSERT INTO messages VALUES(172,NULL,310021,'insert','orders','{"block_index":310021,"expiration":10,"expire_index":310031,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":50000000,"get_remaining":50000000,"give_asset":"BBBB","give_quantity":50000000,"give_remaining":50000000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","tx_hash":"4408350196e71533e054ef84d1bdc4ba4b0f693d2d98d240d3c697b553078ab7","tx_index":22}',0,'OPEN_ORDER');
+INSERT INTO messages VALUES(173,NULL,310021,'parse','transactions','{"supported":true,"tx_hash":"4408350196e71533e054ef84d1bdc4ba4b0f693d2d98d240d3c697b553078ab7","tx_index":22}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(174,NULL,310021,'parse','blocks','{"block_index":310021,"ledger_hash":"6ad5172a6dcaa6706d5a4f6fd8ada183e103b9faab58e42c1365613a26477490","messages_hash":"bee135735ca1d013383b5fde88988a6f7e0155ec16c2d5ffaae49d6f4e0d6905","txlist_hash":"1c207ab28dd2c5d297f47d5ac366699523cd97ccfc8a3e348dbf6fe900c32b5d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(175,NULL,310021,'insert','blocks','{"block_hash":"44435f9a99a0aa12a9bfabdc4cb8119f6ea6a6e1350d2d65445fb66a456db5fc","block_index":310022,"block_time":310022000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(176,NULL,310022,'insert','transactions','{"block_hash":"44435f9a99a0aa12a9bfabdc4cb8119f6ea6a6e1350d2d65445fb66a456db5fc","block_index":310022,"block_time":310022000,"btc_amount":100000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"181709b341ec136f90975fdaa362c767ebd789e72f16d4e17348ab2985c1bd01","tx_index":23}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(177,NULL,310022,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310022,"calling_function":"burn","event":"181709b341ec136f90975fdaa362c767ebd789e72f16d4e17348ab2985c1bd01","quantity":56999887262,"tx_index":23}',0,'CREDIT');
+INSERT INTO messages VALUES(178,NULL,310022,'insert','burns','{"block_index":310022,"burned":38000000,"earned":56999887262,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"181709b341ec136f90975fdaa362c767ebd789e72f16d4e17348ab2985c1bd01","tx_index":23}',0,'BURN');
+INSERT INTO messages VALUES(179,NULL,310022,'parse','blocks','{"block_index":310022,"ledger_hash":"c9361fea7f3dd2415969eb6ad7fe893381c9ca65ea391f2e47a966e342db3a90","messages_hash":"bb9d4b79d020195079c817aac5ae98987b3e9db4889667e69dc62fe454c25a14","txlist_hash":"c0867554bd3d50cd8ca4bb6e2d055250fa0c3c46f47b5f03ce5022b7090e07d4"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(180,NULL,310022,'insert','blocks','{"block_hash":"d8cf5bec1bbcab8ca4f495352afde3b6572b7e1d61b3976872ebb8e9d30ccb08","block_index":310023,"block_time":310023000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(181,NULL,310023,'insert','transactions','{"block_hash":"d8cf5bec1bbcab8ca4f495352afde3b6572b7e1d61b3976872ebb8e9d30ccb08","block_index":310023,"block_time":310023000,"btc_amount":1000,"data":"0000000000000000000047680000000000002710","destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","fee":7650,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"f4a0c2582fb141e9451a7c00fa61afc147b9959c2dd20a1978950936fdb53831","tx_index":24}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(182,NULL,310023,'update','bets','{"status":"expired","tx_hash":"ef92dc4986fdfb4ccb6e101ee949d5307c554e8dd1619307548ec032a973f19c"}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(183,NULL,310023,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310023,"calling_function":"recredit wager remaining","event":"ef92dc4986fdfb4ccb6e101ee949d5307c554e8dd1619307548ec032a973f19c","quantity":8500000,"tx_index":0}',0,'CREDIT');
+INSERT INTO messages VALUES(184,NULL,310023,'insert','bet_expirations','{"bet_hash":"ef92dc4986fdfb4ccb6e101ee949d5307c554e8dd1619307548ec032a973f19c","bet_index":13,"block_index":310023,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3"}',0,'BET_EXPIRATION');
+INSERT INTO messages VALUES(185,NULL,310023,'insert','debits','{"action":"send","address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBC","block_index":310023,"event":"f4a0c2582fb141e9451a7c00fa61afc147b9959c2dd20a1978950936fdb53831","quantity":10000,"tx_index":24}',0,'DEBIT');
+INSERT INTO messages VALUES(186,NULL,310023,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"BBBC","block_index":310023,"calling_function":"send","event":"f4a0c2582fb141e9451a7c00fa61afc147b9959c2dd20a1978950936fdb53831","quantity":10000,"tx_index":24}',0,'CREDIT');
+INSERT INTO messages VALUES(187,NULL,310023,'insert','sends','{"asset":"BBBC","block_index":310023,"destination":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","quantity":10000,"source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"f4a0c2582fb141e9451a7c00fa61afc147b9959c2dd20a1978950936fdb53831","tx_index":24}',0,'SEND');
+INSERT INTO messages VALUES(188,NULL,310023,'parse','transactions','{"supported":true,"tx_hash":"f4a0c2582fb141e9451a7c00fa61afc147b9959c2dd20a1978950936fdb53831","tx_index":24}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(189,NULL,310023,'parse','blocks','{"block_index":310023,"ledger_hash":"f63680db66cf963aaaebf64130629790e7492b5ea9396434c2179a5eb8774412","messages_hash":"9953f0483df04bf7651d41fb34e95ecf36ef2195b8508e8e1525e4d1e872beea","txlist_hash":"6a3cc06342da18a8eae7180bd93af2cc3a6f7c51916a19265365814f52a58119"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(190,NULL,310023,'insert','blocks','{"block_hash":"b03042b4e18a222b4c8d1e9e1970d93e6e2a2d41686d227ff8ecf0a839223dc5","block_index":310024,"block_time":310024000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(191,NULL,310024,'parse','blocks','{"block_index":310024,"ledger_hash":"d69ea243fcd5e525ae03af680d5610b654a9d2bad17782e196305aaa110a6ba9","messages_hash":"b68e0765ebe5e98e0972ee993eb7ae5fc1178de01b68aa2e33966fb69ea2591c","txlist_hash":"7e4a0076ce614d5b7bcb0a59c84e79d21702a3507ba88bc0d8ce9e644d7fe692"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(192,NULL,310024,'insert','blocks','{"block_hash":"a872e560766832cc3b4f7f222228cb6db882ce3c54f6459f62c71d5cd6e90666","block_index":310025,"block_time":310025000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(193,NULL,310025,'parse','blocks','{"block_index":310025,"ledger_hash":"721906ed4cbd1524fafdc8e3ffef27d8b03e0c798bbcbe3eee7bc7f14afe4e81","messages_hash":"e1edd85efb3d8302b64133ce5edac3cc3047c0b968b295f864e61dadc65cdcee","txlist_hash":"c1596eb8c172f2968ddd2ef70c1a8f125ab989c1a7bb012ab56f6c75cd96bb41"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(194,NULL,310025,'insert','blocks','{"block_hash":"6c96350f6f2f05810f19a689de235eff975338587194a36a70dfd0fcd490941a","block_index":310026,"block_time":310026000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(195,NULL,310026,'parse','blocks','{"block_index":310026,"ledger_hash":"27912da2afa797876030dd0e50c31aea462d54c7bfa4f89d2f14fdb7b80db6b0","messages_hash":"fdb48d0418b6e97e15f1beb3e755e001eccc2217100606217e003c3a86a27997","txlist_hash":"2d653751a75829265f2cfe2dd7bcc3a594be62492893d36642e3c8815d339fbd"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(196,NULL,310026,'insert','blocks','{"block_hash":"d7acfac66df393c4482a14c189742c0571b89442eb7f817b34415a560445699e","block_index":310027,"block_time":310027000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(197,NULL,310027,'parse','blocks','{"block_index":310027,"ledger_hash":"cc0734ecfd2bdbd2d04d236b853f60e324feaa9115fae33a8add961c4a5f9436","messages_hash":"88a9b5e14c5f63905f30734c91a2bfb61efe8e62ba88cf36a5242495487885b4","txlist_hash":"3d5c1eb8dafccfee04f7d91b2819d9f51a9fe8df4050c025c19c29ceb18b3575"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(198,NULL,310027,'insert','blocks','{"block_hash":"02409fcf8fa06dafcb7f11e38593181d9c42cc9d5e2ddc304d098f990bd9530b","block_index":310028,"block_time":310028000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(199,NULL,310028,'parse','blocks','{"block_index":310028,"ledger_hash":"d3f5fbbe85d5a81fef8735c73349f61a43122f4b6f3f7aa61215323a683ce3aa","messages_hash":"ba94bc00c1246e08a641038398acddf181d667a726e0a054a570a95a91407055","txlist_hash":"e6600d6d90725ce81afdd7b00220f8df650f85dc3a308d2486fab88edaaa8981"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(200,NULL,310028,'insert','blocks','{"block_hash":"3c739fa8b40c118d5547ea356ee8d10ee2898871907643ec02e5db9d00f03cc6","block_index":310029,"block_time":310029000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(201,NULL,310029,'parse','blocks','{"block_index":310029,"ledger_hash":"74d08f0d1cad9f7102d0cfe70f50614c7ae7f4844ca6d02390031e1e96c2b418","messages_hash":"f4f014290c00eb6d1df157e203d82ed4bdd52aaa758dabdf3fd32ec3880c2b5c","txlist_hash":"341aa44dcd4967cc3356ca23c97111b1cf3ee128c944493a0ebc6458c4f119be"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(202,NULL,310029,'insert','blocks','{"block_hash":"d5071cddedf89765ee0fd58f209c1c7d669ba8ea66200a57587da8b189b9e4f5","block_index":310030,"block_time":310030000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(203,NULL,310030,'parse','blocks','{"block_index":310030,"ledger_hash":"753a1a8bb877851ae24dbc33884344f34ee18c6b0d70a4d909231448b943e8cd","messages_hash":"db8ea86a15db96b17b2d85a213bb157e6044ef311d40258dcb4e2030ee91546b","txlist_hash":"b9385290e5bd72f2a1a5d2cc889108a6da0aa888fdcf76170b166888c6301407"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(204,NULL,310030,'insert','blocks','{"block_hash":"0b02b10f41380fff27c543ea8891ecb845bf7a003ac5c87e15932aff3bfcf689","block_index":310031,"block_time":310031000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(205,NULL,310031,'parse','blocks','{"block_index":310031,"ledger_hash":"f7c62d08a4efc854dea6f47249786d3d00778d97223dd84de1d0fd1eef3e2ee7","messages_hash":"108cd055eb0f1f50883615c29d1f2f7e58a3ed849b381d6a13f5249cf3339d6c","txlist_hash":"6c27a0cb80d8602b9ccd126f53bb69727d358353b4c1299434c3472b0469d85f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(206,NULL,310031,'insert','blocks','{"block_hash":"66346be81e6ba04544f2ae643b76c2b7b1383f038fc2636e02e49dc7ec144074","block_index":310032,"block_time":310032000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(207,NULL,310032,'update','orders','{"status":"expired","tx_hash":"4408350196e71533e054ef84d1bdc4ba4b0f693d2d98d240d3c697b553078ab7"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(208,NULL,310032,'insert','credits','{"address":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBB","block_index":310032,"calling_function":"cancel order","event":"4408350196e71533e054ef84d1bdc4ba4b0f693d2d98d240d3c697b553078ab7","quantity":50000000,"tx_index":0}',0,'CREDIT');
+INSERT INTO messages VALUES(209,NULL,310032,'insert','order_expirations','{"block_index":310032,"order_hash":"4408350196e71533e054ef84d1bdc4ba4b0f693d2d98d240d3c697b553078ab7","source":"2_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3"}',0,'ORDER_EXPIRATION');
+INSERT INTO messages VALUES(210,NULL,310032,'parse','blocks','{"block_index":310032,"ledger_hash":"833690f195e85b427b61890640fe8f0cc7419e0f4301b6f4738bab12be06dbb8","messages_hash":"a6321cefb0ec463ccef9562be2387263feab779731c65626aeb393b2fdde3886","txlist_hash":"cb3ca17e5c792309fead54d49039ee0e00e7b17291868a3a2e86e09bb3dae80e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(211,NULL,310032,'insert','blocks','{"block_hash":"999c65df9661f73e8c01f1da1afda09ac16788b72834f0ff5ea3d1464afb4707","block_index":310033,"block_time":310033000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(212,NULL,310033,'parse','blocks','{"block_index":310033,"ledger_hash":"a1e118474a6f70b8f700a67b43ee0272c4609d3309603b5be6434ca587eaa704","messages_hash":"039c4c914fb56800d197a5eba14ff51734a5f39e848fb6a3d41bf811c34a1582","txlist_hash":"2f097bb1b1dff2b4266dcb3b46d29255401e23a2fcfb75f28e9f7184733e14bc"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(213,NULL,310033,'insert','blocks','{"block_hash":"f552edd2e0a648230f3668e72ddf0ddfb1e8ac0f4c190f91b89c1a8c2e357208","block_index":310034,"block_time":310034000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(214,NULL,310034,'parse','blocks','{"block_index":310034,"ledger_hash":"3b6427f61fb59ffd674ed8e0af75687fc4ccf8b462011727d4dc4bdf4c794775","messages_hash":"e33abdd943a38b791ea9eedd1fecb1b25e17fb11ca5f434d1fb9c1a52e014b25","txlist_hash":"be05766d9a1c70d8907d523979a313ccec8cf2900335fd91800b4b90da3bee12"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(215,NULL,310034,'insert','blocks','{"block_hash":"a13cbb016f3044207a46967a4ba1c87dab411f78c55c1179f2336653c2726ae2","block_index":310035,"block_time":310035000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(216,NULL,310035,'parse','blocks','{"block_index":310035,"ledger_hash":"d065384f739c52a718f656717f88eb2fecc10d8567a93ccf823434c003d28c55","messages_hash":"5be7215f264b8f7977200c67689ceff9e2f14035280d424ae973855a8e689d7f","txlist_hash":"41cb2236ce676fd45ae98593c9cac6291fa95479ec07a5af615ccb5fbbeab760"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(217,NULL,310035,'insert','blocks','{"block_hash":"158648a98f1e1bd1875584ce8449eb15a4e91a99a923bbb24c4210135cef0c76","block_index":310036,"block_time":310036000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(218,NULL,310036,'parse','blocks','{"block_index":310036,"ledger_hash":"22cddc8dbfcbaf4b851fa5379c740a96294acc3d772dcf6d684881bef18d7fbf","messages_hash":"70668b938741ae0f0dc76997b78268cebb0960bfd43fa6d043b648d3de84cf72","txlist_hash":"0beb88a3d4adbf913601c2d5144599cecfd48886ca51f995aecfeb50c56aab1c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(219,NULL,310036,'insert','blocks','{"block_hash":"563acfd6d991ce256d5655de2e9429975c8dceeb221e76d5ec6e9e24a2c27c07","block_index":310037,"block_time":310037000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(220,NULL,310037,'parse','blocks','{"block_index":310037,"ledger_hash":"93172c51a9c4cb5c33937a199a32ad3c13a40a60f4c194a1187e2c59a15c0ccc","messages_hash":"b23bd50542786f46b18658498e048f11ecd3c4bab73ace2b1d41e72b3ef921e8","txlist_hash":"ea276540d3637a9165f482c48e414467e3a78c2c25c6a70bbed0c38f7205920e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(221,NULL,310037,'insert','blocks','{"block_hash":"b44b4cad12431c32df27940e18d51f63897c7472b70950d18454edfd640490b2","block_index":310038,"block_time":310038000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(222,NULL,310038,'parse','blocks','{"block_index":310038,"ledger_hash":"7a167a13f7e576c7e066035dbe2a2513659f1386c095a9e63afa494c043b7def","messages_hash":"d236c4cc61ab09e7b0a2b20a2d8358002b4cdd8528edfad746df5f4156ebb8a5","txlist_hash":"15ef5d6175a7ce1937554ed6c2b10be6555aa14f7179245b7b140d1a620095fc"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(223,NULL,310038,'insert','blocks','{"block_hash":"5fa1ae9c5e8a599247458987b006ad3a57f686df1f7cc240bf119e911b56c347","block_index":310039,"block_time":310039000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(224,NULL,310039,'parse','blocks','{"block_index":310039,"ledger_hash":"4733d9ada3d4f60bc09f0a6eba3fdcdcd8e8b18adfd38c7bf06372259e2d38f3","messages_hash":"b001901e32d2be5ffcf6722ad12d238cba23d17cf5903818c35fc4f1e111ea45","txlist_hash":"4ac5fe346b8577626d58c9442c95fccd4955506ac712ee3f27b5df6b7ec1d0df"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(225,NULL,310039,'insert','blocks','{"block_hash":"7200ded406675453eadddfbb2d14c2a4526c7dc2b5de14bd48b29243df5e1aa3","block_index":310040,"block_time":310040000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(226,NULL,310040,'parse','blocks','{"block_index":310040,"ledger_hash":"b8021bbe3744e58cedfc3dd99220fce48f4e56a8fe8256d7894dd55c7312a76d","messages_hash":"bcfde45a33ace1870169520291256debd57cd92191055b02b067ca9b359459d9","txlist_hash":"acbb3114dc5c7599eabdaec4833952c3b6de20dde616233f3945151977d5be16"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(227,NULL,310040,'insert','blocks','{"block_hash":"5db592ff9ba5fac1e030cf22d6c13b70d330ba397f415340086ee7357143b359","block_index":310041,"block_time":310041000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(228,NULL,310041,'parse','blocks','{"block_index":310041,"ledger_hash":"017b79a5fb34785dd39964a61a5bde69d676f75ee085c27bbc9e3381983c2dab","messages_hash":"fe7e2286d95c9fedb3f426879324acf58b6b818e79fb76f672d77d9a052f33a0","txlist_hash":"6cbdfb2d6b3677c91097b1e80a32dafb0172725fabff370adcf444321ee48509"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(229,NULL,310041,'insert','blocks','{"block_hash":"826fd4701ef2824e9559b069517cd3cb990aff6a4690830f78fc845ab77fa3e4","block_index":310042,"block_time":310042000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(230,NULL,310042,'parse','blocks','{"block_index":310042,"ledger_hash":"cf5389c037b6c619025bf95d9718fb5548cd67978c3ebf26f76029873828162e","messages_hash":"cf30fc0d3b3fcad9aa91035bdab67237d66928cfaffd8c6e9d5747ba7e730295","txlist_hash":"a091876d90aaf1dd5b0d53403a3a9b5788710bf3d0c1996184a91961a1f24aa0"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(231,NULL,310042,'insert','blocks','{"block_hash":"2254a12ada208f1dd57bc17547ecaf3c44720323c47bc7d4b1262477cb7f3c51","block_index":310043,"block_time":310043000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(232,NULL,310043,'parse','blocks','{"block_index":310043,"ledger_hash":"df116ea1fcf5f968644dcc97c1149f0ef6061b188fd56c27152543256ce79009","messages_hash":"3967234a887552a7a446b28b1d71be584efe09d346e735477726fcb803d3ea06","txlist_hash":"eafb7d2cbbb2d1afe4a3eb65ca6bc7be653d7d824238264082d2c5e382757e54"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(233,NULL,310043,'insert','blocks','{"block_hash":"3346d24118d8af0b3c6bcc42f8b85792e7a2e7036ebf6e4c25f4f6723c78e46b","block_index":310044,"block_time":310044000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(234,NULL,310044,'parse','blocks','{"block_index":310044,"ledger_hash":"c12cfaa984bfb34e781ac93848a87cdc0318c45a1cd9f02d31f5c3a4abe8d918","messages_hash":"b96d11bc51e12584035a7a14072443ebb4ab62cb43903ce3f93183f4489708ab","txlist_hash":"61cb811c578f90cd6cc9f6963ff80c280f6ad0edb53fe53dd3075a8818404fe8"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(235,NULL,310044,'insert','blocks','{"block_hash":"7bba0ab243839e91ad1a45a762bf074011f8a9883074d68203c6d1b46fffde98","block_index":310045,"block_time":310045000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(236,NULL,310045,'parse','blocks','{"block_index":310045,"ledger_hash":"999a9ed2673de2db7637e22eb8a1876e0c794e90f09cdd76d1442e56ae12b1c8","messages_hash":"3ba540abdfe5bec9c2b07cacfbec12fd67312f884073e3f7a2e0138fd4c1d5d3","txlist_hash":"ce9e3f0524576a630ed0154cf69c7798065a001e6752c4f369c30b06aebbe378"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(237,NULL,310045,'insert','blocks','{"block_hash":"47db6788c38f2d6d712764979e41346b55e78cbb4969e0ef5c4336faf18993a6","block_index":310046,"block_time":310046000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(238,NULL,310046,'parse','blocks','{"block_index":310046,"ledger_hash":"240c9a2f6dc918ed868abfb5de6838d7a17f02263fdda0ccd3c7481c09e155d1","messages_hash":"657eaa5a6ca03f35197b063eff359fdd5c08e369a9675a2f2aefefae93a8adf7","txlist_hash":"4f83f9bc531841759d1071a92ccda5d898af693fc88db0de16b2d2ca09630d59"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(239,NULL,310046,'insert','blocks','{"block_hash":"a9ccabcc2a098a7d25e4ab8bda7c4e66807eefa42e29890dcd88149a10de7075","block_index":310047,"block_time":310047000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(240,NULL,310047,'parse','blocks','{"block_index":310047,"ledger_hash":"79836105e355e25afd709d15632e2c0d1ab53ab251cd3750ffee9fea4a2605b8","messages_hash":"67b525e65cdf790966a30fa8980229402ca894d989c8e04b368b39710cb486a1","txlist_hash":"b17c5d4fc0eef05c315095d265b324a0ea7dee28145d7b4e251a944b4b6a16fb"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(241,NULL,310047,'insert','blocks','{"block_hash":"610bf3935a85b05a98556c55493c6de45bed4d7b3b6c8553a984718765796309","block_index":310048,"block_time":310048000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(242,NULL,310048,'parse','blocks','{"block_index":310048,"ledger_hash":"6bf0789392e97311c4283d9f748b37effe7b0d1678076e30ce5725eff345a8c5","messages_hash":"d1189f782de3e9769c05abd81d1f7e13ff72ebae99f271958b33b84c1cecfeff","txlist_hash":"f9f7ec8bdc9301d4ea41a099d04f84631badad709fdbdf43582327f183102590"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(243,NULL,310048,'insert','blocks','{"block_hash":"4ad2761923ad49ad2b283b640f1832522a2a5d6964486b21591b71df6b33be3c","block_index":310049,"block_time":310049000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(244,NULL,310049,'parse','blocks','{"block_index":310049,"ledger_hash":"1842c46a03800f5e191cb8d641aead6bc80e6d25c2ec826f3a5df426059cc1cb","messages_hash":"3840a6172bb14e16efef4402c3a4f81667c97dc4a5ce48d90e60982f5bbaecb1","txlist_hash":"458e51569acd6ef757e0b36ab3f558e76f239ea3bfbf1b0ce7824f39ec5ac23b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(245,NULL,310049,'insert','blocks','{"block_hash":"8cfeb60a14a4cec6e9be13d699694d49007d82a31065a17890383e262071e348","block_index":310050,"block_time":310050000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(246,NULL,310050,'parse','blocks','{"block_index":310050,"ledger_hash":"d424b02109320491b2d32388869d6468ab1fca26d4bf72374cfef729efad866d","messages_hash":"4e38733346bd60ded8f95932eb85b68c170ab5e0e62dcdbd28b66901ac96c1d0","txlist_hash":"53e0972193c4f689d3a7216f22607a9b0cb7b8a9f43f144469bfbf25f59edb09"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(247,NULL,310050,'insert','blocks','{"block_hash":"b53c90385dd808306601350920c6af4beb717518493fd23b5c730eea078f33e6","block_index":310051,"block_time":310051000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(248,NULL,310051,'parse','blocks','{"block_index":310051,"ledger_hash":"d1db4181403136b41168ab7786831f2fadfc418a05b7477246ab097bab531859","messages_hash":"036a2c57db183169924f171a954a33d5ec1cd430b5916bf071a0b587afaa7147","txlist_hash":"89bbd06ca16ed2098ac6b7accd2296b4e0a2d8236dbf1cc14137e90ebad364e3"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(249,NULL,310051,'insert','blocks','{"block_hash":"0acdacf4e4b6fca756479cb055191b367b1fa433aa558956f5f08fa5b7b394e2","block_index":310052,"block_time":310052000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(250,NULL,310052,'parse','blocks','{"block_index":310052,"ledger_hash":"97fdb6b2c8e636d23109a67af55ab4bb30955a84073274de3fdc788074dc1b6b","messages_hash":"3db2edc06e57d225d363f733a6539fed037aee88e16888ed16da58b7b692707a","txlist_hash":"8b8739b799483eb556e0e32f92cc092c349bb2bcb87044e88e762d55d6f1b033"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(251,NULL,310052,'insert','blocks','{"block_hash":"68348f01b6dc49b2cb30fe92ac43e527aa90d859093d3bf7cd695c64d2ef744f","block_index":310053,"block_time":310053000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(252,NULL,310053,'parse','blocks','{"block_index":310053,"ledger_hash":"0506be4f04a22058504406210af3f1475dbf6d6834c1c1b7f6ac0fe013b47363","messages_hash":"aa9e8f3e3d6febd2672bcdb086a690d656bf47a8817fc555f139c786b2530fd3","txlist_hash":"05673a7bf2fc7e9a5daf3732cb03bcf43712df43ef7ecf1bfe89d18f54726b6b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(253,NULL,310053,'insert','blocks','{"block_hash":"a8b5f253df293037e49b998675620d5477445c51d5ec66596e023282bb9cd305","block_index":310054,"block_time":310054000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(254,NULL,310054,'parse','blocks','{"block_index":310054,"ledger_hash":"3dc7894c1368c9ef5d32a95fdc292e7de8237b73b61365a25b9d0da95eedc2e6","messages_hash":"f94db2dd80cde70db18382dffac1ed812f3d2d03c4a2b1f9feb972247e212525","txlist_hash":"4651aab35442e5ec1d79ba6422ca0c2b0df02369ee49b33efe1ef54e2ebc7080"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(255,NULL,310054,'insert','blocks','{"block_hash":"4b069152e2dc82e96ed8a3c3547c162e8c3aceeb2a4ac07972f8321a535b9356","block_index":310055,"block_time":310055000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(256,NULL,310055,'parse','blocks','{"block_index":310055,"ledger_hash":"a9ef2c8bf3a88c326d2bdd722c3d82ed4f4c10b65620b136d4b893ed93174795","messages_hash":"2e774913f25b35ed4864bc24fdd94ca25a67cd9779d0c59e652a7fd22607010e","txlist_hash":"d826fea28c0f5e82a6fbefae4d6885a0a49a3180d3c16d6eeb4faff9f57d4d89"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(257,NULL,310055,'insert','blocks','{"block_hash":"7603eaed418971b745256742f9d2ba70b2c2b2f69f61de6cc70e61ce0336f9d3","block_index":310056,"block_time":310056000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(258,NULL,310056,'parse','blocks','{"block_index":310056,"ledger_hash":"13b76edecb04a9733107d5c21420ee20424fd463dcde2ea98424ad99ed3383f0","messages_hash":"2f5072254be3d1ca2cf2c871f75d90c7ff0158014b26e0803daadb7f8ea1430e","txlist_hash":"fe620dd60bf5b6f3c610495735deca47cdbfcbb510975ebba2f68c7df6d32a15"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(259,NULL,310056,'insert','blocks','{"block_hash":"4a5fdc84f2d66ecb6ee3e3646aad20751ce8694e64e348d3c8aab09d33a3e411","block_index":310057,"block_time":310057000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(260,NULL,310057,'parse','blocks','{"block_index":310057,"ledger_hash":"41c8a47d7bc4e73aa2f09685acb9fac052c5c55764ec3a8250abbbcde40dbe90","messages_hash":"8337aa5515901276b768ee119463ff5e7cdb251b8517b47006cc734d70c5311f","txlist_hash":"553ea196d7a1045f71dc6261cbfe4b84c78b7dc37de89b8865f4d385cbb42863"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(261,NULL,310057,'insert','blocks','{"block_hash":"a6eef3089896f0cae0bfe9423392e45c48f4efe4310b14d8cfbdb1fea613635f","block_index":310058,"block_time":310058000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(262,NULL,310058,'parse','blocks','{"block_index":310058,"ledger_hash":"0b8ec211d258206ab8c318c079d9deb33d444a7086d5a05aaba97abc0be137df","messages_hash":"ac5c07af4e8057be82c39a551bf2a0eaf6d9acf57658e3d13383dd66014727c5","txlist_hash":"c3fd7824c9b8413f24feb96ca676285447a980d684f730d10b81c06a440fab7a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(263,NULL,310058,'insert','blocks','{"block_hash":"ab505de874c43f97c90be1c26a769e6c5cb140405c993b4a6cc7afc795f156a9","block_index":310059,"block_time":310059000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(264,NULL,310059,'parse','blocks','{"block_index":310059,"ledger_hash":"f5c2686408577854893d11b02f52d8ea917e90777dddf67c98aabb36a3339b6f","messages_hash":"0bc06f8d5a42655c32b9d0a2faf5a15b638e7529721c1fc07562b8445458e72d","txlist_hash":"3f73e1d36c82dfc8ee58f83502643d962ba6558cbf0fb46d83fea966b5cdfc59"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(265,NULL,310059,'insert','blocks','{"block_hash":"974ad5fbef621e0a38eab811608dc9afaf10c8ecc85fed913075ba1a145e889b","block_index":310060,"block_time":310060000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(266,NULL,310060,'parse','blocks','{"block_index":310060,"ledger_hash":"b80d446905550494f56f4f8240b501d593b0d0e63b5d98a09e180b1a0a68e3b1","messages_hash":"121aeaa7099e55f66f61bf5597e6c277106987c914283bfe3de59757c9dc5a53","txlist_hash":"f1995db5beea80756d509ddf79d3467bb14ae96b0d151175499030505d1f648e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(267,NULL,310060,'insert','blocks','{"block_hash":"35d267d21ad386e7b7632292af1c422b0310dde7ca49a82f9577525a29c138cf","block_index":310061,"block_time":310061000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(268,NULL,310061,'parse','blocks','{"block_index":310061,"ledger_hash":"41b30d23becc727151698b29a1bb733e45ae5086683c5256d073a6f817baaf49","messages_hash":"ad3dc31b4ef463b328c95e834f9fb14b8b2c0ccdc009a7570aa10ecd18c7cc47","txlist_hash":"de6a4e6bbd49de2001ce26387040970beeb7062b4e16911757204d2745f6c409"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(269,NULL,310061,'insert','blocks','{"block_hash":"b31a0054145319ef9de8c1cb19df5bcf4dc8a1ece20053aa494e5d3a00a2852f","block_index":310062,"block_time":310062000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(270,NULL,310062,'parse','blocks','{"block_index":310062,"ledger_hash":"f873f47e89715e965c98e92616339f8ff4200f6b8ef5cf747e8de2d101cbde02","messages_hash":"f49c03b535f3622c285a0c30dc16b1ab768477a919617e94558a766e8b0dd783","txlist_hash":"f2954d07588b07ffc063170f43afbb12548fe61584575a979526d28dd631edaa"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(271,NULL,310062,'insert','blocks','{"block_hash":"0cbcbcd5b7f2dc288e3a34eab3d4212463a5a56e886804fb4f9f1cf929eadebe","block_index":310063,"block_time":310063000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(272,NULL,310063,'parse','blocks','{"block_index":310063,"ledger_hash":"14ce21ebfe6a00eccd7bf1aac2d5cf122441d2ebe8c0f5fd6dd14a95b5a209b3","messages_hash":"8abb5b763837ecbe0ee9fcc3f199e14e0a5b7d3af2132dcf24ad69971ccf83ff","txlist_hash":"96b5675e5c3a3b66d7e2bd3424316119cf795c17bbbf2c8677b66872e4659574"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(273,NULL,310063,'insert','blocks','{"block_hash":"e2db8065a195e85cde9ddb868a17d39893a60fb2b1255aa5f0c88729de7cbf30","block_index":310064,"block_time":310064000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(274,NULL,310064,'parse','blocks','{"block_index":310064,"ledger_hash":"adb05bac5e7f1e6a1679d5c51f252dc877ebd99c2b73a56df69a9c848cef98a7","messages_hash":"fd8f02cc9a32ede97914e157560a3d68ee7106ca7e7d2ab80f2397e39455cb85","txlist_hash":"243e437b3c00d8106e8c9c2cb08d22376e8a16bd3b62a8b62b86128ddd6d139e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(275,NULL,310064,'insert','blocks','{"block_hash":"8a7bc7a77c831ac4fd11b8a9d22d1b6a0661b07cef05c2e600c7fb683b861d2a","block_index":310065,"block_time":310065000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(276,NULL,310065,'parse','blocks','{"block_index":310065,"ledger_hash":"9065476b6b2cfb122888e036cea71d36f3d5f7d6c72451c63d770b40a4560fac","messages_hash":"237fab9675ab9d7b81399d8fefb8678ffd4dc2424b7089ed9c107c2437a0f9b9","txlist_hash":"4af47a042289756821ffb0b14aba38fcc8c972fd254220d3991b05642df641e6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(277,NULL,310065,'insert','blocks','{"block_hash":"b6959be51eb084747d301f7ccaf9e75f2292c9404633b1532e3692659939430d","block_index":310066,"block_time":310066000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(278,NULL,310066,'parse','blocks','{"block_index":310066,"ledger_hash":"7d5d369827ec0cd44743ed9a519d45003789ff8dc2e511191d2726e1482f58d2","messages_hash":"a6ef9c531563e09b7fa26c58ef497218dd993107540fe47bce76770a8a7f92e5","txlist_hash":"4d61dab0197a7a3f452f3751a92cb1f5378106a13be0351f0f8942d011da097d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(279,NULL,310066,'insert','blocks','{"block_hash":"8b08eae98d7193c9c01863fac6effb9162bda010daeacf9e0347112f233b8577","block_index":310067,"block_time":310067000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(280,NULL,310067,'parse','blocks','{"block_index":310067,"ledger_hash":"301b22a9338d5dd39bbebf6bf518ac53bbb8e1cf7469322484cbcee2fee666ef","messages_hash":"409af4673120ac3029d09fdf1b20a59e4d86d8c1922acfc0dc94f120c79bcbfd","txlist_hash":"ae0cf0361293deb7b8903f20aca2410197db694ea3aff0aec3b635690168f5a5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(281,NULL,310067,'insert','blocks','{"block_hash":"9280e7297ef6313341bc81787a36acfc9af58f83a415afff5e3154f126cf52b5","block_index":310068,"block_time":310068000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(282,NULL,310068,'parse','blocks','{"block_index":310068,"ledger_hash":"fc281736e1dfe5a89a9a3dd098565c645904a4ad1626dd70ac8e9bc447dfb8b8","messages_hash":"f410e3c9f4d3381177946edaae6b1db4c84eb0118f0ce0bbcd2cac11b15221a1","txlist_hash":"460295c507a33a24231d1f4c760e5987b54f29d1e17bc97959db2a712f0339bf"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(283,NULL,310068,'insert','blocks','{"block_hash":"486351f0655bf594ffaab1980cff17353b640b63e9c27239109addece189a6f7","block_index":310069,"block_time":310069000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(284,NULL,310069,'parse','blocks','{"block_index":310069,"ledger_hash":"b0249a0dfd008a4554adc24085d3c5f44278403cbccb44ba27ee354b23c5627b","messages_hash":"546c9caf6f78f49dc560850474c3354eb4c8a80b3775ec147f78700a9f117e0e","txlist_hash":"d07500b12517493106b918ff5b6c96c371bc10bb3699eb279647539ea7ab1fd5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(285,NULL,310069,'insert','blocks','{"block_hash":"8739e99f4dee8bebf1332f37f49a125348b40b93b74fe35579dd52bfba4fa7e5","block_index":310070,"block_time":310070000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(286,NULL,310070,'parse','blocks','{"block_index":310070,"ledger_hash":"d34051879c8db679ac5c49e50edf2085d0ce88dfc1adb971e7b097c0177854c2","messages_hash":"3e6dba3cc0c763aa7ca983d8f815aae7c993a51ee1db7a058c764f76fc821c7f","txlist_hash":"874e494499820bcc0ba41ac5cd1bd153ac1772f730c9b842b77b289adbb2c2f5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(287,NULL,310070,'insert','blocks','{"block_hash":"7a099aa1bba0ead577f1e44f35263a1f115ed6a868c98d4dd71609072ae7f80b","block_index":310071,"block_time":310071000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(288,NULL,310071,'parse','blocks','{"block_index":310071,"ledger_hash":"0186c5312af19576cc628a85014ce7c33892dc23b5352c8ff5a0f230adfe263b","messages_hash":"179740d814b3143f9f9243c1afc800cabbcce38f4a3bff20d372f08eeb6f0768","txlist_hash":"01342c18caeaea6b35f2d815b9aeffbd92228f6ad285103faa13cb25171fdfc6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(289,NULL,310071,'insert','blocks','{"block_hash":"7b17ecedc07552551b8129e068ae67cb176ca766ea3f6df74b597a94e3a7fc8a","block_index":310072,"block_time":310072000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(290,NULL,310072,'parse','blocks','{"block_index":310072,"ledger_hash":"5376530512d61c3967f21cf01418d317ed072976119b8583fefaf3991b93d8b2","messages_hash":"290e9835fd502c57d1d3b10c512789133df5c6caa128f4e64f53b016d06dc3d2","txlist_hash":"72a7d63ad0b15a401210b197da00ca549b6e8c80d8eda1650cf9017bcbc92532"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(291,NULL,310072,'insert','blocks','{"block_hash":"ee0fe3cc9b3a48a2746b6090b63b442b97ea6055d48edcf4b2288396764c6943","block_index":310073,"block_time":310073000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(292,NULL,310073,'parse','blocks','{"block_index":310073,"ledger_hash":"d15fe704fe5de58e9203ff5ded50218a1a01609b65a1a259aec510b8b9e6d690","messages_hash":"6d25cf33e13bf22ab1e3e0aa9e92bc6c70dfd3af45e3f2c1435855289369c2d0","txlist_hash":"924753a39229b5005b684c4b2dd111b6233347b89179f2fd2732d256b960ace0"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(293,NULL,310073,'insert','blocks','{"block_hash":"ceab38dfde01f711a187601731ad575d67cfe0b7dbc61dcd4f15baaef72089fb","block_index":310074,"block_time":310074000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(294,NULL,310074,'parse','blocks','{"block_index":310074,"ledger_hash":"61015667044d0dddac3bdb16db67faa6ebcb71758101bfad898fca8ed183e7c3","messages_hash":"37a72ebc94288c1526b9dd7ffc91a59b9fcfeddc28c7848efe86bf44ed5eaa31","txlist_hash":"298ed692f21afcee61b06fd853cf07e5707dbd63a05f0caff6b6a177edc3b613"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(295,NULL,310074,'insert','blocks','{"block_hash":"ef547198c6e36d829f117cfd7077ccde45158e3c545152225fa24dba7a26847b","block_index":310075,"block_time":310075000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(296,NULL,310075,'parse','blocks','{"block_index":310075,"ledger_hash":"5dd06f32075c46b6e573d73f12c1c31cf82cac5d1588bbdf302b8fe95c4b948b","messages_hash":"1bd5f8cc1ec863a1eabcbc0e89dd96b86cf0b47a76ea553fae27a1f9b44a78f3","txlist_hash":"528e4b6aee88202f84f9f2b56611d0aba2336d925b8d8fe47039504e6eea1ebc"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(297,NULL,310075,'insert','blocks','{"block_hash":"3b0499c2e8e8f0252c7288d4ecf66efc426ca37aad3524424d14c8bc6f8b0d92","block_index":310076,"block_time":310076000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(298,NULL,310076,'parse','blocks','{"block_index":310076,"ledger_hash":"8e1782c2f35a07fcc4c57b34b2226b70cc4c7af2761386f38fc8fd74d53d5e60","messages_hash":"ae84d3a2b80f3efcb466d2371fd67160de7b6a832d122ee80403f9e966190814","txlist_hash":"76682f0ffbc6b86d16fbcec967a7562f6f12558c12aa3d9abd8779f51cc870ab"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(299,NULL,310076,'insert','blocks','{"block_hash":"d2adeefa9024ab3ff2822bc36acf19b6c647cea118cf15b86c6bc00c3322e7dd","block_index":310077,"block_time":310077000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(300,NULL,310077,'parse','blocks','{"block_index":310077,"ledger_hash":"6469ff80c3890d274817d30602f33d5d4b0a7c0a9e3b85100d21d7b38d894efb","messages_hash":"c3eaa5ca861b8b1f550baee63c8210fc3fcca2e8326b968478c7fd435959d700","txlist_hash":"187e9ae8428d46b7f8c8d652ab31dcf7c86a574cc781714a71784857dc0d1365"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(301,NULL,310077,'insert','blocks','{"block_hash":"f6c17115ef0efe489c562bcda4615892b4d4b39db0c9791fe193d4922bd82cd6","block_index":310078,"block_time":310078000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(302,NULL,310078,'parse','blocks','{"block_index":310078,"ledger_hash":"3ca73c2bf37c694281938a0599335633dccf0284a027f5f3b8e17a9e68cbcdf0","messages_hash":"4b53c5f3f79be4d81443e9c774ced97b5a945a4ea630ee39796a6f18784874cd","txlist_hash":"f7830250755fc0566ee5162a06e7308b51c9c0a7a951752be6cff224806a90fa"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(303,NULL,310078,'insert','blocks','{"block_hash":"f2fbd2074d804e631db44cb0fb2e1db3fdc367e439c21ffc40d73104c4d7069c","block_index":310079,"block_time":310079000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(304,NULL,310079,'parse','blocks','{"block_index":310079,"ledger_hash":"ae4a36e1ce7d5e11f059301684573cddce85b70ba69188a116e0611ceba5c140","messages_hash":"d3fb445eb5f1998a4f0490b187079d82a2522179d7fabd4aac10961120e8de5c","txlist_hash":"8d3b4ed30546c5f19f5522a0f57a86c29159ce27bf9e1e183a5ecffd9fbae8a2"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(305,NULL,310079,'insert','blocks','{"block_hash":"42943b914d9c367000a78b78a544cc4b84b1df838aadde33fe730964a89a3a6c","block_index":310080,"block_time":310080000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(306,NULL,310080,'parse','blocks','{"block_index":310080,"ledger_hash":"c2c0b96c64f1ed555c8553da976e0fcc3a5ef403819ceac49cf22b476281ced1","messages_hash":"53f48ccfd392fea120503dc3305b1a2425316a48760bdbd9eca17c1cde959319","txlist_hash":"d9ecf83f3f9f40246bee151938855fce34e0f9c636a5c9c2c80c896eb59287b9"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(307,NULL,310080,'insert','blocks','{"block_hash":"6554f9d307976249e7b7e260e08046b3b55d318f8b6af627fed5be3063f123c4","block_index":310081,"block_time":310081000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(308,NULL,310081,'parse','blocks','{"block_index":310081,"ledger_hash":"88d1b09f8141b90b44740e4618422298f8a64f2b3d11230c6b04084ef8d11b2c","messages_hash":"d66811b6b4438b65cf403dbcf382e0a41cfcfe9bd4f0f7b95c2e061564e81ea7","txlist_hash":"49e2f64485ac3ef523a079732bce9b2197384e2abfb3a4ad9340bca5a7179e31"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(309,NULL,310081,'insert','blocks','{"block_hash":"4f1ef91b1dcd575f8ac2e66a67715500cbca154bd6f3b8148bb7015a6aa6c644","block_index":310082,"block_time":310082000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(310,NULL,310082,'parse','blocks','{"block_index":310082,"ledger_hash":"dab22ae7a9216033777136cbbac87a3597cf6478a2fd008260caab3cad0cde3f","messages_hash":"a07058ef1ba8c2a825e497f04e76c526294e8a4bd8e999c96cd195fec2266738","txlist_hash":"5406c6e3c63633910da82fc039c525dbeeb1aa818dc450a9d34d43084eef680f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(311,NULL,310082,'insert','blocks','{"block_hash":"9b1f6fd6ff9b0dc4e37603cfb0625f49067c775b99e12492afd85392d3c8d850","block_index":310083,"block_time":310083000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(312,NULL,310083,'parse','blocks','{"block_index":310083,"ledger_hash":"a185e60dc97d19a211b0dfaa3f3da154956499b4af146751bf1d776fc68c15b8","messages_hash":"be8805302f4e3ff5944af2e51e0eeb84680ee2fe6c5a976ba576b347998d8c73","txlist_hash":"76e009b37822fc739a1e4abccf9f908a5fcdbed7fac540a719efbff8ebc694b7"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(313,NULL,310083,'insert','blocks','{"block_hash":"1e0972523e80306441b9f4157f171716199f1428db2e818a7f7817ccdc8859e3","block_index":310084,"block_time":310084000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(314,NULL,310084,'parse','blocks','{"block_index":310084,"ledger_hash":"622c574321be176c535fde918f319e10cfacaab383978be51406334303d14a8d","messages_hash":"1182b2e349f88f2df5119e7cbbd3ff6d9893ab5e00be067bc47d35b3f986d041","txlist_hash":"f3a3c37d89eb008f2194267a1eb5a7a52e9443f8b1f5fe51267d93a57eee27c7"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(315,NULL,310084,'insert','blocks','{"block_hash":"c5b6e9581831e3bc5848cd7630c499bca26d9ece5156d36579bdb72d54817e34","block_index":310085,"block_time":310085000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(316,NULL,310085,'parse','blocks','{"block_index":310085,"ledger_hash":"5556084b92f51175d4de4097fcd820a3c367c2f0630d3a20081296e892462d84","messages_hash":"3398a844add370aa0b7661ed80a3d7090f730a0b1bb0a5943ed5f1383ace9234","txlist_hash":"f284f757d004154b6ab9b9ee9d18281e6f8dd51f25f3f1fc7cc58450e0ba5f17"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(317,NULL,310085,'insert','blocks','{"block_hash":"080c1dc55a4ecf4824cf9840602498cfc35b5f84099f50b71b45cb63834c7a78","block_index":310086,"block_time":310086000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(318,NULL,310086,'parse','blocks','{"block_index":310086,"ledger_hash":"fc9dd8ef92fc7d47b187a75bd16e9698d61fa9ce6b4da7bba75982f59b0fbbc5","messages_hash":"c6f8b9023f4fb14abf10b405dfe416bb91386d12667871c8b128528162b27df4","txlist_hash":"e5f9da1d98725423a240687ba2985b42f8acb274ba0122b4e31e25c57619845f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(319,NULL,310086,'insert','blocks','{"block_hash":"4ec8cb1c38b22904e8087a034a6406b896eff4dd28e7620601c6bddf82e2738c","block_index":310087,"block_time":310087000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(320,NULL,310087,'parse','blocks','{"block_index":310087,"ledger_hash":"21f7329fa27373fba176043db9081b0d9f95f75421e5adce87177a3edffcedc0","messages_hash":"74446399df111b44c653465cc75327752e252ed8686373b7266390d50a6707a8","txlist_hash":"7935ee6c215a123367ddfae34507170148723d08f1963aad7e47b68520fa4e70"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(321,NULL,310087,'insert','blocks','{"block_hash":"e945c815c433cbddd0bf8e66c5c23b51072483492acda98f5c2c201020a8c5b3","block_index":310088,"block_time":310088000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(322,NULL,310088,'parse','blocks','{"block_index":310088,"ledger_hash":"19164a10a0602df57d1add2e3a31ad4eef9d3ef9e53e70174b44aa91de2d6296","messages_hash":"8f42f7221255861ee5bd5ba65b281a071fab20f79c483ef92460f8e7d79beb9d","txlist_hash":"d35a417416c712908cdfbeda76e261a55c605ff8091605a79d4d4fc986ae76cd"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(323,NULL,310088,'insert','blocks','{"block_hash":"0382437f895ef3e7e38bf025fd4f606fd44d4bbd6aea71dbdc4ed11a7cd46f33","block_index":310089,"block_time":310089000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(324,NULL,310089,'parse','blocks','{"block_index":310089,"ledger_hash":"87f1c713c5f2cd84fab28b996008900f86bf9eaad25ceedac1507348a949be7c","messages_hash":"051ccde9020819e5b7aa2c6f95ab716f1ac0fb7a905d31c67ee5352c8572ab3c","txlist_hash":"44c73622e27c362abf0460a5e0d7b836091523b763b6183cb9815cee30d66bef"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(325,NULL,310089,'insert','blocks','{"block_hash":"b756db71dc037b5a4582de354a3347371267d31ebda453e152f0a13bb2fae969","block_index":310090,"block_time":310090000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(326,NULL,310090,'parse','blocks','{"block_index":310090,"ledger_hash":"75264a6a628d669a60b4a8ca7e24b6b5ef1ad2c74d955b8325959f906c3bc337","messages_hash":"883f97a60b66fb64c61c49b1d08bbe3245988443c8da0f04180aaafe1aabc6bb","txlist_hash":"c1771520c57b0c705c3a5f0d576622c8dd40c399e4946b63ba153af976b23b0e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(327,NULL,310090,'insert','blocks','{"block_hash":"734a9aa485f36399d5efb74f3b9c47f8b5f6fd68c9967f134b14cfe7e2d7583c","block_index":310091,"block_time":310091000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(328,NULL,310091,'parse','blocks','{"block_index":310091,"ledger_hash":"27914e38b3ca9d8444275e5c6d24b5cfe0b4093f7c645d5c1fc3c39e0d3a3c60","messages_hash":"063389fad33e69fb1a37535b082d7605ceb64e2a98f2c157c4f072e6254b8c35","txlist_hash":"329ae5ae96b71b9a116cb82d9518110e63d32a9dfcb6fece911201ab6c3a78c5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(329,NULL,310091,'insert','blocks','{"block_hash":"56386beb65f9228740d4ad43a1c575645f6daf59e0dd9f22551c59215b5e8c3d","block_index":310092,"block_time":310092000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(330,NULL,310092,'parse','blocks','{"block_index":310092,"ledger_hash":"eca83e762899ace4d990b8acb23183263df5f92be10b63aecab3518b340b975d","messages_hash":"cd07af393f202759c9752fede344e7b96e08767be4525e4530690dd32961e3b8","txlist_hash":"6183465e58c5e5ef0f359a032e98d12cd247ff080ae44dc7a90ee35006e74e9e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(331,NULL,310092,'insert','blocks','{"block_hash":"a74a2425f2f4be24bb5f715173e6756649e1cbf1b064aeb1ef60e0b94b418ddc","block_index":310093,"block_time":310093000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(332,NULL,310093,'parse','blocks','{"block_index":310093,"ledger_hash":"3544fab97fe90a35b1f52ba955f88a8149d90329986df38d97e12992201bb187","messages_hash":"54e1bbd5d34dc103464f9254d73b99e2bb240ebf2981fd5e78c1778492442c58","txlist_hash":"407c0451107403f827f434f3f8f8e3c9adb33362ab584802d87903afe3851f4d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(333,NULL,310093,'insert','blocks','{"block_hash":"2a8f976f20c4e89ff01071915ac96ee35192d54df3a246bf61fd4a0cccfb5b23","block_index":310094,"block_time":310094000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(334,NULL,310094,'parse','blocks','{"block_index":310094,"ledger_hash":"df1e6d8f1be344f78c0b58baf7260c2abdbed3175adc45a122947815c08fcc16","messages_hash":"1b3956b84c9076fa22fdd3350a85b27e0ac949495e18dcc9c2187e07d7e4a596","txlist_hash":"d4bc7124f8beb9fe04930a1b19a66aef57669e6bf790a5d38441beefcc001dbf"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(335,NULL,310094,'insert','blocks','{"block_hash":"bed0fa40c9981223fb40b3be8124ca619edc9dd34d0c907369477ea92e5d2cd2","block_index":310095,"block_time":310095000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(336,NULL,310095,'parse','blocks','{"block_index":310095,"ledger_hash":"8b9febcfe1a9447f6a820c060f503dfe6e5c02738df4d9d63b007fe03847a6c7","messages_hash":"c35d50219e30573b4346080b362836e7aa84dfa6f4ce548e3f5c94f891b8e5cd","txlist_hash":"7038d6f46cc32e35793799e50fbce7bde13c52c379e3bea10da0e6443a221c62"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(337,NULL,310095,'insert','blocks','{"block_hash":"306aeec3db435fabffdf88c2f26ee83caa4c2426375a33daa2be041dbd27ea2f","block_index":310096,"block_time":310096000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(338,NULL,310096,'parse','blocks','{"block_index":310096,"ledger_hash":"b927091b4cf42f8537058a9adbec3814b574c1e1ccd242fe44c5f3671a191304","messages_hash":"173e9852974eacbeb6084725c5e9f300ea1e0eec8ee89eb63f822cb1cec8976f","txlist_hash":"7640d47e11233c9d27a8e868bec5595acd99b3c7326a480298f7ea38c4a66689"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(339,NULL,310096,'insert','blocks','{"block_hash":"13e8e16e67c7cdcc80d477491e554b43744f90e8e1a9728439a11fab42cefadf","block_index":310097,"block_time":310097000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(340,NULL,310097,'parse','blocks','{"block_index":310097,"ledger_hash":"649d094cfc74f90e06bb4514276aaf3b0a0ed45f56397a2f774cae9602d02e6f","messages_hash":"c063131b7b3e526fcd0d32784dd33bfbde81aaf84860d2fd128538891629ba59","txlist_hash":"ce9cdd6db6e1bbea3a9446b50b092e504bcc58900befb237580896e1c107eaab"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(341,NULL,310097,'insert','blocks','{"block_hash":"ca5bca4b5ec4fa6183e05176abe921cff884c4e20910fab55b603cef48dc3bca","block_index":310098,"block_time":310098000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(342,NULL,310098,'parse','blocks','{"block_index":310098,"ledger_hash":"c9a9dec300afba2cc3f171f76ff4c07cbeb7a41a86a3f498f712e066a8acbd17","messages_hash":"8ae79287158f94c84d5945cb8833435518c91dba4c8e95036198369ac548b610","txlist_hash":"7153d6b86e3d8ed76bed0edd2dbd4fe6200e1e6d82d51dd3f812d6b43109f503"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(343,NULL,310098,'insert','blocks','{"block_hash":"3c4c2279cd7de0add5ec469648a845875495a7d54ebfb5b012dcc5a197b7992a","block_index":310099,"block_time":310099000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(344,NULL,310099,'parse','blocks','{"block_index":310099,"ledger_hash":"3c7434887f9373b5370664180ba640fa63c2eb5b85569875105e4f4db67d8c02","messages_hash":"a3e5b0bb7df3e0ec5a9e23f7abb2cb779e266038bc8e99e5d99a54c7516e6642","txlist_hash":"adfefb6d18cdf44329bf9330e32f265145f60290f2a75db73fea8dd8ed2eb7d6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(345,NULL,310099,'insert','blocks','{"block_hash":"96925c05b3c7c80c716f5bef68d161c71d044252c766ca0e3f17f255764242cb","block_index":310100,"block_time":310100000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(346,NULL,310100,'parse','blocks','{"block_index":310100,"ledger_hash":"7e6a09386c3d8552a0dcc25b75143876a3046ebac0ff9cb09d6224ea7e2f3df9","messages_hash":"adc0156efd0d146d632eb6ce494f365b5c2d40acc8c22f2138ee64bce753567b","txlist_hash":"2776deb848ce539546aada2bc1756d9de92b23e0a8d513f5dbfb1b0bb3be3bc5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(347,NULL,310100,'insert','blocks','{"block_hash":"369472409995ca1a2ebecbad6bf9dab38c378ab1e67e1bdf13d4ce1346731cd6","block_index":310101,"block_time":310101000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(348,NULL,310101,'parse','blocks','{"block_index":310101,"ledger_hash":"6903c0c5941f334f1374aa731e389b010043fc5940d4e9ae8b94480fb4fca030","messages_hash":"6be3d97c2fd4c161f247215c9fe17df2747c2adf80b1292294705ef636ca4d40","txlist_hash":"6612c5f602f26ccc2cf4961f27e64c188ba405870cc0d7cf881c4e0fcb9a54ce"}',0,'BLOCK_PARSED');
 -- Triggers and indices on  messages
 CREATE TRIGGER block_update_messages
                            BEFORE UPDATE ON messages BEGIN
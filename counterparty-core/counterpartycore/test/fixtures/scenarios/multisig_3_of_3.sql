@@ -463,361 +463,362 @@ BEGIN TRANSACTION;
 DROP TABLE IF EXISTS messages;
 CREATE TABLE messages(
                       message_index INTEGER PRIMARY KEY,
+                      mensaje_index INTEGER,
                       block_index INTEGER,
                       command TEXT,
                       category TEXT,
                       bindings TEXT,
                       timestamp INTEGER,
                       event TEXT);
-INSERT INTO messages VALUES(0,0,'insert','blocks','{"block_hash":"8b3bef249cb3b0fa23a4936c1249b6bd41daeadc848c8d2e409ea1cbc10adfe7","block_index":309999,"block_time":309999000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1,309999,'parse','blocks','{"block_index":309999,"ledger_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","messages_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","txlist_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(2,309999,'insert','blocks','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(3,310000,'insert','transactions','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"btc_amount":62000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"c9ff1be2579378fad6d83ca87e6c91428b1eb8cfd1b0f341b3c7e452764404f5","tx_index":1}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(4,310000,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310000,"calling_function":"burn","event":"c9ff1be2579378fad6d83ca87e6c91428b1eb8cfd1b0f341b3c7e452764404f5","quantity":93000000000,"tx_index":1}',0,'CREDIT');
-INSERT INTO messages VALUES(5,310000,'insert','burns','{"block_index":310000,"burned":62000000,"earned":93000000000,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"c9ff1be2579378fad6d83ca87e6c91428b1eb8cfd1b0f341b3c7e452764404f5","tx_index":1}',0,'BURN');
-INSERT INTO messages VALUES(6,310000,'parse','blocks','{"block_index":310000,"ledger_hash":"09fa44ed277cd9e448baf3d4a2accc520d57c77fed0d97379ba9bb804e3dda71","messages_hash":"6be4f08fcd898cb64f0378531dbe611a612627b71163bcea29aab0653610dcc6","txlist_hash":"7d9cd23062d78e9eb1a892f69b154410935e9675ede8e05fe9c1269cd3c54b12"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(7,310000,'insert','blocks','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(8,310001,'insert','transactions','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"btc_amount":1000,"data":"0000000000000000000000010000000002faf080","destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","fee":7650,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"8968369ff47b1f5f6959aa67aca82d1385f3763e1cac2180d8cf41b44a515a32","tx_index":2}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(9,310001,'insert','debits','{"action":"send","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310001,"event":"8968369ff47b1f5f6959aa67aca82d1385f3763e1cac2180d8cf41b44a515a32","quantity":50000000,"tx_index":2}',0,'DEBIT');
-INSERT INTO messages VALUES(10,310001,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"XCP","block_index":310001,"calling_function":"send","event":"8968369ff47b1f5f6959aa67aca82d1385f3763e1cac2180d8cf41b44a515a32","quantity":50000000,"tx_index":2}',0,'CREDIT');
-INSERT INTO messages VALUES(11,310001,'insert','sends','{"asset":"XCP","block_index":310001,"destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","quantity":50000000,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"8968369ff47b1f5f6959aa67aca82d1385f3763e1cac2180d8cf41b44a515a32","tx_index":2}',0,'SEND');
-INSERT INTO messages VALUES(12,310001,'parse','transactions','{"supported":true,"tx_hash":"8968369ff47b1f5f6959aa67aca82d1385f3763e1cac2180d8cf41b44a515a32","tx_index":2}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(13,310001,'parse','blocks','{"block_index":310001,"ledger_hash":"b2237a0b0b29b2198355f47d38cb995e013c0e074c29dcbf1b99ed4c0f459c8d","messages_hash":"e9a2d21a205d237a9db00044b47594e52ddef4e0ce7a8502602d1d763541949e","txlist_hash":"adddb3e1b9020e7ef190f661823c79abbc5951801b15469ad9f483c512af002a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(14,310001,'insert','blocks','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(15,310002,'insert','transactions','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"btc_amount":0,"data":"0000000a00000000000000000000000002faf08000000000000000010000000005f5e100000a0000000000000000","destination":"","fee":1000000,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"1385519ca199f1b39bb89caac062fe3a342f18e393d301d7a56c150a8ab84093","tx_index":3}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(16,310002,'insert','orders','{"block_index":310002,"expiration":10,"expire_index":310012,"fee_provided":1000000,"fee_provided_remaining":1000000,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":100000000,"get_remaining":100000000,"give_asset":"BTC","give_quantity":50000000,"give_remaining":50000000,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","tx_hash":"1385519ca199f1b39bb89caac062fe3a342f18e393d301d7a56c150a8ab84093","tx_index":3}',0,'OPEN_ORDER');
-INSERT INTO messages VALUES(17,310002,'parse','transactions','{"supported":true,"tx_hash":"1385519ca199f1b39bb89caac062fe3a342f18e393d301d7a56c150a8ab84093","tx_index":3}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(18,310002,'parse','blocks','{"block_index":310002,"ledger_hash":"a3c393a285361d2981551f0a903d45847e7a0142779692d384bc77bac420db18","messages_hash":"ab4f4ad0d5abb5f36804c6b59a1ef3005b283e6718eb3b9ef279e64753216d4a","txlist_hash":"6fddb621bb8a1e2d10cf0ec8f507ada12be28578223ee53997aad614097bb35e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(19,310002,'insert','blocks','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(20,310003,'insert','transactions','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"btc_amount":0,"data":"0000000a00000000000000010000000006422c4000000000000000000000000002faf080000a00000000000dbba0","destination":"","fee":6800,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e","tx_index":4}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(21,310003,'insert','debits','{"action":"open order","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310003,"event":"a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e","quantity":105000000,"tx_index":4}',0,'DEBIT');
-INSERT INTO messages VALUES(22,310003,'insert','orders','{"block_index":310003,"expiration":10,"expire_index":310013,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":900000,"fee_required_remaining":900000,"get_asset":"BTC","get_quantity":50000000,"get_remaining":50000000,"give_asset":"XCP","give_quantity":105000000,"give_remaining":105000000,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","tx_hash":"a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e","tx_index":4}',0,'OPEN_ORDER');
-INSERT INTO messages VALUES(23,310003,'update','orders','{"fee_provided_remaining":142858,"fee_required_remaining":0,"get_remaining":0,"give_remaining":0,"status":"open","tx_hash":"1385519ca199f1b39bb89caac062fe3a342f18e393d301d7a56c150a8ab84093"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(24,310003,'update','orders','{"fee_provided_remaining":6800,"fee_required_remaining":42858,"get_remaining":0,"give_remaining":5000000,"status":"open","tx_hash":"a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(25,310003,'insert','order_matches','{"backward_asset":"XCP","backward_quantity":100000000,"block_index":310003,"fee_paid":857142,"forward_asset":"BTC","forward_quantity":50000000,"id":"1385519ca199f1b39bb89caac062fe3a342f18e393d301d7a56c150a8ab84093_a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e","match_expire_index":310023,"status":"pending","tx0_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx0_block_index":310002,"tx0_expiration":10,"tx0_hash":"1385519ca199f1b39bb89caac062fe3a342f18e393d301d7a56c150a8ab84093","tx0_index":3,"tx1_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx1_block_index":310003,"tx1_expiration":10,"tx1_hash":"a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e","tx1_index":4}',0,'ORDER_MATCH');
-INSERT INTO messages VALUES(26,310003,'parse','transactions','{"supported":true,"tx_hash":"a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e","tx_index":4}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(27,310003,'parse','blocks','{"block_index":310003,"ledger_hash":"f96ba90a471ab5524a574cc4ff72a228a8dc7019824482a664569dcb41c126c7","messages_hash":"cc9e415b3deeeffb07fe65b558b262e958c9688fda29829a128fc002e7ea07a5","txlist_hash":"d6756ca2a0f2a403b0a1714964ddb71bc773e0a18c049008f78670efb7137e18"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(28,310003,'insert','blocks','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(29,310004,'insert','transactions','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"btc_amount":50000000,"data":"0000000b1385519ca199f1b39bb89caac062fe3a342f18e393d301d7a56c150a8ab84093a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e","destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":9675,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"06448effa4c26f1101b315b2dbe3d2b7b888ca18f5755f4365c97215a6c760ac","tx_index":5}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(30,310004,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310004,"calling_function":"btcpay","event":"06448effa4c26f1101b315b2dbe3d2b7b888ca18f5755f4365c97215a6c760ac","quantity":100000000,"tx_index":5}',0,'CREDIT');
-INSERT INTO messages VALUES(31,310004,'update','order_matches','{"id":"1385519ca199f1b39bb89caac062fe3a342f18e393d301d7a56c150a8ab84093_a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e","order_match_id":"1385519ca199f1b39bb89caac062fe3a342f18e393d301d7a56c150a8ab84093_a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e","status":"completed"}',0,'ORDER_MATCH_UPDATE');
-INSERT INTO messages VALUES(32,310004,'insert','btcpays','{"block_index":310004,"btc_amount":50000000,"destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","order_match_id":"1385519ca199f1b39bb89caac062fe3a342f18e393d301d7a56c150a8ab84093_a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e","source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"06448effa4c26f1101b315b2dbe3d2b7b888ca18f5755f4365c97215a6c760ac","tx_index":5}',0,'BTC_PAY');
-INSERT INTO messages VALUES(33,310004,'parse','transactions','{"supported":true,"tx_hash":"06448effa4c26f1101b315b2dbe3d2b7b888ca18f5755f4365c97215a6c760ac","tx_index":5}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(34,310004,'parse','blocks','{"block_index":310004,"ledger_hash":"943a23e317f71981b24d636cae98f495b2bb00c949b1603a778eb7500894c844","messages_hash":"9f6909b8c5d78e55d34f7745c22743903c3f785b1ef283554b5f878dfb56c07f","txlist_hash":"be04682401f137d4d02c7539d1c776bbc76263dea1bb88fc95197128ec1a700f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(35,310004,'insert','blocks','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(36,310005,'insert','transactions','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"btc_amount":0,"data":"000000140000000000004767000000003b9aca000100000000000000000000","destination":"","fee":6800,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"57b34dae586111eefeecae4d16f6d20d6447efa974b72931f7b2cd0f39890406","tx_index":6}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(37,310005,'insert','debits','{"action":"issuance fee","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310005,"event":"57b34dae586111eefeecae4d16f6d20d6447efa974b72931f7b2cd0f39890406","quantity":50000000,"tx_index":6}',0,'DEBIT');
-INSERT INTO messages VALUES(38,310005,'insert','assets','{"asset_id":"18279","asset_longname":null,"asset_name":"BBBB","block_index":310005}',0,'ASSET_CREATION');
-INSERT INTO messages VALUES(39,310005,'insert','issuances','{"asset":"BBBB","asset_longname":null,"block_index":310005,"call_date":0,"call_price":0.0,"callable":false,"description":"","divisible":true,"fee_paid":50000000,"issuer":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","locked":false,"quantity":1000000000,"reset":false,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","transfer":false,"tx_hash":"57b34dae586111eefeecae4d16f6d20d6447efa974b72931f7b2cd0f39890406","tx_index":6}',0,'ASSET_ISSUANCE');
-INSERT INTO messages VALUES(40,310005,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBB","block_index":310005,"calling_function":"issuance","event":"57b34dae586111eefeecae4d16f6d20d6447efa974b72931f7b2cd0f39890406","quantity":1000000000,"tx_index":6}',0,'CREDIT');
-INSERT INTO messages VALUES(41,310005,'parse','transactions','{"supported":true,"tx_hash":"57b34dae586111eefeecae4d16f6d20d6447efa974b72931f7b2cd0f39890406","tx_index":6}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(42,310005,'parse','blocks','{"block_index":310005,"ledger_hash":"0c5f3dd2d439a571eec03583442fb051bedf5bc0b0ede92012922b27847af2a1","messages_hash":"14056368108692b234d1f9b7f65cf905ea4ce658789e0a79a3032a9e16bb4ab9","txlist_hash":"03c8d26098b8e49a297c104f22af44a622378afa711195bd8b91d46f01d68d65"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(43,310005,'insert','blocks','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(44,310006,'insert','transactions','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"btc_amount":0,"data":"00000014000000000000476800000000000186a00000000000000000000006666f6f626172","destination":"","fee":6800,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"6163ab5e7282e43a2f07a146d28b4b45c55820ee541881bc98d2592f4e6ba975","tx_index":7}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(45,310006,'insert','debits','{"action":"issuance fee","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310006,"event":"6163ab5e7282e43a2f07a146d28b4b45c55820ee541881bc98d2592f4e6ba975","quantity":50000000,"tx_index":7}',0,'DEBIT');
-INSERT INTO messages VALUES(46,310006,'insert','assets','{"asset_id":"18280","asset_longname":null,"asset_name":"BBBC","block_index":310006}',0,'ASSET_CREATION');
-INSERT INTO messages VALUES(47,310006,'insert','issuances','{"asset":"BBBC","asset_longname":null,"block_index":310006,"call_date":0,"call_price":0.0,"callable":false,"description":"foobar","divisible":false,"fee_paid":50000000,"issuer":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","locked":false,"quantity":100000,"reset":false,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","transfer":false,"tx_hash":"6163ab5e7282e43a2f07a146d28b4b45c55820ee541881bc98d2592f4e6ba975","tx_index":7}',0,'ASSET_ISSUANCE');
-INSERT INTO messages VALUES(48,310006,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBC","block_index":310006,"calling_function":"issuance","event":"6163ab5e7282e43a2f07a146d28b4b45c55820ee541881bc98d2592f4e6ba975","quantity":100000,"tx_index":7}',0,'CREDIT');
-INSERT INTO messages VALUES(49,310006,'parse','transactions','{"supported":true,"tx_hash":"6163ab5e7282e43a2f07a146d28b4b45c55820ee541881bc98d2592f4e6ba975","tx_index":7}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(50,310006,'parse','blocks','{"block_index":310006,"ledger_hash":"377fe894d79d60b011958ed747908b6009c5e0261fa177caefc664cb8db4c74b","messages_hash":"bd4d9db136434d836e9c7e435e56e44fa3ff5c3b1cf93fd0302f617a4b812347","txlist_hash":"079ec7423e2fe87820626aee8980e236a78e7d51b453a739fb5768d9d520bef6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(51,310006,'insert','blocks','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(52,310007,'insert','transactions','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"btc_amount":1000,"data":"00000000000000000000476700000000003d0900","destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","fee":7650,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"8972d4a117a0c4161ddf2bcdeb3877e0ad4cbf9cb5ce2be3411c69eedc9f718b","tx_index":8}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(53,310007,'insert','debits','{"action":"send","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBB","block_index":310007,"event":"8972d4a117a0c4161ddf2bcdeb3877e0ad4cbf9cb5ce2be3411c69eedc9f718b","quantity":4000000,"tx_index":8}',0,'DEBIT');
-INSERT INTO messages VALUES(54,310007,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"BBBB","block_index":310007,"calling_function":"send","event":"8972d4a117a0c4161ddf2bcdeb3877e0ad4cbf9cb5ce2be3411c69eedc9f718b","quantity":4000000,"tx_index":8}',0,'CREDIT');
-INSERT INTO messages VALUES(55,310007,'insert','sends','{"asset":"BBBB","block_index":310007,"destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","quantity":4000000,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"8972d4a117a0c4161ddf2bcdeb3877e0ad4cbf9cb5ce2be3411c69eedc9f718b","tx_index":8}',0,'SEND');
-INSERT INTO messages VALUES(56,310007,'parse','transactions','{"supported":true,"tx_hash":"8972d4a117a0c4161ddf2bcdeb3877e0ad4cbf9cb5ce2be3411c69eedc9f718b","tx_index":8}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(57,310007,'parse','blocks','{"block_index":310007,"ledger_hash":"4be55eb54e78e829306dfa31248b3073d311f49da420d9844f9aedabfbd296e3","messages_hash":"0483b397712a1597fda79b43b8d2e320e19089c073d98a94f8f31d4bda960bc0","txlist_hash":"d57db7ce89eeea61f270e7c676b38d3574c52166322cb0e287f1857a7d085e5a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(58,310007,'insert','blocks','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(59,310008,'insert','transactions','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"btc_amount":1000,"data":"000000000000000000004768000000000000020e","destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","fee":7650,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"3f49e685b22a7cd1a4d20bb7ca9a3f1ec4e593bc6e60c67037de2aab8b992391","tx_index":9}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(60,310008,'insert','debits','{"action":"send","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBC","block_index":310008,"event":"3f49e685b22a7cd1a4d20bb7ca9a3f1ec4e593bc6e60c67037de2aab8b992391","quantity":526,"tx_index":9}',0,'DEBIT');
-INSERT INTO messages VALUES(61,310008,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"BBBC","block_index":310008,"calling_function":"send","event":"3f49e685b22a7cd1a4d20bb7ca9a3f1ec4e593bc6e60c67037de2aab8b992391","quantity":526,"tx_index":9}',0,'CREDIT');
-INSERT INTO messages VALUES(62,310008,'insert','sends','{"asset":"BBBC","block_index":310008,"destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","quantity":526,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"3f49e685b22a7cd1a4d20bb7ca9a3f1ec4e593bc6e60c67037de2aab8b992391","tx_index":9}',0,'SEND');
-INSERT INTO messages VALUES(63,310008,'parse','transactions','{"supported":true,"tx_hash":"3f49e685b22a7cd1a4d20bb7ca9a3f1ec4e593bc6e60c67037de2aab8b992391","tx_index":9}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(64,310008,'parse','blocks','{"block_index":310008,"ledger_hash":"1248da848479b90f9dada38eaa02b9fe1226859e6ed1e3c4a121172786178dea","messages_hash":"1090df77ae250c237887d69ec32aa9ce3978b820f31f257743be73497a03e395","txlist_hash":"8727f3f9af7958daaecda9f2cef1bad0303d631cf9f8418636cf130581e4bb79"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(65,310008,'insert','blocks','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(66,310009,'insert','transactions','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"btc_amount":0,"data":"00000032000000000000025800000000000047670000000000000001","destination":"","fee":6800,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"6aa6c552e5a302b056768aed88aa8da6e9f78def669d5203904719e15ff1ac29","tx_index":10}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(67,310009,'insert','debits','{"action":"dividend","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310009,"event":"6aa6c552e5a302b056768aed88aa8da6e9f78def669d5203904719e15ff1ac29","quantity":24,"tx_index":10}',0,'DEBIT');
-INSERT INTO messages VALUES(68,310009,'insert','debits','{"action":"dividend fee","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310009,"event":"6aa6c552e5a302b056768aed88aa8da6e9f78def669d5203904719e15ff1ac29","quantity":20000,"tx_index":10}',0,'DEBIT');
-INSERT INTO messages VALUES(69,310009,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"XCP","block_index":310009,"calling_function":"dividend","event":"6aa6c552e5a302b056768aed88aa8da6e9f78def669d5203904719e15ff1ac29","quantity":24,"tx_index":10}',0,'CREDIT');
-INSERT INTO messages VALUES(70,310009,'insert','dividends','{"asset":"BBBB","block_index":310009,"dividend_asset":"XCP","fee_paid":20000,"quantity_per_unit":600,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"6aa6c552e5a302b056768aed88aa8da6e9f78def669d5203904719e15ff1ac29","tx_index":10}',0,'ASSET_DIVIDEND');
-INSERT INTO messages VALUES(71,310009,'parse','transactions','{"supported":true,"tx_hash":"6aa6c552e5a302b056768aed88aa8da6e9f78def669d5203904719e15ff1ac29","tx_index":10}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(72,310009,'parse','blocks','{"block_index":310009,"ledger_hash":"1e1b07f218127eccdfab98a4bc127ce185cda15314e72328dfe10eb8f2f18726","messages_hash":"74ca0349f3017a1f66ef461140c650f4d543dcd443ee6557fc2b5644f1617400","txlist_hash":"baa3b08e70e0db5ecf913bb99da662ec3dc04a5650f99d2d36408eb8ed6cc4ea"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(73,310009,'insert','blocks','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(74,310010,'insert','transactions','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"btc_amount":0,"data":"00000032000000000000032000000000000047680000000000000001","destination":"","fee":6800,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"8606cbcb3aaa438e207e9ef279191f6f100e34d479b1985268525e32a91c953e","tx_index":11}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(75,310010,'insert','debits','{"action":"dividend","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310010,"event":"8606cbcb3aaa438e207e9ef279191f6f100e34d479b1985268525e32a91c953e","quantity":420800,"tx_index":11}',0,'DEBIT');
-INSERT INTO messages VALUES(76,310010,'insert','debits','{"action":"dividend fee","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310010,"event":"8606cbcb3aaa438e207e9ef279191f6f100e34d479b1985268525e32a91c953e","quantity":20000,"tx_index":11}',0,'DEBIT');
-INSERT INTO messages VALUES(77,310010,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"XCP","block_index":310010,"calling_function":"dividend","event":"8606cbcb3aaa438e207e9ef279191f6f100e34d479b1985268525e32a91c953e","quantity":420800,"tx_index":11}',0,'CREDIT');
-INSERT INTO messages VALUES(78,310010,'insert','dividends','{"asset":"BBBC","block_index":310010,"dividend_asset":"XCP","fee_paid":20000,"quantity_per_unit":800,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"8606cbcb3aaa438e207e9ef279191f6f100e34d479b1985268525e32a91c953e","tx_index":11}',0,'ASSET_DIVIDEND');
-INSERT INTO messages VALUES(79,310010,'parse','transactions','{"supported":true,"tx_hash":"8606cbcb3aaa438e207e9ef279191f6f100e34d479b1985268525e32a91c953e","tx_index":11}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(80,310010,'parse','blocks','{"block_index":310010,"ledger_hash":"03be7c3d8dc521277625164e3e828be106672cba205129c014ce7771a3b8730f","messages_hash":"3d53dacffbd01aea7f6de2017803318dd4f2e3dd68c172d073608c058c185089","txlist_hash":"5def9d6ed9fcf82c7ec9dbc2247657f349ec4df0b75dac4444f7ff90e24f0955"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(81,310010,'insert','blocks','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(82,310011,'insert','transactions','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"btc_amount":0,"data":"0000001e52bb3300405900000000000005f5e0ff09556e69742054657374","destination":"","fee":6800,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"47a25bd63a47c61ca2709279bb5c1dc8695f0e93926bf659038be64e6a1c4060","tx_index":12}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(83,310011,'insert','broadcasts','{"block_index":310011,"fee_fraction_int":99999999,"locked":false,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","text":"Unit Test","timestamp":1388000000,"tx_hash":"47a25bd63a47c61ca2709279bb5c1dc8695f0e93926bf659038be64e6a1c4060","tx_index":12,"value":100.0}',0,'BROADCAST');
-INSERT INTO messages VALUES(84,310011,'parse','transactions','{"supported":true,"tx_hash":"47a25bd63a47c61ca2709279bb5c1dc8695f0e93926bf659038be64e6a1c4060","tx_index":12}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(85,310011,'parse','blocks','{"block_index":310011,"ledger_hash":"db6d49ef7cfb461f9431b2e712f694f0747012ae28f3684e0d41476f77fab667","messages_hash":"7ecbc512ec95ddd61fcdc326dd0a773a627a329892228506a957c54bf3bf6a9e","txlist_hash":"f6d1a346abbb2adae7dd7fe6ddd94061bcdae3ed30bd091958d445c8b5f57f4c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(86,310011,'insert','blocks','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(87,310012,'insert','transactions','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"btc_amount":1000,"data":"00000028000052bb33640000000002faf08000000000017d7840000000000000000000003b100000000a","destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"5c49e06f8ddf9cc0f83541550664bb00075a2f01df493278097066462497af16","tx_index":13}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(88,310012,'insert','debits','{"action":"bet","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310012,"event":"5c49e06f8ddf9cc0f83541550664bb00075a2f01df493278097066462497af16","quantity":50000000,"tx_index":13}',0,'DEBIT');
-INSERT INTO messages VALUES(89,310012,'insert','bets','{"bet_type":0,"block_index":310012,"counterwager_quantity":25000000,"counterwager_remaining":25000000,"deadline":1388000100,"expiration":10,"expire_index":310022,"fee_fraction_int":99999999.0,"feed_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":15120,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":0.0,"tx_hash":"5c49e06f8ddf9cc0f83541550664bb00075a2f01df493278097066462497af16","tx_index":13,"wager_quantity":50000000,"wager_remaining":50000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(90,310012,'parse','transactions','{"supported":true,"tx_hash":"5c49e06f8ddf9cc0f83541550664bb00075a2f01df493278097066462497af16","tx_index":13}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(91,310012,'parse','blocks','{"block_index":310012,"ledger_hash":"ac399d193def488d3457876edef42dd651b30c976025c3d6f810e4d37c88c822","messages_hash":"9c6c273607bbb6fed258f56ebdf7090ee5a5d45fa7e6736a34197663771cc343","txlist_hash":"273ce70d30b249ba5afb8382ddf7ded2d0849044d519fb48224a6ea69b7ba6dc"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(92,310012,'insert','blocks','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(93,310013,'insert','transactions','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"btc_amount":1000,"data":"00000028000152bb336400000000017d78400000000002793d60000000000000000000003b100000000a","destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"813e45480753e39c6ea548efd6b77f830120a41ac3b9bd37a4470b14e83301a3","tx_index":14}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(94,310013,'update','orders','{"status":"expired","tx_hash":"1385519ca199f1b39bb89caac062fe3a342f18e393d301d7a56c150a8ab84093"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(95,310013,'insert','order_expirations','{"block_index":310013,"order_hash":"1385519ca199f1b39bb89caac062fe3a342f18e393d301d7a56c150a8ab84093","source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3"}',0,'ORDER_EXPIRATION');
-INSERT INTO messages VALUES(96,310013,'insert','debits','{"action":"bet","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310013,"event":"813e45480753e39c6ea548efd6b77f830120a41ac3b9bd37a4470b14e83301a3","quantity":25000000,"tx_index":14}',0,'DEBIT');
-INSERT INTO messages VALUES(97,310013,'insert','bets','{"bet_type":1,"block_index":310013,"counterwager_quantity":41500000,"counterwager_remaining":41500000,"deadline":1388000100,"expiration":10,"expire_index":310023,"fee_fraction_int":99999999.0,"feed_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":15120,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":0.0,"tx_hash":"813e45480753e39c6ea548efd6b77f830120a41ac3b9bd37a4470b14e83301a3","tx_index":14,"wager_quantity":25000000,"wager_remaining":25000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(98,310013,'update','bets','{"counterwager_remaining":4250000,"status":"open","tx_hash":"5c49e06f8ddf9cc0f83541550664bb00075a2f01df493278097066462497af16","wager_remaining":8500000}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(99,310013,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310013,"calling_function":"filled","event":"813e45480753e39c6ea548efd6b77f830120a41ac3b9bd37a4470b14e83301a3","quantity":4250000,"tx_index":14}',0,'CREDIT');
-INSERT INTO messages VALUES(100,310013,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"813e45480753e39c6ea548efd6b77f830120a41ac3b9bd37a4470b14e83301a3","wager_remaining":4250000}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(101,310013,'insert','bet_matches','{"backward_quantity":20750000,"block_index":310012,"deadline":1388000100,"fee_fraction_int":99999999,"feed_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","forward_quantity":41500000,"id":"5c49e06f8ddf9cc0f83541550664bb00075a2f01df493278097066462497af16_813e45480753e39c6ea548efd6b77f830120a41ac3b9bd37a4470b14e83301a3","initial_value":100.0,"leverage":15120,"match_expire_index":310022,"status":"pending","target_value":0.0,"tx0_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx0_bet_type":0,"tx0_block_index":310012,"tx0_expiration":10,"tx0_hash":"5c49e06f8ddf9cc0f83541550664bb00075a2f01df493278097066462497af16","tx0_index":13,"tx1_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx1_bet_type":1,"tx1_block_index":310013,"tx1_expiration":10,"tx1_hash":"813e45480753e39c6ea548efd6b77f830120a41ac3b9bd37a4470b14e83301a3","tx1_index":14}',0,'BET_MATCH');
-INSERT INTO messages VALUES(102,310013,'parse','transactions','{"supported":true,"tx_hash":"813e45480753e39c6ea548efd6b77f830120a41ac3b9bd37a4470b14e83301a3","tx_index":14}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(103,310013,'parse','blocks','{"block_index":310013,"ledger_hash":"f6fd6f6280b1c580abe8e31de28bfa0f269d453068946733cad69d29f6874936","messages_hash":"d31725c5efb73972745475a8c76fa70e0780d81ab89ecd2cbd38c1e2dc128e21","txlist_hash":"ce4d93afd619a9f22326d72b5ae6c10b24d3075399374184463f65d489a57c51"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(104,310013,'insert','blocks','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(105,310014,'insert','transactions','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"btc_amount":1000,"data":"00000028000052bb33640000000008f0d1800000000014dc93800000000000000000000013b00000000a","destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"33fdca6b108f99ffb56d590f55f9d19c7d16fe83c096b9fbbf71eabeda826a41","tx_index":15}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(106,310014,'update','orders','{"status":"expired","tx_hash":"a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(107,310014,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310014,"calling_function":"cancel order","event":"a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e","quantity":5000000,"tx_index":0}',0,'CREDIT');
-INSERT INTO messages VALUES(108,310014,'insert','order_expirations','{"block_index":310014,"order_hash":"a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e","source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3"}',0,'ORDER_EXPIRATION');
-INSERT INTO messages VALUES(109,310014,'insert','debits','{"action":"bet","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310014,"event":"33fdca6b108f99ffb56d590f55f9d19c7d16fe83c096b9fbbf71eabeda826a41","quantity":150000000,"tx_index":15}',0,'DEBIT');
-INSERT INTO messages VALUES(110,310014,'insert','bets','{"bet_type":0,"block_index":310014,"counterwager_quantity":350000000,"counterwager_remaining":350000000,"deadline":1388000100,"expiration":10,"expire_index":310024,"fee_fraction_int":99999999.0,"feed_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":5040,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":0.0,"tx_hash":"33fdca6b108f99ffb56d590f55f9d19c7d16fe83c096b9fbbf71eabeda826a41","tx_index":15,"wager_quantity":150000000,"wager_remaining":150000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(111,310014,'parse','transactions','{"supported":true,"tx_hash":"33fdca6b108f99ffb56d590f55f9d19c7d16fe83c096b9fbbf71eabeda826a41","tx_index":15}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(112,310014,'parse','blocks','{"block_index":310014,"ledger_hash":"0c52d56c6f7c25da7b757aba30e890e9eff402155b5497a5420e13e69b7cb54b","messages_hash":"b20b444de969c080c6a742769b8fc09fb899f7a962d04930fdb1eb91f2a8565b","txlist_hash":"7df6ac77f91e828339a1f92ce8197c74ff120f6c00d180bdb19a91f7da14a83a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(113,310014,'insert','blocks','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(114,310015,'insert','transactions','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"btc_amount":1000,"data":"00000028000152bb33640000000014dc93800000000008f0d1800000000000000000000013b00000000a","destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"22375d61ad5cb70e45ca8843ccffa0abe11b028351352d5da874d246c834ab6f","tx_index":16}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(115,310015,'insert','debits','{"action":"bet","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310015,"event":"22375d61ad5cb70e45ca8843ccffa0abe11b028351352d5da874d246c834ab6f","quantity":350000000,"tx_index":16}',0,'DEBIT');
-INSERT INTO messages VALUES(116,310015,'insert','bets','{"bet_type":1,"block_index":310015,"counterwager_quantity":150000000,"counterwager_remaining":150000000,"deadline":1388000100,"expiration":10,"expire_index":310025,"fee_fraction_int":99999999.0,"feed_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":5040,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":0.0,"tx_hash":"22375d61ad5cb70e45ca8843ccffa0abe11b028351352d5da874d246c834ab6f","tx_index":16,"wager_quantity":350000000,"wager_remaining":350000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(117,310015,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310015,"calling_function":"filled","event":"22375d61ad5cb70e45ca8843ccffa0abe11b028351352d5da874d246c834ab6f","quantity":0,"tx_index":16}',0,'CREDIT');
-INSERT INTO messages VALUES(118,310015,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"33fdca6b108f99ffb56d590f55f9d19c7d16fe83c096b9fbbf71eabeda826a41","wager_remaining":0}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(119,310015,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310015,"calling_function":"filled","event":"22375d61ad5cb70e45ca8843ccffa0abe11b028351352d5da874d246c834ab6f","quantity":0,"tx_index":16}',0,'CREDIT');
-INSERT INTO messages VALUES(120,310015,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"22375d61ad5cb70e45ca8843ccffa0abe11b028351352d5da874d246c834ab6f","wager_remaining":0}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(121,310015,'insert','bet_matches','{"backward_quantity":350000000,"block_index":310014,"deadline":1388000100,"fee_fraction_int":99999999,"feed_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","forward_quantity":150000000,"id":"33fdca6b108f99ffb56d590f55f9d19c7d16fe83c096b9fbbf71eabeda826a41_22375d61ad5cb70e45ca8843ccffa0abe11b028351352d5da874d246c834ab6f","initial_value":100.0,"leverage":5040,"match_expire_index":310024,"status":"pending","target_value":0.0,"tx0_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx0_bet_type":0,"tx0_block_index":310014,"tx0_expiration":10,"tx0_hash":"33fdca6b108f99ffb56d590f55f9d19c7d16fe83c096b9fbbf71eabeda826a41","tx0_index":15,"tx1_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx1_bet_type":1,"tx1_block_index":310015,"tx1_expiration":10,"tx1_hash":"22375d61ad5cb70e45ca8843ccffa0abe11b028351352d5da874d246c834ab6f","tx1_index":16}',0,'BET_MATCH');
-INSERT INTO messages VALUES(122,310015,'parse','transactions','{"supported":true,"tx_hash":"22375d61ad5cb70e45ca8843ccffa0abe11b028351352d5da874d246c834ab6f","tx_index":16}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(123,310015,'parse','blocks','{"block_index":310015,"ledger_hash":"03cd020f708d5f082f5b63e3c1f58e5f25d564a60699ae0f23471115d9e37d5e","messages_hash":"d8c072c161c3ba901c9d2b06221e5e36b47cc66cf910dabc2aa7d75927ad0c9d","txlist_hash":"45379e27de14058cb9100cc29417da1e5b2534e4434bfcd074c811324e46fd06"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(124,310015,'insert','blocks','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(125,310016,'insert','transactions','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"btc_amount":1000,"data":"00000028000252bb33c8000000002cb417800000000026be36803ff0000000000000000013b00000000a","destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"5e0cd8d81531e656dc3a4ae4b7edfd1bec48e455ed0bd69a4a3c22c0c08bbede","tx_index":17}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(126,310016,'insert','debits','{"action":"bet","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310016,"event":"5e0cd8d81531e656dc3a4ae4b7edfd1bec48e455ed0bd69a4a3c22c0c08bbede","quantity":750000000,"tx_index":17}',0,'DEBIT');
-INSERT INTO messages VALUES(127,310016,'insert','bets','{"bet_type":2,"block_index":310016,"counterwager_quantity":650000000,"counterwager_remaining":650000000,"deadline":1388000200,"expiration":10,"expire_index":310026,"fee_fraction_int":99999999.0,"feed_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":5040,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":1.0,"tx_hash":"5e0cd8d81531e656dc3a4ae4b7edfd1bec48e455ed0bd69a4a3c22c0c08bbede","tx_index":17,"wager_quantity":750000000,"wager_remaining":750000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(128,310016,'parse','transactions','{"supported":true,"tx_hash":"5e0cd8d81531e656dc3a4ae4b7edfd1bec48e455ed0bd69a4a3c22c0c08bbede","tx_index":17}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(129,310016,'parse','blocks','{"block_index":310016,"ledger_hash":"d95cf7b2af3f578fc64450d484323075e81999a868918d3dbf89160269d68980","messages_hash":"684fde58a199a4d55bc79612e1f970b2b6b819a513762defdd2629c99fe494a1","txlist_hash":"92ed43fd80e4e254ebff7dc725c32962beb79be51dfe8d62d12bd8e123320532"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(130,310016,'insert','blocks','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(131,310017,'insert','transactions','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"btc_amount":1000,"data":"00000028000352bb33c80000000026be3680000000002cb417803ff0000000000000000013b00000000a","destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"07d3cbac831b5edb261b1445071e307949d7825565b8d5c8cba1d720d5c7ab4a","tx_index":18}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(132,310017,'insert','debits','{"action":"bet","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310017,"event":"07d3cbac831b5edb261b1445071e307949d7825565b8d5c8cba1d720d5c7ab4a","quantity":650000000,"tx_index":18}',0,'DEBIT');
-INSERT INTO messages VALUES(133,310017,'insert','bets','{"bet_type":3,"block_index":310017,"counterwager_quantity":750000000,"counterwager_remaining":750000000,"deadline":1388000200,"expiration":10,"expire_index":310027,"fee_fraction_int":99999999.0,"feed_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":5040,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":1.0,"tx_hash":"07d3cbac831b5edb261b1445071e307949d7825565b8d5c8cba1d720d5c7ab4a","tx_index":18,"wager_quantity":650000000,"wager_remaining":650000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(134,310017,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310017,"calling_function":"filled","event":"07d3cbac831b5edb261b1445071e307949d7825565b8d5c8cba1d720d5c7ab4a","quantity":0,"tx_index":18}',0,'CREDIT');
-INSERT INTO messages VALUES(135,310017,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"5e0cd8d81531e656dc3a4ae4b7edfd1bec48e455ed0bd69a4a3c22c0c08bbede","wager_remaining":0}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(136,310017,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310017,"calling_function":"filled","event":"07d3cbac831b5edb261b1445071e307949d7825565b8d5c8cba1d720d5c7ab4a","quantity":0,"tx_index":18}',0,'CREDIT');
-INSERT INTO messages VALUES(137,310017,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"07d3cbac831b5edb261b1445071e307949d7825565b8d5c8cba1d720d5c7ab4a","wager_remaining":0}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(138,310017,'insert','bet_matches','{"backward_quantity":650000000,"block_index":310016,"deadline":1388000200,"fee_fraction_int":99999999,"feed_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","forward_quantity":750000000,"id":"5e0cd8d81531e656dc3a4ae4b7edfd1bec48e455ed0bd69a4a3c22c0c08bbede_07d3cbac831b5edb261b1445071e307949d7825565b8d5c8cba1d720d5c7ab4a","initial_value":100.0,"leverage":5040,"match_expire_index":310026,"status":"pending","target_value":1.0,"tx0_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx0_bet_type":2,"tx0_block_index":310016,"tx0_expiration":10,"tx0_hash":"5e0cd8d81531e656dc3a4ae4b7edfd1bec48e455ed0bd69a4a3c22c0c08bbede","tx0_index":17,"tx1_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx1_bet_type":3,"tx1_block_index":310017,"tx1_expiration":10,"tx1_hash":"07d3cbac831b5edb261b1445071e307949d7825565b8d5c8cba1d720d5c7ab4a","tx1_index":18}',0,'BET_MATCH');
-INSERT INTO messages VALUES(139,310017,'parse','transactions','{"supported":true,"tx_hash":"07d3cbac831b5edb261b1445071e307949d7825565b8d5c8cba1d720d5c7ab4a","tx_index":18}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(140,310017,'parse','blocks','{"block_index":310017,"ledger_hash":"725783dab777f54b11be66fdf47280852fd6b4d8a9b9f2fbba9e92056538ce73","messages_hash":"141e4de5d1572c6001982c0d980d2276a7b805bc6e95b8520cd66edf8a97b593","txlist_hash":"f21d857139bdc083724362346aeaa455f82caf0fdf13f2ca880db6dbc6e047b2"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(141,310017,'insert','blocks','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(142,310018,'insert','transactions','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"btc_amount":0,"data":"0000001e52bb33324058f7256ffc115e004c4b4009556e69742054657374","destination":"","fee":6800,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"5a057227535fcb5aeaf56ec919321667cc45f4fa7d11bf940d22abaad909cd66","tx_index":19}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(143,310018,'insert','broadcasts','{"block_index":310018,"fee_fraction_int":5000000,"locked":false,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","text":"Unit Test","timestamp":1388000050,"tx_hash":"5a057227535fcb5aeaf56ec919321667cc45f4fa7d11bf940d22abaad909cd66","tx_index":19,"value":99.86166}',0,'BROADCAST');
-INSERT INTO messages VALUES(144,310018,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310018,"calling_function":"bet settled: liquidated for bear","event":"5a057227535fcb5aeaf56ec919321667cc45f4fa7d11bf940d22abaad909cd66","quantity":59137500,"tx_index":19}',0,'CREDIT');
-INSERT INTO messages VALUES(145,310018,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310018,"calling_function":"feed fee","event":"5a057227535fcb5aeaf56ec919321667cc45f4fa7d11bf940d22abaad909cd66","quantity":3112500,"tx_index":19}',0,'CREDIT');
-INSERT INTO messages VALUES(146,310018,'insert','bet_match_resolutions','{"bear_credit":59137500,"bet_match_id":"5c49e06f8ddf9cc0f83541550664bb00075a2f01df493278097066462497af16_813e45480753e39c6ea548efd6b77f830120a41ac3b9bd37a4470b14e83301a3","bet_match_type_id":1,"block_index":310018,"bull_credit":0,"escrow_less_fee":null,"fee":3112500,"settled":false,"winner":null}',0,'BET_MATCH_RESOLUTON');
-INSERT INTO messages VALUES(147,310018,'update','bet_matches','{"id":"5c49e06f8ddf9cc0f83541550664bb00075a2f01df493278097066462497af16_813e45480753e39c6ea548efd6b77f830120a41ac3b9bd37a4470b14e83301a3","status":"settled: liquidated for bear"}',0,'BET_MATCH_UPDATE');
-INSERT INTO messages VALUES(148,310018,'parse','transactions','{"supported":true,"tx_hash":"5a057227535fcb5aeaf56ec919321667cc45f4fa7d11bf940d22abaad909cd66","tx_index":19}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(149,310018,'parse','blocks','{"block_index":310018,"ledger_hash":"05ad248fa836b50ce72a2f61c7465a455cc48ac92f2c0ff9bb9f94e69081d1e7","messages_hash":"502d5a096e80766d8d947d832fb1e88e57357b2feaae0912ec783ce3147a85b1","txlist_hash":"3e8a8361086aee82a316c2a041d8f4e1d7b4000c3e18263ca84a3267a811ee7d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(150,310018,'insert','blocks','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(151,310019,'insert','transactions','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"btc_amount":0,"data":"0000001e52bb3365405915f3b645a1cb004c4b4009556e69742054657374","destination":"","fee":6800,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"0baab7280b14d7d8597dc5f570682654fac0453b0b4c374d45cef3d21a7ceb17","tx_index":20}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(152,310019,'insert','broadcasts','{"block_index":310019,"fee_fraction_int":5000000,"locked":false,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","text":"Unit Test","timestamp":1388000101,"tx_hash":"0baab7280b14d7d8597dc5f570682654fac0453b0b4c374d45cef3d21a7ceb17","tx_index":20,"value":100.343}',0,'BROADCAST');
-INSERT INTO messages VALUES(153,310019,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310019,"calling_function":"bet settled","event":"0baab7280b14d7d8597dc5f570682654fac0453b0b4c374d45cef3d21a7ceb17","quantity":159300000,"tx_index":20}',0,'CREDIT');
-INSERT INTO messages VALUES(154,310019,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310019,"calling_function":"bet settled","event":"0baab7280b14d7d8597dc5f570682654fac0453b0b4c374d45cef3d21a7ceb17","quantity":315700000,"tx_index":20}',0,'CREDIT');
-INSERT INTO messages VALUES(155,310019,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310019,"calling_function":"feed fee","event":"0baab7280b14d7d8597dc5f570682654fac0453b0b4c374d45cef3d21a7ceb17","quantity":25000000,"tx_index":20}',0,'CREDIT');
-INSERT INTO messages VALUES(156,310019,'insert','bet_match_resolutions','{"bear_credit":315700000,"bet_match_id":"33fdca6b108f99ffb56d590f55f9d19c7d16fe83c096b9fbbf71eabeda826a41_22375d61ad5cb70e45ca8843ccffa0abe11b028351352d5da874d246c834ab6f","bet_match_type_id":1,"block_index":310019,"bull_credit":159300000,"escrow_less_fee":null,"fee":25000000,"settled":true,"winner":null}',0,'BET_MATCH_RESOLUTON');
-INSERT INTO messages VALUES(157,310019,'update','bet_matches','{"id":"33fdca6b108f99ffb56d590f55f9d19c7d16fe83c096b9fbbf71eabeda826a41_22375d61ad5cb70e45ca8843ccffa0abe11b028351352d5da874d246c834ab6f","status":"settled"}',0,'BET_MATCH_UPDATE');
-INSERT INTO messages VALUES(158,310019,'parse','transactions','{"supported":true,"tx_hash":"0baab7280b14d7d8597dc5f570682654fac0453b0b4c374d45cef3d21a7ceb17","tx_index":20}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(159,310019,'parse','blocks','{"block_index":310019,"ledger_hash":"0ab8707bce7b77beecc32ad6124482cb561776ed245ce6dce08f5318e2cf396f","messages_hash":"445f1951bd294004e2343cfc7561599bcf0488901a051e4c2cf5dee8f4474eb6","txlist_hash":"d66ff9e099bc707b866c2595b0bb642657601a36ab06cafa070f18e9f3ad30e3"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(160,310019,'insert','blocks','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(161,310020,'insert','transactions','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"btc_amount":0,"data":"0000001e52bb33c94000000000000000004c4b4009556e69742054657374","destination":"","fee":6800,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"2b39f99114417cb4857c8c2c671b4bc3bc8b3e52865daa91a49ea6d9bdfb6402","tx_index":21}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(162,310020,'insert','broadcasts','{"block_index":310020,"fee_fraction_int":5000000,"locked":false,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","text":"Unit Test","timestamp":1388000201,"tx_hash":"2b39f99114417cb4857c8c2c671b4bc3bc8b3e52865daa91a49ea6d9bdfb6402","tx_index":21,"value":2.0}',0,'BROADCAST');
-INSERT INTO messages VALUES(163,310020,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310020,"calling_function":"bet settled: for notequal","event":"2b39f99114417cb4857c8c2c671b4bc3bc8b3e52865daa91a49ea6d9bdfb6402","quantity":1330000000,"tx_index":21}',0,'CREDIT');
-INSERT INTO messages VALUES(164,310020,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310020,"calling_function":"feed fee","event":"2b39f99114417cb4857c8c2c671b4bc3bc8b3e52865daa91a49ea6d9bdfb6402","quantity":70000000,"tx_index":21}',0,'CREDIT');
-INSERT INTO messages VALUES(165,310020,'insert','bet_match_resolutions','{"bear_credit":null,"bet_match_id":"5e0cd8d81531e656dc3a4ae4b7edfd1bec48e455ed0bd69a4a3c22c0c08bbede_07d3cbac831b5edb261b1445071e307949d7825565b8d5c8cba1d720d5c7ab4a","bet_match_type_id":5,"block_index":310020,"bull_credit":null,"escrow_less_fee":1330000000,"fee":70000000,"settled":null,"winner":"NotEqual"}',0,'BET_MATCH_RESOLUTON');
-INSERT INTO messages VALUES(166,310020,'update','bet_matches','{"id":"5e0cd8d81531e656dc3a4ae4b7edfd1bec48e455ed0bd69a4a3c22c0c08bbede_07d3cbac831b5edb261b1445071e307949d7825565b8d5c8cba1d720d5c7ab4a","status":"settled: for notequal"}',0,'BET_MATCH_UPDATE');
-INSERT INTO messages VALUES(167,310020,'parse','transactions','{"supported":true,"tx_hash":"2b39f99114417cb4857c8c2c671b4bc3bc8b3e52865daa91a49ea6d9bdfb6402","tx_index":21}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(168,310020,'parse','blocks','{"block_index":310020,"ledger_hash":"198edc4bf109549538a2f8f96714536a99a1568fe16fe4254881520474adc68d","messages_hash":"ff432d16380c967282cd5222c8626af85bacf13e3d85aef97b632192956598c1","txlist_hash":"3bd8ef01a2be7a5d817b535f19e456325bcf2d684ac25f09124d4582040fde54"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(169,310020,'insert','blocks','{"block_hash":"7c2460bb32c5749c856486393239bf7a0ac789587ac71f32e7237910da8097f2","block_index":310021,"block_time":310021000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(170,310021,'insert','transactions','{"block_hash":"7c2460bb32c5749c856486393239bf7a0ac789587ac71f32e7237910da8097f2","block_index":310021,"block_time":310021000,"btc_amount":0,"data":"0000000a00000000000047670000000002faf08000000000000000010000000002faf080000a0000000000000000","destination":"","fee":6800,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"19c6fe5cbf0be99ff3d469077e866e0f9fdc56901824b7fec89b0b523526e323","tx_index":22}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(171,310021,'insert','debits','{"action":"open order","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBB","block_index":310021,"event":"19c6fe5cbf0be99ff3d469077e866e0f9fdc56901824b7fec89b0b523526e323","quantity":50000000,"tx_index":22}',0,'DEBIT');
-INSERT INTO messages VALUES(172,310021,'insert','orders','{"block_index":310021,"expiration":10,"expire_index":310031,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":50000000,"get_remaining":50000000,"give_asset":"BBBB","give_quantity":50000000,"give_remaining":50000000,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","tx_hash":"19c6fe5cbf0be99ff3d469077e866e0f9fdc56901824b7fec89b0b523526e323","tx_index":22}',0,'OPEN_ORDER');
-INSERT INTO messages VALUES(173,310021,'parse','transactions','{"supported":true,"tx_hash":"19c6fe5cbf0be99ff3d469077e866e0f9fdc56901824b7fec89b0b523526e323","tx_index":22}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(174,310021,'parse','blocks','{"block_index":310021,"ledger_hash":"52482033c5c11ad24257707137b090606305497618e29050b2fdd3e13bc822ce","messages_hash":"20a39f221845b6f4e0eaa1ad4bc3a6e735d487cd6fba54ed30714d93ceededdd","txlist_hash":"7d74bbdb4057dc5d0e9b568e983df362b87bdacdddf2724b1ee4c42b6602bd47"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(175,310021,'insert','blocks','{"block_hash":"44435f9a99a0aa12a9bfabdc4cb8119f6ea6a6e1350d2d65445fb66a456db5fc","block_index":310022,"block_time":310022000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(176,310022,'insert','transactions','{"block_hash":"44435f9a99a0aa12a9bfabdc4cb8119f6ea6a6e1350d2d65445fb66a456db5fc","block_index":310022,"block_time":310022000,"btc_amount":100000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"3739350ed4c86474468cb1fed825b1ef141304d638b298867d0b2ae58c509c22","tx_index":23}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(177,310022,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310022,"calling_function":"burn","event":"3739350ed4c86474468cb1fed825b1ef141304d638b298867d0b2ae58c509c22","quantity":56999887262,"tx_index":23}',0,'CREDIT');
-INSERT INTO messages VALUES(178,310022,'insert','burns','{"block_index":310022,"burned":38000000,"earned":56999887262,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"3739350ed4c86474468cb1fed825b1ef141304d638b298867d0b2ae58c509c22","tx_index":23}',0,'BURN');
-INSERT INTO messages VALUES(179,310022,'parse','blocks','{"block_index":310022,"ledger_hash":"85d639cc8147885470da26d3c0470dba0eb8b6870d5941b12bcc4afb8fcd9af1","messages_hash":"a5a389ccb25f814327dbdf5f424767cbb80be0d0c05d0e7752d3fbe6164f071f","txlist_hash":"568bbeb4d12090c110442540d6f12734602dcf84ae5e331f0391a4a47857d059"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(180,310022,'insert','blocks','{"block_hash":"d8cf5bec1bbcab8ca4f495352afde3b6572b7e1d61b3976872ebb8e9d30ccb08","block_index":310023,"block_time":310023000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(181,310023,'insert','transactions','{"block_hash":"d8cf5bec1bbcab8ca4f495352afde3b6572b7e1d61b3976872ebb8e9d30ccb08","block_index":310023,"block_time":310023000,"btc_amount":1000,"data":"0000000000000000000047680000000000002710","destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","fee":7650,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"72bd448eb70da9b7554d3b58a1e89356171578c847763af014b25c99e70cbb58","tx_index":24}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(182,310023,'update','bets','{"status":"expired","tx_hash":"5c49e06f8ddf9cc0f83541550664bb00075a2f01df493278097066462497af16"}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(183,310023,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310023,"calling_function":"recredit wager remaining","event":"5c49e06f8ddf9cc0f83541550664bb00075a2f01df493278097066462497af16","quantity":8500000,"tx_index":0}',0,'CREDIT');
-INSERT INTO messages VALUES(184,310023,'insert','bet_expirations','{"bet_hash":"5c49e06f8ddf9cc0f83541550664bb00075a2f01df493278097066462497af16","bet_index":13,"block_index":310023,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3"}',0,'BET_EXPIRATION');
-INSERT INTO messages VALUES(185,310023,'insert','debits','{"action":"send","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBC","block_index":310023,"event":"72bd448eb70da9b7554d3b58a1e89356171578c847763af014b25c99e70cbb58","quantity":10000,"tx_index":24}',0,'DEBIT');
-INSERT INTO messages VALUES(186,310023,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"BBBC","block_index":310023,"calling_function":"send","event":"72bd448eb70da9b7554d3b58a1e89356171578c847763af014b25c99e70cbb58","quantity":10000,"tx_index":24}',0,'CREDIT');
-INSERT INTO messages VALUES(187,310023,'insert','sends','{"asset":"BBBC","block_index":310023,"destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","quantity":10000,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"72bd448eb70da9b7554d3b58a1e89356171578c847763af014b25c99e70cbb58","tx_index":24}',0,'SEND');
-INSERT INTO messages VALUES(188,310023,'parse','transactions','{"supported":true,"tx_hash":"72bd448eb70da9b7554d3b58a1e89356171578c847763af014b25c99e70cbb58","tx_index":24}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(189,310023,'parse','blocks','{"block_index":310023,"ledger_hash":"eb62ce47d68491a84b9a29b92db2742021881f0274072f1bc39dfef08cd7a590","messages_hash":"7076a1e5280056ffbed986360f5e6985ef94abce4aed7cf01c3625ddb9c8e6f7","txlist_hash":"877a4d466f5f780e8103a42fb7771935ef57486ed7d74aa77757b9cb434893b3"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(190,310023,'insert','blocks','{"block_hash":"b03042b4e18a222b4c8d1e9e1970d93e6e2a2d41686d227ff8ecf0a839223dc5","block_index":310024,"block_time":310024000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(191,310024,'parse','blocks','{"block_index":310024,"ledger_hash":"45e73afbc34855b5cbd342a6fb77545e01f3ff4601a04c6dd25dff665aeff484","messages_hash":"c00cc576f5d36432e15347902f18fccb316e0222d3890019d1ee381bb7936b63","txlist_hash":"b16082c8d932618c9bd89f7b8d6372190cab18b274ed8dbc1b4f04e5edc2bdbf"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(192,310024,'insert','blocks','{"block_hash":"a872e560766832cc3b4f7f222228cb6db882ce3c54f6459f62c71d5cd6e90666","block_index":310025,"block_time":310025000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(193,310025,'parse','blocks','{"block_index":310025,"ledger_hash":"714702b25559325c7bacffdf28e0af30c47bf48e6b4fda053c21ea31c7604128","messages_hash":"801eb76b5da9f7d5c76f0bb146caaa3fd6b6dbfdbbd244d6fc9ae5befef65527","txlist_hash":"391a822509e48a899634f3b8a6b0c99fd298eefd97230b401b40c301dd7e6052"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(194,310025,'insert','blocks','{"block_hash":"6c96350f6f2f05810f19a689de235eff975338587194a36a70dfd0fcd490941a","block_index":310026,"block_time":310026000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(195,310026,'parse','blocks','{"block_index":310026,"ledger_hash":"b305741a1e277ba0ce8436b914784ea0156616ac308282a7f29dbca62a54cc82","messages_hash":"c548b86b7154b71f57f48a7ca09daf1c4a85238e447c78027e00e2da8f47684e","txlist_hash":"16c8d91265aaface472342f436e376984d576675529de1f58a188f994375dea0"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(196,310026,'insert','blocks','{"block_hash":"d7acfac66df393c4482a14c189742c0571b89442eb7f817b34415a560445699e","block_index":310027,"block_time":310027000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(197,310027,'parse','blocks','{"block_index":310027,"ledger_hash":"1f833f7396917e02b4b65b0a05d19754b6a53b030b659514d0c21cad062d45f9","messages_hash":"207882040c07bf4f53de0d18b2cf8195a8eae75423aee1b9c091cea5ce3b3d27","txlist_hash":"d7a61a46b4f6da78607245b9fdd4e0b1d7499b5687805939342a431ef570711d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(198,310027,'insert','blocks','{"block_hash":"02409fcf8fa06dafcb7f11e38593181d9c42cc9d5e2ddc304d098f990bd9530b","block_index":310028,"block_time":310028000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(199,310028,'parse','blocks','{"block_index":310028,"ledger_hash":"47b38906beda7ad735a86b9fd63669b0357b7ae0a0c1a54c9827bc8b90185626","messages_hash":"822023de35329c7abf80e0bfb4982def648716fe0d577705aff5b9f4e7de4440","txlist_hash":"a8a0b67ddb47a15f89fd14f227e118bd374dde04f4bce3205d5ee07a8c7509d7"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(200,310028,'insert','blocks','{"block_hash":"3c739fa8b40c118d5547ea356ee8d10ee2898871907643ec02e5db9d00f03cc6","block_index":310029,"block_time":310029000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(201,310029,'parse','blocks','{"block_index":310029,"ledger_hash":"e69f6c9b649ac04920be70f9b076f7909bcebd8312afa715be3d8922794a72e7","messages_hash":"fe7adc1d1add270a2a72656e295146d97f02906127422a837a999878783f7e54","txlist_hash":"355199be765ee2db25308e58d6cdfd22c6941a296b51800e8f937cea1afedbdf"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(202,310029,'insert','blocks','{"block_hash":"d5071cddedf89765ee0fd58f209c1c7d669ba8ea66200a57587da8b189b9e4f5","block_index":310030,"block_time":310030000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(203,310030,'parse','blocks','{"block_index":310030,"ledger_hash":"c51828b04433b000787c92eaa7e5abd5cc0bc31c619cb8479aff675af6e00c55","messages_hash":"c6b5b98f91407d3fe485e52acccc248f30baa792a5fa385eb6568c9531a1d9f4","txlist_hash":"b4bb7325ae90ccf0095b0970cb4828c98915a2e6694723ca8af1e9f77523d540"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(204,310030,'insert','blocks','{"block_hash":"0b02b10f41380fff27c543ea8891ecb845bf7a003ac5c87e15932aff3bfcf689","block_index":310031,"block_time":310031000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(205,310031,'parse','blocks','{"block_index":310031,"ledger_hash":"26d91568af76b5ad4b357693ecb0b9341aabbf5de5d5c83f9998dc2f95d76e5e","messages_hash":"3628978fba600403d80a4664c770a72885e2a071bb6fcbcc6123870602c6b3a9","txlist_hash":"b13328f7f6011c05736a1c728af4726f63f557ae1eafab7d70b6b7fd60025616"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(206,310031,'insert','blocks','{"block_hash":"66346be81e6ba04544f2ae643b76c2b7b1383f038fc2636e02e49dc7ec144074","block_index":310032,"block_time":310032000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(207,310032,'update','orders','{"status":"expired","tx_hash":"19c6fe5cbf0be99ff3d469077e866e0f9fdc56901824b7fec89b0b523526e323"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(208,310032,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBB","block_index":310032,"calling_function":"cancel order","event":"19c6fe5cbf0be99ff3d469077e866e0f9fdc56901824b7fec89b0b523526e323","quantity":50000000,"tx_index":0}',0,'CREDIT');
-INSERT INTO messages VALUES(209,310032,'insert','order_expirations','{"block_index":310032,"order_hash":"19c6fe5cbf0be99ff3d469077e866e0f9fdc56901824b7fec89b0b523526e323","source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3"}',0,'ORDER_EXPIRATION');
-INSERT INTO messages VALUES(210,310032,'parse','blocks','{"block_index":310032,"ledger_hash":"21f8da71c386ec1e5e31a35c1190b895f2df52529ea028d5fba25e0d57616952","messages_hash":"904c8038bf8b7f23c529b8df31b2f8c19713fd76de70d62d87435402068957ff","txlist_hash":"80980b4466ca949fa21a42ffb8c22a2f5853722c4fa02bf0cb962e97365384f1"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(211,310032,'insert','blocks','{"block_hash":"999c65df9661f73e8c01f1da1afda09ac16788b72834f0ff5ea3d1464afb4707","block_index":310033,"block_time":310033000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(212,310033,'parse','blocks','{"block_index":310033,"ledger_hash":"1c844a38fc28e83406c8019615d0c24a1ea84e6ffe4da392d29f353ca676001b","messages_hash":"0166e273e9fa7ffc4d82e225994c190babf5f835df2b0025c10f6c5ef43799c3","txlist_hash":"0c2f46b4f4d5f345399be6073d2f72bf689f6a3a20e57c41ccd541cc0bae76d3"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(213,310033,'insert','blocks','{"block_hash":"f552edd2e0a648230f3668e72ddf0ddfb1e8ac0f4c190f91b89c1a8c2e357208","block_index":310034,"block_time":310034000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(214,310034,'parse','blocks','{"block_index":310034,"ledger_hash":"0533bc0d3bc008b5d65932c569e9f85e3217ea9efbb8937935be93b7a01ec2a8","messages_hash":"3a3a230f7a95b060a2b17b8482e7d7100c58fcbf490502c90d512a6e02108231","txlist_hash":"9f5f89f0c9821b7de30388b2a0891011612096ac158a70838d4479059a4bfc50"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(215,310034,'insert','blocks','{"block_hash":"a13cbb016f3044207a46967a4ba1c87dab411f78c55c1179f2336653c2726ae2","block_index":310035,"block_time":310035000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(216,310035,'parse','blocks','{"block_index":310035,"ledger_hash":"b5f0b7406fe3b6dbcbb5c3b28fb8fb119e237f07532f500b422058ba898e5b22","messages_hash":"4c78ac34d5f492cc396c93c5fec07d489dce0734a3d660f92ea9d77fdc2d3762","txlist_hash":"5847c5ec7d8ad0e27d47b3b6ff7df903c4a67a269aa248e69ee918062e58976c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(217,310035,'insert','blocks','{"block_hash":"158648a98f1e1bd1875584ce8449eb15a4e91a99a923bbb24c4210135cef0c76","block_index":310036,"block_time":310036000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(218,310036,'parse','blocks','{"block_index":310036,"ledger_hash":"7519ac8cdf4c13b25929d913e3858855aca68bcf3fe6d3636e7371894af27f04","messages_hash":"2bbe9ed724b1fed2ced169ed3c8b73c85e3b907942d63d410034062016d9fde9","txlist_hash":"46fea446096a8d96f1f990374d94405f358ef5a3a8bf09aeba2f76977cf867b0"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(219,310036,'insert','blocks','{"block_hash":"563acfd6d991ce256d5655de2e9429975c8dceeb221e76d5ec6e9e24a2c27c07","block_index":310037,"block_time":310037000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(220,310037,'parse','blocks','{"block_index":310037,"ledger_hash":"f417da67da0c23d4bc44bbb864de5b94057916e28502641ba70764f44165a1fa","messages_hash":"2ca69d6d57ff41bd714ec175e6467480a69e5a62055c216350cce6cbb7d2571d","txlist_hash":"e372a6531d2f206be5cca17be0f42a75e2e6617499a6dec377c274f7738620df"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(221,310037,'insert','blocks','{"block_hash":"b44b4cad12431c32df27940e18d51f63897c7472b70950d18454edfd640490b2","block_index":310038,"block_time":310038000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(222,310038,'parse','blocks','{"block_index":310038,"ledger_hash":"098eb6f2b0a1c584d969167f50bb55383ab71593ed1f0ca61d83c4513a209107","messages_hash":"c015b324f177d23f9dfafef324c000fb4e4397b80e91e663c00b51ce0421d4cf","txlist_hash":"da7704f6d661aa255af6e2d3ad713fbca0a0e6296b16e3a364989bcb5a4e38ba"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(223,310038,'insert','blocks','{"block_hash":"5fa1ae9c5e8a599247458987b006ad3a57f686df1f7cc240bf119e911b56c347","block_index":310039,"block_time":310039000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(224,310039,'parse','blocks','{"block_index":310039,"ledger_hash":"a4aa60a1320e47c975628f6650d8fdc44b6a729d26a3178031e32fcb48b59491","messages_hash":"1ddc1eab822609f46aaa413f870738d386600cb5f92477029f3321538a8f3425","txlist_hash":"02eb5dc168a03d3cd067677480b22185a8ad6731e467c0b3bd5a907834e01013"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(225,310039,'insert','blocks','{"block_hash":"7200ded406675453eadddfbb2d14c2a4526c7dc2b5de14bd48b29243df5e1aa3","block_index":310040,"block_time":310040000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(226,310040,'parse','blocks','{"block_index":310040,"ledger_hash":"cc5b2af6948531b635b18a4b6698efa318190762c8e4419aa9ca3634e7ed5d1e","messages_hash":"d1204fb3f4fc48c21af8226bc45388f0b6eeac8a9f4fd47126f80c6572a5469e","txlist_hash":"f6ba96a6e3e2e3442722bbc1bd770d3f6f0f4a4ffe57d0858586539f81e868b8"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(227,310040,'insert','blocks','{"block_hash":"5db592ff9ba5fac1e030cf22d6c13b70d330ba397f415340086ee7357143b359","block_index":310041,"block_time":310041000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(228,310041,'parse','blocks','{"block_index":310041,"ledger_hash":"7ad02b4853bde78025942e9f58c212a76c1828337610347e516d4a359af804b5","messages_hash":"9436001b6251917c4b69c00921901c387330125c720ccf2c9e576599d8dafa83","txlist_hash":"d8089b22bc20979dce133885c84c5babb754ff0522d7f2193e1d3157c5251631"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(229,310041,'insert','blocks','{"block_hash":"826fd4701ef2824e9559b069517cd3cb990aff6a4690830f78fc845ab77fa3e4","block_index":310042,"block_time":310042000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(230,310042,'parse','blocks','{"block_index":310042,"ledger_hash":"64a91735950113c13603e49ca549fae9b30092a9fc02d53a32a20eaef64ab6ce","messages_hash":"517bcde57fab2adad83570b2609cee487bb5705e176f400106ff69ecb4746b6d","txlist_hash":"554d6b2a2182d87b00111b748a5d904aef85a56b92f1d076ad4f866f0d054041"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(231,310042,'insert','blocks','{"block_hash":"2254a12ada208f1dd57bc17547ecaf3c44720323c47bc7d4b1262477cb7f3c51","block_index":310043,"block_time":310043000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(232,310043,'parse','blocks','{"block_index":310043,"ledger_hash":"68107847c7a9dd19612d8b47c1a39cdc446c752f2c05ea8fcd961a42f835d155","messages_hash":"912b1b96d379d1fc64b209c7d2e5312ba4ee269eb530b04eb7bbeb0537e4c21a","txlist_hash":"f2b1800a73d98a15428bfb5289f7ccbb9d3c66b98fb0a36f00ffce8a78279801"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(233,310043,'insert','blocks','{"block_hash":"3346d24118d8af0b3c6bcc42f8b85792e7a2e7036ebf6e4c25f4f6723c78e46b","block_index":310044,"block_time":310044000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(234,310044,'parse','blocks','{"block_index":310044,"ledger_hash":"64d4d51adb6994360b3dbf04663c4f067ba223e62912fe1c5a96a190225bb54c","messages_hash":"1600a9735c13014eb519bd322dde80f84ab675df322f6decfcdffd1af54504d1","txlist_hash":"ce4365857faa29eb04e638064e4810620f434fe515efe63eb2ac49c3adce6581"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(235,310044,'insert','blocks','{"block_hash":"7bba0ab243839e91ad1a45a762bf074011f8a9883074d68203c6d1b46fffde98","block_index":310045,"block_time":310045000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(236,310045,'parse','blocks','{"block_index":310045,"ledger_hash":"3ba2d7685f63962f576e9fa94e4d6709ace95249a3064804c3822078c982d11d","messages_hash":"56d227f3edb62b974dac1362b79eed46bdfa1e91f69065d83c8d7c61c1129ba3","txlist_hash":"94729a0956e8c1b095c9181e01c220b94257ff582e35d87923e3c5ddba3a3566"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(237,310045,'insert','blocks','{"block_hash":"47db6788c38f2d6d712764979e41346b55e78cbb4969e0ef5c4336faf18993a6","block_index":310046,"block_time":310046000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(238,310046,'parse','blocks','{"block_index":310046,"ledger_hash":"6502f277568bed2705c5f496e278e5d99310ff6705751a3999cb4b2bc7d725bd","messages_hash":"63397d50f0c1aa35c11c76609beac1cca925f3ba6835f096137952b6411609bf","txlist_hash":"0986f1e944c39e36fe955ff092028c51647a9359492f17a76c682b4346be714e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(239,310046,'insert','blocks','{"block_hash":"a9ccabcc2a098a7d25e4ab8bda7c4e66807eefa42e29890dcd88149a10de7075","block_index":310047,"block_time":310047000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(240,310047,'parse','blocks','{"block_index":310047,"ledger_hash":"5dae29289f36e64b87d56f9870af0bd5ad77ca45f1093c1a41140ea397945130","messages_hash":"6b46b89049da0cbfe2d00b6901b5a8954ad60532e57d14ca35967167c73ba625","txlist_hash":"f14e3c5de5e186beaed6835c7c61fe2274603bb73e62ebea5899ae2a998e26e2"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(241,310047,'insert','blocks','{"block_hash":"610bf3935a85b05a98556c55493c6de45bed4d7b3b6c8553a984718765796309","block_index":310048,"block_time":310048000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(242,310048,'parse','blocks','{"block_index":310048,"ledger_hash":"d5dee49d7b78e2ce4dd2a648e345a52bbfa7e0e76de9e970b1dc0b6aea66c130","messages_hash":"c57c5d45c4cef74d650721928f3dbe8f0d83b310cba367170b79381a7ba21ee8","txlist_hash":"e31cb01f21f653217b3bff72061a63f3778f45a72a8419988a496d8f388cac1f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(243,310048,'insert','blocks','{"block_hash":"4ad2761923ad49ad2b283b640f1832522a2a5d6964486b21591b71df6b33be3c","block_index":310049,"block_time":310049000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(244,310049,'parse','blocks','{"block_index":310049,"ledger_hash":"2b4c97a93933b8986ebb061d47f2e8bbb1672206058ae3c3ae388bab36b8cbc8","messages_hash":"7f8534be109485517c9459dfb5222b8f541b468bb4f7aa58220db663d7f8d243","txlist_hash":"eb45cf1a49da1dfd4ce7231e8f6da96b7241b0b034884cb2de57dc107723b7a5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(245,310049,'insert','blocks','{"block_hash":"8cfeb60a14a4cec6e9be13d699694d49007d82a31065a17890383e262071e348","block_index":310050,"block_time":310050000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(246,310050,'parse','blocks','{"block_index":310050,"ledger_hash":"115913763ca7ef5691512a5c6d47cbd49203aee8a3242928f62640912c935872","messages_hash":"3e82c3cebfd5dc148f738ef6d03270bd335fdb9f897d7c38ec08de99bd2029dd","txlist_hash":"db0d0812374555812015a2058ea7f6bc8aebb8aa7d2824eeeb26b7b42d75f97e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(247,310050,'insert','blocks','{"block_hash":"b53c90385dd808306601350920c6af4beb717518493fd23b5c730eea078f33e6","block_index":310051,"block_time":310051000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(248,310051,'parse','blocks','{"block_index":310051,"ledger_hash":"72f24dc53c759a08aeb447d826bf64aad71ca8f4ab9640e30e440e6bc050a0eb","messages_hash":"988ffda502c528af98f0a02d190e1b79b50362938e53feea5d16c3bb9d6efbd0","txlist_hash":"b3834012ddc576765f337d3dd8b3c916f66711481c0bfa2464f6ec2678d1512e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(249,310051,'insert','blocks','{"block_hash":"0acdacf4e4b6fca756479cb055191b367b1fa433aa558956f5f08fa5b7b394e2","block_index":310052,"block_time":310052000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(250,310052,'parse','blocks','{"block_index":310052,"ledger_hash":"07846004f2da033bfd113e13040b0d0d605375370b7437e2ca2ea9467fc80c1a","messages_hash":"a2a135fe3fb63d0eba7fbe099dd2b528a757d64babba95166aad63f1524d6ad3","txlist_hash":"35357fb0ca94373955c3cdf08be75d20e9665a9632be0df0c90b567875594049"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(251,310052,'insert','blocks','{"block_hash":"68348f01b6dc49b2cb30fe92ac43e527aa90d859093d3bf7cd695c64d2ef744f","block_index":310053,"block_time":310053000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(252,310053,'parse','blocks','{"block_index":310053,"ledger_hash":"7bf9a701337c043a7268cecca5ff765c24600a2056137cd03e3ead9d64ef2348","messages_hash":"cd278dc9fcd6af0b08770e3ae24d6cc06035a808521a27d30f52f740c92013b9","txlist_hash":"d177ed9e0bb4b3d77bc5b1a044e724cabb92dee3189747bc1c01d1fee7148fa2"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(253,310053,'insert','blocks','{"block_hash":"a8b5f253df293037e49b998675620d5477445c51d5ec66596e023282bb9cd305","block_index":310054,"block_time":310054000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(254,310054,'parse','blocks','{"block_index":310054,"ledger_hash":"d544aec17018203fe2f5c9bda52a5da53d41d3364b8026770d1f620aa53e6c36","messages_hash":"11bdddd1a775214ace919b5cb8b05153a029d3afc0d4fc76aa6fa3745c2be51b","txlist_hash":"8a3b92aa200f79e8aff4a849618914f7d39c34ef2ed636d3b5633a2ad2f647ea"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(255,310054,'insert','blocks','{"block_hash":"4b069152e2dc82e96ed8a3c3547c162e8c3aceeb2a4ac07972f8321a535b9356","block_index":310055,"block_time":310055000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(256,310055,'parse','blocks','{"block_index":310055,"ledger_hash":"bd3044c66f7e2c24944a9c938b8f162ac8f566a1338444c219396eadf5179d3e","messages_hash":"c8fe4a422a254591a8fe091f3ac0a188b49f241298ab1548edc31dbce7e09734","txlist_hash":"59ce208e69d4e1427791ae237a6db6a05efcd50fa386f4f8f56862c6cc3b12d5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(257,310055,'insert','blocks','{"block_hash":"7603eaed418971b745256742f9d2ba70b2c2b2f69f61de6cc70e61ce0336f9d3","block_index":310056,"block_time":310056000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(258,310056,'parse','blocks','{"block_index":310056,"ledger_hash":"b19346f726636aa9da55af6106a471c596a7f7b93289b70d3d33b45334bca9d3","messages_hash":"1f6fb5ab52976782a48b7530e23aa9dfbc640325a72cbb0c7db1247c7a0b4031","txlist_hash":"8e9d4b1d3ad7c5e8e479640da0ffd8b7423aee810ff6adc4ae2d37d545169579"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(259,310056,'insert','blocks','{"block_hash":"4a5fdc84f2d66ecb6ee3e3646aad20751ce8694e64e348d3c8aab09d33a3e411","block_index":310057,"block_time":310057000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(260,310057,'parse','blocks','{"block_index":310057,"ledger_hash":"35c2ad9ccd3bd68cdb0c4d8fd4e30938521b8559c1cec331a29b1802d649947a","messages_hash":"e850532831c45f4cae14c9bcda7d894dea4a93934ce7afc38f256def03ba1c4f","txlist_hash":"e14484629fa3aa2e8ce54505b3983d0f33e7727d3dacc5de57a574c2e0c69baf"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(261,310057,'insert','blocks','{"block_hash":"a6eef3089896f0cae0bfe9423392e45c48f4efe4310b14d8cfbdb1fea613635f","block_index":310058,"block_time":310058000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(262,310058,'parse','blocks','{"block_index":310058,"ledger_hash":"e9a705d6661f0345ffe0f45ae26c0d6ba6bd5a125eef2f0e9558d0702ee6d63f","messages_hash":"047adfb7ad69518a1b2a78af1eb8222168b0865300be9a50e37075c7e1948c9c","txlist_hash":"cfbb1995e2c28020dabca30e98f72afee01b64fe276acacee7e104b22772de65"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(263,310058,'insert','blocks','{"block_hash":"ab505de874c43f97c90be1c26a769e6c5cb140405c993b4a6cc7afc795f156a9","block_index":310059,"block_time":310059000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(264,310059,'parse','blocks','{"block_index":310059,"ledger_hash":"61efe4d33a7f70cae34df86753532aee25fb0b153744acb962142691f6979482","messages_hash":"8eb894c4a10a9bf7669b8376b5e09663b9e4ccf35adf18de9db07a33315b7ed6","txlist_hash":"401b057e48ae9e423f354f7ddbb11e70c0ec2209ef1a26dc7ffd0bf6003f1335"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(265,310059,'insert','blocks','{"block_hash":"974ad5fbef621e0a38eab811608dc9afaf10c8ecc85fed913075ba1a145e889b","block_index":310060,"block_time":310060000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(266,310060,'parse','blocks','{"block_index":310060,"ledger_hash":"59d9785e783c59c12783977087ad439b2dacad9ae1ef2be6384bfc9036da9804","messages_hash":"e932e980d4a231aa6c0b641cf4df7178dee3d08ba746c32f4db844090938d7e8","txlist_hash":"6010ccb1d9476ce07d8b50633bccb97ecff1a229a0ea7701c802aad32f961be9"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(267,310060,'insert','blocks','{"block_hash":"35d267d21ad386e7b7632292af1c422b0310dde7ca49a82f9577525a29c138cf","block_index":310061,"block_time":310061000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(268,310061,'parse','blocks','{"block_index":310061,"ledger_hash":"e257d59ab5dfb01b8396bd12d2fd169f9ac7629365b90bf6e593e627738d3754","messages_hash":"e1c03b783d99b6d377dc00755feda0a6939daa86e393e26a5a68f714300fb554","txlist_hash":"bda63243caec3f70173e1e93a16867ecbcf45d987b6a5f72d1bea54d361f0ed2"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(269,310061,'insert','blocks','{"block_hash":"b31a0054145319ef9de8c1cb19df5bcf4dc8a1ece20053aa494e5d3a00a2852f","block_index":310062,"block_time":310062000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(270,310062,'parse','blocks','{"block_index":310062,"ledger_hash":"0dc0317a88a6fc4ac791cd4d45edcf2a142fb83aa2e8a2f299fcac48a2c2e04d","messages_hash":"fbddf6eee66e1c7b1df8e81372ee1d62a5ef71db7b7dd4baf4d5ef016bdf7c4a","txlist_hash":"ea9f3db44eb05a8ba1c860cd0a13ea662f84715b59e78a87f49c78377cb6b2c3"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(271,310062,'insert','blocks','{"block_hash":"0cbcbcd5b7f2dc288e3a34eab3d4212463a5a56e886804fb4f9f1cf929eadebe","block_index":310063,"block_time":310063000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(272,310063,'parse','blocks','{"block_index":310063,"ledger_hash":"892d6a49aebb262f2a626a35c0806c488c836c04d33122c2d65ecd8904fe3d85","messages_hash":"8d2ee1a5f97490c82f97f7cfa52fd6e3b8e4cddae27d1aa5084d19006427fef6","txlist_hash":"3fc1380f35c9123d16b9ffbeb23c44f24e4d6001406a484ce30ee5758b8ec965"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(273,310063,'insert','blocks','{"block_hash":"e2db8065a195e85cde9ddb868a17d39893a60fb2b1255aa5f0c88729de7cbf30","block_index":310064,"block_time":310064000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(274,310064,'parse','blocks','{"block_index":310064,"ledger_hash":"e345abbf8dc42737a9f2dd038534409200d63a9ebf5d1cbf3344ea9413c388c0","messages_hash":"1557b98be10d0eeeaf1e47f46d632cfa065aa77760ab38f1e81ed16bcc28e405","txlist_hash":"be23706267b965eb38fa15ec1ce8c17ed5727bfedba0ca4d4be3db2fd703744f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(275,310064,'insert','blocks','{"block_hash":"8a7bc7a77c831ac4fd11b8a9d22d1b6a0661b07cef05c2e600c7fb683b861d2a","block_index":310065,"block_time":310065000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(276,310065,'parse','blocks','{"block_index":310065,"ledger_hash":"84ec781d054c0602ed97384cd32cd060b938627ea490a7635fa3ac0babba94cc","messages_hash":"3a160d03c922d16d4defefc07987a5d7d6c87958f1040c9058f4810c5dfd192e","txlist_hash":"1f7417cf7a3d9f07e5a8faf658b166c288aff136ee56f244797ef589f9cf98c5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(277,310065,'insert','blocks','{"block_hash":"b6959be51eb084747d301f7ccaf9e75f2292c9404633b1532e3692659939430d","block_index":310066,"block_time":310066000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(278,310066,'parse','blocks','{"block_index":310066,"ledger_hash":"3478612a8bb95c2966891fb4d1b35493a1342364a6f08404b83ac9fdda763aa2","messages_hash":"f6bd82018fec6aef410ce22ae9453985c47d112327ac79467b1b58b5459b88a6","txlist_hash":"7b4317e7c2db815ced2d81aaf8efaa6331e475a7a9b3a59041640d43484b1a89"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(279,310066,'insert','blocks','{"block_hash":"8b08eae98d7193c9c01863fac6effb9162bda010daeacf9e0347112f233b8577","block_index":310067,"block_time":310067000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(280,310067,'parse','blocks','{"block_index":310067,"ledger_hash":"c532c4c5f5e2ae1026ec2582645d9aef06afee46cb9781427a1f40667378ed67","messages_hash":"534d66483e451478608cbb2ede9587088e10efd2e0e700f59eef272e91423c46","txlist_hash":"89699fdf437b96128d7eb89a45d58e45d0b829789c6e0b29e8972b48ce5e62de"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(281,310067,'insert','blocks','{"block_hash":"9280e7297ef6313341bc81787a36acfc9af58f83a415afff5e3154f126cf52b5","block_index":310068,"block_time":310068000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(282,310068,'parse','blocks','{"block_index":310068,"ledger_hash":"5508189396fa6dfe63a7d06fe97a3073e986eb305bcb49430157f99e3848cd69","messages_hash":"0d2642a45e69da6ca9f71855222603189bd602ecd7ccfa1d5a08fc602f2d83bd","txlist_hash":"4c49d9334c909f728f3b06a0ef613fb09f6369dd431b7078db5d269cdf9dd4bd"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(283,310068,'insert','blocks','{"block_hash":"486351f0655bf594ffaab1980cff17353b640b63e9c27239109addece189a6f7","block_index":310069,"block_time":310069000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(284,310069,'parse','blocks','{"block_index":310069,"ledger_hash":"9b0b5d09dc7aaffaf5a3603fa2b914c54b04755a5ddbf83476320149f802292a","messages_hash":"8d85103885918d2f0cb3653b55615111561cef1defb3f57a52aa7efc3f2343d3","txlist_hash":"ef4759403c17482a8f8042fb93a5cae1b741085cdbf73e839638fee316044571"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(285,310069,'insert','blocks','{"block_hash":"8739e99f4dee8bebf1332f37f49a125348b40b93b74fe35579dd52bfba4fa7e5","block_index":310070,"block_time":310070000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(286,310070,'parse','blocks','{"block_index":310070,"ledger_hash":"2e40d398c2eb131e195a667f1b2b5e8de29e80423a2d0dd3935fad6dd7cc919c","messages_hash":"0e52d3a43ac7fe4e49c1ac354ad2cf71668253207b461713d045dcc82e247575","txlist_hash":"18e3230ce4fdaca025887c118a2f2fa6bcbe81fba5c968301a90b43e27f2c7aa"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(287,310070,'insert','blocks','{"block_hash":"7a099aa1bba0ead577f1e44f35263a1f115ed6a868c98d4dd71609072ae7f80b","block_index":310071,"block_time":310071000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(288,310071,'parse','blocks','{"block_index":310071,"ledger_hash":"763d3d949dc16a797f5b8a2f5a27fd34b4636fa3dbf33eabed5db048e1a848b4","messages_hash":"44bf78b7251f514af029c657853ea438db6a6f19e126dfe21efc7987e3415673","txlist_hash":"7b10cd9561d4a33c7771570925e5a9a879a501ac503004eccc5e60074d2dedab"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(289,310071,'insert','blocks','{"block_hash":"7b17ecedc07552551b8129e068ae67cb176ca766ea3f6df74b597a94e3a7fc8a","block_index":310072,"block_time":310072000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(290,310072,'parse','blocks','{"block_index":310072,"ledger_hash":"d9b9d6a52f757604a5652aac64c343a47a928160790963521ce33d125486cb0b","messages_hash":"6af984b5ea8eef37a8be2d9aa7ce6a686827604fb285e0632a61ed653f753ceb","txlist_hash":"deda10c92f292c186698b9b4d371727688a9c0ea194963464fd1c5b429fbbff1"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(291,310072,'insert','blocks','{"block_hash":"ee0fe3cc9b3a48a2746b6090b63b442b97ea6055d48edcf4b2288396764c6943","block_index":310073,"block_time":310073000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(292,310073,'parse','blocks','{"block_index":310073,"ledger_hash":"9c1a650b6029cc982e9e617b619da6d88878453ccea68ff82047581d5cc74e9c","messages_hash":"af4dd5f282ecaa21596b2eb8b5aa0cfff6e0400cc3641fdd58964dc8045bf214","txlist_hash":"26e4cfa82a9ed189ffafa596c7022cab40002c8099b48814f3e7fbc48b01b0fa"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(293,310073,'insert','blocks','{"block_hash":"ceab38dfde01f711a187601731ad575d67cfe0b7dbc61dcd4f15baaef72089fb","block_index":310074,"block_time":310074000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(294,310074,'parse','blocks','{"block_index":310074,"ledger_hash":"32d648a0d0b99f6826376e8badb278c06f95a0ab781cd873e2f7f55219953b01","messages_hash":"5e1a75ec243b0a826cb040effbca894d0efbcf88dcdee8133e97cb700f5f9cbc","txlist_hash":"f10d714905f2e84a57e0c792ebf0dd67158f19f352176a571278dce49aaf778b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(295,310074,'insert','blocks','{"block_hash":"ef547198c6e36d829f117cfd7077ccde45158e3c545152225fa24dba7a26847b","block_index":310075,"block_time":310075000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(296,310075,'parse','blocks','{"block_index":310075,"ledger_hash":"67cd615e67e397cae8195fc8753403563e9100ecd623b2796a46b137ca553be2","messages_hash":"22127fbab598f700c53a834ddafb92a9325055467b24256455dd998de58d9fd0","txlist_hash":"d0c0ffcafa826685b59ef036c4315e79cc688ac1ee43097143debf445f6e638b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(297,310075,'insert','blocks','{"block_hash":"3b0499c2e8e8f0252c7288d4ecf66efc426ca37aad3524424d14c8bc6f8b0d92","block_index":310076,"block_time":310076000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(298,310076,'parse','blocks','{"block_index":310076,"ledger_hash":"d636f3831cd35437271557e6299024d70c4be6b9a685a4fed61e7d67e61540dd","messages_hash":"16ff09b6f1392469f352a23d614830752e85e9ed7c39dca2dcac1cfe75249db8","txlist_hash":"fb11ef8957cdc599585372679a59440580acb37458ed3da092b22974a4857bb6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(299,310076,'insert','blocks','{"block_hash":"d2adeefa9024ab3ff2822bc36acf19b6c647cea118cf15b86c6bc00c3322e7dd","block_index":310077,"block_time":310077000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(300,310077,'parse','blocks','{"block_index":310077,"ledger_hash":"abf96247f6b99a24e518d89162c23cffc821d5cae5703f5b7c7c4587e34cdf98","messages_hash":"823ac2dd7bd746deeab41d20c2f7a28ae22e1240582b31108d980814ee7e9a73","txlist_hash":"67d8b52c93c5d07ce1a335ea3572f0015a971effdecf921193cca273553466c1"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(301,310077,'insert','blocks','{"block_hash":"f6c17115ef0efe489c562bcda4615892b4d4b39db0c9791fe193d4922bd82cd6","block_index":310078,"block_time":310078000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(302,310078,'parse','blocks','{"block_index":310078,"ledger_hash":"06aeace2e79321c6776dd1098982e71bfc0baadc55470721022db67a03bd4478","messages_hash":"0235009ba1b7b4829cb22ad87c8295f613951a2e5d99fb9b732e734115f72a0a","txlist_hash":"2e148e6946d39fee7c6d1b320122beb1689903e929397821a63e612d5216326d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(303,310078,'insert','blocks','{"block_hash":"f2fbd2074d804e631db44cb0fb2e1db3fdc367e439c21ffc40d73104c4d7069c","block_index":310079,"block_time":310079000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(304,310079,'parse','blocks','{"block_index":310079,"ledger_hash":"ba2c7078ee940b14e584459985a5a4785156762135541d40a138c31ff9bfe4fb","messages_hash":"fb33e505d3b178a8d5abae4c7cb9c40e6810b6633d5ad576ec373529a8a4e6a7","txlist_hash":"63832ac6186f8a8e8091579221ada474b43c36f465ae25ddae4ead963207150c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(305,310079,'insert','blocks','{"block_hash":"42943b914d9c367000a78b78a544cc4b84b1df838aadde33fe730964a89a3a6c","block_index":310080,"block_time":310080000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(306,310080,'parse','blocks','{"block_index":310080,"ledger_hash":"af327b161ed9fa8022f3efd81b695d25ad9ae8f250a6d08739a40b0883262045","messages_hash":"bd5b04fd2a333d10ee6dbed807e153fa483cbc0e272dfb146a9c8144420d2e45","txlist_hash":"47bdbc4933d69cd703c277d9a5e156951ef57791f87f92d16b85c15ab3194061"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(307,310080,'insert','blocks','{"block_hash":"6554f9d307976249e7b7e260e08046b3b55d318f8b6af627fed5be3063f123c4","block_index":310081,"block_time":310081000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(308,310081,'parse','blocks','{"block_index":310081,"ledger_hash":"2c4d6568a9c77737c5942fab33613a1ef055ce21b9f0a9b4a42fcdf6e9536a59","messages_hash":"22d1d0053667443aae83fa579cc48b0814338c7b4ec567f88955d9ff37cca0c7","txlist_hash":"7d57db6fdebb83dc0fbd1746eb328a94403f4a66e7e003593fe90c95fdef3e5c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(309,310081,'insert','blocks','{"block_hash":"4f1ef91b1dcd575f8ac2e66a67715500cbca154bd6f3b8148bb7015a6aa6c644","block_index":310082,"block_time":310082000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(310,310082,'parse','blocks','{"block_index":310082,"ledger_hash":"0b8dcdff637e5e60ae045d4c7646bd47e6047fc992860c99dd422477b9a90d74","messages_hash":"e236d1ad78134a4a1f0eafeb382709f1f9db74313f22bc17d44df9053826be59","txlist_hash":"61316fca3bd986c2398fa5dd92a8b874f4a64095691626d695e82e3c30849e27"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(311,310082,'insert','blocks','{"block_hash":"9b1f6fd6ff9b0dc4e37603cfb0625f49067c775b99e12492afd85392d3c8d850","block_index":310083,"block_time":310083000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(312,310083,'parse','blocks','{"block_index":310083,"ledger_hash":"eec6578a8bc1f5766427f4753ded18cb97c53e710f5fff8918bbdadb59678f64","messages_hash":"3dce816512e26be7ae36f3f8f32dc9ad25504c8b08c59c5a3f4d0206096d0e25","txlist_hash":"bc5cabb9579b79f03b329c0e5e3c8652d8b0eccde9563d838890218bcc8bd932"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(313,310083,'insert','blocks','{"block_hash":"1e0972523e80306441b9f4157f171716199f1428db2e818a7f7817ccdc8859e3","block_index":310084,"block_time":310084000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(314,310084,'parse','blocks','{"block_index":310084,"ledger_hash":"a2b2ed6a61f1c9a3d322a050178c6be119b89d1a0795fa9c9d7484ad8edfcecd","messages_hash":"80bcccb657ee818f010373641e90d6a1353a15d95a576ea5c83eb41d96832b33","txlist_hash":"86e50073092182d9a5b37cd2453dd5a7a1af175ad0a1150492d5001510b05e6e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(315,310084,'insert','blocks','{"block_hash":"c5b6e9581831e3bc5848cd7630c499bca26d9ece5156d36579bdb72d54817e34","block_index":310085,"block_time":310085000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(316,310085,'parse','blocks','{"block_index":310085,"ledger_hash":"02828eaf91883ad16beb5563f9c84cb226269c655a886857b31e5e150a1053ec","messages_hash":"5f930a16ea9b174ea0a1a549f9d094dba36a469572e4094855e3b9e935e94bd8","txlist_hash":"bf59d4fe42c11ab04792ba5c95cfd811a6ddf18e125daebb93695bdd829736c3"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(317,310085,'insert','blocks','{"block_hash":"080c1dc55a4ecf4824cf9840602498cfc35b5f84099f50b71b45cb63834c7a78","block_index":310086,"block_time":310086000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(318,310086,'parse','blocks','{"block_index":310086,"ledger_hash":"5427b45ed778796c26d0d2ddf73e975856cc9ae081c36762e78d046f6cfc376c","messages_hash":"36eb11de51610eff7bd985bd603d208ea6308f292233c12aa8ce4c71f4a8f6ca","txlist_hash":"ca0801d366e8dc44c01db11f67594bcb3ea3e81a3031cee93d24683b82185461"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(319,310086,'insert','blocks','{"block_hash":"4ec8cb1c38b22904e8087a034a6406b896eff4dd28e7620601c6bddf82e2738c","block_index":310087,"block_time":310087000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(320,310087,'parse','blocks','{"block_index":310087,"ledger_hash":"34c2664f81b1bbb53c728636097bc4b7cede67bb318ddcc5e5e6b5735bcc55a7","messages_hash":"8f1616a4b99b0017b45f187fe0153199d4afdcc18180b89d915c9a658d22a9ea","txlist_hash":"321bd59dc3c2996a1a2a6f74905f89a8db172b3b2b35a2d1cbfc6d06f49d09c9"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(321,310087,'insert','blocks','{"block_hash":"e945c815c433cbddd0bf8e66c5c23b51072483492acda98f5c2c201020a8c5b3","block_index":310088,"block_time":310088000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(322,310088,'parse','blocks','{"block_index":310088,"ledger_hash":"14615dfa6194665d43cf2f495b8f65fb9efa04c2e90885172d229ad4a9dd2358","messages_hash":"ab83027e5a67ed9d64eed651a88ee64bf025e741c22fb00088a06b3a73d971f3","txlist_hash":"3ef6f8bdf30073f297852db2b7036374e3d2c1e91b0d087cb2c6c88e400de110"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(323,310088,'insert','blocks','{"block_hash":"0382437f895ef3e7e38bf025fd4f606fd44d4bbd6aea71dbdc4ed11a7cd46f33","block_index":310089,"block_time":310089000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(324,310089,'parse','blocks','{"block_index":310089,"ledger_hash":"fc0f077548225d481384a1aba2d91ed4ec8b2df0f0a57ab603305c615672b25f","messages_hash":"28e50e9e6a0cc748d1752c2ee636936f7f0cacc0154cc3f4e2341f99b99da524","txlist_hash":"0788356af4b45cc44c143c457d069e64d54aa12703f8c376cf3b98827052c173"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(325,310089,'insert','blocks','{"block_hash":"b756db71dc037b5a4582de354a3347371267d31ebda453e152f0a13bb2fae969","block_index":310090,"block_time":310090000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(326,310090,'parse','blocks','{"block_index":310090,"ledger_hash":"5749263295014a597071acf2293fcd185d02a6a7b3a96df859aae3bf146b276e","messages_hash":"24e5630de6254178200271f1a404a76830763d87367530c928ca78fa481ad450","txlist_hash":"02938682157ea8b10c49e9d87ed444c1303a952a00f6acfe33a1661e84868cc8"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(327,310090,'insert','blocks','{"block_hash":"734a9aa485f36399d5efb74f3b9c47f8b5f6fd68c9967f134b14cfe7e2d7583c","block_index":310091,"block_time":310091000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(328,310091,'parse','blocks','{"block_index":310091,"ledger_hash":"ae369a1ec3e4f2aea602eab8c7ab1181cacd6b8d01582c96c4771fdd7b3de771","messages_hash":"021342bdaccc173aefff413c3400cb85b7eaa5e9aa5fe5b7fc0e5177f5d8b928","txlist_hash":"04aaa17c2a3dacf6c38b16ed63d70aea7b9546dc7e733dd51a3c08248ca13eb1"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(329,310091,'insert','blocks','{"block_hash":"56386beb65f9228740d4ad43a1c575645f6daf59e0dd9f22551c59215b5e8c3d","block_index":310092,"block_time":310092000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(330,310092,'parse','blocks','{"block_index":310092,"ledger_hash":"06a2ac591c418d2b01c74edf2524100afd1140c3933f32120c4cc3180c1de3f0","messages_hash":"75fad188405897ce4a94e9a47109b57f4425efa2ce794da636a5ef6bc1282167","txlist_hash":"421eb90f1258261c97512745b3543fee15ae8d17769d523646033851abde9c75"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(331,310092,'insert','blocks','{"block_hash":"a74a2425f2f4be24bb5f715173e6756649e1cbf1b064aeb1ef60e0b94b418ddc","block_index":310093,"block_time":310093000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(332,310093,'parse','blocks','{"block_index":310093,"ledger_hash":"cdf0ae4d5d06b8735e3e62f5a76a902fee40742fc760578dae98b43635f2e57a","messages_hash":"a412013457b63881cbe03936adcc9a6d413ed3f85e8c9f15bcd91238f126d3e4","txlist_hash":"cbe924452487ba251291d1bf1ec518a7233eda0aa956d002bc2e0933d0057c53"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(333,310093,'insert','blocks','{"block_hash":"2a8f976f20c4e89ff01071915ac96ee35192d54df3a246bf61fd4a0cccfb5b23","block_index":310094,"block_time":310094000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(334,310094,'parse','blocks','{"block_index":310094,"ledger_hash":"77d836433add0cf3f7691884ec1607dde9a3996df00128703644527fb096bab5","messages_hash":"3f9caa3a0efeadd13a5442e94e78c8202aa5d9a036c1e0d780bbb4708709ec90","txlist_hash":"2dad9d43a8612157867a046cc0dbc8939f30c41cc8f527a1e184c93004cca63e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(335,310094,'insert','blocks','{"block_hash":"bed0fa40c9981223fb40b3be8124ca619edc9dd34d0c907369477ea92e5d2cd2","block_index":310095,"block_time":310095000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(336,310095,'parse','blocks','{"block_index":310095,"ledger_hash":"770a0187b5c98725dc32e15a414b9323030f407749fcb0652b1e1f2e4e762e7e","messages_hash":"39c7215611beaf69e4ff95e35d7b363ba065b5c67c8d46cfd6e5aa36ee831d51","txlist_hash":"251e12514d80ad256c13398d257708ad2dfb3b70db674695a8d72d977337ac90"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(337,310095,'insert','blocks','{"block_hash":"306aeec3db435fabffdf88c2f26ee83caa4c2426375a33daa2be041dbd27ea2f","block_index":310096,"block_time":310096000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(338,310096,'parse','blocks','{"block_index":310096,"ledger_hash":"567e91f9456ecd020fbd2fe940d796ac976981485f870db8cb0bc41d77a0fd0f","messages_hash":"bd51e820948048543ee33b42759c0936b74471c6ca9f9271395261e6ed825f48","txlist_hash":"48924c125c80fbe8887ff318ebbab0edf8629e604eed0561dd48444bc4acdab3"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(339,310096,'insert','blocks','{"block_hash":"13e8e16e67c7cdcc80d477491e554b43744f90e8e1a9728439a11fab42cefadf","block_index":310097,"block_time":310097000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(340,310097,'parse','blocks','{"block_index":310097,"ledger_hash":"447ceafb93aeb346eb98d87db46f07f4d1f51ffde3d44adc6056a624bea3b0c3","messages_hash":"67f40bcce0e0c78c223929650f7ce85a0410790fbf93f5d0e269fd29161b4b65","txlist_hash":"213f5672119909ebcda9f987e3bf69dd0404134584b36c56acdd3596a1ea6881"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(341,310097,'insert','blocks','{"block_hash":"ca5bca4b5ec4fa6183e05176abe921cff884c4e20910fab55b603cef48dc3bca","block_index":310098,"block_time":310098000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(342,310098,'parse','blocks','{"block_index":310098,"ledger_hash":"f510ec6201f4eb850d4f62b399d0d360d0d8cca7e3d955f849ad59a22fba1677","messages_hash":"eb8d0c00e10de227ba487e5a1a42828227b0764caee0d5c827833c5de1f108a3","txlist_hash":"e504e97b361e32b0256aeb1640291eeda547dc564043835013086c87f5e637c2"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(343,310098,'insert','blocks','{"block_hash":"3c4c2279cd7de0add5ec469648a845875495a7d54ebfb5b012dcc5a197b7992a","block_index":310099,"block_time":310099000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(344,310099,'parse','blocks','{"block_index":310099,"ledger_hash":"1f956e2c07defac832b7c90982c1e7a1192988c4d1e622b54b40b78065deafef","messages_hash":"bc047032c040c11436d7a1c9e7e33d12be7013f1a3df3d2c87a766fda09b0d28","txlist_hash":"891969418c97f41be742eeb562f39cfe92543c159095f58c5f58c8c2b0274423"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(345,310099,'insert','blocks','{"block_hash":"96925c05b3c7c80c716f5bef68d161c71d044252c766ca0e3f17f255764242cb","block_index":310100,"block_time":310100000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(346,310100,'parse','blocks','{"block_index":310100,"ledger_hash":"ac4cc3e01feb10ba2211afdff4ec43a4ce13a12e1a90dc6f675c390e6395b1e3","messages_hash":"6886fd77ef7eb785c257933ea5b6f1008311559a1d350b5ca1a7e2c1cb18cb50","txlist_hash":"71e61b2d7aca45ccd7cfb6bda957b18fa076cc16bcbbfb63668e4c4f2749b7f3"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(347,310100,'insert','blocks','{"block_hash":"369472409995ca1a2ebecbad6bf9dab38c378ab1e67e1bdf13d4ce1346731cd6","block_index":310101,"block_time":310101000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(348,310101,'parse','blocks','{"block_index":310101,"ledger_hash":"0a4bb35bf922a8175ef5559e74084d32caa16f599df84adb5e255de26b92c1c4","messages_hash":"283b91394c3e8249e7023df44632f72659fa20b0a8f030c82287f59c3579e514","txlist_hash":"e716e04989e254c2ed5b1c4b81026153d5799edb5a676adea5b7efb930940b30"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(0,NULL,0,'insert','blocks','{"block_hash":"8b3bef249cb3b0fa23a4936c1249b6bd41daeadc848c8d2e409ea1cbc10adfe7","block_index":309999,"block_time":309999000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1,NULL,309999,'parse','blocks','{"block_index":309999,"ledger_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","messages_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","txlist_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(2,NULL,309999,'insert','blocks','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(3,NULL,310000,'insert','transactions','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"btc_amount":62000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"c9ff1be2579378fad6d83ca87e6c91428b1eb8cfd1b0f341b3c7e452764404f5","tx_index":1}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(4,NULL,310000,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310000,"calling_function":"burn","event":"c9ff1be2579378fad6d83ca87e6c91428b1eb8cfd1b0f341b3c7e452764404f5","quantity":93000000000,"tx_index":1}',0,'CREDIT');
+INSERT INTO messages VALUES(5,NULL,310000,'insert','burns','{"block_index":310000,"burned":62000000,"earned":93000000000,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"c9ff1be2579378fad6d83ca87e6c91428b1eb8cfd1b0f341b3c7e452764404f5","tx_index":1}',0,'BURN');
+INSERT INTO messages VALUES(6,NULL,310000,'parse','blocks','{"block_index":310000,"ledger_hash":"09fa44ed277cd9e448baf3d4a2accc520d57c77fed0d97379ba9bb804e3dda71","messages_hash":"6be4f08fcd898cb64f0378531dbe611a612627b71163bcea29aab0653610dcc6","txlist_hash":"7d9cd23062d78e9eb1a892f69b154410935e9675ede8e05fe9c1269cd3c54b12"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(7,NULL,310000,'insert','blocks','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(8,NULL,310001,'insert','transactions','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"btc_amount":1000,"data":"0000000000000000000000010000000002faf080","destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","fee":7650,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"8968369ff47b1f5f6959aa67aca82d1385f3763e1cac2180d8cf41b44a515a32","tx_index":2}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(9,NULL,310001,'insert','debits','{"action":"send","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310001,"event":"8968369ff47b1f5f6959aa67aca82d1385f3763e1cac2180d8cf41b44a515a32","quantity":50000000,"tx_index":2}',0,'DEBIT');
+INSERT INTO messages VALUES(10,NULL,310001,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"XCP","block_index":310001,"calling_function":"send","event":"8968369ff47b1f5f6959aa67aca82d1385f3763e1cac2180d8cf41b44a515a32","quantity":50000000,"tx_index":2}',0,'CREDIT');
+INSERT INTO messages VALUES(11,NULL,310001,'insert','sends','{"asset":"XCP","block_index":310001,"destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","quantity":50000000,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"8968369ff47b1f5f6959aa67aca82d1385f3763e1cac2180d8cf41b44a515a32","tx_index":2}',0,'SEND');
+INSERT INTO messages VALUES(12,NULL,310001,'parse','transactions','{"supported":true,"tx_hash":"8968369ff47b1f5f6959aa67aca82d1385f3763e1cac2180d8cf41b44a515a32","tx_index":2}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(13,NULL,310001,'parse','blocks','{"block_index":310001,"ledger_hash":"b2237a0b0b29b2198355f47d38cb995e013c0e074c29dcbf1b99ed4c0f459c8d","messages_hash":"e9a2d21a205d237a9db00044b47594e52ddef4e0ce7a8502602d1d763541949e","txlist_hash":"adddb3e1b9020e7ef190f661823c79abbc5951801b15469ad9f483c512af002a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(14,NULL,310001,'insert','blocks','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(15,NULL,310002,'insert','transactions','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"btc_amount":0,"data":"0000000a00000000000000000000000002faf08000000000000000010000000005f5e100000a0000000000000000","destination":"","fee":1000000,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"1385519ca199f1b39bb89caac062fe3a342f18e393d301d7a56c150a8ab84093","tx_index":3}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(16,NULL,310002,'insert','orders','{"block_index":310002,"expiration":10,"expire_index":310012,"fee_provided":1000000,"fee_provided_remaining":1000000,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":100000000,"get_remaining":100000000,"give_asset":"BTC","give_quantity":50000000,"give_remaining":50000000,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","tx_hash":"1385519ca199f1b39bb89caac062fe3a342f18e393d301d7a56c150a8ab84093","tx_index":3}',0,'OPEN_ORDER');
+INSERT INTO messages VALUES(17,NULL,310002,'parse','transactions','{"supported":true,"tx_hash":"1385519ca199f1b39bb89caac062fe3a342f18e393d301d7a56c150a8ab84093","tx_index":3}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(18,NULL,310002,'parse','blocks','{"block_index":310002,"ledger_hash":"a3c393a285361d2981551f0a903d45847e7a0142779692d384bc77bac420db18","messages_hash":"ab4f4ad0d5abb5f36804c6b59a1ef3005b283e6718eb3b9ef279e64753216d4a","txlist_hash":"6fddb621bb8a1e2d10cf0ec8f507ada12be28578223ee53997aad614097bb35e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(19,NULL,310002,'insert','blocks','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(20,NULL,310003,'insert','transactions','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"btc_amount":0,"data":"0000000a00000000000000010000000006422c4000000000000000000000000002faf080000a00000000000dbba0","destination":"","fee":6800,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e","tx_index":4}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(21,NULL,310003,'insert','debits','{"action":"open order","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310003,"event":"a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e","quantity":105000000,"tx_index":4}',0,'DEBIT');
+INSERT INTO messages VALUES(22,NULL,310003,'insert','orders','{"block_index":310003,"expiration":10,"expire_index":310013,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":900000,"fee_required_remaining":900000,"get_asset":"BTC","get_quantity":50000000,"get_remaining":50000000,"give_asset":"XCP","give_quantity":105000000,"give_remaining":105000000,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","tx_hash":"a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e","tx_index":4}',0,'OPEN_ORDER');
+INSERT INTO messages VALUES(23,NULL,310003,'update','orders','{"fee_provided_remaining":142858,"fee_required_remaining":0,"get_remaining":0,"give_remaining":0,"status":"open","tx_hash":"1385519ca199f1b39bb89caac062fe3a342f18e393d301d7a56c150a8ab84093"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(24,NULL,310003,'update','orders','{"fee_provided_remaining":6800,"fee_required_remaining":42858,"get_remaining":0,"give_remaining":5000000,"status":"open","tx_hash":"a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(25,NULL,310003,'insert','order_matches','{"backward_asset":"XCP","backward_quantity":100000000,"block_index":310003,"fee_paid":857142,"forward_asset":"BTC","forward_quantity":50000000,"id":"1385519ca199f1b39bb89caac062fe3a342f18e393d301d7a56c150a8ab84093_a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e","match_expire_index":310023,"status":"pending","tx0_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx0_block_index":310002,"tx0_expiration":10,"tx0_hash":"1385519ca199f1b39bb89caac062fe3a342f18e393d301d7a56c150a8ab84093","tx0_index":3,"tx1_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx1_block_index":310003,"tx1_expiration":10,"tx1_hash":"a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e","tx1_index":4}',0,'ORDER_MATCH');
+INSERT INTO messages VALUES(26,NULL,310003,'parse','transactions','{"supported":true,"tx_hash":"a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e","tx_index":4}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(27,NULL,310003,'parse','blocks','{"block_index":310003,"ledger_hash":"f96ba90a471ab5524a574cc4ff72a228a8dc7019824482a664569dcb41c126c7","messages_hash":"cc9e415b3deeeffb07fe65b558b262e958c9688fda29829a128fc002e7ea07a5","txlist_hash":"d6756ca2a0f2a403b0a1714964ddb71bc773e0a18c049008f78670efb7137e18"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(28,NULL,310003,'insert','blocks','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(29,NULL,310004,'insert','transactions','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"btc_amount":50000000,"data":"0000000b1385519ca199f1b39bb89caac062fe3a342f18e393d301d7a56c150a8ab84093a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e","destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":9675,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"06448effa4c26f1101b315b2dbe3d2b7b888ca18f5755f4365c97215a6c760ac","tx_index":5}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(30,NULL,310004,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310004,"calling_function":"btcpay","event":"06448effa4c26f1101b315b2dbe3d2b7b888ca18f5755f4365c97215a6c760ac","quantity":100000000,"tx_index":5}',0,'CREDIT');
+INSERT INTO messages VALUES(31,NULL,310004,'update','order_matches','{"id":"1385519ca199f1b39bb89caac062fe3a342f18e393d301d7a56c150a8ab84093_a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e","order_match_id":"1385519ca199f1b39bb89caac062fe3a342f18e393d301d7a56c150a8ab84093_a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e","status":"completed"}',0,'ORDER_MATCH_UPDATE');
+INSERT INTO messages VALUES(32,NULL,310004,'insert','btcpays','{"block_index":310004,"btc_amount":50000000,"destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","order_match_id":"1385519ca199f1b39bb89caac062fe3a342f18e393d301d7a56c150a8ab84093_a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e","source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"06448effa4c26f1101b315b2dbe3d2b7b888ca18f5755f4365c97215a6c760ac","tx_index":5}',0,'BTC_PAY');
+INSERT INTO messages VALUES(33,NULL,310004,'parse','transactions','{"supported":true,"tx_hash":"06448effa4c26f1101b315b2dbe3d2b7b888ca18f5755f4365c97215a6c760ac","tx_index":5}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(34,NULL,310004,'parse','blocks','{"block_index":310004,"ledger_hash":"943a23e317f71981b24d636cae98f495b2bb00c949b1603a778eb7500894c844","messages_hash":"9f6909b8c5d78e55d34f7745c22743903c3f785b1ef283554b5f878dfb56c07f","txlist_hash":"be04682401f137d4d02c7539d1c776bbc76263dea1bb88fc95197128ec1a700f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(35,NULL,310004,'insert','blocks','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(36,NULL,310005,'insert','transactions','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"btc_amount":0,"data":"000000140000000000004767000000003b9aca000100000000000000000000","destination":"","fee":6800,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"57b34dae586111eefeecae4d16f6d20d6447efa974b72931f7b2cd0f39890406","tx_index":6}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(37,NULL,310005,'insert','debits','{"action":"issuance fee","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310005,"event":"57b34dae586111eefeecae4d16f6d20d6447efa974b72931f7b2cd0f39890406","quantity":50000000,"tx_index":6}',0,'DEBIT');
+INSERT INTO messages VALUES(38,NULL,310005,'insert','assets','{"asset_id":"18279","asset_longname":null,"asset_name":"BBBB","block_index":310005}',0,'ASSET_CREATION');
+INSERT INTO messages VALUES(39,NULL,310005,'insert','issuances','{"asset":"BBBB","asset_longname":null,"block_index":310005,"call_date":0,"call_price":0.0,"callable":false,"description":"","divisible":true,"fee_paid":50000000,"issuer":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","locked":false,"quantity":1000000000,"reset":false,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","transfer":false,"tx_hash":"57b34dae586111eefeecae4d16f6d20d6447efa974b72931f7b2cd0f39890406","tx_index":6}',0,'ASSET_ISSUANCE');
+INSERT INTO messages VALUES(40,NULL,310005,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBB","block_index":310005,"calling_function":"issuance","event":"57b34dae586111eefeecae4d16f6d20d6447efa974b72931f7b2cd0f39890406","quantity":1000000000,"tx_index":6}',0,'CREDIT');
+INSERT INTO messages VALUES(41,NULL,310005,'parse','transactions','{"supported":true,"tx_hash":"57b34dae586111eefeecae4d16f6d20d6447efa974b72931f7b2cd0f39890406","tx_index":6}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(42,NULL,310005,'parse','blocks','{"block_index":310005,"ledger_hash":"0c5f3dd2d439a571eec03583442fb051bedf5bc0b0ede92012922b27847af2a1","messages_hash":"14056368108692b234d1f9b7f65cf905ea4ce658789e0a79a3032a9e16bb4ab9","txlist_hash":"03c8d26098b8e49a297c104f22af44a622378afa711195bd8b91d46f01d68d65"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(43,NULL,310005,'insert','blocks','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(44,NULL,310006,'insert','transactions','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"btc_amount":0,"data":"00000014000000000000476800000000000186a00000000000000000000006666f6f626172","destination":"","fee":6800,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"6163ab5e7282e43a2f07a146d28b4b45c55820ee541881bc98d2592f4e6ba975","tx_index":7}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(45,NULL,310006,'insert','debits','{"action":"issuance fee","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310006,"event":"6163ab5e7282e43a2f07a146d28b4b45c55820ee541881bc98d2592f4e6ba975","quantity":50000000,"tx_index":7}',0,'DEBIT');
+INSERT INTO messages VALUES(46,NULL,310006,'insert','assets','{"asset_id":"18280","asset_longname":null,"asset_name":"BBBC","block_index":310006}',0,'ASSET_CREATION');
+INSERT INTO messages VALUES(47,NULL,310006,'insert','issuances','{"asset":"BBBC","asset_longname":null,"block_index":310006,"call_date":0,"call_price":0.0,"callable":false,"description":"foobar","divisible":false,"fee_paid":50000000,"issuer":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","locked":false,"quantity":100000,"reset":false,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","transfer":false,"tx_hash":"6163ab5e7282e43a2f07a146d28b4b45c55820ee541881bc98d2592f4e6ba975","tx_index":7}',0,'ASSET_ISSUANCE');
+INSERT INTO messages VALUES(48,NULL,310006,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBC","block_index":310006,"calling_function":"issuance","event":"6163ab5e7282e43a2f07a146d28b4b45c55820ee541881bc98d2592f4e6ba975","quantity":100000,"tx_index":7}',0,'CREDIT');
+INSERT INTO messages VALUES(49,NULL,310006,'parse','transactions','{"supported":true,"tx_hash":"6163ab5e7282e43a2f07a146d28b4b45c55820ee541881bc98d2592f4e6ba975","tx_index":7}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(50,NULL,310006,'parse','blocks','{"block_index":310006,"ledger_hash":"377fe894d79d60b011958ed747908b6009c5e0261fa177caefc664cb8db4c74b","messages_hash":"bd4d9db136434d836e9c7e435e56e44fa3ff5c3b1cf93fd0302f617a4b812347","txlist_hash":"079ec7423e2fe87820626aee8980e236a78e7d51b453a739fb5768d9d520bef6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(51,NULL,310006,'insert','blocks','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(52,NULL,310007,'insert','transactions','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"btc_amount":1000,"data":"00000000000000000000476700000000003d0900","destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","fee":7650,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"8972d4a117a0c4161ddf2bcdeb3877e0ad4cbf9cb5ce2be3411c69eedc9f718b","tx_index":8}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(53,NULL,310007,'insert','debits','{"action":"send","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBB","block_index":310007,"event":"8972d4a117a0c4161ddf2bcdeb3877e0ad4cbf9cb5ce2be3411c69eedc9f718b","quantity":4000000,"tx_index":8}',0,'DEBIT');
+INSERT INTO messages VALUES(54,NULL,310007,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"BBBB","block_index":310007,"calling_function":"send","event":"8972d4a117a0c4161ddf2bcdeb3877e0ad4cbf9cb5ce2be3411c69eedc9f718b","quantity":4000000,"tx_index":8}',0,'CREDIT');
+INSERT INTO messages VALUES(55,NULL,310007,'insert','sends','{"asset":"BBBB","block_index":310007,"destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","quantity":4000000,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"8972d4a117a0c4161ddf2bcdeb3877e0ad4cbf9cb5ce2be3411c69eedc9f718b","tx_index":8}',0,'SEND');
+INSERT INTO messages VALUES(56,NULL,310007,'parse','transactions','{"supported":true,"tx_hash":"8972d4a117a0c4161ddf2bcdeb3877e0ad4cbf9cb5ce2be3411c69eedc9f718b","tx_index":8}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(57,NULL,310007,'parse','blocks','{"block_index":310007,"ledger_hash":"4be55eb54e78e829306dfa31248b3073d311f49da420d9844f9aedabfbd296e3","messages_hash":"0483b397712a1597fda79b43b8d2e320e19089c073d98a94f8f31d4bda960bc0","txlist_hash":"d57db7ce89eeea61f270e7c676b38d3574c52166322cb0e287f1857a7d085e5a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(58,NULL,310007,'insert','blocks','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(59,NULL,310008,'insert','transactions','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"btc_amount":1000,"data":"000000000000000000004768000000000000020e","destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","fee":7650,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"3f49e685b22a7cd1a4d20bb7ca9a3f1ec4e593bc6e60c67037de2aab8b992391","tx_index":9}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(60,NULL,310008,'insert','debits','{"action":"send","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBC","block_index":310008,"event":"3f49e685b22a7cd1a4d20bb7ca9a3f1ec4e593bc6e60c67037de2aab8b992391","quantity":526,"tx_index":9}',0,'DEBIT');
+INSERT INTO messages VALUES(61,NULL,310008,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"BBBC","block_index":310008,"calling_function":"send","event":"3f49e685b22a7cd1a4d20bb7ca9a3f1ec4e593bc6e60c67037de2aab8b992391","quantity":526,"tx_index":9}',0,'CREDIT');
+INSERT INTO messages VALUES(62,NULL,310008,'insert','sends','{"asset":"BBBC","block_index":310008,"destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","quantity":526,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"3f49e685b22a7cd1a4d20bb7ca9a3f1ec4e593bc6e60c67037de2aab8b992391","tx_index":9}',0,'SEND');
+INSERT INTO messages VALUES(63,NULL,310008,'parse','transactions','{"supported":true,"tx_hash":"3f49e685b22a7cd1a4d20bb7ca9a3f1ec4e593bc6e60c67037de2aab8b992391","tx_index":9}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(64,NULL,310008,'parse','blocks','{"block_index":310008,"ledger_hash":"1248da848479b90f9dada38eaa02b9fe1226859e6ed1e3c4a121172786178dea","messages_hash":"1090df77ae250c237887d69ec32aa9ce3978b820f31f257743be73497a03e395","txlist_hash":"8727f3f9af7958daaecda9f2cef1bad0303d631cf9f8418636cf130581e4bb79"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(65,NULL,310008,'insert','blocks','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(66,NULL,310009,'insert','transactions','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"btc_amount":0,"data":"00000032000000000000025800000000000047670000000000000001","destination":"","fee":6800,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"6aa6c552e5a302b056768aed88aa8da6e9f78def669d5203904719e15ff1ac29","tx_index":10}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(67,NULL,310009,'insert','debits','{"action":"dividend","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310009,"event":"6aa6c552e5a302b056768aed88aa8da6e9f78def669d5203904719e15ff1ac29","quantity":24,"tx_index":10}',0,'DEBIT');
+INSERT INTO messages VALUES(68,NULL,310009,'insert','debits','{"action":"dividend fee","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310009,"event":"6aa6c552e5a302b056768aed88aa8da6e9f78def669d5203904719e15ff1ac29","quantity":20000,"tx_index":10}',0,'DEBIT');
+INSERT INTO messages VALUES(69,NULL,310009,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"XCP","block_index":310009,"calling_function":"dividend","event":"6aa6c552e5a302b056768aed88aa8da6e9f78def669d5203904719e15ff1ac29","quantity":24,"tx_index":10}',0,'CREDIT');
+INSERT INTO messages VALUES(70,NULL,310009,'insert','dividends','{"asset":"BBBB","block_index":310009,"dividend_asset":"XCP","fee_paid":20000,"quantity_per_unit":600,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"6aa6c552e5a302b056768aed88aa8da6e9f78def669d5203904719e15ff1ac29","tx_index":10}',0,'ASSET_DIVIDEND');
+INSERT INTO messages VALUES(71,NULL,310009,'parse','transactions','{"supported":true,"tx_hash":"6aa6c552e5a302b056768aed88aa8da6e9f78def669d5203904719e15ff1ac29","tx_index":10}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(72,NULL,310009,'parse','blocks','{"block_index":310009,"ledger_hash":"1e1b07f218127eccdfab98a4bc127ce185cda15314e72328dfe10eb8f2f18726","messages_hash":"74ca0349f3017a1f66ef461140c650f4d543dcd443ee6557fc2b5644f1617400","txlist_hash":"baa3b08e70e0db5ecf913bb99da662ec3dc04a5650f99d2d36408eb8ed6cc4ea"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(73,NULL,310009,'insert','blocks','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(74,NULL,310010,'insert','transactions','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"btc_amount":0,"data":"00000032000000000000032000000000000047680000000000000001","destination":"","fee":6800,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"8606cbcb3aaa438e207e9ef279191f6f100e34d479b1985268525e32a91c953e","tx_index":11}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(75,NULL,310010,'insert','debits','{"action":"dividend","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310010,"event":"8606cbcb3aaa438e207e9ef279191f6f100e34d479b1985268525e32a91c953e","quantity":420800,"tx_index":11}',0,'DEBIT');
+INSERT INTO messages VALUES(76,NULL,310010,'insert','debits','{"action":"dividend fee","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310010,"event":"8606cbcb3aaa438e207e9ef279191f6f100e34d479b1985268525e32a91c953e","quantity":20000,"tx_index":11}',0,'DEBIT');
+INSERT INTO messages VALUES(77,NULL,310010,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"XCP","block_index":310010,"calling_function":"dividend","event":"8606cbcb3aaa438e207e9ef279191f6f100e34d479b1985268525e32a91c953e","quantity":420800,"tx_index":11}',0,'CREDIT');
+INSERT INTO messages VALUES(78,NULL,310010,'insert','dividends','{"asset":"BBBC","block_index":310010,"dividend_asset":"XCP","fee_paid":20000,"quantity_per_unit":800,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"8606cbcb3aaa438e207e9ef279191f6f100e34d479b1985268525e32a91c953e","tx_index":11}',0,'ASSET_DIVIDEND');
+INSERT INTO messages VALUES(79,NULL,310010,'parse','transactions','{"supported":true,"tx_hash":"8606cbcb3aaa438e207e9ef279191f6f100e34d479b1985268525e32a91c953e","tx_index":11}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(80,NULL,310010,'parse','blocks','{"block_index":310010,"ledger_hash":"03be7c3d8dc521277625164e3e828be106672cba205129c014ce7771a3b8730f","messages_hash":"3d53dacffbd01aea7f6de2017803318dd4f2e3dd68c172d073608c058c185089","txlist_hash":"5def9d6ed9fcf82c7ec9dbc2247657f349ec4df0b75dac4444f7ff90e24f0955"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(81,NULL,310010,'insert','blocks','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(82,NULL,310011,'insert','transactions','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"btc_amount":0,"data":"0000001e52bb3300405900000000000005f5e0ff09556e69742054657374","destination":"","fee":6800,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"47a25bd63a47c61ca2709279bb5c1dc8695f0e93926bf659038be64e6a1c4060","tx_index":12}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(83,NULL,310011,'insert','broadcasts','{"block_index":310011,"fee_fraction_int":99999999,"locked":false,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","text":"Unit Test","timestamp":1388000000,"tx_hash":"47a25bd63a47c61ca2709279bb5c1dc8695f0e93926bf659038be64e6a1c4060","tx_index":12,"value":100.0}',0,'BROADCAST');
+INSERT INTO messages VALUES(84,NULL,310011,'parse','transactions','{"supported":true,"tx_hash":"47a25bd63a47c61ca2709279bb5c1dc8695f0e93926bf659038be64e6a1c4060","tx_index":12}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(85,NULL,310011,'parse','blocks','{"block_index":310011,"ledger_hash":"db6d49ef7cfb461f9431b2e712f694f0747012ae28f3684e0d41476f77fab667","messages_hash":"7ecbc512ec95ddd61fcdc326dd0a773a627a329892228506a957c54bf3bf6a9e","txlist_hash":"f6d1a346abbb2adae7dd7fe6ddd94061bcdae3ed30bd091958d445c8b5f57f4c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(86,NULL,310011,'insert','blocks','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(87,NULL,310012,'insert','transactions','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"btc_amount":1000,"data":"00000028000052bb33640000000002faf08000000000017d7840000000000000000000003b100000000a","destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"5c49e06f8ddf9cc0f83541550664bb00075a2f01df493278097066462497af16","tx_index":13}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(88,NULL,310012,'insert','debits','{"action":"bet","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310012,"event":"5c49e06f8ddf9cc0f83541550664bb00075a2f01df493278097066462497af16","quantity":50000000,"tx_index":13}',0,'DEBIT');
+INSERT INTO messages VALUES(89,NULL,310012,'insert','bets','{"bet_type":0,"block_index":310012,"counterwager_quantity":25000000,"counterwager_remaining":25000000,"deadline":1388000100,"expiration":10,"expire_index":310022,"fee_fraction_int":99999999.0,"feed_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":15120,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":0.0,"tx_hash":"5c49e06f8ddf9cc0f83541550664bb00075a2f01df493278097066462497af16","tx_index":13,"wager_quantity":50000000,"wager_remaining":50000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(90,NULL,310012,'parse','transactions','{"supported":true,"tx_hash":"5c49e06f8ddf9cc0f83541550664bb00075a2f01df493278097066462497af16","tx_index":13}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(91,NULL,310012,'parse','blocks','{"block_index":310012,"ledger_hash":"ac399d193def488d3457876edef42dd651b30c976025c3d6f810e4d37c88c822","messages_hash":"9c6c273607bbb6fed258f56ebdf7090ee5a5d45fa7e6736a34197663771cc343","txlist_hash":"273ce70d30b249ba5afb8382ddf7ded2d0849044d519fb48224a6ea69b7ba6dc"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(92,NULL,310012,'insert','blocks','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(93,NULL,310013,'insert','transactions','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"btc_amount":1000,"data":"00000028000152bb336400000000017d78400000000002793d60000000000000000000003b100000000a","destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"813e45480753e39c6ea548efd6b77f830120a41ac3b9bd37a4470b14e83301a3","tx_index":14}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(94,NULL,310013,'update','orders','{"status":"expired","tx_hash":"1385519ca199f1b39bb89caac062fe3a342f18e393d301d7a56c150a8ab84093"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(95,NULL,310013,'insert','order_expirations','{"block_index":310013,"order_hash":"1385519ca199f1b39bb89caac062fe3a342f18e393d301d7a56c150a8ab84093","source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3"}',0,'ORDER_EXPIRATION');
+INSERT INTO messages VALUES(96,NULL,310013,'insert','debits','{"action":"bet","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310013,"event":"813e45480753e39c6ea548efd6b77f830120a41ac3b9bd37a4470b14e83301a3","quantity":25000000,"tx_index":14}',0,'DEBIT');
+INSERT INTO messages VALUES(97,NULL,310013,'insert','bets','{"bet_type":1,"block_index":310013,"counterwager_quantity":41500000,"counterwager_remaining":41500000,"deadline":1388000100,"expiration":10,"expire_index":310023,"fee_fraction_int":99999999.0,"feed_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":15120,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":0.0,"tx_hash":"813e45480753e39c6ea548efd6b77f830120a41ac3b9bd37a4470b14e83301a3","tx_index":14,"wager_quantity":25000000,"wager_remaining":25000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(98,NULL,310013,'update','bets','{"counterwager_remaining":4250000,"status":"open","tx_hash":"5c49e06f8ddf9cc0f83541550664bb00075a2f01df493278097066462497af16","wager_remaining":8500000}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(99,NULL,310013,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310013,"calling_function":"filled","event":"813e45480753e39c6ea548efd6b77f830120a41ac3b9bd37a4470b14e83301a3","quantity":4250000,"tx_index":14}',0,'CREDIT');
+INSERT INTO messages VALUES(100,NULL,310013,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"813e45480753e39c6ea548efd6b77f830120a41ac3b9bd37a4470b14e83301a3","wager_remaining":4250000}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(101,NULL,310013,'insert','bet_matches','{"backward_quantity":20750000,"block_index":310012,"deadline":1388000100,"fee_fraction_int":99999999,"feed_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","forward_quantity":41500000,"id":"5c49e06f8ddf9cc0f83541550664bb00075a2f01df493278097066462497af16_813e45480753e39c6ea548efd6b77f830120a41ac3b9bd37a4470b14e83301a3","initial_value":100.0,"leverage":15120,"match_expire_index":310022,"status":"pending","target_value":0.0,"tx0_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx0_bet_type":0,"tx0_block_index":310012,"tx0_expiration":10,"tx0_hash":"5c49e06f8ddf9cc0f83541550664bb00075a2f01df493278097066462497af16","tx0_index":13,"tx1_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx1_bet_type":1,"tx1_block_index":310013,"tx1_expiration":10,"tx1_hash":"813e45480753e39c6ea548efd6b77f830120a41ac3b9bd37a4470b14e83301a3","tx1_index":14}',0,'BET_MATCH');
+INSERT INTO messages VALUES(102,NULL,310013,'parse','transactions','{"supported":true,"tx_hash":"813e45480753e39c6ea548efd6b77f830120a41ac3b9bd37a4470b14e83301a3","tx_index":14}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(103,NULL,310013,'parse','blocks','{"block_index":310013,"ledger_hash":"f6fd6f6280b1c580abe8e31de28bfa0f269d453068946733cad69d29f6874936","messages_hash":"d31725c5efb73972745475a8c76fa70e0780d81ab89ecd2cbd38c1e2dc128e21","txlist_hash":"ce4d93afd619a9f22326d72b5ae6c10b24d3075399374184463f65d489a57c51"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(104,NULL,310013,'insert','blocks','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(105,NULL,310014,'insert','transactions','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"btc_amount":1000,"data":"00000028000052bb33640000000008f0d1800000000014dc93800000000000000000000013b00000000a","destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"33fdca6b108f99ffb56d590f55f9d19c7d16fe83c096b9fbbf71eabeda826a41","tx_index":15}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(106,NULL,310014,'update','orders','{"status":"expired","tx_hash":"a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(107,NULL,310014,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310014,"calling_function":"cancel order","event":"a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e","quantity":5000000,"tx_index":0}',0,'CREDIT');
+INSERT INTO messages VALUES(108,NULL,310014,'insert','order_expirations','{"block_index":310014,"order_hash":"a2e93083b871e68cb89e216f9a99c4c6aea1eb92cbdbafc5b4b0e160c19c517e","source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3"}',0,'ORDER_EXPIRATION');
+INSERT INTO messages VALUES(109,NULL,310014,'insert','debits','{"action":"bet","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310014,"event":"33fdca6b108f99ffb56d590f55f9d19c7d16fe83c096b9fbbf71eabeda826a41","quantity":150000000,"tx_index":15}',0,'DEBIT');
+INSERT INTO messages VALUES(110,NULL,310014,'insert','bets','{"bet_type":0,"block_index":310014,"counterwager_quantity":350000000,"counterwager_remaining":350000000,"deadline":1388000100,"expiration":10,"expire_index":310024,"fee_fraction_int":99999999.0,"feed_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":5040,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":0.0,"tx_hash":"33fdca6b108f99ffb56d590f55f9d19c7d16fe83c096b9fbbf71eabeda826a41","tx_index":15,"wager_quantity":150000000,"wager_remaining":150000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(111,NULL,310014,'parse','transactions','{"supported":true,"tx_hash":"33fdca6b108f99ffb56d590f55f9d19c7d16fe83c096b9fbbf71eabeda826a41","tx_index":15}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(112,NULL,310014,'parse','blocks','{"block_index":310014,"ledger_hash":"0c52d56c6f7c25da7b757aba30e890e9eff402155b5497a5420e13e69b7cb54b","messages_hash":"b20b444de969c080c6a742769b8fc09fb899f7a962d04930fdb1eb91f2a8565b","txlist_hash":"7df6ac77f91e828339a1f92ce8197c74ff120f6c00d180bdb19a91f7da14a83a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(113,NULL,310014,'insert','blocks','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(114,NULL,310015,'insert','transactions','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"btc_amount":1000,"data":"00000028000152bb33640000000014dc93800000000008f0d1800000000000000000000013b00000000a","destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"22375d61ad5cb70e45ca8843ccffa0abe11b028351352d5da874d246c834ab6f","tx_index":16}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(115,NULL,310015,'insert','debits','{"action":"bet","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310015,"event":"22375d61ad5cb70e45ca8843ccffa0abe11b028351352d5da874d246c834ab6f","quantity":350000000,"tx_index":16}',0,'DEBIT');
+INSERT INTO messages VALUES(116,NULL,310015,'insert','bets','{"bet_type":1,"block_index":310015,"counterwager_quantity":150000000,"counterwager_remaining":150000000,"deadline":1388000100,"expiration":10,"expire_index":310025,"fee_fraction_int":99999999.0,"feed_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":5040,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":0.0,"tx_hash":"22375d61ad5cb70e45ca8843ccffa0abe11b028351352d5da874d246c834ab6f","tx_index":16,"wager_quantity":350000000,"wager_remaining":350000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(117,NULL,310015,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310015,"calling_function":"filled","event":"22375d61ad5cb70e45ca8843ccffa0abe11b028351352d5da874d246c834ab6f","quantity":0,"tx_index":16}',0,'CREDIT');
+INSERT INTO messages VALUES(118,NULL,310015,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"33fdca6b108f99ffb56d590f55f9d19c7d16fe83c096b9fbbf71eabeda826a41","wager_remaining":0}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(119,NULL,310015,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310015,"calling_function":"filled","event":"22375d61ad5cb70e45ca8843ccffa0abe11b028351352d5da874d246c834ab6f","quantity":0,"tx_index":16}',0,'CREDIT');
+INSERT INTO messages VALUES(120,NULL,310015,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"22375d61ad5cb70e45ca8843ccffa0abe11b028351352d5da874d246c834ab6f","wager_remaining":0}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(121,NULL,310015,'insert','bet_matches','{"backward_quantity":350000000,"block_index":310014,"deadline":1388000100,"fee_fraction_int":99999999,"feed_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","forward_quantity":150000000,"id":"33fdca6b108f99ffb56d590f55f9d19c7d16fe83c096b9fbbf71eabeda826a41_22375d61ad5cb70e45ca8843ccffa0abe11b028351352d5da874d246c834ab6f","initial_value":100.0,"leverage":5040,"match_expire_index":310024,"status":"pending","target_value":0.0,"tx0_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx0_bet_type":0,"tx0_block_index":310014,"tx0_expiration":10,"tx0_hash":"33fdca6b108f99ffb56d590f55f9d19c7d16fe83c096b9fbbf71eabeda826a41","tx0_index":15,"tx1_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx1_bet_type":1,"tx1_block_index":310015,"tx1_expiration":10,"tx1_hash":"22375d61ad5cb70e45ca8843ccffa0abe11b028351352d5da874d246c834ab6f","tx1_index":16}',0,'BET_MATCH');
+INSERT INTO messages VALUES(122,NULL,310015,'parse','transactions','{"supported":true,"tx_hash":"22375d61ad5cb70e45ca8843ccffa0abe11b028351352d5da874d246c834ab6f","tx_index":16}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(123,NULL,310015,'parse','blocks','{"block_index":310015,"ledger_hash":"03cd020f708d5f082f5b63e3c1f58e5f25d564a60699ae0f23471115d9e37d5e","messages_hash":"d8c072c161c3ba901c9d2b06221e5e36b47cc66cf910dabc2aa7d75927ad0c9d","txlist_hash":"45379e27de14058cb9100cc29417da1e5b2534e4434bfcd074c811324e46fd06"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(124,NULL,310015,'insert','blocks','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(125,NULL,310016,'insert','transactions','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"btc_amount":1000,"data":"00000028000252bb33c8000000002cb417800000000026be36803ff0000000000000000013b00000000a","destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"5e0cd8d81531e656dc3a4ae4b7edfd1bec48e455ed0bd69a4a3c22c0c08bbede","tx_index":17}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(126,NULL,310016,'insert','debits','{"action":"bet","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310016,"event":"5e0cd8d81531e656dc3a4ae4b7edfd1bec48e455ed0bd69a4a3c22c0c08bbede","quantity":750000000,"tx_index":17}',0,'DEBIT');
+INSERT INTO messages VALUES(127,NULL,310016,'insert','bets','{"bet_type":2,"block_index":310016,"counterwager_quantity":650000000,"counterwager_remaining":650000000,"deadline":1388000200,"expiration":10,"expire_index":310026,"fee_fraction_int":99999999.0,"feed_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":5040,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":1.0,"tx_hash":"5e0cd8d81531e656dc3a4ae4b7edfd1bec48e455ed0bd69a4a3c22c0c08bbede","tx_index":17,"wager_quantity":750000000,"wager_remaining":750000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(128,NULL,310016,'parse','transactions','{"supported":true,"tx_hash":"5e0cd8d81531e656dc3a4ae4b7edfd1bec48e455ed0bd69a4a3c22c0c08bbede","tx_index":17}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(129,NULL,310016,'parse','blocks','{"block_index":310016,"ledger_hash":"d95cf7b2af3f578fc64450d484323075e81999a868918d3dbf89160269d68980","messages_hash":"684fde58a199a4d55bc79612e1f970b2b6b819a513762defdd2629c99fe494a1","txlist_hash":"92ed43fd80e4e254ebff7dc725c32962beb79be51dfe8d62d12bd8e123320532"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(130,NULL,310016,'insert','blocks','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(131,NULL,310017,'insert','transactions','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"btc_amount":1000,"data":"00000028000352bb33c80000000026be3680000000002cb417803ff0000000000000000013b00000000a","destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","fee":7650,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"07d3cbac831b5edb261b1445071e307949d7825565b8d5c8cba1d720d5c7ab4a","tx_index":18}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(132,NULL,310017,'insert','debits','{"action":"bet","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310017,"event":"07d3cbac831b5edb261b1445071e307949d7825565b8d5c8cba1d720d5c7ab4a","quantity":650000000,"tx_index":18}',0,'DEBIT');
+INSERT INTO messages VALUES(133,NULL,310017,'insert','bets','{"bet_type":3,"block_index":310017,"counterwager_quantity":750000000,"counterwager_remaining":750000000,"deadline":1388000200,"expiration":10,"expire_index":310027,"fee_fraction_int":99999999.0,"feed_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","leverage":5040,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","target_value":1.0,"tx_hash":"07d3cbac831b5edb261b1445071e307949d7825565b8d5c8cba1d720d5c7ab4a","tx_index":18,"wager_quantity":650000000,"wager_remaining":650000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(134,NULL,310017,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310017,"calling_function":"filled","event":"07d3cbac831b5edb261b1445071e307949d7825565b8d5c8cba1d720d5c7ab4a","quantity":0,"tx_index":18}',0,'CREDIT');
+INSERT INTO messages VALUES(135,NULL,310017,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"5e0cd8d81531e656dc3a4ae4b7edfd1bec48e455ed0bd69a4a3c22c0c08bbede","wager_remaining":0}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(136,NULL,310017,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310017,"calling_function":"filled","event":"07d3cbac831b5edb261b1445071e307949d7825565b8d5c8cba1d720d5c7ab4a","quantity":0,"tx_index":18}',0,'CREDIT');
+INSERT INTO messages VALUES(137,NULL,310017,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"07d3cbac831b5edb261b1445071e307949d7825565b8d5c8cba1d720d5c7ab4a","wager_remaining":0}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(138,NULL,310017,'insert','bet_matches','{"backward_quantity":650000000,"block_index":310016,"deadline":1388000200,"fee_fraction_int":99999999,"feed_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","forward_quantity":750000000,"id":"5e0cd8d81531e656dc3a4ae4b7edfd1bec48e455ed0bd69a4a3c22c0c08bbede_07d3cbac831b5edb261b1445071e307949d7825565b8d5c8cba1d720d5c7ab4a","initial_value":100.0,"leverage":5040,"match_expire_index":310026,"status":"pending","target_value":1.0,"tx0_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx0_bet_type":2,"tx0_block_index":310016,"tx0_expiration":10,"tx0_hash":"5e0cd8d81531e656dc3a4ae4b7edfd1bec48e455ed0bd69a4a3c22c0c08bbede","tx0_index":17,"tx1_address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","tx1_bet_type":3,"tx1_block_index":310017,"tx1_expiration":10,"tx1_hash":"07d3cbac831b5edb261b1445071e307949d7825565b8d5c8cba1d720d5c7ab4a","tx1_index":18}',0,'BET_MATCH');
+INSERT INTO messages VALUES(139,NULL,310017,'parse','transactions','{"supported":true,"tx_hash":"07d3cbac831b5edb261b1445071e307949d7825565b8d5c8cba1d720d5c7ab4a","tx_index":18}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(140,NULL,310017,'parse','blocks','{"block_index":310017,"ledger_hash":"725783dab777f54b11be66fdf47280852fd6b4d8a9b9f2fbba9e92056538ce73","messages_hash":"141e4de5d1572c6001982c0d980d2276a7b805bc6e95b8520cd66edf8a97b593","txlist_hash":"f21d857139bdc083724362346aeaa455f82caf0fdf13f2ca880db6dbc6e047b2"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(141,NULL,310017,'insert','blocks','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(142,NULL,310018,'insert','transactions','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"btc_amount":0,"data":"0000001e52bb33324058f7256ffc115e004c4b4009556e69742054657374","destination":"","fee":6800,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"5a057227535fcb5aeaf56ec919321667cc45f4fa7d11bf940d22abaad909cd66","tx_index":19}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(143,NULL,310018,'insert','broadcasts','{"block_index":310018,"fee_fraction_int":5000000,"locked":false,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","text":"Unit Test","timestamp":1388000050,"tx_hash":"5a057227535fcb5aeaf56ec919321667cc45f4fa7d11bf940d22abaad909cd66","tx_index":19,"value":99.86166}',0,'BROADCAST');
+INSERT INTO messages VALUES(144,NULL,310018,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310018,"calling_function":"bet settled: liquidated for bear","event":"5a057227535fcb5aeaf56ec919321667cc45f4fa7d11bf940d22abaad909cd66","quantity":59137500,"tx_index":19}',0,'CREDIT');
+INSERT INTO messages VALUES(145,NULL,310018,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310018,"calling_function":"feed fee","event":"5a057227535fcb5aeaf56ec919321667cc45f4fa7d11bf940d22abaad909cd66","quantity":3112500,"tx_index":19}',0,'CREDIT');
+INSERT INTO messages VALUES(146,NULL,310018,'insert','bet_match_resolutions','{"bear_credit":59137500,"bet_match_id":"5c49e06f8ddf9cc0f83541550664bb00075a2f01df493278097066462497af16_813e45480753e39c6ea548efd6b77f830120a41ac3b9bd37a4470b14e83301a3","bet_match_type_id":1,"block_index":310018,"bull_credit":0,"escrow_less_fee":null,"fee":3112500,"settled":false,"winner":null}',0,'BET_MATCH_RESOLUTON');
+INSERT INTO messages VALUES(147,NULL,310018,'update','bet_matches','{"id":"5c49e06f8ddf9cc0f83541550664bb00075a2f01df493278097066462497af16_813e45480753e39c6ea548efd6b77f830120a41ac3b9bd37a4470b14e83301a3","status":"settled: liquidated for bear"}',0,'BET_MATCH_UPDATE');
+INSERT INTO messages VALUES(148,NULL,310018,'parse','transactions','{"supported":true,"tx_hash":"5a057227535fcb5aeaf56ec919321667cc45f4fa7d11bf940d22abaad909cd66","tx_index":19}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(149,NULL,310018,'parse','blocks','{"block_index":310018,"ledger_hash":"05ad248fa836b50ce72a2f61c7465a455cc48ac92f2c0ff9bb9f94e69081d1e7","messages_hash":"502d5a096e80766d8d947d832fb1e88e57357b2feaae0912ec783ce3147a85b1","txlist_hash":"3e8a8361086aee82a316c2a041d8f4e1d7b4000c3e18263ca84a3267a811ee7d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(150,NULL,310018,'insert','blocks','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(151,NULL,310019,'insert','transactions','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"btc_amount":0,"data":"0000001e52bb3365405915f3b645a1cb004c4b4009556e69742054657374","destination":"","fee":6800,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"0baab7280b14d7d8597dc5f570682654fac0453b0b4c374d45cef3d21a7ceb17","tx_index":20}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(152,NULL,310019,'insert','broadcasts','{"block_index":310019,"fee_fraction_int":5000000,"locked":false,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","text":"Unit Test","timestamp":1388000101,"tx_hash":"0baab7280b14d7d8597dc5f570682654fac0453b0b4c374d45cef3d21a7ceb17","tx_index":20,"value":100.343}',0,'BROADCAST');
+INSERT INTO messages VALUES(153,NULL,310019,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310019,"calling_function":"bet settled","event":"0baab7280b14d7d8597dc5f570682654fac0453b0b4c374d45cef3d21a7ceb17","quantity":159300000,"tx_index":20}',0,'CREDIT');
+INSERT INTO messages VALUES(154,NULL,310019,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310019,"calling_function":"bet settled","event":"0baab7280b14d7d8597dc5f570682654fac0453b0b4c374d45cef3d21a7ceb17","quantity":315700000,"tx_index":20}',0,'CREDIT');
+INSERT INTO messages VALUES(155,NULL,310019,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310019,"calling_function":"feed fee","event":"0baab7280b14d7d8597dc5f570682654fac0453b0b4c374d45cef3d21a7ceb17","quantity":25000000,"tx_index":20}',0,'CREDIT');
+INSERT INTO messages VALUES(156,NULL,310019,'insert','bet_match_resolutions','{"bear_credit":315700000,"bet_match_id":"33fdca6b108f99ffb56d590f55f9d19c7d16fe83c096b9fbbf71eabeda826a41_22375d61ad5cb70e45ca8843ccffa0abe11b028351352d5da874d246c834ab6f","bet_match_type_id":1,"block_index":310019,"bull_credit":159300000,"escrow_less_fee":null,"fee":25000000,"settled":true,"winner":null}',0,'BET_MATCH_RESOLUTON');
+INSERT INTO messages VALUES(157,NULL,310019,'update','bet_matches','{"id":"33fdca6b108f99ffb56d590f55f9d19c7d16fe83c096b9fbbf71eabeda826a41_22375d61ad5cb70e45ca8843ccffa0abe11b028351352d5da874d246c834ab6f","status":"settled"}',0,'BET_MATCH_UPDATE');
+INSERT INTO messages VALUES(158,NULL,310019,'parse','transactions','{"supported":true,"tx_hash":"0baab7280b14d7d8597dc5f570682654fac0453b0b4c374d45cef3d21a7ceb17","tx_index":20}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(159,NULL,310019,'parse','blocks','{"block_index":310019,"ledger_hash":"0ab8707bce7b77beecc32ad6124482cb561776ed245ce6dce08f5318e2cf396f","messages_hash":"445f1951bd294004e2343cfc7561599bcf0488901a051e4c2cf5dee8f4474eb6","txlist_hash":"d66ff9e099bc707b866c2595b0bb642657601a36ab06cafa070f18e9f3ad30e3"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(160,NULL,310019,'insert','blocks','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(161,NULL,310020,'insert','transactions','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"btc_amount":0,"data":"0000001e52bb33c94000000000000000004c4b4009556e69742054657374","destination":"","fee":6800,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"2b39f99114417cb4857c8c2c671b4bc3bc8b3e52865daa91a49ea6d9bdfb6402","tx_index":21}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(162,NULL,310020,'insert','broadcasts','{"block_index":310020,"fee_fraction_int":5000000,"locked":false,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","text":"Unit Test","timestamp":1388000201,"tx_hash":"2b39f99114417cb4857c8c2c671b4bc3bc8b3e52865daa91a49ea6d9bdfb6402","tx_index":21,"value":2.0}',0,'BROADCAST');
+INSERT INTO messages VALUES(163,NULL,310020,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310020,"calling_function":"bet settled: for notequal","event":"2b39f99114417cb4857c8c2c671b4bc3bc8b3e52865daa91a49ea6d9bdfb6402","quantity":1330000000,"tx_index":21}',0,'CREDIT');
+INSERT INTO messages VALUES(164,NULL,310020,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310020,"calling_function":"feed fee","event":"2b39f99114417cb4857c8c2c671b4bc3bc8b3e52865daa91a49ea6d9bdfb6402","quantity":70000000,"tx_index":21}',0,'CREDIT');
+INSERT INTO messages VALUES(165,NULL,310020,'insert','bet_match_resolutions','{"bear_credit":null,"bet_match_id":"5e0cd8d81531e656dc3a4ae4b7edfd1bec48e455ed0bd69a4a3c22c0c08bbede_07d3cbac831b5edb261b1445071e307949d7825565b8d5c8cba1d720d5c7ab4a","bet_match_type_id":5,"block_index":310020,"bull_credit":null,"escrow_less_fee":1330000000,"fee":70000000,"settled":null,"winner":"NotEqual"}',0,'BET_MATCH_RESOLUTON');
+INSERT INTO messages VALUES(166,NULL,310020,'update','bet_matches','{"id":"5e0cd8d81531e656dc3a4ae4b7edfd1bec48e455ed0bd69a4a3c22c0c08bbede_07d3cbac831b5edb261b1445071e307949d7825565b8d5c8cba1d720d5c7ab4a","status":"settled: for notequal"}',0,'BET_MATCH_UPDATE');
+INSERT INTO messages VALUES(167,NULL,310020,'parse','transactions','{"supported":true,"tx_hash":"2b39f99114417cb4857c8c2c671b4bc3bc8b3e52865daa91a49ea6d9bdfb6402","tx_index":21}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(168,NULL,310020,'parse','blocks','{"block_index":310020,"ledger_hash":"198edc4bf109549538a2f8f96714536a99a1568fe16fe4254881520474adc68d","messages_hash":"ff432d16380c967282cd5222c8626af85bacf13e3d85aef97b632192956598c1","txlist_hash":"3bd8ef01a2be7a5d817b535f19e456325bcf2d684ac25f09124d4582040fde54"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(169,NULL,310020,'insert','blocks','{"block_hash":"7c2460bb32c5749c856486393239bf7a0ac789587ac71f32e7237910da8097f2","block_index":310021,"block_time":310021000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(170,NULL,310021,'insert','transactions','{"block_hash":"7c2460bb32c5749c856486393239bf7a0ac789587ac71f32e7237910da8097f2","block_index":310021,"block_time":310021000,"btc_amount":0,"data":"0000000a00000000000047670000000002faf08000000000000000010000000002faf080000a0000000000000000","destination":"","fee":6800,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"19c6fe5cbf0be99ff3d469077e866e0f9fdc56901824b7fec89b0b523526e323","tx_index":22}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(171,NULL,310021,'insert','debits','{"action":"open order","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBB","block_index":310021,"event":"19c6fe5cbf0be99ff3d469077e866e0f9fdc56901824b7fec89b0b523526e323","quantity":50000000,"tx_index":22}',0,'DEBIT');
+INSERT INTO messages VALUES(172,NULL,310021,'insert','orders','{"block_index":310021,"expiration":10,"expire_index":310031,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":50000000,"get_remaining":50000000,"give_asset":"BBBB","give_quantity":50000000,"give_remaining":50000000,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"open","tx_hash":"19c6fe5cbf0be99ff3d469077e866e0f9fdc56901824b7fec89b0b523526e323","tx_index":22}',0,'OPEN_ORDER');
+INSERT INTO messages VALUES(173,NULL,310021,'parse','transactions','{"supported":true,"tx_hash":"19c6fe5cbf0be99ff3d469077e866e0f9fdc56901824b7fec89b0b523526e323","tx_index":22}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(174,NULL,310021,'parse','blocks','{"block_index":310021,"ledger_hash":"52482033c5c11ad24257707137b090606305497618e29050b2fdd3e13bc822ce","messages_hash":"20a39f221845b6f4e0eaa1ad4bc3a6e735d487cd6fba54ed30714d93ceededdd","txlist_hash":"7d74bbdb4057dc5d0e9b568e983df362b87bdacdddf2724b1ee4c42b6602bd47"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(175,NULL,310021,'insert','blocks','{"block_hash":"44435f9a99a0aa12a9bfabdc4cb8119f6ea6a6e1350d2d65445fb66a456db5fc","block_index":310022,"block_time":310022000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(176,NULL,310022,'insert','transactions','{"block_hash":"44435f9a99a0aa12a9bfabdc4cb8119f6ea6a6e1350d2d65445fb66a456db5fc","block_index":310022,"block_time":310022000,"btc_amount":100000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"3739350ed4c86474468cb1fed825b1ef141304d638b298867d0b2ae58c509c22","tx_index":23}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(177,NULL,310022,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310022,"calling_function":"burn","event":"3739350ed4c86474468cb1fed825b1ef141304d638b298867d0b2ae58c509c22","quantity":56999887262,"tx_index":23}',0,'CREDIT');
+INSERT INTO messages VALUES(178,NULL,310022,'insert','burns','{"block_index":310022,"burned":38000000,"earned":56999887262,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"3739350ed4c86474468cb1fed825b1ef141304d638b298867d0b2ae58c509c22","tx_index":23}',0,'BURN');
+INSERT INTO messages VALUES(179,NULL,310022,'parse','blocks','{"block_index":310022,"ledger_hash":"85d639cc8147885470da26d3c0470dba0eb8b6870d5941b12bcc4afb8fcd9af1","messages_hash":"a5a389ccb25f814327dbdf5f424767cbb80be0d0c05d0e7752d3fbe6164f071f","txlist_hash":"568bbeb4d12090c110442540d6f12734602dcf84ae5e331f0391a4a47857d059"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(180,NULL,310022,'insert','blocks','{"block_hash":"d8cf5bec1bbcab8ca4f495352afde3b6572b7e1d61b3976872ebb8e9d30ccb08","block_index":310023,"block_time":310023000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(181,NULL,310023,'insert','transactions','{"block_hash":"d8cf5bec1bbcab8ca4f495352afde3b6572b7e1d61b3976872ebb8e9d30ccb08","block_index":310023,"block_time":310023000,"btc_amount":1000,"data":"0000000000000000000047680000000000002710","destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","fee":7650,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","supported":true,"tx_hash":"72bd448eb70da9b7554d3b58a1e89356171578c847763af014b25c99e70cbb58","tx_index":24}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(182,NULL,310023,'update','bets','{"status":"expired","tx_hash":"5c49e06f8ddf9cc0f83541550664bb00075a2f01df493278097066462497af16"}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(183,NULL,310023,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"XCP","block_index":310023,"calling_function":"recredit wager remaining","event":"5c49e06f8ddf9cc0f83541550664bb00075a2f01df493278097066462497af16","quantity":8500000,"tx_index":0}',0,'CREDIT');
+INSERT INTO messages VALUES(184,NULL,310023,'insert','bet_expirations','{"bet_hash":"5c49e06f8ddf9cc0f83541550664bb00075a2f01df493278097066462497af16","bet_index":13,"block_index":310023,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3"}',0,'BET_EXPIRATION');
+INSERT INTO messages VALUES(185,NULL,310023,'insert','debits','{"action":"send","address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBC","block_index":310023,"event":"72bd448eb70da9b7554d3b58a1e89356171578c847763af014b25c99e70cbb58","quantity":10000,"tx_index":24}',0,'DEBIT');
+INSERT INTO messages VALUES(186,NULL,310023,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","asset":"BBBC","block_index":310023,"calling_function":"send","event":"72bd448eb70da9b7554d3b58a1e89356171578c847763af014b25c99e70cbb58","quantity":10000,"tx_index":24}',0,'CREDIT');
+INSERT INTO messages VALUES(187,NULL,310023,'insert','sends','{"asset":"BBBC","block_index":310023,"destination":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj_3","quantity":10000,"source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","status":"valid","tx_hash":"72bd448eb70da9b7554d3b58a1e89356171578c847763af014b25c99e70cbb58","tx_index":24}',0,'SEND');
+INSERT INTO messages VALUES(188,NULL,310023,'parse','transactions','{"supported":true,"tx_hash":"72bd448eb70da9b7554d3b58a1e89356171578c847763af014b25c99e70cbb58","tx_index":24}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(189,NULL,310023,'parse','blocks','{"block_index":310023,"ledger_hash":"eb62ce47d68491a84b9a29b92db2742021881f0274072f1bc39dfef08cd7a590","messages_hash":"7076a1e5280056ffbed986360f5e6985ef94abce4aed7cf01c3625ddb9c8e6f7","txlist_hash":"877a4d466f5f780e8103a42fb7771935ef57486ed7d74aa77757b9cb434893b3"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(190,NULL,310023,'insert','blocks','{"block_hash":"b03042b4e18a222b4c8d1e9e1970d93e6e2a2d41686d227ff8ecf0a839223dc5","block_index":310024,"block_time":310024000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(191,NULL,310024,'parse','blocks','{"block_index":310024,"ledger_hash":"45e73afbc34855b5cbd342a6fb77545e01f3ff4601a04c6dd25dff665aeff484","messages_hash":"c00cc576f5d36432e15347902f18fccb316e0222d3890019d1ee381bb7936b63","txlist_hash":"b16082c8d932618c9bd89f7b8d6372190cab18b274ed8dbc1b4f04e5edc2bdbf"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(192,NULL,310024,'insert','blocks','{"block_hash":"a872e560766832cc3b4f7f222228cb6db882ce3c54f6459f62c71d5cd6e90666","block_index":310025,"block_time":310025000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(193,NULL,310025,'parse','blocks','{"block_index":310025,"ledger_hash":"714702b25559325c7bacffdf28e0af30c47bf48e6b4fda053c21ea31c7604128","messages_hash":"801eb76b5da9f7d5c76f0bb146caaa3fd6b6dbfdbbd244d6fc9ae5befef65527","txlist_hash":"391a822509e48a899634f3b8a6b0c99fd298eefd97230b401b40c301dd7e6052"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(194,NULL,310025,'insert','blocks','{"block_hash":"6c96350f6f2f05810f19a689de235eff975338587194a36a70dfd0fcd490941a","block_index":310026,"block_time":310026000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(195,NULL,310026,'parse','blocks','{"block_index":310026,"ledger_hash":"b305741a1e277ba0ce8436b914784ea0156616ac308282a7f29dbca62a54cc82","messages_hash":"c548b86b7154b71f57f48a7ca09daf1c4a85238e447c78027e00e2da8f47684e","txlist_hash":"16c8d91265aaface472342f436e376984d576675529de1f58a188f994375dea0"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(196,NULL,310026,'insert','blocks','{"block_hash":"d7acfac66df393c4482a14c189742c0571b89442eb7f817b34415a560445699e","block_index":310027,"block_time":310027000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(197,NULL,310027,'parse','blocks','{"block_index":310027,"ledger_hash":"1f833f7396917e02b4b65b0a05d19754b6a53b030b659514d0c21cad062d45f9","messages_hash":"207882040c07bf4f53de0d18b2cf8195a8eae75423aee1b9c091cea5ce3b3d27","txlist_hash":"d7a61a46b4f6da78607245b9fdd4e0b1d7499b5687805939342a431ef570711d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(198,NULL,310027,'insert','blocks','{"block_hash":"02409fcf8fa06dafcb7f11e38593181d9c42cc9d5e2ddc304d098f990bd9530b","block_index":310028,"block_time":310028000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(199,NULL,310028,'parse','blocks','{"block_index":310028,"ledger_hash":"47b38906beda7ad735a86b9fd63669b0357b7ae0a0c1a54c9827bc8b90185626","messages_hash":"822023de35329c7abf80e0bfb4982def648716fe0d577705aff5b9f4e7de4440","txlist_hash":"a8a0b67ddb47a15f89fd14f227e118bd374dde04f4bce3205d5ee07a8c7509d7"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(200,NULL,310028,'insert','blocks','{"block_hash":"3c739fa8b40c118d5547ea356ee8d10ee2898871907643ec02e5db9d00f03cc6","block_index":310029,"block_time":310029000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(201,NULL,310029,'parse','blocks','{"block_index":310029,"ledger_hash":"e69f6c9b649ac04920be70f9b076f7909bcebd8312afa715be3d8922794a72e7","messages_hash":"fe7adc1d1add270a2a72656e295146d97f02906127422a837a999878783f7e54","txlist_hash":"355199be765ee2db25308e58d6cdfd22c6941a296b51800e8f937cea1afedbdf"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(202,NULL,310029,'insert','blocks','{"block_hash":"d5071cddedf89765ee0fd58f209c1c7d669ba8ea66200a57587da8b189b9e4f5","block_index":310030,"block_time":310030000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(203,NULL,310030,'parse','blocks','{"block_index":310030,"ledger_hash":"c51828b04433b000787c92eaa7e5abd5cc0bc31c619cb8479aff675af6e00c55","messages_hash":"c6b5b98f91407d3fe485e52acccc248f30baa792a5fa385eb6568c9531a1d9f4","txlist_hash":"b4bb7325ae90ccf0095b0970cb4828c98915a2e6694723ca8af1e9f77523d540"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(204,NULL,310030,'insert','blocks','{"block_hash":"0b02b10f41380fff27c543ea8891ecb845bf7a003ac5c87e15932aff3bfcf689","block_index":310031,"block_time":310031000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(205,NULL,310031,'parse','blocks','{"block_index":310031,"ledger_hash":"26d91568af76b5ad4b357693ecb0b9341aabbf5de5d5c83f9998dc2f95d76e5e","messages_hash":"3628978fba600403d80a4664c770a72885e2a071bb6fcbcc6123870602c6b3a9","txlist_hash":"b13328f7f6011c05736a1c728af4726f63f557ae1eafab7d70b6b7fd60025616"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(206,NULL,310031,'insert','blocks','{"block_hash":"66346be81e6ba04544f2ae643b76c2b7b1383f038fc2636e02e49dc7ec144074","block_index":310032,"block_time":310032000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(207,NULL,310032,'update','orders','{"status":"expired","tx_hash":"19c6fe5cbf0be99ff3d469077e866e0f9fdc56901824b7fec89b0b523526e323"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(208,NULL,310032,'insert','credits','{"address":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3","asset":"BBBB","block_index":310032,"calling_function":"cancel order","event":"19c6fe5cbf0be99ff3d469077e866e0f9fdc56901824b7fec89b0b523526e323","quantity":50000000,"tx_index":0}',0,'CREDIT');
+INSERT INTO messages VALUES(209,NULL,310032,'insert','order_expirations','{"block_index":310032,"order_hash":"19c6fe5cbf0be99ff3d469077e866e0f9fdc56901824b7fec89b0b523526e323","source":"3_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_3"}',0,'ORDER_EXPIRATION');
+INSERT INTO messages VALUES(210,NULL,310032,'parse','blocks','{"block_index":310032,"ledger_hash":"21f8da71c386ec1e5e31a35c1190b895f2df52529ea028d5fba25e0d57616952","messages_hash":"904c8038bf8b7f23c529b8df31b2f8c19713fd76de70d62d87435402068957ff","txlist_hash":"80980b4466ca949fa21a42ffb8c22a2f5853722c4fa02bf0cb962e97365384f1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(211,NULL,310032,'insert','blocks','{"block_hash":"999c65df9661f73e8c01f1da1afda09ac16788b72834f0ff5ea3d1464afb4707","block_index":310033,"block_time":310033000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(212,NULL,310033,'parse','blocks','{"block_index":310033,"ledger_hash":"1c844a38fc28e83406c8019615d0c24a1ea84e6ffe4da392d29f353ca676001b","messages_hash":"0166e273e9fa7ffc4d82e225994c190babf5f835df2b0025c10f6c5ef43799c3","txlist_hash":"0c2f46b4f4d5f345399be6073d2f72bf689f6a3a20e57c41ccd541cc0bae76d3"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(213,NULL,310033,'insert','blocks','{"block_hash":"f552edd2e0a648230f3668e72ddf0ddfb1e8ac0f4c190f91b89c1a8c2e357208","block_index":310034,"block_time":310034000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(214,NULL,310034,'parse','blocks','{"block_index":310034,"ledger_hash":"0533bc0d3bc008b5d65932c569e9f85e3217ea9efbb8937935be93b7a01ec2a8","messages_hash":"3a3a230f7a95b060a2b17b8482e7d7100c58fcbf490502c90d512a6e02108231","txlist_hash":"9f5f89f0c9821b7de30388b2a0891011612096ac158a70838d4479059a4bfc50"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(215,NULL,310034,'insert','blocks','{"block_hash":"a13cbb016f3044207a46967a4ba1c87dab411f78c55c1179f2336653c2726ae2","block_index":310035,"block_time":310035000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(216,NULL,310035,'parse','blocks','{"block_index":310035,"ledger_hash":"b5f0b7406fe3b6dbcbb5c3b28fb8fb119e237f07532f500b422058ba898e5b22","messages_hash":"4c78ac34d5f492cc396c93c5fec07d489dce0734a3d660f92ea9d77fdc2d3762","txlist_hash":"5847c5ec7d8ad0e27d47b3b6ff7df903c4a67a269aa248e69ee918062e58976c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(217,NULL,310035,'insert','blocks','{"block_hash":"158648a98f1e1bd1875584ce8449eb15a4e91a99a923bbb24c4210135cef0c76","block_index":310036,"block_time":310036000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(218,NULL,310036,'parse','blocks','{"block_index":310036,"ledger_hash":"7519ac8cdf4c13b25929d913e3858855aca68bcf3fe6d3636e7371894af27f04","messages_hash":"2bbe9ed724b1fed2ced169ed3c8b73c85e3b907942d63d410034062016d9fde9","txlist_hash":"46fea446096a8d96f1f990374d94405f358ef5a3a8bf09aeba2f76977cf867b0"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(219,NULL,310036,'insert','blocks','{"block_hash":"563acfd6d991ce256d5655de2e9429975c8dceeb221e76d5ec6e9e24a2c27c07","block_index":310037,"block_time":310037000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(220,NULL,310037,'parse','blocks','{"block_index":310037,"ledger_hash":"f417da67da0c23d4bc44bbb864de5b94057916e28502641ba70764f44165a1fa","messages_hash":"2ca69d6d57ff41bd714ec175e6467480a69e5a62055c216350cce6cbb7d2571d","txlist_hash":"e372a6531d2f206be5cca17be0f42a75e2e6617499a6dec377c274f7738620df"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(221,NULL,310037,'insert','blocks','{"block_hash":"b44b4cad12431c32df27940e18d51f63897c7472b70950d18454edfd640490b2","block_index":310038,"block_time":310038000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(222,NULL,310038,'parse','blocks','{"block_index":310038,"ledger_hash":"098eb6f2b0a1c584d969167f50bb55383ab71593ed1f0ca61d83c4513a209107","messages_hash":"c015b324f177d23f9dfafef324c000fb4e4397b80e91e663c00b51ce0421d4cf","txlist_hash":"da7704f6d661aa255af6e2d3ad713fbca0a0e6296b16e3a364989bcb5a4e38ba"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(223,NULL,310038,'insert','blocks','{"block_hash":"5fa1ae9c5e8a599247458987b006ad3a57f686df1f7cc240bf119e911b56c347","block_index":310039,"block_time":310039000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(224,NULL,310039,'parse','blocks','{"block_index":310039,"ledger_hash":"a4aa60a1320e47c975628f6650d8fdc44b6a729d26a3178031e32fcb48b59491","messages_hash":"1ddc1eab822609f46aaa413f870738d386600cb5f92477029f3321538a8f3425","txlist_hash":"02eb5dc168a03d3cd067677480b22185a8ad6731e467c0b3bd5a907834e01013"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(225,NULL,310039,'insert','blocks','{"block_hash":"7200ded406675453eadddfbb2d14c2a4526c7dc2b5de14bd48b29243df5e1aa3","block_index":310040,"block_time":310040000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(226,NULL,310040,'parse','blocks','{"block_index":310040,"ledger_hash":"cc5b2af6948531b635b18a4b6698efa318190762c8e4419aa9ca3634e7ed5d1e","messages_hash":"d1204fb3f4fc48c21af8226bc45388f0b6eeac8a9f4fd47126f80c6572a5469e","txlist_hash":"f6ba96a6e3e2e3442722bbc1bd770d3f6f0f4a4ffe57d0858586539f81e868b8"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(227,NULL,310040,'insert','blocks','{"block_hash":"5db592ff9ba5fac1e030cf22d6c13b70d330ba397f415340086ee7357143b359","block_index":310041,"block_time":310041000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(228,NULL,310041,'parse','blocks','{"block_index":310041,"ledger_hash":"7ad02b4853bde78025942e9f58c212a76c1828337610347e516d4a359af804b5","messages_hash":"9436001b6251917c4b69c00921901c387330125c720ccf2c9e576599d8dafa83","txlist_hash":"d8089b22bc20979dce133885c84c5babb754ff0522d7f2193e1d3157c5251631"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(229,NULL,310041,'insert','blocks','{"block_hash":"826fd4701ef2824e9559b069517cd3cb990aff6a4690830f78fc845ab77fa3e4","block_index":310042,"block_time":310042000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(230,NULL,310042,'parse','blocks','{"block_index":310042,"ledger_hash":"64a91735950113c13603e49ca549fae9b30092a9fc02d53a32a20eaef64ab6ce","messages_hash":"517bcde57fab2adad83570b2609cee487bb5705e176f400106ff69ecb4746b6d","txlist_hash":"554d6b2a2182d87b00111b748a5d904aef85a56b92f1d076ad4f866f0d054041"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(231,NULL,310042,'insert','blocks','{"block_hash":"2254a12ada208f1dd57bc17547ecaf3c44720323c47bc7d4b1262477cb7f3c51","block_index":310043,"block_time":310043000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(232,NULL,310043,'parse','blocks','{"block_index":310043,"ledger_hash":"68107847c7a9dd19612d8b47c1a39cdc446c752f2c05ea8fcd961a42f835d155","messages_hash":"912b1b96d379d1fc64b209c7d2e5312ba4ee269eb530b04eb7bbeb0537e4c21a","txlist_hash":"f2b1800a73d98a15428bfb5289f7ccbb9d3c66b98fb0a36f00ffce8a78279801"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(233,NULL,310043,'insert','blocks','{"block_hash":"3346d24118d8af0b3c6bcc42f8b85792e7a2e7036ebf6e4c25f4f6723c78e46b","block_index":310044,"block_time":310044000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(234,NULL,310044,'parse','blocks','{"block_index":310044,"ledger_hash":"64d4d51adb6994360b3dbf04663c4f067ba223e62912fe1c5a96a190225bb54c","messages_hash":"1600a9735c13014eb519bd322dde80f84ab675df322f6decfcdffd1af54504d1","txlist_hash":"ce4365857faa29eb04e638064e4810620f434fe515efe63eb2ac49c3adce6581"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(235,NULL,310044,'insert','blocks','{"block_hash":"7bba0ab243839e91ad1a45a762bf074011f8a9883074d68203c6d1b46fffde98","block_index":310045,"block_time":310045000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(236,NULL,310045,'parse','blocks','{"block_index":310045,"ledger_hash":"3ba2d7685f63962f576e9fa94e4d6709ace95249a3064804c3822078c982d11d","messages_hash":"56d227f3edb62b974dac1362b79eed46bdfa1e91f69065d83c8d7c61c1129ba3","txlist_hash":"94729a0956e8c1b095c9181e01c220b94257ff582e35d87923e3c5ddba3a3566"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(237,NULL,310045,'insert','blocks','{"block_hash":"47db6788c38f2d6d712764979e41346b55e78cbb4969e0ef5c4336faf18993a6","block_index":310046,"block_time":310046000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(238,NULL,310046,'parse','blocks','{"block_index":310046,"ledger_hash":"6502f277568bed2705c5f496e278e5d99310ff6705751a3999cb4b2bc7d725bd","messages_hash":"63397d50f0c1aa35c11c76609beac1cca925f3ba6835f096137952b6411609bf","txlist_hash":"0986f1e944c39e36fe955ff092028c51647a9359492f17a76c682b4346be714e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(239,NULL,310046,'insert','blocks','{"block_hash":"a9ccabcc2a098a7d25e4ab8bda7c4e66807eefa42e29890dcd88149a10de7075","block_index":310047,"block_time":310047000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(240,NULL,310047,'parse','blocks','{"block_index":310047,"ledger_hash":"5dae29289f36e64b87d56f9870af0bd5ad77ca45f1093c1a41140ea397945130","messages_hash":"6b46b89049da0cbfe2d00b6901b5a8954ad60532e57d14ca35967167c73ba625","txlist_hash":"f14e3c5de5e186beaed6835c7c61fe2274603bb73e62ebea5899ae2a998e26e2"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(241,NULL,310047,'insert','blocks','{"block_hash":"610bf3935a85b05a98556c55493c6de45bed4d7b3b6c8553a984718765796309","block_index":310048,"block_time":310048000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(242,NULL,310048,'parse','blocks','{"block_index":310048,"ledger_hash":"d5dee49d7b78e2ce4dd2a648e345a52bbfa7e0e76de9e970b1dc0b6aea66c130","messages_hash":"c57c5d45c4cef74d650721928f3dbe8f0d83b310cba367170b79381a7ba21ee8","txlist_hash":"e31cb01f21f653217b3bff72061a63f3778f45a72a8419988a496d8f388cac1f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(243,NULL,310048,'insert','blocks','{"block_hash":"4ad2761923ad49ad2b283b640f1832522a2a5d6964486b21591b71df6b33be3c","block_index":310049,"block_time":310049000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(244,NULL,310049,'parse','blocks','{"block_index":310049,"ledger_hash":"2b4c97a93933b8986ebb061d47f2e8bbb1672206058ae3c3ae388bab36b8cbc8","messages_hash":"7f8534be109485517c9459dfb5222b8f541b468bb4f7aa58220db663d7f8d243","txlist_hash":"eb45cf1a49da1dfd4ce7231e8f6da96b7241b0b034884cb2de57dc107723b7a5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(245,NULL,310049,'insert','blocks','{"block_hash":"8cfeb60a14a4cec6e9be13d699694d49007d82a31065a17890383e262071e348","block_index":310050,"block_time":310050000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(246,NULL,310050,'parse','blocks','{"block_index":310050,"ledger_hash":"115913763ca7ef5691512a5c6d47cbd49203aee8a3242928f62640912c935872","messages_hash":"3e82c3cebfd5dc148f738ef6d03270bd335fdb9f897d7c38ec08de99bd2029dd","txlist_hash":"db0d0812374555812015a2058ea7f6bc8aebb8aa7d2824eeeb26b7b42d75f97e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(247,NULL,310050,'insert','blocks','{"block_hash":"b53c90385dd808306601350920c6af4beb717518493fd23b5c730eea078f33e6","block_index":310051,"block_time":310051000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(248,NULL,310051,'parse','blocks','{"block_index":310051,"ledger_hash":"72f24dc53c759a08aeb447d826bf64aad71ca8f4ab9640e30e440e6bc050a0eb","messages_hash":"988ffda502c528af98f0a02d190e1b79b50362938e53feea5d16c3bb9d6efbd0","txlist_hash":"b3834012ddc576765f337d3dd8b3c916f66711481c0bfa2464f6ec2678d1512e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(249,NULL,310051,'insert','blocks','{"block_hash":"0acdacf4e4b6fca756479cb055191b367b1fa433aa558956f5f08fa5b7b394e2","block_index":310052,"block_time":310052000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(250,NULL,310052,'parse','blocks','{"block_index":310052,"ledger_hash":"07846004f2da033bfd113e13040b0d0d605375370b7437e2ca2ea9467fc80c1a","messages_hash":"a2a135fe3fb63d0eba7fbe099dd2b528a757d64babba95166aad63f1524d6ad3","txlist_hash":"35357fb0ca94373955c3cdf08be75d20e9665a9632be0df0c90b567875594049"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(251,NULL,310052,'insert','blocks','{"block_hash":"68348f01b6dc49b2cb30fe92ac43e527aa90d859093d3bf7cd695c64d2ef744f","block_index":310053,"block_time":310053000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(252,NULL,310053,'parse','blocks','{"block_index":310053,"ledger_hash":"7bf9a701337c043a7268cecca5ff765c24600a2056137cd03e3ead9d64ef2348","messages_hash":"cd278dc9fcd6af0b08770e3ae24d6cc06035a808521a27d30f52f740c92013b9","txlist_hash":"d177ed9e0bb4b3d77bc5b1a044e724cabb92dee3189747bc1c01d1fee7148fa2"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(253,NULL,310053,'insert','blocks','{"block_hash":"a8b5f253df293037e49b998675620d5477445c51d5ec66596e023282bb9cd305","block_index":310054,"block_time":310054000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(254,NULL,310054,'parse','blocks','{"block_index":310054,"ledger_hash":"d544aec17018203fe2f5c9bda52a5da53d41d3364b8026770d1f620aa53e6c36","messages_hash":"11bdddd1a775214ace919b5cb8b05153a029d3afc0d4fc76aa6fa3745c2be51b","txlist_hash":"8a3b92aa200f79e8aff4a849618914f7d39c34ef2ed636d3b5633a2ad2f647ea"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(255,NULL,310054,'insert','blocks','{"block_hash":"4b069152e2dc82e96ed8a3c3547c162e8c3aceeb2a4ac07972f8321a535b9356","block_index":310055,"block_time":310055000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(256,NULL,310055,'parse','blocks','{"block_index":310055,"ledger_hash":"bd3044c66f7e2c24944a9c938b8f162ac8f566a1338444c219396eadf5179d3e","messages_hash":"c8fe4a422a254591a8fe091f3ac0a188b49f241298ab1548edc31dbce7e09734","txlist_hash":"59ce208e69d4e1427791ae237a6db6a05efcd50fa386f4f8f56862c6cc3b12d5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(257,NULL,310055,'insert','blocks','{"block_hash":"7603eaed418971b745256742f9d2ba70b2c2b2f69f61de6cc70e61ce0336f9d3","block_index":310056,"block_time":310056000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(258,NULL,310056,'parse','blocks','{"block_index":310056,"ledger_hash":"b19346f726636aa9da55af6106a471c596a7f7b93289b70d3d33b45334bca9d3","messages_hash":"1f6fb5ab52976782a48b7530e23aa9dfbc640325a72cbb0c7db1247c7a0b4031","txlist_hash":"8e9d4b1d3ad7c5e8e479640da0ffd8b7423aee810ff6adc4ae2d37d545169579"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(259,NULL,310056,'insert','blocks','{"block_hash":"4a5fdc84f2d66ecb6ee3e3646aad20751ce8694e64e348d3c8aab09d33a3e411","block_index":310057,"block_time":310057000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(260,NULL,310057,'parse','blocks','{"block_index":310057,"ledger_hash":"35c2ad9ccd3bd68cdb0c4d8fd4e30938521b8559c1cec331a29b1802d649947a","messages_hash":"e850532831c45f4cae14c9bcda7d894dea4a93934ce7afc38f256def03ba1c4f","txlist_hash":"e14484629fa3aa2e8ce54505b3983d0f33e7727d3dacc5de57a574c2e0c69baf"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(261,NULL,310057,'insert','blocks','{"block_hash":"a6eef3089896f0cae0bfe9423392e45c48f4efe4310b14d8cfbdb1fea613635f","block_index":310058,"block_time":310058000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(262,NULL,310058,'parse','blocks','{"block_index":310058,"ledger_hash":"e9a705d6661f0345ffe0f45ae26c0d6ba6bd5a125eef2f0e9558d0702ee6d63f","messages_hash":"047adfb7ad69518a1b2a78af1eb8222168b0865300be9a50e37075c7e1948c9c","txlist_hash":"cfbb1995e2c28020dabca30e98f72afee01b64fe276acacee7e104b22772de65"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(263,NULL,310058,'insert','blocks','{"block_hash":"ab505de874c43f97c90be1c26a769e6c5cb140405c993b4a6cc7afc795f156a9","block_index":310059,"block_time":310059000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(264,NULL,310059,'parse','blocks','{"block_index":310059,"ledger_hash":"61efe4d33a7f70cae34df86753532aee25fb0b153744acb962142691f6979482","messages_hash":"8eb894c4a10a9bf7669b8376b5e09663b9e4ccf35adf18de9db07a33315b7ed6","txlist_hash":"401b057e48ae9e423f354f7ddbb11e70c0ec2209ef1a26dc7ffd0bf6003f1335"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(265,NULL,310059,'insert','blocks','{"block_hash":"974ad5fbef621e0a38eab811608dc9afaf10c8ecc85fed913075ba1a145e889b","block_index":310060,"block_time":310060000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(266,NULL,310060,'parse','blocks','{"block_index":310060,"ledger_hash":"59d9785e783c59c12783977087ad439b2dacad9ae1ef2be6384bfc9036da9804","messages_hash":"e932e980d4a231aa6c0b641cf4df7178dee3d08ba746c32f4db844090938d7e8","txlist_hash":"6010ccb1d9476ce07d8b50633bccb97ecff1a229a0ea7701c802aad32f961be9"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(267,NULL,310060,'insert','blocks','{"block_hash":"35d267d21ad386e7b7632292af1c422b0310dde7ca49a82f9577525a29c138cf","block_index":310061,"block_time":310061000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(268,NULL,310061,'parse','blocks','{"block_index":310061,"ledger_hash":"e257d59ab5dfb01b8396bd12d2fd169f9ac7629365b90bf6e593e627738d3754","messages_hash":"e1c03b783d99b6d377dc00755feda0a6939daa86e393e26a5a68f714300fb554","txlist_hash":"bda63243caec3f70173e1e93a16867ecbcf45d987b6a5f72d1bea54d361f0ed2"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(269,NULL,310061,'insert','blocks','{"block_hash":"b31a0054145319ef9de8c1cb19df5bcf4dc8a1ece20053aa494e5d3a00a2852f","block_index":310062,"block_time":310062000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(270,NULL,310062,'parse','blocks','{"block_index":310062,"ledger_hash":"0dc0317a88a6fc4ac791cd4d45edcf2a142fb83aa2e8a2f299fcac48a2c2e04d","messages_hash":"fbddf6eee66e1c7b1df8e81372ee1d62a5ef71db7b7dd4baf4d5ef016bdf7c4a","txlist_hash":"ea9f3db44eb05a8ba1c860cd0a13ea662f84715b59e78a87f49c78377cb6b2c3"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(271,NULL,310062,'insert','blocks','{"block_hash":"0cbcbcd5b7f2dc288e3a34eab3d4212463a5a56e886804fb4f9f1cf929eadebe","block_index":310063,"block_time":310063000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(272,NULL,310063,'parse','blocks','{"block_index":310063,"ledger_hash":"892d6a49aebb262f2a626a35c0806c488c836c04d33122c2d65ecd8904fe3d85","messages_hash":"8d2ee1a5f97490c82f97f7cfa52fd6e3b8e4cddae27d1aa5084d19006427fef6","txlist_hash":"3fc1380f35c9123d16b9ffbeb23c44f24e4d6001406a484ce30ee5758b8ec965"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(273,NULL,310063,'insert','blocks','{"block_hash":"e2db8065a195e85cde9ddb868a17d39893a60fb2b1255aa5f0c88729de7cbf30","block_index":310064,"block_time":310064000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(274,NULL,310064,'parse','blocks','{"block_index":310064,"ledger_hash":"e345abbf8dc42737a9f2dd038534409200d63a9ebf5d1cbf3344ea9413c388c0","messages_hash":"1557b98be10d0eeeaf1e47f46d632cfa065aa77760ab38f1e81ed16bcc28e405","txlist_hash":"be23706267b965eb38fa15ec1ce8c17ed5727bfedba0ca4d4be3db2fd703744f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(275,NULL,310064,'insert','blocks','{"block_hash":"8a7bc7a77c831ac4fd11b8a9d22d1b6a0661b07cef05c2e600c7fb683b861d2a","block_index":310065,"block_time":310065000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(276,NULL,310065,'parse','blocks','{"block_index":310065,"ledger_hash":"84ec781d054c0602ed97384cd32cd060b938627ea490a7635fa3ac0babba94cc","messages_hash":"3a160d03c922d16d4defefc07987a5d7d6c87958f1040c9058f4810c5dfd192e","txlist_hash":"1f7417cf7a3d9f07e5a8faf658b166c288aff136ee56f244797ef589f9cf98c5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(277,NULL,310065,'insert','blocks','{"block_hash":"b6959be51eb084747d301f7ccaf9e75f2292c9404633b1532e3692659939430d","block_index":310066,"block_time":310066000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(278,NULL,310066,'parse','blocks','{"block_index":310066,"ledger_hash":"3478612a8bb95c2966891fb4d1b35493a1342364a6f08404b83ac9fdda763aa2","messages_hash":"f6bd82018fec6aef410ce22ae9453985c47d112327ac79467b1b58b5459b88a6","txlist_hash":"7b4317e7c2db815ced2d81aaf8efaa6331e475a7a9b3a59041640d43484b1a89"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(279,NULL,310066,'insert','blocks','{"block_hash":"8b08eae98d7193c9c01863fac6effb9162bda010daeacf9e0347112f233b8577","block_index":310067,"block_time":310067000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(280,NULL,310067,'parse','blocks','{"block_index":310067,"ledger_hash":"c532c4c5f5e2ae1026ec2582645d9aef06afee46cb9781427a1f40667378ed67","messages_hash":"534d66483e451478608cbb2ede9587088e10efd2e0e700f59eef272e91423c46","txlist_hash":"89699fdf437b96128d7eb89a45d58e45d0b829789c6e0b29e8972b48ce5e62de"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(281,NULL,310067,'insert','blocks','{"block_hash":"9280e7297ef6313341bc81787a36acfc9af58f83a415afff5e3154f126cf52b5","block_index":310068,"block_time":310068000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(282,NULL,310068,'parse','blocks','{"block_index":310068,"ledger_hash":"5508189396fa6dfe63a7d06fe97a3073e986eb305bcb49430157f99e3848cd69","messages_hash":"0d2642a45e69da6ca9f71855222603189bd602ecd7ccfa1d5a08fc602f2d83bd","txlist_hash":"4c49d9334c909f728f3b06a0ef613fb09f6369dd431b7078db5d269cdf9dd4bd"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(283,NULL,310068,'insert','blocks','{"block_hash":"486351f0655bf594ffaab1980cff17353b640b63e9c27239109addece189a6f7","block_index":310069,"block_time":310069000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(284,NULL,310069,'parse','blocks','{"block_index":310069,"ledger_hash":"9b0b5d09dc7aaffaf5a3603fa2b914c54b04755a5ddbf83476320149f802292a","messages_hash":"8d85103885918d2f0cb3653b55615111561cef1defb3f57a52aa7efc3f2343d3","txlist_hash":"ef4759403c17482a8f8042fb93a5cae1b741085cdbf73e839638fee316044571"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(285,NULL,310069,'insert','blocks','{"block_hash":"8739e99f4dee8bebf1332f37f49a125348b40b93b74fe35579dd52bfba4fa7e5","block_index":310070,"block_time":310070000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(286,NULL,310070,'parse','blocks','{"block_index":310070,"ledger_hash":"2e40d398c2eb131e195a667f1b2b5e8de29e80423a2d0dd3935fad6dd7cc919c","messages_hash":"0e52d3a43ac7fe4e49c1ac354ad2cf71668253207b461713d045dcc82e247575","txlist_hash":"18e3230ce4fdaca025887c118a2f2fa6bcbe81fba5c968301a90b43e27f2c7aa"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(287,NULL,310070,'insert','blocks','{"block_hash":"7a099aa1bba0ead577f1e44f35263a1f115ed6a868c98d4dd71609072ae7f80b","block_index":310071,"block_time":310071000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(288,NULL,310071,'parse','blocks','{"block_index":310071,"ledger_hash":"763d3d949dc16a797f5b8a2f5a27fd34b4636fa3dbf33eabed5db048e1a848b4","messages_hash":"44bf78b7251f514af029c657853ea438db6a6f19e126dfe21efc7987e3415673","txlist_hash":"7b10cd9561d4a33c7771570925e5a9a879a501ac503004eccc5e60074d2dedab"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(289,NULL,310071,'insert','blocks','{"block_hash":"7b17ecedc07552551b8129e068ae67cb176ca766ea3f6df74b597a94e3a7fc8a","block_index":310072,"block_time":310072000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(290,NULL,310072,'parse','blocks','{"block_index":310072,"ledger_hash":"d9b9d6a52f757604a5652aac64c343a47a928160790963521ce33d125486cb0b","messages_hash":"6af984b5ea8eef37a8be2d9aa7ce6a686827604fb285e0632a61ed653f753ceb","txlist_hash":"deda10c92f292c186698b9b4d371727688a9c0ea194963464fd1c5b429fbbff1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(291,NULL,310072,'insert','blocks','{"block_hash":"ee0fe3cc9b3a48a2746b6090b63b442b97ea6055d48edcf4b2288396764c6943","block_index":310073,"block_time":310073000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(292,NULL,310073,'parse','blocks','{"block_index":310073,"ledger_hash":"9c1a650b6029cc982e9e617b619da6d88878453ccea68ff82047581d5cc74e9c","messages_hash":"af4dd5f282ecaa21596b2eb8b5aa0cfff6e0400cc3641fdd58964dc8045bf214","txlist_hash":"26e4cfa82a9ed189ffafa596c7022cab40002c8099b48814f3e7fbc48b01b0fa"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(293,NULL,310073,'insert','blocks','{"block_hash":"ceab38dfde01f711a187601731ad575d67cfe0b7dbc61dcd4f15baaef72089fb","block_index":310074,"block_time":310074000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(294,NULL,310074,'parse','blocks','{"block_index":310074,"ledger_hash":"32d648a0d0b99f6826376e8badb278c06f95a0ab781cd873e2f7f55219953b01","messages_hash":"5e1a75ec243b0a826cb040effbca894d0efbcf88dcdee8133e97cb700f5f9cbc","txlist_hash":"f10d714905f2e84a57e0c792ebf0dd67158f19f352176a571278dce49aaf778b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(295,NULL,310074,'insert','blocks','{"block_hash":"ef547198c6e36d829f117cfd7077ccde45158e3c545152225fa24dba7a26847b","block_index":310075,"block_time":310075000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(296,NULL,310075,'parse','blocks','{"block_index":310075,"ledger_hash":"67cd615e67e397cae8195fc8753403563e9100ecd623b2796a46b137ca553be2","messages_hash":"22127fbab598f700c53a834ddafb92a9325055467b24256455dd998de58d9fd0","txlist_hash":"d0c0ffcafa826685b59ef036c4315e79cc688ac1ee43097143debf445f6e638b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(297,NULL,310075,'insert','blocks','{"block_hash":"3b0499c2e8e8f0252c7288d4ecf66efc426ca37aad3524424d14c8bc6f8b0d92","block_index":310076,"block_time":310076000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(298,NULL,310076,'parse','blocks','{"block_index":310076,"ledger_hash":"d636f3831cd35437271557e6299024d70c4be6b9a685a4fed61e7d67e61540dd","messages_hash":"16ff09b6f1392469f352a23d614830752e85e9ed7c39dca2dcac1cfe75249db8","txlist_hash":"fb11ef8957cdc599585372679a59440580acb37458ed3da092b22974a4857bb6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(299,NULL,310076,'insert','blocks','{"block_hash":"d2adeefa9024ab3ff2822bc36acf19b6c647cea118cf15b86c6bc00c3322e7dd","block_index":310077,"block_time":310077000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(300,NULL,310077,'parse','blocks','{"block_index":310077,"ledger_hash":"abf96247f6b99a24e518d89162c23cffc821d5cae5703f5b7c7c4587e34cdf98","messages_hash":"823ac2dd7bd746deeab41d20c2f7a28ae22e1240582b31108d980814ee7e9a73","txlist_hash":"67d8b52c93c5d07ce1a335ea3572f0015a971effdecf921193cca273553466c1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(301,NULL,310077,'insert','blocks','{"block_hash":"f6c17115ef0efe489c562bcda4615892b4d4b39db0c9791fe193d4922bd82cd6","block_index":310078,"block_time":310078000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(302,NULL,310078,'parse','blocks','{"block_index":310078,"ledger_hash":"06aeace2e79321c6776dd1098982e71bfc0baadc55470721022db67a03bd4478","messages_hash":"0235009ba1b7b4829cb22ad87c8295f613951a2e5d99fb9b732e734115f72a0a","txlist_hash":"2e148e6946d39fee7c6d1b320122beb1689903e929397821a63e612d5216326d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(303,NULL,310078,'insert','blocks','{"block_hash":"f2fbd2074d804e631db44cb0fb2e1db3fdc367e439c21ffc40d73104c4d7069c","block_index":310079,"block_time":310079000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(304,NULL,310079,'parse','blocks','{"block_index":310079,"ledger_hash":"ba2c7078ee940b14e584459985a5a4785156762135541d40a138c31ff9bfe4fb","messages_hash":"fb33e505d3b178a8d5abae4c7cb9c40e6810b6633d5ad576ec373529a8a4e6a7","txlist_hash":"63832ac6186f8a8e8091579221ada474b43c36f465ae25ddae4ead963207150c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(305,NULL,310079,'insert','blocks','{"block_hash":"42943b914d9c367000a78b78a544cc4b84b1df838aadde33fe730964a89a3a6c","block_index":310080,"block_time":310080000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(306,NULL,310080,'parse','blocks','{"block_index":310080,"ledger_hash":"af327b161ed9fa8022f3efd81b695d25ad9ae8f250a6d08739a40b0883262045","messages_hash":"bd5b04fd2a333d10ee6dbed807e153fa483cbc0e272dfb146a9c8144420d2e45","txlist_hash":"47bdbc4933d69cd703c277d9a5e156951ef57791f87f92d16b85c15ab3194061"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(307,NULL,310080,'insert','blocks','{"block_hash":"6554f9d307976249e7b7e260e08046b3b55d318f8b6af627fed5be3063f123c4","block_index":310081,"block_time":310081000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(308,NULL,310081,'parse','blocks','{"block_index":310081,"ledger_hash":"2c4d6568a9c77737c5942fab33613a1ef055ce21b9f0a9b4a42fcdf6e9536a59","messages_hash":"22d1d0053667443aae83fa579cc48b0814338c7b4ec567f88955d9ff37cca0c7","txlist_hash":"7d57db6fdebb83dc0fbd1746eb328a94403f4a66e7e003593fe90c95fdef3e5c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(309,NULL,310081,'insert','blocks','{"block_hash":"4f1ef91b1dcd575f8ac2e66a67715500cbca154bd6f3b8148bb7015a6aa6c644","block_index":310082,"block_time":310082000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(310,NULL,310082,'parse','blocks','{"block_index":310082,"ledger_hash":"0b8dcdff637e5e60ae045d4c7646bd47e6047fc992860c99dd422477b9a90d74","messages_hash":"e236d1ad78134a4a1f0eafeb382709f1f9db74313f22bc17d44df9053826be59","txlist_hash":"61316fca3bd986c2398fa5dd92a8b874f4a64095691626d695e82e3c30849e27"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(311,NULL,310082,'insert','blocks','{"block_hash":"9b1f6fd6ff9b0dc4e37603cfb0625f49067c775b99e12492afd85392d3c8d850","block_index":310083,"block_time":310083000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(312,NULL,310083,'parse','blocks','{"block_index":310083,"ledger_hash":"eec6578a8bc1f5766427f4753ded18cb97c53e710f5fff8918bbdadb59678f64","messages_hash":"3dce816512e26be7ae36f3f8f32dc9ad25504c8b08c59c5a3f4d0206096d0e25","txlist_hash":"bc5cabb9579b79f03b329c0e5e3c8652d8b0eccde9563d838890218bcc8bd932"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(313,NULL,310083,'insert','blocks','{"block_hash":"1e0972523e80306441b9f4157f171716199f1428db2e818a7f7817ccdc8859e3","block_index":310084,"block_time":310084000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(314,NULL,310084,'parse','blocks','{"block_index":310084,"ledger_hash":"a2b2ed6a61f1c9a3d322a050178c6be119b89d1a0795fa9c9d7484ad8edfcecd","messages_hash":"80bcccb657ee818f010373641e90d6a1353a15d95a576ea5c83eb41d96832b33","txlist_hash":"86e50073092182d9a5b37cd2453dd5a7a1af175ad0a1150492d5001510b05e6e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(315,NULL,310084,'insert','blocks','{"block_hash":"c5b6e9581831e3bc5848cd7630c499bca26d9ece5156d36579bdb72d54817e34","block_index":310085,"block_time":310085000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(316,NULL,310085,'parse','blocks','{"block_index":310085,"ledger_hash":"02828eaf91883ad16beb5563f9c84cb226269c655a886857b31e5e150a1053ec","messages_hash":"5f930a16ea9b174ea0a1a549f9d094dba36a469572e4094855e3b9e935e94bd8","txlist_hash":"bf59d4fe42c11ab04792ba5c95cfd811a6ddf18e125daebb93695bdd829736c3"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(317,NULL,310085,'insert','blocks','{"block_hash":"080c1dc55a4ecf4824cf9840602498cfc35b5f84099f50b71b45cb63834c7a78","block_index":310086,"block_time":310086000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(318,NULL,310086,'parse','blocks','{"block_index":310086,"ledger_hash":"5427b45ed778796c26d0d2ddf73e975856cc9ae081c36762e78d046f6cfc376c","messages_hash":"36eb11de51610eff7bd985bd603d208ea6308f292233c12aa8ce4c71f4a8f6ca","txlist_hash":"ca0801d366e8dc44c01db11f67594bcb3ea3e81a3031cee93d24683b82185461"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(319,NULL,310086,'insert','blocks','{"block_hash":"4ec8cb1c38b22904e8087a034a6406b896eff4dd28e7620601c6bddf82e2738c","block_index":310087,"block_time":310087000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(320,NULL,310087,'parse','blocks','{"block_index":310087,"ledger_hash":"34c2664f81b1bbb53c728636097bc4b7cede67bb318ddcc5e5e6b5735bcc55a7","messages_hash":"8f1616a4b99b0017b45f187fe0153199d4afdcc18180b89d915c9a658d22a9ea","txlist_hash":"321bd59dc3c2996a1a2a6f74905f89a8db172b3b2b35a2d1cbfc6d06f49d09c9"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(321,NULL,310087,'insert','blocks','{"block_hash":"e945c815c433cbddd0bf8e66c5c23b51072483492acda98f5c2c201020a8c5b3","block_index":310088,"block_time":310088000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(322,NULL,310088,'parse','blocks','{"block_index":310088,"ledger_hash":"14615dfa6194665d43cf2f495b8f65fb9efa04c2e90885172d229ad4a9dd2358","messages_hash":"ab83027e5a67ed9d64eed651a88ee64bf025e741c22fb00088a06b3a73d971f3","txlist_hash":"3ef6f8bdf30073f297852db2b7036374e3d2c1e91b0d087cb2c6c88e400de110"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(323,NULL,310088,'insert','blocks','{"block_hash":"0382437f895ef3e7e38bf025fd4f606fd44d4bbd6aea71dbdc4ed11a7cd46f33","block_index":310089,"block_time":310089000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(324,NULL,310089,'parse','blocks','{"block_index":310089,"ledger_hash":"fc0f077548225d481384a1aba2d91ed4ec8b2df0f0a57ab603305c615672b25f","messages_hash":"28e50e9e6a0cc748d1752c2ee636936f7f0cacc0154cc3f4e2341f99b99da524","txlist_hash":"0788356af4b45cc44c143c457d069e64d54aa12703f8c376cf3b98827052c173"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(325,NULL,310089,'insert','blocks','{"block_hash":"b756db71dc037b5a4582de354a3347371267d31ebda453e152f0a13bb2fae969","block_index":310090,"block_time":310090000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(326,NULL,310090,'parse','blocks','{"block_index":310090,"ledger_hash":"5749263295014a597071acf2293fcd185d02a6a7b3a96df859aae3bf146b276e","messages_hash":"24e5630de6254178200271f1a404a76830763d87367530c928ca78fa481ad450","txlist_hash":"02938682157ea8b10c49e9d87ed444c1303a952a00f6acfe33a1661e84868cc8"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(327,NULL,310090,'insert','blocks','{"block_hash":"734a9aa485f36399d5efb74f3b9c47f8b5f6fd68c9967f134b14cfe7e2d7583c","block_index":310091,"block_time":310091000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(328,NULL,310091,'parse','blocks','{"block_index":310091,"ledger_hash":"ae369a1ec3e4f2aea602eab8c7ab1181cacd6b8d01582c96c4771fdd7b3de771","messages_hash":"021342bdaccc173aefff413c3400cb85b7eaa5e9aa5fe5b7fc0e5177f5d8b928","txlist_hash":"04aaa17c2a3dacf6c38b16ed63d70aea7b9546dc7e733dd51a3c08248ca13eb1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(329,NULL,310091,'insert','blocks','{"block_hash":"56386beb65f9228740d4ad43a1c575645f6daf59e0dd9f22551c59215b5e8c3d","block_index":310092,"block_time":310092000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(330,NULL,310092,'parse','blocks','{"block_index":310092,"ledger_hash":"06a2ac591c418d2b01c74edf2524100afd1140c3933f32120c4cc3180c1de3f0","messages_hash":"75fad188405897ce4a94e9a47109b57f4425efa2ce794da636a5ef6bc1282167","txlist_hash":"421eb90f1258261c97512745b3543fee15ae8d17769d523646033851abde9c75"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(331,NULL,310092,'insert','blocks','{"block_hash":"a74a2425f2f4be24bb5f715173e6756649e1cbf1b064aeb1ef60e0b94b418ddc","block_index":310093,"block_time":310093000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(332,NULL,310093,'parse','blocks','{"block_index":310093,"ledger_hash":"cdf0ae4d5d06b8735e3e62f5a76a902fee40742fc760578dae98b43635f2e57a","messages_hash":"a412013457b63881cbe03936adcc9a6d413ed3f85e8c9f15bcd91238f126d3e4","txlist_hash":"cbe924452487ba251291d1bf1ec518a7233eda0aa956d002bc2e0933d0057c53"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(333,NULL,310093,'insert','blocks','{"block_hash":"2a8f976f20c4e89ff01071915ac96ee35192d54df3a246bf61fd4a0cccfb5b23","block_index":310094,"block_time":310094000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(334,NULL,310094,'parse','blocks','{"block_index":310094,"ledger_hash":"77d836433add0cf3f7691884ec1607dde9a3996df00128703644527fb096bab5","messages_hash":"3f9caa3a0efeadd13a5442e94e78c8202aa5d9a036c1e0d780bbb4708709ec90","txlist_hash":"2dad9d43a8612157867a046cc0dbc8939f30c41cc8f527a1e184c93004cca63e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(335,NULL,310094,'insert','blocks','{"block_hash":"bed0fa40c9981223fb40b3be8124ca619edc9dd34d0c907369477ea92e5d2cd2","block_index":310095,"block_time":310095000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(336,NULL,310095,'parse','blocks','{"block_index":310095,"ledger_hash":"770a0187b5c98725dc32e15a414b9323030f407749fcb0652b1e1f2e4e762e7e","messages_hash":"39c7215611beaf69e4ff95e35d7b363ba065b5c67c8d46cfd6e5aa36ee831d51","txlist_hash":"251e12514d80ad256c13398d257708ad2dfb3b70db674695a8d72d977337ac90"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(337,NULL,310095,'insert','blocks','{"block_hash":"306aeec3db435fabffdf88c2f26ee83caa4c2426375a33daa2be041dbd27ea2f","block_index":310096,"block_time":310096000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(338,NULL,310096,'parse','blocks','{"block_index":310096,"ledger_hash":"567e91f9456ecd020fbd2fe940d796ac976981485f870db8cb0bc41d77a0fd0f","messages_hash":"bd51e820948048543ee33b42759c0936b74471c6ca9f9271395261e6ed825f48","txlist_hash":"48924c125c80fbe8887ff318ebbab0edf8629e604eed0561dd48444bc4acdab3"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(339,NULL,310096,'insert','blocks','{"block_hash":"13e8e16e67c7cdcc80d477491e554b43744f90e8e1a9728439a11fab42cefadf","block_index":310097,"block_time":310097000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(340,NULL,310097,'parse','blocks','{"block_index":310097,"ledger_hash":"447ceafb93aeb346eb98d87db46f07f4d1f51ffde3d44adc6056a624bea3b0c3","messages_hash":"67f40bcce0e0c78c223929650f7ce85a0410790fbf93f5d0e269fd29161b4b65","txlist_hash":"213f5672119909ebcda9f987e3bf69dd0404134584b36c56acdd3596a1ea6881"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(341,NULL,310097,'insert','blocks','{"block_hash":"ca5bca4b5ec4fa6183e05176abe921cff884c4e20910fab55b603cef48dc3bca","block_index":310098,"block_time":310098000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(342,NULL,310098,'parse','blocks','{"block_index":310098,"ledger_hash":"f510ec6201f4eb850d4f62b399d0d360d0d8cca7e3d955f849ad59a22fba1677","messages_hash":"eb8d0c00e10de227ba487e5a1a42828227b0764caee0d5c827833c5de1f108a3","txlist_hash":"e504e97b361e32b0256aeb1640291eeda547dc564043835013086c87f5e637c2"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(343,NULL,310098,'insert','blocks','{"block_hash":"3c4c2279cd7de0add5ec469648a845875495a7d54ebfb5b012dcc5a197b7992a","block_index":310099,"block_time":310099000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(344,NULL,310099,'parse','blocks','{"block_index":310099,"ledger_hash":"1f956e2c07defac832b7c90982c1e7a1192988c4d1e622b54b40b78065deafef","messages_hash":"bc047032c040c11436d7a1c9e7e33d12be7013f1a3df3d2c87a766fda09b0d28","txlist_hash":"891969418c97f41be742eeb562f39cfe92543c159095f58c5f58c8c2b0274423"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(345,NULL,310099,'insert','blocks','{"block_hash":"96925c05b3c7c80c716f5bef68d161c71d044252c766ca0e3f17f255764242cb","block_index":310100,"block_time":310100000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(346,NULL,310100,'parse','blocks','{"block_index":310100,"ledger_hash":"ac4cc3e01feb10ba2211afdff4ec43a4ce13a12e1a90dc6f675c390e6395b1e3","messages_hash":"6886fd77ef7eb785c257933ea5b6f1008311559a1d350b5ca1a7e2c1cb18cb50","txlist_hash":"71e61b2d7aca45ccd7cfb6bda957b18fa076cc16bcbbfb63668e4c4f2749b7f3"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(347,NULL,310100,'insert','blocks','{"block_hash":"369472409995ca1a2ebecbad6bf9dab38c378ab1e67e1bdf13d4ce1346731cd6","block_index":310101,"block_time":310101000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(348,NULL,310101,'parse','blocks','{"block_index":310101,"ledger_hash":"0a4bb35bf922a8175ef5559e74084d32caa16f599df84adb5e255de26b92c1c4","messages_hash":"283b91394c3e8249e7023df44632f72659fa20b0a8f030c82287f59c3579e514","txlist_hash":"e716e04989e254c2ed5b1c4b81026153d5799edb5a676adea5b7efb930940b30"}',0,'BLOCK_PARSED');
 -- Triggers and indices on  messages
 CREATE TRIGGER block_update_messages
                            BEFORE UPDATE ON messages BEGIN
@@ -963,1251 +963,1252 @@ BEGIN TRANSACTION;
 DROP TABLE IF EXISTS messages;
 CREATE TABLE messages(
                       message_index INTEGER PRIMARY KEY,
+                      mensaje_index INTEGER,
                       block_index INTEGER,
                       command TEXT,
                       category TEXT,
                       bindings TEXT,
                       timestamp INTEGER,
                       event TEXT);
-INSERT INTO messages VALUES(0,0,'insert','blocks','{"block_hash":"8b3bef249cb3b0fa23a4936c1249b6bd41daeadc848c8d2e409ea1cbc10adfe7","block_index":309999,"block_time":309999000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1,309999,'parse','blocks','{"block_index":309999,"ledger_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","messages_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","txlist_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(2,309999,'insert','blocks','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(3,310000,'insert','transactions','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"btc_amount":62000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"6dc5b0a33d4d4297e0f5cc2d23ae307951d32aab2d86b7fa147b385219f3a597","tx_index":1}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(4,310000,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310000,"calling_function":"burn","event":"6dc5b0a33d4d4297e0f5cc2d23ae307951d32aab2d86b7fa147b385219f3a597","quantity":93000000000,"tx_index":1}',0,'CREDIT');
-INSERT INTO messages VALUES(5,310000,'insert','burns','{"block_index":310000,"burned":62000000,"earned":93000000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"6dc5b0a33d4d4297e0f5cc2d23ae307951d32aab2d86b7fa147b385219f3a597","tx_index":1}',0,'BURN');
-INSERT INTO messages VALUES(6,310000,'parse','blocks','{"block_index":310000,"ledger_hash":"cf0ea1d313e22ba5f413075b88e07dffc5c00e59f95eeb6d6dec935bd77f5ae4","messages_hash":"9e7dd13f1ecb4ec6481076dc9bb5fda1bdb9103747455f9de9ab516748201ef0","txlist_hash":"f06c23e6040a063ed59693baa0d63492dce64e1debc7455b22f5535c9dfbdc67"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(7,310000,'insert','blocks','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(8,310001,'insert','transactions','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"btc_amount":0,"data":"00000014000000a25be34b66000000174876e800010000000000000000000f446976697369626c65206173736574","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"1fc2e5a57f584b2f2edd05676e75c33d03eed1d3098cc0550ea33474e3ec9db1","tx_index":2}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(9,310001,'insert','debits','{"action":"issuance fee","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310001,"event":"1fc2e5a57f584b2f2edd05676e75c33d03eed1d3098cc0550ea33474e3ec9db1","quantity":50000000,"tx_index":2}',0,'DEBIT');
-INSERT INTO messages VALUES(10,310001,'insert','assets','{"asset_id":"697326324582","asset_longname":null,"asset_name":"DIVISIBLE","block_index":310001}',0,'ASSET_CREATION');
-INSERT INTO messages VALUES(11,310001,'insert','issuances','{"asset":"DIVISIBLE","asset_longname":null,"block_index":310001,"call_date":0,"call_price":0.0,"callable":false,"description":"Divisible asset","divisible":true,"fee_paid":50000000,"issuer":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","locked":false,"quantity":100000000000,"reset":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","transfer":false,"tx_hash":"1fc2e5a57f584b2f2edd05676e75c33d03eed1d3098cc0550ea33474e3ec9db1","tx_index":2}',0,'ASSET_ISSUANCE');
-INSERT INTO messages VALUES(12,310001,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"DIVISIBLE","block_index":310001,"calling_function":"issuance","event":"1fc2e5a57f584b2f2edd05676e75c33d03eed1d3098cc0550ea33474e3ec9db1","quantity":100000000000,"tx_index":2}',0,'CREDIT');
-INSERT INTO messages VALUES(13,310001,'parse','transactions','{"supported":true,"tx_hash":"1fc2e5a57f584b2f2edd05676e75c33d03eed1d3098cc0550ea33474e3ec9db1","tx_index":2}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(14,310001,'parse','blocks','{"block_index":310001,"ledger_hash":"11461f972c4cd85c87b5abfedb3cee589d09e945570d34564dcde6f4df9d2b57","messages_hash":"73d038390ff24d64df88c69d45b46bbc90f6b77f68cbbe2081dbe1e556a65e5e","txlist_hash":"ff8358e8c8b2cb9a1765deadb77bdfc6eae05a844831a0a8c8820d416d54446e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(15,310001,'insert','blocks','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(16,310002,'insert','transactions','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"btc_amount":0,"data":"000000140006cad8dc7f0b6600000000000003e800000000000000000000124e6f20646976697369626c65206173736574","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"7b1bf5144346279271b1ff78664f118224fe27fd8679d6c1519345f9c6c54584","tx_index":3}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(17,310002,'insert','debits','{"action":"issuance fee","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310002,"event":"7b1bf5144346279271b1ff78664f118224fe27fd8679d6c1519345f9c6c54584","quantity":50000000,"tx_index":3}',0,'DEBIT');
-INSERT INTO messages VALUES(18,310002,'insert','assets','{"asset_id":"1911882621324134","asset_longname":null,"asset_name":"NODIVISIBLE","block_index":310002}',0,'ASSET_CREATION');
-INSERT INTO messages VALUES(19,310002,'insert','issuances','{"asset":"NODIVISIBLE","asset_longname":null,"block_index":310002,"call_date":0,"call_price":0.0,"callable":false,"description":"No divisible asset","divisible":false,"fee_paid":50000000,"issuer":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","locked":false,"quantity":1000,"reset":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","transfer":false,"tx_hash":"7b1bf5144346279271b1ff78664f118224fe27fd8679d6c1519345f9c6c54584","tx_index":3}',0,'ASSET_ISSUANCE');
-INSERT INTO messages VALUES(20,310002,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"NODIVISIBLE","block_index":310002,"calling_function":"issuance","event":"7b1bf5144346279271b1ff78664f118224fe27fd8679d6c1519345f9c6c54584","quantity":1000,"tx_index":3}',0,'CREDIT');
-INSERT INTO messages VALUES(21,310002,'parse','transactions','{"supported":true,"tx_hash":"7b1bf5144346279271b1ff78664f118224fe27fd8679d6c1519345f9c6c54584","tx_index":3}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(22,310002,'parse','blocks','{"block_index":310002,"ledger_hash":"355d92f841de89a1d97c3b2ea7623959ea4494bb62ea7e67ad359beb68caca8c","messages_hash":"a180177bd180e7945ff4ce61b48c12cb0fd21535f71e943ffc25ff67a770e0f0","txlist_hash":"b17176b511fdea4cd899cfaf83f2e12193a4c92d1b199f18f590eb4fed90fa25"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(23,310002,'insert','blocks','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(24,310003,'insert','transactions','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"btc_amount":0,"data":"0000001400000003c58e5c5600000000000003e8010000000000000000000e43616c6c61626c65206173736574","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"c26f3a0c4e57e41919ff27aae95a9a9d4d65d34c6da6f1893884a17c8d407140","tx_index":4}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(25,310003,'insert','debits','{"action":"issuance fee","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310003,"event":"c26f3a0c4e57e41919ff27aae95a9a9d4d65d34c6da6f1893884a17c8d407140","quantity":50000000,"tx_index":4}',0,'DEBIT');
-INSERT INTO messages VALUES(26,310003,'insert','assets','{"asset_id":"16199343190","asset_longname":null,"asset_name":"CALLABLE","block_index":310003}',0,'ASSET_CREATION');
-INSERT INTO messages VALUES(27,310003,'insert','issuances','{"asset":"CALLABLE","asset_longname":null,"block_index":310003,"call_date":0,"call_price":0.0,"callable":false,"description":"Callable asset","divisible":true,"fee_paid":50000000,"issuer":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","locked":false,"quantity":1000,"reset":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","transfer":false,"tx_hash":"c26f3a0c4e57e41919ff27aae95a9a9d4d65d34c6da6f1893884a17c8d407140","tx_index":4}',0,'ASSET_ISSUANCE');
-INSERT INTO messages VALUES(28,310003,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"CALLABLE","block_index":310003,"calling_function":"issuance","event":"c26f3a0c4e57e41919ff27aae95a9a9d4d65d34c6da6f1893884a17c8d407140","quantity":1000,"tx_index":4}',0,'CREDIT');
-INSERT INTO messages VALUES(29,310003,'parse','transactions','{"supported":true,"tx_hash":"c26f3a0c4e57e41919ff27aae95a9a9d4d65d34c6da6f1893884a17c8d407140","tx_index":4}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(30,310003,'parse','blocks','{"block_index":310003,"ledger_hash":"edcd7e344fb5cca16999f025594890b8b54543555e61eb3807406bb4204677f2","messages_hash":"424e7f569243bc71c70002dce988e93e6b19cfb7f859c2a5195533147d099d87","txlist_hash":"b6dffe5b8c1f483c3c20832d23dddd7b530afe7ac1f3f57f433da59d83b48f06"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(31,310003,'insert','blocks','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(32,310004,'insert','transactions','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"btc_amount":0,"data":"0000001400000000082c82e300000000000003e8010000000000000000000c4c6f636b6564206173736574","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"90b5734be98b0f2a0bd4b6a269c8db3368e2e387bb890ade239951d05423b4da","tx_index":5}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(33,310004,'insert','debits','{"action":"issuance fee","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310004,"event":"90b5734be98b0f2a0bd4b6a269c8db3368e2e387bb890ade239951d05423b4da","quantity":50000000,"tx_index":5}',0,'DEBIT');
-INSERT INTO messages VALUES(34,310004,'insert','assets','{"asset_id":"137134819","asset_longname":null,"asset_name":"LOCKED","block_index":310004}',0,'ASSET_CREATION');
-INSERT INTO messages VALUES(35,310004,'insert','issuances','{"asset":"LOCKED","asset_longname":null,"block_index":310004,"call_date":0,"call_price":0.0,"callable":false,"description":"Locked asset","divisible":true,"fee_paid":50000000,"issuer":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","locked":false,"quantity":1000,"reset":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","transfer":false,"tx_hash":"90b5734be98b0f2a0bd4b6a269c8db3368e2e387bb890ade239951d05423b4da","tx_index":5}',0,'ASSET_ISSUANCE');
-INSERT INTO messages VALUES(36,310004,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"LOCKED","block_index":310004,"calling_function":"issuance","event":"90b5734be98b0f2a0bd4b6a269c8db3368e2e387bb890ade239951d05423b4da","quantity":1000,"tx_index":5}',0,'CREDIT');
-INSERT INTO messages VALUES(37,310004,'parse','transactions','{"supported":true,"tx_hash":"90b5734be98b0f2a0bd4b6a269c8db3368e2e387bb890ade239951d05423b4da","tx_index":5}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(38,310004,'parse','blocks','{"block_index":310004,"ledger_hash":"abd71a31bc1f8a072761b23a5bc2976731ebdf305d1d7d33922e93573f308129","messages_hash":"e47e38f99b22b4e486fc05ee95352ec049c4d7e9e4b67082cadc62e928a2a9e7","txlist_hash":"3da72b0c813432f47a3a70887dfd29350d270e9ebaca9875ed6304c91888e387"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(39,310004,'insert','blocks','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(40,310005,'insert','transactions','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"btc_amount":0,"data":"0000001400000000082c82e3000000000000000001000000000000000000044c4f434b","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"344dcc8909ca3a137630726d0071dfd2df4f7c855bac150c7d3a8367835c90bc","tx_index":6}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(41,310005,'insert','debits','{"action":"issuance fee","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310005,"event":"344dcc8909ca3a137630726d0071dfd2df4f7c855bac150c7d3a8367835c90bc","quantity":0,"tx_index":6}',0,'DEBIT');
-INSERT INTO messages VALUES(42,310005,'insert','issuances','{"asset":"LOCKED","asset_longname":null,"block_index":310005,"call_date":0,"call_price":0.0,"callable":false,"description":"Locked asset","divisible":true,"fee_paid":0,"issuer":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","locked":true,"quantity":0,"reset":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","transfer":false,"tx_hash":"344dcc8909ca3a137630726d0071dfd2df4f7c855bac150c7d3a8367835c90bc","tx_index":6}',0,'ASSET_ISSUANCE');
-INSERT INTO messages VALUES(43,310005,'parse','transactions','{"supported":true,"tx_hash":"344dcc8909ca3a137630726d0071dfd2df4f7c855bac150c7d3a8367835c90bc","tx_index":6}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(44,310005,'parse','blocks','{"block_index":310005,"ledger_hash":"0c3914f9676e506a96e6db793f15200ef33087cd47de4d27628849013a391daa","messages_hash":"b5346d07ec8d18e36cbabc930ea2dc452d5fc26b12af0d060f7fb7ff46b8f99d","txlist_hash":"2d59f139907859f9108360f7fa4695101a6b5ef0b7dd0e56c2dd41641e58e9af"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(45,310005,'insert','blocks','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(46,310006,'insert','transactions','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"btc_amount":0,"data":"0000000a00000000000000010000000005f5e100000000a25be34b660000000005f5e10007d00000000000000000","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"4f0433ba841038e2e16328445930dd7bca35309b14b0da4451c8f94c631368b8","tx_index":7}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(47,310006,'insert','debits','{"action":"open order","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310006,"event":"4f0433ba841038e2e16328445930dd7bca35309b14b0da4451c8f94c631368b8","quantity":100000000,"tx_index":7}',0,'DEBIT');
-INSERT INTO messages VALUES(48,310006,'insert','orders','{"block_index":310006,"expiration":2000,"expire_index":312006,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":0,"fee_required_remaining":0,"get_asset":"DIVISIBLE","get_quantity":100000000,"get_remaining":100000000,"give_asset":"XCP","give_quantity":100000000,"give_remaining":100000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","tx_hash":"4f0433ba841038e2e16328445930dd7bca35309b14b0da4451c8f94c631368b8","tx_index":7}',0,'OPEN_ORDER');
-INSERT INTO messages VALUES(49,310006,'parse','transactions','{"supported":true,"tx_hash":"4f0433ba841038e2e16328445930dd7bca35309b14b0da4451c8f94c631368b8","tx_index":7}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(50,310006,'parse','blocks','{"block_index":310006,"ledger_hash":"57ff5f34a9e418b179db9003414c5f3bdfa7feeb538f24071b23d024a3d05df0","messages_hash":"2490d17814a7fac90af178d960f9e277e98bf005b8d3f076bc7c5d58634fc271","txlist_hash":"a4a6fb433e6c49968fded16954502c472b0d21b74c6cce8d08c8c53c00f2781e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(51,310006,'insert','blocks','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(52,310007,'insert','transactions','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"btc_amount":5430,"data":"00000000000000a25be34b660000000005f5e100","destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"6e91ae23de2035e3e28c3322712212333592a1f666bcff9dd91aec45d5ea2753","tx_index":8}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(53,310007,'insert','debits','{"action":"send","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"DIVISIBLE","block_index":310007,"event":"6e91ae23de2035e3e28c3322712212333592a1f666bcff9dd91aec45d5ea2753","quantity":100000000,"tx_index":8}',0,'DEBIT');
-INSERT INTO messages VALUES(54,310007,'insert','credits','{"address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"DIVISIBLE","block_index":310007,"calling_function":"send","event":"6e91ae23de2035e3e28c3322712212333592a1f666bcff9dd91aec45d5ea2753","quantity":100000000,"tx_index":8}',0,'CREDIT');
-INSERT INTO messages VALUES(55,310007,'insert','sends','{"asset":"DIVISIBLE","block_index":310007,"destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","quantity":100000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"6e91ae23de2035e3e28c3322712212333592a1f666bcff9dd91aec45d5ea2753","tx_index":8}',0,'SEND');
-INSERT INTO messages VALUES(56,310007,'parse','transactions','{"supported":true,"tx_hash":"6e91ae23de2035e3e28c3322712212333592a1f666bcff9dd91aec45d5ea2753","tx_index":8}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(57,310007,'parse','blocks','{"block_index":310007,"ledger_hash":"bfed530458339aab02ff75ad76738569dc6997c7a35d4452351678b04e022f68","messages_hash":"8147e6b42edd71153d880649a4b7b75c3e2fc59f122de054ebacf5204abee406","txlist_hash":"ce20264c332892b0a5e0c3e2d4b63d02c901fa2c3f8c5171b2896b50c82ea0af"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(58,310007,'insert','blocks','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(59,310008,'insert','transactions','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"btc_amount":5430,"data":"0000000000000000000000010000000005f5e100","destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"4fd55abadfdbe77c3bda2431749cca934a29994a179620a62c1b57f28bd62a43","tx_index":9}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(60,310008,'insert','debits','{"action":"send","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310008,"event":"4fd55abadfdbe77c3bda2431749cca934a29994a179620a62c1b57f28bd62a43","quantity":100000000,"tx_index":9}',0,'DEBIT');
-INSERT INTO messages VALUES(61,310008,'insert','credits','{"address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"XCP","block_index":310008,"calling_function":"send","event":"4fd55abadfdbe77c3bda2431749cca934a29994a179620a62c1b57f28bd62a43","quantity":100000000,"tx_index":9}',0,'CREDIT');
-INSERT INTO messages VALUES(62,310008,'insert','sends','{"asset":"XCP","block_index":310008,"destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","quantity":100000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"4fd55abadfdbe77c3bda2431749cca934a29994a179620a62c1b57f28bd62a43","tx_index":9}',0,'SEND');
-INSERT INTO messages VALUES(63,310008,'parse','transactions','{"supported":true,"tx_hash":"4fd55abadfdbe77c3bda2431749cca934a29994a179620a62c1b57f28bd62a43","tx_index":9}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(64,310008,'parse','blocks','{"block_index":310008,"ledger_hash":"d4feec997754d11a1502e5351ed62fcfbfcafb770e19a37da41d1d88b7b45ed4","messages_hash":"d573b3b22e23c8e7ced1388219033e4b3a1c7711944acfb2926abfdbdd63b44b","txlist_hash":"d25c9f48fbbe2010a62cad729d45b658a2caf9a7c9abc65a30e2a7fc47bc83e5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(65,310008,'insert','blocks','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(66,310009,'insert','transactions','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"btc_amount":0,"data":"0000000a00000000000000010000000005f5e100000000a25be34b660000000005f5e10007d00000000000000000","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"21460d5c07284f9be9baf824927d0d4e4eb790e297f3162305841607b672349b","tx_index":10}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(67,310009,'insert','debits','{"action":"open order","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310009,"event":"21460d5c07284f9be9baf824927d0d4e4eb790e297f3162305841607b672349b","quantity":100000000,"tx_index":10}',0,'DEBIT');
-INSERT INTO messages VALUES(68,310009,'insert','orders','{"block_index":310009,"expiration":2000,"expire_index":312009,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":0,"fee_required_remaining":0,"get_asset":"DIVISIBLE","get_quantity":100000000,"get_remaining":100000000,"give_asset":"XCP","give_quantity":100000000,"give_remaining":100000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","tx_hash":"21460d5c07284f9be9baf824927d0d4e4eb790e297f3162305841607b672349b","tx_index":10}',0,'OPEN_ORDER');
-INSERT INTO messages VALUES(69,310009,'parse','transactions','{"supported":true,"tx_hash":"21460d5c07284f9be9baf824927d0d4e4eb790e297f3162305841607b672349b","tx_index":10}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(70,310009,'parse','blocks','{"block_index":310009,"ledger_hash":"4ab5ff9e71bbc83956557fb5abec98372fa38e5580838fb258b2d831bfc4d9ea","messages_hash":"54c64b7338e79af0bc6b238eb91692ac0331345cbd6278ef27aa3f6a7351e35e","txlist_hash":"173e769e0b4fa951ef0267c7e218f3a473d9a5857b0880d654a2181f244c92e2"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(71,310009,'insert','blocks','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(72,310010,'insert','transactions','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"btc_amount":0,"data":"0000000a00000000000000010000000005f5e100000000000000000000000000000f424007d000000000000dbba0","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"1899b2e6ec36ba4bc9d035e6640b0a62b08c3a147c77c89183a77d9ed9081b3a","tx_index":11}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(73,310010,'insert','debits','{"action":"open order","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310010,"event":"1899b2e6ec36ba4bc9d035e6640b0a62b08c3a147c77c89183a77d9ed9081b3a","quantity":100000000,"tx_index":11}',0,'DEBIT');
-INSERT INTO messages VALUES(74,310010,'insert','orders','{"block_index":310010,"expiration":2000,"expire_index":312010,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":900000,"fee_required_remaining":900000,"get_asset":"BTC","get_quantity":1000000,"get_remaining":1000000,"give_asset":"XCP","give_quantity":100000000,"give_remaining":100000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","tx_hash":"1899b2e6ec36ba4bc9d035e6640b0a62b08c3a147c77c89183a77d9ed9081b3a","tx_index":11}',0,'OPEN_ORDER');
-INSERT INTO messages VALUES(75,310010,'parse','transactions','{"supported":true,"tx_hash":"1899b2e6ec36ba4bc9d035e6640b0a62b08c3a147c77c89183a77d9ed9081b3a","tx_index":11}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(76,310010,'parse','blocks','{"block_index":310010,"ledger_hash":"1909ef40a24263776cb9e0d52a690048b50728855a0fe4b0e1ba3834a9e401c1","messages_hash":"895d6cc5aa14f7618cc66b2593b43d0223387fd11f1b2b017c9f22140613afcc","txlist_hash":"7d1ef03dad99c4bdf7a8e5af7209a136c8ac392922dd3afdbcc0446ea1f5f604"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(77,310010,'insert','blocks','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(78,310011,'insert','transactions','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"btc_amount":0,"data":"0000000a000000000000000000000000000a2c2b00000000000000010000000005f5e10007d00000000000000000","destination":"","fee":1000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"a1768d7db2db3b9732b26df8c04db4b9a8535a1e5cf684a680e81e7c06f394b6","tx_index":12}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(79,310011,'insert','orders','{"block_index":310011,"expiration":2000,"expire_index":312011,"fee_provided":1000000,"fee_provided_remaining":1000000,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":100000000,"get_remaining":100000000,"give_asset":"BTC","give_quantity":666667,"give_remaining":666667,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","tx_hash":"a1768d7db2db3b9732b26df8c04db4b9a8535a1e5cf684a680e81e7c06f394b6","tx_index":12}',0,'OPEN_ORDER');
-INSERT INTO messages VALUES(80,310011,'parse','transactions','{"supported":true,"tx_hash":"a1768d7db2db3b9732b26df8c04db4b9a8535a1e5cf684a680e81e7c06f394b6","tx_index":12}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(81,310011,'parse','blocks','{"block_index":310011,"ledger_hash":"c3d51a5f2df90c089844ba4de7d5541f6051490aa1389e5945a7bb91d49e3589","messages_hash":"9603465a786c9b927cdf36078b09eed3481d863a390eb52cf617fab895f6be65","txlist_hash":"86ebe5be8b9443f411adcd49e7443a34941979c0c6bf40136a3b44193024abfc"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(82,310011,'insert','blocks','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(83,310012,'insert','transactions','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"btc_amount":1000,"data":"0000000000000000000000010000000011e1a300","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"698e97e507da8623cf38ab42701853443c8f7fe0d93b4674aabb42f9800ee9d6","tx_index":13}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(84,310012,'insert','debits','{"action":"send","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310012,"event":"698e97e507da8623cf38ab42701853443c8f7fe0d93b4674aabb42f9800ee9d6","quantity":300000000,"tx_index":13}',0,'DEBIT');
-INSERT INTO messages VALUES(85,310012,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310012,"calling_function":"send","event":"698e97e507da8623cf38ab42701853443c8f7fe0d93b4674aabb42f9800ee9d6","quantity":300000000,"tx_index":13}',0,'CREDIT');
-INSERT INTO messages VALUES(86,310012,'insert','sends','{"asset":"XCP","block_index":310012,"destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","quantity":300000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"698e97e507da8623cf38ab42701853443c8f7fe0d93b4674aabb42f9800ee9d6","tx_index":13}',0,'SEND');
-INSERT INTO messages VALUES(87,310012,'parse','transactions','{"supported":true,"tx_hash":"698e97e507da8623cf38ab42701853443c8f7fe0d93b4674aabb42f9800ee9d6","tx_index":13}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(88,310012,'parse','blocks','{"block_index":310012,"ledger_hash":"a9dc31556d38b118eeb0bcbb3a374a0ed79adec4eb23e00c80c0599ba97c9a7a","messages_hash":"f064f5cc3b48464bef3b6aa9b77a01adf3fb99168888a5615a369d1bcf125ec2","txlist_hash":"5a729b250068fe7b175a540b66a30326344514e357023184540ef97bae5e16e7"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(89,310012,'insert','blocks','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(90,310013,'insert','transactions','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"btc_amount":1000,"data":"00000000000000a25be34b66000000003b9aca00","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"0cfeeb559ed794d067557df0376a6c213b48b174b80cdb2c3c6d365cf538e132","tx_index":14}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(91,310013,'insert','debits','{"action":"send","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"DIVISIBLE","block_index":310013,"event":"0cfeeb559ed794d067557df0376a6c213b48b174b80cdb2c3c6d365cf538e132","quantity":1000000000,"tx_index":14}',0,'DEBIT');
-INSERT INTO messages VALUES(92,310013,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"DIVISIBLE","block_index":310013,"calling_function":"send","event":"0cfeeb559ed794d067557df0376a6c213b48b174b80cdb2c3c6d365cf538e132","quantity":1000000000,"tx_index":14}',0,'CREDIT');
-INSERT INTO messages VALUES(93,310013,'insert','sends','{"asset":"DIVISIBLE","block_index":310013,"destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","quantity":1000000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"0cfeeb559ed794d067557df0376a6c213b48b174b80cdb2c3c6d365cf538e132","tx_index":14}',0,'SEND');
-INSERT INTO messages VALUES(94,310013,'parse','transactions','{"supported":true,"tx_hash":"0cfeeb559ed794d067557df0376a6c213b48b174b80cdb2c3c6d365cf538e132","tx_index":14}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(95,310013,'parse','blocks','{"block_index":310013,"ledger_hash":"e72be5070d0a5853631d902d334e8b88eddf6e79616373311babc4a0a27dd3d8","messages_hash":"9c164d38483ae1923ddc825d301d86d8a71548f2a1edcfad8311e4111cc3e34a","txlist_hash":"1294e3d0871b0c2297d9980ed46bfa3563b33b202b426949dadeeba7075b4bc7"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(96,310013,'insert','blocks','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(97,310014,'insert','transactions','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"btc_amount":5430,"data":"000000000006cad8dc7f0b660000000000000005","destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"1facb0072f16f6bdca64ea859c82b850f58f0ec7ff410d901679772a4727515a","tx_index":15}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(98,310014,'insert','debits','{"action":"send","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"NODIVISIBLE","block_index":310014,"event":"1facb0072f16f6bdca64ea859c82b850f58f0ec7ff410d901679772a4727515a","quantity":5,"tx_index":15}',0,'DEBIT');
-INSERT INTO messages VALUES(99,310014,'insert','credits','{"address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"NODIVISIBLE","block_index":310014,"calling_function":"send","event":"1facb0072f16f6bdca64ea859c82b850f58f0ec7ff410d901679772a4727515a","quantity":5,"tx_index":15}',0,'CREDIT');
-INSERT INTO messages VALUES(100,310014,'insert','sends','{"asset":"NODIVISIBLE","block_index":310014,"destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","quantity":5,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"1facb0072f16f6bdca64ea859c82b850f58f0ec7ff410d901679772a4727515a","tx_index":15}',0,'SEND');
-INSERT INTO messages VALUES(101,310014,'parse','transactions','{"supported":true,"tx_hash":"1facb0072f16f6bdca64ea859c82b850f58f0ec7ff410d901679772a4727515a","tx_index":15}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(102,310014,'parse','blocks','{"block_index":310014,"ledger_hash":"cb0962222af917dbac2a11465c22cd80770c0b3cdb8bdc0870c99a8116745c9e","messages_hash":"81a62b796cd9dbf6eaecf4053b5896e384cf08135dd7aef545c48feadfbd6936","txlist_hash":"d5431af170b331497d8967969820632880473d06dae0d06fa7ffc93a0cb90180"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(103,310014,'insert','blocks','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(104,310015,'insert','transactions','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"btc_amount":1000,"data":"000000000006cad8dc7f0b66000000000000000a","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"e3b6667b7baa515048a7fcf2be7818e3e7622371236b78e19b4b08e2d7e7818c","tx_index":16}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(105,310015,'insert','debits','{"action":"send","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"NODIVISIBLE","block_index":310015,"event":"e3b6667b7baa515048a7fcf2be7818e3e7622371236b78e19b4b08e2d7e7818c","quantity":10,"tx_index":16}',0,'DEBIT');
-INSERT INTO messages VALUES(106,310015,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"NODIVISIBLE","block_index":310015,"calling_function":"send","event":"e3b6667b7baa515048a7fcf2be7818e3e7622371236b78e19b4b08e2d7e7818c","quantity":10,"tx_index":16}',0,'CREDIT');
-INSERT INTO messages VALUES(107,310015,'insert','sends','{"asset":"NODIVISIBLE","block_index":310015,"destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","quantity":10,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"e3b6667b7baa515048a7fcf2be7818e3e7622371236b78e19b4b08e2d7e7818c","tx_index":16}',0,'SEND');
-INSERT INTO messages VALUES(108,310015,'parse','transactions','{"supported":true,"tx_hash":"e3b6667b7baa515048a7fcf2be7818e3e7622371236b78e19b4b08e2d7e7818c","tx_index":16}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(109,310015,'parse','blocks','{"block_index":310015,"ledger_hash":"6ff899433f22546c41a15f20b4c66913c747931500fee10d58c4a17b9e2f0c88","messages_hash":"ea46fd7c1ff0ff2b73dc503b3ba507ab43442ffac120f56b5fd0803d27db4b9c","txlist_hash":"b77c1d69b3ac7348e336cce9948f982efafa1cb56cbdde85fe9f49a73871ba3b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(110,310015,'insert','blocks','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(111,310016,'insert','transactions','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"btc_amount":0,"data":"000000140000000000033a3e7fffffffffffffff01000000000000000000104d6178696d756d207175616e74697479","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"bd4e9cbbe69c2db893cd32182a2d315c89c45ba4e31aa5775d1fe42d841cea39","tx_index":17}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(112,310016,'insert','debits','{"action":"issuance fee","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310016,"event":"bd4e9cbbe69c2db893cd32182a2d315c89c45ba4e31aa5775d1fe42d841cea39","quantity":50000000,"tx_index":17}',0,'DEBIT');
-INSERT INTO messages VALUES(113,310016,'insert','assets','{"asset_id":"211518","asset_longname":null,"asset_name":"MAXI","block_index":310016}',0,'ASSET_CREATION');
-INSERT INTO messages VALUES(114,310016,'insert','issuances','{"asset":"MAXI","asset_longname":null,"block_index":310016,"call_date":0,"call_price":0.0,"callable":false,"description":"Maximum quantity","divisible":true,"fee_paid":50000000,"issuer":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","locked":false,"quantity":9223372036854775807,"reset":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","transfer":false,"tx_hash":"bd4e9cbbe69c2db893cd32182a2d315c89c45ba4e31aa5775d1fe42d841cea39","tx_index":17}',0,'ASSET_ISSUANCE');
-INSERT INTO messages VALUES(115,310016,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"MAXI","block_index":310016,"calling_function":"issuance","event":"bd4e9cbbe69c2db893cd32182a2d315c89c45ba4e31aa5775d1fe42d841cea39","quantity":9223372036854775807,"tx_index":17}',0,'CREDIT');
-INSERT INTO messages VALUES(116,310016,'parse','transactions','{"supported":true,"tx_hash":"bd4e9cbbe69c2db893cd32182a2d315c89c45ba4e31aa5775d1fe42d841cea39","tx_index":17}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(117,310016,'parse','blocks','{"block_index":310016,"ledger_hash":"ec66a06cde401b66917c6d1d4e1ee8893405cfbf0474560d9997d6960c8af710","messages_hash":"32d216ca6a80cb867f8963ab1ddde2bd07a969e095d67c80aecd0950a01a6218","txlist_hash":"6d3d469ad1b72a67ee50d8a7c6c57069da3a0e2e9d12a23a30bbf4f2ccc64cb6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(118,310016,'insert','blocks','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(119,310017,'insert','transactions','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"btc_amount":0,"data":"0000001e52bb33003ff0000000000000004c4b4009556e69742054657374","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"d14388b74b63d93e4477b1fe8426028bb8ab20656703e3ce8deeb23c2fe0b8af","tx_index":18}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(120,310017,'insert','broadcasts','{"block_index":310017,"fee_fraction_int":5000000,"locked":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","text":"Unit Test","timestamp":1388000000,"tx_hash":"d14388b74b63d93e4477b1fe8426028bb8ab20656703e3ce8deeb23c2fe0b8af","tx_index":18,"value":1.0}',0,'BROADCAST');
-INSERT INTO messages VALUES(121,310017,'parse','transactions','{"supported":true,"tx_hash":"d14388b74b63d93e4477b1fe8426028bb8ab20656703e3ce8deeb23c2fe0b8af","tx_index":18}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(122,310017,'parse','blocks','{"block_index":310017,"ledger_hash":"b2053109bff06dae1705fc32ab0712f38bf9d206fa3517fbf0a938d1b5f33bad","messages_hash":"720dfe78fccdb0831b951f79905c945a3c7abb6f13c3e258e7c3b8b7ddbfae36","txlist_hash":"223e10a8e23e4435e635f1dda533a0662dff9f0e3fb86b72a22b2c191f731a80"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(123,310017,'insert','blocks','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(124,310018,'insert','transactions','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"btc_amount":0,"data":"0000001e4cc552003ff000000000000000000000046c6f636b","destination":"","fee":6800,"source":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","supported":true,"tx_hash":"f9e0527c85a9084d7eda91fc30a49993370d029efea031a8ccccdf846146a660","tx_index":19}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(125,310018,'insert','broadcasts','{"block_index":310018,"fee_fraction_int":null,"locked":true,"source":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","status":"valid","text":null,"timestamp":0,"tx_hash":"f9e0527c85a9084d7eda91fc30a49993370d029efea031a8ccccdf846146a660","tx_index":19,"value":null}',0,'BROADCAST');
-INSERT INTO messages VALUES(126,310018,'parse','transactions','{"supported":true,"tx_hash":"f9e0527c85a9084d7eda91fc30a49993370d029efea031a8ccccdf846146a660","tx_index":19}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(127,310018,'parse','blocks','{"block_index":310018,"ledger_hash":"d7051de4d03fb31bfedf215b407b1edc12789c1f2748abb5a72257ad8f5113ce","messages_hash":"260724f92886f32a80da2705559eda171d2bd55724a534c72740e05b348c1874","txlist_hash":"9eb6f4683bebb675467829573cd2f7e3ab613d21398c5aef31ed389a40f3c48d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(128,310018,'insert','blocks','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(129,310019,'insert','transactions','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"btc_amount":5430,"data":"00000028000152bb3301000000000000000900000000000000090000000000000000000013b000000064","destination":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"2a2169991597036b6dad687ea1feffd55465a204466f40c35cbba811cb3109b1","tx_index":20}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(130,310019,'insert','debits','{"action":"bet","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310019,"event":"2a2169991597036b6dad687ea1feffd55465a204466f40c35cbba811cb3109b1","quantity":9,"tx_index":20}',0,'DEBIT');
-INSERT INTO messages VALUES(131,310019,'insert','bets','{"bet_type":1,"block_index":310019,"counterwager_quantity":9,"counterwager_remaining":9,"deadline":1388000001,"expiration":100,"expire_index":310119,"fee_fraction_int":5000000.0,"feed_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","leverage":5040,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","target_value":0.0,"tx_hash":"2a2169991597036b6dad687ea1feffd55465a204466f40c35cbba811cb3109b1","tx_index":20,"wager_quantity":9,"wager_remaining":9}',0,'OPEN_BET');
-INSERT INTO messages VALUES(132,310019,'parse','transactions','{"supported":true,"tx_hash":"2a2169991597036b6dad687ea1feffd55465a204466f40c35cbba811cb3109b1","tx_index":20}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(133,310019,'parse','blocks','{"block_index":310019,"ledger_hash":"35c95a70193ded2f9ee18254a91ce5d4834bb162fc3cca85dd432339257539b8","messages_hash":"10830661175f7d2bf48585647709d277e5a895b536f58f83672c14d5026992e8","txlist_hash":"88220e5f48660f8b9e339c3afb65ffbad83d632164f1df8e22af2ee6fc18826e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(134,310019,'insert','blocks','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(135,310020,'insert','transactions','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"btc_amount":5430,"data":"00000028000052bb3301000000000000000900000000000000090000000000000000000013b000000064","destination":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","fee":7650,"source":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","supported":true,"tx_hash":"5c6562ddad0bc8a1faaded18813a65522cd273709acd190cf9d3271817eefc93","tx_index":21}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(136,310020,'insert','debits','{"action":"bet","address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"XCP","block_index":310020,"event":"5c6562ddad0bc8a1faaded18813a65522cd273709acd190cf9d3271817eefc93","quantity":9,"tx_index":21}',0,'DEBIT');
-INSERT INTO messages VALUES(137,310020,'insert','bets','{"bet_type":0,"block_index":310020,"counterwager_quantity":9,"counterwager_remaining":9,"deadline":1388000001,"expiration":100,"expire_index":310120,"fee_fraction_int":5000000.0,"feed_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","leverage":5040,"source":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","status":"open","target_value":0.0,"tx_hash":"5c6562ddad0bc8a1faaded18813a65522cd273709acd190cf9d3271817eefc93","tx_index":21,"wager_quantity":9,"wager_remaining":9}',0,'OPEN_BET');
-INSERT INTO messages VALUES(138,310020,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310020,"calling_function":"filled","event":"5c6562ddad0bc8a1faaded18813a65522cd273709acd190cf9d3271817eefc93","quantity":0,"tx_index":21}',0,'CREDIT');
-INSERT INTO messages VALUES(139,310020,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"2a2169991597036b6dad687ea1feffd55465a204466f40c35cbba811cb3109b1","wager_remaining":0}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(140,310020,'insert','credits','{"address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"XCP","block_index":310020,"calling_function":"filled","event":"5c6562ddad0bc8a1faaded18813a65522cd273709acd190cf9d3271817eefc93","quantity":0,"tx_index":21}',0,'CREDIT');
-INSERT INTO messages VALUES(141,310020,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"5c6562ddad0bc8a1faaded18813a65522cd273709acd190cf9d3271817eefc93","wager_remaining":0}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(142,310020,'insert','bet_matches','{"backward_quantity":9,"block_index":310019,"deadline":1388000001,"fee_fraction_int":5000000,"feed_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","forward_quantity":9,"id":"2a2169991597036b6dad687ea1feffd55465a204466f40c35cbba811cb3109b1_5c6562ddad0bc8a1faaded18813a65522cd273709acd190cf9d3271817eefc93","initial_value":1.0,"leverage":5040,"match_expire_index":310119,"status":"pending","target_value":0.0,"tx0_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","tx0_bet_type":1,"tx0_block_index":310019,"tx0_expiration":100,"tx0_hash":"2a2169991597036b6dad687ea1feffd55465a204466f40c35cbba811cb3109b1","tx0_index":20,"tx1_address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","tx1_bet_type":0,"tx1_block_index":310020,"tx1_expiration":100,"tx1_hash":"5c6562ddad0bc8a1faaded18813a65522cd273709acd190cf9d3271817eefc93","tx1_index":21}',0,'BET_MATCH');
-INSERT INTO messages VALUES(143,310020,'parse','transactions','{"supported":true,"tx_hash":"5c6562ddad0bc8a1faaded18813a65522cd273709acd190cf9d3271817eefc93","tx_index":21}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(144,310020,'parse','blocks','{"block_index":310020,"ledger_hash":"8315de64ee1051c333687ba9fae6244287b85bcc1e3a4b67f3fe7d51b931378b","messages_hash":"dd333107fc51c883a23785c8e2176bc01fc1bf8d52ff8d37ee925e9991b03a7a","txlist_hash":"087de9b1715dfdac7372489fc615b597c9575c9520eb1ad5f7435a2641388621"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(145,310020,'insert','blocks','{"block_hash":"7c2460bb32c5749c856486393239bf7a0ac789587ac71f32e7237910da8097f2","block_index":310021,"block_time":310021000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(146,310021,'parse','blocks','{"block_index":310021,"ledger_hash":"c2d646bd3f54eec73cd9da6f5da4bc159d0c64e8fb9ad4095dfa58850e65c7b1","messages_hash":"45bb0c5dd432a2d7313fbf6185637260877da537b18334604280a29539e73205","txlist_hash":"e5f36761a4755ebc133389b9bc01a085c585a24fa346c784123f3dd5a125ad27"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(147,310021,'insert','blocks','{"block_hash":"44435f9a99a0aa12a9bfabdc4cb8119f6ea6a6e1350d2d65445fb66a456db5fc","block_index":310022,"block_time":310022000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(148,310022,'parse','blocks','{"block_index":310022,"ledger_hash":"619367fb7657e0fb4800acd385eb5593d085ce5cbfbfb098dafa98612d9fd445","messages_hash":"0b5b6279634c98137b3ebd37b0e31af63b183c0f8ae6942df3aec9e0b6ef725f","txlist_hash":"e62992a5e4f80347f92c512e1bd47df4c2f4e9fa0c38b7ca73befd39fd181d54"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(149,310022,'insert','blocks','{"block_hash":"d8cf5bec1bbcab8ca4f495352afde3b6572b7e1d61b3976872ebb8e9d30ccb08","block_index":310023,"block_time":310023000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(150,310023,'parse','blocks','{"block_index":310023,"ledger_hash":"ba865dbc8263aaf153d7264dfc6a580bebe9391ca0551f15a1c822c6cbe2b8de","messages_hash":"41612e674a216f80e46263c28770962c5cacf632df3151fee409c0f9eef3a498","txlist_hash":"e62acd9368da6141ddf435bd919fe0e124bd77646207d69a2544790107ab88a5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(151,310023,'insert','blocks','{"block_hash":"b03042b4e18a222b4c8d1e9e1970d93e6e2a2d41686d227ff8ecf0a839223dc5","block_index":310024,"block_time":310024000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(152,310024,'parse','blocks','{"block_index":310024,"ledger_hash":"368e948cbf42de80aca51abe75d09ec78196924453719182ccc86419df5da2db","messages_hash":"5cc0e229526c00f288c81848c45d12cc6a24fc0ba84e8d78041d84b8e28fbf88","txlist_hash":"2c65dfdc0d371025c6d497e087b8548633238d6049242fa411383fcce72b096e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(153,310024,'insert','blocks','{"block_hash":"a872e560766832cc3b4f7f222228cb6db882ce3c54f6459f62c71d5cd6e90666","block_index":310025,"block_time":310025000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(154,310025,'parse','blocks','{"block_index":310025,"ledger_hash":"9f7132c808936f580d4fb1dc5791541a5a3d23532d1093c20d434007f8dde54c","messages_hash":"cc0a82636125f077fd262e62ce5e60bd457154376ba685a771a4b92388324420","txlist_hash":"ca60850f73099aabc38d1521a94d611cc02f4539620a17488d1e9a445087104f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(155,310025,'insert','blocks','{"block_hash":"6c96350f6f2f05810f19a689de235eff975338587194a36a70dfd0fcd490941a","block_index":310026,"block_time":310026000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(156,310026,'parse','blocks','{"block_index":310026,"ledger_hash":"074ea6f10a5290cff31f7b21483f7b2248723c8d1b5bc060c31219f66f37def7","messages_hash":"33266041a43b151330c149d5536ca098c595054d54d88c2a06bfb257f64c4c06","txlist_hash":"21db77ad7cd241752184fa9fd61ab9cf670cd40105d7d9b887d8df62f25e5cfc"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(157,310026,'insert','blocks','{"block_hash":"d7acfac66df393c4482a14c189742c0571b89442eb7f817b34415a560445699e","block_index":310027,"block_time":310027000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(158,310027,'parse','blocks','{"block_index":310027,"ledger_hash":"a3ade2b2e5bc701996f511f3e85d596b60f882a3254fd975769c0f38b3b14cb3","messages_hash":"df932138bd7a19f61e98148cbc5ef645be2d4e05674258fb5f1659bc0be276ca","txlist_hash":"9469f4c4b4f208f2a46569234006846d18ae108ca6a98600ab70bac1ef1ad633"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(159,310027,'insert','blocks','{"block_hash":"02409fcf8fa06dafcb7f11e38593181d9c42cc9d5e2ddc304d098f990bd9530b","block_index":310028,"block_time":310028000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(160,310028,'parse','blocks','{"block_index":310028,"ledger_hash":"3bf124a34825b5c487c94dd79b1ea4f25e657294966879f1c10b56b37a3d29b5","messages_hash":"647074e7d5c71b584b7661d02f6f5cac0ea9a0a9fd13ae78d4d2bf4c76793d2d","txlist_hash":"55de4927d0ba81d336f143b08224af9fe9a862bf0ed4d39fbe242e9c5946bcf4"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(161,310028,'insert','blocks','{"block_hash":"3c739fa8b40c118d5547ea356ee8d10ee2898871907643ec02e5db9d00f03cc6","block_index":310029,"block_time":310029000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(162,310029,'parse','blocks','{"block_index":310029,"ledger_hash":"e502eb7b282e0bd4940d8f75ef51d677a641f3d55304adcb015bc249c97892bf","messages_hash":"bfe4c7d60e0cca63ba44a61e12c48e2d840faf4a0aa92ba197a9d4fb17f7ddcc","txlist_hash":"3d879f96d783e70a75f71c2b44ae4c5601bc8f1192b828f1b35400b8c99aa0f2"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(163,310029,'insert','blocks','{"block_hash":"d5071cddedf89765ee0fd58f209c1c7d669ba8ea66200a57587da8b189b9e4f5","block_index":310030,"block_time":310030000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(164,310030,'parse','blocks','{"block_index":310030,"ledger_hash":"d64b5eb04ddfb5600be40142b1fd27c308387a35942a6e8a6916407bbc1313b1","messages_hash":"96e13c2a5517d1740fdd2dd5c805a13a37104bc0470eebf6ab1ee5f6edc49343","txlist_hash":"c859356c985f3c051d5b01424759e66e9ec7c2eac055eb9fc2b0ad7323253a6a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(165,310030,'insert','blocks','{"block_hash":"0b02b10f41380fff27c543ea8891ecb845bf7a003ac5c87e15932aff3bfcf689","block_index":310031,"block_time":310031000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(166,310031,'parse','blocks','{"block_index":310031,"ledger_hash":"e9c97dd7adb1b22d4ed0238607faeb2d14c090fbd7d685275ee802ab23b4b740","messages_hash":"92abe74beca9968adb2f2952a4eb710fefe4df33f4cf2ea0319a0d36c93b8bec","txlist_hash":"4cdafec839c7abdda11f10437d890c952b3416929ff6e715f44e8c57412437af"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(167,310031,'insert','blocks','{"block_hash":"66346be81e6ba04544f2ae643b76c2b7b1383f038fc2636e02e49dc7ec144074","block_index":310032,"block_time":310032000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(168,310032,'parse','blocks','{"block_index":310032,"ledger_hash":"2544ffced9af1aabd84ab51fb78c56c9beac03dcb286aebd4202938dfa0754ea","messages_hash":"49f3542309f554440ef13516ddc8e88ae079b92a2c7c8eb97765a6ed6ac6cd10","txlist_hash":"2fc6c250a775ac70976d371540df4a7af608ca1b106b7efb7bc5a820ff505bdb"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(169,310032,'insert','blocks','{"block_hash":"999c65df9661f73e8c01f1da1afda09ac16788b72834f0ff5ea3d1464afb4707","block_index":310033,"block_time":310033000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(170,310033,'parse','blocks','{"block_index":310033,"ledger_hash":"4355d3ebb95187fec36b1847a4c3777d8e1d5541bd1d9ff8461b8ac5b9881261","messages_hash":"ceb14a6637c8a5764c7f33049973a6101daa056d265b46c248c3b8363c919c6c","txlist_hash":"d99b155e06fb50de6e7e6b646c641e3862d3d6df0ab9aec3e360fba0fcb54776"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(171,310033,'insert','blocks','{"block_hash":"f552edd2e0a648230f3668e72ddf0ddfb1e8ac0f4c190f91b89c1a8c2e357208","block_index":310034,"block_time":310034000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(172,310034,'parse','blocks','{"block_index":310034,"ledger_hash":"c7fcb5134bd8131c035d65b5eeef8a3cd214348822563232a992f3f703c6b0b9","messages_hash":"4ca5dd8e74223684d3d8c28a79b4e872787788fcae088ab3e3066788ffca65af","txlist_hash":"826d7b750bb4ad8fabd67c825c81f840b7a7a264489a9263410a5cb204d3309f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(173,310034,'insert','blocks','{"block_hash":"a13cbb016f3044207a46967a4ba1c87dab411f78c55c1179f2336653c2726ae2","block_index":310035,"block_time":310035000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(174,310035,'parse','blocks','{"block_index":310035,"ledger_hash":"c41c280498ce05d6073fc6e89be2684dc68c345c1c43c00b9a3f9041954fce26","messages_hash":"b500c7812d872ff80b668ed88d7a8898df99b0a2ef8d4ba16b85597fa3e1cd0e","txlist_hash":"f96598e2169d42d81b91ba03e7403dbd25a61399290f358022a998e4375fe2b9"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(175,310035,'insert','blocks','{"block_hash":"158648a98f1e1bd1875584ce8449eb15a4e91a99a923bbb24c4210135cef0c76","block_index":310036,"block_time":310036000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(176,310036,'parse','blocks','{"block_index":310036,"ledger_hash":"86c67fd234ca9d2406080018b2677386990fac477db8008c0092d40a398203ed","messages_hash":"1c2819e818ad5ef4ef1d5eb2b9e7630930a559a1cffa880ad0d34fc482b4063d","txlist_hash":"ae7fdf3e9388811e96d470070db9ac45b5b19754bb4ad424aade40fede3c9cf9"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(177,310036,'insert','blocks','{"block_hash":"563acfd6d991ce256d5655de2e9429975c8dceeb221e76d5ec6e9e24a2c27c07","block_index":310037,"block_time":310037000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(178,310037,'parse','blocks','{"block_index":310037,"ledger_hash":"3ae6272437eb0758a779d68785c41e119d1204dd5421c78e03b9d12eba64804b","messages_hash":"b39a9f69fbe9c498602609f3c6bf9bb18e6b97f83519c743afbc14e99d9cb95a","txlist_hash":"aa9600ce32fd7c1d6e963a51648eaae043685d3369413785517172d1f94d551b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(179,310037,'insert','blocks','{"block_hash":"b44b4cad12431c32df27940e18d51f63897c7472b70950d18454edfd640490b2","block_index":310038,"block_time":310038000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(180,310038,'parse','blocks','{"block_index":310038,"ledger_hash":"18f7552567b898f6c2cfe8c829903912445de5dbf05b56a13bf9b402a24fdc11","messages_hash":"49205a5e8db239c4c785868b103864f8727376c7188a58544537cdb035ce153f","txlist_hash":"46ce886f050bf7a80355da9cb15b35f5d38809ef2ec1a25250f057b63f51cdfc"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(181,310038,'insert','blocks','{"block_hash":"5fa1ae9c5e8a599247458987b006ad3a57f686df1f7cc240bf119e911b56c347","block_index":310039,"block_time":310039000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(182,310039,'parse','blocks','{"block_index":310039,"ledger_hash":"85f2255f9256a5faf59ddec1c58b1d3bc12c91bc2c62ead61b48e1f94ea2888d","messages_hash":"b4d3737b40df8aecdb8f755b92db906b8f215641fd79326bb4700d1f662b2f36","txlist_hash":"23a26edddf0c8662b055ed992c75c706221b59ce9a7aa45b757a3d5158772e8c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(183,310039,'insert','blocks','{"block_hash":"7200ded406675453eadddfbb2d14c2a4526c7dc2b5de14bd48b29243df5e1aa3","block_index":310040,"block_time":310040000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(184,310040,'parse','blocks','{"block_index":310040,"ledger_hash":"b799477db184351df5503f8d15d5461a0483ea35142c003b7e640429663ad943","messages_hash":"d5348f656d30e6e4b55706ba5a4a6dfdf262d8ed36d57c5f2fc71f8766d72af6","txlist_hash":"163682e05a9a10f3e3240420c932a7f3f2172484de30dbcac0319ac23a4726f1"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(185,310040,'insert','blocks','{"block_hash":"5db592ff9ba5fac1e030cf22d6c13b70d330ba397f415340086ee7357143b359","block_index":310041,"block_time":310041000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(186,310041,'parse','blocks','{"block_index":310041,"ledger_hash":"efa9cd46741b59e74263d6d348584f1a61e8ba32163c09fc3ff2e41a5431a483","messages_hash":"440373118703e7f53afd682abe5514d489a78722a600c1067430e7fec5f5fab0","txlist_hash":"a159868ce28207aa243e7ecc50f188e8e34e5ddb5d801b645b1c16a596e060ed"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(187,310041,'insert','blocks','{"block_hash":"826fd4701ef2824e9559b069517cd3cb990aff6a4690830f78fc845ab77fa3e4","block_index":310042,"block_time":310042000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(188,310042,'parse','blocks','{"block_index":310042,"ledger_hash":"f3159919f381d46a3e1341703e55192a02a36519e71fc2675285a3a14c4ee04d","messages_hash":"7611f3db3529dd5fbd5cf9a5ca7affc454536e57455b1b0ea043751c9437a89c","txlist_hash":"52bca7ccb83bfe83d8693ebc4c5b1ce518b2ae472dfc81f2c2940dc2460eeeab"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(189,310042,'insert','blocks','{"block_hash":"2254a12ada208f1dd57bc17547ecaf3c44720323c47bc7d4b1262477cb7f3c51","block_index":310043,"block_time":310043000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(190,310043,'parse','blocks','{"block_index":310043,"ledger_hash":"961c79ea2b7dcc2d7489c423b568fb978631e71732d6b998bcc0657aa4d19194","messages_hash":"110ad00303e1a01d59989b5ab6e4f166edff24c1a49e06b41cba8d56778e844e","txlist_hash":"1fa2eb6aa4c8b5efd093c6e484dddb85eabfa0de55edc929e04487ce65e73608"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(191,310043,'insert','blocks','{"block_hash":"3346d24118d8af0b3c6bcc42f8b85792e7a2e7036ebf6e4c25f4f6723c78e46b","block_index":310044,"block_time":310044000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(192,310044,'parse','blocks','{"block_index":310044,"ledger_hash":"d674c39010fd4554efa487d97a3d9cae278ed9b4aff0ce57db33bd881beeb3e3","messages_hash":"f7708c99c134b071aa3981d012c773e12738ece583c1b2b2908abc6a31556ea9","txlist_hash":"ddc2517e1efddbe56185e00d77333ef9f2f2ad6c59e042d65a8f4d8c2b323e5e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(193,310044,'insert','blocks','{"block_hash":"7bba0ab243839e91ad1a45a762bf074011f8a9883074d68203c6d1b46fffde98","block_index":310045,"block_time":310045000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(194,310045,'parse','blocks','{"block_index":310045,"ledger_hash":"9ba70a032ae92672174421689c0845784f0cef7374e88b2f5258260191864bf1","messages_hash":"15f23755cf1bc0aff99c1a9ed38462d951ed3ea24168c18786d71207390ca4c1","txlist_hash":"3b1d5cd9cb8e7b753233ac0dac5e697226ae372bff3813852434d96996e78fac"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(195,310045,'insert','blocks','{"block_hash":"47db6788c38f2d6d712764979e41346b55e78cbb4969e0ef5c4336faf18993a6","block_index":310046,"block_time":310046000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(196,310046,'parse','blocks','{"block_index":310046,"ledger_hash":"114a6ab930fbdf8531431620ed219db3756a634c5b99af6ce1ee66d527d277ff","messages_hash":"5796f08f5f53035af580104f79cebd606ff66c38b88361325289010a7a470268","txlist_hash":"becb4b0241accefb95aee137e58d406e15e87c28ed3f051938b4fc02e249b21c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(197,310046,'insert','blocks','{"block_hash":"a9ccabcc2a098a7d25e4ab8bda7c4e66807eefa42e29890dcd88149a10de7075","block_index":310047,"block_time":310047000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(198,310047,'parse','blocks','{"block_index":310047,"ledger_hash":"5356512c94ea2c77623d874a927aae8c3dce287a34dfd27a617abfa57142c7f3","messages_hash":"645ba6137d35e81be31cf45092ab0838b241755dd9d33aec134c20c08cd6b091","txlist_hash":"6e06ce8a113de9e8b1a88516a512671aa2cdef60168a40d91742caa281417634"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(199,310047,'insert','blocks','{"block_hash":"610bf3935a85b05a98556c55493c6de45bed4d7b3b6c8553a984718765796309","block_index":310048,"block_time":310048000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(200,310048,'parse','blocks','{"block_index":310048,"ledger_hash":"0902ca0868560d05049c983bca3ab91cdd5eafc46ab0a948d702abcbc4010582","messages_hash":"98854c5467b3003c63ec7e208c6c8282f461bb8a9a65e2dd39927a09b44a108a","txlist_hash":"67a2fb81ebb42dc6781746a403d81b4e7603f82f02724074541d42380d7269fe"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(201,310048,'insert','blocks','{"block_hash":"4ad2761923ad49ad2b283b640f1832522a2a5d6964486b21591b71df6b33be3c","block_index":310049,"block_time":310049000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(202,310049,'parse','blocks','{"block_index":310049,"ledger_hash":"978794628fc95756032cb7fb4e9d5ed286373d84fafbcfceec9af71d18c4c0be","messages_hash":"7524187fdd1244a0d1e4ea4ab1c5cdf5fdd2e1582e30a0d5b7af81ca0805ab76","txlist_hash":"ac68aa21454eb2a2ca973b5451523fc6d2a4df6906b9472891cf8e06087e130c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(203,310049,'insert','blocks','{"block_hash":"8cfeb60a14a4cec6e9be13d699694d49007d82a31065a17890383e262071e348","block_index":310050,"block_time":310050000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(204,310050,'parse','blocks','{"block_index":310050,"ledger_hash":"ff16abeb1d35e0e422f165e206b0d69e0b9ff48b68fc6656c1af74801908b92d","messages_hash":"0b5471a5d2323a894a74d6332822f0f216a0745089ac58a694b1c61a4094454f","txlist_hash":"720d553ed03860df12ab60af34cfec86b9d7ec80275f6d8815e3f61166e3af88"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(205,310050,'insert','blocks','{"block_hash":"b53c90385dd808306601350920c6af4beb717518493fd23b5c730eea078f33e6","block_index":310051,"block_time":310051000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(206,310051,'parse','blocks','{"block_index":310051,"ledger_hash":"556ff900993e70cabefd05ddd5dbe3e8e10bb5c9ada7913b75d84af067004ed5","messages_hash":"ebed9381df6057bd322c0652f404116bcc77e4a0c6acf142d5faec47d4baab45","txlist_hash":"656a21084dc8f46455fd2a42ebbdb0efd5c879ccb16e9b1532a6ab5323debdb4"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(207,310051,'insert','blocks','{"block_hash":"0acdacf4e4b6fca756479cb055191b367b1fa433aa558956f5f08fa5b7b394e2","block_index":310052,"block_time":310052000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(208,310052,'parse','blocks','{"block_index":310052,"ledger_hash":"15af3a616a2974aa70b7b58f88132051f335af299473db925b619fda8be1afc7","messages_hash":"95629a91ab0bd8a87878f7f65e9d02d6114e7e6ca7b0a0fcb36aacd89f0eeae9","txlist_hash":"3f90b36b7ebc9a2daea1e498bb44100f12f35c9df04260448bd38b23375b16be"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(209,310052,'insert','blocks','{"block_hash":"68348f01b6dc49b2cb30fe92ac43e527aa90d859093d3bf7cd695c64d2ef744f","block_index":310053,"block_time":310053000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(210,310053,'parse','blocks','{"block_index":310053,"ledger_hash":"ed0ed3b480b38929a425c2b61c86582495764624e020cb86b3a95fc7d59c692c","messages_hash":"80cb6a5ce7cc7a796965d8351977fed0a4655f702f72c3fec64ec6dc92d23f13","txlist_hash":"67427731be09b73755cd460d142686c903b819b7b8af48297d460ab91fde3609"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(211,310053,'insert','blocks','{"block_hash":"a8b5f253df293037e49b998675620d5477445c51d5ec66596e023282bb9cd305","block_index":310054,"block_time":310054000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(212,310054,'parse','blocks','{"block_index":310054,"ledger_hash":"f012825d2d549910910ad6b7e4ac2373d095b53869f0793709684f0ff05bb108","messages_hash":"d8dfbd478fa699dc45d2432bbb29ce342b54fb22abf175d13bb6da5c2d3abcf3","txlist_hash":"c5e4ba3e2011e7fbf238285525a544de3cc0fe9360a3451392a4c03acd508690"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(213,310054,'insert','blocks','{"block_hash":"4b069152e2dc82e96ed8a3c3547c162e8c3aceeb2a4ac07972f8321a535b9356","block_index":310055,"block_time":310055000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(214,310055,'parse','blocks','{"block_index":310055,"ledger_hash":"90c08144277fe622573282349edaf9e59289b716b5b4e368d88ac25e67e788d1","messages_hash":"8797bf8b7fa1c772c7c44e3301c80e0f723de397db4b8a2f809c096609242cf3","txlist_hash":"5e4a8aee5f04d75d9ffcc85e8344c445b5facfc838f39a77b6b0d5acf6cd8213"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(215,310055,'insert','blocks','{"block_hash":"7603eaed418971b745256742f9d2ba70b2c2b2f69f61de6cc70e61ce0336f9d3","block_index":310056,"block_time":310056000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(216,310056,'parse','blocks','{"block_index":310056,"ledger_hash":"c888ae590b64fa4514ed7f94ba785b12e881052185cc4702b598cf6e48cbb3ba","messages_hash":"8e16d14f35b8d9caa018a8a40be0d0850c5ae513906d5b4638c692a6b764909a","txlist_hash":"1cb780a12bb6040055fa694822a4f39c340a18a858f0b65a8b227a6fd6fb4f31"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(217,310056,'insert','blocks','{"block_hash":"4a5fdc84f2d66ecb6ee3e3646aad20751ce8694e64e348d3c8aab09d33a3e411","block_index":310057,"block_time":310057000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(218,310057,'parse','blocks','{"block_index":310057,"ledger_hash":"e68c9a569fda6f1e1e59502953c9735857a0ee158a76397722436466df24708e","messages_hash":"930ff03b64e3b4d399933ba76354b1d9291112c0593dba85d763c8300db1913f","txlist_hash":"2e175f240928edbbd5a5c6c5f3fbacd9516a36c7e99501703e9d1b19999b2029"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(219,310057,'insert','blocks','{"block_hash":"a6eef3089896f0cae0bfe9423392e45c48f4efe4310b14d8cfbdb1fea613635f","block_index":310058,"block_time":310058000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(220,310058,'parse','blocks','{"block_index":310058,"ledger_hash":"9f6607682f4a6274c2a45895f849816aec83ff0820709ba781634b84518eb05d","messages_hash":"0fbc130a453f3284eb9ec9c847ffbf5ff216ef3bffc06037190267cc2025e835","txlist_hash":"cca92bb672e368c0c1e5b4674a48e150a870f56a67339cbd74926d541ae2a4e4"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(221,310058,'insert','blocks','{"block_hash":"ab505de874c43f97c90be1c26a769e6c5cb140405c993b4a6cc7afc795f156a9","block_index":310059,"block_time":310059000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(222,310059,'parse','blocks','{"block_index":310059,"ledger_hash":"49b10a5c390f603e7be0d405bf1fcae95fd15682ef2e41a3b2fcf713d271e541","messages_hash":"fef609d5eaabd31efa0317a33730438569163fbab3fc09b9eff59a7b555fc4a5","txlist_hash":"12b8b50b634cb6843258f1c130df1cae60898c902d3e66ad00e1303fde4d8724"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(223,310059,'insert','blocks','{"block_hash":"974ad5fbef621e0a38eab811608dc9afaf10c8ecc85fed913075ba1a145e889b","block_index":310060,"block_time":310060000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(224,310060,'parse','blocks','{"block_index":310060,"ledger_hash":"1d6cea34d6f7042ced3a5211da80de88fa77c900af5526f3033b715e4f68df17","messages_hash":"c29369e9d69fcd23979ef58b8cfabc2d6041efe31c810e33bd62b46c8d7866e8","txlist_hash":"40fa40a1a2c02ca514f309fe27268e9e493374bf3edfca8de66e3d46efa32ba6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(225,310060,'insert','blocks','{"block_hash":"35d267d21ad386e7b7632292af1c422b0310dde7ca49a82f9577525a29c138cf","block_index":310061,"block_time":310061000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(226,310061,'parse','blocks','{"block_index":310061,"ledger_hash":"0c43668fdc3d6cc6ec84fee99c68f0eff21650a618db35bc20e428550eae9b0c","messages_hash":"38aef8af21f94ace651d152fbadb529721e3cc64959566388d348d249b226d68","txlist_hash":"4aa0becfc939793d7dccbb0b19881889a20c801e6c627be8ab8a2ffbd8cee8de"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(227,310061,'insert','blocks','{"block_hash":"b31a0054145319ef9de8c1cb19df5bcf4dc8a1ece20053aa494e5d3a00a2852f","block_index":310062,"block_time":310062000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(228,310062,'parse','blocks','{"block_index":310062,"ledger_hash":"cf03a34b29d3a8f8ea5fadb017426f2843c6ab2e785032b6dec70d7aba7bce4a","messages_hash":"e0764773525602d47d332abe4c68dd8c32d8c4585fe47587ecd218a7bc49ebc6","txlist_hash":"3317013c1e6464e0296f5aa7f50208ede42ff9051e4e3ce2da92584cb80a3079"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(229,310062,'insert','blocks','{"block_hash":"0cbcbcd5b7f2dc288e3a34eab3d4212463a5a56e886804fb4f9f1cf929eadebe","block_index":310063,"block_time":310063000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(230,310063,'parse','blocks','{"block_index":310063,"ledger_hash":"e145dfc2c7f053a1ba4c8a41d042b40c0748eefcf9e56c5e906ad4b12f3653eb","messages_hash":"c20c09edd2f2235e7287d0439fe2c6c46abfe7ea5a04fa35260840400f54b201","txlist_hash":"b58f95d06b31f7bb5c6f6bd5c5c4460ef4e4ce0e1d154b8557a18cb73f36d432"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(231,310063,'insert','blocks','{"block_hash":"e2db8065a195e85cde9ddb868a17d39893a60fb2b1255aa5f0c88729de7cbf30","block_index":310064,"block_time":310064000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(232,310064,'parse','blocks','{"block_index":310064,"ledger_hash":"ebc34184623da16251782c82098c7fcfda42f95b155eadfacab2a53e3b34333e","messages_hash":"cbc39bca2b7f961cd5c661f187d4dfa1b5dcb55eba9dec87327cea7eadbbe663","txlist_hash":"e33ac70126559506de70ca420f152dcb639fd0e841d0d7259c0136d518fd4f39"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(233,310064,'insert','blocks','{"block_hash":"8a7bc7a77c831ac4fd11b8a9d22d1b6a0661b07cef05c2e600c7fb683b861d2a","block_index":310065,"block_time":310065000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(234,310065,'parse','blocks','{"block_index":310065,"ledger_hash":"db746a9e0ad8f37c14ef14180dd1bc562ae757a6d4d042a517bb8953f34c6958","messages_hash":"24ca6fdcbb7bdd7358b565ac84d2f14c2314fed7857544359d0c850996e6b151","txlist_hash":"9d52ca0b8859777bcbe84606017ec53961075699eff51b34b80e5a6ed33b137f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(235,310065,'insert','blocks','{"block_hash":"b6959be51eb084747d301f7ccaf9e75f2292c9404633b1532e3692659939430d","block_index":310066,"block_time":310066000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(236,310066,'parse','blocks','{"block_index":310066,"ledger_hash":"cc71a63314b770e4e010bc7c66d8ab808451b6401e6df8558455a2bfc9bb4882","messages_hash":"9d96fefa3d3e1d197e765fcaf64952ec79b419ced4edf858fed794419153b848","txlist_hash":"5122312265a8305639f6490bc51fb025626dbcd38c5735ce85cd652348f2e86e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(237,310066,'insert','blocks','{"block_hash":"8b08eae98d7193c9c01863fac6effb9162bda010daeacf9e0347112f233b8577","block_index":310067,"block_time":310067000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(238,310067,'parse','blocks','{"block_index":310067,"ledger_hash":"a5812c0f3a37b04d5105bca6b0c4819a41beeedf5b0f314f476ab55d6c31235d","messages_hash":"bd447b29f603c6d56257ce8a559c137dfe2fdad10acdacce2bb003e391655225","txlist_hash":"764477c3a233cd407804695f42948d3017951e90b7474cfcc24ef81ee49fdad9"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(239,310067,'insert','blocks','{"block_hash":"9280e7297ef6313341bc81787a36acfc9af58f83a415afff5e3154f126cf52b5","block_index":310068,"block_time":310068000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(240,310068,'parse','blocks','{"block_index":310068,"ledger_hash":"14f065751896a2724251b6ca6d0297b344986980075fb72ad058ad0b5bedcd3c","messages_hash":"61dfcc035dbabe08298144762a6ab94589e14668d412ea20a79a0070437fb202","txlist_hash":"866fceb74e8e97d663493f3546519b01f51e1a3cb25bde4b0f3c2e960d2eda85"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(241,310068,'insert','blocks','{"block_hash":"486351f0655bf594ffaab1980cff17353b640b63e9c27239109addece189a6f7","block_index":310069,"block_time":310069000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(242,310069,'parse','blocks','{"block_index":310069,"ledger_hash":"a7dd17b4760fb65ac58be1b1653f7cb0e90574c47f70c61ff9f940ad15ad3658","messages_hash":"0eae6329012b77e96a46de6c909ecdfd0887599361884a84a9218aa70665be21","txlist_hash":"9e0565827fcf295ae2149bfcf5e0db29237f447760832083baf94de145bdb531"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(243,310069,'insert','blocks','{"block_hash":"8739e99f4dee8bebf1332f37f49a125348b40b93b74fe35579dd52bfba4fa7e5","block_index":310070,"block_time":310070000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(244,310070,'parse','blocks','{"block_index":310070,"ledger_hash":"8068a6bcc5d1fc1a78562f0f3165423b45b4674e55f21c4c09948fb65ee632c0","messages_hash":"4419538295a5c394523a396ad0cef24f72972618b2108e4cd084f0bbbf6a7cd6","txlist_hash":"03f84e0f0838204a53ce54e3cfecde00b2e5741ed08aab0c0d9ed99513ab4655"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(245,310070,'insert','blocks','{"block_hash":"7a099aa1bba0ead577f1e44f35263a1f115ed6a868c98d4dd71609072ae7f80b","block_index":310071,"block_time":310071000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(246,310071,'parse','blocks','{"block_index":310071,"ledger_hash":"af86ffad4b8dd68a0f18142935bbb18623cc5ce2e9e0c02f04c0e7a5dd974e17","messages_hash":"6a299b36e4ccfd1e32f81f91009e367cacc30aedaccbcefbd0273e351b94305f","txlist_hash":"9b3e1c7af0bb119e69813161c19aeac4dd5a594ece5f67f21ffb55b8edaa111f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(247,310071,'insert','blocks','{"block_hash":"7b17ecedc07552551b8129e068ae67cb176ca766ea3f6df74b597a94e3a7fc8a","block_index":310072,"block_time":310072000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(248,310072,'parse','blocks','{"block_index":310072,"ledger_hash":"36de48518d1446b33f2230c5eee7d18e040db543fe03dca001174f8382c209ee","messages_hash":"180ff6f6092c485217d79b3c5510f9d8e0664d09c882fd164ae3a49cb8a6a356","txlist_hash":"33fccfbad1dd91d9102b82f11b7c97883bc5d5fdfd44584cca6c40fbd04ce2d8"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(249,310072,'insert','blocks','{"block_hash":"ee0fe3cc9b3a48a2746b6090b63b442b97ea6055d48edcf4b2288396764c6943","block_index":310073,"block_time":310073000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(250,310073,'parse','blocks','{"block_index":310073,"ledger_hash":"4374f567cbc460b73e74d6190db353c3ee86b92c3f99e392beae3caeb264eb5f","messages_hash":"0e4b56334021fa1fb190d62b5c33fd7f37c126d28ef7a61a80d84eb1b7f833e5","txlist_hash":"7544980dbaa8029ae36d883e3079bcc82f2d140072d4dd65cb3384510692ff45"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(251,310073,'insert','blocks','{"block_hash":"ceab38dfde01f711a187601731ad575d67cfe0b7dbc61dcd4f15baaef72089fb","block_index":310074,"block_time":310074000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(252,310074,'parse','blocks','{"block_index":310074,"ledger_hash":"54fd95cdf7f9374d1687590f2860276afe67a265ddd9216e5b63fb06c5bd569e","messages_hash":"ec24c8cf2685cb4750e7e3da65223b72da2e8afff49e12f36b795105d7dd89c9","txlist_hash":"1efba9ea6a8d2e7ee6ee2070b84b497feb66e3387e05c1e4f4989f086e5e02a2"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(253,310074,'insert','blocks','{"block_hash":"ef547198c6e36d829f117cfd7077ccde45158e3c545152225fa24dba7a26847b","block_index":310075,"block_time":310075000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(254,310075,'parse','blocks','{"block_index":310075,"ledger_hash":"2b42e23b43d30f91fe7705a01f0c8ec86d6230815b587704bcc70b91b5ae87b8","messages_hash":"2178b64331b1afaf3a8d650a93f6173ab0729b9d776b5f4c552970e79db18a0f","txlist_hash":"a370830ef1758c18c88e6d9fcc5803fc15f1dbdad0f2d6a0773f902d86ad7c97"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(255,310075,'insert','blocks','{"block_hash":"3b0499c2e8e8f0252c7288d4ecf66efc426ca37aad3524424d14c8bc6f8b0d92","block_index":310076,"block_time":310076000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(256,310076,'parse','blocks','{"block_index":310076,"ledger_hash":"577092728a4dc81cd9a06fcf6d2b058f0e4ce8bcb395819a704d6b4144f041dc","messages_hash":"29783a12523c7d590f0c9aa3b71f221de0359f61a368924800b80919084823a2","txlist_hash":"05ce95f07d03f4417a2fd15224418c8ba4ae196e9ec6f3192f5324c028363641"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(257,310076,'insert','blocks','{"block_hash":"d2adeefa9024ab3ff2822bc36acf19b6c647cea118cf15b86c6bc00c3322e7dd","block_index":310077,"block_time":310077000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(258,310077,'parse','blocks','{"block_index":310077,"ledger_hash":"d1ba60181f3061673c64ecd0b92abbc19b1a6e69a927dfefdfd8b8c74171ecd2","messages_hash":"821a8fad56889c6609d97cdd7e6bc8b6ecc68d54318986551c747ac45e22cd54","txlist_hash":"6c9e35feb56fb01c37fce04a1e6dc5f7747a6d26ee2f39ac584f11e8359dce71"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(259,310077,'insert','blocks','{"block_hash":"f6c17115ef0efe489c562bcda4615892b4d4b39db0c9791fe193d4922bd82cd6","block_index":310078,"block_time":310078000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(260,310078,'parse','blocks','{"block_index":310078,"ledger_hash":"c0a9270d15793e68cfd1cf445315d737bed7052914da6def4f014c21f0c9e0c5","messages_hash":"c765bfd546685684c2bfacdbbb248478a115f88dda12b4df64efb0b336362540","txlist_hash":"d59b48425061f0965947dd025cfa0fba8855e997f376572c585db72203b9a80a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(261,310078,'insert','blocks','{"block_hash":"f2fbd2074d804e631db44cb0fb2e1db3fdc367e439c21ffc40d73104c4d7069c","block_index":310079,"block_time":310079000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(262,310079,'parse','blocks','{"block_index":310079,"ledger_hash":"74eaddecbf5ab6608c1e95c1c313c13f2af2b649512cc8c7016717d21e93f815","messages_hash":"b38c60aa1982b330713c16d5572143e5970e4b0273ef5461473e237be5133a8b","txlist_hash":"d3f32df02f0e7cd7c2163b47b3ff73d175046599ed626ab343647e1a04525e3c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(263,310079,'insert','blocks','{"block_hash":"42943b914d9c367000a78b78a544cc4b84b1df838aadde33fe730964a89a3a6c","block_index":310080,"block_time":310080000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(264,310080,'parse','blocks','{"block_index":310080,"ledger_hash":"a759e3aac1b015e28b8b524106a74b943b215faac8d5079384ec7351b2239bde","messages_hash":"059af64961a1fef76aafd5d22aedd13466299a9727bd9b21072794674b02c140","txlist_hash":"f588a6cf255e710d9ee481d53f8bc0fc0e1567d58ee701f1b77f0848db881f5f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(265,310080,'insert','blocks','{"block_hash":"6554f9d307976249e7b7e260e08046b3b55d318f8b6af627fed5be3063f123c4","block_index":310081,"block_time":310081000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(266,310081,'parse','blocks','{"block_index":310081,"ledger_hash":"71622e25e8497db6fa222e33c60ea582698e72ca5789a52c9252bf51191cadaa","messages_hash":"f6134380063f36dde912c04787580d3c40a8c8393a595178165f0ff57b5ad90b","txlist_hash":"9a2e169d5fa3721f9bb8852c93ca8ed5dfbcccef05cba99ed3f1c61c937f4366"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(267,310081,'insert','blocks','{"block_hash":"4f1ef91b1dcd575f8ac2e66a67715500cbca154bd6f3b8148bb7015a6aa6c644","block_index":310082,"block_time":310082000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(268,310082,'parse','blocks','{"block_index":310082,"ledger_hash":"47e9d8fbcbafcee2b4c145ce651333ce49812533d13f7f9a0e9a448f51cfbacd","messages_hash":"21d4d5920b914ea36e3c7065dd7f0af4b294454030688c44e1a011835ef8a49b","txlist_hash":"c2cd395566e0a7b16c76cc0ead2c2cc87a684d5a499c76b2370afffe4b408ad1"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(269,310082,'insert','blocks','{"block_hash":"9b1f6fd6ff9b0dc4e37603cfb0625f49067c775b99e12492afd85392d3c8d850","block_index":310083,"block_time":310083000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(270,310083,'parse','blocks','{"block_index":310083,"ledger_hash":"e61148e7a8125f7225a6b6e1d77786f8b28b0b8a74e60fef3f75fa4de8f7d882","messages_hash":"b3e7328b23a6af5e3df01bb9bea68d2a8445820c50c2adf3b13bf79c3c4f9d54","txlist_hash":"21fb4596655071cca486c2e6988ec980799a9827e2e5f169033a45d21b3c7a75"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(271,310083,'insert','blocks','{"block_hash":"1e0972523e80306441b9f4157f171716199f1428db2e818a7f7817ccdc8859e3","block_index":310084,"block_time":310084000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(272,310084,'parse','blocks','{"block_index":310084,"ledger_hash":"20fb450589ddc6c904fbb61cca8588e85e865635c12402ce7ae72995ab884c14","messages_hash":"3101e4813e73498cef2ec786023347dc13fb29aaf1407bbfee16d04f86ff6ac1","txlist_hash":"feb3992f370b8465a732bc4d90691b99db691f44e1697ad2775a6df216d93b13"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(273,310084,'insert','blocks','{"block_hash":"c5b6e9581831e3bc5848cd7630c499bca26d9ece5156d36579bdb72d54817e34","block_index":310085,"block_time":310085000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(274,310085,'parse','blocks','{"block_index":310085,"ledger_hash":"9cea37d548308505f80dc438d5183bac6c6ca424ea4dd9c85d883b05d67cdc92","messages_hash":"a10a734ce80faabca0177b12746f0483692fd13256d7d75af28e615b2324e682","txlist_hash":"277205c28e54078d55ce1641fed64ff4b409b686fbe4aa3a018cead2f969c501"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(275,310085,'insert','blocks','{"block_hash":"080c1dc55a4ecf4824cf9840602498cfc35b5f84099f50b71b45cb63834c7a78","block_index":310086,"block_time":310086000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(276,310086,'parse','blocks','{"block_index":310086,"ledger_hash":"e11bab5fba2d038086c65030b90ce1cbc988314d0c9846aa7ddac4fd357bd01a","messages_hash":"54ccdfdb8690395f13bf11d70244d69052acdb3f9948e8238c0d4bede54c899b","txlist_hash":"ef3ac1de31e29795732b362218bd244945bea4183273512ff6974ecd0c0a7aef"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(277,310086,'insert','blocks','{"block_hash":"4ec8cb1c38b22904e8087a034a6406b896eff4dd28e7620601c6bddf82e2738c","block_index":310087,"block_time":310087000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(278,310087,'parse','blocks','{"block_index":310087,"ledger_hash":"777873e7ebd0ec3052be65197ec0db8bd72e46d2053badb0f37be1f6e84ae0b3","messages_hash":"96a8a5d4606f2e77f429e6ae8f54576e51e1159969612a14739e69e4121e0fb1","txlist_hash":"3bec931f7207a5b03e5a7d390787cd737e598d04025a1514c7654ef34fd1aedc"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(279,310087,'insert','blocks','{"block_hash":"e945c815c433cbddd0bf8e66c5c23b51072483492acda98f5c2c201020a8c5b3","block_index":310088,"block_time":310088000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(280,310088,'parse','blocks','{"block_index":310088,"ledger_hash":"85a5ea57af33dfddddbcbe1a1c87994efe5a21a645713aa164f19e19bfb23c64","messages_hash":"20fbc6981fcb9ff9aea35590a435ac2c7d1513bb4a038a8f62602632b6bee622","txlist_hash":"4030ee911aec8ebfbbeecede9cfb977088fb591b20cf52d5340e5aa13e41c7f7"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(281,310088,'insert','blocks','{"block_hash":"0382437f895ef3e7e38bf025fd4f606fd44d4bbd6aea71dbdc4ed11a7cd46f33","block_index":310089,"block_time":310089000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(282,310089,'parse','blocks','{"block_index":310089,"ledger_hash":"bdf3b6e7a14a3aa22d42a7d69f2f96b0993f1eef2952a7d74313c37e1b407523","messages_hash":"3e376fad3e36d13f5c50f8bac968fba251f8192e0661df0dec9266d0de986838","txlist_hash":"255675a022762a349d44af6315173e05c685f351f2b3b770e0ec80e128969a4b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(283,310089,'insert','blocks','{"block_hash":"b756db71dc037b5a4582de354a3347371267d31ebda453e152f0a13bb2fae969","block_index":310090,"block_time":310090000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(284,310090,'parse','blocks','{"block_index":310090,"ledger_hash":"9b3ee688c5786ecc438ec9c843ba5f898fe1ab1a8bc3903ad7789aaf6b0c0bf0","messages_hash":"c61c461272d69c03c027a144418a877a6122dba7ba9f2376000d53656037ce75","txlist_hash":"7d658801ab6fbe73231469da5204c5e1c73d290b83449187ec5eec71b846616d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(285,310090,'insert','blocks','{"block_hash":"734a9aa485f36399d5efb74f3b9c47f8b5f6fd68c9967f134b14cfe7e2d7583c","block_index":310091,"block_time":310091000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(286,310091,'parse','blocks','{"block_index":310091,"ledger_hash":"25578ac389a77dbf9589b23c5470f3199016ac66a415540ae03efac29dfe7adc","messages_hash":"48792e4348415165ef24cbfadfe83934dfd900c8f2a0bf47251604ad1f9819b5","txlist_hash":"1cb14bc9f998c85e670e2e291cde3a2debe9b4013840c0c060417f509c7210ea"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(287,310091,'insert','blocks','{"block_hash":"56386beb65f9228740d4ad43a1c575645f6daf59e0dd9f22551c59215b5e8c3d","block_index":310092,"block_time":310092000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(288,310092,'parse','blocks','{"block_index":310092,"ledger_hash":"bb9109ba299c99cb104ebf2ef6e75141c50264d701d27119525ab5d0a54c1a40","messages_hash":"44a37e3c8140c5d6cc507bae93571af20c9cf4b48e8404edfa4e55c8e5e82931","txlist_hash":"889afcda8b6e0848c7d43014beb0e181c78fa69d3aedec508f4bc0eb8a416029"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(289,310092,'insert','blocks','{"block_hash":"a74a2425f2f4be24bb5f715173e6756649e1cbf1b064aeb1ef60e0b94b418ddc","block_index":310093,"block_time":310093000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(290,310093,'parse','blocks','{"block_index":310093,"ledger_hash":"cdb21362b3eb4fc10ba3c6bf3aba41bfc5bd0bf2475f742c1069cb4383be7b95","messages_hash":"b0166f95f4cf48193827d3b5423889419477c07e9a041c41b72df8229e46adee","txlist_hash":"dec762d55ba88cb2c043f627b2a8b26c920cce9d4dc2746065c0bcf2795c2d99"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(291,310093,'insert','blocks','{"block_hash":"2a8f976f20c4e89ff01071915ac96ee35192d54df3a246bf61fd4a0cccfb5b23","block_index":310094,"block_time":310094000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(292,310094,'parse','blocks','{"block_index":310094,"ledger_hash":"b82568de09fe4ea06f3dca053dbcbcc61dbe5e44dd300a4301c995ba180f894d","messages_hash":"34ba529a171f062f8e18bd65ef967158d21a63f907c90ff79f00381c1d9836e9","txlist_hash":"625beebc3c34fa3276e022a37c79137c8f09af21454e8171cce7ab7a04453047"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(293,310094,'insert','blocks','{"block_hash":"bed0fa40c9981223fb40b3be8124ca619edc9dd34d0c907369477ea92e5d2cd2","block_index":310095,"block_time":310095000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(294,310095,'parse','blocks','{"block_index":310095,"ledger_hash":"513c4a041ee80ba72d1d8428605c682e3485fa45341460bc33fae6540dffb571","messages_hash":"108e625c8ae24f372335196ec1678080f2f5d211a7e47de3eb1da4817dfecd5e","txlist_hash":"b7794e7c8dfe3947ab8d256b94af8bc43acb9ca11f696a81cf9ad98062372959"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(295,310095,'insert','blocks','{"block_hash":"306aeec3db435fabffdf88c2f26ee83caa4c2426375a33daa2be041dbd27ea2f","block_index":310096,"block_time":310096000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(296,310096,'parse','blocks','{"block_index":310096,"ledger_hash":"3e8ff43c8d671159355b2d40a995fb8f6d84f6216fa8326fa80ae39aa9d15d03","messages_hash":"d68fba6521389577f6303af99b28050b6cbceb05908bd85de1dacd982537db4c","txlist_hash":"8117c5400c1cfdb97456cf3b79e8572aecf23c29d1c336d5543979d0e81cc158"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(297,310096,'insert','blocks','{"block_hash":"13e8e16e67c7cdcc80d477491e554b43744f90e8e1a9728439a11fab42cefadf","block_index":310097,"block_time":310097000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(298,310097,'parse','blocks','{"block_index":310097,"ledger_hash":"19d91de7be12136737d3f8990e7a4a793912c952e71e017d723d750118e849c6","messages_hash":"3f04ffa37371d7689609be3f5e65a6986553bf2e0c9db51e8ac815dbf61b01df","txlist_hash":"1e2f99bf2c03b8c915bd23c94431002d3801a13caf40d9b42f22001c2faf305a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(299,310097,'insert','blocks','{"block_hash":"ca5bca4b5ec4fa6183e05176abe921cff884c4e20910fab55b603cef48dc3bca","block_index":310098,"block_time":310098000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(300,310098,'parse','blocks','{"block_index":310098,"ledger_hash":"be75df2e5aff3faaebfc0ce4ab5134790fa728f84500e6989739dddc058738de","messages_hash":"cc3e49edd68887f1f34db7c81e3125f9f76ba0c45aae70a5a4e4f7f8a85baf4d","txlist_hash":"7f692426eab57621527d12cc4a49aa85841de9856cd46ad6992a658ed5c15fb1"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(301,310098,'insert','blocks','{"block_hash":"3c4c2279cd7de0add5ec469648a845875495a7d54ebfb5b012dcc5a197b7992a","block_index":310099,"block_time":310099000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(302,310099,'parse','blocks','{"block_index":310099,"ledger_hash":"9090b8a4a26ea7dff75658317ce2c6ab828b3b42684922e44debfd1bf8330b8d","messages_hash":"274d30a0808c4740b2fad528bf374e4b65e3bdfa17247e7e1c924bda16be9794","txlist_hash":"c3b0869da7bd7abbda54895e6de81cffd2febe007e1f7085da8cc657512278e6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(303,310099,'insert','blocks','{"block_hash":"96925c05b3c7c80c716f5bef68d161c71d044252c766ca0e3f17f255764242cb","block_index":310100,"block_time":310100000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(304,310100,'parse','blocks','{"block_index":310100,"ledger_hash":"d48d30db433bcee44d87153fb3db17d37fbe3534f23eb16ac853b3420d86d80e","messages_hash":"33ba6fe2f691128379ebff991b818614c4665fd09e4c54b61619d2d2ed54c0ce","txlist_hash":"793627f8b7de24827faca4a19ce374f39c90b74e278b83a599cb637877bd6388"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(305,310100,'insert','blocks','{"block_hash":"369472409995ca1a2ebecbad6bf9dab38c378ab1e67e1bdf13d4ce1346731cd6","block_index":310101,"block_time":310101000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(306,310101,'insert','transactions','{"block_hash":"369472409995ca1a2ebecbad6bf9dab38c378ab1e67e1bdf13d4ce1346731cd6","block_index":310101,"block_time":310101000,"btc_amount":5430,"data":"00000028000352bb33c8000000000000000a000000000000000a0000000000000000000013b0000003e8","destination":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","fee":7650,"source":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","supported":true,"tx_hash":"db4ea092bea6036e3d1e5f6ec863db9b900252b4f4d6d9faa6165323f433c51e","tx_index":102}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(307,310101,'insert','debits','{"action":"bet","address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"XCP","block_index":310101,"event":"db4ea092bea6036e3d1e5f6ec863db9b900252b4f4d6d9faa6165323f433c51e","quantity":10,"tx_index":102}',0,'DEBIT');
-INSERT INTO messages VALUES(308,310101,'insert','bets','{"bet_type":3,"block_index":310101,"counterwager_quantity":10,"counterwager_remaining":10,"deadline":1388000200,"expiration":1000,"expire_index":311101,"fee_fraction_int":5000000.0,"feed_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","leverage":5040,"source":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","status":"open","target_value":0.0,"tx_hash":"db4ea092bea6036e3d1e5f6ec863db9b900252b4f4d6d9faa6165323f433c51e","tx_index":102,"wager_quantity":10,"wager_remaining":10}',0,'OPEN_BET');
-INSERT INTO messages VALUES(309,310101,'parse','transactions','{"supported":true,"tx_hash":"db4ea092bea6036e3d1e5f6ec863db9b900252b4f4d6d9faa6165323f433c51e","tx_index":102}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(310,310101,'parse','blocks','{"block_index":310101,"ledger_hash":"53c6f9247cd255c86a69c05c4463ab94f9a3277496c155398c38dc6f7121fe9b","messages_hash":"f3689c9c1663d8e96f34d9e34442f1db962b00725c617592ebad5a5b1338cae4","txlist_hash":"7388dcdfb1f5a54a0d4a4d3e50d486b24a662cef04f054a582e2d5b0bcf3ca28"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(311,310101,'insert','blocks','{"block_hash":"11e25883fd0479b78ddb1953ef67e3c3d1ffc82bd1f9e918a75c2194f7137f99","block_index":310102,"block_time":310102000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(312,310102,'insert','transactions','{"block_hash":"11e25883fd0479b78ddb1953ef67e3c3d1ffc82bd1f9e918a75c2194f7137f99","block_index":310102,"block_time":310102000,"btc_amount":0,"data":"0000001e52bb33023ff0000000000000004c4b4009556e69742054657374","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"16462eac6c795cea6e5985ee063867d8c61ae24373df02048186d28118d25bae","tx_index":103}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(313,310102,'insert','broadcasts','{"block_index":310102,"fee_fraction_int":5000000,"locked":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","text":"Unit Test","timestamp":1388000002,"tx_hash":"16462eac6c795cea6e5985ee063867d8c61ae24373df02048186d28118d25bae","tx_index":103,"value":1.0}',0,'BROADCAST');
-INSERT INTO messages VALUES(314,310102,'insert','credits','{"address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"XCP","block_index":310102,"calling_function":"bet settled","event":"16462eac6c795cea6e5985ee063867d8c61ae24373df02048186d28118d25bae","quantity":9,"tx_index":103}',0,'CREDIT');
-INSERT INTO messages VALUES(315,310102,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310102,"calling_function":"bet settled","event":"16462eac6c795cea6e5985ee063867d8c61ae24373df02048186d28118d25bae","quantity":9,"tx_index":103}',0,'CREDIT');
-INSERT INTO messages VALUES(316,310102,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310102,"calling_function":"feed fee","event":"16462eac6c795cea6e5985ee063867d8c61ae24373df02048186d28118d25bae","quantity":0,"tx_index":103}',0,'CREDIT');
-INSERT INTO messages VALUES(317,310102,'insert','bet_match_resolutions','{"bear_credit":9,"bet_match_id":"2a2169991597036b6dad687ea1feffd55465a204466f40c35cbba811cb3109b1_5c6562ddad0bc8a1faaded18813a65522cd273709acd190cf9d3271817eefc93","bet_match_type_id":1,"block_index":310102,"bull_credit":9,"escrow_less_fee":null,"fee":0,"settled":true,"winner":null}',0,'BET_MATCH_RESOLUTON');
-INSERT INTO messages VALUES(318,310102,'update','bet_matches','{"id":"2a2169991597036b6dad687ea1feffd55465a204466f40c35cbba811cb3109b1_5c6562ddad0bc8a1faaded18813a65522cd273709acd190cf9d3271817eefc93","status":"settled"}',0,'BET_MATCH_UPDATE');
-INSERT INTO messages VALUES(319,310102,'parse','transactions','{"supported":true,"tx_hash":"16462eac6c795cea6e5985ee063867d8c61ae24373df02048186d28118d25bae","tx_index":103}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(320,310102,'parse','blocks','{"block_index":310102,"ledger_hash":"b225c48fb4c40b2e0695991251f6d69217df6e00c01613e0a20f6a3e34f50d5b","messages_hash":"c3f16c9c50b71969ea4e21819eaf214b1e40316e91af4a3f3964a91b35808e6b","txlist_hash":"7d553f87ef9f2beea74631e2e6ec107522b9f4756f041e2ee40fa3946909b3dd"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(321,310102,'insert','blocks','{"block_hash":"559a208afea6dd27b8bfeb031f1bd8f57182dcab6cf55c4089a6c49fb4744f17","block_index":310103,"block_time":310103000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(322,310103,'insert','transactions','{"block_hash":"559a208afea6dd27b8bfeb031f1bd8f57182dcab6cf55c4089a6c49fb4744f17","block_index":310103,"block_time":310103000,"btc_amount":62000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":-99994375,"source":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","supported":true,"tx_hash":"65d4048700fb8ae03f321be93c6669b8497f506a1f43920f96d994f43358c35b","tx_index":104}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(323,310103,'insert','credits','{"address":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","asset":"XCP","block_index":310103,"calling_function":"burn","event":"65d4048700fb8ae03f321be93c6669b8497f506a1f43920f96d994f43358c35b","quantity":92999138821,"tx_index":104}',0,'CREDIT');
-INSERT INTO messages VALUES(324,310103,'insert','burns','{"block_index":310103,"burned":62000000,"earned":92999138821,"source":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","status":"valid","tx_hash":"65d4048700fb8ae03f321be93c6669b8497f506a1f43920f96d994f43358c35b","tx_index":104}',0,'BURN');
-INSERT INTO messages VALUES(325,310103,'parse','blocks','{"block_index":310103,"ledger_hash":"fc2a8ce8efc122e5cbd631998e611dc8707cfe0b8d3f6a531fe5bcc21c17feae","messages_hash":"d57ce83db250acc25efe3e0193a3ae93aa5e521eaf0063a745f538e82e0b6c3d","txlist_hash":"ece7991721b8e94950e2a9f41b9285b34be716340a7621b1c1528f8065e9ac28"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(326,310103,'insert','blocks','{"block_hash":"55b82e631b61d22a8524981ff3b5e3ab4ad7b732b7d1a06191064334b8f2dfd2","block_index":310104,"block_time":310104000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(327,310104,'insert','transactions','{"block_hash":"55b82e631b61d22a8524981ff3b5e3ab4ad7b732b7d1a06191064334b8f2dfd2","block_index":310104,"block_time":310104000,"btc_amount":62000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":-99994375,"source":"munimLLHjPhGeSU5rYB2HN79LJa8bRZr5b","supported":true,"tx_hash":"95332a7e3e2b04f2c10e3027327bfc31b686947fb05381e28903e3ff569bd4ff","tx_index":105}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(328,310104,'insert','credits','{"address":"munimLLHjPhGeSU5rYB2HN79LJa8bRZr5b","asset":"XCP","block_index":310104,"calling_function":"burn","event":"95332a7e3e2b04f2c10e3027327bfc31b686947fb05381e28903e3ff569bd4ff","quantity":92999130460,"tx_index":105}',0,'CREDIT');
-INSERT INTO messages VALUES(329,310104,'insert','burns','{"block_index":310104,"burned":62000000,"earned":92999130460,"source":"munimLLHjPhGeSU5rYB2HN79LJa8bRZr5b","status":"valid","tx_hash":"95332a7e3e2b04f2c10e3027327bfc31b686947fb05381e28903e3ff569bd4ff","tx_index":105}',0,'BURN');
-INSERT INTO messages VALUES(330,310104,'parse','blocks','{"block_index":310104,"ledger_hash":"b1a7115902d371d13889008320e52473cd5b34591bd657e372c0048df020012e","messages_hash":"b04d2d8cf335c953fa24a5e17662783dcc80794e937589a0dded13744a9c69ba","txlist_hash":"66dacde33bddb633552c94d9107669297fe26ccdcf482f9098f1e6c05f3d01e6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(331,310104,'insert','blocks','{"block_hash":"1d72cdf6c4a02a5f973e6eaa53c28e9e13014b4f5bb13f91621a911b27fe936a","block_index":310105,"block_time":310105000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(332,310105,'insert','transactions','{"block_hash":"1d72cdf6c4a02a5f973e6eaa53c28e9e13014b4f5bb13f91621a911b27fe936a","block_index":310105,"block_time":310105000,"btc_amount":62000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":-99994375,"source":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","supported":true,"tx_hash":"e062d1ebf4cb71bd22d80c949b956f5286080838a7607ccf87945b2b3abfcafa","tx_index":106}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(333,310105,'insert','credits','{"address":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","asset":"XCP","block_index":310105,"calling_function":"burn","event":"e062d1ebf4cb71bd22d80c949b956f5286080838a7607ccf87945b2b3abfcafa","quantity":92999122099,"tx_index":106}',0,'CREDIT');
-INSERT INTO messages VALUES(334,310105,'insert','burns','{"block_index":310105,"burned":62000000,"earned":92999122099,"source":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","status":"valid","tx_hash":"e062d1ebf4cb71bd22d80c949b956f5286080838a7607ccf87945b2b3abfcafa","tx_index":106}',0,'BURN');
-INSERT INTO messages VALUES(335,310105,'parse','blocks','{"block_index":310105,"ledger_hash":"b5fcda12415e713fc81278b95515fe86ecc6beb5810e4f80eb9645f09870dab0","messages_hash":"2e336a7a4575cfab7289b78ebf57f67f09e3efa3a4bdeb2c9b9397deb3701c77","txlist_hash":"656d27bdbf841c33dd3c11253159dc5d8a6d7885db3174f4f9c6a8382d6a7209"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(336,310105,'insert','blocks','{"block_hash":"9d39cbe8c8a5357fc56e5c2f95bf132382ddad14cbc8abd54e549d58248140ff","block_index":310106,"block_time":310106000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(337,310106,'insert','transactions','{"block_hash":"9d39cbe8c8a5357fc56e5c2f95bf132382ddad14cbc8abd54e549d58248140ff","block_index":310106,"block_time":310106000,"btc_amount":10000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"mrPk7hTeZWjjSCrMTC2ET4SAUThQt7C4uK","supported":true,"tx_hash":"bbf0b9f6992755a3e371fb0c0b72f6828831e81c6f7ada6f95ba1104fb901ac3","tx_index":107}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(338,310106,'insert','credits','{"address":"mrPk7hTeZWjjSCrMTC2ET4SAUThQt7C4uK","asset":"XCP","block_index":310106,"calling_function":"burn","event":"bbf0b9f6992755a3e371fb0c0b72f6828831e81c6f7ada6f95ba1104fb901ac3","quantity":14999857,"tx_index":107}',0,'CREDIT');
-INSERT INTO messages VALUES(339,310106,'insert','burns','{"block_index":310106,"burned":10000,"earned":14999857,"source":"mrPk7hTeZWjjSCrMTC2ET4SAUThQt7C4uK","status":"valid","tx_hash":"bbf0b9f6992755a3e371fb0c0b72f6828831e81c6f7ada6f95ba1104fb901ac3","tx_index":107}',0,'BURN');
-INSERT INTO messages VALUES(340,310106,'parse','blocks','{"block_index":310106,"ledger_hash":"f3c98c954cf939951d8b24a257bc6b1bc152a6a0bcf6b580ac281c26bbf16499","messages_hash":"79e48332abdd115517204c76fc873417fc8a3da56e255bade91e6f8842c4f192","txlist_hash":"6138a4e92289d72dab6e43906e545dcc3d1475102b7f33195118de74a53fe576"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(341,310106,'insert','blocks','{"block_hash":"51cc04005e49fa49e661946a0e147240b0e5aac174252c96481ab7ddd5487435","block_index":310107,"block_time":310107000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(342,310107,'insert','transactions','{"block_hash":"51cc04005e49fa49e661946a0e147240b0e5aac174252c96481ab7ddd5487435","block_index":310107,"block_time":310107000,"btc_amount":0,"data":"0000000c000000000000000100000000000000640000000000000064000000000000006400","destination":"","fee":6150,"source":"munimLLHjPhGeSU5rYB2HN79LJa8bRZr5b","supported":true,"tx_hash":"9834219d2825b4d85ca7ee0d75a5372d9d42ce75eb9144951fca1af5a25915ec","tx_index":108}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(343,310107,'insert','debits','{"action":"open dispenser","address":"munimLLHjPhGeSU5rYB2HN79LJa8bRZr5b","asset":"XCP","block_index":310107,"event":"9834219d2825b4d85ca7ee0d75a5372d9d42ce75eb9144951fca1af5a25915ec","quantity":100,"tx_index":108}',0,'DEBIT');
-INSERT INTO messages VALUES(344,310107,'insert','dispensers','{"asset":"XCP","block_index":310107,"dispense_count":0,"escrow_quantity":100,"give_quantity":100,"give_remaining":100,"oracle_address":null,"origin":"munimLLHjPhGeSU5rYB2HN79LJa8bRZr5b","satoshirate":100,"source":"munimLLHjPhGeSU5rYB2HN79LJa8bRZr5b","status":0,"tx_hash":"9834219d2825b4d85ca7ee0d75a5372d9d42ce75eb9144951fca1af5a25915ec","tx_index":108}',0,'OPEN_DISPENSER');
-INSERT INTO messages VALUES(345,310107,'parse','transactions','{"supported":true,"tx_hash":"9834219d2825b4d85ca7ee0d75a5372d9d42ce75eb9144951fca1af5a25915ec","tx_index":108}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(346,310107,'parse','blocks','{"block_index":310107,"ledger_hash":"a550df26b8dee075bee82fc59c44ce5cbf65fe9df10c60f3f3009faa2791c783","messages_hash":"110dd70ced22e1a1c91201c1c1ce0afc628885b2f2b3c785624b851983a71dc6","txlist_hash":"b30d22c6d7e8bf574e3b3e11d08bcb73c5853ba348e8688a25670a861d3f4e3a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(347,310107,'insert','blocks','{"block_hash":"8f2d3861aa42f8e75dc14a23d6046bd89feef0d81996b6e1adc2a2828fbc8b34","block_index":310108,"block_time":310108000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(348,310108,'insert','transactions','{"block_hash":"8f2d3861aa42f8e75dc14a23d6046bd89feef0d81996b6e1adc2a2828fbc8b34","block_index":310108,"block_time":310108000,"btc_amount":31000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","supported":true,"tx_hash":"93c6d2499a0536c31c77a3db3fc9fc8456fbd0726c45b8f716af16f938727a73","tx_index":109}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(349,310108,'insert','credits','{"address":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","asset":"XCP","block_index":310108,"calling_function":"burn","event":"93c6d2499a0536c31c77a3db3fc9fc8456fbd0726c45b8f716af16f938727a73","quantity":46499548508,"tx_index":109}',0,'CREDIT');
-INSERT INTO messages VALUES(350,310108,'insert','burns','{"block_index":310108,"burned":31000000,"earned":46499548508,"source":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","status":"valid","tx_hash":"93c6d2499a0536c31c77a3db3fc9fc8456fbd0726c45b8f716af16f938727a73","tx_index":109}',0,'BURN');
-INSERT INTO messages VALUES(351,310108,'parse','blocks','{"block_index":310108,"ledger_hash":"e1d8c345c74760010223a823895471d3ad6a2db5c6a70b13850d5cd977414518","messages_hash":"fdaa97987f607fff62cd0459e4d261ba764a7ed75ea6ab1afb3ece06277216dd","txlist_hash":"d03bdcdbb4980ea415ab73c8e91a7fca7099c8c176d6bb4c2fdf72b6873175ae"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(352,310108,'insert','blocks','{"block_hash":"d23aaaae55e6a912eaaa8d20fe2a9ad4819fe9dc1ed58977265af58fad89d8f9","block_index":310109,"block_time":310109000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(353,310109,'insert','transactions','{"block_hash":"d23aaaae55e6a912eaaa8d20fe2a9ad4819fe9dc1ed58977265af58fad89d8f9","block_index":310109,"block_time":310109000,"btc_amount":0,"data":"0000001400078a8fe2e5e44100000000000003e8000000000000000000001050534820697373756564206173736574","destination":"","fee":6800,"source":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","supported":true,"tx_hash":"e8baf787b9e4636a3cad0ffeb62992ad7abb160dc6506af0546f566dc178de7e","tx_index":110}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(354,310109,'insert','debits','{"action":"issuance fee","address":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","asset":"XCP","block_index":310109,"event":"e8baf787b9e4636a3cad0ffeb62992ad7abb160dc6506af0546f566dc178de7e","quantity":50000000,"tx_index":110}',0,'DEBIT');
-INSERT INTO messages VALUES(355,310109,'insert','assets','{"asset_id":"2122675428648001","asset_longname":null,"asset_name":"PAYTOSCRIPT","block_index":310109}',0,'ASSET_CREATION');
-INSERT INTO messages VALUES(356,310109,'insert','issuances','{"asset":"PAYTOSCRIPT","asset_longname":null,"block_index":310109,"call_date":0,"call_price":0.0,"callable":false,"description":"PSH issued asset","divisible":false,"fee_paid":50000000,"issuer":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","locked":false,"quantity":1000,"reset":false,"source":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","status":"valid","transfer":false,"tx_hash":"e8baf787b9e4636a3cad0ffeb62992ad7abb160dc6506af0546f566dc178de7e","tx_index":110}',0,'ASSET_ISSUANCE');
-INSERT INTO messages VALUES(357,310109,'insert','credits','{"address":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","asset":"PAYTOSCRIPT","block_index":310109,"calling_function":"issuance","event":"e8baf787b9e4636a3cad0ffeb62992ad7abb160dc6506af0546f566dc178de7e","quantity":1000,"tx_index":110}',0,'CREDIT');
-INSERT INTO messages VALUES(358,310109,'parse','transactions','{"supported":true,"tx_hash":"e8baf787b9e4636a3cad0ffeb62992ad7abb160dc6506af0546f566dc178de7e","tx_index":110}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(359,310109,'parse','blocks','{"block_index":310109,"ledger_hash":"8fb63d8460a222163d15eab76a61e383ffa251a175c16f209648d6782c304059","messages_hash":"bf0b49028ffbb1d91272975e819dd6ecba7847dafe7def099bb7119e99ee357b","txlist_hash":"cff81539539169771000a550581dbdf4d4d1fdabecfb9032342269ff5f100b61"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(360,310109,'insert','blocks','{"block_hash":"cecc8e4791bd3081995bd9fd67acb6b97415facfd2b68f926a70b22d9a258382","block_index":310110,"block_time":310110000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(361,310110,'insert','transactions','{"block_hash":"cecc8e4791bd3081995bd9fd67acb6b97415facfd2b68f926a70b22d9a258382","block_index":310110,"block_time":310110000,"btc_amount":5430,"data":"00000000000000a25be34b660000000005f5e100","destination":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"f6a0f819e899b407cbfa07b4eff3d58902af3899abfbaa47d5f31d5b398e76e7","tx_index":111}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(362,310110,'insert','debits','{"action":"send","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"DIVISIBLE","block_index":310110,"event":"f6a0f819e899b407cbfa07b4eff3d58902af3899abfbaa47d5f31d5b398e76e7","quantity":100000000,"tx_index":111}',0,'DEBIT');
-INSERT INTO messages VALUES(363,310110,'insert','credits','{"address":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","asset":"DIVISIBLE","block_index":310110,"calling_function":"send","event":"f6a0f819e899b407cbfa07b4eff3d58902af3899abfbaa47d5f31d5b398e76e7","quantity":100000000,"tx_index":111}',0,'CREDIT');
-INSERT INTO messages VALUES(364,310110,'insert','sends','{"asset":"DIVISIBLE","block_index":310110,"destination":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","quantity":100000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"f6a0f819e899b407cbfa07b4eff3d58902af3899abfbaa47d5f31d5b398e76e7","tx_index":111}',0,'SEND');
-INSERT INTO messages VALUES(365,310110,'parse','transactions','{"supported":true,"tx_hash":"f6a0f819e899b407cbfa07b4eff3d58902af3899abfbaa47d5f31d5b398e76e7","tx_index":111}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(366,310110,'parse','blocks','{"block_index":310110,"ledger_hash":"250f7b5c6f00bf06c9cd4de8dea0b8166e2decf093910ea32eabd615b910e7e6","messages_hash":"9bb53822ba08d1625a3eacd2e25ddb87d578d63c081b96395b39a13322c581b4","txlist_hash":"d6853c803a38efdd5190401e94244333cb4f46752a2868d4a03e6d7d6c8c2bad"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(367,310110,'insert','blocks','{"block_hash":"fde71b9756d5ba0b6d8b230ee885af01f9c4461a55dbde8678279166a21b20ae","block_index":310111,"block_time":310111000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(368,310111,'insert','transactions','{"block_hash":"fde71b9756d5ba0b6d8b230ee885af01f9c4461a55dbde8678279166a21b20ae","block_index":310111,"block_time":310111000,"btc_amount":0,"data":"0000001e52bb33023ff0000000000000004c4b4009556e69742054657374","destination":"","fee":5975,"source":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","supported":true,"tx_hash":"510f6feb902159622d83f64eae590a4fec88989869a20caf5804c313aa5e0186","tx_index":112}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(369,310111,'insert','broadcasts','{"block_index":310111,"fee_fraction_int":5000000,"locked":false,"source":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","status":"valid","text":"Unit Test","timestamp":1388000002,"tx_hash":"510f6feb902159622d83f64eae590a4fec88989869a20caf5804c313aa5e0186","tx_index":112,"value":1.0}',0,'BROADCAST');
-INSERT INTO messages VALUES(370,310111,'parse','transactions','{"supported":true,"tx_hash":"510f6feb902159622d83f64eae590a4fec88989869a20caf5804c313aa5e0186","tx_index":112}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(371,310111,'parse','blocks','{"block_index":310111,"ledger_hash":"0c3c3d099bf08803f67c2a77d0d67779674d1063cc72d8794b8fe62a55049d75","messages_hash":"65d2ccd2975d2480ed63306ab9054ffdbb76fc442ed4c7dad2aac7428d2506e4","txlist_hash":"9cab90baa72446a36a7c176e82eed32ce968f96b0f29067b240a10a71ed95808"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(372,310111,'insert','blocks','{"block_hash":"5b06f69bfdde1083785cf68ebc2211b464839033c30a099d3227b490bf3ab251","block_index":310112,"block_time":310112000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(373,310112,'insert','transactions','{"block_hash":"5b06f69bfdde1083785cf68ebc2211b464839033c30a099d3227b490bf3ab251","block_index":310112,"block_time":310112000,"btc_amount":5430,"data":"00000028000352bb33c8000000000000000a000000000000000a0000000000000000000013b0000003e8","destination":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","fee":7124,"source":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","supported":true,"tx_hash":"d79b590e4ec3e74cbc3eb4d0f956ce7abb0e3af2ccac85ff90ed8acf13f2e048","tx_index":113}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(374,310112,'insert','debits','{"action":"bet","address":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","asset":"XCP","block_index":310112,"event":"d79b590e4ec3e74cbc3eb4d0f956ce7abb0e3af2ccac85ff90ed8acf13f2e048","quantity":10,"tx_index":113}',0,'DEBIT');
-INSERT INTO messages VALUES(375,310112,'insert','bets','{"bet_type":3,"block_index":310112,"counterwager_quantity":10,"counterwager_remaining":10,"deadline":1388000200,"expiration":1000,"expire_index":311112,"fee_fraction_int":5000000.0,"feed_address":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","leverage":5040,"source":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","status":"open","target_value":0.0,"tx_hash":"d79b590e4ec3e74cbc3eb4d0f956ce7abb0e3af2ccac85ff90ed8acf13f2e048","tx_index":113,"wager_quantity":10,"wager_remaining":10}',0,'OPEN_BET');
-INSERT INTO messages VALUES(376,310112,'parse','transactions','{"supported":true,"tx_hash":"d79b590e4ec3e74cbc3eb4d0f956ce7abb0e3af2ccac85ff90ed8acf13f2e048","tx_index":113}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(377,310112,'parse','blocks','{"block_index":310112,"ledger_hash":"557fdd1240793f8607a2b4c638ce800d5260c2adb294aac95d6c5eab7e98c3a9","messages_hash":"8600ea90c90218d55e9aec3aedcfb652432fc0f8c2bfde19ca62f768d1653101","txlist_hash":"4fc0df4832258d430e645f1950407e19e72ea27d28b8ae1851333e8e8718086b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(378,310112,'insert','blocks','{"block_hash":"63914cf376d3076b697b9234810dfc084ed5a885d5cd188dd5462560da25d5e7","block_index":310113,"block_time":310113000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(379,310113,'insert','transactions','{"block_hash":"63914cf376d3076b697b9234810dfc084ed5a885d5cd188dd5462560da25d5e7","block_index":310113,"block_time":310113000,"btc_amount":0,"data":"00000014000038fedf6d2c6900000000000003e8010000000000000000000c4c6f636b6564206173736574","destination":"","fee":6800,"source":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","supported":true,"tx_hash":"34bce6f409758b3d6fd13282a99b277ef1fdf44a1025d2901075cac0249dbc63","tx_index":114}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(380,310113,'insert','debits','{"action":"issuance fee","address":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","asset":"XCP","block_index":310113,"event":"34bce6f409758b3d6fd13282a99b277ef1fdf44a1025d2901075cac0249dbc63","quantity":50000000,"tx_index":114}',0,'DEBIT');
-INSERT INTO messages VALUES(381,310113,'insert','assets','{"asset_id":"62667321322601","asset_longname":null,"asset_name":"LOCKEDPREV","block_index":310113}',0,'ASSET_CREATION');
-INSERT INTO messages VALUES(382,310113,'insert','issuances','{"asset":"LOCKEDPREV","asset_longname":null,"block_index":310113,"call_date":0,"call_price":0.0,"callable":false,"description":"Locked asset","divisible":true,"fee_paid":50000000,"issuer":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","locked":false,"quantity":1000,"reset":false,"source":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","status":"valid","transfer":false,"tx_hash":"34bce6f409758b3d6fd13282a99b277ef1fdf44a1025d2901075cac0249dbc63","tx_index":114}',0,'ASSET_ISSUANCE');
-INSERT INTO messages VALUES(383,310113,'insert','credits','{"address":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","asset":"LOCKEDPREV","block_index":310113,"calling_function":"issuance","event":"34bce6f409758b3d6fd13282a99b277ef1fdf44a1025d2901075cac0249dbc63","quantity":1000,"tx_index":114}',0,'CREDIT');
-INSERT INTO messages VALUES(384,310113,'parse','transactions','{"supported":true,"tx_hash":"34bce6f409758b3d6fd13282a99b277ef1fdf44a1025d2901075cac0249dbc63","tx_index":114}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(385,310113,'parse','blocks','{"block_index":310113,"ledger_hash":"4ecad4a5c8e9b54101c4a037d6c86a7eb36d3cf0503e60a1bf13c5a4196c5989","messages_hash":"aaf7654cbbdd946eeec20b756019f62d012569d28e633380b50e501ea11d37d9","txlist_hash":"baf1f86b3145fd8dc33aa2fcb2e882cf69ffadee81e8412ed2092c634934709c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(386,310113,'insert','blocks','{"block_hash":"24fc2dded4f811eff58b32cda85d90fb5773e81b9267e9a03c359bc730d82283","block_index":310114,"block_time":310114000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(387,310114,'insert','transactions','{"block_hash":"24fc2dded4f811eff58b32cda85d90fb5773e81b9267e9a03c359bc730d82283","block_index":310114,"block_time":310114000,"btc_amount":0,"data":"00000014000038fedf6d2c69000000000000000001000000000000000000044c4f434b","destination":"","fee":6800,"source":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","supported":true,"tx_hash":"025b810fce7735c5869b90846007e5f604f60c1beda4c1695f1c7fbec3d44bc2","tx_index":115}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(388,310114,'insert','debits','{"action":"issuance fee","address":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","asset":"XCP","block_index":310114,"event":"025b810fce7735c5869b90846007e5f604f60c1beda4c1695f1c7fbec3d44bc2","quantity":0,"tx_index":115}',0,'DEBIT');
-INSERT INTO messages VALUES(389,310114,'insert','issuances','{"asset":"LOCKEDPREV","asset_longname":null,"block_index":310114,"call_date":0,"call_price":0.0,"callable":false,"description":"Locked asset","divisible":true,"fee_paid":0,"issuer":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","locked":true,"quantity":0,"reset":false,"source":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","status":"valid","transfer":false,"tx_hash":"025b810fce7735c5869b90846007e5f604f60c1beda4c1695f1c7fbec3d44bc2","tx_index":115}',0,'ASSET_ISSUANCE');
-INSERT INTO messages VALUES(390,310114,'parse','transactions','{"supported":true,"tx_hash":"025b810fce7735c5869b90846007e5f604f60c1beda4c1695f1c7fbec3d44bc2","tx_index":115}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(391,310114,'parse','blocks','{"block_index":310114,"ledger_hash":"00380ec3118a5e8f9cab403d10870dd5bc339421297fcb6196a3112d70541ecd","messages_hash":"1dce35ef471c90ab925590429d3bc5d7c2987aedf5acc0ea1b3be46e88f0158e","txlist_hash":"22e3851c91f780c0152549b24228d0dab3542c2632b633995c0d8dcfd8e26601"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(392,310114,'insert','blocks','{"block_hash":"a632d67ff5f832fe9c3c675f855f08a4969c6d78c0211e71b2a24fe04be5656a","block_index":310115,"block_time":310115000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(393,310115,'insert','transactions','{"block_hash":"a632d67ff5f832fe9c3c675f855f08a4969c6d78c0211e71b2a24fe04be5656a","block_index":310115,"block_time":310115000,"btc_amount":0,"data":"00000014000038fedf6d2c69000000000000000001000000000000000000076368616e676564","destination":"","fee":6800,"source":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","supported":true,"tx_hash":"4ab1a24283c1dbfc710be7b215d64e8a4510ee97af019e210049c25773b50beb","tx_index":116}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(394,310115,'insert','debits','{"action":"issuance fee","address":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","asset":"XCP","block_index":310115,"event":"4ab1a24283c1dbfc710be7b215d64e8a4510ee97af019e210049c25773b50beb","quantity":0,"tx_index":116}',0,'DEBIT');
-INSERT INTO messages VALUES(395,310115,'insert','issuances','{"asset":"LOCKEDPREV","asset_longname":null,"block_index":310115,"call_date":0,"call_price":0.0,"callable":false,"description":"changed","divisible":true,"fee_paid":0,"issuer":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","locked":false,"quantity":0,"reset":false,"source":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","status":"valid","transfer":false,"tx_hash":"4ab1a24283c1dbfc710be7b215d64e8a4510ee97af019e210049c25773b50beb","tx_index":116}',0,'ASSET_ISSUANCE');
-INSERT INTO messages VALUES(396,310115,'parse','transactions','{"supported":true,"tx_hash":"4ab1a24283c1dbfc710be7b215d64e8a4510ee97af019e210049c25773b50beb","tx_index":116}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(397,310115,'parse','blocks','{"block_index":310115,"ledger_hash":"0acd3a07c5df54e883ff9871852c961b00771d3f4afccb3b1941d0b1c7b300cc","messages_hash":"2d466dd469c4531675c2190d0e4d9fb2daad5b33426b3d22058ed9770cdae63f","txlist_hash":"cf921f50b98df4ec37f2a9803315a798198507adcbfd8fd54e6a9bc539cc8f41"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(398,310115,'insert','blocks','{"block_hash":"8495ba36b331473c4f3529681a118a4cc4fa4d51cd9b8dccb1f13e5ef841dd84","block_index":310116,"block_time":310116000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(399,310116,'insert','transactions','{"block_hash":"8495ba36b331473c4f3529681a118a4cc4fa4d51cd9b8dccb1f13e5ef841dd84","block_index":310116,"block_time":310116000,"btc_amount":62000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"tb1qw508d6qejxtdg4y5r3zarvary0c5xw7kxpjzsx","supported":true,"tx_hash":"27929c4fcad307a76ea7da34dd2691084f678a22ee43ce7f3842b78730ee08f9","tx_index":117}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(400,310116,'insert','credits','{"address":"tb1qw508d6qejxtdg4y5r3zarvary0c5xw7kxpjzsx","asset":"XCP","block_index":310116,"calling_function":"burn","event":"27929c4fcad307a76ea7da34dd2691084f678a22ee43ce7f3842b78730ee08f9","quantity":92999030129,"tx_index":117}',0,'CREDIT');
-INSERT INTO messages VALUES(401,310116,'insert','burns','{"block_index":310116,"burned":62000000,"earned":92999030129,"source":"tb1qw508d6qejxtdg4y5r3zarvary0c5xw7kxpjzsx","status":"valid","tx_hash":"27929c4fcad307a76ea7da34dd2691084f678a22ee43ce7f3842b78730ee08f9","tx_index":117}',0,'BURN');
-INSERT INTO messages VALUES(402,310116,'parse','blocks','{"block_index":310116,"ledger_hash":"6c6845d3be70cbe9a71c33227983f695c96877aac6d3a8d6a6839760b4691d25","messages_hash":"c94709a97d76eda00339d8b9313c132c7124fedcbb4f13f7fc65521eec5fd63e","txlist_hash":"a7e01a910cc919588be3b0c19c4bb7c36499b0a9b0347834d40fbb54fdf05fb6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(403,310116,'insert','blocks','{"block_hash":"978a3eac44917b82d009332797e2b6fe64c7ce313c0f15bfd9b7bb68e4f35a71","block_index":310117,"block_time":310117000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(404,310117,'parse','blocks','{"block_index":310117,"ledger_hash":"0465a90ff545d58e69c07c204160360bcc6fba5cc60fb81d7e6e389d9ff8133e","messages_hash":"d882f745bd8f7edc17b13d0807c8d3cfccfbd9dd6678913bd354e2fe5334507f","txlist_hash":"1100b7084683079d36f9ec6e4cb1ec457ae4c45941cdbaa0f4d53bc458e2fa9f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(405,310117,'insert','blocks','{"block_hash":"02487d8bd4dadabd06a44fdeb67616e6830c3556ec10faad40a42416039f4723","block_index":310118,"block_time":310118000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(406,310118,'parse','blocks','{"block_index":310118,"ledger_hash":"011ed3df8ae72a02b686e98aa8db07c973e1e12c2ac09891ba90d783ae63161f","messages_hash":"aefb56011c816cb6b5e7a388a109f991957fd957de7ecf9c4f0ea8f7758098db","txlist_hash":"7ed056a59c2b15a2d082f75c8728ee1e7f9b0eea6cb56b37f41319b115e39771"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(407,310118,'insert','blocks','{"block_hash":"6d6be3478c874c27f5d354c9375884089511b1aaaa3cc3421759d8e3aaeb5481","block_index":310119,"block_time":310119000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(408,310119,'parse','blocks','{"block_index":310119,"ledger_hash":"a6620b1b6a5b1f54fe6a8076fc35f0f3ce15315e9f549f5ff3fa0f5b6094919f","messages_hash":"0bb1e98956bc350cf8101125e6147253e60978ddeef6b931e13c772056153ce6","txlist_hash":"1312871691c685ced39676d4d4bd8825d2109587d1ec36f2dadc50f68b4d9cca"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(409,310119,'insert','blocks','{"block_hash":"2bba7fd459ea76fe54d6d7faf437c31af8253438d5685e803c71484c53887deb","block_index":310120,"block_time":310120000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(410,310120,'parse','blocks','{"block_index":310120,"ledger_hash":"e38e2aa0bf8831b90e69b40c78d4b7d41bc564527451b5f9b332bb0beb54c923","messages_hash":"7b105baade40f901ef31f2f73cd8503ee209f79db870e9bd51502f7260c074f8","txlist_hash":"1901f4d80a526969a544b68b1a695f07aa078ad719b8803c0b7543fcb4a974d6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(411,310120,'insert','blocks','{"block_hash":"9b3ea991d6c2fe58906bdc75ba6a2095dcb7f00cfdd6108ac75c938f93c94ee7","block_index":310121,"block_time":310121000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(412,310121,'parse','blocks','{"block_index":310121,"ledger_hash":"5b988c8ad133bb5ff5ac1ee4ad0a6a4fd431247db373e43c9be2a020520f438b","messages_hash":"124d2805fa3144fd091b2ef1c80ce44f9895f9ec4a44e8c7b48237f1282b1e35","txlist_hash":"9921b651b8ca004602b16f95d76b2ea76f03456d9a978abb02bb340f360df7a7"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(413,310121,'insert','blocks','{"block_hash":"d31b927c46e8f9ba2ccfb02f11a72179e08474bdd1b60dd3dcfd2e91a9ea2932","block_index":310122,"block_time":310122000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(414,310122,'parse','blocks','{"block_index":310122,"ledger_hash":"70ddab8f1d6283ce5a054650dbcd02d7ad4ca9c35de7bed920c2f266bc092070","messages_hash":"eeac27ff4665134ac9db123eed51a6ebeb9f66b830282684cf14b80fa9ad4018","txlist_hash":"a45cd1eea6626efa3af3dcd3c89782c50cc3b683c1b22249dc67d288e56aeb17"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(415,310122,'insert','blocks','{"block_hash":"be6d35019a923fcef1125a27387d27237755c136f4926c5eddbf150402ea2bbd","block_index":310123,"block_time":310123000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(416,310123,'parse','blocks','{"block_index":310123,"ledger_hash":"3670feebcf979edce175ad5b296a4c88fd7fc6bdc251dda84d487b1b092e41dd","messages_hash":"0d89c488b635238845ad30bdc78ec4191561296f57240b2728a3396900f69949","txlist_hash":"78c648296fcc7856757b990a92cf9512c61d180b08d451b63ed4e796d051d338"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(417,310123,'insert','blocks','{"block_hash":"0984b4a908f1a7dac9dcd94da1ee451e367cc6f3216ee8cdee15eae5d0700810","block_index":310124,"block_time":310124000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(418,310124,'parse','blocks','{"block_index":310124,"ledger_hash":"9883fff318e7cf9021fb4cc39261840f682e8adabb934549dbae2a10d2a71de3","messages_hash":"6df82c4ffb3e630f9abd9b4f4577221f22a669a0bd985620fec81c585f654797","txlist_hash":"c58aaf910fe01fd9ba6a892ea421c0933f4cebec80c6d2d556accc81102428d3"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(419,310124,'insert','blocks','{"block_hash":"cc28d39365904b2f91276d09fae040adb1bbbfd4d37d8c329fced276dc52c6a6","block_index":310125,"block_time":310125000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(420,310125,'parse','blocks','{"block_index":310125,"ledger_hash":"1840685242f9090297d4b432e305e4a093f90faa0b673953b648fbed948f31b6","messages_hash":"8cb8ff5c4c38c9c0fba5186c78e3c57041831ddc55b169a74995edce686de946","txlist_hash":"3d1e4c3a02456d7f79402a89f6a39dcb235fde15b275a762197b70e643d29e25"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(421,310125,'insert','blocks','{"block_hash":"c9d6c2bd3eeb87f3f1033a13de8255a56445341c920a6a0ee2fb030877106797","block_index":310126,"block_time":310126000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(422,310126,'parse','blocks','{"block_index":310126,"ledger_hash":"1a83f417c18439cd3c6269626c44b480317290f0c27a9b9f883a01653de69272","messages_hash":"9fd0630d7ebf232470cd1a8c7e051bbcdb752b88598aa90bec029fb7f118a128","txlist_hash":"7cde633cf5f7bc1176a3faa6ad03a449d3fb0d21dcce5885d2a37b81448a2ca5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(423,310126,'insert','blocks','{"block_hash":"c952f369e2b3317725b4b73ba1922b84af881bd59054be94406a5d9bbb106904","block_index":310127,"block_time":310127000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(424,310127,'parse','blocks','{"block_index":310127,"ledger_hash":"094c53dfd00b5004d074987dba90a6c9c47841d01041d0aeb61923c48315d1bb","messages_hash":"fc7ec51fc69f7284dbd6df219ff906253036d1696f5518d346fe5a1997bbd05c","txlist_hash":"0ac0ddcc5c45d4d709d9070814832bfa2339eaf5edbed98232cda4b1731e5478"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(425,310127,'insert','blocks','{"block_hash":"990b0d3575caf5909286b9701ece586338067fbd35357fec7d6a54c6a6120079","block_index":310128,"block_time":310128000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(426,310128,'parse','blocks','{"block_index":310128,"ledger_hash":"28ad1365daaadc866e79b6b1a555fa31bd804a85827d958cebb9d29511f78e19","messages_hash":"c726eba0cec90d465a44ede024b1f8dc58063711870de6e82d1424ffa23f4081","txlist_hash":"aa9a25819899fc8948c4906673cfc8128c0a98417db8fe659098d28ca12e3786"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(427,310128,'insert','blocks','{"block_hash":"fa8a7d674a9a3e4b40053cf3b819385a71831eec2f119a0f0640c6870ca1dddc","block_index":310129,"block_time":310129000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(428,310129,'parse','blocks','{"block_index":310129,"ledger_hash":"61587f9b5d05f8f553f0a4f580f38a140edcf7d9facb13c542865f5ec586a32c","messages_hash":"f0bfe24dec959d07b2b68a79c3c85caf68911d384ef64b4244b61fb86aa21eb3","txlist_hash":"ca3752868d963f0c165166928139cb078aefd0ebcbd9ab8f182c631ff941a56b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(429,310129,'insert','blocks','{"block_hash":"d3046e8e8ab77a67bf0629a3bab0bea4975631d52099d2ddc9c9fa0860522721","block_index":310130,"block_time":310130000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(430,310130,'parse','blocks','{"block_index":310130,"ledger_hash":"1ee8c39657890ac946e2aac5409147cdbf1b0004db1f00d997cf45452596f781","messages_hash":"c9d741a97b59ad670227903d4a4b5f63048712721e6ee4a59e6593e3a06a4514","txlist_hash":"bb38c9be1ef6ce22f1f14319cb3e1385d70fc63f7d0b2d80789c9af018baaa71"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(431,310130,'insert','blocks','{"block_hash":"d6b4357496bc2c42b58a7d1260a3615bfdb86e2ce68cd20914ef3dd3c0cdd34d","block_index":310131,"block_time":310131000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(432,310131,'parse','blocks','{"block_index":310131,"ledger_hash":"aee45272e68725a2746582f1847582eb9808289d3deca144f8c6cb43bc4f42e6","messages_hash":"eb64baddde8b82bc629227449b9f5ac4cc4adab4b387ad9a2812591de19d6703","txlist_hash":"69fba2b86abed1e740d45d33ec1bed7d2bf7de0f3bd9633959bfe77a21dd7aeb"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(433,310131,'insert','blocks','{"block_hash":"1b95a691bf4abf92f0dde901e1152cc5bd87a792d4b42613655e4046a57ab818","block_index":310132,"block_time":310132000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(434,310132,'parse','blocks','{"block_index":310132,"ledger_hash":"a3fe51c1d168ed726a78b72db61175f2abb07ea6c614b2886f3054cdd1a858fe","messages_hash":"ff03eb6a337397b372d03eed981a03eb5f3f9565f66bb943bc1e9fb931a3a298","txlist_hash":"352b00e4db389d411377c2302ecf272f97268e953c30d0976a5d12bffc5a17f7"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(435,310132,'insert','blocks','{"block_hash":"1029c14051faabf90641371a82f9e2352eaa3d6b1da66737fcf447568ca4ec51","block_index":310133,"block_time":310133000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(436,310133,'parse','blocks','{"block_index":310133,"ledger_hash":"626743e51b462163f23f22079d672379def21382fd88f9155ddd453ca3d633ef","messages_hash":"5fe7e9c01410af91855efed43e8f9a44d9eb0ef53d2fe80c1d88581285c86df0","txlist_hash":"1a7a1af397c6619b629eba7fdef0f0ea2d737e673d182fe985421dee61d0c63a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(437,310133,'insert','blocks','{"block_hash":"1748478069b32162affa59105257d81ef9d78aee27c626e7b24d11beb2831398","block_index":310134,"block_time":310134000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(438,310134,'parse','blocks','{"block_index":310134,"ledger_hash":"4b6e3202cae46fa80222e3ddec001213062ab76b8848eaaf4ab73f44bd84ac55","messages_hash":"33874759d6fdcf012b2fc2b57d21fa0226cb3e18d14194500f282f3b11280f76","txlist_hash":"855a47de54b979a3d958a921c2679825084193b9f1eb0fa56393e0186fb1b440"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(439,310134,'insert','blocks','{"block_hash":"d128d3469b1a5f8fb43e64b40f8a394945d1eb2f19ccbac2603f7044a4097e4f","block_index":310135,"block_time":310135000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(440,310135,'parse','blocks','{"block_index":310135,"ledger_hash":"e32784cedeadac39bb292da2c5eaffc983f416e0bf387978691e4c0fa5b1715a","messages_hash":"359ed3a20d949167d5d711db7a275c8e9a410f5edcc76a0bc1e277d1eb563216","txlist_hash":"80e68a8a303975543781e760be8d8b151206fb0335d3e0f5c2821d3e482b0ef0"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(441,310135,'insert','blocks','{"block_hash":"6ec490aaffe2c222a9d6876a18d1c3d385c742ff4c12d1334613a54042a543a5","block_index":310136,"block_time":310136000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(442,310136,'parse','blocks','{"block_index":310136,"ledger_hash":"93c67fdabd991708d1e35dabbdf7acb4e928763eeb817b32a79cd0bdb414fd2a","messages_hash":"d8091e8da964d953066d4973a4212788f9ca3b47788454f693a9a9557d8370f0","txlist_hash":"5fd1f9311646bed047ec4ac1d5aa5c74d68d26ddf6bdec14f2f53f4cb9c1f6b1"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(443,310136,'insert','blocks','{"block_hash":"7b44f07e233498303a57e5350f366b767809f1a3426d57b1b754dc16aba76900","block_index":310137,"block_time":310137000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(444,310137,'parse','blocks','{"block_index":310137,"ledger_hash":"8a43d01155ba47b8b1311c41d5a57112198857701c2970d0fd373da04ef4e585","messages_hash":"2cd10f30db70185a0aa3a4e3b085a99f9b68ddedea747d25a09fe43085873fd7","txlist_hash":"d1f1a4a5fb78621aa1be58d32795feef8ac82572c34a694bf6b0b8c3c73ba7d6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(445,310137,'insert','blocks','{"block_hash":"d2d658ccbf9baa89c32659e8b6c25b640af4b9b2f28f9d40baae840206402ab5","block_index":310138,"block_time":310138000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(446,310138,'parse','blocks','{"block_index":310138,"ledger_hash":"4acf0244f3188f60152acc8ca30dcaeadf12e6669b15377c81b7e6dc3c8892b6","messages_hash":"0eb29408989eb9c5a38a5a2ef7808a99f649cd05a3d641f6e2d652732884d6d7","txlist_hash":"645be1bed53d63c268cd21d99a914aa4268b5a357dafa57f706075a66e42f948"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(447,310138,'insert','blocks','{"block_hash":"b2c6fb61f2ae0b9d75d18fce4c52a53b1d24772b1ad66c51ca51090210527d46","block_index":310139,"block_time":310139000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(448,310139,'parse','blocks','{"block_index":310139,"ledger_hash":"2d77bdd47ed1b3be1c2edf41473bd5eb707d06dab33717b01c4a227f9855d73d","messages_hash":"86088a65b7c10dc88153276f05db07d1fb4f6d4ad707c5a4a9875e739782e2cc","txlist_hash":"c1e0ab9fe21f807be3431a5d28c048b7f5c49ee5cfba7b9a0a837d1fa5c90f4c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(449,310139,'insert','blocks','{"block_hash":"edddddea90e07a466298219fd7f5a88975f1213289f7c434ed47152af6b68ebb","block_index":310140,"block_time":310140000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(450,310140,'parse','blocks','{"block_index":310140,"ledger_hash":"277c0c6dd1c505dc6f9a222c737296396569d8e007c4b9a42582f108e90fa624","messages_hash":"5ff093890b48f2b0ad5d1b99f633fccab79c3014a7f47729399d07e595cdfd45","txlist_hash":"ab9a8224e0e3f8f728b56fd3ff40d960d9d336b2743932053b2419423223f2ac"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(451,310140,'insert','blocks','{"block_hash":"b5b71d2a271bd638561c56f4ffbe94d6086debaaa86bfeb02ef0d71339310709","block_index":310141,"block_time":310141000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(452,310141,'parse','blocks','{"block_index":310141,"ledger_hash":"f5d0edff3f22b2e025c884b7c738abe641bca9110a6b9a7b90de179fd6e5d2dc","messages_hash":"89b97705896f32061405c10278c072dc4fa495e92c935ba0c57c5d54cf4473bb","txlist_hash":"d272db9ecd97edb037736fe46ab9585397f38a6d1c1d9455e64b8439811ebe4f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(453,310141,'insert','blocks','{"block_hash":"a98ae174c41ab8fc575d9c8d53d8e02d8e446b8c6c0d98a20ff234eba082b143","block_index":310142,"block_time":310142000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(454,310142,'parse','blocks','{"block_index":310142,"ledger_hash":"a9f00ec826a30e66820ab2920cf9573244a24dacd63d48c080b9e80b1c5e05b7","messages_hash":"3e036c1c3d33d8075922c286510d7fe6bf687cd7b6b2ca54bc183e36856266c0","txlist_hash":"0c2ddacd61856ee0743eca9125326981ab9f5711982f53874a0f8153089a8d97"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(455,310142,'insert','blocks','{"block_hash":"8ba2f7feb302a5f9ec3e8c7fc718b02379df4698f6387d00858005b8f01e062f","block_index":310143,"block_time":310143000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(456,310143,'parse','blocks','{"block_index":310143,"ledger_hash":"b5765899f770fdb6cf1120535d85826c6b0ae44b16b8d5a619c5cd12c98783ea","messages_hash":"02e0bd55a0bda5403762446e66a13753ebaa5a514c1cd66c7f04ef46ef4df738","txlist_hash":"39ef998b6c6130f79df8dcb5abff84c18a485915f1088b36a10de30da8c6f9c6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(457,310143,'insert','blocks','{"block_hash":"879ffa05ae6b24b236591c1f1537909179ed1245a27c5fdadd2218ab2193cdb9","block_index":310144,"block_time":310144000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(458,310144,'parse','blocks','{"block_index":310144,"ledger_hash":"1a80f48136e5938b33f817a7cc1cb60aaf6d628b7811abd43e38cc807a18072a","messages_hash":"807eaade814d710f7f74b556d926b294fff13c105e326d6955b02a4bc5d6d29c","txlist_hash":"0b547c8db7446cd3f26dd0d8b88d533c1361fa5dfae6127b85e87095b42ab66b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(459,310144,'insert','blocks','{"block_hash":"175449ef0aa4580593ad4a7d0c5a9b117e1549ea772af00caa4ccdc9b1bf7a6e","block_index":310145,"block_time":310145000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(460,310145,'parse','blocks','{"block_index":310145,"ledger_hash":"fce2f084c1776fcb36b3ae3e0c952893934e24672ffa0d3dac72bb1278af8264","messages_hash":"170f6971eaafb88ec0895d5d9af3ed34bbb3eee703117b5b0e6cf8d8deafe0f1","txlist_hash":"bcef3d9f5eb82fb2198d268e442edfca029d5aa3ccff5e5306f0a1a8cf43b30c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(461,310145,'insert','blocks','{"block_hash":"e954ab6a110455d745503f7cc8df9d92c1a800fafdd151e7b1912830a9cb7184","block_index":310146,"block_time":310146000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(462,310146,'parse','blocks','{"block_index":310146,"ledger_hash":"9a98eb971580a0a69fceafc5fd41f398f1908b626c47df57965d1863e9a24b84","messages_hash":"e103e1f0ee51b5fa86d61f8b8ddd9b7918e0d047727daa43c66ad3d13d7b3c12","txlist_hash":"036b1784841e65e5905b012f2b74c70e1d9c33b769603c01387d13e693343411"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(463,310146,'insert','blocks','{"block_hash":"7650c95eba7bf1cad81575ed12f32a8cc36281a6f41bef13afe1dfc1b03a7e83","block_index":310147,"block_time":310147000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(464,310147,'parse','blocks','{"block_index":310147,"ledger_hash":"336a89d3d137810d3220d2de432f72e3b3ccd2ada2b746da3859c77dbb89d6a3","messages_hash":"c671dd04015cf20b8cc8fce97e40ed1f31df42f7e42a0989eee0a9b49044554c","txlist_hash":"184e1861a82afa97634e0ad72cff532220a37d75f8eb5e1265039188124f6ad6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(465,310147,'insert','blocks','{"block_hash":"77c29785877724be924f965215eb50ffe916e3b6b3a2beaea3e3ae4796545a7e","block_index":310148,"block_time":310148000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(466,310148,'parse','blocks','{"block_index":310148,"ledger_hash":"f904794337dd67d356981d2623b8c3d1d78ba584cd98a8c1db939951d3102612","messages_hash":"35a58ace6733dd96d89ffe8486a3d595754aae5271e3584aabedd6f8cb1076e2","txlist_hash":"c75b4218153bfdf3baf44f22f99523f7c54d957994ee838c05c08dd52d98c06f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(467,310148,'insert','blocks','{"block_hash":"526b3c4a74c2663fc04ed5234c86974bffddb7235c8736d76860778c30207b3c","block_index":310149,"block_time":310149000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(468,310149,'parse','blocks','{"block_index":310149,"ledger_hash":"c2972fbd048790f54d9ecef4e18aedec8ae7aa28227d1d43bd19cd71b4feff85","messages_hash":"ecb6a27a09df864cd864d610a210593ec26988d4132f30f63c8607b6323e4c22","txlist_hash":"8dac7e6494cc67fc5c186e74b08d9fc8bc92cf71af9b0e1d919c48e9fecf7660"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(469,310149,'insert','blocks','{"block_hash":"cdd141f7463967dbeb78bf69dc1cd8e12489f58c4ea0a5dc9c5c01ec4fcea333","block_index":310150,"block_time":310150000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(470,310150,'parse','blocks','{"block_index":310150,"ledger_hash":"88b999e4ae34386b826b0f3b315953b5eeda8d9ef496af051498bfce6d8737fc","messages_hash":"6c18380805d06f23f130503ad7148ef1a215c0b217199995496a7670aad67c52","txlist_hash":"db25206ba3a052c622c6a5063359308d04fc2a031d6509447d838cf96a0632d1"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(471,310150,'insert','blocks','{"block_hash":"a0f31cc6e12ec86e65e999e806ab3bfa18f4f1084e4aeb4fbd699b4fe284b330","block_index":310151,"block_time":310151000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(472,310151,'parse','blocks','{"block_index":310151,"ledger_hash":"b7c176a2eff86655f8b0b71cc8bd3bab3a92ba203d4ccd911d63f3d2ce7fdc25","messages_hash":"86d5f32768df40dbbc112f75dde5f7aef0aa1904a689cce3d24be58fc793bfb6","txlist_hash":"c6868100e51f390d57b2da8324915c9751aa3882b6e102055fcfe229d1abfc85"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(473,310151,'insert','blocks','{"block_hash":"89c8cc3a0938c63a35e89d039aa84318a0fc4e13afac6beb849ac37140132c67","block_index":310152,"block_time":310152000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(474,310152,'parse','blocks','{"block_index":310152,"ledger_hash":"3f9471c393bc2bf144b17a5febea88c42982ae746fd700a5903c0e6e541e2b09","messages_hash":"206690aa73f071c14545eea0cb0c8838abdfbc8ebd64c0fd097cc2e2a254d481","txlist_hash":"ff691488593add72ffd8fb9c8eab2b2c6f92dc2082615b3829f4b84fc8a81f88"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(475,310152,'insert','blocks','{"block_hash":"d1121dfa68f4a1de4f97c123d2d2a41a102971a44b34927a78cd539ad8dca482","block_index":310153,"block_time":310153000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(476,310153,'parse','blocks','{"block_index":310153,"ledger_hash":"c6bc81e7b7e6758bbbfe10fa0e688b09e679fb74a18134639e172c18c6e017a7","messages_hash":"ed1c7beb196128167ad8b9d03f1b9a1b7b5d70cd7add306919cd658bc32f0d87","txlist_hash":"6c303c21dd9de15f2a265d88e04a2c110f32718da29a06294ebafe9ed91d4441"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(477,310153,'insert','blocks','{"block_hash":"ba982ea2e99d3bc5f574897c85485f89430ae38cf4ab49b7716ed466afa506d6","block_index":310154,"block_time":310154000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(478,310154,'parse','blocks','{"block_index":310154,"ledger_hash":"b3e07f9de85ab67e88042b1bb52302c6eb16b7ff45d5be6a49700f115ed396d4","messages_hash":"977e7ff9f1e5f0c1f756e802013a6e72299de42a6e2bafad94b57bfdee7a6632","txlist_hash":"b21fe34642b2c9ff09e65be86103f1c3390a01eb51b4d8b98456558639ef6e1f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(479,310154,'insert','blocks','{"block_hash":"cefb3b87c7b75a0eb8f062a0cde8e1073774ae035d176e9769fc87071c12d137","block_index":310155,"block_time":310155000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(480,310155,'parse','blocks','{"block_index":310155,"ledger_hash":"27014841a468e23bcb70c718919745eadcded4310031a7be90a4732c96509404","messages_hash":"a171b8e9e9879ede2f4c1fd42173d0b0ae0a07fc4d1e7f2f58ba50855fd986f6","txlist_hash":"0e5f0bfae3a6ced9c6498cbe95b8bcb56c76530830baa61345b8072aa6e28ff3"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(481,310155,'insert','blocks','{"block_hash":"6e3811e65cb02434f9fde0445a7a2b03fe796041458737d0afcc52208f988a83","block_index":310156,"block_time":310156000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(482,310156,'parse','blocks','{"block_index":310156,"ledger_hash":"5597aaadb8cc75848219f9fde3f5d76bb5592689c72068db59922732e89eef9d","messages_hash":"e06a1bce3d693147d3df5c1a5ad3b7b421d526213ced3eec59be44220aa6c2c1","txlist_hash":"ff3319c50ddd9bbd558542bdde3d612a475b543d6a34ea76738d929b5e05a380"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(483,310156,'insert','blocks','{"block_hash":"51dd192502fe797c55287b04c403cc63c087020a01c974a565dd4038db82f94a","block_index":310157,"block_time":310157000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(484,310157,'parse','blocks','{"block_index":310157,"ledger_hash":"cc1ae27fef286424e40204f6b575e9e079e1f7a5ccf6cc356729a7c4a7f83eb8","messages_hash":"e9ab5031997634f6ad74021f5adf3d5a62388fd55401a584464d7bd1c7edd44c","txlist_hash":"9b4884eaca300843017c2732aa8d09815eee4701cff996cc8b6ca6d62af4055d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(485,310157,'insert','blocks','{"block_hash":"749395af0c3221b8652d31b4c4410c19b10404d941c7e78d765b865f853559d2","block_index":310158,"block_time":310158000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(486,310158,'parse','blocks','{"block_index":310158,"ledger_hash":"6d80d98e778b30c124b0255b3e72620f432245d0f841f6bd62a0fcff44843bf0","messages_hash":"be1d3efb0c59cb3610c20487d20907179398843322cf4a26681010bc89d3032a","txlist_hash":"03a33d54ece86ab81f4f6e1cb337b07b6fc105a580a4ff82496885c7671939a4"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(487,310158,'insert','blocks','{"block_hash":"fc0e9f7b6ae99080bc41625588cef73b59c8a9f7a21d7f9f1bf96192ba631c12","block_index":310159,"block_time":310159000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(488,310159,'parse','blocks','{"block_index":310159,"ledger_hash":"d8ab8bb14092afea6cc675d2f50891318e3169bf9dbe2d07e80c4db95f0f2033","messages_hash":"4c81d40dc2e7cbc7e47272cbc8fd00b3b88fc7743ae9127216c8fd3cf0a29440","txlist_hash":"c292a08eda8cb807f0c11947fc08c748353bf545596d8c6c03a4a734d25461a6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(489,310159,'insert','blocks','{"block_hash":"163a82beeba44b4cb83a31764047880455a94a03e859dc050da782ed89c5fa8b","block_index":310160,"block_time":310160000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(490,310160,'parse','blocks','{"block_index":310160,"ledger_hash":"2d76a042d062b73b7dd956d5cff0ee397f068c04eae6cf5b9522d3d55e88cee9","messages_hash":"4091dc7273cdb5d4bd19145a422394d0ce18572cbc6665e32274bff761d04c62","txlist_hash":"df1e1e18b65c4322284ab36204d9f4397c0dade89bf25486c8b84f6358e0f18e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(491,310160,'insert','blocks','{"block_hash":"609c983d412a23c693e666abdea3f672e256674bf9ee55df89b5d9777c9264d8","block_index":310161,"block_time":310161000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(492,310161,'parse','blocks','{"block_index":310161,"ledger_hash":"beb3496742415027bcc0d59f3385809523c8783cd91a5670f2fb6fec3230e980","messages_hash":"54055d0c951f4ca0806dec96cde66848cbb36f6bc836d96cd98db0ff9e4b38cb","txlist_hash":"e61374e297180716eee972376d16b85266342dfcee4f383ba9061360f7c0a425"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(493,310161,'insert','blocks','{"block_hash":"043e9645e019f0b6a019d54c5fef5eebee8ce2da1273a21283c517da126fc804","block_index":310162,"block_time":310162000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(494,310162,'parse','blocks','{"block_index":310162,"ledger_hash":"066a2b93df863300741145cd6a4f1a9ea616bc787861cb8ab809f59d47a6fa1f","messages_hash":"2acaead0979ed14161b7b6665b5431098d5544d1415a8539f20bc27e880790d3","txlist_hash":"bc115f6ddeebabd3e0ea592604ff679267b755376e509c4760cfa394e86498df"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(495,310162,'insert','blocks','{"block_hash":"959e0a858a81922d2edf84d1fbb49d7c7e897a8f49f70bd5b066744b77836353","block_index":310163,"block_time":310163000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(496,310163,'parse','blocks','{"block_index":310163,"ledger_hash":"460c271269ccdd8775925b511705207baed8fc212caa7e74fc08a80be600a38a","messages_hash":"4616d2ff3ac7feec157408f1a40dda3e96b3ecbd1fd7977a5d89c40936b1d188","txlist_hash":"d16b6243e4c0718a2adca941956564325985750a9a0833aaa35635335cb504ea"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(497,310163,'insert','blocks','{"block_hash":"781b7188be61c98d864d75954cf412b2a181364cc1046de45266ccc8cdb730e2","block_index":310164,"block_time":310164000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(498,310164,'parse','blocks','{"block_index":310164,"ledger_hash":"19a7948cd1bc4a89a427d48bb01330dadff848e2b32ec8b8abe342872850b268","messages_hash":"a86e2d86f493fa42f842b5ae85a42f41a97740d844cdcba66dbe64a7aa48872c","txlist_hash":"54068fbe0e385c8ae2df5cb2c601397e15c019c732e37ed484573f07106741e3"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(499,310164,'insert','blocks','{"block_hash":"a75081e4143fa95d4aa29618fea17fc3fabd85e84059cc45c96a73473fc32599","block_index":310165,"block_time":310165000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(500,310165,'parse','blocks','{"block_index":310165,"ledger_hash":"97f0a48a26daf011a8c7b22bb772228a0c8a920eccd011e713956100c9fbdf33","messages_hash":"85a9f6ce9e41a035f7077c6f53371fbaf823985fb3e4aa88c8ab3f917b06014e","txlist_hash":"0783c9e3d99f4f95b64b38b92c4e8b7d257f325d10cd83bc86d684378b9ebbd6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(501,310165,'insert','blocks','{"block_hash":"a440d426adaa83fa9bb7e3d4a04b4fa06e896fc2813f5966941f1ad1f28cfb41","block_index":310166,"block_time":310166000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(502,310166,'parse','blocks','{"block_index":310166,"ledger_hash":"edbd00e1229c673f4f15b3ac7bbe020f54b5f3a61b1d158658471076a55c77b0","messages_hash":"b45d7ccd18ec37708371b786d993d4f6cd880a42087093d0651432d357acee0c","txlist_hash":"683f4ab00ee1ff495bf452c511c1582100191ef7b575139b9d2f102c852018c8"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(503,310166,'insert','blocks','{"block_hash":"ab4293dbea81fedacca1a0d5230fe85a230afc9490d895aa6963acc216125f66","block_index":310167,"block_time":310167000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(504,310167,'parse','blocks','{"block_index":310167,"ledger_hash":"e118e0f3aad5be73080f4d1892517e8fd2c4575589ccdfadf980edebb9a66a14","messages_hash":"6cd15a6b0104e8343a928946b3bd0dc4ba7062b599e63576a456f9bcbdad2c64","txlist_hash":"d2be4356643047c7bd04eede767d4f6853885f408827f3bec8c54ceb2b7fd71b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(505,310167,'insert','blocks','{"block_hash":"a12b36a88c2b0ed41f1419a29cc118fae4ecd2f70003de77848bf4a9b2b72dc9","block_index":310168,"block_time":310168000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(506,310168,'parse','blocks','{"block_index":310168,"ledger_hash":"267f48eb4e3b0925f4f472d8ce6ec57ec5039911b13a14ff2884a41a9cafd7b1","messages_hash":"696d4a61ff5e1174d4f20bdb76941ea081a4d2f3189ea334c4e95224f8c8c8a6","txlist_hash":"ad748b661aad47fa8963b43999846ef9bd00ea2595747f835710360afed16797"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(507,310168,'insert','blocks','{"block_hash":"204809a85ead8ba63f981fc1db8ae95afe92015f003eaebbec166021867421f3","block_index":310169,"block_time":310169000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(508,310169,'parse','blocks','{"block_index":310169,"ledger_hash":"df394a6f3b2a9b9dded6019dce9f3d3214db1f30019faffbdc2ce614f629b25a","messages_hash":"cdfd35fa4c56e13b5d326dd331f4ebf61f85518bbbcbade10dc40b1af4a15431","txlist_hash":"3a92e2c7808a00a0ff2b2fb4695b225acf6262c57753023334bcf3de8e1c7ace"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(509,310169,'insert','blocks','{"block_hash":"b38b0345a20a367dfe854e455e5752f63ac2d9be8de33eab264a29e87f94d119","block_index":310170,"block_time":310170000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(510,310170,'parse','blocks','{"block_index":310170,"ledger_hash":"3081081c2ab6d8280ef721c5836d0fb7e89eb3d747a4e4522d2e22f5a6b153a2","messages_hash":"a771c459fa5e0cc21787d85a9b38e8ec396e77cc95362ddfa73ec9fb454495fc","txlist_hash":"f4ada9df3e82d94ba52292e829c4c814b3f0d04f0e3f8606a90fed651634fafd"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(511,310170,'insert','blocks','{"block_hash":"b8ba5ae8d97900ce37dd451e8c6d8b3a0e2664bb1c103bf697355bf3b1de2d2d","block_index":310171,"block_time":310171000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(512,310171,'parse','blocks','{"block_index":310171,"ledger_hash":"e6a4017e4f7d9da50bb3817990c3e115d5035443de8824dc01b5380a5b4c52a9","messages_hash":"c31dfeb0e49cd9b9f45143ca853172c4f8d3ee88427c3e98f7cc8dd874355392","txlist_hash":"e335e773387256c016b82649c44647ce0355aa108249413f02117fe14f39c56d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(513,310171,'insert','blocks','{"block_hash":"b17fda199c609ab4cc2d85194dd53fa51ba960212f3964a9d2fe2cfe0bb57055","block_index":310172,"block_time":310172000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(514,310172,'parse','blocks','{"block_index":310172,"ledger_hash":"89e90622bf8363bcee5cd7ab6d48b6d06ce4cbd067f9985e35e67fc683f4c103","messages_hash":"7d8b260c7351e40751ff111c6c06d7c8aa885428710b3d1e1f0994c35e2f9643","txlist_hash":"d03bfc2a16d240505e3413ce267b263a0ddde5b3f8a04acb6a67d33a89434996"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(515,310172,'insert','blocks','{"block_hash":"f2dcdc5ffc0aca2e71e6e0466391b388870229398a1f3c57dec646b806a65016","block_index":310173,"block_time":310173000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(516,310173,'parse','blocks','{"block_index":310173,"ledger_hash":"35ceee6a23757fa49e7f5c34ccf0fd034731e95d564257b443ebfdee7cd294d3","messages_hash":"af128c2ba7c50382bbe8e3b428f19fcd80958bc2e5d4c33be43712d47d435a70","txlist_hash":"73c9dd3d2f5390d0d4379cc8f5e195ba4a0b4d280d3fe663db3940d4a42108ef"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(517,310173,'insert','blocks','{"block_hash":"fa6f46af9e3664353a473f6fffce56fa295e07985018bface8141b4bf7924679","block_index":310174,"block_time":310174000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(518,310174,'parse','blocks','{"block_index":310174,"ledger_hash":"101dedf34bc0788c0589c8e2b1d7da4ec65f6eab2e3c5523c0903db685cab017","messages_hash":"c963441968e83c301e8f29f28765581cc5f14e6623c040c3350dc589eea57da6","txlist_hash":"71d9279604a4ac7dbd49f6672ec6cd19ba59b62302eb1b1bd78ecd3b6d4a5263"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(519,310174,'insert','blocks','{"block_hash":"f71e79fe5f03c3bc7f1360febc5d8f79fc2768ce0ff1872cf27a829b49017333","block_index":310175,"block_time":310175000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(520,310175,'parse','blocks','{"block_index":310175,"ledger_hash":"67de4a0a9e52d9ae06caf62b3412d0bf2c10a6b24716210b21212d75be75ad6c","messages_hash":"dfee8971396dc54217e263b98b1ee284fabc170a53cf0fa2d123a1f9cbd14d64","txlist_hash":"90b52df6f0427a7dc695fa0e17a7bf3e59d788cf4016bb65c451a151c38f121b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(521,310175,'insert','blocks','{"block_hash":"67cd1d81f2998f615602346065e37f9ceb8916abb74b5762ead317d5e26453c6","block_index":310176,"block_time":310176000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(522,310176,'parse','blocks','{"block_index":310176,"ledger_hash":"a90bd400e15727fada1a27be4a6e228bd91a15f0dbd0fb7de3b6779a8bf89e4c","messages_hash":"493da573a8f068a577690df0b951ad995a49bbbdca22029102fa286d1d633269","txlist_hash":"b870ef1dabda015a561f74122039890b1c9c98e2c4c547dea34ed296fc99e8e1"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(523,310176,'insert','blocks','{"block_hash":"6856b1971121b91c907aaf7aed286648a6074f0bd1f66bd55da2b03116192a52","block_index":310177,"block_time":310177000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(524,310177,'parse','blocks','{"block_index":310177,"ledger_hash":"bac315d07dee18e27336a46ff3ffeed58aaf8eb1eb702e98a93c06303c937716","messages_hash":"e54ad17218ff9f1d0ac02978bc5b0ec884a467ccd1417779043860b108dc7e74","txlist_hash":"80b0eed7b842a9779b358c5293771470290876f3acb617d85e1a97e786a73092"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(525,310177,'insert','blocks','{"block_hash":"8094fdc6e549c4fab18c62e4a9be5583990c4167721a7e72f46eaf1e4e04d816","block_index":310178,"block_time":310178000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(526,310178,'parse','blocks','{"block_index":310178,"ledger_hash":"186ea0ece84d21ee21889ff13c98959dfc1842063a970e0c095552f0ca86515e","messages_hash":"bb17de70c734bbc12be97953357cba4c749de77aed7ff5e0a5a7c95e02a48bec","txlist_hash":"79d67c9aecc8676b0743ebc9af6b78c6f40d264b54bcb510b0028715fc1ca4bd"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(527,310178,'insert','blocks','{"block_hash":"d1528027cd25a1530cdc32c4eaff3751a851c947ddc748d99a7d3026a5e581a7","block_index":310179,"block_time":310179000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(528,310179,'parse','blocks','{"block_index":310179,"ledger_hash":"0200402ef08256efa0adc85b2b4b15fb7448b5107b65fafbcc7985d809e84bc8","messages_hash":"2e03fe798f0a5c1f8dedb60d153f4fbb5c461b6df84a5427c4c5fc568c247632","txlist_hash":"3bbcd82428f094a7089c7c9a5c74be0e400e4a03181ea95faea8681323851d43"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(529,310179,'insert','blocks','{"block_hash":"f2f401a5e3141a8387aaf9799e8fef92eb0fc68370dae1e27622893406d685c1","block_index":310180,"block_time":310180000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(530,310180,'parse','blocks','{"block_index":310180,"ledger_hash":"13829eeaf9bdc54f87366e35616c5a57cd836c63db8a9ba7d117d02377ef43e1","messages_hash":"de94fa7ca96ff9c889cdfda64f41e136ecdec886443ac534d48cab345400fdf0","txlist_hash":"2398e91ec31dc2810a4648946a85f5af7df71cae0b678f99aaa17e97d215785b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(531,310180,'insert','blocks','{"block_hash":"bd59318cdba0e511487d1e4e093b146b0f362c875d35ab5251592b3d9fed7145","block_index":310181,"block_time":310181000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(532,310181,'parse','blocks','{"block_index":310181,"ledger_hash":"81b4d83a623a55019ad720c1bd3ecef100d8ca49deda91b8ba6ffe9802764df7","messages_hash":"f62a4c12fb1ef9e3f82035ca00f8b419baa84c536d23f127a552b9c3d9df6e3f","txlist_hash":"82cb247f5dfeeb31342861a77bceb74957ceb62932de536d837988a2f471f599"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(533,310181,'insert','blocks','{"block_hash":"a7e66b4671a11af2743889a10b19d4af09ec873e2b8eb36949d710d22e1d768f","block_index":310182,"block_time":310182000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(534,310182,'parse','blocks','{"block_index":310182,"ledger_hash":"935e40f93195d450b292481aac481f445d2de8786d04d26263f4adc5a348704c","messages_hash":"454c2009be61a3954687ce793fe7cb30490d41edd77bd9d62006622440df901d","txlist_hash":"1a48f71be7c5f3baa68d68c393a6c68d63596c561005ac7c6df457584fc18c6a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(535,310182,'insert','blocks','{"block_hash":"85318afb50dc77cf9edfef4d6192f7203415e93be43f19b15ca53e170b0477bb","block_index":310183,"block_time":310183000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(536,310183,'parse','blocks','{"block_index":310183,"ledger_hash":"268bf841be40615472bf4c60b5306d0763ed50510fbb55c47a6a0ac726e8701f","messages_hash":"6a772e172863a0a850489c0ebce5b7c5467d17a50bb1b04f9ba949dba19ca8b6","txlist_hash":"82d2641b1ab0cdf057e8e68b0cd7824ff8c60222f8d4e23125d68beacf2b3293"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(537,310183,'insert','blocks','{"block_hash":"042a898e29c2ebf0fdbb4156d29d9ba1a5935e7ed707928cb21824c76dd53bfc","block_index":310184,"block_time":310184000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(538,310184,'parse','blocks','{"block_index":310184,"ledger_hash":"64323488ca4d32a1f548842db4ac772b750599ce6222020ef6149b4a0e54a935","messages_hash":"c5850f7e42e373ad7c980eac188fc4c1d93c1b70fa5113498aa6a50a7e583a95","txlist_hash":"9a7f77be4828adcfee8ea1f106ecbcb55ae758d5098a6fa1aa3a494af957f7cb"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(539,310184,'insert','blocks','{"block_hash":"bd78c092ae353c78798482830c007aac1be07e9bc8e52855f620a3d48f46811f","block_index":310185,"block_time":310185000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(540,310185,'parse','blocks','{"block_index":310185,"ledger_hash":"8946baadef2e19c5e4e4b2d771b36982a217486dcb0f95097b41ce633e61da94","messages_hash":"d67a467f3facea45d03afbe61753a922cd38f8de8c4b23e064a530e2592412aa","txlist_hash":"8956f030f917aa87d9b309bd845b59cb37ba2265184ff1f67bfa4b61e32d43c3"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(541,310185,'insert','blocks','{"block_hash":"e30a3a92cc2e5ad0133e5cee1f789a1a28bea620974f9ab8fa663da53e5bf707","block_index":310186,"block_time":310186000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(542,310186,'parse','blocks','{"block_index":310186,"ledger_hash":"e68b5525927cfee15fefee02a16fd700abf6b6e7b4e32e57df7d324fae7ae090","messages_hash":"de219598994c08d7db8fa07ab2a525349193cf9995b12bdebf550efc116f6d3d","txlist_hash":"137a7a7a1ae71a317f7c3c48f7f84e4a782a515fa2096c2abe2c1adeab4e8256"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(543,310186,'insert','blocks','{"block_hash":"fc6402c86b66b6e953d23ed33d149faa0988fa90aa9f7434e2863e33da2f3414","block_index":310187,"block_time":310187000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(544,310187,'parse','blocks','{"block_index":310187,"ledger_hash":"c42efa24d48339fc341908a30c6679beeadc9f5918d8d3e62d5c4b06fec845d5","messages_hash":"d102dd65505ea26b381ebc87971f3346b7bc5caf341923fe94dcb249d69b4e30","txlist_hash":"cc587cfca94dbe30e6670dbfc4a5e3ec46732731f5c66aab9c7ef9028b05c22a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(545,310187,'insert','blocks','{"block_hash":"85694a80e534a53d921b5d2c6b789b747aa73bf5556b91eeed2df148e2ada917","block_index":310188,"block_time":310188000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(546,310188,'parse','blocks','{"block_index":310188,"ledger_hash":"13de1d9b569d5d2525ecfa39b1eda69f9fd474683b6e34554b1a755125e96e5d","messages_hash":"b8c7ce7442aa512c5eb00e3c222fd2ce668afb4ef43d20af4592755faedf27b0","txlist_hash":"2fcc160068a4eb52ac410937237ec3813bfee52750bd8cef939738b81c8ac30b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(547,310188,'insert','blocks','{"block_hash":"7c036dadf19348348edbe0abe84861f03370415ed2fec991b9374dbb0ca19a06","block_index":310189,"block_time":310189000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(548,310189,'parse','blocks','{"block_index":310189,"ledger_hash":"582b8b3d3a226d3f6df497cb933ed5f42e1e992c0c25372ec15de424c0a33368","messages_hash":"51aa347c9fde3d01458f08a73c430406fd712a905ebc897c477ab43297fb57c4","txlist_hash":"ae81616b5fd77e3672318a0a5ef1b20106afc3ce7d730c8beef848d73ba53a0f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(549,310189,'insert','blocks','{"block_hash":"d6ef65299fb9dfc165284015ff2b23804ffef0b5c8baf6e5fa631211a2edbd8d","block_index":310190,"block_time":310190000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(550,310190,'parse','blocks','{"block_index":310190,"ledger_hash":"d4c49d5e3aaf21e6fe1c30663d0ba93f7dc9ddb03611e3751fba9aac8d382ac4","messages_hash":"badc62331f35d2d438ef5ac0d918e29d750aae86f1275164354eac7a7e7f5254","txlist_hash":"48c70376450aa80a2a920e4b871d27d1efe703b377ba446a262e06c9a6677611"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(551,310190,'insert','blocks','{"block_hash":"5987ffecb8d4a70887a7ce2b7acb9a326f176cca3ccf270f6040219590329139","block_index":310191,"block_time":310191000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(552,310191,'parse','blocks','{"block_index":310191,"ledger_hash":"23d340ff3f1979a43bd1336c9c882b5ee01c646cd104060feacdb5db78025cca","messages_hash":"88f7d700b8ff35da0dbaf70bc08d827586f42dd7e817ae603c2f81058850c9d1","txlist_hash":"704b02ead8ed3e4e6505225fc620073993e9c3b13209bff9b5f638d5f21ce23b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(553,310191,'insert','blocks','{"block_hash":"31b7be43784f8cc2ce7bc982d29a48ff93ef95ba18f82380881c901c50cd0caa","block_index":310192,"block_time":310192000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(554,310192,'parse','blocks','{"block_index":310192,"ledger_hash":"cd18860851bceba4a0174480ccdc0f6ddc47b31ce71af8ec8500cb07f75d9da9","messages_hash":"b3ed38fcef537adc2756596562698c24287abe616870b22853ea834aed2a0bf7","txlist_hash":"17018479e73908fd235313691ed8464b93a0a5db774d3608294e23fba918c672"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(555,310192,'insert','blocks','{"block_hash":"ff3bb9c107f3a6e138440dee2d60c65e342dfbf216e1872c7cdb45f2a4d8852a","block_index":310193,"block_time":310193000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(556,310193,'parse','blocks','{"block_index":310193,"ledger_hash":"391e97ae7ccf5bc38ac72e7ad1256f24c28297c625bd9a789cba8231a5ade046","messages_hash":"62ffa442b4f5a7835ddc82c0f5b5362aa3c97ecb66b039670ee22893b6891ad9","txlist_hash":"d08696a916e09e242fd20a9f8314cd4fb6305e991b506c53e3ef3f77e2d1d6dd"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(557,310193,'insert','blocks','{"block_hash":"d1d8f8c242a06005f59d3c4f85983f1fa5d5edcc65eb48e7b75ed7165558434a","block_index":310194,"block_time":310194000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(558,310194,'parse','blocks','{"block_index":310194,"ledger_hash":"9141c9b38087c7cf2b8c11ffd55c2eabcb3bb09f132ac0baf9c3779f628dd42b","messages_hash":"015c140f5d377fa59b3c9d8b1c572565f35cd73b230f7530d42d7bf3e84cf41f","txlist_hash":"d5f418ef4569bb977ff73ab64235b3697d0f7f326f95696e6f63c56cdd180d6d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(559,310194,'insert','blocks','{"block_hash":"0b2f1f57c9a7546faac835cbe43243473fa6533b6e4d8bf8d13b8e3c710faf53","block_index":310195,"block_time":310195000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(560,310195,'parse','blocks','{"block_index":310195,"ledger_hash":"705918f002db29e7b3dfbfd6378f79d53e33c6ffa3948b2e3b5c85f85009bbde","messages_hash":"86c493dd15da412115cf100f1ae5090054ecc5c70899504cd8d28b4341c6b2f4","txlist_hash":"d0165e09e04c2049de1d8582291e623c80477499203b702e46fb829390ed64c0"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(561,310195,'insert','blocks','{"block_hash":"280e7f4c9d1457e116b27f6fc2b806d3787002fe285826e468e07f4a0e3bd2e6","block_index":310196,"block_time":310196000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(562,310196,'parse','blocks','{"block_index":310196,"ledger_hash":"59e12df19e3c0e3e23a5d1e9783c75e236a000774a038553312919a0f46b8227","messages_hash":"06521b1a530800f4e086530f29d38e8068690ef94e073c38fe834876aa7f9917","txlist_hash":"57dc6e1a18ce4910ba32e109820e8e0630070251ec745e63557c98ce71dedd80"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(563,310196,'insert','blocks','{"block_hash":"68de4c7fd020395a407ef59ea267412bbd2f19b0a654f09c0dafbc7c9ada4467","block_index":310197,"block_time":310197000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(564,310197,'parse','blocks','{"block_index":310197,"ledger_hash":"a0e1817dfc258180fa1629710ff3b6026181a9042fecd2c8b0b5e38118199e07","messages_hash":"0e8eacaff59da1d2ba48a95aeb66456f4e3bed48ee495cea9ec2e0ffb98db2ba","txlist_hash":"58d18f5f2362b4bfbf155b16fc4e8868b311286b25365f3b4b1a9bf73fab69b4"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(565,310197,'insert','blocks','{"block_hash":"30340d4b655879e82543773117d72017a546630ceac29f591d514f37dd5b1cc2","block_index":310198,"block_time":310198000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(566,310198,'parse','blocks','{"block_index":310198,"ledger_hash":"ff51bfc670b1387bfce53781750e35a3bf69d907167cf9cf57e15613cc0ff3b2","messages_hash":"47e506e747a98d1964596e6c438825affd74e81533b2f48e21eb4e5a90262f55","txlist_hash":"1443d1c76f64272d6ea00fb8f78913e72c617c515a162c9f1c213be02d48008a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(567,310198,'insert','blocks','{"block_hash":"494ebe4ce57d53dc0f51e1281f7e335c7315a6a064e982c3852b7179052a4613","block_index":310199,"block_time":310199000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(568,310199,'parse','blocks','{"block_index":310199,"ledger_hash":"e5f8f8f00de32f0d8d2b62eba27218edcee77563960fe074da5ae86bf5b553f1","messages_hash":"fe470b47af5b3f99bbbcec04aa4e304ac0b2890d03f6432c9f9a3cb6ac22e474","txlist_hash":"87fca2825c48b9ec9db31e2d6e8e8354a0ceff7fa3df299dc2868c7d616a9599"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(569,310199,'insert','blocks','{"block_hash":"d5169d7b23c44e02a5322e91039ccc7959b558608cf164328cd63dbaf9c81a03","block_index":310200,"block_time":310200000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(570,310200,'parse','blocks','{"block_index":310200,"ledger_hash":"fd8fb664576868d4f1c843b28efc7ee028417034a33d6f5635238bd13c701b2a","messages_hash":"9eee9c3e3b358fdbfb78813b40b67c9b33bbaf1512e3d7d27f6c05e61d0bf6ea","txlist_hash":"a88ca1fa9d0dfccf2e49323a500ebdfab7ba13b60dc9011c6b510741148dbf54"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(571,310200,'insert','blocks','{"block_hash":"8842bf23ded504bb28765128c0097e1de47d135f01c5cf47680b3bcf5720ad95","block_index":310201,"block_time":310201000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(572,310201,'parse','blocks','{"block_index":310201,"ledger_hash":"7e2dbbf14c0620ac0fd4e0e676857e2d055fff80cadfe2d9d0dfe07d36738722","messages_hash":"a22e94319ba0331541ae9446e6313faa1ff5e579294f0a4e73d5a4cbf1368ae2","txlist_hash":"f20074cd00170edae909606eb1bd3937afaa3711590eb7d788c564ddbdc6600f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(573,310201,'insert','blocks','{"block_hash":"95fa18eecbc0905377a70b3ccd48636528d5131ccfa0126ed4639bc60d0003d8","block_index":310202,"block_time":310202000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(574,310202,'parse','blocks','{"block_index":310202,"ledger_hash":"084c24e81842ec8edc4144ad64df9f12377318fe4dc491b307b7d377f3f81b2b","messages_hash":"96cba00eb5b84fe3634ae0c4ab0bc5544b5f9a703f20e0c34c3877aa97769071","txlist_hash":"76c57648e216c5f191f04b79d2a1149d273b2a58a6b4956eb1d077abd2cfc113"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(575,310202,'insert','blocks','{"block_hash":"ab15c43e5ac0b9d4bd7da5a14b8030b55b83d5d1855d9174364adbebf42432f8","block_index":310203,"block_time":310203000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(576,310203,'parse','blocks','{"block_index":310203,"ledger_hash":"4b0b8d82a5a2c8600a09b1050eed4440d9e0f2d817498f3e32ba27ebcfbaf6d5","messages_hash":"36c279295138f4a6da31842ab3a843f35fdc05807920bb9909042562e3f72a83","txlist_hash":"3e49b55d1309646ffce3b91d3cc3c53c488377518fe30cf6397c0d3c2aec45f4"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(577,310203,'insert','blocks','{"block_hash":"18996fb47d68e7f4ae140dc1eb80df3e5aba513a344a949fd7c3b4f7cd4d64cb","block_index":310204,"block_time":310204000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(578,310204,'parse','blocks','{"block_index":310204,"ledger_hash":"9f81657142f7523c01595bef4e9008d8525c2337f6d90140e05abad619d94416","messages_hash":"689909b859f925743226073e922bf8f21ca99caade631f6a1dd49b16dff9fce8","txlist_hash":"89015233602aeb77d2097a328f2a5a065245131ac88ec6ac2d2b9b056e7764b6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(579,310204,'insert','blocks','{"block_hash":"5363526ff34a35e018d1a18544ad865352a9abf4c801c50aa55742e71630c13a","block_index":310205,"block_time":310205000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(580,310205,'parse','blocks','{"block_index":310205,"ledger_hash":"fd1cdea0193ed914cc408968efa42377d7c69453aa9bdf8bdf0731d4b1501b01","messages_hash":"4457523f49ff3994beb0520d8f8c96387bcaec1e3dad5d4e414c0118768e1f67","txlist_hash":"1ea101d94c29967a141d71d3b8b15b278f3530c4c16c7e0219b892072d89f8f6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(581,310205,'insert','blocks','{"block_hash":"0615d9fca5bdf694dca2b255fb9e9256f316aa6b8a9fc700aa63e769189b0518","block_index":310206,"block_time":310206000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(582,310206,'parse','blocks','{"block_index":310206,"ledger_hash":"5845d6bedf81fba710999bf2954b3c1f3f9ca007a09d812ccae8e2a6d3b9bb07","messages_hash":"643bb31e7baa89d28efcee7755e727165c26c6160da6e474bf0361ca45d4c928","txlist_hash":"e26d49ceb523c99c2583e7bec1b4bbe1f8686c2bd009626fa4c8966c642a1bb8"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(583,310206,'insert','blocks','{"block_hash":"533b4ece95c58d080f958b3982cbd4d964e95f789d0beffe4dd3c67c50f62585","block_index":310207,"block_time":310207000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(584,310207,'parse','blocks','{"block_index":310207,"ledger_hash":"b65cf7069a0eb909357cd5d45129b70c576eeabc0cb13404029d088e24a2be34","messages_hash":"7a0ee60726734da2812a9d04529425ae59ac22f6598b536a399f77428e3acb66","txlist_hash":"596206790b52de9f791b99f7e71e3543cec87d4c3b9439ded8b7cbcd182b08e6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(585,310207,'insert','blocks','{"block_hash":"26c1535b00852aec245bac47ad0167b3fa76f6e661fc96534b1c5e7fdc752f44","block_index":310208,"block_time":310208000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(586,310208,'parse','blocks','{"block_index":310208,"ledger_hash":"aa54dc010fec8a0ef3871c91667c45e88ffac08ee2fc93274d7ad1b2b5b28102","messages_hash":"66543655288b9354381b07bd124c91433357babb742999fdf19b7c5928ebb9ac","txlist_hash":"3414e0af132ec9df1da5a4304a3c94529bd915631443d34b759a017ad166863a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(587,310208,'insert','blocks','{"block_hash":"23827b94762c64225d218fa3070a3ea1efce392e3a47a1663d894b8ff8a429bf","block_index":310209,"block_time":310209000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(588,310209,'parse','blocks','{"block_index":310209,"ledger_hash":"c7866cb2098c87c1333da5b3dce4c84bdeb620c9f1898456b7cceb23e4027df0","messages_hash":"78c91e8e991f4e18fd9b2a200fdbceba6644c5baa7150ab48a55a06378fa2731","txlist_hash":"56dce3d0e9dfa62c44e422f41ecc1517bc98302341496db287adf309f666d3bb"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(589,310209,'insert','blocks','{"block_hash":"70b24078df58ecc8f7370b73229d39e52bbadcf539814deccb98948ebd86ccc0","block_index":310210,"block_time":310210000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(590,310210,'parse','blocks','{"block_index":310210,"ledger_hash":"207a1c90d1658d55fa0fc2e1507fce98521647ab5c4d11099c2742279cc92b3f","messages_hash":"b8d234858f912396a71c45ebae9b3a21bace1a8dda0827b9e8a9b82a47cea34d","txlist_hash":"ecd4bb45bef1d8b395add25118bbeedc8d96f818a471bd7606554946a023b151"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(591,310210,'insert','blocks','{"block_hash":"4acb44225e022e23c7fdea483db5b1f2e04069431a29c682604fe97d270c926d","block_index":310211,"block_time":310211000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(592,310211,'parse','blocks','{"block_index":310211,"ledger_hash":"dfc7fe172f9bc77148a1bfad5d441a3688f718b4985406d0cefd4c4dcd926208","messages_hash":"03209d67b7b17a0027728b8940661ea37594bc07cfc6780033aa44c481f48af6","txlist_hash":"f999268e3400907f85a0448d124df4d139b228327721fad7ad29ef595b0d16c9"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(593,310211,'insert','blocks','{"block_hash":"6ef5229ec6ea926e99bf4467b0ed49d444eedb652cc792d2b8968b1e9f3b0547","block_index":310212,"block_time":310212000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(594,310212,'parse','blocks','{"block_index":310212,"ledger_hash":"32a39bff0606ec93454a2cb144c0bbd1939bf2be6a2ae369b885afc0b5ef33c9","messages_hash":"079f23e8476ed4f50d9aa11b1dbc3ef842c51bc46b622f75c06b06a62388e701","txlist_hash":"2e46422b38cddef2d8a10b343115c5e587b5456480fb1a019f0a5d541e90afb8"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(595,310212,'insert','blocks','{"block_hash":"17673a8aeff01a8cdc80528df2bd87cdd4a748fcb36d44f3a6d221a6cbddcbe7","block_index":310213,"block_time":310213000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(596,310213,'parse','blocks','{"block_index":310213,"ledger_hash":"15968873880e97e849e59971d4ef19881b1c11c3148dba966f51d986c59ccf36","messages_hash":"36a8bd5e1cd13df3238cc21da9490b545e51981845daccd2d7c0f3e7476e9f69","txlist_hash":"fa1e7562a89ee572607e6cdbf26c80d4ee1aac2bcd45374d166e2e993f8672cb"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(597,310213,'insert','blocks','{"block_hash":"4393b639990f6f7cd47b56da62c3470dcbb31ef37094b76f53829fc12d313454","block_index":310214,"block_time":310214000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(598,310214,'parse','blocks','{"block_index":310214,"ledger_hash":"dcbdc463154fe49a7f22611fcb53e5ca78501424ba741040d89cac9db0a03ac4","messages_hash":"2e5d68dcda983499b5f291e65d92baaf171cc830e18385d212e6c66e5c8c7da5","txlist_hash":"5928d3221dd0bd142368585dc56f9f8a68885be95b7ad46c35bc37fbc61f651f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(599,310214,'insert','blocks','{"block_hash":"c26253deaf7e8df5d62b158ea4290fc9e92a4a689dadc36915650679743a74c7","block_index":310215,"block_time":310215000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(600,310215,'parse','blocks','{"block_index":310215,"ledger_hash":"6047855f1c691f27ade1cc4c587f1c11ff68f5f5bd7959a23f801e5da7773eed","messages_hash":"0b8f5bc09af225c25136f886347723693fd43c83b4a0602747803579bd4fe100","txlist_hash":"b6410b25a5d6f17a5431f621d6226491bcb2ed97dac543c06e832cdaa8853d5a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(601,310215,'insert','blocks','{"block_hash":"6b77673d16911635a36fe55575d26d58cda818916ef008415fa58076eb15b524","block_index":310216,"block_time":310216000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(602,310216,'parse','blocks','{"block_index":310216,"ledger_hash":"a12fbb09858868de79095c8e3222f6fa179f2f00bc3c97c8205fd9367ae05aef","messages_hash":"58b268d9c7d1747b50ef4a6424d3e57365ce66afa440b9b365126437c676d3cc","txlist_hash":"f8b3b6d36fcb97071d826e68d2e6e5bc60f982c470e68644d94a6ec1342d0148"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(603,310216,'insert','blocks','{"block_hash":"0e09244f49225d1115a2a0382365b5728adbf04f997067ea17df89e84f9c13a8","block_index":310217,"block_time":310217000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(604,310217,'parse','blocks','{"block_index":310217,"ledger_hash":"419d8dc096dd58523cd4822748754158f0c11945bbb62100cb5268cd802580a8","messages_hash":"03e581edbb659df8a0b7a2996d0ce6b97f1f9dff6d10a7d1e9443f5b20836521","txlist_hash":"a61fb813a69ed40eae923918a73a8dfe51dd6fa14f5426ada1a5a543ab7bb0ce"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(605,310217,'insert','blocks','{"block_hash":"3eb26381d8c93399926bb83c146847bfe0b69024220cb145fe6601f6dda957d9","block_index":310218,"block_time":310218000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(606,310218,'parse','blocks','{"block_index":310218,"ledger_hash":"a36c07f7fdfaf7878d73baf14aee58b42220b2b2411fd1864450ec6ce1fbd173","messages_hash":"9c7ecbd39c0967b83ae38062d7674b5fc87e4330253c78da3d19d7c1d8e12fe2","txlist_hash":"dc1d785fe75a506a691f0eccaf752017fbaf5ce2b7225bdde3fb538281698e4e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(607,310218,'insert','blocks','{"block_hash":"60da40e38967aadf08696641d44ee5372586b884929974e1cbd5c347dc5befbf","block_index":310219,"block_time":310219000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(608,310219,'parse','blocks','{"block_index":310219,"ledger_hash":"7958aa94088ecf0384a9a6b0569e9507d208e009e9ce139c823960e40996a47e","messages_hash":"128105377e3c494bd2ddebf06d4f7b341d300abbae44e42233771cbdb8f6b2f0","txlist_hash":"c9aa622e3b372ba0c76efe97c1443cb89f2dfbcf8ff5e28dedf9b3abab3d6384"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(609,310219,'insert','blocks','{"block_hash":"d78c428ac4d622ab4b4554aa87aeee013d58f428422b35b0ba0f736d491392ef","block_index":310220,"block_time":310220000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(610,310220,'parse','blocks','{"block_index":310220,"ledger_hash":"00907c4368c2dc76d1ef98a0ba3c86bc4746ed2734b0c10f3797e0af70714240","messages_hash":"f43ab6ee98113914d6107f8950d5f6fb8affc0764a4723aa3da76bb60462ebe6","txlist_hash":"d0c3959f899232cdb5fed61bac2c09e45254959e8bc1a076acb3ba5e3ee63e65"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(611,310220,'insert','blocks','{"block_hash":"cf5263e382afd268e6059b28dc5862285632efe8d36ba218930765e633d48f2d","block_index":310221,"block_time":310221000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(612,310221,'parse','blocks','{"block_index":310221,"ledger_hash":"2e42f882087dc2158036592298321113f1b34e15b414efa6d43364c06d368540","messages_hash":"36833c9b3c6ada300b80182e1b9e78ba57b16030c2350a98ae24f85212a8d1c6","txlist_hash":"cf40107f8d11aa8ba96b03912967f88c44e69e20d7105f497d5418fc08aa5800"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(613,310221,'insert','blocks','{"block_hash":"1519f6ec801bf490282065f5299d631be6553af4b0883df344e7f7e5f49c4993","block_index":310222,"block_time":310222000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(614,310222,'parse','blocks','{"block_index":310222,"ledger_hash":"00c4a5d41dd629bd0973c03152e4519214dce68498999c8dddc1f7a1cad28a82","messages_hash":"9436a06f0aa4299d6d9dd6eeb34a34763dc1571873ec7d801504482f84e0453f","txlist_hash":"6a012ee8e82d8d24b0a24d4bbab74cbe226afea1a9c1e129aceccd1d7591a107"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(615,310222,'insert','blocks','{"block_hash":"af208e2029fa49c19aa4770e582e32e0802d0baac463b00393a7a668fa2ea047","block_index":310223,"block_time":310223000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(616,310223,'parse','blocks','{"block_index":310223,"ledger_hash":"41c7a0fa22ebee9d55f2a3b118314293d155c349ba01069a23ddff76dc842955","messages_hash":"1dd11ae205fb0e3cd0e40f6b38f828c87984aee77d866a89459b419bc35c8b91","txlist_hash":"1080406ec3ccb84490487860bdd507637fa8fbdc68fc886d082bfcdf9ac835e7"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(617,310223,'insert','blocks','{"block_hash":"5b57815583a5333b14beb50b4a35aeb108375492ee452feeeeb7c4a96cfd6e4c","block_index":310224,"block_time":310224000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(618,310224,'parse','blocks','{"block_index":310224,"ledger_hash":"66c268462442b69efb56b29e08aae1a404d3543e0a20711e8998a31af45ee929","messages_hash":"2959b2278c2b1ec51545610be3ffe8558ee5b8d21654226a04e99fbfad17cb5d","txlist_hash":"1d5188bf347d72bc66239f3b4c709ecca24141c5474755c567f4176293f275af"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(619,310224,'insert','blocks','{"block_hash":"0c2992fc10b2ce8d6d08e018397d366c94231d3a05953e79f2db00605c82e41c","block_index":310225,"block_time":310225000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(620,310225,'parse','blocks','{"block_index":310225,"ledger_hash":"cf39fb28a7e4d4db7657bb11a30d592a15c049000d7ac86d4fb3d942bf879b95","messages_hash":"efd4e825c77a27f6c0d8b18c54f144166479fb35ad75dbab439122b908f4d0b5","txlist_hash":"61dccc2a6cdf50b56700c893611fac0dd6cccadcd672cd438452ebd30852ccf7"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(621,310225,'insert','blocks','{"block_hash":"b3f6cd212aee8c17ae964536852e7a53c69433bef01e212425a5e99ec0b7e1cb","block_index":310226,"block_time":310226000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(622,310226,'parse','blocks','{"block_index":310226,"ledger_hash":"cb622a4d04645ad96d3e0006f2b7632e8b82e44206d6c1cb75212b059fe18de5","messages_hash":"07a2801c71185f1fd03a4372433bc536c79aaf46ed374209a41a1fce2d0e9ff8","txlist_hash":"2c131ef357cdc433dce05cf915be1b2c243e51208c877852a19c67968caddca4"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(623,310226,'insert','blocks','{"block_hash":"ea8386e130dd4e84669dc8b2ef5f4818e2f5f35403f2dc1696dba072af2bc552","block_index":310227,"block_time":310227000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(624,310227,'parse','blocks','{"block_index":310227,"ledger_hash":"60ae4209347248a3f7ad39b6436627f06e45433f6b6dd89cfd3383d68974a41c","messages_hash":"d652cb4035428a7d0c6ff73d8f6b3bc341ebcfefbd5129f45d77d9a4c63648a3","txlist_hash":"200ccbec2ba0927612c50a1ce2a58f856ecbda876943bfc2d3404724fff1927a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(625,310227,'insert','blocks','{"block_hash":"8ab465399d5feb5b7933f3e55539a2f53495277dd0780b7bf15f9338560efc7b","block_index":310228,"block_time":310228000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(626,310228,'parse','blocks','{"block_index":310228,"ledger_hash":"798206ee77c9e2fc8fe943f9bf2074c9c2560f534e3304b944e2ed3c89ce8bcb","messages_hash":"03298834b11f7cf4a87e5717022fea72055bc47a6e8d0f62e4a9810f4cb96b82","txlist_hash":"c8c9a18e8420e274c98c528e0d0636aba20f5a6c983135a61e9cd47d60123185"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(627,310228,'insert','blocks','{"block_hash":"d0ccca58f131c8a12ef375dc70951c3aa79c638b4c4d371c7f720c9c784f3297","block_index":310229,"block_time":310229000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(628,310229,'parse','blocks','{"block_index":310229,"ledger_hash":"becad39a4d1bc8d73a856fa1d2bfa251f29b23fec9448a91932dc610243fd8df","messages_hash":"959fc4e9bdfff5818ca84c2a68c31868f6d3bff79e7dcc5df9da122959332a11","txlist_hash":"1d817cb41854bebc85173e6c6c0a8e6ae5a1bdbbd1077a64265ec4c96d60ca45"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(629,310229,'insert','blocks','{"block_hash":"f126b9318ad8e2d5812d3703ce083a43e179775615b03bd379dae5db46362f35","block_index":310230,"block_time":310230000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(630,310230,'parse','blocks','{"block_index":310230,"ledger_hash":"e08eac4daa7d7bc70f2f47a835bb80993d6d6db06d8d8986101b717db1c62ed6","messages_hash":"b540fdab5cebac778cf187ae4e15720474ada921e9ceaa1393176bd2a4b8a3ac","txlist_hash":"d37fa640132bf2595891bfaa5d1d562495c780569e2a5d4f8863fd60d6396d95"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(631,310230,'insert','blocks','{"block_hash":"8667a5b933b6a43dab53858e76e4b9f24c3ac83d3f10b97bb20fde902abd4ceb","block_index":310231,"block_time":310231000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(632,310231,'parse','blocks','{"block_index":310231,"ledger_hash":"a761c29e76c9d5090cd1d6424beb91d0a9fd9546c67ecaa6d4879177b6745b59","messages_hash":"c5044aaa4b6c6310e113ab4b8d4a06108a09e57b6f082589aa84210ff6ef74eb","txlist_hash":"7bdcbdcc058e4c3d39751316b39bc65594624dc79fc8556e2847c94fb5986200"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(633,310231,'insert','blocks','{"block_hash":"813813cec50fd01b6d28277785f9e0ae81f3f0ca4cdee9c4a4415d3719c294e8","block_index":310232,"block_time":310232000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(634,310232,'parse','blocks','{"block_index":310232,"ledger_hash":"5da469b7e21ad8ec4fe7cc2f426dcaeb18a3a4a3c44385d529a8b252c77a9e43","messages_hash":"64b6eb076323d0a896145203b0c7c201c2b57511c3d85d7b546395d75ed44a53","txlist_hash":"721ab1fecac8b537de1c90225f23a62d02a6e8b392f5211a8e020d9169dc75f6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(635,310232,'insert','blocks','{"block_hash":"79a443f726c2a7464817deb2c737a264c10488cac02c001fd1a4d1a76de411d6","block_index":310233,"block_time":310233000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(636,310233,'parse','blocks','{"block_index":310233,"ledger_hash":"d8531834d572acc01591997cac000185facc033e1ab72f8218a70d0ae3898914","messages_hash":"d9f33ce31a6349baf6626faf215023a0dcaa381fbbc85519a36790adea83a30c","txlist_hash":"a0b57a1491335a2fde88223b77d7c8a248101187be0b71894b6c56c426603867"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(637,310233,'insert','blocks','{"block_hash":"662e70a85ddc71d3feae92864315e63c2e1be0db715bb5d8432c21a0c14a63cd","block_index":310234,"block_time":310234000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(638,310234,'parse','blocks','{"block_index":310234,"ledger_hash":"0ac6803ab61e14bb08fd8051424565086ab11b4d33faef077f5a0732eec6f766","messages_hash":"9174a71d733b2d1bf9fe8554ee25a8f90b8316b6c4bf8f93a290c8bcd96d7482","txlist_hash":"b719ec81bc5245492809b946a86c76c121148d506292a4ae125b368f1a24b72a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(639,310234,'insert','blocks','{"block_hash":"66915fa9ef2878c38eaf21c50df95d87669f63b40da7bdf30e3c72c6b1fba38e","block_index":310235,"block_time":310235000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(640,310235,'parse','blocks','{"block_index":310235,"ledger_hash":"5f7de1c7fe45858dcc844604a77051d55de3b9dbb5f5d9910ead8bd0f3af48d8","messages_hash":"26bcd4fe3cc5d852b6ee428aa6d8fed7ac29d4870aa3765afb64a7f606f34f98","txlist_hash":"8d81c116619e760608161facac457bb00d4e816c049afbe42f6e0f7d7f1d09cd"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(641,310235,'insert','blocks','{"block_hash":"d47fadd733c145ad1a3f4b00e03016697ad6e83b15bd6a781589a3a574de23e4","block_index":310236,"block_time":310236000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(642,310236,'parse','blocks','{"block_index":310236,"ledger_hash":"c0437ca60921bb73516c31a74f78d2fb48d2c628b629c8f55c8fbb0060718d76","messages_hash":"a90b36102b9796577c3433977637279f790986193da640ed70d16c82dbcb1697","txlist_hash":"1c50aa16f8543f1eee5c2585aa8f7ee373bdb58648b430189ef4d8c9b0b767db"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(643,310236,'insert','blocks','{"block_hash":"2561400b16b93cfbb1eaba0f10dfaa1b06d70d9a4d560639d1bcc7759e012095","block_index":310237,"block_time":310237000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(644,310237,'parse','blocks','{"block_index":310237,"ledger_hash":"4340ab34a083b38dbca477b6cc2479e6d70ffd6d6b9b75772068674297abadff","messages_hash":"387939cbc42aadf395163de49936ffa63ea379a764238cedc0a52ecb280a8810","txlist_hash":"2f23795147dfb09a113607e442cdc926222a2b9c3dc173b9e92ab8560de20c9f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(645,310237,'insert','blocks','{"block_hash":"43420903497d2735dc3077f4d4a2227c29e6fc2fa1c8fd5d55e7ba88782d3d55","block_index":310238,"block_time":310238000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(646,310238,'parse','blocks','{"block_index":310238,"ledger_hash":"6a76891c10ff0f9416ae1a024b985d621154918bd8ab545980b57fd2d18c4af7","messages_hash":"12bb025b6e426c682d70a6ae543622d706b596d8d1848c61b0fd456113766738","txlist_hash":"31d5717812d8f7e54ac8b7a000c7b599e2123a1de205cef6559b3930c466b961"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(647,310238,'insert','blocks','{"block_hash":"065efefe89eadd92ef1d12b092fd891690da79eec79f96b969fbaa9166cd6ef1","block_index":310239,"block_time":310239000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(648,310239,'parse','blocks','{"block_index":310239,"ledger_hash":"1128bb89562fc3b112da425a3dee67adaf741a8021ee378bdfeb44af3b1b1fac","messages_hash":"c501a04f979e29b0f67e8c4b2ab0cd68bcc610b98eba76d64c28e426e9162334","txlist_hash":"82b7482bdf98200b43d483dc7725ea9069ab96d897fa88dfafd73334132d362e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(649,310239,'insert','blocks','{"block_hash":"50aac88bb1fa76530134b6826a6cc0d056b0f4c784f86744aae3cfc487eeeb26","block_index":310240,"block_time":310240000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(650,310240,'parse','blocks','{"block_index":310240,"ledger_hash":"be05624b84b2e76794f065f36b4e98d6c6c120f1d8a5db91957bbe7008ce3240","messages_hash":"d0dc75e494d5935319620e47fe5aced48a36185547557d7ecdf4105ce3865810","txlist_hash":"bfd037773e4ad5fedd072183d19e824c36cf21549c374f7d7dab3ac313a1542b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(651,310240,'insert','blocks','{"block_hash":"792d50a3f8c22ddafe63fa3ba9a0a39dd0e358ba4e2ebcd853ca12941e85bee4","block_index":310241,"block_time":310241000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(652,310241,'parse','blocks','{"block_index":310241,"ledger_hash":"5abfdfb1aa42fb80ca4538062d152d965b6a7a56bd1e170a7a109409a4606b7a","messages_hash":"021d83e2bcd0861be9bda8a7c6543a42d5cb2b1cad18986155556c784420bae3","txlist_hash":"e0bccb8ee5ac848700b228d8d21970f33fcc7a2c091e4b1d1f7f71c09404ecbe"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(653,310241,'insert','blocks','{"block_hash":"85dda4f2d80069b72728c9e6af187e79f486254666604137533cbfe216c5ea93","block_index":310242,"block_time":310242000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(654,310242,'parse','blocks','{"block_index":310242,"ledger_hash":"5f354f767df3256aa6a23544a7164160b9fabe481c85d1891f5250b3026dd7b8","messages_hash":"f20bae6583a51b6e9170deca1b35559f7a93dde4f14718fba8d132d3fe0e6322","txlist_hash":"a9b87a1cd3146663579bf192b97136602806865bb60ca2d464e3111872b61b7f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(655,310242,'insert','blocks','{"block_hash":"a1f51c9370b0c1171b5be282b5b4892000d8e932d5d41963e28e5d55436ba1bd","block_index":310243,"block_time":310243000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(656,310243,'parse','blocks','{"block_index":310243,"ledger_hash":"ea3acc31b3c298237fa11ca4400c65ee46732c96e0b7fac5a183dd49d938e730","messages_hash":"d9519ac42fde29980b3bc45cb459ee7e430192d8b5780930877da95a6510c14e","txlist_hash":"b7226a87411a48bc0b25e014f2929d63979a297600f51723a0c9bb89fef120b0"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(657,310243,'insert','blocks','{"block_hash":"46e98809a8af5158ede4dfaa5949f5be35578712d59a9f4f1de995a6342c58df","block_index":310244,"block_time":310244000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(658,310244,'parse','blocks','{"block_index":310244,"ledger_hash":"07ad792741a48d5a7b657e6c4dc83e3534c79bd1e7da7044139516124adc8f80","messages_hash":"004314c5aec356c4085a994e40d6e7af4228da1e3ad37071c58a406c9d79ea21","txlist_hash":"baab169058840f62c00af1dc51ee0a77fb964dd27c6241463650fdb6c77d3b6a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(659,310244,'insert','blocks','{"block_hash":"59f634832088aced78462dd164efd7081148062a63fd5b669af422f4fb55b7ae","block_index":310245,"block_time":310245000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(660,310245,'parse','blocks','{"block_index":310245,"ledger_hash":"d36a618af8e92da03b373ab0137ded666db6cef906a6b2c0cb8c71057a1a5903","messages_hash":"f256e29cac9ed8fd9084d5ba5c67dcf17a9cfdbf448002b4d23be878f8f6c431","txlist_hash":"18cf40a1489af6f99dc454630c35dddf20acacbf979d47acb30a5831e55f920e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(661,310245,'insert','blocks','{"block_hash":"6f3d690448b1bd04aaf01cd2a8e7016d0618a61088f2b226b442360d02b2e4cd","block_index":310246,"block_time":310246000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(662,310246,'parse','blocks','{"block_index":310246,"ledger_hash":"a34e154571ee585a839053a851a007d6d433d3efd2b3e923a9c4ec4bb0dc9d98","messages_hash":"92054cd8a49ac6948cac199791828d3caddd81f90d220fc2da94230f776c98b1","txlist_hash":"a2103af3fa84dc4015979f3a629c46e2234f534f86d7c5a403275a8eae144ba7"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(663,310246,'insert','blocks','{"block_hash":"fce808e867645071dc8c198bc9a3757536948b972292f743b1e14d2d8283ed66","block_index":310247,"block_time":310247000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(664,310247,'parse','blocks','{"block_index":310247,"ledger_hash":"ee94fcb9210718095ccdf63f30ab081f45dff765a9ca4f5c86b1b0d98973ef90","messages_hash":"5498543f7056d1878b53eee6bbfbfc859729deff6215caaf7b228b90c2ae0716","txlist_hash":"39cff977657fdbe649c601531383548a3922cde40dd998c355c201cb6deee9f6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(665,310247,'insert','blocks','{"block_hash":"26c05bbcfef8bcd00d0967e804903d340c337b9d9f3a3e3e5a9773363c3e9275","block_index":310248,"block_time":310248000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(666,310248,'parse','blocks','{"block_index":310248,"ledger_hash":"029884a5273466fa45cdfbd91ae3aaca50af0771d22f6b55af6367348c2802e2","messages_hash":"a48928b613ea6f3f01d29fdf8a6627a62af3454eeb3fd706201264e41ad28e71","txlist_hash":"6951bec53cc30ad6d9dd3f38f5fa8e4b876cdb1637595d38614ff3e42b53edce"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(667,310248,'insert','blocks','{"block_hash":"93f5a32167b07030d75400af321ca5009a2cf9fce0e97ea763b92593b8133617","block_index":310249,"block_time":310249000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(668,310249,'parse','blocks','{"block_index":310249,"ledger_hash":"dc10674812c5249c693ab7b148d048439a0d77266014f3afc1810a6260838f02","messages_hash":"1e5bb681e064d631c8fdaee31e42df684856a141bb47c387a509b4c888a83644","txlist_hash":"2f53ae50e27194404c5b85dab55335582b2961c6997393a9c48e6708bab8f1dc"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(669,310249,'insert','blocks','{"block_hash":"4364d780ef6a5e11c1bf2e36374e848dbbd8d041cde763f9a2f3b85f5bb017a2","block_index":310250,"block_time":310250000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(670,310250,'parse','blocks','{"block_index":310250,"ledger_hash":"a0fd49b46ff0000e83d4c56281dfe2be1bbfc924c75969726754b05bf7107641","messages_hash":"58fe2492038e1061f1da22695198180f159b434c09fe8184abb758bfde7dd8ed","txlist_hash":"5148416db7a3e45edd128f1b9b5c61b916ce94f25638cc90a8d73f60afe64176"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(671,310250,'insert','blocks','{"block_hash":"63a3897d988330d59b8876ff13aa9eac968de3807f1800b343bd246571f0dca7","block_index":310251,"block_time":310251000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(672,310251,'parse','blocks','{"block_index":310251,"ledger_hash":"bdef6a6203d28d314dc087e539a9cdad19d123b605824f0a66f13bf5f72de9b8","messages_hash":"dc119235a0d3348db073f20e5edd73ba7886d07bd928c6593c8b531697a2e8c3","txlist_hash":"6742a15406482537d29722db3302d492647e4c7487d840fc8e7d74d0806c3bee"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(673,310251,'insert','blocks','{"block_hash":"768d65dfb67d6b976279cbfcf5927bb082fad08037bc0c72127fab0ebab7bc43","block_index":310252,"block_time":310252000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(674,310252,'parse','blocks','{"block_index":310252,"ledger_hash":"8da11bec0d58b196ddb073d3aba0def98f01f83da654765fcae21cae6046214e","messages_hash":"b91883ba3c87f07f7f3075cedc509a164fc69cccb3f7b4955263f0a427fa2555","txlist_hash":"2c11848ca51ba429a094ef40b1aa019c132cd9fd6f954139dab5324d77eb7125"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(675,310252,'insert','blocks','{"block_hash":"bc167428ff6b39acf39fa56f5ca83db24493d8dd2ada59b02b45f59a176dbe9e","block_index":310253,"block_time":310253000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(676,310253,'parse','blocks','{"block_index":310253,"ledger_hash":"2efa2c5781899d213741e795ca62fbee9d3ddf53792ce002db7484adc66bfbd4","messages_hash":"8c30b4215455a7b5c4fb35ff4b675702192cf87e37cf3a89be543fd46109e8ca","txlist_hash":"1036976d6406322c4c0afb2c6be13d6b89cfb2feb30306c9df8a499330d5489f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(677,310253,'insert','blocks','{"block_hash":"ebda5a4932d24f6cf250ffbb9232913ae47af84d0f0317c12ae6506c05db26e0","block_index":310254,"block_time":310254000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(678,310254,'parse','blocks','{"block_index":310254,"ledger_hash":"d062ec468e76421d3769a99eb3c8b2cbf4bf393d109ba13b3bce128613fff547","messages_hash":"12b9c9f7b4c06692d2e1c8ccad20ac1ad2be2bea92cbffd939f4ab8d28374fbe","txlist_hash":"098200d06ee21c916a203065eae3cffe8e2c80e32bce890f96e6bee400cf16ee"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(679,310254,'insert','blocks','{"block_hash":"cf36803c1789a98e8524f7bcaff084101d4bc98593ef3c9b9ad1a75d2961f8f4","block_index":310255,"block_time":310255000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(680,310255,'parse','blocks','{"block_index":310255,"ledger_hash":"5c531dc8a7461e9e7a2ead654509d76c9be3427b1d2b75c0ac7ae0e03126c49a","messages_hash":"0ad73b9f29a65b6006fab73449dce8503f1afb74b31cc14d7cbb873df28c48d6","txlist_hash":"b9c0f364e8694264c33b7d993ed45f645410820dd0ff39704b79f6aaa64a46c4"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(681,310255,'insert','blocks','{"block_hash":"d0b4cf4e77cbbaee784767f3c75675ab1bf50e733db73fa337aa20edefdd5619","block_index":310256,"block_time":310256000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(682,310256,'parse','blocks','{"block_index":310256,"ledger_hash":"8da9f0162e15e33e14e5e1e22c2fd847055a65b99eec519dd069a83bb9006b51","messages_hash":"58e3369f4b854d4dcf2b03cebb0d9c22eb74381bf8c4f77e46527f6db4ff9205","txlist_hash":"fbb34ac53fa4a19bb467c92b87291aeafd8bf8c43be49c7d487f962df5c50d21"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(683,310256,'insert','blocks','{"block_hash":"0f42e304acaa582130b496647aa41dcb6b76b5700f7c43dd74b8275c35565f34","block_index":310257,"block_time":310257000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(684,310257,'parse','blocks','{"block_index":310257,"ledger_hash":"0cf6657db5f3145587a466c05f237289b639668d844abfd8d46430c090b54913","messages_hash":"35b3a89b3adf80381946f70c49cf74fd946b88eb9d243217623c04c645c6be63","txlist_hash":"71c115bc32aefb584d499c054cd09d0ea58ea0cc11d187bd5add8f261f43f055"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(685,310257,'insert','blocks','{"block_hash":"3a0156dd7512738a0a7adba8eeac1815fac224f49312f75b19a36afb744c579f","block_index":310258,"block_time":310258000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(686,310258,'parse','blocks','{"block_index":310258,"ledger_hash":"e340defe4bd84e788f9c5b083849e6aa1d5c7f33123ebe62d7abe04b8a9e312e","messages_hash":"c2f31d665dead39ac346bfc8a6459ef003c35ebe858bf2273cc3a532df345a5a","txlist_hash":"0725d989aaa9e8f1a5604f1807ec8f5aa2db518ec2397479e7e6c48c4d2b04ca"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(687,310258,'insert','blocks','{"block_hash":"e5ed3cdaaf637dd7aa2a7db134253afe716ffdf153e05672df3159b71f8538a9","block_index":310259,"block_time":310259000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(688,310259,'parse','blocks','{"block_index":310259,"ledger_hash":"03ca0cbce5a5b50988c19c0d4e754240f50821695dca767d1169f8c7f5c1fdcc","messages_hash":"27744046c69e0650cb385182b7b1518085f196c8c2fb11baf13661d2229f4a9c","txlist_hash":"19e343fb3645b7ae94a299eb13691ea02d054e8acef0484a95a4079e42e487b1"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(689,310259,'insert','blocks','{"block_hash":"8717ddcc837032ad1dc0bb148ddc0f6a561ed0d483b81abb0c493c5c82ec33cd","block_index":310260,"block_time":310260000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(690,310260,'parse','blocks','{"block_index":310260,"ledger_hash":"83a3b43e01f4f25ba05b527415baa3e8b8adba319628c245988136bd8fcdfcfe","messages_hash":"d37ff480b33c750eb958bcd17e37f77d69e5ea91ba2cd0fc5bb3368e788691c6","txlist_hash":"de3dee5cacbf5af3aaf1dac7cae860b06af7a2ba227f2bd81840d149354a05db"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(691,310260,'insert','blocks','{"block_hash":"a2a9d8c28ea41df606e81bf99cddb84b593bf5ed1e68743d38d63a7b49a50232","block_index":310261,"block_time":310261000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(692,310261,'parse','blocks','{"block_index":310261,"ledger_hash":"e61c12005d60870fee947fff469631ee540b1a0d6b8aa67614cfacc0a9f65ec0","messages_hash":"5656eb27fedc0aa95a07805caadab9816feac61e3a7e97cb67cdfebfef2d3714","txlist_hash":"58b8a751b3daa23993a773073b44d4bb2715075dbe3cc1738f3138383646504e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(693,310261,'insert','blocks','{"block_hash":"e8ebcee80fbf5afb735db18419a68d61a5ffdde1b3f189e51967155c559ee4ce","block_index":310262,"block_time":310262000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(694,310262,'parse','blocks','{"block_index":310262,"ledger_hash":"c21ac4906d435af5b9ef5576da6bce454f65ef16099b7ee03219a4ae1851bb91","messages_hash":"df2d34002ae7a0a83629c3023a29af627de3da68afd4369cae55737968d1ce5f","txlist_hash":"a1e30e203c037b242cb1a41e5fd948828da8192a5db70453602961183a00d36d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(695,310262,'insert','blocks','{"block_hash":"f5a2d8d77ac9aac8f0c9218eecbb814e4dd0032ec764f15c11407072e037b3c2","block_index":310263,"block_time":310263000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(696,310263,'parse','blocks','{"block_index":310263,"ledger_hash":"676f6c532ff23839fef228a9fac7719e77a3c20efdc17f3cb2d13035c78820e8","messages_hash":"a5e5e3d49738214545b92d1afd827fb69c457af8294d891460eb14ef72bbae9e","txlist_hash":"ca47834be7a15554ab2dd401462d7d5c14f3f5f9ef9ba715488b1b3704de15ab"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(697,310263,'insert','blocks','{"block_hash":"ae968fb818cd631d3e3774d176c24ae6a035de4510b133f0a0dd135dc0ae7416","block_index":310264,"block_time":310264000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(698,310264,'parse','blocks','{"block_index":310264,"ledger_hash":"258854505b1d3067bf360f3d0dcb369ed7a90fec8744578d3dde51a79db72c25","messages_hash":"d06a0daa493d2c5c4a16315a0c4e43447a5cefd995df309dcf6709a2631f1fcf","txlist_hash":"21f8b38aa107a9c6fbd6439244ce85a8a6abd12fde211c4569d28353cad5b8bd"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(699,310264,'insert','blocks','{"block_hash":"41b50a1dfd10119afd4f288c89aad1257b22471a7d2177facb328157ed6346a1","block_index":310265,"block_time":310265000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(700,310265,'parse','blocks','{"block_index":310265,"ledger_hash":"72ab32c420a7dcac0e7c36c4d9ca81e237955b4d8bc57c87078ba292923ce98d","messages_hash":"f1bc84e08951dedc768f03db9aec057ac21d9a3eedbd644018defb10dfdd028c","txlist_hash":"9685f9791c085e79a3c298dfe4f49fd1dbf8b4bdacf45e1d25e7d18382ca0e7c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(701,310265,'insert','blocks','{"block_hash":"1c7c8fa2dc51e8f3cecd776435e68c10d0da238032ebba29cbd4e18b6c299431","block_index":310266,"block_time":310266000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(702,310266,'parse','blocks','{"block_index":310266,"ledger_hash":"b81386d19aac285fee4e39a818cb0442e378372f7d55f92e6028b37f974e4a61","messages_hash":"31341dfe24064025c6a6fe45b2443ca21d461280708f8070481a46a096880844","txlist_hash":"578600253e06f32b4ee4a312df8213ea7cf12f841858bdf6123b0169cb4bd42e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(703,310266,'insert','blocks','{"block_hash":"c0aa0f7d4b7bb6842bf9f86f1ff7f028831ee7e7e2d7e495cc85623e5ad39199","block_index":310267,"block_time":310267000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(704,310267,'parse','blocks','{"block_index":310267,"ledger_hash":"ea8fef9e82e451d9650777b051f19fe5e34b8976f1bcc1880b6eebe5feda34d5","messages_hash":"f153cb888d8bbdf63f4eb45b9cc3b87d6e5ab845eb202deaa48c9d57ab78f23f","txlist_hash":"face84fc0aa45f7b072d73d4930b32e223cc4c22a620c39334fc836e16b2fb5c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(705,310267,'insert','blocks','{"block_hash":"b476840cc1ce090f6cf61d31a01807864e0a18dc117d60793d34df4f748189af","block_index":310268,"block_time":310268000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(706,310268,'parse','blocks','{"block_index":310268,"ledger_hash":"1545d381812f0f0caa827a237f145838276fe058b05af4808615738ca9910bf1","messages_hash":"f5a8f5bd5e8cae447a96b75fc4b9a0d70e818a9654206cb23ad8d5ea07e92831","txlist_hash":"ee67f9fcd6ce50ee98da722352a917a46d3c71d2e5ea50294a55c613817e77dd"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(707,310268,'insert','blocks','{"block_hash":"37460a2ed5ecbad3303fd73e0d9a0b7ba1ab91b552a022d5f300b4da1b14e21e","block_index":310269,"block_time":310269000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(708,310269,'parse','blocks','{"block_index":310269,"ledger_hash":"fd9cf61ac6e1fba409e4220a141ed6c89c18c893c7a752af53d5f7608bc04a67","messages_hash":"c30fd1c2fa3af21d093e353716fc4c1e8cde49854002a411d98e2a0e76211911","txlist_hash":"6d1424cf68a5b1dfddbbafb260989c5b27c060a40026e829476d979cbd8f4412"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(709,310269,'insert','blocks','{"block_hash":"a534f448972c42450ad7b7a7b91a084cf1e9ad08863107ef5abc2b2b4997395d","block_index":310270,"block_time":310270000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(710,310270,'parse','blocks','{"block_index":310270,"ledger_hash":"1d34c8c0dfdb4733a7b589647abb0e6a08f8de93a5c86fbab786f6d9d1500785","messages_hash":"bba3fcf5f4baf2b28664137cb7ac723d03999e9a17eebe6e564e15300415e455","txlist_hash":"fc2696c78afd3051d10ea3ecc56280d2633b732a7c755b9057aa30fb11f58f53"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(711,310270,'insert','blocks','{"block_hash":"67e6efb2226a2489d4c1d7fd5dd4c38531aca8e3d687062d2274aa5348363b0b","block_index":310271,"block_time":310271000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(712,310271,'parse','blocks','{"block_index":310271,"ledger_hash":"cf38baabc6e8a082eba1bd8ca2f72af5eb01cb76bd3c9eb101b27080a3a70d17","messages_hash":"2d5aba60683d839b1579c2b69089c00819349fc4f4b6abc5a48f665230f67c91","txlist_hash":"b28638da352abf83f2250bbc2da0f75b14483d7d4c69c93636484e9e3aaa326a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(713,310271,'insert','blocks','{"block_hash":"6015ede3e28e642cbcf60bc8d397d066316935adbce5d27673ea95e8c7b78eea","block_index":310272,"block_time":310272000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(714,310272,'parse','blocks','{"block_index":310272,"ledger_hash":"2b2763fa5ab2962582c303062da8b8da7280274e615b3e37f93a32e44793ccc8","messages_hash":"52e5adc7e30dfef0bcb7404f93c28177366b172a8f5c8713aa69c712f479b5fb","txlist_hash":"329d5096486b8dc452e2a1ee0a36d9a17ddd5bbb3149ddeee2bdb4989a7a3a35"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(715,310272,'insert','blocks','{"block_hash":"625dad04c47f3f1d7f0794fe98d80122c7621284d0c3cf4a110a2e4f2153c96a","block_index":310273,"block_time":310273000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(716,310273,'parse','blocks','{"block_index":310273,"ledger_hash":"ff9df73d4f92b7557c36f20d8f622923dda225a1ae2871e60f16ee2dfdf5b9d8","messages_hash":"a4460c33d3af7eaf48cff39abbffd1b68bba521b1e1f814f0add5c91b00fdb27","txlist_hash":"f79f73097410b602df3a98901e26ed37d07f1da95249cf0e3a62c811d4f7de3a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(717,310273,'insert','blocks','{"block_hash":"925266253df52bed8dc44148f22bbd85648840f83baee19a9c1ab0a4ce8003b6","block_index":310274,"block_time":310274000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(718,310274,'parse','blocks','{"block_index":310274,"ledger_hash":"ece29ec2cd160d7634009f41cc2d0f13330d53ec6971c019d69dfa4367f86646","messages_hash":"4daa321a8062e35b68c85d63c6c71cba86af28cad34ce1ae7a4a971f34addfcf","txlist_hash":"bf01b445bc208b9efcb314f1cfa1ea4300fc152ad46a973044abf56dc74e9c62"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(719,310274,'insert','blocks','{"block_hash":"85adc228e31fb99c910e291e36e3c6eafdfd7dcaebf5609a6e017269a6c705c9","block_index":310275,"block_time":310275000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(720,310275,'parse','blocks','{"block_index":310275,"ledger_hash":"23738d6d8dbf8b44b481f6c0eade991987c84e8025fe1f484c7acd3ead7f4163","messages_hash":"3e156c57def9f6dcf24682ed855311663d61079a0422522c3b660d80a4e88430","txlist_hash":"c0f70c46688ecb9eccaa94bdcbb3fc54eaf3af76cc450b62dfd7a9513bbbd50f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(721,310275,'insert','blocks','{"block_hash":"ba172f268e6d1a966075623814c8403796b4eab22ef9885345c7b59ab973cc77","block_index":310276,"block_time":310276000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(722,310276,'parse','blocks','{"block_index":310276,"ledger_hash":"a241e1cb19bfbebb3bbb09c6471760b8379ddc73a67d69b4d84fd1d21dfb7034","messages_hash":"f42264c5306769fc6bd1bd6f1955900113ec16b625e06d62ff3001b2e6b69707","txlist_hash":"99d32cb4d9b52ec0726c907330b2a60d7cf8380c8012f804cf8838bee1b0ecec"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(723,310276,'insert','blocks','{"block_hash":"c74bd3d505a05204eb020119b72a291a2684f5a849682632e4f24b73e9524f93","block_index":310277,"block_time":310277000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(724,310277,'parse','blocks','{"block_index":310277,"ledger_hash":"0efa57fd462031a87831832a789ed7751aac5f6c19a23767555b3f7145d87532","messages_hash":"236d34af3aa5893e9aecc8fb65c1efedc4f4e38874a2b20b933c973da4b4691e","txlist_hash":"08e71c5246f1225a02a00c8b52bb7a92c6937da9c9659129a5dcd2981069bbb3"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(725,310277,'insert','blocks','{"block_hash":"7945512bca68961325e5e1054df4d02ee87a0bc60ac4e1306be3d95479bada05","block_index":310278,"block_time":310278000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(726,310278,'parse','blocks','{"block_index":310278,"ledger_hash":"0045189a4da126b22e91e4bc2a7ac37dc90ec0869b7fcbc927919fca4cce5259","messages_hash":"a70fb335be86478d6730dbcbcc8d738e5e3f55608f445b5a033f9f5800951167","txlist_hash":"6e3580c7af675e8fdd1c5366a7af2e387f8d8d9192589794883a28ad2ce6a499"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(727,310278,'insert','blocks','{"block_hash":"1a9417f9adc7551b82a8c9e1e79c0639476ed9329e0233e7f0d6499618d04b4f","block_index":310279,"block_time":310279000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(728,310279,'parse','blocks','{"block_index":310279,"ledger_hash":"442b7d4dee025b81c298ca0f6a5b9dbdf17ed0087fc36eab7f0671d5a19c9a2c","messages_hash":"7244980c44845ce8bd26268b39a1204f014f6c18f968f57dd2e765193b71dcb2","txlist_hash":"04f51f4c3de467be5cfb32cccba5cd482eb14657d7f67a60820204fa22afaa41"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(729,310279,'insert','blocks','{"block_hash":"bf2195835108e32903e4b57c8dd7e25b4d15dd96b4b000d3dbb62f609f800142","block_index":310280,"block_time":310280000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(730,310280,'parse','blocks','{"block_index":310280,"ledger_hash":"38d7f98ae9cfb8e3938032dc33899e2e3e5a88e9037571cdddf8ed4709fc8225","messages_hash":"0b2884e47006914acf505e50ea5272ffeef43e2a646cf0b1c57afc47bf943c5d","txlist_hash":"d25ed55e962a45fbade2012c35ef507dd76fa0c67553343bb6568569bf1c08ca"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(731,310280,'insert','blocks','{"block_hash":"4499b9f7e17fc1ecc7dc54c0c77e57f3dc2c9ea55593361acbea0e456be8830f","block_index":310281,"block_time":310281000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(732,310281,'parse','blocks','{"block_index":310281,"ledger_hash":"51237cee3b85f1636e336259b115fad87acc830c71e13ca79e344efb7c308ecc","messages_hash":"ff50d8f5f8dcce283b687ce2aff46b5b1250eb43a11bb5996164444879dffb31","txlist_hash":"77eb5540b9f1e2f80cd3cb8572ee80bc112391e0236b560749aaf9952fb6705b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(733,310281,'insert','blocks','{"block_hash":"51a29336aa32e5b121b40d4eba0beb0fd337c9f622dacb50372990e5f5134e6f","block_index":310282,"block_time":310282000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(734,310282,'parse','blocks','{"block_index":310282,"ledger_hash":"73adccef91b5c738e8810d4781a38edf98d2aa0a8cb619d575e9bdeda979f1fb","messages_hash":"02e7b49dd579b3355aa9063b38bec6e6e749b3cb5882483d3b15886e176f0610","txlist_hash":"889f3e1047c8ca362c1ce4749d1c7ad167dab1e5f85e509d114b1ba1bac8f240"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(735,310282,'insert','blocks','{"block_hash":"df8565428e67e93a62147b440477386758da778364deb9fd0c81496e0321cf49","block_index":310283,"block_time":310283000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(736,310283,'parse','blocks','{"block_index":310283,"ledger_hash":"5853e60a1b79d4f154cc1f3dc8b0a4d6130ac07784bac16f257f92b9ef294144","messages_hash":"25008bffd8cec7dc2c3ae13ac7c9e868129e3b9203911aa0fa3db14f5fc89a9b","txlist_hash":"1ce62f0a42cb7ecd8c35436253e8234b83e81ba5abc757965b5041400139eee2"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(737,310283,'insert','blocks','{"block_hash":"f9d05d83d3fa7bb3f3c79b8c554301d20f12fbb953f82616ac4aad6e6cc0abe7","block_index":310284,"block_time":310284000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(738,310284,'parse','blocks','{"block_index":310284,"ledger_hash":"ce33194cb67aa0a5facd788cc24706ef249bcecc95a9965f91065146b33e464b","messages_hash":"4bb8f22e461d70d953ff1b9f0ced8b1cb143ab1b8dc38bd3a1fe3fc803ccd40a","txlist_hash":"c354cfcb046ca331ae57c00f64b56defd034278e5616ef7d1f3e559dc538bf0a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(739,310284,'insert','blocks','{"block_hash":"8cef48dbc69cd0a07a5acd4f4190aa199ebce996c47e24ecc44f17de5e3c285a","block_index":310285,"block_time":310285000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(740,310285,'parse','blocks','{"block_index":310285,"ledger_hash":"3af35e85e98aebe1a9c778570c730bf80e085a08ca707c1a5d44b50f2579e71c","messages_hash":"509ae7a1014f0442bec8eb032d144c64dc8a11e6970d0e32a5ecc4d41fe68760","txlist_hash":"35e84bd8780b8efbdc3207b9fef22e12ff71798477971a50088b9c8def3c77ed"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(741,310285,'insert','blocks','{"block_hash":"d4e01fb028cc6f37497f2231ebf6c00125b12e5353e65bdbf5b2ce40691d47d0","block_index":310286,"block_time":310286000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(742,310286,'parse','blocks','{"block_index":310286,"ledger_hash":"4b09b627adda46ee7cf7116102a330ba2aa1ce714b2fa133f7952af34a52ede9","messages_hash":"a7bcd9f0ef4a4deb4603c21e799e2c9418c9a085af6aee86082d3c79a7b4d880","txlist_hash":"5a868b89444476076be22e42526c4462c5b865012d9970b917376c5342750311"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(743,310286,'insert','blocks','{"block_hash":"a78514aa15a5096e4d4af3755e090390727cfa628168f1d35e8ac1d179fb51f4","block_index":310287,"block_time":310287000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(744,310287,'parse','blocks','{"block_index":310287,"ledger_hash":"67786e4ffab15cb78c7bb44ef160d1e5d99b599eecb5ff4f906a6599d744d410","messages_hash":"a0940fad3e49fdf8668dcb4c9d773e1a5eca6fd5ef23fcdf4be0ccd1cbbfe405","txlist_hash":"791a49e50583660824bb3ec141a54951c2fd737ed963b1e65b653c22a4fc4a84"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(745,310287,'insert','blocks','{"block_hash":"2a5c5b3406a944a9ae2615f97064de9af5da07b0258d58c1d6949e95501249e7","block_index":310288,"block_time":310288000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(746,310288,'parse','blocks','{"block_index":310288,"ledger_hash":"600716d2696160b3ba290636180f2afa24bf8d24435022b4539a4cc965c18dfc","messages_hash":"4dd23e9dbda9e5647e194648a2be3ef8597c5f9c4c0e5c58448d4195599de8c8","txlist_hash":"3a1e3da301643f22a9b2719922a4621879b2c2d8b790e646f135bc3b5d165e65"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(747,310288,'insert','blocks','{"block_hash":"dda3dc28762969f5b068768d52ddf73f04674ffeddb1cc4f6a684961ecca8f75","block_index":310289,"block_time":310289000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(748,310289,'parse','blocks','{"block_index":310289,"ledger_hash":"cd6d4b17759152edbf25fd72dce9b9126ea31a2bb1a5435636801e0ee4be1158","messages_hash":"b406c7ad8001546298d16bfa1f0e77b3396787dc2324be51ce33e9cae0c6fd5a","txlist_hash":"26aeba5ab63445ebd419a02915a835d8d6a0bc25bac49dd799e356325687c8f8"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(749,310289,'insert','blocks','{"block_hash":"fe962fe98ce9f3ee1ed1e71dbffce93735d8004e7a9b95804fb456f18501a370","block_index":310290,"block_time":310290000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(750,310290,'parse','blocks','{"block_index":310290,"ledger_hash":"04a9135f416dc041d3c1c0216a84fd780d133213c3369691fbf5e8848af9d14f","messages_hash":"dcb7aa5f99cbb70b4d70bf3a360be2c4a5756261a8792856828a6cc1f282a644","txlist_hash":"74c57c7e7db040f0974be44dae944c978ed2ddb01390d616c9bfaa6816ed198e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(751,310290,'insert','blocks','{"block_hash":"1eeb72097fd0bce4c2377160926b25bf8166dfd6e99402570bf506e153e25aa2","block_index":310291,"block_time":310291000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(752,310291,'parse','blocks','{"block_index":310291,"ledger_hash":"50f556e01b9e8c135b20187bf863839e651a0d0bf4cfd1008b446531776f7917","messages_hash":"0b50391ad17533ea1807be4941305ee75a013a8a5330139e36818f60a9f7d8ef","txlist_hash":"13ede25257044f3bd98c6905c216bed45b0d054951d2c5e86a3cf4707699a279"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(753,310291,'insert','blocks','{"block_hash":"9c87d12effe7e07dcaf3f71074c0a4f9f8a23c2ed49bf2634dc83e286ba3131d","block_index":310292,"block_time":310292000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(754,310292,'parse','blocks','{"block_index":310292,"ledger_hash":"9d4bf4b1c5dba1132a9cbfd78c1d94cbaf15d7648da80c8bc1a8dce12a79eac0","messages_hash":"24b3947f5fbed58b6a9c47ab51ef2e654114be20f84935eaa908c9544e275514","txlist_hash":"1b761ed985b1e55c95598c5c0f37df4a1e06dfd26c17792b1020cf0d28fa9a56"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(755,310292,'insert','blocks','{"block_hash":"bc18127444c7aebf0cdc5d9d30a3108b25dd3f29bf28d904176c986fa5433712","block_index":310293,"block_time":310293000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(756,310293,'parse','blocks','{"block_index":310293,"ledger_hash":"a51a3f9af39175cc9d142eff67811307ad8f51cdd8161aaf0d98af9e2be28efa","messages_hash":"1db78c9abe493106e75d3629d221d046e1d6194e44df8f882be38b521d33ab53","txlist_hash":"2fd7a38fbb17d7b0eec35f2f03a28c4aee7f579d7f42e3ab124cf5eca07869eb"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(757,310293,'insert','blocks','{"block_hash":"4d6ee08b06c8a11b88877b941282dc679e83712880591213fb51c2bf1838cd4d","block_index":310294,"block_time":310294000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(758,310294,'parse','blocks','{"block_index":310294,"ledger_hash":"3e9858caa8e835295aa7e78505ea34ce0726e3f5f6cf9fbc6dc4393a28724a25","messages_hash":"b6d94000a7b7dc674d610bf89faf7c0d43bdc3e8f391f6089ded1557f7f0f286","txlist_hash":"36566c7c396ecf454c6fa6d3b27dd7ad2c138a85edd74672f2e7d9791e77f0b6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(759,310294,'insert','blocks','{"block_hash":"66b8b169b98858de4ceefcb4cbf3a89383e72180a86aeb2694d4f3467a654a53","block_index":310295,"block_time":310295000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(760,310295,'parse','blocks','{"block_index":310295,"ledger_hash":"bf48715799c46d629641ba5b72405f6e6cf0500886da94fcc6fddd306a86b02a","messages_hash":"cc57c30a8b34a715c886a444cedd81ccf2c8be145642f2df64d376d0acf1e1f3","txlist_hash":"2d6b79733125c81413a3e70acf597a11e986893264588da74e9b8a0d5d46e1da"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(761,310295,'insert','blocks','{"block_hash":"75ceb8b7377c650147612384601cf512e27db7b70503d816b392b941531b5916","block_index":310296,"block_time":310296000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(762,310296,'parse','blocks','{"block_index":310296,"ledger_hash":"08e2361ae4b98387ee43fd7230ea8b296dee677b337f0e211527e3cf29a64e9b","messages_hash":"b77e2a71e0857e990c1cfbb021c0a04fb17b64ec9ba48c60d49e3dd8ecc6b0ac","txlist_hash":"517c81a10cc4219c38e3f947dd862f6983a4a2eb22459dba31f1a656bdf4eeff"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(763,310296,'insert','blocks','{"block_hash":"d8ccb0c27b1ee885d882ab6314a294b2fb13068b877e35539a51caa46171b650","block_index":310297,"block_time":310297000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(764,310297,'parse','blocks','{"block_index":310297,"ledger_hash":"cfefc3138983a33686dd1fc37f06fa1d7e01d9b218f7242cdd59005633c0ded8","messages_hash":"edcb77f23eb738d688c1ea5732a945d76279766c4a1ee1effd190bf3f726c05b","txlist_hash":"85ae0c384a76e7c93b29204df759293f7a488fc71edf6b4abaea1944fa3a85d7"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(765,310297,'insert','blocks','{"block_hash":"8ca08f7c45e9de5dfc053183c3ee5fadfb1a85c9e5ca2570e2480ef05175547a","block_index":310298,"block_time":310298000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(766,310298,'parse','blocks','{"block_index":310298,"ledger_hash":"25254257d6f6724161b2b73f94d28d3fd40594b4846699b8a2d5f45d205b1fec","messages_hash":"5dc738e17243a84b37564b261267924bce9c6cce7595c74d8808f0cf03432a89","txlist_hash":"0633d67a69ae2c0ea1e7d3c349cfe1f3b753e387446787987c50782ee4601b68"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(767,310298,'insert','blocks','{"block_hash":"a1cdac6a49a5b71bf5802df800a97310bbf964d53e6464563e5490a0b6fef5e9","block_index":310299,"block_time":310299000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(768,310299,'parse','blocks','{"block_index":310299,"ledger_hash":"756acb1055ec75df8fa70f80e23d75f2b47e75035bfd68802e68308785a2ee14","messages_hash":"f3c6ab9d0253858a08da5dfe893c8266a32c796eb2e4a6c4f64ebd4263f9250d","txlist_hash":"299d47f0c18c1629003069df0afd0bb877b45f06b5609ec171c7b87ae65a0be0"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(769,310299,'insert','blocks','{"block_hash":"395b0b4d289c02416af743d28fb7516486dea87844309ebef2663dc21b76dcb2","block_index":310300,"block_time":310300000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(770,310300,'parse','blocks','{"block_index":310300,"ledger_hash":"e30027ca81176dc1e79a0ab3a5afbb839a3338dbe9ea6057aebcd383ed884c1d","messages_hash":"40541eb5a9dfd5c5a299a13aac804fb1b87e790891c55b66e9b36b1838dc8dfd","txlist_hash":"8338432f3d159dd15129a269d1cf3866cc7cda8c3845ab349ee6cc240ecd7020"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(771,310300,'insert','blocks','{"block_hash":"52f13163068f40428b55ccb8496653d0e63e3217ce1dbea8deda8407b7810e8a","block_index":310301,"block_time":310301000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(772,310301,'parse','blocks','{"block_index":310301,"ledger_hash":"4c2bcffc796af76a2607a978289942241e63a6387e0a2ae8fc3d02c6b5519fb0","messages_hash":"7273cf6a0294acc31eea0e0a9af603500f59a9f115b3c5acd5cca992f185f061","txlist_hash":"676af2de3d30fc26112e65d493b9c2401f93822c8e414cc5e7231e60b728e6e0"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(773,310301,'insert','blocks','{"block_hash":"ca03ebc1453dbb1b52c8cc1bc6b343d76ef4c1eaac321a0837c6028384b8d5aa","block_index":310302,"block_time":310302000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(774,310302,'parse','blocks','{"block_index":310302,"ledger_hash":"a39fdd7f84d2f6e29b613a8a724bc0902d9abd2d6b4d2f46c3b0512928d69b3f","messages_hash":"b26574ea33e8a4ca0bd958b82248a9fc9fdfe403aa717a9e0ef31474bcc32e58","txlist_hash":"ef3dfc32bc5b72ec279a0229af8bf6548bfb5bf4ed717e3e81ccb7710f802021"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(775,310302,'insert','blocks','{"block_hash":"d4e6600c553f0f1e3c3af36dd9573352a25033920d7b1e9912e7daae3058dcca","block_index":310303,"block_time":310303000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(776,310303,'parse','blocks','{"block_index":310303,"ledger_hash":"23f307ef560a02210f4aae5fe605c6d8af9317ab17f1e1ef0944038a3515da49","messages_hash":"8076e1b2af994482a8868a28ad8b5d41a5fbe2ccb349d65404e7c0dc59c6dd2e","txlist_hash":"d1c0461baeac24d356af8ba5283753c778f8ab0fa222c51b753758268f1e7fa4"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(777,310303,'insert','blocks','{"block_hash":"b698b0c6cb64ca397b3616ce0c4297ca94b20a5332dcc2e2b85d43f5b69a4f1c","block_index":310304,"block_time":310304000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(778,310304,'parse','blocks','{"block_index":310304,"ledger_hash":"6baa2ac646d3725fa01111959753844d22181cbbd1801cb12c4208be3709a3a3","messages_hash":"3862df7b71134b605229146563a78a5ca695a37c4d6da4b65d21876129c80f1b","txlist_hash":"96ea912eae3265566ab229e5d5a25354c0713471d73d866b9a09c9b2954d53e5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(779,310304,'insert','blocks','{"block_hash":"cfba0521675f1e08aef4ecdbc2848fe031e47f8b41014bcd4b5934c1aa483c5b","block_index":310305,"block_time":310305000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(780,310305,'parse','blocks','{"block_index":310305,"ledger_hash":"c366fd009860a090c632131eae9380820e512009bbbaa6f7bc5529afab7a88c1","messages_hash":"3b6505bd17f14fef0f06cf95c6bd3d3d759479674824f738b1c7fecc151b9b44","txlist_hash":"35584be5484303aa263d746735209b04d92a6baa6045e2d684496ff5dabe59ef"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(781,310305,'insert','blocks','{"block_hash":"a88a07c577a6f2f137f686036411a866cae27ff8af4e1dfb8290606780ec722a","block_index":310306,"block_time":310306000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(782,310306,'parse','blocks','{"block_index":310306,"ledger_hash":"fd12969b828d689063b4885a0356fc17e5207794d1f5b6a17bdeb8d584815a79","messages_hash":"c052edd088e829c9ac4ae5ca349da7067bfd5dcb8dfec11c4ec1a635d3c8c9e0","txlist_hash":"df65a3a9f318fd30166869a3d5d6eabb9c84399f15a7a50f39422a05ff851997"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(783,310306,'insert','blocks','{"block_hash":"bc5ccf771903eb94e336daf54b134459e1f9dd4465dec9eaa66a8ee0e76d426c","block_index":310307,"block_time":310307000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(784,310307,'parse','blocks','{"block_index":310307,"ledger_hash":"e168094d31f56d36e4c3863fe719e6064b08ccc6f3c2adb490b1359360026aee","messages_hash":"3bd3565fc83516439eab9db5ac6d85d8763d16c16bff122cc6e70b5c48246030","txlist_hash":"272ae60ff5120848055f08303e13a982fc66959f3e3b72f7d7461c7f91252944"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(785,310307,'insert','blocks','{"block_hash":"2291ffd9650760ff861660a70403252d078c677bb037a38e9d4a506b10ee2a30","block_index":310308,"block_time":310308000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(786,310308,'parse','blocks','{"block_index":310308,"ledger_hash":"523b3bba7b02e2c4e588f21ed14b7b4f6630f887cc89f9361487b581d7e633b5","messages_hash":"4b488ffd95c4d443b431c66d9d4442621cfcb3831e920f8f1d291501e2d3eba9","txlist_hash":"30df282ad2859208c35204fe5e2d395734e041bd9644b8b8626678fdd64058c1"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(787,310308,'insert','blocks','{"block_hash":"ca3ca8819aa3e5fc4238d80e5f06f74ca0c0980adbbf5e2be0076243e7731737","block_index":310309,"block_time":310309000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(788,310309,'parse','blocks','{"block_index":310309,"ledger_hash":"effe1a68917014086da3bf8696f6c13f3cf2cb5cbd6c18b80ed622e476cff017","messages_hash":"5b336477cd043069fc94aaa9efeec573f8ea2f1915382602469f2ab6bed6d717","txlist_hash":"197a65735f9d06d433abdd01f29f44ec697ba537ead9107ebe9cd889393a053c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(789,310309,'insert','blocks','{"block_hash":"07cd7252e3e172168e33a1265b396c3708ae43b761d02448add81e476b1bcb2c","block_index":310310,"block_time":310310000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(790,310310,'parse','blocks','{"block_index":310310,"ledger_hash":"968fb8a7409531a27ffb52af484e7c1076f05b58f9a51bf9cf3d5a7d83b12002","messages_hash":"d4b6b0de6209af38f0a99ee7cc1e629039233cba66bbd546aa874c9b5ec949fd","txlist_hash":"b9b9eef5f4c1720522286ce5f6375613c267684ac330210ab664e29219065cc0"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(791,310310,'insert','blocks','{"block_hash":"2842937eabfdd890e3f233d11c030bed6144b884d3a9029cd2252126221caf36","block_index":310311,"block_time":310311000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(792,310311,'parse','blocks','{"block_index":310311,"ledger_hash":"8c69639a757d0195594fa1da3f6b35a0e8c62b8df7f95db81e26d496b8c9dd72","messages_hash":"9f34557e605c362c267d01a10c0e1230b96311675cf37ac22fefef3e348f90e6","txlist_hash":"86b9b4356e26ab703e29060a4ff1be0c5cad328b2490d983eae10c24369a1649"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(793,310311,'insert','blocks','{"block_hash":"8168511cdfdc0018672bf22f3c6808af709430dd0757609abe10fcd0c3aabfd7","block_index":310312,"block_time":310312000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(794,310312,'parse','blocks','{"block_index":310312,"ledger_hash":"8d839bac01b9aae5e554f691ae0ee42cee072f9367fcc2811d4b3f65640cfcad","messages_hash":"06ab0afed2be45271b993ebf500b3fca4df8e920441577bcb1842206129b58f2","txlist_hash":"802b3d153e101c2772b1c96c851efab754f77fd3fd7eb59848d510f8994a9d86"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(795,310312,'insert','blocks','{"block_hash":"7c1b734c019c4f3e27e8d5cbee28e64aa6c66bb041d2a450e03537e3fac8e7e5","block_index":310313,"block_time":310313000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(796,310313,'parse','blocks','{"block_index":310313,"ledger_hash":"1377f4255bfd7ff6638734733a4b8faec97fd62aeb954e42b477c875ccc50b73","messages_hash":"471dc3888257e83dc49fb7acb75a3d327ccfc572fa4c2a597f68e97ced7b706c","txlist_hash":"e96392425727ab5eb4e16a61aef7d28cd0826ad7bc1d8266b3c187bb22bb5d51"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(797,310313,'insert','blocks','{"block_hash":"1ce78314eee22e87ccae74ff129b1803115a953426a5b807f2c55fb10fb63dc8","block_index":310314,"block_time":310314000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(798,310314,'parse','blocks','{"block_index":310314,"ledger_hash":"8ed80d44f0d6ad01a30611d94b91f735ef3a166cf0dfa7531492a3e4ac7c29f1","messages_hash":"d0edc182ab52e7db475d67edfa4b8d9b4d4bfaa79351ab7c7d0a93cc1e63e465","txlist_hash":"17d9134674657a9958c43efaea302df438762233e7e5d57811b71378e3d62695"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(799,310314,'insert','blocks','{"block_hash":"bd356b1bce263f7933fb4b64cf8298d2f085ca1480975d6346a8f5dab0db72cb","block_index":310315,"block_time":310315000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(800,310315,'parse','blocks','{"block_index":310315,"ledger_hash":"24b5905cf0d5349b7031870af9677916892e3292fa61455a75e84c1605a398ba","messages_hash":"f96452fa9d526175036d137afc49a849f0839c4338d29815ee3eac02e3df6f91","txlist_hash":"d8bad5e8a6ab63c8e0394c200e6b90cb2a1feabe3f58dc0faaaab59bb0b82654"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(801,310315,'insert','blocks','{"block_hash":"ea9e5e747996c8d8741877afdcf296413126e2b45c693f3abdb602a5dae3fa44","block_index":310316,"block_time":310316000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(802,310316,'parse','blocks','{"block_index":310316,"ledger_hash":"a191657253ca159739403f35417ef74637b053db49c7db62465fde4c54e69239","messages_hash":"cf505f0c309fbaecae7d9e525557f8d1501a3a08d66bb8a7abc8d2a8db721add","txlist_hash":"daf2edaf9fb8e7f718f56cff9e570869297ce6bd350794501b05e02a541e1c84"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(803,310316,'insert','blocks','{"block_hash":"aa8a533edd243f1484917951e45f0b7681446747cebcc54d43c78eda68134d63","block_index":310317,"block_time":310317000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(804,310317,'parse','blocks','{"block_index":310317,"ledger_hash":"bf6d880b9fa42b0e38523c00c92a898093afd068450be504a0a56bafd69ed647","messages_hash":"af696ec589d2b95f36e16039d388a57c38eafee5f3de5596a97f3c823c77f892","txlist_hash":"740737c2cd6ffb9a5e89e2ae0d34afe5f0bb48d120ae482802b76d07100b6153"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(805,310317,'insert','blocks','{"block_hash":"c1be6c211fbad07a10b96ac7e6850a90c43ba2a38e05d53225d913cc2cf60b03","block_index":310318,"block_time":310318000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(806,310318,'parse','blocks','{"block_index":310318,"ledger_hash":"6422eb2cab5937adb9ca2194c025d0dce63cd62e18d7ebd63220207957c942ee","messages_hash":"ff573059e90f4aade75d1f2d950dcf046ef2c1217b589d0bf2fc9c38c6c42012","txlist_hash":"3cb46a2e5b1a3ef3dd37dbe0cc429962982812eb9c7f87b5282a77a4a7f6185c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(807,310318,'insert','blocks','{"block_hash":"f7fc6204a576c37295d0c65aac3d8202db94b6a4fa879fff63510d470dcefa71","block_index":310319,"block_time":310319000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(808,310319,'parse','blocks','{"block_index":310319,"ledger_hash":"efb625496aa4365f5ac198a82833c880a60cd5f86d04689463216619cd7d96b8","messages_hash":"73a44e99dcb39be095771e34c74ee4b6a7a0819207807821d621545ca4b6a91f","txlist_hash":"ed69cef0ba9e4a9371deca76209629cc988257493a69006504b96a99b3da4222"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(809,310319,'insert','blocks','{"block_hash":"fd34ebe6ba298ba423d860a62c566c05372521438150e8341c430116824e7e0b","block_index":310320,"block_time":310320000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(810,310320,'parse','blocks','{"block_index":310320,"ledger_hash":"8c3938d7b3c0a822ebee67f1ecf21b1db6496e19471cf1f2cd00f30325d0c88a","messages_hash":"3abdeb2a4902cacc07440c8f176576963d48190c3e66bce2ccd97cc15d79f752","txlist_hash":"b87169ed018fdc8251d14b58f8d0e09001e45ab5dd76eb2408ab625d34ec584b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(811,310320,'insert','blocks','{"block_hash":"f74be89e9ceb0779f3c7f97c34fb97cd7c51942244cbc2018d17a3f423dd3ae5","block_index":310321,"block_time":310321000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(812,310321,'parse','blocks','{"block_index":310321,"ledger_hash":"21e4c3a7afd02f183cbb69709fc6c006ab3d38fef3466de1a1870232d1c891bd","messages_hash":"0d0c1c139a2f9304f5111dab26862dd88c97f061ee9ec716cfdfa8f101cf9f2a","txlist_hash":"77ef24833ac345e51eeb48fa9adbb111e31ffa3739298ce12a18d2f581c9a79a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(813,310321,'insert','blocks','{"block_hash":"ce0b1afb355e6fd897e74b556a9441f202e3f2b524d1d88bc54e18f860b57668","block_index":310322,"block_time":310322000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(814,310322,'parse','blocks','{"block_index":310322,"ledger_hash":"01b3b28c4d8eb796827267c06e6362206884e44f40c3f72d9b5c9d1e6cdfb29a","messages_hash":"a803ff9c9a83a885463f0f41b774b09c5dad9ef8827579499cd94cc6ff218858","txlist_hash":"3833d915749baf7aa33484d7a6b6b28e4acf0d78ee0f1b4e8ab44b22d756a3e3"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(815,310322,'insert','blocks','{"block_hash":"df82040c0cbd905e7991a88786090b93606168a7248c8b099d6b9c166c7e80fd","block_index":310323,"block_time":310323000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(816,310323,'parse','blocks','{"block_index":310323,"ledger_hash":"a362da58df0d31eeaa93a25c91c17bec62f9cad6ff0c31420584ce293ecafdbc","messages_hash":"fe10c5d1f27a192d9c72377818077b94ff7fee46c54b8bc52cbbca50743ccb56","txlist_hash":"2d41c7286053cb2256526ce42c03ab1288dfa066720e9ae5e5dac4532d512de4"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(817,310323,'insert','blocks','{"block_hash":"367d0ac107cbc7f93857d79e6fa96d47b1c98f88b3fdda97c51f9163e2366826","block_index":310324,"block_time":310324000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(818,310324,'parse','blocks','{"block_index":310324,"ledger_hash":"d1b353ac97e000471c66df8ee04d7b0c25f7eead2414e5648cd2ef334881bad6","messages_hash":"c654695d92ff853e15ec8399c1e5fd6b552b8a2e4da3167f792e2325b21fefa0","txlist_hash":"051b158e05c22a326dd8becd27d142b52477b9209f369599db5c5e25484af157"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(819,310324,'insert','blocks','{"block_hash":"60d50997f57a876b2f9291e1ae19c776df95b2e46c14fe6574fb0e4ce8021eac","block_index":310325,"block_time":310325000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(820,310325,'parse','blocks','{"block_index":310325,"ledger_hash":"7734300dc764c67fde935dd4432396de4a31cedc2901f3fc70bf1576797cf7b0","messages_hash":"0d9072553790491007aa13b4d406831506f7f770f8ac7fea5ad42db6b6cd2b68","txlist_hash":"7671d8cfff3601fc44132a6d274c1ab1fb0b4fb712041d86eb28157667682251"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(821,310325,'insert','blocks','{"block_hash":"d6f210a1617e1a8eb819fc0e9ef06bd135e15ae65af407e7413f0901f5996573","block_index":310326,"block_time":310326000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(822,310326,'parse','blocks','{"block_index":310326,"ledger_hash":"ebe859a722587fd456695c6a46af7f0bf54c03e940bdbb5424520a8c1fe70617","messages_hash":"e0a3b19fce605701f1ce2ed25cde785ddef37c8ae11a1af97f32f89a9faef45b","txlist_hash":"72884e56565b442c37cbbc572fa762c7b7b3c549c396037393463be7afb089fa"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(823,310326,'insert','blocks','{"block_hash":"9fa4076881b482d234c2085a93526b057ead3c73a6e73c1ed1cdee1a59af8adc","block_index":310327,"block_time":310327000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(824,310327,'parse','blocks','{"block_index":310327,"ledger_hash":"8ced7a546ee2c746d4dc3f0ecd2fb4eaa62c65c4e98be74545d8de22c03526e6","messages_hash":"f2ce43aa9e6374f95a9c5d5b55de0396da45be6575dc5223742c2d70369bd00e","txlist_hash":"ccbabd4fc70b15ebb6f28afa6f96e4a1f0af08e6a3cdfb518ae008432b908739"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(825,310327,'insert','blocks','{"block_hash":"c7ffd388714d8d0fc77e92d05145e6845c72e6bfd32aeb61845515eca2fa2daf","block_index":310328,"block_time":310328000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(826,310328,'parse','blocks','{"block_index":310328,"ledger_hash":"bb5d3479e492f52a0b3b69d29852faefdff645f9b113eae82594f57e8aa40b5d","messages_hash":"cb79907543638b77555fac7568f2f744f22ce989dc0e7654fd49e132eb7666c8","txlist_hash":"42fa2df2e053f97e86881395e5d66de912e59bf73eb5be322ab170b06fabd344"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(827,310328,'insert','blocks','{"block_hash":"67fb2e77f8d77924c877a58c1af13e1e16b9df425340ed30e9816a9553fd5a30","block_index":310329,"block_time":310329000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(828,310329,'parse','blocks','{"block_index":310329,"ledger_hash":"4ad2c9d802db762537be19143ef5eca474cd9f749bbbc661cb95bcf1dcb0b02b","messages_hash":"02047850f93eb91d0d83851054da00ed66f6f6c0fea04d627866f6355be4273c","txlist_hash":"a5336a1818452ca9888d582bb5ad8182e00ec37723d42e6769b001069f96232a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(829,310329,'insert','blocks','{"block_hash":"b62c222ad5a41084eb4d779e36f635c922ff8fe275df41a9259f9a54b9adcc0c","block_index":310330,"block_time":310330000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(830,310330,'parse','blocks','{"block_index":310330,"ledger_hash":"4a9a6b59d56f6b7cf867095d939f9bddbf779141177feda470df3759b7d48be3","messages_hash":"3d6595616fc996c9fd880bc5b227a7e2d436bf27f6f06ab15cd456c4322fffb6","txlist_hash":"263932b9bd949d4b0557a7fcd5597a0c607c722b34e644f9795e4f08713a4436"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(831,310330,'insert','blocks','{"block_hash":"52fb4d803a141f02b12a603244801e2e555a2dffb13a76c93f9ce13f9cf9b21e","block_index":310331,"block_time":310331000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(832,310331,'parse','blocks','{"block_index":310331,"ledger_hash":"c676b9c31e0e3d74d005ad0a52a18ba34688b6002da5d269bcea0f789a4f8e91","messages_hash":"ba499b294c5cb3d50626ad04df807602e4f3fa955ca6b35795202f437182fd6b","txlist_hash":"646197318fca63f2c8068c0a119f122d02cfea4a5c95201d6cc2eada9ba276a6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(833,310331,'insert','blocks','{"block_hash":"201086b0aab856c8b9c7b57d40762e907746fea722dbed8efb518f4bfd0dfdf2","block_index":310332,"block_time":310332000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(834,310332,'parse','blocks','{"block_index":310332,"ledger_hash":"cf0b702c03ecff4bda1254dd5e96ca580b69d5d02d1f233725fccbe1f5f32000","messages_hash":"a57bfcc468c3f5d57b1b178ea7cc8c1af55f42867d0ba5d88d4e55b2bc79fe02","txlist_hash":"8197afee90f808a95bd5a3dbc9c41618e3a07a3039dc2e2539a94cb023e54a0b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(835,310332,'insert','blocks','{"block_hash":"b7476114e72d4a38d0bebb0b388444619c6f1b62f97b598fed2e1ec7cd08ee82","block_index":310333,"block_time":310333000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(836,310333,'parse','blocks','{"block_index":310333,"ledger_hash":"b40359eb197db65549946d93a39b2a732e0694d21b8d0138b9bfce4f5a87ae5b","messages_hash":"7694e14e12a15ab6aa8143f1e9fcaae46b1746f51398d79a4f6be6c3137d6c89","txlist_hash":"c8b269f3fb117e7ea3a9592a023787d886ffc388f91fd651618f807c017c9a67"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(837,310333,'insert','blocks','{"block_hash":"a39eb839c62b127287ea01dd087b2fc3ad59107ef012decae298e40c1dec52cd","block_index":310334,"block_time":310334000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(838,310334,'parse','blocks','{"block_index":310334,"ledger_hash":"7cb471ec146f9ec1e4d1b93184ea641f7b8088807dedcd1c0be4ca5ba99e80e1","messages_hash":"226e74766ac5ef3a15e7d38c05990871f92ef80cddf954d17759d2ad2ea59d02","txlist_hash":"24eb770852273754585985a5fed612de801663408db3703bb9771d5bcf518cb9"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(839,310334,'insert','blocks','{"block_hash":"23bd6092da66032357b13b95206e6527a8d22e6637a097d696d7a96c8858cc89","block_index":310335,"block_time":310335000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(840,310335,'parse','blocks','{"block_index":310335,"ledger_hash":"47de747ec20cbec96a6bc4b71f67ea827c7a5a1ab0d3541fd539efac7442d644","messages_hash":"fe3fa4d5ea7f9f18f6564a1857c7ce23e418e46aa5b63b3365d6cf73ab930e07","txlist_hash":"ba840a499b9de3ae457db93220ebb7bf61560f33660b8e7b980178325d114cec"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(841,310335,'insert','blocks','{"block_hash":"ec4b8d0968dbae28789be96ffa5a7e27c3846064683acd7c3eb86f1f0cc58199","block_index":310336,"block_time":310336000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(842,310336,'parse','blocks','{"block_index":310336,"ledger_hash":"c216588e623d2b3d03499c7e9f817106b20a8c98765979987633f1e4e50d9594","messages_hash":"1eff4c9279cff57e13e005fad48c92f7f5bd928e4b5a3d7eb102bfd0bccf353a","txlist_hash":"a6c20cca4d22fa5b8357fae640f1a90e3e656f9015eb5db289ef6da17b597f1c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(843,310336,'insert','blocks','{"block_hash":"055247d24ba9860eb2eadf9ec7ea966b86794a0e3727e6ffbcba0af38f2bc34a","block_index":310337,"block_time":310337000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(844,310337,'parse','blocks','{"block_index":310337,"ledger_hash":"a558b47328f54b79a5ad9f7737af0e4df07e13e20f150296370e111879c09c2e","messages_hash":"61eeadd7e8f4c94b41e9f3c67bad3ff29cc1d19f580114b3ca3c2a929596c036","txlist_hash":"15c9f81424d97e28fc5d40b9f74edee6bed3f68f8c81dcf572cbd786626ff353"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(845,310337,'insert','blocks','{"block_hash":"97944272a7e86b716c6587d0da0d2094b6f7e29714daa00fec8677205a049bcd","block_index":310338,"block_time":310338000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(846,310338,'parse','blocks','{"block_index":310338,"ledger_hash":"31bea50c6481fa982eace70df5fc13d2981f1af13962809e3492b493a0dd4905","messages_hash":"0b46e8c3b291dbc65e5a2ba99739bea530eeed734b7cbd0248c3b0ab06e3d817","txlist_hash":"ee8efb364c79aae62d48d0198d7ca348d71f312eaef01daf906fec89d2fe9166"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(847,310338,'insert','blocks','{"block_hash":"99d59ea38842e00c8ba156276582ff67c5fc8c3d3c6929246623d8f51239a052","block_index":310339,"block_time":310339000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(848,310339,'parse','blocks','{"block_index":310339,"ledger_hash":"6605ca3db3c509fbc8574f2e10a3f981e2ff17b2812946ec8f2b1e49ba44f220","messages_hash":"5771cf30f52a621216658854604973564d9a3a5b659986d3f5ab042a8a4a2674","txlist_hash":"af5e50fc6a529fb06423c8ad7beed13c6e1de1c3f746f53dcedb7af76e0d95ff"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(849,310339,'insert','blocks','{"block_hash":"f7a193f14949aaae1167aebf7a6814c44712d2b19f6bf802e72be5f97dd7f5a0","block_index":310340,"block_time":310340000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(850,310340,'parse','blocks','{"block_index":310340,"ledger_hash":"7db1ad1952cac2dda86fff6e5f939010bb30a1da26af438d354e17f423d5bf1f","messages_hash":"9b0c7bd03815d2708a3d6038b3783da0dd241e75b6de17402e89a05ec76e5222","txlist_hash":"f42c5c43148a61dace7d50127d905f236ad738774c20d4f874fc3b824b58cf92"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(851,310340,'insert','blocks','{"block_hash":"6c468431e0169b7df175afd661bc21a66f6b4353160f7a6c9df513a6b1788a7f","block_index":310341,"block_time":310341000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(852,310341,'parse','blocks','{"block_index":310341,"ledger_hash":"1a1eef01250d2c53a1b34a8ee5b1e8fce984c3d47d28c544c6e162493b51225b","messages_hash":"d0116b9fb089a2865d1425244075ef65425ce9e5f0f1b70fe7cf97e5ce6b8f47","txlist_hash":"5fcdf7ababadc89a26c3833bc8b819642466504b58323cded8cdb8a904239ce6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(853,310341,'insert','blocks','{"block_hash":"48669c2cb8e6bf2ca7f8e4846816d35396cbc88c349a8d1318ded0598a30edf7","block_index":310342,"block_time":310342000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(854,310342,'parse','blocks','{"block_index":310342,"ledger_hash":"3c85c0b825985b04b42137da7e59fb3daaaf9e65b871b79390a4d8b31be5da92","messages_hash":"2a6b0c1cd6ba6cb2fc95fa6fb0ce6369b7959d73680cfa1a09697626bb48f4bb","txlist_hash":"b165c708026f386ddc7206518e594fcef7b5782fa0db77db6ce5b02e3b563145"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(855,310342,'insert','blocks','{"block_hash":"41a1030c13ae11f5565e0045c73d15edc583a1ff6f3a8f5eac94ffcfaf759e11","block_index":310343,"block_time":310343000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(856,310343,'parse','blocks','{"block_index":310343,"ledger_hash":"26f4ea323dd31b715c7a7f4ab8f1feabb199333a8494449ed538ff13215bb3b2","messages_hash":"af3dd05b7f7751705f9bc0aaf099568289d0cc8a62b80cb8cf957b67ae9ccdc0","txlist_hash":"37808f9fb4ad766c671be7e9703aa7c7ea53991fa838400536d25f304ebe8090"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(857,310343,'insert','blocks','{"block_hash":"97b74842207c7cd27160b23d74d7deb603882e4e5e61e2899c96a39b079b3977","block_index":310344,"block_time":310344000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(858,310344,'parse','blocks','{"block_index":310344,"ledger_hash":"444314748cb1fa1c836b3b4de65c3920c7fe446741193e5f77843affe3bee908","messages_hash":"071a2af66f03d51498ea342dce8d818d4b2df9e2e5fb7ca9344988ae7676b0e7","txlist_hash":"52dd50744ce4773a3db8dcf016a392a133ff7ebbeaf293d4ecb4a32fcc575a19"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(859,310344,'insert','blocks','{"block_hash":"0bda7b13d1bc2ba4c3c72e0f27157067677595264d6430038f0b227118de8c65","block_index":310345,"block_time":310345000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(860,310345,'parse','blocks','{"block_index":310345,"ledger_hash":"d1775816bb104187076be74e78e87fc6d367c3cb31d372329aec2b635002ca2e","messages_hash":"54a59c638ed8ad1a8b9d72d0f9afef9616f7ee9c77b1cce9793ec14119c819dc","txlist_hash":"15f4f9eb55ff5d2b8efb40a57193f253470889b1fb2f532f02b66d236bc902bf"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(861,310345,'insert','blocks','{"block_hash":"0635503844de474dd694ecbcfb93e578268f77a80230a29986dfa7eeade15b16","block_index":310346,"block_time":310346000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(862,310346,'parse','blocks','{"block_index":310346,"ledger_hash":"3244eed1df8ec4ae0ddb04f9f6e59e54244ca3df10dc21fc89c99c74ba734781","messages_hash":"ed53197fade3b880a6bcd70a41112b83879f5a1b2733dcd044a152f6e06966a1","txlist_hash":"58faa47bcd277d0d52d39a46473882adc797797cf2c30967418fb4ae832dc21d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(863,310346,'insert','blocks','{"block_hash":"f3f6b7e7a27c8da4318f9f2f694f37aaa9255bbdad260cb46f319a4755a1a84d","block_index":310347,"block_time":310347000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(864,310347,'parse','blocks','{"block_index":310347,"ledger_hash":"6fd1802c269750b69ec04df457d47cd6b44c261340ebd5b4da61f06ede6aa166","messages_hash":"f9b1e1152ba3fd730692c61dc7b897b74290425148717cb0c7d26ddb2b066764","txlist_hash":"716162f3fea6641e6ac697eb11880c5b39903de4ab30fa24e899e363d5c1d9cd"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(865,310347,'insert','blocks','{"block_hash":"c912af0d57982701bcda4293ad1ff3456299fd9e4a1da939d8d94bcb86634412","block_index":310348,"block_time":310348000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(866,310348,'parse','blocks','{"block_index":310348,"ledger_hash":"668330e80a23f499c0e91b01c4c51aab393813b840f81b6b672611e391699faf","messages_hash":"95410fcf3fc291907a1969f9cdc8646a55fd0979f748332a10a298ed1914b4c7","txlist_hash":"8c169d593d4c922ef7d3f530f6de4da37c01716f19ea19b48b122a6135f3e293"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(867,310348,'insert','blocks','{"block_hash":"ca911c788add2e16726f4e194137f595823092482e48ff8dd3bdbe56c203523c","block_index":310349,"block_time":310349000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(868,310349,'parse','blocks','{"block_index":310349,"ledger_hash":"32b36035ac1684e93126657ecd9711feb689672f64cceb03d220a8089dfacf12","messages_hash":"650e904e246fbaccd362968543bd414fe4e03941d96f0a8c1c7d509fc260b738","txlist_hash":"8d54849ce08f65fd3dd06baf845e5a3132b84c960e6f316c4bbbbe5a3d2b7b01"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(869,310349,'insert','blocks','{"block_hash":"c20d54368c4e558c44e2fbaa0765d3aecc8c9f01d456e3ff219508b5d06bd69d","block_index":310350,"block_time":310350000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(870,310350,'parse','blocks','{"block_index":310350,"ledger_hash":"dbe70bf3b8e4b74ac25c1b6737b6a760e6a06a4f96ee83a5ca728c8501d4af05","messages_hash":"33bc524f9a329407e3509a4623d89f6d2c3e00616c4314b86bab1d1b802a4a6c","txlist_hash":"1e46f66542896fa2ff6048472d49feed3065a6fffaad639da03027b00ce377bf"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(871,310350,'insert','blocks','{"block_hash":"656bd69a59329dbea94b8b22cfdaaec8de9ab50204868f006494d78e7f88e26f","block_index":310351,"block_time":310351000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(872,310351,'parse','blocks','{"block_index":310351,"ledger_hash":"89bb7ea865a221a3646f78ea774a7cf1e15e8d65b85ddcfbdf87773145904151","messages_hash":"dbbc0a977c9bf6385e4652c94f97702965df6eae2863730b9930e7aafd8d6c84","txlist_hash":"f99c452388cd3d8aa59f7c75fa06770a116b5f69263dddbb7b5fdcffc7ffc524"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(873,310351,'insert','blocks','{"block_hash":"fb97d2f766a23acb9644fef833e0257fdb74546e50d9e2303cf88d2e82b71a50","block_index":310352,"block_time":310352000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(874,310352,'parse','blocks','{"block_index":310352,"ledger_hash":"fdbf27d576a72b046776be0e5c0a91d060619778aadef3df1d30f1a7785a0fdb","messages_hash":"b2a4a9c315f66980a2a3525b322adf6ff4a47e60649559bd2e7dffb68b58c29a","txlist_hash":"1d2f391bb7990954e14c69c9429b54b9f5a88791ec4b2fba2facb464152417f4"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(875,310352,'insert','blocks','{"block_hash":"2d3e451f189fc2f29704b1b09820278dd1eeb347fef11352d7a680c9aecc13b8","block_index":310353,"block_time":310353000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(876,310353,'parse','blocks','{"block_index":310353,"ledger_hash":"73429d323376209447edc6d2ddbfd51f0bcde21736ea6dad61dc96b6984a1fa1","messages_hash":"a73650310ecd6b53b89787e20449de8e844aa747b6211dcc0b33aa389b3a5d72","txlist_hash":"8ad1adee999dd851e81025b31920d1f0f66c1e56433e7b2b110d03cfccd7a141"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(877,310353,'insert','blocks','{"block_hash":"437d9635e1702247e0d9330347cc6e339e3678be89a760ba9bf79dd2cd8803e0","block_index":310354,"block_time":310354000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(878,310354,'parse','blocks','{"block_index":310354,"ledger_hash":"b2bbcbb6a7db94b2a5681c6e380ac13480bb49c29a3fbb3c7c1eb740f70f8324","messages_hash":"b31bc14fc3a9af3b1b3977100c36b1465781bdbe9390ff267afdc51d57caae39","txlist_hash":"8d6870632f2336908828a72e7445c9d8ecbec3d420b234dad2b17ae06c0a709c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(879,310354,'insert','blocks','{"block_hash":"ea80897a4f9167bfc775e4e43840d9ea6f839f3571c7ab4433f1e082f4bbe37d","block_index":310355,"block_time":310355000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(880,310355,'parse','blocks','{"block_index":310355,"ledger_hash":"ccbd3ea41587c3c1d92f355979b49c5340a0a90060f07c228c22d6ff76b25579","messages_hash":"f1f4e9f44d7cec303a3ff0e9014c66741e8463d2e1e2644edff38a7a06ae19d3","txlist_hash":"8dfb02eb42bf84a085d150a0dc3fb2effa201594da47639e8f77fea0a7084eea"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(881,310355,'insert','blocks','{"block_hash":"68088305f7eba74c1d50458e5e5ca5a849f0b4a4e9935709d8ee56877b1b55c4","block_index":310356,"block_time":310356000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(882,310356,'parse','blocks','{"block_index":310356,"ledger_hash":"06a95d39e110e40ba318320d50984096cbec88c680f426f721154555efc2561f","messages_hash":"cc0cc378fba640609764042b3a71687c5ea7085f9fd3528fc22cb4a0f33c535a","txlist_hash":"3516c2e9b180883b3526ee0a028c6d22b2a8a028b896423eb71db31cc284d566"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(883,310356,'insert','blocks','{"block_hash":"4572f7f4ad467ef78212e9e08fa2ce3f01f2acc28c0b8ca9d1479380726bab1f","block_index":310357,"block_time":310357000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(884,310357,'parse','blocks','{"block_index":310357,"ledger_hash":"443f947352e853367d1c10d25771c7d78eec22fac19c5bace6f96b8f949e264b","messages_hash":"1a17b268e299c081550e6b708d3a67c8e9e5da464a248c07bd7ff2d37521aaf6","txlist_hash":"af4dd2cd8426ceb8c7dacc24b30d4d48e1152340a5a81f32b745878558969f4a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(885,310357,'insert','blocks','{"block_hash":"d5eae5513f1264d00d8c83fe9271e984774526d89b03ecd78d62d4d95ec1dea6","block_index":310358,"block_time":310358000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(886,310358,'parse','blocks','{"block_index":310358,"ledger_hash":"c2cd71dc9e7d5ccb5d5e9d6b55c47010c9db6a573d01820da1c8960970fd571f","messages_hash":"8994641c9faf9510eb6dc0cafb53c9ddd941fb6c7f628361bc30a57b70d1c635","txlist_hash":"635f90dc6b705e3e5928101d6ffc32a247088fd8965e0e372358b35ba822df31"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(887,310358,'insert','blocks','{"block_hash":"4fa301160e7e0be18a33065475b1511e859475f390133857a803de0692a9b74f","block_index":310359,"block_time":310359000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(888,310359,'parse','blocks','{"block_index":310359,"ledger_hash":"5b7646bafc6b11eb1554ea1e02221883043b435ae973c3678505fa2128aadfb7","messages_hash":"f65b2c8ae6adc575a288d4f042f90176bd007350206178e62c024584d6ed287c","txlist_hash":"eeec8a86b03a3973bdf5215e1789277ab7aa4c47f4e9f05a44a312c01e0ccf0d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(889,310359,'insert','blocks','{"block_hash":"cc852c3c20dbb58466f9a3c9f6df59ef1c3584f849272e100823a95b7a3c79f0","block_index":310360,"block_time":310360000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(890,310360,'parse','blocks','{"block_index":310360,"ledger_hash":"b0e937568a47c244e3b29cfb3a5e7196c171acc1565c44020345c715b7774658","messages_hash":"0f246fe11fc2b9fc1d2b8f7517473f6a7eb91915d765779783e7898a8bd3d5bc","txlist_hash":"32f4991609b3d8cbddbee2fe5e7aff49e7d4f5334ba0d283893733f19d3f448b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(891,310360,'insert','blocks','{"block_hash":"636110c0af5c76ada1a19fa5cd012e3ee796723f8a7b3a5457d8cb81d6c57019","block_index":310361,"block_time":310361000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(892,310361,'parse','blocks','{"block_index":310361,"ledger_hash":"fd5b67bb571f4e9c0c37c6a5c9e1181133c301e05f4f97a41bd827eda7a6db3c","messages_hash":"6fac343e1053a7a48346243c906493f98c138355761619bdc0677a0b3d7c697d","txlist_hash":"4ad763ba9a9de4e6fd2f48d1342b9c2b4f87224fe591cddcf0ea3aab19187ab3"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(893,310361,'insert','blocks','{"block_hash":"6199591a598e9b2159adb828ab26d48c37c26b784f8467a6bb55d51d7b6390f2","block_index":310362,"block_time":310362000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(894,310362,'parse','blocks','{"block_index":310362,"ledger_hash":"38382cc090b349809c4798c3c83b485f8ff682fd5b5b2568357d62ef30f7c046","messages_hash":"7208036024f6c4e6557619b9625abd7275a52a91f6bf0d62fbd20736138665f4","txlist_hash":"2eed1cb542570837b9e34c5ef140428d09c132369e5073061d9b1580338fad97"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(895,310362,'insert','blocks','{"block_hash":"a31967b730f72da6ad20f563df18c081c13e3537ba7ea5ab5d01db40e02647e6","block_index":310363,"block_time":310363000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(896,310363,'parse','blocks','{"block_index":310363,"ledger_hash":"82911a691937d87629bc14e5294f68a25ff2fc6512370db032834b85a623d5c3","messages_hash":"f2e9a33842fc7f9a1482b1c985a2a6058b8b56535c2a508fcd3e3dba930e46be","txlist_hash":"baa8c23f6f8bbed9640382166a4fa59eba156a3c94b645334124a57ad886136d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(897,310363,'insert','blocks','{"block_hash":"67025b6f69e33546f3309b229ea1ae22ed12b0544b48e202f5387e08d13be0c9","block_index":310364,"block_time":310364000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(898,310364,'parse','blocks','{"block_index":310364,"ledger_hash":"cc362ce4c2142e539057430e2dd6402b985c62fefa4e4ad33afe1305f53af8a4","messages_hash":"6de02c61011ad812328b595e95dfd62a2a21ed94bcf59d87fc87c758a9ccd48e","txlist_hash":"973037f8124687eaeba2e9f3e301cb20b9370bef4acd3f2c86eedf595b792b73"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(899,310364,'insert','blocks','{"block_hash":"b65b578ed93a85ea5f5005ec957765e2d41e741480adde6968315fe09784c409","block_index":310365,"block_time":310365000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(900,310365,'parse','blocks','{"block_index":310365,"ledger_hash":"49e41f95f081b70e3f540fa22864cc4f229ceabfdfd54f2da112f1fd35466617","messages_hash":"800333a93bd7fa0dda3e2ba69ae3e54849f6eada89153cb172fd950470da26cf","txlist_hash":"aa3e39acb1dc1a955f579a9a40961a80319c5dd484ddf322ca6edc6b67cec932"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(901,310365,'insert','blocks','{"block_hash":"a7843440b110ab26327672e3d65125a1b9efd838671422b6ede6c85890352440","block_index":310366,"block_time":310366000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(902,310366,'parse','blocks','{"block_index":310366,"ledger_hash":"687c5f3e381d164499126ff90785e3635c825db3808267d4de2ec0e37cc7c597","messages_hash":"b33be7191d7e1afb1140f19fd44bb07daf83897c2fa1af45fc75c15bc85307a0","txlist_hash":"610fbd2d8f4dad57d7efca0772534da791785cb2c45de1906a9b282792faa9f8"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(903,310366,'insert','blocks','{"block_hash":"326c7e51165800a892b48909d105ff5ea572ff408d56d1623ad66d3dfeeb4f47","block_index":310367,"block_time":310367000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(904,310367,'parse','blocks','{"block_index":310367,"ledger_hash":"d7fe976a4b2cca2e23d082a703ef4f4739e110ce1e0a373e76064f6186856ff7","messages_hash":"78fd0206e26ec2c77965dec55fa417738c919261b8a436e69574a786d313dc65","txlist_hash":"531453a70483611396ce5bacc17e22125b1b61f61d56c110fb72a929b95deb9a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(905,310367,'insert','blocks','{"block_hash":"f7bfee2feb32c2bfd998dc0f6bff5e5994a3131808b912d692c3089528b4e006","block_index":310368,"block_time":310368000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(906,310368,'parse','blocks','{"block_index":310368,"ledger_hash":"97f0a0f9e6f355dd179aa2941412decc1b0a06de0dc14dce8538aed6e35d41ba","messages_hash":"a75962c77a91893bfe4fce4d8e9b6e6f85d863b7f2b30060f7eb61b913c8f988","txlist_hash":"289eb338000f45b4d7e143a08a490fbee8d307eb0975f5a2ed62586c2f625e0e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(907,310368,'insert','blocks','{"block_hash":"0f836b76eb06019a6bb01776e80bc10dac9fb77002262c80d6683fd42dbfc8da","block_index":310369,"block_time":310369000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(908,310369,'parse','blocks','{"block_index":310369,"ledger_hash":"1b5d9ec9bd918c84a5f9b6882c94a739cc1ad1362dedfbdf7b2009fd42251d66","messages_hash":"9f6da7f4b88f3abd9705318ff6a1d23ee9bcfb11c16f6de7a1dfc5c160c8f5bc","txlist_hash":"a9122294ce4ccd606d3fa1787fb9c44f25811fb2fe486c9d58b407b5da50dd8b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(909,310369,'insert','blocks','{"block_hash":"9eb8f1f6cc0ed3d2a77c5b2c66965150c8ceb26d357b9844e19674d8221fef67","block_index":310370,"block_time":310370000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(910,310370,'parse','blocks','{"block_index":310370,"ledger_hash":"578b039ed2b9a25e1c75ad9a5242c5962d6645616dc53fb08386602e40f14486","messages_hash":"7e1fc55016a8c1f7d8aeb507891febc3d2ff083d15a8386cb151eeed36126902","txlist_hash":"d61d958644caab04dc236d04d3654abeb1fd625dd7b9cdc01ca5caeae9b41f58"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(911,310370,'insert','blocks','{"block_hash":"7404cb31a39887a9841c2c27309d8c50b88748ed5fa8a3e5ba4cc3fc18310154","block_index":310371,"block_time":310371000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(912,310371,'parse','blocks','{"block_index":310371,"ledger_hash":"473d21b8218a2b02f7fa0d5daf114fa988e4a3d97c33aebe97e51a8d22252492","messages_hash":"0c1a84220c5740d841e1019b76849a49f2760d82afac404c46ac333840724478","txlist_hash":"8abb7bf5c66895fd9e9de804ed8e35b3b1d12054a4e45ab3df6cd41194d836e6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(913,310371,'insert','blocks','{"block_hash":"d3a790f6f5f85e2662a9d5fcd94a38bfe9f318ffd695f4770b6ea0770e1ae18d","block_index":310372,"block_time":310372000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(914,310372,'parse','blocks','{"block_index":310372,"ledger_hash":"0c306eb25702d190ce32cac521b1fac9b8a7cbcf441fd74be8de2e002b4ce14c","messages_hash":"c4f885c7acac670739975c95af4f377eecfb635a112cc87b6881d6972cf46374","txlist_hash":"ad3d52b024093fcc5b88b7a3176c4117468f0f675fd9e908c727ebedc5e2eff3"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(915,310372,'insert','blocks','{"block_hash":"c192bec419937220c2705ce8a260ba0922940af116e10a2bc9db94f7497cf9c0","block_index":310373,"block_time":310373000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(916,310373,'parse','blocks','{"block_index":310373,"ledger_hash":"48d14b17f9074ce1f75ab32581e8f6fe7d518ebd669af6508e5d986d97c92b3d","messages_hash":"95024e723544b65f52242f2c4ec5e71264a1aceb8e4a02136a0772be1c7d60fe","txlist_hash":"b60270d322c86c6452289e0968be64c2217ebeec34944e43aef908e119f838ea"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(917,310373,'insert','blocks','{"block_hash":"f541273d293a084509916c10aec0de40092c7695888ec7510f23e0c7bb405f8e","block_index":310374,"block_time":310374000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(918,310374,'parse','blocks','{"block_index":310374,"ledger_hash":"aee93917f6fe0046069aaff48d5d1875a9c4451acec6562a377428bfb1184cd4","messages_hash":"015375f1837c56f1921aed0b6297ce0ed5279663bb9bca13ede1392abbf17d81","txlist_hash":"46decb141683d0bf4c52e4f756b955c923bfb3995025d0f19a8ef7cac1dd2b60"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(919,310374,'insert','blocks','{"block_hash":"da666e1886212e20c154aba9d6b617e471106ddc9b8c8a28e9860baf82a17458","block_index":310375,"block_time":310375000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(920,310375,'parse','blocks','{"block_index":310375,"ledger_hash":"2b0d74911bba5c9530b69c04fec512fe4c5df25458e5237db884586a221fa30b","messages_hash":"9f74f2c9fc67e4d2364b85c8d975f11c53dd96dbb33512d3718fa815b5fa070a","txlist_hash":"9349961eeb706cf083d6ef1fff69cc871def662dd23fd7854135c1b0dc1a78fb"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(921,310375,'insert','blocks','{"block_hash":"5dc483d7d1697eb823cba64bb8d6c0aded59d00ea37067de0caeebf3ea4ea7dc","block_index":310376,"block_time":310376000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(922,310376,'parse','blocks','{"block_index":310376,"ledger_hash":"a6f84afe2845ba2fa4e5e7377b1d4474dbde6dfc9c4bed050e6d10cc80025e82","messages_hash":"53b6ffb8648293f11adb26d10dce89a55dc0b6645c74bac3b8841421a2715476","txlist_hash":"a5f607569f31beb9ba2a0496a9eb2eb40a6926df4b174161b73f53719ad04767"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(923,310376,'insert','blocks','{"block_hash":"f8d1cac1fef3fa6e7ad1c44ff6ae2c6920985bad74e77a6868612ee81f16b0b3","block_index":310377,"block_time":310377000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(924,310377,'parse','blocks','{"block_index":310377,"ledger_hash":"e006e13691719e4fce65e72c692d3affeae8ae465de2a3b285a1bed4eb518a70","messages_hash":"318599633adc13ffcdc8228c39103c9f25eff9a3b1d1b1fc308d10bb41d7f9f0","txlist_hash":"4dd3a5ae07e934557005871e7c72351077b1092580eadda11fcd3501bb000579"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(925,310377,'insert','blocks','{"block_hash":"fec994dd24e213aa78f166ca315c90cb74ee871295a252723dd269c13fc614ce","block_index":310378,"block_time":310378000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(926,310378,'parse','blocks','{"block_index":310378,"ledger_hash":"607ffa4928577b82f275750353fcecc2e50098d227f18bb8ea95ac2bbb10eea6","messages_hash":"bc105cb041223f0dd3c20019e8a7a9aeb127d6fddec1560d606cd5b8af23279c","txlist_hash":"49533405fa36a389e0d8cac965389e23eb421da5833d625d160f75fa9defdeab"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(927,310378,'insert','blocks','{"block_hash":"d86cdb36616976eafb054477058de5670a02194f3ee27911df1822ff1c26f19c","block_index":310379,"block_time":310379000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(928,310379,'parse','blocks','{"block_index":310379,"ledger_hash":"9f17e8d662dbbfc12a56dc36172b3154bc9b05a87885d1411826481e1ca4f6ea","messages_hash":"902cbbb20d2a0003f4c579bfbedb04e787a2a5ef5a8c485a269c215c9628db32","txlist_hash":"4514a78a69d0987ff60976334f70d0533a1c5726099ae73d93be187a57f25f44"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(929,310379,'insert','blocks','{"block_hash":"292dba1b887326f0719fe00caf9863afc613fc1643e041ba7678a325cf2b6aae","block_index":310380,"block_time":310380000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(930,310380,'parse','blocks','{"block_index":310380,"ledger_hash":"d617e30e1a32ed1cf269a190fd4c843755413492827546a0b3ed14278f817532","messages_hash":"1c8bc40c48e73b0993830fb4073e2f2ae056111b5bd5d22a87831c4b88d32973","txlist_hash":"77038e6b75820a64c9fc9530b3d2c8411cc4da649fc69a3d235424c2dd5500c5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(931,310380,'insert','blocks','{"block_hash":"6726e0171d41e8b03e8c7a245ef69477b44506b651efe999e892e1e6d9d4cf38","block_index":310381,"block_time":310381000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(932,310381,'parse','blocks','{"block_index":310381,"ledger_hash":"8af8d819f02927de4a74d3d37dcecf6e5124d53be37603764b1b1adad13b0d7a","messages_hash":"910afea0bf4129dd27c06428bafaab6c8c8bbf95ec371466640072a26eb129e5","txlist_hash":"48b66540bea91d2c2d216d5c13e88dfd9c1f1a36cae2ec721253034041e63af6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(933,310381,'insert','blocks','{"block_hash":"0be33004c34938cedd0901b03c95e55d91590aa2fec6c5f6e44aec5366a0e7d8","block_index":310382,"block_time":310382000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(934,310382,'parse','blocks','{"block_index":310382,"ledger_hash":"809d5c20335bbefe8e4f3552e24b24d96f6ee4ab12f3bfc9e74898371cf69797","messages_hash":"9cdf0d22a1b690bfb2f542326c53e25e0f1d2b83c434bdc8294ce03959faeba6","txlist_hash":"159e8434abde33d3a97a4e7701cafec884a6d0d7ad78852ee7db449a18c5e23f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(935,310382,'insert','blocks','{"block_hash":"992ff9a3b2f4e303854514d4cad554ff333c1f3f84961aa5a6b570af44a74508","block_index":310383,"block_time":310383000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(936,310383,'parse','blocks','{"block_index":310383,"ledger_hash":"d8ec301994a5333f8efe7cc547a833d26c6766deb0b39c4fc18d1bdb470ee903","messages_hash":"4b565f4fd6c07a96002f87eccb7e693fe8d7cc6d8a81cb85cc6b06fb071069c4","txlist_hash":"aecbe5619daf47a60ab2765502725a284224c0985e91993b212c50c3449d197a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(937,310383,'insert','blocks','{"block_hash":"d518c696796401d77956d878cbdc247e207f03198eabc2749d61ebeadee87e5e","block_index":310384,"block_time":310384000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(938,310384,'parse','blocks','{"block_index":310384,"ledger_hash":"fe47a03993cb9079a6e72810552d631fe838bcfaba3b34c73c9948af77266df2","messages_hash":"8e77a1836fdc196b50c2a525208fb5ff587c38486d1dce443a2fb1a7227119f2","txlist_hash":"e69bc390fb0a624f6d33512a55e9732857afee1b114df97761186ac648f63111"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(939,310384,'insert','blocks','{"block_hash":"2aa6a491a03a1a16adbc5f5e795c97ec338345cfdf10ff711ffb7ac3a0e26e28","block_index":310385,"block_time":310385000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(940,310385,'parse','blocks','{"block_index":310385,"ledger_hash":"6114e98e0004cf0f9472fce6bfa6bb99ae38e57214c8b134f30da1d62399f6ef","messages_hash":"7668443002aeaae041ff7859c252f642fd930c4d51a616247a798f47942f97ae","txlist_hash":"d3e6a4df9ff34518f8fe243dc87c981aef0cc7b89ff9ca466269a19493aeaecb"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(941,310385,'insert','blocks','{"block_hash":"9d19a754b48a180fd5ebb0ae63e96fa9f4a67e475aeefa41f8f4f8420e677eda","block_index":310386,"block_time":310386000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(942,310386,'parse','blocks','{"block_index":310386,"ledger_hash":"4c52d59ade1bd2068e3b75b8b3cd1d23c6a94b6437f7966d10f5a07bf8f630ff","messages_hash":"1fd22e6bf448e0771f8c7da5c0829614f5f45612bd6592104c369b001fcfd266","txlist_hash":"1c250ef18892c191c535562bb35bb1c8bd4f515ab00bc4cf0b564436b2bd33ee"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(943,310386,'insert','blocks','{"block_hash":"b4cac00f59c626206e193575b3ba9bfddd83bbfc374ebeb2838acd25e34a6c2b","block_index":310387,"block_time":310387000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(944,310387,'parse','blocks','{"block_index":310387,"ledger_hash":"327e9a842233568888998ec1456b6f78c093b47639707d44e6336b2bc18d955f","messages_hash":"194a4ec47379a92f7ad3ef8b24e797fe33173d2036b687596fa534356c07a672","txlist_hash":"d7de64dd98a65b478518d909b1f0f2860f6a0b8e5e530f23ee55caffbaf1a545"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(945,310387,'insert','blocks','{"block_hash":"41a04637694ea47a57b76fb52d3e8cfe67ee28e3e8744218f652166abe833284","block_index":310388,"block_time":310388000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(946,310388,'parse','blocks','{"block_index":310388,"ledger_hash":"6efaab188a5cae39ef547a804f61bcbc2be4881e0569f49d7622b407f6860401","messages_hash":"5de4d26d0f94ec5c143e465eb509d22bbd2016bf9068ffb5e5c6949384a648e1","txlist_hash":"4916559fdc472a474aa4c652c85b0db143744daed0d98d7f2fddd1dba32be88e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(947,310388,'insert','blocks','{"block_hash":"3ec95ae011161c6752f308d28bde892b2846e96a96de164e5f3394744d0aa607","block_index":310389,"block_time":310389000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(948,310389,'parse','blocks','{"block_index":310389,"ledger_hash":"89c686d5d973691a7281268c867f837b86b140a05f16f12302a3cdeb3b6a0ee9","messages_hash":"232a974e8b60494567216ff9b2b8744fbd48c5328d04a63b29c671a8274df924","txlist_hash":"b2e0098e42f81a8a9369d510b17be67446feb3e5da1b1eb37acd9f0b33b29fce"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(949,310389,'insert','blocks','{"block_hash":"f05a916c6be28909fa19d176e0232f704d8108f73083dded5365d05b306ddf1a","block_index":310390,"block_time":310390000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(950,310390,'parse','blocks','{"block_index":310390,"ledger_hash":"2c4eceebb94d0c7a7702478d9547d1afbb42ab5ecb5ae6271a3f69942bd77e50","messages_hash":"bf9827228ad31a03a85dacfd3a333afbbfe662611550bd431077abd226c87845","txlist_hash":"8e3a48b160083860b0928dd97150477980da9097945c4ae3ee144c505f131b86"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(951,310390,'insert','blocks','{"block_hash":"fc26112b7fdd8aaf333645607dabc9781eac067d4468d63bb46628623e122952","block_index":310391,"block_time":310391000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(952,310391,'parse','blocks','{"block_index":310391,"ledger_hash":"06397124ee2a1bcb9104899469394855d4ecccd1a08626d650bdf3169e227831","messages_hash":"7eb2b6f227e5550b5d0d75c21818c58263a4e86dd6b160b0b1638dda017d3062","txlist_hash":"b1b4f0fc9ba54527ea0902192a61158bb5383f1959f187915c07f88bdf11caaa"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(953,310391,'insert','blocks','{"block_hash":"f7022ecab2f2179c398580460f50c643b10d4b6869e5519db6ef5d5a27d84a1d","block_index":310392,"block_time":310392000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(954,310392,'parse','blocks','{"block_index":310392,"ledger_hash":"44974b5fec0be3a2958d39f2d6824a2e82733f873a404ec9887178c620843149","messages_hash":"3341d9abb5324b460d6a80df5fd0b9c4003b38dffab3a503c27cfd21a3cd60df","txlist_hash":"97a039be078662ac5b1a275d5618224c1a90886c79b9fb651dfcb14481da8e8a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(955,310392,'insert','blocks','{"block_hash":"e6aeef89ab079721e7eae02f7b197acfb37c2de587d35a5cf4dd1e3c54d68308","block_index":310393,"block_time":310393000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(956,310393,'parse','blocks','{"block_index":310393,"ledger_hash":"1863677c0e552344607b1af3eb8ef8f4fc6b2a73d63eebb3e9928302c887970f","messages_hash":"7e02c72085143c68bf4ec2f0d7f9cc74a5bdd0bbaf28d7c441401a8990e64fc7","txlist_hash":"c488dd61c64182cdc779e96a2b312463d42ff9829d1d518c8a9daa1a4cb26de3"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(957,310393,'insert','blocks','{"block_hash":"2a944743c3beb3bf1b530bd6a210682a0a0e9b0e6a9ff938d9be856236779a6f","block_index":310394,"block_time":310394000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(958,310394,'parse','blocks','{"block_index":310394,"ledger_hash":"3838ba6e84376ed8dffb3fee9b5928d903952c0d8a8ad41ab63a9651a1c8c770","messages_hash":"b386b65006170bb4b28bbe1a8235f9fc7104ea3e9e34d51d86eee06326571d99","txlist_hash":"e329db30a579327664d135ce9c3661a259378dcc12e179232599e0186c7bfe91"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(959,310394,'insert','blocks','{"block_hash":"19eb891ce70b82db2f2745e1d60e0cf445363aaff4e96335f9014d92312d20e4","block_index":310395,"block_time":310395000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(960,310395,'parse','blocks','{"block_index":310395,"ledger_hash":"872367d61f81cddeb555da5f9c4f46a8ac57c24629ab073094e407a4555a8555","messages_hash":"5f9db4e525ecff94de73118f2cb2ffaf872fe2692c4c35ab221fe89adc13b28d","txlist_hash":"2234b36f4187eb0da9ed6a633aa2e15075d5efb23f154963885e7fd42495e4a5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(961,310395,'insert','blocks','{"block_hash":"aea407729ac8d8e9221efd9d70106d14df6aaf9f2f87dc6f490835a9caadf08e","block_index":310396,"block_time":310396000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(962,310396,'parse','blocks','{"block_index":310396,"ledger_hash":"b9a9eaaf1cf6cfa4ae5b0f314812a9a2346209da0b7ce57e16010d2a01c0092a","messages_hash":"9e0597d4190ec3e829b62fe7ccc8020109369dbf72ab2b14ea115da386330813","txlist_hash":"25946162b9af068438633980c75eaf9e508144f603f7a913de56cc11a7a482f6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(963,310396,'insert','blocks','{"block_hash":"7c429e56a19e884a8a77a759b52334a4b79404081b976270114043ba94d7985c","block_index":310397,"block_time":310397000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(964,310397,'parse','blocks','{"block_index":310397,"ledger_hash":"b61f36bcc934a18fdccf7806d41482684ca129801d0b9ce7815dcd488fc49a66","messages_hash":"b55fadb9aadb55ad049079769711016434ca942454f5bc39d9f6dc4417b24dab","txlist_hash":"e697fb2f445f03a1d895b904be58a554af4c26ed74a65eb0e52c98e490efbd44"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(965,310397,'insert','blocks','{"block_hash":"55c046db86dee1d63c0e46e6df79b5b77dfd4ab2ff5da79e6360ce77dd98335e","block_index":310398,"block_time":310398000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(966,310398,'parse','blocks','{"block_index":310398,"ledger_hash":"9446476e123e5dd354682c60591cab8b712c30df9080dde756246eef45e21df5","messages_hash":"f56692ed7d8f224a45a3c2563e2441b55626f8845abb6879fd1364cfa442c189","txlist_hash":"0d20ba449b95f7d128c8b78ef2a37ec390e6177b2041a2b035a72cb8e6062ba9"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(967,310398,'insert','blocks','{"block_hash":"765abc449b3127d71ab971e0c2ae69c570284e0c5dacf4c3c07f2e4eca180e7a","block_index":310399,"block_time":310399000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(968,310399,'parse','blocks','{"block_index":310399,"ledger_hash":"50d288bca09d446f56544fb1ec50d613bdf156488468ac92d433425a3cab0804","messages_hash":"b64321d63d483d9e7c09026e749bf3e9ab67e14d2e6c09363728bfa02c102d09","txlist_hash":"82214bf1638d82e5b66919990e24d3960eb02a423bb3f36bcdd730b17267e340"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(969,310399,'insert','blocks','{"block_hash":"925bc6f6f45fe2fb2d494e852aaf667d8623e5dae2e92fdffa80f15661f04218","block_index":310400,"block_time":310400000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(970,310400,'parse','blocks','{"block_index":310400,"ledger_hash":"349a24fd446727bb1793ccf88fc569d20eb680c10e506fc25b281ce6ec3fd7bd","messages_hash":"fee9df29e116470c1165c090931eb1bd7e45795f53350fa87da5042ce529edef","txlist_hash":"e7ce5e8c9c4160590dcdaba04bc866267a9784f99fe68bebd337da16768e8f18"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(971,310400,'insert','blocks','{"block_hash":"f7b9af2e2cd16c478eed4a34021f2009944dbc9b757bf8fe4fc03f9d900e0351","block_index":310401,"block_time":310401000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(972,310401,'parse','blocks','{"block_index":310401,"ledger_hash":"52c06b68cad19608420b73476a73b411d0327382b92bd454cadf1b8616eb17a5","messages_hash":"05538970685115a9ddaf41d458a3cce59ecf7b9b6a888729efadce1014e7a899","txlist_hash":"6ff1e13b2110c6ee69e86818bd32bacdffa6f4e91fd2d8c2b09b5db35062be81"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(973,310401,'insert','blocks','{"block_hash":"1404f1826cd93e1861dd92ca3f3b05c65e8578b88626577a3cbad1e771b96e44","block_index":310402,"block_time":310402000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(974,310402,'parse','blocks','{"block_index":310402,"ledger_hash":"8bf64213a454c62dd4b0dcd7dfa298da0244a6aa7ae6fff98be6f49d50d259ab","messages_hash":"21985f293ab45f0cc41e2760cd3cd2c3e5fe8788ad16c5008b1853869e574790","txlist_hash":"3e776187716a384a84170b2e7dbbb5c152d98535351c1f5b4b00c7bf5ea7ff33"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(975,310402,'insert','blocks','{"block_hash":"f7426dbd4a0808148b5fc3eb66df4a8ad606c97888c175850f65099286c7581c","block_index":310403,"block_time":310403000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(976,310403,'parse','blocks','{"block_index":310403,"ledger_hash":"fb2a365372522d1442792cb38e1a4167eda2612ef442c776749097a3d541a827","messages_hash":"e0e319bb5d4189cd952e021faaf0146e2872b62dcf137856d61959adf81724a4","txlist_hash":"1fad731787bca55d4102d8d355ccb9625590baaccd0ae63490320efbf5aaf90f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(977,310403,'insert','blocks','{"block_hash":"401c327424b39a6d908f1a2f2202208a7893a5bedc2b9aff8e7eda0b64040040","block_index":310404,"block_time":310404000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(978,310404,'parse','blocks','{"block_index":310404,"ledger_hash":"47f96d798df9cad17667be908ebb063ab9f79d947784a78189d247e626864a5f","messages_hash":"64c5499c7eef627a35277d801a7480aeb4a1e845ae368475da0c2edac597968c","txlist_hash":"10b2cfe8ebe45dac311048b4aa8d15d7c59ae17f5c1a0c132cfb675d893de8d5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(979,310404,'insert','blocks','{"block_hash":"4f6928561724e0f6aab2fc40719f591823ca7e57e42d1589a943f8c55400430a","block_index":310405,"block_time":310405000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(980,310405,'parse','blocks','{"block_index":310405,"ledger_hash":"185780205a9ab241bb0656799fd0d5942c1e3e5854abd1d06573da550b04b096","messages_hash":"dc4339e5e79750da2e11a43ccf76b285e85e50187e81bf14237084c2a3c414b2","txlist_hash":"8cbd52dd97944b34f080d675a51360dafcd38183cb08633e6ea247d2c5074435"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(981,310405,'insert','blocks','{"block_hash":"6784365c24e32a1dd59043f89283c7f4ac8ceb3ef75310414ded9903a9967b97","block_index":310406,"block_time":310406000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(982,310406,'parse','blocks','{"block_index":310406,"ledger_hash":"367b9de2313c5f7fce0c2dc2b4a8e2bc059f6881bc924f7315e8e2ca61728a59","messages_hash":"29eac43bd800bb93099e696e1f4cfe1bb7dfbce8316e65459c5e7780d32488c7","txlist_hash":"0d104d4ce44d11e581f51e5a33ec9e35a994b2b992842b173fb8a2756412b4b2"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(983,310406,'insert','blocks','{"block_hash":"84396eb206e0ec366059d9e60aefdb381bca5082d58bffb3d2a7e7b6227fc01e","block_index":310407,"block_time":310407000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(984,310407,'parse','blocks','{"block_index":310407,"ledger_hash":"2bdbd79575aa2ff52ba0cce3fc1a1aac6120d598a8ab0ff3925e1395e6cad2d1","messages_hash":"b570ec3ca500cb58c1388584391c16e4ff5061ac434b7bcfd8185a121f318207","txlist_hash":"a3407057dc90723c90ed8f2df5af7840e50daa4c4bdedd47181c17a1e8563934"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(985,310407,'insert','blocks','{"block_hash":"4827c178805e2abae5cb6625605623b3260622b364b7b6be455060deaaec2cda","block_index":310408,"block_time":310408000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(986,310408,'parse','blocks','{"block_index":310408,"ledger_hash":"fcd0edef8c4ae9517a6e793a2742c598de38c122829b7a7aa265310417ac92c3","messages_hash":"91b0efd57597544fe96539dbab912ef18d57dc237a42ee5245dd95c59eafd375","txlist_hash":"3ee1e7949bdb395a4e481f94344fccb2781abcb3f5d1fea2bbadb9de9228a426"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(987,310408,'insert','blocks','{"block_hash":"01a719656ad1140e975b2bdc8eebb1e7395905fd814b30690ab0a7abd4f76bba","block_index":310409,"block_time":310409000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(988,310409,'parse','blocks','{"block_index":310409,"ledger_hash":"5b663c40873af21ebc721f2689e2c57a2c787fff579c58f033bba75910a64837","messages_hash":"7b6bfcc602b144da1f9c12773523114a4a54267eca14f4c8f255a9ce8b2e85c4","txlist_hash":"68fbf3a110ed24946d1594f5a4de1dae9c4b6f0394188a71ab89996e9fb4e55b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(989,310409,'insert','blocks','{"block_hash":"247a0070ac1ab6a3bd3ec5e73f802d9fbdcfa7ee562eaeeb21193f487ec4d348","block_index":310410,"block_time":310410000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(990,310410,'parse','blocks','{"block_index":310410,"ledger_hash":"93c5a33931b2a33933bc286d6987b34730c0677460e4875d5c032ae86c2e01f0","messages_hash":"ca813e8e604e5ac2adf5fa18e2776ddf48ef3b2f34a1471fe71fb80ff73769d1","txlist_hash":"bd755bf0718d5a0423ec41a8ac84b1554751ff8f0a3f63d87e7e0f58aaa31008"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(991,310410,'insert','blocks','{"block_hash":"26cae3289bb171773e9e876faa3e45f0ccc992380bb4d00c3a01d087ef537ae2","block_index":310411,"block_time":310411000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(992,310411,'parse','blocks','{"block_index":310411,"ledger_hash":"8d98498f89619a2e334e9ac69bf8ff37251af6431d9bb6d1ea8bbc404c5e560d","messages_hash":"6be534a6fddd54f6813f4f6247e6c47bb0eddda08e28edbafa132bf8115f390f","txlist_hash":"103563dcfc7b9f149b6efdad7cae17b090d4a8232fd4c37fac7bcf942d784b55"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(993,310411,'insert','blocks','{"block_hash":"ab84ad5a3df5cfdce9f90b8d251eb6f68b55e6976a980de6de5bcda148b0cd20","block_index":310412,"block_time":310412000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(994,310412,'parse','blocks','{"block_index":310412,"ledger_hash":"a16a650c4b63ed783e7229980be1177da867c188a5039ed5c58b9717f6ccf634","messages_hash":"a3b69de49ae3569129f96bc994fd0566acfc5cf6ea0c346e7297aea967283636","txlist_hash":"4daa6f0799529346ba4ee87e2aed1450447921dfa92e785378fae39c234a7c8f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(995,310412,'insert','blocks','{"block_hash":"21c33c9fd432343b549f0036c3620754565c3ad99f19f91f4e42344f10ec79bf","block_index":310413,"block_time":310413000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(996,310413,'parse','blocks','{"block_index":310413,"ledger_hash":"768577c1a7c2cf2cc19cd8dbe823f1bdb8a222daee4c7ac7b5ead6633040c283","messages_hash":"f8ffa3c414d806885764c093a7a8d362aa78d68751e710cfc89e2e318d59817b","txlist_hash":"7ae9815341dccd2d1bff8dbcfdbcce4e52b4aac8f2fdd421348ed9f44cd19e38"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(997,310413,'insert','blocks','{"block_hash":"8cff03c07fd2a899c3bcf6ac93e05840e00de3133da14a413e9807304db854b6","block_index":310414,"block_time":310414000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(998,310414,'parse','blocks','{"block_index":310414,"ledger_hash":"906c491f164877c31002da41233c237d0d4a945a0072406a7b7d13df74be7eec","messages_hash":"94b9e9f9260a35300ea27a15a0a9493350c2a6db704bc0d4ee0e78a5818cebdd","txlist_hash":"807cd64b4d8ee3d91a5cbc651e42feeacd5248b6572310472743ca71a9f24621"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(999,310414,'insert','blocks','{"block_hash":"dd0facbd37cca09870f6054d95710d5d97528ed3d1faf2557914b61a1fc9c1cc","block_index":310415,"block_time":310415000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1000,310415,'parse','blocks','{"block_index":310415,"ledger_hash":"d27f99b4a67dfc910d3b932f97b7299779f245e95f871140d3c90f13cc6e506e","messages_hash":"8146c8dfac8c08e8d1a7fd45ace0cbc146f928616343c082603dea1dbe0375ee","txlist_hash":"67fe947c260b3d8748887e94f68c3725664bb6dbd72187e9312ee48a42770ec3"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1001,310415,'insert','blocks','{"block_hash":"7302158055327843ded75203f7cf9320c8719b9d1a044207d2a97f09791a5b6b","block_index":310416,"block_time":310416000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1002,310416,'parse','blocks','{"block_index":310416,"ledger_hash":"90fcd04c508a9821e0ba0ed36cd7cfadd1d3c95116e3f52ad69f98d3d14de571","messages_hash":"dca1d2b95f7f534e3dea2e7a2019838753efb31c5ced981701f50940f3cf0d26","txlist_hash":"1041a17c5c146181a56da6ef17386814299be8a22c76a2b2f8a4a2768b2b531c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1003,310416,'insert','blocks','{"block_hash":"2fef6d72654cbd4ea08e0989c18c32f2fe22de70a4c2d863c1778086b0449002","block_index":310417,"block_time":310417000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1004,310417,'parse','blocks','{"block_index":310417,"ledger_hash":"19cbb26c6d24df5b110a5aae9b53a911a61b2086dde926273a1b0f66c1049e6b","messages_hash":"827cc7c36c8f51da81c980c10003c324cfab26a15e2e7d5698ae323deff752c6","txlist_hash":"920154e272608daa3c501588cf0eee50c2c45a385d30f42711657ae4a6de3bf5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1005,310417,'insert','blocks','{"block_hash":"fc27f87607fd57cb02ce54d83cec184cf7d196738f52a8eb9c91b1ea7d071509","block_index":310418,"block_time":310418000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1006,310418,'parse','blocks','{"block_index":310418,"ledger_hash":"2dc971d2db4e92e2d5dcef124bf9cdad33c41a71d6ae3db80297cb2257911f0d","messages_hash":"85d72f558c2926cf357f739ea311de5aa840cbe82c35beee417a1520860d7a59","txlist_hash":"290826e9c72e49636370d0dad56ba1c2c9209d888b993e030838f84300c0225a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1007,310418,'insert','blocks','{"block_hash":"9df404f5ce813fe6eb0541203c108bc7a0a2bac341a69d607c6641c140e21c8e","block_index":310419,"block_time":310419000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1008,310419,'parse','blocks','{"block_index":310419,"ledger_hash":"7ad2bf141622a0db4b27b1f4dab4857d1595e3f746a4113992850a680ebf1f37","messages_hash":"77ebc95e7c6af80280c5d7915ec2b599d700151c4160dbc5a8d5b2a109bbe05c","txlist_hash":"d06653b493d120dd288637d530cd3f6efa1c8f5c252bb275572c1948ff0f3539"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1009,310419,'insert','blocks','{"block_hash":"138b3f1773159c0dd265a2d32dd2141202d174c2e52a4aeac3588224a3558372","block_index":310420,"block_time":310420000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1010,310420,'parse','blocks','{"block_index":310420,"ledger_hash":"3602b26268d1bd3fc5f08f170e9767ff07c91f6976a1c342dc6b24f7ee98c509","messages_hash":"1107a47b26211af98233b1c5293451ae5bb9349c73368b513ecd337ad2a64d3e","txlist_hash":"ae8e61a57232c10bd15c655bb8c76007dcef394ba64d1619157ca58990e18c25"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1011,310420,'insert','blocks','{"block_hash":"71fe2b0e02c5cad8588636016483ddd97a4ef0737283b5fd4ab6ea5dc5c56b9a","block_index":310421,"block_time":310421000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1012,310421,'parse','blocks','{"block_index":310421,"ledger_hash":"1c1facfa3852b33c173a08d06450335a2b230541c60973a154e8dd864f3c3c8b","messages_hash":"1a47a0616e0d7d4153e694dc20509140325be90d30203a496bff146da7aadaef","txlist_hash":"01bfd609f878bb6149779f6377d7868d5b7fa3b831f68cd757967b982cd09ad4"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1013,310421,'insert','blocks','{"block_hash":"cd40260541b9ed20abaac53b8f601d01cd972c34f28d91718854f1f3a4026158","block_index":310422,"block_time":310422000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1014,310422,'parse','blocks','{"block_index":310422,"ledger_hash":"e788123aefd1129554fa2c166dbd06ce68f913730183ca73cf248c1f5284eba4","messages_hash":"a6aca492da14b2a2a5911a1eb9fc2b94007ac2618d18c7141e0c917af583b09d","txlist_hash":"6577ad9a9e3889fb5eeac7fc9039af8d4537a8fc28b4a9de85e230f5d9da3583"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1015,310422,'insert','blocks','{"block_hash":"6ca0d6d246108b2df3de62a4dd454ff940e1945f194ba72566089f98ad72f4db","block_index":310423,"block_time":310423000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1016,310423,'parse','blocks','{"block_index":310423,"ledger_hash":"ad445e5351af8739b2f74cbba8b44201c20ab55ad1db064402614fb97f35c375","messages_hash":"d52d5b979c57d1fc9b43ab2133ffe65f383646105c22be971c618325a4e295a3","txlist_hash":"dd7b66518e8ec22359df2d8ad4c0349fe4ab3a74620aaf2ef4bdc93a4c7e2d92"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1017,310423,'insert','blocks','{"block_hash":"ed42fe6896e4ba9ded6ea352a1e7e02f3d786bfc9379780daba4e7aa049668ad","block_index":310424,"block_time":310424000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1018,310424,'parse','blocks','{"block_index":310424,"ledger_hash":"e89872ed802fe4421844882958fe6384cf21a85a6dcf10db761e2bb4a77ed24e","messages_hash":"0ba84d839fea22ea4634d16617df4437859805e6ef3fcecbf9319648152c959d","txlist_hash":"bb05836e569bc4c85141c5b4d2832efa5a83ad519260e96d92f6ee16fe4a0c80"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1019,310424,'insert','blocks','{"block_hash":"73f4be91e41a2ccd1c4d836a5cea28aea906ac9ede7773d9cd51dff5936f1ba7","block_index":310425,"block_time":310425000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1020,310425,'parse','blocks','{"block_index":310425,"ledger_hash":"29e595e9ac7717013cfc8d12255496192234abbddd8a66762a5eaff0c49f3750","messages_hash":"7f501e4f4dad5fc70bb3c56d1378bf4b292259188c56b5d5e53a3c5206c9700a","txlist_hash":"2cedf78c9d13e32fde5792907f2ac9f409fe701740533b94ceab6b8087f790b1"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1021,310425,'insert','blocks','{"block_hash":"9d28065325bb70b8e272f6bee3bc2cd5ea4ea4d36e293075096e204cb53dc415","block_index":310426,"block_time":310426000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1022,310426,'parse','blocks','{"block_index":310426,"ledger_hash":"9b9509ce7b7bf380f4d030604810a755c71fabe27152be990997a6a9db37ff15","messages_hash":"25fa3569e346dfc876bba62b9d23783c146a543cbdeec50fc6e18332122fb2b7","txlist_hash":"c037094c1947835fceefa8a25a81724d9c88191d5f5199d3a59339bd44407289"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1023,310426,'insert','blocks','{"block_hash":"d08e8bc7035bbf08ec91bf42839eccb3d7e489d68f85a0be426f95709a976a2a","block_index":310427,"block_time":310427000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1024,310427,'parse','blocks','{"block_index":310427,"ledger_hash":"f1b834e2a380f1b9a78c592acbe78ec809220c620e15f296ab8d7ecea6cd392e","messages_hash":"a139b9e0838217dba78ff8d8503ed732bc0a94ca9a5aa75ab8938c99edee297a","txlist_hash":"81d439d9d368279e97c8739243efb01c7027be218d831d93127364fa247aed95"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1025,310427,'insert','blocks','{"block_hash":"2eef4e1784ee12bcb13628f2c0dc7c008db6aaf55930d5de09513425f55658a2","block_index":310428,"block_time":310428000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1026,310428,'parse','blocks','{"block_index":310428,"ledger_hash":"9e963a17fbc4a5c20d48094f1459959033520f92d7a8bc044b71bbffb8dd173d","messages_hash":"3162a5d50ea03633b8b2d947cc3c52a5df9593e245376bf80756f48e7c1fc2d7","txlist_hash":"002b7ac255f66476970512e50d7ca9cb5da695bea9763bf0379f8d8e6c77a71c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1027,310428,'insert','blocks','{"block_hash":"086bfbba799c6d66a39d90a810b8dd6753f2904a48e2c01590845adda214cf8d","block_index":310429,"block_time":310429000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1028,310429,'parse','blocks','{"block_index":310429,"ledger_hash":"ac8cfd965b9c53f32731a3e0fcdb6df5746d646b02c88b5201a674125e37eed5","messages_hash":"fcea4b97a5fe73cf70e2d0263371e1e00e099bf1cf6ec7db042b3bea048a265c","txlist_hash":"4b68376b50d77145ada0ebc72c3eb43b54b4743b538dbc9fa2c914515882dbb7"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1029,310429,'insert','blocks','{"block_hash":"870cf1829f84d1f29c231190205fe2e961738240fc16477c7de24da037763048","block_index":310430,"block_time":310430000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1030,310430,'parse','blocks','{"block_index":310430,"ledger_hash":"33654e32dfd41ff3a5744b57fd2483a08a2b4729c18ca54c3ac5d95a1bf0ef21","messages_hash":"1b3b759f56da231657bf1c579b3186abe1a28fba2c262a9e872f7ee83aaa4e26","txlist_hash":"3323c2d01e777caaca3eeaf6f2af8299cee1622589cbaf08f4d245356642d2f2"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1031,310430,'insert','blocks','{"block_hash":"20b72324e40ffc43a49569b560d6245c679e638b9d20404fc1e3386992d63648","block_index":310431,"block_time":310431000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1032,310431,'parse','blocks','{"block_index":310431,"ledger_hash":"ba8837c811ae87981cc37cb49438d958fa58dfc5a95824040f2fd088465406d1","messages_hash":"23d2c60e160ae68a16ab609dccdb9b78f1b7d3feeaee2c97c7dedceb13c02eee","txlist_hash":"67aadda0a565f4f5e2786b5007e56e2d10077e87e7d3acc216fe0803365b7b81"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1033,310431,'insert','blocks','{"block_hash":"c81811aca423aa2ccb3fd717b54a24a990611365c360667687dc723e9208ad93","block_index":310432,"block_time":310432000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1034,310432,'parse','blocks','{"block_index":310432,"ledger_hash":"7864019cb0cbbcd895154421183d6acb932b1d64441103b913d52469f656655f","messages_hash":"51e2478b9f02aba026af477be07173549dba6acf715620c3080db983d5818ae4","txlist_hash":"c12942ffa02a5f8eaddf3e8e55ad0ea03f29cebd9e822e00c504c162cddd0471"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1035,310432,'insert','blocks','{"block_hash":"997e4a145d638ad3dcdb2865f8b8fd95242cbc4a4359407791f421f129b1d725","block_index":310433,"block_time":310433000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1036,310433,'parse','blocks','{"block_index":310433,"ledger_hash":"a6da92ef0df7d092de09f2f8d2c99ff65ad74e2a0bd2ea25f8335614372f5279","messages_hash":"9d406a162538d5a0b083ddf1edbc2af4da4772e3dfafeb471757019b03f07860","txlist_hash":"f0eefd9f81db595b07fe719a41e67e54fdb987e177f05d37040237db3be2a8a5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1037,310433,'insert','blocks','{"block_hash":"61df9508e53a7fe477f063e0ff7e86fbb0aef80ff2ddedc556236a38f49ac4d8","block_index":310434,"block_time":310434000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1038,310434,'parse','blocks','{"block_index":310434,"ledger_hash":"e288db28ac6a42822f85fd042f65b57378bc6cc2f8616edfa88143d7b1c9ddcc","messages_hash":"216849b38a9a9bf850733296d6a14b539b2c2261354e26019a723dd7403ad006","txlist_hash":"173f8b7d2c581e9f088b3fb6e96ad2af597b172717d8f8732fd5857997f0f3d7"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1039,310434,'insert','blocks','{"block_hash":"f24cf5e1296952a47556ac80a455a2c45da5c0dc2b388b51d235a3f741793d5f","block_index":310435,"block_time":310435000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1040,310435,'parse','blocks','{"block_index":310435,"ledger_hash":"e87af314e8d7a5f2315ccc559d7c2255c008ba63aff017696201db69344d423f","messages_hash":"c974a643a40e5993fd5ecf85e7a627f6ed4c7d32da8d2bb27528e99f226d5efa","txlist_hash":"a4dd5a36f1aeee54e99bb23095b64707fc0b3fde5f64e33135429a100e4ea558"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1041,310435,'insert','blocks','{"block_hash":"a5e341ba92bdf9b3938691cd3aab87731eba5428bb61a804cecf9178c8da0c19","block_index":310436,"block_time":310436000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1042,310436,'parse','blocks','{"block_index":310436,"ledger_hash":"82327b93bd3ffcdf797bc2f6470b9c8c5101e54b924ec5f141a31356aa8865c7","messages_hash":"6c8edec3773ad66f3ef89d20d5190b2c19318ef48bf3752e7f482a7671b006c3","txlist_hash":"c6b0f05a847c30dd3f2d3f8cb7c26a84f1d005b4720a553f9dd8b717185d7f05"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1043,310436,'insert','blocks','{"block_hash":"9e18d0ffff2cb464c664cefc76e32d35752c9e639045542a73746f5ec2f3b002","block_index":310437,"block_time":310437000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1044,310437,'parse','blocks','{"block_index":310437,"ledger_hash":"70d86f9ef8df495474de06b94e1857693c73d9ca3528356b82553a52fdce0dda","messages_hash":"64193ef0680fb09096cf55f02405bf8e2a133b12bd8e1453330143d72700f164","txlist_hash":"809d60564fefff56688616b7fb96378d4eb425e5c8de36b34f0c9070935dac26"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1045,310437,'insert','blocks','{"block_hash":"36be4b3470275ff5e23ed4be8f380d6e034eb827ebe9143218d6e4689ea5a9fc","block_index":310438,"block_time":310438000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1046,310438,'parse','blocks','{"block_index":310438,"ledger_hash":"44b90478e32373205462f0fb212da636b31db6dfb99a2b56923beb97a3a64722","messages_hash":"65151ecc33ae384e013535fc1f6cda04494809cdedb5a2cdb891f0f38035bd3f","txlist_hash":"2cf7695a3cea08358af8bd9378b1d6ad6c7223cbac01589042ace6c3cb312196"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1047,310438,'insert','blocks','{"block_hash":"4f2449fce22be0edb4d2aefac6f35ce5a47b871623d07c2a8c166363112b2877","block_index":310439,"block_time":310439000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1048,310439,'parse','blocks','{"block_index":310439,"ledger_hash":"66b791b9deb7d2fc8b075f41d712e300ffa9c46ca9d6f4e7cec6429ca6a65163","messages_hash":"01d3ab7b218d6bfef3c5b6b6db851297e951cebfdf60b8d4835a44a665e163ca","txlist_hash":"41f11f77910c12535fa183e819b36a0dda32eaafe0ae8016e2ce7c23d5c1d67d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1049,310439,'insert','blocks','{"block_hash":"89d6bd4cdac1cae08c704490406c41fbc5e1efa6c2d7f161e9175149175ef12a","block_index":310440,"block_time":310440000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1050,310440,'parse','blocks','{"block_index":310440,"ledger_hash":"5baa10e1659182ba4511f87f08deda38d5de3501c63efd376604cc199140d27c","messages_hash":"d8b0a242ba1e6003bbdaf0bf2369b95d39c736ab52e66be2a9113941655e698a","txlist_hash":"c6762d7334806b6b62c3cee84f65346d1121493d3bc3f890af174c4abe4710ae"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1051,310440,'insert','blocks','{"block_hash":"2df1dc53d6481a1ce3a6fee51ad4adcce95f702606fee7c43feda4965cf9ee15","block_index":310441,"block_time":310441000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1052,310441,'parse','blocks','{"block_index":310441,"ledger_hash":"2d490229fead1b15a8350da7bcc83c483dae06e4a2f574c6e8fde248acd449d6","messages_hash":"18ff66422cca18b8b49392bae2d93ece152f47035c44ef71dda8cbd5a2cd7f96","txlist_hash":"f9fcb16a928c44b86ab2af7407a2ca269455b144694a80927b9213bf8e7ac710"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1053,310441,'insert','blocks','{"block_hash":"50844c48722edb7681c5d0095c524113415106691e71db34acc44dbc6462bfec","block_index":310442,"block_time":310442000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1054,310442,'parse','blocks','{"block_index":310442,"ledger_hash":"a3728bacfbdd289b7af24248b9bdacd5643bd5412bb993f5380278631eabb9e9","messages_hash":"d7bba011aeaf59c39a79cc90a4d40f11c86d3a44c12b722cdab3f2d32b96b430","txlist_hash":"5d2600af95413d101a9e3d98b2d9f5ea02cf1cf6a28bf7e96870e167638a7be9"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1055,310442,'insert','blocks','{"block_hash":"edc940455632270b7deda409a3489b19b147be89c4d8f434c284e326b749c79a","block_index":310443,"block_time":310443000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1056,310443,'parse','blocks','{"block_index":310443,"ledger_hash":"d829da764f6397b22a6b97ef396b363ef2cf071990df2dc9c0d03806db6a46b5","messages_hash":"fc88f701c65c71e2d90d31fbdc10378ea284a88543543af540b49d970da6e1b3","txlist_hash":"4c595c9a60ccc98d2f6cd75c92c28333174c618337457f9c5ccf362252732081"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1057,310443,'insert','blocks','{"block_hash":"68c9efab28e78e0ef8d316239612f918408ce66be09e8c03428049a6ee3d32e4","block_index":310444,"block_time":310444000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1058,310444,'parse','blocks','{"block_index":310444,"ledger_hash":"ef53249bf0f13e1f2073b815c8d8da3ab744b6d277b29ddbc0bd68bd006af34b","messages_hash":"0e2148899b497e6e1edd0f0401e2b364cd863d67a16b2d2ba01575249fa44e61","txlist_hash":"5ec6d64106ac1c65cd1dd2129c786aca3cf426c7a1b5f6a966b6684b37755293"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1059,310444,'insert','blocks','{"block_hash":"22a2e3896f1c56aefb2d27032a234ea38d93edf2b6331e72e7b4e3952f0234ef","block_index":310445,"block_time":310445000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1060,310445,'parse','blocks','{"block_index":310445,"ledger_hash":"7e731cda90932b2b4844abdbc3ff60683173104e6c72ed81c65d9a17fd4872dc","messages_hash":"a4956f7cb1d7911fe8b00ccee3a92b01db13f0bd2b28ebc66db307c0307c8632","txlist_hash":"6da5abcb8ff2a77c33c7c43061754d9fe8e587157a98e194157faf534d2ee9c6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1061,310445,'insert','blocks','{"block_hash":"e8b0856eff3efce5f5114d6378a4e5c9e69e972825bc55cc00c26954cd1c8837","block_index":310446,"block_time":310446000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1062,310446,'parse','blocks','{"block_index":310446,"ledger_hash":"db55bac8025e95a567ba984f36dcb09357aa3e9b8706bb594e669b628d4e7204","messages_hash":"cb0858f2c2d1df41d5fce1f8f312d4f31646e876d82754898046d94166f86988","txlist_hash":"e8efb64e8f5f867f1c0db99afa9f9a3e3a06d0e1d55e16e9639ca36c3bda5cd4"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1063,310446,'insert','blocks','{"block_hash":"3f4bc894c0bc04ee24ed1e34849af9f719f55df50c8bc36dc059ec5fa0e1c8a8","block_index":310447,"block_time":310447000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1064,310447,'parse','blocks','{"block_index":310447,"ledger_hash":"5cc4fa447cc291ffcce7be3c4f8fc70041bf8af5c2dd591136d4a449095d2570","messages_hash":"8e43ba092a6ba21408ff40f8248c07d7eb27a7deac290ea2d4161bf16d1e21c4","txlist_hash":"026eb6a7315302879ca62afb071da788deb5759eb3de89cf68fec00ec638d9f0"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1065,310447,'insert','blocks','{"block_hash":"6a6c7c07ba5b579abd81a7e888bd36fc0e02a2bcfb69dbfa061b1b64bfa1bd10","block_index":310448,"block_time":310448000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1066,310448,'parse','blocks','{"block_index":310448,"ledger_hash":"ce49854f4493c163bc891888f920fbc6dd8855c30870beb757df69b33de52633","messages_hash":"0423502422f1719bb57b16c22d7155922a4e57dd46c10c67443ce901fabace72","txlist_hash":"e47cc99299a82c9be619633effff5b9cace113215d7f71aa7d2327e69d3ca3bb"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1067,310448,'insert','blocks','{"block_hash":"9e256a436ff8dae9ff77ed4cac4c3bfbbf026681548265a1b62c771d9d8e0779","block_index":310449,"block_time":310449000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1068,310449,'parse','blocks','{"block_index":310449,"ledger_hash":"84557595cf2067a95924119b8ed5fea114acd9ca1b0df4dbe4ae5181a739b5d1","messages_hash":"f4202e68bbe225aaf543a2595773a928240b7033f7f920803d1a2281c5e927d8","txlist_hash":"4e3048f5eeba69570f9ffd86a3573e85bdfb46a92acf60d55c04d41f49f7f870"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1069,310449,'insert','blocks','{"block_hash":"2d9b2ccc3ad3a32910295d7f7f0d0e671b074494adc373fc49aa874d575e36a3","block_index":310450,"block_time":310450000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1070,310450,'parse','blocks','{"block_index":310450,"ledger_hash":"0e3b252b73fb652f904780da9fc59d1081d712337a9b15cf1a56ea72fbe96c73","messages_hash":"fd5af776d6a38d7d8789a15aa9d76e6d304a94a4d5ffdd2943345da446b6ea80","txlist_hash":"c98b9428cf94077169705f3961816f87293eb89bc840167b1ed8ffb074aef48e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1071,310450,'insert','blocks','{"block_hash":"55731a82b9b28b1aa82445a9e351c9df3a58420f1c2f6b1c9db1874483277296","block_index":310451,"block_time":310451000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1072,310451,'parse','blocks','{"block_index":310451,"ledger_hash":"790eccd04e24e5f10f843d63bbdc1538cf1aabb0e8e6c862104be0ef845f603f","messages_hash":"7d18be6c377428f660ba384eec7a473fa7e44627922722cd5b3721c81452432d","txlist_hash":"3fda9e8b7ebc417311c9f14e61c9dca2e490702c1c796eeb1df156f174d52cb5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1073,310451,'insert','blocks','{"block_hash":"016abbaa1163348d8b6bc497cc487880d469f9300374a72ecb793a03d64572aa","block_index":310452,"block_time":310452000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1074,310452,'parse','blocks','{"block_index":310452,"ledger_hash":"30962129b060b63050fe8f249592587d74cdabc4ebb5680230a280da880c8586","messages_hash":"c5922e3df1d54ca1fceb420ba9ed3538aa432da592b8d11ed98dd577bbfd7973","txlist_hash":"a1bf92fe5ae4df49a6059263dfd3a9ed105ec24ae02cb9127c0408f7330d962c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1075,310452,'insert','blocks','{"block_hash":"610be2f49623d3fe8c86eacf3620347ed1dc53194bf01e77393b83541ba5d776","block_index":310453,"block_time":310453000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1076,310453,'parse','blocks','{"block_index":310453,"ledger_hash":"56f4aa1086d8985a00cc295cf9618d976e69ba426b0c3d103bea6b47b58e4355","messages_hash":"8e306a9c943a812c6f52865d39d2964eb365fae7b17b0329b4c251f8dacaaea1","txlist_hash":"a81de51b7b56cc68f599e592be22e11c2f0b51ca27c027f13b58f05b2229a8e1"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1077,310453,'insert','blocks','{"block_hash":"baea6ad71f16d05b37bb30ca881c73bc48fd931f4bf3ac908a28d7681e976ee9","block_index":310454,"block_time":310454000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1078,310454,'parse','blocks','{"block_index":310454,"ledger_hash":"38d14a206003b812cbaf5f200235dbe12aa6a674e5f3379cb186a781cb5a5654","messages_hash":"f28d86ee84fa30a79a74e3205d45c40c3525c6ea58f9201dc6b5c79fdb526dd3","txlist_hash":"022e8475ba7e68c75b4a00387ae431b7bdaa4d125dcd1b19d08e9c431d3e6057"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1079,310454,'insert','blocks','{"block_hash":"31a375541362b0037245816d50628b0428a28255ff6eddd3dd92ef0262a0a744","block_index":310455,"block_time":310455000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1080,310455,'parse','blocks','{"block_index":310455,"ledger_hash":"b2ff303a67c05bc12fcdfdb774ea4ddc690434c3371428b3416d38105f265f28","messages_hash":"70550cc53729dedacfd7599305a6ba24dbd67d5349e610da1b3aeedbbdb670e2","txlist_hash":"91a1dc2fe8dd56e137b210136966950c79b4badcdf787b4b9fafa7985847192a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1081,310455,'insert','blocks','{"block_hash":"5fee45c5019669a46a049142c0c4b6cf382e06127211e822f5f6f7320b6b50fa","block_index":310456,"block_time":310456000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1082,310456,'parse','blocks','{"block_index":310456,"ledger_hash":"6cc16b442fd7758ed7bae9f50367fa60debdb5d81bffc5abccda044573aeaf15","messages_hash":"48b0c3451909c475fc3273ac84abf136b6b81e2cd6e7022018711a1a8a46abf7","txlist_hash":"5125d7f8718a5a26aed1e1db2ce80e8d2eb4d96bbc91277bace52f571b7f8c26"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1083,310456,'insert','blocks','{"block_hash":"9ce5a2673739be824552754ce60fd5098cf954729bb18be1078395f0c437cce9","block_index":310457,"block_time":310457000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1084,310457,'parse','blocks','{"block_index":310457,"ledger_hash":"8fa0401d245b1b1e8b40760a54f331564d8597e242462ec412878e36a9b06800","messages_hash":"9cb1f06768f23821c73219929b52fb339a5aac8a1f60e905bbe974759b296606","txlist_hash":"061dc1962f44d4da9de8ad6bff4d96650058f5d444951e9c808b901db8717c81"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1085,310457,'insert','blocks','{"block_hash":"deca40ba154ebc8c6268668b69a447e35ad292db4504d196e8a91abdc5312aac","block_index":310458,"block_time":310458000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1086,310458,'parse','blocks','{"block_index":310458,"ledger_hash":"520f92700e31b8a35260a280ae11bf8668b0e09d34795a9d88678f2977e19f7c","messages_hash":"da021b6ace7610144fdb7bbee83fdf5f617508c18b3b28d111e9abb6719d510d","txlist_hash":"b0208287d25e4ca6a1856236b4d4c7a3608533f0a47a9c673806d5d3baeb2297"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1087,310458,'insert','blocks','{"block_hash":"839c15fa5eea10c91851e160a73a6a8ee273a31ab5385fe5bd71920cbc08b565","block_index":310459,"block_time":310459000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1088,310459,'parse','blocks','{"block_index":310459,"ledger_hash":"d7f728b78228a914b8767a6caeaf2267e9dbd50490a27f6c23bd96060eab8ee0","messages_hash":"464f88651f885a9c3604bd83352de75252aa4a53b40a94e55cf04cba3860b315","txlist_hash":"21a24d787b30434a230cae77e281636855ff40a8fb4aaaad35eb034835f63e97"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1089,310459,'insert','blocks','{"block_hash":"9b5f351a5c85aaaa737b6a55f20ebf04cafdf36013cdee73c4aaac376ad4562b","block_index":310460,"block_time":310460000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1090,310460,'parse','blocks','{"block_index":310460,"ledger_hash":"33c2b4c6d22888448a2458ff2ce6a1cfae5e858acae2a57e4cc0232980f8fa4a","messages_hash":"626b13a5e856517c5e8246032184d39a3b70a8d63b9abd7a56d824ec3573e3cb","txlist_hash":"2ae25ed250bd603684d0affe8b14af5a1b8d1554beaed08aa8f723cc3c66cf8d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1091,310460,'insert','blocks','{"block_hash":"8131c823f11c22066362517f8c80d93bfc4c3b0a12890bdd51a0e5a043d26b7b","block_index":310461,"block_time":310461000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1092,310461,'parse','blocks','{"block_index":310461,"ledger_hash":"22426912d3317922912326da552af284677c9b76b6416b6c056668f27ae4f19f","messages_hash":"34e034a1eace1f9cc331b124f20bf9b02b06e9920c860d5258bc846afa59be6d","txlist_hash":"13b7774cf2a5a0f3d65031cd5f9ee498eaeee5c1e0e8ecbd346e0427d847a5c0"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1093,310461,'insert','blocks','{"block_hash":"16f8fad8c21560b9d7f88c3b22293192c24f5264c964d2de303a0c742c27d146","block_index":310462,"block_time":310462000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1094,310462,'parse','blocks','{"block_index":310462,"ledger_hash":"74225b62e696aaeafbd4d6db40b41081c7493d9cc44984729d8619ff9450ce32","messages_hash":"c842b12fd725cba9dda8fba23d55154a026780bc6af2b0a8193126e35560c1b3","txlist_hash":"4f23d4da0bbe4b8bb7e00b6b746b4180356013c63f7a6f9b3eee479380b04e4f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1095,310462,'insert','blocks','{"block_hash":"bf919937d8d1b5d5f421b9f59e5893ecb9e77861c6ab6ffe6d2722f52483bd94","block_index":310463,"block_time":310463000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1096,310463,'parse','blocks','{"block_index":310463,"ledger_hash":"b970979bfe0d44ae2f21f7d98bdcc4ae37287b93cad9fa51f32a62337ceba0c1","messages_hash":"f79b69008dcbe3c3362ee21d19da76108039cb558761d4dcf9e1cdb946bcee10","txlist_hash":"7b9a9095733a9d870b33aef4bb15767c32b012c27b52de8731358178b87bfb50"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1097,310463,'insert','blocks','{"block_hash":"91f08dec994751a6057753945249e9c11964b98b654704e585d9239462bc6f60","block_index":310464,"block_time":310464000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1098,310464,'parse','blocks','{"block_index":310464,"ledger_hash":"00007a158b003fcca20c9fcaa8d73a556f0206bc9a7ab3e5c566ea1bda8648cb","messages_hash":"ad018c29e0f488918c6a134fe27ae637509d72341a28725cf82d74bae0b2fe75","txlist_hash":"28d7eceb69efcc6736dd64c65ed218dae2e8d0e9d4d7284b0572a5d1065a9d52"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1099,310464,'insert','blocks','{"block_hash":"5686aaff2718a688b9a69411e237912869699f756c3eb7bf7c3cf2b9e3756b3d","block_index":310465,"block_time":310465000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1100,310465,'parse','blocks','{"block_index":310465,"ledger_hash":"09c407870b056db90148a9e4cb8ada003898ff28c584bec6a5be90514758a851","messages_hash":"1de15ad33c8b345fe1ad52110c252cdbda801e4fa7fb749dfba0dac2dd773497","txlist_hash":"7a4f4ed76efc69ddb5fc13abe258656d6a5e4a845203b5f3f9133716093d7f6d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1101,310465,'insert','blocks','{"block_hash":"8a68637850c014116da671bb544fb5deddda7682223055a58bdcf7b2e79501fc","block_index":310466,"block_time":310466000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1102,310466,'parse','blocks','{"block_index":310466,"ledger_hash":"23bcfdbb44d8fc2ae6a86ea073ab080158014f04516b256a70d846399e7383cd","messages_hash":"39f1eb92ac050aa56760fcdcc747dccdcadc1bc359632b6dd57cecb59d485378","txlist_hash":"57124a566cf1e863b27fa19e3c982fe4a5115119ffb745624697380ad8d5f900"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1103,310466,'insert','blocks','{"block_hash":"d455a803e714bb6bd9e582edc34e624e7e3d80ee6c7b42f7207d763fff5c2bd3","block_index":310467,"block_time":310467000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1104,310467,'parse','blocks','{"block_index":310467,"ledger_hash":"a43abeddb61ad99d57f208cb0c6cc3e0b05a200009e6d90641a2bc7aac707adf","messages_hash":"a2889082db39a64176b16ba1a33377440b0f45dfb7d30b36265477d98bd5a95b","txlist_hash":"fb3b1ef99d2f323e1bdd6998b78b6044c8c7328fafad6b9fea1de7bd0244a265"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1105,310467,'insert','blocks','{"block_hash":"d84dfd2fcf6d8005aeeac01e03b287af788c81955612375510e37a4ab5766891","block_index":310468,"block_time":310468000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1106,310468,'parse','blocks','{"block_index":310468,"ledger_hash":"fc909facd6ba38fa0908fd49a6e2f25bd8284de5265ef761497b8a2d595344b3","messages_hash":"91296f5df4dff2e619fbe8e9d6d94a1e3b196062fc936ed6f07f72b95d912b3e","txlist_hash":"5c84a33365a6954fe639a1c2b1df030b8728d5d331df5ea1ef4a60f976cfa5d2"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1107,310468,'insert','blocks','{"block_hash":"2fbbf2724f537d539b675acb6a479e530c7aac5f93b4045f4356ea4b0f8a8755","block_index":310469,"block_time":310469000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1108,310469,'parse','blocks','{"block_index":310469,"ledger_hash":"09f0d1c9bde8cdd63544fbb5eab46c2954654d32f3736f9975cf860588aa65cf","messages_hash":"8d17e3a799c3ca2be1da35c1c75644f696843093177564b37431e1e40030c925","txlist_hash":"38083f12891b03e2f089b02f7cb6b7fc7b6cb7091613e1d299051717eef6748b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1109,310469,'insert','blocks','{"block_hash":"ebb7c8e3fbe0b123a456d753b85b8c123ca3b315da14a00379ebd34784b28921","block_index":310470,"block_time":310470000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1110,310470,'parse','blocks','{"block_index":310470,"ledger_hash":"41832b12459e778621b8f576e597b9f639390338605b30e5be28423b016b199a","messages_hash":"758117c9999addb364c604cc287e6dc9e51cbe5e326f2690d70ce87a81407597","txlist_hash":"bc0a8227d8698655c56004a73150eb92144469fd22d4ce8bf0f48c27084e99ae"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1111,310470,'insert','blocks','{"block_hash":"fc6f8162c55ecffeaabb09f70f071fd0cb7a9ef1bccaafaf27fe9a936defb739","block_index":310471,"block_time":310471000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1112,310471,'parse','blocks','{"block_index":310471,"ledger_hash":"bf701017153742cb597353349c90ec66f790f222dd98d617d98a0117f1de3274","messages_hash":"b6b19c84723ff33624fbd5154bbf60083c48b83caeea4ceb6667ecce4bd710bb","txlist_hash":"d912707e01e39b078d3cee49df85af32019d7367d199543259bc98864c3ddae5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1113,310471,'insert','blocks','{"block_hash":"57ee5dec5e95b3d9c65a21c407294a32ed538658a6910b16124f18020f16bdf7","block_index":310472,"block_time":310472000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1114,310472,'parse','blocks','{"block_index":310472,"ledger_hash":"2a162bbd5a20f89a39156995658fd0c4715881bc130922d0edf95b60ece60b9c","messages_hash":"2f940bbc941844d4dd73837ff7f6c96ce80efcf385e2d44a1ce5f68d545da057","txlist_hash":"c9f21a9ff022fd95423d3eb56017f4f6f8ad56a9fde974c5d08b37f01a0d0f13"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1115,310472,'insert','blocks','{"block_hash":"33994c8f6d06134f886b47e14cb4b5af8fc0fd66e6bd60b3a71986622483e095","block_index":310473,"block_time":310473000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1116,310473,'parse','blocks','{"block_index":310473,"ledger_hash":"1ce10996ec9e37d8ddc204f038542c6781da88d2d45bae1952a88ab993b81e88","messages_hash":"6559100889b99c05398948cc0d47d0cde899cd6ac3006ac5fc344a0847a87940","txlist_hash":"ad410d51bae82f8322d110d7b2270a1ff74c0ca64dfc31c5d293cfee7dbbb459"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1117,310473,'insert','blocks','{"block_hash":"312ee99e9526e9c240d76e3c3d1fe4c0a21f58156a15f2789605b3e7f7794a09","block_index":310474,"block_time":310474000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1118,310474,'parse','blocks','{"block_index":310474,"ledger_hash":"5ae424c24ca30aad5aca8298a13ae9371f55b15bc789c7731d833c6e7c7cb04e","messages_hash":"9666d2dbbeea540ac615ae637bb58d5e2199bf937a396750d2a877fb8f55c75d","txlist_hash":"b091eceeb4b263d9fa55bd5595cd298ff8b335e03007d62339033cd884137d48"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1119,310474,'insert','blocks','{"block_hash":"bb9289bcd79075962117aef1161b333dbc403efebd593d93fc315146a2f040eb","block_index":310475,"block_time":310475000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1120,310475,'parse','blocks','{"block_index":310475,"ledger_hash":"b9b257efe76a36c340629ceb265822dd10449a08eadc69667a8ea05af5c052f8","messages_hash":"a4d05b2dd9af6d5ba804421e6043f4ccf727eec75ee10a002baafaed45bc772d","txlist_hash":"345c94c7b237efaf2b4e92802125b7d783e456e36ab6868d1f4126698361ba89"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1121,310475,'insert','blocks','{"block_hash":"3712e1ebd195749e0dc92f32f7f451dd76f499bf16d709462309ce358a9370d0","block_index":310476,"block_time":310476000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1122,310476,'parse','blocks','{"block_index":310476,"ledger_hash":"070c06b36f3a77c04fb4bcc3ab1045e95f198f3f970846e59c35db0d03cdaf2c","messages_hash":"1e684aaf8da9104bf057a078360bf99b878290991bb14c8747d8be386a536095","txlist_hash":"014e01dabe6dd8db8e0477f9b12d4f4e3589e41223ec8c9ca5035b942524ca41"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1123,310476,'insert','blocks','{"block_hash":"7381973c554ac2bbdc849e8ea8c4a0ecbb46e7967d322446d0d83c3f9deab918","block_index":310477,"block_time":310477000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1124,310477,'parse','blocks','{"block_index":310477,"ledger_hash":"4954596dd44d112fd0407c215be3c9534a348d6f708ae4a1e66527d1ac2830b1","messages_hash":"8cb254cdf81022602324076922901e7d7c4675bebc066252bd20a7e83c23b76c","txlist_hash":"1351438c8ea21d9619f81e51cfd188dbefd6a4816fe3c30b68210ac160890e9b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1125,310477,'insert','blocks','{"block_hash":"c09ee871af7f2a611d43e6130aed171e301c23c5d1a29d183d40bf15898b4fa0","block_index":310478,"block_time":310478000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1126,310478,'parse','blocks','{"block_index":310478,"ledger_hash":"d9cac2e29863569bc96aaf022437906a534968a17bf965c54bf59931cd92e590","messages_hash":"fceb7400129cbad4ae34656a15a35d8e625e515fdaf78a9f644c43f1da3f836b","txlist_hash":"cbec4d277b86a587fd0463340a8990600046f6f166f6fde0b6ec1ee817ab12bb"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1127,310478,'insert','blocks','{"block_hash":"f3d691ce35f62df56d142160b6e2cdcba19d4995c01f802da6ce30bfe8d30030","block_index":310479,"block_time":310479000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1128,310479,'parse','blocks','{"block_index":310479,"ledger_hash":"2e48a89a55b6f368745e1c022683e93c20bdd920011518f18fd936f2190ac5e0","messages_hash":"b878bf2f4f70e1c15eb60535887db7ba9e9414ec524d0f426bbde5a459a56bb9","txlist_hash":"81d4ab55e022000a1bb3fbe758e497425c5196951c3e7896d3c641d54b4f2db6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1129,310479,'insert','blocks','{"block_hash":"2694e89a62b3abd03a38dfd318c05eb5871f1be00a6e1bf06826fd54d142e681","block_index":310480,"block_time":310480000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1130,310480,'parse','blocks','{"block_index":310480,"ledger_hash":"aa54124d86e74bebd14ea481ac2a5a5186236ffe214747f1af11ac370565525c","messages_hash":"855cd018f577fe76942fe9837dc27d3be5e71bf378b611f25cdd6381b04ed703","txlist_hash":"8d7e0f8a6f052692155e23eb612c02468830485938e7cb77a91e0c2061611385"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1131,310480,'insert','blocks','{"block_hash":"db37d8f98630ebc61767736ae2c523e4e930095bf54259c01de4d36fd60b6f4a","block_index":310481,"block_time":310481000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1132,310481,'insert','transactions','{"block_hash":"db37d8f98630ebc61767736ae2c523e4e930095bf54259c01de4d36fd60b6f4a","block_index":310481,"block_time":310481000,"btc_amount":0,"data":"0000000200000000000000010000000005f5e1006f8d6ae8a3b381663118b4e1eff4cfc7d0954dd6ec68656c6c6f","destination":"","fee":6375,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"b00bdf03402d81a2cbdbeac4b0df90cff5ab6bf9688f653383d49fe42b8422a5","tx_index":482}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(1133,310481,'insert','debits','{"action":"send","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310481,"event":"b00bdf03402d81a2cbdbeac4b0df90cff5ab6bf9688f653383d49fe42b8422a5","quantity":100000000,"tx_index":482}',0,'DEBIT');
-INSERT INTO messages VALUES(1134,310481,'insert','credits','{"address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"XCP","block_index":310481,"calling_function":"send","event":"b00bdf03402d81a2cbdbeac4b0df90cff5ab6bf9688f653383d49fe42b8422a5","quantity":100000000,"tx_index":482}',0,'CREDIT');
-INSERT INTO messages VALUES(1135,310481,'insert','sends','{"asset":"XCP","block_index":310481,"destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","memo":"68656c6c6f","quantity":100000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"b00bdf03402d81a2cbdbeac4b0df90cff5ab6bf9688f653383d49fe42b8422a5","tx_index":482}',0,'ENHANCED_SEND');
-INSERT INTO messages VALUES(1136,310481,'parse','transactions','{"supported":true,"tx_hash":"b00bdf03402d81a2cbdbeac4b0df90cff5ab6bf9688f653383d49fe42b8422a5","tx_index":482}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(1137,310481,'parse','blocks','{"block_index":310481,"ledger_hash":"fbbe1266bb773e5a3f5b48e82566ff75bc74bfea9424f81f670952565db15c59","messages_hash":"7b058d359a23326a73d98644d5cb0312360ee69f98c85814b2d574408f8d442d","txlist_hash":"8bc755d288d8d6525d9161e5d5072631a72e46d2373de37c7851aa10f3479ed5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1138,310481,'insert','blocks','{"block_hash":"2e27db87dfb6439c006637734e876cc662d1ca74c717756f90f0e535df0787d6","block_index":310482,"block_time":310482000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1139,310482,'insert','transactions','{"block_hash":"2e27db87dfb6439c006637734e876cc662d1ca74c717756f90f0e535df0787d6","block_index":310482,"block_time":310482000,"btc_amount":0,"data":"0000000200000000000000010000000005f5e1006f4838d8b3588c4c7ba7c1d06f866e9b3739c63037fade0001","destination":"","fee":6350,"source":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","supported":true,"tx_hash":"c8716524f33646b9af94d6f5e52494ff3b34466497094b1db2ab920e4f79bc34","tx_index":483}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(1140,310482,'insert','debits','{"action":"send","address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"XCP","block_index":310482,"event":"c8716524f33646b9af94d6f5e52494ff3b34466497094b1db2ab920e4f79bc34","quantity":100000000,"tx_index":483}',0,'DEBIT');
-INSERT INTO messages VALUES(1141,310482,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310482,"calling_function":"send","event":"c8716524f33646b9af94d6f5e52494ff3b34466497094b1db2ab920e4f79bc34","quantity":100000000,"tx_index":483}',0,'CREDIT');
-INSERT INTO messages VALUES(1142,310482,'insert','sends','{"asset":"XCP","block_index":310482,"destination":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","memo":"fade0001","quantity":100000000,"source":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","status":"valid","tx_hash":"c8716524f33646b9af94d6f5e52494ff3b34466497094b1db2ab920e4f79bc34","tx_index":483}',0,'ENHANCED_SEND');
-INSERT INTO messages VALUES(1143,310482,'parse','transactions','{"supported":true,"tx_hash":"c8716524f33646b9af94d6f5e52494ff3b34466497094b1db2ab920e4f79bc34","tx_index":483}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(1144,310482,'parse','blocks','{"block_index":310482,"ledger_hash":"bd28a97e90054319c4c301c3e99d68aaa5e1bf5a145a8f2c4529040bb8137209","messages_hash":"222ce836127c79d43fc5847a1cc427f7218fe84d23c2454ae1fd35585c9234dc","txlist_hash":"838486910c9c7722fb3afbac7b0514cdd94126486f6671697423b34164b9906f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1145,310482,'insert','blocks','{"block_hash":"013bac61f8e33c8d8d0f60f5e6a4ec3de9b16696703dea9802f64a258601c460","block_index":310483,"block_time":310483000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1146,310483,'parse','blocks','{"block_index":310483,"ledger_hash":"fbbeacec99c9ed99a7fc37cdd5673fe8bdce08eba7fcb25b696e262af29ca5d8","messages_hash":"14e0c00fe389f298230aabba0e084ff09875e49dba8b5259fcb99a3604081345","txlist_hash":"2be6ebe515877a76a7b83b1929ca2ef77be1df3aa3d6766c0c47450898ad7adf"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1147,310483,'insert','blocks','{"block_hash":"7cac2b3630c31b592fa0497792bed58d3c41120c009471c348b16b5578b3aa2b","block_index":310484,"block_time":310484000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1148,310484,'parse','blocks','{"block_index":310484,"ledger_hash":"310bc7c61c1325ee3f97e888658fd74e1fe4adccef4924abb6978150fe6f3dad","messages_hash":"00e1362b924985f5761ae514112cc30c143a610d15e936fd909a52e8735eaaa1","txlist_hash":"ec800faf2b61e7b1c2c85157d09b058f59defc14ffbe64d82dffea2a0368ade2"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1149,310484,'insert','blocks','{"block_hash":"eab5febc9668cd438178496417b22da5f77ceaed5bb6e01fc0f04bef1f5b4478","block_index":310485,"block_time":310485000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1150,310485,'parse','blocks','{"block_index":310485,"ledger_hash":"b7f66db9ea5838b65286422d0cac262f6b81bbd5a7397adf7b8d85b21354dbcd","messages_hash":"f424a423cf7f105c5f1000cbbc4552b83589f70e959c2a062eca313f5713271d","txlist_hash":"c2c0301119eb8f6e5ee8f72a4f93366a7c2b9f327f087a5aabff7d73892ca74f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1151,310485,'insert','blocks','{"block_hash":"d4fbe610cc60987f2d1d35c7d8ad3ce32156ee5fe36ef8cc4f08b46836388862","block_index":310486,"block_time":310486000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1152,310486,'insert','transactions','{"block_hash":"d4fbe610cc60987f2d1d35c7d8ad3ce32156ee5fe36ef8cc4f08b46836388862","block_index":310486,"block_time":310486000,"btc_amount":0,"data":"0000001e52bb33003ff0000000000000004c4b4009556e69742054657374","destination":"","fee":6800,"source":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","supported":true,"tx_hash":"3b95e07a2194174ac020de27e8b2b6ee24d5fc120f118df516ba28495657cf14","tx_index":487}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(1153,310486,'insert','broadcasts','{"block_index":310486,"fee_fraction_int":5000000,"locked":false,"source":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","status":"valid","text":"Unit Test","timestamp":1388000000,"tx_hash":"3b95e07a2194174ac020de27e8b2b6ee24d5fc120f118df516ba28495657cf14","tx_index":487,"value":1.0}',0,'BROADCAST');
-INSERT INTO messages VALUES(1154,310486,'parse','transactions','{"supported":true,"tx_hash":"3b95e07a2194174ac020de27e8b2b6ee24d5fc120f118df516ba28495657cf14","tx_index":487}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(1155,310486,'parse','blocks','{"block_index":310486,"ledger_hash":"0f829769e4da773089d7b05047a499db5f6d1b17795d4fba912882caee9813e0","messages_hash":"3c08e19ebcb07664b7679a724ed18c73d7c8c7698a56f85f2fec5e7eb5a3ebd8","txlist_hash":"ea66c7d9251a0eb884fef48de05cb58bbcf3a9e08319f01c96f180aeb0de9bab"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1156,310486,'insert','blocks','{"block_hash":"32aa1b132d0643350bbb62dbd5f38ae0c270d8f491a2012c83b99158d58e464f","block_index":310487,"block_time":310487000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1157,310487,'insert','transactions','{"block_hash":"32aa1b132d0643350bbb62dbd5f38ae0c270d8f491a2012c83b99158d58e464f","block_index":310487,"block_time":310487000,"btc_amount":5430,"data":"00000028000152bb3301000000000000000900000000000000090000000000000000000013b000000064","destination":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","fee":7650,"source":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","supported":true,"tx_hash":"41e821ae1c6b553d0fa5d5a807b2e7e9ffaec5d62706d9d2a59c6e65a3ed9cef","tx_index":488}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(1158,310487,'insert','debits','{"action":"bet","address":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","asset":"XCP","block_index":310487,"event":"41e821ae1c6b553d0fa5d5a807b2e7e9ffaec5d62706d9d2a59c6e65a3ed9cef","quantity":9,"tx_index":488}',0,'DEBIT');
-INSERT INTO messages VALUES(1159,310487,'insert','bets','{"bet_type":1,"block_index":310487,"counterwager_quantity":9,"counterwager_remaining":9,"deadline":1388000001,"expiration":100,"expire_index":310587,"fee_fraction_int":5000000.0,"feed_address":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","leverage":5040,"source":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","status":"open","target_value":0.0,"tx_hash":"41e821ae1c6b553d0fa5d5a807b2e7e9ffaec5d62706d9d2a59c6e65a3ed9cef","tx_index":488,"wager_quantity":9,"wager_remaining":9}',0,'OPEN_BET');
-INSERT INTO messages VALUES(1160,310487,'parse','transactions','{"supported":true,"tx_hash":"41e821ae1c6b553d0fa5d5a807b2e7e9ffaec5d62706d9d2a59c6e65a3ed9cef","tx_index":488}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(1161,310487,'parse','blocks','{"block_index":310487,"ledger_hash":"4b4d7a79843342e96e5d9d71bbc49690245b3098be75e7b86f273021d526216d","messages_hash":"900c8266900450b11b7b896e61baaea9e7f4677b5e722ac78cf07985c65a2e5b","txlist_hash":"76fbd411c43f3f67c8bf61138c5672de0cfda2d98f112a6e50b3a5d084d7cc72"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1162,310487,'insert','blocks','{"block_hash":"80b8dd5d7ce2e4886e6721095b892a39fb699980fe2bc1c17e747f822f4c4b1b","block_index":310488,"block_time":310488000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1163,310488,'insert','transactions','{"block_hash":"80b8dd5d7ce2e4886e6721095b892a39fb699980fe2bc1c17e747f822f4c4b1b","block_index":310488,"block_time":310488000,"btc_amount":0,"data":"0000001e52bb33023ff000000000000000000000096f7074696f6e732030","destination":"","fee":6800,"source":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","supported":true,"tx_hash":"870fb08b373705423f31ccd91fdbcabe135ad92d74e709a959dfa2e12f9a6638","tx_index":489}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(1164,310488,'insert','broadcasts','{"block_index":310488,"fee_fraction_int":0,"locked":false,"source":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","status":"valid","text":"options 0","timestamp":1388000002,"tx_hash":"870fb08b373705423f31ccd91fdbcabe135ad92d74e709a959dfa2e12f9a6638","tx_index":489,"value":1.0}',0,'BROADCAST');
-INSERT INTO messages VALUES(1165,310488,'parse','transactions','{"supported":true,"tx_hash":"870fb08b373705423f31ccd91fdbcabe135ad92d74e709a959dfa2e12f9a6638","tx_index":489}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(1166,310488,'parse','blocks','{"block_index":310488,"ledger_hash":"2d7e59026ea4c8933e9c7474936931ca49d4af91f9b9985f3c76085fb3a69104","messages_hash":"7ea198be8ae7e7f46844b1f34a4021ac5612d6dce70b354a5bedb8e8d2ff7762","txlist_hash":"78e801f2d1968c860ac2563e9cc912c18cb8e5f95996011e84c289833fbd46da"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1167,310488,'insert','blocks','{"block_hash":"2efdb36f986b3e3ccc6cc9b0c1c3cdcb07429fb43cbc0cc3b6c87d1b33f258b6","block_index":310489,"block_time":310489000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1168,310489,'insert','transactions','{"block_hash":"2efdb36f986b3e3ccc6cc9b0c1c3cdcb07429fb43cbc0cc3b6c87d1b33f258b6","block_index":310489,"block_time":310489000,"btc_amount":0,"data":"0000001e52bb33033ff000000000000000000000046c6f636b","destination":"","fee":6800,"source":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","supported":true,"tx_hash":"685d7f99fa76a05201c3239a4e0d9060ea53307b171f6ad7d482a26c73e9c0d1","tx_index":490}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(1169,310489,'insert','broadcasts','{"block_index":310489,"fee_fraction_int":null,"locked":true,"source":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","status":"valid","text":null,"timestamp":0,"tx_hash":"685d7f99fa76a05201c3239a4e0d9060ea53307b171f6ad7d482a26c73e9c0d1","tx_index":490,"value":null}',0,'BROADCAST');
-INSERT INTO messages VALUES(1170,310489,'parse','transactions','{"supported":true,"tx_hash":"685d7f99fa76a05201c3239a4e0d9060ea53307b171f6ad7d482a26c73e9c0d1","tx_index":490}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(1171,310489,'parse','blocks','{"block_index":310489,"ledger_hash":"716354a370f344980e98785a444b56b21188bc699e7fbd0c877b6f2fabf35efc","messages_hash":"d9a37c0bf78624a6bb7630e8f1223f2157df34407341d9813e9ccbc807acf5db","txlist_hash":"23d9af03e6aa29fbab29c8e2a5a0419680053bba19594105cc8ef4d3db05d418"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1172,310489,'insert','blocks','{"block_hash":"e2cb04b8a7368c95359c9d5ff33e64209200fb606de0d64b7c0f67bb1cb8d87c","block_index":310490,"block_time":310490000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1173,310490,'insert','transactions','{"block_hash":"e2cb04b8a7368c95359c9d5ff33e64209200fb606de0d64b7c0f67bb1cb8d87c","block_index":310490,"block_time":310490000,"btc_amount":0,"data":"0000001e52bb33043ff000000000000000000000096f7074696f6e732031","destination":"","fee":6800,"source":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","supported":true,"tx_hash":"7c437705c315212315c85c0b8ba09d358679c91be20b54f30929c5a6052426af","tx_index":491}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(1174,310490,'insert','broadcasts','{"block_index":310490,"fee_fraction_int":0,"locked":false,"source":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","status":"valid","text":"options 1","timestamp":1388000004,"tx_hash":"7c437705c315212315c85c0b8ba09d358679c91be20b54f30929c5a6052426af","tx_index":491,"value":1.0}',0,'BROADCAST');
-INSERT INTO messages VALUES(1175,310490,'parse','transactions','{"supported":true,"tx_hash":"7c437705c315212315c85c0b8ba09d358679c91be20b54f30929c5a6052426af","tx_index":491}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(1176,310490,'parse','blocks','{"block_index":310490,"ledger_hash":"906a38f4256f50312891119c99721537992438af85421e317574ce1810e2b909","messages_hash":"d25fc5c1d965de9ba7a2e9642ee91920b982ee9304bc4b5f3b9a9a7da965706a","txlist_hash":"5f934032dce4102cd1d72d3f887526e78baa4a78991bc43cf0a1ebefe08fdec7"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1177,310490,'insert','blocks','{"block_hash":"811abd7cf2b768cfdaa84ab44c63f4463c96a368ead52125bf149cf0c7447b16","block_index":310491,"block_time":310491000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1178,310491,'insert','transactions','{"block_hash":"811abd7cf2b768cfdaa84ab44c63f4463c96a368ead52125bf149cf0c7447b16","block_index":310491,"block_time":310491000,"btc_amount":0,"data":"0000000a00000000000000010000000005f5e100000000000000000000000000000c350007d000000000000dbba0","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"74db175c4669a3d3a59e3fcddce9e97fcd7d12c35b58ef31845a1b20a1739498","tx_index":492}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(1179,310491,'insert','debits','{"action":"open order","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310491,"event":"74db175c4669a3d3a59e3fcddce9e97fcd7d12c35b58ef31845a1b20a1739498","quantity":100000000,"tx_index":492}',0,'DEBIT');
-INSERT INTO messages VALUES(1180,310491,'insert','orders','{"block_index":310491,"expiration":2000,"expire_index":312491,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":900000,"fee_required_remaining":900000,"get_asset":"BTC","get_quantity":800000,"get_remaining":800000,"give_asset":"XCP","give_quantity":100000000,"give_remaining":100000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","tx_hash":"74db175c4669a3d3a59e3fcddce9e97fcd7d12c35b58ef31845a1b20a1739498","tx_index":492}',0,'OPEN_ORDER');
-INSERT INTO messages VALUES(1181,310491,'parse','transactions','{"supported":true,"tx_hash":"74db175c4669a3d3a59e3fcddce9e97fcd7d12c35b58ef31845a1b20a1739498","tx_index":492}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(1182,310491,'parse','blocks','{"block_index":310491,"ledger_hash":"3114d8091cfcaa9944c6fab49d51950535c4ef269877d58c372ed80b2b472ec6","messages_hash":"9671cfedb3124b67ed996c547cb26a32e95490009ad56065c79be54a28c45994","txlist_hash":"f065728a3544adc085fae976759c0d040a34ca0a8ddd39260b55f0262cd5baa8"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1183,310491,'insert','blocks','{"block_hash":"8a09b2faf0a7ad67eb4ab5c948b9769fc87eb2ec5e16108f2cde8bd9e6cf7607","block_index":310492,"block_time":310492000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1184,310492,'insert','transactions','{"block_hash":"8a09b2faf0a7ad67eb4ab5c948b9769fc87eb2ec5e16108f2cde8bd9e6cf7607","block_index":310492,"block_time":310492000,"btc_amount":0,"data":"0000000a000000000000000000000000000c350000000000000000010000000005f5e10007d00000000000000000","destination":"","fee":1000000,"source":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","supported":true,"tx_hash":"1b294dd8592e76899b1c106782e4c96e63114abd8e3fa09ab6d2d52496b5bf81","tx_index":493}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(1185,310492,'insert','orders','{"block_index":310492,"expiration":2000,"expire_index":312492,"fee_provided":1000000,"fee_provided_remaining":1000000,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":100000000,"get_remaining":100000000,"give_asset":"BTC","give_quantity":800000,"give_remaining":800000,"source":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","status":"open","tx_hash":"1b294dd8592e76899b1c106782e4c96e63114abd8e3fa09ab6d2d52496b5bf81","tx_index":493}',0,'OPEN_ORDER');
-INSERT INTO messages VALUES(1186,310492,'update','orders','{"fee_provided_remaining":6800,"fee_required_remaining":892800,"get_remaining":0,"give_remaining":0,"status":"open","tx_hash":"74db175c4669a3d3a59e3fcddce9e97fcd7d12c35b58ef31845a1b20a1739498"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(1187,310492,'update','orders','{"fee_provided_remaining":992800,"fee_required_remaining":0,"get_remaining":0,"give_remaining":0,"status":"open","tx_hash":"1b294dd8592e76899b1c106782e4c96e63114abd8e3fa09ab6d2d52496b5bf81"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(1188,310492,'insert','order_matches','{"backward_asset":"BTC","backward_quantity":800000,"block_index":310492,"fee_paid":7200,"forward_asset":"XCP","forward_quantity":100000000,"id":"74db175c4669a3d3a59e3fcddce9e97fcd7d12c35b58ef31845a1b20a1739498_1b294dd8592e76899b1c106782e4c96e63114abd8e3fa09ab6d2d52496b5bf81","match_expire_index":310512,"status":"pending","tx0_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","tx0_block_index":310491,"tx0_expiration":2000,"tx0_hash":"74db175c4669a3d3a59e3fcddce9e97fcd7d12c35b58ef31845a1b20a1739498","tx0_index":492,"tx1_address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","tx1_block_index":310492,"tx1_expiration":2000,"tx1_hash":"1b294dd8592e76899b1c106782e4c96e63114abd8e3fa09ab6d2d52496b5bf81","tx1_index":493}',0,'ORDER_MATCH');
-INSERT INTO messages VALUES(1189,310492,'parse','transactions','{"supported":true,"tx_hash":"1b294dd8592e76899b1c106782e4c96e63114abd8e3fa09ab6d2d52496b5bf81","tx_index":493}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(1190,310492,'parse','blocks','{"block_index":310492,"ledger_hash":"98af18583618fdeed545347c013763d068e8294405d265911cc5e1bc420bc740","messages_hash":"0d34fbc26126add5a57b7e8f6f71bad150d7232abf046f3fa9b1fc72b10d61b2","txlist_hash":"daf4d2c1a1ad5206abcf7744bdd06fae99c442fb2607a843dcabb5727d02916e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1191,310492,'insert','blocks','{"block_hash":"c19e2915b750279b2be4b52e57e5ce29f63dffb4e14d9aad30c9e820affc0cbf","block_index":310493,"block_time":310493000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1192,310493,'insert','transactions','{"block_hash":"c19e2915b750279b2be4b52e57e5ce29f63dffb4e14d9aad30c9e820affc0cbf","block_index":310493,"block_time":310493000,"btc_amount":62000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","supported":true,"tx_hash":"c0733e1287afb1bb3d2fdacd1db7c74ea84f14362f3a8d1c038e662e1d0b1b1a","tx_index":494}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(1193,310493,'insert','credits','{"address":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","asset":"XCP","block_index":310493,"calling_function":"burn","event":"c0733e1287afb1bb3d2fdacd1db7c74ea84f14362f3a8d1c038e662e1d0b1b1a","quantity":92995878046,"tx_index":494}',0,'CREDIT');
-INSERT INTO messages VALUES(1194,310493,'insert','burns','{"block_index":310493,"burned":62000000,"earned":92995878046,"source":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","status":"valid","tx_hash":"c0733e1287afb1bb3d2fdacd1db7c74ea84f14362f3a8d1c038e662e1d0b1b1a","tx_index":494}',0,'BURN');
-INSERT INTO messages VALUES(1195,310493,'parse','blocks','{"block_index":310493,"ledger_hash":"29119cd30a4733916fbfd0551506eaa16f7bb1bdfbdf8d17ac4e5bb20d1cb09c","messages_hash":"53a339feb73df3a98bc4acc84af77e111d4780533c8f5a26cf250594d9613cf2","txlist_hash":"7ec4cfa94544900c8e8732ad51be7cee6452aa1884ea940cd5c98862fb4aaba6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1196,310493,'insert','blocks','{"block_hash":"7dda1d3e12785313d5651ee5314d0aecf17588196f9150b10c55695dbaebee5d","block_index":310494,"block_time":310494000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1197,310494,'insert','transactions','{"block_hash":"7dda1d3e12785313d5651ee5314d0aecf17588196f9150b10c55695dbaebee5d","block_index":310494,"block_time":310494000,"btc_amount":0,"data":"00000014000000063e985ffd00000000000000640100000000000000000000","destination":"","fee":6800,"source":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","supported":true,"tx_hash":"321bed395482e034f2ce0a4dbf28d1f800592a658e26ea91ae9c5b0928204503","tx_index":495}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(1198,310494,'insert','debits','{"action":"issuance fee","address":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","asset":"XCP","block_index":310494,"event":"321bed395482e034f2ce0a4dbf28d1f800592a658e26ea91ae9c5b0928204503","quantity":50000000,"tx_index":495}',0,'DEBIT');
-INSERT INTO messages VALUES(1199,310494,'insert','assets','{"asset_id":"26819977213","asset_longname":null,"asset_name":"DIVIDEND","block_index":310494}',0,'ASSET_CREATION');
-INSERT INTO messages VALUES(1200,310494,'insert','issuances','{"asset":"DIVIDEND","asset_longname":null,"block_index":310494,"call_date":0,"call_price":0.0,"callable":false,"description":"","divisible":true,"fee_paid":50000000,"issuer":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","locked":false,"quantity":100,"reset":false,"source":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","status":"valid","transfer":false,"tx_hash":"321bed395482e034f2ce0a4dbf28d1f800592a658e26ea91ae9c5b0928204503","tx_index":495}',0,'ASSET_ISSUANCE');
-INSERT INTO messages VALUES(1201,310494,'insert','credits','{"address":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","asset":"DIVIDEND","block_index":310494,"calling_function":"issuance","event":"321bed395482e034f2ce0a4dbf28d1f800592a658e26ea91ae9c5b0928204503","quantity":100,"tx_index":495}',0,'CREDIT');
-INSERT INTO messages VALUES(1202,310494,'parse','transactions','{"supported":true,"tx_hash":"321bed395482e034f2ce0a4dbf28d1f800592a658e26ea91ae9c5b0928204503","tx_index":495}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(1203,310494,'parse','blocks','{"block_index":310494,"ledger_hash":"72d71bd72263699ea9f2b097ad141be5bc394f49d8b0b0a6b2ff6a87b0ee3919","messages_hash":"0d3c87692d49dc033eed975eb8b8ee17ff2f0f877c8ed5a5866f73ce63bf8715","txlist_hash":"9350c3ba33d0546d1194c5fa767ced28834b26246aedc56d89b1d48ec4f26014"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1204,310494,'insert','blocks','{"block_hash":"4769aa7030f28a05a137a85ef4ee0c1765c37013773212b93ec90f1227168b67","block_index":310495,"block_time":310495000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1205,310495,'insert','transactions','{"block_hash":"4769aa7030f28a05a137a85ef4ee0c1765c37013773212b93ec90f1227168b67","block_index":310495,"block_time":310495000,"btc_amount":5430,"data":"00000000000000063e985ffd000000000000000a","destination":"mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj","fee":7650,"source":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","supported":true,"tx_hash":"02156b9a1f643fb48330396274a37620c8abbbe5eddb2f8b53dadd135f5d2e2e","tx_index":496}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(1206,310495,'insert','debits','{"action":"send","address":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","asset":"DIVIDEND","block_index":310495,"event":"02156b9a1f643fb48330396274a37620c8abbbe5eddb2f8b53dadd135f5d2e2e","quantity":10,"tx_index":496}',0,'DEBIT');
-INSERT INTO messages VALUES(1207,310495,'insert','credits','{"address":"mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj","asset":"DIVIDEND","block_index":310495,"calling_function":"send","event":"02156b9a1f643fb48330396274a37620c8abbbe5eddb2f8b53dadd135f5d2e2e","quantity":10,"tx_index":496}',0,'CREDIT');
-INSERT INTO messages VALUES(1208,310495,'insert','sends','{"asset":"DIVIDEND","block_index":310495,"destination":"mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj","quantity":10,"source":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","status":"valid","tx_hash":"02156b9a1f643fb48330396274a37620c8abbbe5eddb2f8b53dadd135f5d2e2e","tx_index":496}',0,'SEND');
-INSERT INTO messages VALUES(1209,310495,'parse','transactions','{"supported":true,"tx_hash":"02156b9a1f643fb48330396274a37620c8abbbe5eddb2f8b53dadd135f5d2e2e","tx_index":496}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(1210,310495,'parse','blocks','{"block_index":310495,"ledger_hash":"5a7e5a36882466373d576bb5f4ccd1bc72ecaf548b9589baa803a7275a7a24cd","messages_hash":"56518bc9abc11bf108188834058bb9c51c9b8dc3b6276116c5b786b07c797fab","txlist_hash":"09e9db121649cacd979fd18bbaa35e519361e727e7e072e2f2f86291160cdb29"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1211,310495,'insert','blocks','{"block_hash":"65884816927e8c566655e85c07bc2bc2c7ee26e625742f219939d43238fb31f8","block_index":310496,"block_time":310496000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1212,310496,'insert','transactions','{"block_hash":"65884816927e8c566655e85c07bc2bc2c7ee26e625742f219939d43238fb31f8","block_index":310496,"block_time":310496000,"btc_amount":5430,"data":"00000000000000000000000100000015a4018c1e","destination":"mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj","fee":7650,"source":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","supported":true,"tx_hash":"a35ab1736565aceddbd1d71f92fc7f39d1361006aa9099f731e54e762964d5ba","tx_index":497}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(1213,310496,'insert','debits','{"action":"send","address":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","asset":"XCP","block_index":310496,"event":"a35ab1736565aceddbd1d71f92fc7f39d1361006aa9099f731e54e762964d5ba","quantity":92945878046,"tx_index":497}',0,'DEBIT');
-INSERT INTO messages VALUES(1214,310496,'insert','credits','{"address":"mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj","asset":"XCP","block_index":310496,"calling_function":"send","event":"a35ab1736565aceddbd1d71f92fc7f39d1361006aa9099f731e54e762964d5ba","quantity":92945878046,"tx_index":497}',0,'CREDIT');
-INSERT INTO messages VALUES(1215,310496,'insert','sends','{"asset":"XCP","block_index":310496,"destination":"mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj","quantity":92945878046,"source":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","status":"valid","tx_hash":"a35ab1736565aceddbd1d71f92fc7f39d1361006aa9099f731e54e762964d5ba","tx_index":497}',0,'SEND');
-INSERT INTO messages VALUES(1216,310496,'parse','transactions','{"supported":true,"tx_hash":"a35ab1736565aceddbd1d71f92fc7f39d1361006aa9099f731e54e762964d5ba","tx_index":497}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(1217,310496,'parse','blocks','{"block_index":310496,"ledger_hash":"7ac6121c624b634f44695172761830926afe76bb18c4cc9195773f3a26966941","messages_hash":"1b1ed76f99d39b36f4d0737299ce15b21fed9e077d0476658c023b09819853a7","txlist_hash":"9eda85cce745579122ba9c6e24b63cd83f2e5161031a34e6ee9bf08b80823cb4"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1218,310496,'insert','blocks','{"block_hash":"f1118591fe79b8bf52ccf0c5de9826bfd266b1fdc24b44676cf22bbcc76d464e","block_index":310497,"block_time":310497000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1219,310497,'insert','transactions','{"block_hash":"f1118591fe79b8bf52ccf0c5de9826bfd266b1fdc24b44676cf22bbcc76d464e","block_index":310497,"block_time":310497000,"btc_amount":0,"data":"00000014000000000aa4097d0000000005f5e100010000000000000000000c506172656e74206173736574","destination":"","fee":6300,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"076ae3d8eeb7fb40d2ae27692340157c746d9832806766b0dac5adb1526dc78f","tx_index":498}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(1220,310497,'insert','debits','{"action":"issuance fee","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310497,"event":"076ae3d8eeb7fb40d2ae27692340157c746d9832806766b0dac5adb1526dc78f","quantity":50000000,"tx_index":498}',0,'DEBIT');
-INSERT INTO messages VALUES(1221,310497,'insert','assets','{"asset_id":"178522493","asset_longname":null,"asset_name":"PARENT","block_index":310497}',0,'ASSET_CREATION');
-INSERT INTO messages VALUES(1222,310497,'insert','issuances','{"asset":"PARENT","asset_longname":null,"block_index":310497,"call_date":0,"call_price":0.0,"callable":false,"description":"Parent asset","divisible":true,"fee_paid":50000000,"issuer":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","locked":false,"quantity":100000000,"reset":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","transfer":false,"tx_hash":"076ae3d8eeb7fb40d2ae27692340157c746d9832806766b0dac5adb1526dc78f","tx_index":498}',0,'ASSET_ISSUANCE');
-INSERT INTO messages VALUES(1223,310497,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"PARENT","block_index":310497,"calling_function":"issuance","event":"076ae3d8eeb7fb40d2ae27692340157c746d9832806766b0dac5adb1526dc78f","quantity":100000000,"tx_index":498}',0,'CREDIT');
-INSERT INTO messages VALUES(1224,310497,'parse','transactions','{"supported":true,"tx_hash":"076ae3d8eeb7fb40d2ae27692340157c746d9832806766b0dac5adb1526dc78f","tx_index":498}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(1225,310497,'parse','blocks','{"block_index":310497,"ledger_hash":"28c6e92b2299b9cbbb5953f8b7ff3de0fe962d15642ba27e43faa64e1935e819","messages_hash":"ac8d8759fbddc8f92ad8b5d8b4637a63b8d21a04ba1a4126baf2b42a87edfce3","txlist_hash":"ff8136601b9e0138a999d1f0467af6e8535a2bcdd2b622af7be0178a083b9519"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1226,310497,'insert','blocks','{"block_hash":"b7058b6d1ddc325a10bf33144937e06ce6025215b416518ae120da9440ae279e","block_index":310498,"block_time":310498000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1227,310498,'insert','transactions','{"block_hash":"b7058b6d1ddc325a10bf33144937e06ce6025215b416518ae120da9440ae279e","block_index":310498,"block_time":310498000,"btc_amount":0,"data":"0000001501530821671b10650000000005f5e10001108e90a57dba9967c422e83080f22f0c684368696c64206f6620706172656e74","destination":"","fee":6550,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"0abfce2662c05852fd8b181a60900678643cedad47b23a853b8c4eda82cb2cbf","tx_index":499}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(1228,310498,'insert','debits','{"action":"issuance fee","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310498,"event":"0abfce2662c05852fd8b181a60900678643cedad47b23a853b8c4eda82cb2cbf","quantity":25000000,"tx_index":499}',0,'DEBIT');
-INSERT INTO messages VALUES(1229,310498,'insert','assets','{"asset_id":"95428956661682277","asset_longname":"PARENT.already.issued","asset_name":"A95428956661682277","block_index":310498}',0,'ASSET_CREATION');
-INSERT INTO messages VALUES(1230,310498,'insert','issuances','{"asset":"A95428956661682277","asset_longname":"PARENT.already.issued","block_index":310498,"call_date":0,"call_price":0.0,"callable":false,"description":"Child of parent","divisible":true,"fee_paid":25000000,"issuer":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","locked":false,"quantity":100000000,"reset":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","transfer":false,"tx_hash":"0abfce2662c05852fd8b181a60900678643cedad47b23a853b8c4eda82cb2cbf","tx_index":499}',0,'ASSET_ISSUANCE');
-INSERT INTO messages VALUES(1231,310498,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"A95428956661682277","block_index":310498,"calling_function":"issuance","event":"0abfce2662c05852fd8b181a60900678643cedad47b23a853b8c4eda82cb2cbf","quantity":100000000,"tx_index":499}',0,'CREDIT');
-INSERT INTO messages VALUES(1232,310498,'parse','transactions','{"supported":true,"tx_hash":"0abfce2662c05852fd8b181a60900678643cedad47b23a853b8c4eda82cb2cbf","tx_index":499}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(1233,310498,'parse','blocks','{"block_index":310498,"ledger_hash":"5fe6cdb0828379bf240fad99c68bba34e1889bbc19605ce5c297b82352264414","messages_hash":"113207bd13dda56b5e5edf305f70a56e62cc861184e1e95a64e79ce100462c98","txlist_hash":"b488f6f0e6c233f202ee17c0843236d464144e79c870af88bae56355ae9372b7"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1234,310498,'insert','blocks','{"block_hash":"1950e1a4d7fc820ed9603f6df6819c3c953c277c726340dec2a4253e261a1764","block_index":310499,"block_time":310499000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1235,310499,'parse','blocks','{"block_index":310499,"ledger_hash":"b9fcbdafddd46fdda061f6e9f8744b426b6ca37e32b315df1098cbc7899ae9b9","messages_hash":"d6aedacd4f81520d86ae47c9c776d17a213c706a5cf7c91203a4299261d1648c","txlist_hash":"032166892f568bb97f4f69ef5bdf49cc1b15cc9f8c7f6c1f3e1f9d54816ad7e5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1236,310499,'insert','blocks','{"block_hash":"54aeaf47d5387964e2d51617bf3af50520a0449410e0d096cf8c2aa9dad5550b","block_index":310500,"block_time":310500000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1237,310500,'parse','blocks','{"block_index":310500,"ledger_hash":"5ffefc7a2724be6bd697796bb82638ec913c5cbb73627153d1a13b48c7a6c02d","messages_hash":"45f296a535c13129cb1aaeb4e28a03e04ad902917891c39ae59ea2894e9f868f","txlist_hash":"35f4a33840d002ab4e0e44f11c1749ae95b41376927fb346140508b32518edd1"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(1238,310500,'insert','blocks','{"block_hash":"9d9019d15a1d878f2c39c7e3de4340a043a4a31aebb298acdf8e913284ae26ba","block_index":310501,"block_time":310501000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(0,NULL,0,'insert','blocks','{"block_hash":"8b3bef249cb3b0fa23a4936c1249b6bd41daeadc848c8d2e409ea1cbc10adfe7","block_index":309999,"block_time":309999000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1,NULL,309999,'parse','blocks','{"block_index":309999,"ledger_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","messages_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","txlist_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(2,NULL,309999,'insert','blocks','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(3,NULL,310000,'insert','transactions','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"btc_amount":62000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"6dc5b0a33d4d4297e0f5cc2d23ae307951d32aab2d86b7fa147b385219f3a597","tx_index":1}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(4,NULL,310000,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310000,"calling_function":"burn","event":"6dc5b0a33d4d4297e0f5cc2d23ae307951d32aab2d86b7fa147b385219f3a597","quantity":93000000000,"tx_index":1}',0,'CREDIT');
+INSERT INTO messages VALUES(5,NULL,310000,'insert','burns','{"block_index":310000,"burned":62000000,"earned":93000000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"6dc5b0a33d4d4297e0f5cc2d23ae307951d32aab2d86b7fa147b385219f3a597","tx_index":1}',0,'BURN');
+INSERT INTO messages VALUES(6,NULL,310000,'parse','blocks','{"block_index":310000,"ledger_hash":"cf0ea1d313e22ba5f413075b88e07dffc5c00e59f95eeb6d6dec935bd77f5ae4","messages_hash":"9e7dd13f1ecb4ec6481076dc9bb5fda1bdb9103747455f9de9ab516748201ef0","txlist_hash":"f06c23e6040a063ed59693baa0d63492dce64e1debc7455b22f5535c9dfbdc67"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(7,NULL,310000,'insert','blocks','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(8,NULL,310001,'insert','transactions','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"btc_amount":0,"data":"00000014000000a25be34b66000000174876e800010000000000000000000f446976697369626c65206173736574","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"1fc2e5a57f584b2f2edd05676e75c33d03eed1d3098cc0550ea33474e3ec9db1","tx_index":2}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(9,NULL,310001,'insert','debits','{"action":"issuance fee","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310001,"event":"1fc2e5a57f584b2f2edd05676e75c33d03eed1d3098cc0550ea33474e3ec9db1","quantity":50000000,"tx_index":2}',0,'DEBIT');
+INSERT INTO messages VALUES(10,NULL,310001,'insert','assets','{"asset_id":"697326324582","asset_longname":null,"asset_name":"DIVISIBLE","block_index":310001}',0,'ASSET_CREATION');
+INSERT INTO messages VALUES(11,NULL,310001,'insert','issuances','{"asset":"DIVISIBLE","asset_longname":null,"block_index":310001,"call_date":0,"call_price":0.0,"callable":false,"description":"Divisible asset","divisible":true,"fee_paid":50000000,"issuer":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","locked":false,"quantity":100000000000,"reset":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","transfer":false,"tx_hash":"1fc2e5a57f584b2f2edd05676e75c33d03eed1d3098cc0550ea33474e3ec9db1","tx_index":2}',0,'ASSET_ISSUANCE');
+INSERT INTO messages VALUES(12,NULL,310001,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"DIVISIBLE","block_index":310001,"calling_function":"issuance","event":"1fc2e5a57f584b2f2edd05676e75c33d03eed1d3098cc0550ea33474e3ec9db1","quantity":100000000000,"tx_index":2}',0,'CREDIT');
+INSERT INTO messages VALUES(13,NULL,310001,'parse','transactions','{"supported":true,"tx_hash":"1fc2e5a57f584b2f2edd05676e75c33d03eed1d3098cc0550ea33474e3ec9db1","tx_index":2}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(14,NULL,310001,'parse','blocks','{"block_index":310001,"ledger_hash":"11461f972c4cd85c87b5abfedb3cee589d09e945570d34564dcde6f4df9d2b57","messages_hash":"73d038390ff24d64df88c69d45b46bbc90f6b77f68cbbe2081dbe1e556a65e5e","txlist_hash":"ff8358e8c8b2cb9a1765deadb77bdfc6eae05a844831a0a8c8820d416d54446e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(15,NULL,310001,'insert','blocks','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(16,NULL,310002,'insert','transactions','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"btc_amount":0,"data":"000000140006cad8dc7f0b6600000000000003e800000000000000000000124e6f20646976697369626c65206173736574","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"7b1bf5144346279271b1ff78664f118224fe27fd8679d6c1519345f9c6c54584","tx_index":3}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(17,NULL,310002,'insert','debits','{"action":"issuance fee","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310002,"event":"7b1bf5144346279271b1ff78664f118224fe27fd8679d6c1519345f9c6c54584","quantity":50000000,"tx_index":3}',0,'DEBIT');
+INSERT INTO messages VALUES(18,NULL,310002,'insert','assets','{"asset_id":"1911882621324134","asset_longname":null,"asset_name":"NODIVISIBLE","block_index":310002}',0,'ASSET_CREATION');
+INSERT INTO messages VALUES(19,NULL,310002,'insert','issuances','{"asset":"NODIVISIBLE","asset_longname":null,"block_index":310002,"call_date":0,"call_price":0.0,"callable":false,"description":"No divisible asset","divisible":false,"fee_paid":50000000,"issuer":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","locked":false,"quantity":1000,"reset":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","transfer":false,"tx_hash":"7b1bf5144346279271b1ff78664f118224fe27fd8679d6c1519345f9c6c54584","tx_index":3}',0,'ASSET_ISSUANCE');
+INSERT INTO messages VALUES(20,NULL,310002,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"NODIVISIBLE","block_index":310002,"calling_function":"issuance","event":"7b1bf5144346279271b1ff78664f118224fe27fd8679d6c1519345f9c6c54584","quantity":1000,"tx_index":3}',0,'CREDIT');
+INSERT INTO messages VALUES(21,NULL,310002,'parse','transactions','{"supported":true,"tx_hash":"7b1bf5144346279271b1ff78664f118224fe27fd8679d6c1519345f9c6c54584","tx_index":3}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(22,NULL,310002,'parse','blocks','{"block_index":310002,"ledger_hash":"355d92f841de89a1d97c3b2ea7623959ea4494bb62ea7e67ad359beb68caca8c","messages_hash":"a180177bd180e7945ff4ce61b48c12cb0fd21535f71e943ffc25ff67a770e0f0","txlist_hash":"b17176b511fdea4cd899cfaf83f2e12193a4c92d1b199f18f590eb4fed90fa25"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(23,NULL,310002,'insert','blocks','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(24,NULL,310003,'insert','transactions','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"btc_amount":0,"data":"0000001400000003c58e5c5600000000000003e8010000000000000000000e43616c6c61626c65206173736574","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"c26f3a0c4e57e41919ff27aae95a9a9d4d65d34c6da6f1893884a17c8d407140","tx_index":4}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(25,NULL,310003,'insert','debits','{"action":"issuance fee","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310003,"event":"c26f3a0c4e57e41919ff27aae95a9a9d4d65d34c6da6f1893884a17c8d407140","quantity":50000000,"tx_index":4}',0,'DEBIT');
+INSERT INTO messages VALUES(26,NULL,310003,'insert','assets','{"asset_id":"16199343190","asset_longname":null,"asset_name":"CALLABLE","block_index":310003}',0,'ASSET_CREATION');
+INSERT INTO messages VALUES(27,NULL,310003,'insert','issuances','{"asset":"CALLABLE","asset_longname":null,"block_index":310003,"call_date":0,"call_price":0.0,"callable":false,"description":"Callable asset","divisible":true,"fee_paid":50000000,"issuer":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","locked":false,"quantity":1000,"reset":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","transfer":false,"tx_hash":"c26f3a0c4e57e41919ff27aae95a9a9d4d65d34c6da6f1893884a17c8d407140","tx_index":4}',0,'ASSET_ISSUANCE');
+INSERT INTO messages VALUES(28,NULL,310003,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"CALLABLE","block_index":310003,"calling_function":"issuance","event":"c26f3a0c4e57e41919ff27aae95a9a9d4d65d34c6da6f1893884a17c8d407140","quantity":1000,"tx_index":4}',0,'CREDIT');
+INSERT INTO messages VALUES(29,NULL,310003,'parse','transactions','{"supported":true,"tx_hash":"c26f3a0c4e57e41919ff27aae95a9a9d4d65d34c6da6f1893884a17c8d407140","tx_index":4}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(30,NULL,310003,'parse','blocks','{"block_index":310003,"ledger_hash":"edcd7e344fb5cca16999f025594890b8b54543555e61eb3807406bb4204677f2","messages_hash":"424e7f569243bc71c70002dce988e93e6b19cfb7f859c2a5195533147d099d87","txlist_hash":"b6dffe5b8c1f483c3c20832d23dddd7b530afe7ac1f3f57f433da59d83b48f06"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(31,NULL,310003,'insert','blocks','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(32,NULL,310004,'insert','transactions','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"btc_amount":0,"data":"0000001400000000082c82e300000000000003e8010000000000000000000c4c6f636b6564206173736574","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"90b5734be98b0f2a0bd4b6a269c8db3368e2e387bb890ade239951d05423b4da","tx_index":5}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(33,NULL,310004,'insert','debits','{"action":"issuance fee","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310004,"event":"90b5734be98b0f2a0bd4b6a269c8db3368e2e387bb890ade239951d05423b4da","quantity":50000000,"tx_index":5}',0,'DEBIT');
+INSERT INTO messages VALUES(34,NULL,310004,'insert','assets','{"asset_id":"137134819","asset_longname":null,"asset_name":"LOCKED","block_index":310004}',0,'ASSET_CREATION');
+INSERT INTO messages VALUES(35,NULL,310004,'insert','issuances','{"asset":"LOCKED","asset_longname":null,"block_index":310004,"call_date":0,"call_price":0.0,"callable":false,"description":"Locked asset","divisible":true,"fee_paid":50000000,"issuer":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","locked":false,"quantity":1000,"reset":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","transfer":false,"tx_hash":"90b5734be98b0f2a0bd4b6a269c8db3368e2e387bb890ade239951d05423b4da","tx_index":5}',0,'ASSET_ISSUANCE');
+INSERT INTO messages VALUES(36,NULL,310004,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"LOCKED","block_index":310004,"calling_function":"issuance","event":"90b5734be98b0f2a0bd4b6a269c8db3368e2e387bb890ade239951d05423b4da","quantity":1000,"tx_index":5}',0,'CREDIT');
+INSERT INTO messages VALUES(37,NULL,310004,'parse','transactions','{"supported":true,"tx_hash":"90b5734be98b0f2a0bd4b6a269c8db3368e2e387bb890ade239951d05423b4da","tx_index":5}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(38,NULL,310004,'parse','blocks','{"block_index":310004,"ledger_hash":"abd71a31bc1f8a072761b23a5bc2976731ebdf305d1d7d33922e93573f308129","messages_hash":"e47e38f99b22b4e486fc05ee95352ec049c4d7e9e4b67082cadc62e928a2a9e7","txlist_hash":"3da72b0c813432f47a3a70887dfd29350d270e9ebaca9875ed6304c91888e387"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(39,NULL,310004,'insert','blocks','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(40,NULL,310005,'insert','transactions','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"btc_amount":0,"data":"0000001400000000082c82e3000000000000000001000000000000000000044c4f434b","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"344dcc8909ca3a137630726d0071dfd2df4f7c855bac150c7d3a8367835c90bc","tx_index":6}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(41,NULL,310005,'insert','debits','{"action":"issuance fee","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310005,"event":"344dcc8909ca3a137630726d0071dfd2df4f7c855bac150c7d3a8367835c90bc","quantity":0,"tx_index":6}',0,'DEBIT');
+INSERT INTO messages VALUES(42,NULL,310005,'insert','issuances','{"asset":"LOCKED","asset_longname":null,"block_index":310005,"call_date":0,"call_price":0.0,"callable":false,"description":"Locked asset","divisible":true,"fee_paid":0,"issuer":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","locked":true,"quantity":0,"reset":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","transfer":false,"tx_hash":"344dcc8909ca3a137630726d0071dfd2df4f7c855bac150c7d3a8367835c90bc","tx_index":6}',0,'ASSET_ISSUANCE');
+INSERT INTO messages VALUES(43,NULL,310005,'parse','transactions','{"supported":true,"tx_hash":"344dcc8909ca3a137630726d0071dfd2df4f7c855bac150c7d3a8367835c90bc","tx_index":6}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(44,NULL,310005,'parse','blocks','{"block_index":310005,"ledger_hash":"0c3914f9676e506a96e6db793f15200ef33087cd47de4d27628849013a391daa","messages_hash":"b5346d07ec8d18e36cbabc930ea2dc452d5fc26b12af0d060f7fb7ff46b8f99d","txlist_hash":"2d59f139907859f9108360f7fa4695101a6b5ef0b7dd0e56c2dd41641e58e9af"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(45,NULL,310005,'insert','blocks','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(46,NULL,310006,'insert','transactions','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"btc_amount":0,"data":"0000000a00000000000000010000000005f5e100000000a25be34b660000000005f5e10007d00000000000000000","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"4f0433ba841038e2e16328445930dd7bca35309b14b0da4451c8f94c631368b8","tx_index":7}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(47,NULL,310006,'insert','debits','{"action":"open order","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310006,"event":"4f0433ba841038e2e16328445930dd7bca35309b14b0da4451c8f94c631368b8","quantity":100000000,"tx_index":7}',0,'DEBIT');
+INSERT INTO messages VALUES(48,NULL,310006,'insert','orders','{"block_index":310006,"expiration":2000,"expire_index":312006,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":0,"fee_required_remaining":0,"get_asset":"DIVISIBLE","get_quantity":100000000,"get_remaining":100000000,"give_asset":"XCP","give_quantity":100000000,"give_remaining":100000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","tx_hash":"4f0433ba841038e2e16328445930dd7bca35309b14b0da4451c8f94c631368b8","tx_index":7}',0,'OPEN_ORDER');
+INSERT INTO messages VALUES(49,NULL,310006,'parse','transactions','{"supported":true,"tx_hash":"4f0433ba841038e2e16328445930dd7bca35309b14b0da4451c8f94c631368b8","tx_index":7}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(50,NULL,310006,'parse','blocks','{"block_index":310006,"ledger_hash":"57ff5f34a9e418b179db9003414c5f3bdfa7feeb538f24071b23d024a3d05df0","messages_hash":"2490d17814a7fac90af178d960f9e277e98bf005b8d3f076bc7c5d58634fc271","txlist_hash":"a4a6fb433e6c49968fded16954502c472b0d21b74c6cce8d08c8c53c00f2781e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(51,NULL,310006,'insert','blocks','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(52,NULL,310007,'insert','transactions','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"btc_amount":5430,"data":"00000000000000a25be34b660000000005f5e100","destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"6e91ae23de2035e3e28c3322712212333592a1f666bcff9dd91aec45d5ea2753","tx_index":8}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(53,NULL,310007,'insert','debits','{"action":"send","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"DIVISIBLE","block_index":310007,"event":"6e91ae23de2035e3e28c3322712212333592a1f666bcff9dd91aec45d5ea2753","quantity":100000000,"tx_index":8}',0,'DEBIT');
+INSERT INTO messages VALUES(54,NULL,310007,'insert','credits','{"address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"DIVISIBLE","block_index":310007,"calling_function":"send","event":"6e91ae23de2035e3e28c3322712212333592a1f666bcff9dd91aec45d5ea2753","quantity":100000000,"tx_index":8}',0,'CREDIT');
+INSERT INTO messages VALUES(55,NULL,310007,'insert','sends','{"asset":"DIVISIBLE","block_index":310007,"destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","quantity":100000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"6e91ae23de2035e3e28c3322712212333592a1f666bcff9dd91aec45d5ea2753","tx_index":8}',0,'SEND');
+INSERT INTO messages VALUES(56,NULL,310007,'parse','transactions','{"supported":true,"tx_hash":"6e91ae23de2035e3e28c3322712212333592a1f666bcff9dd91aec45d5ea2753","tx_index":8}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(57,NULL,310007,'parse','blocks','{"block_index":310007,"ledger_hash":"bfed530458339aab02ff75ad76738569dc6997c7a35d4452351678b04e022f68","messages_hash":"8147e6b42edd71153d880649a4b7b75c3e2fc59f122de054ebacf5204abee406","txlist_hash":"ce20264c332892b0a5e0c3e2d4b63d02c901fa2c3f8c5171b2896b50c82ea0af"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(58,NULL,310007,'insert','blocks','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(59,NULL,310008,'insert','transactions','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"btc_amount":5430,"data":"0000000000000000000000010000000005f5e100","destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"4fd55abadfdbe77c3bda2431749cca934a29994a179620a62c1b57f28bd62a43","tx_index":9}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(60,NULL,310008,'insert','debits','{"action":"send","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310008,"event":"4fd55abadfdbe77c3bda2431749cca934a29994a179620a62c1b57f28bd62a43","quantity":100000000,"tx_index":9}',0,'DEBIT');
+INSERT INTO messages VALUES(61,NULL,310008,'insert','credits','{"address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"XCP","block_index":310008,"calling_function":"send","event":"4fd55abadfdbe77c3bda2431749cca934a29994a179620a62c1b57f28bd62a43","quantity":100000000,"tx_index":9}',0,'CREDIT');
+INSERT INTO messages VALUES(62,NULL,310008,'insert','sends','{"asset":"XCP","block_index":310008,"destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","quantity":100000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"4fd55abadfdbe77c3bda2431749cca934a29994a179620a62c1b57f28bd62a43","tx_index":9}',0,'SEND');
+INSERT INTO messages VALUES(63,NULL,310008,'parse','transactions','{"supported":true,"tx_hash":"4fd55abadfdbe77c3bda2431749cca934a29994a179620a62c1b57f28bd62a43","tx_index":9}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(64,NULL,310008,'parse','blocks','{"block_index":310008,"ledger_hash":"d4feec997754d11a1502e5351ed62fcfbfcafb770e19a37da41d1d88b7b45ed4","messages_hash":"d573b3b22e23c8e7ced1388219033e4b3a1c7711944acfb2926abfdbdd63b44b","txlist_hash":"d25c9f48fbbe2010a62cad729d45b658a2caf9a7c9abc65a30e2a7fc47bc83e5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(65,NULL,310008,'insert','blocks','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(66,NULL,310009,'insert','transactions','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"btc_amount":0,"data":"0000000a00000000000000010000000005f5e100000000a25be34b660000000005f5e10007d00000000000000000","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"21460d5c07284f9be9baf824927d0d4e4eb790e297f3162305841607b672349b","tx_index":10}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(67,NULL,310009,'insert','debits','{"action":"open order","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310009,"event":"21460d5c07284f9be9baf824927d0d4e4eb790e297f3162305841607b672349b","quantity":100000000,"tx_index":10}',0,'DEBIT');
+INSERT INTO messages VALUES(68,NULL,310009,'insert','orders','{"block_index":310009,"expiration":2000,"expire_index":312009,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":0,"fee_required_remaining":0,"get_asset":"DIVISIBLE","get_quantity":100000000,"get_remaining":100000000,"give_asset":"XCP","give_quantity":100000000,"give_remaining":100000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","tx_hash":"21460d5c07284f9be9baf824927d0d4e4eb790e297f3162305841607b672349b","tx_index":10}',0,'OPEN_ORDER');
+INSERT INTO messages VALUES(69,NULL,310009,'parse','transactions','{"supported":true,"tx_hash":"21460d5c07284f9be9baf824927d0d4e4eb790e297f3162305841607b672349b","tx_index":10}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(70,NULL,310009,'parse','blocks','{"block_index":310009,"ledger_hash":"4ab5ff9e71bbc83956557fb5abec98372fa38e5580838fb258b2d831bfc4d9ea","messages_hash":"54c64b7338e79af0bc6b238eb91692ac0331345cbd6278ef27aa3f6a7351e35e","txlist_hash":"173e769e0b4fa951ef0267c7e218f3a473d9a5857b0880d654a2181f244c92e2"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(71,NULL,310009,'insert','blocks','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(72,NULL,310010,'insert','transactions','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"btc_amount":0,"data":"0000000a00000000000000010000000005f5e100000000000000000000000000000f424007d000000000000dbba0","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"1899b2e6ec36ba4bc9d035e6640b0a62b08c3a147c77c89183a77d9ed9081b3a","tx_index":11}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(73,NULL,310010,'insert','debits','{"action":"open order","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310010,"event":"1899b2e6ec36ba4bc9d035e6640b0a62b08c3a147c77c89183a77d9ed9081b3a","quantity":100000000,"tx_index":11}',0,'DEBIT');
+INSERT INTO messages VALUES(74,NULL,310010,'insert','orders','{"block_index":310010,"expiration":2000,"expire_index":312010,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":900000,"fee_required_remaining":900000,"get_asset":"BTC","get_quantity":1000000,"get_remaining":1000000,"give_asset":"XCP","give_quantity":100000000,"give_remaining":100000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","tx_hash":"1899b2e6ec36ba4bc9d035e6640b0a62b08c3a147c77c89183a77d9ed9081b3a","tx_index":11}',0,'OPEN_ORDER');
+INSERT INTO messages VALUES(75,NULL,310010,'parse','transactions','{"supported":true,"tx_hash":"1899b2e6ec36ba4bc9d035e6640b0a62b08c3a147c77c89183a77d9ed9081b3a","tx_index":11}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(76,NULL,310010,'parse','blocks','{"block_index":310010,"ledger_hash":"1909ef40a24263776cb9e0d52a690048b50728855a0fe4b0e1ba3834a9e401c1","messages_hash":"895d6cc5aa14f7618cc66b2593b43d0223387fd11f1b2b017c9f22140613afcc","txlist_hash":"7d1ef03dad99c4bdf7a8e5af7209a136c8ac392922dd3afdbcc0446ea1f5f604"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(77,NULL,310010,'insert','blocks','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(78,NULL,310011,'insert','transactions','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"btc_amount":0,"data":"0000000a000000000000000000000000000a2c2b00000000000000010000000005f5e10007d00000000000000000","destination":"","fee":1000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"a1768d7db2db3b9732b26df8c04db4b9a8535a1e5cf684a680e81e7c06f394b6","tx_index":12}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(79,NULL,310011,'insert','orders','{"block_index":310011,"expiration":2000,"expire_index":312011,"fee_provided":1000000,"fee_provided_remaining":1000000,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":100000000,"get_remaining":100000000,"give_asset":"BTC","give_quantity":666667,"give_remaining":666667,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","tx_hash":"a1768d7db2db3b9732b26df8c04db4b9a8535a1e5cf684a680e81e7c06f394b6","tx_index":12}',0,'OPEN_ORDER');
+INSERT INTO messages VALUES(80,NULL,310011,'parse','transactions','{"supported":true,"tx_hash":"a1768d7db2db3b9732b26df8c04db4b9a8535a1e5cf684a680e81e7c06f394b6","tx_index":12}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(81,NULL,310011,'parse','blocks','{"block_index":310011,"ledger_hash":"c3d51a5f2df90c089844ba4de7d5541f6051490aa1389e5945a7bb91d49e3589","messages_hash":"9603465a786c9b927cdf36078b09eed3481d863a390eb52cf617fab895f6be65","txlist_hash":"86ebe5be8b9443f411adcd49e7443a34941979c0c6bf40136a3b44193024abfc"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(82,NULL,310011,'insert','blocks','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(83,NULL,310012,'insert','transactions','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"btc_amount":1000,"data":"0000000000000000000000010000000011e1a300","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"698e97e507da8623cf38ab42701853443c8f7fe0d93b4674aabb42f9800ee9d6","tx_index":13}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(84,NULL,310012,'insert','debits','{"action":"send","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310012,"event":"698e97e507da8623cf38ab42701853443c8f7fe0d93b4674aabb42f9800ee9d6","quantity":300000000,"tx_index":13}',0,'DEBIT');
+INSERT INTO messages VALUES(85,NULL,310012,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"XCP","block_index":310012,"calling_function":"send","event":"698e97e507da8623cf38ab42701853443c8f7fe0d93b4674aabb42f9800ee9d6","quantity":300000000,"tx_index":13}',0,'CREDIT');
+INSERT INTO messages VALUES(86,NULL,310012,'insert','sends','{"asset":"XCP","block_index":310012,"destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","quantity":300000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"698e97e507da8623cf38ab42701853443c8f7fe0d93b4674aabb42f9800ee9d6","tx_index":13}',0,'SEND');
+INSERT INTO messages VALUES(87,NULL,310012,'parse','transactions','{"supported":true,"tx_hash":"698e97e507da8623cf38ab42701853443c8f7fe0d93b4674aabb42f9800ee9d6","tx_index":13}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(88,NULL,310012,'parse','blocks','{"block_index":310012,"ledger_hash":"a9dc31556d38b118eeb0bcbb3a374a0ed79adec4eb23e00c80c0599ba97c9a7a","messages_hash":"f064f5cc3b48464bef3b6aa9b77a01adf3fb99168888a5615a369d1bcf125ec2","txlist_hash":"5a729b250068fe7b175a540b66a30326344514e357023184540ef97bae5e16e7"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(89,NULL,310012,'insert','blocks','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(90,NULL,310013,'insert','transactions','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"btc_amount":1000,"data":"00000000000000a25be34b66000000003b9aca00","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"0cfeeb559ed794d067557df0376a6c213b48b174b80cdb2c3c6d365cf538e132","tx_index":14}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(91,NULL,310013,'insert','debits','{"action":"send","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"DIVISIBLE","block_index":310013,"event":"0cfeeb559ed794d067557df0376a6c213b48b174b80cdb2c3c6d365cf538e132","quantity":1000000000,"tx_index":14}',0,'DEBIT');
+INSERT INTO messages VALUES(92,NULL,310013,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"DIVISIBLE","block_index":310013,"calling_function":"send","event":"0cfeeb559ed794d067557df0376a6c213b48b174b80cdb2c3c6d365cf538e132","quantity":1000000000,"tx_index":14}',0,'CREDIT');
+INSERT INTO messages VALUES(93,NULL,310013,'insert','sends','{"asset":"DIVISIBLE","block_index":310013,"destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","quantity":1000000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"0cfeeb559ed794d067557df0376a6c213b48b174b80cdb2c3c6d365cf538e132","tx_index":14}',0,'SEND');
+INSERT INTO messages VALUES(94,NULL,310013,'parse','transactions','{"supported":true,"tx_hash":"0cfeeb559ed794d067557df0376a6c213b48b174b80cdb2c3c6d365cf538e132","tx_index":14}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(95,NULL,310013,'parse','blocks','{"block_index":310013,"ledger_hash":"e72be5070d0a5853631d902d334e8b88eddf6e79616373311babc4a0a27dd3d8","messages_hash":"9c164d38483ae1923ddc825d301d86d8a71548f2a1edcfad8311e4111cc3e34a","txlist_hash":"1294e3d0871b0c2297d9980ed46bfa3563b33b202b426949dadeeba7075b4bc7"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(96,NULL,310013,'insert','blocks','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(97,NULL,310014,'insert','transactions','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"btc_amount":5430,"data":"000000000006cad8dc7f0b660000000000000005","destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"1facb0072f16f6bdca64ea859c82b850f58f0ec7ff410d901679772a4727515a","tx_index":15}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(98,NULL,310014,'insert','debits','{"action":"send","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"NODIVISIBLE","block_index":310014,"event":"1facb0072f16f6bdca64ea859c82b850f58f0ec7ff410d901679772a4727515a","quantity":5,"tx_index":15}',0,'DEBIT');
+INSERT INTO messages VALUES(99,NULL,310014,'insert','credits','{"address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"NODIVISIBLE","block_index":310014,"calling_function":"send","event":"1facb0072f16f6bdca64ea859c82b850f58f0ec7ff410d901679772a4727515a","quantity":5,"tx_index":15}',0,'CREDIT');
+INSERT INTO messages VALUES(100,NULL,310014,'insert','sends','{"asset":"NODIVISIBLE","block_index":310014,"destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","quantity":5,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"1facb0072f16f6bdca64ea859c82b850f58f0ec7ff410d901679772a4727515a","tx_index":15}',0,'SEND');
+INSERT INTO messages VALUES(101,NULL,310014,'parse','transactions','{"supported":true,"tx_hash":"1facb0072f16f6bdca64ea859c82b850f58f0ec7ff410d901679772a4727515a","tx_index":15}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(102,NULL,310014,'parse','blocks','{"block_index":310014,"ledger_hash":"cb0962222af917dbac2a11465c22cd80770c0b3cdb8bdc0870c99a8116745c9e","messages_hash":"81a62b796cd9dbf6eaecf4053b5896e384cf08135dd7aef545c48feadfbd6936","txlist_hash":"d5431af170b331497d8967969820632880473d06dae0d06fa7ffc93a0cb90180"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(103,NULL,310014,'insert','blocks','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(104,NULL,310015,'insert','transactions','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"btc_amount":1000,"data":"000000000006cad8dc7f0b66000000000000000a","destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"e3b6667b7baa515048a7fcf2be7818e3e7622371236b78e19b4b08e2d7e7818c","tx_index":16}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(105,NULL,310015,'insert','debits','{"action":"send","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"NODIVISIBLE","block_index":310015,"event":"e3b6667b7baa515048a7fcf2be7818e3e7622371236b78e19b4b08e2d7e7818c","quantity":10,"tx_index":16}',0,'DEBIT');
+INSERT INTO messages VALUES(106,NULL,310015,'insert','credits','{"address":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","asset":"NODIVISIBLE","block_index":310015,"calling_function":"send","event":"e3b6667b7baa515048a7fcf2be7818e3e7622371236b78e19b4b08e2d7e7818c","quantity":10,"tx_index":16}',0,'CREDIT');
+INSERT INTO messages VALUES(107,NULL,310015,'insert','sends','{"asset":"NODIVISIBLE","block_index":310015,"destination":"1_mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc_mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns_2","quantity":10,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"e3b6667b7baa515048a7fcf2be7818e3e7622371236b78e19b4b08e2d7e7818c","tx_index":16}',0,'SEND');
+INSERT INTO messages VALUES(108,NULL,310015,'parse','transactions','{"supported":true,"tx_hash":"e3b6667b7baa515048a7fcf2be7818e3e7622371236b78e19b4b08e2d7e7818c","tx_index":16}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(109,NULL,310015,'parse','blocks','{"block_index":310015,"ledger_hash":"6ff899433f22546c41a15f20b4c66913c747931500fee10d58c4a17b9e2f0c88","messages_hash":"ea46fd7c1ff0ff2b73dc503b3ba507ab43442ffac120f56b5fd0803d27db4b9c","txlist_hash":"b77c1d69b3ac7348e336cce9948f982efafa1cb56cbdde85fe9f49a73871ba3b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(110,NULL,310015,'insert','blocks','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(111,NULL,310016,'insert','transactions','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"btc_amount":0,"data":"000000140000000000033a3e7fffffffffffffff01000000000000000000104d6178696d756d207175616e74697479","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"bd4e9cbbe69c2db893cd32182a2d315c89c45ba4e31aa5775d1fe42d841cea39","tx_index":17}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(112,NULL,310016,'insert','debits','{"action":"issuance fee","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310016,"event":"bd4e9cbbe69c2db893cd32182a2d315c89c45ba4e31aa5775d1fe42d841cea39","quantity":50000000,"tx_index":17}',0,'DEBIT');
+INSERT INTO messages VALUES(113,NULL,310016,'insert','assets','{"asset_id":"211518","asset_longname":null,"asset_name":"MAXI","block_index":310016}',0,'ASSET_CREATION');
+INSERT INTO messages VALUES(114,NULL,310016,'insert','issuances','{"asset":"MAXI","asset_longname":null,"block_index":310016,"call_date":0,"call_price":0.0,"callable":false,"description":"Maximum quantity","divisible":true,"fee_paid":50000000,"issuer":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","locked":false,"quantity":9223372036854775807,"reset":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","transfer":false,"tx_hash":"bd4e9cbbe69c2db893cd32182a2d315c89c45ba4e31aa5775d1fe42d841cea39","tx_index":17}',0,'ASSET_ISSUANCE');
+INSERT INTO messages VALUES(115,NULL,310016,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"MAXI","block_index":310016,"calling_function":"issuance","event":"bd4e9cbbe69c2db893cd32182a2d315c89c45ba4e31aa5775d1fe42d841cea39","quantity":9223372036854775807,"tx_index":17}',0,'CREDIT');
+INSERT INTO messages VALUES(116,NULL,310016,'parse','transactions','{"supported":true,"tx_hash":"bd4e9cbbe69c2db893cd32182a2d315c89c45ba4e31aa5775d1fe42d841cea39","tx_index":17}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(117,NULL,310016,'parse','blocks','{"block_index":310016,"ledger_hash":"ec66a06cde401b66917c6d1d4e1ee8893405cfbf0474560d9997d6960c8af710","messages_hash":"32d216ca6a80cb867f8963ab1ddde2bd07a969e095d67c80aecd0950a01a6218","txlist_hash":"6d3d469ad1b72a67ee50d8a7c6c57069da3a0e2e9d12a23a30bbf4f2ccc64cb6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(118,NULL,310016,'insert','blocks','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(119,NULL,310017,'insert','transactions','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"btc_amount":0,"data":"0000001e52bb33003ff0000000000000004c4b4009556e69742054657374","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"d14388b74b63d93e4477b1fe8426028bb8ab20656703e3ce8deeb23c2fe0b8af","tx_index":18}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(120,NULL,310017,'insert','broadcasts','{"block_index":310017,"fee_fraction_int":5000000,"locked":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","text":"Unit Test","timestamp":1388000000,"tx_hash":"d14388b74b63d93e4477b1fe8426028bb8ab20656703e3ce8deeb23c2fe0b8af","tx_index":18,"value":1.0}',0,'BROADCAST');
+INSERT INTO messages VALUES(121,NULL,310017,'parse','transactions','{"supported":true,"tx_hash":"d14388b74b63d93e4477b1fe8426028bb8ab20656703e3ce8deeb23c2fe0b8af","tx_index":18}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(122,NULL,310017,'parse','blocks','{"block_index":310017,"ledger_hash":"b2053109bff06dae1705fc32ab0712f38bf9d206fa3517fbf0a938d1b5f33bad","messages_hash":"720dfe78fccdb0831b951f79905c945a3c7abb6f13c3e258e7c3b8b7ddbfae36","txlist_hash":"223e10a8e23e4435e635f1dda533a0662dff9f0e3fb86b72a22b2c191f731a80"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(123,NULL,310017,'insert','blocks','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(124,NULL,310018,'insert','transactions','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"btc_amount":0,"data":"0000001e4cc552003ff000000000000000000000046c6f636b","destination":"","fee":6800,"source":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","supported":true,"tx_hash":"f9e0527c85a9084d7eda91fc30a49993370d029efea031a8ccccdf846146a660","tx_index":19}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(125,NULL,310018,'insert','broadcasts','{"block_index":310018,"fee_fraction_int":null,"locked":true,"source":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","status":"valid","text":null,"timestamp":0,"tx_hash":"f9e0527c85a9084d7eda91fc30a49993370d029efea031a8ccccdf846146a660","tx_index":19,"value":null}',0,'BROADCAST');
+INSERT INTO messages VALUES(126,NULL,310018,'parse','transactions','{"supported":true,"tx_hash":"f9e0527c85a9084d7eda91fc30a49993370d029efea031a8ccccdf846146a660","tx_index":19}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(127,NULL,310018,'parse','blocks','{"block_index":310018,"ledger_hash":"d7051de4d03fb31bfedf215b407b1edc12789c1f2748abb5a72257ad8f5113ce","messages_hash":"260724f92886f32a80da2705559eda171d2bd55724a534c72740e05b348c1874","txlist_hash":"9eb6f4683bebb675467829573cd2f7e3ab613d21398c5aef31ed389a40f3c48d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(128,NULL,310018,'insert','blocks','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(129,NULL,310019,'insert','transactions','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"btc_amount":5430,"data":"00000028000152bb3301000000000000000900000000000000090000000000000000000013b000000064","destination":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"2a2169991597036b6dad687ea1feffd55465a204466f40c35cbba811cb3109b1","tx_index":20}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(130,NULL,310019,'insert','debits','{"action":"bet","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310019,"event":"2a2169991597036b6dad687ea1feffd55465a204466f40c35cbba811cb3109b1","quantity":9,"tx_index":20}',0,'DEBIT');
+INSERT INTO messages VALUES(131,NULL,310019,'insert','bets','{"bet_type":1,"block_index":310019,"counterwager_quantity":9,"counterwager_remaining":9,"deadline":1388000001,"expiration":100,"expire_index":310119,"fee_fraction_int":5000000.0,"feed_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","leverage":5040,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","target_value":0.0,"tx_hash":"2a2169991597036b6dad687ea1feffd55465a204466f40c35cbba811cb3109b1","tx_index":20,"wager_quantity":9,"wager_remaining":9}',0,'OPEN_BET');
+INSERT INTO messages VALUES(132,NULL,310019,'parse','transactions','{"supported":true,"tx_hash":"2a2169991597036b6dad687ea1feffd55465a204466f40c35cbba811cb3109b1","tx_index":20}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(133,NULL,310019,'parse','blocks','{"block_index":310019,"ledger_hash":"35c95a70193ded2f9ee18254a91ce5d4834bb162fc3cca85dd432339257539b8","messages_hash":"10830661175f7d2bf48585647709d277e5a895b536f58f83672c14d5026992e8","txlist_hash":"88220e5f48660f8b9e339c3afb65ffbad83d632164f1df8e22af2ee6fc18826e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(134,NULL,310019,'insert','blocks','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(135,NULL,310020,'insert','transactions','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"btc_amount":5430,"data":"00000028000052bb3301000000000000000900000000000000090000000000000000000013b000000064","destination":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","fee":7650,"source":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","supported":true,"tx_hash":"5c6562ddad0bc8a1faaded18813a65522cd273709acd190cf9d3271817eefc93","tx_index":21}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(136,NULL,310020,'insert','debits','{"action":"bet","address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"XCP","block_index":310020,"event":"5c6562ddad0bc8a1faaded18813a65522cd273709acd190cf9d3271817eefc93","quantity":9,"tx_index":21}',0,'DEBIT');
+INSERT INTO messages VALUES(137,NULL,310020,'insert','bets','{"bet_type":0,"block_index":310020,"counterwager_quantity":9,"counterwager_remaining":9,"deadline":1388000001,"expiration":100,"expire_index":310120,"fee_fraction_int":5000000.0,"feed_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","leverage":5040,"source":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","status":"open","target_value":0.0,"tx_hash":"5c6562ddad0bc8a1faaded18813a65522cd273709acd190cf9d3271817eefc93","tx_index":21,"wager_quantity":9,"wager_remaining":9}',0,'OPEN_BET');
+INSERT INTO messages VALUES(138,NULL,310020,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310020,"calling_function":"filled","event":"5c6562ddad0bc8a1faaded18813a65522cd273709acd190cf9d3271817eefc93","quantity":0,"tx_index":21}',0,'CREDIT');
+INSERT INTO messages VALUES(139,NULL,310020,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"2a2169991597036b6dad687ea1feffd55465a204466f40c35cbba811cb3109b1","wager_remaining":0}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(140,NULL,310020,'insert','credits','{"address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"XCP","block_index":310020,"calling_function":"filled","event":"5c6562ddad0bc8a1faaded18813a65522cd273709acd190cf9d3271817eefc93","quantity":0,"tx_index":21}',0,'CREDIT');
+INSERT INTO messages VALUES(141,NULL,310020,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"5c6562ddad0bc8a1faaded18813a65522cd273709acd190cf9d3271817eefc93","wager_remaining":0}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(142,NULL,310020,'insert','bet_matches','{"backward_quantity":9,"block_index":310019,"deadline":1388000001,"fee_fraction_int":5000000,"feed_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","forward_quantity":9,"id":"2a2169991597036b6dad687ea1feffd55465a204466f40c35cbba811cb3109b1_5c6562ddad0bc8a1faaded18813a65522cd273709acd190cf9d3271817eefc93","initial_value":1.0,"leverage":5040,"match_expire_index":310119,"status":"pending","target_value":0.0,"tx0_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","tx0_bet_type":1,"tx0_block_index":310019,"tx0_expiration":100,"tx0_hash":"2a2169991597036b6dad687ea1feffd55465a204466f40c35cbba811cb3109b1","tx0_index":20,"tx1_address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","tx1_bet_type":0,"tx1_block_index":310020,"tx1_expiration":100,"tx1_hash":"5c6562ddad0bc8a1faaded18813a65522cd273709acd190cf9d3271817eefc93","tx1_index":21}',0,'BET_MATCH');
+INSERT INTO messages VALUES(143,NULL,310020,'parse','transactions','{"supported":true,"tx_hash":"5c6562ddad0bc8a1faaded18813a65522cd273709acd190cf9d3271817eefc93","tx_index":21}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(144,NULL,310020,'parse','blocks','{"block_index":310020,"ledger_hash":"8315de64ee1051c333687ba9fae6244287b85bcc1e3a4b67f3fe7d51b931378b","messages_hash":"dd333107fc51c883a23785c8e2176bc01fc1bf8d52ff8d37ee925e9991b03a7a","txlist_hash":"087de9b1715dfdac7372489fc615b597c9575c9520eb1ad5f7435a2641388621"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(145,NULL,310020,'insert','blocks','{"block_hash":"7c2460bb32c5749c856486393239bf7a0ac789587ac71f32e7237910da8097f2","block_index":310021,"block_time":310021000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(146,NULL,310021,'parse','blocks','{"block_index":310021,"ledger_hash":"c2d646bd3f54eec73cd9da6f5da4bc159d0c64e8fb9ad4095dfa58850e65c7b1","messages_hash":"45bb0c5dd432a2d7313fbf6185637260877da537b18334604280a29539e73205","txlist_hash":"e5f36761a4755ebc133389b9bc01a085c585a24fa346c784123f3dd5a125ad27"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(147,NULL,310021,'insert','blocks','{"block_hash":"44435f9a99a0aa12a9bfabdc4cb8119f6ea6a6e1350d2d65445fb66a456db5fc","block_index":310022,"block_time":310022000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(148,NULL,310022,'parse','blocks','{"block_index":310022,"ledger_hash":"619367fb7657e0fb4800acd385eb5593d085ce5cbfbfb098dafa98612d9fd445","messages_hash":"0b5b6279634c98137b3ebd37b0e31af63b183c0f8ae6942df3aec9e0b6ef725f","txlist_hash":"e62992a5e4f80347f92c512e1bd47df4c2f4e9fa0c38b7ca73befd39fd181d54"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(149,NULL,310022,'insert','blocks','{"block_hash":"d8cf5bec1bbcab8ca4f495352afde3b6572b7e1d61b3976872ebb8e9d30ccb08","block_index":310023,"block_time":310023000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(150,NULL,310023,'parse','blocks','{"block_index":310023,"ledger_hash":"ba865dbc8263aaf153d7264dfc6a580bebe9391ca0551f15a1c822c6cbe2b8de","messages_hash":"41612e674a216f80e46263c28770962c5cacf632df3151fee409c0f9eef3a498","txlist_hash":"e62acd9368da6141ddf435bd919fe0e124bd77646207d69a2544790107ab88a5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(151,NULL,310023,'insert','blocks','{"block_hash":"b03042b4e18a222b4c8d1e9e1970d93e6e2a2d41686d227ff8ecf0a839223dc5","block_index":310024,"block_time":310024000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(152,NULL,310024,'parse','blocks','{"block_index":310024,"ledger_hash":"368e948cbf42de80aca51abe75d09ec78196924453719182ccc86419df5da2db","messages_hash":"5cc0e229526c00f288c81848c45d12cc6a24fc0ba84e8d78041d84b8e28fbf88","txlist_hash":"2c65dfdc0d371025c6d497e087b8548633238d6049242fa411383fcce72b096e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(153,NULL,310024,'insert','blocks','{"block_hash":"a872e560766832cc3b4f7f222228cb6db882ce3c54f6459f62c71d5cd6e90666","block_index":310025,"block_time":310025000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(154,NULL,310025,'parse','blocks','{"block_index":310025,"ledger_hash":"9f7132c808936f580d4fb1dc5791541a5a3d23532d1093c20d434007f8dde54c","messages_hash":"cc0a82636125f077fd262e62ce5e60bd457154376ba685a771a4b92388324420","txlist_hash":"ca60850f73099aabc38d1521a94d611cc02f4539620a17488d1e9a445087104f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(155,NULL,310025,'insert','blocks','{"block_hash":"6c96350f6f2f05810f19a689de235eff975338587194a36a70dfd0fcd490941a","block_index":310026,"block_time":310026000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(156,NULL,310026,'parse','blocks','{"block_index":310026,"ledger_hash":"074ea6f10a5290cff31f7b21483f7b2248723c8d1b5bc060c31219f66f37def7","messages_hash":"33266041a43b151330c149d5536ca098c595054d54d88c2a06bfb257f64c4c06","txlist_hash":"21db77ad7cd241752184fa9fd61ab9cf670cd40105d7d9b887d8df62f25e5cfc"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(157,NULL,310026,'insert','blocks','{"block_hash":"d7acfac66df393c4482a14c189742c0571b89442eb7f817b34415a560445699e","block_index":310027,"block_time":310027000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(158,NULL,310027,'parse','blocks','{"block_index":310027,"ledger_hash":"a3ade2b2e5bc701996f511f3e85d596b60f882a3254fd975769c0f38b3b14cb3","messages_hash":"df932138bd7a19f61e98148cbc5ef645be2d4e05674258fb5f1659bc0be276ca","txlist_hash":"9469f4c4b4f208f2a46569234006846d18ae108ca6a98600ab70bac1ef1ad633"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(159,NULL,310027,'insert','blocks','{"block_hash":"02409fcf8fa06dafcb7f11e38593181d9c42cc9d5e2ddc304d098f990bd9530b","block_index":310028,"block_time":310028000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(160,NULL,310028,'parse','blocks','{"block_index":310028,"ledger_hash":"3bf124a34825b5c487c94dd79b1ea4f25e657294966879f1c10b56b37a3d29b5","messages_hash":"647074e7d5c71b584b7661d02f6f5cac0ea9a0a9fd13ae78d4d2bf4c76793d2d","txlist_hash":"55de4927d0ba81d336f143b08224af9fe9a862bf0ed4d39fbe242e9c5946bcf4"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(161,NULL,310028,'insert','blocks','{"block_hash":"3c739fa8b40c118d5547ea356ee8d10ee2898871907643ec02e5db9d00f03cc6","block_index":310029,"block_time":310029000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(162,NULL,310029,'parse','blocks','{"block_index":310029,"ledger_hash":"e502eb7b282e0bd4940d8f75ef51d677a641f3d55304adcb015bc249c97892bf","messages_hash":"bfe4c7d60e0cca63ba44a61e12c48e2d840faf4a0aa92ba197a9d4fb17f7ddcc","txlist_hash":"3d879f96d783e70a75f71c2b44ae4c5601bc8f1192b828f1b35400b8c99aa0f2"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(163,NULL,310029,'insert','blocks','{"block_hash":"d5071cddedf89765ee0fd58f209c1c7d669ba8ea66200a57587da8b189b9e4f5","block_index":310030,"block_time":310030000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(164,NULL,310030,'parse','blocks','{"block_index":310030,"ledger_hash":"d64b5eb04ddfb5600be40142b1fd27c308387a35942a6e8a6916407bbc1313b1","messages_hash":"96e13c2a5517d1740fdd2dd5c805a13a37104bc0470eebf6ab1ee5f6edc49343","txlist_hash":"c859356c985f3c051d5b01424759e66e9ec7c2eac055eb9fc2b0ad7323253a6a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(165,NULL,310030,'insert','blocks','{"block_hash":"0b02b10f41380fff27c543ea8891ecb845bf7a003ac5c87e15932aff3bfcf689","block_index":310031,"block_time":310031000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(166,NULL,310031,'parse','blocks','{"block_index":310031,"ledger_hash":"e9c97dd7adb1b22d4ed0238607faeb2d14c090fbd7d685275ee802ab23b4b740","messages_hash":"92abe74beca9968adb2f2952a4eb710fefe4df33f4cf2ea0319a0d36c93b8bec","txlist_hash":"4cdafec839c7abdda11f10437d890c952b3416929ff6e715f44e8c57412437af"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(167,NULL,310031,'insert','blocks','{"block_hash":"66346be81e6ba04544f2ae643b76c2b7b1383f038fc2636e02e49dc7ec144074","block_index":310032,"block_time":310032000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(168,NULL,310032,'parse','blocks','{"block_index":310032,"ledger_hash":"2544ffced9af1aabd84ab51fb78c56c9beac03dcb286aebd4202938dfa0754ea","messages_hash":"49f3542309f554440ef13516ddc8e88ae079b92a2c7c8eb97765a6ed6ac6cd10","txlist_hash":"2fc6c250a775ac70976d371540df4a7af608ca1b106b7efb7bc5a820ff505bdb"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(169,NULL,310032,'insert','blocks','{"block_hash":"999c65df9661f73e8c01f1da1afda09ac16788b72834f0ff5ea3d1464afb4707","block_index":310033,"block_time":310033000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(170,NULL,310033,'parse','blocks','{"block_index":310033,"ledger_hash":"4355d3ebb95187fec36b1847a4c3777d8e1d5541bd1d9ff8461b8ac5b9881261","messages_hash":"ceb14a6637c8a5764c7f33049973a6101daa056d265b46c248c3b8363c919c6c","txlist_hash":"d99b155e06fb50de6e7e6b646c641e3862d3d6df0ab9aec3e360fba0fcb54776"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(171,NULL,310033,'insert','blocks','{"block_hash":"f552edd2e0a648230f3668e72ddf0ddfb1e8ac0f4c190f91b89c1a8c2e357208","block_index":310034,"block_time":310034000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(172,NULL,310034,'parse','blocks','{"block_index":310034,"ledger_hash":"c7fcb5134bd8131c035d65b5eeef8a3cd214348822563232a992f3f703c6b0b9","messages_hash":"4ca5dd8e74223684d3d8c28a79b4e872787788fcae088ab3e3066788ffca65af","txlist_hash":"826d7b750bb4ad8fabd67c825c81f840b7a7a264489a9263410a5cb204d3309f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(173,NULL,310034,'insert','blocks','{"block_hash":"a13cbb016f3044207a46967a4ba1c87dab411f78c55c1179f2336653c2726ae2","block_index":310035,"block_time":310035000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(174,NULL,310035,'parse','blocks','{"block_index":310035,"ledger_hash":"c41c280498ce05d6073fc6e89be2684dc68c345c1c43c00b9a3f9041954fce26","messages_hash":"b500c7812d872ff80b668ed88d7a8898df99b0a2ef8d4ba16b85597fa3e1cd0e","txlist_hash":"f96598e2169d42d81b91ba03e7403dbd25a61399290f358022a998e4375fe2b9"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(175,NULL,310035,'insert','blocks','{"block_hash":"158648a98f1e1bd1875584ce8449eb15a4e91a99a923bbb24c4210135cef0c76","block_index":310036,"block_time":310036000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(176,NULL,310036,'parse','blocks','{"block_index":310036,"ledger_hash":"86c67fd234ca9d2406080018b2677386990fac477db8008c0092d40a398203ed","messages_hash":"1c2819e818ad5ef4ef1d5eb2b9e7630930a559a1cffa880ad0d34fc482b4063d","txlist_hash":"ae7fdf3e9388811e96d470070db9ac45b5b19754bb4ad424aade40fede3c9cf9"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(177,NULL,310036,'insert','blocks','{"block_hash":"563acfd6d991ce256d5655de2e9429975c8dceeb221e76d5ec6e9e24a2c27c07","block_index":310037,"block_time":310037000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(178,NULL,310037,'parse','blocks','{"block_index":310037,"ledger_hash":"3ae6272437eb0758a779d68785c41e119d1204dd5421c78e03b9d12eba64804b","messages_hash":"b39a9f69fbe9c498602609f3c6bf9bb18e6b97f83519c743afbc14e99d9cb95a","txlist_hash":"aa9600ce32fd7c1d6e963a51648eaae043685d3369413785517172d1f94d551b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(179,NULL,310037,'insert','blocks','{"block_hash":"b44b4cad12431c32df27940e18d51f63897c7472b70950d18454edfd640490b2","block_index":310038,"block_time":310038000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(180,NULL,310038,'parse','blocks','{"block_index":310038,"ledger_hash":"18f7552567b898f6c2cfe8c829903912445de5dbf05b56a13bf9b402a24fdc11","messages_hash":"49205a5e8db239c4c785868b103864f8727376c7188a58544537cdb035ce153f","txlist_hash":"46ce886f050bf7a80355da9cb15b35f5d38809ef2ec1a25250f057b63f51cdfc"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(181,NULL,310038,'insert','blocks','{"block_hash":"5fa1ae9c5e8a599247458987b006ad3a57f686df1f7cc240bf119e911b56c347","block_index":310039,"block_time":310039000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(182,NULL,310039,'parse','blocks','{"block_index":310039,"ledger_hash":"85f2255f9256a5faf59ddec1c58b1d3bc12c91bc2c62ead61b48e1f94ea2888d","messages_hash":"b4d3737b40df8aecdb8f755b92db906b8f215641fd79326bb4700d1f662b2f36","txlist_hash":"23a26edddf0c8662b055ed992c75c706221b59ce9a7aa45b757a3d5158772e8c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(183,NULL,310039,'insert','blocks','{"block_hash":"7200ded406675453eadddfbb2d14c2a4526c7dc2b5de14bd48b29243df5e1aa3","block_index":310040,"block_time":310040000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(184,NULL,310040,'parse','blocks','{"block_index":310040,"ledger_hash":"b799477db184351df5503f8d15d5461a0483ea35142c003b7e640429663ad943","messages_hash":"d5348f656d30e6e4b55706ba5a4a6dfdf262d8ed36d57c5f2fc71f8766d72af6","txlist_hash":"163682e05a9a10f3e3240420c932a7f3f2172484de30dbcac0319ac23a4726f1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(185,NULL,310040,'insert','blocks','{"block_hash":"5db592ff9ba5fac1e030cf22d6c13b70d330ba397f415340086ee7357143b359","block_index":310041,"block_time":310041000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(186,NULL,310041,'parse','blocks','{"block_index":310041,"ledger_hash":"efa9cd46741b59e74263d6d348584f1a61e8ba32163c09fc3ff2e41a5431a483","messages_hash":"440373118703e7f53afd682abe5514d489a78722a600c1067430e7fec5f5fab0","txlist_hash":"a159868ce28207aa243e7ecc50f188e8e34e5ddb5d801b645b1c16a596e060ed"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(187,NULL,310041,'insert','blocks','{"block_hash":"826fd4701ef2824e9559b069517cd3cb990aff6a4690830f78fc845ab77fa3e4","block_index":310042,"block_time":310042000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(188,NULL,310042,'parse','blocks','{"block_index":310042,"ledger_hash":"f3159919f381d46a3e1341703e55192a02a36519e71fc2675285a3a14c4ee04d","messages_hash":"7611f3db3529dd5fbd5cf9a5ca7affc454536e57455b1b0ea043751c9437a89c","txlist_hash":"52bca7ccb83bfe83d8693ebc4c5b1ce518b2ae472dfc81f2c2940dc2460eeeab"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(189,NULL,310042,'insert','blocks','{"block_hash":"2254a12ada208f1dd57bc17547ecaf3c44720323c47bc7d4b1262477cb7f3c51","block_index":310043,"block_time":310043000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(190,NULL,310043,'parse','blocks','{"block_index":310043,"ledger_hash":"961c79ea2b7dcc2d7489c423b568fb978631e71732d6b998bcc0657aa4d19194","messages_hash":"110ad00303e1a01d59989b5ab6e4f166edff24c1a49e06b41cba8d56778e844e","txlist_hash":"1fa2eb6aa4c8b5efd093c6e484dddb85eabfa0de55edc929e04487ce65e73608"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(191,NULL,310043,'insert','blocks','{"block_hash":"3346d24118d8af0b3c6bcc42f8b85792e7a2e7036ebf6e4c25f4f6723c78e46b","block_index":310044,"block_time":310044000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(192,NULL,310044,'parse','blocks','{"block_index":310044,"ledger_hash":"d674c39010fd4554efa487d97a3d9cae278ed9b4aff0ce57db33bd881beeb3e3","messages_hash":"f7708c99c134b071aa3981d012c773e12738ece583c1b2b2908abc6a31556ea9","txlist_hash":"ddc2517e1efddbe56185e00d77333ef9f2f2ad6c59e042d65a8f4d8c2b323e5e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(193,NULL,310044,'insert','blocks','{"block_hash":"7bba0ab243839e91ad1a45a762bf074011f8a9883074d68203c6d1b46fffde98","block_index":310045,"block_time":310045000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(194,NULL,310045,'parse','blocks','{"block_index":310045,"ledger_hash":"9ba70a032ae92672174421689c0845784f0cef7374e88b2f5258260191864bf1","messages_hash":"15f23755cf1bc0aff99c1a9ed38462d951ed3ea24168c18786d71207390ca4c1","txlist_hash":"3b1d5cd9cb8e7b753233ac0dac5e697226ae372bff3813852434d96996e78fac"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(195,NULL,310045,'insert','blocks','{"block_hash":"47db6788c38f2d6d712764979e41346b55e78cbb4969e0ef5c4336faf18993a6","block_index":310046,"block_time":310046000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(196,NULL,310046,'parse','blocks','{"block_index":310046,"ledger_hash":"114a6ab930fbdf8531431620ed219db3756a634c5b99af6ce1ee66d527d277ff","messages_hash":"5796f08f5f53035af580104f79cebd606ff66c38b88361325289010a7a470268","txlist_hash":"becb4b0241accefb95aee137e58d406e15e87c28ed3f051938b4fc02e249b21c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(197,NULL,310046,'insert','blocks','{"block_hash":"a9ccabcc2a098a7d25e4ab8bda7c4e66807eefa42e29890dcd88149a10de7075","block_index":310047,"block_time":310047000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(198,NULL,310047,'parse','blocks','{"block_index":310047,"ledger_hash":"5356512c94ea2c77623d874a927aae8c3dce287a34dfd27a617abfa57142c7f3","messages_hash":"645ba6137d35e81be31cf45092ab0838b241755dd9d33aec134c20c08cd6b091","txlist_hash":"6e06ce8a113de9e8b1a88516a512671aa2cdef60168a40d91742caa281417634"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(199,NULL,310047,'insert','blocks','{"block_hash":"610bf3935a85b05a98556c55493c6de45bed4d7b3b6c8553a984718765796309","block_index":310048,"block_time":310048000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(200,NULL,310048,'parse','blocks','{"block_index":310048,"ledger_hash":"0902ca0868560d05049c983bca3ab91cdd5eafc46ab0a948d702abcbc4010582","messages_hash":"98854c5467b3003c63ec7e208c6c8282f461bb8a9a65e2dd39927a09b44a108a","txlist_hash":"67a2fb81ebb42dc6781746a403d81b4e7603f82f02724074541d42380d7269fe"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(201,NULL,310048,'insert','blocks','{"block_hash":"4ad2761923ad49ad2b283b640f1832522a2a5d6964486b21591b71df6b33be3c","block_index":310049,"block_time":310049000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(202,NULL,310049,'parse','blocks','{"block_index":310049,"ledger_hash":"978794628fc95756032cb7fb4e9d5ed286373d84fafbcfceec9af71d18c4c0be","messages_hash":"7524187fdd1244a0d1e4ea4ab1c5cdf5fdd2e1582e30a0d5b7af81ca0805ab76","txlist_hash":"ac68aa21454eb2a2ca973b5451523fc6d2a4df6906b9472891cf8e06087e130c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(203,NULL,310049,'insert','blocks','{"block_hash":"8cfeb60a14a4cec6e9be13d699694d49007d82a31065a17890383e262071e348","block_index":310050,"block_time":310050000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(204,NULL,310050,'parse','blocks','{"block_index":310050,"ledger_hash":"ff16abeb1d35e0e422f165e206b0d69e0b9ff48b68fc6656c1af74801908b92d","messages_hash":"0b5471a5d2323a894a74d6332822f0f216a0745089ac58a694b1c61a4094454f","txlist_hash":"720d553ed03860df12ab60af34cfec86b9d7ec80275f6d8815e3f61166e3af88"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(205,NULL,310050,'insert','blocks','{"block_hash":"b53c90385dd808306601350920c6af4beb717518493fd23b5c730eea078f33e6","block_index":310051,"block_time":310051000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(206,NULL,310051,'parse','blocks','{"block_index":310051,"ledger_hash":"556ff900993e70cabefd05ddd5dbe3e8e10bb5c9ada7913b75d84af067004ed5","messages_hash":"ebed9381df6057bd322c0652f404116bcc77e4a0c6acf142d5faec47d4baab45","txlist_hash":"656a21084dc8f46455fd2a42ebbdb0efd5c879ccb16e9b1532a6ab5323debdb4"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(207,NULL,310051,'insert','blocks','{"block_hash":"0acdacf4e4b6fca756479cb055191b367b1fa433aa558956f5f08fa5b7b394e2","block_index":310052,"block_time":310052000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(208,NULL,310052,'parse','blocks','{"block_index":310052,"ledger_hash":"15af3a616a2974aa70b7b58f88132051f335af299473db925b619fda8be1afc7","messages_hash":"95629a91ab0bd8a87878f7f65e9d02d6114e7e6ca7b0a0fcb36aacd89f0eeae9","txlist_hash":"3f90b36b7ebc9a2daea1e498bb44100f12f35c9df04260448bd38b23375b16be"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(209,NULL,310052,'insert','blocks','{"block_hash":"68348f01b6dc49b2cb30fe92ac43e527aa90d859093d3bf7cd695c64d2ef744f","block_index":310053,"block_time":310053000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(210,NULL,310053,'parse','blocks','{"block_index":310053,"ledger_hash":"ed0ed3b480b38929a425c2b61c86582495764624e020cb86b3a95fc7d59c692c","messages_hash":"80cb6a5ce7cc7a796965d8351977fed0a4655f702f72c3fec64ec6dc92d23f13","txlist_hash":"67427731be09b73755cd460d142686c903b819b7b8af48297d460ab91fde3609"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(211,NULL,310053,'insert','blocks','{"block_hash":"a8b5f253df293037e49b998675620d5477445c51d5ec66596e023282bb9cd305","block_index":310054,"block_time":310054000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(212,NULL,310054,'parse','blocks','{"block_index":310054,"ledger_hash":"f012825d2d549910910ad6b7e4ac2373d095b53869f0793709684f0ff05bb108","messages_hash":"d8dfbd478fa699dc45d2432bbb29ce342b54fb22abf175d13bb6da5c2d3abcf3","txlist_hash":"c5e4ba3e2011e7fbf238285525a544de3cc0fe9360a3451392a4c03acd508690"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(213,NULL,310054,'insert','blocks','{"block_hash":"4b069152e2dc82e96ed8a3c3547c162e8c3aceeb2a4ac07972f8321a535b9356","block_index":310055,"block_time":310055000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(214,NULL,310055,'parse','blocks','{"block_index":310055,"ledger_hash":"90c08144277fe622573282349edaf9e59289b716b5b4e368d88ac25e67e788d1","messages_hash":"8797bf8b7fa1c772c7c44e3301c80e0f723de397db4b8a2f809c096609242cf3","txlist_hash":"5e4a8aee5f04d75d9ffcc85e8344c445b5facfc838f39a77b6b0d5acf6cd8213"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(215,NULL,310055,'insert','blocks','{"block_hash":"7603eaed418971b745256742f9d2ba70b2c2b2f69f61de6cc70e61ce0336f9d3","block_index":310056,"block_time":310056000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(216,NULL,310056,'parse','blocks','{"block_index":310056,"ledger_hash":"c888ae590b64fa4514ed7f94ba785b12e881052185cc4702b598cf6e48cbb3ba","messages_hash":"8e16d14f35b8d9caa018a8a40be0d0850c5ae513906d5b4638c692a6b764909a","txlist_hash":"1cb780a12bb6040055fa694822a4f39c340a18a858f0b65a8b227a6fd6fb4f31"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(217,NULL,310056,'insert','blocks','{"block_hash":"4a5fdc84f2d66ecb6ee3e3646aad20751ce8694e64e348d3c8aab09d33a3e411","block_index":310057,"block_time":310057000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(218,NULL,310057,'parse','blocks','{"block_index":310057,"ledger_hash":"e68c9a569fda6f1e1e59502953c9735857a0ee158a76397722436466df24708e","messages_hash":"930ff03b64e3b4d399933ba76354b1d9291112c0593dba85d763c8300db1913f","txlist_hash":"2e175f240928edbbd5a5c6c5f3fbacd9516a36c7e99501703e9d1b19999b2029"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(219,NULL,310057,'insert','blocks','{"block_hash":"a6eef3089896f0cae0bfe9423392e45c48f4efe4310b14d8cfbdb1fea613635f","block_index":310058,"block_time":310058000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(220,NULL,310058,'parse','blocks','{"block_index":310058,"ledger_hash":"9f6607682f4a6274c2a45895f849816aec83ff0820709ba781634b84518eb05d","messages_hash":"0fbc130a453f3284eb9ec9c847ffbf5ff216ef3bffc06037190267cc2025e835","txlist_hash":"cca92bb672e368c0c1e5b4674a48e150a870f56a67339cbd74926d541ae2a4e4"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(221,NULL,310058,'insert','blocks','{"block_hash":"ab505de874c43f97c90be1c26a769e6c5cb140405c993b4a6cc7afc795f156a9","block_index":310059,"block_time":310059000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(222,NULL,310059,'parse','blocks','{"block_index":310059,"ledger_hash":"49b10a5c390f603e7be0d405bf1fcae95fd15682ef2e41a3b2fcf713d271e541","messages_hash":"fef609d5eaabd31efa0317a33730438569163fbab3fc09b9eff59a7b555fc4a5","txlist_hash":"12b8b50b634cb6843258f1c130df1cae60898c902d3e66ad00e1303fde4d8724"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(223,NULL,310059,'insert','blocks','{"block_hash":"974ad5fbef621e0a38eab811608dc9afaf10c8ecc85fed913075ba1a145e889b","block_index":310060,"block_time":310060000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(224,NULL,310060,'parse','blocks','{"block_index":310060,"ledger_hash":"1d6cea34d6f7042ced3a5211da80de88fa77c900af5526f3033b715e4f68df17","messages_hash":"c29369e9d69fcd23979ef58b8cfabc2d6041efe31c810e33bd62b46c8d7866e8","txlist_hash":"40fa40a1a2c02ca514f309fe27268e9e493374bf3edfca8de66e3d46efa32ba6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(225,NULL,310060,'insert','blocks','{"block_hash":"35d267d21ad386e7b7632292af1c422b0310dde7ca49a82f9577525a29c138cf","block_index":310061,"block_time":310061000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(226,NULL,310061,'parse','blocks','{"block_index":310061,"ledger_hash":"0c43668fdc3d6cc6ec84fee99c68f0eff21650a618db35bc20e428550eae9b0c","messages_hash":"38aef8af21f94ace651d152fbadb529721e3cc64959566388d348d249b226d68","txlist_hash":"4aa0becfc939793d7dccbb0b19881889a20c801e6c627be8ab8a2ffbd8cee8de"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(227,NULL,310061,'insert','blocks','{"block_hash":"b31a0054145319ef9de8c1cb19df5bcf4dc8a1ece20053aa494e5d3a00a2852f","block_index":310062,"block_time":310062000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(228,NULL,310062,'parse','blocks','{"block_index":310062,"ledger_hash":"cf03a34b29d3a8f8ea5fadb017426f2843c6ab2e785032b6dec70d7aba7bce4a","messages_hash":"e0764773525602d47d332abe4c68dd8c32d8c4585fe47587ecd218a7bc49ebc6","txlist_hash":"3317013c1e6464e0296f5aa7f50208ede42ff9051e4e3ce2da92584cb80a3079"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(229,NULL,310062,'insert','blocks','{"block_hash":"0cbcbcd5b7f2dc288e3a34eab3d4212463a5a56e886804fb4f9f1cf929eadebe","block_index":310063,"block_time":310063000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(230,NULL,310063,'parse','blocks','{"block_index":310063,"ledger_hash":"e145dfc2c7f053a1ba4c8a41d042b40c0748eefcf9e56c5e906ad4b12f3653eb","messages_hash":"c20c09edd2f2235e7287d0439fe2c6c46abfe7ea5a04fa35260840400f54b201","txlist_hash":"b58f95d06b31f7bb5c6f6bd5c5c4460ef4e4ce0e1d154b8557a18cb73f36d432"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(231,NULL,310063,'insert','blocks','{"block_hash":"e2db8065a195e85cde9ddb868a17d39893a60fb2b1255aa5f0c88729de7cbf30","block_index":310064,"block_time":310064000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(232,NULL,310064,'parse','blocks','{"block_index":310064,"ledger_hash":"ebc34184623da16251782c82098c7fcfda42f95b155eadfacab2a53e3b34333e","messages_hash":"cbc39bca2b7f961cd5c661f187d4dfa1b5dcb55eba9dec87327cea7eadbbe663","txlist_hash":"e33ac70126559506de70ca420f152dcb639fd0e841d0d7259c0136d518fd4f39"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(233,NULL,310064,'insert','blocks','{"block_hash":"8a7bc7a77c831ac4fd11b8a9d22d1b6a0661b07cef05c2e600c7fb683b861d2a","block_index":310065,"block_time":310065000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(234,NULL,310065,'parse','blocks','{"block_index":310065,"ledger_hash":"db746a9e0ad8f37c14ef14180dd1bc562ae757a6d4d042a517bb8953f34c6958","messages_hash":"24ca6fdcbb7bdd7358b565ac84d2f14c2314fed7857544359d0c850996e6b151","txlist_hash":"9d52ca0b8859777bcbe84606017ec53961075699eff51b34b80e5a6ed33b137f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(235,NULL,310065,'insert','blocks','{"block_hash":"b6959be51eb084747d301f7ccaf9e75f2292c9404633b1532e3692659939430d","block_index":310066,"block_time":310066000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(236,NULL,310066,'parse','blocks','{"block_index":310066,"ledger_hash":"cc71a63314b770e4e010bc7c66d8ab808451b6401e6df8558455a2bfc9bb4882","messages_hash":"9d96fefa3d3e1d197e765fcaf64952ec79b419ced4edf858fed794419153b848","txlist_hash":"5122312265a8305639f6490bc51fb025626dbcd38c5735ce85cd652348f2e86e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(237,NULL,310066,'insert','blocks','{"block_hash":"8b08eae98d7193c9c01863fac6effb9162bda010daeacf9e0347112f233b8577","block_index":310067,"block_time":310067000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(238,NULL,310067,'parse','blocks','{"block_index":310067,"ledger_hash":"a5812c0f3a37b04d5105bca6b0c4819a41beeedf5b0f314f476ab55d6c31235d","messages_hash":"bd447b29f603c6d56257ce8a559c137dfe2fdad10acdacce2bb003e391655225","txlist_hash":"764477c3a233cd407804695f42948d3017951e90b7474cfcc24ef81ee49fdad9"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(239,NULL,310067,'insert','blocks','{"block_hash":"9280e7297ef6313341bc81787a36acfc9af58f83a415afff5e3154f126cf52b5","block_index":310068,"block_time":310068000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(240,NULL,310068,'parse','blocks','{"block_index":310068,"ledger_hash":"14f065751896a2724251b6ca6d0297b344986980075fb72ad058ad0b5bedcd3c","messages_hash":"61dfcc035dbabe08298144762a6ab94589e14668d412ea20a79a0070437fb202","txlist_hash":"866fceb74e8e97d663493f3546519b01f51e1a3cb25bde4b0f3c2e960d2eda85"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(241,NULL,310068,'insert','blocks','{"block_hash":"486351f0655bf594ffaab1980cff17353b640b63e9c27239109addece189a6f7","block_index":310069,"block_time":310069000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(242,NULL,310069,'parse','blocks','{"block_index":310069,"ledger_hash":"a7dd17b4760fb65ac58be1b1653f7cb0e90574c47f70c61ff9f940ad15ad3658","messages_hash":"0eae6329012b77e96a46de6c909ecdfd0887599361884a84a9218aa70665be21","txlist_hash":"9e0565827fcf295ae2149bfcf5e0db29237f447760832083baf94de145bdb531"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(243,NULL,310069,'insert','blocks','{"block_hash":"8739e99f4dee8bebf1332f37f49a125348b40b93b74fe35579dd52bfba4fa7e5","block_index":310070,"block_time":310070000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(244,NULL,310070,'parse','blocks','{"block_index":310070,"ledger_hash":"8068a6bcc5d1fc1a78562f0f3165423b45b4674e55f21c4c09948fb65ee632c0","messages_hash":"4419538295a5c394523a396ad0cef24f72972618b2108e4cd084f0bbbf6a7cd6","txlist_hash":"03f84e0f0838204a53ce54e3cfecde00b2e5741ed08aab0c0d9ed99513ab4655"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(245,NULL,310070,'insert','blocks','{"block_hash":"7a099aa1bba0ead577f1e44f35263a1f115ed6a868c98d4dd71609072ae7f80b","block_index":310071,"block_time":310071000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(246,NULL,310071,'parse','blocks','{"block_index":310071,"ledger_hash":"af86ffad4b8dd68a0f18142935bbb18623cc5ce2e9e0c02f04c0e7a5dd974e17","messages_hash":"6a299b36e4ccfd1e32f81f91009e367cacc30aedaccbcefbd0273e351b94305f","txlist_hash":"9b3e1c7af0bb119e69813161c19aeac4dd5a594ece5f67f21ffb55b8edaa111f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(247,NULL,310071,'insert','blocks','{"block_hash":"7b17ecedc07552551b8129e068ae67cb176ca766ea3f6df74b597a94e3a7fc8a","block_index":310072,"block_time":310072000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(248,NULL,310072,'parse','blocks','{"block_index":310072,"ledger_hash":"36de48518d1446b33f2230c5eee7d18e040db543fe03dca001174f8382c209ee","messages_hash":"180ff6f6092c485217d79b3c5510f9d8e0664d09c882fd164ae3a49cb8a6a356","txlist_hash":"33fccfbad1dd91d9102b82f11b7c97883bc5d5fdfd44584cca6c40fbd04ce2d8"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(249,NULL,310072,'insert','blocks','{"block_hash":"ee0fe3cc9b3a48a2746b6090b63b442b97ea6055d48edcf4b2288396764c6943","block_index":310073,"block_time":310073000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(250,NULL,310073,'parse','blocks','{"block_index":310073,"ledger_hash":"4374f567cbc460b73e74d6190db353c3ee86b92c3f99e392beae3caeb264eb5f","messages_hash":"0e4b56334021fa1fb190d62b5c33fd7f37c126d28ef7a61a80d84eb1b7f833e5","txlist_hash":"7544980dbaa8029ae36d883e3079bcc82f2d140072d4dd65cb3384510692ff45"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(251,NULL,310073,'insert','blocks','{"block_hash":"ceab38dfde01f711a187601731ad575d67cfe0b7dbc61dcd4f15baaef72089fb","block_index":310074,"block_time":310074000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(252,NULL,310074,'parse','blocks','{"block_index":310074,"ledger_hash":"54fd95cdf7f9374d1687590f2860276afe67a265ddd9216e5b63fb06c5bd569e","messages_hash":"ec24c8cf2685cb4750e7e3da65223b72da2e8afff49e12f36b795105d7dd89c9","txlist_hash":"1efba9ea6a8d2e7ee6ee2070b84b497feb66e3387e05c1e4f4989f086e5e02a2"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(253,NULL,310074,'insert','blocks','{"block_hash":"ef547198c6e36d829f117cfd7077ccde45158e3c545152225fa24dba7a26847b","block_index":310075,"block_time":310075000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(254,NULL,310075,'parse','blocks','{"block_index":310075,"ledger_hash":"2b42e23b43d30f91fe7705a01f0c8ec86d6230815b587704bcc70b91b5ae87b8","messages_hash":"2178b64331b1afaf3a8d650a93f6173ab0729b9d776b5f4c552970e79db18a0f","txlist_hash":"a370830ef1758c18c88e6d9fcc5803fc15f1dbdad0f2d6a0773f902d86ad7c97"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(255,NULL,310075,'insert','blocks','{"block_hash":"3b0499c2e8e8f0252c7288d4ecf66efc426ca37aad3524424d14c8bc6f8b0d92","block_index":310076,"block_time":310076000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(256,NULL,310076,'parse','blocks','{"block_index":310076,"ledger_hash":"577092728a4dc81cd9a06fcf6d2b058f0e4ce8bcb395819a704d6b4144f041dc","messages_hash":"29783a12523c7d590f0c9aa3b71f221de0359f61a368924800b80919084823a2","txlist_hash":"05ce95f07d03f4417a2fd15224418c8ba4ae196e9ec6f3192f5324c028363641"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(257,NULL,310076,'insert','blocks','{"block_hash":"d2adeefa9024ab3ff2822bc36acf19b6c647cea118cf15b86c6bc00c3322e7dd","block_index":310077,"block_time":310077000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(258,NULL,310077,'parse','blocks','{"block_index":310077,"ledger_hash":"d1ba60181f3061673c64ecd0b92abbc19b1a6e69a927dfefdfd8b8c74171ecd2","messages_hash":"821a8fad56889c6609d97cdd7e6bc8b6ecc68d54318986551c747ac45e22cd54","txlist_hash":"6c9e35feb56fb01c37fce04a1e6dc5f7747a6d26ee2f39ac584f11e8359dce71"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(259,NULL,310077,'insert','blocks','{"block_hash":"f6c17115ef0efe489c562bcda4615892b4d4b39db0c9791fe193d4922bd82cd6","block_index":310078,"block_time":310078000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(260,NULL,310078,'parse','blocks','{"block_index":310078,"ledger_hash":"c0a9270d15793e68cfd1cf445315d737bed7052914da6def4f014c21f0c9e0c5","messages_hash":"c765bfd546685684c2bfacdbbb248478a115f88dda12b4df64efb0b336362540","txlist_hash":"d59b48425061f0965947dd025cfa0fba8855e997f376572c585db72203b9a80a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(261,NULL,310078,'insert','blocks','{"block_hash":"f2fbd2074d804e631db44cb0fb2e1db3fdc367e439c21ffc40d73104c4d7069c","block_index":310079,"block_time":310079000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(262,NULL,310079,'parse','blocks','{"block_index":310079,"ledger_hash":"74eaddecbf5ab6608c1e95c1c313c13f2af2b649512cc8c7016717d21e93f815","messages_hash":"b38c60aa1982b330713c16d5572143e5970e4b0273ef5461473e237be5133a8b","txlist_hash":"d3f32df02f0e7cd7c2163b47b3ff73d175046599ed626ab343647e1a04525e3c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(263,NULL,310079,'insert','blocks','{"block_hash":"42943b914d9c367000a78b78a544cc4b84b1df838aadde33fe730964a89a3a6c","block_index":310080,"block_time":310080000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(264,NULL,310080,'parse','blocks','{"block_index":310080,"ledger_hash":"a759e3aac1b015e28b8b524106a74b943b215faac8d5079384ec7351b2239bde","messages_hash":"059af64961a1fef76aafd5d22aedd13466299a9727bd9b21072794674b02c140","txlist_hash":"f588a6cf255e710d9ee481d53f8bc0fc0e1567d58ee701f1b77f0848db881f5f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(265,NULL,310080,'insert','blocks','{"block_hash":"6554f9d307976249e7b7e260e08046b3b55d318f8b6af627fed5be3063f123c4","block_index":310081,"block_time":310081000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(266,NULL,310081,'parse','blocks','{"block_index":310081,"ledger_hash":"71622e25e8497db6fa222e33c60ea582698e72ca5789a52c9252bf51191cadaa","messages_hash":"f6134380063f36dde912c04787580d3c40a8c8393a595178165f0ff57b5ad90b","txlist_hash":"9a2e169d5fa3721f9bb8852c93ca8ed5dfbcccef05cba99ed3f1c61c937f4366"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(267,NULL,310081,'insert','blocks','{"block_hash":"4f1ef91b1dcd575f8ac2e66a67715500cbca154bd6f3b8148bb7015a6aa6c644","block_index":310082,"block_time":310082000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(268,NULL,310082,'parse','blocks','{"block_index":310082,"ledger_hash":"47e9d8fbcbafcee2b4c145ce651333ce49812533d13f7f9a0e9a448f51cfbacd","messages_hash":"21d4d5920b914ea36e3c7065dd7f0af4b294454030688c44e1a011835ef8a49b","txlist_hash":"c2cd395566e0a7b16c76cc0ead2c2cc87a684d5a499c76b2370afffe4b408ad1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(269,NULL,310082,'insert','blocks','{"block_hash":"9b1f6fd6ff9b0dc4e37603cfb0625f49067c775b99e12492afd85392d3c8d850","block_index":310083,"block_time":310083000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(270,NULL,310083,'parse','blocks','{"block_index":310083,"ledger_hash":"e61148e7a8125f7225a6b6e1d77786f8b28b0b8a74e60fef3f75fa4de8f7d882","messages_hash":"b3e7328b23a6af5e3df01bb9bea68d2a8445820c50c2adf3b13bf79c3c4f9d54","txlist_hash":"21fb4596655071cca486c2e6988ec980799a9827e2e5f169033a45d21b3c7a75"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(271,NULL,310083,'insert','blocks','{"block_hash":"1e0972523e80306441b9f4157f171716199f1428db2e818a7f7817ccdc8859e3","block_index":310084,"block_time":310084000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(272,NULL,310084,'parse','blocks','{"block_index":310084,"ledger_hash":"20fb450589ddc6c904fbb61cca8588e85e865635c12402ce7ae72995ab884c14","messages_hash":"3101e4813e73498cef2ec786023347dc13fb29aaf1407bbfee16d04f86ff6ac1","txlist_hash":"feb3992f370b8465a732bc4d90691b99db691f44e1697ad2775a6df216d93b13"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(273,NULL,310084,'insert','blocks','{"block_hash":"c5b6e9581831e3bc5848cd7630c499bca26d9ece5156d36579bdb72d54817e34","block_index":310085,"block_time":310085000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(274,NULL,310085,'parse','blocks','{"block_index":310085,"ledger_hash":"9cea37d548308505f80dc438d5183bac6c6ca424ea4dd9c85d883b05d67cdc92","messages_hash":"a10a734ce80faabca0177b12746f0483692fd13256d7d75af28e615b2324e682","txlist_hash":"277205c28e54078d55ce1641fed64ff4b409b686fbe4aa3a018cead2f969c501"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(275,NULL,310085,'insert','blocks','{"block_hash":"080c1dc55a4ecf4824cf9840602498cfc35b5f84099f50b71b45cb63834c7a78","block_index":310086,"block_time":310086000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(276,NULL,310086,'parse','blocks','{"block_index":310086,"ledger_hash":"e11bab5fba2d038086c65030b90ce1cbc988314d0c9846aa7ddac4fd357bd01a","messages_hash":"54ccdfdb8690395f13bf11d70244d69052acdb3f9948e8238c0d4bede54c899b","txlist_hash":"ef3ac1de31e29795732b362218bd244945bea4183273512ff6974ecd0c0a7aef"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(277,NULL,310086,'insert','blocks','{"block_hash":"4ec8cb1c38b22904e8087a034a6406b896eff4dd28e7620601c6bddf82e2738c","block_index":310087,"block_time":310087000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(278,NULL,310087,'parse','blocks','{"block_index":310087,"ledger_hash":"777873e7ebd0ec3052be65197ec0db8bd72e46d2053badb0f37be1f6e84ae0b3","messages_hash":"96a8a5d4606f2e77f429e6ae8f54576e51e1159969612a14739e69e4121e0fb1","txlist_hash":"3bec931f7207a5b03e5a7d390787cd737e598d04025a1514c7654ef34fd1aedc"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(279,NULL,310087,'insert','blocks','{"block_hash":"e945c815c433cbddd0bf8e66c5c23b51072483492acda98f5c2c201020a8c5b3","block_index":310088,"block_time":310088000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(280,NULL,310088,'parse','blocks','{"block_index":310088,"ledger_hash":"85a5ea57af33dfddddbcbe1a1c87994efe5a21a645713aa164f19e19bfb23c64","messages_hash":"20fbc6981fcb9ff9aea35590a435ac2c7d1513bb4a038a8f62602632b6bee622","txlist_hash":"4030ee911aec8ebfbbeecede9cfb977088fb591b20cf52d5340e5aa13e41c7f7"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(281,NULL,310088,'insert','blocks','{"block_hash":"0382437f895ef3e7e38bf025fd4f606fd44d4bbd6aea71dbdc4ed11a7cd46f33","block_index":310089,"block_time":310089000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(282,NULL,310089,'parse','blocks','{"block_index":310089,"ledger_hash":"bdf3b6e7a14a3aa22d42a7d69f2f96b0993f1eef2952a7d74313c37e1b407523","messages_hash":"3e376fad3e36d13f5c50f8bac968fba251f8192e0661df0dec9266d0de986838","txlist_hash":"255675a022762a349d44af6315173e05c685f351f2b3b770e0ec80e128969a4b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(283,NULL,310089,'insert','blocks','{"block_hash":"b756db71dc037b5a4582de354a3347371267d31ebda453e152f0a13bb2fae969","block_index":310090,"block_time":310090000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(284,NULL,310090,'parse','blocks','{"block_index":310090,"ledger_hash":"9b3ee688c5786ecc438ec9c843ba5f898fe1ab1a8bc3903ad7789aaf6b0c0bf0","messages_hash":"c61c461272d69c03c027a144418a877a6122dba7ba9f2376000d53656037ce75","txlist_hash":"7d658801ab6fbe73231469da5204c5e1c73d290b83449187ec5eec71b846616d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(285,NULL,310090,'insert','blocks','{"block_hash":"734a9aa485f36399d5efb74f3b9c47f8b5f6fd68c9967f134b14cfe7e2d7583c","block_index":310091,"block_time":310091000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(286,NULL,310091,'parse','blocks','{"block_index":310091,"ledger_hash":"25578ac389a77dbf9589b23c5470f3199016ac66a415540ae03efac29dfe7adc","messages_hash":"48792e4348415165ef24cbfadfe83934dfd900c8f2a0bf47251604ad1f9819b5","txlist_hash":"1cb14bc9f998c85e670e2e291cde3a2debe9b4013840c0c060417f509c7210ea"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(287,NULL,310091,'insert','blocks','{"block_hash":"56386beb65f9228740d4ad43a1c575645f6daf59e0dd9f22551c59215b5e8c3d","block_index":310092,"block_time":310092000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(288,NULL,310092,'parse','blocks','{"block_index":310092,"ledger_hash":"bb9109ba299c99cb104ebf2ef6e75141c50264d701d27119525ab5d0a54c1a40","messages_hash":"44a37e3c8140c5d6cc507bae93571af20c9cf4b48e8404edfa4e55c8e5e82931","txlist_hash":"889afcda8b6e0848c7d43014beb0e181c78fa69d3aedec508f4bc0eb8a416029"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(289,NULL,310092,'insert','blocks','{"block_hash":"a74a2425f2f4be24bb5f715173e6756649e1cbf1b064aeb1ef60e0b94b418ddc","block_index":310093,"block_time":310093000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(290,NULL,310093,'parse','blocks','{"block_index":310093,"ledger_hash":"cdb21362b3eb4fc10ba3c6bf3aba41bfc5bd0bf2475f742c1069cb4383be7b95","messages_hash":"b0166f95f4cf48193827d3b5423889419477c07e9a041c41b72df8229e46adee","txlist_hash":"dec762d55ba88cb2c043f627b2a8b26c920cce9d4dc2746065c0bcf2795c2d99"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(291,NULL,310093,'insert','blocks','{"block_hash":"2a8f976f20c4e89ff01071915ac96ee35192d54df3a246bf61fd4a0cccfb5b23","block_index":310094,"block_time":310094000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(292,NULL,310094,'parse','blocks','{"block_index":310094,"ledger_hash":"b82568de09fe4ea06f3dca053dbcbcc61dbe5e44dd300a4301c995ba180f894d","messages_hash":"34ba529a171f062f8e18bd65ef967158d21a63f907c90ff79f00381c1d9836e9","txlist_hash":"625beebc3c34fa3276e022a37c79137c8f09af21454e8171cce7ab7a04453047"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(293,NULL,310094,'insert','blocks','{"block_hash":"bed0fa40c9981223fb40b3be8124ca619edc9dd34d0c907369477ea92e5d2cd2","block_index":310095,"block_time":310095000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(294,NULL,310095,'parse','blocks','{"block_index":310095,"ledger_hash":"513c4a041ee80ba72d1d8428605c682e3485fa45341460bc33fae6540dffb571","messages_hash":"108e625c8ae24f372335196ec1678080f2f5d211a7e47de3eb1da4817dfecd5e","txlist_hash":"b7794e7c8dfe3947ab8d256b94af8bc43acb9ca11f696a81cf9ad98062372959"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(295,NULL,310095,'insert','blocks','{"block_hash":"306aeec3db435fabffdf88c2f26ee83caa4c2426375a33daa2be041dbd27ea2f","block_index":310096,"block_time":310096000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(296,NULL,310096,'parse','blocks','{"block_index":310096,"ledger_hash":"3e8ff43c8d671159355b2d40a995fb8f6d84f6216fa8326fa80ae39aa9d15d03","messages_hash":"d68fba6521389577f6303af99b28050b6cbceb05908bd85de1dacd982537db4c","txlist_hash":"8117c5400c1cfdb97456cf3b79e8572aecf23c29d1c336d5543979d0e81cc158"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(297,NULL,310096,'insert','blocks','{"block_hash":"13e8e16e67c7cdcc80d477491e554b43744f90e8e1a9728439a11fab42cefadf","block_index":310097,"block_time":310097000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(298,NULL,310097,'parse','blocks','{"block_index":310097,"ledger_hash":"19d91de7be12136737d3f8990e7a4a793912c952e71e017d723d750118e849c6","messages_hash":"3f04ffa37371d7689609be3f5e65a6986553bf2e0c9db51e8ac815dbf61b01df","txlist_hash":"1e2f99bf2c03b8c915bd23c94431002d3801a13caf40d9b42f22001c2faf305a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(299,NULL,310097,'insert','blocks','{"block_hash":"ca5bca4b5ec4fa6183e05176abe921cff884c4e20910fab55b603cef48dc3bca","block_index":310098,"block_time":310098000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(300,NULL,310098,'parse','blocks','{"block_index":310098,"ledger_hash":"be75df2e5aff3faaebfc0ce4ab5134790fa728f84500e6989739dddc058738de","messages_hash":"cc3e49edd68887f1f34db7c81e3125f9f76ba0c45aae70a5a4e4f7f8a85baf4d","txlist_hash":"7f692426eab57621527d12cc4a49aa85841de9856cd46ad6992a658ed5c15fb1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(301,NULL,310098,'insert','blocks','{"block_hash":"3c4c2279cd7de0add5ec469648a845875495a7d54ebfb5b012dcc5a197b7992a","block_index":310099,"block_time":310099000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(302,NULL,310099,'parse','blocks','{"block_index":310099,"ledger_hash":"9090b8a4a26ea7dff75658317ce2c6ab828b3b42684922e44debfd1bf8330b8d","messages_hash":"274d30a0808c4740b2fad528bf374e4b65e3bdfa17247e7e1c924bda16be9794","txlist_hash":"c3b0869da7bd7abbda54895e6de81cffd2febe007e1f7085da8cc657512278e6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(303,NULL,310099,'insert','blocks','{"block_hash":"96925c05b3c7c80c716f5bef68d161c71d044252c766ca0e3f17f255764242cb","block_index":310100,"block_time":310100000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(304,NULL,310100,'parse','blocks','{"block_index":310100,"ledger_hash":"d48d30db433bcee44d87153fb3db17d37fbe3534f23eb16ac853b3420d86d80e","messages_hash":"33ba6fe2f691128379ebff991b818614c4665fd09e4c54b61619d2d2ed54c0ce","txlist_hash":"793627f8b7de24827faca4a19ce374f39c90b74e278b83a599cb637877bd6388"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(305,NULL,310100,'insert','blocks','{"block_hash":"369472409995ca1a2ebecbad6bf9dab38c378ab1e67e1bdf13d4ce1346731cd6","block_index":310101,"block_time":310101000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(306,NULL,310101,'insert','transactions','{"block_hash":"369472409995ca1a2ebecbad6bf9dab38c378ab1e67e1bdf13d4ce1346731cd6","block_index":310101,"block_time":310101000,"btc_amount":5430,"data":"00000028000352bb33c8000000000000000a000000000000000a0000000000000000000013b0000003e8","destination":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","fee":7650,"source":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","supported":true,"tx_hash":"db4ea092bea6036e3d1e5f6ec863db9b900252b4f4d6d9faa6165323f433c51e","tx_index":102}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(307,NULL,310101,'insert','debits','{"action":"bet","address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"XCP","block_index":310101,"event":"db4ea092bea6036e3d1e5f6ec863db9b900252b4f4d6d9faa6165323f433c51e","quantity":10,"tx_index":102}',0,'DEBIT');
+INSERT INTO messages VALUES(308,NULL,310101,'insert','bets','{"bet_type":3,"block_index":310101,"counterwager_quantity":10,"counterwager_remaining":10,"deadline":1388000200,"expiration":1000,"expire_index":311101,"fee_fraction_int":5000000.0,"feed_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","leverage":5040,"source":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","status":"open","target_value":0.0,"tx_hash":"db4ea092bea6036e3d1e5f6ec863db9b900252b4f4d6d9faa6165323f433c51e","tx_index":102,"wager_quantity":10,"wager_remaining":10}',0,'OPEN_BET');
+INSERT INTO messages VALUES(309,NULL,310101,'parse','transactions','{"supported":true,"tx_hash":"db4ea092bea6036e3d1e5f6ec863db9b900252b4f4d6d9faa6165323f433c51e","tx_index":102}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(310,NULL,310101,'parse','blocks','{"block_index":310101,"ledger_hash":"53c6f9247cd255c86a69c05c4463ab94f9a3277496c155398c38dc6f7121fe9b","messages_hash":"f3689c9c1663d8e96f34d9e34442f1db962b00725c617592ebad5a5b1338cae4","txlist_hash":"7388dcdfb1f5a54a0d4a4d3e50d486b24a662cef04f054a582e2d5b0bcf3ca28"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(311,NULL,310101,'insert','blocks','{"block_hash":"11e25883fd0479b78ddb1953ef67e3c3d1ffc82bd1f9e918a75c2194f7137f99","block_index":310102,"block_time":310102000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(312,NULL,310102,'insert','transactions','{"block_hash":"11e25883fd0479b78ddb1953ef67e3c3d1ffc82bd1f9e918a75c2194f7137f99","block_index":310102,"block_time":310102000,"btc_amount":0,"data":"0000001e52bb33023ff0000000000000004c4b4009556e69742054657374","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"16462eac6c795cea6e5985ee063867d8c61ae24373df02048186d28118d25bae","tx_index":103}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(313,NULL,310102,'insert','broadcasts','{"block_index":310102,"fee_fraction_int":5000000,"locked":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","text":"Unit Test","timestamp":1388000002,"tx_hash":"16462eac6c795cea6e5985ee063867d8c61ae24373df02048186d28118d25bae","tx_index":103,"value":1.0}',0,'BROADCAST');
+INSERT INTO messages VALUES(314,NULL,310102,'insert','credits','{"address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"XCP","block_index":310102,"calling_function":"bet settled","event":"16462eac6c795cea6e5985ee063867d8c61ae24373df02048186d28118d25bae","quantity":9,"tx_index":103}',0,'CREDIT');
+INSERT INTO messages VALUES(315,NULL,310102,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310102,"calling_function":"bet settled","event":"16462eac6c795cea6e5985ee063867d8c61ae24373df02048186d28118d25bae","quantity":9,"tx_index":103}',0,'CREDIT');
+INSERT INTO messages VALUES(316,NULL,310102,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310102,"calling_function":"feed fee","event":"16462eac6c795cea6e5985ee063867d8c61ae24373df02048186d28118d25bae","quantity":0,"tx_index":103}',0,'CREDIT');
+INSERT INTO messages VALUES(317,NULL,310102,'insert','bet_match_resolutions','{"bear_credit":9,"bet_match_id":"2a2169991597036b6dad687ea1feffd55465a204466f40c35cbba811cb3109b1_5c6562ddad0bc8a1faaded18813a65522cd273709acd190cf9d3271817eefc93","bet_match_type_id":1,"block_index":310102,"bull_credit":9,"escrow_less_fee":null,"fee":0,"settled":true,"winner":null}',0,'BET_MATCH_RESOLUTON');
+INSERT INTO messages VALUES(318,NULL,310102,'update','bet_matches','{"id":"2a2169991597036b6dad687ea1feffd55465a204466f40c35cbba811cb3109b1_5c6562ddad0bc8a1faaded18813a65522cd273709acd190cf9d3271817eefc93","status":"settled"}',0,'BET_MATCH_UPDATE');
+INSERT INTO messages VALUES(319,NULL,310102,'parse','transactions','{"supported":true,"tx_hash":"16462eac6c795cea6e5985ee063867d8c61ae24373df02048186d28118d25bae","tx_index":103}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(320,NULL,310102,'parse','blocks','{"block_index":310102,"ledger_hash":"b225c48fb4c40b2e0695991251f6d69217df6e00c01613e0a20f6a3e34f50d5b","messages_hash":"c3f16c9c50b71969ea4e21819eaf214b1e40316e91af4a3f3964a91b35808e6b","txlist_hash":"7d553f87ef9f2beea74631e2e6ec107522b9f4756f041e2ee40fa3946909b3dd"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(321,NULL,310102,'insert','blocks','{"block_hash":"559a208afea6dd27b8bfeb031f1bd8f57182dcab6cf55c4089a6c49fb4744f17","block_index":310103,"block_time":310103000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(322,NULL,310103,'insert','transactions','{"block_hash":"559a208afea6dd27b8bfeb031f1bd8f57182dcab6cf55c4089a6c49fb4744f17","block_index":310103,"block_time":310103000,"btc_amount":62000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":-99994375,"source":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","supported":true,"tx_hash":"65d4048700fb8ae03f321be93c6669b8497f506a1f43920f96d994f43358c35b","tx_index":104}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(323,NULL,310103,'insert','credits','{"address":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","asset":"XCP","block_index":310103,"calling_function":"burn","event":"65d4048700fb8ae03f321be93c6669b8497f506a1f43920f96d994f43358c35b","quantity":92999138821,"tx_index":104}',0,'CREDIT');
+INSERT INTO messages VALUES(324,NULL,310103,'insert','burns','{"block_index":310103,"burned":62000000,"earned":92999138821,"source":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","status":"valid","tx_hash":"65d4048700fb8ae03f321be93c6669b8497f506a1f43920f96d994f43358c35b","tx_index":104}',0,'BURN');
+INSERT INTO messages VALUES(325,NULL,310103,'parse','blocks','{"block_index":310103,"ledger_hash":"fc2a8ce8efc122e5cbd631998e611dc8707cfe0b8d3f6a531fe5bcc21c17feae","messages_hash":"d57ce83db250acc25efe3e0193a3ae93aa5e521eaf0063a745f538e82e0b6c3d","txlist_hash":"ece7991721b8e94950e2a9f41b9285b34be716340a7621b1c1528f8065e9ac28"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(326,NULL,310103,'insert','blocks','{"block_hash":"55b82e631b61d22a8524981ff3b5e3ab4ad7b732b7d1a06191064334b8f2dfd2","block_index":310104,"block_time":310104000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(327,NULL,310104,'insert','transactions','{"block_hash":"55b82e631b61d22a8524981ff3b5e3ab4ad7b732b7d1a06191064334b8f2dfd2","block_index":310104,"block_time":310104000,"btc_amount":62000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":-99994375,"source":"munimLLHjPhGeSU5rYB2HN79LJa8bRZr5b","supported":true,"tx_hash":"95332a7e3e2b04f2c10e3027327bfc31b686947fb05381e28903e3ff569bd4ff","tx_index":105}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(328,NULL,310104,'insert','credits','{"address":"munimLLHjPhGeSU5rYB2HN79LJa8bRZr5b","asset":"XCP","block_index":310104,"calling_function":"burn","event":"95332a7e3e2b04f2c10e3027327bfc31b686947fb05381e28903e3ff569bd4ff","quantity":92999130460,"tx_index":105}',0,'CREDIT');
+INSERT INTO messages VALUES(329,NULL,310104,'insert','burns','{"block_index":310104,"burned":62000000,"earned":92999130460,"source":"munimLLHjPhGeSU5rYB2HN79LJa8bRZr5b","status":"valid","tx_hash":"95332a7e3e2b04f2c10e3027327bfc31b686947fb05381e28903e3ff569bd4ff","tx_index":105}',0,'BURN');
+INSERT INTO messages VALUES(330,NULL,310104,'parse','blocks','{"block_index":310104,"ledger_hash":"b1a7115902d371d13889008320e52473cd5b34591bd657e372c0048df020012e","messages_hash":"b04d2d8cf335c953fa24a5e17662783dcc80794e937589a0dded13744a9c69ba","txlist_hash":"66dacde33bddb633552c94d9107669297fe26ccdcf482f9098f1e6c05f3d01e6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(331,NULL,310104,'insert','blocks','{"block_hash":"1d72cdf6c4a02a5f973e6eaa53c28e9e13014b4f5bb13f91621a911b27fe936a","block_index":310105,"block_time":310105000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(332,NULL,310105,'insert','transactions','{"block_hash":"1d72cdf6c4a02a5f973e6eaa53c28e9e13014b4f5bb13f91621a911b27fe936a","block_index":310105,"block_time":310105000,"btc_amount":62000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":-99994375,"source":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","supported":true,"tx_hash":"e062d1ebf4cb71bd22d80c949b956f5286080838a7607ccf87945b2b3abfcafa","tx_index":106}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(333,NULL,310105,'insert','credits','{"address":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","asset":"XCP","block_index":310105,"calling_function":"burn","event":"e062d1ebf4cb71bd22d80c949b956f5286080838a7607ccf87945b2b3abfcafa","quantity":92999122099,"tx_index":106}',0,'CREDIT');
+INSERT INTO messages VALUES(334,NULL,310105,'insert','burns','{"block_index":310105,"burned":62000000,"earned":92999122099,"source":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","status":"valid","tx_hash":"e062d1ebf4cb71bd22d80c949b956f5286080838a7607ccf87945b2b3abfcafa","tx_index":106}',0,'BURN');
+INSERT INTO messages VALUES(335,NULL,310105,'parse','blocks','{"block_index":310105,"ledger_hash":"b5fcda12415e713fc81278b95515fe86ecc6beb5810e4f80eb9645f09870dab0","messages_hash":"2e336a7a4575cfab7289b78ebf57f67f09e3efa3a4bdeb2c9b9397deb3701c77","txlist_hash":"656d27bdbf841c33dd3c11253159dc5d8a6d7885db3174f4f9c6a8382d6a7209"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(336,NULL,310105,'insert','blocks','{"block_hash":"9d39cbe8c8a5357fc56e5c2f95bf132382ddad14cbc8abd54e549d58248140ff","block_index":310106,"block_time":310106000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(337,NULL,310106,'insert','transactions','{"block_hash":"9d39cbe8c8a5357fc56e5c2f95bf132382ddad14cbc8abd54e549d58248140ff","block_index":310106,"block_time":310106000,"btc_amount":10000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"mrPk7hTeZWjjSCrMTC2ET4SAUThQt7C4uK","supported":true,"tx_hash":"bbf0b9f6992755a3e371fb0c0b72f6828831e81c6f7ada6f95ba1104fb901ac3","tx_index":107}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(338,NULL,310106,'insert','credits','{"address":"mrPk7hTeZWjjSCrMTC2ET4SAUThQt7C4uK","asset":"XCP","block_index":310106,"calling_function":"burn","event":"bbf0b9f6992755a3e371fb0c0b72f6828831e81c6f7ada6f95ba1104fb901ac3","quantity":14999857,"tx_index":107}',0,'CREDIT');
+INSERT INTO messages VALUES(339,NULL,310106,'insert','burns','{"block_index":310106,"burned":10000,"earned":14999857,"source":"mrPk7hTeZWjjSCrMTC2ET4SAUThQt7C4uK","status":"valid","tx_hash":"bbf0b9f6992755a3e371fb0c0b72f6828831e81c6f7ada6f95ba1104fb901ac3","tx_index":107}',0,'BURN');
+INSERT INTO messages VALUES(340,NULL,310106,'parse','blocks','{"block_index":310106,"ledger_hash":"f3c98c954cf939951d8b24a257bc6b1bc152a6a0bcf6b580ac281c26bbf16499","messages_hash":"79e48332abdd115517204c76fc873417fc8a3da56e255bade91e6f8842c4f192","txlist_hash":"6138a4e92289d72dab6e43906e545dcc3d1475102b7f33195118de74a53fe576"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(341,NULL,310106,'insert','blocks','{"block_hash":"51cc04005e49fa49e661946a0e147240b0e5aac174252c96481ab7ddd5487435","block_index":310107,"block_time":310107000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(342,NULL,310107,'insert','transactions','{"block_hash":"51cc04005e49fa49e661946a0e147240b0e5aac174252c96481ab7ddd5487435","block_index":310107,"block_time":310107000,"btc_amount":0,"data":"0000000c000000000000000100000000000000640000000000000064000000000000006400","destination":"","fee":6150,"source":"munimLLHjPhGeSU5rYB2HN79LJa8bRZr5b","supported":true,"tx_hash":"9834219d2825b4d85ca7ee0d75a5372d9d42ce75eb9144951fca1af5a25915ec","tx_index":108}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(343,NULL,310107,'insert','debits','{"action":"open dispenser","address":"munimLLHjPhGeSU5rYB2HN79LJa8bRZr5b","asset":"XCP","block_index":310107,"event":"9834219d2825b4d85ca7ee0d75a5372d9d42ce75eb9144951fca1af5a25915ec","quantity":100,"tx_index":108}',0,'DEBIT');
+INSERT INTO messages VALUES(344,NULL,310107,'insert','dispensers','{"asset":"XCP","block_index":310107,"dispense_count":0,"escrow_quantity":100,"give_quantity":100,"give_remaining":100,"oracle_address":null,"origin":"munimLLHjPhGeSU5rYB2HN79LJa8bRZr5b","satoshirate":100,"source":"munimLLHjPhGeSU5rYB2HN79LJa8bRZr5b","status":0,"tx_hash":"9834219d2825b4d85ca7ee0d75a5372d9d42ce75eb9144951fca1af5a25915ec","tx_index":108}',0,'OPEN_DISPENSER');
+INSERT INTO messages VALUES(345,NULL,310107,'parse','transactions','{"supported":true,"tx_hash":"9834219d2825b4d85ca7ee0d75a5372d9d42ce75eb9144951fca1af5a25915ec","tx_index":108}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(346,NULL,310107,'parse','blocks','{"block_index":310107,"ledger_hash":"a550df26b8dee075bee82fc59c44ce5cbf65fe9df10c60f3f3009faa2791c783","messages_hash":"110dd70ced22e1a1c91201c1c1ce0afc628885b2f2b3c785624b851983a71dc6","txlist_hash":"b30d22c6d7e8bf574e3b3e11d08bcb73c5853ba348e8688a25670a861d3f4e3a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(347,NULL,310107,'insert','blocks','{"block_hash":"8f2d3861aa42f8e75dc14a23d6046bd89feef0d81996b6e1adc2a2828fbc8b34","block_index":310108,"block_time":310108000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(348,NULL,310108,'insert','transactions','{"block_hash":"8f2d3861aa42f8e75dc14a23d6046bd89feef0d81996b6e1adc2a2828fbc8b34","block_index":310108,"block_time":310108000,"btc_amount":31000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","supported":true,"tx_hash":"93c6d2499a0536c31c77a3db3fc9fc8456fbd0726c45b8f716af16f938727a73","tx_index":109}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(349,NULL,310108,'insert','credits','{"address":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","asset":"XCP","block_index":310108,"calling_function":"burn","event":"93c6d2499a0536c31c77a3db3fc9fc8456fbd0726c45b8f716af16f938727a73","quantity":46499548508,"tx_index":109}',0,'CREDIT');
+INSERT INTO messages VALUES(350,NULL,310108,'insert','burns','{"block_index":310108,"burned":31000000,"earned":46499548508,"source":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","status":"valid","tx_hash":"93c6d2499a0536c31c77a3db3fc9fc8456fbd0726c45b8f716af16f938727a73","tx_index":109}',0,'BURN');
+INSERT INTO messages VALUES(351,NULL,310108,'parse','blocks','{"block_index":310108,"ledger_hash":"e1d8c345c74760010223a823895471d3ad6a2db5c6a70b13850d5cd977414518","messages_hash":"fdaa97987f607fff62cd0459e4d261ba764a7ed75ea6ab1afb3ece06277216dd","txlist_hash":"d03bdcdbb4980ea415ab73c8e91a7fca7099c8c176d6bb4c2fdf72b6873175ae"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(352,NULL,310108,'insert','blocks','{"block_hash":"d23aaaae55e6a912eaaa8d20fe2a9ad4819fe9dc1ed58977265af58fad89d8f9","block_index":310109,"block_time":310109000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(353,NULL,310109,'insert','transactions','{"block_hash":"d23aaaae55e6a912eaaa8d20fe2a9ad4819fe9dc1ed58977265af58fad89d8f9","block_index":310109,"block_time":310109000,"btc_amount":0,"data":"0000001400078a8fe2e5e44100000000000003e8000000000000000000001050534820697373756564206173736574","destination":"","fee":6800,"source":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","supported":true,"tx_hash":"e8baf787b9e4636a3cad0ffeb62992ad7abb160dc6506af0546f566dc178de7e","tx_index":110}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(354,NULL,310109,'insert','debits','{"action":"issuance fee","address":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","asset":"XCP","block_index":310109,"event":"e8baf787b9e4636a3cad0ffeb62992ad7abb160dc6506af0546f566dc178de7e","quantity":50000000,"tx_index":110}',0,'DEBIT');
+INSERT INTO messages VALUES(355,NULL,310109,'insert','assets','{"asset_id":"2122675428648001","asset_longname":null,"asset_name":"PAYTOSCRIPT","block_index":310109}',0,'ASSET_CREATION');
+INSERT INTO messages VALUES(356,NULL,310109,'insert','issuances','{"asset":"PAYTOSCRIPT","asset_longname":null,"block_index":310109,"call_date":0,"call_price":0.0,"callable":false,"description":"PSH issued asset","divisible":false,"fee_paid":50000000,"issuer":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","locked":false,"quantity":1000,"reset":false,"source":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","status":"valid","transfer":false,"tx_hash":"e8baf787b9e4636a3cad0ffeb62992ad7abb160dc6506af0546f566dc178de7e","tx_index":110}',0,'ASSET_ISSUANCE');
+INSERT INTO messages VALUES(357,NULL,310109,'insert','credits','{"address":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","asset":"PAYTOSCRIPT","block_index":310109,"calling_function":"issuance","event":"e8baf787b9e4636a3cad0ffeb62992ad7abb160dc6506af0546f566dc178de7e","quantity":1000,"tx_index":110}',0,'CREDIT');
+INSERT INTO messages VALUES(358,NULL,310109,'parse','transactions','{"supported":true,"tx_hash":"e8baf787b9e4636a3cad0ffeb62992ad7abb160dc6506af0546f566dc178de7e","tx_index":110}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(359,NULL,310109,'parse','blocks','{"block_index":310109,"ledger_hash":"8fb63d8460a222163d15eab76a61e383ffa251a175c16f209648d6782c304059","messages_hash":"bf0b49028ffbb1d91272975e819dd6ecba7847dafe7def099bb7119e99ee357b","txlist_hash":"cff81539539169771000a550581dbdf4d4d1fdabecfb9032342269ff5f100b61"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(360,NULL,310109,'insert','blocks','{"block_hash":"cecc8e4791bd3081995bd9fd67acb6b97415facfd2b68f926a70b22d9a258382","block_index":310110,"block_time":310110000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(361,NULL,310110,'insert','transactions','{"block_hash":"cecc8e4791bd3081995bd9fd67acb6b97415facfd2b68f926a70b22d9a258382","block_index":310110,"block_time":310110000,"btc_amount":5430,"data":"00000000000000a25be34b660000000005f5e100","destination":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"f6a0f819e899b407cbfa07b4eff3d58902af3899abfbaa47d5f31d5b398e76e7","tx_index":111}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(362,NULL,310110,'insert','debits','{"action":"send","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"DIVISIBLE","block_index":310110,"event":"f6a0f819e899b407cbfa07b4eff3d58902af3899abfbaa47d5f31d5b398e76e7","quantity":100000000,"tx_index":111}',0,'DEBIT');
+INSERT INTO messages VALUES(363,NULL,310110,'insert','credits','{"address":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","asset":"DIVISIBLE","block_index":310110,"calling_function":"send","event":"f6a0f819e899b407cbfa07b4eff3d58902af3899abfbaa47d5f31d5b398e76e7","quantity":100000000,"tx_index":111}',0,'CREDIT');
+INSERT INTO messages VALUES(364,NULL,310110,'insert','sends','{"asset":"DIVISIBLE","block_index":310110,"destination":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","quantity":100000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"f6a0f819e899b407cbfa07b4eff3d58902af3899abfbaa47d5f31d5b398e76e7","tx_index":111}',0,'SEND');
+INSERT INTO messages VALUES(365,NULL,310110,'parse','transactions','{"supported":true,"tx_hash":"f6a0f819e899b407cbfa07b4eff3d58902af3899abfbaa47d5f31d5b398e76e7","tx_index":111}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(366,NULL,310110,'parse','blocks','{"block_index":310110,"ledger_hash":"250f7b5c6f00bf06c9cd4de8dea0b8166e2decf093910ea32eabd615b910e7e6","messages_hash":"9bb53822ba08d1625a3eacd2e25ddb87d578d63c081b96395b39a13322c581b4","txlist_hash":"d6853c803a38efdd5190401e94244333cb4f46752a2868d4a03e6d7d6c8c2bad"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(367,NULL,310110,'insert','blocks','{"block_hash":"fde71b9756d5ba0b6d8b230ee885af01f9c4461a55dbde8678279166a21b20ae","block_index":310111,"block_time":310111000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(368,NULL,310111,'insert','transactions','{"block_hash":"fde71b9756d5ba0b6d8b230ee885af01f9c4461a55dbde8678279166a21b20ae","block_index":310111,"block_time":310111000,"btc_amount":0,"data":"0000001e52bb33023ff0000000000000004c4b4009556e69742054657374","destination":"","fee":5975,"source":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","supported":true,"tx_hash":"510f6feb902159622d83f64eae590a4fec88989869a20caf5804c313aa5e0186","tx_index":112}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(369,NULL,310111,'insert','broadcasts','{"block_index":310111,"fee_fraction_int":5000000,"locked":false,"source":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","status":"valid","text":"Unit Test","timestamp":1388000002,"tx_hash":"510f6feb902159622d83f64eae590a4fec88989869a20caf5804c313aa5e0186","tx_index":112,"value":1.0}',0,'BROADCAST');
+INSERT INTO messages VALUES(370,NULL,310111,'parse','transactions','{"supported":true,"tx_hash":"510f6feb902159622d83f64eae590a4fec88989869a20caf5804c313aa5e0186","tx_index":112}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(371,NULL,310111,'parse','blocks','{"block_index":310111,"ledger_hash":"0c3c3d099bf08803f67c2a77d0d67779674d1063cc72d8794b8fe62a55049d75","messages_hash":"65d2ccd2975d2480ed63306ab9054ffdbb76fc442ed4c7dad2aac7428d2506e4","txlist_hash":"9cab90baa72446a36a7c176e82eed32ce968f96b0f29067b240a10a71ed95808"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(372,NULL,310111,'insert','blocks','{"block_hash":"5b06f69bfdde1083785cf68ebc2211b464839033c30a099d3227b490bf3ab251","block_index":310112,"block_time":310112000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(373,NULL,310112,'insert','transactions','{"block_hash":"5b06f69bfdde1083785cf68ebc2211b464839033c30a099d3227b490bf3ab251","block_index":310112,"block_time":310112000,"btc_amount":5430,"data":"00000028000352bb33c8000000000000000a000000000000000a0000000000000000000013b0000003e8","destination":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","fee":7124,"source":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","supported":true,"tx_hash":"d79b590e4ec3e74cbc3eb4d0f956ce7abb0e3af2ccac85ff90ed8acf13f2e048","tx_index":113}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(374,NULL,310112,'insert','debits','{"action":"bet","address":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","asset":"XCP","block_index":310112,"event":"d79b590e4ec3e74cbc3eb4d0f956ce7abb0e3af2ccac85ff90ed8acf13f2e048","quantity":10,"tx_index":113}',0,'DEBIT');
+INSERT INTO messages VALUES(375,NULL,310112,'insert','bets','{"bet_type":3,"block_index":310112,"counterwager_quantity":10,"counterwager_remaining":10,"deadline":1388000200,"expiration":1000,"expire_index":311112,"fee_fraction_int":5000000.0,"feed_address":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","leverage":5040,"source":"2MyJHMUenMWonC35Yi6PHC7i2tkS7PuomCy","status":"open","target_value":0.0,"tx_hash":"d79b590e4ec3e74cbc3eb4d0f956ce7abb0e3af2ccac85ff90ed8acf13f2e048","tx_index":113,"wager_quantity":10,"wager_remaining":10}',0,'OPEN_BET');
+INSERT INTO messages VALUES(376,NULL,310112,'parse','transactions','{"supported":true,"tx_hash":"d79b590e4ec3e74cbc3eb4d0f956ce7abb0e3af2ccac85ff90ed8acf13f2e048","tx_index":113}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(377,NULL,310112,'parse','blocks','{"block_index":310112,"ledger_hash":"557fdd1240793f8607a2b4c638ce800d5260c2adb294aac95d6c5eab7e98c3a9","messages_hash":"8600ea90c90218d55e9aec3aedcfb652432fc0f8c2bfde19ca62f768d1653101","txlist_hash":"4fc0df4832258d430e645f1950407e19e72ea27d28b8ae1851333e8e8718086b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(378,NULL,310112,'insert','blocks','{"block_hash":"63914cf376d3076b697b9234810dfc084ed5a885d5cd188dd5462560da25d5e7","block_index":310113,"block_time":310113000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(379,NULL,310113,'insert','transactions','{"block_hash":"63914cf376d3076b697b9234810dfc084ed5a885d5cd188dd5462560da25d5e7","block_index":310113,"block_time":310113000,"btc_amount":0,"data":"00000014000038fedf6d2c6900000000000003e8010000000000000000000c4c6f636b6564206173736574","destination":"","fee":6800,"source":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","supported":true,"tx_hash":"34bce6f409758b3d6fd13282a99b277ef1fdf44a1025d2901075cac0249dbc63","tx_index":114}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(380,NULL,310113,'insert','debits','{"action":"issuance fee","address":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","asset":"XCP","block_index":310113,"event":"34bce6f409758b3d6fd13282a99b277ef1fdf44a1025d2901075cac0249dbc63","quantity":50000000,"tx_index":114}',0,'DEBIT');
+INSERT INTO messages VALUES(381,NULL,310113,'insert','assets','{"asset_id":"62667321322601","asset_longname":null,"asset_name":"LOCKEDPREV","block_index":310113}',0,'ASSET_CREATION');
+INSERT INTO messages VALUES(382,NULL,310113,'insert','issuances','{"asset":"LOCKEDPREV","asset_longname":null,"block_index":310113,"call_date":0,"call_price":0.0,"callable":false,"description":"Locked asset","divisible":true,"fee_paid":50000000,"issuer":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","locked":false,"quantity":1000,"reset":false,"source":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","status":"valid","transfer":false,"tx_hash":"34bce6f409758b3d6fd13282a99b277ef1fdf44a1025d2901075cac0249dbc63","tx_index":114}',0,'ASSET_ISSUANCE');
+INSERT INTO messages VALUES(383,NULL,310113,'insert','credits','{"address":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","asset":"LOCKEDPREV","block_index":310113,"calling_function":"issuance","event":"34bce6f409758b3d6fd13282a99b277ef1fdf44a1025d2901075cac0249dbc63","quantity":1000,"tx_index":114}',0,'CREDIT');
+INSERT INTO messages VALUES(384,NULL,310113,'parse','transactions','{"supported":true,"tx_hash":"34bce6f409758b3d6fd13282a99b277ef1fdf44a1025d2901075cac0249dbc63","tx_index":114}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(385,NULL,310113,'parse','blocks','{"block_index":310113,"ledger_hash":"4ecad4a5c8e9b54101c4a037d6c86a7eb36d3cf0503e60a1bf13c5a4196c5989","messages_hash":"aaf7654cbbdd946eeec20b756019f62d012569d28e633380b50e501ea11d37d9","txlist_hash":"baf1f86b3145fd8dc33aa2fcb2e882cf69ffadee81e8412ed2092c634934709c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(386,NULL,310113,'insert','blocks','{"block_hash":"24fc2dded4f811eff58b32cda85d90fb5773e81b9267e9a03c359bc730d82283","block_index":310114,"block_time":310114000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(387,NULL,310114,'insert','transactions','{"block_hash":"24fc2dded4f811eff58b32cda85d90fb5773e81b9267e9a03c359bc730d82283","block_index":310114,"block_time":310114000,"btc_amount":0,"data":"00000014000038fedf6d2c69000000000000000001000000000000000000044c4f434b","destination":"","fee":6800,"source":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","supported":true,"tx_hash":"025b810fce7735c5869b90846007e5f604f60c1beda4c1695f1c7fbec3d44bc2","tx_index":115}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(388,NULL,310114,'insert','debits','{"action":"issuance fee","address":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","asset":"XCP","block_index":310114,"event":"025b810fce7735c5869b90846007e5f604f60c1beda4c1695f1c7fbec3d44bc2","quantity":0,"tx_index":115}',0,'DEBIT');
+INSERT INTO messages VALUES(389,NULL,310114,'insert','issuances','{"asset":"LOCKEDPREV","asset_longname":null,"block_index":310114,"call_date":0,"call_price":0.0,"callable":false,"description":"Locked asset","divisible":true,"fee_paid":0,"issuer":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","locked":true,"quantity":0,"reset":false,"source":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","status":"valid","transfer":false,"tx_hash":"025b810fce7735c5869b90846007e5f604f60c1beda4c1695f1c7fbec3d44bc2","tx_index":115}',0,'ASSET_ISSUANCE');
+INSERT INTO messages VALUES(390,NULL,310114,'parse','transactions','{"supported":true,"tx_hash":"025b810fce7735c5869b90846007e5f604f60c1beda4c1695f1c7fbec3d44bc2","tx_index":115}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(391,NULL,310114,'parse','blocks','{"block_index":310114,"ledger_hash":"00380ec3118a5e8f9cab403d10870dd5bc339421297fcb6196a3112d70541ecd","messages_hash":"1dce35ef471c90ab925590429d3bc5d7c2987aedf5acc0ea1b3be46e88f0158e","txlist_hash":"22e3851c91f780c0152549b24228d0dab3542c2632b633995c0d8dcfd8e26601"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(392,NULL,310114,'insert','blocks','{"block_hash":"a632d67ff5f832fe9c3c675f855f08a4969c6d78c0211e71b2a24fe04be5656a","block_index":310115,"block_time":310115000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(393,NULL,310115,'insert','transactions','{"block_hash":"a632d67ff5f832fe9c3c675f855f08a4969c6d78c0211e71b2a24fe04be5656a","block_index":310115,"block_time":310115000,"btc_amount":0,"data":"00000014000038fedf6d2c69000000000000000001000000000000000000076368616e676564","destination":"","fee":6800,"source":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","supported":true,"tx_hash":"4ab1a24283c1dbfc710be7b215d64e8a4510ee97af019e210049c25773b50beb","tx_index":116}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(394,NULL,310115,'insert','debits','{"action":"issuance fee","address":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","asset":"XCP","block_index":310115,"event":"4ab1a24283c1dbfc710be7b215d64e8a4510ee97af019e210049c25773b50beb","quantity":0,"tx_index":116}',0,'DEBIT');
+INSERT INTO messages VALUES(395,NULL,310115,'insert','issuances','{"asset":"LOCKEDPREV","asset_longname":null,"block_index":310115,"call_date":0,"call_price":0.0,"callable":false,"description":"changed","divisible":true,"fee_paid":0,"issuer":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","locked":false,"quantity":0,"reset":false,"source":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","status":"valid","transfer":false,"tx_hash":"4ab1a24283c1dbfc710be7b215d64e8a4510ee97af019e210049c25773b50beb","tx_index":116}',0,'ASSET_ISSUANCE');
+INSERT INTO messages VALUES(396,NULL,310115,'parse','transactions','{"supported":true,"tx_hash":"4ab1a24283c1dbfc710be7b215d64e8a4510ee97af019e210049c25773b50beb","tx_index":116}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(397,NULL,310115,'parse','blocks','{"block_index":310115,"ledger_hash":"0acd3a07c5df54e883ff9871852c961b00771d3f4afccb3b1941d0b1c7b300cc","messages_hash":"2d466dd469c4531675c2190d0e4d9fb2daad5b33426b3d22058ed9770cdae63f","txlist_hash":"cf921f50b98df4ec37f2a9803315a798198507adcbfd8fd54e6a9bc539cc8f41"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(398,NULL,310115,'insert','blocks','{"block_hash":"8495ba36b331473c4f3529681a118a4cc4fa4d51cd9b8dccb1f13e5ef841dd84","block_index":310116,"block_time":310116000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(399,NULL,310116,'insert','transactions','{"block_hash":"8495ba36b331473c4f3529681a118a4cc4fa4d51cd9b8dccb1f13e5ef841dd84","block_index":310116,"block_time":310116000,"btc_amount":62000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"tb1qw508d6qejxtdg4y5r3zarvary0c5xw7kxpjzsx","supported":true,"tx_hash":"27929c4fcad307a76ea7da34dd2691084f678a22ee43ce7f3842b78730ee08f9","tx_index":117}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(400,NULL,310116,'insert','credits','{"address":"tb1qw508d6qejxtdg4y5r3zarvary0c5xw7kxpjzsx","asset":"XCP","block_index":310116,"calling_function":"burn","event":"27929c4fcad307a76ea7da34dd2691084f678a22ee43ce7f3842b78730ee08f9","quantity":92999030129,"tx_index":117}',0,'CREDIT');
+INSERT INTO messages VALUES(401,NULL,310116,'insert','burns','{"block_index":310116,"burned":62000000,"earned":92999030129,"source":"tb1qw508d6qejxtdg4y5r3zarvary0c5xw7kxpjzsx","status":"valid","tx_hash":"27929c4fcad307a76ea7da34dd2691084f678a22ee43ce7f3842b78730ee08f9","tx_index":117}',0,'BURN');
+INSERT INTO messages VALUES(402,NULL,310116,'parse','blocks','{"block_index":310116,"ledger_hash":"6c6845d3be70cbe9a71c33227983f695c96877aac6d3a8d6a6839760b4691d25","messages_hash":"c94709a97d76eda00339d8b9313c132c7124fedcbb4f13f7fc65521eec5fd63e","txlist_hash":"a7e01a910cc919588be3b0c19c4bb7c36499b0a9b0347834d40fbb54fdf05fb6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(403,NULL,310116,'insert','blocks','{"block_hash":"978a3eac44917b82d009332797e2b6fe64c7ce313c0f15bfd9b7bb68e4f35a71","block_index":310117,"block_time":310117000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(404,NULL,310117,'parse','blocks','{"block_index":310117,"ledger_hash":"0465a90ff545d58e69c07c204160360bcc6fba5cc60fb81d7e6e389d9ff8133e","messages_hash":"d882f745bd8f7edc17b13d0807c8d3cfccfbd9dd6678913bd354e2fe5334507f","txlist_hash":"1100b7084683079d36f9ec6e4cb1ec457ae4c45941cdbaa0f4d53bc458e2fa9f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(405,NULL,310117,'insert','blocks','{"block_hash":"02487d8bd4dadabd06a44fdeb67616e6830c3556ec10faad40a42416039f4723","block_index":310118,"block_time":310118000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(406,NULL,310118,'parse','blocks','{"block_index":310118,"ledger_hash":"011ed3df8ae72a02b686e98aa8db07c973e1e12c2ac09891ba90d783ae63161f","messages_hash":"aefb56011c816cb6b5e7a388a109f991957fd957de7ecf9c4f0ea8f7758098db","txlist_hash":"7ed056a59c2b15a2d082f75c8728ee1e7f9b0eea6cb56b37f41319b115e39771"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(407,NULL,310118,'insert','blocks','{"block_hash":"6d6be3478c874c27f5d354c9375884089511b1aaaa3cc3421759d8e3aaeb5481","block_index":310119,"block_time":310119000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(408,NULL,310119,'parse','blocks','{"block_index":310119,"ledger_hash":"a6620b1b6a5b1f54fe6a8076fc35f0f3ce15315e9f549f5ff3fa0f5b6094919f","messages_hash":"0bb1e98956bc350cf8101125e6147253e60978ddeef6b931e13c772056153ce6","txlist_hash":"1312871691c685ced39676d4d4bd8825d2109587d1ec36f2dadc50f68b4d9cca"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(409,NULL,310119,'insert','blocks','{"block_hash":"2bba7fd459ea76fe54d6d7faf437c31af8253438d5685e803c71484c53887deb","block_index":310120,"block_time":310120000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(410,NULL,310120,'parse','blocks','{"block_index":310120,"ledger_hash":"e38e2aa0bf8831b90e69b40c78d4b7d41bc564527451b5f9b332bb0beb54c923","messages_hash":"7b105baade40f901ef31f2f73cd8503ee209f79db870e9bd51502f7260c074f8","txlist_hash":"1901f4d80a526969a544b68b1a695f07aa078ad719b8803c0b7543fcb4a974d6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(411,NULL,310120,'insert','blocks','{"block_hash":"9b3ea991d6c2fe58906bdc75ba6a2095dcb7f00cfdd6108ac75c938f93c94ee7","block_index":310121,"block_time":310121000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(412,NULL,310121,'parse','blocks','{"block_index":310121,"ledger_hash":"5b988c8ad133bb5ff5ac1ee4ad0a6a4fd431247db373e43c9be2a020520f438b","messages_hash":"124d2805fa3144fd091b2ef1c80ce44f9895f9ec4a44e8c7b48237f1282b1e35","txlist_hash":"9921b651b8ca004602b16f95d76b2ea76f03456d9a978abb02bb340f360df7a7"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(413,NULL,310121,'insert','blocks','{"block_hash":"d31b927c46e8f9ba2ccfb02f11a72179e08474bdd1b60dd3dcfd2e91a9ea2932","block_index":310122,"block_time":310122000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(414,NULL,310122,'parse','blocks','{"block_index":310122,"ledger_hash":"70ddab8f1d6283ce5a054650dbcd02d7ad4ca9c35de7bed920c2f266bc092070","messages_hash":"eeac27ff4665134ac9db123eed51a6ebeb9f66b830282684cf14b80fa9ad4018","txlist_hash":"a45cd1eea6626efa3af3dcd3c89782c50cc3b683c1b22249dc67d288e56aeb17"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(415,NULL,310122,'insert','blocks','{"block_hash":"be6d35019a923fcef1125a27387d27237755c136f4926c5eddbf150402ea2bbd","block_index":310123,"block_time":310123000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(416,NULL,310123,'parse','blocks','{"block_index":310123,"ledger_hash":"3670feebcf979edce175ad5b296a4c88fd7fc6bdc251dda84d487b1b092e41dd","messages_hash":"0d89c488b635238845ad30bdc78ec4191561296f57240b2728a3396900f69949","txlist_hash":"78c648296fcc7856757b990a92cf9512c61d180b08d451b63ed4e796d051d338"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(417,NULL,310123,'insert','blocks','{"block_hash":"0984b4a908f1a7dac9dcd94da1ee451e367cc6f3216ee8cdee15eae5d0700810","block_index":310124,"block_time":310124000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(418,NULL,310124,'parse','blocks','{"block_index":310124,"ledger_hash":"9883fff318e7cf9021fb4cc39261840f682e8adabb934549dbae2a10d2a71de3","messages_hash":"6df82c4ffb3e630f9abd9b4f4577221f22a669a0bd985620fec81c585f654797","txlist_hash":"c58aaf910fe01fd9ba6a892ea421c0933f4cebec80c6d2d556accc81102428d3"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(419,NULL,310124,'insert','blocks','{"block_hash":"cc28d39365904b2f91276d09fae040adb1bbbfd4d37d8c329fced276dc52c6a6","block_index":310125,"block_time":310125000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(420,NULL,310125,'parse','blocks','{"block_index":310125,"ledger_hash":"1840685242f9090297d4b432e305e4a093f90faa0b673953b648fbed948f31b6","messages_hash":"8cb8ff5c4c38c9c0fba5186c78e3c57041831ddc55b169a74995edce686de946","txlist_hash":"3d1e4c3a02456d7f79402a89f6a39dcb235fde15b275a762197b70e643d29e25"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(421,NULL,310125,'insert','blocks','{"block_hash":"c9d6c2bd3eeb87f3f1033a13de8255a56445341c920a6a0ee2fb030877106797","block_index":310126,"block_time":310126000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(422,NULL,310126,'parse','blocks','{"block_index":310126,"ledger_hash":"1a83f417c18439cd3c6269626c44b480317290f0c27a9b9f883a01653de69272","messages_hash":"9fd0630d7ebf232470cd1a8c7e051bbcdb752b88598aa90bec029fb7f118a128","txlist_hash":"7cde633cf5f7bc1176a3faa6ad03a449d3fb0d21dcce5885d2a37b81448a2ca5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(423,NULL,310126,'insert','blocks','{"block_hash":"c952f369e2b3317725b4b73ba1922b84af881bd59054be94406a5d9bbb106904","block_index":310127,"block_time":310127000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(424,NULL,310127,'parse','blocks','{"block_index":310127,"ledger_hash":"094c53dfd00b5004d074987dba90a6c9c47841d01041d0aeb61923c48315d1bb","messages_hash":"fc7ec51fc69f7284dbd6df219ff906253036d1696f5518d346fe5a1997bbd05c","txlist_hash":"0ac0ddcc5c45d4d709d9070814832bfa2339eaf5edbed98232cda4b1731e5478"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(425,NULL,310127,'insert','blocks','{"block_hash":"990b0d3575caf5909286b9701ece586338067fbd35357fec7d6a54c6a6120079","block_index":310128,"block_time":310128000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(426,NULL,310128,'parse','blocks','{"block_index":310128,"ledger_hash":"28ad1365daaadc866e79b6b1a555fa31bd804a85827d958cebb9d29511f78e19","messages_hash":"c726eba0cec90d465a44ede024b1f8dc58063711870de6e82d1424ffa23f4081","txlist_hash":"aa9a25819899fc8948c4906673cfc8128c0a98417db8fe659098d28ca12e3786"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(427,NULL,310128,'insert','blocks','{"block_hash":"fa8a7d674a9a3e4b40053cf3b819385a71831eec2f119a0f0640c6870ca1dddc","block_index":310129,"block_time":310129000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(428,NULL,310129,'parse','blocks','{"block_index":310129,"ledger_hash":"61587f9b5d05f8f553f0a4f580f38a140edcf7d9facb13c542865f5ec586a32c","messages_hash":"f0bfe24dec959d07b2b68a79c3c85caf68911d384ef64b4244b61fb86aa21eb3","txlist_hash":"ca3752868d963f0c165166928139cb078aefd0ebcbd9ab8f182c631ff941a56b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(429,NULL,310129,'insert','blocks','{"block_hash":"d3046e8e8ab77a67bf0629a3bab0bea4975631d52099d2ddc9c9fa0860522721","block_index":310130,"block_time":310130000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(430,NULL,310130,'parse','blocks','{"block_index":310130,"ledger_hash":"1ee8c39657890ac946e2aac5409147cdbf1b0004db1f00d997cf45452596f781","messages_hash":"c9d741a97b59ad670227903d4a4b5f63048712721e6ee4a59e6593e3a06a4514","txlist_hash":"bb38c9be1ef6ce22f1f14319cb3e1385d70fc63f7d0b2d80789c9af018baaa71"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(431,NULL,310130,'insert','blocks','{"block_hash":"d6b4357496bc2c42b58a7d1260a3615bfdb86e2ce68cd20914ef3dd3c0cdd34d","block_index":310131,"block_time":310131000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(432,NULL,310131,'parse','blocks','{"block_index":310131,"ledger_hash":"aee45272e68725a2746582f1847582eb9808289d3deca144f8c6cb43bc4f42e6","messages_hash":"eb64baddde8b82bc629227449b9f5ac4cc4adab4b387ad9a2812591de19d6703","txlist_hash":"69fba2b86abed1e740d45d33ec1bed7d2bf7de0f3bd9633959bfe77a21dd7aeb"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(433,NULL,310131,'insert','blocks','{"block_hash":"1b95a691bf4abf92f0dde901e1152cc5bd87a792d4b42613655e4046a57ab818","block_index":310132,"block_time":310132000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(434,NULL,310132,'parse','blocks','{"block_index":310132,"ledger_hash":"a3fe51c1d168ed726a78b72db61175f2abb07ea6c614b2886f3054cdd1a858fe","messages_hash":"ff03eb6a337397b372d03eed981a03eb5f3f9565f66bb943bc1e9fb931a3a298","txlist_hash":"352b00e4db389d411377c2302ecf272f97268e953c30d0976a5d12bffc5a17f7"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(435,NULL,310132,'insert','blocks','{"block_hash":"1029c14051faabf90641371a82f9e2352eaa3d6b1da66737fcf447568ca4ec51","block_index":310133,"block_time":310133000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(436,NULL,310133,'parse','blocks','{"block_index":310133,"ledger_hash":"626743e51b462163f23f22079d672379def21382fd88f9155ddd453ca3d633ef","messages_hash":"5fe7e9c01410af91855efed43e8f9a44d9eb0ef53d2fe80c1d88581285c86df0","txlist_hash":"1a7a1af397c6619b629eba7fdef0f0ea2d737e673d182fe985421dee61d0c63a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(437,NULL,310133,'insert','blocks','{"block_hash":"1748478069b32162affa59105257d81ef9d78aee27c626e7b24d11beb2831398","block_index":310134,"block_time":310134000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(438,NULL,310134,'parse','blocks','{"block_index":310134,"ledger_hash":"4b6e3202cae46fa80222e3ddec001213062ab76b8848eaaf4ab73f44bd84ac55","messages_hash":"33874759d6fdcf012b2fc2b57d21fa0226cb3e18d14194500f282f3b11280f76","txlist_hash":"855a47de54b979a3d958a921c2679825084193b9f1eb0fa56393e0186fb1b440"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(439,NULL,310134,'insert','blocks','{"block_hash":"d128d3469b1a5f8fb43e64b40f8a394945d1eb2f19ccbac2603f7044a4097e4f","block_index":310135,"block_time":310135000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(440,NULL,310135,'parse','blocks','{"block_index":310135,"ledger_hash":"e32784cedeadac39bb292da2c5eaffc983f416e0bf387978691e4c0fa5b1715a","messages_hash":"359ed3a20d949167d5d711db7a275c8e9a410f5edcc76a0bc1e277d1eb563216","txlist_hash":"80e68a8a303975543781e760be8d8b151206fb0335d3e0f5c2821d3e482b0ef0"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(441,NULL,310135,'insert','blocks','{"block_hash":"6ec490aaffe2c222a9d6876a18d1c3d385c742ff4c12d1334613a54042a543a5","block_index":310136,"block_time":310136000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(442,NULL,310136,'parse','blocks','{"block_index":310136,"ledger_hash":"93c67fdabd991708d1e35dabbdf7acb4e928763eeb817b32a79cd0bdb414fd2a","messages_hash":"d8091e8da964d953066d4973a4212788f9ca3b47788454f693a9a9557d8370f0","txlist_hash":"5fd1f9311646bed047ec4ac1d5aa5c74d68d26ddf6bdec14f2f53f4cb9c1f6b1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(443,NULL,310136,'insert','blocks','{"block_hash":"7b44f07e233498303a57e5350f366b767809f1a3426d57b1b754dc16aba76900","block_index":310137,"block_time":310137000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(444,NULL,310137,'parse','blocks','{"block_index":310137,"ledger_hash":"8a43d01155ba47b8b1311c41d5a57112198857701c2970d0fd373da04ef4e585","messages_hash":"2cd10f30db70185a0aa3a4e3b085a99f9b68ddedea747d25a09fe43085873fd7","txlist_hash":"d1f1a4a5fb78621aa1be58d32795feef8ac82572c34a694bf6b0b8c3c73ba7d6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(445,NULL,310137,'insert','blocks','{"block_hash":"d2d658ccbf9baa89c32659e8b6c25b640af4b9b2f28f9d40baae840206402ab5","block_index":310138,"block_time":310138000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(446,NULL,310138,'parse','blocks','{"block_index":310138,"ledger_hash":"4acf0244f3188f60152acc8ca30dcaeadf12e6669b15377c81b7e6dc3c8892b6","messages_hash":"0eb29408989eb9c5a38a5a2ef7808a99f649cd05a3d641f6e2d652732884d6d7","txlist_hash":"645be1bed53d63c268cd21d99a914aa4268b5a357dafa57f706075a66e42f948"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(447,NULL,310138,'insert','blocks','{"block_hash":"b2c6fb61f2ae0b9d75d18fce4c52a53b1d24772b1ad66c51ca51090210527d46","block_index":310139,"block_time":310139000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(448,NULL,310139,'parse','blocks','{"block_index":310139,"ledger_hash":"2d77bdd47ed1b3be1c2edf41473bd5eb707d06dab33717b01c4a227f9855d73d","messages_hash":"86088a65b7c10dc88153276f05db07d1fb4f6d4ad707c5a4a9875e739782e2cc","txlist_hash":"c1e0ab9fe21f807be3431a5d28c048b7f5c49ee5cfba7b9a0a837d1fa5c90f4c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(449,NULL,310139,'insert','blocks','{"block_hash":"edddddea90e07a466298219fd7f5a88975f1213289f7c434ed47152af6b68ebb","block_index":310140,"block_time":310140000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(450,NULL,310140,'parse','blocks','{"block_index":310140,"ledger_hash":"277c0c6dd1c505dc6f9a222c737296396569d8e007c4b9a42582f108e90fa624","messages_hash":"5ff093890b48f2b0ad5d1b99f633fccab79c3014a7f47729399d07e595cdfd45","txlist_hash":"ab9a8224e0e3f8f728b56fd3ff40d960d9d336b2743932053b2419423223f2ac"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(451,NULL,310140,'insert','blocks','{"block_hash":"b5b71d2a271bd638561c56f4ffbe94d6086debaaa86bfeb02ef0d71339310709","block_index":310141,"block_time":310141000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(452,NULL,310141,'parse','blocks','{"block_index":310141,"ledger_hash":"f5d0edff3f22b2e025c884b7c738abe641bca9110a6b9a7b90de179fd6e5d2dc","messages_hash":"89b97705896f32061405c10278c072dc4fa495e92c935ba0c57c5d54cf4473bb","txlist_hash":"d272db9ecd97edb037736fe46ab9585397f38a6d1c1d9455e64b8439811ebe4f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(453,NULL,310141,'insert','blocks','{"block_hash":"a98ae174c41ab8fc575d9c8d53d8e02d8e446b8c6c0d98a20ff234eba082b143","block_index":310142,"block_time":310142000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(454,NULL,310142,'parse','blocks','{"block_index":310142,"ledger_hash":"a9f00ec826a30e66820ab2920cf9573244a24dacd63d48c080b9e80b1c5e05b7","messages_hash":"3e036c1c3d33d8075922c286510d7fe6bf687cd7b6b2ca54bc183e36856266c0","txlist_hash":"0c2ddacd61856ee0743eca9125326981ab9f5711982f53874a0f8153089a8d97"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(455,NULL,310142,'insert','blocks','{"block_hash":"8ba2f7feb302a5f9ec3e8c7fc718b02379df4698f6387d00858005b8f01e062f","block_index":310143,"block_time":310143000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(456,NULL,310143,'parse','blocks','{"block_index":310143,"ledger_hash":"b5765899f770fdb6cf1120535d85826c6b0ae44b16b8d5a619c5cd12c98783ea","messages_hash":"02e0bd55a0bda5403762446e66a13753ebaa5a514c1cd66c7f04ef46ef4df738","txlist_hash":"39ef998b6c6130f79df8dcb5abff84c18a485915f1088b36a10de30da8c6f9c6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(457,NULL,310143,'insert','blocks','{"block_hash":"879ffa05ae6b24b236591c1f1537909179ed1245a27c5fdadd2218ab2193cdb9","block_index":310144,"block_time":310144000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(458,NULL,310144,'parse','blocks','{"block_index":310144,"ledger_hash":"1a80f48136e5938b33f817a7cc1cb60aaf6d628b7811abd43e38cc807a18072a","messages_hash":"807eaade814d710f7f74b556d926b294fff13c105e326d6955b02a4bc5d6d29c","txlist_hash":"0b547c8db7446cd3f26dd0d8b88d533c1361fa5dfae6127b85e87095b42ab66b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(459,NULL,310144,'insert','blocks','{"block_hash":"175449ef0aa4580593ad4a7d0c5a9b117e1549ea772af00caa4ccdc9b1bf7a6e","block_index":310145,"block_time":310145000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(460,NULL,310145,'parse','blocks','{"block_index":310145,"ledger_hash":"fce2f084c1776fcb36b3ae3e0c952893934e24672ffa0d3dac72bb1278af8264","messages_hash":"170f6971eaafb88ec0895d5d9af3ed34bbb3eee703117b5b0e6cf8d8deafe0f1","txlist_hash":"bcef3d9f5eb82fb2198d268e442edfca029d5aa3ccff5e5306f0a1a8cf43b30c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(461,NULL,310145,'insert','blocks','{"block_hash":"e954ab6a110455d745503f7cc8df9d92c1a800fafdd151e7b1912830a9cb7184","block_index":310146,"block_time":310146000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(462,NULL,310146,'parse','blocks','{"block_index":310146,"ledger_hash":"9a98eb971580a0a69fceafc5fd41f398f1908b626c47df57965d1863e9a24b84","messages_hash":"e103e1f0ee51b5fa86d61f8b8ddd9b7918e0d047727daa43c66ad3d13d7b3c12","txlist_hash":"036b1784841e65e5905b012f2b74c70e1d9c33b769603c01387d13e693343411"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(463,NULL,310146,'insert','blocks','{"block_hash":"7650c95eba7bf1cad81575ed12f32a8cc36281a6f41bef13afe1dfc1b03a7e83","block_index":310147,"block_time":310147000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(464,NULL,310147,'parse','blocks','{"block_index":310147,"ledger_hash":"336a89d3d137810d3220d2de432f72e3b3ccd2ada2b746da3859c77dbb89d6a3","messages_hash":"c671dd04015cf20b8cc8fce97e40ed1f31df42f7e42a0989eee0a9b49044554c","txlist_hash":"184e1861a82afa97634e0ad72cff532220a37d75f8eb5e1265039188124f6ad6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(465,NULL,310147,'insert','blocks','{"block_hash":"77c29785877724be924f965215eb50ffe916e3b6b3a2beaea3e3ae4796545a7e","block_index":310148,"block_time":310148000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(466,NULL,310148,'parse','blocks','{"block_index":310148,"ledger_hash":"f904794337dd67d356981d2623b8c3d1d78ba584cd98a8c1db939951d3102612","messages_hash":"35a58ace6733dd96d89ffe8486a3d595754aae5271e3584aabedd6f8cb1076e2","txlist_hash":"c75b4218153bfdf3baf44f22f99523f7c54d957994ee838c05c08dd52d98c06f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(467,NULL,310148,'insert','blocks','{"block_hash":"526b3c4a74c2663fc04ed5234c86974bffddb7235c8736d76860778c30207b3c","block_index":310149,"block_time":310149000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(468,NULL,310149,'parse','blocks','{"block_index":310149,"ledger_hash":"c2972fbd048790f54d9ecef4e18aedec8ae7aa28227d1d43bd19cd71b4feff85","messages_hash":"ecb6a27a09df864cd864d610a210593ec26988d4132f30f63c8607b6323e4c22","txlist_hash":"8dac7e6494cc67fc5c186e74b08d9fc8bc92cf71af9b0e1d919c48e9fecf7660"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(469,NULL,310149,'insert','blocks','{"block_hash":"cdd141f7463967dbeb78bf69dc1cd8e12489f58c4ea0a5dc9c5c01ec4fcea333","block_index":310150,"block_time":310150000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(470,NULL,310150,'parse','blocks','{"block_index":310150,"ledger_hash":"88b999e4ae34386b826b0f3b315953b5eeda8d9ef496af051498bfce6d8737fc","messages_hash":"6c18380805d06f23f130503ad7148ef1a215c0b217199995496a7670aad67c52","txlist_hash":"db25206ba3a052c622c6a5063359308d04fc2a031d6509447d838cf96a0632d1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(471,NULL,310150,'insert','blocks','{"block_hash":"a0f31cc6e12ec86e65e999e806ab3bfa18f4f1084e4aeb4fbd699b4fe284b330","block_index":310151,"block_time":310151000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(472,NULL,310151,'parse','blocks','{"block_index":310151,"ledger_hash":"b7c176a2eff86655f8b0b71cc8bd3bab3a92ba203d4ccd911d63f3d2ce7fdc25","messages_hash":"86d5f32768df40dbbc112f75dde5f7aef0aa1904a689cce3d24be58fc793bfb6","txlist_hash":"c6868100e51f390d57b2da8324915c9751aa3882b6e102055fcfe229d1abfc85"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(473,NULL,310151,'insert','blocks','{"block_hash":"89c8cc3a0938c63a35e89d039aa84318a0fc4e13afac6beb849ac37140132c67","block_index":310152,"block_time":310152000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(474,NULL,310152,'parse','blocks','{"block_index":310152,"ledger_hash":"3f9471c393bc2bf144b17a5febea88c42982ae746fd700a5903c0e6e541e2b09","messages_hash":"206690aa73f071c14545eea0cb0c8838abdfbc8ebd64c0fd097cc2e2a254d481","txlist_hash":"ff691488593add72ffd8fb9c8eab2b2c6f92dc2082615b3829f4b84fc8a81f88"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(475,NULL,310152,'insert','blocks','{"block_hash":"d1121dfa68f4a1de4f97c123d2d2a41a102971a44b34927a78cd539ad8dca482","block_index":310153,"block_time":310153000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(476,NULL,310153,'parse','blocks','{"block_index":310153,"ledger_hash":"c6bc81e7b7e6758bbbfe10fa0e688b09e679fb74a18134639e172c18c6e017a7","messages_hash":"ed1c7beb196128167ad8b9d03f1b9a1b7b5d70cd7add306919cd658bc32f0d87","txlist_hash":"6c303c21dd9de15f2a265d88e04a2c110f32718da29a06294ebafe9ed91d4441"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(477,NULL,310153,'insert','blocks','{"block_hash":"ba982ea2e99d3bc5f574897c85485f89430ae38cf4ab49b7716ed466afa506d6","block_index":310154,"block_time":310154000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(478,NULL,310154,'parse','blocks','{"block_index":310154,"ledger_hash":"b3e07f9de85ab67e88042b1bb52302c6eb16b7ff45d5be6a49700f115ed396d4","messages_hash":"977e7ff9f1e5f0c1f756e802013a6e72299de42a6e2bafad94b57bfdee7a6632","txlist_hash":"b21fe34642b2c9ff09e65be86103f1c3390a01eb51b4d8b98456558639ef6e1f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(479,NULL,310154,'insert','blocks','{"block_hash":"cefb3b87c7b75a0eb8f062a0cde8e1073774ae035d176e9769fc87071c12d137","block_index":310155,"block_time":310155000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(480,NULL,310155,'parse','blocks','{"block_index":310155,"ledger_hash":"27014841a468e23bcb70c718919745eadcded4310031a7be90a4732c96509404","messages_hash":"a171b8e9e9879ede2f4c1fd42173d0b0ae0a07fc4d1e7f2f58ba50855fd986f6","txlist_hash":"0e5f0bfae3a6ced9c6498cbe95b8bcb56c76530830baa61345b8072aa6e28ff3"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(481,NULL,310155,'insert','blocks','{"block_hash":"6e3811e65cb02434f9fde0445a7a2b03fe796041458737d0afcc52208f988a83","block_index":310156,"block_time":310156000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(482,NULL,310156,'parse','blocks','{"block_index":310156,"ledger_hash":"5597aaadb8cc75848219f9fde3f5d76bb5592689c72068db59922732e89eef9d","messages_hash":"e06a1bce3d693147d3df5c1a5ad3b7b421d526213ced3eec59be44220aa6c2c1","txlist_hash":"ff3319c50ddd9bbd558542bdde3d612a475b543d6a34ea76738d929b5e05a380"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(483,NULL,310156,'insert','blocks','{"block_hash":"51dd192502fe797c55287b04c403cc63c087020a01c974a565dd4038db82f94a","block_index":310157,"block_time":310157000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(484,NULL,310157,'parse','blocks','{"block_index":310157,"ledger_hash":"cc1ae27fef286424e40204f6b575e9e079e1f7a5ccf6cc356729a7c4a7f83eb8","messages_hash":"e9ab5031997634f6ad74021f5adf3d5a62388fd55401a584464d7bd1c7edd44c","txlist_hash":"9b4884eaca300843017c2732aa8d09815eee4701cff996cc8b6ca6d62af4055d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(485,NULL,310157,'insert','blocks','{"block_hash":"749395af0c3221b8652d31b4c4410c19b10404d941c7e78d765b865f853559d2","block_index":310158,"block_time":310158000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(486,NULL,310158,'parse','blocks','{"block_index":310158,"ledger_hash":"6d80d98e778b30c124b0255b3e72620f432245d0f841f6bd62a0fcff44843bf0","messages_hash":"be1d3efb0c59cb3610c20487d20907179398843322cf4a26681010bc89d3032a","txlist_hash":"03a33d54ece86ab81f4f6e1cb337b07b6fc105a580a4ff82496885c7671939a4"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(487,NULL,310158,'insert','blocks','{"block_hash":"fc0e9f7b6ae99080bc41625588cef73b59c8a9f7a21d7f9f1bf96192ba631c12","block_index":310159,"block_time":310159000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(488,NULL,310159,'parse','blocks','{"block_index":310159,"ledger_hash":"d8ab8bb14092afea6cc675d2f50891318e3169bf9dbe2d07e80c4db95f0f2033","messages_hash":"4c81d40dc2e7cbc7e47272cbc8fd00b3b88fc7743ae9127216c8fd3cf0a29440","txlist_hash":"c292a08eda8cb807f0c11947fc08c748353bf545596d8c6c03a4a734d25461a6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(489,NULL,310159,'insert','blocks','{"block_hash":"163a82beeba44b4cb83a31764047880455a94a03e859dc050da782ed89c5fa8b","block_index":310160,"block_time":310160000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(490,NULL,310160,'parse','blocks','{"block_index":310160,"ledger_hash":"2d76a042d062b73b7dd956d5cff0ee397f068c04eae6cf5b9522d3d55e88cee9","messages_hash":"4091dc7273cdb5d4bd19145a422394d0ce18572cbc6665e32274bff761d04c62","txlist_hash":"df1e1e18b65c4322284ab36204d9f4397c0dade89bf25486c8b84f6358e0f18e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(491,NULL,310160,'insert','blocks','{"block_hash":"609c983d412a23c693e666abdea3f672e256674bf9ee55df89b5d9777c9264d8","block_index":310161,"block_time":310161000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(492,NULL,310161,'parse','blocks','{"block_index":310161,"ledger_hash":"beb3496742415027bcc0d59f3385809523c8783cd91a5670f2fb6fec3230e980","messages_hash":"54055d0c951f4ca0806dec96cde66848cbb36f6bc836d96cd98db0ff9e4b38cb","txlist_hash":"e61374e297180716eee972376d16b85266342dfcee4f383ba9061360f7c0a425"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(493,NULL,310161,'insert','blocks','{"block_hash":"043e9645e019f0b6a019d54c5fef5eebee8ce2da1273a21283c517da126fc804","block_index":310162,"block_time":310162000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(494,NULL,310162,'parse','blocks','{"block_index":310162,"ledger_hash":"066a2b93df863300741145cd6a4f1a9ea616bc787861cb8ab809f59d47a6fa1f","messages_hash":"2acaead0979ed14161b7b6665b5431098d5544d1415a8539f20bc27e880790d3","txlist_hash":"bc115f6ddeebabd3e0ea592604ff679267b755376e509c4760cfa394e86498df"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(495,NULL,310162,'insert','blocks','{"block_hash":"959e0a858a81922d2edf84d1fbb49d7c7e897a8f49f70bd5b066744b77836353","block_index":310163,"block_time":310163000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(496,NULL,310163,'parse','blocks','{"block_index":310163,"ledger_hash":"460c271269ccdd8775925b511705207baed8fc212caa7e74fc08a80be600a38a","messages_hash":"4616d2ff3ac7feec157408f1a40dda3e96b3ecbd1fd7977a5d89c40936b1d188","txlist_hash":"d16b6243e4c0718a2adca941956564325985750a9a0833aaa35635335cb504ea"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(497,NULL,310163,'insert','blocks','{"block_hash":"781b7188be61c98d864d75954cf412b2a181364cc1046de45266ccc8cdb730e2","block_index":310164,"block_time":310164000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(498,NULL,310164,'parse','blocks','{"block_index":310164,"ledger_hash":"19a7948cd1bc4a89a427d48bb01330dadff848e2b32ec8b8abe342872850b268","messages_hash":"a86e2d86f493fa42f842b5ae85a42f41a97740d844cdcba66dbe64a7aa48872c","txlist_hash":"54068fbe0e385c8ae2df5cb2c601397e15c019c732e37ed484573f07106741e3"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(499,NULL,310164,'insert','blocks','{"block_hash":"a75081e4143fa95d4aa29618fea17fc3fabd85e84059cc45c96a73473fc32599","block_index":310165,"block_time":310165000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(500,NULL,310165,'parse','blocks','{"block_index":310165,"ledger_hash":"97f0a48a26daf011a8c7b22bb772228a0c8a920eccd011e713956100c9fbdf33","messages_hash":"85a9f6ce9e41a035f7077c6f53371fbaf823985fb3e4aa88c8ab3f917b06014e","txlist_hash":"0783c9e3d99f4f95b64b38b92c4e8b7d257f325d10cd83bc86d684378b9ebbd6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(501,NULL,310165,'insert','blocks','{"block_hash":"a440d426adaa83fa9bb7e3d4a04b4fa06e896fc2813f5966941f1ad1f28cfb41","block_index":310166,"block_time":310166000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(502,NULL,310166,'parse','blocks','{"block_index":310166,"ledger_hash":"edbd00e1229c673f4f15b3ac7bbe020f54b5f3a61b1d158658471076a55c77b0","messages_hash":"b45d7ccd18ec37708371b786d993d4f6cd880a42087093d0651432d357acee0c","txlist_hash":"683f4ab00ee1ff495bf452c511c1582100191ef7b575139b9d2f102c852018c8"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(503,NULL,310166,'insert','blocks','{"block_hash":"ab4293dbea81fedacca1a0d5230fe85a230afc9490d895aa6963acc216125f66","block_index":310167,"block_time":310167000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(504,NULL,310167,'parse','blocks','{"block_index":310167,"ledger_hash":"e118e0f3aad5be73080f4d1892517e8fd2c4575589ccdfadf980edebb9a66a14","messages_hash":"6cd15a6b0104e8343a928946b3bd0dc4ba7062b599e63576a456f9bcbdad2c64","txlist_hash":"d2be4356643047c7bd04eede767d4f6853885f408827f3bec8c54ceb2b7fd71b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(505,NULL,310167,'insert','blocks','{"block_hash":"a12b36a88c2b0ed41f1419a29cc118fae4ecd2f70003de77848bf4a9b2b72dc9","block_index":310168,"block_time":310168000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(506,NULL,310168,'parse','blocks','{"block_index":310168,"ledger_hash":"267f48eb4e3b0925f4f472d8ce6ec57ec5039911b13a14ff2884a41a9cafd7b1","messages_hash":"696d4a61ff5e1174d4f20bdb76941ea081a4d2f3189ea334c4e95224f8c8c8a6","txlist_hash":"ad748b661aad47fa8963b43999846ef9bd00ea2595747f835710360afed16797"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(507,NULL,310168,'insert','blocks','{"block_hash":"204809a85ead8ba63f981fc1db8ae95afe92015f003eaebbec166021867421f3","block_index":310169,"block_time":310169000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(508,NULL,310169,'parse','blocks','{"block_index":310169,"ledger_hash":"df394a6f3b2a9b9dded6019dce9f3d3214db1f30019faffbdc2ce614f629b25a","messages_hash":"cdfd35fa4c56e13b5d326dd331f4ebf61f85518bbbcbade10dc40b1af4a15431","txlist_hash":"3a92e2c7808a00a0ff2b2fb4695b225acf6262c57753023334bcf3de8e1c7ace"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(509,NULL,310169,'insert','blocks','{"block_hash":"b38b0345a20a367dfe854e455e5752f63ac2d9be8de33eab264a29e87f94d119","block_index":310170,"block_time":310170000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(510,NULL,310170,'parse','blocks','{"block_index":310170,"ledger_hash":"3081081c2ab6d8280ef721c5836d0fb7e89eb3d747a4e4522d2e22f5a6b153a2","messages_hash":"a771c459fa5e0cc21787d85a9b38e8ec396e77cc95362ddfa73ec9fb454495fc","txlist_hash":"f4ada9df3e82d94ba52292e829c4c814b3f0d04f0e3f8606a90fed651634fafd"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(511,NULL,310170,'insert','blocks','{"block_hash":"b8ba5ae8d97900ce37dd451e8c6d8b3a0e2664bb1c103bf697355bf3b1de2d2d","block_index":310171,"block_time":310171000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(512,NULL,310171,'parse','blocks','{"block_index":310171,"ledger_hash":"e6a4017e4f7d9da50bb3817990c3e115d5035443de8824dc01b5380a5b4c52a9","messages_hash":"c31dfeb0e49cd9b9f45143ca853172c4f8d3ee88427c3e98f7cc8dd874355392","txlist_hash":"e335e773387256c016b82649c44647ce0355aa108249413f02117fe14f39c56d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(513,NULL,310171,'insert','blocks','{"block_hash":"b17fda199c609ab4cc2d85194dd53fa51ba960212f3964a9d2fe2cfe0bb57055","block_index":310172,"block_time":310172000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(514,NULL,310172,'parse','blocks','{"block_index":310172,"ledger_hash":"89e90622bf8363bcee5cd7ab6d48b6d06ce4cbd067f9985e35e67fc683f4c103","messages_hash":"7d8b260c7351e40751ff111c6c06d7c8aa885428710b3d1e1f0994c35e2f9643","txlist_hash":"d03bfc2a16d240505e3413ce267b263a0ddde5b3f8a04acb6a67d33a89434996"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(515,NULL,310172,'insert','blocks','{"block_hash":"f2dcdc5ffc0aca2e71e6e0466391b388870229398a1f3c57dec646b806a65016","block_index":310173,"block_time":310173000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(516,NULL,310173,'parse','blocks','{"block_index":310173,"ledger_hash":"35ceee6a23757fa49e7f5c34ccf0fd034731e95d564257b443ebfdee7cd294d3","messages_hash":"af128c2ba7c50382bbe8e3b428f19fcd80958bc2e5d4c33be43712d47d435a70","txlist_hash":"73c9dd3d2f5390d0d4379cc8f5e195ba4a0b4d280d3fe663db3940d4a42108ef"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(517,NULL,310173,'insert','blocks','{"block_hash":"fa6f46af9e3664353a473f6fffce56fa295e07985018bface8141b4bf7924679","block_index":310174,"block_time":310174000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(518,NULL,310174,'parse','blocks','{"block_index":310174,"ledger_hash":"101dedf34bc0788c0589c8e2b1d7da4ec65f6eab2e3c5523c0903db685cab017","messages_hash":"c963441968e83c301e8f29f28765581cc5f14e6623c040c3350dc589eea57da6","txlist_hash":"71d9279604a4ac7dbd49f6672ec6cd19ba59b62302eb1b1bd78ecd3b6d4a5263"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(519,NULL,310174,'insert','blocks','{"block_hash":"f71e79fe5f03c3bc7f1360febc5d8f79fc2768ce0ff1872cf27a829b49017333","block_index":310175,"block_time":310175000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(520,NULL,310175,'parse','blocks','{"block_index":310175,"ledger_hash":"67de4a0a9e52d9ae06caf62b3412d0bf2c10a6b24716210b21212d75be75ad6c","messages_hash":"dfee8971396dc54217e263b98b1ee284fabc170a53cf0fa2d123a1f9cbd14d64","txlist_hash":"90b52df6f0427a7dc695fa0e17a7bf3e59d788cf4016bb65c451a151c38f121b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(521,NULL,310175,'insert','blocks','{"block_hash":"67cd1d81f2998f615602346065e37f9ceb8916abb74b5762ead317d5e26453c6","block_index":310176,"block_time":310176000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(522,NULL,310176,'parse','blocks','{"block_index":310176,"ledger_hash":"a90bd400e15727fada1a27be4a6e228bd91a15f0dbd0fb7de3b6779a8bf89e4c","messages_hash":"493da573a8f068a577690df0b951ad995a49bbbdca22029102fa286d1d633269","txlist_hash":"b870ef1dabda015a561f74122039890b1c9c98e2c4c547dea34ed296fc99e8e1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(523,NULL,310176,'insert','blocks','{"block_hash":"6856b1971121b91c907aaf7aed286648a6074f0bd1f66bd55da2b03116192a52","block_index":310177,"block_time":310177000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(524,NULL,310177,'parse','blocks','{"block_index":310177,"ledger_hash":"bac315d07dee18e27336a46ff3ffeed58aaf8eb1eb702e98a93c06303c937716","messages_hash":"e54ad17218ff9f1d0ac02978bc5b0ec884a467ccd1417779043860b108dc7e74","txlist_hash":"80b0eed7b842a9779b358c5293771470290876f3acb617d85e1a97e786a73092"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(525,NULL,310177,'insert','blocks','{"block_hash":"8094fdc6e549c4fab18c62e4a9be5583990c4167721a7e72f46eaf1e4e04d816","block_index":310178,"block_time":310178000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(526,NULL,310178,'parse','blocks','{"block_index":310178,"ledger_hash":"186ea0ece84d21ee21889ff13c98959dfc1842063a970e0c095552f0ca86515e","messages_hash":"bb17de70c734bbc12be97953357cba4c749de77aed7ff5e0a5a7c95e02a48bec","txlist_hash":"79d67c9aecc8676b0743ebc9af6b78c6f40d264b54bcb510b0028715fc1ca4bd"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(527,NULL,310178,'insert','blocks','{"block_hash":"d1528027cd25a1530cdc32c4eaff3751a851c947ddc748d99a7d3026a5e581a7","block_index":310179,"block_time":310179000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(528,NULL,310179,'parse','blocks','{"block_index":310179,"ledger_hash":"0200402ef08256efa0adc85b2b4b15fb7448b5107b65fafbcc7985d809e84bc8","messages_hash":"2e03fe798f0a5c1f8dedb60d153f4fbb5c461b6df84a5427c4c5fc568c247632","txlist_hash":"3bbcd82428f094a7089c7c9a5c74be0e400e4a03181ea95faea8681323851d43"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(529,NULL,310179,'insert','blocks','{"block_hash":"f2f401a5e3141a8387aaf9799e8fef92eb0fc68370dae1e27622893406d685c1","block_index":310180,"block_time":310180000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(530,NULL,310180,'parse','blocks','{"block_index":310180,"ledger_hash":"13829eeaf9bdc54f87366e35616c5a57cd836c63db8a9ba7d117d02377ef43e1","messages_hash":"de94fa7ca96ff9c889cdfda64f41e136ecdec886443ac534d48cab345400fdf0","txlist_hash":"2398e91ec31dc2810a4648946a85f5af7df71cae0b678f99aaa17e97d215785b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(531,NULL,310180,'insert','blocks','{"block_hash":"bd59318cdba0e511487d1e4e093b146b0f362c875d35ab5251592b3d9fed7145","block_index":310181,"block_time":310181000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(532,NULL,310181,'parse','blocks','{"block_index":310181,"ledger_hash":"81b4d83a623a55019ad720c1bd3ecef100d8ca49deda91b8ba6ffe9802764df7","messages_hash":"f62a4c12fb1ef9e3f82035ca00f8b419baa84c536d23f127a552b9c3d9df6e3f","txlist_hash":"82cb247f5dfeeb31342861a77bceb74957ceb62932de536d837988a2f471f599"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(533,NULL,310181,'insert','blocks','{"block_hash":"a7e66b4671a11af2743889a10b19d4af09ec873e2b8eb36949d710d22e1d768f","block_index":310182,"block_time":310182000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(534,NULL,310182,'parse','blocks','{"block_index":310182,"ledger_hash":"935e40f93195d450b292481aac481f445d2de8786d04d26263f4adc5a348704c","messages_hash":"454c2009be61a3954687ce793fe7cb30490d41edd77bd9d62006622440df901d","txlist_hash":"1a48f71be7c5f3baa68d68c393a6c68d63596c561005ac7c6df457584fc18c6a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(535,NULL,310182,'insert','blocks','{"block_hash":"85318afb50dc77cf9edfef4d6192f7203415e93be43f19b15ca53e170b0477bb","block_index":310183,"block_time":310183000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(536,NULL,310183,'parse','blocks','{"block_index":310183,"ledger_hash":"268bf841be40615472bf4c60b5306d0763ed50510fbb55c47a6a0ac726e8701f","messages_hash":"6a772e172863a0a850489c0ebce5b7c5467d17a50bb1b04f9ba949dba19ca8b6","txlist_hash":"82d2641b1ab0cdf057e8e68b0cd7824ff8c60222f8d4e23125d68beacf2b3293"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(537,NULL,310183,'insert','blocks','{"block_hash":"042a898e29c2ebf0fdbb4156d29d9ba1a5935e7ed707928cb21824c76dd53bfc","block_index":310184,"block_time":310184000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(538,NULL,310184,'parse','blocks','{"block_index":310184,"ledger_hash":"64323488ca4d32a1f548842db4ac772b750599ce6222020ef6149b4a0e54a935","messages_hash":"c5850f7e42e373ad7c980eac188fc4c1d93c1b70fa5113498aa6a50a7e583a95","txlist_hash":"9a7f77be4828adcfee8ea1f106ecbcb55ae758d5098a6fa1aa3a494af957f7cb"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(539,NULL,310184,'insert','blocks','{"block_hash":"bd78c092ae353c78798482830c007aac1be07e9bc8e52855f620a3d48f46811f","block_index":310185,"block_time":310185000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(540,NULL,310185,'parse','blocks','{"block_index":310185,"ledger_hash":"8946baadef2e19c5e4e4b2d771b36982a217486dcb0f95097b41ce633e61da94","messages_hash":"d67a467f3facea45d03afbe61753a922cd38f8de8c4b23e064a530e2592412aa","txlist_hash":"8956f030f917aa87d9b309bd845b59cb37ba2265184ff1f67bfa4b61e32d43c3"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(541,NULL,310185,'insert','blocks','{"block_hash":"e30a3a92cc2e5ad0133e5cee1f789a1a28bea620974f9ab8fa663da53e5bf707","block_index":310186,"block_time":310186000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(542,NULL,310186,'parse','blocks','{"block_index":310186,"ledger_hash":"e68b5525927cfee15fefee02a16fd700abf6b6e7b4e32e57df7d324fae7ae090","messages_hash":"de219598994c08d7db8fa07ab2a525349193cf9995b12bdebf550efc116f6d3d","txlist_hash":"137a7a7a1ae71a317f7c3c48f7f84e4a782a515fa2096c2abe2c1adeab4e8256"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(543,NULL,310186,'insert','blocks','{"block_hash":"fc6402c86b66b6e953d23ed33d149faa0988fa90aa9f7434e2863e33da2f3414","block_index":310187,"block_time":310187000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(544,NULL,310187,'parse','blocks','{"block_index":310187,"ledger_hash":"c42efa24d48339fc341908a30c6679beeadc9f5918d8d3e62d5c4b06fec845d5","messages_hash":"d102dd65505ea26b381ebc87971f3346b7bc5caf341923fe94dcb249d69b4e30","txlist_hash":"cc587cfca94dbe30e6670dbfc4a5e3ec46732731f5c66aab9c7ef9028b05c22a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(545,NULL,310187,'insert','blocks','{"block_hash":"85694a80e534a53d921b5d2c6b789b747aa73bf5556b91eeed2df148e2ada917","block_index":310188,"block_time":310188000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(546,NULL,310188,'parse','blocks','{"block_index":310188,"ledger_hash":"13de1d9b569d5d2525ecfa39b1eda69f9fd474683b6e34554b1a755125e96e5d","messages_hash":"b8c7ce7442aa512c5eb00e3c222fd2ce668afb4ef43d20af4592755faedf27b0","txlist_hash":"2fcc160068a4eb52ac410937237ec3813bfee52750bd8cef939738b81c8ac30b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(547,NULL,310188,'insert','blocks','{"block_hash":"7c036dadf19348348edbe0abe84861f03370415ed2fec991b9374dbb0ca19a06","block_index":310189,"block_time":310189000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(548,NULL,310189,'parse','blocks','{"block_index":310189,"ledger_hash":"582b8b3d3a226d3f6df497cb933ed5f42e1e992c0c25372ec15de424c0a33368","messages_hash":"51aa347c9fde3d01458f08a73c430406fd712a905ebc897c477ab43297fb57c4","txlist_hash":"ae81616b5fd77e3672318a0a5ef1b20106afc3ce7d730c8beef848d73ba53a0f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(549,NULL,310189,'insert','blocks','{"block_hash":"d6ef65299fb9dfc165284015ff2b23804ffef0b5c8baf6e5fa631211a2edbd8d","block_index":310190,"block_time":310190000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(550,NULL,310190,'parse','blocks','{"block_index":310190,"ledger_hash":"d4c49d5e3aaf21e6fe1c30663d0ba93f7dc9ddb03611e3751fba9aac8d382ac4","messages_hash":"badc62331f35d2d438ef5ac0d918e29d750aae86f1275164354eac7a7e7f5254","txlist_hash":"48c70376450aa80a2a920e4b871d27d1efe703b377ba446a262e06c9a6677611"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(551,NULL,310190,'insert','blocks','{"block_hash":"5987ffecb8d4a70887a7ce2b7acb9a326f176cca3ccf270f6040219590329139","block_index":310191,"block_time":310191000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(552,NULL,310191,'parse','blocks','{"block_index":310191,"ledger_hash":"23d340ff3f1979a43bd1336c9c882b5ee01c646cd104060feacdb5db78025cca","messages_hash":"88f7d700b8ff35da0dbaf70bc08d827586f42dd7e817ae603c2f81058850c9d1","txlist_hash":"704b02ead8ed3e4e6505225fc620073993e9c3b13209bff9b5f638d5f21ce23b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(553,NULL,310191,'insert','blocks','{"block_hash":"31b7be43784f8cc2ce7bc982d29a48ff93ef95ba18f82380881c901c50cd0caa","block_index":310192,"block_time":310192000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(554,NULL,310192,'parse','blocks','{"block_index":310192,"ledger_hash":"cd18860851bceba4a0174480ccdc0f6ddc47b31ce71af8ec8500cb07f75d9da9","messages_hash":"b3ed38fcef537adc2756596562698c24287abe616870b22853ea834aed2a0bf7","txlist_hash":"17018479e73908fd235313691ed8464b93a0a5db774d3608294e23fba918c672"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(555,NULL,310192,'insert','blocks','{"block_hash":"ff3bb9c107f3a6e138440dee2d60c65e342dfbf216e1872c7cdb45f2a4d8852a","block_index":310193,"block_time":310193000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(556,NULL,310193,'parse','blocks','{"block_index":310193,"ledger_hash":"391e97ae7ccf5bc38ac72e7ad1256f24c28297c625bd9a789cba8231a5ade046","messages_hash":"62ffa442b4f5a7835ddc82c0f5b5362aa3c97ecb66b039670ee22893b6891ad9","txlist_hash":"d08696a916e09e242fd20a9f8314cd4fb6305e991b506c53e3ef3f77e2d1d6dd"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(557,NULL,310193,'insert','blocks','{"block_hash":"d1d8f8c242a06005f59d3c4f85983f1fa5d5edcc65eb48e7b75ed7165558434a","block_index":310194,"block_time":310194000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(558,NULL,310194,'parse','blocks','{"block_index":310194,"ledger_hash":"9141c9b38087c7cf2b8c11ffd55c2eabcb3bb09f132ac0baf9c3779f628dd42b","messages_hash":"015c140f5d377fa59b3c9d8b1c572565f35cd73b230f7530d42d7bf3e84cf41f","txlist_hash":"d5f418ef4569bb977ff73ab64235b3697d0f7f326f95696e6f63c56cdd180d6d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(559,NULL,310194,'insert','blocks','{"block_hash":"0b2f1f57c9a7546faac835cbe43243473fa6533b6e4d8bf8d13b8e3c710faf53","block_index":310195,"block_time":310195000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(560,NULL,310195,'parse','blocks','{"block_index":310195,"ledger_hash":"705918f002db29e7b3dfbfd6378f79d53e33c6ffa3948b2e3b5c85f85009bbde","messages_hash":"86c493dd15da412115cf100f1ae5090054ecc5c70899504cd8d28b4341c6b2f4","txlist_hash":"d0165e09e04c2049de1d8582291e623c80477499203b702e46fb829390ed64c0"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(561,NULL,310195,'insert','blocks','{"block_hash":"280e7f4c9d1457e116b27f6fc2b806d3787002fe285826e468e07f4a0e3bd2e6","block_index":310196,"block_time":310196000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(562,NULL,310196,'parse','blocks','{"block_index":310196,"ledger_hash":"59e12df19e3c0e3e23a5d1e9783c75e236a000774a038553312919a0f46b8227","messages_hash":"06521b1a530800f4e086530f29d38e8068690ef94e073c38fe834876aa7f9917","txlist_hash":"57dc6e1a18ce4910ba32e109820e8e0630070251ec745e63557c98ce71dedd80"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(563,NULL,310196,'insert','blocks','{"block_hash":"68de4c7fd020395a407ef59ea267412bbd2f19b0a654f09c0dafbc7c9ada4467","block_index":310197,"block_time":310197000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(564,NULL,310197,'parse','blocks','{"block_index":310197,"ledger_hash":"a0e1817dfc258180fa1629710ff3b6026181a9042fecd2c8b0b5e38118199e07","messages_hash":"0e8eacaff59da1d2ba48a95aeb66456f4e3bed48ee495cea9ec2e0ffb98db2ba","txlist_hash":"58d18f5f2362b4bfbf155b16fc4e8868b311286b25365f3b4b1a9bf73fab69b4"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(565,NULL,310197,'insert','blocks','{"block_hash":"30340d4b655879e82543773117d72017a546630ceac29f591d514f37dd5b1cc2","block_index":310198,"block_time":310198000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(566,NULL,310198,'parse','blocks','{"block_index":310198,"ledger_hash":"ff51bfc670b1387bfce53781750e35a3bf69d907167cf9cf57e15613cc0ff3b2","messages_hash":"47e506e747a98d1964596e6c438825affd74e81533b2f48e21eb4e5a90262f55","txlist_hash":"1443d1c76f64272d6ea00fb8f78913e72c617c515a162c9f1c213be02d48008a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(567,NULL,310198,'insert','blocks','{"block_hash":"494ebe4ce57d53dc0f51e1281f7e335c7315a6a064e982c3852b7179052a4613","block_index":310199,"block_time":310199000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(568,NULL,310199,'parse','blocks','{"block_index":310199,"ledger_hash":"e5f8f8f00de32f0d8d2b62eba27218edcee77563960fe074da5ae86bf5b553f1","messages_hash":"fe470b47af5b3f99bbbcec04aa4e304ac0b2890d03f6432c9f9a3cb6ac22e474","txlist_hash":"87fca2825c48b9ec9db31e2d6e8e8354a0ceff7fa3df299dc2868c7d616a9599"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(569,NULL,310199,'insert','blocks','{"block_hash":"d5169d7b23c44e02a5322e91039ccc7959b558608cf164328cd63dbaf9c81a03","block_index":310200,"block_time":310200000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(570,NULL,310200,'parse','blocks','{"block_index":310200,"ledger_hash":"fd8fb664576868d4f1c843b28efc7ee028417034a33d6f5635238bd13c701b2a","messages_hash":"9eee9c3e3b358fdbfb78813b40b67c9b33bbaf1512e3d7d27f6c05e61d0bf6ea","txlist_hash":"a88ca1fa9d0dfccf2e49323a500ebdfab7ba13b60dc9011c6b510741148dbf54"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(571,NULL,310200,'insert','blocks','{"block_hash":"8842bf23ded504bb28765128c0097e1de47d135f01c5cf47680b3bcf5720ad95","block_index":310201,"block_time":310201000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(572,NULL,310201,'parse','blocks','{"block_index":310201,"ledger_hash":"7e2dbbf14c0620ac0fd4e0e676857e2d055fff80cadfe2d9d0dfe07d36738722","messages_hash":"a22e94319ba0331541ae9446e6313faa1ff5e579294f0a4e73d5a4cbf1368ae2","txlist_hash":"f20074cd00170edae909606eb1bd3937afaa3711590eb7d788c564ddbdc6600f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(573,NULL,310201,'insert','blocks','{"block_hash":"95fa18eecbc0905377a70b3ccd48636528d5131ccfa0126ed4639bc60d0003d8","block_index":310202,"block_time":310202000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(574,NULL,310202,'parse','blocks','{"block_index":310202,"ledger_hash":"084c24e81842ec8edc4144ad64df9f12377318fe4dc491b307b7d377f3f81b2b","messages_hash":"96cba00eb5b84fe3634ae0c4ab0bc5544b5f9a703f20e0c34c3877aa97769071","txlist_hash":"76c57648e216c5f191f04b79d2a1149d273b2a58a6b4956eb1d077abd2cfc113"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(575,NULL,310202,'insert','blocks','{"block_hash":"ab15c43e5ac0b9d4bd7da5a14b8030b55b83d5d1855d9174364adbebf42432f8","block_index":310203,"block_time":310203000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(576,NULL,310203,'parse','blocks','{"block_index":310203,"ledger_hash":"4b0b8d82a5a2c8600a09b1050eed4440d9e0f2d817498f3e32ba27ebcfbaf6d5","messages_hash":"36c279295138f4a6da31842ab3a843f35fdc05807920bb9909042562e3f72a83","txlist_hash":"3e49b55d1309646ffce3b91d3cc3c53c488377518fe30cf6397c0d3c2aec45f4"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(577,NULL,310203,'insert','blocks','{"block_hash":"18996fb47d68e7f4ae140dc1eb80df3e5aba513a344a949fd7c3b4f7cd4d64cb","block_index":310204,"block_time":310204000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(578,NULL,310204,'parse','blocks','{"block_index":310204,"ledger_hash":"9f81657142f7523c01595bef4e9008d8525c2337f6d90140e05abad619d94416","messages_hash":"689909b859f925743226073e922bf8f21ca99caade631f6a1dd49b16dff9fce8","txlist_hash":"89015233602aeb77d2097a328f2a5a065245131ac88ec6ac2d2b9b056e7764b6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(579,NULL,310204,'insert','blocks','{"block_hash":"5363526ff34a35e018d1a18544ad865352a9abf4c801c50aa55742e71630c13a","block_index":310205,"block_time":310205000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(580,NULL,310205,'parse','blocks','{"block_index":310205,"ledger_hash":"fd1cdea0193ed914cc408968efa42377d7c69453aa9bdf8bdf0731d4b1501b01","messages_hash":"4457523f49ff3994beb0520d8f8c96387bcaec1e3dad5d4e414c0118768e1f67","txlist_hash":"1ea101d94c29967a141d71d3b8b15b278f3530c4c16c7e0219b892072d89f8f6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(581,NULL,310205,'insert','blocks','{"block_hash":"0615d9fca5bdf694dca2b255fb9e9256f316aa6b8a9fc700aa63e769189b0518","block_index":310206,"block_time":310206000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(582,NULL,310206,'parse','blocks','{"block_index":310206,"ledger_hash":"5845d6bedf81fba710999bf2954b3c1f3f9ca007a09d812ccae8e2a6d3b9bb07","messages_hash":"643bb31e7baa89d28efcee7755e727165c26c6160da6e474bf0361ca45d4c928","txlist_hash":"e26d49ceb523c99c2583e7bec1b4bbe1f8686c2bd009626fa4c8966c642a1bb8"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(583,NULL,310206,'insert','blocks','{"block_hash":"533b4ece95c58d080f958b3982cbd4d964e95f789d0beffe4dd3c67c50f62585","block_index":310207,"block_time":310207000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(584,NULL,310207,'parse','blocks','{"block_index":310207,"ledger_hash":"b65cf7069a0eb909357cd5d45129b70c576eeabc0cb13404029d088e24a2be34","messages_hash":"7a0ee60726734da2812a9d04529425ae59ac22f6598b536a399f77428e3acb66","txlist_hash":"596206790b52de9f791b99f7e71e3543cec87d4c3b9439ded8b7cbcd182b08e6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(585,NULL,310207,'insert','blocks','{"block_hash":"26c1535b00852aec245bac47ad0167b3fa76f6e661fc96534b1c5e7fdc752f44","block_index":310208,"block_time":310208000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(586,NULL,310208,'parse','blocks','{"block_index":310208,"ledger_hash":"aa54dc010fec8a0ef3871c91667c45e88ffac08ee2fc93274d7ad1b2b5b28102","messages_hash":"66543655288b9354381b07bd124c91433357babb742999fdf19b7c5928ebb9ac","txlist_hash":"3414e0af132ec9df1da5a4304a3c94529bd915631443d34b759a017ad166863a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(587,NULL,310208,'insert','blocks','{"block_hash":"23827b94762c64225d218fa3070a3ea1efce392e3a47a1663d894b8ff8a429bf","block_index":310209,"block_time":310209000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(588,NULL,310209,'parse','blocks','{"block_index":310209,"ledger_hash":"c7866cb2098c87c1333da5b3dce4c84bdeb620c9f1898456b7cceb23e4027df0","messages_hash":"78c91e8e991f4e18fd9b2a200fdbceba6644c5baa7150ab48a55a06378fa2731","txlist_hash":"56dce3d0e9dfa62c44e422f41ecc1517bc98302341496db287adf309f666d3bb"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(589,NULL,310209,'insert','blocks','{"block_hash":"70b24078df58ecc8f7370b73229d39e52bbadcf539814deccb98948ebd86ccc0","block_index":310210,"block_time":310210000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(590,NULL,310210,'parse','blocks','{"block_index":310210,"ledger_hash":"207a1c90d1658d55fa0fc2e1507fce98521647ab5c4d11099c2742279cc92b3f","messages_hash":"b8d234858f912396a71c45ebae9b3a21bace1a8dda0827b9e8a9b82a47cea34d","txlist_hash":"ecd4bb45bef1d8b395add25118bbeedc8d96f818a471bd7606554946a023b151"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(591,NULL,310210,'insert','blocks','{"block_hash":"4acb44225e022e23c7fdea483db5b1f2e04069431a29c682604fe97d270c926d","block_index":310211,"block_time":310211000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(592,NULL,310211,'parse','blocks','{"block_index":310211,"ledger_hash":"dfc7fe172f9bc77148a1bfad5d441a3688f718b4985406d0cefd4c4dcd926208","messages_hash":"03209d67b7b17a0027728b8940661ea37594bc07cfc6780033aa44c481f48af6","txlist_hash":"f999268e3400907f85a0448d124df4d139b228327721fad7ad29ef595b0d16c9"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(593,NULL,310211,'insert','blocks','{"block_hash":"6ef5229ec6ea926e99bf4467b0ed49d444eedb652cc792d2b8968b1e9f3b0547","block_index":310212,"block_time":310212000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(594,NULL,310212,'parse','blocks','{"block_index":310212,"ledger_hash":"32a39bff0606ec93454a2cb144c0bbd1939bf2be6a2ae369b885afc0b5ef33c9","messages_hash":"079f23e8476ed4f50d9aa11b1dbc3ef842c51bc46b622f75c06b06a62388e701","txlist_hash":"2e46422b38cddef2d8a10b343115c5e587b5456480fb1a019f0a5d541e90afb8"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(595,NULL,310212,'insert','blocks','{"block_hash":"17673a8aeff01a8cdc80528df2bd87cdd4a748fcb36d44f3a6d221a6cbddcbe7","block_index":310213,"block_time":310213000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(596,NULL,310213,'parse','blocks','{"block_index":310213,"ledger_hash":"15968873880e97e849e59971d4ef19881b1c11c3148dba966f51d986c59ccf36","messages_hash":"36a8bd5e1cd13df3238cc21da9490b545e51981845daccd2d7c0f3e7476e9f69","txlist_hash":"fa1e7562a89ee572607e6cdbf26c80d4ee1aac2bcd45374d166e2e993f8672cb"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(597,NULL,310213,'insert','blocks','{"block_hash":"4393b639990f6f7cd47b56da62c3470dcbb31ef37094b76f53829fc12d313454","block_index":310214,"block_time":310214000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(598,NULL,310214,'parse','blocks','{"block_index":310214,"ledger_hash":"dcbdc463154fe49a7f22611fcb53e5ca78501424ba741040d89cac9db0a03ac4","messages_hash":"2e5d68dcda983499b5f291e65d92baaf171cc830e18385d212e6c66e5c8c7da5","txlist_hash":"5928d3221dd0bd142368585dc56f9f8a68885be95b7ad46c35bc37fbc61f651f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(599,NULL,310214,'insert','blocks','{"block_hash":"c26253deaf7e8df5d62b158ea4290fc9e92a4a689dadc36915650679743a74c7","block_index":310215,"block_time":310215000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(600,NULL,310215,'parse','blocks','{"block_index":310215,"ledger_hash":"6047855f1c691f27ade1cc4c587f1c11ff68f5f5bd7959a23f801e5da7773eed","messages_hash":"0b8f5bc09af225c25136f886347723693fd43c83b4a0602747803579bd4fe100","txlist_hash":"b6410b25a5d6f17a5431f621d6226491bcb2ed97dac543c06e832cdaa8853d5a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(601,NULL,310215,'insert','blocks','{"block_hash":"6b77673d16911635a36fe55575d26d58cda818916ef008415fa58076eb15b524","block_index":310216,"block_time":310216000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(602,NULL,310216,'parse','blocks','{"block_index":310216,"ledger_hash":"a12fbb09858868de79095c8e3222f6fa179f2f00bc3c97c8205fd9367ae05aef","messages_hash":"58b268d9c7d1747b50ef4a6424d3e57365ce66afa440b9b365126437c676d3cc","txlist_hash":"f8b3b6d36fcb97071d826e68d2e6e5bc60f982c470e68644d94a6ec1342d0148"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(603,NULL,310216,'insert','blocks','{"block_hash":"0e09244f49225d1115a2a0382365b5728adbf04f997067ea17df89e84f9c13a8","block_index":310217,"block_time":310217000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(604,NULL,310217,'parse','blocks','{"block_index":310217,"ledger_hash":"419d8dc096dd58523cd4822748754158f0c11945bbb62100cb5268cd802580a8","messages_hash":"03e581edbb659df8a0b7a2996d0ce6b97f1f9dff6d10a7d1e9443f5b20836521","txlist_hash":"a61fb813a69ed40eae923918a73a8dfe51dd6fa14f5426ada1a5a543ab7bb0ce"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(605,NULL,310217,'insert','blocks','{"block_hash":"3eb26381d8c93399926bb83c146847bfe0b69024220cb145fe6601f6dda957d9","block_index":310218,"block_time":310218000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(606,NULL,310218,'parse','blocks','{"block_index":310218,"ledger_hash":"a36c07f7fdfaf7878d73baf14aee58b42220b2b2411fd1864450ec6ce1fbd173","messages_hash":"9c7ecbd39c0967b83ae38062d7674b5fc87e4330253c78da3d19d7c1d8e12fe2","txlist_hash":"dc1d785fe75a506a691f0eccaf752017fbaf5ce2b7225bdde3fb538281698e4e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(607,NULL,310218,'insert','blocks','{"block_hash":"60da40e38967aadf08696641d44ee5372586b884929974e1cbd5c347dc5befbf","block_index":310219,"block_time":310219000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(608,NULL,310219,'parse','blocks','{"block_index":310219,"ledger_hash":"7958aa94088ecf0384a9a6b0569e9507d208e009e9ce139c823960e40996a47e","messages_hash":"128105377e3c494bd2ddebf06d4f7b341d300abbae44e42233771cbdb8f6b2f0","txlist_hash":"c9aa622e3b372ba0c76efe97c1443cb89f2dfbcf8ff5e28dedf9b3abab3d6384"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(609,NULL,310219,'insert','blocks','{"block_hash":"d78c428ac4d622ab4b4554aa87aeee013d58f428422b35b0ba0f736d491392ef","block_index":310220,"block_time":310220000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(610,NULL,310220,'parse','blocks','{"block_index":310220,"ledger_hash":"00907c4368c2dc76d1ef98a0ba3c86bc4746ed2734b0c10f3797e0af70714240","messages_hash":"f43ab6ee98113914d6107f8950d5f6fb8affc0764a4723aa3da76bb60462ebe6","txlist_hash":"d0c3959f899232cdb5fed61bac2c09e45254959e8bc1a076acb3ba5e3ee63e65"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(611,NULL,310220,'insert','blocks','{"block_hash":"cf5263e382afd268e6059b28dc5862285632efe8d36ba218930765e633d48f2d","block_index":310221,"block_time":310221000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(612,NULL,310221,'parse','blocks','{"block_index":310221,"ledger_hash":"2e42f882087dc2158036592298321113f1b34e15b414efa6d43364c06d368540","messages_hash":"36833c9b3c6ada300b80182e1b9e78ba57b16030c2350a98ae24f85212a8d1c6","txlist_hash":"cf40107f8d11aa8ba96b03912967f88c44e69e20d7105f497d5418fc08aa5800"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(613,NULL,310221,'insert','blocks','{"block_hash":"1519f6ec801bf490282065f5299d631be6553af4b0883df344e7f7e5f49c4993","block_index":310222,"block_time":310222000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(614,NULL,310222,'parse','blocks','{"block_index":310222,"ledger_hash":"00c4a5d41dd629bd0973c03152e4519214dce68498999c8dddc1f7a1cad28a82","messages_hash":"9436a06f0aa4299d6d9dd6eeb34a34763dc1571873ec7d801504482f84e0453f","txlist_hash":"6a012ee8e82d8d24b0a24d4bbab74cbe226afea1a9c1e129aceccd1d7591a107"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(615,NULL,310222,'insert','blocks','{"block_hash":"af208e2029fa49c19aa4770e582e32e0802d0baac463b00393a7a668fa2ea047","block_index":310223,"block_time":310223000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(616,NULL,310223,'parse','blocks','{"block_index":310223,"ledger_hash":"41c7a0fa22ebee9d55f2a3b118314293d155c349ba01069a23ddff76dc842955","messages_hash":"1dd11ae205fb0e3cd0e40f6b38f828c87984aee77d866a89459b419bc35c8b91","txlist_hash":"1080406ec3ccb84490487860bdd507637fa8fbdc68fc886d082bfcdf9ac835e7"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(617,NULL,310223,'insert','blocks','{"block_hash":"5b57815583a5333b14beb50b4a35aeb108375492ee452feeeeb7c4a96cfd6e4c","block_index":310224,"block_time":310224000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(618,NULL,310224,'parse','blocks','{"block_index":310224,"ledger_hash":"66c268462442b69efb56b29e08aae1a404d3543e0a20711e8998a31af45ee929","messages_hash":"2959b2278c2b1ec51545610be3ffe8558ee5b8d21654226a04e99fbfad17cb5d","txlist_hash":"1d5188bf347d72bc66239f3b4c709ecca24141c5474755c567f4176293f275af"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(619,NULL,310224,'insert','blocks','{"block_hash":"0c2992fc10b2ce8d6d08e018397d366c94231d3a05953e79f2db00605c82e41c","block_index":310225,"block_time":310225000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(620,NULL,310225,'parse','blocks','{"block_index":310225,"ledger_hash":"cf39fb28a7e4d4db7657bb11a30d592a15c049000d7ac86d4fb3d942bf879b95","messages_hash":"efd4e825c77a27f6c0d8b18c54f144166479fb35ad75dbab439122b908f4d0b5","txlist_hash":"61dccc2a6cdf50b56700c893611fac0dd6cccadcd672cd438452ebd30852ccf7"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(621,NULL,310225,'insert','blocks','{"block_hash":"b3f6cd212aee8c17ae964536852e7a53c69433bef01e212425a5e99ec0b7e1cb","block_index":310226,"block_time":310226000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(622,NULL,310226,'parse','blocks','{"block_index":310226,"ledger_hash":"cb622a4d04645ad96d3e0006f2b7632e8b82e44206d6c1cb75212b059fe18de5","messages_hash":"07a2801c71185f1fd03a4372433bc536c79aaf46ed374209a41a1fce2d0e9ff8","txlist_hash":"2c131ef357cdc433dce05cf915be1b2c243e51208c877852a19c67968caddca4"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(623,NULL,310226,'insert','blocks','{"block_hash":"ea8386e130dd4e84669dc8b2ef5f4818e2f5f35403f2dc1696dba072af2bc552","block_index":310227,"block_time":310227000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(624,NULL,310227,'parse','blocks','{"block_index":310227,"ledger_hash":"60ae4209347248a3f7ad39b6436627f06e45433f6b6dd89cfd3383d68974a41c","messages_hash":"d652cb4035428a7d0c6ff73d8f6b3bc341ebcfefbd5129f45d77d9a4c63648a3","txlist_hash":"200ccbec2ba0927612c50a1ce2a58f856ecbda876943bfc2d3404724fff1927a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(625,NULL,310227,'insert','blocks','{"block_hash":"8ab465399d5feb5b7933f3e55539a2f53495277dd0780b7bf15f9338560efc7b","block_index":310228,"block_time":310228000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(626,NULL,310228,'parse','blocks','{"block_index":310228,"ledger_hash":"798206ee77c9e2fc8fe943f9bf2074c9c2560f534e3304b944e2ed3c89ce8bcb","messages_hash":"03298834b11f7cf4a87e5717022fea72055bc47a6e8d0f62e4a9810f4cb96b82","txlist_hash":"c8c9a18e8420e274c98c528e0d0636aba20f5a6c983135a61e9cd47d60123185"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(627,NULL,310228,'insert','blocks','{"block_hash":"d0ccca58f131c8a12ef375dc70951c3aa79c638b4c4d371c7f720c9c784f3297","block_index":310229,"block_time":310229000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(628,NULL,310229,'parse','blocks','{"block_index":310229,"ledger_hash":"becad39a4d1bc8d73a856fa1d2bfa251f29b23fec9448a91932dc610243fd8df","messages_hash":"959fc4e9bdfff5818ca84c2a68c31868f6d3bff79e7dcc5df9da122959332a11","txlist_hash":"1d817cb41854bebc85173e6c6c0a8e6ae5a1bdbbd1077a64265ec4c96d60ca45"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(629,NULL,310229,'insert','blocks','{"block_hash":"f126b9318ad8e2d5812d3703ce083a43e179775615b03bd379dae5db46362f35","block_index":310230,"block_time":310230000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(630,NULL,310230,'parse','blocks','{"block_index":310230,"ledger_hash":"e08eac4daa7d7bc70f2f47a835bb80993d6d6db06d8d8986101b717db1c62ed6","messages_hash":"b540fdab5cebac778cf187ae4e15720474ada921e9ceaa1393176bd2a4b8a3ac","txlist_hash":"d37fa640132bf2595891bfaa5d1d562495c780569e2a5d4f8863fd60d6396d95"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(631,NULL,310230,'insert','blocks','{"block_hash":"8667a5b933b6a43dab53858e76e4b9f24c3ac83d3f10b97bb20fde902abd4ceb","block_index":310231,"block_time":310231000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(632,NULL,310231,'parse','blocks','{"block_index":310231,"ledger_hash":"a761c29e76c9d5090cd1d6424beb91d0a9fd9546c67ecaa6d4879177b6745b59","messages_hash":"c5044aaa4b6c6310e113ab4b8d4a06108a09e57b6f082589aa84210ff6ef74eb","txlist_hash":"7bdcbdcc058e4c3d39751316b39bc65594624dc79fc8556e2847c94fb5986200"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(633,NULL,310231,'insert','blocks','{"block_hash":"813813cec50fd01b6d28277785f9e0ae81f3f0ca4cdee9c4a4415d3719c294e8","block_index":310232,"block_time":310232000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(634,NULL,310232,'parse','blocks','{"block_index":310232,"ledger_hash":"5da469b7e21ad8ec4fe7cc2f426dcaeb18a3a4a3c44385d529a8b252c77a9e43","messages_hash":"64b6eb076323d0a896145203b0c7c201c2b57511c3d85d7b546395d75ed44a53","txlist_hash":"721ab1fecac8b537de1c90225f23a62d02a6e8b392f5211a8e020d9169dc75f6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(635,NULL,310232,'insert','blocks','{"block_hash":"79a443f726c2a7464817deb2c737a264c10488cac02c001fd1a4d1a76de411d6","block_index":310233,"block_time":310233000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(636,NULL,310233,'parse','blocks','{"block_index":310233,"ledger_hash":"d8531834d572acc01591997cac000185facc033e1ab72f8218a70d0ae3898914","messages_hash":"d9f33ce31a6349baf6626faf215023a0dcaa381fbbc85519a36790adea83a30c","txlist_hash":"a0b57a1491335a2fde88223b77d7c8a248101187be0b71894b6c56c426603867"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(637,NULL,310233,'insert','blocks','{"block_hash":"662e70a85ddc71d3feae92864315e63c2e1be0db715bb5d8432c21a0c14a63cd","block_index":310234,"block_time":310234000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(638,NULL,310234,'parse','blocks','{"block_index":310234,"ledger_hash":"0ac6803ab61e14bb08fd8051424565086ab11b4d33faef077f5a0732eec6f766","messages_hash":"9174a71d733b2d1bf9fe8554ee25a8f90b8316b6c4bf8f93a290c8bcd96d7482","txlist_hash":"b719ec81bc5245492809b946a86c76c121148d506292a4ae125b368f1a24b72a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(639,NULL,310234,'insert','blocks','{"block_hash":"66915fa9ef2878c38eaf21c50df95d87669f63b40da7bdf30e3c72c6b1fba38e","block_index":310235,"block_time":310235000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(640,NULL,310235,'parse','blocks','{"block_index":310235,"ledger_hash":"5f7de1c7fe45858dcc844604a77051d55de3b9dbb5f5d9910ead8bd0f3af48d8","messages_hash":"26bcd4fe3cc5d852b6ee428aa6d8fed7ac29d4870aa3765afb64a7f606f34f98","txlist_hash":"8d81c116619e760608161facac457bb00d4e816c049afbe42f6e0f7d7f1d09cd"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(641,NULL,310235,'insert','blocks','{"block_hash":"d47fadd733c145ad1a3f4b00e03016697ad6e83b15bd6a781589a3a574de23e4","block_index":310236,"block_time":310236000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(642,NULL,310236,'parse','blocks','{"block_index":310236,"ledger_hash":"c0437ca60921bb73516c31a74f78d2fb48d2c628b629c8f55c8fbb0060718d76","messages_hash":"a90b36102b9796577c3433977637279f790986193da640ed70d16c82dbcb1697","txlist_hash":"1c50aa16f8543f1eee5c2585aa8f7ee373bdb58648b430189ef4d8c9b0b767db"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(643,NULL,310236,'insert','blocks','{"block_hash":"2561400b16b93cfbb1eaba0f10dfaa1b06d70d9a4d560639d1bcc7759e012095","block_index":310237,"block_time":310237000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(644,NULL,310237,'parse','blocks','{"block_index":310237,"ledger_hash":"4340ab34a083b38dbca477b6cc2479e6d70ffd6d6b9b75772068674297abadff","messages_hash":"387939cbc42aadf395163de49936ffa63ea379a764238cedc0a52ecb280a8810","txlist_hash":"2f23795147dfb09a113607e442cdc926222a2b9c3dc173b9e92ab8560de20c9f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(645,NULL,310237,'insert','blocks','{"block_hash":"43420903497d2735dc3077f4d4a2227c29e6fc2fa1c8fd5d55e7ba88782d3d55","block_index":310238,"block_time":310238000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(646,NULL,310238,'parse','blocks','{"block_index":310238,"ledger_hash":"6a76891c10ff0f9416ae1a024b985d621154918bd8ab545980b57fd2d18c4af7","messages_hash":"12bb025b6e426c682d70a6ae543622d706b596d8d1848c61b0fd456113766738","txlist_hash":"31d5717812d8f7e54ac8b7a000c7b599e2123a1de205cef6559b3930c466b961"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(647,NULL,310238,'insert','blocks','{"block_hash":"065efefe89eadd92ef1d12b092fd891690da79eec79f96b969fbaa9166cd6ef1","block_index":310239,"block_time":310239000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(648,NULL,310239,'parse','blocks','{"block_index":310239,"ledger_hash":"1128bb89562fc3b112da425a3dee67adaf741a8021ee378bdfeb44af3b1b1fac","messages_hash":"c501a04f979e29b0f67e8c4b2ab0cd68bcc610b98eba76d64c28e426e9162334","txlist_hash":"82b7482bdf98200b43d483dc7725ea9069ab96d897fa88dfafd73334132d362e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(649,NULL,310239,'insert','blocks','{"block_hash":"50aac88bb1fa76530134b6826a6cc0d056b0f4c784f86744aae3cfc487eeeb26","block_index":310240,"block_time":310240000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(650,NULL,310240,'parse','blocks','{"block_index":310240,"ledger_hash":"be05624b84b2e76794f065f36b4e98d6c6c120f1d8a5db91957bbe7008ce3240","messages_hash":"d0dc75e494d5935319620e47fe5aced48a36185547557d7ecdf4105ce3865810","txlist_hash":"bfd037773e4ad5fedd072183d19e824c36cf21549c374f7d7dab3ac313a1542b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(651,NULL,310240,'insert','blocks','{"block_hash":"792d50a3f8c22ddafe63fa3ba9a0a39dd0e358ba4e2ebcd853ca12941e85bee4","block_index":310241,"block_time":310241000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(652,NULL,310241,'parse','blocks','{"block_index":310241,"ledger_hash":"5abfdfb1aa42fb80ca4538062d152d965b6a7a56bd1e170a7a109409a4606b7a","messages_hash":"021d83e2bcd0861be9bda8a7c6543a42d5cb2b1cad18986155556c784420bae3","txlist_hash":"e0bccb8ee5ac848700b228d8d21970f33fcc7a2c091e4b1d1f7f71c09404ecbe"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(653,NULL,310241,'insert','blocks','{"block_hash":"85dda4f2d80069b72728c9e6af187e79f486254666604137533cbfe216c5ea93","block_index":310242,"block_time":310242000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(654,NULL,310242,'parse','blocks','{"block_index":310242,"ledger_hash":"5f354f767df3256aa6a23544a7164160b9fabe481c85d1891f5250b3026dd7b8","messages_hash":"f20bae6583a51b6e9170deca1b35559f7a93dde4f14718fba8d132d3fe0e6322","txlist_hash":"a9b87a1cd3146663579bf192b97136602806865bb60ca2d464e3111872b61b7f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(655,NULL,310242,'insert','blocks','{"block_hash":"a1f51c9370b0c1171b5be282b5b4892000d8e932d5d41963e28e5d55436ba1bd","block_index":310243,"block_time":310243000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(656,NULL,310243,'parse','blocks','{"block_index":310243,"ledger_hash":"ea3acc31b3c298237fa11ca4400c65ee46732c96e0b7fac5a183dd49d938e730","messages_hash":"d9519ac42fde29980b3bc45cb459ee7e430192d8b5780930877da95a6510c14e","txlist_hash":"b7226a87411a48bc0b25e014f2929d63979a297600f51723a0c9bb89fef120b0"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(657,NULL,310243,'insert','blocks','{"block_hash":"46e98809a8af5158ede4dfaa5949f5be35578712d59a9f4f1de995a6342c58df","block_index":310244,"block_time":310244000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(658,NULL,310244,'parse','blocks','{"block_index":310244,"ledger_hash":"07ad792741a48d5a7b657e6c4dc83e3534c79bd1e7da7044139516124adc8f80","messages_hash":"004314c5aec356c4085a994e40d6e7af4228da1e3ad37071c58a406c9d79ea21","txlist_hash":"baab169058840f62c00af1dc51ee0a77fb964dd27c6241463650fdb6c77d3b6a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(659,NULL,310244,'insert','blocks','{"block_hash":"59f634832088aced78462dd164efd7081148062a63fd5b669af422f4fb55b7ae","block_index":310245,"block_time":310245000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(660,NULL,310245,'parse','blocks','{"block_index":310245,"ledger_hash":"d36a618af8e92da03b373ab0137ded666db6cef906a6b2c0cb8c71057a1a5903","messages_hash":"f256e29cac9ed8fd9084d5ba5c67dcf17a9cfdbf448002b4d23be878f8f6c431","txlist_hash":"18cf40a1489af6f99dc454630c35dddf20acacbf979d47acb30a5831e55f920e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(661,NULL,310245,'insert','blocks','{"block_hash":"6f3d690448b1bd04aaf01cd2a8e7016d0618a61088f2b226b442360d02b2e4cd","block_index":310246,"block_time":310246000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(662,NULL,310246,'parse','blocks','{"block_index":310246,"ledger_hash":"a34e154571ee585a839053a851a007d6d433d3efd2b3e923a9c4ec4bb0dc9d98","messages_hash":"92054cd8a49ac6948cac199791828d3caddd81f90d220fc2da94230f776c98b1","txlist_hash":"a2103af3fa84dc4015979f3a629c46e2234f534f86d7c5a403275a8eae144ba7"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(663,NULL,310246,'insert','blocks','{"block_hash":"fce808e867645071dc8c198bc9a3757536948b972292f743b1e14d2d8283ed66","block_index":310247,"block_time":310247000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(664,NULL,310247,'parse','blocks','{"block_index":310247,"ledger_hash":"ee94fcb9210718095ccdf63f30ab081f45dff765a9ca4f5c86b1b0d98973ef90","messages_hash":"5498543f7056d1878b53eee6bbfbfc859729deff6215caaf7b228b90c2ae0716","txlist_hash":"39cff977657fdbe649c601531383548a3922cde40dd998c355c201cb6deee9f6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(665,NULL,310247,'insert','blocks','{"block_hash":"26c05bbcfef8bcd00d0967e804903d340c337b9d9f3a3e3e5a9773363c3e9275","block_index":310248,"block_time":310248000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(666,NULL,310248,'parse','blocks','{"block_index":310248,"ledger_hash":"029884a5273466fa45cdfbd91ae3aaca50af0771d22f6b55af6367348c2802e2","messages_hash":"a48928b613ea6f3f01d29fdf8a6627a62af3454eeb3fd706201264e41ad28e71","txlist_hash":"6951bec53cc30ad6d9dd3f38f5fa8e4b876cdb1637595d38614ff3e42b53edce"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(667,NULL,310248,'insert','blocks','{"block_hash":"93f5a32167b07030d75400af321ca5009a2cf9fce0e97ea763b92593b8133617","block_index":310249,"block_time":310249000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(668,NULL,310249,'parse','blocks','{"block_index":310249,"ledger_hash":"dc10674812c5249c693ab7b148d048439a0d77266014f3afc1810a6260838f02","messages_hash":"1e5bb681e064d631c8fdaee31e42df684856a141bb47c387a509b4c888a83644","txlist_hash":"2f53ae50e27194404c5b85dab55335582b2961c6997393a9c48e6708bab8f1dc"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(669,NULL,310249,'insert','blocks','{"block_hash":"4364d780ef6a5e11c1bf2e36374e848dbbd8d041cde763f9a2f3b85f5bb017a2","block_index":310250,"block_time":310250000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(670,NULL,310250,'parse','blocks','{"block_index":310250,"ledger_hash":"a0fd49b46ff0000e83d4c56281dfe2be1bbfc924c75969726754b05bf7107641","messages_hash":"58fe2492038e1061f1da22695198180f159b434c09fe8184abb758bfde7dd8ed","txlist_hash":"5148416db7a3e45edd128f1b9b5c61b916ce94f25638cc90a8d73f60afe64176"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(671,NULL,310250,'insert','blocks','{"block_hash":"63a3897d988330d59b8876ff13aa9eac968de3807f1800b343bd246571f0dca7","block_index":310251,"block_time":310251000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(672,NULL,310251,'parse','blocks','{"block_index":310251,"ledger_hash":"bdef6a6203d28d314dc087e539a9cdad19d123b605824f0a66f13bf5f72de9b8","messages_hash":"dc119235a0d3348db073f20e5edd73ba7886d07bd928c6593c8b531697a2e8c3","txlist_hash":"6742a15406482537d29722db3302d492647e4c7487d840fc8e7d74d0806c3bee"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(673,NULL,310251,'insert','blocks','{"block_hash":"768d65dfb67d6b976279cbfcf5927bb082fad08037bc0c72127fab0ebab7bc43","block_index":310252,"block_time":310252000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(674,NULL,310252,'parse','blocks','{"block_index":310252,"ledger_hash":"8da11bec0d58b196ddb073d3aba0def98f01f83da654765fcae21cae6046214e","messages_hash":"b91883ba3c87f07f7f3075cedc509a164fc69cccb3f7b4955263f0a427fa2555","txlist_hash":"2c11848ca51ba429a094ef40b1aa019c132cd9fd6f954139dab5324d77eb7125"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(675,NULL,310252,'insert','blocks','{"block_hash":"bc167428ff6b39acf39fa56f5ca83db24493d8dd2ada59b02b45f59a176dbe9e","block_index":310253,"block_time":310253000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(676,NULL,310253,'parse','blocks','{"block_index":310253,"ledger_hash":"2efa2c5781899d213741e795ca62fbee9d3ddf53792ce002db7484adc66bfbd4","messages_hash":"8c30b4215455a7b5c4fb35ff4b675702192cf87e37cf3a89be543fd46109e8ca","txlist_hash":"1036976d6406322c4c0afb2c6be13d6b89cfb2feb30306c9df8a499330d5489f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(677,NULL,310253,'insert','blocks','{"block_hash":"ebda5a4932d24f6cf250ffbb9232913ae47af84d0f0317c12ae6506c05db26e0","block_index":310254,"block_time":310254000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(678,NULL,310254,'parse','blocks','{"block_index":310254,"ledger_hash":"d062ec468e76421d3769a99eb3c8b2cbf4bf393d109ba13b3bce128613fff547","messages_hash":"12b9c9f7b4c06692d2e1c8ccad20ac1ad2be2bea92cbffd939f4ab8d28374fbe","txlist_hash":"098200d06ee21c916a203065eae3cffe8e2c80e32bce890f96e6bee400cf16ee"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(679,NULL,310254,'insert','blocks','{"block_hash":"cf36803c1789a98e8524f7bcaff084101d4bc98593ef3c9b9ad1a75d2961f8f4","block_index":310255,"block_time":310255000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(680,NULL,310255,'parse','blocks','{"block_index":310255,"ledger_hash":"5c531dc8a7461e9e7a2ead654509d76c9be3427b1d2b75c0ac7ae0e03126c49a","messages_hash":"0ad73b9f29a65b6006fab73449dce8503f1afb74b31cc14d7cbb873df28c48d6","txlist_hash":"b9c0f364e8694264c33b7d993ed45f645410820dd0ff39704b79f6aaa64a46c4"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(681,NULL,310255,'insert','blocks','{"block_hash":"d0b4cf4e77cbbaee784767f3c75675ab1bf50e733db73fa337aa20edefdd5619","block_index":310256,"block_time":310256000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(682,NULL,310256,'parse','blocks','{"block_index":310256,"ledger_hash":"8da9f0162e15e33e14e5e1e22c2fd847055a65b99eec519dd069a83bb9006b51","messages_hash":"58e3369f4b854d4dcf2b03cebb0d9c22eb74381bf8c4f77e46527f6db4ff9205","txlist_hash":"fbb34ac53fa4a19bb467c92b87291aeafd8bf8c43be49c7d487f962df5c50d21"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(683,NULL,310256,'insert','blocks','{"block_hash":"0f42e304acaa582130b496647aa41dcb6b76b5700f7c43dd74b8275c35565f34","block_index":310257,"block_time":310257000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(684,NULL,310257,'parse','blocks','{"block_index":310257,"ledger_hash":"0cf6657db5f3145587a466c05f237289b639668d844abfd8d46430c090b54913","messages_hash":"35b3a89b3adf80381946f70c49cf74fd946b88eb9d243217623c04c645c6be63","txlist_hash":"71c115bc32aefb584d499c054cd09d0ea58ea0cc11d187bd5add8f261f43f055"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(685,NULL,310257,'insert','blocks','{"block_hash":"3a0156dd7512738a0a7adba8eeac1815fac224f49312f75b19a36afb744c579f","block_index":310258,"block_time":310258000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(686,NULL,310258,'parse','blocks','{"block_index":310258,"ledger_hash":"e340defe4bd84e788f9c5b083849e6aa1d5c7f33123ebe62d7abe04b8a9e312e","messages_hash":"c2f31d665dead39ac346bfc8a6459ef003c35ebe858bf2273cc3a532df345a5a","txlist_hash":"0725d989aaa9e8f1a5604f1807ec8f5aa2db518ec2397479e7e6c48c4d2b04ca"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(687,NULL,310258,'insert','blocks','{"block_hash":"e5ed3cdaaf637dd7aa2a7db134253afe716ffdf153e05672df3159b71f8538a9","block_index":310259,"block_time":310259000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(688,NULL,310259,'parse','blocks','{"block_index":310259,"ledger_hash":"03ca0cbce5a5b50988c19c0d4e754240f50821695dca767d1169f8c7f5c1fdcc","messages_hash":"27744046c69e0650cb385182b7b1518085f196c8c2fb11baf13661d2229f4a9c","txlist_hash":"19e343fb3645b7ae94a299eb13691ea02d054e8acef0484a95a4079e42e487b1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(689,NULL,310259,'insert','blocks','{"block_hash":"8717ddcc837032ad1dc0bb148ddc0f6a561ed0d483b81abb0c493c5c82ec33cd","block_index":310260,"block_time":310260000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(690,NULL,310260,'parse','blocks','{"block_index":310260,"ledger_hash":"83a3b43e01f4f25ba05b527415baa3e8b8adba319628c245988136bd8fcdfcfe","messages_hash":"d37ff480b33c750eb958bcd17e37f77d69e5ea91ba2cd0fc5bb3368e788691c6","txlist_hash":"de3dee5cacbf5af3aaf1dac7cae860b06af7a2ba227f2bd81840d149354a05db"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(691,NULL,310260,'insert','blocks','{"block_hash":"a2a9d8c28ea41df606e81bf99cddb84b593bf5ed1e68743d38d63a7b49a50232","block_index":310261,"block_time":310261000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(692,NULL,310261,'parse','blocks','{"block_index":310261,"ledger_hash":"e61c12005d60870fee947fff469631ee540b1a0d6b8aa67614cfacc0a9f65ec0","messages_hash":"5656eb27fedc0aa95a07805caadab9816feac61e3a7e97cb67cdfebfef2d3714","txlist_hash":"58b8a751b3daa23993a773073b44d4bb2715075dbe3cc1738f3138383646504e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(693,NULL,310261,'insert','blocks','{"block_hash":"e8ebcee80fbf5afb735db18419a68d61a5ffdde1b3f189e51967155c559ee4ce","block_index":310262,"block_time":310262000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(694,NULL,310262,'parse','blocks','{"block_index":310262,"ledger_hash":"c21ac4906d435af5b9ef5576da6bce454f65ef16099b7ee03219a4ae1851bb91","messages_hash":"df2d34002ae7a0a83629c3023a29af627de3da68afd4369cae55737968d1ce5f","txlist_hash":"a1e30e203c037b242cb1a41e5fd948828da8192a5db70453602961183a00d36d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(695,NULL,310262,'insert','blocks','{"block_hash":"f5a2d8d77ac9aac8f0c9218eecbb814e4dd0032ec764f15c11407072e037b3c2","block_index":310263,"block_time":310263000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(696,NULL,310263,'parse','blocks','{"block_index":310263,"ledger_hash":"676f6c532ff23839fef228a9fac7719e77a3c20efdc17f3cb2d13035c78820e8","messages_hash":"a5e5e3d49738214545b92d1afd827fb69c457af8294d891460eb14ef72bbae9e","txlist_hash":"ca47834be7a15554ab2dd401462d7d5c14f3f5f9ef9ba715488b1b3704de15ab"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(697,NULL,310263,'insert','blocks','{"block_hash":"ae968fb818cd631d3e3774d176c24ae6a035de4510b133f0a0dd135dc0ae7416","block_index":310264,"block_time":310264000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(698,NULL,310264,'parse','blocks','{"block_index":310264,"ledger_hash":"258854505b1d3067bf360f3d0dcb369ed7a90fec8744578d3dde51a79db72c25","messages_hash":"d06a0daa493d2c5c4a16315a0c4e43447a5cefd995df309dcf6709a2631f1fcf","txlist_hash":"21f8b38aa107a9c6fbd6439244ce85a8a6abd12fde211c4569d28353cad5b8bd"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(699,NULL,310264,'insert','blocks','{"block_hash":"41b50a1dfd10119afd4f288c89aad1257b22471a7d2177facb328157ed6346a1","block_index":310265,"block_time":310265000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(700,NULL,310265,'parse','blocks','{"block_index":310265,"ledger_hash":"72ab32c420a7dcac0e7c36c4d9ca81e237955b4d8bc57c87078ba292923ce98d","messages_hash":"f1bc84e08951dedc768f03db9aec057ac21d9a3eedbd644018defb10dfdd028c","txlist_hash":"9685f9791c085e79a3c298dfe4f49fd1dbf8b4bdacf45e1d25e7d18382ca0e7c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(701,NULL,310265,'insert','blocks','{"block_hash":"1c7c8fa2dc51e8f3cecd776435e68c10d0da238032ebba29cbd4e18b6c299431","block_index":310266,"block_time":310266000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(702,NULL,310266,'parse','blocks','{"block_index":310266,"ledger_hash":"b81386d19aac285fee4e39a818cb0442e378372f7d55f92e6028b37f974e4a61","messages_hash":"31341dfe24064025c6a6fe45b2443ca21d461280708f8070481a46a096880844","txlist_hash":"578600253e06f32b4ee4a312df8213ea7cf12f841858bdf6123b0169cb4bd42e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(703,NULL,310266,'insert','blocks','{"block_hash":"c0aa0f7d4b7bb6842bf9f86f1ff7f028831ee7e7e2d7e495cc85623e5ad39199","block_index":310267,"block_time":310267000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(704,NULL,310267,'parse','blocks','{"block_index":310267,"ledger_hash":"ea8fef9e82e451d9650777b051f19fe5e34b8976f1bcc1880b6eebe5feda34d5","messages_hash":"f153cb888d8bbdf63f4eb45b9cc3b87d6e5ab845eb202deaa48c9d57ab78f23f","txlist_hash":"face84fc0aa45f7b072d73d4930b32e223cc4c22a620c39334fc836e16b2fb5c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(705,NULL,310267,'insert','blocks','{"block_hash":"b476840cc1ce090f6cf61d31a01807864e0a18dc117d60793d34df4f748189af","block_index":310268,"block_time":310268000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(706,NULL,310268,'parse','blocks','{"block_index":310268,"ledger_hash":"1545d381812f0f0caa827a237f145838276fe058b05af4808615738ca9910bf1","messages_hash":"f5a8f5bd5e8cae447a96b75fc4b9a0d70e818a9654206cb23ad8d5ea07e92831","txlist_hash":"ee67f9fcd6ce50ee98da722352a917a46d3c71d2e5ea50294a55c613817e77dd"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(707,NULL,310268,'insert','blocks','{"block_hash":"37460a2ed5ecbad3303fd73e0d9a0b7ba1ab91b552a022d5f300b4da1b14e21e","block_index":310269,"block_time":310269000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(708,NULL,310269,'parse','blocks','{"block_index":310269,"ledger_hash":"fd9cf61ac6e1fba409e4220a141ed6c89c18c893c7a752af53d5f7608bc04a67","messages_hash":"c30fd1c2fa3af21d093e353716fc4c1e8cde49854002a411d98e2a0e76211911","txlist_hash":"6d1424cf68a5b1dfddbbafb260989c5b27c060a40026e829476d979cbd8f4412"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(709,NULL,310269,'insert','blocks','{"block_hash":"a534f448972c42450ad7b7a7b91a084cf1e9ad08863107ef5abc2b2b4997395d","block_index":310270,"block_time":310270000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(710,NULL,310270,'parse','blocks','{"block_index":310270,"ledger_hash":"1d34c8c0dfdb4733a7b589647abb0e6a08f8de93a5c86fbab786f6d9d1500785","messages_hash":"bba3fcf5f4baf2b28664137cb7ac723d03999e9a17eebe6e564e15300415e455","txlist_hash":"fc2696c78afd3051d10ea3ecc56280d2633b732a7c755b9057aa30fb11f58f53"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(711,NULL,310270,'insert','blocks','{"block_hash":"67e6efb2226a2489d4c1d7fd5dd4c38531aca8e3d687062d2274aa5348363b0b","block_index":310271,"block_time":310271000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(712,NULL,310271,'parse','blocks','{"block_index":310271,"ledger_hash":"cf38baabc6e8a082eba1bd8ca2f72af5eb01cb76bd3c9eb101b27080a3a70d17","messages_hash":"2d5aba60683d839b1579c2b69089c00819349fc4f4b6abc5a48f665230f67c91","txlist_hash":"b28638da352abf83f2250bbc2da0f75b14483d7d4c69c93636484e9e3aaa326a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(713,NULL,310271,'insert','blocks','{"block_hash":"6015ede3e28e642cbcf60bc8d397d066316935adbce5d27673ea95e8c7b78eea","block_index":310272,"block_time":310272000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(714,NULL,310272,'parse','blocks','{"block_index":310272,"ledger_hash":"2b2763fa5ab2962582c303062da8b8da7280274e615b3e37f93a32e44793ccc8","messages_hash":"52e5adc7e30dfef0bcb7404f93c28177366b172a8f5c8713aa69c712f479b5fb","txlist_hash":"329d5096486b8dc452e2a1ee0a36d9a17ddd5bbb3149ddeee2bdb4989a7a3a35"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(715,NULL,310272,'insert','blocks','{"block_hash":"625dad04c47f3f1d7f0794fe98d80122c7621284d0c3cf4a110a2e4f2153c96a","block_index":310273,"block_time":310273000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(716,NULL,310273,'parse','blocks','{"block_index":310273,"ledger_hash":"ff9df73d4f92b7557c36f20d8f622923dda225a1ae2871e60f16ee2dfdf5b9d8","messages_hash":"a4460c33d3af7eaf48cff39abbffd1b68bba521b1e1f814f0add5c91b00fdb27","txlist_hash":"f79f73097410b602df3a98901e26ed37d07f1da95249cf0e3a62c811d4f7de3a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(717,NULL,310273,'insert','blocks','{"block_hash":"925266253df52bed8dc44148f22bbd85648840f83baee19a9c1ab0a4ce8003b6","block_index":310274,"block_time":310274000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(718,NULL,310274,'parse','blocks','{"block_index":310274,"ledger_hash":"ece29ec2cd160d7634009f41cc2d0f13330d53ec6971c019d69dfa4367f86646","messages_hash":"4daa321a8062e35b68c85d63c6c71cba86af28cad34ce1ae7a4a971f34addfcf","txlist_hash":"bf01b445bc208b9efcb314f1cfa1ea4300fc152ad46a973044abf56dc74e9c62"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(719,NULL,310274,'insert','blocks','{"block_hash":"85adc228e31fb99c910e291e36e3c6eafdfd7dcaebf5609a6e017269a6c705c9","block_index":310275,"block_time":310275000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(720,NULL,310275,'parse','blocks','{"block_index":310275,"ledger_hash":"23738d6d8dbf8b44b481f6c0eade991987c84e8025fe1f484c7acd3ead7f4163","messages_hash":"3e156c57def9f6dcf24682ed855311663d61079a0422522c3b660d80a4e88430","txlist_hash":"c0f70c46688ecb9eccaa94bdcbb3fc54eaf3af76cc450b62dfd7a9513bbbd50f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(721,NULL,310275,'insert','blocks','{"block_hash":"ba172f268e6d1a966075623814c8403796b4eab22ef9885345c7b59ab973cc77","block_index":310276,"block_time":310276000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(722,NULL,310276,'parse','blocks','{"block_index":310276,"ledger_hash":"a241e1cb19bfbebb3bbb09c6471760b8379ddc73a67d69b4d84fd1d21dfb7034","messages_hash":"f42264c5306769fc6bd1bd6f1955900113ec16b625e06d62ff3001b2e6b69707","txlist_hash":"99d32cb4d9b52ec0726c907330b2a60d7cf8380c8012f804cf8838bee1b0ecec"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(723,NULL,310276,'insert','blocks','{"block_hash":"c74bd3d505a05204eb020119b72a291a2684f5a849682632e4f24b73e9524f93","block_index":310277,"block_time":310277000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(724,NULL,310277,'parse','blocks','{"block_index":310277,"ledger_hash":"0efa57fd462031a87831832a789ed7751aac5f6c19a23767555b3f7145d87532","messages_hash":"236d34af3aa5893e9aecc8fb65c1efedc4f4e38874a2b20b933c973da4b4691e","txlist_hash":"08e71c5246f1225a02a00c8b52bb7a92c6937da9c9659129a5dcd2981069bbb3"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(725,NULL,310277,'insert','blocks','{"block_hash":"7945512bca68961325e5e1054df4d02ee87a0bc60ac4e1306be3d95479bada05","block_index":310278,"block_time":310278000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(726,NULL,310278,'parse','blocks','{"block_index":310278,"ledger_hash":"0045189a4da126b22e91e4bc2a7ac37dc90ec0869b7fcbc927919fca4cce5259","messages_hash":"a70fb335be86478d6730dbcbcc8d738e5e3f55608f445b5a033f9f5800951167","txlist_hash":"6e3580c7af675e8fdd1c5366a7af2e387f8d8d9192589794883a28ad2ce6a499"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(727,NULL,310278,'insert','blocks','{"block_hash":"1a9417f9adc7551b82a8c9e1e79c0639476ed9329e0233e7f0d6499618d04b4f","block_index":310279,"block_time":310279000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(728,NULL,310279,'parse','blocks','{"block_index":310279,"ledger_hash":"442b7d4dee025b81c298ca0f6a5b9dbdf17ed0087fc36eab7f0671d5a19c9a2c","messages_hash":"7244980c44845ce8bd26268b39a1204f014f6c18f968f57dd2e765193b71dcb2","txlist_hash":"04f51f4c3de467be5cfb32cccba5cd482eb14657d7f67a60820204fa22afaa41"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(729,NULL,310279,'insert','blocks','{"block_hash":"bf2195835108e32903e4b57c8dd7e25b4d15dd96b4b000d3dbb62f609f800142","block_index":310280,"block_time":310280000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(730,NULL,310280,'parse','blocks','{"block_index":310280,"ledger_hash":"38d7f98ae9cfb8e3938032dc33899e2e3e5a88e9037571cdddf8ed4709fc8225","messages_hash":"0b2884e47006914acf505e50ea5272ffeef43e2a646cf0b1c57afc47bf943c5d","txlist_hash":"d25ed55e962a45fbade2012c35ef507dd76fa0c67553343bb6568569bf1c08ca"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(731,NULL,310280,'insert','blocks','{"block_hash":"4499b9f7e17fc1ecc7dc54c0c77e57f3dc2c9ea55593361acbea0e456be8830f","block_index":310281,"block_time":310281000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(732,NULL,310281,'parse','blocks','{"block_index":310281,"ledger_hash":"51237cee3b85f1636e336259b115fad87acc830c71e13ca79e344efb7c308ecc","messages_hash":"ff50d8f5f8dcce283b687ce2aff46b5b1250eb43a11bb5996164444879dffb31","txlist_hash":"77eb5540b9f1e2f80cd3cb8572ee80bc112391e0236b560749aaf9952fb6705b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(733,NULL,310281,'insert','blocks','{"block_hash":"51a29336aa32e5b121b40d4eba0beb0fd337c9f622dacb50372990e5f5134e6f","block_index":310282,"block_time":310282000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(734,NULL,310282,'parse','blocks','{"block_index":310282,"ledger_hash":"73adccef91b5c738e8810d4781a38edf98d2aa0a8cb619d575e9bdeda979f1fb","messages_hash":"02e7b49dd579b3355aa9063b38bec6e6e749b3cb5882483d3b15886e176f0610","txlist_hash":"889f3e1047c8ca362c1ce4749d1c7ad167dab1e5f85e509d114b1ba1bac8f240"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(735,NULL,310282,'insert','blocks','{"block_hash":"df8565428e67e93a62147b440477386758da778364deb9fd0c81496e0321cf49","block_index":310283,"block_time":310283000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(736,NULL,310283,'parse','blocks','{"block_index":310283,"ledger_hash":"5853e60a1b79d4f154cc1f3dc8b0a4d6130ac07784bac16f257f92b9ef294144","messages_hash":"25008bffd8cec7dc2c3ae13ac7c9e868129e3b9203911aa0fa3db14f5fc89a9b","txlist_hash":"1ce62f0a42cb7ecd8c35436253e8234b83e81ba5abc757965b5041400139eee2"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(737,NULL,310283,'insert','blocks','{"block_hash":"f9d05d83d3fa7bb3f3c79b8c554301d20f12fbb953f82616ac4aad6e6cc0abe7","block_index":310284,"block_time":310284000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(738,NULL,310284,'parse','blocks','{"block_index":310284,"ledger_hash":"ce33194cb67aa0a5facd788cc24706ef249bcecc95a9965f91065146b33e464b","messages_hash":"4bb8f22e461d70d953ff1b9f0ced8b1cb143ab1b8dc38bd3a1fe3fc803ccd40a","txlist_hash":"c354cfcb046ca331ae57c00f64b56defd034278e5616ef7d1f3e559dc538bf0a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(739,NULL,310284,'insert','blocks','{"block_hash":"8cef48dbc69cd0a07a5acd4f4190aa199ebce996c47e24ecc44f17de5e3c285a","block_index":310285,"block_time":310285000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(740,NULL,310285,'parse','blocks','{"block_index":310285,"ledger_hash":"3af35e85e98aebe1a9c778570c730bf80e085a08ca707c1a5d44b50f2579e71c","messages_hash":"509ae7a1014f0442bec8eb032d144c64dc8a11e6970d0e32a5ecc4d41fe68760","txlist_hash":"35e84bd8780b8efbdc3207b9fef22e12ff71798477971a50088b9c8def3c77ed"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(741,NULL,310285,'insert','blocks','{"block_hash":"d4e01fb028cc6f37497f2231ebf6c00125b12e5353e65bdbf5b2ce40691d47d0","block_index":310286,"block_time":310286000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(742,NULL,310286,'parse','blocks','{"block_index":310286,"ledger_hash":"4b09b627adda46ee7cf7116102a330ba2aa1ce714b2fa133f7952af34a52ede9","messages_hash":"a7bcd9f0ef4a4deb4603c21e799e2c9418c9a085af6aee86082d3c79a7b4d880","txlist_hash":"5a868b89444476076be22e42526c4462c5b865012d9970b917376c5342750311"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(743,NULL,310286,'insert','blocks','{"block_hash":"a78514aa15a5096e4d4af3755e090390727cfa628168f1d35e8ac1d179fb51f4","block_index":310287,"block_time":310287000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(744,NULL,310287,'parse','blocks','{"block_index":310287,"ledger_hash":"67786e4ffab15cb78c7bb44ef160d1e5d99b599eecb5ff4f906a6599d744d410","messages_hash":"a0940fad3e49fdf8668dcb4c9d773e1a5eca6fd5ef23fcdf4be0ccd1cbbfe405","txlist_hash":"791a49e50583660824bb3ec141a54951c2fd737ed963b1e65b653c22a4fc4a84"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(745,NULL,310287,'insert','blocks','{"block_hash":"2a5c5b3406a944a9ae2615f97064de9af5da07b0258d58c1d6949e95501249e7","block_index":310288,"block_time":310288000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(746,NULL,310288,'parse','blocks','{"block_index":310288,"ledger_hash":"600716d2696160b3ba290636180f2afa24bf8d24435022b4539a4cc965c18dfc","messages_hash":"4dd23e9dbda9e5647e194648a2be3ef8597c5f9c4c0e5c58448d4195599de8c8","txlist_hash":"3a1e3da301643f22a9b2719922a4621879b2c2d8b790e646f135bc3b5d165e65"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(747,NULL,310288,'insert','blocks','{"block_hash":"dda3dc28762969f5b068768d52ddf73f04674ffeddb1cc4f6a684961ecca8f75","block_index":310289,"block_time":310289000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(748,NULL,310289,'parse','blocks','{"block_index":310289,"ledger_hash":"cd6d4b17759152edbf25fd72dce9b9126ea31a2bb1a5435636801e0ee4be1158","messages_hash":"b406c7ad8001546298d16bfa1f0e77b3396787dc2324be51ce33e9cae0c6fd5a","txlist_hash":"26aeba5ab63445ebd419a02915a835d8d6a0bc25bac49dd799e356325687c8f8"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(749,NULL,310289,'insert','blocks','{"block_hash":"fe962fe98ce9f3ee1ed1e71dbffce93735d8004e7a9b95804fb456f18501a370","block_index":310290,"block_time":310290000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(750,NULL,310290,'parse','blocks','{"block_index":310290,"ledger_hash":"04a9135f416dc041d3c1c0216a84fd780d133213c3369691fbf5e8848af9d14f","messages_hash":"dcb7aa5f99cbb70b4d70bf3a360be2c4a5756261a8792856828a6cc1f282a644","txlist_hash":"74c57c7e7db040f0974be44dae944c978ed2ddb01390d616c9bfaa6816ed198e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(751,NULL,310290,'insert','blocks','{"block_hash":"1eeb72097fd0bce4c2377160926b25bf8166dfd6e99402570bf506e153e25aa2","block_index":310291,"block_time":310291000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(752,NULL,310291,'parse','blocks','{"block_index":310291,"ledger_hash":"50f556e01b9e8c135b20187bf863839e651a0d0bf4cfd1008b446531776f7917","messages_hash":"0b50391ad17533ea1807be4941305ee75a013a8a5330139e36818f60a9f7d8ef","txlist_hash":"13ede25257044f3bd98c6905c216bed45b0d054951d2c5e86a3cf4707699a279"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(753,NULL,310291,'insert','blocks','{"block_hash":"9c87d12effe7e07dcaf3f71074c0a4f9f8a23c2ed49bf2634dc83e286ba3131d","block_index":310292,"block_time":310292000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(754,NULL,310292,'parse','blocks','{"block_index":310292,"ledger_hash":"9d4bf4b1c5dba1132a9cbfd78c1d94cbaf15d7648da80c8bc1a8dce12a79eac0","messages_hash":"24b3947f5fbed58b6a9c47ab51ef2e654114be20f84935eaa908c9544e275514","txlist_hash":"1b761ed985b1e55c95598c5c0f37df4a1e06dfd26c17792b1020cf0d28fa9a56"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(755,NULL,310292,'insert','blocks','{"block_hash":"bc18127444c7aebf0cdc5d9d30a3108b25dd3f29bf28d904176c986fa5433712","block_index":310293,"block_time":310293000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(756,NULL,310293,'parse','blocks','{"block_index":310293,"ledger_hash":"a51a3f9af39175cc9d142eff67811307ad8f51cdd8161aaf0d98af9e2be28efa","messages_hash":"1db78c9abe493106e75d3629d221d046e1d6194e44df8f882be38b521d33ab53","txlist_hash":"2fd7a38fbb17d7b0eec35f2f03a28c4aee7f579d7f42e3ab124cf5eca07869eb"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(757,NULL,310293,'insert','blocks','{"block_hash":"4d6ee08b06c8a11b88877b941282dc679e83712880591213fb51c2bf1838cd4d","block_index":310294,"block_time":310294000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(758,NULL,310294,'parse','blocks','{"block_index":310294,"ledger_hash":"3e9858caa8e835295aa7e78505ea34ce0726e3f5f6cf9fbc6dc4393a28724a25","messages_hash":"b6d94000a7b7dc674d610bf89faf7c0d43bdc3e8f391f6089ded1557f7f0f286","txlist_hash":"36566c7c396ecf454c6fa6d3b27dd7ad2c138a85edd74672f2e7d9791e77f0b6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(759,NULL,310294,'insert','blocks','{"block_hash":"66b8b169b98858de4ceefcb4cbf3a89383e72180a86aeb2694d4f3467a654a53","block_index":310295,"block_time":310295000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(760,NULL,310295,'parse','blocks','{"block_index":310295,"ledger_hash":"bf48715799c46d629641ba5b72405f6e6cf0500886da94fcc6fddd306a86b02a","messages_hash":"cc57c30a8b34a715c886a444cedd81ccf2c8be145642f2df64d376d0acf1e1f3","txlist_hash":"2d6b79733125c81413a3e70acf597a11e986893264588da74e9b8a0d5d46e1da"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(761,NULL,310295,'insert','blocks','{"block_hash":"75ceb8b7377c650147612384601cf512e27db7b70503d816b392b941531b5916","block_index":310296,"block_time":310296000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(762,NULL,310296,'parse','blocks','{"block_index":310296,"ledger_hash":"08e2361ae4b98387ee43fd7230ea8b296dee677b337f0e211527e3cf29a64e9b","messages_hash":"b77e2a71e0857e990c1cfbb021c0a04fb17b64ec9ba48c60d49e3dd8ecc6b0ac","txlist_hash":"517c81a10cc4219c38e3f947dd862f6983a4a2eb22459dba31f1a656bdf4eeff"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(763,NULL,310296,'insert','blocks','{"block_hash":"d8ccb0c27b1ee885d882ab6314a294b2fb13068b877e35539a51caa46171b650","block_index":310297,"block_time":310297000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(764,NULL,310297,'parse','blocks','{"block_index":310297,"ledger_hash":"cfefc3138983a33686dd1fc37f06fa1d7e01d9b218f7242cdd59005633c0ded8","messages_hash":"edcb77f23eb738d688c1ea5732a945d76279766c4a1ee1effd190bf3f726c05b","txlist_hash":"85ae0c384a76e7c93b29204df759293f7a488fc71edf6b4abaea1944fa3a85d7"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(765,NULL,310297,'insert','blocks','{"block_hash":"8ca08f7c45e9de5dfc053183c3ee5fadfb1a85c9e5ca2570e2480ef05175547a","block_index":310298,"block_time":310298000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(766,NULL,310298,'parse','blocks','{"block_index":310298,"ledger_hash":"25254257d6f6724161b2b73f94d28d3fd40594b4846699b8a2d5f45d205b1fec","messages_hash":"5dc738e17243a84b37564b261267924bce9c6cce7595c74d8808f0cf03432a89","txlist_hash":"0633d67a69ae2c0ea1e7d3c349cfe1f3b753e387446787987c50782ee4601b68"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(767,NULL,310298,'insert','blocks','{"block_hash":"a1cdac6a49a5b71bf5802df800a97310bbf964d53e6464563e5490a0b6fef5e9","block_index":310299,"block_time":310299000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(768,NULL,310299,'parse','blocks','{"block_index":310299,"ledger_hash":"756acb1055ec75df8fa70f80e23d75f2b47e75035bfd68802e68308785a2ee14","messages_hash":"f3c6ab9d0253858a08da5dfe893c8266a32c796eb2e4a6c4f64ebd4263f9250d","txlist_hash":"299d47f0c18c1629003069df0afd0bb877b45f06b5609ec171c7b87ae65a0be0"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(769,NULL,310299,'insert','blocks','{"block_hash":"395b0b4d289c02416af743d28fb7516486dea87844309ebef2663dc21b76dcb2","block_index":310300,"block_time":310300000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(770,NULL,310300,'parse','blocks','{"block_index":310300,"ledger_hash":"e30027ca81176dc1e79a0ab3a5afbb839a3338dbe9ea6057aebcd383ed884c1d","messages_hash":"40541eb5a9dfd5c5a299a13aac804fb1b87e790891c55b66e9b36b1838dc8dfd","txlist_hash":"8338432f3d159dd15129a269d1cf3866cc7cda8c3845ab349ee6cc240ecd7020"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(771,NULL,310300,'insert','blocks','{"block_hash":"52f13163068f40428b55ccb8496653d0e63e3217ce1dbea8deda8407b7810e8a","block_index":310301,"block_time":310301000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(772,NULL,310301,'parse','blocks','{"block_index":310301,"ledger_hash":"4c2bcffc796af76a2607a978289942241e63a6387e0a2ae8fc3d02c6b5519fb0","messages_hash":"7273cf6a0294acc31eea0e0a9af603500f59a9f115b3c5acd5cca992f185f061","txlist_hash":"676af2de3d30fc26112e65d493b9c2401f93822c8e414cc5e7231e60b728e6e0"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(773,NULL,310301,'insert','blocks','{"block_hash":"ca03ebc1453dbb1b52c8cc1bc6b343d76ef4c1eaac321a0837c6028384b8d5aa","block_index":310302,"block_time":310302000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(774,NULL,310302,'parse','blocks','{"block_index":310302,"ledger_hash":"a39fdd7f84d2f6e29b613a8a724bc0902d9abd2d6b4d2f46c3b0512928d69b3f","messages_hash":"b26574ea33e8a4ca0bd958b82248a9fc9fdfe403aa717a9e0ef31474bcc32e58","txlist_hash":"ef3dfc32bc5b72ec279a0229af8bf6548bfb5bf4ed717e3e81ccb7710f802021"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(775,NULL,310302,'insert','blocks','{"block_hash":"d4e6600c553f0f1e3c3af36dd9573352a25033920d7b1e9912e7daae3058dcca","block_index":310303,"block_time":310303000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(776,NULL,310303,'parse','blocks','{"block_index":310303,"ledger_hash":"23f307ef560a02210f4aae5fe605c6d8af9317ab17f1e1ef0944038a3515da49","messages_hash":"8076e1b2af994482a8868a28ad8b5d41a5fbe2ccb349d65404e7c0dc59c6dd2e","txlist_hash":"d1c0461baeac24d356af8ba5283753c778f8ab0fa222c51b753758268f1e7fa4"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(777,NULL,310303,'insert','blocks','{"block_hash":"b698b0c6cb64ca397b3616ce0c4297ca94b20a5332dcc2e2b85d43f5b69a4f1c","block_index":310304,"block_time":310304000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(778,NULL,310304,'parse','blocks','{"block_index":310304,"ledger_hash":"6baa2ac646d3725fa01111959753844d22181cbbd1801cb12c4208be3709a3a3","messages_hash":"3862df7b71134b605229146563a78a5ca695a37c4d6da4b65d21876129c80f1b","txlist_hash":"96ea912eae3265566ab229e5d5a25354c0713471d73d866b9a09c9b2954d53e5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(779,NULL,310304,'insert','blocks','{"block_hash":"cfba0521675f1e08aef4ecdbc2848fe031e47f8b41014bcd4b5934c1aa483c5b","block_index":310305,"block_time":310305000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(780,NULL,310305,'parse','blocks','{"block_index":310305,"ledger_hash":"c366fd009860a090c632131eae9380820e512009bbbaa6f7bc5529afab7a88c1","messages_hash":"3b6505bd17f14fef0f06cf95c6bd3d3d759479674824f738b1c7fecc151b9b44","txlist_hash":"35584be5484303aa263d746735209b04d92a6baa6045e2d684496ff5dabe59ef"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(781,NULL,310305,'insert','blocks','{"block_hash":"a88a07c577a6f2f137f686036411a866cae27ff8af4e1dfb8290606780ec722a","block_index":310306,"block_time":310306000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(782,NULL,310306,'parse','blocks','{"block_index":310306,"ledger_hash":"fd12969b828d689063b4885a0356fc17e5207794d1f5b6a17bdeb8d584815a79","messages_hash":"c052edd088e829c9ac4ae5ca349da7067bfd5dcb8dfec11c4ec1a635d3c8c9e0","txlist_hash":"df65a3a9f318fd30166869a3d5d6eabb9c84399f15a7a50f39422a05ff851997"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(783,NULL,310306,'insert','blocks','{"block_hash":"bc5ccf771903eb94e336daf54b134459e1f9dd4465dec9eaa66a8ee0e76d426c","block_index":310307,"block_time":310307000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(784,NULL,310307,'parse','blocks','{"block_index":310307,"ledger_hash":"e168094d31f56d36e4c3863fe719e6064b08ccc6f3c2adb490b1359360026aee","messages_hash":"3bd3565fc83516439eab9db5ac6d85d8763d16c16bff122cc6e70b5c48246030","txlist_hash":"272ae60ff5120848055f08303e13a982fc66959f3e3b72f7d7461c7f91252944"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(785,NULL,310307,'insert','blocks','{"block_hash":"2291ffd9650760ff861660a70403252d078c677bb037a38e9d4a506b10ee2a30","block_index":310308,"block_time":310308000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(786,NULL,310308,'parse','blocks','{"block_index":310308,"ledger_hash":"523b3bba7b02e2c4e588f21ed14b7b4f6630f887cc89f9361487b581d7e633b5","messages_hash":"4b488ffd95c4d443b431c66d9d4442621cfcb3831e920f8f1d291501e2d3eba9","txlist_hash":"30df282ad2859208c35204fe5e2d395734e041bd9644b8b8626678fdd64058c1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(787,NULL,310308,'insert','blocks','{"block_hash":"ca3ca8819aa3e5fc4238d80e5f06f74ca0c0980adbbf5e2be0076243e7731737","block_index":310309,"block_time":310309000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(788,NULL,310309,'parse','blocks','{"block_index":310309,"ledger_hash":"effe1a68917014086da3bf8696f6c13f3cf2cb5cbd6c18b80ed622e476cff017","messages_hash":"5b336477cd043069fc94aaa9efeec573f8ea2f1915382602469f2ab6bed6d717","txlist_hash":"197a65735f9d06d433abdd01f29f44ec697ba537ead9107ebe9cd889393a053c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(789,NULL,310309,'insert','blocks','{"block_hash":"07cd7252e3e172168e33a1265b396c3708ae43b761d02448add81e476b1bcb2c","block_index":310310,"block_time":310310000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(790,NULL,310310,'parse','blocks','{"block_index":310310,"ledger_hash":"968fb8a7409531a27ffb52af484e7c1076f05b58f9a51bf9cf3d5a7d83b12002","messages_hash":"d4b6b0de6209af38f0a99ee7cc1e629039233cba66bbd546aa874c9b5ec949fd","txlist_hash":"b9b9eef5f4c1720522286ce5f6375613c267684ac330210ab664e29219065cc0"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(791,NULL,310310,'insert','blocks','{"block_hash":"2842937eabfdd890e3f233d11c030bed6144b884d3a9029cd2252126221caf36","block_index":310311,"block_time":310311000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(792,NULL,310311,'parse','blocks','{"block_index":310311,"ledger_hash":"8c69639a757d0195594fa1da3f6b35a0e8c62b8df7f95db81e26d496b8c9dd72","messages_hash":"9f34557e605c362c267d01a10c0e1230b96311675cf37ac22fefef3e348f90e6","txlist_hash":"86b9b4356e26ab703e29060a4ff1be0c5cad328b2490d983eae10c24369a1649"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(793,NULL,310311,'insert','blocks','{"block_hash":"8168511cdfdc0018672bf22f3c6808af709430dd0757609abe10fcd0c3aabfd7","block_index":310312,"block_time":310312000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(794,NULL,310312,'parse','blocks','{"block_index":310312,"ledger_hash":"8d839bac01b9aae5e554f691ae0ee42cee072f9367fcc2811d4b3f65640cfcad","messages_hash":"06ab0afed2be45271b993ebf500b3fca4df8e920441577bcb1842206129b58f2","txlist_hash":"802b3d153e101c2772b1c96c851efab754f77fd3fd7eb59848d510f8994a9d86"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(795,NULL,310312,'insert','blocks','{"block_hash":"7c1b734c019c4f3e27e8d5cbee28e64aa6c66bb041d2a450e03537e3fac8e7e5","block_index":310313,"block_time":310313000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(796,NULL,310313,'parse','blocks','{"block_index":310313,"ledger_hash":"1377f4255bfd7ff6638734733a4b8faec97fd62aeb954e42b477c875ccc50b73","messages_hash":"471dc3888257e83dc49fb7acb75a3d327ccfc572fa4c2a597f68e97ced7b706c","txlist_hash":"e96392425727ab5eb4e16a61aef7d28cd0826ad7bc1d8266b3c187bb22bb5d51"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(797,NULL,310313,'insert','blocks','{"block_hash":"1ce78314eee22e87ccae74ff129b1803115a953426a5b807f2c55fb10fb63dc8","block_index":310314,"block_time":310314000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(798,NULL,310314,'parse','blocks','{"block_index":310314,"ledger_hash":"8ed80d44f0d6ad01a30611d94b91f735ef3a166cf0dfa7531492a3e4ac7c29f1","messages_hash":"d0edc182ab52e7db475d67edfa4b8d9b4d4bfaa79351ab7c7d0a93cc1e63e465","txlist_hash":"17d9134674657a9958c43efaea302df438762233e7e5d57811b71378e3d62695"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(799,NULL,310314,'insert','blocks','{"block_hash":"bd356b1bce263f7933fb4b64cf8298d2f085ca1480975d6346a8f5dab0db72cb","block_index":310315,"block_time":310315000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(800,NULL,310315,'parse','blocks','{"block_index":310315,"ledger_hash":"24b5905cf0d5349b7031870af9677916892e3292fa61455a75e84c1605a398ba","messages_hash":"f96452fa9d526175036d137afc49a849f0839c4338d29815ee3eac02e3df6f91","txlist_hash":"d8bad5e8a6ab63c8e0394c200e6b90cb2a1feabe3f58dc0faaaab59bb0b82654"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(801,NULL,310315,'insert','blocks','{"block_hash":"ea9e5e747996c8d8741877afdcf296413126e2b45c693f3abdb602a5dae3fa44","block_index":310316,"block_time":310316000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(802,NULL,310316,'parse','blocks','{"block_index":310316,"ledger_hash":"a191657253ca159739403f35417ef74637b053db49c7db62465fde4c54e69239","messages_hash":"cf505f0c309fbaecae7d9e525557f8d1501a3a08d66bb8a7abc8d2a8db721add","txlist_hash":"daf2edaf9fb8e7f718f56cff9e570869297ce6bd350794501b05e02a541e1c84"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(803,NULL,310316,'insert','blocks','{"block_hash":"aa8a533edd243f1484917951e45f0b7681446747cebcc54d43c78eda68134d63","block_index":310317,"block_time":310317000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(804,NULL,310317,'parse','blocks','{"block_index":310317,"ledger_hash":"bf6d880b9fa42b0e38523c00c92a898093afd068450be504a0a56bafd69ed647","messages_hash":"af696ec589d2b95f36e16039d388a57c38eafee5f3de5596a97f3c823c77f892","txlist_hash":"740737c2cd6ffb9a5e89e2ae0d34afe5f0bb48d120ae482802b76d07100b6153"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(805,NULL,310317,'insert','blocks','{"block_hash":"c1be6c211fbad07a10b96ac7e6850a90c43ba2a38e05d53225d913cc2cf60b03","block_index":310318,"block_time":310318000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(806,NULL,310318,'parse','blocks','{"block_index":310318,"ledger_hash":"6422eb2cab5937adb9ca2194c025d0dce63cd62e18d7ebd63220207957c942ee","messages_hash":"ff573059e90f4aade75d1f2d950dcf046ef2c1217b589d0bf2fc9c38c6c42012","txlist_hash":"3cb46a2e5b1a3ef3dd37dbe0cc429962982812eb9c7f87b5282a77a4a7f6185c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(807,NULL,310318,'insert','blocks','{"block_hash":"f7fc6204a576c37295d0c65aac3d8202db94b6a4fa879fff63510d470dcefa71","block_index":310319,"block_time":310319000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(808,NULL,310319,'parse','blocks','{"block_index":310319,"ledger_hash":"efb625496aa4365f5ac198a82833c880a60cd5f86d04689463216619cd7d96b8","messages_hash":"73a44e99dcb39be095771e34c74ee4b6a7a0819207807821d621545ca4b6a91f","txlist_hash":"ed69cef0ba9e4a9371deca76209629cc988257493a69006504b96a99b3da4222"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(809,NULL,310319,'insert','blocks','{"block_hash":"fd34ebe6ba298ba423d860a62c566c05372521438150e8341c430116824e7e0b","block_index":310320,"block_time":310320000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(810,NULL,310320,'parse','blocks','{"block_index":310320,"ledger_hash":"8c3938d7b3c0a822ebee67f1ecf21b1db6496e19471cf1f2cd00f30325d0c88a","messages_hash":"3abdeb2a4902cacc07440c8f176576963d48190c3e66bce2ccd97cc15d79f752","txlist_hash":"b87169ed018fdc8251d14b58f8d0e09001e45ab5dd76eb2408ab625d34ec584b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(811,NULL,310320,'insert','blocks','{"block_hash":"f74be89e9ceb0779f3c7f97c34fb97cd7c51942244cbc2018d17a3f423dd3ae5","block_index":310321,"block_time":310321000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(812,NULL,310321,'parse','blocks','{"block_index":310321,"ledger_hash":"21e4c3a7afd02f183cbb69709fc6c006ab3d38fef3466de1a1870232d1c891bd","messages_hash":"0d0c1c139a2f9304f5111dab26862dd88c97f061ee9ec716cfdfa8f101cf9f2a","txlist_hash":"77ef24833ac345e51eeb48fa9adbb111e31ffa3739298ce12a18d2f581c9a79a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(813,NULL,310321,'insert','blocks','{"block_hash":"ce0b1afb355e6fd897e74b556a9441f202e3f2b524d1d88bc54e18f860b57668","block_index":310322,"block_time":310322000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(814,NULL,310322,'parse','blocks','{"block_index":310322,"ledger_hash":"01b3b28c4d8eb796827267c06e6362206884e44f40c3f72d9b5c9d1e6cdfb29a","messages_hash":"a803ff9c9a83a885463f0f41b774b09c5dad9ef8827579499cd94cc6ff218858","txlist_hash":"3833d915749baf7aa33484d7a6b6b28e4acf0d78ee0f1b4e8ab44b22d756a3e3"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(815,NULL,310322,'insert','blocks','{"block_hash":"df82040c0cbd905e7991a88786090b93606168a7248c8b099d6b9c166c7e80fd","block_index":310323,"block_time":310323000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(816,NULL,310323,'parse','blocks','{"block_index":310323,"ledger_hash":"a362da58df0d31eeaa93a25c91c17bec62f9cad6ff0c31420584ce293ecafdbc","messages_hash":"fe10c5d1f27a192d9c72377818077b94ff7fee46c54b8bc52cbbca50743ccb56","txlist_hash":"2d41c7286053cb2256526ce42c03ab1288dfa066720e9ae5e5dac4532d512de4"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(817,NULL,310323,'insert','blocks','{"block_hash":"367d0ac107cbc7f93857d79e6fa96d47b1c98f88b3fdda97c51f9163e2366826","block_index":310324,"block_time":310324000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(818,NULL,310324,'parse','blocks','{"block_index":310324,"ledger_hash":"d1b353ac97e000471c66df8ee04d7b0c25f7eead2414e5648cd2ef334881bad6","messages_hash":"c654695d92ff853e15ec8399c1e5fd6b552b8a2e4da3167f792e2325b21fefa0","txlist_hash":"051b158e05c22a326dd8becd27d142b52477b9209f369599db5c5e25484af157"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(819,NULL,310324,'insert','blocks','{"block_hash":"60d50997f57a876b2f9291e1ae19c776df95b2e46c14fe6574fb0e4ce8021eac","block_index":310325,"block_time":310325000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(820,NULL,310325,'parse','blocks','{"block_index":310325,"ledger_hash":"7734300dc764c67fde935dd4432396de4a31cedc2901f3fc70bf1576797cf7b0","messages_hash":"0d9072553790491007aa13b4d406831506f7f770f8ac7fea5ad42db6b6cd2b68","txlist_hash":"7671d8cfff3601fc44132a6d274c1ab1fb0b4fb712041d86eb28157667682251"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(821,NULL,310325,'insert','blocks','{"block_hash":"d6f210a1617e1a8eb819fc0e9ef06bd135e15ae65af407e7413f0901f5996573","block_index":310326,"block_time":310326000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(822,NULL,310326,'parse','blocks','{"block_index":310326,"ledger_hash":"ebe859a722587fd456695c6a46af7f0bf54c03e940bdbb5424520a8c1fe70617","messages_hash":"e0a3b19fce605701f1ce2ed25cde785ddef37c8ae11a1af97f32f89a9faef45b","txlist_hash":"72884e56565b442c37cbbc572fa762c7b7b3c549c396037393463be7afb089fa"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(823,NULL,310326,'insert','blocks','{"block_hash":"9fa4076881b482d234c2085a93526b057ead3c73a6e73c1ed1cdee1a59af8adc","block_index":310327,"block_time":310327000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(824,NULL,310327,'parse','blocks','{"block_index":310327,"ledger_hash":"8ced7a546ee2c746d4dc3f0ecd2fb4eaa62c65c4e98be74545d8de22c03526e6","messages_hash":"f2ce43aa9e6374f95a9c5d5b55de0396da45be6575dc5223742c2d70369bd00e","txlist_hash":"ccbabd4fc70b15ebb6f28afa6f96e4a1f0af08e6a3cdfb518ae008432b908739"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(825,NULL,310327,'insert','blocks','{"block_hash":"c7ffd388714d8d0fc77e92d05145e6845c72e6bfd32aeb61845515eca2fa2daf","block_index":310328,"block_time":310328000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(826,NULL,310328,'parse','blocks','{"block_index":310328,"ledger_hash":"bb5d3479e492f52a0b3b69d29852faefdff645f9b113eae82594f57e8aa40b5d","messages_hash":"cb79907543638b77555fac7568f2f744f22ce989dc0e7654fd49e132eb7666c8","txlist_hash":"42fa2df2e053f97e86881395e5d66de912e59bf73eb5be322ab170b06fabd344"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(827,NULL,310328,'insert','blocks','{"block_hash":"67fb2e77f8d77924c877a58c1af13e1e16b9df425340ed30e9816a9553fd5a30","block_index":310329,"block_time":310329000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(828,NULL,310329,'parse','blocks','{"block_index":310329,"ledger_hash":"4ad2c9d802db762537be19143ef5eca474cd9f749bbbc661cb95bcf1dcb0b02b","messages_hash":"02047850f93eb91d0d83851054da00ed66f6f6c0fea04d627866f6355be4273c","txlist_hash":"a5336a1818452ca9888d582bb5ad8182e00ec37723d42e6769b001069f96232a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(829,NULL,310329,'insert','blocks','{"block_hash":"b62c222ad5a41084eb4d779e36f635c922ff8fe275df41a9259f9a54b9adcc0c","block_index":310330,"block_time":310330000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(830,NULL,310330,'parse','blocks','{"block_index":310330,"ledger_hash":"4a9a6b59d56f6b7cf867095d939f9bddbf779141177feda470df3759b7d48be3","messages_hash":"3d6595616fc996c9fd880bc5b227a7e2d436bf27f6f06ab15cd456c4322fffb6","txlist_hash":"263932b9bd949d4b0557a7fcd5597a0c607c722b34e644f9795e4f08713a4436"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(831,NULL,310330,'insert','blocks','{"block_hash":"52fb4d803a141f02b12a603244801e2e555a2dffb13a76c93f9ce13f9cf9b21e","block_index":310331,"block_time":310331000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(832,NULL,310331,'parse','blocks','{"block_index":310331,"ledger_hash":"c676b9c31e0e3d74d005ad0a52a18ba34688b6002da5d269bcea0f789a4f8e91","messages_hash":"ba499b294c5cb3d50626ad04df807602e4f3fa955ca6b35795202f437182fd6b","txlist_hash":"646197318fca63f2c8068c0a119f122d02cfea4a5c95201d6cc2eada9ba276a6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(833,NULL,310331,'insert','blocks','{"block_hash":"201086b0aab856c8b9c7b57d40762e907746fea722dbed8efb518f4bfd0dfdf2","block_index":310332,"block_time":310332000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(834,NULL,310332,'parse','blocks','{"block_index":310332,"ledger_hash":"cf0b702c03ecff4bda1254dd5e96ca580b69d5d02d1f233725fccbe1f5f32000","messages_hash":"a57bfcc468c3f5d57b1b178ea7cc8c1af55f42867d0ba5d88d4e55b2bc79fe02","txlist_hash":"8197afee90f808a95bd5a3dbc9c41618e3a07a3039dc2e2539a94cb023e54a0b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(835,NULL,310332,'insert','blocks','{"block_hash":"b7476114e72d4a38d0bebb0b388444619c6f1b62f97b598fed2e1ec7cd08ee82","block_index":310333,"block_time":310333000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(836,NULL,310333,'parse','blocks','{"block_index":310333,"ledger_hash":"b40359eb197db65549946d93a39b2a732e0694d21b8d0138b9bfce4f5a87ae5b","messages_hash":"7694e14e12a15ab6aa8143f1e9fcaae46b1746f51398d79a4f6be6c3137d6c89","txlist_hash":"c8b269f3fb117e7ea3a9592a023787d886ffc388f91fd651618f807c017c9a67"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(837,NULL,310333,'insert','blocks','{"block_hash":"a39eb839c62b127287ea01dd087b2fc3ad59107ef012decae298e40c1dec52cd","block_index":310334,"block_time":310334000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(838,NULL,310334,'parse','blocks','{"block_index":310334,"ledger_hash":"7cb471ec146f9ec1e4d1b93184ea641f7b8088807dedcd1c0be4ca5ba99e80e1","messages_hash":"226e74766ac5ef3a15e7d38c05990871f92ef80cddf954d17759d2ad2ea59d02","txlist_hash":"24eb770852273754585985a5fed612de801663408db3703bb9771d5bcf518cb9"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(839,NULL,310334,'insert','blocks','{"block_hash":"23bd6092da66032357b13b95206e6527a8d22e6637a097d696d7a96c8858cc89","block_index":310335,"block_time":310335000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(840,NULL,310335,'parse','blocks','{"block_index":310335,"ledger_hash":"47de747ec20cbec96a6bc4b71f67ea827c7a5a1ab0d3541fd539efac7442d644","messages_hash":"fe3fa4d5ea7f9f18f6564a1857c7ce23e418e46aa5b63b3365d6cf73ab930e07","txlist_hash":"ba840a499b9de3ae457db93220ebb7bf61560f33660b8e7b980178325d114cec"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(841,NULL,310335,'insert','blocks','{"block_hash":"ec4b8d0968dbae28789be96ffa5a7e27c3846064683acd7c3eb86f1f0cc58199","block_index":310336,"block_time":310336000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(842,NULL,310336,'parse','blocks','{"block_index":310336,"ledger_hash":"c216588e623d2b3d03499c7e9f817106b20a8c98765979987633f1e4e50d9594","messages_hash":"1eff4c9279cff57e13e005fad48c92f7f5bd928e4b5a3d7eb102bfd0bccf353a","txlist_hash":"a6c20cca4d22fa5b8357fae640f1a90e3e656f9015eb5db289ef6da17b597f1c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(843,NULL,310336,'insert','blocks','{"block_hash":"055247d24ba9860eb2eadf9ec7ea966b86794a0e3727e6ffbcba0af38f2bc34a","block_index":310337,"block_time":310337000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(844,NULL,310337,'parse','blocks','{"block_index":310337,"ledger_hash":"a558b47328f54b79a5ad9f7737af0e4df07e13e20f150296370e111879c09c2e","messages_hash":"61eeadd7e8f4c94b41e9f3c67bad3ff29cc1d19f580114b3ca3c2a929596c036","txlist_hash":"15c9f81424d97e28fc5d40b9f74edee6bed3f68f8c81dcf572cbd786626ff353"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(845,NULL,310337,'insert','blocks','{"block_hash":"97944272a7e86b716c6587d0da0d2094b6f7e29714daa00fec8677205a049bcd","block_index":310338,"block_time":310338000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(846,NULL,310338,'parse','blocks','{"block_index":310338,"ledger_hash":"31bea50c6481fa982eace70df5fc13d2981f1af13962809e3492b493a0dd4905","messages_hash":"0b46e8c3b291dbc65e5a2ba99739bea530eeed734b7cbd0248c3b0ab06e3d817","txlist_hash":"ee8efb364c79aae62d48d0198d7ca348d71f312eaef01daf906fec89d2fe9166"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(847,NULL,310338,'insert','blocks','{"block_hash":"99d59ea38842e00c8ba156276582ff67c5fc8c3d3c6929246623d8f51239a052","block_index":310339,"block_time":310339000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(848,NULL,310339,'parse','blocks','{"block_index":310339,"ledger_hash":"6605ca3db3c509fbc8574f2e10a3f981e2ff17b2812946ec8f2b1e49ba44f220","messages_hash":"5771cf30f52a621216658854604973564d9a3a5b659986d3f5ab042a8a4a2674","txlist_hash":"af5e50fc6a529fb06423c8ad7beed13c6e1de1c3f746f53dcedb7af76e0d95ff"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(849,NULL,310339,'insert','blocks','{"block_hash":"f7a193f14949aaae1167aebf7a6814c44712d2b19f6bf802e72be5f97dd7f5a0","block_index":310340,"block_time":310340000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(850,NULL,310340,'parse','blocks','{"block_index":310340,"ledger_hash":"7db1ad1952cac2dda86fff6e5f939010bb30a1da26af438d354e17f423d5bf1f","messages_hash":"9b0c7bd03815d2708a3d6038b3783da0dd241e75b6de17402e89a05ec76e5222","txlist_hash":"f42c5c43148a61dace7d50127d905f236ad738774c20d4f874fc3b824b58cf92"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(851,NULL,310340,'insert','blocks','{"block_hash":"6c468431e0169b7df175afd661bc21a66f6b4353160f7a6c9df513a6b1788a7f","block_index":310341,"block_time":310341000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(852,NULL,310341,'parse','blocks','{"block_index":310341,"ledger_hash":"1a1eef01250d2c53a1b34a8ee5b1e8fce984c3d47d28c544c6e162493b51225b","messages_hash":"d0116b9fb089a2865d1425244075ef65425ce9e5f0f1b70fe7cf97e5ce6b8f47","txlist_hash":"5fcdf7ababadc89a26c3833bc8b819642466504b58323cded8cdb8a904239ce6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(853,NULL,310341,'insert','blocks','{"block_hash":"48669c2cb8e6bf2ca7f8e4846816d35396cbc88c349a8d1318ded0598a30edf7","block_index":310342,"block_time":310342000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(854,NULL,310342,'parse','blocks','{"block_index":310342,"ledger_hash":"3c85c0b825985b04b42137da7e59fb3daaaf9e65b871b79390a4d8b31be5da92","messages_hash":"2a6b0c1cd6ba6cb2fc95fa6fb0ce6369b7959d73680cfa1a09697626bb48f4bb","txlist_hash":"b165c708026f386ddc7206518e594fcef7b5782fa0db77db6ce5b02e3b563145"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(855,NULL,310342,'insert','blocks','{"block_hash":"41a1030c13ae11f5565e0045c73d15edc583a1ff6f3a8f5eac94ffcfaf759e11","block_index":310343,"block_time":310343000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(856,NULL,310343,'parse','blocks','{"block_index":310343,"ledger_hash":"26f4ea323dd31b715c7a7f4ab8f1feabb199333a8494449ed538ff13215bb3b2","messages_hash":"af3dd05b7f7751705f9bc0aaf099568289d0cc8a62b80cb8cf957b67ae9ccdc0","txlist_hash":"37808f9fb4ad766c671be7e9703aa7c7ea53991fa838400536d25f304ebe8090"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(857,NULL,310343,'insert','blocks','{"block_hash":"97b74842207c7cd27160b23d74d7deb603882e4e5e61e2899c96a39b079b3977","block_index":310344,"block_time":310344000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(858,NULL,310344,'parse','blocks','{"block_index":310344,"ledger_hash":"444314748cb1fa1c836b3b4de65c3920c7fe446741193e5f77843affe3bee908","messages_hash":"071a2af66f03d51498ea342dce8d818d4b2df9e2e5fb7ca9344988ae7676b0e7","txlist_hash":"52dd50744ce4773a3db8dcf016a392a133ff7ebbeaf293d4ecb4a32fcc575a19"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(859,NULL,310344,'insert','blocks','{"block_hash":"0bda7b13d1bc2ba4c3c72e0f27157067677595264d6430038f0b227118de8c65","block_index":310345,"block_time":310345000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(860,NULL,310345,'parse','blocks','{"block_index":310345,"ledger_hash":"d1775816bb104187076be74e78e87fc6d367c3cb31d372329aec2b635002ca2e","messages_hash":"54a59c638ed8ad1a8b9d72d0f9afef9616f7ee9c77b1cce9793ec14119c819dc","txlist_hash":"15f4f9eb55ff5d2b8efb40a57193f253470889b1fb2f532f02b66d236bc902bf"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(861,NULL,310345,'insert','blocks','{"block_hash":"0635503844de474dd694ecbcfb93e578268f77a80230a29986dfa7eeade15b16","block_index":310346,"block_time":310346000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(862,NULL,310346,'parse','blocks','{"block_index":310346,"ledger_hash":"3244eed1df8ec4ae0ddb04f9f6e59e54244ca3df10dc21fc89c99c74ba734781","messages_hash":"ed53197fade3b880a6bcd70a41112b83879f5a1b2733dcd044a152f6e06966a1","txlist_hash":"58faa47bcd277d0d52d39a46473882adc797797cf2c30967418fb4ae832dc21d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(863,NULL,310346,'insert','blocks','{"block_hash":"f3f6b7e7a27c8da4318f9f2f694f37aaa9255bbdad260cb46f319a4755a1a84d","block_index":310347,"block_time":310347000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(864,NULL,310347,'parse','blocks','{"block_index":310347,"ledger_hash":"6fd1802c269750b69ec04df457d47cd6b44c261340ebd5b4da61f06ede6aa166","messages_hash":"f9b1e1152ba3fd730692c61dc7b897b74290425148717cb0c7d26ddb2b066764","txlist_hash":"716162f3fea6641e6ac697eb11880c5b39903de4ab30fa24e899e363d5c1d9cd"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(865,NULL,310347,'insert','blocks','{"block_hash":"c912af0d57982701bcda4293ad1ff3456299fd9e4a1da939d8d94bcb86634412","block_index":310348,"block_time":310348000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(866,NULL,310348,'parse','blocks','{"block_index":310348,"ledger_hash":"668330e80a23f499c0e91b01c4c51aab393813b840f81b6b672611e391699faf","messages_hash":"95410fcf3fc291907a1969f9cdc8646a55fd0979f748332a10a298ed1914b4c7","txlist_hash":"8c169d593d4c922ef7d3f530f6de4da37c01716f19ea19b48b122a6135f3e293"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(867,NULL,310348,'insert','blocks','{"block_hash":"ca911c788add2e16726f4e194137f595823092482e48ff8dd3bdbe56c203523c","block_index":310349,"block_time":310349000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(868,NULL,310349,'parse','blocks','{"block_index":310349,"ledger_hash":"32b36035ac1684e93126657ecd9711feb689672f64cceb03d220a8089dfacf12","messages_hash":"650e904e246fbaccd362968543bd414fe4e03941d96f0a8c1c7d509fc260b738","txlist_hash":"8d54849ce08f65fd3dd06baf845e5a3132b84c960e6f316c4bbbbe5a3d2b7b01"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(869,NULL,310349,'insert','blocks','{"block_hash":"c20d54368c4e558c44e2fbaa0765d3aecc8c9f01d456e3ff219508b5d06bd69d","block_index":310350,"block_time":310350000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(870,NULL,310350,'parse','blocks','{"block_index":310350,"ledger_hash":"dbe70bf3b8e4b74ac25c1b6737b6a760e6a06a4f96ee83a5ca728c8501d4af05","messages_hash":"33bc524f9a329407e3509a4623d89f6d2c3e00616c4314b86bab1d1b802a4a6c","txlist_hash":"1e46f66542896fa2ff6048472d49feed3065a6fffaad639da03027b00ce377bf"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(871,NULL,310350,'insert','blocks','{"block_hash":"656bd69a59329dbea94b8b22cfdaaec8de9ab50204868f006494d78e7f88e26f","block_index":310351,"block_time":310351000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(872,NULL,310351,'parse','blocks','{"block_index":310351,"ledger_hash":"89bb7ea865a221a3646f78ea774a7cf1e15e8d65b85ddcfbdf87773145904151","messages_hash":"dbbc0a977c9bf6385e4652c94f97702965df6eae2863730b9930e7aafd8d6c84","txlist_hash":"f99c452388cd3d8aa59f7c75fa06770a116b5f69263dddbb7b5fdcffc7ffc524"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(873,NULL,310351,'insert','blocks','{"block_hash":"fb97d2f766a23acb9644fef833e0257fdb74546e50d9e2303cf88d2e82b71a50","block_index":310352,"block_time":310352000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(874,NULL,310352,'parse','blocks','{"block_index":310352,"ledger_hash":"fdbf27d576a72b046776be0e5c0a91d060619778aadef3df1d30f1a7785a0fdb","messages_hash":"b2a4a9c315f66980a2a3525b322adf6ff4a47e60649559bd2e7dffb68b58c29a","txlist_hash":"1d2f391bb7990954e14c69c9429b54b9f5a88791ec4b2fba2facb464152417f4"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(875,NULL,310352,'insert','blocks','{"block_hash":"2d3e451f189fc2f29704b1b09820278dd1eeb347fef11352d7a680c9aecc13b8","block_index":310353,"block_time":310353000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(876,NULL,310353,'parse','blocks','{"block_index":310353,"ledger_hash":"73429d323376209447edc6d2ddbfd51f0bcde21736ea6dad61dc96b6984a1fa1","messages_hash":"a73650310ecd6b53b89787e20449de8e844aa747b6211dcc0b33aa389b3a5d72","txlist_hash":"8ad1adee999dd851e81025b31920d1f0f66c1e56433e7b2b110d03cfccd7a141"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(877,NULL,310353,'insert','blocks','{"block_hash":"437d9635e1702247e0d9330347cc6e339e3678be89a760ba9bf79dd2cd8803e0","block_index":310354,"block_time":310354000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(878,NULL,310354,'parse','blocks','{"block_index":310354,"ledger_hash":"b2bbcbb6a7db94b2a5681c6e380ac13480bb49c29a3fbb3c7c1eb740f70f8324","messages_hash":"b31bc14fc3a9af3b1b3977100c36b1465781bdbe9390ff267afdc51d57caae39","txlist_hash":"8d6870632f2336908828a72e7445c9d8ecbec3d420b234dad2b17ae06c0a709c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(879,NULL,310354,'insert','blocks','{"block_hash":"ea80897a4f9167bfc775e4e43840d9ea6f839f3571c7ab4433f1e082f4bbe37d","block_index":310355,"block_time":310355000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(880,NULL,310355,'parse','blocks','{"block_index":310355,"ledger_hash":"ccbd3ea41587c3c1d92f355979b49c5340a0a90060f07c228c22d6ff76b25579","messages_hash":"f1f4e9f44d7cec303a3ff0e9014c66741e8463d2e1e2644edff38a7a06ae19d3","txlist_hash":"8dfb02eb42bf84a085d150a0dc3fb2effa201594da47639e8f77fea0a7084eea"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(881,NULL,310355,'insert','blocks','{"block_hash":"68088305f7eba74c1d50458e5e5ca5a849f0b4a4e9935709d8ee56877b1b55c4","block_index":310356,"block_time":310356000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(882,NULL,310356,'parse','blocks','{"block_index":310356,"ledger_hash":"06a95d39e110e40ba318320d50984096cbec88c680f426f721154555efc2561f","messages_hash":"cc0cc378fba640609764042b3a71687c5ea7085f9fd3528fc22cb4a0f33c535a","txlist_hash":"3516c2e9b180883b3526ee0a028c6d22b2a8a028b896423eb71db31cc284d566"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(883,NULL,310356,'insert','blocks','{"block_hash":"4572f7f4ad467ef78212e9e08fa2ce3f01f2acc28c0b8ca9d1479380726bab1f","block_index":310357,"block_time":310357000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(884,NULL,310357,'parse','blocks','{"block_index":310357,"ledger_hash":"443f947352e853367d1c10d25771c7d78eec22fac19c5bace6f96b8f949e264b","messages_hash":"1a17b268e299c081550e6b708d3a67c8e9e5da464a248c07bd7ff2d37521aaf6","txlist_hash":"af4dd2cd8426ceb8c7dacc24b30d4d48e1152340a5a81f32b745878558969f4a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(885,NULL,310357,'insert','blocks','{"block_hash":"d5eae5513f1264d00d8c83fe9271e984774526d89b03ecd78d62d4d95ec1dea6","block_index":310358,"block_time":310358000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(886,NULL,310358,'parse','blocks','{"block_index":310358,"ledger_hash":"c2cd71dc9e7d5ccb5d5e9d6b55c47010c9db6a573d01820da1c8960970fd571f","messages_hash":"8994641c9faf9510eb6dc0cafb53c9ddd941fb6c7f628361bc30a57b70d1c635","txlist_hash":"635f90dc6b705e3e5928101d6ffc32a247088fd8965e0e372358b35ba822df31"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(887,NULL,310358,'insert','blocks','{"block_hash":"4fa301160e7e0be18a33065475b1511e859475f390133857a803de0692a9b74f","block_index":310359,"block_time":310359000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(888,NULL,310359,'parse','blocks','{"block_index":310359,"ledger_hash":"5b7646bafc6b11eb1554ea1e02221883043b435ae973c3678505fa2128aadfb7","messages_hash":"f65b2c8ae6adc575a288d4f042f90176bd007350206178e62c024584d6ed287c","txlist_hash":"eeec8a86b03a3973bdf5215e1789277ab7aa4c47f4e9f05a44a312c01e0ccf0d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(889,NULL,310359,'insert','blocks','{"block_hash":"cc852c3c20dbb58466f9a3c9f6df59ef1c3584f849272e100823a95b7a3c79f0","block_index":310360,"block_time":310360000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(890,NULL,310360,'parse','blocks','{"block_index":310360,"ledger_hash":"b0e937568a47c244e3b29cfb3a5e7196c171acc1565c44020345c715b7774658","messages_hash":"0f246fe11fc2b9fc1d2b8f7517473f6a7eb91915d765779783e7898a8bd3d5bc","txlist_hash":"32f4991609b3d8cbddbee2fe5e7aff49e7d4f5334ba0d283893733f19d3f448b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(891,NULL,310360,'insert','blocks','{"block_hash":"636110c0af5c76ada1a19fa5cd012e3ee796723f8a7b3a5457d8cb81d6c57019","block_index":310361,"block_time":310361000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(892,NULL,310361,'parse','blocks','{"block_index":310361,"ledger_hash":"fd5b67bb571f4e9c0c37c6a5c9e1181133c301e05f4f97a41bd827eda7a6db3c","messages_hash":"6fac343e1053a7a48346243c906493f98c138355761619bdc0677a0b3d7c697d","txlist_hash":"4ad763ba9a9de4e6fd2f48d1342b9c2b4f87224fe591cddcf0ea3aab19187ab3"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(893,NULL,310361,'insert','blocks','{"block_hash":"6199591a598e9b2159adb828ab26d48c37c26b784f8467a6bb55d51d7b6390f2","block_index":310362,"block_time":310362000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(894,NULL,310362,'parse','blocks','{"block_index":310362,"ledger_hash":"38382cc090b349809c4798c3c83b485f8ff682fd5b5b2568357d62ef30f7c046","messages_hash":"7208036024f6c4e6557619b9625abd7275a52a91f6bf0d62fbd20736138665f4","txlist_hash":"2eed1cb542570837b9e34c5ef140428d09c132369e5073061d9b1580338fad97"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(895,NULL,310362,'insert','blocks','{"block_hash":"a31967b730f72da6ad20f563df18c081c13e3537ba7ea5ab5d01db40e02647e6","block_index":310363,"block_time":310363000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(896,NULL,310363,'parse','blocks','{"block_index":310363,"ledger_hash":"82911a691937d87629bc14e5294f68a25ff2fc6512370db032834b85a623d5c3","messages_hash":"f2e9a33842fc7f9a1482b1c985a2a6058b8b56535c2a508fcd3e3dba930e46be","txlist_hash":"baa8c23f6f8bbed9640382166a4fa59eba156a3c94b645334124a57ad886136d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(897,NULL,310363,'insert','blocks','{"block_hash":"67025b6f69e33546f3309b229ea1ae22ed12b0544b48e202f5387e08d13be0c9","block_index":310364,"block_time":310364000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(898,NULL,310364,'parse','blocks','{"block_index":310364,"ledger_hash":"cc362ce4c2142e539057430e2dd6402b985c62fefa4e4ad33afe1305f53af8a4","messages_hash":"6de02c61011ad812328b595e95dfd62a2a21ed94bcf59d87fc87c758a9ccd48e","txlist_hash":"973037f8124687eaeba2e9f3e301cb20b9370bef4acd3f2c86eedf595b792b73"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(899,NULL,310364,'insert','blocks','{"block_hash":"b65b578ed93a85ea5f5005ec957765e2d41e741480adde6968315fe09784c409","block_index":310365,"block_time":310365000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(900,NULL,310365,'parse','blocks','{"block_index":310365,"ledger_hash":"49e41f95f081b70e3f540fa22864cc4f229ceabfdfd54f2da112f1fd35466617","messages_hash":"800333a93bd7fa0dda3e2ba69ae3e54849f6eada89153cb172fd950470da26cf","txlist_hash":"aa3e39acb1dc1a955f579a9a40961a80319c5dd484ddf322ca6edc6b67cec932"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(901,NULL,310365,'insert','blocks','{"block_hash":"a7843440b110ab26327672e3d65125a1b9efd838671422b6ede6c85890352440","block_index":310366,"block_time":310366000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(902,NULL,310366,'parse','blocks','{"block_index":310366,"ledger_hash":"687c5f3e381d164499126ff90785e3635c825db3808267d4de2ec0e37cc7c597","messages_hash":"b33be7191d7e1afb1140f19fd44bb07daf83897c2fa1af45fc75c15bc85307a0","txlist_hash":"610fbd2d8f4dad57d7efca0772534da791785cb2c45de1906a9b282792faa9f8"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(903,NULL,310366,'insert','blocks','{"block_hash":"326c7e51165800a892b48909d105ff5ea572ff408d56d1623ad66d3dfeeb4f47","block_index":310367,"block_time":310367000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(904,NULL,310367,'parse','blocks','{"block_index":310367,"ledger_hash":"d7fe976a4b2cca2e23d082a703ef4f4739e110ce1e0a373e76064f6186856ff7","messages_hash":"78fd0206e26ec2c77965dec55fa417738c919261b8a436e69574a786d313dc65","txlist_hash":"531453a70483611396ce5bacc17e22125b1b61f61d56c110fb72a929b95deb9a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(905,NULL,310367,'insert','blocks','{"block_hash":"f7bfee2feb32c2bfd998dc0f6bff5e5994a3131808b912d692c3089528b4e006","block_index":310368,"block_time":310368000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(906,NULL,310368,'parse','blocks','{"block_index":310368,"ledger_hash":"97f0a0f9e6f355dd179aa2941412decc1b0a06de0dc14dce8538aed6e35d41ba","messages_hash":"a75962c77a91893bfe4fce4d8e9b6e6f85d863b7f2b30060f7eb61b913c8f988","txlist_hash":"289eb338000f45b4d7e143a08a490fbee8d307eb0975f5a2ed62586c2f625e0e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(907,NULL,310368,'insert','blocks','{"block_hash":"0f836b76eb06019a6bb01776e80bc10dac9fb77002262c80d6683fd42dbfc8da","block_index":310369,"block_time":310369000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(908,NULL,310369,'parse','blocks','{"block_index":310369,"ledger_hash":"1b5d9ec9bd918c84a5f9b6882c94a739cc1ad1362dedfbdf7b2009fd42251d66","messages_hash":"9f6da7f4b88f3abd9705318ff6a1d23ee9bcfb11c16f6de7a1dfc5c160c8f5bc","txlist_hash":"a9122294ce4ccd606d3fa1787fb9c44f25811fb2fe486c9d58b407b5da50dd8b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(909,NULL,310369,'insert','blocks','{"block_hash":"9eb8f1f6cc0ed3d2a77c5b2c66965150c8ceb26d357b9844e19674d8221fef67","block_index":310370,"block_time":310370000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(910,NULL,310370,'parse','blocks','{"block_index":310370,"ledger_hash":"578b039ed2b9a25e1c75ad9a5242c5962d6645616dc53fb08386602e40f14486","messages_hash":"7e1fc55016a8c1f7d8aeb507891febc3d2ff083d15a8386cb151eeed36126902","txlist_hash":"d61d958644caab04dc236d04d3654abeb1fd625dd7b9cdc01ca5caeae9b41f58"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(911,NULL,310370,'insert','blocks','{"block_hash":"7404cb31a39887a9841c2c27309d8c50b88748ed5fa8a3e5ba4cc3fc18310154","block_index":310371,"block_time":310371000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(912,NULL,310371,'parse','blocks','{"block_index":310371,"ledger_hash":"473d21b8218a2b02f7fa0d5daf114fa988e4a3d97c33aebe97e51a8d22252492","messages_hash":"0c1a84220c5740d841e1019b76849a49f2760d82afac404c46ac333840724478","txlist_hash":"8abb7bf5c66895fd9e9de804ed8e35b3b1d12054a4e45ab3df6cd41194d836e6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(913,NULL,310371,'insert','blocks','{"block_hash":"d3a790f6f5f85e2662a9d5fcd94a38bfe9f318ffd695f4770b6ea0770e1ae18d","block_index":310372,"block_time":310372000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(914,NULL,310372,'parse','blocks','{"block_index":310372,"ledger_hash":"0c306eb25702d190ce32cac521b1fac9b8a7cbcf441fd74be8de2e002b4ce14c","messages_hash":"c4f885c7acac670739975c95af4f377eecfb635a112cc87b6881d6972cf46374","txlist_hash":"ad3d52b024093fcc5b88b7a3176c4117468f0f675fd9e908c727ebedc5e2eff3"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(915,NULL,310372,'insert','blocks','{"block_hash":"c192bec419937220c2705ce8a260ba0922940af116e10a2bc9db94f7497cf9c0","block_index":310373,"block_time":310373000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(916,NULL,310373,'parse','blocks','{"block_index":310373,"ledger_hash":"48d14b17f9074ce1f75ab32581e8f6fe7d518ebd669af6508e5d986d97c92b3d","messages_hash":"95024e723544b65f52242f2c4ec5e71264a1aceb8e4a02136a0772be1c7d60fe","txlist_hash":"b60270d322c86c6452289e0968be64c2217ebeec34944e43aef908e119f838ea"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(917,NULL,310373,'insert','blocks','{"block_hash":"f541273d293a084509916c10aec0de40092c7695888ec7510f23e0c7bb405f8e","block_index":310374,"block_time":310374000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(918,NULL,310374,'parse','blocks','{"block_index":310374,"ledger_hash":"aee93917f6fe0046069aaff48d5d1875a9c4451acec6562a377428bfb1184cd4","messages_hash":"015375f1837c56f1921aed0b6297ce0ed5279663bb9bca13ede1392abbf17d81","txlist_hash":"46decb141683d0bf4c52e4f756b955c923bfb3995025d0f19a8ef7cac1dd2b60"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(919,NULL,310374,'insert','blocks','{"block_hash":"da666e1886212e20c154aba9d6b617e471106ddc9b8c8a28e9860baf82a17458","block_index":310375,"block_time":310375000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(920,NULL,310375,'parse','blocks','{"block_index":310375,"ledger_hash":"2b0d74911bba5c9530b69c04fec512fe4c5df25458e5237db884586a221fa30b","messages_hash":"9f74f2c9fc67e4d2364b85c8d975f11c53dd96dbb33512d3718fa815b5fa070a","txlist_hash":"9349961eeb706cf083d6ef1fff69cc871def662dd23fd7854135c1b0dc1a78fb"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(921,NULL,310375,'insert','blocks','{"block_hash":"5dc483d7d1697eb823cba64bb8d6c0aded59d00ea37067de0caeebf3ea4ea7dc","block_index":310376,"block_time":310376000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(922,NULL,310376,'parse','blocks','{"block_index":310376,"ledger_hash":"a6f84afe2845ba2fa4e5e7377b1d4474dbde6dfc9c4bed050e6d10cc80025e82","messages_hash":"53b6ffb8648293f11adb26d10dce89a55dc0b6645c74bac3b8841421a2715476","txlist_hash":"a5f607569f31beb9ba2a0496a9eb2eb40a6926df4b174161b73f53719ad04767"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(923,NULL,310376,'insert','blocks','{"block_hash":"f8d1cac1fef3fa6e7ad1c44ff6ae2c6920985bad74e77a6868612ee81f16b0b3","block_index":310377,"block_time":310377000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(924,NULL,310377,'parse','blocks','{"block_index":310377,"ledger_hash":"e006e13691719e4fce65e72c692d3affeae8ae465de2a3b285a1bed4eb518a70","messages_hash":"318599633adc13ffcdc8228c39103c9f25eff9a3b1d1b1fc308d10bb41d7f9f0","txlist_hash":"4dd3a5ae07e934557005871e7c72351077b1092580eadda11fcd3501bb000579"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(925,NULL,310377,'insert','blocks','{"block_hash":"fec994dd24e213aa78f166ca315c90cb74ee871295a252723dd269c13fc614ce","block_index":310378,"block_time":310378000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(926,NULL,310378,'parse','blocks','{"block_index":310378,"ledger_hash":"607ffa4928577b82f275750353fcecc2e50098d227f18bb8ea95ac2bbb10eea6","messages_hash":"bc105cb041223f0dd3c20019e8a7a9aeb127d6fddec1560d606cd5b8af23279c","txlist_hash":"49533405fa36a389e0d8cac965389e23eb421da5833d625d160f75fa9defdeab"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(927,NULL,310378,'insert','blocks','{"block_hash":"d86cdb36616976eafb054477058de5670a02194f3ee27911df1822ff1c26f19c","block_index":310379,"block_time":310379000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(928,NULL,310379,'parse','blocks','{"block_index":310379,"ledger_hash":"9f17e8d662dbbfc12a56dc36172b3154bc9b05a87885d1411826481e1ca4f6ea","messages_hash":"902cbbb20d2a0003f4c579bfbedb04e787a2a5ef5a8c485a269c215c9628db32","txlist_hash":"4514a78a69d0987ff60976334f70d0533a1c5726099ae73d93be187a57f25f44"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(929,NULL,310379,'insert','blocks','{"block_hash":"292dba1b887326f0719fe00caf9863afc613fc1643e041ba7678a325cf2b6aae","block_index":310380,"block_time":310380000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(930,NULL,310380,'parse','blocks','{"block_index":310380,"ledger_hash":"d617e30e1a32ed1cf269a190fd4c843755413492827546a0b3ed14278f817532","messages_hash":"1c8bc40c48e73b0993830fb4073e2f2ae056111b5bd5d22a87831c4b88d32973","txlist_hash":"77038e6b75820a64c9fc9530b3d2c8411cc4da649fc69a3d235424c2dd5500c5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(931,NULL,310380,'insert','blocks','{"block_hash":"6726e0171d41e8b03e8c7a245ef69477b44506b651efe999e892e1e6d9d4cf38","block_index":310381,"block_time":310381000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(932,NULL,310381,'parse','blocks','{"block_index":310381,"ledger_hash":"8af8d819f02927de4a74d3d37dcecf6e5124d53be37603764b1b1adad13b0d7a","messages_hash":"910afea0bf4129dd27c06428bafaab6c8c8bbf95ec371466640072a26eb129e5","txlist_hash":"48b66540bea91d2c2d216d5c13e88dfd9c1f1a36cae2ec721253034041e63af6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(933,NULL,310381,'insert','blocks','{"block_hash":"0be33004c34938cedd0901b03c95e55d91590aa2fec6c5f6e44aec5366a0e7d8","block_index":310382,"block_time":310382000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(934,NULL,310382,'parse','blocks','{"block_index":310382,"ledger_hash":"809d5c20335bbefe8e4f3552e24b24d96f6ee4ab12f3bfc9e74898371cf69797","messages_hash":"9cdf0d22a1b690bfb2f542326c53e25e0f1d2b83c434bdc8294ce03959faeba6","txlist_hash":"159e8434abde33d3a97a4e7701cafec884a6d0d7ad78852ee7db449a18c5e23f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(935,NULL,310382,'insert','blocks','{"block_hash":"992ff9a3b2f4e303854514d4cad554ff333c1f3f84961aa5a6b570af44a74508","block_index":310383,"block_time":310383000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(936,NULL,310383,'parse','blocks','{"block_index":310383,"ledger_hash":"d8ec301994a5333f8efe7cc547a833d26c6766deb0b39c4fc18d1bdb470ee903","messages_hash":"4b565f4fd6c07a96002f87eccb7e693fe8d7cc6d8a81cb85cc6b06fb071069c4","txlist_hash":"aecbe5619daf47a60ab2765502725a284224c0985e91993b212c50c3449d197a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(937,NULL,310383,'insert','blocks','{"block_hash":"d518c696796401d77956d878cbdc247e207f03198eabc2749d61ebeadee87e5e","block_index":310384,"block_time":310384000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(938,NULL,310384,'parse','blocks','{"block_index":310384,"ledger_hash":"fe47a03993cb9079a6e72810552d631fe838bcfaba3b34c73c9948af77266df2","messages_hash":"8e77a1836fdc196b50c2a525208fb5ff587c38486d1dce443a2fb1a7227119f2","txlist_hash":"e69bc390fb0a624f6d33512a55e9732857afee1b114df97761186ac648f63111"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(939,NULL,310384,'insert','blocks','{"block_hash":"2aa6a491a03a1a16adbc5f5e795c97ec338345cfdf10ff711ffb7ac3a0e26e28","block_index":310385,"block_time":310385000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(940,NULL,310385,'parse','blocks','{"block_index":310385,"ledger_hash":"6114e98e0004cf0f9472fce6bfa6bb99ae38e57214c8b134f30da1d62399f6ef","messages_hash":"7668443002aeaae041ff7859c252f642fd930c4d51a616247a798f47942f97ae","txlist_hash":"d3e6a4df9ff34518f8fe243dc87c981aef0cc7b89ff9ca466269a19493aeaecb"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(941,NULL,310385,'insert','blocks','{"block_hash":"9d19a754b48a180fd5ebb0ae63e96fa9f4a67e475aeefa41f8f4f8420e677eda","block_index":310386,"block_time":310386000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(942,NULL,310386,'parse','blocks','{"block_index":310386,"ledger_hash":"4c52d59ade1bd2068e3b75b8b3cd1d23c6a94b6437f7966d10f5a07bf8f630ff","messages_hash":"1fd22e6bf448e0771f8c7da5c0829614f5f45612bd6592104c369b001fcfd266","txlist_hash":"1c250ef18892c191c535562bb35bb1c8bd4f515ab00bc4cf0b564436b2bd33ee"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(943,NULL,310386,'insert','blocks','{"block_hash":"b4cac00f59c626206e193575b3ba9bfddd83bbfc374ebeb2838acd25e34a6c2b","block_index":310387,"block_time":310387000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(944,NULL,310387,'parse','blocks','{"block_index":310387,"ledger_hash":"327e9a842233568888998ec1456b6f78c093b47639707d44e6336b2bc18d955f","messages_hash":"194a4ec47379a92f7ad3ef8b24e797fe33173d2036b687596fa534356c07a672","txlist_hash":"d7de64dd98a65b478518d909b1f0f2860f6a0b8e5e530f23ee55caffbaf1a545"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(945,NULL,310387,'insert','blocks','{"block_hash":"41a04637694ea47a57b76fb52d3e8cfe67ee28e3e8744218f652166abe833284","block_index":310388,"block_time":310388000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(946,NULL,310388,'parse','blocks','{"block_index":310388,"ledger_hash":"6efaab188a5cae39ef547a804f61bcbc2be4881e0569f49d7622b407f6860401","messages_hash":"5de4d26d0f94ec5c143e465eb509d22bbd2016bf9068ffb5e5c6949384a648e1","txlist_hash":"4916559fdc472a474aa4c652c85b0db143744daed0d98d7f2fddd1dba32be88e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(947,NULL,310388,'insert','blocks','{"block_hash":"3ec95ae011161c6752f308d28bde892b2846e96a96de164e5f3394744d0aa607","block_index":310389,"block_time":310389000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(948,NULL,310389,'parse','blocks','{"block_index":310389,"ledger_hash":"89c686d5d973691a7281268c867f837b86b140a05f16f12302a3cdeb3b6a0ee9","messages_hash":"232a974e8b60494567216ff9b2b8744fbd48c5328d04a63b29c671a8274df924","txlist_hash":"b2e0098e42f81a8a9369d510b17be67446feb3e5da1b1eb37acd9f0b33b29fce"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(949,NULL,310389,'insert','blocks','{"block_hash":"f05a916c6be28909fa19d176e0232f704d8108f73083dded5365d05b306ddf1a","block_index":310390,"block_time":310390000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(950,NULL,310390,'parse','blocks','{"block_index":310390,"ledger_hash":"2c4eceebb94d0c7a7702478d9547d1afbb42ab5ecb5ae6271a3f69942bd77e50","messages_hash":"bf9827228ad31a03a85dacfd3a333afbbfe662611550bd431077abd226c87845","txlist_hash":"8e3a48b160083860b0928dd97150477980da9097945c4ae3ee144c505f131b86"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(951,NULL,310390,'insert','blocks','{"block_hash":"fc26112b7fdd8aaf333645607dabc9781eac067d4468d63bb46628623e122952","block_index":310391,"block_time":310391000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(952,NULL,310391,'parse','blocks','{"block_index":310391,"ledger_hash":"06397124ee2a1bcb9104899469394855d4ecccd1a08626d650bdf3169e227831","messages_hash":"7eb2b6f227e5550b5d0d75c21818c58263a4e86dd6b160b0b1638dda017d3062","txlist_hash":"b1b4f0fc9ba54527ea0902192a61158bb5383f1959f187915c07f88bdf11caaa"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(953,NULL,310391,'insert','blocks','{"block_hash":"f7022ecab2f2179c398580460f50c643b10d4b6869e5519db6ef5d5a27d84a1d","block_index":310392,"block_time":310392000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(954,NULL,310392,'parse','blocks','{"block_index":310392,"ledger_hash":"44974b5fec0be3a2958d39f2d6824a2e82733f873a404ec9887178c620843149","messages_hash":"3341d9abb5324b460d6a80df5fd0b9c4003b38dffab3a503c27cfd21a3cd60df","txlist_hash":"97a039be078662ac5b1a275d5618224c1a90886c79b9fb651dfcb14481da8e8a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(955,NULL,310392,'insert','blocks','{"block_hash":"e6aeef89ab079721e7eae02f7b197acfb37c2de587d35a5cf4dd1e3c54d68308","block_index":310393,"block_time":310393000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(956,NULL,310393,'parse','blocks','{"block_index":310393,"ledger_hash":"1863677c0e552344607b1af3eb8ef8f4fc6b2a73d63eebb3e9928302c887970f","messages_hash":"7e02c72085143c68bf4ec2f0d7f9cc74a5bdd0bbaf28d7c441401a8990e64fc7","txlist_hash":"c488dd61c64182cdc779e96a2b312463d42ff9829d1d518c8a9daa1a4cb26de3"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(957,NULL,310393,'insert','blocks','{"block_hash":"2a944743c3beb3bf1b530bd6a210682a0a0e9b0e6a9ff938d9be856236779a6f","block_index":310394,"block_time":310394000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(958,NULL,310394,'parse','blocks','{"block_index":310394,"ledger_hash":"3838ba6e84376ed8dffb3fee9b5928d903952c0d8a8ad41ab63a9651a1c8c770","messages_hash":"b386b65006170bb4b28bbe1a8235f9fc7104ea3e9e34d51d86eee06326571d99","txlist_hash":"e329db30a579327664d135ce9c3661a259378dcc12e179232599e0186c7bfe91"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(959,NULL,310394,'insert','blocks','{"block_hash":"19eb891ce70b82db2f2745e1d60e0cf445363aaff4e96335f9014d92312d20e4","block_index":310395,"block_time":310395000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(960,NULL,310395,'parse','blocks','{"block_index":310395,"ledger_hash":"872367d61f81cddeb555da5f9c4f46a8ac57c24629ab073094e407a4555a8555","messages_hash":"5f9db4e525ecff94de73118f2cb2ffaf872fe2692c4c35ab221fe89adc13b28d","txlist_hash":"2234b36f4187eb0da9ed6a633aa2e15075d5efb23f154963885e7fd42495e4a5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(961,NULL,310395,'insert','blocks','{"block_hash":"aea407729ac8d8e9221efd9d70106d14df6aaf9f2f87dc6f490835a9caadf08e","block_index":310396,"block_time":310396000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(962,NULL,310396,'parse','blocks','{"block_index":310396,"ledger_hash":"b9a9eaaf1cf6cfa4ae5b0f314812a9a2346209da0b7ce57e16010d2a01c0092a","messages_hash":"9e0597d4190ec3e829b62fe7ccc8020109369dbf72ab2b14ea115da386330813","txlist_hash":"25946162b9af068438633980c75eaf9e508144f603f7a913de56cc11a7a482f6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(963,NULL,310396,'insert','blocks','{"block_hash":"7c429e56a19e884a8a77a759b52334a4b79404081b976270114043ba94d7985c","block_index":310397,"block_time":310397000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(964,NULL,310397,'parse','blocks','{"block_index":310397,"ledger_hash":"b61f36bcc934a18fdccf7806d41482684ca129801d0b9ce7815dcd488fc49a66","messages_hash":"b55fadb9aadb55ad049079769711016434ca942454f5bc39d9f6dc4417b24dab","txlist_hash":"e697fb2f445f03a1d895b904be58a554af4c26ed74a65eb0e52c98e490efbd44"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(965,NULL,310397,'insert','blocks','{"block_hash":"55c046db86dee1d63c0e46e6df79b5b77dfd4ab2ff5da79e6360ce77dd98335e","block_index":310398,"block_time":310398000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(966,NULL,310398,'parse','blocks','{"block_index":310398,"ledger_hash":"9446476e123e5dd354682c60591cab8b712c30df9080dde756246eef45e21df5","messages_hash":"f56692ed7d8f224a45a3c2563e2441b55626f8845abb6879fd1364cfa442c189","txlist_hash":"0d20ba449b95f7d128c8b78ef2a37ec390e6177b2041a2b035a72cb8e6062ba9"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(967,NULL,310398,'insert','blocks','{"block_hash":"765abc449b3127d71ab971e0c2ae69c570284e0c5dacf4c3c07f2e4eca180e7a","block_index":310399,"block_time":310399000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(968,NULL,310399,'parse','blocks','{"block_index":310399,"ledger_hash":"50d288bca09d446f56544fb1ec50d613bdf156488468ac92d433425a3cab0804","messages_hash":"b64321d63d483d9e7c09026e749bf3e9ab67e14d2e6c09363728bfa02c102d09","txlist_hash":"82214bf1638d82e5b66919990e24d3960eb02a423bb3f36bcdd730b17267e340"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(969,NULL,310399,'insert','blocks','{"block_hash":"925bc6f6f45fe2fb2d494e852aaf667d8623e5dae2e92fdffa80f15661f04218","block_index":310400,"block_time":310400000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(970,NULL,310400,'parse','blocks','{"block_index":310400,"ledger_hash":"349a24fd446727bb1793ccf88fc569d20eb680c10e506fc25b281ce6ec3fd7bd","messages_hash":"fee9df29e116470c1165c090931eb1bd7e45795f53350fa87da5042ce529edef","txlist_hash":"e7ce5e8c9c4160590dcdaba04bc866267a9784f99fe68bebd337da16768e8f18"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(971,NULL,310400,'insert','blocks','{"block_hash":"f7b9af2e2cd16c478eed4a34021f2009944dbc9b757bf8fe4fc03f9d900e0351","block_index":310401,"block_time":310401000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(972,NULL,310401,'parse','blocks','{"block_index":310401,"ledger_hash":"52c06b68cad19608420b73476a73b411d0327382b92bd454cadf1b8616eb17a5","messages_hash":"05538970685115a9ddaf41d458a3cce59ecf7b9b6a888729efadce1014e7a899","txlist_hash":"6ff1e13b2110c6ee69e86818bd32bacdffa6f4e91fd2d8c2b09b5db35062be81"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(973,NULL,310401,'insert','blocks','{"block_hash":"1404f1826cd93e1861dd92ca3f3b05c65e8578b88626577a3cbad1e771b96e44","block_index":310402,"block_time":310402000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(974,NULL,310402,'parse','blocks','{"block_index":310402,"ledger_hash":"8bf64213a454c62dd4b0dcd7dfa298da0244a6aa7ae6fff98be6f49d50d259ab","messages_hash":"21985f293ab45f0cc41e2760cd3cd2c3e5fe8788ad16c5008b1853869e574790","txlist_hash":"3e776187716a384a84170b2e7dbbb5c152d98535351c1f5b4b00c7bf5ea7ff33"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(975,NULL,310402,'insert','blocks','{"block_hash":"f7426dbd4a0808148b5fc3eb66df4a8ad606c97888c175850f65099286c7581c","block_index":310403,"block_time":310403000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(976,NULL,310403,'parse','blocks','{"block_index":310403,"ledger_hash":"fb2a365372522d1442792cb38e1a4167eda2612ef442c776749097a3d541a827","messages_hash":"e0e319bb5d4189cd952e021faaf0146e2872b62dcf137856d61959adf81724a4","txlist_hash":"1fad731787bca55d4102d8d355ccb9625590baaccd0ae63490320efbf5aaf90f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(977,NULL,310403,'insert','blocks','{"block_hash":"401c327424b39a6d908f1a2f2202208a7893a5bedc2b9aff8e7eda0b64040040","block_index":310404,"block_time":310404000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(978,NULL,310404,'parse','blocks','{"block_index":310404,"ledger_hash":"47f96d798df9cad17667be908ebb063ab9f79d947784a78189d247e626864a5f","messages_hash":"64c5499c7eef627a35277d801a7480aeb4a1e845ae368475da0c2edac597968c","txlist_hash":"10b2cfe8ebe45dac311048b4aa8d15d7c59ae17f5c1a0c132cfb675d893de8d5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(979,NULL,310404,'insert','blocks','{"block_hash":"4f6928561724e0f6aab2fc40719f591823ca7e57e42d1589a943f8c55400430a","block_index":310405,"block_time":310405000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(980,NULL,310405,'parse','blocks','{"block_index":310405,"ledger_hash":"185780205a9ab241bb0656799fd0d5942c1e3e5854abd1d06573da550b04b096","messages_hash":"dc4339e5e79750da2e11a43ccf76b285e85e50187e81bf14237084c2a3c414b2","txlist_hash":"8cbd52dd97944b34f080d675a51360dafcd38183cb08633e6ea247d2c5074435"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(981,NULL,310405,'insert','blocks','{"block_hash":"6784365c24e32a1dd59043f89283c7f4ac8ceb3ef75310414ded9903a9967b97","block_index":310406,"block_time":310406000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(982,NULL,310406,'parse','blocks','{"block_index":310406,"ledger_hash":"367b9de2313c5f7fce0c2dc2b4a8e2bc059f6881bc924f7315e8e2ca61728a59","messages_hash":"29eac43bd800bb93099e696e1f4cfe1bb7dfbce8316e65459c5e7780d32488c7","txlist_hash":"0d104d4ce44d11e581f51e5a33ec9e35a994b2b992842b173fb8a2756412b4b2"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(983,NULL,310406,'insert','blocks','{"block_hash":"84396eb206e0ec366059d9e60aefdb381bca5082d58bffb3d2a7e7b6227fc01e","block_index":310407,"block_time":310407000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(984,NULL,310407,'parse','blocks','{"block_index":310407,"ledger_hash":"2bdbd79575aa2ff52ba0cce3fc1a1aac6120d598a8ab0ff3925e1395e6cad2d1","messages_hash":"b570ec3ca500cb58c1388584391c16e4ff5061ac434b7bcfd8185a121f318207","txlist_hash":"a3407057dc90723c90ed8f2df5af7840e50daa4c4bdedd47181c17a1e8563934"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(985,NULL,310407,'insert','blocks','{"block_hash":"4827c178805e2abae5cb6625605623b3260622b364b7b6be455060deaaec2cda","block_index":310408,"block_time":310408000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(986,NULL,310408,'parse','blocks','{"block_index":310408,"ledger_hash":"fcd0edef8c4ae9517a6e793a2742c598de38c122829b7a7aa265310417ac92c3","messages_hash":"91b0efd57597544fe96539dbab912ef18d57dc237a42ee5245dd95c59eafd375","txlist_hash":"3ee1e7949bdb395a4e481f94344fccb2781abcb3f5d1fea2bbadb9de9228a426"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(987,NULL,310408,'insert','blocks','{"block_hash":"01a719656ad1140e975b2bdc8eebb1e7395905fd814b30690ab0a7abd4f76bba","block_index":310409,"block_time":310409000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(988,NULL,310409,'parse','blocks','{"block_index":310409,"ledger_hash":"5b663c40873af21ebc721f2689e2c57a2c787fff579c58f033bba75910a64837","messages_hash":"7b6bfcc602b144da1f9c12773523114a4a54267eca14f4c8f255a9ce8b2e85c4","txlist_hash":"68fbf3a110ed24946d1594f5a4de1dae9c4b6f0394188a71ab89996e9fb4e55b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(989,NULL,310409,'insert','blocks','{"block_hash":"247a0070ac1ab6a3bd3ec5e73f802d9fbdcfa7ee562eaeeb21193f487ec4d348","block_index":310410,"block_time":310410000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(990,NULL,310410,'parse','blocks','{"block_index":310410,"ledger_hash":"93c5a33931b2a33933bc286d6987b34730c0677460e4875d5c032ae86c2e01f0","messages_hash":"ca813e8e604e5ac2adf5fa18e2776ddf48ef3b2f34a1471fe71fb80ff73769d1","txlist_hash":"bd755bf0718d5a0423ec41a8ac84b1554751ff8f0a3f63d87e7e0f58aaa31008"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(991,NULL,310410,'insert','blocks','{"block_hash":"26cae3289bb171773e9e876faa3e45f0ccc992380bb4d00c3a01d087ef537ae2","block_index":310411,"block_time":310411000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(992,NULL,310411,'parse','blocks','{"block_index":310411,"ledger_hash":"8d98498f89619a2e334e9ac69bf8ff37251af6431d9bb6d1ea8bbc404c5e560d","messages_hash":"6be534a6fddd54f6813f4f6247e6c47bb0eddda08e28edbafa132bf8115f390f","txlist_hash":"103563dcfc7b9f149b6efdad7cae17b090d4a8232fd4c37fac7bcf942d784b55"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(993,NULL,310411,'insert','blocks','{"block_hash":"ab84ad5a3df5cfdce9f90b8d251eb6f68b55e6976a980de6de5bcda148b0cd20","block_index":310412,"block_time":310412000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(994,NULL,310412,'parse','blocks','{"block_index":310412,"ledger_hash":"a16a650c4b63ed783e7229980be1177da867c188a5039ed5c58b9717f6ccf634","messages_hash":"a3b69de49ae3569129f96bc994fd0566acfc5cf6ea0c346e7297aea967283636","txlist_hash":"4daa6f0799529346ba4ee87e2aed1450447921dfa92e785378fae39c234a7c8f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(995,NULL,310412,'insert','blocks','{"block_hash":"21c33c9fd432343b549f0036c3620754565c3ad99f19f91f4e42344f10ec79bf","block_index":310413,"block_time":310413000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(996,NULL,310413,'parse','blocks','{"block_index":310413,"ledger_hash":"768577c1a7c2cf2cc19cd8dbe823f1bdb8a222daee4c7ac7b5ead6633040c283","messages_hash":"f8ffa3c414d806885764c093a7a8d362aa78d68751e710cfc89e2e318d59817b","txlist_hash":"7ae9815341dccd2d1bff8dbcfdbcce4e52b4aac8f2fdd421348ed9f44cd19e38"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(997,NULL,310413,'insert','blocks','{"block_hash":"8cff03c07fd2a899c3bcf6ac93e05840e00de3133da14a413e9807304db854b6","block_index":310414,"block_time":310414000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(998,NULL,310414,'parse','blocks','{"block_index":310414,"ledger_hash":"906c491f164877c31002da41233c237d0d4a945a0072406a7b7d13df74be7eec","messages_hash":"94b9e9f9260a35300ea27a15a0a9493350c2a6db704bc0d4ee0e78a5818cebdd","txlist_hash":"807cd64b4d8ee3d91a5cbc651e42feeacd5248b6572310472743ca71a9f24621"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(999,NULL,310414,'insert','blocks','{"block_hash":"dd0facbd37cca09870f6054d95710d5d97528ed3d1faf2557914b61a1fc9c1cc","block_index":310415,"block_time":310415000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1000,NULL,310415,'parse','blocks','{"block_index":310415,"ledger_hash":"d27f99b4a67dfc910d3b932f97b7299779f245e95f871140d3c90f13cc6e506e","messages_hash":"8146c8dfac8c08e8d1a7fd45ace0cbc146f928616343c082603dea1dbe0375ee","txlist_hash":"67fe947c260b3d8748887e94f68c3725664bb6dbd72187e9312ee48a42770ec3"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1001,NULL,310415,'insert','blocks','{"block_hash":"7302158055327843ded75203f7cf9320c8719b9d1a044207d2a97f09791a5b6b","block_index":310416,"block_time":310416000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1002,NULL,310416,'parse','blocks','{"block_index":310416,"ledger_hash":"90fcd04c508a9821e0ba0ed36cd7cfadd1d3c95116e3f52ad69f98d3d14de571","messages_hash":"dca1d2b95f7f534e3dea2e7a2019838753efb31c5ced981701f50940f3cf0d26","txlist_hash":"1041a17c5c146181a56da6ef17386814299be8a22c76a2b2f8a4a2768b2b531c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1003,NULL,310416,'insert','blocks','{"block_hash":"2fef6d72654cbd4ea08e0989c18c32f2fe22de70a4c2d863c1778086b0449002","block_index":310417,"block_time":310417000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1004,NULL,310417,'parse','blocks','{"block_index":310417,"ledger_hash":"19cbb26c6d24df5b110a5aae9b53a911a61b2086dde926273a1b0f66c1049e6b","messages_hash":"827cc7c36c8f51da81c980c10003c324cfab26a15e2e7d5698ae323deff752c6","txlist_hash":"920154e272608daa3c501588cf0eee50c2c45a385d30f42711657ae4a6de3bf5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1005,NULL,310417,'insert','blocks','{"block_hash":"fc27f87607fd57cb02ce54d83cec184cf7d196738f52a8eb9c91b1ea7d071509","block_index":310418,"block_time":310418000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1006,NULL,310418,'parse','blocks','{"block_index":310418,"ledger_hash":"2dc971d2db4e92e2d5dcef124bf9cdad33c41a71d6ae3db80297cb2257911f0d","messages_hash":"85d72f558c2926cf357f739ea311de5aa840cbe82c35beee417a1520860d7a59","txlist_hash":"290826e9c72e49636370d0dad56ba1c2c9209d888b993e030838f84300c0225a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1007,NULL,310418,'insert','blocks','{"block_hash":"9df404f5ce813fe6eb0541203c108bc7a0a2bac341a69d607c6641c140e21c8e","block_index":310419,"block_time":310419000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1008,NULL,310419,'parse','blocks','{"block_index":310419,"ledger_hash":"7ad2bf141622a0db4b27b1f4dab4857d1595e3f746a4113992850a680ebf1f37","messages_hash":"77ebc95e7c6af80280c5d7915ec2b599d700151c4160dbc5a8d5b2a109bbe05c","txlist_hash":"d06653b493d120dd288637d530cd3f6efa1c8f5c252bb275572c1948ff0f3539"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1009,NULL,310419,'insert','blocks','{"block_hash":"138b3f1773159c0dd265a2d32dd2141202d174c2e52a4aeac3588224a3558372","block_index":310420,"block_time":310420000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1010,NULL,310420,'parse','blocks','{"block_index":310420,"ledger_hash":"3602b26268d1bd3fc5f08f170e9767ff07c91f6976a1c342dc6b24f7ee98c509","messages_hash":"1107a47b26211af98233b1c5293451ae5bb9349c73368b513ecd337ad2a64d3e","txlist_hash":"ae8e61a57232c10bd15c655bb8c76007dcef394ba64d1619157ca58990e18c25"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1011,NULL,310420,'insert','blocks','{"block_hash":"71fe2b0e02c5cad8588636016483ddd97a4ef0737283b5fd4ab6ea5dc5c56b9a","block_index":310421,"block_time":310421000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1012,NULL,310421,'parse','blocks','{"block_index":310421,"ledger_hash":"1c1facfa3852b33c173a08d06450335a2b230541c60973a154e8dd864f3c3c8b","messages_hash":"1a47a0616e0d7d4153e694dc20509140325be90d30203a496bff146da7aadaef","txlist_hash":"01bfd609f878bb6149779f6377d7868d5b7fa3b831f68cd757967b982cd09ad4"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1013,NULL,310421,'insert','blocks','{"block_hash":"cd40260541b9ed20abaac53b8f601d01cd972c34f28d91718854f1f3a4026158","block_index":310422,"block_time":310422000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1014,NULL,310422,'parse','blocks','{"block_index":310422,"ledger_hash":"e788123aefd1129554fa2c166dbd06ce68f913730183ca73cf248c1f5284eba4","messages_hash":"a6aca492da14b2a2a5911a1eb9fc2b94007ac2618d18c7141e0c917af583b09d","txlist_hash":"6577ad9a9e3889fb5eeac7fc9039af8d4537a8fc28b4a9de85e230f5d9da3583"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1015,NULL,310422,'insert','blocks','{"block_hash":"6ca0d6d246108b2df3de62a4dd454ff940e1945f194ba72566089f98ad72f4db","block_index":310423,"block_time":310423000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1016,NULL,310423,'parse','blocks','{"block_index":310423,"ledger_hash":"ad445e5351af8739b2f74cbba8b44201c20ab55ad1db064402614fb97f35c375","messages_hash":"d52d5b979c57d1fc9b43ab2133ffe65f383646105c22be971c618325a4e295a3","txlist_hash":"dd7b66518e8ec22359df2d8ad4c0349fe4ab3a74620aaf2ef4bdc93a4c7e2d92"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1017,NULL,310423,'insert','blocks','{"block_hash":"ed42fe6896e4ba9ded6ea352a1e7e02f3d786bfc9379780daba4e7aa049668ad","block_index":310424,"block_time":310424000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1018,NULL,310424,'parse','blocks','{"block_index":310424,"ledger_hash":"e89872ed802fe4421844882958fe6384cf21a85a6dcf10db761e2bb4a77ed24e","messages_hash":"0ba84d839fea22ea4634d16617df4437859805e6ef3fcecbf9319648152c959d","txlist_hash":"bb05836e569bc4c85141c5b4d2832efa5a83ad519260e96d92f6ee16fe4a0c80"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1019,NULL,310424,'insert','blocks','{"block_hash":"73f4be91e41a2ccd1c4d836a5cea28aea906ac9ede7773d9cd51dff5936f1ba7","block_index":310425,"block_time":310425000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1020,NULL,310425,'parse','blocks','{"block_index":310425,"ledger_hash":"29e595e9ac7717013cfc8d12255496192234abbddd8a66762a5eaff0c49f3750","messages_hash":"7f501e4f4dad5fc70bb3c56d1378bf4b292259188c56b5d5e53a3c5206c9700a","txlist_hash":"2cedf78c9d13e32fde5792907f2ac9f409fe701740533b94ceab6b8087f790b1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1021,NULL,310425,'insert','blocks','{"block_hash":"9d28065325bb70b8e272f6bee3bc2cd5ea4ea4d36e293075096e204cb53dc415","block_index":310426,"block_time":310426000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1022,NULL,310426,'parse','blocks','{"block_index":310426,"ledger_hash":"9b9509ce7b7bf380f4d030604810a755c71fabe27152be990997a6a9db37ff15","messages_hash":"25fa3569e346dfc876bba62b9d23783c146a543cbdeec50fc6e18332122fb2b7","txlist_hash":"c037094c1947835fceefa8a25a81724d9c88191d5f5199d3a59339bd44407289"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1023,NULL,310426,'insert','blocks','{"block_hash":"d08e8bc7035bbf08ec91bf42839eccb3d7e489d68f85a0be426f95709a976a2a","block_index":310427,"block_time":310427000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1024,NULL,310427,'parse','blocks','{"block_index":310427,"ledger_hash":"f1b834e2a380f1b9a78c592acbe78ec809220c620e15f296ab8d7ecea6cd392e","messages_hash":"a139b9e0838217dba78ff8d8503ed732bc0a94ca9a5aa75ab8938c99edee297a","txlist_hash":"81d439d9d368279e97c8739243efb01c7027be218d831d93127364fa247aed95"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1025,NULL,310427,'insert','blocks','{"block_hash":"2eef4e1784ee12bcb13628f2c0dc7c008db6aaf55930d5de09513425f55658a2","block_index":310428,"block_time":310428000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1026,NULL,310428,'parse','blocks','{"block_index":310428,"ledger_hash":"9e963a17fbc4a5c20d48094f1459959033520f92d7a8bc044b71bbffb8dd173d","messages_hash":"3162a5d50ea03633b8b2d947cc3c52a5df9593e245376bf80756f48e7c1fc2d7","txlist_hash":"002b7ac255f66476970512e50d7ca9cb5da695bea9763bf0379f8d8e6c77a71c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1027,NULL,310428,'insert','blocks','{"block_hash":"086bfbba799c6d66a39d90a810b8dd6753f2904a48e2c01590845adda214cf8d","block_index":310429,"block_time":310429000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1028,NULL,310429,'parse','blocks','{"block_index":310429,"ledger_hash":"ac8cfd965b9c53f32731a3e0fcdb6df5746d646b02c88b5201a674125e37eed5","messages_hash":"fcea4b97a5fe73cf70e2d0263371e1e00e099bf1cf6ec7db042b3bea048a265c","txlist_hash":"4b68376b50d77145ada0ebc72c3eb43b54b4743b538dbc9fa2c914515882dbb7"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1029,NULL,310429,'insert','blocks','{"block_hash":"870cf1829f84d1f29c231190205fe2e961738240fc16477c7de24da037763048","block_index":310430,"block_time":310430000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1030,NULL,310430,'parse','blocks','{"block_index":310430,"ledger_hash":"33654e32dfd41ff3a5744b57fd2483a08a2b4729c18ca54c3ac5d95a1bf0ef21","messages_hash":"1b3b759f56da231657bf1c579b3186abe1a28fba2c262a9e872f7ee83aaa4e26","txlist_hash":"3323c2d01e777caaca3eeaf6f2af8299cee1622589cbaf08f4d245356642d2f2"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1031,NULL,310430,'insert','blocks','{"block_hash":"20b72324e40ffc43a49569b560d6245c679e638b9d20404fc1e3386992d63648","block_index":310431,"block_time":310431000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1032,NULL,310431,'parse','blocks','{"block_index":310431,"ledger_hash":"ba8837c811ae87981cc37cb49438d958fa58dfc5a95824040f2fd088465406d1","messages_hash":"23d2c60e160ae68a16ab609dccdb9b78f1b7d3feeaee2c97c7dedceb13c02eee","txlist_hash":"67aadda0a565f4f5e2786b5007e56e2d10077e87e7d3acc216fe0803365b7b81"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1033,NULL,310431,'insert','blocks','{"block_hash":"c81811aca423aa2ccb3fd717b54a24a990611365c360667687dc723e9208ad93","block_index":310432,"block_time":310432000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1034,NULL,310432,'parse','blocks','{"block_index":310432,"ledger_hash":"7864019cb0cbbcd895154421183d6acb932b1d64441103b913d52469f656655f","messages_hash":"51e2478b9f02aba026af477be07173549dba6acf715620c3080db983d5818ae4","txlist_hash":"c12942ffa02a5f8eaddf3e8e55ad0ea03f29cebd9e822e00c504c162cddd0471"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1035,NULL,310432,'insert','blocks','{"block_hash":"997e4a145d638ad3dcdb2865f8b8fd95242cbc4a4359407791f421f129b1d725","block_index":310433,"block_time":310433000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1036,NULL,310433,'parse','blocks','{"block_index":310433,"ledger_hash":"a6da92ef0df7d092de09f2f8d2c99ff65ad74e2a0bd2ea25f8335614372f5279","messages_hash":"9d406a162538d5a0b083ddf1edbc2af4da4772e3dfafeb471757019b03f07860","txlist_hash":"f0eefd9f81db595b07fe719a41e67e54fdb987e177f05d37040237db3be2a8a5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1037,NULL,310433,'insert','blocks','{"block_hash":"61df9508e53a7fe477f063e0ff7e86fbb0aef80ff2ddedc556236a38f49ac4d8","block_index":310434,"block_time":310434000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1038,NULL,310434,'parse','blocks','{"block_index":310434,"ledger_hash":"e288db28ac6a42822f85fd042f65b57378bc6cc2f8616edfa88143d7b1c9ddcc","messages_hash":"216849b38a9a9bf850733296d6a14b539b2c2261354e26019a723dd7403ad006","txlist_hash":"173f8b7d2c581e9f088b3fb6e96ad2af597b172717d8f8732fd5857997f0f3d7"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1039,NULL,310434,'insert','blocks','{"block_hash":"f24cf5e1296952a47556ac80a455a2c45da5c0dc2b388b51d235a3f741793d5f","block_index":310435,"block_time":310435000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1040,NULL,310435,'parse','blocks','{"block_index":310435,"ledger_hash":"e87af314e8d7a5f2315ccc559d7c2255c008ba63aff017696201db69344d423f","messages_hash":"c974a643a40e5993fd5ecf85e7a627f6ed4c7d32da8d2bb27528e99f226d5efa","txlist_hash":"a4dd5a36f1aeee54e99bb23095b64707fc0b3fde5f64e33135429a100e4ea558"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1041,NULL,310435,'insert','blocks','{"block_hash":"a5e341ba92bdf9b3938691cd3aab87731eba5428bb61a804cecf9178c8da0c19","block_index":310436,"block_time":310436000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1042,NULL,310436,'parse','blocks','{"block_index":310436,"ledger_hash":"82327b93bd3ffcdf797bc2f6470b9c8c5101e54b924ec5f141a31356aa8865c7","messages_hash":"6c8edec3773ad66f3ef89d20d5190b2c19318ef48bf3752e7f482a7671b006c3","txlist_hash":"c6b0f05a847c30dd3f2d3f8cb7c26a84f1d005b4720a553f9dd8b717185d7f05"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1043,NULL,310436,'insert','blocks','{"block_hash":"9e18d0ffff2cb464c664cefc76e32d35752c9e639045542a73746f5ec2f3b002","block_index":310437,"block_time":310437000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1044,NULL,310437,'parse','blocks','{"block_index":310437,"ledger_hash":"70d86f9ef8df495474de06b94e1857693c73d9ca3528356b82553a52fdce0dda","messages_hash":"64193ef0680fb09096cf55f02405bf8e2a133b12bd8e1453330143d72700f164","txlist_hash":"809d60564fefff56688616b7fb96378d4eb425e5c8de36b34f0c9070935dac26"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1045,NULL,310437,'insert','blocks','{"block_hash":"36be4b3470275ff5e23ed4be8f380d6e034eb827ebe9143218d6e4689ea5a9fc","block_index":310438,"block_time":310438000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1046,NULL,310438,'parse','blocks','{"block_index":310438,"ledger_hash":"44b90478e32373205462f0fb212da636b31db6dfb99a2b56923beb97a3a64722","messages_hash":"65151ecc33ae384e013535fc1f6cda04494809cdedb5a2cdb891f0f38035bd3f","txlist_hash":"2cf7695a3cea08358af8bd9378b1d6ad6c7223cbac01589042ace6c3cb312196"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1047,NULL,310438,'insert','blocks','{"block_hash":"4f2449fce22be0edb4d2aefac6f35ce5a47b871623d07c2a8c166363112b2877","block_index":310439,"block_time":310439000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1048,NULL,310439,'parse','blocks','{"block_index":310439,"ledger_hash":"66b791b9deb7d2fc8b075f41d712e300ffa9c46ca9d6f4e7cec6429ca6a65163","messages_hash":"01d3ab7b218d6bfef3c5b6b6db851297e951cebfdf60b8d4835a44a665e163ca","txlist_hash":"41f11f77910c12535fa183e819b36a0dda32eaafe0ae8016e2ce7c23d5c1d67d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1049,NULL,310439,'insert','blocks','{"block_hash":"89d6bd4cdac1cae08c704490406c41fbc5e1efa6c2d7f161e9175149175ef12a","block_index":310440,"block_time":310440000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1050,NULL,310440,'parse','blocks','{"block_index":310440,"ledger_hash":"5baa10e1659182ba4511f87f08deda38d5de3501c63efd376604cc199140d27c","messages_hash":"d8b0a242ba1e6003bbdaf0bf2369b95d39c736ab52e66be2a9113941655e698a","txlist_hash":"c6762d7334806b6b62c3cee84f65346d1121493d3bc3f890af174c4abe4710ae"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1051,NULL,310440,'insert','blocks','{"block_hash":"2df1dc53d6481a1ce3a6fee51ad4adcce95f702606fee7c43feda4965cf9ee15","block_index":310441,"block_time":310441000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1052,NULL,310441,'parse','blocks','{"block_index":310441,"ledger_hash":"2d490229fead1b15a8350da7bcc83c483dae06e4a2f574c6e8fde248acd449d6","messages_hash":"18ff66422cca18b8b49392bae2d93ece152f47035c44ef71dda8cbd5a2cd7f96","txlist_hash":"f9fcb16a928c44b86ab2af7407a2ca269455b144694a80927b9213bf8e7ac710"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1053,NULL,310441,'insert','blocks','{"block_hash":"50844c48722edb7681c5d0095c524113415106691e71db34acc44dbc6462bfec","block_index":310442,"block_time":310442000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1054,NULL,310442,'parse','blocks','{"block_index":310442,"ledger_hash":"a3728bacfbdd289b7af24248b9bdacd5643bd5412bb993f5380278631eabb9e9","messages_hash":"d7bba011aeaf59c39a79cc90a4d40f11c86d3a44c12b722cdab3f2d32b96b430","txlist_hash":"5d2600af95413d101a9e3d98b2d9f5ea02cf1cf6a28bf7e96870e167638a7be9"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1055,NULL,310442,'insert','blocks','{"block_hash":"edc940455632270b7deda409a3489b19b147be89c4d8f434c284e326b749c79a","block_index":310443,"block_time":310443000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1056,NULL,310443,'parse','blocks','{"block_index":310443,"ledger_hash":"d829da764f6397b22a6b97ef396b363ef2cf071990df2dc9c0d03806db6a46b5","messages_hash":"fc88f701c65c71e2d90d31fbdc10378ea284a88543543af540b49d970da6e1b3","txlist_hash":"4c595c9a60ccc98d2f6cd75c92c28333174c618337457f9c5ccf362252732081"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1057,NULL,310443,'insert','blocks','{"block_hash":"68c9efab28e78e0ef8d316239612f918408ce66be09e8c03428049a6ee3d32e4","block_index":310444,"block_time":310444000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1058,NULL,310444,'parse','blocks','{"block_index":310444,"ledger_hash":"ef53249bf0f13e1f2073b815c8d8da3ab744b6d277b29ddbc0bd68bd006af34b","messages_hash":"0e2148899b497e6e1edd0f0401e2b364cd863d67a16b2d2ba01575249fa44e61","txlist_hash":"5ec6d64106ac1c65cd1dd2129c786aca3cf426c7a1b5f6a966b6684b37755293"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1059,NULL,310444,'insert','blocks','{"block_hash":"22a2e3896f1c56aefb2d27032a234ea38d93edf2b6331e72e7b4e3952f0234ef","block_index":310445,"block_time":310445000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1060,NULL,310445,'parse','blocks','{"block_index":310445,"ledger_hash":"7e731cda90932b2b4844abdbc3ff60683173104e6c72ed81c65d9a17fd4872dc","messages_hash":"a4956f7cb1d7911fe8b00ccee3a92b01db13f0bd2b28ebc66db307c0307c8632","txlist_hash":"6da5abcb8ff2a77c33c7c43061754d9fe8e587157a98e194157faf534d2ee9c6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1061,NULL,310445,'insert','blocks','{"block_hash":"e8b0856eff3efce5f5114d6378a4e5c9e69e972825bc55cc00c26954cd1c8837","block_index":310446,"block_time":310446000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1062,NULL,310446,'parse','blocks','{"block_index":310446,"ledger_hash":"db55bac8025e95a567ba984f36dcb09357aa3e9b8706bb594e669b628d4e7204","messages_hash":"cb0858f2c2d1df41d5fce1f8f312d4f31646e876d82754898046d94166f86988","txlist_hash":"e8efb64e8f5f867f1c0db99afa9f9a3e3a06d0e1d55e16e9639ca36c3bda5cd4"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1063,NULL,310446,'insert','blocks','{"block_hash":"3f4bc894c0bc04ee24ed1e34849af9f719f55df50c8bc36dc059ec5fa0e1c8a8","block_index":310447,"block_time":310447000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1064,NULL,310447,'parse','blocks','{"block_index":310447,"ledger_hash":"5cc4fa447cc291ffcce7be3c4f8fc70041bf8af5c2dd591136d4a449095d2570","messages_hash":"8e43ba092a6ba21408ff40f8248c07d7eb27a7deac290ea2d4161bf16d1e21c4","txlist_hash":"026eb6a7315302879ca62afb071da788deb5759eb3de89cf68fec00ec638d9f0"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1065,NULL,310447,'insert','blocks','{"block_hash":"6a6c7c07ba5b579abd81a7e888bd36fc0e02a2bcfb69dbfa061b1b64bfa1bd10","block_index":310448,"block_time":310448000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1066,NULL,310448,'parse','blocks','{"block_index":310448,"ledger_hash":"ce49854f4493c163bc891888f920fbc6dd8855c30870beb757df69b33de52633","messages_hash":"0423502422f1719bb57b16c22d7155922a4e57dd46c10c67443ce901fabace72","txlist_hash":"e47cc99299a82c9be619633effff5b9cace113215d7f71aa7d2327e69d3ca3bb"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1067,NULL,310448,'insert','blocks','{"block_hash":"9e256a436ff8dae9ff77ed4cac4c3bfbbf026681548265a1b62c771d9d8e0779","block_index":310449,"block_time":310449000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1068,NULL,310449,'parse','blocks','{"block_index":310449,"ledger_hash":"84557595cf2067a95924119b8ed5fea114acd9ca1b0df4dbe4ae5181a739b5d1","messages_hash":"f4202e68bbe225aaf543a2595773a928240b7033f7f920803d1a2281c5e927d8","txlist_hash":"4e3048f5eeba69570f9ffd86a3573e85bdfb46a92acf60d55c04d41f49f7f870"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1069,NULL,310449,'insert','blocks','{"block_hash":"2d9b2ccc3ad3a32910295d7f7f0d0e671b074494adc373fc49aa874d575e36a3","block_index":310450,"block_time":310450000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1070,NULL,310450,'parse','blocks','{"block_index":310450,"ledger_hash":"0e3b252b73fb652f904780da9fc59d1081d712337a9b15cf1a56ea72fbe96c73","messages_hash":"fd5af776d6a38d7d8789a15aa9d76e6d304a94a4d5ffdd2943345da446b6ea80","txlist_hash":"c98b9428cf94077169705f3961816f87293eb89bc840167b1ed8ffb074aef48e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1071,NULL,310450,'insert','blocks','{"block_hash":"55731a82b9b28b1aa82445a9e351c9df3a58420f1c2f6b1c9db1874483277296","block_index":310451,"block_time":310451000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1072,NULL,310451,'parse','blocks','{"block_index":310451,"ledger_hash":"790eccd04e24e5f10f843d63bbdc1538cf1aabb0e8e6c862104be0ef845f603f","messages_hash":"7d18be6c377428f660ba384eec7a473fa7e44627922722cd5b3721c81452432d","txlist_hash":"3fda9e8b7ebc417311c9f14e61c9dca2e490702c1c796eeb1df156f174d52cb5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1073,NULL,310451,'insert','blocks','{"block_hash":"016abbaa1163348d8b6bc497cc487880d469f9300374a72ecb793a03d64572aa","block_index":310452,"block_time":310452000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1074,NULL,310452,'parse','blocks','{"block_index":310452,"ledger_hash":"30962129b060b63050fe8f249592587d74cdabc4ebb5680230a280da880c8586","messages_hash":"c5922e3df1d54ca1fceb420ba9ed3538aa432da592b8d11ed98dd577bbfd7973","txlist_hash":"a1bf92fe5ae4df49a6059263dfd3a9ed105ec24ae02cb9127c0408f7330d962c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1075,NULL,310452,'insert','blocks','{"block_hash":"610be2f49623d3fe8c86eacf3620347ed1dc53194bf01e77393b83541ba5d776","block_index":310453,"block_time":310453000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1076,NULL,310453,'parse','blocks','{"block_index":310453,"ledger_hash":"56f4aa1086d8985a00cc295cf9618d976e69ba426b0c3d103bea6b47b58e4355","messages_hash":"8e306a9c943a812c6f52865d39d2964eb365fae7b17b0329b4c251f8dacaaea1","txlist_hash":"a81de51b7b56cc68f599e592be22e11c2f0b51ca27c027f13b58f05b2229a8e1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1077,NULL,310453,'insert','blocks','{"block_hash":"baea6ad71f16d05b37bb30ca881c73bc48fd931f4bf3ac908a28d7681e976ee9","block_index":310454,"block_time":310454000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1078,NULL,310454,'parse','blocks','{"block_index":310454,"ledger_hash":"38d14a206003b812cbaf5f200235dbe12aa6a674e5f3379cb186a781cb5a5654","messages_hash":"f28d86ee84fa30a79a74e3205d45c40c3525c6ea58f9201dc6b5c79fdb526dd3","txlist_hash":"022e8475ba7e68c75b4a00387ae431b7bdaa4d125dcd1b19d08e9c431d3e6057"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1079,NULL,310454,'insert','blocks','{"block_hash":"31a375541362b0037245816d50628b0428a28255ff6eddd3dd92ef0262a0a744","block_index":310455,"block_time":310455000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1080,NULL,310455,'parse','blocks','{"block_index":310455,"ledger_hash":"b2ff303a67c05bc12fcdfdb774ea4ddc690434c3371428b3416d38105f265f28","messages_hash":"70550cc53729dedacfd7599305a6ba24dbd67d5349e610da1b3aeedbbdb670e2","txlist_hash":"91a1dc2fe8dd56e137b210136966950c79b4badcdf787b4b9fafa7985847192a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1081,NULL,310455,'insert','blocks','{"block_hash":"5fee45c5019669a46a049142c0c4b6cf382e06127211e822f5f6f7320b6b50fa","block_index":310456,"block_time":310456000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1082,NULL,310456,'parse','blocks','{"block_index":310456,"ledger_hash":"6cc16b442fd7758ed7bae9f50367fa60debdb5d81bffc5abccda044573aeaf15","messages_hash":"48b0c3451909c475fc3273ac84abf136b6b81e2cd6e7022018711a1a8a46abf7","txlist_hash":"5125d7f8718a5a26aed1e1db2ce80e8d2eb4d96bbc91277bace52f571b7f8c26"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1083,NULL,310456,'insert','blocks','{"block_hash":"9ce5a2673739be824552754ce60fd5098cf954729bb18be1078395f0c437cce9","block_index":310457,"block_time":310457000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1084,NULL,310457,'parse','blocks','{"block_index":310457,"ledger_hash":"8fa0401d245b1b1e8b40760a54f331564d8597e242462ec412878e36a9b06800","messages_hash":"9cb1f06768f23821c73219929b52fb339a5aac8a1f60e905bbe974759b296606","txlist_hash":"061dc1962f44d4da9de8ad6bff4d96650058f5d444951e9c808b901db8717c81"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1085,NULL,310457,'insert','blocks','{"block_hash":"deca40ba154ebc8c6268668b69a447e35ad292db4504d196e8a91abdc5312aac","block_index":310458,"block_time":310458000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1086,NULL,310458,'parse','blocks','{"block_index":310458,"ledger_hash":"520f92700e31b8a35260a280ae11bf8668b0e09d34795a9d88678f2977e19f7c","messages_hash":"da021b6ace7610144fdb7bbee83fdf5f617508c18b3b28d111e9abb6719d510d","txlist_hash":"b0208287d25e4ca6a1856236b4d4c7a3608533f0a47a9c673806d5d3baeb2297"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1087,NULL,310458,'insert','blocks','{"block_hash":"839c15fa5eea10c91851e160a73a6a8ee273a31ab5385fe5bd71920cbc08b565","block_index":310459,"block_time":310459000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1088,NULL,310459,'parse','blocks','{"block_index":310459,"ledger_hash":"d7f728b78228a914b8767a6caeaf2267e9dbd50490a27f6c23bd96060eab8ee0","messages_hash":"464f88651f885a9c3604bd83352de75252aa4a53b40a94e55cf04cba3860b315","txlist_hash":"21a24d787b30434a230cae77e281636855ff40a8fb4aaaad35eb034835f63e97"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1089,NULL,310459,'insert','blocks','{"block_hash":"9b5f351a5c85aaaa737b6a55f20ebf04cafdf36013cdee73c4aaac376ad4562b","block_index":310460,"block_time":310460000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1090,NULL,310460,'parse','blocks','{"block_index":310460,"ledger_hash":"33c2b4c6d22888448a2458ff2ce6a1cfae5e858acae2a57e4cc0232980f8fa4a","messages_hash":"626b13a5e856517c5e8246032184d39a3b70a8d63b9abd7a56d824ec3573e3cb","txlist_hash":"2ae25ed250bd603684d0affe8b14af5a1b8d1554beaed08aa8f723cc3c66cf8d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1091,NULL,310460,'insert','blocks','{"block_hash":"8131c823f11c22066362517f8c80d93bfc4c3b0a12890bdd51a0e5a043d26b7b","block_index":310461,"block_time":310461000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1092,NULL,310461,'parse','blocks','{"block_index":310461,"ledger_hash":"22426912d3317922912326da552af284677c9b76b6416b6c056668f27ae4f19f","messages_hash":"34e034a1eace1f9cc331b124f20bf9b02b06e9920c860d5258bc846afa59be6d","txlist_hash":"13b7774cf2a5a0f3d65031cd5f9ee498eaeee5c1e0e8ecbd346e0427d847a5c0"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1093,NULL,310461,'insert','blocks','{"block_hash":"16f8fad8c21560b9d7f88c3b22293192c24f5264c964d2de303a0c742c27d146","block_index":310462,"block_time":310462000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1094,NULL,310462,'parse','blocks','{"block_index":310462,"ledger_hash":"74225b62e696aaeafbd4d6db40b41081c7493d9cc44984729d8619ff9450ce32","messages_hash":"c842b12fd725cba9dda8fba23d55154a026780bc6af2b0a8193126e35560c1b3","txlist_hash":"4f23d4da0bbe4b8bb7e00b6b746b4180356013c63f7a6f9b3eee479380b04e4f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1095,NULL,310462,'insert','blocks','{"block_hash":"bf919937d8d1b5d5f421b9f59e5893ecb9e77861c6ab6ffe6d2722f52483bd94","block_index":310463,"block_time":310463000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1096,NULL,310463,'parse','blocks','{"block_index":310463,"ledger_hash":"b970979bfe0d44ae2f21f7d98bdcc4ae37287b93cad9fa51f32a62337ceba0c1","messages_hash":"f79b69008dcbe3c3362ee21d19da76108039cb558761d4dcf9e1cdb946bcee10","txlist_hash":"7b9a9095733a9d870b33aef4bb15767c32b012c27b52de8731358178b87bfb50"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1097,NULL,310463,'insert','blocks','{"block_hash":"91f08dec994751a6057753945249e9c11964b98b654704e585d9239462bc6f60","block_index":310464,"block_time":310464000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1098,NULL,310464,'parse','blocks','{"block_index":310464,"ledger_hash":"00007a158b003fcca20c9fcaa8d73a556f0206bc9a7ab3e5c566ea1bda8648cb","messages_hash":"ad018c29e0f488918c6a134fe27ae637509d72341a28725cf82d74bae0b2fe75","txlist_hash":"28d7eceb69efcc6736dd64c65ed218dae2e8d0e9d4d7284b0572a5d1065a9d52"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1099,NULL,310464,'insert','blocks','{"block_hash":"5686aaff2718a688b9a69411e237912869699f756c3eb7bf7c3cf2b9e3756b3d","block_index":310465,"block_time":310465000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1100,NULL,310465,'parse','blocks','{"block_index":310465,"ledger_hash":"09c407870b056db90148a9e4cb8ada003898ff28c584bec6a5be90514758a851","messages_hash":"1de15ad33c8b345fe1ad52110c252cdbda801e4fa7fb749dfba0dac2dd773497","txlist_hash":"7a4f4ed76efc69ddb5fc13abe258656d6a5e4a845203b5f3f9133716093d7f6d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1101,NULL,310465,'insert','blocks','{"block_hash":"8a68637850c014116da671bb544fb5deddda7682223055a58bdcf7b2e79501fc","block_index":310466,"block_time":310466000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1102,NULL,310466,'parse','blocks','{"block_index":310466,"ledger_hash":"23bcfdbb44d8fc2ae6a86ea073ab080158014f04516b256a70d846399e7383cd","messages_hash":"39f1eb92ac050aa56760fcdcc747dccdcadc1bc359632b6dd57cecb59d485378","txlist_hash":"57124a566cf1e863b27fa19e3c982fe4a5115119ffb745624697380ad8d5f900"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1103,NULL,310466,'insert','blocks','{"block_hash":"d455a803e714bb6bd9e582edc34e624e7e3d80ee6c7b42f7207d763fff5c2bd3","block_index":310467,"block_time":310467000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1104,NULL,310467,'parse','blocks','{"block_index":310467,"ledger_hash":"a43abeddb61ad99d57f208cb0c6cc3e0b05a200009e6d90641a2bc7aac707adf","messages_hash":"a2889082db39a64176b16ba1a33377440b0f45dfb7d30b36265477d98bd5a95b","txlist_hash":"fb3b1ef99d2f323e1bdd6998b78b6044c8c7328fafad6b9fea1de7bd0244a265"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1105,NULL,310467,'insert','blocks','{"block_hash":"d84dfd2fcf6d8005aeeac01e03b287af788c81955612375510e37a4ab5766891","block_index":310468,"block_time":310468000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1106,NULL,310468,'parse','blocks','{"block_index":310468,"ledger_hash":"fc909facd6ba38fa0908fd49a6e2f25bd8284de5265ef761497b8a2d595344b3","messages_hash":"91296f5df4dff2e619fbe8e9d6d94a1e3b196062fc936ed6f07f72b95d912b3e","txlist_hash":"5c84a33365a6954fe639a1c2b1df030b8728d5d331df5ea1ef4a60f976cfa5d2"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1107,NULL,310468,'insert','blocks','{"block_hash":"2fbbf2724f537d539b675acb6a479e530c7aac5f93b4045f4356ea4b0f8a8755","block_index":310469,"block_time":310469000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1108,NULL,310469,'parse','blocks','{"block_index":310469,"ledger_hash":"09f0d1c9bde8cdd63544fbb5eab46c2954654d32f3736f9975cf860588aa65cf","messages_hash":"8d17e3a799c3ca2be1da35c1c75644f696843093177564b37431e1e40030c925","txlist_hash":"38083f12891b03e2f089b02f7cb6b7fc7b6cb7091613e1d299051717eef6748b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1109,NULL,310469,'insert','blocks','{"block_hash":"ebb7c8e3fbe0b123a456d753b85b8c123ca3b315da14a00379ebd34784b28921","block_index":310470,"block_time":310470000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1110,NULL,310470,'parse','blocks','{"block_index":310470,"ledger_hash":"41832b12459e778621b8f576e597b9f639390338605b30e5be28423b016b199a","messages_hash":"758117c9999addb364c604cc287e6dc9e51cbe5e326f2690d70ce87a81407597","txlist_hash":"bc0a8227d8698655c56004a73150eb92144469fd22d4ce8bf0f48c27084e99ae"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1111,NULL,310470,'insert','blocks','{"block_hash":"fc6f8162c55ecffeaabb09f70f071fd0cb7a9ef1bccaafaf27fe9a936defb739","block_index":310471,"block_time":310471000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1112,NULL,310471,'parse','blocks','{"block_index":310471,"ledger_hash":"bf701017153742cb597353349c90ec66f790f222dd98d617d98a0117f1de3274","messages_hash":"b6b19c84723ff33624fbd5154bbf60083c48b83caeea4ceb6667ecce4bd710bb","txlist_hash":"d912707e01e39b078d3cee49df85af32019d7367d199543259bc98864c3ddae5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1113,NULL,310471,'insert','blocks','{"block_hash":"57ee5dec5e95b3d9c65a21c407294a32ed538658a6910b16124f18020f16bdf7","block_index":310472,"block_time":310472000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1114,NULL,310472,'parse','blocks','{"block_index":310472,"ledger_hash":"2a162bbd5a20f89a39156995658fd0c4715881bc130922d0edf95b60ece60b9c","messages_hash":"2f940bbc941844d4dd73837ff7f6c96ce80efcf385e2d44a1ce5f68d545da057","txlist_hash":"c9f21a9ff022fd95423d3eb56017f4f6f8ad56a9fde974c5d08b37f01a0d0f13"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1115,NULL,310472,'insert','blocks','{"block_hash":"33994c8f6d06134f886b47e14cb4b5af8fc0fd66e6bd60b3a71986622483e095","block_index":310473,"block_time":310473000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1116,NULL,310473,'parse','blocks','{"block_index":310473,"ledger_hash":"1ce10996ec9e37d8ddc204f038542c6781da88d2d45bae1952a88ab993b81e88","messages_hash":"6559100889b99c05398948cc0d47d0cde899cd6ac3006ac5fc344a0847a87940","txlist_hash":"ad410d51bae82f8322d110d7b2270a1ff74c0ca64dfc31c5d293cfee7dbbb459"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1117,NULL,310473,'insert','blocks','{"block_hash":"312ee99e9526e9c240d76e3c3d1fe4c0a21f58156a15f2789605b3e7f7794a09","block_index":310474,"block_time":310474000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1118,NULL,310474,'parse','blocks','{"block_index":310474,"ledger_hash":"5ae424c24ca30aad5aca8298a13ae9371f55b15bc789c7731d833c6e7c7cb04e","messages_hash":"9666d2dbbeea540ac615ae637bb58d5e2199bf937a396750d2a877fb8f55c75d","txlist_hash":"b091eceeb4b263d9fa55bd5595cd298ff8b335e03007d62339033cd884137d48"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1119,NULL,310474,'insert','blocks','{"block_hash":"bb9289bcd79075962117aef1161b333dbc403efebd593d93fc315146a2f040eb","block_index":310475,"block_time":310475000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1120,NULL,310475,'parse','blocks','{"block_index":310475,"ledger_hash":"b9b257efe76a36c340629ceb265822dd10449a08eadc69667a8ea05af5c052f8","messages_hash":"a4d05b2dd9af6d5ba804421e6043f4ccf727eec75ee10a002baafaed45bc772d","txlist_hash":"345c94c7b237efaf2b4e92802125b7d783e456e36ab6868d1f4126698361ba89"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1121,NULL,310475,'insert','blocks','{"block_hash":"3712e1ebd195749e0dc92f32f7f451dd76f499bf16d709462309ce358a9370d0","block_index":310476,"block_time":310476000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1122,NULL,310476,'parse','blocks','{"block_index":310476,"ledger_hash":"070c06b36f3a77c04fb4bcc3ab1045e95f198f3f970846e59c35db0d03cdaf2c","messages_hash":"1e684aaf8da9104bf057a078360bf99b878290991bb14c8747d8be386a536095","txlist_hash":"014e01dabe6dd8db8e0477f9b12d4f4e3589e41223ec8c9ca5035b942524ca41"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1123,NULL,310476,'insert','blocks','{"block_hash":"7381973c554ac2bbdc849e8ea8c4a0ecbb46e7967d322446d0d83c3f9deab918","block_index":310477,"block_time":310477000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1124,NULL,310477,'parse','blocks','{"block_index":310477,"ledger_hash":"4954596dd44d112fd0407c215be3c9534a348d6f708ae4a1e66527d1ac2830b1","messages_hash":"8cb254cdf81022602324076922901e7d7c4675bebc066252bd20a7e83c23b76c","txlist_hash":"1351438c8ea21d9619f81e51cfd188dbefd6a4816fe3c30b68210ac160890e9b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1125,NULL,310477,'insert','blocks','{"block_hash":"c09ee871af7f2a611d43e6130aed171e301c23c5d1a29d183d40bf15898b4fa0","block_index":310478,"block_time":310478000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1126,NULL,310478,'parse','blocks','{"block_index":310478,"ledger_hash":"d9cac2e29863569bc96aaf022437906a534968a17bf965c54bf59931cd92e590","messages_hash":"fceb7400129cbad4ae34656a15a35d8e625e515fdaf78a9f644c43f1da3f836b","txlist_hash":"cbec4d277b86a587fd0463340a8990600046f6f166f6fde0b6ec1ee817ab12bb"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1127,NULL,310478,'insert','blocks','{"block_hash":"f3d691ce35f62df56d142160b6e2cdcba19d4995c01f802da6ce30bfe8d30030","block_index":310479,"block_time":310479000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1128,NULL,310479,'parse','blocks','{"block_index":310479,"ledger_hash":"2e48a89a55b6f368745e1c022683e93c20bdd920011518f18fd936f2190ac5e0","messages_hash":"b878bf2f4f70e1c15eb60535887db7ba9e9414ec524d0f426bbde5a459a56bb9","txlist_hash":"81d4ab55e022000a1bb3fbe758e497425c5196951c3e7896d3c641d54b4f2db6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1129,NULL,310479,'insert','blocks','{"block_hash":"2694e89a62b3abd03a38dfd318c05eb5871f1be00a6e1bf06826fd54d142e681","block_index":310480,"block_time":310480000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1130,NULL,310480,'parse','blocks','{"block_index":310480,"ledger_hash":"aa54124d86e74bebd14ea481ac2a5a5186236ffe214747f1af11ac370565525c","messages_hash":"855cd018f577fe76942fe9837dc27d3be5e71bf378b611f25cdd6381b04ed703","txlist_hash":"8d7e0f8a6f052692155e23eb612c02468830485938e7cb77a91e0c2061611385"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1131,NULL,310480,'insert','blocks','{"block_hash":"db37d8f98630ebc61767736ae2c523e4e930095bf54259c01de4d36fd60b6f4a","block_index":310481,"block_time":310481000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1132,NULL,310481,'insert','transactions','{"block_hash":"db37d8f98630ebc61767736ae2c523e4e930095bf54259c01de4d36fd60b6f4a","block_index":310481,"block_time":310481000,"btc_amount":0,"data":"0000000200000000000000010000000005f5e1006f8d6ae8a3b381663118b4e1eff4cfc7d0954dd6ec68656c6c6f","destination":"","fee":6375,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"b00bdf03402d81a2cbdbeac4b0df90cff5ab6bf9688f653383d49fe42b8422a5","tx_index":482}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(1133,NULL,310481,'insert','debits','{"action":"send","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310481,"event":"b00bdf03402d81a2cbdbeac4b0df90cff5ab6bf9688f653383d49fe42b8422a5","quantity":100000000,"tx_index":482}',0,'DEBIT');
+INSERT INTO messages VALUES(1134,NULL,310481,'insert','credits','{"address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"XCP","block_index":310481,"calling_function":"send","event":"b00bdf03402d81a2cbdbeac4b0df90cff5ab6bf9688f653383d49fe42b8422a5","quantity":100000000,"tx_index":482}',0,'CREDIT');
+INSERT INTO messages VALUES(1135,NULL,310481,'insert','sends','{"asset":"XCP","block_index":310481,"destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","memo":"68656c6c6f","quantity":100000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"b00bdf03402d81a2cbdbeac4b0df90cff5ab6bf9688f653383d49fe42b8422a5","tx_index":482}',0,'ENHANCED_SEND');
+INSERT INTO messages VALUES(1136,NULL,310481,'parse','transactions','{"supported":true,"tx_hash":"b00bdf03402d81a2cbdbeac4b0df90cff5ab6bf9688f653383d49fe42b8422a5","tx_index":482}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(1137,NULL,310481,'parse','blocks','{"block_index":310481,"ledger_hash":"fbbe1266bb773e5a3f5b48e82566ff75bc74bfea9424f81f670952565db15c59","messages_hash":"7b058d359a23326a73d98644d5cb0312360ee69f98c85814b2d574408f8d442d","txlist_hash":"8bc755d288d8d6525d9161e5d5072631a72e46d2373de37c7851aa10f3479ed5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1138,NULL,310481,'insert','blocks','{"block_hash":"2e27db87dfb6439c006637734e876cc662d1ca74c717756f90f0e535df0787d6","block_index":310482,"block_time":310482000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1139,NULL,310482,'insert','transactions','{"block_hash":"2e27db87dfb6439c006637734e876cc662d1ca74c717756f90f0e535df0787d6","block_index":310482,"block_time":310482000,"btc_amount":0,"data":"0000000200000000000000010000000005f5e1006f4838d8b3588c4c7ba7c1d06f866e9b3739c63037fade0001","destination":"","fee":6350,"source":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","supported":true,"tx_hash":"c8716524f33646b9af94d6f5e52494ff3b34466497094b1db2ab920e4f79bc34","tx_index":483}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(1140,NULL,310482,'insert','debits','{"action":"send","address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"XCP","block_index":310482,"event":"c8716524f33646b9af94d6f5e52494ff3b34466497094b1db2ab920e4f79bc34","quantity":100000000,"tx_index":483}',0,'DEBIT');
+INSERT INTO messages VALUES(1141,NULL,310482,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310482,"calling_function":"send","event":"c8716524f33646b9af94d6f5e52494ff3b34466497094b1db2ab920e4f79bc34","quantity":100000000,"tx_index":483}',0,'CREDIT');
+INSERT INTO messages VALUES(1142,NULL,310482,'insert','sends','{"asset":"XCP","block_index":310482,"destination":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","memo":"fade0001","quantity":100000000,"source":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","status":"valid","tx_hash":"c8716524f33646b9af94d6f5e52494ff3b34466497094b1db2ab920e4f79bc34","tx_index":483}',0,'ENHANCED_SEND');
+INSERT INTO messages VALUES(1143,NULL,310482,'parse','transactions','{"supported":true,"tx_hash":"c8716524f33646b9af94d6f5e52494ff3b34466497094b1db2ab920e4f79bc34","tx_index":483}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(1144,NULL,310482,'parse','blocks','{"block_index":310482,"ledger_hash":"bd28a97e90054319c4c301c3e99d68aaa5e1bf5a145a8f2c4529040bb8137209","messages_hash":"222ce836127c79d43fc5847a1cc427f7218fe84d23c2454ae1fd35585c9234dc","txlist_hash":"838486910c9c7722fb3afbac7b0514cdd94126486f6671697423b34164b9906f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1145,NULL,310482,'insert','blocks','{"block_hash":"013bac61f8e33c8d8d0f60f5e6a4ec3de9b16696703dea9802f64a258601c460","block_index":310483,"block_time":310483000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1146,NULL,310483,'parse','blocks','{"block_index":310483,"ledger_hash":"fbbeacec99c9ed99a7fc37cdd5673fe8bdce08eba7fcb25b696e262af29ca5d8","messages_hash":"14e0c00fe389f298230aabba0e084ff09875e49dba8b5259fcb99a3604081345","txlist_hash":"2be6ebe515877a76a7b83b1929ca2ef77be1df3aa3d6766c0c47450898ad7adf"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1147,NULL,310483,'insert','blocks','{"block_hash":"7cac2b3630c31b592fa0497792bed58d3c41120c009471c348b16b5578b3aa2b","block_index":310484,"block_time":310484000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1148,NULL,310484,'parse','blocks','{"block_index":310484,"ledger_hash":"310bc7c61c1325ee3f97e888658fd74e1fe4adccef4924abb6978150fe6f3dad","messages_hash":"00e1362b924985f5761ae514112cc30c143a610d15e936fd909a52e8735eaaa1","txlist_hash":"ec800faf2b61e7b1c2c85157d09b058f59defc14ffbe64d82dffea2a0368ade2"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1149,NULL,310484,'insert','blocks','{"block_hash":"eab5febc9668cd438178496417b22da5f77ceaed5bb6e01fc0f04bef1f5b4478","block_index":310485,"block_time":310485000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1150,NULL,310485,'parse','blocks','{"block_index":310485,"ledger_hash":"b7f66db9ea5838b65286422d0cac262f6b81bbd5a7397adf7b8d85b21354dbcd","messages_hash":"f424a423cf7f105c5f1000cbbc4552b83589f70e959c2a062eca313f5713271d","txlist_hash":"c2c0301119eb8f6e5ee8f72a4f93366a7c2b9f327f087a5aabff7d73892ca74f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1151,NULL,310485,'insert','blocks','{"block_hash":"d4fbe610cc60987f2d1d35c7d8ad3ce32156ee5fe36ef8cc4f08b46836388862","block_index":310486,"block_time":310486000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1152,NULL,310486,'insert','transactions','{"block_hash":"d4fbe610cc60987f2d1d35c7d8ad3ce32156ee5fe36ef8cc4f08b46836388862","block_index":310486,"block_time":310486000,"btc_amount":0,"data":"0000001e52bb33003ff0000000000000004c4b4009556e69742054657374","destination":"","fee":6800,"source":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","supported":true,"tx_hash":"3b95e07a2194174ac020de27e8b2b6ee24d5fc120f118df516ba28495657cf14","tx_index":487}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(1153,NULL,310486,'insert','broadcasts','{"block_index":310486,"fee_fraction_int":5000000,"locked":false,"source":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","status":"valid","text":"Unit Test","timestamp":1388000000,"tx_hash":"3b95e07a2194174ac020de27e8b2b6ee24d5fc120f118df516ba28495657cf14","tx_index":487,"value":1.0}',0,'BROADCAST');
+INSERT INTO messages VALUES(1154,NULL,310486,'parse','transactions','{"supported":true,"tx_hash":"3b95e07a2194174ac020de27e8b2b6ee24d5fc120f118df516ba28495657cf14","tx_index":487}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(1155,NULL,310486,'parse','blocks','{"block_index":310486,"ledger_hash":"0f829769e4da773089d7b05047a499db5f6d1b17795d4fba912882caee9813e0","messages_hash":"3c08e19ebcb07664b7679a724ed18c73d7c8c7698a56f85f2fec5e7eb5a3ebd8","txlist_hash":"ea66c7d9251a0eb884fef48de05cb58bbcf3a9e08319f01c96f180aeb0de9bab"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1156,NULL,310486,'insert','blocks','{"block_hash":"32aa1b132d0643350bbb62dbd5f38ae0c270d8f491a2012c83b99158d58e464f","block_index":310487,"block_time":310487000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1157,NULL,310487,'insert','transactions','{"block_hash":"32aa1b132d0643350bbb62dbd5f38ae0c270d8f491a2012c83b99158d58e464f","block_index":310487,"block_time":310487000,"btc_amount":5430,"data":"00000028000152bb3301000000000000000900000000000000090000000000000000000013b000000064","destination":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","fee":7650,"source":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","supported":true,"tx_hash":"41e821ae1c6b553d0fa5d5a807b2e7e9ffaec5d62706d9d2a59c6e65a3ed9cef","tx_index":488}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(1158,NULL,310487,'insert','debits','{"action":"bet","address":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","asset":"XCP","block_index":310487,"event":"41e821ae1c6b553d0fa5d5a807b2e7e9ffaec5d62706d9d2a59c6e65a3ed9cef","quantity":9,"tx_index":488}',0,'DEBIT');
+INSERT INTO messages VALUES(1159,NULL,310487,'insert','bets','{"bet_type":1,"block_index":310487,"counterwager_quantity":9,"counterwager_remaining":9,"deadline":1388000001,"expiration":100,"expire_index":310587,"fee_fraction_int":5000000.0,"feed_address":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","leverage":5040,"source":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","status":"open","target_value":0.0,"tx_hash":"41e821ae1c6b553d0fa5d5a807b2e7e9ffaec5d62706d9d2a59c6e65a3ed9cef","tx_index":488,"wager_quantity":9,"wager_remaining":9}',0,'OPEN_BET');
+INSERT INTO messages VALUES(1160,NULL,310487,'parse','transactions','{"supported":true,"tx_hash":"41e821ae1c6b553d0fa5d5a807b2e7e9ffaec5d62706d9d2a59c6e65a3ed9cef","tx_index":488}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(1161,NULL,310487,'parse','blocks','{"block_index":310487,"ledger_hash":"4b4d7a79843342e96e5d9d71bbc49690245b3098be75e7b86f273021d526216d","messages_hash":"900c8266900450b11b7b896e61baaea9e7f4677b5e722ac78cf07985c65a2e5b","txlist_hash":"76fbd411c43f3f67c8bf61138c5672de0cfda2d98f112a6e50b3a5d084d7cc72"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1162,NULL,310487,'insert','blocks','{"block_hash":"80b8dd5d7ce2e4886e6721095b892a39fb699980fe2bc1c17e747f822f4c4b1b","block_index":310488,"block_time":310488000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1163,NULL,310488,'insert','transactions','{"block_hash":"80b8dd5d7ce2e4886e6721095b892a39fb699980fe2bc1c17e747f822f4c4b1b","block_index":310488,"block_time":310488000,"btc_amount":0,"data":"0000001e52bb33023ff000000000000000000000096f7074696f6e732030","destination":"","fee":6800,"source":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","supported":true,"tx_hash":"870fb08b373705423f31ccd91fdbcabe135ad92d74e709a959dfa2e12f9a6638","tx_index":489}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(1164,NULL,310488,'insert','broadcasts','{"block_index":310488,"fee_fraction_int":0,"locked":false,"source":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","status":"valid","text":"options 0","timestamp":1388000002,"tx_hash":"870fb08b373705423f31ccd91fdbcabe135ad92d74e709a959dfa2e12f9a6638","tx_index":489,"value":1.0}',0,'BROADCAST');
+INSERT INTO messages VALUES(1165,NULL,310488,'parse','transactions','{"supported":true,"tx_hash":"870fb08b373705423f31ccd91fdbcabe135ad92d74e709a959dfa2e12f9a6638","tx_index":489}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(1166,NULL,310488,'parse','blocks','{"block_index":310488,"ledger_hash":"2d7e59026ea4c8933e9c7474936931ca49d4af91f9b9985f3c76085fb3a69104","messages_hash":"7ea198be8ae7e7f46844b1f34a4021ac5612d6dce70b354a5bedb8e8d2ff7762","txlist_hash":"78e801f2d1968c860ac2563e9cc912c18cb8e5f95996011e84c289833fbd46da"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1167,NULL,310488,'insert','blocks','{"block_hash":"2efdb36f986b3e3ccc6cc9b0c1c3cdcb07429fb43cbc0cc3b6c87d1b33f258b6","block_index":310489,"block_time":310489000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1168,NULL,310489,'insert','transactions','{"block_hash":"2efdb36f986b3e3ccc6cc9b0c1c3cdcb07429fb43cbc0cc3b6c87d1b33f258b6","block_index":310489,"block_time":310489000,"btc_amount":0,"data":"0000001e52bb33033ff000000000000000000000046c6f636b","destination":"","fee":6800,"source":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","supported":true,"tx_hash":"685d7f99fa76a05201c3239a4e0d9060ea53307b171f6ad7d482a26c73e9c0d1","tx_index":490}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(1169,NULL,310489,'insert','broadcasts','{"block_index":310489,"fee_fraction_int":null,"locked":true,"source":"myAtcJEHAsDLbTkai6ipWDZeeL7VkxXsiM","status":"valid","text":null,"timestamp":0,"tx_hash":"685d7f99fa76a05201c3239a4e0d9060ea53307b171f6ad7d482a26c73e9c0d1","tx_index":490,"value":null}',0,'BROADCAST');
+INSERT INTO messages VALUES(1170,NULL,310489,'parse','transactions','{"supported":true,"tx_hash":"685d7f99fa76a05201c3239a4e0d9060ea53307b171f6ad7d482a26c73e9c0d1","tx_index":490}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(1171,NULL,310489,'parse','blocks','{"block_index":310489,"ledger_hash":"716354a370f344980e98785a444b56b21188bc699e7fbd0c877b6f2fabf35efc","messages_hash":"d9a37c0bf78624a6bb7630e8f1223f2157df34407341d9813e9ccbc807acf5db","txlist_hash":"23d9af03e6aa29fbab29c8e2a5a0419680053bba19594105cc8ef4d3db05d418"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1172,NULL,310489,'insert','blocks','{"block_hash":"e2cb04b8a7368c95359c9d5ff33e64209200fb606de0d64b7c0f67bb1cb8d87c","block_index":310490,"block_time":310490000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1173,NULL,310490,'insert','transactions','{"block_hash":"e2cb04b8a7368c95359c9d5ff33e64209200fb606de0d64b7c0f67bb1cb8d87c","block_index":310490,"block_time":310490000,"btc_amount":0,"data":"0000001e52bb33043ff000000000000000000000096f7074696f6e732031","destination":"","fee":6800,"source":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","supported":true,"tx_hash":"7c437705c315212315c85c0b8ba09d358679c91be20b54f30929c5a6052426af","tx_index":491}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(1174,NULL,310490,'insert','broadcasts','{"block_index":310490,"fee_fraction_int":0,"locked":false,"source":"mwtPsLQxW9xpm7gdLmwWvJK5ABdPUVJm42","status":"valid","text":"options 1","timestamp":1388000004,"tx_hash":"7c437705c315212315c85c0b8ba09d358679c91be20b54f30929c5a6052426af","tx_index":491,"value":1.0}',0,'BROADCAST');
+INSERT INTO messages VALUES(1175,NULL,310490,'parse','transactions','{"supported":true,"tx_hash":"7c437705c315212315c85c0b8ba09d358679c91be20b54f30929c5a6052426af","tx_index":491}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(1176,NULL,310490,'parse','blocks','{"block_index":310490,"ledger_hash":"906a38f4256f50312891119c99721537992438af85421e317574ce1810e2b909","messages_hash":"d25fc5c1d965de9ba7a2e9642ee91920b982ee9304bc4b5f3b9a9a7da965706a","txlist_hash":"5f934032dce4102cd1d72d3f887526e78baa4a78991bc43cf0a1ebefe08fdec7"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1177,NULL,310490,'insert','blocks','{"block_hash":"811abd7cf2b768cfdaa84ab44c63f4463c96a368ead52125bf149cf0c7447b16","block_index":310491,"block_time":310491000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1178,NULL,310491,'insert','transactions','{"block_hash":"811abd7cf2b768cfdaa84ab44c63f4463c96a368ead52125bf149cf0c7447b16","block_index":310491,"block_time":310491000,"btc_amount":0,"data":"0000000a00000000000000010000000005f5e100000000000000000000000000000c350007d000000000000dbba0","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"74db175c4669a3d3a59e3fcddce9e97fcd7d12c35b58ef31845a1b20a1739498","tx_index":492}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(1179,NULL,310491,'insert','debits','{"action":"open order","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310491,"event":"74db175c4669a3d3a59e3fcddce9e97fcd7d12c35b58ef31845a1b20a1739498","quantity":100000000,"tx_index":492}',0,'DEBIT');
+INSERT INTO messages VALUES(1180,NULL,310491,'insert','orders','{"block_index":310491,"expiration":2000,"expire_index":312491,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":900000,"fee_required_remaining":900000,"get_asset":"BTC","get_quantity":800000,"get_remaining":800000,"give_asset":"XCP","give_quantity":100000000,"give_remaining":100000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","tx_hash":"74db175c4669a3d3a59e3fcddce9e97fcd7d12c35b58ef31845a1b20a1739498","tx_index":492}',0,'OPEN_ORDER');
+INSERT INTO messages VALUES(1181,NULL,310491,'parse','transactions','{"supported":true,"tx_hash":"74db175c4669a3d3a59e3fcddce9e97fcd7d12c35b58ef31845a1b20a1739498","tx_index":492}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(1182,NULL,310491,'parse','blocks','{"block_index":310491,"ledger_hash":"3114d8091cfcaa9944c6fab49d51950535c4ef269877d58c372ed80b2b472ec6","messages_hash":"9671cfedb3124b67ed996c547cb26a32e95490009ad56065c79be54a28c45994","txlist_hash":"f065728a3544adc085fae976759c0d040a34ca0a8ddd39260b55f0262cd5baa8"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1183,NULL,310491,'insert','blocks','{"block_hash":"8a09b2faf0a7ad67eb4ab5c948b9769fc87eb2ec5e16108f2cde8bd9e6cf7607","block_index":310492,"block_time":310492000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1184,NULL,310492,'insert','transactions','{"block_hash":"8a09b2faf0a7ad67eb4ab5c948b9769fc87eb2ec5e16108f2cde8bd9e6cf7607","block_index":310492,"block_time":310492000,"btc_amount":0,"data":"0000000a000000000000000000000000000c350000000000000000010000000005f5e10007d00000000000000000","destination":"","fee":1000000,"source":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","supported":true,"tx_hash":"1b294dd8592e76899b1c106782e4c96e63114abd8e3fa09ab6d2d52496b5bf81","tx_index":493}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(1185,NULL,310492,'insert','orders','{"block_index":310492,"expiration":2000,"expire_index":312492,"fee_provided":1000000,"fee_provided_remaining":1000000,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":100000000,"get_remaining":100000000,"give_asset":"BTC","give_quantity":800000,"give_remaining":800000,"source":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","status":"open","tx_hash":"1b294dd8592e76899b1c106782e4c96e63114abd8e3fa09ab6d2d52496b5bf81","tx_index":493}',0,'OPEN_ORDER');
+INSERT INTO messages VALUES(1186,NULL,310492,'update','orders','{"fee_provided_remaining":6800,"fee_required_remaining":892800,"get_remaining":0,"give_remaining":0,"status":"open","tx_hash":"74db175c4669a3d3a59e3fcddce9e97fcd7d12c35b58ef31845a1b20a1739498"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(1187,NULL,310492,'update','orders','{"fee_provided_remaining":992800,"fee_required_remaining":0,"get_remaining":0,"give_remaining":0,"status":"open","tx_hash":"1b294dd8592e76899b1c106782e4c96e63114abd8e3fa09ab6d2d52496b5bf81"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(1188,NULL,310492,'insert','order_matches','{"backward_asset":"BTC","backward_quantity":800000,"block_index":310492,"fee_paid":7200,"forward_asset":"XCP","forward_quantity":100000000,"id":"74db175c4669a3d3a59e3fcddce9e97fcd7d12c35b58ef31845a1b20a1739498_1b294dd8592e76899b1c106782e4c96e63114abd8e3fa09ab6d2d52496b5bf81","match_expire_index":310512,"status":"pending","tx0_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","tx0_block_index":310491,"tx0_expiration":2000,"tx0_hash":"74db175c4669a3d3a59e3fcddce9e97fcd7d12c35b58ef31845a1b20a1739498","tx0_index":492,"tx1_address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","tx1_block_index":310492,"tx1_expiration":2000,"tx1_hash":"1b294dd8592e76899b1c106782e4c96e63114abd8e3fa09ab6d2d52496b5bf81","tx1_index":493}',0,'ORDER_MATCH');
+INSERT INTO messages VALUES(1189,NULL,310492,'parse','transactions','{"supported":true,"tx_hash":"1b294dd8592e76899b1c106782e4c96e63114abd8e3fa09ab6d2d52496b5bf81","tx_index":493}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(1190,NULL,310492,'parse','blocks','{"block_index":310492,"ledger_hash":"98af18583618fdeed545347c013763d068e8294405d265911cc5e1bc420bc740","messages_hash":"0d34fbc26126add5a57b7e8f6f71bad150d7232abf046f3fa9b1fc72b10d61b2","txlist_hash":"daf4d2c1a1ad5206abcf7744bdd06fae99c442fb2607a843dcabb5727d02916e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1191,NULL,310492,'insert','blocks','{"block_hash":"c19e2915b750279b2be4b52e57e5ce29f63dffb4e14d9aad30c9e820affc0cbf","block_index":310493,"block_time":310493000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1192,NULL,310493,'insert','transactions','{"block_hash":"c19e2915b750279b2be4b52e57e5ce29f63dffb4e14d9aad30c9e820affc0cbf","block_index":310493,"block_time":310493000,"btc_amount":62000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","supported":true,"tx_hash":"c0733e1287afb1bb3d2fdacd1db7c74ea84f14362f3a8d1c038e662e1d0b1b1a","tx_index":494}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(1193,NULL,310493,'insert','credits','{"address":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","asset":"XCP","block_index":310493,"calling_function":"burn","event":"c0733e1287afb1bb3d2fdacd1db7c74ea84f14362f3a8d1c038e662e1d0b1b1a","quantity":92995878046,"tx_index":494}',0,'CREDIT');
+INSERT INTO messages VALUES(1194,NULL,310493,'insert','burns','{"block_index":310493,"burned":62000000,"earned":92995878046,"source":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","status":"valid","tx_hash":"c0733e1287afb1bb3d2fdacd1db7c74ea84f14362f3a8d1c038e662e1d0b1b1a","tx_index":494}',0,'BURN');
+INSERT INTO messages VALUES(1195,NULL,310493,'parse','blocks','{"block_index":310493,"ledger_hash":"29119cd30a4733916fbfd0551506eaa16f7bb1bdfbdf8d17ac4e5bb20d1cb09c","messages_hash":"53a339feb73df3a98bc4acc84af77e111d4780533c8f5a26cf250594d9613cf2","txlist_hash":"7ec4cfa94544900c8e8732ad51be7cee6452aa1884ea940cd5c98862fb4aaba6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1196,NULL,310493,'insert','blocks','{"block_hash":"7dda1d3e12785313d5651ee5314d0aecf17588196f9150b10c55695dbaebee5d","block_index":310494,"block_time":310494000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1197,NULL,310494,'insert','transactions','{"block_hash":"7dda1d3e12785313d5651ee5314d0aecf17588196f9150b10c55695dbaebee5d","block_index":310494,"block_time":310494000,"btc_amount":0,"data":"00000014000000063e985ffd00000000000000640100000000000000000000","destination":"","fee":6800,"source":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","supported":true,"tx_hash":"321bed395482e034f2ce0a4dbf28d1f800592a658e26ea91ae9c5b0928204503","tx_index":495}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(1198,NULL,310494,'insert','debits','{"action":"issuance fee","address":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","asset":"XCP","block_index":310494,"event":"321bed395482e034f2ce0a4dbf28d1f800592a658e26ea91ae9c5b0928204503","quantity":50000000,"tx_index":495}',0,'DEBIT');
+INSERT INTO messages VALUES(1199,NULL,310494,'insert','assets','{"asset_id":"26819977213","asset_longname":null,"asset_name":"DIVIDEND","block_index":310494}',0,'ASSET_CREATION');
+INSERT INTO messages VALUES(1200,NULL,310494,'insert','issuances','{"asset":"DIVIDEND","asset_longname":null,"block_index":310494,"call_date":0,"call_price":0.0,"callable":false,"description":"","divisible":true,"fee_paid":50000000,"issuer":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","locked":false,"quantity":100,"reset":false,"source":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","status":"valid","transfer":false,"tx_hash":"321bed395482e034f2ce0a4dbf28d1f800592a658e26ea91ae9c5b0928204503","tx_index":495}',0,'ASSET_ISSUANCE');
+INSERT INTO messages VALUES(1201,NULL,310494,'insert','credits','{"address":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","asset":"DIVIDEND","block_index":310494,"calling_function":"issuance","event":"321bed395482e034f2ce0a4dbf28d1f800592a658e26ea91ae9c5b0928204503","quantity":100,"tx_index":495}',0,'CREDIT');
+INSERT INTO messages VALUES(1202,NULL,310494,'parse','transactions','{"supported":true,"tx_hash":"321bed395482e034f2ce0a4dbf28d1f800592a658e26ea91ae9c5b0928204503","tx_index":495}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(1203,NULL,310494,'parse','blocks','{"block_index":310494,"ledger_hash":"72d71bd72263699ea9f2b097ad141be5bc394f49d8b0b0a6b2ff6a87b0ee3919","messages_hash":"0d3c87692d49dc033eed975eb8b8ee17ff2f0f877c8ed5a5866f73ce63bf8715","txlist_hash":"9350c3ba33d0546d1194c5fa767ced28834b26246aedc56d89b1d48ec4f26014"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1204,NULL,310494,'insert','blocks','{"block_hash":"4769aa7030f28a05a137a85ef4ee0c1765c37013773212b93ec90f1227168b67","block_index":310495,"block_time":310495000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1205,NULL,310495,'insert','transactions','{"block_hash":"4769aa7030f28a05a137a85ef4ee0c1765c37013773212b93ec90f1227168b67","block_index":310495,"block_time":310495000,"btc_amount":5430,"data":"00000000000000063e985ffd000000000000000a","destination":"mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj","fee":7650,"source":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","supported":true,"tx_hash":"02156b9a1f643fb48330396274a37620c8abbbe5eddb2f8b53dadd135f5d2e2e","tx_index":496}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(1206,NULL,310495,'insert','debits','{"action":"send","address":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","asset":"DIVIDEND","block_index":310495,"event":"02156b9a1f643fb48330396274a37620c8abbbe5eddb2f8b53dadd135f5d2e2e","quantity":10,"tx_index":496}',0,'DEBIT');
+INSERT INTO messages VALUES(1207,NULL,310495,'insert','credits','{"address":"mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj","asset":"DIVIDEND","block_index":310495,"calling_function":"send","event":"02156b9a1f643fb48330396274a37620c8abbbe5eddb2f8b53dadd135f5d2e2e","quantity":10,"tx_index":496}',0,'CREDIT');
+INSERT INTO messages VALUES(1208,NULL,310495,'insert','sends','{"asset":"DIVIDEND","block_index":310495,"destination":"mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj","quantity":10,"source":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","status":"valid","tx_hash":"02156b9a1f643fb48330396274a37620c8abbbe5eddb2f8b53dadd135f5d2e2e","tx_index":496}',0,'SEND');
+INSERT INTO messages VALUES(1209,NULL,310495,'parse','transactions','{"supported":true,"tx_hash":"02156b9a1f643fb48330396274a37620c8abbbe5eddb2f8b53dadd135f5d2e2e","tx_index":496}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(1210,NULL,310495,'parse','blocks','{"block_index":310495,"ledger_hash":"5a7e5a36882466373d576bb5f4ccd1bc72ecaf548b9589baa803a7275a7a24cd","messages_hash":"56518bc9abc11bf108188834058bb9c51c9b8dc3b6276116c5b786b07c797fab","txlist_hash":"09e9db121649cacd979fd18bbaa35e519361e727e7e072e2f2f86291160cdb29"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1211,NULL,310495,'insert','blocks','{"block_hash":"65884816927e8c566655e85c07bc2bc2c7ee26e625742f219939d43238fb31f8","block_index":310496,"block_time":310496000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1212,NULL,310496,'insert','transactions','{"block_hash":"65884816927e8c566655e85c07bc2bc2c7ee26e625742f219939d43238fb31f8","block_index":310496,"block_time":310496000,"btc_amount":5430,"data":"00000000000000000000000100000015a4018c1e","destination":"mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj","fee":7650,"source":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","supported":true,"tx_hash":"a35ab1736565aceddbd1d71f92fc7f39d1361006aa9099f731e54e762964d5ba","tx_index":497}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(1213,NULL,310496,'insert','debits','{"action":"send","address":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","asset":"XCP","block_index":310496,"event":"a35ab1736565aceddbd1d71f92fc7f39d1361006aa9099f731e54e762964d5ba","quantity":92945878046,"tx_index":497}',0,'DEBIT');
+INSERT INTO messages VALUES(1214,NULL,310496,'insert','credits','{"address":"mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj","asset":"XCP","block_index":310496,"calling_function":"send","event":"a35ab1736565aceddbd1d71f92fc7f39d1361006aa9099f731e54e762964d5ba","quantity":92945878046,"tx_index":497}',0,'CREDIT');
+INSERT INTO messages VALUES(1215,NULL,310496,'insert','sends','{"asset":"XCP","block_index":310496,"destination":"mqPCfvqTfYctXMUfmniXeG2nyaN8w6tPmj","quantity":92945878046,"source":"mnfAHmddVibnZNSkh8DvKaQoiEfNsxjXzH","status":"valid","tx_hash":"a35ab1736565aceddbd1d71f92fc7f39d1361006aa9099f731e54e762964d5ba","tx_index":497}',0,'SEND');
+INSERT INTO messages VALUES(1216,NULL,310496,'parse','transactions','{"supported":true,"tx_hash":"a35ab1736565aceddbd1d71f92fc7f39d1361006aa9099f731e54e762964d5ba","tx_index":497}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(1217,NULL,310496,'parse','blocks','{"block_index":310496,"ledger_hash":"7ac6121c624b634f44695172761830926afe76bb18c4cc9195773f3a26966941","messages_hash":"1b1ed76f99d39b36f4d0737299ce15b21fed9e077d0476658c023b09819853a7","txlist_hash":"9eda85cce745579122ba9c6e24b63cd83f2e5161031a34e6ee9bf08b80823cb4"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1218,NULL,310496,'insert','blocks','{"block_hash":"f1118591fe79b8bf52ccf0c5de9826bfd266b1fdc24b44676cf22bbcc76d464e","block_index":310497,"block_time":310497000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1219,NULL,310497,'insert','transactions','{"block_hash":"f1118591fe79b8bf52ccf0c5de9826bfd266b1fdc24b44676cf22bbcc76d464e","block_index":310497,"block_time":310497000,"btc_amount":0,"data":"00000014000000000aa4097d0000000005f5e100010000000000000000000c506172656e74206173736574","destination":"","fee":6300,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"076ae3d8eeb7fb40d2ae27692340157c746d9832806766b0dac5adb1526dc78f","tx_index":498}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(1220,NULL,310497,'insert','debits','{"action":"issuance fee","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310497,"event":"076ae3d8eeb7fb40d2ae27692340157c746d9832806766b0dac5adb1526dc78f","quantity":50000000,"tx_index":498}',0,'DEBIT');
+INSERT INTO messages VALUES(1221,NULL,310497,'insert','assets','{"asset_id":"178522493","asset_longname":null,"asset_name":"PARENT","block_index":310497}',0,'ASSET_CREATION');
+INSERT INTO messages VALUES(1222,NULL,310497,'insert','issuances','{"asset":"PARENT","asset_longname":null,"block_index":310497,"call_date":0,"call_price":0.0,"callable":false,"description":"Parent asset","divisible":true,"fee_paid":50000000,"issuer":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","locked":false,"quantity":100000000,"reset":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","transfer":false,"tx_hash":"076ae3d8eeb7fb40d2ae27692340157c746d9832806766b0dac5adb1526dc78f","tx_index":498}',0,'ASSET_ISSUANCE');
+INSERT INTO messages VALUES(1223,NULL,310497,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"PARENT","block_index":310497,"calling_function":"issuance","event":"076ae3d8eeb7fb40d2ae27692340157c746d9832806766b0dac5adb1526dc78f","quantity":100000000,"tx_index":498}',0,'CREDIT');
+INSERT INTO messages VALUES(1224,NULL,310497,'parse','transactions','{"supported":true,"tx_hash":"076ae3d8eeb7fb40d2ae27692340157c746d9832806766b0dac5adb1526dc78f","tx_index":498}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(1225,NULL,310497,'parse','blocks','{"block_index":310497,"ledger_hash":"28c6e92b2299b9cbbb5953f8b7ff3de0fe962d15642ba27e43faa64e1935e819","messages_hash":"ac8d8759fbddc8f92ad8b5d8b4637a63b8d21a04ba1a4126baf2b42a87edfce3","txlist_hash":"ff8136601b9e0138a999d1f0467af6e8535a2bcdd2b622af7be0178a083b9519"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1226,NULL,310497,'insert','blocks','{"block_hash":"b7058b6d1ddc325a10bf33144937e06ce6025215b416518ae120da9440ae279e","block_index":310498,"block_time":310498000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1227,NULL,310498,'insert','transactions','{"block_hash":"b7058b6d1ddc325a10bf33144937e06ce6025215b416518ae120da9440ae279e","block_index":310498,"block_time":310498000,"btc_amount":0,"data":"0000001501530821671b10650000000005f5e10001108e90a57dba9967c422e83080f22f0c684368696c64206f6620706172656e74","destination":"","fee":6550,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"0abfce2662c05852fd8b181a60900678643cedad47b23a853b8c4eda82cb2cbf","tx_index":499}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(1228,NULL,310498,'insert','debits','{"action":"issuance fee","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310498,"event":"0abfce2662c05852fd8b181a60900678643cedad47b23a853b8c4eda82cb2cbf","quantity":25000000,"tx_index":499}',0,'DEBIT');
+INSERT INTO messages VALUES(1229,NULL,310498,'insert','assets','{"asset_id":"95428956661682277","asset_longname":"PARENT.already.issued","asset_name":"A95428956661682277","block_index":310498}',0,'ASSET_CREATION');
+INSERT INTO messages VALUES(1230,NULL,310498,'insert','issuances','{"asset":"A95428956661682277","asset_longname":"PARENT.already.issued","block_index":310498,"call_date":0,"call_price":0.0,"callable":false,"description":"Child of parent","divisible":true,"fee_paid":25000000,"issuer":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","locked":false,"quantity":100000000,"reset":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","transfer":false,"tx_hash":"0abfce2662c05852fd8b181a60900678643cedad47b23a853b8c4eda82cb2cbf","tx_index":499}',0,'ASSET_ISSUANCE');
+INSERT INTO messages VALUES(1231,NULL,310498,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"A95428956661682277","block_index":310498,"calling_function":"issuance","event":"0abfce2662c05852fd8b181a60900678643cedad47b23a853b8c4eda82cb2cbf","quantity":100000000,"tx_index":499}',0,'CREDIT');
+INSERT INTO messages VALUES(1232,NULL,310498,'parse','transactions','{"supported":true,"tx_hash":"0abfce2662c05852fd8b181a60900678643cedad47b23a853b8c4eda82cb2cbf","tx_index":499}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(1233,NULL,310498,'parse','blocks','{"block_index":310498,"ledger_hash":"5fe6cdb0828379bf240fad99c68bba34e1889bbc19605ce5c297b82352264414","messages_hash":"113207bd13dda56b5e5edf305f70a56e62cc861184e1e95a64e79ce100462c98","txlist_hash":"b488f6f0e6c233f202ee17c0843236d464144e79c870af88bae56355ae9372b7"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1234,NULL,310498,'insert','blocks','{"block_hash":"1950e1a4d7fc820ed9603f6df6819c3c953c277c726340dec2a4253e261a1764","block_index":310499,"block_time":310499000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1235,NULL,310499,'parse','blocks','{"block_index":310499,"ledger_hash":"b9fcbdafddd46fdda061f6e9f8744b426b6ca37e32b315df1098cbc7899ae9b9","messages_hash":"d6aedacd4f81520d86ae47c9c776d17a213c706a5cf7c91203a4299261d1648c","txlist_hash":"032166892f568bb97f4f69ef5bdf49cc1b15cc9f8c7f6c1f3e1f9d54816ad7e5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1236,NULL,310499,'insert','blocks','{"block_hash":"54aeaf47d5387964e2d51617bf3af50520a0449410e0d096cf8c2aa9dad5550b","block_index":310500,"block_time":310500000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1237,NULL,310500,'parse','blocks','{"block_index":310500,"ledger_hash":"5ffefc7a2724be6bd697796bb82638ec913c5cbb73627153d1a13b48c7a6c02d","messages_hash":"45f296a535c13129cb1aaeb4e28a03e04ad902917891c39ae59ea2894e9f868f","txlist_hash":"35f4a33840d002ab4e0e44f11c1749ae95b41376927fb346140508b32518edd1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(1238,NULL,310500,'insert','blocks','{"block_hash":"9d9019d15a1d878f2c39c7e3de4340a043a4a31aebb298acdf8e913284ae26ba","block_index":310501,"block_time":310501000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
 -- Triggers and indices on  messages
 CREATE TRIGGER block_update_messages
                            BEFORE UPDATE ON messages BEGIN
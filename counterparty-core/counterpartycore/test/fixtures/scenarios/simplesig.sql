@@ -463,361 +463,362 @@ BEGIN TRANSACTION;
 DROP TABLE IF EXISTS messages;
 CREATE TABLE messages(
                       message_index INTEGER PRIMARY KEY,
+                      mensaje_index INTEGER,
                       block_index INTEGER,
                       command TEXT,
                       category TEXT,
                       bindings TEXT,
                       timestamp INTEGER,
                       event TEXT);
-INSERT INTO messages VALUES(0,0,'insert','blocks','{"block_hash":"8b3bef249cb3b0fa23a4936c1249b6bd41daeadc848c8d2e409ea1cbc10adfe7","block_index":309999,"block_time":309999000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(1,309999,'parse','blocks','{"block_index":309999,"ledger_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","messages_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","txlist_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(2,309999,'insert','blocks','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(3,310000,'insert','transactions','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"btc_amount":62000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"6dc5b0a33d4d4297e0f5cc2d23ae307951d32aab2d86b7fa147b385219f3a597","tx_index":1}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(4,310000,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310000,"calling_function":"burn","event":"6dc5b0a33d4d4297e0f5cc2d23ae307951d32aab2d86b7fa147b385219f3a597","quantity":93000000000,"tx_index":1}',0,'CREDIT');
-INSERT INTO messages VALUES(5,310000,'insert','burns','{"block_index":310000,"burned":62000000,"earned":93000000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"6dc5b0a33d4d4297e0f5cc2d23ae307951d32aab2d86b7fa147b385219f3a597","tx_index":1}',0,'BURN');
-INSERT INTO messages VALUES(6,310000,'parse','blocks','{"block_index":310000,"ledger_hash":"cf0ea1d313e22ba5f413075b88e07dffc5c00e59f95eeb6d6dec935bd77f5ae4","messages_hash":"9e7dd13f1ecb4ec6481076dc9bb5fda1bdb9103747455f9de9ab516748201ef0","txlist_hash":"f06c23e6040a063ed59693baa0d63492dce64e1debc7455b22f5535c9dfbdc67"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(7,310000,'insert','blocks','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(8,310001,'insert','transactions','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"btc_amount":5430,"data":"0000000000000000000000010000000002faf080","destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"3b273ba342ed8bd4ccd2ae28d3df7754768a6c65ec1cee4a6e84b4b4bdec8d8c","tx_index":2}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(9,310001,'insert','debits','{"action":"send","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310001,"event":"3b273ba342ed8bd4ccd2ae28d3df7754768a6c65ec1cee4a6e84b4b4bdec8d8c","quantity":50000000,"tx_index":2}',0,'DEBIT');
-INSERT INTO messages VALUES(10,310001,'insert','credits','{"address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"XCP","block_index":310001,"calling_function":"send","event":"3b273ba342ed8bd4ccd2ae28d3df7754768a6c65ec1cee4a6e84b4b4bdec8d8c","quantity":50000000,"tx_index":2}',0,'CREDIT');
-INSERT INTO messages VALUES(11,310001,'insert','sends','{"asset":"XCP","block_index":310001,"destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","quantity":50000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"3b273ba342ed8bd4ccd2ae28d3df7754768a6c65ec1cee4a6e84b4b4bdec8d8c","tx_index":2}',0,'SEND');
-INSERT INTO messages VALUES(12,310001,'parse','transactions','{"supported":true,"tx_hash":"3b273ba342ed8bd4ccd2ae28d3df7754768a6c65ec1cee4a6e84b4b4bdec8d8c","tx_index":2}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(13,310001,'parse','blocks','{"block_index":310001,"ledger_hash":"bdf1308701712d94da26f53fef4c440ea2fb7b0ef7361f424ba9263e747272bd","messages_hash":"8e1a31c7d7fa8f0fe6981c7b33a5832fef697516b3e3bdaf732746550bf2a9eb","txlist_hash":"fac614e6f77f1b954c12523e9d0eeb4252f92f3640f7d067790a510a9e893811"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(14,310001,'insert','blocks','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(15,310002,'insert','transactions','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"btc_amount":0,"data":"0000000a00000000000000000000000002faf08000000000000000010000000005f5e100000a0000000000000000","destination":"","fee":1000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"6bdb2ef465e9fc04060f58ced26c159dc983a616cb121c5e7954e66833444c59","tx_index":3}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(16,310002,'insert','orders','{"block_index":310002,"expiration":10,"expire_index":310012,"fee_provided":1000000,"fee_provided_remaining":1000000,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":100000000,"get_remaining":100000000,"give_asset":"BTC","give_quantity":50000000,"give_remaining":50000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","tx_hash":"6bdb2ef465e9fc04060f58ced26c159dc983a616cb121c5e7954e66833444c59","tx_index":3}',0,'OPEN_ORDER');
-INSERT INTO messages VALUES(17,310002,'parse','transactions','{"supported":true,"tx_hash":"6bdb2ef465e9fc04060f58ced26c159dc983a616cb121c5e7954e66833444c59","tx_index":3}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(18,310002,'parse','blocks','{"block_index":310002,"ledger_hash":"cf830f949715ebeac09d4441878f60ac04d691c09d6c25c62a0d30fb5886cba9","messages_hash":"d5c067448e960b3b7609d4bc33f28739e755833b8752d57757dc8fe6bfdaaef2","txlist_hash":"0c743d61c27efab7c83c1845f6b0446b67c9b59173318709d51363e75e7a0601"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(19,310002,'insert','blocks','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(20,310003,'insert','transactions','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"btc_amount":0,"data":"0000000a00000000000000010000000006422c4000000000000000000000000002faf080000a00000000000dbba0","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"36d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c","tx_index":4}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(21,310003,'insert','debits','{"action":"open order","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310003,"event":"36d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c","quantity":105000000,"tx_index":4}',0,'DEBIT');
-INSERT INTO messages VALUES(22,310003,'insert','orders','{"block_index":310003,"expiration":10,"expire_index":310013,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":900000,"fee_required_remaining":900000,"get_asset":"BTC","get_quantity":50000000,"get_remaining":50000000,"give_asset":"XCP","give_quantity":105000000,"give_remaining":105000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","tx_hash":"36d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c","tx_index":4}',0,'OPEN_ORDER');
-INSERT INTO messages VALUES(23,310003,'update','orders','{"fee_provided_remaining":142858,"fee_required_remaining":0,"get_remaining":0,"give_remaining":0,"status":"open","tx_hash":"6bdb2ef465e9fc04060f58ced26c159dc983a616cb121c5e7954e66833444c59"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(24,310003,'update','orders','{"fee_provided_remaining":6800,"fee_required_remaining":42858,"get_remaining":0,"give_remaining":5000000,"status":"open","tx_hash":"36d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(25,310003,'insert','order_matches','{"backward_asset":"XCP","backward_quantity":100000000,"block_index":310003,"fee_paid":857142,"forward_asset":"BTC","forward_quantity":50000000,"id":"6bdb2ef465e9fc04060f58ced26c159dc983a616cb121c5e7954e66833444c59_36d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c","match_expire_index":310023,"status":"pending","tx0_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","tx0_block_index":310002,"tx0_expiration":10,"tx0_hash":"6bdb2ef465e9fc04060f58ced26c159dc983a616cb121c5e7954e66833444c59","tx0_index":3,"tx1_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","tx1_block_index":310003,"tx1_expiration":10,"tx1_hash":"36d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c","tx1_index":4}',0,'ORDER_MATCH');
-INSERT INTO messages VALUES(26,310003,'parse','transactions','{"supported":true,"tx_hash":"36d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c","tx_index":4}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(27,310003,'parse','blocks','{"block_index":310003,"ledger_hash":"e881a675a38c4649cd44e6406ddc494996c761671bc349dcdea1de430a84258d","messages_hash":"c060770e246851710cba711099d9f8ccfed66a792b2e64d68ae887e1b83bac51","txlist_hash":"9ae051d14f8d19db67a85c713eefc0a936f1bad818ae1138fcecb91506a46d88"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(28,310003,'insert','blocks','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(29,310004,'insert','transactions','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"btc_amount":50000000,"data":"0000000b6bdb2ef465e9fc04060f58ced26c159dc983a616cb121c5e7954e66833444c5936d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c","destination":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","fee":9675,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"843c5df8f979db230ba61f26ad1342ed5803adeba7333b019b8a96ac6703f099","tx_index":5}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(30,310004,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310004,"calling_function":"btcpay","event":"843c5df8f979db230ba61f26ad1342ed5803adeba7333b019b8a96ac6703f099","quantity":100000000,"tx_index":5}',0,'CREDIT');
-INSERT INTO messages VALUES(31,310004,'update','order_matches','{"id":"6bdb2ef465e9fc04060f58ced26c159dc983a616cb121c5e7954e66833444c59_36d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c","order_match_id":"6bdb2ef465e9fc04060f58ced26c159dc983a616cb121c5e7954e66833444c59_36d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c","status":"completed"}',0,'ORDER_MATCH_UPDATE');
-INSERT INTO messages VALUES(32,310004,'insert','btcpays','{"block_index":310004,"btc_amount":50000000,"destination":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","order_match_id":"6bdb2ef465e9fc04060f58ced26c159dc983a616cb121c5e7954e66833444c59_36d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c","source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"843c5df8f979db230ba61f26ad1342ed5803adeba7333b019b8a96ac6703f099","tx_index":5}',0,'BTC_PAY');
-INSERT INTO messages VALUES(33,310004,'parse','transactions','{"supported":true,"tx_hash":"843c5df8f979db230ba61f26ad1342ed5803adeba7333b019b8a96ac6703f099","tx_index":5}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(34,310004,'parse','blocks','{"block_index":310004,"ledger_hash":"13e0c6276f297ff1ca77705f1b18d807ca22f53735fba52f4f5c3766dc4b04e8","messages_hash":"0238a76faa733825349cf252aa10cfc94392cccd7599025643ac132abf329636","txlist_hash":"a865bc7b6e26b3c3868ae080ab927ce3f2dcdb7d3654ffbcd1b3a8111d0807b1"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(35,310004,'insert','blocks','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(36,310005,'insert','transactions','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"btc_amount":0,"data":"000000140000000000004767000000003b9aca000100000000000000000000","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"5d951d44d034cb6fd5dc5c98cd877c63f55c1ae108d335b6b6d991d072856adf","tx_index":6}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(37,310005,'insert','debits','{"action":"issuance fee","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310005,"event":"5d951d44d034cb6fd5dc5c98cd877c63f55c1ae108d335b6b6d991d072856adf","quantity":50000000,"tx_index":6}',0,'DEBIT');
-INSERT INTO messages VALUES(38,310005,'insert','assets','{"asset_id":"18279","asset_longname":null,"asset_name":"BBBB","block_index":310005}',0,'ASSET_CREATION');
-INSERT INTO messages VALUES(39,310005,'insert','issuances','{"asset":"BBBB","asset_longname":null,"block_index":310005,"call_date":0,"call_price":0.0,"callable":false,"description":"","divisible":true,"fee_paid":50000000,"issuer":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","locked":false,"quantity":1000000000,"reset":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","transfer":false,"tx_hash":"5d951d44d034cb6fd5dc5c98cd877c63f55c1ae108d335b6b6d991d072856adf","tx_index":6}',0,'ASSET_ISSUANCE');
-INSERT INTO messages VALUES(40,310005,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"BBBB","block_index":310005,"calling_function":"issuance","event":"5d951d44d034cb6fd5dc5c98cd877c63f55c1ae108d335b6b6d991d072856adf","quantity":1000000000,"tx_index":6}',0,'CREDIT');
-INSERT INTO messages VALUES(41,310005,'parse','transactions','{"supported":true,"tx_hash":"5d951d44d034cb6fd5dc5c98cd877c63f55c1ae108d335b6b6d991d072856adf","tx_index":6}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(42,310005,'parse','blocks','{"block_index":310005,"ledger_hash":"765896f532b411af9f889687a750d44414296c20002f3e2abed9551a6822937d","messages_hash":"2be211b1beee52aa7be5d2f229a93c3795d226c12eac8fbfee98b2742ce1e0d8","txlist_hash":"59095fce5f573c2ff1b5eda5cd75c36227b0f9782601e7538215fea5317c505b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(43,310005,'insert','blocks','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(44,310006,'insert','transactions','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"btc_amount":0,"data":"00000014000000000000476800000000000186a00000000000000000000006666f6f626172","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"2b44f590422a3ab5b70fb1265a2e4f4d3b0bcb3de3f296dc7280924870ec8c59","tx_index":7}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(45,310006,'insert','debits','{"action":"issuance fee","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310006,"event":"2b44f590422a3ab5b70fb1265a2e4f4d3b0bcb3de3f296dc7280924870ec8c59","quantity":50000000,"tx_index":7}',0,'DEBIT');
-INSERT INTO messages VALUES(46,310006,'insert','assets','{"asset_id":"18280","asset_longname":null,"asset_name":"BBBC","block_index":310006}',0,'ASSET_CREATION');
-INSERT INTO messages VALUES(47,310006,'insert','issuances','{"asset":"BBBC","asset_longname":null,"block_index":310006,"call_date":0,"call_price":0.0,"callable":false,"description":"foobar","divisible":false,"fee_paid":50000000,"issuer":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","locked":false,"quantity":100000,"reset":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","transfer":false,"tx_hash":"2b44f590422a3ab5b70fb1265a2e4f4d3b0bcb3de3f296dc7280924870ec8c59","tx_index":7}',0,'ASSET_ISSUANCE');
-INSERT INTO messages VALUES(48,310006,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"BBBC","block_index":310006,"calling_function":"issuance","event":"2b44f590422a3ab5b70fb1265a2e4f4d3b0bcb3de3f296dc7280924870ec8c59","quantity":100000,"tx_index":7}',0,'CREDIT');
-INSERT INTO messages VALUES(49,310006,'parse','transactions','{"supported":true,"tx_hash":"2b44f590422a3ab5b70fb1265a2e4f4d3b0bcb3de3f296dc7280924870ec8c59","tx_index":7}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(50,310006,'parse','blocks','{"block_index":310006,"ledger_hash":"853e3a8d39c4e8bdb36a0ec01a8d20f12335fcc00a00ac271e9d83be471d394f","messages_hash":"fc41309cdb46e7fbae0f09fda002234a6e758ab63e8240a648793fee6bfc0c7d","txlist_hash":"752821f935743579d04abcc94c104148b226cbc0777a6bb30bb7eceb29b85fca"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(51,310006,'insert','blocks','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(52,310007,'insert','transactions','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"btc_amount":5430,"data":"00000000000000000000476700000000003d0900","destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"5836fb23c2bb94eeb4b71cb8e3c622c6d943b3e4ed3aebee42d240445e615db8","tx_index":8}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(53,310007,'insert','debits','{"action":"send","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"BBBB","block_index":310007,"event":"5836fb23c2bb94eeb4b71cb8e3c622c6d943b3e4ed3aebee42d240445e615db8","quantity":4000000,"tx_index":8}',0,'DEBIT');
-INSERT INTO messages VALUES(54,310007,'insert','credits','{"address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"BBBB","block_index":310007,"calling_function":"send","event":"5836fb23c2bb94eeb4b71cb8e3c622c6d943b3e4ed3aebee42d240445e615db8","quantity":4000000,"tx_index":8}',0,'CREDIT');
-INSERT INTO messages VALUES(55,310007,'insert','sends','{"asset":"BBBB","block_index":310007,"destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","quantity":4000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"5836fb23c2bb94eeb4b71cb8e3c622c6d943b3e4ed3aebee42d240445e615db8","tx_index":8}',0,'SEND');
-INSERT INTO messages VALUES(56,310007,'parse','transactions','{"supported":true,"tx_hash":"5836fb23c2bb94eeb4b71cb8e3c622c6d943b3e4ed3aebee42d240445e615db8","tx_index":8}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(57,310007,'parse','blocks','{"block_index":310007,"ledger_hash":"f2b2d250a94afa158f9ed84434c3ac7a0bfc97b4387e5e3c099afc95b8a6ad9c","messages_hash":"569752afb305c679927918cc1cebce198cb79b86e2e52a5cfbf5284cb1382065","txlist_hash":"405914410b5982b395f52f17ee4fc69dc0e4fb4c7a511009c700c0d1bdbfb563"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(58,310007,'insert','blocks','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(59,310008,'insert','transactions','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"btc_amount":5430,"data":"000000000000000000004768000000000000020e","destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"843e6f7712b7847099502bda8a4bd7127c17a2799290b91ef1584a6bfe069412","tx_index":9}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(60,310008,'insert','debits','{"action":"send","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"BBBC","block_index":310008,"event":"843e6f7712b7847099502bda8a4bd7127c17a2799290b91ef1584a6bfe069412","quantity":526,"tx_index":9}',0,'DEBIT');
-INSERT INTO messages VALUES(61,310008,'insert','credits','{"address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"BBBC","block_index":310008,"calling_function":"send","event":"843e6f7712b7847099502bda8a4bd7127c17a2799290b91ef1584a6bfe069412","quantity":526,"tx_index":9}',0,'CREDIT');
-INSERT INTO messages VALUES(62,310008,'insert','sends','{"asset":"BBBC","block_index":310008,"destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","quantity":526,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"843e6f7712b7847099502bda8a4bd7127c17a2799290b91ef1584a6bfe069412","tx_index":9}',0,'SEND');
-INSERT INTO messages VALUES(63,310008,'parse','transactions','{"supported":true,"tx_hash":"843e6f7712b7847099502bda8a4bd7127c17a2799290b91ef1584a6bfe069412","tx_index":9}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(64,310008,'parse','blocks','{"block_index":310008,"ledger_hash":"8c44f15f5606b6fe984a9fa7df8d7d5381fe87a6c8b634469804328885668569","messages_hash":"2a03aeebd37f31a3ceea8c2e86ce7d0d4038ac74a3bbca363253aef81e1acac3","txlist_hash":"81714583a99f97b5cefc10510f507567e02f380bdb5741e2b5ef037816e8be17"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(65,310008,'insert','blocks','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(66,310009,'insert','transactions','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"btc_amount":0,"data":"00000032000000000000025800000000000047670000000000000001","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"42ae2fd7f3a18f84334bc37aa88283e79d6bff0b234dbf97e788695957d75518","tx_index":10}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(67,310009,'insert','debits','{"action":"dividend","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310009,"event":"42ae2fd7f3a18f84334bc37aa88283e79d6bff0b234dbf97e788695957d75518","quantity":24,"tx_index":10}',0,'DEBIT');
-INSERT INTO messages VALUES(68,310009,'insert','debits','{"action":"dividend fee","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310009,"event":"42ae2fd7f3a18f84334bc37aa88283e79d6bff0b234dbf97e788695957d75518","quantity":20000,"tx_index":10}',0,'DEBIT');
-INSERT INTO messages VALUES(69,310009,'insert','credits','{"address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"XCP","block_index":310009,"calling_function":"dividend","event":"42ae2fd7f3a18f84334bc37aa88283e79d6bff0b234dbf97e788695957d75518","quantity":24,"tx_index":10}',0,'CREDIT');
-INSERT INTO messages VALUES(70,310009,'insert','dividends','{"asset":"BBBB","block_index":310009,"dividend_asset":"XCP","fee_paid":20000,"quantity_per_unit":600,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"42ae2fd7f3a18f84334bc37aa88283e79d6bff0b234dbf97e788695957d75518","tx_index":10}',0,'ASSET_DIVIDEND');
-INSERT INTO messages VALUES(71,310009,'parse','transactions','{"supported":true,"tx_hash":"42ae2fd7f3a18f84334bc37aa88283e79d6bff0b234dbf97e788695957d75518","tx_index":10}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(72,310009,'parse','blocks','{"block_index":310009,"ledger_hash":"ba378e9192f290d3f9d3dd1e46aeef3a185bd5aff1be809c8974fca8dc142987","messages_hash":"1b8f265cb1ec72a091317f293c1c6a2bd31d7dbb066e093c66b55d40cb966266","txlist_hash":"9395234af8a78eb91afe7dd45a6701032af9926cba3e126e01f06547ffcb2e08"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(73,310009,'insert','blocks','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(74,310010,'insert','transactions','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"btc_amount":0,"data":"00000032000000000000032000000000000047680000000000000001","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"201123e1ddbc4dab954fed0043a29fca770a9bd4268714354bb7991f01133c10","tx_index":11}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(75,310010,'insert','debits','{"action":"dividend","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310010,"event":"201123e1ddbc4dab954fed0043a29fca770a9bd4268714354bb7991f01133c10","quantity":420800,"tx_index":11}',0,'DEBIT');
-INSERT INTO messages VALUES(76,310010,'insert','debits','{"action":"dividend fee","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310010,"event":"201123e1ddbc4dab954fed0043a29fca770a9bd4268714354bb7991f01133c10","quantity":20000,"tx_index":11}',0,'DEBIT');
-INSERT INTO messages VALUES(77,310010,'insert','credits','{"address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"XCP","block_index":310010,"calling_function":"dividend","event":"201123e1ddbc4dab954fed0043a29fca770a9bd4268714354bb7991f01133c10","quantity":420800,"tx_index":11}',0,'CREDIT');
-INSERT INTO messages VALUES(78,310010,'insert','dividends','{"asset":"BBBC","block_index":310010,"dividend_asset":"XCP","fee_paid":20000,"quantity_per_unit":800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"201123e1ddbc4dab954fed0043a29fca770a9bd4268714354bb7991f01133c10","tx_index":11}',0,'ASSET_DIVIDEND');
-INSERT INTO messages VALUES(79,310010,'parse','transactions','{"supported":true,"tx_hash":"201123e1ddbc4dab954fed0043a29fca770a9bd4268714354bb7991f01133c10","tx_index":11}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(80,310010,'parse','blocks','{"block_index":310010,"ledger_hash":"64f78f9eedce2931aedfe413b4f4bdeb728752e1c897e0bd44c7db665976a723","messages_hash":"1a9855c2f2e4ee940e81ba585d2e0a4fa9269d38b7ca9e8fe5aea128de067d77","txlist_hash":"09624bd24bdd3d945e0a75450915715fa9e9a077db33aa5bdb275b0c76e7f9e8"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(81,310010,'insert','blocks','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(82,310011,'insert','transactions','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"btc_amount":0,"data":"0000001e52bb3300405900000000000005f5e0ff09556e69742054657374","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"1afa4fa28e1ef63b2b67c288e078cfeb109a2b236558ab5544eedc7f171e0a84","tx_index":12}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(83,310011,'insert','broadcasts','{"block_index":310011,"fee_fraction_int":99999999,"locked":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","text":"Unit Test","timestamp":1388000000,"tx_hash":"1afa4fa28e1ef63b2b67c288e078cfeb109a2b236558ab5544eedc7f171e0a84","tx_index":12,"value":100.0}',0,'BROADCAST');
-INSERT INTO messages VALUES(84,310011,'parse','transactions','{"supported":true,"tx_hash":"1afa4fa28e1ef63b2b67c288e078cfeb109a2b236558ab5544eedc7f171e0a84","tx_index":12}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(85,310011,'parse','blocks','{"block_index":310011,"ledger_hash":"671a1b4e1edd1f96dcfcc96d521fb2125ae5b9d2d01a76fc66686b7ed20c5662","messages_hash":"54da84d0982b7a0b58767098bfc307fa45569f0ed925f0d0557b22b7b38401fe","txlist_hash":"aa59f74f7d3eeee95415b1bca4a090036cd9a2efb187880f7c72c69dc1bfc059"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(86,310011,'insert','blocks','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(87,310012,'insert','transactions','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"btc_amount":5430,"data":"00000028000052bb33640000000002faf08000000000017d7840000000000000000000003b100000000a","destination":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"7025ded3ba412d1285be69c8aaa02773b8f4e2504310832c99a9b171b7e07e81","tx_index":13}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(88,310012,'insert','debits','{"action":"bet","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310012,"event":"7025ded3ba412d1285be69c8aaa02773b8f4e2504310832c99a9b171b7e07e81","quantity":50000000,"tx_index":13}',0,'DEBIT');
-INSERT INTO messages VALUES(89,310012,'insert','bets','{"bet_type":0,"block_index":310012,"counterwager_quantity":25000000,"counterwager_remaining":25000000,"deadline":1388000100,"expiration":10,"expire_index":310022,"fee_fraction_int":99999999.0,"feed_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","leverage":15120,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","target_value":0.0,"tx_hash":"7025ded3ba412d1285be69c8aaa02773b8f4e2504310832c99a9b171b7e07e81","tx_index":13,"wager_quantity":50000000,"wager_remaining":50000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(90,310012,'parse','transactions','{"supported":true,"tx_hash":"7025ded3ba412d1285be69c8aaa02773b8f4e2504310832c99a9b171b7e07e81","tx_index":13}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(91,310012,'parse','blocks','{"block_index":310012,"ledger_hash":"1f5b502c341699b5a59b87566c0fc02b7db5c657919f014e41a00303aa53efc8","messages_hash":"f145d04f53c877a372423f6cce9f84d253d3f307b334882be758636caedf7fcc","txlist_hash":"ba55fd791587dad14742ad66d1515992a076eefbd54d1215806aa9db3811cf50"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(92,310012,'insert','blocks','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(93,310013,'insert','transactions','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"btc_amount":5430,"data":"00000028000152bb336400000000017d78400000000002793d60000000000000000000003b100000000a","destination":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"e566ab052d414d2c9b9d6ffc643bc5d2b31d80976dffe7acceaf2576246f9e42","tx_index":14}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(94,310013,'update','orders','{"status":"expired","tx_hash":"6bdb2ef465e9fc04060f58ced26c159dc983a616cb121c5e7954e66833444c59"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(95,310013,'insert','order_expirations','{"block_index":310013,"order_hash":"6bdb2ef465e9fc04060f58ced26c159dc983a616cb121c5e7954e66833444c59","source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc"}',0,'ORDER_EXPIRATION');
-INSERT INTO messages VALUES(96,310013,'insert','debits','{"action":"bet","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310013,"event":"e566ab052d414d2c9b9d6ffc643bc5d2b31d80976dffe7acceaf2576246f9e42","quantity":25000000,"tx_index":14}',0,'DEBIT');
-INSERT INTO messages VALUES(97,310013,'insert','bets','{"bet_type":1,"block_index":310013,"counterwager_quantity":41500000,"counterwager_remaining":41500000,"deadline":1388000100,"expiration":10,"expire_index":310023,"fee_fraction_int":99999999.0,"feed_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","leverage":15120,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","target_value":0.0,"tx_hash":"e566ab052d414d2c9b9d6ffc643bc5d2b31d80976dffe7acceaf2576246f9e42","tx_index":14,"wager_quantity":25000000,"wager_remaining":25000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(98,310013,'update','bets','{"counterwager_remaining":4250000,"status":"open","tx_hash":"7025ded3ba412d1285be69c8aaa02773b8f4e2504310832c99a9b171b7e07e81","wager_remaining":8500000}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(99,310013,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310013,"calling_function":"filled","event":"e566ab052d414d2c9b9d6ffc643bc5d2b31d80976dffe7acceaf2576246f9e42","quantity":4250000,"tx_index":14}',0,'CREDIT');
-INSERT INTO messages VALUES(100,310013,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"e566ab052d414d2c9b9d6ffc643bc5d2b31d80976dffe7acceaf2576246f9e42","wager_remaining":4250000}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(101,310013,'insert','bet_matches','{"backward_quantity":20750000,"block_index":310012,"deadline":1388000100,"fee_fraction_int":99999999,"feed_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","forward_quantity":41500000,"id":"7025ded3ba412d1285be69c8aaa02773b8f4e2504310832c99a9b171b7e07e81_e566ab052d414d2c9b9d6ffc643bc5d2b31d80976dffe7acceaf2576246f9e42","initial_value":100.0,"leverage":15120,"match_expire_index":310022,"status":"pending","target_value":0.0,"tx0_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","tx0_bet_type":0,"tx0_block_index":310012,"tx0_expiration":10,"tx0_hash":"7025ded3ba412d1285be69c8aaa02773b8f4e2504310832c99a9b171b7e07e81","tx0_index":13,"tx1_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","tx1_bet_type":1,"tx1_block_index":310013,"tx1_expiration":10,"tx1_hash":"e566ab052d414d2c9b9d6ffc643bc5d2b31d80976dffe7acceaf2576246f9e42","tx1_index":14}',0,'BET_MATCH');
-INSERT INTO messages VALUES(102,310013,'parse','transactions','{"supported":true,"tx_hash":"e566ab052d414d2c9b9d6ffc643bc5d2b31d80976dffe7acceaf2576246f9e42","tx_index":14}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(103,310013,'parse','blocks','{"block_index":310013,"ledger_hash":"cd0cfff6de5dd4381301929c740015d5910339ba915a83eb4229ecb91ae84c17","messages_hash":"7386c24d72b2b17bfb3baa53dbc6b04cadbc19bcccb00a1a99fc9e014f594533","txlist_hash":"6c03bbdc682356647ad229247ed9d4000c2ffd03696695e0277c43b4e4d8fed8"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(104,310013,'insert','blocks','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(105,310014,'insert','transactions','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"btc_amount":5430,"data":"00000028000052bb33640000000008f0d1800000000014dc93800000000000000000000013b00000000a","destination":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"3d3ae119aa3891770b7ae1e1ce34062b7a850593f39a96b6df19d69960d4a76a","tx_index":15}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(106,310014,'update','orders','{"status":"expired","tx_hash":"36d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(107,310014,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310014,"calling_function":"cancel order","event":"36d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c","quantity":5000000,"tx_index":0}',0,'CREDIT');
-INSERT INTO messages VALUES(108,310014,'insert','order_expirations','{"block_index":310014,"order_hash":"36d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c","source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc"}',0,'ORDER_EXPIRATION');
-INSERT INTO messages VALUES(109,310014,'insert','debits','{"action":"bet","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310014,"event":"3d3ae119aa3891770b7ae1e1ce34062b7a850593f39a96b6df19d69960d4a76a","quantity":150000000,"tx_index":15}',0,'DEBIT');
-INSERT INTO messages VALUES(110,310014,'insert','bets','{"bet_type":0,"block_index":310014,"counterwager_quantity":350000000,"counterwager_remaining":350000000,"deadline":1388000100,"expiration":10,"expire_index":310024,"fee_fraction_int":99999999.0,"feed_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","leverage":5040,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","target_value":0.0,"tx_hash":"3d3ae119aa3891770b7ae1e1ce34062b7a850593f39a96b6df19d69960d4a76a","tx_index":15,"wager_quantity":150000000,"wager_remaining":150000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(111,310014,'parse','transactions','{"supported":true,"tx_hash":"3d3ae119aa3891770b7ae1e1ce34062b7a850593f39a96b6df19d69960d4a76a","tx_index":15}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(112,310014,'parse','blocks','{"block_index":310014,"ledger_hash":"5012d84065c7a39b5563f4fadeaf30670b47df3856f43d40fda74de663753e4e","messages_hash":"a34442f144f48eda8ed839bddf2280067bb9831e7fc5f8012fa257cceef0f77c","txlist_hash":"99b41cf441ebd1ad46c14b34a3da79586aee124ae643f196f23f0eadb9fbe50d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(113,310014,'insert','blocks','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(114,310015,'insert','transactions','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"btc_amount":5430,"data":"00000028000152bb33640000000014dc93800000000008f0d1800000000000000000000013b00000000a","destination":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"a73843f1c9197674ba45e3aa92ed0671062c8acd8955e6b1e4d10dd149f40bc8","tx_index":16}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(115,310015,'insert','debits','{"action":"bet","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310015,"event":"a73843f1c9197674ba45e3aa92ed0671062c8acd8955e6b1e4d10dd149f40bc8","quantity":350000000,"tx_index":16}',0,'DEBIT');
-INSERT INTO messages VALUES(116,310015,'insert','bets','{"bet_type":1,"block_index":310015,"counterwager_quantity":150000000,"counterwager_remaining":150000000,"deadline":1388000100,"expiration":10,"expire_index":310025,"fee_fraction_int":99999999.0,"feed_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","leverage":5040,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","target_value":0.0,"tx_hash":"a73843f1c9197674ba45e3aa92ed0671062c8acd8955e6b1e4d10dd149f40bc8","tx_index":16,"wager_quantity":350000000,"wager_remaining":350000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(117,310015,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310015,"calling_function":"filled","event":"a73843f1c9197674ba45e3aa92ed0671062c8acd8955e6b1e4d10dd149f40bc8","quantity":0,"tx_index":16}',0,'CREDIT');
-INSERT INTO messages VALUES(118,310015,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"3d3ae119aa3891770b7ae1e1ce34062b7a850593f39a96b6df19d69960d4a76a","wager_remaining":0}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(119,310015,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310015,"calling_function":"filled","event":"a73843f1c9197674ba45e3aa92ed0671062c8acd8955e6b1e4d10dd149f40bc8","quantity":0,"tx_index":16}',0,'CREDIT');
-INSERT INTO messages VALUES(120,310015,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"a73843f1c9197674ba45e3aa92ed0671062c8acd8955e6b1e4d10dd149f40bc8","wager_remaining":0}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(121,310015,'insert','bet_matches','{"backward_quantity":350000000,"block_index":310014,"deadline":1388000100,"fee_fraction_int":99999999,"feed_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","forward_quantity":150000000,"id":"3d3ae119aa3891770b7ae1e1ce34062b7a850593f39a96b6df19d69960d4a76a_a73843f1c9197674ba45e3aa92ed0671062c8acd8955e6b1e4d10dd149f40bc8","initial_value":100.0,"leverage":5040,"match_expire_index":310024,"status":"pending","target_value":0.0,"tx0_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","tx0_bet_type":0,"tx0_block_index":310014,"tx0_expiration":10,"tx0_hash":"3d3ae119aa3891770b7ae1e1ce34062b7a850593f39a96b6df19d69960d4a76a","tx0_index":15,"tx1_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","tx1_bet_type":1,"tx1_block_index":310015,"tx1_expiration":10,"tx1_hash":"a73843f1c9197674ba45e3aa92ed0671062c8acd8955e6b1e4d10dd149f40bc8","tx1_index":16}',0,'BET_MATCH');
-INSERT INTO messages VALUES(122,310015,'parse','transactions','{"supported":true,"tx_hash":"a73843f1c9197674ba45e3aa92ed0671062c8acd8955e6b1e4d10dd149f40bc8","tx_index":16}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(123,310015,'parse','blocks','{"block_index":310015,"ledger_hash":"0356494d376b2b65b9f4b066b9d2baf2ae90d82369b87914bb58a67927ced5af","messages_hash":"971f87fb66232464062c83cdec0c175d6e326e973598324ff2c2fbac8e081b2e","txlist_hash":"c6fff3cf22683f773cf2941f0eb9b5ed84647569c76d40cba61ca444852fceb6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(124,310015,'insert','blocks','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(125,310016,'insert','transactions','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"btc_amount":5430,"data":"00000028000252bb33c8000000002cb417800000000026be36803ff0000000000000000013b00000000a","destination":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"194a87d56aecedf43bb9724b6f20f10626c26c00267fd108db843772e5ee41f5","tx_index":17}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(126,310016,'insert','debits','{"action":"bet","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310016,"event":"194a87d56aecedf43bb9724b6f20f10626c26c00267fd108db843772e5ee41f5","quantity":750000000,"tx_index":17}',0,'DEBIT');
-INSERT INTO messages VALUES(127,310016,'insert','bets','{"bet_type":2,"block_index":310016,"counterwager_quantity":650000000,"counterwager_remaining":650000000,"deadline":1388000200,"expiration":10,"expire_index":310026,"fee_fraction_int":99999999.0,"feed_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","leverage":5040,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","target_value":1.0,"tx_hash":"194a87d56aecedf43bb9724b6f20f10626c26c00267fd108db843772e5ee41f5","tx_index":17,"wager_quantity":750000000,"wager_remaining":750000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(128,310016,'parse','transactions','{"supported":true,"tx_hash":"194a87d56aecedf43bb9724b6f20f10626c26c00267fd108db843772e5ee41f5","tx_index":17}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(129,310016,'parse','blocks','{"block_index":310016,"ledger_hash":"c90ff439bd04970ed9e6e25cbfce32160450925a37ba3360f40df8854529b52d","messages_hash":"1e6547529c58138a1970ef457d8c2296c1742e41976424215f7606176301cc02","txlist_hash":"16e32aeb7155ac1b89e47925bb2367269d4fc81e9da0558266ad9722843202fd"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(130,310016,'insert','blocks','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(131,310017,'insert','transactions','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"btc_amount":5430,"data":"00000028000352bb33c80000000026be3680000000002cb417803ff0000000000000000013b00000000a","destination":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"72baa141e136cbafc08ee2f6c8e5841076c7573d5d5cd619f45149bf84a6a207","tx_index":18}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(132,310017,'insert','debits','{"action":"bet","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310017,"event":"72baa141e136cbafc08ee2f6c8e5841076c7573d5d5cd619f45149bf84a6a207","quantity":650000000,"tx_index":18}',0,'DEBIT');
-INSERT INTO messages VALUES(133,310017,'insert','bets','{"bet_type":3,"block_index":310017,"counterwager_quantity":750000000,"counterwager_remaining":750000000,"deadline":1388000200,"expiration":10,"expire_index":310027,"fee_fraction_int":99999999.0,"feed_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","leverage":5040,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","target_value":1.0,"tx_hash":"72baa141e136cbafc08ee2f6c8e5841076c7573d5d5cd619f45149bf84a6a207","tx_index":18,"wager_quantity":650000000,"wager_remaining":650000000}',0,'OPEN_BET');
-INSERT INTO messages VALUES(134,310017,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310017,"calling_function":"filled","event":"72baa141e136cbafc08ee2f6c8e5841076c7573d5d5cd619f45149bf84a6a207","quantity":0,"tx_index":18}',0,'CREDIT');
-INSERT INTO messages VALUES(135,310017,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"194a87d56aecedf43bb9724b6f20f10626c26c00267fd108db843772e5ee41f5","wager_remaining":0}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(136,310017,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310017,"calling_function":"filled","event":"72baa141e136cbafc08ee2f6c8e5841076c7573d5d5cd619f45149bf84a6a207","quantity":0,"tx_index":18}',0,'CREDIT');
-INSERT INTO messages VALUES(137,310017,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"72baa141e136cbafc08ee2f6c8e5841076c7573d5d5cd619f45149bf84a6a207","wager_remaining":0}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(138,310017,'insert','bet_matches','{"backward_quantity":650000000,"block_index":310016,"deadline":1388000200,"fee_fraction_int":99999999,"feed_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","forward_quantity":750000000,"id":"194a87d56aecedf43bb9724b6f20f10626c26c00267fd108db843772e5ee41f5_72baa141e136cbafc08ee2f6c8e5841076c7573d5d5cd619f45149bf84a6a207","initial_value":100.0,"leverage":5040,"match_expire_index":310026,"status":"pending","target_value":1.0,"tx0_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","tx0_bet_type":2,"tx0_block_index":310016,"tx0_expiration":10,"tx0_hash":"194a87d56aecedf43bb9724b6f20f10626c26c00267fd108db843772e5ee41f5","tx0_index":17,"tx1_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","tx1_bet_type":3,"tx1_block_index":310017,"tx1_expiration":10,"tx1_hash":"72baa141e136cbafc08ee2f6c8e5841076c7573d5d5cd619f45149bf84a6a207","tx1_index":18}',0,'BET_MATCH');
-INSERT INTO messages VALUES(139,310017,'parse','transactions','{"supported":true,"tx_hash":"72baa141e136cbafc08ee2f6c8e5841076c7573d5d5cd619f45149bf84a6a207","tx_index":18}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(140,310017,'parse','blocks','{"block_index":310017,"ledger_hash":"19cf18f708dab6a983a2642802deb38d25b6fc205ea663059a0569fa38bdaf8d","messages_hash":"9b869953cdad0502b038662de44f11fccffc976ad21182d94af502409754f6c8","txlist_hash":"94709d5f6bcb8df437947be80ac95e2e716a92645f3eec2d915cb7c088504f1c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(141,310017,'insert','blocks','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(142,310018,'insert','transactions','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"btc_amount":0,"data":"0000001e52bb33324058f7256ffc115e004c4b4009556e69742054657374","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"065de641fd87c0b3ef893130ef4a3dca7643b7a35f6d18c721f34a7a36a5992f","tx_index":19}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(143,310018,'insert','broadcasts','{"block_index":310018,"fee_fraction_int":5000000,"locked":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","text":"Unit Test","timestamp":1388000050,"tx_hash":"065de641fd87c0b3ef893130ef4a3dca7643b7a35f6d18c721f34a7a36a5992f","tx_index":19,"value":99.86166}',0,'BROADCAST');
-INSERT INTO messages VALUES(144,310018,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310018,"calling_function":"bet settled: liquidated for bear","event":"065de641fd87c0b3ef893130ef4a3dca7643b7a35f6d18c721f34a7a36a5992f","quantity":59137500,"tx_index":19}',0,'CREDIT');
-INSERT INTO messages VALUES(145,310018,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310018,"calling_function":"feed fee","event":"065de641fd87c0b3ef893130ef4a3dca7643b7a35f6d18c721f34a7a36a5992f","quantity":3112500,"tx_index":19}',0,'CREDIT');
-INSERT INTO messages VALUES(146,310018,'insert','bet_match_resolutions','{"bear_credit":59137500,"bet_match_id":"7025ded3ba412d1285be69c8aaa02773b8f4e2504310832c99a9b171b7e07e81_e566ab052d414d2c9b9d6ffc643bc5d2b31d80976dffe7acceaf2576246f9e42","bet_match_type_id":1,"block_index":310018,"bull_credit":0,"escrow_less_fee":null,"fee":3112500,"settled":false,"winner":null}',0,'BET_MATCH_RESOLUTON');
-INSERT INTO messages VALUES(147,310018,'update','bet_matches','{"id":"7025ded3ba412d1285be69c8aaa02773b8f4e2504310832c99a9b171b7e07e81_e566ab052d414d2c9b9d6ffc643bc5d2b31d80976dffe7acceaf2576246f9e42","status":"settled: liquidated for bear"}',0,'BET_MATCH_UPDATE');
-INSERT INTO messages VALUES(148,310018,'parse','transactions','{"supported":true,"tx_hash":"065de641fd87c0b3ef893130ef4a3dca7643b7a35f6d18c721f34a7a36a5992f","tx_index":19}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(149,310018,'parse','blocks','{"block_index":310018,"ledger_hash":"d9ac565fbe7bf18c1d899dab8e0c98e070880e36fa51710382017d46ddf837cf","messages_hash":"b7b696036883d92a4d4bab709ff2b1d82ea9894f5a3c74be752b7616c7a2f68c","txlist_hash":"e3e2ebfcee41e92d855051b2c2e4344600646ac3ac5b335084d5f5a23e872f3b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(150,310018,'insert','blocks','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(151,310019,'insert','transactions','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"btc_amount":0,"data":"0000001e52bb3365405915f3b645a1cb004c4b4009556e69742054657374","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"7cc015005c559686a8e10294015ca1773c0bcd9f4d7d9768deb4bb94cdd4a69e","tx_index":20}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(152,310019,'insert','broadcasts','{"block_index":310019,"fee_fraction_int":5000000,"locked":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","text":"Unit Test","timestamp":1388000101,"tx_hash":"7cc015005c559686a8e10294015ca1773c0bcd9f4d7d9768deb4bb94cdd4a69e","tx_index":20,"value":100.343}',0,'BROADCAST');
-INSERT INTO messages VALUES(153,310019,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310019,"calling_function":"bet settled","event":"7cc015005c559686a8e10294015ca1773c0bcd9f4d7d9768deb4bb94cdd4a69e","quantity":159300000,"tx_index":20}',0,'CREDIT');
-INSERT INTO messages VALUES(154,310019,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310019,"calling_function":"bet settled","event":"7cc015005c559686a8e10294015ca1773c0bcd9f4d7d9768deb4bb94cdd4a69e","quantity":315700000,"tx_index":20}',0,'CREDIT');
-INSERT INTO messages VALUES(155,310019,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310019,"calling_function":"feed fee","event":"7cc015005c559686a8e10294015ca1773c0bcd9f4d7d9768deb4bb94cdd4a69e","quantity":25000000,"tx_index":20}',0,'CREDIT');
-INSERT INTO messages VALUES(156,310019,'insert','bet_match_resolutions','{"bear_credit":315700000,"bet_match_id":"3d3ae119aa3891770b7ae1e1ce34062b7a850593f39a96b6df19d69960d4a76a_a73843f1c9197674ba45e3aa92ed0671062c8acd8955e6b1e4d10dd149f40bc8","bet_match_type_id":1,"block_index":310019,"bull_credit":159300000,"escrow_less_fee":null,"fee":25000000,"settled":true,"winner":null}',0,'BET_MATCH_RESOLUTON');
-INSERT INTO messages VALUES(157,310019,'update','bet_matches','{"id":"3d3ae119aa3891770b7ae1e1ce34062b7a850593f39a96b6df19d69960d4a76a_a73843f1c9197674ba45e3aa92ed0671062c8acd8955e6b1e4d10dd149f40bc8","status":"settled"}',0,'BET_MATCH_UPDATE');
-INSERT INTO messages VALUES(158,310019,'parse','transactions','{"supported":true,"tx_hash":"7cc015005c559686a8e10294015ca1773c0bcd9f4d7d9768deb4bb94cdd4a69e","tx_index":20}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(159,310019,'parse','blocks','{"block_index":310019,"ledger_hash":"b66661deef419a50557d171cc1bcae04f5bc260ed1f5ff56cf08ef39158617a1","messages_hash":"1cefa71f85a09e70ef26efc854fc288f669f4b098fa553f7be0f448703900bf4","txlist_hash":"c89d7fa5df5eab9ac8a57f00c6cc2b9d75244ce412e12eb842c6a43297ee41a6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(160,310019,'insert','blocks','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(161,310020,'insert','transactions','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"btc_amount":0,"data":"0000001e52bb33c94000000000000000004c4b4009556e69742054657374","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"0899b8bccef3403252fd7d37ec550eea3350845dca098368b84bf4c3c48d3fc9","tx_index":21}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(162,310020,'insert','broadcasts','{"block_index":310020,"fee_fraction_int":5000000,"locked":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","text":"Unit Test","timestamp":1388000201,"tx_hash":"0899b8bccef3403252fd7d37ec550eea3350845dca098368b84bf4c3c48d3fc9","tx_index":21,"value":2.0}',0,'BROADCAST');
-INSERT INTO messages VALUES(163,310020,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310020,"calling_function":"bet settled: for notequal","event":"0899b8bccef3403252fd7d37ec550eea3350845dca098368b84bf4c3c48d3fc9","quantity":1330000000,"tx_index":21}',0,'CREDIT');
-INSERT INTO messages VALUES(164,310020,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310020,"calling_function":"feed fee","event":"0899b8bccef3403252fd7d37ec550eea3350845dca098368b84bf4c3c48d3fc9","quantity":70000000,"tx_index":21}',0,'CREDIT');
-INSERT INTO messages VALUES(165,310020,'insert','bet_match_resolutions','{"bear_credit":null,"bet_match_id":"194a87d56aecedf43bb9724b6f20f10626c26c00267fd108db843772e5ee41f5_72baa141e136cbafc08ee2f6c8e5841076c7573d5d5cd619f45149bf84a6a207","bet_match_type_id":5,"block_index":310020,"bull_credit":null,"escrow_less_fee":1330000000,"fee":70000000,"settled":null,"winner":"NotEqual"}',0,'BET_MATCH_RESOLUTON');
-INSERT INTO messages VALUES(166,310020,'update','bet_matches','{"id":"194a87d56aecedf43bb9724b6f20f10626c26c00267fd108db843772e5ee41f5_72baa141e136cbafc08ee2f6c8e5841076c7573d5d5cd619f45149bf84a6a207","status":"settled: for notequal"}',0,'BET_MATCH_UPDATE');
-INSERT INTO messages VALUES(167,310020,'parse','transactions','{"supported":true,"tx_hash":"0899b8bccef3403252fd7d37ec550eea3350845dca098368b84bf4c3c48d3fc9","tx_index":21}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(168,310020,'parse','blocks','{"block_index":310020,"ledger_hash":"57a6c53e41338011cb06cd60118961dcec0e800f62a2c4b1e9381c666319680f","messages_hash":"df81bfb67fb3c30f1d0a6d73b72cb9bbdec225725b5b3f43ddcdc575b89e5400","txlist_hash":"5d8f062b1b5c6740eed53d90f4cd10a23f273237bda588f42fa35653a9fe5feb"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(169,310020,'insert','blocks','{"block_hash":"7c2460bb32c5749c856486393239bf7a0ac789587ac71f32e7237910da8097f2","block_index":310021,"block_time":310021000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(170,310021,'insert','transactions','{"block_hash":"7c2460bb32c5749c856486393239bf7a0ac789587ac71f32e7237910da8097f2","block_index":310021,"block_time":310021000,"btc_amount":0,"data":"0000000a00000000000047670000000002faf08000000000000000010000000002faf080000a0000000000000000","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"eb5953f4e1dec30f0bf4741cb2044c11b6e1c3be20fef2111461f69d989b852a","tx_index":22}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(171,310021,'insert','debits','{"action":"open order","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"BBBB","block_index":310021,"event":"eb5953f4e1dec30f0bf4741cb2044c11b6e1c3be20fef2111461f69d989b852a","quantity":50000000,"tx_index":22}',0,'DEBIT');
-INSERT INTO messages VALUES(172,310021,'insert','orders','{"block_index":310021,"expiration":10,"expire_index":310031,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":50000000,"get_remaining":50000000,"give_asset":"BBBB","give_quantity":50000000,"give_remaining":50000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","tx_hash":"eb5953f4e1dec30f0bf4741cb2044c11b6e1c3be20fef2111461f69d989b852a","tx_index":22}',0,'OPEN_ORDER');
-INSERT INTO messages VALUES(173,310021,'parse','transactions','{"supported":true,"tx_hash":"eb5953f4e1dec30f0bf4741cb2044c11b6e1c3be20fef2111461f69d989b852a","tx_index":22}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(174,310021,'parse','blocks','{"block_index":310021,"ledger_hash":"66c16af10125f298796da828f1a6c2b43123cda38e3dfc57ccc25b00f3da17f8","messages_hash":"0a49d35ea7c0d8d382b303f2462c1c8a78725dfeb8f1e374cc7fe8222111987f","txlist_hash":"94b751bb8af2f91fb1933dfae1edaa636836fe1f9100edc5c6b8bc793fea4b47"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(175,310021,'insert','blocks','{"block_hash":"44435f9a99a0aa12a9bfabdc4cb8119f6ea6a6e1350d2d65445fb66a456db5fc","block_index":310022,"block_time":310022000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(176,310022,'insert','transactions','{"block_hash":"44435f9a99a0aa12a9bfabdc4cb8119f6ea6a6e1350d2d65445fb66a456db5fc","block_index":310022,"block_time":310022000,"btc_amount":100000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":10150,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"c3f73d02e630cb2824f044e6d91f47b1ce351feff0339ea7b85652d24d8ff6bc","tx_index":23}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(177,310022,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310022,"calling_function":"burn","event":"c3f73d02e630cb2824f044e6d91f47b1ce351feff0339ea7b85652d24d8ff6bc","quantity":56999887262,"tx_index":23}',0,'CREDIT');
-INSERT INTO messages VALUES(178,310022,'insert','burns','{"block_index":310022,"burned":38000000,"earned":56999887262,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"c3f73d02e630cb2824f044e6d91f47b1ce351feff0339ea7b85652d24d8ff6bc","tx_index":23}',0,'BURN');
-INSERT INTO messages VALUES(179,310022,'parse','blocks','{"block_index":310022,"ledger_hash":"43b6213cad601a389aed2a4e912be118dfab6cca5358d86bac03f4bee6765493","messages_hash":"5a7e3ebeb25bf887ea951d37c55d30b5461d52e45a8cd40e9cc3abd15c1e8b86","txlist_hash":"fcb847408d5ee30ef86a94a0495f53670b1157d4f33d627b62ebd84fb1321cf5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(180,310022,'insert','blocks','{"block_hash":"d8cf5bec1bbcab8ca4f495352afde3b6572b7e1d61b3976872ebb8e9d30ccb08","block_index":310023,"block_time":310023000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(181,310023,'insert','transactions','{"block_hash":"d8cf5bec1bbcab8ca4f495352afde3b6572b7e1d61b3976872ebb8e9d30ccb08","block_index":310023,"block_time":310023000,"btc_amount":5430,"data":"0000000000000000000047680000000000002710","destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"58b89d056b539d2cf9ddac4518ccca6744495127e0ce893eb71da2599cbf85ab","tx_index":24}',0,'NEW_TRANSACTION');
-INSERT INTO messages VALUES(182,310023,'update','bets','{"status":"expired","tx_hash":"7025ded3ba412d1285be69c8aaa02773b8f4e2504310832c99a9b171b7e07e81"}',0,'BET_UPDATE');
-INSERT INTO messages VALUES(183,310023,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310023,"calling_function":"recredit wager remaining","event":"7025ded3ba412d1285be69c8aaa02773b8f4e2504310832c99a9b171b7e07e81","quantity":8500000,"tx_index":0}',0,'CREDIT');
-INSERT INTO messages VALUES(184,310023,'insert','bet_expirations','{"bet_hash":"7025ded3ba412d1285be69c8aaa02773b8f4e2504310832c99a9b171b7e07e81","bet_index":13,"block_index":310023,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc"}',0,'BET_EXPIRATION');
-INSERT INTO messages VALUES(185,310023,'insert','debits','{"action":"send","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"BBBC","block_index":310023,"event":"58b89d056b539d2cf9ddac4518ccca6744495127e0ce893eb71da2599cbf85ab","quantity":10000,"tx_index":24}',0,'DEBIT');
-INSERT INTO messages VALUES(186,310023,'insert','credits','{"address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"BBBC","block_index":310023,"calling_function":"send","event":"58b89d056b539d2cf9ddac4518ccca6744495127e0ce893eb71da2599cbf85ab","quantity":10000,"tx_index":24}',0,'CREDIT');
-INSERT INTO messages VALUES(187,310023,'insert','sends','{"asset":"BBBC","block_index":310023,"destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","quantity":10000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"58b89d056b539d2cf9ddac4518ccca6744495127e0ce893eb71da2599cbf85ab","tx_index":24}',0,'SEND');
-INSERT INTO messages VALUES(188,310023,'parse','transactions','{"supported":true,"tx_hash":"58b89d056b539d2cf9ddac4518ccca6744495127e0ce893eb71da2599cbf85ab","tx_index":24}',0,'TRANSACTION_PARSED');
-INSERT INTO messages VALUES(189,310023,'parse','blocks','{"block_index":310023,"ledger_hash":"8a9758963891bbfbdcb6515d8d3e49c941fedba7de82038776e9f8ed65e803c1","messages_hash":"7aa46117102c62f460f667fd79f116bda42b266f0e384f209527d60b56753299","txlist_hash":"d21109a870f8542e8ef40f6d72e36fb0bb5ac4ad1e7b3232ba1b2bdcc735810e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(190,310023,'insert','blocks','{"block_hash":"b03042b4e18a222b4c8d1e9e1970d93e6e2a2d41686d227ff8ecf0a839223dc5","block_index":310024,"block_time":310024000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(191,310024,'parse','blocks','{"block_index":310024,"ledger_hash":"cb034ab4a3e252fdfe9973a672e208295741a52634c9332b1501d612e0012e19","messages_hash":"d42bf4e0b63695149ee35307cdcdda6613234dfa95fc4f90385fb4cb964d013c","txlist_hash":"52bcbfb439bfc9cf14e38d39a9d6c401a8798a20fe64238f070125e8e7905151"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(192,310024,'insert','blocks','{"block_hash":"a872e560766832cc3b4f7f222228cb6db882ce3c54f6459f62c71d5cd6e90666","block_index":310025,"block_time":310025000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(193,310025,'parse','blocks','{"block_index":310025,"ledger_hash":"5addc8253469d5c729cdffc1c637b75d9e8886a633d4406dedf2b1c16ba5b92a","messages_hash":"6c12fc7540de124823bc0fc2e03f016f02bb33a7679f87335857baf740946816","txlist_hash":"e2d8891737534dde276dd1f7f51d42558b9ad60d88baada83f75951905e6f174"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(194,310025,'insert','blocks','{"block_hash":"6c96350f6f2f05810f19a689de235eff975338587194a36a70dfd0fcd490941a","block_index":310026,"block_time":310026000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(195,310026,'parse','blocks','{"block_index":310026,"ledger_hash":"8620bd0283c320330631185d1b2351718f174732bd099324a0880719cdfc18c7","messages_hash":"6ffccd6d55f048c0116fab0af2d249ba002a1146517b4232f6ad1079c7cea9bd","txlist_hash":"e7b6699c8b2b5857b60004dec9aa8aeda30ef42483ca16bc79e4ecdc1c0b4ce7"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(196,310026,'insert','blocks','{"block_hash":"d7acfac66df393c4482a14c189742c0571b89442eb7f817b34415a560445699e","block_index":310027,"block_time":310027000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(197,310027,'parse','blocks','{"block_index":310027,"ledger_hash":"96960e09478184f4f0ad38d1fc03f0c0240e58715a0a29745a6dc58c40003249","messages_hash":"78a07b4b6cad61df9c669c30ce670f65df7c9520e3889073a1ccfd229b1bc60f","txlist_hash":"a7e32b5f0b6568eff793a1d12d32ab594f3886b417a6491b6ec641d15e906e9e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(198,310027,'insert','blocks','{"block_hash":"02409fcf8fa06dafcb7f11e38593181d9c42cc9d5e2ddc304d098f990bd9530b","block_index":310028,"block_time":310028000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(199,310028,'parse','blocks','{"block_index":310028,"ledger_hash":"2f556d2528abe1c4e9d31f6ed70d400d94633d4dfb54c9a4f250e1b054f9a384","messages_hash":"5cebc5467f3918ed4d618643a8e6201bce7803ceb72b833fceae513c79551fa1","txlist_hash":"8b22bfc6153a2e742e843a5263194ffcf3ab985d934e212266ca400ed568e710"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(200,310028,'insert','blocks','{"block_hash":"3c739fa8b40c118d5547ea356ee8d10ee2898871907643ec02e5db9d00f03cc6","block_index":310029,"block_time":310029000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(201,310029,'parse','blocks','{"block_index":310029,"ledger_hash":"be195b1f7b7b55dcefb83907d954736d4bf059a9e32055131efd16602d7761d6","messages_hash":"faec53519d22e82c65d28effff3bba8236d89b38ac79edb3c808102bc6682658","txlist_hash":"ad8654356f0a1ffb669528bf4c3625e9d43ce08d9dda7f1adc2e962b65d20b55"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(202,310029,'insert','blocks','{"block_hash":"d5071cddedf89765ee0fd58f209c1c7d669ba8ea66200a57587da8b189b9e4f5","block_index":310030,"block_time":310030000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(203,310030,'parse','blocks','{"block_index":310030,"ledger_hash":"d3a25656dbb63eecf1c89820581fcab193d750f3a09ca8ab34a5008c8d89051d","messages_hash":"1e3c12ea29a0c893e4cd24e7d743153d6f2d8dce1850c750a8a654950836ac73","txlist_hash":"f9a6fb698ab5cf74c1d334f2bc3fc258738c330a5bf3614b8951c6f2d90263a1"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(204,310030,'insert','blocks','{"block_hash":"0b02b10f41380fff27c543ea8891ecb845bf7a003ac5c87e15932aff3bfcf689","block_index":310031,"block_time":310031000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(205,310031,'parse','blocks','{"block_index":310031,"ledger_hash":"0edb535f8c6a40062a86e4ea327cf7fb70310b6d55a6654d5a23e54498aa3159","messages_hash":"1f7c139549d1628bd43d4ad4f882cf1ab4959aae732600941290d49df8258d47","txlist_hash":"52c64812c82695720461525033471afc39749f788156239b06f72c7887206fa4"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(206,310031,'insert','blocks','{"block_hash":"66346be81e6ba04544f2ae643b76c2b7b1383f038fc2636e02e49dc7ec144074","block_index":310032,"block_time":310032000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(207,310032,'update','orders','{"status":"expired","tx_hash":"eb5953f4e1dec30f0bf4741cb2044c11b6e1c3be20fef2111461f69d989b852a"}',0,'ORDER_UPDATE');
-INSERT INTO messages VALUES(208,310032,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"BBBB","block_index":310032,"calling_function":"cancel order","event":"eb5953f4e1dec30f0bf4741cb2044c11b6e1c3be20fef2111461f69d989b852a","quantity":50000000,"tx_index":0}',0,'CREDIT');
-INSERT INTO messages VALUES(209,310032,'insert','order_expirations','{"block_index":310032,"order_hash":"eb5953f4e1dec30f0bf4741cb2044c11b6e1c3be20fef2111461f69d989b852a","source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc"}',0,'ORDER_EXPIRATION');
-INSERT INTO messages VALUES(210,310032,'parse','blocks','{"block_index":310032,"ledger_hash":"a9208a1b7f782852d652e5089c6485744031176b4d285ea985bbc1df0ccf49c0","messages_hash":"50cf00394dc4dc4028f5373e81809d11afad9da1ac790b78371850b3e4f09484","txlist_hash":"4089c5ee6e83c7fdb9d8f0df917268b807801e7f0fb477b6a7fb4b9f931601f0"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(211,310032,'insert','blocks','{"block_hash":"999c65df9661f73e8c01f1da1afda09ac16788b72834f0ff5ea3d1464afb4707","block_index":310033,"block_time":310033000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(212,310033,'parse','blocks','{"block_index":310033,"ledger_hash":"c8a973eb6bdd28dcab4f1b2a5e29e104944745e57a54e6d87b370aafb2e589f6","messages_hash":"57617659dfd3672b306a544fbf3419b2a77525588d83fdafcf27f133cd8cc027","txlist_hash":"28e9816084711e62a27a7d33af7a023d9c375d67c6d7dd4fbe840d511d114fbb"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(213,310033,'insert','blocks','{"block_hash":"f552edd2e0a648230f3668e72ddf0ddfb1e8ac0f4c190f91b89c1a8c2e357208","block_index":310034,"block_time":310034000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(214,310034,'parse','blocks','{"block_index":310034,"ledger_hash":"0d7b5809b7a5aa5ff854cfe141490a78c9b33e16f8102a8e804dbf0a0a8c0842","messages_hash":"918e7a686526c32d037a4a5634c04a4bc527d1e94261b300278950cc47c56831","txlist_hash":"37532a1b8cba78b522775b2feabd9dc786b259b49ae54af0279fd84061fcaf90"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(215,310034,'insert','blocks','{"block_hash":"a13cbb016f3044207a46967a4ba1c87dab411f78c55c1179f2336653c2726ae2","block_index":310035,"block_time":310035000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(216,310035,'parse','blocks','{"block_index":310035,"ledger_hash":"6b4c99289086445a7bf575110172a661c1cd37c418b70afd8ef3be0982041f5e","messages_hash":"923e8dfd3279b7777a65ef4a0d31253cf092b52467d725ffa578114ee5707e1d","txlist_hash":"6d74b1faad84274944078e3fa21083b3776e37da614acfc8d61987a1a48db51e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(217,310035,'insert','blocks','{"block_hash":"158648a98f1e1bd1875584ce8449eb15a4e91a99a923bbb24c4210135cef0c76","block_index":310036,"block_time":310036000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(218,310036,'parse','blocks','{"block_index":310036,"ledger_hash":"f20b81389b2f4c9c9be4442b3c68f87da881406f1490637c7d93d63539155a7e","messages_hash":"b4119937e540d23b8c91810b6a3a712e123b010ba64f6d0ec2e7513965677c80","txlist_hash":"246e6cb136a8e79ad87ccc6a2318361c689d4720a9000c1a404f3556dced1bfb"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(219,310036,'insert','blocks','{"block_hash":"563acfd6d991ce256d5655de2e9429975c8dceeb221e76d5ec6e9e24a2c27c07","block_index":310037,"block_time":310037000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(220,310037,'parse','blocks','{"block_index":310037,"ledger_hash":"52d554e6b53b853066a3a8f931fc37779f3596c4388e277a9f66a95e001a09eb","messages_hash":"08a26261dd5a60bd70efbc193b8c7541642b38853e7e7fc5b85e8fdf8b94ecf8","txlist_hash":"c4474243bf31bccb8aa11963c477e3d40bbdbf6c604edd86429c37b59d83b427"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(221,310037,'insert','blocks','{"block_hash":"b44b4cad12431c32df27940e18d51f63897c7472b70950d18454edfd640490b2","block_index":310038,"block_time":310038000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(222,310038,'parse','blocks','{"block_index":310038,"ledger_hash":"08a949af614ff73a79313a5a949908b368efe1f8c131eeeb51ed610baf65ac46","messages_hash":"d699fba6e49edfd28c3f42448a0452645ea3d48b2a6ee315c189f6164f9167bd","txlist_hash":"791f23628ed99486b93754ee4e7a3717d2deee1ae60d4b80dd79c614e874c94a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(223,310038,'insert','blocks','{"block_hash":"5fa1ae9c5e8a599247458987b006ad3a57f686df1f7cc240bf119e911b56c347","block_index":310039,"block_time":310039000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(224,310039,'parse','blocks','{"block_index":310039,"ledger_hash":"7ff8b2408ee1124a5ee573d31023660aabcdb21599bdcfb4a3bc1895d7910094","messages_hash":"4e1fc5d2adfa955670023a3171caba56bc9a487487e735661d2b8fef0b009829","txlist_hash":"019a41a08fe760b6ca07f10cdb763ebd41d76a7a458f81023dacd0bb000221d6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(225,310039,'insert','blocks','{"block_hash":"7200ded406675453eadddfbb2d14c2a4526c7dc2b5de14bd48b29243df5e1aa3","block_index":310040,"block_time":310040000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(226,310040,'parse','blocks','{"block_index":310040,"ledger_hash":"c687e753c01711e94cfcad1f16d2976a12ef5d6c3731c64db26f969c988fe7c3","messages_hash":"175073928f9c483e28ef0153f7552bc8a8886a35a6cad614a381e866b390a27a","txlist_hash":"81bf654cee844b048e68c07fdbb561865156f77769d686aba7666d51bfc529b0"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(227,310040,'insert','blocks','{"block_hash":"5db592ff9ba5fac1e030cf22d6c13b70d330ba397f415340086ee7357143b359","block_index":310041,"block_time":310041000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(228,310041,'parse','blocks','{"block_index":310041,"ledger_hash":"66f493ec8b5cf8140d1f627f008c50624d3069f56828df90286b53a2d6cbf47e","messages_hash":"7c38a2bc3583e8a0b36e349b2f7c8eb08a73cb2cdc26cd574e42d5f6f1819792","txlist_hash":"87461d03ba2d32213a73f526b81f1decb96b112a012ada6f9fc089032720798c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(229,310041,'insert','blocks','{"block_hash":"826fd4701ef2824e9559b069517cd3cb990aff6a4690830f78fc845ab77fa3e4","block_index":310042,"block_time":310042000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(230,310042,'parse','blocks','{"block_index":310042,"ledger_hash":"33acd319bde452aa81b589435a31ee3add742870a928ef2c15a7a447b4b4e0fa","messages_hash":"9308dd7bc118848b1dfa1514c65622002c8ce8b09f8d3f383cd921acae7fb6f5","txlist_hash":"c1fd057575646ab25fc055b10cb7cc9cc4d4d05f0ddbacfaa462fc9ac32d975e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(231,310042,'insert','blocks','{"block_hash":"2254a12ada208f1dd57bc17547ecaf3c44720323c47bc7d4b1262477cb7f3c51","block_index":310043,"block_time":310043000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(232,310043,'parse','blocks','{"block_index":310043,"ledger_hash":"83997825aa2597adb0292e265f01e937f621cc75d8cc18e23a4bd0c1fb0920c7","messages_hash":"584d88bef1b341c7a46c693cabbe0fcc603df58d4a425f64b9edf31f5204a6c4","txlist_hash":"86e036eb2032af487a2c3ccd6a6d8b3073c155164cda4bead96f92da996fd4be"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(233,310043,'insert','blocks','{"block_hash":"3346d24118d8af0b3c6bcc42f8b85792e7a2e7036ebf6e4c25f4f6723c78e46b","block_index":310044,"block_time":310044000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(234,310044,'parse','blocks','{"block_index":310044,"ledger_hash":"9890bca86442f329b2abf1b3bbf4d94e8ab54d10dfa7823a53f02fcfef030d88","messages_hash":"8518f19efe134acf8d55da0bd9512363de63bb14d06a1f51e4315f113c0c9430","txlist_hash":"a839b90852909b1e21b4461debe100d578abe34e3a46837b444a92db3eab8d97"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(235,310044,'insert','blocks','{"block_hash":"7bba0ab243839e91ad1a45a762bf074011f8a9883074d68203c6d1b46fffde98","block_index":310045,"block_time":310045000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(236,310045,'parse','blocks','{"block_index":310045,"ledger_hash":"a909f658a8f405ef1f5cd8bbab03cbd865235544ae1c2f4dc20e2a4393181efc","messages_hash":"bf1f9d352187f8252ae400baf7b361897cb58d056f00685357a03159e48b9e43","txlist_hash":"a55dd67a02d97f49eb1ce9cbdf94b201a0320065e63aaccca1d14fc856a167b1"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(237,310045,'insert','blocks','{"block_hash":"47db6788c38f2d6d712764979e41346b55e78cbb4969e0ef5c4336faf18993a6","block_index":310046,"block_time":310046000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(238,310046,'parse','blocks','{"block_index":310046,"ledger_hash":"713d2ccc66a1aa7797ea9b6af18b04245478c7582a8aee76cf2c7f3f3060df3a","messages_hash":"5d5cc15d98b43e5689b2b23418e1a8c60c7466b75fce6a9eb34f2c2df59d8ef3","txlist_hash":"c7bdbef0fecf54c6d2f1dde171123487c95ccea2cb80743633a8bbdb3c3b9d35"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(239,310046,'insert','blocks','{"block_hash":"a9ccabcc2a098a7d25e4ab8bda7c4e66807eefa42e29890dcd88149a10de7075","block_index":310047,"block_time":310047000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(240,310047,'parse','blocks','{"block_index":310047,"ledger_hash":"534500ae61a04841771193d57384d27b54fa2bb92c0698beaa46509b3d39eb1c","messages_hash":"9e57cfc8a170d8d502a7fd3a7837ab20035e29915f70982b1335f1b208241e96","txlist_hash":"8c7d8f1273c82696c80fa325a3dde05ee4ad5f719f6890b3d93907c91302cf7d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(241,310047,'insert','blocks','{"block_hash":"610bf3935a85b05a98556c55493c6de45bed4d7b3b6c8553a984718765796309","block_index":310048,"block_time":310048000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(242,310048,'parse','blocks','{"block_index":310048,"ledger_hash":"48c8e5d9ab1887f092731ba2881a330d22d4f03f601dccc096fa5147042a3d55","messages_hash":"cde2ec1e7c733c02935331d6137bb1effe396ea7dc82e4ded69543ceb6aedfb4","txlist_hash":"4c724447d400c30336cda4523a84f5cfe86849086f98367e5821a0bdddf68f7b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(243,310048,'insert','blocks','{"block_hash":"4ad2761923ad49ad2b283b640f1832522a2a5d6964486b21591b71df6b33be3c","block_index":310049,"block_time":310049000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(244,310049,'parse','blocks','{"block_index":310049,"ledger_hash":"6c5ec3d2b7d8a724175559db977cb9ab78eecd39b9239688b30d6d3350cb01fe","messages_hash":"d0b0d19e3dfea993fe9e8b5b047f701fea2363b86e371e33388db2879acb485a","txlist_hash":"8f0ee591c9f8165289f106091ac0cc19dbaf813bf1134c3ad2cf302bdba0e8c7"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(245,310049,'insert','blocks','{"block_hash":"8cfeb60a14a4cec6e9be13d699694d49007d82a31065a17890383e262071e348","block_index":310050,"block_time":310050000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(246,310050,'parse','blocks','{"block_index":310050,"ledger_hash":"817dc86594b3820de76f1d2bc2400d702475d558d6ee5bef4313fc154bbdaca2","messages_hash":"c31cc75c52571b2f31eb550b4441955777b3dda8f609ff0e896e6cc11a19c748","txlist_hash":"9ff934d29741af663537dc45d552b6c01cc8ba577af1fc2ddbbcb7259477bab8"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(247,310050,'insert','blocks','{"block_hash":"b53c90385dd808306601350920c6af4beb717518493fd23b5c730eea078f33e6","block_index":310051,"block_time":310051000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(248,310051,'parse','blocks','{"block_index":310051,"ledger_hash":"00916e6bac2f648f953c8d6dff21438a6ec53ad198b33f90667e8d4564e00e78","messages_hash":"969b1eef7e73c6c7440a6e1821ff57d9be96c399da6d25222c8761f031ec3966","txlist_hash":"3074814e0ba9b6e99b6af70ecee2f1cd072d760d921d13f04a5064342636da4e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(249,310051,'insert','blocks','{"block_hash":"0acdacf4e4b6fca756479cb055191b367b1fa433aa558956f5f08fa5b7b394e2","block_index":310052,"block_time":310052000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(250,310052,'parse','blocks','{"block_index":310052,"ledger_hash":"959df962b9bc7ef215f1530b886613404adaf81552d6eeb4b1401ea265ad5f4f","messages_hash":"305f357468bc4c4030f71a370d6396a58e1724e218a6e6190966203721f71494","txlist_hash":"c792d99e376babe180a99ebe9c20a7925a74fb919ccab28a600d200caad6c0e3"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(251,310052,'insert','blocks','{"block_hash":"68348f01b6dc49b2cb30fe92ac43e527aa90d859093d3bf7cd695c64d2ef744f","block_index":310053,"block_time":310053000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(252,310053,'parse','blocks','{"block_index":310053,"ledger_hash":"d76b639ebddd434e5269de084de0b502e7f0eaff71b4e99de2d4ebdd1fc61380","messages_hash":"844c2635c132ed421e7747be6908cf50a926150d5bc27296f37f73fa03500faa","txlist_hash":"ca53cd5d8d4e90481a6099af39825f25e7b5325fd586693362d9e7302e72fc3a"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(253,310053,'insert','blocks','{"block_hash":"a8b5f253df293037e49b998675620d5477445c51d5ec66596e023282bb9cd305","block_index":310054,"block_time":310054000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(254,310054,'parse','blocks','{"block_index":310054,"ledger_hash":"525e8cabfc993080d128faf38a5e5c9e9afa61423a5f20a90d68cdcacc96b59b","messages_hash":"3ea2df17ab88adc76330690ca7dd681fd80f522375155867c73bb6d1298c3bf8","txlist_hash":"1bfbc68852f429756bdfb76508d3f044ecc24704e437259c23107470f1edec74"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(255,310054,'insert','blocks','{"block_hash":"4b069152e2dc82e96ed8a3c3547c162e8c3aceeb2a4ac07972f8321a535b9356","block_index":310055,"block_time":310055000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(256,310055,'parse','blocks','{"block_index":310055,"ledger_hash":"155ffdc74a2077a3da7d5c068833468c7d0758dfb525a799f910cdb1543beadb","messages_hash":"115a3d942d7134aa1fd1e06de6be36a489076b6b89363d0d9ca8574a52192a47","txlist_hash":"86186f38b173c755554117ee448b6935fd6ec6ca9f464438d659ad6be767d481"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(257,310055,'insert','blocks','{"block_hash":"7603eaed418971b745256742f9d2ba70b2c2b2f69f61de6cc70e61ce0336f9d3","block_index":310056,"block_time":310056000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(258,310056,'parse','blocks','{"block_index":310056,"ledger_hash":"4f6fe786e34af90927bcd888b4b2a8fc69d3ccdfe4c4bb37edb2007901ce234a","messages_hash":"6c10c2e39604750e0fc0a2246c30cfc268ba9c93cd8b7f0418da56fa1e2081a7","txlist_hash":"822b518b20b4f136877f2dfb4f4a9299a4ef7c26441791e986677396405ee03f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(259,310056,'insert','blocks','{"block_hash":"4a5fdc84f2d66ecb6ee3e3646aad20751ce8694e64e348d3c8aab09d33a3e411","block_index":310057,"block_time":310057000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(260,310057,'parse','blocks','{"block_index":310057,"ledger_hash":"30978d87fd8e32d9d27c92a0d4ca19d179b515ed95410fa96bf496b4cd8aa5e2","messages_hash":"10c89c95b6fa528a5aa068809e5f735c5e3680d75ef1882bb2584f8cedba1bf5","txlist_hash":"79032221c81d77f7dd7e35d46a314b21b17df32357b606ecb7402e5976473b19"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(261,310057,'insert','blocks','{"block_hash":"a6eef3089896f0cae0bfe9423392e45c48f4efe4310b14d8cfbdb1fea613635f","block_index":310058,"block_time":310058000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(262,310058,'parse','blocks','{"block_index":310058,"ledger_hash":"a0760bc5d2f04b381cc46aca84aa3788e8e3fbc833379a26ae812807d3a04fc5","messages_hash":"7e9860fb7b394ee7801f90330d53db116b7e3c4cdea3483eba351da8c9c81e8b","txlist_hash":"8f56034a75de70a679a8bd2515b5982dcebc5b2a6c468203ee8922f7e12aca4f"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(263,310058,'insert','blocks','{"block_hash":"ab505de874c43f97c90be1c26a769e6c5cb140405c993b4a6cc7afc795f156a9","block_index":310059,"block_time":310059000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(264,310059,'parse','blocks','{"block_index":310059,"ledger_hash":"26dcef9e54b1a34b6024f8402ddebb6e9449cd90c270e3db75354a001484b1a1","messages_hash":"6d87ea5d117406693fa50f178d4d6bfb51d016387b65178d773d94f5f03a91b4","txlist_hash":"d645719f82c5029a7fe5eba356e16c17eb676e0848ac2e03b4d98df0106ae95c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(265,310059,'insert','blocks','{"block_hash":"974ad5fbef621e0a38eab811608dc9afaf10c8ecc85fed913075ba1a145e889b","block_index":310060,"block_time":310060000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(266,310060,'parse','blocks','{"block_index":310060,"ledger_hash":"810ebcdb63a08af5a26d1fd4e7a3604afd03bd06ff620d6a86c665e1c81116d2","messages_hash":"acc09ca7d6d46a31e5219a5fe711c3115dc935eae8b9f76de341d8ffc1251367","txlist_hash":"de75a174069eec13deaa318cf1429ed15d775816b7ffe6f46c7db0e252584271"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(267,310060,'insert','blocks','{"block_hash":"35d267d21ad386e7b7632292af1c422b0310dde7ca49a82f9577525a29c138cf","block_index":310061,"block_time":310061000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(268,310061,'parse','blocks','{"block_index":310061,"ledger_hash":"1edfc24d186c7e7267b11c03b0a29e57926e9ab25f668231a18a499cbd08c702","messages_hash":"31ef09c9d9085307840329344f77997686024ff642eb7fd66d1bb8ccba72772d","txlist_hash":"4f5fb29442a7bfe7928dfd0a30bc730b2ee0a0bfee963e20f8da2eeb0bc3d6d6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(269,310061,'insert','blocks','{"block_hash":"b31a0054145319ef9de8c1cb19df5bcf4dc8a1ece20053aa494e5d3a00a2852f","block_index":310062,"block_time":310062000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(270,310062,'parse','blocks','{"block_index":310062,"ledger_hash":"b0de9503f019c9548a97bd198e6b1b58b57d6a7c231ace2d72adb0421b29e9b7","messages_hash":"9e1443459f5d65d8a563c386ba81aafdbb7d8edec0b851cac2954bceca9a915f","txlist_hash":"99f2cacd3f24f7f8cf40d0c6a3c50413a243d886a381f432dc4398b06dd0003e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(271,310062,'insert','blocks','{"block_hash":"0cbcbcd5b7f2dc288e3a34eab3d4212463a5a56e886804fb4f9f1cf929eadebe","block_index":310063,"block_time":310063000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(272,310063,'parse','blocks','{"block_index":310063,"ledger_hash":"62e41caff168eb4b15eb67ab2130510ba3f17ac186f8516cf5b5c6f168988345","messages_hash":"120e6e7664ae78686c77d35bf4d699256954f01fb3136f6b57daf14c7f8c4c2c","txlist_hash":"6436ea453d46084d34e4af17b844a1312a3a3f0d95234921dffa50c3bb86a8da"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(273,310063,'insert','blocks','{"block_hash":"e2db8065a195e85cde9ddb868a17d39893a60fb2b1255aa5f0c88729de7cbf30","block_index":310064,"block_time":310064000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(274,310064,'parse','blocks','{"block_index":310064,"ledger_hash":"a444b1535d27bb2917478019c4c59abf9474e87128f9ec1e44c20eea1f014f3c","messages_hash":"bc4110a8a69c3c5b68a220d18914bfc2b775f4505fae4905a056ab1129a18759","txlist_hash":"4a7b7ac0f91d282190236dd238b33f7b76b40c1f5151c25117d7fffe014a1995"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(275,310064,'insert','blocks','{"block_hash":"8a7bc7a77c831ac4fd11b8a9d22d1b6a0661b07cef05c2e600c7fb683b861d2a","block_index":310065,"block_time":310065000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(276,310065,'parse','blocks','{"block_index":310065,"ledger_hash":"0ad978671f587f99e5e1c1b6f68ac3d18bb03a3bd7ea9afb63590bcef25160c8","messages_hash":"9db614ad9f148242e8d381964ed1f060344570c654494d6f28a1d54748783c82","txlist_hash":"a7373340d9f43d4256f8a9063b32c415ca44e5964abc500cb3daa631ab92a311"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(277,310065,'insert','blocks','{"block_hash":"b6959be51eb084747d301f7ccaf9e75f2292c9404633b1532e3692659939430d","block_index":310066,"block_time":310066000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(278,310066,'parse','blocks','{"block_index":310066,"ledger_hash":"a6bb36829770b24fa0b960b85566a0138360a60b52cec62d94d7df8cb0b8f8b4","messages_hash":"22c378a039a5d54dc936e50a2b439d325bebf2499797ce6af9ee8d04c984a701","txlist_hash":"3f137eaa77970ba242a8bd0709970f7045ae79ca9f3cc172882577ee3ed34e9d"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(279,310066,'insert','blocks','{"block_hash":"8b08eae98d7193c9c01863fac6effb9162bda010daeacf9e0347112f233b8577","block_index":310067,"block_time":310067000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(280,310067,'parse','blocks','{"block_index":310067,"ledger_hash":"9b8ceda9b170429d8b9ed517f0db95487b3058397e20d7e786577c8e46b389b8","messages_hash":"e2199f8f8010ed9d80b755628f7b92539f0a7eff814045b5cb0c4b71ff693506","txlist_hash":"a8c54e9c41e6d694d38a6cb9bb9cea881609c013ef9bf4909fbcb0090168e263"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(281,310067,'insert','blocks','{"block_hash":"9280e7297ef6313341bc81787a36acfc9af58f83a415afff5e3154f126cf52b5","block_index":310068,"block_time":310068000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(282,310068,'parse','blocks','{"block_index":310068,"ledger_hash":"cee2e41baf86f1af24d555e9ab4a0c023b5f1ab2b054707d4434b4f60d31862a","messages_hash":"26a0fcab0e3f7ba3cb0b2d78b72c11ad6355647501cead5c427e1d23d4e3f3ad","txlist_hash":"bc2a5bfc7f1a8181b7b04970a8287b498f096bc08acf106f6a8e0a0ac5ca3723"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(283,310068,'insert','blocks','{"block_hash":"486351f0655bf594ffaab1980cff17353b640b63e9c27239109addece189a6f7","block_index":310069,"block_time":310069000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(284,310069,'parse','blocks','{"block_index":310069,"ledger_hash":"cbfd7ff728f05ba3f1db5972f1449618a79d3fd0d76bf7fe990aed2eb2316a38","messages_hash":"0a0c5631c11c33f5ccf3a0d4e537469fd887b0493a9395cce6f5cecec4525b98","txlist_hash":"73e3b8838f74134d3db985de53446f88c3bb86a8cec53bf773c10dd89fc2d709"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(285,310069,'insert','blocks','{"block_hash":"8739e99f4dee8bebf1332f37f49a125348b40b93b74fe35579dd52bfba4fa7e5","block_index":310070,"block_time":310070000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(286,310070,'parse','blocks','{"block_index":310070,"ledger_hash":"9af85cd995c83b5a5f0cac66351cabdf9dc9faecfee080638fc76019663faaa6","messages_hash":"0243ca02e41d763a7dc643fc9353613ee3eda717381cf1cc92d27833652bc9aa","txlist_hash":"5e951c9dc5201f32b7e8b9e72702984a2ff13c011cec35ef4ddbcf5b1e7e3111"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(287,310070,'insert','blocks','{"block_hash":"7a099aa1bba0ead577f1e44f35263a1f115ed6a868c98d4dd71609072ae7f80b","block_index":310071,"block_time":310071000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(288,310071,'parse','blocks','{"block_index":310071,"ledger_hash":"a3c547e84db6b29630b87fa566e37796e0632ba616dd6d521d558632c3b55370","messages_hash":"260cbb371e6bedd2e668b53e65b1938ddac82a976c4642e5931ef3c637aa0a2a","txlist_hash":"c72261d02c311085af66e2c66b8bcef2833d05716f067de2327442b92d219adf"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(289,310071,'insert','blocks','{"block_hash":"7b17ecedc07552551b8129e068ae67cb176ca766ea3f6df74b597a94e3a7fc8a","block_index":310072,"block_time":310072000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(290,310072,'parse','blocks','{"block_index":310072,"ledger_hash":"a0170d8a72a0f8642c0863899bf034e754596e3fd8ddffefa91e7e9a7addf944","messages_hash":"f251df0e4b0cd81f4f5be1d0847f2313327c5d3fcde55f54dc97da0c030338c5","txlist_hash":"df4f5afac7aa5bdd2e580979d13c750f4990c5f7e8dacaec6d751f4b1e3c690e"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(291,310072,'insert','blocks','{"block_hash":"ee0fe3cc9b3a48a2746b6090b63b442b97ea6055d48edcf4b2288396764c6943","block_index":310073,"block_time":310073000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(292,310073,'parse','blocks','{"block_index":310073,"ledger_hash":"e0179a21342fcf35fa169567f1ef35bd6b0b1b048a98e90c049fdf3ee58e9da4","messages_hash":"8766382520f4e2f1cd434333e1b0f694679e3389938ad90cb27a806f1b10bc1f","txlist_hash":"c5cc010dd34b520a733ad2e109b4b2b8cc84b48e412c43ac688a57f99147c164"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(293,310073,'insert','blocks','{"block_hash":"ceab38dfde01f711a187601731ad575d67cfe0b7dbc61dcd4f15baaef72089fb","block_index":310074,"block_time":310074000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(294,310074,'parse','blocks','{"block_index":310074,"ledger_hash":"8855ace296b0b078d90aa24fcd30ca9f9cccf9d3961f3dba4985a3ff187a02ac","messages_hash":"57d4af8c7a15f1318317e9c5904245edf53331c9f4ecffc1ba4d5043e62d8af4","txlist_hash":"eac5c44840751fb1009274a20657bc544e855ff1a49533c9fc43c0b6e66b7402"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(295,310074,'insert','blocks','{"block_hash":"ef547198c6e36d829f117cfd7077ccde45158e3c545152225fa24dba7a26847b","block_index":310075,"block_time":310075000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(296,310075,'parse','blocks','{"block_index":310075,"ledger_hash":"bde3a6c6cc31b96d58f466d3ce0361cc6366c8c239778f21b696d4063cf6d89e","messages_hash":"2a1c11729dfc8b114a93a4d00c864898433dca5405b147a551ab342eee18d6ea","txlist_hash":"40cde00e42632bcc0477dc071b9acfa0745283dc2a9d2d28e230f939832abbac"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(297,310075,'insert','blocks','{"block_hash":"3b0499c2e8e8f0252c7288d4ecf66efc426ca37aad3524424d14c8bc6f8b0d92","block_index":310076,"block_time":310076000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(298,310076,'parse','blocks','{"block_index":310076,"ledger_hash":"f562851b32a7005ee02b9e2491c0195dddce451e8fecb428209d087e69345303","messages_hash":"c5208e94a5cf8b81912e897627778a7b87b6cda084714bcf17dcbbfe471ff09a","txlist_hash":"dc3ab137a2d7430196ec3d25456e09e8e63d815c8e4b246e95e7e63d4e3a9c75"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(299,310076,'insert','blocks','{"block_hash":"d2adeefa9024ab3ff2822bc36acf19b6c647cea118cf15b86c6bc00c3322e7dd","block_index":310077,"block_time":310077000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(300,310077,'parse','blocks','{"block_index":310077,"ledger_hash":"996cda7b65e623747deef936d61491cedd0159f44faa1e3536de1b6d6c474097","messages_hash":"f6755e4b9a0aac05188b3556704027627d5429557332b9f836605544254ed43b","txlist_hash":"a957a0c28f2a0beb967ef0ac9519e9207e37415af3018f1a5cb998169f3b6005"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(301,310077,'insert','blocks','{"block_hash":"f6c17115ef0efe489c562bcda4615892b4d4b39db0c9791fe193d4922bd82cd6","block_index":310078,"block_time":310078000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(302,310078,'parse','blocks','{"block_index":310078,"ledger_hash":"c8286f73cc3a070f4251b7c59bb485e611437a1916fd39ffac831dc78df54ecd","messages_hash":"1796d3f485d4ca5c7fbfeabc6b1428703afd47c721400cdc2acdaeadb9d26482","txlist_hash":"3cf1b57600853e04513ad74089e344f9e5af742e1d4aaad0c9e51c0ebc6e77d5"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(303,310078,'insert','blocks','{"block_hash":"f2fbd2074d804e631db44cb0fb2e1db3fdc367e439c21ffc40d73104c4d7069c","block_index":310079,"block_time":310079000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(304,310079,'parse','blocks','{"block_index":310079,"ledger_hash":"ef9dab42700918027fac849f2088d2248a6291dc7bc24be583b556f37739631b","messages_hash":"e5aed9b39fa7515afa96939dd322b29380c52591b7dc6ed6a62d1e7153f69889","txlist_hash":"6cf1d5147d5c6523c275384d404b4f7a750dab987def5846979bc5d14233a44b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(305,310079,'insert','blocks','{"block_hash":"42943b914d9c367000a78b78a544cc4b84b1df838aadde33fe730964a89a3a6c","block_index":310080,"block_time":310080000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(306,310080,'parse','blocks','{"block_index":310080,"ledger_hash":"c6bbc52f1e8f907b2d66378f4352f41ae3d354985aaab5f16d737d75a7e6b1d8","messages_hash":"08636b4a9a1b1ef795ea50198a555762e9a7b1b2e9bf12428b223b2dae49cd3c","txlist_hash":"091641bdce3f527a8a3da393068fca3534e8209fba337b7b79bf22f2a6bc5dec"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(307,310080,'insert','blocks','{"block_hash":"6554f9d307976249e7b7e260e08046b3b55d318f8b6af627fed5be3063f123c4","block_index":310081,"block_time":310081000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(308,310081,'parse','blocks','{"block_index":310081,"ledger_hash":"66f7b7ff8f0217ed62938a5931d4a6a232546e5d58e09dfd3ba5a792c35fa560","messages_hash":"fbe957e0c70cf6dd4ebc7b0f46adf107bc92354eba58205ef447e3daf6bc8db6","txlist_hash":"8a955c5c1a5c9f8c82553803172cc961e61b2e2e19b9c87cad6dec24512ee351"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(309,310081,'insert','blocks','{"block_hash":"4f1ef91b1dcd575f8ac2e66a67715500cbca154bd6f3b8148bb7015a6aa6c644","block_index":310082,"block_time":310082000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(310,310082,'parse','blocks','{"block_index":310082,"ledger_hash":"2b26c6d901ca9790987331432372046d9620d10ea163f4824208d6b23e8e7a35","messages_hash":"df11ad31e79548a8591fbd90d30ad79ce85da37dfb146a48ec4bb648737ebff6","txlist_hash":"482bf498868976d12ae17fc38bc847d8c7398c96fad5df9f1d2719197fa038e6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(311,310082,'insert','blocks','{"block_hash":"9b1f6fd6ff9b0dc4e37603cfb0625f49067c775b99e12492afd85392d3c8d850","block_index":310083,"block_time":310083000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(312,310083,'parse','blocks','{"block_index":310083,"ledger_hash":"0d6d774dce93e94e870835005b0e8b04f010fb25158aa69a0fa0321d1577e987","messages_hash":"06753394ba61e21576857c2bea779ed38eed2fb104134102a6ee6f4075acf676","txlist_hash":"ed1021dde8c16263483f3a50091a2df2105977a7aab9217b78af58833433853c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(313,310083,'insert','blocks','{"block_hash":"1e0972523e80306441b9f4157f171716199f1428db2e818a7f7817ccdc8859e3","block_index":310084,"block_time":310084000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(314,310084,'parse','blocks','{"block_index":310084,"ledger_hash":"9dbd171e3606b1662f6b576339b1e9aaa3da8a9f8a246bab905af255add4a762","messages_hash":"0da963e6f910b4d732b4b5142c237cd3fc3cc77ffdd8a7566ee849b827f93e59","txlist_hash":"e5ea123c86cd7147d8cd8d9866006e1da8528bb32c8005a998ca9f6ee917c2ba"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(315,310084,'insert','blocks','{"block_hash":"c5b6e9581831e3bc5848cd7630c499bca26d9ece5156d36579bdb72d54817e34","block_index":310085,"block_time":310085000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(316,310085,'parse','blocks','{"block_index":310085,"ledger_hash":"db67b5dc6b0c0ddec22d0e716b72aa8cb6fa9702316f2a8e12659ee229094c16","messages_hash":"0e49e187d7c89228e2592780e408c2a4add307095076272d84e2b55f4ecf29e9","txlist_hash":"a25387e650e60dbb003c5ef16c46a8d8464013d81bdb49508c2935368d4ae9c0"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(317,310085,'insert','blocks','{"block_hash":"080c1dc55a4ecf4824cf9840602498cfc35b5f84099f50b71b45cb63834c7a78","block_index":310086,"block_time":310086000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(318,310086,'parse','blocks','{"block_index":310086,"ledger_hash":"7cf70b5298dbb36efbec2fb880b76e2514e3bad9d5200875fa3eb3ceb7719ee8","messages_hash":"99d27abfd96c4b9202fc101ca8795378da7adb442693a8dd2ee01755c3a5aa5d","txlist_hash":"f5028a37d6395b533cf60e6ce9f0bf574a0a7beb2cebd2f545b5183e5362aaf3"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(319,310086,'insert','blocks','{"block_hash":"4ec8cb1c38b22904e8087a034a6406b896eff4dd28e7620601c6bddf82e2738c","block_index":310087,"block_time":310087000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(320,310087,'parse','blocks','{"block_index":310087,"ledger_hash":"27106f400fe1ee93bde42f3bf3cf39737fb856bbf0df3f90fe0838cf7d38798c","messages_hash":"eb249a817d3a77ab509de6ec126d1adb66ba7cb5b061b8bc1b6bbd8fb97fa2d8","txlist_hash":"f336b56eb2aab91aaacef9df8159627bafc67b497482abcec9ad6786710da7ec"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(321,310087,'insert','blocks','{"block_hash":"e945c815c433cbddd0bf8e66c5c23b51072483492acda98f5c2c201020a8c5b3","block_index":310088,"block_time":310088000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(322,310088,'parse','blocks','{"block_index":310088,"ledger_hash":"28c9833eded6d68967f206e5884616f83bb9ad16b9d7a507031b96480aecc799","messages_hash":"717ede78db478693f58863ed85316b1a70c505f7d7288b783eb30c9e6aafbdbe","txlist_hash":"c51f9cf9cd60f836bf4ae7ee0cd982829f6f7cbb2503eafef3bb167a285cf9a9"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(323,310088,'insert','blocks','{"block_hash":"0382437f895ef3e7e38bf025fd4f606fd44d4bbd6aea71dbdc4ed11a7cd46f33","block_index":310089,"block_time":310089000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(324,310089,'parse','blocks','{"block_index":310089,"ledger_hash":"cdac6435934ea6e67a311495325c85237158ef30c009ea44c562c2127d79e696","messages_hash":"1bfad3f02446c2eaf5d92214a3dace565861afd1cfcb75b12087f88c542c82e8","txlist_hash":"b6749729423101ee337b7fbf0362191ba34102f01db03b225ac0d6c52de2a6fb"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(325,310089,'insert','blocks','{"block_hash":"b756db71dc037b5a4582de354a3347371267d31ebda453e152f0a13bb2fae969","block_index":310090,"block_time":310090000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(326,310090,'parse','blocks','{"block_index":310090,"ledger_hash":"cb33e420348e7969a2310445a6c17c79e647d3c6f3106d4fd0c0a1249e11ed6f","messages_hash":"e7f8143dcc493803ee016f2318c91d7ec9cfee932596858f77c96b9572c24ad1","txlist_hash":"544bc0db1dbb1d22a05e5f81de7520ef990df5b897b9f9e60d98f102fef86568"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(327,310090,'insert','blocks','{"block_hash":"734a9aa485f36399d5efb74f3b9c47f8b5f6fd68c9967f134b14cfe7e2d7583c","block_index":310091,"block_time":310091000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(328,310091,'parse','blocks','{"block_index":310091,"ledger_hash":"dda2531cf7db78a3f27c1ce70189b3f6efb69ddd24b61639f9deff42566bba2a","messages_hash":"ee5b11297364b892749812f46908976dbf0df6fed5083470bddd3cbd0f443688","txlist_hash":"217908d5688f0d9797f04ee9c3cd03ae93c20f4e5801fd809d3c37154e55b7b6"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(329,310091,'insert','blocks','{"block_hash":"56386beb65f9228740d4ad43a1c575645f6daf59e0dd9f22551c59215b5e8c3d","block_index":310092,"block_time":310092000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(330,310092,'parse','blocks','{"block_index":310092,"ledger_hash":"9ca7d9e1da0c6e4465d9e1c76990b6c48e62ee3a0b3b83189dc7a0f2c03a3006","messages_hash":"0d714f5b1aeb7850a37e62304533be483e870cf8a93c842499e7fb8f426a278a","txlist_hash":"6e31995ac19f2ff3fdfe5d2ba7a49f4b018b132d2aae92a4c664a97d6a6b3b6b"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(331,310092,'insert','blocks','{"block_hash":"a74a2425f2f4be24bb5f715173e6756649e1cbf1b064aeb1ef60e0b94b418ddc","block_index":310093,"block_time":310093000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(332,310093,'parse','blocks','{"block_index":310093,"ledger_hash":"c6fc005e874909cf0393ac1bee7267f66cc5355c549d8657234a0ed6b429c869","messages_hash":"35654c3d2b3f82e783d329180c97ed5e933a36e01e19a4d46f75372f411bdc4c","txlist_hash":"d7d3f23d0014f40f3ac6a00fbb59e95653d22e11360783fe4116be9ecf360149"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(333,310093,'insert','blocks','{"block_hash":"2a8f976f20c4e89ff01071915ac96ee35192d54df3a246bf61fd4a0cccfb5b23","block_index":310094,"block_time":310094000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(334,310094,'parse','blocks','{"block_index":310094,"ledger_hash":"14dacaec0b37ca20f271e500d0ec1837a63006eb464728c067107738ad3167c6","messages_hash":"e84c649434ab608ebf4f88162e34f824e244c76f4af22913f0efb6ae6e21c94f","txlist_hash":"7a1a9bf5515019b99c1c35abaa4a2003c6291018e090c26ec03c5c951f853f82"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(335,310094,'insert','blocks','{"block_hash":"bed0fa40c9981223fb40b3be8124ca619edc9dd34d0c907369477ea92e5d2cd2","block_index":310095,"block_time":310095000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(336,310095,'parse','blocks','{"block_index":310095,"ledger_hash":"05bd680c082185147e83785e7464d8890908d1550359b4fac79018b510475e01","messages_hash":"604cde079938595e2eaafe98115d964d3d7760de6727133ce55a0aaf3c09ebda","txlist_hash":"40b9134941fbe6312e3a7dca4b1f5114c3b7ab73f6ab84ba96aa101097111168"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(337,310095,'insert','blocks','{"block_hash":"306aeec3db435fabffdf88c2f26ee83caa4c2426375a33daa2be041dbd27ea2f","block_index":310096,"block_time":310096000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(338,310096,'parse','blocks','{"block_index":310096,"ledger_hash":"b50805d750ebd26f8dbced919948118f1f97ce7d117aa1760e7a3c4895f51e13","messages_hash":"a9cb685942d115aef7c6cbedb261c04ae6a2b7a8106749ebbaa5c80a0abd3aeb","txlist_hash":"4e1fd0382baffd66852d64c667941808ebeb08a17309ccfe91be8e16046ad266"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(339,310096,'insert','blocks','{"block_hash":"13e8e16e67c7cdcc80d477491e554b43744f90e8e1a9728439a11fab42cefadf","block_index":310097,"block_time":310097000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(340,310097,'parse','blocks','{"block_index":310097,"ledger_hash":"dde96405c241e1d57334670e4eff7ed8db92056e6867cae10475a9bc30ba4619","messages_hash":"ace214c70fd988ebaa5d2cbb97ea3015c50819efbc2bc788840a984fa721de41","txlist_hash":"8e635d69a6a40df5c3849e1811ee551c32a57a3496fe8e4b97846b9592a9ebde"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(341,310097,'insert','blocks','{"block_hash":"ca5bca4b5ec4fa6183e05176abe921cff884c4e20910fab55b603cef48dc3bca","block_index":310098,"block_time":310098000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(342,310098,'parse','blocks','{"block_index":310098,"ledger_hash":"613d78fbabba246a4d1cd9d50317e732795a59812df8395472347e15cec1ee9b","messages_hash":"ea310679cec41d4ecfbc9e8293090ecfc50d42603aeead40f8578f1c67325499","txlist_hash":"c96db41449a579ffc6b459375569230e88bdfd51c10578c60f8d252eff630fd3"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(343,310098,'insert','blocks','{"block_hash":"3c4c2279cd7de0add5ec469648a845875495a7d54ebfb5b012dcc5a197b7992a","block_index":310099,"block_time":310099000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(344,310099,'parse','blocks','{"block_index":310099,"ledger_hash":"e535ca5960d2ce7508bd2157dd0cac3ea1f9ab14532a40884d522b4bba0d4979","messages_hash":"42229b9e7e27e8ef79ad7116e9c90af0ead5a28b5330d482c82975fe22e0fc0b","txlist_hash":"710369d2e677643b7ab8f2bbcebf0f13017052ff7fd9adfd6ffac4e6fff83f8c"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(345,310099,'insert','blocks','{"block_hash":"96925c05b3c7c80c716f5bef68d161c71d044252c766ca0e3f17f255764242cb","block_index":310100,"block_time":310100000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(346,310100,'parse','blocks','{"block_index":310100,"ledger_hash":"970865291b7a6d8173d6ad2ae97335cb2e89d80cbbb7a79bb2328cf6c67fa6cd","messages_hash":"7a2883d5bee08691b501606fb32234a6e9e72187d20393de23126819cbed81a8","txlist_hash":"9deae420c2b87043e6e18db077634a1d65ae60b38f604ce56f0899ed3a561347"}',0,'BLOCK_PARSED');
-INSERT INTO messages VALUES(347,310100,'insert','blocks','{"block_hash":"369472409995ca1a2ebecbad6bf9dab38c378ab1e67e1bdf13d4ce1346731cd6","block_index":310101,"block_time":310101000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
-INSERT INTO messages VALUES(348,310101,'parse','blocks','{"block_index":310101,"ledger_hash":"0741e57ad88cdada65134c9f131ff5bfd9498cb054378d829e34715e8db2aa6d","messages_hash":"d445cfe17527660e016649cfd9b00ee76b41728d084d1064e30859cda37eb244","txlist_hash":"4bd0054addc71915293b8f040ed3c6c64d0aaf8ad27647d1887e16d55604523c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(0,NULL,0,'insert','blocks','{"block_hash":"8b3bef249cb3b0fa23a4936c1249b6bd41daeadc848c8d2e409ea1cbc10adfe7","block_index":309999,"block_time":309999000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(1,NULL,309999,'parse','blocks','{"block_index":309999,"ledger_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","messages_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223","txlist_hash":"63f0fef31d02da85fa779e9a0e1b585b1a6a4e59e14564249e288e074e91c223"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(2,NULL,309999,'insert','blocks','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(3,NULL,310000,'insert','transactions','{"block_hash":"505d8d82c4ced7daddef7ed0b05ba12ecc664176887b938ef56c6af276f3b30c","block_index":310000,"block_time":310000000,"btc_amount":62000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":5625,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"6dc5b0a33d4d4297e0f5cc2d23ae307951d32aab2d86b7fa147b385219f3a597","tx_index":1}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(4,NULL,310000,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310000,"calling_function":"burn","event":"6dc5b0a33d4d4297e0f5cc2d23ae307951d32aab2d86b7fa147b385219f3a597","quantity":93000000000,"tx_index":1}',0,'CREDIT');
+INSERT INTO messages VALUES(5,NULL,310000,'insert','burns','{"block_index":310000,"burned":62000000,"earned":93000000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"6dc5b0a33d4d4297e0f5cc2d23ae307951d32aab2d86b7fa147b385219f3a597","tx_index":1}',0,'BURN');
+INSERT INTO messages VALUES(6,NULL,310000,'parse','blocks','{"block_index":310000,"ledger_hash":"cf0ea1d313e22ba5f413075b88e07dffc5c00e59f95eeb6d6dec935bd77f5ae4","messages_hash":"9e7dd13f1ecb4ec6481076dc9bb5fda1bdb9103747455f9de9ab516748201ef0","txlist_hash":"f06c23e6040a063ed59693baa0d63492dce64e1debc7455b22f5535c9dfbdc67"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(7,NULL,310000,'insert','blocks','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(8,NULL,310001,'insert','transactions','{"block_hash":"3c9f6a9c6cac46a9273bd3db39ad775acd5bc546378ec2fb0587e06e112cc78e","block_index":310001,"block_time":310001000,"btc_amount":5430,"data":"0000000000000000000000010000000002faf080","destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"3b273ba342ed8bd4ccd2ae28d3df7754768a6c65ec1cee4a6e84b4b4bdec8d8c","tx_index":2}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(9,NULL,310001,'insert','debits','{"action":"send","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310001,"event":"3b273ba342ed8bd4ccd2ae28d3df7754768a6c65ec1cee4a6e84b4b4bdec8d8c","quantity":50000000,"tx_index":2}',0,'DEBIT');
+INSERT INTO messages VALUES(10,NULL,310001,'insert','credits','{"address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"XCP","block_index":310001,"calling_function":"send","event":"3b273ba342ed8bd4ccd2ae28d3df7754768a6c65ec1cee4a6e84b4b4bdec8d8c","quantity":50000000,"tx_index":2}',0,'CREDIT');
+INSERT INTO messages VALUES(11,NULL,310001,'insert','sends','{"asset":"XCP","block_index":310001,"destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","quantity":50000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"3b273ba342ed8bd4ccd2ae28d3df7754768a6c65ec1cee4a6e84b4b4bdec8d8c","tx_index":2}',0,'SEND');
+INSERT INTO messages VALUES(12,NULL,310001,'parse','transactions','{"supported":true,"tx_hash":"3b273ba342ed8bd4ccd2ae28d3df7754768a6c65ec1cee4a6e84b4b4bdec8d8c","tx_index":2}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(13,NULL,310001,'parse','blocks','{"block_index":310001,"ledger_hash":"bdf1308701712d94da26f53fef4c440ea2fb7b0ef7361f424ba9263e747272bd","messages_hash":"8e1a31c7d7fa8f0fe6981c7b33a5832fef697516b3e3bdaf732746550bf2a9eb","txlist_hash":"fac614e6f77f1b954c12523e9d0eeb4252f92f3640f7d067790a510a9e893811"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(14,NULL,310001,'insert','blocks','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(15,NULL,310002,'insert','transactions','{"block_hash":"fbb60f1144e1f7d4dc036a4a158a10ea6dea2ba6283a723342a49b8eb5cc9964","block_index":310002,"block_time":310002000,"btc_amount":0,"data":"0000000a00000000000000000000000002faf08000000000000000010000000005f5e100000a0000000000000000","destination":"","fee":1000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"6bdb2ef465e9fc04060f58ced26c159dc983a616cb121c5e7954e66833444c59","tx_index":3}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(16,NULL,310002,'insert','orders','{"block_index":310002,"expiration":10,"expire_index":310012,"fee_provided":1000000,"fee_provided_remaining":1000000,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":100000000,"get_remaining":100000000,"give_asset":"BTC","give_quantity":50000000,"give_remaining":50000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","tx_hash":"6bdb2ef465e9fc04060f58ced26c159dc983a616cb121c5e7954e66833444c59","tx_index":3}',0,'OPEN_ORDER');
+INSERT INTO messages VALUES(17,NULL,310002,'parse','transactions','{"supported":true,"tx_hash":"6bdb2ef465e9fc04060f58ced26c159dc983a616cb121c5e7954e66833444c59","tx_index":3}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(18,NULL,310002,'parse','blocks','{"block_index":310002,"ledger_hash":"cf830f949715ebeac09d4441878f60ac04d691c09d6c25c62a0d30fb5886cba9","messages_hash":"d5c067448e960b3b7609d4bc33f28739e755833b8752d57757dc8fe6bfdaaef2","txlist_hash":"0c743d61c27efab7c83c1845f6b0446b67c9b59173318709d51363e75e7a0601"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(19,NULL,310002,'insert','blocks','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(20,NULL,310003,'insert','transactions','{"block_hash":"d50825dcb32bcf6f69994d616eba18de7718d3d859497e80751b2cb67e333e8a","block_index":310003,"block_time":310003000,"btc_amount":0,"data":"0000000a00000000000000010000000006422c4000000000000000000000000002faf080000a00000000000dbba0","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"36d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c","tx_index":4}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(21,NULL,310003,'insert','debits','{"action":"open order","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310003,"event":"36d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c","quantity":105000000,"tx_index":4}',0,'DEBIT');
+INSERT INTO messages VALUES(22,NULL,310003,'insert','orders','{"block_index":310003,"expiration":10,"expire_index":310013,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":900000,"fee_required_remaining":900000,"get_asset":"BTC","get_quantity":50000000,"get_remaining":50000000,"give_asset":"XCP","give_quantity":105000000,"give_remaining":105000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","tx_hash":"36d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c","tx_index":4}',0,'OPEN_ORDER');
+INSERT INTO messages VALUES(23,NULL,310003,'update','orders','{"fee_provided_remaining":142858,"fee_required_remaining":0,"get_remaining":0,"give_remaining":0,"status":"open","tx_hash":"6bdb2ef465e9fc04060f58ced26c159dc983a616cb121c5e7954e66833444c59"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(24,NULL,310003,'update','orders','{"fee_provided_remaining":6800,"fee_required_remaining":42858,"get_remaining":0,"give_remaining":5000000,"status":"open","tx_hash":"36d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(25,NULL,310003,'insert','order_matches','{"backward_asset":"XCP","backward_quantity":100000000,"block_index":310003,"fee_paid":857142,"forward_asset":"BTC","forward_quantity":50000000,"id":"6bdb2ef465e9fc04060f58ced26c159dc983a616cb121c5e7954e66833444c59_36d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c","match_expire_index":310023,"status":"pending","tx0_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","tx0_block_index":310002,"tx0_expiration":10,"tx0_hash":"6bdb2ef465e9fc04060f58ced26c159dc983a616cb121c5e7954e66833444c59","tx0_index":3,"tx1_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","tx1_block_index":310003,"tx1_expiration":10,"tx1_hash":"36d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c","tx1_index":4}',0,'ORDER_MATCH');
+INSERT INTO messages VALUES(26,NULL,310003,'parse','transactions','{"supported":true,"tx_hash":"36d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c","tx_index":4}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(27,NULL,310003,'parse','blocks','{"block_index":310003,"ledger_hash":"e881a675a38c4649cd44e6406ddc494996c761671bc349dcdea1de430a84258d","messages_hash":"c060770e246851710cba711099d9f8ccfed66a792b2e64d68ae887e1b83bac51","txlist_hash":"9ae051d14f8d19db67a85c713eefc0a936f1bad818ae1138fcecb91506a46d88"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(28,NULL,310003,'insert','blocks','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(29,NULL,310004,'insert','transactions','{"block_hash":"60cdc0ac0e3121ceaa2c3885f21f5789f49992ffef6e6ff99f7da80e36744615","block_index":310004,"block_time":310004000,"btc_amount":50000000,"data":"0000000b6bdb2ef465e9fc04060f58ced26c159dc983a616cb121c5e7954e66833444c5936d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c","destination":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","fee":9675,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"843c5df8f979db230ba61f26ad1342ed5803adeba7333b019b8a96ac6703f099","tx_index":5}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(30,NULL,310004,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310004,"calling_function":"btcpay","event":"843c5df8f979db230ba61f26ad1342ed5803adeba7333b019b8a96ac6703f099","quantity":100000000,"tx_index":5}',0,'CREDIT');
+INSERT INTO messages VALUES(31,NULL,310004,'update','order_matches','{"id":"6bdb2ef465e9fc04060f58ced26c159dc983a616cb121c5e7954e66833444c59_36d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c","order_match_id":"6bdb2ef465e9fc04060f58ced26c159dc983a616cb121c5e7954e66833444c59_36d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c","status":"completed"}',0,'ORDER_MATCH_UPDATE');
+INSERT INTO messages VALUES(32,NULL,310004,'insert','btcpays','{"block_index":310004,"btc_amount":50000000,"destination":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","order_match_id":"6bdb2ef465e9fc04060f58ced26c159dc983a616cb121c5e7954e66833444c59_36d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c","source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"843c5df8f979db230ba61f26ad1342ed5803adeba7333b019b8a96ac6703f099","tx_index":5}',0,'BTC_PAY');
+INSERT INTO messages VALUES(33,NULL,310004,'parse','transactions','{"supported":true,"tx_hash":"843c5df8f979db230ba61f26ad1342ed5803adeba7333b019b8a96ac6703f099","tx_index":5}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(34,NULL,310004,'parse','blocks','{"block_index":310004,"ledger_hash":"13e0c6276f297ff1ca77705f1b18d807ca22f53735fba52f4f5c3766dc4b04e8","messages_hash":"0238a76faa733825349cf252aa10cfc94392cccd7599025643ac132abf329636","txlist_hash":"a865bc7b6e26b3c3868ae080ab927ce3f2dcdb7d3654ffbcd1b3a8111d0807b1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(35,NULL,310004,'insert','blocks','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(36,NULL,310005,'insert','transactions','{"block_hash":"8005c2926b7ecc50376642bc661a49108b6dc62636463a5c492b123e2184cd9a","block_index":310005,"block_time":310005000,"btc_amount":0,"data":"000000140000000000004767000000003b9aca000100000000000000000000","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"5d951d44d034cb6fd5dc5c98cd877c63f55c1ae108d335b6b6d991d072856adf","tx_index":6}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(37,NULL,310005,'insert','debits','{"action":"issuance fee","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310005,"event":"5d951d44d034cb6fd5dc5c98cd877c63f55c1ae108d335b6b6d991d072856adf","quantity":50000000,"tx_index":6}',0,'DEBIT');
+INSERT INTO messages VALUES(38,NULL,310005,'insert','assets','{"asset_id":"18279","asset_longname":null,"asset_name":"BBBB","block_index":310005}',0,'ASSET_CREATION');
+INSERT INTO messages VALUES(39,NULL,310005,'insert','issuances','{"asset":"BBBB","asset_longname":null,"block_index":310005,"call_date":0,"call_price":0.0,"callable":false,"description":"","divisible":true,"fee_paid":50000000,"issuer":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","locked":false,"quantity":1000000000,"reset":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","transfer":false,"tx_hash":"5d951d44d034cb6fd5dc5c98cd877c63f55c1ae108d335b6b6d991d072856adf","tx_index":6}',0,'ASSET_ISSUANCE');
+INSERT INTO messages VALUES(40,NULL,310005,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"BBBB","block_index":310005,"calling_function":"issuance","event":"5d951d44d034cb6fd5dc5c98cd877c63f55c1ae108d335b6b6d991d072856adf","quantity":1000000000,"tx_index":6}',0,'CREDIT');
+INSERT INTO messages VALUES(41,NULL,310005,'parse','transactions','{"supported":true,"tx_hash":"5d951d44d034cb6fd5dc5c98cd877c63f55c1ae108d335b6b6d991d072856adf","tx_index":6}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(42,NULL,310005,'parse','blocks','{"block_index":310005,"ledger_hash":"765896f532b411af9f889687a750d44414296c20002f3e2abed9551a6822937d","messages_hash":"2be211b1beee52aa7be5d2f229a93c3795d226c12eac8fbfee98b2742ce1e0d8","txlist_hash":"59095fce5f573c2ff1b5eda5cd75c36227b0f9782601e7538215fea5317c505b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(43,NULL,310005,'insert','blocks','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(44,NULL,310006,'insert','transactions','{"block_hash":"bdad69d1669eace68b9f246de113161099d4f83322e2acf402c42defef3af2bb","block_index":310006,"block_time":310006000,"btc_amount":0,"data":"00000014000000000000476800000000000186a00000000000000000000006666f6f626172","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"2b44f590422a3ab5b70fb1265a2e4f4d3b0bcb3de3f296dc7280924870ec8c59","tx_index":7}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(45,NULL,310006,'insert','debits','{"action":"issuance fee","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310006,"event":"2b44f590422a3ab5b70fb1265a2e4f4d3b0bcb3de3f296dc7280924870ec8c59","quantity":50000000,"tx_index":7}',0,'DEBIT');
+INSERT INTO messages VALUES(46,NULL,310006,'insert','assets','{"asset_id":"18280","asset_longname":null,"asset_name":"BBBC","block_index":310006}',0,'ASSET_CREATION');
+INSERT INTO messages VALUES(47,NULL,310006,'insert','issuances','{"asset":"BBBC","asset_longname":null,"block_index":310006,"call_date":0,"call_price":0.0,"callable":false,"description":"foobar","divisible":false,"fee_paid":50000000,"issuer":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","locked":false,"quantity":100000,"reset":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","transfer":false,"tx_hash":"2b44f590422a3ab5b70fb1265a2e4f4d3b0bcb3de3f296dc7280924870ec8c59","tx_index":7}',0,'ASSET_ISSUANCE');
+INSERT INTO messages VALUES(48,NULL,310006,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"BBBC","block_index":310006,"calling_function":"issuance","event":"2b44f590422a3ab5b70fb1265a2e4f4d3b0bcb3de3f296dc7280924870ec8c59","quantity":100000,"tx_index":7}',0,'CREDIT');
+INSERT INTO messages VALUES(49,NULL,310006,'parse','transactions','{"supported":true,"tx_hash":"2b44f590422a3ab5b70fb1265a2e4f4d3b0bcb3de3f296dc7280924870ec8c59","tx_index":7}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(50,NULL,310006,'parse','blocks','{"block_index":310006,"ledger_hash":"853e3a8d39c4e8bdb36a0ec01a8d20f12335fcc00a00ac271e9d83be471d394f","messages_hash":"fc41309cdb46e7fbae0f09fda002234a6e758ab63e8240a648793fee6bfc0c7d","txlist_hash":"752821f935743579d04abcc94c104148b226cbc0777a6bb30bb7eceb29b85fca"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(51,NULL,310006,'insert','blocks','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(52,NULL,310007,'insert','transactions','{"block_hash":"10a642b96d60091d08234d17dfdecf3025eca41e4fc8e3bbe71a91c5a457cb4b","block_index":310007,"block_time":310007000,"btc_amount":5430,"data":"00000000000000000000476700000000003d0900","destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"5836fb23c2bb94eeb4b71cb8e3c622c6d943b3e4ed3aebee42d240445e615db8","tx_index":8}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(53,NULL,310007,'insert','debits','{"action":"send","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"BBBB","block_index":310007,"event":"5836fb23c2bb94eeb4b71cb8e3c622c6d943b3e4ed3aebee42d240445e615db8","quantity":4000000,"tx_index":8}',0,'DEBIT');
+INSERT INTO messages VALUES(54,NULL,310007,'insert','credits','{"address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"BBBB","block_index":310007,"calling_function":"send","event":"5836fb23c2bb94eeb4b71cb8e3c622c6d943b3e4ed3aebee42d240445e615db8","quantity":4000000,"tx_index":8}',0,'CREDIT');
+INSERT INTO messages VALUES(55,NULL,310007,'insert','sends','{"asset":"BBBB","block_index":310007,"destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","quantity":4000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"5836fb23c2bb94eeb4b71cb8e3c622c6d943b3e4ed3aebee42d240445e615db8","tx_index":8}',0,'SEND');
+INSERT INTO messages VALUES(56,NULL,310007,'parse','transactions','{"supported":true,"tx_hash":"5836fb23c2bb94eeb4b71cb8e3c622c6d943b3e4ed3aebee42d240445e615db8","tx_index":8}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(57,NULL,310007,'parse','blocks','{"block_index":310007,"ledger_hash":"f2b2d250a94afa158f9ed84434c3ac7a0bfc97b4387e5e3c099afc95b8a6ad9c","messages_hash":"569752afb305c679927918cc1cebce198cb79b86e2e52a5cfbf5284cb1382065","txlist_hash":"405914410b5982b395f52f17ee4fc69dc0e4fb4c7a511009c700c0d1bdbfb563"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(58,NULL,310007,'insert','blocks','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(59,NULL,310008,'insert','transactions','{"block_hash":"47d0e3acbdc6916aeae95e987f9cfa16209b3df1e67bb38143b3422b32322c33","block_index":310008,"block_time":310008000,"btc_amount":5430,"data":"000000000000000000004768000000000000020e","destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"843e6f7712b7847099502bda8a4bd7127c17a2799290b91ef1584a6bfe069412","tx_index":9}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(60,NULL,310008,'insert','debits','{"action":"send","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"BBBC","block_index":310008,"event":"843e6f7712b7847099502bda8a4bd7127c17a2799290b91ef1584a6bfe069412","quantity":526,"tx_index":9}',0,'DEBIT');
+INSERT INTO messages VALUES(61,NULL,310008,'insert','credits','{"address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"BBBC","block_index":310008,"calling_function":"send","event":"843e6f7712b7847099502bda8a4bd7127c17a2799290b91ef1584a6bfe069412","quantity":526,"tx_index":9}',0,'CREDIT');
+INSERT INTO messages VALUES(62,NULL,310008,'insert','sends','{"asset":"BBBC","block_index":310008,"destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","quantity":526,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"843e6f7712b7847099502bda8a4bd7127c17a2799290b91ef1584a6bfe069412","tx_index":9}',0,'SEND');
+INSERT INTO messages VALUES(63,NULL,310008,'parse','transactions','{"supported":true,"tx_hash":"843e6f7712b7847099502bda8a4bd7127c17a2799290b91ef1584a6bfe069412","tx_index":9}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(64,NULL,310008,'parse','blocks','{"block_index":310008,"ledger_hash":"8c44f15f5606b6fe984a9fa7df8d7d5381fe87a6c8b634469804328885668569","messages_hash":"2a03aeebd37f31a3ceea8c2e86ce7d0d4038ac74a3bbca363253aef81e1acac3","txlist_hash":"81714583a99f97b5cefc10510f507567e02f380bdb5741e2b5ef037816e8be17"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(65,NULL,310008,'insert','blocks','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(66,NULL,310009,'insert','transactions','{"block_hash":"4d474992b141620bf3753863db7ee5e8af26cadfbba27725911f44fa657bc1c0","block_index":310009,"block_time":310009000,"btc_amount":0,"data":"00000032000000000000025800000000000047670000000000000001","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"42ae2fd7f3a18f84334bc37aa88283e79d6bff0b234dbf97e788695957d75518","tx_index":10}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(67,NULL,310009,'insert','debits','{"action":"dividend","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310009,"event":"42ae2fd7f3a18f84334bc37aa88283e79d6bff0b234dbf97e788695957d75518","quantity":24,"tx_index":10}',0,'DEBIT');
+INSERT INTO messages VALUES(68,NULL,310009,'insert','debits','{"action":"dividend fee","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310009,"event":"42ae2fd7f3a18f84334bc37aa88283e79d6bff0b234dbf97e788695957d75518","quantity":20000,"tx_index":10}',0,'DEBIT');
+INSERT INTO messages VALUES(69,NULL,310009,'insert','credits','{"address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"XCP","block_index":310009,"calling_function":"dividend","event":"42ae2fd7f3a18f84334bc37aa88283e79d6bff0b234dbf97e788695957d75518","quantity":24,"tx_index":10}',0,'CREDIT');
+INSERT INTO messages VALUES(70,NULL,310009,'insert','dividends','{"asset":"BBBB","block_index":310009,"dividend_asset":"XCP","fee_paid":20000,"quantity_per_unit":600,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"42ae2fd7f3a18f84334bc37aa88283e79d6bff0b234dbf97e788695957d75518","tx_index":10}',0,'ASSET_DIVIDEND');
+INSERT INTO messages VALUES(71,NULL,310009,'parse','transactions','{"supported":true,"tx_hash":"42ae2fd7f3a18f84334bc37aa88283e79d6bff0b234dbf97e788695957d75518","tx_index":10}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(72,NULL,310009,'parse','blocks','{"block_index":310009,"ledger_hash":"ba378e9192f290d3f9d3dd1e46aeef3a185bd5aff1be809c8974fca8dc142987","messages_hash":"1b8f265cb1ec72a091317f293c1c6a2bd31d7dbb066e093c66b55d40cb966266","txlist_hash":"9395234af8a78eb91afe7dd45a6701032af9926cba3e126e01f06547ffcb2e08"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(73,NULL,310009,'insert','blocks','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(74,NULL,310010,'insert','transactions','{"block_hash":"a58162dff81a32e6a29b075be759dbb9fa9b8b65303e69c78fb4d7b0acc37042","block_index":310010,"block_time":310010000,"btc_amount":0,"data":"00000032000000000000032000000000000047680000000000000001","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"201123e1ddbc4dab954fed0043a29fca770a9bd4268714354bb7991f01133c10","tx_index":11}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(75,NULL,310010,'insert','debits','{"action":"dividend","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310010,"event":"201123e1ddbc4dab954fed0043a29fca770a9bd4268714354bb7991f01133c10","quantity":420800,"tx_index":11}',0,'DEBIT');
+INSERT INTO messages VALUES(76,NULL,310010,'insert','debits','{"action":"dividend fee","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310010,"event":"201123e1ddbc4dab954fed0043a29fca770a9bd4268714354bb7991f01133c10","quantity":20000,"tx_index":11}',0,'DEBIT');
+INSERT INTO messages VALUES(77,NULL,310010,'insert','credits','{"address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"XCP","block_index":310010,"calling_function":"dividend","event":"201123e1ddbc4dab954fed0043a29fca770a9bd4268714354bb7991f01133c10","quantity":420800,"tx_index":11}',0,'CREDIT');
+INSERT INTO messages VALUES(78,NULL,310010,'insert','dividends','{"asset":"BBBC","block_index":310010,"dividend_asset":"XCP","fee_paid":20000,"quantity_per_unit":800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"201123e1ddbc4dab954fed0043a29fca770a9bd4268714354bb7991f01133c10","tx_index":11}',0,'ASSET_DIVIDEND');
+INSERT INTO messages VALUES(79,NULL,310010,'parse','transactions','{"supported":true,"tx_hash":"201123e1ddbc4dab954fed0043a29fca770a9bd4268714354bb7991f01133c10","tx_index":11}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(80,NULL,310010,'parse','blocks','{"block_index":310010,"ledger_hash":"64f78f9eedce2931aedfe413b4f4bdeb728752e1c897e0bd44c7db665976a723","messages_hash":"1a9855c2f2e4ee940e81ba585d2e0a4fa9269d38b7ca9e8fe5aea128de067d77","txlist_hash":"09624bd24bdd3d945e0a75450915715fa9e9a077db33aa5bdb275b0c76e7f9e8"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(81,NULL,310010,'insert','blocks','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(82,NULL,310011,'insert','transactions','{"block_hash":"8042cc2ef293fd73d050f283fbd075c79dd4c49fdcca054dc0714fc3a50dc1bb","block_index":310011,"block_time":310011000,"btc_amount":0,"data":"0000001e52bb3300405900000000000005f5e0ff09556e69742054657374","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"1afa4fa28e1ef63b2b67c288e078cfeb109a2b236558ab5544eedc7f171e0a84","tx_index":12}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(83,NULL,310011,'insert','broadcasts','{"block_index":310011,"fee_fraction_int":99999999,"locked":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","text":"Unit Test","timestamp":1388000000,"tx_hash":"1afa4fa28e1ef63b2b67c288e078cfeb109a2b236558ab5544eedc7f171e0a84","tx_index":12,"value":100.0}',0,'BROADCAST');
+INSERT INTO messages VALUES(84,NULL,310011,'parse','transactions','{"supported":true,"tx_hash":"1afa4fa28e1ef63b2b67c288e078cfeb109a2b236558ab5544eedc7f171e0a84","tx_index":12}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(85,NULL,310011,'parse','blocks','{"block_index":310011,"ledger_hash":"671a1b4e1edd1f96dcfcc96d521fb2125ae5b9d2d01a76fc66686b7ed20c5662","messages_hash":"54da84d0982b7a0b58767098bfc307fa45569f0ed925f0d0557b22b7b38401fe","txlist_hash":"aa59f74f7d3eeee95415b1bca4a090036cd9a2efb187880f7c72c69dc1bfc059"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(86,NULL,310011,'insert','blocks','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(87,NULL,310012,'insert','transactions','{"block_hash":"cdba329019d93a67b31b79d05f76ce1b7791d430ea0d6c1c2168fe78d2f67677","block_index":310012,"block_time":310012000,"btc_amount":5430,"data":"00000028000052bb33640000000002faf08000000000017d7840000000000000000000003b100000000a","destination":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"7025ded3ba412d1285be69c8aaa02773b8f4e2504310832c99a9b171b7e07e81","tx_index":13}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(88,NULL,310012,'insert','debits','{"action":"bet","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310012,"event":"7025ded3ba412d1285be69c8aaa02773b8f4e2504310832c99a9b171b7e07e81","quantity":50000000,"tx_index":13}',0,'DEBIT');
+INSERT INTO messages VALUES(89,NULL,310012,'insert','bets','{"bet_type":0,"block_index":310012,"counterwager_quantity":25000000,"counterwager_remaining":25000000,"deadline":1388000100,"expiration":10,"expire_index":310022,"fee_fraction_int":99999999.0,"feed_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","leverage":15120,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","target_value":0.0,"tx_hash":"7025ded3ba412d1285be69c8aaa02773b8f4e2504310832c99a9b171b7e07e81","tx_index":13,"wager_quantity":50000000,"wager_remaining":50000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(90,NULL,310012,'parse','transactions','{"supported":true,"tx_hash":"7025ded3ba412d1285be69c8aaa02773b8f4e2504310832c99a9b171b7e07e81","tx_index":13}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(91,NULL,310012,'parse','blocks','{"block_index":310012,"ledger_hash":"1f5b502c341699b5a59b87566c0fc02b7db5c657919f014e41a00303aa53efc8","messages_hash":"f145d04f53c877a372423f6cce9f84d253d3f307b334882be758636caedf7fcc","txlist_hash":"ba55fd791587dad14742ad66d1515992a076eefbd54d1215806aa9db3811cf50"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(92,NULL,310012,'insert','blocks','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(93,NULL,310013,'insert','transactions','{"block_hash":"0425e5e832e4286757dc0228cd505b8d572081007218abd3a0983a3bcd502a61","block_index":310013,"block_time":310013000,"btc_amount":5430,"data":"00000028000152bb336400000000017d78400000000002793d60000000000000000000003b100000000a","destination":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"e566ab052d414d2c9b9d6ffc643bc5d2b31d80976dffe7acceaf2576246f9e42","tx_index":14}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(94,NULL,310013,'update','orders','{"status":"expired","tx_hash":"6bdb2ef465e9fc04060f58ced26c159dc983a616cb121c5e7954e66833444c59"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(95,NULL,310013,'insert','order_expirations','{"block_index":310013,"order_hash":"6bdb2ef465e9fc04060f58ced26c159dc983a616cb121c5e7954e66833444c59","source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc"}',0,'ORDER_EXPIRATION');
+INSERT INTO messages VALUES(96,NULL,310013,'insert','debits','{"action":"bet","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310013,"event":"e566ab052d414d2c9b9d6ffc643bc5d2b31d80976dffe7acceaf2576246f9e42","quantity":25000000,"tx_index":14}',0,'DEBIT');
+INSERT INTO messages VALUES(97,NULL,310013,'insert','bets','{"bet_type":1,"block_index":310013,"counterwager_quantity":41500000,"counterwager_remaining":41500000,"deadline":1388000100,"expiration":10,"expire_index":310023,"fee_fraction_int":99999999.0,"feed_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","leverage":15120,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","target_value":0.0,"tx_hash":"e566ab052d414d2c9b9d6ffc643bc5d2b31d80976dffe7acceaf2576246f9e42","tx_index":14,"wager_quantity":25000000,"wager_remaining":25000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(98,NULL,310013,'update','bets','{"counterwager_remaining":4250000,"status":"open","tx_hash":"7025ded3ba412d1285be69c8aaa02773b8f4e2504310832c99a9b171b7e07e81","wager_remaining":8500000}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(99,NULL,310013,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310013,"calling_function":"filled","event":"e566ab052d414d2c9b9d6ffc643bc5d2b31d80976dffe7acceaf2576246f9e42","quantity":4250000,"tx_index":14}',0,'CREDIT');
+INSERT INTO messages VALUES(100,NULL,310013,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"e566ab052d414d2c9b9d6ffc643bc5d2b31d80976dffe7acceaf2576246f9e42","wager_remaining":4250000}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(101,NULL,310013,'insert','bet_matches','{"backward_quantity":20750000,"block_index":310012,"deadline":1388000100,"fee_fraction_int":99999999,"feed_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","forward_quantity":41500000,"id":"7025ded3ba412d1285be69c8aaa02773b8f4e2504310832c99a9b171b7e07e81_e566ab052d414d2c9b9d6ffc643bc5d2b31d80976dffe7acceaf2576246f9e42","initial_value":100.0,"leverage":15120,"match_expire_index":310022,"status":"pending","target_value":0.0,"tx0_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","tx0_bet_type":0,"tx0_block_index":310012,"tx0_expiration":10,"tx0_hash":"7025ded3ba412d1285be69c8aaa02773b8f4e2504310832c99a9b171b7e07e81","tx0_index":13,"tx1_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","tx1_bet_type":1,"tx1_block_index":310013,"tx1_expiration":10,"tx1_hash":"e566ab052d414d2c9b9d6ffc643bc5d2b31d80976dffe7acceaf2576246f9e42","tx1_index":14}',0,'BET_MATCH');
+INSERT INTO messages VALUES(102,NULL,310013,'parse','transactions','{"supported":true,"tx_hash":"e566ab052d414d2c9b9d6ffc643bc5d2b31d80976dffe7acceaf2576246f9e42","tx_index":14}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(103,NULL,310013,'parse','blocks','{"block_index":310013,"ledger_hash":"cd0cfff6de5dd4381301929c740015d5910339ba915a83eb4229ecb91ae84c17","messages_hash":"7386c24d72b2b17bfb3baa53dbc6b04cadbc19bcccb00a1a99fc9e014f594533","txlist_hash":"6c03bbdc682356647ad229247ed9d4000c2ffd03696695e0277c43b4e4d8fed8"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(104,NULL,310013,'insert','blocks','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(105,NULL,310014,'insert','transactions','{"block_hash":"85b28d413ebda2968ed82ae53643677338650151b997ed1e4656158005b9f65f","block_index":310014,"block_time":310014000,"btc_amount":5430,"data":"00000028000052bb33640000000008f0d1800000000014dc93800000000000000000000013b00000000a","destination":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"3d3ae119aa3891770b7ae1e1ce34062b7a850593f39a96b6df19d69960d4a76a","tx_index":15}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(106,NULL,310014,'update','orders','{"status":"expired","tx_hash":"36d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(107,NULL,310014,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310014,"calling_function":"cancel order","event":"36d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c","quantity":5000000,"tx_index":0}',0,'CREDIT');
+INSERT INTO messages VALUES(108,NULL,310014,'insert','order_expirations','{"block_index":310014,"order_hash":"36d00f8c35a9c6ecc7dd0a64610b1c39a71110d1a95face6a2486a6a7a1ff83c","source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc"}',0,'ORDER_EXPIRATION');
+INSERT INTO messages VALUES(109,NULL,310014,'insert','debits','{"action":"bet","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310014,"event":"3d3ae119aa3891770b7ae1e1ce34062b7a850593f39a96b6df19d69960d4a76a","quantity":150000000,"tx_index":15}',0,'DEBIT');
+INSERT INTO messages VALUES(110,NULL,310014,'insert','bets','{"bet_type":0,"block_index":310014,"counterwager_quantity":350000000,"counterwager_remaining":350000000,"deadline":1388000100,"expiration":10,"expire_index":310024,"fee_fraction_int":99999999.0,"feed_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","leverage":5040,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","target_value":0.0,"tx_hash":"3d3ae119aa3891770b7ae1e1ce34062b7a850593f39a96b6df19d69960d4a76a","tx_index":15,"wager_quantity":150000000,"wager_remaining":150000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(111,NULL,310014,'parse','transactions','{"supported":true,"tx_hash":"3d3ae119aa3891770b7ae1e1ce34062b7a850593f39a96b6df19d69960d4a76a","tx_index":15}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(112,NULL,310014,'parse','blocks','{"block_index":310014,"ledger_hash":"5012d84065c7a39b5563f4fadeaf30670b47df3856f43d40fda74de663753e4e","messages_hash":"a34442f144f48eda8ed839bddf2280067bb9831e7fc5f8012fa257cceef0f77c","txlist_hash":"99b41cf441ebd1ad46c14b34a3da79586aee124ae643f196f23f0eadb9fbe50d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(113,NULL,310014,'insert','blocks','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(114,NULL,310015,'insert','transactions','{"block_hash":"4cf77d688f18f0c68c077db882f62e49f31859dfa6144372457cd73b29223922","block_index":310015,"block_time":310015000,"btc_amount":5430,"data":"00000028000152bb33640000000014dc93800000000008f0d1800000000000000000000013b00000000a","destination":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"a73843f1c9197674ba45e3aa92ed0671062c8acd8955e6b1e4d10dd149f40bc8","tx_index":16}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(115,NULL,310015,'insert','debits','{"action":"bet","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310015,"event":"a73843f1c9197674ba45e3aa92ed0671062c8acd8955e6b1e4d10dd149f40bc8","quantity":350000000,"tx_index":16}',0,'DEBIT');
+INSERT INTO messages VALUES(116,NULL,310015,'insert','bets','{"bet_type":1,"block_index":310015,"counterwager_quantity":150000000,"counterwager_remaining":150000000,"deadline":1388000100,"expiration":10,"expire_index":310025,"fee_fraction_int":99999999.0,"feed_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","leverage":5040,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","target_value":0.0,"tx_hash":"a73843f1c9197674ba45e3aa92ed0671062c8acd8955e6b1e4d10dd149f40bc8","tx_index":16,"wager_quantity":350000000,"wager_remaining":350000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(117,NULL,310015,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310015,"calling_function":"filled","event":"a73843f1c9197674ba45e3aa92ed0671062c8acd8955e6b1e4d10dd149f40bc8","quantity":0,"tx_index":16}',0,'CREDIT');
+INSERT INTO messages VALUES(118,NULL,310015,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"3d3ae119aa3891770b7ae1e1ce34062b7a850593f39a96b6df19d69960d4a76a","wager_remaining":0}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(119,NULL,310015,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310015,"calling_function":"filled","event":"a73843f1c9197674ba45e3aa92ed0671062c8acd8955e6b1e4d10dd149f40bc8","quantity":0,"tx_index":16}',0,'CREDIT');
+INSERT INTO messages VALUES(120,NULL,310015,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"a73843f1c9197674ba45e3aa92ed0671062c8acd8955e6b1e4d10dd149f40bc8","wager_remaining":0}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(121,NULL,310015,'insert','bet_matches','{"backward_quantity":350000000,"block_index":310014,"deadline":1388000100,"fee_fraction_int":99999999,"feed_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","forward_quantity":150000000,"id":"3d3ae119aa3891770b7ae1e1ce34062b7a850593f39a96b6df19d69960d4a76a_a73843f1c9197674ba45e3aa92ed0671062c8acd8955e6b1e4d10dd149f40bc8","initial_value":100.0,"leverage":5040,"match_expire_index":310024,"status":"pending","target_value":0.0,"tx0_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","tx0_bet_type":0,"tx0_block_index":310014,"tx0_expiration":10,"tx0_hash":"3d3ae119aa3891770b7ae1e1ce34062b7a850593f39a96b6df19d69960d4a76a","tx0_index":15,"tx1_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","tx1_bet_type":1,"tx1_block_index":310015,"tx1_expiration":10,"tx1_hash":"a73843f1c9197674ba45e3aa92ed0671062c8acd8955e6b1e4d10dd149f40bc8","tx1_index":16}',0,'BET_MATCH');
+INSERT INTO messages VALUES(122,NULL,310015,'parse','transactions','{"supported":true,"tx_hash":"a73843f1c9197674ba45e3aa92ed0671062c8acd8955e6b1e4d10dd149f40bc8","tx_index":16}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(123,NULL,310015,'parse','blocks','{"block_index":310015,"ledger_hash":"0356494d376b2b65b9f4b066b9d2baf2ae90d82369b87914bb58a67927ced5af","messages_hash":"971f87fb66232464062c83cdec0c175d6e326e973598324ff2c2fbac8e081b2e","txlist_hash":"c6fff3cf22683f773cf2941f0eb9b5ed84647569c76d40cba61ca444852fceb6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(124,NULL,310015,'insert','blocks','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(125,NULL,310016,'insert','transactions','{"block_hash":"99dc7d2627efb4e5e618a53b9898b4ca39c70e98fe9bf39f68a6c980f5b64ef9","block_index":310016,"block_time":310016000,"btc_amount":5430,"data":"00000028000252bb33c8000000002cb417800000000026be36803ff0000000000000000013b00000000a","destination":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"194a87d56aecedf43bb9724b6f20f10626c26c00267fd108db843772e5ee41f5","tx_index":17}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(126,NULL,310016,'insert','debits','{"action":"bet","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310016,"event":"194a87d56aecedf43bb9724b6f20f10626c26c00267fd108db843772e5ee41f5","quantity":750000000,"tx_index":17}',0,'DEBIT');
+INSERT INTO messages VALUES(127,NULL,310016,'insert','bets','{"bet_type":2,"block_index":310016,"counterwager_quantity":650000000,"counterwager_remaining":650000000,"deadline":1388000200,"expiration":10,"expire_index":310026,"fee_fraction_int":99999999.0,"feed_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","leverage":5040,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","target_value":1.0,"tx_hash":"194a87d56aecedf43bb9724b6f20f10626c26c00267fd108db843772e5ee41f5","tx_index":17,"wager_quantity":750000000,"wager_remaining":750000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(128,NULL,310016,'parse','transactions','{"supported":true,"tx_hash":"194a87d56aecedf43bb9724b6f20f10626c26c00267fd108db843772e5ee41f5","tx_index":17}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(129,NULL,310016,'parse','blocks','{"block_index":310016,"ledger_hash":"c90ff439bd04970ed9e6e25cbfce32160450925a37ba3360f40df8854529b52d","messages_hash":"1e6547529c58138a1970ef457d8c2296c1742e41976424215f7606176301cc02","txlist_hash":"16e32aeb7155ac1b89e47925bb2367269d4fc81e9da0558266ad9722843202fd"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(130,NULL,310016,'insert','blocks','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(131,NULL,310017,'insert','transactions','{"block_hash":"8a4fedfbf734b91a5c5761a7bcb3908ea57169777a7018148c51ff611970e4a3","block_index":310017,"block_time":310017000,"btc_amount":5430,"data":"00000028000352bb33c80000000026be3680000000002cb417803ff0000000000000000013b00000000a","destination":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"72baa141e136cbafc08ee2f6c8e5841076c7573d5d5cd619f45149bf84a6a207","tx_index":18}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(132,NULL,310017,'insert','debits','{"action":"bet","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310017,"event":"72baa141e136cbafc08ee2f6c8e5841076c7573d5d5cd619f45149bf84a6a207","quantity":650000000,"tx_index":18}',0,'DEBIT');
+INSERT INTO messages VALUES(133,NULL,310017,'insert','bets','{"bet_type":3,"block_index":310017,"counterwager_quantity":750000000,"counterwager_remaining":750000000,"deadline":1388000200,"expiration":10,"expire_index":310027,"fee_fraction_int":99999999.0,"feed_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","leverage":5040,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","target_value":1.0,"tx_hash":"72baa141e136cbafc08ee2f6c8e5841076c7573d5d5cd619f45149bf84a6a207","tx_index":18,"wager_quantity":650000000,"wager_remaining":650000000}',0,'OPEN_BET');
+INSERT INTO messages VALUES(134,NULL,310017,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310017,"calling_function":"filled","event":"72baa141e136cbafc08ee2f6c8e5841076c7573d5d5cd619f45149bf84a6a207","quantity":0,"tx_index":18}',0,'CREDIT');
+INSERT INTO messages VALUES(135,NULL,310017,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"194a87d56aecedf43bb9724b6f20f10626c26c00267fd108db843772e5ee41f5","wager_remaining":0}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(136,NULL,310017,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310017,"calling_function":"filled","event":"72baa141e136cbafc08ee2f6c8e5841076c7573d5d5cd619f45149bf84a6a207","quantity":0,"tx_index":18}',0,'CREDIT');
+INSERT INTO messages VALUES(137,NULL,310017,'update','bets','{"counterwager_remaining":0,"status":"filled","tx_hash":"72baa141e136cbafc08ee2f6c8e5841076c7573d5d5cd619f45149bf84a6a207","wager_remaining":0}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(138,NULL,310017,'insert','bet_matches','{"backward_quantity":650000000,"block_index":310016,"deadline":1388000200,"fee_fraction_int":99999999,"feed_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","forward_quantity":750000000,"id":"194a87d56aecedf43bb9724b6f20f10626c26c00267fd108db843772e5ee41f5_72baa141e136cbafc08ee2f6c8e5841076c7573d5d5cd619f45149bf84a6a207","initial_value":100.0,"leverage":5040,"match_expire_index":310026,"status":"pending","target_value":1.0,"tx0_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","tx0_bet_type":2,"tx0_block_index":310016,"tx0_expiration":10,"tx0_hash":"194a87d56aecedf43bb9724b6f20f10626c26c00267fd108db843772e5ee41f5","tx0_index":17,"tx1_address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","tx1_bet_type":3,"tx1_block_index":310017,"tx1_expiration":10,"tx1_hash":"72baa141e136cbafc08ee2f6c8e5841076c7573d5d5cd619f45149bf84a6a207","tx1_index":18}',0,'BET_MATCH');
+INSERT INTO messages VALUES(139,NULL,310017,'parse','transactions','{"supported":true,"tx_hash":"72baa141e136cbafc08ee2f6c8e5841076c7573d5d5cd619f45149bf84a6a207","tx_index":18}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(140,NULL,310017,'parse','blocks','{"block_index":310017,"ledger_hash":"19cf18f708dab6a983a2642802deb38d25b6fc205ea663059a0569fa38bdaf8d","messages_hash":"9b869953cdad0502b038662de44f11fccffc976ad21182d94af502409754f6c8","txlist_hash":"94709d5f6bcb8df437947be80ac95e2e716a92645f3eec2d915cb7c088504f1c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(141,NULL,310017,'insert','blocks','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(142,NULL,310018,'insert','transactions','{"block_hash":"35c06f9e3de39e4e56ceb1d1a22008f52361c50dd0d251c0acbe2e3c2dba8ed3","block_index":310018,"block_time":310018000,"btc_amount":0,"data":"0000001e52bb33324058f7256ffc115e004c4b4009556e69742054657374","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"065de641fd87c0b3ef893130ef4a3dca7643b7a35f6d18c721f34a7a36a5992f","tx_index":19}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(143,NULL,310018,'insert','broadcasts','{"block_index":310018,"fee_fraction_int":5000000,"locked":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","text":"Unit Test","timestamp":1388000050,"tx_hash":"065de641fd87c0b3ef893130ef4a3dca7643b7a35f6d18c721f34a7a36a5992f","tx_index":19,"value":99.86166}',0,'BROADCAST');
+INSERT INTO messages VALUES(144,NULL,310018,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310018,"calling_function":"bet settled: liquidated for bear","event":"065de641fd87c0b3ef893130ef4a3dca7643b7a35f6d18c721f34a7a36a5992f","quantity":59137500,"tx_index":19}',0,'CREDIT');
+INSERT INTO messages VALUES(145,NULL,310018,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310018,"calling_function":"feed fee","event":"065de641fd87c0b3ef893130ef4a3dca7643b7a35f6d18c721f34a7a36a5992f","quantity":3112500,"tx_index":19}',0,'CREDIT');
+INSERT INTO messages VALUES(146,NULL,310018,'insert','bet_match_resolutions','{"bear_credit":59137500,"bet_match_id":"7025ded3ba412d1285be69c8aaa02773b8f4e2504310832c99a9b171b7e07e81_e566ab052d414d2c9b9d6ffc643bc5d2b31d80976dffe7acceaf2576246f9e42","bet_match_type_id":1,"block_index":310018,"bull_credit":0,"escrow_less_fee":null,"fee":3112500,"settled":false,"winner":null}',0,'BET_MATCH_RESOLUTON');
+INSERT INTO messages VALUES(147,NULL,310018,'update','bet_matches','{"id":"7025ded3ba412d1285be69c8aaa02773b8f4e2504310832c99a9b171b7e07e81_e566ab052d414d2c9b9d6ffc643bc5d2b31d80976dffe7acceaf2576246f9e42","status":"settled: liquidated for bear"}',0,'BET_MATCH_UPDATE');
+INSERT INTO messages VALUES(148,NULL,310018,'parse','transactions','{"supported":true,"tx_hash":"065de641fd87c0b3ef893130ef4a3dca7643b7a35f6d18c721f34a7a36a5992f","tx_index":19}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(149,NULL,310018,'parse','blocks','{"block_index":310018,"ledger_hash":"d9ac565fbe7bf18c1d899dab8e0c98e070880e36fa51710382017d46ddf837cf","messages_hash":"b7b696036883d92a4d4bab709ff2b1d82ea9894f5a3c74be752b7616c7a2f68c","txlist_hash":"e3e2ebfcee41e92d855051b2c2e4344600646ac3ac5b335084d5f5a23e872f3b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(150,NULL,310018,'insert','blocks','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(151,NULL,310019,'insert','transactions','{"block_hash":"114affa0c4f34b1ebf8e2778c9477641f60b5b9e8a69052158041d4c41893294","block_index":310019,"block_time":310019000,"btc_amount":0,"data":"0000001e52bb3365405915f3b645a1cb004c4b4009556e69742054657374","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"7cc015005c559686a8e10294015ca1773c0bcd9f4d7d9768deb4bb94cdd4a69e","tx_index":20}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(152,NULL,310019,'insert','broadcasts','{"block_index":310019,"fee_fraction_int":5000000,"locked":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","text":"Unit Test","timestamp":1388000101,"tx_hash":"7cc015005c559686a8e10294015ca1773c0bcd9f4d7d9768deb4bb94cdd4a69e","tx_index":20,"value":100.343}',0,'BROADCAST');
+INSERT INTO messages VALUES(153,NULL,310019,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310019,"calling_function":"bet settled","event":"7cc015005c559686a8e10294015ca1773c0bcd9f4d7d9768deb4bb94cdd4a69e","quantity":159300000,"tx_index":20}',0,'CREDIT');
+INSERT INTO messages VALUES(154,NULL,310019,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310019,"calling_function":"bet settled","event":"7cc015005c559686a8e10294015ca1773c0bcd9f4d7d9768deb4bb94cdd4a69e","quantity":315700000,"tx_index":20}',0,'CREDIT');
+INSERT INTO messages VALUES(155,NULL,310019,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310019,"calling_function":"feed fee","event":"7cc015005c559686a8e10294015ca1773c0bcd9f4d7d9768deb4bb94cdd4a69e","quantity":25000000,"tx_index":20}',0,'CREDIT');
+INSERT INTO messages VALUES(156,NULL,310019,'insert','bet_match_resolutions','{"bear_credit":315700000,"bet_match_id":"3d3ae119aa3891770b7ae1e1ce34062b7a850593f39a96b6df19d69960d4a76a_a73843f1c9197674ba45e3aa92ed0671062c8acd8955e6b1e4d10dd149f40bc8","bet_match_type_id":1,"block_index":310019,"bull_credit":159300000,"escrow_less_fee":null,"fee":25000000,"settled":true,"winner":null}',0,'BET_MATCH_RESOLUTON');
+INSERT INTO messages VALUES(157,NULL,310019,'update','bet_matches','{"id":"3d3ae119aa3891770b7ae1e1ce34062b7a850593f39a96b6df19d69960d4a76a_a73843f1c9197674ba45e3aa92ed0671062c8acd8955e6b1e4d10dd149f40bc8","status":"settled"}',0,'BET_MATCH_UPDATE');
+INSERT INTO messages VALUES(158,NULL,310019,'parse','transactions','{"supported":true,"tx_hash":"7cc015005c559686a8e10294015ca1773c0bcd9f4d7d9768deb4bb94cdd4a69e","tx_index":20}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(159,NULL,310019,'parse','blocks','{"block_index":310019,"ledger_hash":"b66661deef419a50557d171cc1bcae04f5bc260ed1f5ff56cf08ef39158617a1","messages_hash":"1cefa71f85a09e70ef26efc854fc288f669f4b098fa553f7be0f448703900bf4","txlist_hash":"c89d7fa5df5eab9ac8a57f00c6cc2b9d75244ce412e12eb842c6a43297ee41a6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(160,NULL,310019,'insert','blocks','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(161,NULL,310020,'insert','transactions','{"block_hash":"d93c79920e4a42164af74ecb5c6b903ff6055cdc007376c74dfa692c8d85ebc9","block_index":310020,"block_time":310020000,"btc_amount":0,"data":"0000001e52bb33c94000000000000000004c4b4009556e69742054657374","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"0899b8bccef3403252fd7d37ec550eea3350845dca098368b84bf4c3c48d3fc9","tx_index":21}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(162,NULL,310020,'insert','broadcasts','{"block_index":310020,"fee_fraction_int":5000000,"locked":false,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","text":"Unit Test","timestamp":1388000201,"tx_hash":"0899b8bccef3403252fd7d37ec550eea3350845dca098368b84bf4c3c48d3fc9","tx_index":21,"value":2.0}',0,'BROADCAST');
+INSERT INTO messages VALUES(163,NULL,310020,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310020,"calling_function":"bet settled: for notequal","event":"0899b8bccef3403252fd7d37ec550eea3350845dca098368b84bf4c3c48d3fc9","quantity":1330000000,"tx_index":21}',0,'CREDIT');
+INSERT INTO messages VALUES(164,NULL,310020,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310020,"calling_function":"feed fee","event":"0899b8bccef3403252fd7d37ec550eea3350845dca098368b84bf4c3c48d3fc9","quantity":70000000,"tx_index":21}',0,'CREDIT');
+INSERT INTO messages VALUES(165,NULL,310020,'insert','bet_match_resolutions','{"bear_credit":null,"bet_match_id":"194a87d56aecedf43bb9724b6f20f10626c26c00267fd108db843772e5ee41f5_72baa141e136cbafc08ee2f6c8e5841076c7573d5d5cd619f45149bf84a6a207","bet_match_type_id":5,"block_index":310020,"bull_credit":null,"escrow_less_fee":1330000000,"fee":70000000,"settled":null,"winner":"NotEqual"}',0,'BET_MATCH_RESOLUTON');
+INSERT INTO messages VALUES(166,NULL,310020,'update','bet_matches','{"id":"194a87d56aecedf43bb9724b6f20f10626c26c00267fd108db843772e5ee41f5_72baa141e136cbafc08ee2f6c8e5841076c7573d5d5cd619f45149bf84a6a207","status":"settled: for notequal"}',0,'BET_MATCH_UPDATE');
+INSERT INTO messages VALUES(167,NULL,310020,'parse','transactions','{"supported":true,"tx_hash":"0899b8bccef3403252fd7d37ec550eea3350845dca098368b84bf4c3c48d3fc9","tx_index":21}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(168,NULL,310020,'parse','blocks','{"block_index":310020,"ledger_hash":"57a6c53e41338011cb06cd60118961dcec0e800f62a2c4b1e9381c666319680f","messages_hash":"df81bfb67fb3c30f1d0a6d73b72cb9bbdec225725b5b3f43ddcdc575b89e5400","txlist_hash":"5d8f062b1b5c6740eed53d90f4cd10a23f273237bda588f42fa35653a9fe5feb"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(169,NULL,310020,'insert','blocks','{"block_hash":"7c2460bb32c5749c856486393239bf7a0ac789587ac71f32e7237910da8097f2","block_index":310021,"block_time":310021000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(170,NULL,310021,'insert','transactions','{"block_hash":"7c2460bb32c5749c856486393239bf7a0ac789587ac71f32e7237910da8097f2","block_index":310021,"block_time":310021000,"btc_amount":0,"data":"0000000a00000000000047670000000002faf08000000000000000010000000002faf080000a0000000000000000","destination":"","fee":6800,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"eb5953f4e1dec30f0bf4741cb2044c11b6e1c3be20fef2111461f69d989b852a","tx_index":22}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(171,NULL,310021,'insert','debits','{"action":"open order","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"BBBB","block_index":310021,"event":"eb5953f4e1dec30f0bf4741cb2044c11b6e1c3be20fef2111461f69d989b852a","quantity":50000000,"tx_index":22}',0,'DEBIT');
+INSERT INTO messages VALUES(172,NULL,310021,'insert','orders','{"block_index":310021,"expiration":10,"expire_index":310031,"fee_provided":6800,"fee_provided_remaining":6800,"fee_required":0,"fee_required_remaining":0,"get_asset":"XCP","get_quantity":50000000,"get_remaining":50000000,"give_asset":"BBBB","give_quantity":50000000,"give_remaining":50000000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"open","tx_hash":"eb5953f4e1dec30f0bf4741cb2044c11b6e1c3be20fef2111461f69d989b852a","tx_index":22}',0,'OPEN_ORDER');
+INSERT INTO messages VALUES(173,NULL,310021,'parse','transactions','{"supported":true,"tx_hash":"eb5953f4e1dec30f0bf4741cb2044c11b6e1c3be20fef2111461f69d989b852a","tx_index":22}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(174,NULL,310021,'parse','blocks','{"block_index":310021,"ledger_hash":"66c16af10125f298796da828f1a6c2b43123cda38e3dfc57ccc25b00f3da17f8","messages_hash":"0a49d35ea7c0d8d382b303f2462c1c8a78725dfeb8f1e374cc7fe8222111987f","txlist_hash":"94b751bb8af2f91fb1933dfae1edaa636836fe1f9100edc5c6b8bc793fea4b47"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(175,NULL,310021,'insert','blocks','{"block_hash":"44435f9a99a0aa12a9bfabdc4cb8119f6ea6a6e1350d2d65445fb66a456db5fc","block_index":310022,"block_time":310022000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(176,NULL,310022,'insert','transactions','{"block_hash":"44435f9a99a0aa12a9bfabdc4cb8119f6ea6a6e1350d2d65445fb66a456db5fc","block_index":310022,"block_time":310022000,"btc_amount":100000000,"data":"","destination":"mvCounterpartyXXXXXXXXXXXXXXW24Hef","fee":10150,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"c3f73d02e630cb2824f044e6d91f47b1ce351feff0339ea7b85652d24d8ff6bc","tx_index":23}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(177,NULL,310022,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310022,"calling_function":"burn","event":"c3f73d02e630cb2824f044e6d91f47b1ce351feff0339ea7b85652d24d8ff6bc","quantity":56999887262,"tx_index":23}',0,'CREDIT');
+INSERT INTO messages VALUES(178,NULL,310022,'insert','burns','{"block_index":310022,"burned":38000000,"earned":56999887262,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"c3f73d02e630cb2824f044e6d91f47b1ce351feff0339ea7b85652d24d8ff6bc","tx_index":23}',0,'BURN');
+INSERT INTO messages VALUES(179,NULL,310022,'parse','blocks','{"block_index":310022,"ledger_hash":"43b6213cad601a389aed2a4e912be118dfab6cca5358d86bac03f4bee6765493","messages_hash":"5a7e3ebeb25bf887ea951d37c55d30b5461d52e45a8cd40e9cc3abd15c1e8b86","txlist_hash":"fcb847408d5ee30ef86a94a0495f53670b1157d4f33d627b62ebd84fb1321cf5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(180,NULL,310022,'insert','blocks','{"block_hash":"d8cf5bec1bbcab8ca4f495352afde3b6572b7e1d61b3976872ebb8e9d30ccb08","block_index":310023,"block_time":310023000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(181,NULL,310023,'insert','transactions','{"block_hash":"d8cf5bec1bbcab8ca4f495352afde3b6572b7e1d61b3976872ebb8e9d30ccb08","block_index":310023,"block_time":310023000,"btc_amount":5430,"data":"0000000000000000000047680000000000002710","destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","fee":7650,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","supported":true,"tx_hash":"58b89d056b539d2cf9ddac4518ccca6744495127e0ce893eb71da2599cbf85ab","tx_index":24}',0,'NEW_TRANSACTION');
+INSERT INTO messages VALUES(182,NULL,310023,'update','bets','{"status":"expired","tx_hash":"7025ded3ba412d1285be69c8aaa02773b8f4e2504310832c99a9b171b7e07e81"}',0,'BET_UPDATE');
+INSERT INTO messages VALUES(183,NULL,310023,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"XCP","block_index":310023,"calling_function":"recredit wager remaining","event":"7025ded3ba412d1285be69c8aaa02773b8f4e2504310832c99a9b171b7e07e81","quantity":8500000,"tx_index":0}',0,'CREDIT');
+INSERT INTO messages VALUES(184,NULL,310023,'insert','bet_expirations','{"bet_hash":"7025ded3ba412d1285be69c8aaa02773b8f4e2504310832c99a9b171b7e07e81","bet_index":13,"block_index":310023,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc"}',0,'BET_EXPIRATION');
+INSERT INTO messages VALUES(185,NULL,310023,'insert','debits','{"action":"send","address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"BBBC","block_index":310023,"event":"58b89d056b539d2cf9ddac4518ccca6744495127e0ce893eb71da2599cbf85ab","quantity":10000,"tx_index":24}',0,'DEBIT');
+INSERT INTO messages VALUES(186,NULL,310023,'insert','credits','{"address":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","asset":"BBBC","block_index":310023,"calling_function":"send","event":"58b89d056b539d2cf9ddac4518ccca6744495127e0ce893eb71da2599cbf85ab","quantity":10000,"tx_index":24}',0,'CREDIT');
+INSERT INTO messages VALUES(187,NULL,310023,'insert','sends','{"asset":"BBBC","block_index":310023,"destination":"mtQheFaSfWELRB2MyMBaiWjdDm6ux9Ezns","quantity":10000,"source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","status":"valid","tx_hash":"58b89d056b539d2cf9ddac4518ccca6744495127e0ce893eb71da2599cbf85ab","tx_index":24}',0,'SEND');
+INSERT INTO messages VALUES(188,NULL,310023,'parse','transactions','{"supported":true,"tx_hash":"58b89d056b539d2cf9ddac4518ccca6744495127e0ce893eb71da2599cbf85ab","tx_index":24}',0,'TRANSACTION_PARSED');
+INSERT INTO messages VALUES(189,NULL,310023,'parse','blocks','{"block_index":310023,"ledger_hash":"8a9758963891bbfbdcb6515d8d3e49c941fedba7de82038776e9f8ed65e803c1","messages_hash":"7aa46117102c62f460f667fd79f116bda42b266f0e384f209527d60b56753299","txlist_hash":"d21109a870f8542e8ef40f6d72e36fb0bb5ac4ad1e7b3232ba1b2bdcc735810e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(190,NULL,310023,'insert','blocks','{"block_hash":"b03042b4e18a222b4c8d1e9e1970d93e6e2a2d41686d227ff8ecf0a839223dc5","block_index":310024,"block_time":310024000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(191,NULL,310024,'parse','blocks','{"block_index":310024,"ledger_hash":"cb034ab4a3e252fdfe9973a672e208295741a52634c9332b1501d612e0012e19","messages_hash":"d42bf4e0b63695149ee35307cdcdda6613234dfa95fc4f90385fb4cb964d013c","txlist_hash":"52bcbfb439bfc9cf14e38d39a9d6c401a8798a20fe64238f070125e8e7905151"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(192,NULL,310024,'insert','blocks','{"block_hash":"a872e560766832cc3b4f7f222228cb6db882ce3c54f6459f62c71d5cd6e90666","block_index":310025,"block_time":310025000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(193,NULL,310025,'parse','blocks','{"block_index":310025,"ledger_hash":"5addc8253469d5c729cdffc1c637b75d9e8886a633d4406dedf2b1c16ba5b92a","messages_hash":"6c12fc7540de124823bc0fc2e03f016f02bb33a7679f87335857baf740946816","txlist_hash":"e2d8891737534dde276dd1f7f51d42558b9ad60d88baada83f75951905e6f174"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(194,NULL,310025,'insert','blocks','{"block_hash":"6c96350f6f2f05810f19a689de235eff975338587194a36a70dfd0fcd490941a","block_index":310026,"block_time":310026000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(195,NULL,310026,'parse','blocks','{"block_index":310026,"ledger_hash":"8620bd0283c320330631185d1b2351718f174732bd099324a0880719cdfc18c7","messages_hash":"6ffccd6d55f048c0116fab0af2d249ba002a1146517b4232f6ad1079c7cea9bd","txlist_hash":"e7b6699c8b2b5857b60004dec9aa8aeda30ef42483ca16bc79e4ecdc1c0b4ce7"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(196,NULL,310026,'insert','blocks','{"block_hash":"d7acfac66df393c4482a14c189742c0571b89442eb7f817b34415a560445699e","block_index":310027,"block_time":310027000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(197,NULL,310027,'parse','blocks','{"block_index":310027,"ledger_hash":"96960e09478184f4f0ad38d1fc03f0c0240e58715a0a29745a6dc58c40003249","messages_hash":"78a07b4b6cad61df9c669c30ce670f65df7c9520e3889073a1ccfd229b1bc60f","txlist_hash":"a7e32b5f0b6568eff793a1d12d32ab594f3886b417a6491b6ec641d15e906e9e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(198,NULL,310027,'insert','blocks','{"block_hash":"02409fcf8fa06dafcb7f11e38593181d9c42cc9d5e2ddc304d098f990bd9530b","block_index":310028,"block_time":310028000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(199,NULL,310028,'parse','blocks','{"block_index":310028,"ledger_hash":"2f556d2528abe1c4e9d31f6ed70d400d94633d4dfb54c9a4f250e1b054f9a384","messages_hash":"5cebc5467f3918ed4d618643a8e6201bce7803ceb72b833fceae513c79551fa1","txlist_hash":"8b22bfc6153a2e742e843a5263194ffcf3ab985d934e212266ca400ed568e710"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(200,NULL,310028,'insert','blocks','{"block_hash":"3c739fa8b40c118d5547ea356ee8d10ee2898871907643ec02e5db9d00f03cc6","block_index":310029,"block_time":310029000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(201,NULL,310029,'parse','blocks','{"block_index":310029,"ledger_hash":"be195b1f7b7b55dcefb83907d954736d4bf059a9e32055131efd16602d7761d6","messages_hash":"faec53519d22e82c65d28effff3bba8236d89b38ac79edb3c808102bc6682658","txlist_hash":"ad8654356f0a1ffb669528bf4c3625e9d43ce08d9dda7f1adc2e962b65d20b55"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(202,NULL,310029,'insert','blocks','{"block_hash":"d5071cddedf89765ee0fd58f209c1c7d669ba8ea66200a57587da8b189b9e4f5","block_index":310030,"block_time":310030000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(203,NULL,310030,'parse','blocks','{"block_index":310030,"ledger_hash":"d3a25656dbb63eecf1c89820581fcab193d750f3a09ca8ab34a5008c8d89051d","messages_hash":"1e3c12ea29a0c893e4cd24e7d743153d6f2d8dce1850c750a8a654950836ac73","txlist_hash":"f9a6fb698ab5cf74c1d334f2bc3fc258738c330a5bf3614b8951c6f2d90263a1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(204,NULL,310030,'insert','blocks','{"block_hash":"0b02b10f41380fff27c543ea8891ecb845bf7a003ac5c87e15932aff3bfcf689","block_index":310031,"block_time":310031000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(205,NULL,310031,'parse','blocks','{"block_index":310031,"ledger_hash":"0edb535f8c6a40062a86e4ea327cf7fb70310b6d55a6654d5a23e54498aa3159","messages_hash":"1f7c139549d1628bd43d4ad4f882cf1ab4959aae732600941290d49df8258d47","txlist_hash":"52c64812c82695720461525033471afc39749f788156239b06f72c7887206fa4"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(206,NULL,310031,'insert','blocks','{"block_hash":"66346be81e6ba04544f2ae643b76c2b7b1383f038fc2636e02e49dc7ec144074","block_index":310032,"block_time":310032000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(207,NULL,310032,'update','orders','{"status":"expired","tx_hash":"eb5953f4e1dec30f0bf4741cb2044c11b6e1c3be20fef2111461f69d989b852a"}',0,'ORDER_UPDATE');
+INSERT INTO messages VALUES(208,NULL,310032,'insert','credits','{"address":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc","asset":"BBBB","block_index":310032,"calling_function":"cancel order","event":"eb5953f4e1dec30f0bf4741cb2044c11b6e1c3be20fef2111461f69d989b852a","quantity":50000000,"tx_index":0}',0,'CREDIT');
+INSERT INTO messages VALUES(209,NULL,310032,'insert','order_expirations','{"block_index":310032,"order_hash":"eb5953f4e1dec30f0bf4741cb2044c11b6e1c3be20fef2111461f69d989b852a","source":"mn6q3dS2EnDUx3bmyWc6D4szJNVGtaR7zc"}',0,'ORDER_EXPIRATION');
+INSERT INTO messages VALUES(210,NULL,310032,'parse','blocks','{"block_index":310032,"ledger_hash":"a9208a1b7f782852d652e5089c6485744031176b4d285ea985bbc1df0ccf49c0","messages_hash":"50cf00394dc4dc4028f5373e81809d11afad9da1ac790b78371850b3e4f09484","txlist_hash":"4089c5ee6e83c7fdb9d8f0df917268b807801e7f0fb477b6a7fb4b9f931601f0"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(211,NULL,310032,'insert','blocks','{"block_hash":"999c65df9661f73e8c01f1da1afda09ac16788b72834f0ff5ea3d1464afb4707","block_index":310033,"block_time":310033000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(212,NULL,310033,'parse','blocks','{"block_index":310033,"ledger_hash":"c8a973eb6bdd28dcab4f1b2a5e29e104944745e57a54e6d87b370aafb2e589f6","messages_hash":"57617659dfd3672b306a544fbf3419b2a77525588d83fdafcf27f133cd8cc027","txlist_hash":"28e9816084711e62a27a7d33af7a023d9c375d67c6d7dd4fbe840d511d114fbb"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(213,NULL,310033,'insert','blocks','{"block_hash":"f552edd2e0a648230f3668e72ddf0ddfb1e8ac0f4c190f91b89c1a8c2e357208","block_index":310034,"block_time":310034000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(214,NULL,310034,'parse','blocks','{"block_index":310034,"ledger_hash":"0d7b5809b7a5aa5ff854cfe141490a78c9b33e16f8102a8e804dbf0a0a8c0842","messages_hash":"918e7a686526c32d037a4a5634c04a4bc527d1e94261b300278950cc47c56831","txlist_hash":"37532a1b8cba78b522775b2feabd9dc786b259b49ae54af0279fd84061fcaf90"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(215,NULL,310034,'insert','blocks','{"block_hash":"a13cbb016f3044207a46967a4ba1c87dab411f78c55c1179f2336653c2726ae2","block_index":310035,"block_time":310035000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(216,NULL,310035,'parse','blocks','{"block_index":310035,"ledger_hash":"6b4c99289086445a7bf575110172a661c1cd37c418b70afd8ef3be0982041f5e","messages_hash":"923e8dfd3279b7777a65ef4a0d31253cf092b52467d725ffa578114ee5707e1d","txlist_hash":"6d74b1faad84274944078e3fa21083b3776e37da614acfc8d61987a1a48db51e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(217,NULL,310035,'insert','blocks','{"block_hash":"158648a98f1e1bd1875584ce8449eb15a4e91a99a923bbb24c4210135cef0c76","block_index":310036,"block_time":310036000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(218,NULL,310036,'parse','blocks','{"block_index":310036,"ledger_hash":"f20b81389b2f4c9c9be4442b3c68f87da881406f1490637c7d93d63539155a7e","messages_hash":"b4119937e540d23b8c91810b6a3a712e123b010ba64f6d0ec2e7513965677c80","txlist_hash":"246e6cb136a8e79ad87ccc6a2318361c689d4720a9000c1a404f3556dced1bfb"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(219,NULL,310036,'insert','blocks','{"block_hash":"563acfd6d991ce256d5655de2e9429975c8dceeb221e76d5ec6e9e24a2c27c07","block_index":310037,"block_time":310037000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(220,NULL,310037,'parse','blocks','{"block_index":310037,"ledger_hash":"52d554e6b53b853066a3a8f931fc37779f3596c4388e277a9f66a95e001a09eb","messages_hash":"08a26261dd5a60bd70efbc193b8c7541642b38853e7e7fc5b85e8fdf8b94ecf8","txlist_hash":"c4474243bf31bccb8aa11963c477e3d40bbdbf6c604edd86429c37b59d83b427"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(221,NULL,310037,'insert','blocks','{"block_hash":"b44b4cad12431c32df27940e18d51f63897c7472b70950d18454edfd640490b2","block_index":310038,"block_time":310038000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(222,NULL,310038,'parse','blocks','{"block_index":310038,"ledger_hash":"08a949af614ff73a79313a5a949908b368efe1f8c131eeeb51ed610baf65ac46","messages_hash":"d699fba6e49edfd28c3f42448a0452645ea3d48b2a6ee315c189f6164f9167bd","txlist_hash":"791f23628ed99486b93754ee4e7a3717d2deee1ae60d4b80dd79c614e874c94a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(223,NULL,310038,'insert','blocks','{"block_hash":"5fa1ae9c5e8a599247458987b006ad3a57f686df1f7cc240bf119e911b56c347","block_index":310039,"block_time":310039000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(224,NULL,310039,'parse','blocks','{"block_index":310039,"ledger_hash":"7ff8b2408ee1124a5ee573d31023660aabcdb21599bdcfb4a3bc1895d7910094","messages_hash":"4e1fc5d2adfa955670023a3171caba56bc9a487487e735661d2b8fef0b009829","txlist_hash":"019a41a08fe760b6ca07f10cdb763ebd41d76a7a458f81023dacd0bb000221d6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(225,NULL,310039,'insert','blocks','{"block_hash":"7200ded406675453eadddfbb2d14c2a4526c7dc2b5de14bd48b29243df5e1aa3","block_index":310040,"block_time":310040000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(226,NULL,310040,'parse','blocks','{"block_index":310040,"ledger_hash":"c687e753c01711e94cfcad1f16d2976a12ef5d6c3731c64db26f969c988fe7c3","messages_hash":"175073928f9c483e28ef0153f7552bc8a8886a35a6cad614a381e866b390a27a","txlist_hash":"81bf654cee844b048e68c07fdbb561865156f77769d686aba7666d51bfc529b0"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(227,NULL,310040,'insert','blocks','{"block_hash":"5db592ff9ba5fac1e030cf22d6c13b70d330ba397f415340086ee7357143b359","block_index":310041,"block_time":310041000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(228,NULL,310041,'parse','blocks','{"block_index":310041,"ledger_hash":"66f493ec8b5cf8140d1f627f008c50624d3069f56828df90286b53a2d6cbf47e","messages_hash":"7c38a2bc3583e8a0b36e349b2f7c8eb08a73cb2cdc26cd574e42d5f6f1819792","txlist_hash":"87461d03ba2d32213a73f526b81f1decb96b112a012ada6f9fc089032720798c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(229,NULL,310041,'insert','blocks','{"block_hash":"826fd4701ef2824e9559b069517cd3cb990aff6a4690830f78fc845ab77fa3e4","block_index":310042,"block_time":310042000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(230,NULL,310042,'parse','blocks','{"block_index":310042,"ledger_hash":"33acd319bde452aa81b589435a31ee3add742870a928ef2c15a7a447b4b4e0fa","messages_hash":"9308dd7bc118848b1dfa1514c65622002c8ce8b09f8d3f383cd921acae7fb6f5","txlist_hash":"c1fd057575646ab25fc055b10cb7cc9cc4d4d05f0ddbacfaa462fc9ac32d975e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(231,NULL,310042,'insert','blocks','{"block_hash":"2254a12ada208f1dd57bc17547ecaf3c44720323c47bc7d4b1262477cb7f3c51","block_index":310043,"block_time":310043000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(232,NULL,310043,'parse','blocks','{"block_index":310043,"ledger_hash":"83997825aa2597adb0292e265f01e937f621cc75d8cc18e23a4bd0c1fb0920c7","messages_hash":"584d88bef1b341c7a46c693cabbe0fcc603df58d4a425f64b9edf31f5204a6c4","txlist_hash":"86e036eb2032af487a2c3ccd6a6d8b3073c155164cda4bead96f92da996fd4be"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(233,NULL,310043,'insert','blocks','{"block_hash":"3346d24118d8af0b3c6bcc42f8b85792e7a2e7036ebf6e4c25f4f6723c78e46b","block_index":310044,"block_time":310044000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(234,NULL,310044,'parse','blocks','{"block_index":310044,"ledger_hash":"9890bca86442f329b2abf1b3bbf4d94e8ab54d10dfa7823a53f02fcfef030d88","messages_hash":"8518f19efe134acf8d55da0bd9512363de63bb14d06a1f51e4315f113c0c9430","txlist_hash":"a839b90852909b1e21b4461debe100d578abe34e3a46837b444a92db3eab8d97"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(235,NULL,310044,'insert','blocks','{"block_hash":"7bba0ab243839e91ad1a45a762bf074011f8a9883074d68203c6d1b46fffde98","block_index":310045,"block_time":310045000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(236,NULL,310045,'parse','blocks','{"block_index":310045,"ledger_hash":"a909f658a8f405ef1f5cd8bbab03cbd865235544ae1c2f4dc20e2a4393181efc","messages_hash":"bf1f9d352187f8252ae400baf7b361897cb58d056f00685357a03159e48b9e43","txlist_hash":"a55dd67a02d97f49eb1ce9cbdf94b201a0320065e63aaccca1d14fc856a167b1"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(237,NULL,310045,'insert','blocks','{"block_hash":"47db6788c38f2d6d712764979e41346b55e78cbb4969e0ef5c4336faf18993a6","block_index":310046,"block_time":310046000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(238,NULL,310046,'parse','blocks','{"block_index":310046,"ledger_hash":"713d2ccc66a1aa7797ea9b6af18b04245478c7582a8aee76cf2c7f3f3060df3a","messages_hash":"5d5cc15d98b43e5689b2b23418e1a8c60c7466b75fce6a9eb34f2c2df59d8ef3","txlist_hash":"c7bdbef0fecf54c6d2f1dde171123487c95ccea2cb80743633a8bbdb3c3b9d35"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(239,NULL,310046,'insert','blocks','{"block_hash":"a9ccabcc2a098a7d25e4ab8bda7c4e66807eefa42e29890dcd88149a10de7075","block_index":310047,"block_time":310047000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(240,NULL,310047,'parse','blocks','{"block_index":310047,"ledger_hash":"534500ae61a04841771193d57384d27b54fa2bb92c0698beaa46509b3d39eb1c","messages_hash":"9e57cfc8a170d8d502a7fd3a7837ab20035e29915f70982b1335f1b208241e96","txlist_hash":"8c7d8f1273c82696c80fa325a3dde05ee4ad5f719f6890b3d93907c91302cf7d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(241,NULL,310047,'insert','blocks','{"block_hash":"610bf3935a85b05a98556c55493c6de45bed4d7b3b6c8553a984718765796309","block_index":310048,"block_time":310048000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(242,NULL,310048,'parse','blocks','{"block_index":310048,"ledger_hash":"48c8e5d9ab1887f092731ba2881a330d22d4f03f601dccc096fa5147042a3d55","messages_hash":"cde2ec1e7c733c02935331d6137bb1effe396ea7dc82e4ded69543ceb6aedfb4","txlist_hash":"4c724447d400c30336cda4523a84f5cfe86849086f98367e5821a0bdddf68f7b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(243,NULL,310048,'insert','blocks','{"block_hash":"4ad2761923ad49ad2b283b640f1832522a2a5d6964486b21591b71df6b33be3c","block_index":310049,"block_time":310049000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(244,NULL,310049,'parse','blocks','{"block_index":310049,"ledger_hash":"6c5ec3d2b7d8a724175559db977cb9ab78eecd39b9239688b30d6d3350cb01fe","messages_hash":"d0b0d19e3dfea993fe9e8b5b047f701fea2363b86e371e33388db2879acb485a","txlist_hash":"8f0ee591c9f8165289f106091ac0cc19dbaf813bf1134c3ad2cf302bdba0e8c7"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(245,NULL,310049,'insert','blocks','{"block_hash":"8cfeb60a14a4cec6e9be13d699694d49007d82a31065a17890383e262071e348","block_index":310050,"block_time":310050000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(246,NULL,310050,'parse','blocks','{"block_index":310050,"ledger_hash":"817dc86594b3820de76f1d2bc2400d702475d558d6ee5bef4313fc154bbdaca2","messages_hash":"c31cc75c52571b2f31eb550b4441955777b3dda8f609ff0e896e6cc11a19c748","txlist_hash":"9ff934d29741af663537dc45d552b6c01cc8ba577af1fc2ddbbcb7259477bab8"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(247,NULL,310050,'insert','blocks','{"block_hash":"b53c90385dd808306601350920c6af4beb717518493fd23b5c730eea078f33e6","block_index":310051,"block_time":310051000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(248,NULL,310051,'parse','blocks','{"block_index":310051,"ledger_hash":"00916e6bac2f648f953c8d6dff21438a6ec53ad198b33f90667e8d4564e00e78","messages_hash":"969b1eef7e73c6c7440a6e1821ff57d9be96c399da6d25222c8761f031ec3966","txlist_hash":"3074814e0ba9b6e99b6af70ecee2f1cd072d760d921d13f04a5064342636da4e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(249,NULL,310051,'insert','blocks','{"block_hash":"0acdacf4e4b6fca756479cb055191b367b1fa433aa558956f5f08fa5b7b394e2","block_index":310052,"block_time":310052000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(250,NULL,310052,'parse','blocks','{"block_index":310052,"ledger_hash":"959df962b9bc7ef215f1530b886613404adaf81552d6eeb4b1401ea265ad5f4f","messages_hash":"305f357468bc4c4030f71a370d6396a58e1724e218a6e6190966203721f71494","txlist_hash":"c792d99e376babe180a99ebe9c20a7925a74fb919ccab28a600d200caad6c0e3"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(251,NULL,310052,'insert','blocks','{"block_hash":"68348f01b6dc49b2cb30fe92ac43e527aa90d859093d3bf7cd695c64d2ef744f","block_index":310053,"block_time":310053000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(252,NULL,310053,'parse','blocks','{"block_index":310053,"ledger_hash":"d76b639ebddd434e5269de084de0b502e7f0eaff71b4e99de2d4ebdd1fc61380","messages_hash":"844c2635c132ed421e7747be6908cf50a926150d5bc27296f37f73fa03500faa","txlist_hash":"ca53cd5d8d4e90481a6099af39825f25e7b5325fd586693362d9e7302e72fc3a"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(253,NULL,310053,'insert','blocks','{"block_hash":"a8b5f253df293037e49b998675620d5477445c51d5ec66596e023282bb9cd305","block_index":310054,"block_time":310054000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(254,NULL,310054,'parse','blocks','{"block_index":310054,"ledger_hash":"525e8cabfc993080d128faf38a5e5c9e9afa61423a5f20a90d68cdcacc96b59b","messages_hash":"3ea2df17ab88adc76330690ca7dd681fd80f522375155867c73bb6d1298c3bf8","txlist_hash":"1bfbc68852f429756bdfb76508d3f044ecc24704e437259c23107470f1edec74"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(255,NULL,310054,'insert','blocks','{"block_hash":"4b069152e2dc82e96ed8a3c3547c162e8c3aceeb2a4ac07972f8321a535b9356","block_index":310055,"block_time":310055000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(256,NULL,310055,'parse','blocks','{"block_index":310055,"ledger_hash":"155ffdc74a2077a3da7d5c068833468c7d0758dfb525a799f910cdb1543beadb","messages_hash":"115a3d942d7134aa1fd1e06de6be36a489076b6b89363d0d9ca8574a52192a47","txlist_hash":"86186f38b173c755554117ee448b6935fd6ec6ca9f464438d659ad6be767d481"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(257,NULL,310055,'insert','blocks','{"block_hash":"7603eaed418971b745256742f9d2ba70b2c2b2f69f61de6cc70e61ce0336f9d3","block_index":310056,"block_time":310056000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(258,NULL,310056,'parse','blocks','{"block_index":310056,"ledger_hash":"4f6fe786e34af90927bcd888b4b2a8fc69d3ccdfe4c4bb37edb2007901ce234a","messages_hash":"6c10c2e39604750e0fc0a2246c30cfc268ba9c93cd8b7f0418da56fa1e2081a7","txlist_hash":"822b518b20b4f136877f2dfb4f4a9299a4ef7c26441791e986677396405ee03f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(259,NULL,310056,'insert','blocks','{"block_hash":"4a5fdc84f2d66ecb6ee3e3646aad20751ce8694e64e348d3c8aab09d33a3e411","block_index":310057,"block_time":310057000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(260,NULL,310057,'parse','blocks','{"block_index":310057,"ledger_hash":"30978d87fd8e32d9d27c92a0d4ca19d179b515ed95410fa96bf496b4cd8aa5e2","messages_hash":"10c89c95b6fa528a5aa068809e5f735c5e3680d75ef1882bb2584f8cedba1bf5","txlist_hash":"79032221c81d77f7dd7e35d46a314b21b17df32357b606ecb7402e5976473b19"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(261,NULL,310057,'insert','blocks','{"block_hash":"a6eef3089896f0cae0bfe9423392e45c48f4efe4310b14d8cfbdb1fea613635f","block_index":310058,"block_time":310058000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(262,NULL,310058,'parse','blocks','{"block_index":310058,"ledger_hash":"a0760bc5d2f04b381cc46aca84aa3788e8e3fbc833379a26ae812807d3a04fc5","messages_hash":"7e9860fb7b394ee7801f90330d53db116b7e3c4cdea3483eba351da8c9c81e8b","txlist_hash":"8f56034a75de70a679a8bd2515b5982dcebc5b2a6c468203ee8922f7e12aca4f"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(263,NULL,310058,'insert','blocks','{"block_hash":"ab505de874c43f97c90be1c26a769e6c5cb140405c993b4a6cc7afc795f156a9","block_index":310059,"block_time":310059000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(264,NULL,310059,'parse','blocks','{"block_index":310059,"ledger_hash":"26dcef9e54b1a34b6024f8402ddebb6e9449cd90c270e3db75354a001484b1a1","messages_hash":"6d87ea5d117406693fa50f178d4d6bfb51d016387b65178d773d94f5f03a91b4","txlist_hash":"d645719f82c5029a7fe5eba356e16c17eb676e0848ac2e03b4d98df0106ae95c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(265,NULL,310059,'insert','blocks','{"block_hash":"974ad5fbef621e0a38eab811608dc9afaf10c8ecc85fed913075ba1a145e889b","block_index":310060,"block_time":310060000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(266,NULL,310060,'parse','blocks','{"block_index":310060,"ledger_hash":"810ebcdb63a08af5a26d1fd4e7a3604afd03bd06ff620d6a86c665e1c81116d2","messages_hash":"acc09ca7d6d46a31e5219a5fe711c3115dc935eae8b9f76de341d8ffc1251367","txlist_hash":"de75a174069eec13deaa318cf1429ed15d775816b7ffe6f46c7db0e252584271"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(267,NULL,310060,'insert','blocks','{"block_hash":"35d267d21ad386e7b7632292af1c422b0310dde7ca49a82f9577525a29c138cf","block_index":310061,"block_time":310061000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(268,NULL,310061,'parse','blocks','{"block_index":310061,"ledger_hash":"1edfc24d186c7e7267b11c03b0a29e57926e9ab25f668231a18a499cbd08c702","messages_hash":"31ef09c9d9085307840329344f77997686024ff642eb7fd66d1bb8ccba72772d","txlist_hash":"4f5fb29442a7bfe7928dfd0a30bc730b2ee0a0bfee963e20f8da2eeb0bc3d6d6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(269,NULL,310061,'insert','blocks','{"block_hash":"b31a0054145319ef9de8c1cb19df5bcf4dc8a1ece20053aa494e5d3a00a2852f","block_index":310062,"block_time":310062000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(270,NULL,310062,'parse','blocks','{"block_index":310062,"ledger_hash":"b0de9503f019c9548a97bd198e6b1b58b57d6a7c231ace2d72adb0421b29e9b7","messages_hash":"9e1443459f5d65d8a563c386ba81aafdbb7d8edec0b851cac2954bceca9a915f","txlist_hash":"99f2cacd3f24f7f8cf40d0c6a3c50413a243d886a381f432dc4398b06dd0003e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(271,NULL,310062,'insert','blocks','{"block_hash":"0cbcbcd5b7f2dc288e3a34eab3d4212463a5a56e886804fb4f9f1cf929eadebe","block_index":310063,"block_time":310063000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(272,NULL,310063,'parse','blocks','{"block_index":310063,"ledger_hash":"62e41caff168eb4b15eb67ab2130510ba3f17ac186f8516cf5b5c6f168988345","messages_hash":"120e6e7664ae78686c77d35bf4d699256954f01fb3136f6b57daf14c7f8c4c2c","txlist_hash":"6436ea453d46084d34e4af17b844a1312a3a3f0d95234921dffa50c3bb86a8da"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(273,NULL,310063,'insert','blocks','{"block_hash":"e2db8065a195e85cde9ddb868a17d39893a60fb2b1255aa5f0c88729de7cbf30","block_index":310064,"block_time":310064000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(274,NULL,310064,'parse','blocks','{"block_index":310064,"ledger_hash":"a444b1535d27bb2917478019c4c59abf9474e87128f9ec1e44c20eea1f014f3c","messages_hash":"bc4110a8a69c3c5b68a220d18914bfc2b775f4505fae4905a056ab1129a18759","txlist_hash":"4a7b7ac0f91d282190236dd238b33f7b76b40c1f5151c25117d7fffe014a1995"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(275,NULL,310064,'insert','blocks','{"block_hash":"8a7bc7a77c831ac4fd11b8a9d22d1b6a0661b07cef05c2e600c7fb683b861d2a","block_index":310065,"block_time":310065000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(276,NULL,310065,'parse','blocks','{"block_index":310065,"ledger_hash":"0ad978671f587f99e5e1c1b6f68ac3d18bb03a3bd7ea9afb63590bcef25160c8","messages_hash":"9db614ad9f148242e8d381964ed1f060344570c654494d6f28a1d54748783c82","txlist_hash":"a7373340d9f43d4256f8a9063b32c415ca44e5964abc500cb3daa631ab92a311"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(277,NULL,310065,'insert','blocks','{"block_hash":"b6959be51eb084747d301f7ccaf9e75f2292c9404633b1532e3692659939430d","block_index":310066,"block_time":310066000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(278,NULL,310066,'parse','blocks','{"block_index":310066,"ledger_hash":"a6bb36829770b24fa0b960b85566a0138360a60b52cec62d94d7df8cb0b8f8b4","messages_hash":"22c378a039a5d54dc936e50a2b439d325bebf2499797ce6af9ee8d04c984a701","txlist_hash":"3f137eaa77970ba242a8bd0709970f7045ae79ca9f3cc172882577ee3ed34e9d"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(279,NULL,310066,'insert','blocks','{"block_hash":"8b08eae98d7193c9c01863fac6effb9162bda010daeacf9e0347112f233b8577","block_index":310067,"block_time":310067000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(280,NULL,310067,'parse','blocks','{"block_index":310067,"ledger_hash":"9b8ceda9b170429d8b9ed517f0db95487b3058397e20d7e786577c8e46b389b8","messages_hash":"e2199f8f8010ed9d80b755628f7b92539f0a7eff814045b5cb0c4b71ff693506","txlist_hash":"a8c54e9c41e6d694d38a6cb9bb9cea881609c013ef9bf4909fbcb0090168e263"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(281,NULL,310067,'insert','blocks','{"block_hash":"9280e7297ef6313341bc81787a36acfc9af58f83a415afff5e3154f126cf52b5","block_index":310068,"block_time":310068000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(282,NULL,310068,'parse','blocks','{"block_index":310068,"ledger_hash":"cee2e41baf86f1af24d555e9ab4a0c023b5f1ab2b054707d4434b4f60d31862a","messages_hash":"26a0fcab0e3f7ba3cb0b2d78b72c11ad6355647501cead5c427e1d23d4e3f3ad","txlist_hash":"bc2a5bfc7f1a8181b7b04970a8287b498f096bc08acf106f6a8e0a0ac5ca3723"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(283,NULL,310068,'insert','blocks','{"block_hash":"486351f0655bf594ffaab1980cff17353b640b63e9c27239109addece189a6f7","block_index":310069,"block_time":310069000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(284,NULL,310069,'parse','blocks','{"block_index":310069,"ledger_hash":"cbfd7ff728f05ba3f1db5972f1449618a79d3fd0d76bf7fe990aed2eb2316a38","messages_hash":"0a0c5631c11c33f5ccf3a0d4e537469fd887b0493a9395cce6f5cecec4525b98","txlist_hash":"73e3b8838f74134d3db985de53446f88c3bb86a8cec53bf773c10dd89fc2d709"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(285,NULL,310069,'insert','blocks','{"block_hash":"8739e99f4dee8bebf1332f37f49a125348b40b93b74fe35579dd52bfba4fa7e5","block_index":310070,"block_time":310070000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(286,NULL,310070,'parse','blocks','{"block_index":310070,"ledger_hash":"9af85cd995c83b5a5f0cac66351cabdf9dc9faecfee080638fc76019663faaa6","messages_hash":"0243ca02e41d763a7dc643fc9353613ee3eda717381cf1cc92d27833652bc9aa","txlist_hash":"5e951c9dc5201f32b7e8b9e72702984a2ff13c011cec35ef4ddbcf5b1e7e3111"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(287,NULL,310070,'insert','blocks','{"block_hash":"7a099aa1bba0ead577f1e44f35263a1f115ed6a868c98d4dd71609072ae7f80b","block_index":310071,"block_time":310071000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(288,NULL,310071,'parse','blocks','{"block_index":310071,"ledger_hash":"a3c547e84db6b29630b87fa566e37796e0632ba616dd6d521d558632c3b55370","messages_hash":"260cbb371e6bedd2e668b53e65b1938ddac82a976c4642e5931ef3c637aa0a2a","txlist_hash":"c72261d02c311085af66e2c66b8bcef2833d05716f067de2327442b92d219adf"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(289,NULL,310071,'insert','blocks','{"block_hash":"7b17ecedc07552551b8129e068ae67cb176ca766ea3f6df74b597a94e3a7fc8a","block_index":310072,"block_time":310072000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(290,NULL,310072,'parse','blocks','{"block_index":310072,"ledger_hash":"a0170d8a72a0f8642c0863899bf034e754596e3fd8ddffefa91e7e9a7addf944","messages_hash":"f251df0e4b0cd81f4f5be1d0847f2313327c5d3fcde55f54dc97da0c030338c5","txlist_hash":"df4f5afac7aa5bdd2e580979d13c750f4990c5f7e8dacaec6d751f4b1e3c690e"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(291,NULL,310072,'insert','blocks','{"block_hash":"ee0fe3cc9b3a48a2746b6090b63b442b97ea6055d48edcf4b2288396764c6943","block_index":310073,"block_time":310073000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(292,NULL,310073,'parse','blocks','{"block_index":310073,"ledger_hash":"e0179a21342fcf35fa169567f1ef35bd6b0b1b048a98e90c049fdf3ee58e9da4","messages_hash":"8766382520f4e2f1cd434333e1b0f694679e3389938ad90cb27a806f1b10bc1f","txlist_hash":"c5cc010dd34b520a733ad2e109b4b2b8cc84b48e412c43ac688a57f99147c164"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(293,NULL,310073,'insert','blocks','{"block_hash":"ceab38dfde01f711a187601731ad575d67cfe0b7dbc61dcd4f15baaef72089fb","block_index":310074,"block_time":310074000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(294,NULL,310074,'parse','blocks','{"block_index":310074,"ledger_hash":"8855ace296b0b078d90aa24fcd30ca9f9cccf9d3961f3dba4985a3ff187a02ac","messages_hash":"57d4af8c7a15f1318317e9c5904245edf53331c9f4ecffc1ba4d5043e62d8af4","txlist_hash":"eac5c44840751fb1009274a20657bc544e855ff1a49533c9fc43c0b6e66b7402"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(295,NULL,310074,'insert','blocks','{"block_hash":"ef547198c6e36d829f117cfd7077ccde45158e3c545152225fa24dba7a26847b","block_index":310075,"block_time":310075000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(296,NULL,310075,'parse','blocks','{"block_index":310075,"ledger_hash":"bde3a6c6cc31b96d58f466d3ce0361cc6366c8c239778f21b696d4063cf6d89e","messages_hash":"2a1c11729dfc8b114a93a4d00c864898433dca5405b147a551ab342eee18d6ea","txlist_hash":"40cde00e42632bcc0477dc071b9acfa0745283dc2a9d2d28e230f939832abbac"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(297,NULL,310075,'insert','blocks','{"block_hash":"3b0499c2e8e8f0252c7288d4ecf66efc426ca37aad3524424d14c8bc6f8b0d92","block_index":310076,"block_time":310076000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(298,NULL,310076,'parse','blocks','{"block_index":310076,"ledger_hash":"f562851b32a7005ee02b9e2491c0195dddce451e8fecb428209d087e69345303","messages_hash":"c5208e94a5cf8b81912e897627778a7b87b6cda084714bcf17dcbbfe471ff09a","txlist_hash":"dc3ab137a2d7430196ec3d25456e09e8e63d815c8e4b246e95e7e63d4e3a9c75"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(299,NULL,310076,'insert','blocks','{"block_hash":"d2adeefa9024ab3ff2822bc36acf19b6c647cea118cf15b86c6bc00c3322e7dd","block_index":310077,"block_time":310077000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(300,NULL,310077,'parse','blocks','{"block_index":310077,"ledger_hash":"996cda7b65e623747deef936d61491cedd0159f44faa1e3536de1b6d6c474097","messages_hash":"f6755e4b9a0aac05188b3556704027627d5429557332b9f836605544254ed43b","txlist_hash":"a957a0c28f2a0beb967ef0ac9519e9207e37415af3018f1a5cb998169f3b6005"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(301,NULL,310077,'insert','blocks','{"block_hash":"f6c17115ef0efe489c562bcda4615892b4d4b39db0c9791fe193d4922bd82cd6","block_index":310078,"block_time":310078000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(302,NULL,310078,'parse','blocks','{"block_index":310078,"ledger_hash":"c8286f73cc3a070f4251b7c59bb485e611437a1916fd39ffac831dc78df54ecd","messages_hash":"1796d3f485d4ca5c7fbfeabc6b1428703afd47c721400cdc2acdaeadb9d26482","txlist_hash":"3cf1b57600853e04513ad74089e344f9e5af742e1d4aaad0c9e51c0ebc6e77d5"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(303,NULL,310078,'insert','blocks','{"block_hash":"f2fbd2074d804e631db44cb0fb2e1db3fdc367e439c21ffc40d73104c4d7069c","block_index":310079,"block_time":310079000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(304,NULL,310079,'parse','blocks','{"block_index":310079,"ledger_hash":"ef9dab42700918027fac849f2088d2248a6291dc7bc24be583b556f37739631b","messages_hash":"e5aed9b39fa7515afa96939dd322b29380c52591b7dc6ed6a62d1e7153f69889","txlist_hash":"6cf1d5147d5c6523c275384d404b4f7a750dab987def5846979bc5d14233a44b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(305,NULL,310079,'insert','blocks','{"block_hash":"42943b914d9c367000a78b78a544cc4b84b1df838aadde33fe730964a89a3a6c","block_index":310080,"block_time":310080000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(306,NULL,310080,'parse','blocks','{"block_index":310080,"ledger_hash":"c6bbc52f1e8f907b2d66378f4352f41ae3d354985aaab5f16d737d75a7e6b1d8","messages_hash":"08636b4a9a1b1ef795ea50198a555762e9a7b1b2e9bf12428b223b2dae49cd3c","txlist_hash":"091641bdce3f527a8a3da393068fca3534e8209fba337b7b79bf22f2a6bc5dec"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(307,NULL,310080,'insert','blocks','{"block_hash":"6554f9d307976249e7b7e260e08046b3b55d318f8b6af627fed5be3063f123c4","block_index":310081,"block_time":310081000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(308,NULL,310081,'parse','blocks','{"block_index":310081,"ledger_hash":"66f7b7ff8f0217ed62938a5931d4a6a232546e5d58e09dfd3ba5a792c35fa560","messages_hash":"fbe957e0c70cf6dd4ebc7b0f46adf107bc92354eba58205ef447e3daf6bc8db6","txlist_hash":"8a955c5c1a5c9f8c82553803172cc961e61b2e2e19b9c87cad6dec24512ee351"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(309,NULL,310081,'insert','blocks','{"block_hash":"4f1ef91b1dcd575f8ac2e66a67715500cbca154bd6f3b8148bb7015a6aa6c644","block_index":310082,"block_time":310082000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(310,NULL,310082,'parse','blocks','{"block_index":310082,"ledger_hash":"2b26c6d901ca9790987331432372046d9620d10ea163f4824208d6b23e8e7a35","messages_hash":"df11ad31e79548a8591fbd90d30ad79ce85da37dfb146a48ec4bb648737ebff6","txlist_hash":"482bf498868976d12ae17fc38bc847d8c7398c96fad5df9f1d2719197fa038e6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(311,NULL,310082,'insert','blocks','{"block_hash":"9b1f6fd6ff9b0dc4e37603cfb0625f49067c775b99e12492afd85392d3c8d850","block_index":310083,"block_time":310083000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(312,NULL,310083,'parse','blocks','{"block_index":310083,"ledger_hash":"0d6d774dce93e94e870835005b0e8b04f010fb25158aa69a0fa0321d1577e987","messages_hash":"06753394ba61e21576857c2bea779ed38eed2fb104134102a6ee6f4075acf676","txlist_hash":"ed1021dde8c16263483f3a50091a2df2105977a7aab9217b78af58833433853c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(313,NULL,310083,'insert','blocks','{"block_hash":"1e0972523e80306441b9f4157f171716199f1428db2e818a7f7817ccdc8859e3","block_index":310084,"block_time":310084000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(314,NULL,310084,'parse','blocks','{"block_index":310084,"ledger_hash":"9dbd171e3606b1662f6b576339b1e9aaa3da8a9f8a246bab905af255add4a762","messages_hash":"0da963e6f910b4d732b4b5142c237cd3fc3cc77ffdd8a7566ee849b827f93e59","txlist_hash":"e5ea123c86cd7147d8cd8d9866006e1da8528bb32c8005a998ca9f6ee917c2ba"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(315,NULL,310084,'insert','blocks','{"block_hash":"c5b6e9581831e3bc5848cd7630c499bca26d9ece5156d36579bdb72d54817e34","block_index":310085,"block_time":310085000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(316,NULL,310085,'parse','blocks','{"block_index":310085,"ledger_hash":"db67b5dc6b0c0ddec22d0e716b72aa8cb6fa9702316f2a8e12659ee229094c16","messages_hash":"0e49e187d7c89228e2592780e408c2a4add307095076272d84e2b55f4ecf29e9","txlist_hash":"a25387e650e60dbb003c5ef16c46a8d8464013d81bdb49508c2935368d4ae9c0"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(317,NULL,310085,'insert','blocks','{"block_hash":"080c1dc55a4ecf4824cf9840602498cfc35b5f84099f50b71b45cb63834c7a78","block_index":310086,"block_time":310086000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(318,NULL,310086,'parse','blocks','{"block_index":310086,"ledger_hash":"7cf70b5298dbb36efbec2fb880b76e2514e3bad9d5200875fa3eb3ceb7719ee8","messages_hash":"99d27abfd96c4b9202fc101ca8795378da7adb442693a8dd2ee01755c3a5aa5d","txlist_hash":"f5028a37d6395b533cf60e6ce9f0bf574a0a7beb2cebd2f545b5183e5362aaf3"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(319,NULL,310086,'insert','blocks','{"block_hash":"4ec8cb1c38b22904e8087a034a6406b896eff4dd28e7620601c6bddf82e2738c","block_index":310087,"block_time":310087000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(320,NULL,310087,'parse','blocks','{"block_index":310087,"ledger_hash":"27106f400fe1ee93bde42f3bf3cf39737fb856bbf0df3f90fe0838cf7d38798c","messages_hash":"eb249a817d3a77ab509de6ec126d1adb66ba7cb5b061b8bc1b6bbd8fb97fa2d8","txlist_hash":"f336b56eb2aab91aaacef9df8159627bafc67b497482abcec9ad6786710da7ec"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(321,NULL,310087,'insert','blocks','{"block_hash":"e945c815c433cbddd0bf8e66c5c23b51072483492acda98f5c2c201020a8c5b3","block_index":310088,"block_time":310088000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(322,NULL,310088,'parse','blocks','{"block_index":310088,"ledger_hash":"28c9833eded6d68967f206e5884616f83bb9ad16b9d7a507031b96480aecc799","messages_hash":"717ede78db478693f58863ed85316b1a70c505f7d7288b783eb30c9e6aafbdbe","txlist_hash":"c51f9cf9cd60f836bf4ae7ee0cd982829f6f7cbb2503eafef3bb167a285cf9a9"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(323,NULL,310088,'insert','blocks','{"block_hash":"0382437f895ef3e7e38bf025fd4f606fd44d4bbd6aea71dbdc4ed11a7cd46f33","block_index":310089,"block_time":310089000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(324,NULL,310089,'parse','blocks','{"block_index":310089,"ledger_hash":"cdac6435934ea6e67a311495325c85237158ef30c009ea44c562c2127d79e696","messages_hash":"1bfad3f02446c2eaf5d92214a3dace565861afd1cfcb75b12087f88c542c82e8","txlist_hash":"b6749729423101ee337b7fbf0362191ba34102f01db03b225ac0d6c52de2a6fb"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(325,NULL,310089,'insert','blocks','{"block_hash":"b756db71dc037b5a4582de354a3347371267d31ebda453e152f0a13bb2fae969","block_index":310090,"block_time":310090000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(326,NULL,310090,'parse','blocks','{"block_index":310090,"ledger_hash":"cb33e420348e7969a2310445a6c17c79e647d3c6f3106d4fd0c0a1249e11ed6f","messages_hash":"e7f8143dcc493803ee016f2318c91d7ec9cfee932596858f77c96b9572c24ad1","txlist_hash":"544bc0db1dbb1d22a05e5f81de7520ef990df5b897b9f9e60d98f102fef86568"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(327,NULL,310090,'insert','blocks','{"block_hash":"734a9aa485f36399d5efb74f3b9c47f8b5f6fd68c9967f134b14cfe7e2d7583c","block_index":310091,"block_time":310091000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(328,NULL,310091,'parse','blocks','{"block_index":310091,"ledger_hash":"dda2531cf7db78a3f27c1ce70189b3f6efb69ddd24b61639f9deff42566bba2a","messages_hash":"ee5b11297364b892749812f46908976dbf0df6fed5083470bddd3cbd0f443688","txlist_hash":"217908d5688f0d9797f04ee9c3cd03ae93c20f4e5801fd809d3c37154e55b7b6"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(329,NULL,310091,'insert','blocks','{"block_hash":"56386beb65f9228740d4ad43a1c575645f6daf59e0dd9f22551c59215b5e8c3d","block_index":310092,"block_time":310092000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(330,NULL,310092,'parse','blocks','{"block_index":310092,"ledger_hash":"9ca7d9e1da0c6e4465d9e1c76990b6c48e62ee3a0b3b83189dc7a0f2c03a3006","messages_hash":"0d714f5b1aeb7850a37e62304533be483e870cf8a93c842499e7fb8f426a278a","txlist_hash":"6e31995ac19f2ff3fdfe5d2ba7a49f4b018b132d2aae92a4c664a97d6a6b3b6b"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(331,NULL,310092,'insert','blocks','{"block_hash":"a74a2425f2f4be24bb5f715173e6756649e1cbf1b064aeb1ef60e0b94b418ddc","block_index":310093,"block_time":310093000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(332,NULL,310093,'parse','blocks','{"block_index":310093,"ledger_hash":"c6fc005e874909cf0393ac1bee7267f66cc5355c549d8657234a0ed6b429c869","messages_hash":"35654c3d2b3f82e783d329180c97ed5e933a36e01e19a4d46f75372f411bdc4c","txlist_hash":"d7d3f23d0014f40f3ac6a00fbb59e95653d22e11360783fe4116be9ecf360149"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(333,NULL,310093,'insert','blocks','{"block_hash":"2a8f976f20c4e89ff01071915ac96ee35192d54df3a246bf61fd4a0cccfb5b23","block_index":310094,"block_time":310094000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(334,NULL,310094,'parse','blocks','{"block_index":310094,"ledger_hash":"14dacaec0b37ca20f271e500d0ec1837a63006eb464728c067107738ad3167c6","messages_hash":"e84c649434ab608ebf4f88162e34f824e244c76f4af22913f0efb6ae6e21c94f","txlist_hash":"7a1a9bf5515019b99c1c35abaa4a2003c6291018e090c26ec03c5c951f853f82"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(335,NULL,310094,'insert','blocks','{"block_hash":"bed0fa40c9981223fb40b3be8124ca619edc9dd34d0c907369477ea92e5d2cd2","block_index":310095,"block_time":310095000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(336,NULL,310095,'parse','blocks','{"block_index":310095,"ledger_hash":"05bd680c082185147e83785e7464d8890908d1550359b4fac79018b510475e01","messages_hash":"604cde079938595e2eaafe98115d964d3d7760de6727133ce55a0aaf3c09ebda","txlist_hash":"40b9134941fbe6312e3a7dca4b1f5114c3b7ab73f6ab84ba96aa101097111168"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(337,NULL,310095,'insert','blocks','{"block_hash":"306aeec3db435fabffdf88c2f26ee83caa4c2426375a33daa2be041dbd27ea2f","block_index":310096,"block_time":310096000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(338,NULL,310096,'parse','blocks','{"block_index":310096,"ledger_hash":"b50805d750ebd26f8dbced919948118f1f97ce7d117aa1760e7a3c4895f51e13","messages_hash":"a9cb685942d115aef7c6cbedb261c04ae6a2b7a8106749ebbaa5c80a0abd3aeb","txlist_hash":"4e1fd0382baffd66852d64c667941808ebeb08a17309ccfe91be8e16046ad266"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(339,NULL,310096,'insert','blocks','{"block_hash":"13e8e16e67c7cdcc80d477491e554b43744f90e8e1a9728439a11fab42cefadf","block_index":310097,"block_time":310097000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(340,NULL,310097,'parse','blocks','{"block_index":310097,"ledger_hash":"dde96405c241e1d57334670e4eff7ed8db92056e6867cae10475a9bc30ba4619","messages_hash":"ace214c70fd988ebaa5d2cbb97ea3015c50819efbc2bc788840a984fa721de41","txlist_hash":"8e635d69a6a40df5c3849e1811ee551c32a57a3496fe8e4b97846b9592a9ebde"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(341,NULL,310097,'insert','blocks','{"block_hash":"ca5bca4b5ec4fa6183e05176abe921cff884c4e20910fab55b603cef48dc3bca","block_index":310098,"block_time":310098000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(342,NULL,310098,'parse','blocks','{"block_index":310098,"ledger_hash":"613d78fbabba246a4d1cd9d50317e732795a59812df8395472347e15cec1ee9b","messages_hash":"ea310679cec41d4ecfbc9e8293090ecfc50d42603aeead40f8578f1c67325499","txlist_hash":"c96db41449a579ffc6b459375569230e88bdfd51c10578c60f8d252eff630fd3"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(343,NULL,310098,'insert','blocks','{"block_hash":"3c4c2279cd7de0add5ec469648a845875495a7d54ebfb5b012dcc5a197b7992a","block_index":310099,"block_time":310099000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(344,NULL,310099,'parse','blocks','{"block_index":310099,"ledger_hash":"e535ca5960d2ce7508bd2157dd0cac3ea1f9ab14532a40884d522b4bba0d4979","messages_hash":"42229b9e7e27e8ef79ad7116e9c90af0ead5a28b5330d482c82975fe22e0fc0b","txlist_hash":"710369d2e677643b7ab8f2bbcebf0f13017052ff7fd9adfd6ffac4e6fff83f8c"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(345,NULL,310099,'insert','blocks','{"block_hash":"96925c05b3c7c80c716f5bef68d161c71d044252c766ca0e3f17f255764242cb","block_index":310100,"block_time":310100000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(346,NULL,310100,'parse','blocks','{"block_index":310100,"ledger_hash":"970865291b7a6d8173d6ad2ae97335cb2e89d80cbbb7a79bb2328cf6c67fa6cd","messages_hash":"7a2883d5bee08691b501606fb32234a6e9e72187d20393de23126819cbed81a8","txlist_hash":"9deae420c2b87043e6e18db077634a1d65ae60b38f604ce56f0899ed3a561347"}',0,'BLOCK_PARSED');
+INSERT INTO messages VALUES(347,NULL,310100,'insert','blocks','{"block_hash":"369472409995ca1a2ebecbad6bf9dab38c378ab1e67e1bdf13d4ce1346731cd6","block_index":310101,"block_time":310101000,"difficulty":null,"ledger_hash":null,"previous_block_hash":null,"txlist_hash":null}',0,'NEW_BLOCK');
+INSERT INTO messages VALUES(348,NULL,310101,'parse','blocks','{"block_index":310101,"ledger_hash":"0741e57ad88cdada65134c9f131ff5bfd9498cb054378d829e34715e8db2aa6d","messages_hash":"d445cfe17527660e016649cfd9b00ee76b41728d084d1064e30859cda37eb244","txlist_hash":"4bd0054addc71915293b8f040ed3c6c64d0aaf8ad27647d1887e16d55604523c"}',0,'BLOCK_PARSED');
 -- Triggers and indices on  messages
 CREATE TRIGGER block_update_messages
                            BEFORE UPDATE ON messages BEGIN
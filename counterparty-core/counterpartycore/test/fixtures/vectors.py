@@ -9459,6 +9459,15 @@ UNITTEST_VECTOR = {
                 "out": "3f2c7ccae98af81e44c0ec419659f50d8b7d48c681e5d57fc747d0461e42dda1",
             }
         ],
+        "encode_cursor": [{"in": (1233,), "out": "MTIzMw=="}],
+        "decode_cursor": [
+            {"in": ("MTIzMw==",), "out": 1233},
+            {"in": (None,), "out": None},
+            {
+                "in": ("foobar",),
+                "error": (exceptions.InvalidArgument, "Invalid cursor parameter"),
+            },
+        ],
         "hexlify": [
             {
                 "in": (b"\x00\x00\x00\x14\x00\x00\x00\x00\x00\x0b\xfc\xe3",),
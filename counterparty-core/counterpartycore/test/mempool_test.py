@@ -0,0 +1,182 @@
+import tempfile
+
+from counterpartycore.lib import blocks, config, ledger, mempool, transaction, util
+from counterpartycore.lib.kickstart.blocks_parser import BlockchainParser
+
+# this is require near the top to do setup of the test suite
+from counterpartycore.test import (
+    conftest,  # noqa: F401
+)
+from counterpartycore.test.fixtures.params import ADDR
+from counterpartycore.test.util_test import CURR_DIR
+
+# read by the `cp_server` fixture
+FIXTURE_SQL_FILE = CURR_DIR + "/fixtures/scenarios/unittest_fixture.sql"
+FIXTURE_DB = tempfile.gettempdir() + "/fixtures.unittest_fixture.db"
+
+# send of XCP from ADDR[0] to ADDR[1], from `complex_unit_test`
+TX_HEXES = [
+    "0100000001c1d8c075936c3495f6d653c50f73d987f75448d97a750249b1eb83bee71b24ae000000001976a9144838d8b3588c4c7ba7c1d06f866e9b3739c6303788acffffffff0336150000000000001976a9141e9d9c2c34d4dda3cd71603d9ce1e447c3cc5c0588ac00000000000000001e6a1c8a5dda15fb6f05628a061e67576e926dc71a7fa2f0cceb951120a9322f30ea0b000000001976a9144838d8b3588c4c7ba7c1d06f866e9b3739c6303788ac00000000",
+]
+
+
+def get_raw_transactions(tx_hexes):
+    return {
+        BlockchainParser().deserialize_tx(tx_hex, use_txid=True)["tx_hash"]: tx_hex
+        for tx_hex in tx_hexes
+    }
+
+
+def parse_mempool(db, raw_transactions):
+    """Parse the transactions as the mempool loop of `blocks.follow()` does."""
+    xcp_mempool = []
+    parsed_transactions = {}
+    tx_index = blocks.get_next_tx_index(db)
+    cursor = db.cursor()
+    for tx_hash, tx_hex in raw_transactions.items():
+        tx_index = blocks.parse_mempool_tx(
+            db,
+            cursor,
+            tx_hash,
+            tx_hex,
+            util.CURRENT_BLOCK_INDEX + 1,
+            0,
+            tx_index,
+            {},
+            [],
+            xcp_mempool,
+            parsed_transactions,
+        )
+    cursor.close()
+    return xcp_mempool, parsed_transactions
+
+
+def parse_mempool_by_transaction(db, raw_transactions):
+    """Parse each transaction in its own rolled back database transaction, with the
+    journal indexes as the only state restored."""
+    xcp_mempool = []
+    tx_index = blocks.get_next_tx_index(db)
+    cursor = db.cursor()
+    for tx_hash, tx_hex in raw_transactions.items():
+        journal_indexes = ledger.JOURNAL_INDEXES
+        try:
+            with db:
+                cursor.execute(
+                    """INSERT INTO blocks(block_index, block_hash, block_time) VALUES(?,?,?)""",
+                    (config.MEMPOOL_BLOCK_INDEX, config.MEMPOOL_BLOCK_HASH, 0),
+                )
+                tx_index = blocks.list_tx(
+                    db,
+                    None,
+                    util.CURRENT_BLOCK_INDEX + 1,
+                    0,
+                    tx_hash,
+                    tx_index=tx_index,
+                    tx_hex=tx_hex,
+                )
+                cursor.execute("""SELECT * FROM transactions WHERE tx_hash = ?""", (tx_hash,))
+                blocks.parse_tx(db, cursor.fetchone())
+                cursor.execute(
+                    """SELECT * FROM messages WHERE block_index = ?""",
+                    (config.MEMPOOL_BLOCK_INDEX,),
+                )
+                for message in list(cursor):
+                    xcp_mempool.append((tx_hash, message))
+                raise blocks.MempoolError
+        except blocks.MempoolError:
+            pass
+        finally:
+            ledger.JOURNAL_INDEXES = journal_indexes
+    cursor.close()
+    return xcp_mempool
+
+
+def without_timestamps(xcp_mempool):
+    return [
+        (tx_hash, {key: value for key, value in message.items() if key != "timestamp"})
+        for tx_hash, message in xcp_mempool
+    ]
+
+
+def test_mempool_update(server_db, monkeypatch):
+    monkeypatch.setattr(mempool, "TRANSACTIONS", {})
+    raw_transactions = get_raw_transactions(TX_HEXES)
+    # the entries built by the API v1 `MemMempool` thread
+    expected = [
+        mempool.decode_transaction(server_db, tx_hash, tx_hex)
+        for tx_hash, tx_hex in raw_transactions.items()
+    ]
+    assert all(entry is not None for entry in expected)
+
+    xcp_mempool, parsed_transactions = parse_mempool(server_db, raw_transactions)
+    tx_hashes = [tx_hash for tx_hash, _ in xcp_mempool]
+    assert set(tx_hashes) == set(raw_transactions)
+
+    def decode_transaction(db, tx_hash, tx_hex):
+        raise AssertionError("transaction decoded twice")
+
+    monkeypatch.setattr(mempool, "decode_transaction", decode_transaction)
+    mempool.update(server_db, tx_hashes, parsed_transactions, raw_transactions)
+    assert mempool.get_transactions() == expected
+
+    # already decoded
+    mempool.update(server_db, tx_hashes)
+    assert mempool.get_transactions() == expected
+
+    # the transactions left the mempool
+    mempool.update(server_db, [])
+    assert mempool.get_transactions() == []
+
+
+def test_mempool_update_after_restart(server_db, monkeypatch):
+    monkeypatch.setattr(mempool, "TRANSACTIONS", {})
+    tx_hex = TX_HEXES[0]
+    tx_hash = BlockchainParser().deserialize_tx(tx_hex, use_txid=True)["tx_hash"]
+    monkeypatch.setattr(
+        mempool.backend, "getrawtransaction_batch", lambda *args, **kwargs: {tx_hash: tx_hex}
+    )
+    # the transaction was parsed before the restart, it is decoded from its raw transaction
+    mempool.update(server_db, [tx_hash])
+    assert mempool.get_transactions() == [mempool.decode_transaction(server_db, tx_hash, tx_hex)]
+
+
+def test_mempool_transactions(server_db):
+    transaction.initialise()
+    raw_transactions = get_raw_transactions(
+        [
+            transaction.compose_transaction(
+                server_db,
+                "send",
+                {
+                    "source": ADDR[0],
+                    "destination": destination,
+                    "asset": "XCP",
+                    "quantity": 100000000,
+                },
+                regular_dust_size=5430,
+                # the sends spend the same output, as replaced transactions do
+                disable_utxo_locks=True,
+            )
+            for destination in ADDR[1:4]
+        ]
+    )
+    expected = parse_mempool_by_transaction(server_db, raw_transactions)
+    assert [tx_hash for tx_hash, _ in expected] == list(raw_transactions)
+
+    xcp_mempool, _ = parse_mempool(server_db, raw_transactions)
+    assert without_timestamps(xcp_mempool) == without_timestamps(expected)
+
+    # nothing is left in the database
+    cursor = server_db.cursor()
+    assert (
+        cursor.execute(
+            "SELECT * FROM blocks WHERE block_index = ?", (config.MEMPOOL_BLOCK_INDEX,)
+        ).fetchall()
+        == []
+    )
+    assert (
+        cursor.execute(
+            "SELECT * FROM messages WHERE block_index = ?", (config.MEMPOOL_BLOCK_INDEX,)
+        ).fetchall()
+        == []
+    )
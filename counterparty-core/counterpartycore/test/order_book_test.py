@@ -0,0 +1,165 @@
+import tempfile
+
+import pytest
+
+from counterpartycore.lib import blocks, database, ledger, message_type, util
+from counterpartycore.lib.messages import order
+
+# this is require near the top to do setup of the test suite
+from counterpartycore.test import (
+    conftest,  # noqa: F401
+    util_test,
+)
+from counterpartycore.test.fixtures.params import ADDR
+from counterpartycore.test.util_test import CURR_DIR
+
+FIXTURE_SQL_FILE = CURR_DIR + "/fixtures/scenarios/unittest_fixture.sql"
+FIXTURE_DB = tempfile.gettempdir() + "/fixtures.unittest_fixture.db"
+
+
+@pytest.fixture
+def orders_db(server_db):
+    """`server_db` with the columns that `order.initialise()` adds to the fixture tables.
+
+    The schema changes are rolled back with the rest of the test transaction.
+    """
+    order.initialise(server_db)
+    blocks.initialise_state_tables(server_db)
+    database.reset_statements(server_db)
+    yield server_db
+    database.reset_statements(server_db)
+    ledger.reset_caches()
+
+
+def sql_sorted_matching_orders(db, tx_hash, give_asset, get_asset):
+    """Matching orders sorted as `order.match()` sorted them before the order book."""
+    orders = ledger.get_matching_orders(db, tx_hash, give_asset, get_asset)
+    orders = sorted(orders, key=lambda x: x["tx_index"])
+    return sorted(orders, key=lambda x: ledger.price(x["get_quantity"], x["give_quantity"]))
+
+
+def open_order(db, source, give_asset, give_quantity, get_asset, get_quantity, expiration=100):
+    block_index = blocks.last_db_index(db) + 1
+    tx_index = blocks.get_next_tx_index(db)
+    tx = {
+        "tx_index": tx_index,
+        "tx_hash": util.dhash_string(f"order_book_test_{tx_index}"),
+        "block_index": block_index,
+        "block_hash": util.dhash_string(f"order_book_test_{block_index}"),
+        "block_time": block_index * 1000,
+        "source": source,
+        "destination": None,
+        "btc_amount": 0,
+        "fee": 10000,
+        "data": b"",
+        "supported": True,
+    }
+    _, _, data = order.compose(
+        db, source, give_asset, give_quantity, get_asset, get_quantity, expiration, 0
+    )
+    tx["data"] = data
+    util_test.insert_transaction(tx, db)
+    _, message = message_type.unpack(data, block_index)
+    order.parse(db, tx, message)
+    return tx["tx_hash"]
+
+
+def run_orders(db):
+    """Open orders crossing at equal prices, with an expired one, and return the results."""
+    first_block_index = blocks.last_db_index(db) + 1
+    # the fixture has no orders between DIVISIBLE and NODIVISIBLE
+    sells = [
+        # two orders at the same price, with different quantities
+        open_order(db, ADDR[0], "DIVISIBLE", 2000, "NODIVISIBLE", 2),
+        open_order(db, ADDR[0], "DIVISIBLE", 1000, "NODIVISIBLE", 1),
+        # better price, opened later
+        open_order(db, ADDR[0], "DIVISIBLE", 2000, "NODIVISIBLE", 1),
+        # worse price
+        open_order(db, ADDR[0], "DIVISIBLE", 1000, "NODIVISIBLE", 2),
+        # same price as the first ones, expired before the buy
+        open_order(db, ADDR[0], "DIVISIBLE", 3000, "NODIVISIBLE", 3, expiration=1),
+    ]
+    for _ in range(2):
+        block_index, _, _ = util_test.create_next_block(db, parse_block=False)
+        order.expire(db, block_index)
+    buys = [
+        open_order(db, ADDR[1], "NODIVISIBLE", 5, "DIVISIBLE", 5000),
+    ]
+
+    cursor = db.cursor()
+    order_matches = cursor.execute(
+        """SELECT id, tx0_hash, tx1_hash, forward_quantity, backward_quantity
+           FROM order_matches WHERE block_index >= ? ORDER BY rowid""",
+        (first_block_index,),
+    ).fetchall()
+    orders = {
+        tx_hash: cursor.execute(
+            """SELECT status, give_remaining, get_remaining FROM orders
+               WHERE tx_hash = ? ORDER BY rowid DESC LIMIT 1""",
+            (tx_hash,),
+        ).fetchone()
+        for tx_hash in sells + buys
+    }
+    cursor.close()
+    return sells, buys, order_matches, orders
+
+
+def run_in_savepoint(db, function):
+    db.execute("SAVEPOINT order_book_test")
+    block_index = util.CURRENT_BLOCK_INDEX
+    try:
+        return function(db)
+    finally:
+        db.execute("ROLLBACK TO SAVEPOINT order_book_test")
+        db.execute("RELEASE SAVEPOINT order_book_test")
+        ledger.reset_caches()
+        util.CURRENT_BLOCK_INDEX = block_index
+
+
+def test_sorted_matching_orders(server_db):
+    for give_asset, get_asset in [
+        ("XCP", "BTC"),
+        ("BTC", "XCP"),
+        ("XCP", "DIVISIBLE"),
+        ("DIVISIBLE", "XCP"),
+    ]:
+        assert ledger.get_sorted_matching_orders(
+            server_db, "", give_asset, get_asset
+        ) == sql_sorted_matching_orders(server_db, "", give_asset, get_asset)
+
+
+def test_match(orders_db, monkeypatch):
+    # loads the order books before and after a rollback
+    with_order_book = run_in_savepoint(orders_db, run_orders)
+    with_order_book_again = run_in_savepoint(orders_db, run_orders)
+
+    monkeypatch.setattr(ledger, "get_sorted_matching_orders", sql_sorted_matching_orders)
+    with_sql = run_in_savepoint(orders_db, run_orders)
+
+    assert with_order_book == with_sql
+    assert with_order_book_again == with_sql
+
+    sells, buys, order_matches, orders = with_sql
+    # best price first, then the first order opened at the same price
+    assert [order_match["tx0_hash"] for order_match in order_matches] == [
+        sells[2],
+        sells[0],
+        sells[1],
+    ]
+    # the order at a worse price is not matched, the expired one is not matched
+    assert orders[sells[3]]["status"] == "open"
+    assert orders[sells[4]]["status"] == "expired"
+    assert orders[buys[0]]["status"] == "filled"
+
+
+def test_order_book_reset(orders_db):
+    # the order book is loaded, then orders are written and rolled back
+    assert ledger.get_sorted_matching_orders(orders_db, "", "NODIVISIBLE", "DIVISIBLE") == []
+    orders_db.execute("SAVEPOINT order_book_test")
+    open_order(orders_db, ADDR[0], "DIVISIBLE", 1000, "NODIVISIBLE", 1)
+    assert len(ledger.get_sorted_matching_orders(orders_db, "", "NODIVISIBLE", "DIVISIBLE")) == 1
+    orders_db.execute("ROLLBACK TO SAVEPOINT order_book_test")
+    orders_db.execute("RELEASE SAVEPOINT order_book_test")
+    ledger.reset_caches()
+
+    assert ledger.get_sorted_matching_orders(orders_db, "", "NODIVISIBLE", "DIVISIBLE") == []
@@ -0,0 +1,253 @@
+import collections
+import tempfile
+import threading
+
+from counterpartycore.lib import backend, config, gettxinfo, prefetcher, script, util
+
+# this is require near the top to do setup of the test suite
+from counterpartycore.test import (
+    conftest,  # noqa: F401
+)
+from counterpartycore.test.util_test import CURR_DIR
+
+# read by the `cp_server` fixture
+FIXTURE_SQL_FILE = CURR_DIR + "/fixtures/scenarios/unittest_fixture.sql"
+FIXTURE_DB = tempfile.gettempdir() + "/fixtures.unittest_fixture.db"
+
+TX_HEX = "0100000001db3acf37743ac015808f7911a88761530c801819b3b907340aa65dfb6d98ce24030000006a473044022002961f4800cb157f8c0913084db0ee148fa3e1130e0b5e40c3a46a6d4f83ceaf02202c3dd8e631bf24f4c0c5341b3e1382a27f8436d75f3e0a095915995b0bf7dc8e01210395c223fbf96e49e5b9e06a236ca7ef95b10bf18c074bd91a5942fc40360d0b68fdffffff040000000000000000536a4c5058325bd61325dc633fadf05bec9157c23106759cee40954d39d9dbffc17ec5851a2d1feb5d271da422e0e24c7ae8ad29d2eeabf7f9ca3de306bd2bc98e2a39e47731aa000caf400053000c1283000149c8000000000000001976a91462bef4110f98fdcb4aac3c1869dbed9bce8702ed88acc80000000000000017a9144317f779c0a2ccf8f6bc3d440bd9e536a5bff75287fa3e5100000000001976a914bf2646b8ba8b4a143220528bde9c306dac44a01c88ac00000000"
+TX_HASH = "54cc399879446c4eaa7774bb764b319a2680709f99704ce60344587f49ff97e8"
+
+
+class SynchronousResult:
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+class SynchronousPool:
+    """Runs the decoding in the test process."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def apply_async(self, function, args):
+        self.calls += 1
+        return SynchronousResult(function(*args))
+
+
+def cached_block(block_hash):
+    return {
+        "block_hash": block_hash,
+        "txhash_list": [TX_HASH],
+        "raw_transactions": {TX_HASH: TX_HEX},
+        "previous_block_hash": None,
+        "block_time": 0,
+        "block_difficulty": 0,
+    }
+
+
+def test_get_decoded_transactions(server_db, monkeypatch):
+    pool = SynchronousPool()
+    monkeypatch.setattr(prefetcher, "DECODER_POOL", pool)
+    monkeypatch.setattr(prefetcher, "DECODED_BLOCKS", {})
+    monkeypatch.setattr(backend, "BLOCKCHAIN_CACHE", {310001: cached_block("hash1")})
+
+    decoded_transactions = prefetcher.get_decoded_transactions(310001, "hash1")
+    assert pool.calls == 1
+    assert list(decoded_transactions) == [TX_HASH]
+    assert decoded_transactions[TX_HASH]["vin"][0]["n"] == 3
+    assert "parsed_vouts" in decoded_transactions[TX_HASH]
+    assert prefetcher.DECODED_BLOCKS == {}
+
+
+def test_get_decoded_transactions_hash_mismatch(server_db, monkeypatch):
+    pool = SynchronousPool()
+    monkeypatch.setattr(prefetcher, "DECODER_POOL", pool)
+    monkeypatch.setattr(prefetcher, "DECODED_BLOCKS", {})
+    monkeypatch.setattr(backend, "BLOCKCHAIN_CACHE", {310001: cached_block("hash1")})
+
+    # the block has been replaced by a reorg since it was sent to the decoder
+    assert prefetcher.get_decoded_transactions(310001, "hash2") is None
+    # the outdated result is dropped
+    assert 310001 not in prefetcher.DECODED_BLOCKS
+
+    # without decoder processes, the parser decodes the block itself
+    monkeypatch.setattr(prefetcher, "DECODER_POOL", None)
+    assert prefetcher.get_decoded_transactions(310001, "hash1") is None
+
+
+def pipeline_block(size):
+    return {"raw_transactions": {"tx": "00" * (size // 2)}}
+
+
+def reset_pipeline(monkeypatch, max_bytes):
+    monkeypatch.setattr(prefetcher, "BLOCKCHAIN_CACHE_MAX_BYTES", max_bytes)
+    monkeypatch.setattr(prefetcher, "NEXT_BLOCK_TO_PREFETCH", 100)
+    monkeypatch.setattr(prefetcher, "BLOCKS_IN_FLIGHT", set())
+    monkeypatch.setattr(prefetcher, "CACHED_BLOCKS_SIZE", {})
+    monkeypatch.setattr(prefetcher, "STATS", dict.fromkeys(prefetcher.STATS, 0))
+    monkeypatch.setattr(prefetcher, "PREFETCHER_THREADS", [])
+    monkeypatch.setattr(backend, "BLOCKCHAIN_CACHE", {})
+
+
+def test_pipeline_backpressure(monkeypatch):
+    reset_pipeline(monkeypatch, 10)
+    stop_event = threading.Event()
+
+    assert prefetcher.claim_block_index(stop_event) == 100
+    assert prefetcher.claim_block_index(stop_event) == 101
+    prefetcher.cache_block(101, pipeline_block(6))
+    prefetcher.cache_block(100, pipeline_block(6))
+    assert prefetcher.get_stats()["cache_bytes"] == 12
+    assert prefetcher.get_stats()["cache_blocks"] == 2
+    assert prefetcher.get_stats()["blocks_in_flight"] == 0
+
+    # the cache is full: the next claim waits for the parser
+    claimed = []
+    producer = threading.Thread(
+        target=lambda: claimed.append(prefetcher.claim_block_index(stop_event))
+    )
+    producer.start()
+    producer.join(0.2)
+    assert producer.is_alive()
+    assert claimed == []
+    assert prefetcher.STATS["producer_stalls"] >= 1
+
+    prefetcher.release_block(100)
+    producer.join(5)
+    assert claimed == [102]
+    assert prefetcher.get_stats()["cache_bytes"] == 6
+    assert list(backend.BLOCKCHAIN_CACHE) == [101]
+
+    # releasing a block releases the previous ones too
+    prefetcher.cache_block(102, pipeline_block(4))
+    prefetcher.release_block(102)
+    assert backend.BLOCKCHAIN_CACHE == {}
+    assert prefetcher.CACHED_BLOCKS_SIZE == {}
+    assert prefetcher.get_stats()["cache_bytes"] == 0
+    assert prefetcher.get_stats()["cache_blocks"] == 0
+
+
+def test_pipeline_stop(monkeypatch):
+    reset_pipeline(monkeypatch, 1)
+    stop_event = threading.Event()
+    prefetcher.claim_block_index(stop_event)
+    prefetcher.cache_block(100, pipeline_block(2))
+
+    claimed = []
+    producer = threading.Thread(
+        target=lambda: claimed.append(prefetcher.claim_block_index(stop_event))
+    )
+    producer.start()
+    producer.join(0.2)
+    assert producer.is_alive()
+
+    stop_event.set()
+    with prefetcher.PIPELINE_CONDITION:
+        prefetcher.PIPELINE_CONDITION.notify_all()
+    producer.join(5)
+    assert claimed == [None]
+
+
+def test_get_block_in_flight(monkeypatch):
+    reset_pipeline(monkeypatch, 10)
+    stop_event = threading.Event()
+    assert prefetcher.claim_block_index(stop_event) == 100
+    assert prefetcher.claim_block_index(stop_event) == 101
+
+    # the parser waits for the block being fetched
+    blocks = []
+    consumer = threading.Thread(target=lambda: blocks.append(prefetcher.get_block(100)))
+    consumer.start()
+    consumer.join(0.2)
+    assert consumer.is_alive()
+
+    block = pipeline_block(2)
+    prefetcher.cache_block(100, block)
+    consumer.join(5)
+    assert blocks == [block]
+    assert prefetcher.STATS["consumer_stalls"] == 1
+
+    # a failed fetch only releases the claim, the parser fetches the block itself
+    prefetcher.cache_block(101, None)
+    assert prefetcher.get_block(101) is None
+    assert prefetcher.get_stats()["blocks_in_flight"] == 0
+    assert prefetcher.get_stats()["cache_bytes"] == 2
+
+
+def spending_tx(txid, output_indexes, parsed_vouts):
+    return {
+        "coinbase": False,
+        "vin": [{"hash": bytes.fromhex(txid)[::-1], "n": n} for n in output_indexes],
+        "parsed_vouts": parsed_vouts,
+    }
+
+
+def test_prefetch_prevouts(server_db, monkeypatch):
+    monkeypatch.setattr(gettxinfo, "PREVOUTS_CACHE", collections.OrderedDict())
+    monkeypatch.setattr(util, "CURRENT_BLOCK_INDEX", 1569194)
+    batches = []
+
+    def getrawtransaction_batch(txhash_list, verbose=False, skip_missing=False):
+        batches.append(txhash_list)
+        return {TX_HASH: TX_HEX}
+
+    def getrawtransaction(tx_hash, verbose=False, block_index=None):
+        raise AssertionError("prevout fetched one by one")
+
+    monkeypatch.setattr(backend, "getrawtransaction_batch", getrawtransaction_batch)
+    monkeypatch.setattr(backend, "getrawtransaction", getrawtransaction)
+
+    decoded_transactions = [
+        # Counterparty transactions
+        spending_tx(TX_HASH, [1], ([], 0, 0, b"data", [])),
+        spending_tx(TX_HASH, [3], ([config.UNSPENDABLE], 0, 0, b"", [])),
+        # BTC only transaction, its sources are never looked for
+        spending_tx("00" * 32, [0], (["address"], 1000, 0, b"", [("address", 1000)])),
+    ]
+    gettxinfo.prefetch_prevouts(server_db, decoded_transactions)
+
+    assert batches == [[TX_HASH]]
+    assert list(gettxinfo.PREVOUTS_CACHE) == [(TX_HASH, 1), (TX_HASH, 3)]
+    assert gettxinfo.get_prevout(decoded_transactions[0]["vin"][0]) == (
+        200,
+        bytes.fromhex("76a91462bef4110f98fdcb4aac3c1869dbed9bce8702ed88ac"),
+        False,
+    )
+
+    # cached outputs are not fetched again
+    gettxinfo.prefetch_prevouts(server_db, decoded_transactions[:2])
+    assert batches == [[TX_HASH]]
+
+
+def test_prefetch_prevouts_dispense(server_db, monkeypatch):
+    monkeypatch.setattr(gettxinfo, "PREVOUTS_CACHE", collections.OrderedDict())
+    monkeypatch.setattr(util, "CURRENT_BLOCK_INDEX", 1569194)
+    monkeypatch.setattr(
+        backend, "getrawtransaction_batch", lambda *args, **kwargs: {TX_HASH: TX_HEX}
+    )
+
+    dispenser_address = "munimLLHjPhGeSU5rYB2HN79LJa8bRZr5b"
+    decoded_tx = spending_tx(
+        TX_HASH, [1], ([dispenser_address], 100, 0, b"", [(dispenser_address, 100)])
+    )
+    gettxinfo.prefetch_prevouts(server_db, [decoded_tx])
+    assert (TX_HASH, 1) in gettxinfo.PREVOUTS_CACHE
+    assert decoded_tx["dispensers_outputs"] == [(dispenser_address, 100)]
+
+    # the dispensers are not looked up again when the transaction is listed
+    def get_dispensers_outputs(db, potential_dispensers):
+        raise AssertionError("dispensers looked up twice")
+
+    monkeypatch.setattr(gettxinfo, "get_dispensers_outputs", get_dispensers_outputs)
+    source, destination, btc_amount, _, _, outs = gettxinfo.get_tx_info_new(
+        server_db, decoded_tx, util.CURRENT_BLOCK_INDEX
+    )
+    assert source == script.base58_check_encode(
+        "62bef4110f98fdcb4aac3c1869dbed9bce8702ed", config.ADDRESSVERSION
+    )
+    assert destination == dispenser_address
+    assert btc_amount == 100
+    assert outs == []
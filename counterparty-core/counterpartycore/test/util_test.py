@@ -88,6 +88,8 @@ def init_database(sqlfile, dbfile, options=None):
 
     restore_database(config.DATABASE, sqlfile)
     db = database.get_connection(read_only=False)  # reinit the DB to deal with the restoring
+    blocks.initialise_state_tables(db)  # dumps don't contain the state tables
+    database.reset_statements(db)
     database.update_version(db)
     util.FIRST_MULTISIG_BLOCK_TESTNET = 1
 
@@ -756,6 +758,8 @@ def exec_tested_method(tx_name, method, tested_method, inputs, server_db):
                     "compact_subasset_longname",
                     "expand_subasset_longname",
                     "enabled",
+                    "encode_cursor",
+                    "decode_cursor",
                 ]
             )
         )
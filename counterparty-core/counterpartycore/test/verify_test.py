@@ -0,0 +1,125 @@
+import collections
+import itertools
+import os
+import shutil
+import tempfile
+
+import apsw
+import pytest
+
+from counterpartycore.lib import blocks, check, config, exceptions
+
+# this is require near the top to do setup of the test suite
+from counterpartycore.test import (
+    conftest,  # noqa: F401
+)
+from counterpartycore.test.util_test import CURR_DIR
+
+FIXTURE_SQL_FILE = CURR_DIR + "/fixtures/scenarios/unittest_fixture.sql"
+FIXTURE_DB = tempfile.gettempdir() + "/fixtures.unittest_fixture.db"
+
+CHECKPOINTS = {310100: {}, 310300: {}, 310600: {}}
+
+
+@pytest.fixture
+def checkpoints(monkeypatch):
+    monkeypatch.setattr(config, "TESTNET", True)
+    monkeypatch.setattr(config, "REGTEST", False)
+    monkeypatch.setattr(check, "CHECKPOINTS_TESTNET", CHECKPOINTS)
+
+
+def assert_contiguous(ranges, first_block_index, last_block_index):
+    assert ranges[0][0] == first_block_index
+    assert ranges[-1][1] == last_block_index
+    for (_, previous_last), (next_first, _) in itertools.pairwise(ranges):
+        assert next_first == previous_last + 1
+
+
+def test_verification_ranges(server_db, checkpoints):
+    last_block_index = blocks.last_db_index(server_db)
+    assert last_block_index == 310500
+
+    ranges = blocks.get_verification_ranges(server_db, 310000, 2)
+    assert len(ranges) == 2
+    assert_contiguous(ranges, 310000, last_block_index)
+    # ranges end at checkpoints
+    assert ranges[0][1] in CHECKPOINTS
+
+    # only one process
+    assert blocks.get_verification_ranges(server_db, 310000, 1) == [(310000, last_block_index)]
+
+    # more processes than checkpoints: one range by checkpoint
+    ranges = blocks.get_verification_ranges(server_db, 310000, 10)
+    assert ranges == [(310000, 310100), (310101, 310300), (310301, last_block_index)]
+
+    # the range of the checkpoint block has no transactions, it's merged with the next one
+    ranges = blocks.get_verification_ranges(server_db, 310100, 10)
+    assert ranges == [(310100, 310300), (310301, last_block_index)]
+
+    # after the last checkpoint in the database
+    ranges = blocks.get_verification_ranges(server_db, 310400, 10)
+    assert ranges == [(310400, last_block_index)]
+
+
+def test_verify_disk_space(server_db, checkpoints, monkeypatch):
+    database_size = os.path.getsize(config.DATABASE)
+    usage = collections.namedtuple("usage", ["total", "used", "free"])
+
+    monkeypatch.setattr(shutil, "disk_usage", lambda path: usage(0, 0, int(database_size * 2.5)))
+    assert blocks.get_max_verify_processes(config.DATABASE, 8) == 2
+    assert blocks.get_max_verify_processes(config.DATABASE, 1) == 1
+
+    monkeypatch.setattr(shutil, "disk_usage", lambda path: usage(0, 0, database_size))
+    assert blocks.get_max_verify_processes(config.DATABASE, 8) == 0
+    with pytest.raises(exceptions.DatabaseError, match="Not enough free disk space"):
+        blocks.verify(server_db, 310000, processes=8)
+
+
+def test_verify_snapshots(server_db):
+    ranges = [(310001, 310300), (310301, 310500)]
+    snapshot_files = [
+        tempfile.gettempdir() + "/fixtures.verify.310001",
+        tempfile.gettempdir() + "/fixtures.verify.310301",
+    ]
+    try:
+        blocks.create_snapshots(server_db, snapshot_files, ranges)
+        for snapshot_file, (first_block_index, _) in zip(snapshot_files, ranges, strict=True):
+            snapshot_db = apsw.Connection(snapshot_file, flags=apsw.SQLITE_OPEN_READONLY)
+            # the blocks are kept, the messages are rolled back to the range start
+            assert snapshot_db.execute("SELECT MAX(block_index) FROM blocks").fetchone() == (
+                310500,
+            )
+            assert snapshot_db.execute("SELECT MAX(block_index) FROM messages").fetchone() == (
+                first_block_index - 1,
+            )
+            snapshot_db.close()
+    finally:
+        blocks.remove_snapshot_files(snapshot_files)
+    assert not any(os.path.exists(snapshot_file) for snapshot_file in snapshot_files)
+
+
+def test_verify_errors(server_db, monkeypatch):
+    def reparse_block(db, block):
+        if block["block_index"] == 310002:
+            raise check.ConsensusError("invalid hash for block 310002")
+        if block["block_index"] == 310400:
+            raise KeyError("block_hash")
+
+    monkeypatch.setattr(blocks, "reparse_block", reparse_block)
+    snapshot_file = tempfile.gettempdir() + "/fixtures.verify.errors"
+    ranges = [(310001, 310300), (310301, 310500)]
+    parser_config = {"DATABASE": config.DATABASE}
+    try:
+        blocks.create_snapshots(server_db, [snapshot_file], ranges[:1])
+        assert blocks.verify_blocks(parser_config, snapshot_file, *ranges[0]) == (
+            True,
+            "invalid hash for block 310002",
+        )
+        # the other errors are reported too
+        assert blocks.verify_blocks(parser_config, snapshot_file, *ranges[1]) == (
+            False,
+            "Blocks 310301-310500: KeyError: 'block_hash'",
+        )
+    finally:
+        config.DATABASE = parser_config["DATABASE"]
+        blocks.remove_snapshot_files([snapshot_file])